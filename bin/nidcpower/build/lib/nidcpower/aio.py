@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+# This file was generated
+'''asyncio front-end for NI-DCPower sessions.
+
+Blocking methods return awaitables. The underlying driver call runs on an executor, by default the
+worker thread of the session (see nidcpower.Session.executor), so the event loop keeps running while
+the driver waits. Cancelling the awaitable before the call has started removes it from the queue, and
+asyncio.wait_for() can be used to put a timeout on it.
+
+All other methods and properties are forwarded to the synchronous nidcpower.Session unchanged.
+
+Requires Python 3.4 or later.
+'''
+import asyncio
+
+from nidcpower import session as _session
+
+
+class _RepeatedCapabilities(object):
+    def __init__(self, repeated_capabilities, executor):
+        self._repeated_capabilities = repeated_capabilities
+        self._executor = executor
+
+    def __getitem__(self, repeated_capability):
+        '''Set/get properties or call methods with a repeated capability (i.e. channels)'''
+        return _SessionBase(self._repeated_capabilities[repeated_capability], self._executor)
+
+
+class _SessionBase(object):
+    '''Base class for all asyncio NI-DCPower sessions.'''
+
+    def __init__(self, session, executor):
+        object.__setattr__(self, '_session', session)
+        object.__setattr__(self, '_executor', executor)
+
+    def __repr__(self):
+        return '{0}.aio.{1}({2})'.format('nidcpower', self.__class__.__name__, self._session._param_list)
+
+    def __getattr__(self, key):
+        return getattr(self._session, key)
+
+    def __setattr__(self, key, value):
+        setattr(self._session, key, value)
+
+    def run_in_executor(self, fn, *args, **kwargs):
+        '''run_in_executor
+
+        Schedules fn(*args, **kwargs) on the executor of this session and returns an awaitable for its result.
+        Use it to call methods that do not have an asyncio variant without blocking the event loop.
+        '''
+        return asyncio.wrap_future(self._executor.submit(fn, *args, **kwargs))
+
+    def fetch_multiple(self, *args, **kwargs):
+        '''fetch_multiple
+
+        asyncio variant of nidcpower.Session.fetch_multiple. Takes the same parameters and returns an awaitable for its result.
+        '''
+        return self.run_in_executor(self._session.fetch_multiple, *args, **kwargs)
+
+    def fetch_multiple_into(self, *args, **kwargs):
+        '''fetch_multiple_into
+
+        asyncio variant of nidcpower.Session.fetch_multiple_into. Takes the same parameters and returns an awaitable for its result.
+        '''
+        return self.run_in_executor(self._session.fetch_multiple_into, *args, **kwargs)
+
+    def measure(self, *args, **kwargs):
+        '''measure
+
+        asyncio variant of nidcpower.Session.measure. Takes the same parameters and returns an awaitable for its result.
+        '''
+        return self.run_in_executor(self._session.measure, *args, **kwargs)
+
+    def measure_multiple(self, *args, **kwargs):
+        '''measure_multiple
+
+        asyncio variant of nidcpower.Session.measure_multiple. Takes the same parameters and returns an awaitable for its result.
+        '''
+        return self.run_in_executor(self._session.measure_multiple, *args, **kwargs)
+
+    def measure_multiple_into(self, *args, **kwargs):
+        '''measure_multiple_into
+
+        asyncio variant of nidcpower.Session.measure_multiple_into. Takes the same parameters and returns an awaitable for its result.
+        '''
+        return self.run_in_executor(self._session.measure_multiple_into, *args, **kwargs)
+
+
+class Session(_SessionBase):
+    '''asyncio variant of nidcpower.Session'''
+
+    def __init__(self, resource_name, channels="", reset=False, options={}, executor=None):
+        '''asyncio variant of nidcpower.Session
+
+        Opens the session synchronously; see nidcpower.Session for the parameters.
+
+        Args:
+            executor (concurrent.futures.Executor): Executor that runs the blocking calls. Defaults to the worker
+                thread of the session. Pass a shared executor to bound the number of threads used by many sessions.
+        '''
+        session = _session.Session(resource_name, channels, reset, options)
+        super(Session, self).__init__(session, session.executor if executor is None else executor)
+
+        # Instantiate any repeated capability objects
+        object.__setattr__(self, 'channels', _RepeatedCapabilities(session.channels, self._executor))
+
+    def __aenter__(self):
+        return asyncio.sleep(0, result=self)
+
+    def __aexit__(self, exc_type, exc_value, traceback):
+        return self.close()
+
+    def close(self):
+        '''close
+
+        Closes the session and returns an awaitable. Pending calls on the session executor complete first.
+        '''
+        # close() waits for the worker thread of the session, so it cannot run on it
+        return asyncio.get_event_loop().run_in_executor(None, self._session.close)
+
+    def wait_for_event(self, *args, **kwargs):
+        '''wait_for_event
+
+        asyncio variant of nidcpower.Session.wait_for_event. Takes the same parameters and returns an awaitable for its result.
+        '''
+        return self.run_in_executor(self._session.wait_for_event, *args, **kwargs)
+
+    def self_test(self, *args, **kwargs):
+        '''self_test
+
+        asyncio variant of nidcpower.Session.self_test. Takes the same parameters and returns an awaitable for its result.
+        '''
+        return self.run_in_executor(self._session.self_test, *args, **kwargs)
+
+
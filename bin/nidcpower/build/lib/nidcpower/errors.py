@@ -0,0 +1,300 @@
+#!/usr/bin/python
+# This file was generated
+
+
+import collections
+import datetime
+import platform
+import threading
+import time
+import warnings
+import weakref
+
+from enum import Enum
+
+
+def _is_success(code):
+    return (code == 0)
+
+
+def _is_error(code):
+    return (code < 0)
+
+
+def _is_warning(code):
+    return (code > 0)
+
+
+class _StatusBase(object):
+    '''Holds the status code returned by the driver and retrieves its description on first access.
+
+    Getting the description takes up to two calls into the driver. Code that catches errors or filters
+    warnings without looking at the description (i.e. a polling loop with timeout=0) doesn't pay for them.
+    Descriptions that are still pending when the session is closed are retrieved by close(), see
+    _PendingDescriptions.
+    '''
+
+    def _init_status(self, code, description, session):
+        self.code = code
+        self._description = description
+        self._session = session
+        self._args = None
+
+    @property
+    def description(self):
+        if self._description is None:
+            self._description = self._session._get_error_description(self.code)
+            # Don't keep the session alive for as long as the exception or warning
+            self._session = None
+        return self._description
+
+    @property
+    def args(self):
+        # The message, as when the description was passed to the constructor. It is only built when args is used.
+        if self._args is None:
+            return (str(self), )
+        return self._args
+
+    @args.setter
+    def args(self, value):
+        self._args = tuple(value)
+
+    def __repr__(self):
+        return '{0}({1!r})'.format(type(self).__name__, str(self))
+
+    def __reduce__(self):
+        # The session can't be pickled, so pickle the description instead
+        return (type(self), (self.code, self.description))
+
+
+class _ErrorBase(_StatusBase, Exception):
+
+    def __init__(self, code, description=None, session=None):
+        self._init_status(code, description, session)
+        super(_ErrorBase, self).__init__(code)
+
+    def __str__(self):
+        return str(self.code) + ": " + self.description
+
+
+class Error(_ErrorBase):
+    '''An error originating from the NI-DCPower driver'''
+
+    def __init__(self, code, description=None, session=None):
+        assert (_is_error(code)), "Should not raise Error if code is not fatal."
+        super(Error, self).__init__(code, description, session)
+
+
+class NidcpowerWarning(_StatusBase, Warning):
+    '''A warning originating from the NI-DCPower driver'''
+
+    def __init__(self, code, description=None, session=None):
+        assert (_is_warning(code)), "Should not create Warning if code is not positive."
+        self._init_status(code, description, session)
+        super(NidcpowerWarning, self).__init__(code)
+
+    def __str__(self):
+        return 'Warning {0} occurred.\n\n{1}'.format(self.code, self.description)
+
+
+class WarningPolicy(Enum):
+    ALWAYS = 0
+    '''
+    Every warning returned by the driver is issued with warnings.warn(). This is the default.
+    '''
+    ONCE_PER_CODE = 1
+    '''
+    Only the first warning with each code is issued, later ones are only counted.
+    '''
+    RATE_LIMITED = 2
+    '''
+    At most one warning with each code is issued per warning_interval, the others are only counted.
+    '''
+    COUNT = 3
+    '''
+    Warnings are only counted, see warning_stats().
+    '''
+
+
+WarningStats = collections.namedtuple('WarningStats', ['count', 'issued', 'description'])
+'''Number of times the driver returned a warning code, number of those that were issued with warnings.warn() and the description of the code.'''
+
+
+# Python 2 doesn't have time.monotonic()
+_clock = getattr(time, 'monotonic', time.time)
+
+
+class _WarningFilter(object):
+    '''Counts the warnings of a session and decides which ones are issued, see WarningPolicy.
+
+    It is shared by a session and the objects returned by its repeated capabilities.
+    '''
+
+    def __init__(self):
+        self.policy = WarningPolicy.ALWAYS
+        self.interval = 1.0
+        # code: [count, issued, time last issued]
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    def should_warn(self, code):
+        with self._lock:
+            entry = self._counts.get(code)
+            if entry is None:
+                entry = self._counts[code] = [0, 0, None]
+            entry[0] += 1
+            if self.policy is WarningPolicy.ALWAYS:
+                issue = True
+            elif self.policy is WarningPolicy.ONCE_PER_CODE:
+                issue = entry[1] == 0
+            elif self.policy is WarningPolicy.RATE_LIMITED:
+                now = _clock()
+                issue = entry[2] is None or now - entry[2] >= self.interval
+                if issue:
+                    entry[2] = now
+            else:
+                assert self.policy is WarningPolicy.COUNT
+                issue = False
+            if issue:
+                entry[1] += 1
+            return issue
+
+    def get_counts(self, reset):
+        '''Returns {code: (count, issued)}, clearing the counts if reset is True'''
+        with self._lock:
+            counts = dict((code, (entry[0], entry[1])) for code, entry in self._counts.items())
+            if reset:
+                self._counts.clear()
+        return counts
+
+
+class _WarningPolicyMixin(object):
+    '''Session properties and methods for the WarningPolicy of a session.
+
+    Used by the sessions of every driver, which set _warning_filter to a _WarningFilter and implement _get_error_description().
+    '''
+
+    @property
+    def warning_policy(self):
+        '''warning_policy
+
+        WarningPolicy that decides which warnings returned by the driver are issued with warnings.warn(),
+        i.e. WarningPolicy.ONCE_PER_CODE for a loop that gets the same coercion warning on every call.
+        Warnings that are not issued are still counted, see warning_stats(). Defaults to WarningPolicy.ALWAYS.
+        '''
+        return self._warning_filter.policy
+
+    @warning_policy.setter
+    def warning_policy(self, value):
+        if type(value) is not WarningPolicy:
+            raise TypeError('must be WarningPolicy not ' + str(type(value).__name__))
+        self._warning_filter.policy = value
+
+    @property
+    def warning_interval(self):
+        '''warning_interval
+
+        Minimum time between two warnings with the same code when warning_policy is
+        WarningPolicy.RATE_LIMITED, as a datetime.timedelta. Defaults to 1 second.
+        '''
+        return datetime.timedelta(seconds=self._warning_filter.interval)
+
+    @warning_interval.setter
+    def warning_interval(self, value):
+        self._warning_filter.interval = value.total_seconds()
+
+    def warning_stats(self, reset=False):
+        '''warning_stats
+
+        Returns a dict that maps each warning code returned by the driver on this session to a
+        WarningStats(count, issued, description) tuple: how many times the driver returned it, how many
+        of those were issued with warnings.warn() and the description of the code.
+
+        Args:
+            reset (bool): Clears the counts after returning them.
+
+        Returns:
+            stats (dict): WarningStats keyed by warning code.
+        '''
+        counts = self._warning_filter.get_counts(reset)
+        return dict((code, WarningStats(count, issued, self._get_error_description(code))) for code, (count, issued) in counts.items())
+
+
+class _PendingDescriptions(object):
+    '''Errors and warnings of a session whose description has not been retrieved yet.
+
+    The driver can only return the description of the last error while the session is open. An error that
+    propagates out of a with block is usually looked at after Session.__exit__ closed the session, so close()
+    calls resolve() first. Only weak references are kept, so errors that were caught and dropped are not
+    retrieved. It is shared by a session and the objects returned by its repeated capabilities.
+    '''
+
+    def __init__(self):
+        self._statuses = weakref.WeakSet()
+        self._lock = threading.Lock()
+
+    def add(self, status):
+        with self._lock:
+            self._statuses.add(status)
+
+    def resolve(self):
+        '''Retrieves the description of every error and warning that is still referenced'''
+        with self._lock:
+            statuses = list(self._statuses)
+            self._statuses.clear()
+        for status in statuses:
+            status.description
+
+
+class UnsupportedConfigurationError(Exception):
+    '''An error due to using this module in an usupported platform.'''
+
+    def __init__(self):
+        super(UnsupportedConfigurationError, self).__init__('System configuration is unsupported: ' + platform.architecture()[0] + ' ' + platform.system())
+
+
+class DriverNotInstalledError(Exception):
+    '''An error due to using this module without the driver runtime installed.'''
+
+    def __init__(self):
+        super(DriverNotInstalledError, self).__init__('The NI-DCPower runtime is not installed. Please visit http://www.ni.com/downloads/drivers/ to download and install it.')
+
+
+def handle_error(session, code, ignore_warnings, is_error_handling):
+    '''handle_error
+
+    Helper function for handling errors returned by nidcpower.Library.
+    It raises Error or warns with NidcpowerWarning if necessary. The
+    description is retrieved from the session when it is first used.
+    '''
+
+    if _is_success(code) or (_is_warning(code) and ignore_warnings):
+        return
+
+    if is_error_handling:
+        # The caller is in the midst of error handling and an error occurred.
+        # Don't try to get the description or we'll start recursing until the stack overflows.
+        description = ''
+        session = None
+    else:
+        description = None
+
+    if _is_error(code):
+        raise _add_pending(session, Error(code, description, session))
+
+    assert _is_warning(code)
+    # Warnings that occur during error handling are always issued
+    if session is not None and not session._warning_filter.should_warn(code):
+        return
+    warnings.warn(_add_pending(session, NidcpowerWarning(code, description, session)))
+
+
+def _add_pending(session, status):
+    # A function of its own so that the error is not a local variable of handle_error(), whose frame is kept
+    # alive by the traceback of the error
+    if session is not None:
+        session._pending_descriptions.add(status)
+    return status
+
+
+warnings.filterwarnings("always", category=NidcpowerWarning)
@@ -0,0 +1,449 @@
+# This file was generated
+
+import ctypes
+import threading
+
+from nidmm.visatype import *  # noqa: F403,H303
+
+
+class Library(object):
+    '''Library
+
+    Wrapper around driver library.
+    Class will setup the correct ctypes information for every function on first call.
+
+    Binding uses double-checked locking: _func_lock is only taken the first time a function
+    is called. Call bind_all_functions() to bind every function up front, after which no
+    call into the driver takes a Python-side lock.
+    '''
+
+    # ctypes prototype (argtypes, restype) of every function in the driver library
+    _prototypes = {
+        'niDMM_Abort': ([ViSession], ViStatus),  # noqa: F405
+        'niDMM_ConfigureACBandwidth': ([ViSession, ViReal64, ViReal64], ViStatus),  # noqa: F405
+        'niDMM_ConfigureMeasurementAbsolute': ([ViSession, ViInt32, ViReal64, ViReal64], ViStatus),  # noqa: F405
+        'niDMM_ConfigureMeasurementDigits': ([ViSession, ViInt32, ViReal64, ViReal64], ViStatus),  # noqa: F405
+        'niDMM_ConfigureMultiPoint': ([ViSession, ViInt32, ViInt32, ViInt32, ViReal64], ViStatus),  # noqa: F405
+        'niDMM_ConfigureOpenCableCompValues': ([ViSession, ViReal64, ViReal64], ViStatus),  # noqa: F405
+        'niDMM_ConfigurePowerLineFrequency': ([ViSession, ViReal64], ViStatus),  # noqa: F405
+        'niDMM_ConfigureRTDCustom': ([ViSession, ViReal64, ViReal64, ViReal64], ViStatus),  # noqa: F405
+        'niDMM_ConfigureRTDType': ([ViSession, ViInt32, ViReal64], ViStatus),  # noqa: F405
+        'niDMM_ConfigureShortCableCompValues': ([ViSession, ViReal64, ViReal64], ViStatus),  # noqa: F405
+        'niDMM_ConfigureThermistorCustom': ([ViSession, ViReal64, ViReal64, ViReal64], ViStatus),  # noqa: F405
+        'niDMM_ConfigureThermocouple': ([ViSession, ViInt32, ViInt32], ViStatus),  # noqa: F405
+        'niDMM_ConfigureTrigger': ([ViSession, ViInt32, ViReal64], ViStatus),  # noqa: F405
+        'niDMM_ConfigureWaveformAcquisition': ([ViSession, ViInt32, ViReal64, ViReal64, ViInt32], ViStatus),  # noqa: F405
+        'niDMM_Disable': ([ViSession], ViStatus),  # noqa: F405
+        'niDMM_Fetch': ([ViSession, ViInt32, ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niDMM_FetchMultiPoint': ([ViSession, ViInt32, ViInt32, ctypes.POINTER(ViReal64), ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niDMM_FetchWaveform': ([ViSession, ViInt32, ViInt32, ctypes.POINTER(ViReal64), ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niDMM_GetApertureTimeInfo': ([ViSession, ctypes.POINTER(ViReal64), ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niDMM_GetAttributeViBoolean': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViBoolean)], ViStatus),  # noqa: F405
+        'niDMM_GetAttributeViInt32': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niDMM_GetAttributeViReal64': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niDMM_GetAttributeViString': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ViInt32, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niDMM_GetAutoRangeValue': ([ViSession, ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niDMM_GetCalDateAndTime': ([ViSession, ViInt32, ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niDMM_GetDevTemp': ([ViSession, ctypes.POINTER(ViChar), ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niDMM_GetError': ([ViSession, ctypes.POINTER(ViStatus), ViInt32, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niDMM_GetExtCalRecommendedInterval': ([ViSession, ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niDMM_GetLastCalTemp': ([ViSession, ViInt32, ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niDMM_GetMeasurementPeriod': ([ViSession, ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niDMM_GetSelfCalSupported': ([ViSession, ctypes.POINTER(ViBoolean)], ViStatus),  # noqa: F405
+        'niDMM_InitWithOptions': ([ctypes.POINTER(ViChar), ViBoolean, ViBoolean, ctypes.POINTER(ViChar), ctypes.POINTER(ViSession)], ViStatus),  # noqa: F405
+        'niDMM_Initiate': ([ViSession], ViStatus),  # noqa: F405
+        'niDMM_PerformOpenCableComp': ([ViSession, ctypes.POINTER(ViReal64), ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niDMM_PerformShortCableComp': ([ViSession, ctypes.POINTER(ViReal64), ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niDMM_Read': ([ViSession, ViInt32, ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niDMM_ReadMultiPoint': ([ViSession, ViInt32, ViInt32, ctypes.POINTER(ViReal64), ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niDMM_ReadStatus': ([ViSession, ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt16)], ViStatus),  # noqa: F405
+        'niDMM_ReadWaveform': ([ViSession, ViInt32, ViInt32, ctypes.POINTER(ViReal64), ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niDMM_ResetWithDefaults': ([ViSession], ViStatus),  # noqa: F405
+        'niDMM_SelfCal': ([ViSession], ViStatus),  # noqa: F405
+        'niDMM_SendSoftwareTrigger': ([ViSession], ViStatus),  # noqa: F405
+        'niDMM_SetAttributeViBoolean': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ViBoolean], ViStatus),  # noqa: F405
+        'niDMM_SetAttributeViInt32': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ViInt32], ViStatus),  # noqa: F405
+        'niDMM_SetAttributeViReal64': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ViReal64], ViStatus),  # noqa: F405
+        'niDMM_SetAttributeViString': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niDMM_close': ([ViSession], ViStatus),  # noqa: F405
+        'niDMM_error_message': ([ViSession, ViStatus, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niDMM_reset': ([ViSession], ViStatus),  # noqa: F405
+        'niDMM_self_test': ([ViSession, ctypes.POINTER(ViInt16), ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+    }
+
+    def __init__(self, ctypes_library):
+        self._func_lock = threading.Lock()
+        self._library = ctypes_library
+        # We cache the cfunc object from the ctypes.CDLL object
+        self.niDMM_Abort_cfunc = None
+        self.niDMM_ConfigureACBandwidth_cfunc = None
+        self.niDMM_ConfigureMeasurementAbsolute_cfunc = None
+        self.niDMM_ConfigureMeasurementDigits_cfunc = None
+        self.niDMM_ConfigureMultiPoint_cfunc = None
+        self.niDMM_ConfigureOpenCableCompValues_cfunc = None
+        self.niDMM_ConfigurePowerLineFrequency_cfunc = None
+        self.niDMM_ConfigureRTDCustom_cfunc = None
+        self.niDMM_ConfigureRTDType_cfunc = None
+        self.niDMM_ConfigureShortCableCompValues_cfunc = None
+        self.niDMM_ConfigureThermistorCustom_cfunc = None
+        self.niDMM_ConfigureThermocouple_cfunc = None
+        self.niDMM_ConfigureTrigger_cfunc = None
+        self.niDMM_ConfigureWaveformAcquisition_cfunc = None
+        self.niDMM_Disable_cfunc = None
+        self.niDMM_Fetch_cfunc = None
+        self.niDMM_FetchMultiPoint_cfunc = None
+        self.niDMM_FetchWaveform_cfunc = None
+        self.niDMM_GetApertureTimeInfo_cfunc = None
+        self.niDMM_GetAttributeViBoolean_cfunc = None
+        self.niDMM_GetAttributeViInt32_cfunc = None
+        self.niDMM_GetAttributeViReal64_cfunc = None
+        self.niDMM_GetAttributeViString_cfunc = None
+        self.niDMM_GetAutoRangeValue_cfunc = None
+        self.niDMM_GetCalDateAndTime_cfunc = None
+        self.niDMM_GetDevTemp_cfunc = None
+        self.niDMM_GetError_cfunc = None
+        self.niDMM_GetExtCalRecommendedInterval_cfunc = None
+        self.niDMM_GetLastCalTemp_cfunc = None
+        self.niDMM_GetMeasurementPeriod_cfunc = None
+        self.niDMM_GetSelfCalSupported_cfunc = None
+        self.niDMM_InitWithOptions_cfunc = None
+        self.niDMM_Initiate_cfunc = None
+        self.niDMM_PerformOpenCableComp_cfunc = None
+        self.niDMM_PerformShortCableComp_cfunc = None
+        self.niDMM_Read_cfunc = None
+        self.niDMM_ReadMultiPoint_cfunc = None
+        self.niDMM_ReadStatus_cfunc = None
+        self.niDMM_ReadWaveform_cfunc = None
+        self.niDMM_ResetWithDefaults_cfunc = None
+        self.niDMM_SelfCal_cfunc = None
+        self.niDMM_SendSoftwareTrigger_cfunc = None
+        self.niDMM_SetAttributeViBoolean_cfunc = None
+        self.niDMM_SetAttributeViInt32_cfunc = None
+        self.niDMM_SetAttributeViReal64_cfunc = None
+        self.niDMM_SetAttributeViString_cfunc = None
+        self.niDMM_close_cfunc = None
+        self.niDMM_error_message_cfunc = None
+        self.niDMM_reset_cfunc = None
+        self.niDMM_self_test_cfunc = None
+
+    def _bind_function(self, c_func_name):
+        with self._func_lock:
+            cfunc = getattr(self, c_func_name + '_cfunc')
+            if cfunc is None:
+                cfunc = getattr(self._library, c_func_name)
+                cfunc.argtypes, cfunc.restype = self._prototypes[c_func_name]
+                # Only publish the cfunc once it is fully typed, other threads read it without the lock
+                setattr(self, c_func_name + '_cfunc', cfunc)
+        return cfunc
+
+    def bind_all_functions(self):
+        '''bind_all_functions
+
+        Resolves and sets up the ctypes information for every function in the driver library.
+        Functions not exported by the driver runtime are left unbound and raise on first call.
+        '''
+        for c_func_name in sorted(self._prototypes):
+            try:
+                self._bind_function(c_func_name)
+            except AttributeError:
+                pass
+
+    def niDMM_Abort(self, vi):  # noqa: N802
+        cfunc = self.niDMM_Abort_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_Abort')
+        return cfunc(vi)
+
+    def niDMM_ConfigureACBandwidth(self, vi, ac_minimum_frequency_hz, ac_maximum_frequency_hz):  # noqa: N802
+        cfunc = self.niDMM_ConfigureACBandwidth_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_ConfigureACBandwidth')
+        return cfunc(vi, ac_minimum_frequency_hz, ac_maximum_frequency_hz)
+
+    def niDMM_ConfigureMeasurementAbsolute(self, vi, measurement_function, range, resolution_absolute):  # noqa: N802
+        cfunc = self.niDMM_ConfigureMeasurementAbsolute_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_ConfigureMeasurementAbsolute')
+        return cfunc(vi, measurement_function, range, resolution_absolute)
+
+    def niDMM_ConfigureMeasurementDigits(self, vi, measurement_function, range, resolution_digits):  # noqa: N802
+        cfunc = self.niDMM_ConfigureMeasurementDigits_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_ConfigureMeasurementDigits')
+        return cfunc(vi, measurement_function, range, resolution_digits)
+
+    def niDMM_ConfigureMultiPoint(self, vi, trigger_count, sample_count, sample_trigger, sample_interval):  # noqa: N802
+        cfunc = self.niDMM_ConfigureMultiPoint_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_ConfigureMultiPoint')
+        return cfunc(vi, trigger_count, sample_count, sample_trigger, sample_interval)
+
+    def niDMM_ConfigureOpenCableCompValues(self, vi, conductance, susceptance):  # noqa: N802
+        cfunc = self.niDMM_ConfigureOpenCableCompValues_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_ConfigureOpenCableCompValues')
+        return cfunc(vi, conductance, susceptance)
+
+    def niDMM_ConfigurePowerLineFrequency(self, vi, power_line_frequency_hz):  # noqa: N802
+        cfunc = self.niDMM_ConfigurePowerLineFrequency_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_ConfigurePowerLineFrequency')
+        return cfunc(vi, power_line_frequency_hz)
+
+    def niDMM_ConfigureRTDCustom(self, vi, rtd_a, rtd_b, rtd_c):  # noqa: N802
+        cfunc = self.niDMM_ConfigureRTDCustom_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_ConfigureRTDCustom')
+        return cfunc(vi, rtd_a, rtd_b, rtd_c)
+
+    def niDMM_ConfigureRTDType(self, vi, rtd_type, rtd_resistance):  # noqa: N802
+        cfunc = self.niDMM_ConfigureRTDType_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_ConfigureRTDType')
+        return cfunc(vi, rtd_type, rtd_resistance)
+
+    def niDMM_ConfigureShortCableCompValues(self, vi, resistance, reactance):  # noqa: N802
+        cfunc = self.niDMM_ConfigureShortCableCompValues_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_ConfigureShortCableCompValues')
+        return cfunc(vi, resistance, reactance)
+
+    def niDMM_ConfigureThermistorCustom(self, vi, thermistor_a, thermistor_b, thermistor_c):  # noqa: N802
+        cfunc = self.niDMM_ConfigureThermistorCustom_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_ConfigureThermistorCustom')
+        return cfunc(vi, thermistor_a, thermistor_b, thermistor_c)
+
+    def niDMM_ConfigureThermocouple(self, vi, thermocouple_type, reference_junction_type):  # noqa: N802
+        cfunc = self.niDMM_ConfigureThermocouple_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_ConfigureThermocouple')
+        return cfunc(vi, thermocouple_type, reference_junction_type)
+
+    def niDMM_ConfigureTrigger(self, vi, trigger_source, trigger_delay):  # noqa: N802
+        cfunc = self.niDMM_ConfigureTrigger_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_ConfigureTrigger')
+        return cfunc(vi, trigger_source, trigger_delay)
+
+    def niDMM_ConfigureWaveformAcquisition(self, vi, measurement_function, range, rate, waveform_points):  # noqa: N802
+        cfunc = self.niDMM_ConfigureWaveformAcquisition_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_ConfigureWaveformAcquisition')
+        return cfunc(vi, measurement_function, range, rate, waveform_points)
+
+    def niDMM_Disable(self, vi):  # noqa: N802
+        cfunc = self.niDMM_Disable_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_Disable')
+        return cfunc(vi)
+
+    def niDMM_Fetch(self, vi, maximum_time, reading):  # noqa: N802
+        cfunc = self.niDMM_Fetch_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_Fetch')
+        return cfunc(vi, maximum_time, reading)
+
+    def niDMM_FetchMultiPoint(self, vi, maximum_time, array_size, reading_array, actual_number_of_points):  # noqa: N802
+        cfunc = self.niDMM_FetchMultiPoint_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_FetchMultiPoint')
+        return cfunc(vi, maximum_time, array_size, reading_array, actual_number_of_points)
+
+    def niDMM_FetchWaveform(self, vi, maximum_time, array_size, waveform_array, actual_number_of_points):  # noqa: N802
+        cfunc = self.niDMM_FetchWaveform_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_FetchWaveform')
+        return cfunc(vi, maximum_time, array_size, waveform_array, actual_number_of_points)
+
+    def niDMM_GetApertureTimeInfo(self, vi, aperture_time, aperture_time_units):  # noqa: N802
+        cfunc = self.niDMM_GetApertureTimeInfo_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_GetApertureTimeInfo')
+        return cfunc(vi, aperture_time, aperture_time_units)
+
+    def niDMM_GetAttributeViBoolean(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
+        cfunc = self.niDMM_GetAttributeViBoolean_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_GetAttributeViBoolean')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
+
+    def niDMM_GetAttributeViInt32(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
+        cfunc = self.niDMM_GetAttributeViInt32_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_GetAttributeViInt32')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
+
+    def niDMM_GetAttributeViReal64(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
+        cfunc = self.niDMM_GetAttributeViReal64_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_GetAttributeViReal64')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
+
+    def niDMM_GetAttributeViString(self, vi, channel_name, attribute_id, buffer_size, attribute_value):  # noqa: N802
+        cfunc = self.niDMM_GetAttributeViString_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_GetAttributeViString')
+        return cfunc(vi, channel_name, attribute_id, buffer_size, attribute_value)
+
+    def niDMM_GetAutoRangeValue(self, vi, actual_range):  # noqa: N802
+        cfunc = self.niDMM_GetAutoRangeValue_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_GetAutoRangeValue')
+        return cfunc(vi, actual_range)
+
+    def niDMM_GetCalDateAndTime(self, vi, cal_type, month, day, year, hour, minute):  # noqa: N802
+        cfunc = self.niDMM_GetCalDateAndTime_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_GetCalDateAndTime')
+        return cfunc(vi, cal_type, month, day, year, hour, minute)
+
+    def niDMM_GetDevTemp(self, vi, options, temperature):  # noqa: N802
+        cfunc = self.niDMM_GetDevTemp_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_GetDevTemp')
+        return cfunc(vi, options, temperature)
+
+    def niDMM_GetError(self, vi, error_code, buffer_size, description):  # noqa: N802
+        cfunc = self.niDMM_GetError_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_GetError')
+        return cfunc(vi, error_code, buffer_size, description)
+
+    def niDMM_GetExtCalRecommendedInterval(self, vi, months):  # noqa: N802
+        cfunc = self.niDMM_GetExtCalRecommendedInterval_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_GetExtCalRecommendedInterval')
+        return cfunc(vi, months)
+
+    def niDMM_GetLastCalTemp(self, vi, cal_type, temperature):  # noqa: N802
+        cfunc = self.niDMM_GetLastCalTemp_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_GetLastCalTemp')
+        return cfunc(vi, cal_type, temperature)
+
+    def niDMM_GetMeasurementPeriod(self, vi, period):  # noqa: N802
+        cfunc = self.niDMM_GetMeasurementPeriod_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_GetMeasurementPeriod')
+        return cfunc(vi, period)
+
+    def niDMM_GetSelfCalSupported(self, vi, self_cal_supported):  # noqa: N802
+        cfunc = self.niDMM_GetSelfCalSupported_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_GetSelfCalSupported')
+        return cfunc(vi, self_cal_supported)
+
+    def niDMM_InitWithOptions(self, resource_name, id_query, reset_device, option_string, vi):  # noqa: N802
+        cfunc = self.niDMM_InitWithOptions_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_InitWithOptions')
+        return cfunc(resource_name, id_query, reset_device, option_string, vi)
+
+    def niDMM_Initiate(self, vi):  # noqa: N802
+        cfunc = self.niDMM_Initiate_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_Initiate')
+        return cfunc(vi)
+
+    def niDMM_PerformOpenCableComp(self, vi, conductance, susceptance):  # noqa: N802
+        cfunc = self.niDMM_PerformOpenCableComp_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_PerformOpenCableComp')
+        return cfunc(vi, conductance, susceptance)
+
+    def niDMM_PerformShortCableComp(self, vi, resistance, reactance):  # noqa: N802
+        cfunc = self.niDMM_PerformShortCableComp_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_PerformShortCableComp')
+        return cfunc(vi, resistance, reactance)
+
+    def niDMM_Read(self, vi, maximum_time, reading):  # noqa: N802
+        cfunc = self.niDMM_Read_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_Read')
+        return cfunc(vi, maximum_time, reading)
+
+    def niDMM_ReadMultiPoint(self, vi, maximum_time, array_size, reading_array, actual_number_of_points):  # noqa: N802
+        cfunc = self.niDMM_ReadMultiPoint_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_ReadMultiPoint')
+        return cfunc(vi, maximum_time, array_size, reading_array, actual_number_of_points)
+
+    def niDMM_ReadStatus(self, vi, acquisition_backlog, acquisition_status):  # noqa: N802
+        cfunc = self.niDMM_ReadStatus_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_ReadStatus')
+        return cfunc(vi, acquisition_backlog, acquisition_status)
+
+    def niDMM_ReadWaveform(self, vi, maximum_time, array_size, waveform_array, actual_number_of_points):  # noqa: N802
+        cfunc = self.niDMM_ReadWaveform_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_ReadWaveform')
+        return cfunc(vi, maximum_time, array_size, waveform_array, actual_number_of_points)
+
+    def niDMM_ResetWithDefaults(self, vi):  # noqa: N802
+        cfunc = self.niDMM_ResetWithDefaults_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_ResetWithDefaults')
+        return cfunc(vi)
+
+    def niDMM_SelfCal(self, vi):  # noqa: N802
+        cfunc = self.niDMM_SelfCal_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_SelfCal')
+        return cfunc(vi)
+
+    def niDMM_SendSoftwareTrigger(self, vi):  # noqa: N802
+        cfunc = self.niDMM_SendSoftwareTrigger_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_SendSoftwareTrigger')
+        return cfunc(vi)
+
+    def niDMM_SetAttributeViBoolean(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
+        cfunc = self.niDMM_SetAttributeViBoolean_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_SetAttributeViBoolean')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
+
+    def niDMM_SetAttributeViInt32(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
+        cfunc = self.niDMM_SetAttributeViInt32_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_SetAttributeViInt32')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
+
+    def niDMM_SetAttributeViReal64(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
+        cfunc = self.niDMM_SetAttributeViReal64_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_SetAttributeViReal64')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
+
+    def niDMM_SetAttributeViString(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
+        cfunc = self.niDMM_SetAttributeViString_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_SetAttributeViString')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
+
+    def niDMM_close(self, vi):  # noqa: N802
+        cfunc = self.niDMM_close_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_close')
+        return cfunc(vi)
+
+    def niDMM_error_message(self, vi, error_code, error_message):  # noqa: N802
+        cfunc = self.niDMM_error_message_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_error_message')
+        return cfunc(vi, error_code, error_message)
+
+    def niDMM_reset(self, vi):  # noqa: N802
+        cfunc = self.niDMM_reset_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_reset')
+        return cfunc(vi)
+
+    def niDMM_self_test(self, vi, self_test_result, self_test_message):  # noqa: N802
+        cfunc = self.niDMM_self_test_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_self_test')
+        return cfunc(vi, self_test_result, self_test_message)
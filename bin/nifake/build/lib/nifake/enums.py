@@ -0,0 +1,64 @@
+# This file was generated
+
+from enum import Enum
+
+
+class Color(Enum):
+    RED = 1
+    '''
+    Like blood.
+    '''
+    BLUE = 2
+    '''
+    Like the sky.
+    '''
+    YELLOW = 2
+    '''
+    Like a banana.
+    '''
+    BLACK = 2
+    '''
+    Like this developer's conscience.
+    '''
+
+
+class FloatEnum(Enum):
+    THREE_POINT_FIVE = 3.5
+    '''
+    Specifies 3.5 digits resolution.
+    '''
+    FOUR_POINT_FIVE = 4.5
+    '''
+    Specifies 4.5 digits resolution.
+    '''
+    FIVE_POINT_FIVE = 5.5
+    '''
+    Specifies 5.5 digits resolution.
+    '''
+    SIX_POINT_FIVE = 6.5
+    '''
+    Specifies 6.5 digits resolution.
+    '''
+    SEVEN_POINT_FIVE = 7.5
+    '''
+    Specifies 7.5 digits resolution.
+    '''
+
+
+class Turtle(Enum):
+    LEONARDO = 0
+    '''
+    Wields two katanas.
+    '''
+    DONATELLO = 1
+    '''
+    Uses a bo staff.
+    '''
+    RAPHAEL = 2
+    '''
+    Has a pair of sai.
+    '''
+    MICHELANGELO = 3
+    '''
+    Owns nunchucks.
+    '''
@@ -0,0 +1,411 @@
+# This file was generated
+
+import ctypes
+import threading
+
+from nifake.visatype import *  # noqa: F403,H303
+
+from nifake import custom_struct  # noqa: F401
+
+
+class Library(object):
+    '''Library
+
+    Wrapper around driver library.
+    Class will setup the correct ctypes information for every function on first call.
+
+    Binding uses double-checked locking: _func_lock is only taken the first time a function
+    is called. Call bind_all_functions() to bind every function up front, after which no
+    call into the driver takes a Python-side lock.
+    '''
+
+    # ctypes prototype (argtypes, restype) of every function in the driver library
+    _prototypes = {
+        'niFake_Abort': ([ViSession], ViStatus),  # noqa: F405
+        'niFake_BoolArrayOutputFunction': ([ViSession, ViInt32, ctypes.POINTER(ViBoolean)], ViStatus),  # noqa: F405
+        'niFake_EnumArrayOutputFunction': ([ViSession, ViInt32, ctypes.POINTER(ViInt16)], ViStatus),  # noqa: F405
+        'niFake_EnumInputFunctionWithDefaults': ([ViSession, ViInt16], ViStatus),  # noqa: F405
+        'niFake_FetchWaveform': ([ViSession, ViInt32, ctypes.POINTER(ViReal64), ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niFake_GetABoolean': ([ViSession, ctypes.POINTER(ViBoolean)], ViStatus),  # noqa: F405
+        'niFake_GetANumber': ([ViSession, ctypes.POINTER(ViInt16)], ViStatus),  # noqa: F405
+        'niFake_GetAStringOfFixedMaximumSize': ([ViSession, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niFake_GetAnIviDanceString': ([ViSession, ViInt32, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niFake_GetArrayForPythonCodeCustomType': ([ViSession, ViInt32, ctypes.POINTER(custom_struct.custom_struct)], ViStatus),  # noqa: F405
+        'niFake_GetArrayForPythonCodeDouble': ([ViSession, ViInt32, ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niFake_GetArraySizeForPythonCode': ([ViSession, ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niFake_GetArrayUsingIVIDance': ([ViSession, ViInt32, ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niFake_GetAttributeViBoolean': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViBoolean)], ViStatus),  # noqa: F405
+        'niFake_GetAttributeViInt32': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niFake_GetAttributeViInt64': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViInt64)], ViStatus),  # noqa: F405
+        'niFake_GetAttributeViReal64': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niFake_GetAttributeViString': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ViInt32, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niFake_GetCalDateAndTime': ([ViSession, ViInt32, ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niFake_GetCustomType': ([ViSession, ctypes.POINTER(custom_struct.custom_struct)], ViStatus),  # noqa: F405
+        'niFake_GetCustomTypeArray': ([ViSession, ViInt32, ctypes.POINTER(custom_struct.custom_struct)], ViStatus),  # noqa: F405
+        'niFake_GetEnumValue': ([ViSession, ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt16)], ViStatus),  # noqa: F405
+        'niFake_GetError': ([ViSession, ctypes.POINTER(ViStatus), ViInt32, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niFake_InitWithOptions': ([ctypes.POINTER(ViChar), ViBoolean, ViBoolean, ctypes.POINTER(ViChar), ctypes.POINTER(ViSession)], ViStatus),  # noqa: F405
+        'niFake_Initiate': ([ViSession], ViStatus),  # noqa: F405
+        'niFake_MultipleArrayTypes': ([ViSession, ViInt32, ctypes.POINTER(ViReal64), ctypes.POINTER(ViReal64), ViInt32, ctypes.POINTER(ViReal64), ctypes.POINTER(ViInt16)], ViStatus),  # noqa: F405
+        'niFake_OneInputFunction': ([ViSession, ViInt32], ViStatus),  # noqa: F405
+        'niFake_ParametersAreMultipleTypes': ([ViSession, ViBoolean, ViInt32, ViInt64, ViInt16, ViReal64, ViReal64, ViInt32, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niFake_PoorlyNamedSimpleFunction': ([ViSession], ViStatus),  # noqa: F405
+        'niFake_Read': ([ViSession, ViReal64, ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niFake_ReadFromChannel': ([ViSession, ctypes.POINTER(ViChar), ViInt32, ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niFake_ReturnANumberAndAString': ([ViSession, ctypes.POINTER(ViInt16), ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niFake_ReturnMultipleTypes': ([ViSession, ctypes.POINTER(ViBoolean), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt64), ctypes.POINTER(ViInt16), ctypes.POINTER(ViReal64), ctypes.POINTER(ViReal64), ViInt32, ctypes.POINTER(ViReal64), ViInt32, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niFake_SetAttributeViBoolean': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ViBoolean], ViStatus),  # noqa: F405
+        'niFake_SetAttributeViInt32': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ViInt32], ViStatus),  # noqa: F405
+        'niFake_SetAttributeViInt64': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ViInt64], ViStatus),  # noqa: F405
+        'niFake_SetAttributeViReal64': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ViReal64], ViStatus),  # noqa: F405
+        'niFake_SetAttributeViString': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niFake_SetCustomType': ([ViSession, custom_struct.custom_struct], ViStatus),  # noqa: F405
+        'niFake_SetCustomTypeArray': ([ViSession, ViInt32, ctypes.POINTER(custom_struct.custom_struct)], ViStatus),  # noqa: F405
+        'niFake_TwoInputFunction': ([ViSession, ViReal64, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niFake_Use64BitNumber': ([ViSession, ViInt64, ctypes.POINTER(ViInt64)], ViStatus),  # noqa: F405
+        'niFake_WriteWaveform': ([ViSession, ViInt32, ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niFake_close': ([ViSession], ViStatus),  # noqa: F405
+        'niFake_error_message': ([ViSession, ViStatus, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+    }
+
+    def __init__(self, ctypes_library):
+        self._func_lock = threading.Lock()
+        self._library = ctypes_library
+        # We cache the cfunc object from the ctypes.CDLL object
+        self.niFake_Abort_cfunc = None
+        self.niFake_BoolArrayOutputFunction_cfunc = None
+        self.niFake_EnumArrayOutputFunction_cfunc = None
+        self.niFake_EnumInputFunctionWithDefaults_cfunc = None
+        self.niFake_FetchWaveform_cfunc = None
+        self.niFake_GetABoolean_cfunc = None
+        self.niFake_GetANumber_cfunc = None
+        self.niFake_GetAStringOfFixedMaximumSize_cfunc = None
+        self.niFake_GetAnIviDanceString_cfunc = None
+        self.niFake_GetArrayForPythonCodeCustomType_cfunc = None
+        self.niFake_GetArrayForPythonCodeDouble_cfunc = None
+        self.niFake_GetArraySizeForPythonCode_cfunc = None
+        self.niFake_GetArrayUsingIVIDance_cfunc = None
+        self.niFake_GetAttributeViBoolean_cfunc = None
+        self.niFake_GetAttributeViInt32_cfunc = None
+        self.niFake_GetAttributeViInt64_cfunc = None
+        self.niFake_GetAttributeViReal64_cfunc = None
+        self.niFake_GetAttributeViString_cfunc = None
+        self.niFake_GetCalDateAndTime_cfunc = None
+        self.niFake_GetCustomType_cfunc = None
+        self.niFake_GetCustomTypeArray_cfunc = None
+        self.niFake_GetEnumValue_cfunc = None
+        self.niFake_GetError_cfunc = None
+        self.niFake_InitWithOptions_cfunc = None
+        self.niFake_Initiate_cfunc = None
+        self.niFake_MultipleArrayTypes_cfunc = None
+        self.niFake_OneInputFunction_cfunc = None
+        self.niFake_ParametersAreMultipleTypes_cfunc = None
+        self.niFake_PoorlyNamedSimpleFunction_cfunc = None
+        self.niFake_Read_cfunc = None
+        self.niFake_ReadFromChannel_cfunc = None
+        self.niFake_ReturnANumberAndAString_cfunc = None
+        self.niFake_ReturnMultipleTypes_cfunc = None
+        self.niFake_SetAttributeViBoolean_cfunc = None
+        self.niFake_SetAttributeViInt32_cfunc = None
+        self.niFake_SetAttributeViInt64_cfunc = None
+        self.niFake_SetAttributeViReal64_cfunc = None
+        self.niFake_SetAttributeViString_cfunc = None
+        self.niFake_SetCustomType_cfunc = None
+        self.niFake_SetCustomTypeArray_cfunc = None
+        self.niFake_TwoInputFunction_cfunc = None
+        self.niFake_Use64BitNumber_cfunc = None
+        self.niFake_WriteWaveform_cfunc = None
+        self.niFake_close_cfunc = None
+        self.niFake_error_message_cfunc = None
+
+    def _bind_function(self, c_func_name):
+        with self._func_lock:
+            cfunc = getattr(self, c_func_name + '_cfunc')
+            if cfunc is None:
+                cfunc = getattr(self._library, c_func_name)
+                cfunc.argtypes, cfunc.restype = self._prototypes[c_func_name]
+                # Only publish the cfunc once it is fully typed, other threads read it without the lock
+                setattr(self, c_func_name + '_cfunc', cfunc)
+        return cfunc
+
+    def bind_all_functions(self):
+        '''bind_all_functions
+
+        Resolves and sets up the ctypes information for every function in the driver library.
+        Functions not exported by the driver runtime are left unbound and raise on first call.
+        '''
+        for c_func_name in sorted(self._prototypes):
+            try:
+                self._bind_function(c_func_name)
+            except AttributeError:
+                pass
+
+    def niFake_Abort(self, vi):  # noqa: N802
+        cfunc = self.niFake_Abort_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_Abort')
+        return cfunc(vi)
+
+    def niFake_BoolArrayOutputFunction(self, vi, number_of_elements, an_array):  # noqa: N802
+        cfunc = self.niFake_BoolArrayOutputFunction_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_BoolArrayOutputFunction')
+        return cfunc(vi, number_of_elements, an_array)
+
+    def niFake_EnumArrayOutputFunction(self, vi, number_of_elements, an_array):  # noqa: N802
+        cfunc = self.niFake_EnumArrayOutputFunction_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_EnumArrayOutputFunction')
+        return cfunc(vi, number_of_elements, an_array)
+
+    def niFake_EnumInputFunctionWithDefaults(self, vi, a_turtle):  # noqa: N802
+        cfunc = self.niFake_EnumInputFunctionWithDefaults_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_EnumInputFunctionWithDefaults')
+        return cfunc(vi, a_turtle)
+
+    def niFake_FetchWaveform(self, vi, number_of_samples, waveform_data, actual_number_of_samples):  # noqa: N802
+        cfunc = self.niFake_FetchWaveform_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_FetchWaveform')
+        return cfunc(vi, number_of_samples, waveform_data, actual_number_of_samples)
+
+    def niFake_GetABoolean(self, vi, a_boolean):  # noqa: N802
+        cfunc = self.niFake_GetABoolean_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_GetABoolean')
+        return cfunc(vi, a_boolean)
+
+    def niFake_GetANumber(self, vi, a_number):  # noqa: N802
+        cfunc = self.niFake_GetANumber_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_GetANumber')
+        return cfunc(vi, a_number)
+
+    def niFake_GetAStringOfFixedMaximumSize(self, vi, a_string):  # noqa: N802
+        cfunc = self.niFake_GetAStringOfFixedMaximumSize_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_GetAStringOfFixedMaximumSize')
+        return cfunc(vi, a_string)
+
+    def niFake_GetAnIviDanceString(self, vi, buffer_size, a_string):  # noqa: N802
+        cfunc = self.niFake_GetAnIviDanceString_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_GetAnIviDanceString')
+        return cfunc(vi, buffer_size, a_string)
+
+    def niFake_GetArrayForPythonCodeCustomType(self, vi, number_of_elements, array_out):  # noqa: N802
+        cfunc = self.niFake_GetArrayForPythonCodeCustomType_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_GetArrayForPythonCodeCustomType')
+        return cfunc(vi, number_of_elements, array_out)
+
+    def niFake_GetArrayForPythonCodeDouble(self, vi, number_of_elements, array_out):  # noqa: N802
+        cfunc = self.niFake_GetArrayForPythonCodeDouble_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_GetArrayForPythonCodeDouble')
+        return cfunc(vi, number_of_elements, array_out)
+
+    def niFake_GetArraySizeForPythonCode(self, vi, size_out):  # noqa: N802
+        cfunc = self.niFake_GetArraySizeForPythonCode_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_GetArraySizeForPythonCode')
+        return cfunc(vi, size_out)
+
+    def niFake_GetArrayUsingIVIDance(self, vi, array_size, array_out):  # noqa: N802
+        cfunc = self.niFake_GetArrayUsingIVIDance_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_GetArrayUsingIVIDance')
+        return cfunc(vi, array_size, array_out)
+
+    def niFake_GetAttributeViBoolean(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
+        cfunc = self.niFake_GetAttributeViBoolean_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_GetAttributeViBoolean')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
+
+    def niFake_GetAttributeViInt32(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
+        cfunc = self.niFake_GetAttributeViInt32_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_GetAttributeViInt32')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
+
+    def niFake_GetAttributeViInt64(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
+        cfunc = self.niFake_GetAttributeViInt64_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_GetAttributeViInt64')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
+
+    def niFake_GetAttributeViReal64(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
+        cfunc = self.niFake_GetAttributeViReal64_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_GetAttributeViReal64')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
+
+    def niFake_GetAttributeViString(self, vi, channel_name, attribute_id, buffer_size, attribute_value):  # noqa: N802
+        cfunc = self.niFake_GetAttributeViString_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_GetAttributeViString')
+        return cfunc(vi, channel_name, attribute_id, buffer_size, attribute_value)
+
+    def niFake_GetCalDateAndTime(self, vi, cal_type, month, day, year, hour, minute):  # noqa: N802
+        cfunc = self.niFake_GetCalDateAndTime_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_GetCalDateAndTime')
+        return cfunc(vi, cal_type, month, day, year, hour, minute)
+
+    def niFake_GetCustomType(self, vi, cs):  # noqa: N802
+        cfunc = self.niFake_GetCustomType_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_GetCustomType')
+        return cfunc(vi, cs)
+
+    def niFake_GetCustomTypeArray(self, vi, number_of_elements, cs):  # noqa: N802
+        cfunc = self.niFake_GetCustomTypeArray_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_GetCustomTypeArray')
+        return cfunc(vi, number_of_elements, cs)
+
+    def niFake_GetEnumValue(self, vi, a_quantity, a_turtle):  # noqa: N802
+        cfunc = self.niFake_GetEnumValue_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_GetEnumValue')
+        return cfunc(vi, a_quantity, a_turtle)
+
+    def niFake_GetError(self, vi, error_code, buffer_size, description):  # noqa: N802
+        cfunc = self.niFake_GetError_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_GetError')
+        return cfunc(vi, error_code, buffer_size, description)
+
+    def niFake_InitWithOptions(self, resource_name, id_query, reset_device, option_string, vi):  # noqa: N802
+        cfunc = self.niFake_InitWithOptions_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_InitWithOptions')
+        return cfunc(resource_name, id_query, reset_device, option_string, vi)
+
+    def niFake_Initiate(self, vi):  # noqa: N802
+        cfunc = self.niFake_Initiate_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_Initiate')
+        return cfunc(vi)
+
+    def niFake_MultipleArrayTypes(self, vi, output_array_size, output_array, output_array_of_fixed_length, input_array_sizes, input_array_of_floats, input_array_of_integers):  # noqa: N802
+        cfunc = self.niFake_MultipleArrayTypes_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_MultipleArrayTypes')
+        return cfunc(vi, output_array_size, output_array, output_array_of_fixed_length, input_array_sizes, input_array_of_floats, input_array_of_integers)
+
+    def niFake_OneInputFunction(self, vi, a_number):  # noqa: N802
+        cfunc = self.niFake_OneInputFunction_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_OneInputFunction')
+        return cfunc(vi, a_number)
+
+    def niFake_ParametersAreMultipleTypes(self, vi, a_boolean, an_int32, an_int64, an_int_enum, a_float, a_float_enum, string_size, a_string):  # noqa: N802
+        cfunc = self.niFake_ParametersAreMultipleTypes_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_ParametersAreMultipleTypes')
+        return cfunc(vi, a_boolean, an_int32, an_int64, an_int_enum, a_float, a_float_enum, string_size, a_string)
+
+    def niFake_PoorlyNamedSimpleFunction(self, vi):  # noqa: N802
+        cfunc = self.niFake_PoorlyNamedSimpleFunction_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_PoorlyNamedSimpleFunction')
+        return cfunc(vi)
+
+    def niFake_Read(self, vi, maximum_time, reading):  # noqa: N802
+        cfunc = self.niFake_Read_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_Read')
+        return cfunc(vi, maximum_time, reading)
+
+    def niFake_ReadFromChannel(self, vi, channel_name, maximum_time, reading):  # noqa: N802
+        cfunc = self.niFake_ReadFromChannel_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_ReadFromChannel')
+        return cfunc(vi, channel_name, maximum_time, reading)
+
+    def niFake_ReturnANumberAndAString(self, vi, a_number, a_string):  # noqa: N802
+        cfunc = self.niFake_ReturnANumberAndAString_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_ReturnANumberAndAString')
+        return cfunc(vi, a_number, a_string)
+
+    def niFake_ReturnMultipleTypes(self, vi, a_boolean, an_int32, an_int64, an_int_enum, a_float, a_float_enum, array_size, an_array, string_size, a_string):  # noqa: N802
+        cfunc = self.niFake_ReturnMultipleTypes_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_ReturnMultipleTypes')
+        return cfunc(vi, a_boolean, an_int32, an_int64, an_int_enum, a_float, a_float_enum, array_size, an_array, string_size, a_string)
+
+    def niFake_SetAttributeViBoolean(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
+        cfunc = self.niFake_SetAttributeViBoolean_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_SetAttributeViBoolean')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
+
+    def niFake_SetAttributeViInt32(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
+        cfunc = self.niFake_SetAttributeViInt32_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_SetAttributeViInt32')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
+
+    def niFake_SetAttributeViInt64(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
+        cfunc = self.niFake_SetAttributeViInt64_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_SetAttributeViInt64')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
+
+    def niFake_SetAttributeViReal64(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
+        cfunc = self.niFake_SetAttributeViReal64_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_SetAttributeViReal64')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
+
+    def niFake_SetAttributeViString(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
+        cfunc = self.niFake_SetAttributeViString_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_SetAttributeViString')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
+
+    def niFake_SetCustomType(self, vi, cs):  # noqa: N802
+        cfunc = self.niFake_SetCustomType_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_SetCustomType')
+        return cfunc(vi, cs)
+
+    def niFake_SetCustomTypeArray(self, vi, number_of_elements, cs):  # noqa: N802
+        cfunc = self.niFake_SetCustomTypeArray_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_SetCustomTypeArray')
+        return cfunc(vi, number_of_elements, cs)
+
+    def niFake_TwoInputFunction(self, vi, a_number, a_string):  # noqa: N802
+        cfunc = self.niFake_TwoInputFunction_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_TwoInputFunction')
+        return cfunc(vi, a_number, a_string)
+
+    def niFake_Use64BitNumber(self, vi, input, output):  # noqa: N802
+        cfunc = self.niFake_Use64BitNumber_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_Use64BitNumber')
+        return cfunc(vi, input, output)
+
+    def niFake_WriteWaveform(self, vi, number_of_samples, waveform):  # noqa: N802
+        cfunc = self.niFake_WriteWaveform_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_WriteWaveform')
+        return cfunc(vi, number_of_samples, waveform)
+
+    def niFake_close(self, vi):  # noqa: N802
+        cfunc = self.niFake_close_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_close')
+        return cfunc(vi)
+
+    def niFake_error_message(self, vi, error_code, error_message):  # noqa: N802
+        cfunc = self.niFake_error_message_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFake_error_message')
+        return cfunc(vi, error_code, error_message)
@@ -0,0 +1,1816 @@
+# -*- coding: utf-8 -*-
+# This file was generated
+import array  # noqa: F401
+import collections
+import ctypes
+import datetime
+import six
+import threading
+
+from nifake import _converters
+from nifake import attributes
+from nifake import enums
+from nifake import errors
+from nifake import executor
+from nifake import library_singleton
+from nifake import visatype
+
+from nifake import custom_struct  # noqa: F401
+
+# Used for __repr__
+import pprint
+pp = pprint.PrettyPrinter(indent=4)
+
+
+# Helper functions for creating ctypes needed for calling into the driver DLL
+def get_ctypes_pointer_for_buffer(value=None, library_type=None, size=None):
+    if isinstance(value, array.array):
+        assert library_type is not None, 'library_type is required for array.array'
+        if value.itemsize == ctypes.sizeof(library_type) and (value.typecode in 'fd') == (getattr(library_type, '_type_', None) in ('f', 'd')):
+            # Passed by pointer, without copying
+            addr, _ = value.buffer_info()
+            return ctypes.cast(addr, ctypes.POINTER(library_type))
+        # Input buffer of another element type, i.e. array.array('f') for ViReal64
+        return (library_type * len(value))(*value)
+    elif str(type(value)).find("'numpy.ndarray'") != -1:
+        import numpy
+        if library_type is None:
+            return numpy.ctypeslib.as_ctypes(value)
+        dtype = numpy.dtype(library_type)
+        if value.dtype == dtype and value.flags.c_contiguous:
+            # Passed by pointer, without copying
+            return ctypes.cast(value.ctypes.data, ctypes.POINTER(library_type))
+        # Input buffer of another dtype or not contiguous. The ctypes array keeps a reference to the converted copy.
+        return numpy.ctypeslib.as_ctypes(numpy.ascontiguousarray(value.astype(dtype, casting='same_kind', copy=False)))
+    elif isinstance(value, (list, tuple)):
+        assert library_type is not None, 'library_type is required for list'
+        return (library_type * len(value))(*value)
+    else:
+        if library_type is not None and size is not None:
+            return (library_type * size)()
+        else:
+            return None
+
+
+def get_ctypes_and_array(value, array_type):
+    if value is not None:
+        if isinstance(value, array.array) or str(type(value)).find("'numpy.ndarray'") != -1:
+            # get_ctypes_pointer_for_buffer() passes them by pointer when the element type matches
+            value_array = value
+        else:
+            value_array = array.array(array_type, value)
+    else:
+        value_array = None
+
+    return value_array
+
+
+class _Acquisition(object):
+    def __init__(self, session):
+        self._session = session
+        self._session._initiate()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._session.abort()
+
+
+class _LruCache(object):
+    '''Dictionary with at most maxsize entries that discards the least recently used entry when full'''
+
+    def __init__(self, maxsize):
+        self._maxsize = maxsize
+        self._values = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, create):
+        '''Returns the value stored for key, calling create() and storing its result on a miss'''
+        with self._lock:
+            try:
+                value = self._values.pop(key)
+                self._values[key] = value
+                return value
+            except KeyError:
+                pass
+        # Don't hold the lock while creating the value, create() may call into the driver
+        value = create()
+        with self._lock:
+            self._values[key] = value
+            if len(self._values) > self._maxsize:
+                self._values.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+
+def _get_repeated_capability_cache_key(repeated_capability):
+    '''Returns a hashable key for repeated_capability, or None for values that are not cached (i.e. generators)'''
+    simple_types = six.string_types + six.integer_types
+    if isinstance(repeated_capability, simple_types):
+        # The type is part of the key so that i.e. True and 1 are different keys
+        return (type(repeated_capability), repeated_capability)
+    if isinstance(repeated_capability, slice):
+        return (slice, repeated_capability.start, repeated_capability.stop, repeated_capability.step)
+    if isinstance(repeated_capability, (list, tuple)) and all(isinstance(r, simple_types) for r in repeated_capability):
+        return (type(repeated_capability), ) + tuple((type(r), r) for r in repeated_capability)
+    return None
+
+
+class _RepeatedCapabilities(object):
+    # Maximum number of objects kept by each repeated capability, see __getitem__
+    _cache_size = 128
+
+    def __init__(self, session, prefix):
+        self._session = session
+        self._prefix = prefix
+        self._cache = _LruCache(self._cache_size)
+
+    def __getitem__(self, repeated_capability):
+        '''Set/get properties or call methods with a repeated capability (i.e. channels)'''
+        key = _get_repeated_capability_cache_key(repeated_capability)
+        if key is None:
+            return self._create(repeated_capability)
+        # The objects are immutable, so the ones for recently used repeated capabilities are reused
+        # instead of parsing the repeated capability and encoding the resulting string again
+        return self._cache.get(key, lambda: self._create(repeated_capability))
+
+    def _create(self, repeated_capability):
+        rep_caps = _converters.convert_repeated_capabilities(repeated_capability, self._prefix)
+
+        return self._session._with_repeated_capability(rep_caps)
+
+    def _clear_cache(self):
+        self._cache.clear()
+
+
+class _SessionBase(errors._WarningPolicyMixin):
+    '''Base class for all NI-FAKE sessions.'''
+
+    # This is needed during __init__. Without it, __setattr__ raises an exception
+    _is_frozen = False
+
+    # Names that __setattr__ accepts without a dir() lookup once the session is frozen: the
+    # properties and the instance attributes set in __init__. Anything else falls back to dir().
+    _settable_names = frozenset([
+        '_vi',
+        '_attribute_cache',
+        '_channel_name_ctypes',
+        '_encoding',
+        '_error_descriptions',
+        '_is_frozen',
+        '_library',
+        '_memoized_results',
+        '_param_list',
+        '_pending_descriptions',
+        '_repeated_capability',
+        '_repeated_capability_ctype',
+        '_warning_filter',
+        'float_enum',
+        'read_write_bool',
+        'read_write_color',
+        'read_write_double',
+        'read_write_double_with_converter',
+        'read_write_int64',
+        'read_write_integer',
+        'read_write_integer_with_converter',
+        'read_write_string',
+    ])
+
+    float_enum = attributes.AttributeEnum(attributes.AttributeViReal64, enums.FloatEnum, 1000005)
+    '''Type: enums.FloatEnum
+
+    An property with an enum that is also a float
+    '''
+    read_write_bool = attributes.AttributeViBoolean(1000000)
+    '''Type: bool
+
+    An property of type bool with read/write access.
+    '''
+    read_write_color = attributes.AttributeEnum(attributes.AttributeViInt32, enums.Color, 1000003)
+    '''Type: enums.Color
+
+    An property of type Color with read/write access.
+    '''
+    read_write_double = attributes.AttributeViReal64(1000001)
+    '''Type: float
+
+    An property of type float with read/write access.
+    '''
+    read_write_double_with_converter = attributes.AttributeViReal64TimeDeltaSeconds(1000007)
+    '''Type: datetime.timedelta
+
+    Property in seconds
+    '''
+    read_write_int64 = attributes.AttributeViInt64(1000006, cacheable=False)
+    '''Type: int
+
+    An property of type 64-bit integer with read/write access.
+    '''
+    read_write_integer = attributes.AttributeViInt32(1000004)
+    '''Type: int
+
+    An property of type integer with read/write access.
+    '''
+    read_write_integer_with_converter = attributes.AttributeViInt32TimeDeltaMilliseconds(1000008)
+    '''Type: datetime.timedelta
+
+    Property in milliseconds
+    '''
+    read_write_string = attributes.AttributeViString(1000002)
+    '''Type: str
+
+    An property of type string with read/write access.
+    '''
+
+    def __init__(self, repeated_capability, vi, library, encoding, attribute_cache, error_descriptions, warning_filter, pending_descriptions, freeze_it=False):
+        self._repeated_capability = repeated_capability
+        self._vi = vi
+        self._library = library
+        self._encoding = encoding
+        self._attribute_cache = attribute_cache
+        self._error_descriptions = error_descriptions
+        self._warning_filter = warning_filter
+        self._pending_descriptions = pending_descriptions
+        # Encoded once and passed to every driver call that takes the repeated capability. The driver does not modify it.
+        self._repeated_capability_ctype = None if encoding is None else ctypes.create_string_buffer(repeated_capability.encode(encoding))
+        # Created on first use, see _get_channel_name_ctypes
+        self._channel_name_ctypes = None
+        # Results of methods that only depend on the repeated capability, see the memoized_method template
+        self._memoized_results = {}
+
+        # Store the parameter list for later printing in __repr__
+        self._param_list = "repeated_capability=" + pp.pformat(repeated_capability)
+
+        self._is_frozen = freeze_it
+
+    def __repr__(self):
+        return '{0}.{1}({2})'.format('nifake', self.__class__.__name__, self._param_list)
+
+    def _with_repeated_capability(self, repeated_capability):
+        '''Returns a _SessionBase for repeated_capability that shares the handle, library and per-session state of this session'''
+        return _SessionBase(vi=self._vi, repeated_capability=repeated_capability, library=self._library, encoding=self._encoding, attribute_cache=self._attribute_cache, error_descriptions=self._error_descriptions, warning_filter=self._warning_filter, pending_descriptions=self._pending_descriptions, freeze_it=True)
+
+    def _session_wide(self):
+        '''Returns a _SessionBase without a repeated capability, for properties and methods that are not channel based'''
+        return self._with_repeated_capability('')
+
+    def __setattr__(self, key, value):
+        if self._is_frozen and key not in self._settable_names and key not in dir(self):
+            raise AttributeError("'{0}' object has no attribute '{1}'".format(type(self).__name__, key))
+        object.__setattr__(self, key, value)
+
+    def _get_error_description(self, error_code):
+        '''_get_error_description
+
+        Returns the error description.
+
+        Descriptions of warnings are kept per session, so a warning returned over and over by the driver
+        (i.e. a coercion warning on every fetch) only costs calls into the driver the first time.
+        '''
+        if errors._is_warning(error_code):
+            return self._error_descriptions.get(error_code, lambda: self._read_error_description(error_code))
+        return self._read_error_description(error_code)
+
+    def _read_error_description(self, error_code):
+        # The description is retrieved after the call that failed, so the last error of the session may
+        # be a different one. Only use it when the codes match.
+        try:
+            last_error_code, error_string = self._get_error()
+            if last_error_code == error_code:
+                return error_string
+        except errors.Error:
+            pass
+
+        try:
+            '''
+            It is expected for _get_error to raise when the session is invalid
+            (IVI spec requires GetError to fail).
+            Use _error_message instead. It doesn't require a session.
+            '''
+            error_string = self._error_message(error_code)
+            return error_string
+        except errors.Error:
+            return "Failed to retrieve error description."
+
+    def _find_attributes(self, names):
+        '''Returns (name, descriptor) pairs for the given property names
+
+        Raises a single AttributeError that lists every name that is not a property.
+        '''
+        found = []
+        unknown = []
+        for name in names:
+            attribute = _SessionBase.__dict__.get(name)
+            if isinstance(attribute, (attributes.Attribute, attributes.AttributeEnum)):
+                found.append((name, attribute))
+            else:
+                unknown.append(name)
+        if unknown:
+            raise AttributeError("'{0}' object has no attribute {1}".format(type(self).__name__, ', '.join(repr(n) for n in unknown)))
+        return found
+
+    def _get_channel_name_ctypes(self):
+        '''Returns (channel name, encoded channel name) pairs for the comma-separated items of the repeated capability'''
+        if self._channel_name_ctypes is None:
+            channel_names = [c.strip() for c in self._repeated_capability.split(',')]
+            self._channel_name_ctypes = [(c, ctypes.create_string_buffer(c.encode(self._encoding))) for c in channel_names]
+        return self._channel_name_ctypes
+
+    def _get_set_attribute_call(self, attribute, value):
+        '''Converts value for attribute and returns the SetAttribute function to call and the value ctype'''
+        value = attribute._to_driver(value)
+        if attribute._vi_type == 'ViString':
+            return self._library.niFake_SetAttributeViString, ctypes.create_string_buffer(value.encode(self._encoding))
+        set_attribute_name, value_type = {
+            'ViBoolean': ('niFake_SetAttributeViBoolean', visatype.ViBoolean),
+            'ViInt32': ('niFake_SetAttributeViInt32', visatype.ViInt32),
+            'ViInt64': ('niFake_SetAttributeViInt64', visatype.ViInt64),
+            'ViReal64': ('niFake_SetAttributeViReal64', visatype.ViReal64),
+        }[attribute._vi_type]
+        return getattr(self._library, set_attribute_name), value_type(value)
+
+    def _get_attribute_getter(self, vi_type, channel_name_ctype):
+        '''Returns getter(attribute_id) that reads an attribute of API type vi_type for channel_name_ctype from the driver'''
+        vi_ctype = visatype.ViSession(self._vi)
+        if vi_type == 'ViString':
+            def getter(attribute_id):
+                attribute_id_ctype = visatype.ViAttr(attribute_id)
+                error_code = self._library.niFake_GetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, visatype.ViInt32(), None)
+                errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=False)
+                buffer_size_ctype = visatype.ViInt32(error_code)
+                attribute_value_ctype = (visatype.ViChar * buffer_size_ctype.value)()
+                error_code = self._library.niFake_GetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, buffer_size_ctype, attribute_value_ctype)
+                errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+                return attribute_value_ctype.value.decode(self._encoding)
+            return getter
+
+        get_attribute_name, value_type, python_type = {
+            'ViBoolean': ('niFake_GetAttributeViBoolean', visatype.ViBoolean, bool),
+            'ViInt32': ('niFake_GetAttributeViInt32', visatype.ViInt32, int),
+            'ViInt64': ('niFake_GetAttributeViInt64', visatype.ViInt64, int),
+            'ViReal64': ('niFake_GetAttributeViReal64', visatype.ViReal64, float),
+        }[vi_type]
+        get_attribute = getattr(self._library, get_attribute_name)
+        # One value buffer for all the calls made with this getter
+        value_ctype = value_type()
+
+        def getter(attribute_id):
+            error_code = get_attribute(vi_ctype, channel_name_ctype, visatype.ViAttr(attribute_id), ctypes.pointer(value_ctype))
+            errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+            return python_type(value_ctype.value)
+        return getter
+
+    def _set_attributes(self, channel_name_ctype, calls):
+        '''Makes the (SetAttribute function, attribute ID, value ctype) calls, stopping at the first error'''
+        vi_ctype = visatype.ViSession(self._vi)
+        try:
+            for set_attribute, attribute_id, value_ctype in calls:
+                error_code = set_attribute(vi_ctype, channel_name_ctype, visatype.ViAttr(attribute_id), value_ctype)
+                errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        finally:
+            self._attribute_cache.clear()
+
+    def configure(self, ordered_properties=(), **properties):
+        '''configure
+
+        Sets several properties with one call, i.e.
+
+            session.configure(read_write_bool=True, read_write_double=1.5)
+
+        Like properties, it can be called on a repeated capability to set the properties for those channels only.
+
+        Every name and value is checked and converted before anything is sent to the driver, so an
+        unknown name or a value of the wrong type leaves the device untouched. The properties are then
+        set without the per-property overhead of setting them one at a time. If the driver returns an
+        error, the properties after the failing one are not set.
+
+        The valid values of some properties depend on others, so the order can matter. Properties in
+        ordered_properties are set in the order given, before the keyword arguments, i.e.
+
+            session.configure([('read_write_bool', True), ('read_write_double', 1.5)])
+
+        The order of keyword arguments is only kept by Python 3.6 and later.
+
+        Args:
+            ordered_properties (list of (str, value) tuples or collections.OrderedDict): Property names and the values to set them to, in the order to set them.
+
+            properties: Property names and the values to set them to.
+        '''
+        if hasattr(ordered_properties, 'items'):
+            ordered_properties = ordered_properties.items()
+        name_values = list(ordered_properties) + list(properties.items())
+        calls = []
+        invalid = []
+        found = self._find_attributes([name for name, _ in name_values])
+        for (name, attribute), (_, value) in zip(found, name_values):
+            try:
+                set_attribute, value_ctype = self._get_set_attribute_call(attribute, value)
+            except (AttributeError, TypeError, ValueError) as e:
+                invalid.append('{0}: {1}'.format(name, e))
+                continue
+            calls.append((set_attribute, attribute._attribute_id, value_ctype))
+        if invalid:
+            raise TypeError('Invalid property values: ' + '; '.join(invalid))
+        self._set_attributes(self._repeated_capability_ctype, calls)
+
+    def read_attributes(self, names):
+        '''read_attributes
+
+        Reads several properties with one call and returns a dict that maps each name to its value, i.e.
+
+            values = session.read_attributes(['read_write_bool', 'read_write_double'])
+
+        Every name is checked before anything is read from the driver. Values are returned from the
+        attribute cache when it is enabled, see attribute_cache_enabled.
+
+        Args:
+            names (list of str): Names of the properties to read.
+
+        Returns:
+            values (dict): Property values, keyed by name, in the order of names.
+        '''
+        values = collections.OrderedDict()
+        for name, attribute in self._find_attributes(names):
+            getter = self._get_attribute_getter(attribute._vi_type, self._repeated_capability_ctype)
+            if attribute._cacheable:
+                value = self._attribute_cache.get(self._repeated_capability, attribute._attribute_id, getter)
+            else:
+                value = getter(attribute._attribute_id)
+            values[name] = attribute._from_driver(value)
+        return values
+
+    def get(self, name):
+        '''get
+
+        Reads a property for each channel of the repeated capability and returns a numpy.ndarray with one value per channel, i.e.
+
+            values = session.channels[0:64].get('read_write_bool')
+
+        The channels are the comma-separated items of the repeated capability, in order. A range such as '0-63'
+        is a single item. Boolean, integer and floating-point properties are returned in an array of the matching
+        dtype, other properties (i.e. enums, strings and timedeltas) in an array of objects.
+
+        Values are returned from the attribute cache when it is enabled, see attribute_cache_enabled.
+
+        Requires numpy.
+
+        Args:
+            name (str): Name of the property to read.
+
+        Returns:
+            values (numpy.ndarray): Property value for each channel.
+        '''
+        import numpy
+        [(_, attribute)] = self._find_attributes([name])
+        channel_name_ctypes = self._get_channel_name_ctypes()
+        values = numpy.empty(len(channel_name_ctypes), dtype=attribute._numpy_type or object)
+        for i, (channel_name, channel_name_ctype) in enumerate(channel_name_ctypes):
+            getter = self._get_attribute_getter(attribute._vi_type, channel_name_ctype)
+            if attribute._cacheable:
+                value = self._attribute_cache.get(channel_name, attribute._attribute_id, getter)
+            else:
+                value = getter(attribute._attribute_id)
+            values[i] = attribute._from_driver(value)
+        return values
+
+    def set(self, name, values):
+        '''set
+
+        Sets a property to a different value for each channel of the repeated capability, i.e.
+
+            session.channels[0:64].set('read_write_bool', values)
+
+        The channels are the comma-separated items of the repeated capability, in order. A range such as '0-63'
+        is a single item. values can be a numpy.ndarray, an array.array or any other sequence with one value per channel.
+
+        Every value is checked and converted before anything is sent to the driver. If the driver returns an
+        error, the channels after the failing one are not set.
+
+        Args:
+            name (str): Name of the property to set.
+
+            values: Property value for each channel.
+        '''
+        [(_, attribute)] = self._find_attributes([name])
+        channel_name_ctypes = self._get_channel_name_ctypes()
+        # numpy.ndarray and array.array convert their items to Python values, which ctypes accepts
+        values = values.tolist() if hasattr(values, 'tolist') else list(values)
+        if len(values) != len(channel_name_ctypes):
+            raise ValueError('{0} values given for {1} channels'.format(len(values), len(channel_name_ctypes)))
+
+        calls = []
+        invalid = []
+        for (channel_name, channel_name_ctype), value in zip(channel_name_ctypes, values):
+            try:
+                calls.append((channel_name_ctype, self._get_set_attribute_call(attribute, value)))
+            except (AttributeError, TypeError, ValueError) as e:
+                invalid.append('{0}: {1}'.format(channel_name, e))
+        if invalid:
+            raise TypeError('Invalid values for {0}: {1}'.format(name, '; '.join(invalid)))
+
+        for channel_name_ctype, (set_attribute, value_ctype) in calls:
+            self._set_attributes(channel_name_ctype, [(set_attribute, attribute._attribute_id, value_ctype)])
+
+    ''' These are code-generated '''
+
+    def _get_attribute_vi_boolean(self, attribute_id):
+        '''_get_attribute_vi_boolean
+
+        Queries the value of a ViBoolean property.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        nifake.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        nifake.Session instance, and calling this method on the result.:
+
+            session.channels['0,1']._get_attribute_vi_boolean(attribute_id)
+
+        Args:
+            attribute_id (int): Pass the ID of an property.
+
+
+        Returns:
+            attribute_value (bool): Returns the value of the property.
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
+        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
+        attribute_value_ctype = visatype.ViBoolean()  # case S200
+        error_code = self._library.niFake_GetAttributeViBoolean(vi_ctype, channel_name_ctype, attribute_id_ctype, None if attribute_value_ctype is None else (ctypes.pointer(attribute_value_ctype)))
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return bool(attribute_value_ctype.value)
+
+    def _get_attribute_vi_int32(self, attribute_id):
+        '''_get_attribute_vi_int32
+
+        Queries the value of a ViInt32 property.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        nifake.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        nifake.Session instance, and calling this method on the result.:
+
+            session.channels['0,1']._get_attribute_vi_int32(attribute_id)
+
+        Args:
+            attribute_id (int): Pass the ID of an property.
+
+
+        Returns:
+            attribute_value (int): Returns the value of the property.
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
+        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
+        attribute_value_ctype = visatype.ViInt32()  # case S200
+        error_code = self._library.niFake_GetAttributeViInt32(vi_ctype, channel_name_ctype, attribute_id_ctype, None if attribute_value_ctype is None else (ctypes.pointer(attribute_value_ctype)))
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return int(attribute_value_ctype.value)
+
+    def _get_attribute_vi_int64(self, attribute_id):
+        '''_get_attribute_vi_int64
+
+        Queries the value of a ViInt64 property.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        nifake.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        nifake.Session instance, and calling this method on the result.:
+
+            session.channels['0,1']._get_attribute_vi_int64(attribute_id)
+
+        Args:
+            attribute_id (int): Pass the ID of an property.
+
+
+        Returns:
+            attribute_value (int): Returns the value of the property.
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
+        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
+        attribute_value_ctype = visatype.ViInt64()  # case S200
+        error_code = self._library.niFake_GetAttributeViInt64(vi_ctype, channel_name_ctype, attribute_id_ctype, None if attribute_value_ctype is None else (ctypes.pointer(attribute_value_ctype)))
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return int(attribute_value_ctype.value)
+
+    def _get_attribute_vi_real64(self, attribute_id):
+        '''_get_attribute_vi_real64
+
+        Queries the value of a ViReal property.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        nifake.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        nifake.Session instance, and calling this method on the result.:
+
+            session.channels['0,1']._get_attribute_vi_real64(attribute_id)
+
+        Args:
+            attribute_id (int): Pass the ID of an property.
+
+
+        Returns:
+            attribute_value (float): Returns the value of the property.
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
+        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
+        attribute_value_ctype = visatype.ViReal64()  # case S200
+        error_code = self._library.niFake_GetAttributeViReal64(vi_ctype, channel_name_ctype, attribute_id_ctype, None if attribute_value_ctype is None else (ctypes.pointer(attribute_value_ctype)))
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return float(attribute_value_ctype.value)
+
+    def _get_attribute_vi_string(self, attribute_id):
+        '''_get_attribute_vi_string
+
+        Queries the value of a ViBoolean property.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        nifake.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        nifake.Session instance, and calling this method on the result.:
+
+            session.channels['0,1']._get_attribute_vi_string(attribute_id)
+
+        Args:
+            attribute_id (int): Pass the ID of an property.
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
+        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
+        buffer_size_ctype = visatype.ViInt32()  # case S170
+        attribute_value_ctype = None  # case C050
+        error_code = self._library.niFake_GetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, buffer_size_ctype, attribute_value_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=False)
+        buffer_size_ctype = visatype.ViInt32(error_code)  # case S180
+        attribute_value_ctype = (visatype.ViChar * buffer_size_ctype.value)()  # case C060
+        error_code = self._library.niFake_GetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, buffer_size_ctype, attribute_value_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return attribute_value_ctype.value.decode(self._encoding)
+
+    def _get_error(self):
+        '''_get_error
+
+        Returns the error information associated with the session.
+
+        Returns:
+            error_code (int): Returns errorCode for the session. If you pass 0 for bufferSize, you can pass VI_NULL for this.
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        error_code_ctype = visatype.ViStatus()  # case S200
+        buffer_size_ctype = visatype.ViInt32()  # case S170
+        description_ctype = None  # case C050
+        error_code = self._library.niFake_GetError(vi_ctype, None if error_code_ctype is None else (ctypes.pointer(error_code_ctype)), buffer_size_ctype, description_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=True)
+        buffer_size_ctype = visatype.ViInt32(error_code)  # case S180
+        description_ctype = (visatype.ViChar * buffer_size_ctype.value)()  # case C060
+        error_code = self._library.niFake_GetError(vi_ctype, None if error_code_ctype is None else (ctypes.pointer(error_code_ctype)), buffer_size_ctype, description_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=True)
+        return int(error_code_ctype.value), description_ctype.value.decode(self._encoding)
+
+    def read_from_channel(self, maximum_time):
+        '''read_from_channel
+
+        Acquires a single measurement and returns the measured value.
+
+        Note:
+        This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        nifake.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        nifake.Session instance, and calling this method on the result.:
+
+            session.channels['0,1'].read_from_channel(maximum_time)
+
+        Args:
+            maximum_time (datetime.timedelta): Specifies the **maximum_time** allowed in microseconds.
+
+
+        Returns:
+            reading (float): The measured value.
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
+        maximum_time_ctype = _converters.convert_timedelta_to_microseconds(maximum_time, visatype.ViInt32)  # case S140
+        reading_ctype = visatype.ViReal64()  # case S200
+        error_code = self._library.niFake_ReadFromChannel(vi_ctype, channel_name_ctype, maximum_time_ctype, None if reading_ctype is None else (ctypes.pointer(reading_ctype)))
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return float(reading_ctype.value)
+
+    def _set_attribute_vi_boolean(self, attribute_id, attribute_value):
+        '''_set_attribute_vi_boolean
+
+        This method sets the value of a ViBoolean property.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        nifake.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        nifake.Session instance, and calling this method on the result.:
+
+            session.channels['0,1']._set_attribute_vi_boolean(attribute_id, attribute_value)
+
+        Args:
+            attribute_id (int): Pass the ID of an property.
+
+            attribute_value (bool): Pass the value that you want to set the property to.
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
+        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
+        attribute_value_ctype = visatype.ViBoolean(attribute_value)  # case S150
+        error_code = self._library.niFake_SetAttributeViBoolean(vi_ctype, channel_name_ctype, attribute_id_ctype, attribute_value_ctype)
+        self._attribute_cache.clear()
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def _set_attribute_vi_int32(self, attribute_id, attribute_value):
+        '''_set_attribute_vi_int32
+
+        This method sets the value of a ViInt32 property.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        nifake.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        nifake.Session instance, and calling this method on the result.:
+
+            session.channels['0,1']._set_attribute_vi_int32(attribute_id, attribute_value)
+
+        Args:
+            attribute_id (int): Pass the ID of an property.
+
+            attribute_value (int): Pass the value that you want to set the property to.
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
+        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
+        attribute_value_ctype = visatype.ViInt32(attribute_value)  # case S150
+        error_code = self._library.niFake_SetAttributeViInt32(vi_ctype, channel_name_ctype, attribute_id_ctype, attribute_value_ctype)
+        self._attribute_cache.clear()
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def _set_attribute_vi_int64(self, attribute_id, attribute_value):
+        '''_set_attribute_vi_int64
+
+        This method sets the value of a ViInt64 property.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        nifake.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        nifake.Session instance, and calling this method on the result.:
+
+            session.channels['0,1']._set_attribute_vi_int64(attribute_id, attribute_value)
+
+        Args:
+            attribute_id (int): Pass the ID of an property.
+
+            attribute_value (int): Pass the value that you want to set the property to.
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
+        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
+        attribute_value_ctype = visatype.ViInt64(attribute_value)  # case S150
+        error_code = self._library.niFake_SetAttributeViInt64(vi_ctype, channel_name_ctype, attribute_id_ctype, attribute_value_ctype)
+        self._attribute_cache.clear()
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def _set_attribute_vi_real64(self, attribute_id, attribute_value):
+        '''_set_attribute_vi_real64
+
+        This method sets the value of a ViReal64 property.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        nifake.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        nifake.Session instance, and calling this method on the result.:
+
+            session.channels['0,1']._set_attribute_vi_real64(attribute_id, attribute_value)
+
+        Args:
+            attribute_id (int): Pass the ID of an property.
+
+            attribute_value (float): Pass the value that you want to set the property to.
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
+        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
+        attribute_value_ctype = visatype.ViReal64(attribute_value)  # case S150
+        error_code = self._library.niFake_SetAttributeViReal64(vi_ctype, channel_name_ctype, attribute_id_ctype, attribute_value_ctype)
+        self._attribute_cache.clear()
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def _set_attribute_vi_string(self, attribute_id, attribute_value):
+        '''_set_attribute_vi_string
+
+        This method sets the value of a ViString property.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        nifake.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        nifake.Session instance, and calling this method on the result.:
+
+            session.channels['0,1']._set_attribute_vi_string(attribute_id, attribute_value)
+
+        Args:
+            attribute_id (int): Pass the ID of an property.
+
+            attribute_value (str): Pass the value that you want to set the property to.
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
+        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
+        attribute_value_ctype = ctypes.create_string_buffer(attribute_value.encode(self._encoding))  # case C020
+        error_code = self._library.niFake_SetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, attribute_value_ctype)
+        self._attribute_cache.clear()
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def _error_message(self, error_code):
+        '''_error_message
+
+        Takes the errorCode returned by a functiona and returns it as a user-readable string.
+
+        Args:
+            error_code (int): The errorCode returned from the instrument.
+
+
+        Returns:
+            error_message (str): The error information formatted into a string.
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        error_code_ctype = visatype.ViStatus(error_code)  # case S150
+        error_message_ctype = (visatype.ViChar * 256)()  # case C070
+        error_code = self._library.niFake_error_message(vi_ctype, error_code_ctype, error_message_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=True)
+        return error_message_ctype.value.decode(self._encoding)
+
+
+class Session(_SessionBase):
+    '''An NI-FAKE session to a fake MI driver whose sole purpose is to test nimi-python code generation
+
+    Thread safety:
+
+    A session can be used from several threads. This applies to every method and property. No Python lock is held while the driver runs, and the driver runs one call on a session at a time. A method called, or a property set or read, while another call on the same session is in progress, directly or through the executor property, waits for that call to complete. Calls on different sessions run in parallel.
+
+    Calls made through the executor property run on the worker thread of the session, one at a time and in the order they were submitted.
+
+    Sequences of calls that depend on each other, such as setting the fetch properties and then fetching, are not atomic. Make them from one thread, or submit them to the executor as one callable. Generators, pipelines and buffer pools returned by the session are used from one thread at a time. Do not call close() while other threads use the session.
+    '''
+
+    _settable_names = _SessionBase._settable_names | frozenset([
+        '_executor',
+        '_executor_lock',
+        'attribute_cache_enabled',
+        'warning_interval',
+        'warning_policy',
+        'channels',
+    ])
+
+    def __init__(self, resource_name, options={}, id_query=False, reset_device=False):
+        '''An NI-FAKE session to a fake MI driver whose sole purpose is to test nimi-python code generation
+
+        Creates a new IVI instrument driver session.
+
+        Args:
+            resource_name (str): Caution: This is just some string.
+
+                Contains the **resource_name** of the device to initialize.
+
+            options (str): Specifies the initial value of certain properties for the session. The
+                syntax for **options** is a dictionary of properties with an assigned
+                value. For example:
+
+                { 'simulate': False }
+
+                You do not have to specify a value for all the properties. If you do not
+                specify a value for an property, the default value is used.
+
+                Advanced Example:
+                { 'simulate': True, 'driver_setup': { 'Model': '<model number>',  'BoardType': '<type>' } }
+
+                +-------------------------+---------+
+                | Property                | Default |
+                +=========================+=========+
+                | range_check             | True    |
+                +-------------------------+---------+
+                | query_instrument_status | False   |
+                +-------------------------+---------+
+                | cache                   | True    |
+                +-------------------------+---------+
+                | simulate                | False   |
+                +-------------------------+---------+
+                | record_value_coersions  | False   |
+                +-------------------------+---------+
+                | driver_setup            | {}      |
+                +-------------------------+---------+
+
+            id_query (bool): NI-FAKE is probably not needed.
+
+                +----------------+---+------------------+
+                | True (default) | 1 | Perform ID Query |
+                +----------------+---+------------------+
+                | False          | 0 | Skip ID Query    |
+                +----------------+---+------------------+
+
+            reset_device (bool): Specifies whether to reset
+
+                +----------------+---+--------------+
+                | True (default) | 1 | Reset Device |
+                +----------------+---+--------------+
+                | False          | 0 | Don't Reset  |
+                +----------------+---+--------------+
+
+
+        Returns:
+            session (nifake.Session): A session object representing the device.
+
+        '''
+        super(Session, self).__init__(repeated_capability='', vi=None, library=None, encoding=None, attribute_cache=attributes.AttributeCache(), error_descriptions=_LruCache(64), warning_filter=errors._WarningFilter(), pending_descriptions=errors._PendingDescriptions(), freeze_it=False)
+        options = _converters.convert_init_with_options_dictionary(options, self._encoding)
+        self._library = library_singleton.get()
+        self._encoding = 'windows-1251'
+        self._repeated_capability_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))
+
+        # The executor is created on first use, see the executor property
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+        # Call specified init function
+        self._vi = 0  # This must be set before calling _init_with_options().
+        self._vi = self._init_with_options(resource_name, options, id_query, reset_device)
+
+        # Instantiate any repeated capability objects
+        self.channels = _RepeatedCapabilities(self, '')
+
+        # Store the parameter list for later printing in __repr__
+        param_list = []
+        param_list.append("resource_name=" + pp.pformat(resource_name))
+        param_list.append("options=" + pp.pformat(options))
+        param_list.append("reset_device=" + pp.pformat(reset_device))
+        self._param_list = ', '.join(param_list)
+
+        self._is_frozen = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def initiate(self):
+        return _Acquisition(self)
+
+    @property
+    def attribute_cache_enabled(self):
+        '''attribute_cache_enabled
+
+        When True, property values are kept in a Python-side cache after they are first read from the
+        driver, so reading them again does not call into the driver. Methods that can change property
+        values, including setting a property, clear the cache. Properties that change on their own,
+        such as status or temperature, are never cached. Defaults to False.
+
+        Do not enable the cache if another session or process changes the configuration of the device.
+        '''
+        return self._attribute_cache.enabled
+
+    @attribute_cache_enabled.setter
+    def attribute_cache_enabled(self, value):
+        self._attribute_cache.clear()
+        self._attribute_cache.enabled = value
+
+    @property
+    def executor(self):
+        '''executor
+
+        Returns the executor.SessionExecutor that runs calls on this session on a
+        dedicated worker thread. The worker thread is started on first use and
+        stopped by close(), after any pending calls have completed.
+        '''
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = executor.SessionExecutor(self)
+            return self._executor
+
+    def close(self):
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+        self.channels._clear_cache()
+        # The driver can't describe errors of the session once it is closed
+        self._pending_descriptions.resolve()
+        try:
+            self._close()
+        except errors.Error as e:
+            self._pending_descriptions.resolve()
+            self._vi = 0
+            raise
+        self._vi = 0
+
+    ''' These are code-generated '''
+
+    def abort(self):
+        '''abort
+
+        Aborts a previously initiated thingie.
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        error_code = self._library.niFake_Abort(vi_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def bool_array_output_function(self, number_of_elements):
+        '''bool_array_output_function
+
+        This method returns an array of booleans.
+
+        Args:
+            number_of_elements (int): Number of elements in the array.
+
+
+        Returns:
+            an_array (list of bool): Contains an array of booleans
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        number_of_elements_ctype = visatype.ViInt32(number_of_elements)  # case S190
+        an_array_size = number_of_elements  # case B600
+        an_array_ctype = get_ctypes_pointer_for_buffer(library_type=visatype.ViBoolean, size=an_array_size)  # case B600
+        error_code = self._library.niFake_BoolArrayOutputFunction(vi_ctype, number_of_elements_ctype, an_array_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return [bool(an_array_ctype[i]) for i in range(number_of_elements_ctype.value)]
+
+    def enum_array_output_function(self, number_of_elements):
+        '''enum_array_output_function
+
+        This method returns an array of enums, stored as 16 bit integers under the hood.
+
+        Args:
+            number_of_elements (int): Number of elements in the array.
+
+
+        Returns:
+            an_array (list of enums.Turtle): Contains an array of enums, stored as 16 bit integers under the hood
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        number_of_elements_ctype = visatype.ViInt32(number_of_elements)  # case S190
+        an_array_size = number_of_elements  # case B600
+        an_array_ctype = get_ctypes_pointer_for_buffer(library_type=visatype.ViInt16, size=an_array_size)  # case B600
+        error_code = self._library.niFake_EnumArrayOutputFunction(vi_ctype, number_of_elements_ctype, an_array_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return [enums.Turtle(an_array_ctype[i]) for i in range(number_of_elements_ctype.value)]
+
+    def enum_input_function_with_defaults(self, a_turtle=enums.Turtle.LEONARDO):
+        '''enum_input_function_with_defaults
+
+        This method takes one parameter other than the session, which happens to be an enum and has a default value defined in functions_addon.
+
+        Args:
+            a_turtle (enums.Turtle): Indicates a ninja turtle
+
+                +---+---------------+
+                | 0 | Leonardo      |
+                +---+---------------+
+                | 1 | Donatello     |
+                +---+---------------+
+                | 2 | Raphael       |
+                +---+---------------+
+                | 3 | Mich elangelo |
+                +---+---------------+
+
+        '''
+        if type(a_turtle) is not enums.Turtle:
+            raise TypeError('Parameter mode must be of type ' + str(enums.Turtle))
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        a_turtle_ctype = visatype.ViInt16(a_turtle.value)  # case S130
+        error_code = self._library.niFake_EnumInputFunctionWithDefaults(vi_ctype, a_turtle_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def fetch_waveform(self, number_of_samples):
+        '''fetch_waveform
+
+        Returns waveform data.
+
+        Note:
+        This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.
+
+        Args:
+            number_of_samples (int): Number of samples to return
+
+
+        Returns:
+            waveform_data (array.array("d")): Samples fetched from the device. Array should be numberOfSamples big.
+
+            actual_number_of_samples (int): Number of samples actually fetched.
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        number_of_samples_ctype = visatype.ViInt32(number_of_samples)  # case S190
+        waveform_data_size = number_of_samples  # case B600
+        waveform_data_array = array.array("d", [0]) * waveform_data_size  # case B600
+        waveform_data_ctype = get_ctypes_pointer_for_buffer(value=waveform_data_array, library_type=visatype.ViReal64)  # case B600
+        actual_number_of_samples_ctype = visatype.ViInt32()  # case S200
+        error_code = self._library.niFake_FetchWaveform(vi_ctype, number_of_samples_ctype, waveform_data_ctype, None if actual_number_of_samples_ctype is None else (ctypes.pointer(actual_number_of_samples_ctype)))
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return waveform_data_array
+
+    def fetch_waveform_into(self, waveform_data):
+        '''fetch_waveform
+
+        Returns waveform data.
+
+        Note:
+        This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.
+
+        Args:
+            waveform_data (numpy.array(dtype=numpy.float64)): Samples fetched from the device. Array should be numberOfSamples big.
+
+
+        Returns:
+            waveform_data (numpy.array(dtype=numpy.float64)): Samples fetched from the device. Array should be numberOfSamples big.
+
+            actual_number_of_samples (int): Number of samples actually fetched.
+
+        '''
+        import numpy
+
+        if type(waveform_data) is not numpy.ndarray:
+            raise TypeError('waveform_data must be {0}, is {1}'.format(numpy.ndarray, type(waveform_data)))
+        if numpy.isfortran(waveform_data) is True:
+            raise TypeError('waveform_data must be in C-order')
+        if waveform_data.dtype is not numpy.dtype('float64'):
+            raise TypeError('waveform_data must be numpy.ndarray of dtype=float64, is ' + str(waveform_data.dtype))
+        number_of_samples = len(waveform_data)
+
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        number_of_samples_ctype = visatype.ViInt32(number_of_samples)  # case S190
+        waveform_data_ctype = get_ctypes_pointer_for_buffer(value=waveform_data)  # case B510
+        actual_number_of_samples_ctype = visatype.ViInt32()  # case S200
+        error_code = self._library.niFake_FetchWaveform(vi_ctype, number_of_samples_ctype, waveform_data_ctype, None if actual_number_of_samples_ctype is None else (ctypes.pointer(actual_number_of_samples_ctype)))
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def get_a_boolean(self):
+        '''get_a_boolean
+
+        Returns a boolean.
+
+        Note: This method rules!
+
+        Returns:
+            a_boolean (bool): Contains a boolean.
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        a_boolean_ctype = visatype.ViBoolean()  # case S200
+        error_code = self._library.niFake_GetABoolean(vi_ctype, None if a_boolean_ctype is None else (ctypes.pointer(a_boolean_ctype)))
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return bool(a_boolean_ctype.value)
+
+    def get_a_number(self):
+        '''get_a_number
+
+        Returns a number.
+
+        Note: This method rules!
+
+        Returns:
+            a_number (int): Contains a number.
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        a_number_ctype = visatype.ViInt16()  # case S200
+        error_code = self._library.niFake_GetANumber(vi_ctype, None if a_number_ctype is None else (ctypes.pointer(a_number_ctype)))
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return int(a_number_ctype.value)
+
+    def get_a_string_of_fixed_maximum_size(self):
+        '''get_a_string_of_fixed_maximum_size
+
+        Illustrates resturning a string of fixed size.
+
+        Returns:
+            a_string (str): String comes back here. Buffer must be 256 big.
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        a_string_ctype = (visatype.ViChar * 256)()  # case C070
+        error_code = self._library.niFake_GetAStringOfFixedMaximumSize(vi_ctype, a_string_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return a_string_ctype.value.decode(self._encoding)
+
+    def get_an_ivi_dance_string(self):
+        '''get_an_ivi_dance_string
+
+        Returns a string using the IVI dance.
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        buffer_size_ctype = visatype.ViInt32()  # case S170
+        a_string_ctype = None  # case C050
+        error_code = self._library.niFake_GetAnIviDanceString(vi_ctype, buffer_size_ctype, a_string_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=False)
+        buffer_size_ctype = visatype.ViInt32(error_code)  # case S180
+        a_string_ctype = (visatype.ViChar * buffer_size_ctype.value)()  # case C060
+        error_code = self._library.niFake_GetAnIviDanceString(vi_ctype, buffer_size_ctype, a_string_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return a_string_ctype.value.decode(self._encoding)
+
+    def get_array_for_python_code_custom_type(self):
+        '''get_array_for_python_code_custom_type
+
+        This method returns an array for use in python-code size mechanism.
+
+        Returns:
+            array_out (list of CustomStruct): Array of custom type using puthon-code size mechanism
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        number_of_elements_ctype = visatype.ViInt32(self.get_array_size_for_python_code())  # case S120
+        array_out_size = self.get_array_size_for_python_code()  # case B560
+        array_out_ctype = get_ctypes_pointer_for_buffer(library_type=custom_struct.custom_struct, size=array_out_size)  # case B560
+        error_code = self._library.niFake_GetArrayForPythonCodeCustomType(vi_ctype, number_of_elements_ctype, array_out_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return [custom_struct.CustomStruct(array_out_ctype[i]) for i in range(array_out_size)]
+
+    def get_array_for_python_code_double(self):
+        '''get_array_for_python_code_double
+
+        This method returns an array for use in python-code size mechanism.
+
+        Returns:
+            array_out (list of float): Array of double using puthon-code size mechanism
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        number_of_elements_ctype = visatype.ViInt32(self.get_array_size_for_python_code())  # case S120
+        array_out_size = self.get_array_size_for_python_code()  # case B560
+        array_out_ctype = get_ctypes_pointer_for_buffer(library_type=visatype.ViReal64, size=array_out_size)  # case B560
+        error_code = self._library.niFake_GetArrayForPythonCodeDouble(vi_ctype, number_of_elements_ctype, array_out_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return [float(array_out_ctype[i]) for i in range(array_out_size)]
+
+    def get_array_size_for_python_code(self):
+        '''get_array_size_for_python_code
+
+        This method returns the size of the array for use in python-code size mechanism.
+
+        Returns:
+            size_out (int): Size of array
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        size_out_ctype = visatype.ViInt32()  # case S200
+        error_code = self._library.niFake_GetArraySizeForPythonCode(vi_ctype, None if size_out_ctype is None else (ctypes.pointer(size_out_ctype)))
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return int(size_out_ctype.value)
+
+    def get_array_using_ivi_dance(self):
+        '''get_array_using_ivi_dance
+
+        This method returns an array of float whose size is determined with the IVI dance.
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        array_size_ctype = visatype.ViInt32()  # case S170
+        array_out_ctype = None  # case B580
+        error_code = self._library.niFake_GetArrayUsingIVIDance(vi_ctype, array_size_ctype, array_out_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=False)
+        array_size_ctype = visatype.ViInt32(error_code)  # case S180
+        array_out_size = array_size_ctype.value  # case B590
+        array_out_ctype = get_ctypes_pointer_for_buffer(library_type=visatype.ViReal64, size=array_out_size)  # case B590
+        error_code = self._library.niFake_GetArrayUsingIVIDance(vi_ctype, array_size_ctype, array_out_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return [float(array_out_ctype[i]) for i in range(array_size_ctype.value)]
+
+    def _get_cal_date_and_time(self, cal_type):
+        '''_get_cal_date_and_time
+
+        Returns the date and time of the last calibration performed.
+
+        Args:
+            cal_type (int): Specifies the type of calibration performed (external or self-calibration).
+
+
+        Returns:
+            month (int): Indicates the **month** of the last calibration.
+
+            day (int): Indicates the **day** of the last calibration.
+
+            year (int): Indicates the **year** of the last calibration.
+
+            hour (int): Indicates the **hour** of the last calibration.
+
+            minute (int): Indicates the **minute** of the last calibration.
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        cal_type_ctype = visatype.ViInt32(cal_type)  # case S150
+        month_ctype = visatype.ViInt32()  # case S200
+        day_ctype = visatype.ViInt32()  # case S200
+        year_ctype = visatype.ViInt32()  # case S200
+        hour_ctype = visatype.ViInt32()  # case S200
+        minute_ctype = visatype.ViInt32()  # case S200
+        error_code = self._library.niFake_GetCalDateAndTime(vi_ctype, cal_type_ctype, None if month_ctype is None else (ctypes.pointer(month_ctype)), None if day_ctype is None else (ctypes.pointer(day_ctype)), None if year_ctype is None else (ctypes.pointer(year_ctype)), None if hour_ctype is None else (ctypes.pointer(hour_ctype)), None if minute_ctype is None else (ctypes.pointer(minute_ctype)))
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return int(month_ctype.value), int(day_ctype.value), int(year_ctype.value), int(hour_ctype.value), int(minute_ctype.value)
+
+    def get_custom_type(self):
+        '''get_custom_type
+
+        This method returns a custom type.
+
+        Returns:
+            cs (CustomStruct): Set using custom type
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        cs_ctype = custom_struct.custom_struct()  # case S200
+        error_code = self._library.niFake_GetCustomType(vi_ctype, None if cs_ctype is None else (ctypes.pointer(cs_ctype)))
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return custom_struct.CustomStruct(cs_ctype)
+
+    def get_custom_type_array(self, number_of_elements):
+        '''get_custom_type_array
+
+        This method returns a custom type.
+
+        Args:
+            number_of_elements (int): Number of elements in the array.
+
+
+        Returns:
+            cs (list of CustomStruct): Get using custom type
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        number_of_elements_ctype = visatype.ViInt32(number_of_elements)  # case S190
+        cs_size = number_of_elements  # case B600
+        cs_ctype = get_ctypes_pointer_for_buffer(library_type=custom_struct.custom_struct, size=cs_size)  # case B600
+        error_code = self._library.niFake_GetCustomTypeArray(vi_ctype, number_of_elements_ctype, cs_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return [custom_struct.CustomStruct(cs_ctype[i]) for i in range(number_of_elements_ctype.value)]
+
+    def get_enum_value(self):
+        '''get_enum_value
+
+        Returns an enum value
+
+        Note: Splinter is not supported.
+
+        Returns:
+            a_quantity (int): This is an amount.
+
+                Note: The amount will be between -2^31 and (2^31-1)
+
+            a_turtle (enums.Turtle): Indicates a ninja turtle
+
+                +---+---------------+
+                | 0 | Leonardo      |
+                +---+---------------+
+                | 1 | Donatello     |
+                +---+---------------+
+                | 2 | Raphael       |
+                +---+---------------+
+                | 3 | Mich elangelo |
+                +---+---------------+
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        a_quantity_ctype = visatype.ViInt32()  # case S200
+        a_turtle_ctype = visatype.ViInt16()  # case S200
+        error_code = self._library.niFake_GetEnumValue(vi_ctype, None if a_quantity_ctype is None else (ctypes.pointer(a_quantity_ctype)), None if a_turtle_ctype is None else (ctypes.pointer(a_turtle_ctype)))
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return int(a_quantity_ctype.value), enums.Turtle(a_turtle_ctype.value)
+
+    def get_cal_date_and_time(self, cal_type):
+        '''get_cal_date_and_time
+
+        Returns the date and time of the last calibration performed.
+
+        Args:
+            cal_type (int): Specifies the type of calibration performed (external or self-calibration).
+
+
+        Returns:
+            month (datetime.datetime): Indicates date and time of the last calibration.
+
+        '''
+        month, day, year, hour, minute = self._get_cal_date_and_time(cal_type)
+        return datetime.datetime(year, month, day, hour, minute)
+
+    def _init_with_options(self, resource_name, option_string, id_query=False, reset_device=False):
+        '''_init_with_options
+
+        Creates a new IVI instrument driver session.
+
+        Args:
+            resource_name (str): Caution: This is just some string.
+
+                Contains the **resource_name** of the device to initialize.
+
+            option_string (str): Some options
+
+            id_query (bool): NI-FAKE is probably not needed.
+
+                +----------------+---+------------------+
+                | True (default) | 1 | Perform ID Query |
+                +----------------+---+------------------+
+                | False          | 0 | Skip ID Query    |
+                +----------------+---+------------------+
+
+            reset_device (bool): Specifies whether to reset
+
+                +----------------+---+--------------+
+                | True (default) | 1 | Reset Device |
+                +----------------+---+--------------+
+                | False          | 0 | Don't Reset  |
+                +----------------+---+--------------+
+
+
+        Returns:
+            vi (int): Returns a ViSession handle that you use.
+
+        '''
+        resource_name_ctype = ctypes.create_string_buffer(resource_name.encode(self._encoding))  # case C020
+        id_query_ctype = visatype.ViBoolean(id_query)  # case S150
+        reset_device_ctype = visatype.ViBoolean(reset_device)  # case S150
+        option_string_ctype = ctypes.create_string_buffer(option_string.encode(self._encoding))  # case C020
+        vi_ctype = visatype.ViSession()  # case S200
+        error_code = self._library.niFake_InitWithOptions(resource_name_ctype, id_query_ctype, reset_device_ctype, option_string_ctype, None if vi_ctype is None else (ctypes.pointer(vi_ctype)))
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return int(vi_ctype.value)
+
+    def _initiate(self):
+        '''_initiate
+
+        Initiates a thingie.
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        error_code = self._library.niFake_Initiate(vi_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def multiple_array_types(self, output_array_size, input_array_of_floats, input_array_of_integers=None):
+        '''multiple_array_types
+
+        Receives and returns multiple types of arrays.
+
+        Args:
+            output_array_size (int): Size of the array that will be returned.
+
+            input_array_of_floats (list of float): Array of floats
+
+            input_array_of_integers (list of int): Array of integers. Optional. If passed in then size must match that of inputArrayOfFloats.
+
+
+        Returns:
+            output_array (list of float): Array that will be returned.
+
+                Note: The size must be at least outputArraySize.
+
+            output_array_of_fixed_length (list of float): An array of doubles with fixed size.
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        output_array_size_ctype = visatype.ViInt32(output_array_size)  # case S190
+        output_array_size = output_array_size  # case B600
+        output_array_ctype = get_ctypes_pointer_for_buffer(library_type=visatype.ViReal64, size=output_array_size)  # case B600
+        output_array_of_fixed_length_size = 3  # case B570
+        output_array_of_fixed_length_ctype = get_ctypes_pointer_for_buffer(library_type=visatype.ViReal64, size=output_array_of_fixed_length_size)  # case B570
+        input_array_sizes_ctype = visatype.ViInt32(0 if input_array_of_floats is None else len(input_array_of_floats))  # case S160
+        input_array_of_floats_ctype = get_ctypes_pointer_for_buffer(value=input_array_of_floats, library_type=visatype.ViReal64)  # case B550
+        input_array_of_integers_ctype = get_ctypes_pointer_for_buffer(value=input_array_of_integers, library_type=visatype.ViInt16)  # case B550
+        error_code = self._library.niFake_MultipleArrayTypes(vi_ctype, output_array_size_ctype, output_array_ctype, output_array_of_fixed_length_ctype, input_array_sizes_ctype, input_array_of_floats_ctype, input_array_of_integers_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return [float(output_array_ctype[i]) for i in range(output_array_size_ctype.value)], [float(output_array_of_fixed_length_ctype[i]) for i in range(3)]
+
+    def one_input_function(self, a_number):
+        '''one_input_function
+
+        This method takes one parameter other than the session.
+
+        Args:
+            a_number (int): Contains a number
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        a_number_ctype = visatype.ViInt32(a_number)  # case S150
+        error_code = self._library.niFake_OneInputFunction(vi_ctype, a_number_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def parameters_are_multiple_types(self, a_boolean, an_int32, an_int64, an_int_enum, a_float, a_float_enum, a_string):
+        '''parameters_are_multiple_types
+
+        Has parameters of multiple types.
+
+        Args:
+            a_boolean (bool): Contains a boolean.
+
+            an_int32 (int): Contains a 32-bit integer.
+
+            an_int64 (int): Contains a 64-bit integer.
+
+            an_int_enum (enums.Turtle): Indicates a ninja turtle
+
+                +---+---------------+
+                | 0 | Leonardo      |
+                +---+---------------+
+                | 1 | Donatello     |
+                +---+---------------+
+                | 2 | Raphael       |
+                +---+---------------+
+                | 3 | Mich elangelo |
+                +---+---------------+
+
+            a_float (float): The measured value.
+
+            a_float_enum (enums.FloatEnum): A float enum.
+
+            a_string (str): An IVI dance string.
+
+        '''
+        if type(an_int_enum) is not enums.Turtle:
+            raise TypeError('Parameter mode must be of type ' + str(enums.Turtle))
+        if type(a_float_enum) is not enums.FloatEnum:
+            raise TypeError('Parameter mode must be of type ' + str(enums.FloatEnum))
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        a_boolean_ctype = visatype.ViBoolean(a_boolean)  # case S150
+        an_int32_ctype = visatype.ViInt32(an_int32)  # case S150
+        an_int64_ctype = visatype.ViInt64(an_int64)  # case S150
+        an_int_enum_ctype = visatype.ViInt16(an_int_enum.value)  # case S130
+        a_float_ctype = visatype.ViReal64(a_float)  # case S150
+        a_float_enum_ctype = visatype.ViReal64(a_float_enum.value)  # case S130
+        string_size_ctype = visatype.ViInt32(0 if a_string is None else len(a_string))  # case S160
+        a_string_ctype = ctypes.create_string_buffer(a_string.encode(self._encoding))  # case C020
+        error_code = self._library.niFake_ParametersAreMultipleTypes(vi_ctype, a_boolean_ctype, an_int32_ctype, an_int64_ctype, an_int_enum_ctype, a_float_ctype, a_float_enum_ctype, string_size_ctype, a_string_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def simple_function(self):
+        '''simple_function
+
+        This method takes no parameters other than the session.
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        error_code = self._library.niFake_PoorlyNamedSimpleFunction(vi_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def read(self, maximum_time):
+        '''read
+
+        Acquires a single measurement and returns the measured value.
+
+        Note:
+        This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.
+
+        Args:
+            maximum_time (datetime.timedelta): Specifies the **maximum_time** allowed in seconds.
+
+
+        Returns:
+            reading (float): The measured value.
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        maximum_time_ctype = _converters.convert_timedelta_to_seconds(maximum_time, visatype.ViReal64)  # case S140
+        reading_ctype = visatype.ViReal64()  # case S200
+        error_code = self._library.niFake_Read(vi_ctype, maximum_time_ctype, None if reading_ctype is None else (ctypes.pointer(reading_ctype)))
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return float(reading_ctype.value)
+
+    def return_a_number_and_a_string(self):
+        '''return_a_number_and_a_string
+
+        Returns a number and a string.
+
+        Note: This method rules!
+
+        Returns:
+            a_number (int): Contains a number.
+
+            a_string (str): Contains a string. Buffer must be 256 bytes or larger.
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        a_number_ctype = visatype.ViInt16()  # case S200
+        a_string_ctype = (visatype.ViChar * 256)()  # case C070
+        error_code = self._library.niFake_ReturnANumberAndAString(vi_ctype, None if a_number_ctype is None else (ctypes.pointer(a_number_ctype)), a_string_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return int(a_number_ctype.value), a_string_ctype.value.decode(self._encoding)
+
+    def return_multiple_types(self, array_size):
+        '''return_multiple_types
+
+        Returns multiple types.
+
+        Args:
+            array_size (int): Number of measurements to acquire.
+
+
+        Returns:
+            a_boolean (bool): Contains a boolean.
+
+            an_int32 (int): Contains a 32-bit integer.
+
+            an_int64 (int): Contains a 64-bit integer.
+
+            an_int_enum (enums.Turtle): Indicates a ninja turtle
+
+                +---+---------------+
+                | 0 | Leonardo      |
+                +---+---------------+
+                | 1 | Donatello     |
+                +---+---------------+
+                | 2 | Raphael       |
+                +---+---------------+
+                | 3 | Mich elangelo |
+                +---+---------------+
+
+            a_float (float): The measured value.
+
+            a_float_enum (enums.FloatEnum): A float enum.
+
+            an_array (list of float): An array of measurement values.
+
+                Note: The size must be at least arraySize.
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        a_boolean_ctype = visatype.ViBoolean()  # case S200
+        an_int32_ctype = visatype.ViInt32()  # case S200
+        an_int64_ctype = visatype.ViInt64()  # case S200
+        an_int_enum_ctype = visatype.ViInt16()  # case S200
+        a_float_ctype = visatype.ViReal64()  # case S200
+        a_float_enum_ctype = visatype.ViReal64()  # case S200
+        array_size_ctype = visatype.ViInt32(array_size)  # case S190
+        an_array_size = array_size  # case B600
+        an_array_ctype = get_ctypes_pointer_for_buffer(library_type=visatype.ViReal64, size=an_array_size)  # case B600
+        string_size_ctype = visatype.ViInt32()  # case S170
+        a_string_ctype = None  # case C050
+        error_code = self._library.niFake_ReturnMultipleTypes(vi_ctype, None if a_boolean_ctype is None else (ctypes.pointer(a_boolean_ctype)), None if an_int32_ctype is None else (ctypes.pointer(an_int32_ctype)), None if an_int64_ctype is None else (ctypes.pointer(an_int64_ctype)), None if an_int_enum_ctype is None else (ctypes.pointer(an_int_enum_ctype)), None if a_float_ctype is None else (ctypes.pointer(a_float_ctype)), None if a_float_enum_ctype is None else (ctypes.pointer(a_float_enum_ctype)), array_size_ctype, an_array_ctype, string_size_ctype, a_string_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=False)
+        string_size_ctype = visatype.ViInt32(error_code)  # case S180
+        a_string_ctype = (visatype.ViChar * string_size_ctype.value)()  # case C060
+        error_code = self._library.niFake_ReturnMultipleTypes(vi_ctype, None if a_boolean_ctype is None else (ctypes.pointer(a_boolean_ctype)), None if an_int32_ctype is None else (ctypes.pointer(an_int32_ctype)), None if an_int64_ctype is None else (ctypes.pointer(an_int64_ctype)), None if an_int_enum_ctype is None else (ctypes.pointer(an_int_enum_ctype)), None if a_float_ctype is None else (ctypes.pointer(a_float_ctype)), None if a_float_enum_ctype is None else (ctypes.pointer(a_float_enum_ctype)), array_size_ctype, an_array_ctype, string_size_ctype, a_string_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return bool(a_boolean_ctype.value), int(an_int32_ctype.value), int(an_int64_ctype.value), enums.Turtle(an_int_enum_ctype.value), float(a_float_ctype.value), enums.FloatEnum(a_float_enum_ctype.value), [float(an_array_ctype[i]) for i in range(array_size_ctype.value)], a_string_ctype.value.decode(self._encoding)
+
+    def set_custom_type(self, cs):
+        '''set_custom_type
+
+        This method takes a custom type.
+
+        Args:
+            cs (CustomStruct): Set using custom type
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        cs_ctype = custom_struct.custom_struct(cs)  # case S150
+        error_code = self._library.niFake_SetCustomType(vi_ctype, cs_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def set_custom_type_array(self, cs):
+        '''set_custom_type_array
+
+        This method takes an array of custom types.
+
+        Args:
+            cs (list of CustomStruct): Set using custom type
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        number_of_elements_ctype = visatype.ViInt32(0 if cs is None else len(cs))  # case S160
+        cs_ctype = get_ctypes_pointer_for_buffer([custom_struct.custom_struct(c) for c in cs], library_type=custom_struct.custom_struct)  # case B540
+        error_code = self._library.niFake_SetCustomTypeArray(vi_ctype, number_of_elements_ctype, cs_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def two_input_function(self, a_number, a_string):
+        '''two_input_function
+
+        This method takes two parameters other than the session.
+
+        Args:
+            a_number (float): Contains a number
+
+            a_string (str): Contains a string
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        a_number_ctype = visatype.ViReal64(a_number)  # case S150
+        a_string_ctype = ctypes.create_string_buffer(a_string.encode(self._encoding))  # case C020
+        error_code = self._library.niFake_TwoInputFunction(vi_ctype, a_number_ctype, a_string_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def use64_bit_number(self, input):
+        '''use64_bit_number
+
+        Returns a number and a string.
+
+        Note: This method rules!
+
+        Args:
+            input (int): A big number on its way in.
+
+
+        Returns:
+            output (int): A big number on its way out.
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        input_ctype = visatype.ViInt64(input)  # case S150
+        output_ctype = visatype.ViInt64()  # case S200
+        error_code = self._library.niFake_Use64BitNumber(vi_ctype, input_ctype, None if output_ctype is None else (ctypes.pointer(output_ctype)))
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return int(output_ctype.value)
+
+    def write_waveform(self, waveform):
+        '''write_waveform
+
+        Writes waveform to the driver
+
+        Args:
+            waveform (array.array("d")): Waveform data.
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        number_of_samples_ctype = visatype.ViInt32(0 if waveform is None else len(waveform))  # case S160
+        waveform_array = get_ctypes_and_array(value=waveform, array_type="d")  # case B550
+        waveform_ctype = get_ctypes_pointer_for_buffer(value=waveform_array, library_type=visatype.ViReal64)  # case B550
+        error_code = self._library.niFake_WriteWaveform(vi_ctype, number_of_samples_ctype, waveform_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def write_waveform_numpy(self, waveform):
+        '''write_waveform
+
+        Writes waveform to the driver
+
+        Args:
+            waveform (numpy.array(dtype=numpy.float64)): Waveform data.
+
+        '''
+        import numpy
+
+        if type(waveform) is not numpy.ndarray:
+            raise TypeError('waveform must be {0}, is {1}'.format(numpy.ndarray, type(waveform)))
+        if numpy.isfortran(waveform) is True:
+            raise TypeError('waveform must be in C-order')
+        if waveform.dtype is not numpy.dtype('float64'):
+            raise TypeError('waveform must be numpy.ndarray of dtype=float64, is ' + str(waveform.dtype))
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        number_of_samples_ctype = visatype.ViInt32(0 if waveform is None else len(waveform))  # case S160
+        waveform_ctype = get_ctypes_pointer_for_buffer(value=waveform)  # case B510
+        error_code = self._library.niFake_WriteWaveform(vi_ctype, number_of_samples_ctype, waveform_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def _close(self):
+        '''_close
+
+        Closes the specified session and deallocates resources that it reserved.
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        error_code = self._library.niFake_close(vi_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+
+
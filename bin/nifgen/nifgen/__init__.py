@@ -0,0 +1,9 @@
+#!/usr/bin/python
+# This file was generated
+
+from nifgen.enums import *          # noqa: F403,F401,H303
+from nifgen.errors import Error     # noqa: F401
+from nifgen.errors import NifgenWarning   # noqa: F401
+from nifgen.errors import WarningPolicy   # noqa: F401
+from nifgen.session import Session  # noqa: F401
+
@@ -0,0 +1,601 @@
+# This file was generated
+
+import ctypes
+import threading
+
+from nifgen.visatype import *  # noqa: F403,H303
+
+
+class Library(object):
+    '''Library
+
+    Wrapper around driver library.
+    Class will setup the correct ctypes information for every function on first call.
+
+    Binding uses double-checked locking: _func_lock is only taken the first time a function
+    is called. Call bind_all_functions() to bind every function up front, after which no
+    call into the driver takes a Python-side lock.
+    '''
+
+    # ctypes prototype (argtypes, restype) of every function in the driver library
+    _prototypes = {
+        'niFgen_AbortGeneration': ([ViSession], ViStatus),  # noqa: F405
+        'niFgen_AllocateNamedWaveform': ([ViSession, ctypes.POINTER(ViChar), ctypes.POINTER(ViChar), ViInt32], ViStatus),  # noqa: F405
+        'niFgen_AllocateWaveform': ([ViSession, ctypes.POINTER(ViChar), ViInt32, ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niFgen_ClearArbMemory': ([ViSession], ViStatus),  # noqa: F405
+        'niFgen_ClearArbSequence': ([ViSession, ViInt32], ViStatus),  # noqa: F405
+        'niFgen_ClearArbWaveform': ([ViSession, ViInt32], ViStatus),  # noqa: F405
+        'niFgen_ClearFreqList': ([ViSession, ViInt32], ViStatus),  # noqa: F405
+        'niFgen_ClearUserStandardWaveform': ([ViSession, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niFgen_Commit': ([ViSession], ViStatus),  # noqa: F405
+        'niFgen_ConfigureArbSequence': ([ViSession, ctypes.POINTER(ViChar), ViInt32, ViReal64, ViReal64], ViStatus),  # noqa: F405
+        'niFgen_ConfigureArbWaveform': ([ViSession, ctypes.POINTER(ViChar), ViInt32, ViReal64, ViReal64], ViStatus),  # noqa: F405
+        'niFgen_ConfigureCustomFIRFilterCoefficients': ([ViSession, ctypes.POINTER(ViChar), ViInt32, ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niFgen_ConfigureDigitalEdgeScriptTrigger': ([ViSession, ctypes.POINTER(ViChar), ctypes.POINTER(ViChar), ViInt32], ViStatus),  # noqa: F405
+        'niFgen_ConfigureDigitalEdgeStartTrigger': ([ViSession, ctypes.POINTER(ViChar), ViInt32], ViStatus),  # noqa: F405
+        'niFgen_ConfigureDigitalLevelScriptTrigger': ([ViSession, ctypes.POINTER(ViChar), ctypes.POINTER(ViChar), ViInt32], ViStatus),  # noqa: F405
+        'niFgen_ConfigureFreqList': ([ViSession, ctypes.POINTER(ViChar), ViInt32, ViReal64, ViReal64, ViReal64], ViStatus),  # noqa: F405
+        'niFgen_ConfigureStandardWaveform': ([ViSession, ctypes.POINTER(ViChar), ViInt32, ViReal64, ViReal64, ViReal64, ViReal64], ViStatus),  # noqa: F405
+        'niFgen_CreateAdvancedArbSequence': ([ViSession, ViInt32, ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niFgen_CreateArbSequence': ([ViSession, ViInt32, ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niFgen_CreateFreqList': ([ViSession, ViInt32, ViInt32, ctypes.POINTER(ViReal64), ctypes.POINTER(ViReal64), ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niFgen_CreateWaveformF64': ([ViSession, ctypes.POINTER(ViChar), ViInt32, ctypes.POINTER(ViReal64), ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niFgen_CreateWaveformFromFileF64': ([ViSession, ctypes.POINTER(ViChar), ctypes.POINTER(ViChar), ViInt32, ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niFgen_CreateWaveformFromFileI16': ([ViSession, ctypes.POINTER(ViChar), ctypes.POINTER(ViChar), ViInt32, ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niFgen_CreateWaveformI16': ([ViSession, ctypes.POINTER(ViChar), ViInt32, ctypes.POINTER(ViInt16), ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niFgen_DefineUserStandardWaveform': ([ViSession, ctypes.POINTER(ViChar), ViInt32, ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niFgen_DeleteNamedWaveform': ([ViSession, ctypes.POINTER(ViChar), ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niFgen_DeleteScript': ([ViSession, ctypes.POINTER(ViChar), ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niFgen_Disable': ([ViSession], ViStatus),  # noqa: F405
+        'niFgen_ExportSignal': ([ViSession, ViInt32, ctypes.POINTER(ViChar), ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niFgen_GetAttributeViBoolean': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViBoolean)], ViStatus),  # noqa: F405
+        'niFgen_GetAttributeViInt32': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niFgen_GetAttributeViReal64': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niFgen_GetAttributeViString': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ViInt32, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niFgen_GetError': ([ViSession, ctypes.POINTER(ViStatus), ViInt32, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niFgen_GetExtCalLastDateAndTime': ([ViSession, ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niFgen_GetExtCalLastTemp': ([ViSession, ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niFgen_GetExtCalRecommendedInterval': ([ViSession, ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niFgen_GetFIRFilterCoefficients': ([ViSession, ctypes.POINTER(ViChar), ViInt32, ctypes.POINTER(ViReal64), ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niFgen_GetHardwareState': ([ViSession, ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niFgen_GetSelfCalLastDateAndTime': ([ViSession, ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niFgen_GetSelfCalLastTemp': ([ViSession, ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niFgen_GetSelfCalSupported': ([ViSession, ctypes.POINTER(ViBoolean)], ViStatus),  # noqa: F405
+        'niFgen_InitializeWithChannels': ([ctypes.POINTER(ViChar), ctypes.POINTER(ViChar), ViBoolean, ctypes.POINTER(ViChar), ctypes.POINTER(ViSession)], ViStatus),  # noqa: F405
+        'niFgen_InitiateGeneration': ([ViSession], ViStatus),  # noqa: F405
+        'niFgen_IsDone': ([ViSession, ctypes.POINTER(ViBoolean)], ViStatus),  # noqa: F405
+        'niFgen_QueryArbSeqCapabilities': ([ViSession, ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niFgen_QueryArbWfmCapabilities': ([ViSession, ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niFgen_QueryFreqListCapabilities': ([ViSession, ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViReal64), ctypes.POINTER(ViReal64), ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niFgen_ReadCurrentTemperature': ([ViSession, ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niFgen_ResetDevice': ([ViSession], ViStatus),  # noqa: F405
+        'niFgen_ResetWithDefaults': ([ViSession], ViStatus),  # noqa: F405
+        'niFgen_SelfCal': ([ViSession], ViStatus),  # noqa: F405
+        'niFgen_SendSoftwareEdgeTrigger': ([ViSession, ViInt32, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niFgen_SetAttributeViBoolean': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ViBoolean], ViStatus),  # noqa: F405
+        'niFgen_SetAttributeViInt32': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ViInt32], ViStatus),  # noqa: F405
+        'niFgen_SetAttributeViReal64': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ViReal64], ViStatus),  # noqa: F405
+        'niFgen_SetAttributeViString': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niFgen_SetNamedWaveformNextWritePosition': ([ViSession, ctypes.POINTER(ViChar), ctypes.POINTER(ViChar), ViInt32, ViInt32], ViStatus),  # noqa: F405
+        'niFgen_SetWaveformNextWritePosition': ([ViSession, ctypes.POINTER(ViChar), ViInt32, ViInt32, ViInt32], ViStatus),  # noqa: F405
+        'niFgen_WaitUntilDone': ([ViSession, ViInt32], ViStatus),  # noqa: F405
+        'niFgen_WriteBinary16Waveform': ([ViSession, ctypes.POINTER(ViChar), ViInt32, ViInt32, ctypes.POINTER(ViInt16)], ViStatus),  # noqa: F405
+        'niFgen_WriteNamedWaveformF64': ([ViSession, ctypes.POINTER(ViChar), ctypes.POINTER(ViChar), ViInt32, ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niFgen_WriteNamedWaveformI16': ([ViSession, ctypes.POINTER(ViChar), ctypes.POINTER(ViChar), ViInt32, ctypes.POINTER(ViInt16)], ViStatus),  # noqa: F405
+        'niFgen_WriteScript': ([ViSession, ctypes.POINTER(ViChar), ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niFgen_WriteWaveform': ([ViSession, ctypes.POINTER(ViChar), ViInt32, ViInt32, ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niFgen_close': ([ViSession], ViStatus),  # noqa: F405
+        'niFgen_error_message': ([ViSession, ViStatus, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niFgen_reset': ([ViSession], ViStatus),  # noqa: F405
+        'niFgen_self_test': ([ViSession, ctypes.POINTER(ViInt16), ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+    }
+
+    def __init__(self, ctypes_library):
+        self._func_lock = threading.Lock()
+        self._library = ctypes_library
+        # We cache the cfunc object from the ctypes.CDLL object
+        self.niFgen_AbortGeneration_cfunc = None
+        self.niFgen_AllocateNamedWaveform_cfunc = None
+        self.niFgen_AllocateWaveform_cfunc = None
+        self.niFgen_ClearArbMemory_cfunc = None
+        self.niFgen_ClearArbSequence_cfunc = None
+        self.niFgen_ClearArbWaveform_cfunc = None
+        self.niFgen_ClearFreqList_cfunc = None
+        self.niFgen_ClearUserStandardWaveform_cfunc = None
+        self.niFgen_Commit_cfunc = None
+        self.niFgen_ConfigureArbSequence_cfunc = None
+        self.niFgen_ConfigureArbWaveform_cfunc = None
+        self.niFgen_ConfigureCustomFIRFilterCoefficients_cfunc = None
+        self.niFgen_ConfigureDigitalEdgeScriptTrigger_cfunc = None
+        self.niFgen_ConfigureDigitalEdgeStartTrigger_cfunc = None
+        self.niFgen_ConfigureDigitalLevelScriptTrigger_cfunc = None
+        self.niFgen_ConfigureFreqList_cfunc = None
+        self.niFgen_ConfigureStandardWaveform_cfunc = None
+        self.niFgen_CreateAdvancedArbSequence_cfunc = None
+        self.niFgen_CreateArbSequence_cfunc = None
+        self.niFgen_CreateFreqList_cfunc = None
+        self.niFgen_CreateWaveformF64_cfunc = None
+        self.niFgen_CreateWaveformFromFileF64_cfunc = None
+        self.niFgen_CreateWaveformFromFileI16_cfunc = None
+        self.niFgen_CreateWaveformI16_cfunc = None
+        self.niFgen_DefineUserStandardWaveform_cfunc = None
+        self.niFgen_DeleteNamedWaveform_cfunc = None
+        self.niFgen_DeleteScript_cfunc = None
+        self.niFgen_Disable_cfunc = None
+        self.niFgen_ExportSignal_cfunc = None
+        self.niFgen_GetAttributeViBoolean_cfunc = None
+        self.niFgen_GetAttributeViInt32_cfunc = None
+        self.niFgen_GetAttributeViReal64_cfunc = None
+        self.niFgen_GetAttributeViString_cfunc = None
+        self.niFgen_GetError_cfunc = None
+        self.niFgen_GetExtCalLastDateAndTime_cfunc = None
+        self.niFgen_GetExtCalLastTemp_cfunc = None
+        self.niFgen_GetExtCalRecommendedInterval_cfunc = None
+        self.niFgen_GetFIRFilterCoefficients_cfunc = None
+        self.niFgen_GetHardwareState_cfunc = None
+        self.niFgen_GetSelfCalLastDateAndTime_cfunc = None
+        self.niFgen_GetSelfCalLastTemp_cfunc = None
+        self.niFgen_GetSelfCalSupported_cfunc = None
+        self.niFgen_InitializeWithChannels_cfunc = None
+        self.niFgen_InitiateGeneration_cfunc = None
+        self.niFgen_IsDone_cfunc = None
+        self.niFgen_QueryArbSeqCapabilities_cfunc = None
+        self.niFgen_QueryArbWfmCapabilities_cfunc = None
+        self.niFgen_QueryFreqListCapabilities_cfunc = None
+        self.niFgen_ReadCurrentTemperature_cfunc = None
+        self.niFgen_ResetDevice_cfunc = None
+        self.niFgen_ResetWithDefaults_cfunc = None
+        self.niFgen_SelfCal_cfunc = None
+        self.niFgen_SendSoftwareEdgeTrigger_cfunc = None
+        self.niFgen_SetAttributeViBoolean_cfunc = None
+        self.niFgen_SetAttributeViInt32_cfunc = None
+        self.niFgen_SetAttributeViReal64_cfunc = None
+        self.niFgen_SetAttributeViString_cfunc = None
+        self.niFgen_SetNamedWaveformNextWritePosition_cfunc = None
+        self.niFgen_SetWaveformNextWritePosition_cfunc = None
+        self.niFgen_WaitUntilDone_cfunc = None
+        self.niFgen_WriteBinary16Waveform_cfunc = None
+        self.niFgen_WriteNamedWaveformF64_cfunc = None
+        self.niFgen_WriteNamedWaveformI16_cfunc = None
+        self.niFgen_WriteScript_cfunc = None
+        self.niFgen_WriteWaveform_cfunc = None
+        self.niFgen_close_cfunc = None
+        self.niFgen_error_message_cfunc = None
+        self.niFgen_reset_cfunc = None
+        self.niFgen_self_test_cfunc = None
+
+    def _bind_function(self, c_func_name):
+        with self._func_lock:
+            cfunc = getattr(self, c_func_name + '_cfunc')
+            if cfunc is None:
+                cfunc = getattr(self._library, c_func_name)
+                cfunc.argtypes, cfunc.restype = self._prototypes[c_func_name]
+                # Only publish the cfunc once it is fully typed, other threads read it without the lock
+                setattr(self, c_func_name + '_cfunc', cfunc)
+        return cfunc
+
+    def bind_all_functions(self):
+        '''bind_all_functions
+
+        Resolves and sets up the ctypes information for every function in the driver library.
+        Functions not exported by the driver runtime are left unbound and raise on first call.
+        '''
+        for c_func_name in sorted(self._prototypes):
+            try:
+                self._bind_function(c_func_name)
+            except AttributeError:
+                pass
+
+    def niFgen_AbortGeneration(self, vi):  # noqa: N802
+        cfunc = self.niFgen_AbortGeneration_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_AbortGeneration')
+        return cfunc(vi)
+
+    def niFgen_AllocateNamedWaveform(self, vi, channel_name, waveform_name, waveform_size):  # noqa: N802
+        cfunc = self.niFgen_AllocateNamedWaveform_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_AllocateNamedWaveform')
+        return cfunc(vi, channel_name, waveform_name, waveform_size)
+
+    def niFgen_AllocateWaveform(self, vi, channel_name, waveform_size, waveform_handle):  # noqa: N802
+        cfunc = self.niFgen_AllocateWaveform_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_AllocateWaveform')
+        return cfunc(vi, channel_name, waveform_size, waveform_handle)
+
+    def niFgen_ClearArbMemory(self, vi):  # noqa: N802
+        cfunc = self.niFgen_ClearArbMemory_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_ClearArbMemory')
+        return cfunc(vi)
+
+    def niFgen_ClearArbSequence(self, vi, sequence_handle):  # noqa: N802
+        cfunc = self.niFgen_ClearArbSequence_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_ClearArbSequence')
+        return cfunc(vi, sequence_handle)
+
+    def niFgen_ClearArbWaveform(self, vi, waveform_handle):  # noqa: N802
+        cfunc = self.niFgen_ClearArbWaveform_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_ClearArbWaveform')
+        return cfunc(vi, waveform_handle)
+
+    def niFgen_ClearFreqList(self, vi, frequency_list_handle):  # noqa: N802
+        cfunc = self.niFgen_ClearFreqList_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_ClearFreqList')
+        return cfunc(vi, frequency_list_handle)
+
+    def niFgen_ClearUserStandardWaveform(self, vi, channel_name):  # noqa: N802
+        cfunc = self.niFgen_ClearUserStandardWaveform_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_ClearUserStandardWaveform')
+        return cfunc(vi, channel_name)
+
+    def niFgen_Commit(self, vi):  # noqa: N802
+        cfunc = self.niFgen_Commit_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_Commit')
+        return cfunc(vi)
+
+    def niFgen_ConfigureArbSequence(self, vi, channel_name, sequence_handle, gain, offset):  # noqa: N802
+        cfunc = self.niFgen_ConfigureArbSequence_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_ConfigureArbSequence')
+        return cfunc(vi, channel_name, sequence_handle, gain, offset)
+
+    def niFgen_ConfigureArbWaveform(self, vi, channel_name, waveform_handle, gain, offset):  # noqa: N802
+        cfunc = self.niFgen_ConfigureArbWaveform_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_ConfigureArbWaveform')
+        return cfunc(vi, channel_name, waveform_handle, gain, offset)
+
+    def niFgen_ConfigureCustomFIRFilterCoefficients(self, vi, channel_name, number_of_coefficients, coefficients_array):  # noqa: N802
+        cfunc = self.niFgen_ConfigureCustomFIRFilterCoefficients_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_ConfigureCustomFIRFilterCoefficients')
+        return cfunc(vi, channel_name, number_of_coefficients, coefficients_array)
+
+    def niFgen_ConfigureDigitalEdgeScriptTrigger(self, vi, trigger_id, source, edge):  # noqa: N802
+        cfunc = self.niFgen_ConfigureDigitalEdgeScriptTrigger_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_ConfigureDigitalEdgeScriptTrigger')
+        return cfunc(vi, trigger_id, source, edge)
+
+    def niFgen_ConfigureDigitalEdgeStartTrigger(self, vi, source, edge):  # noqa: N802
+        cfunc = self.niFgen_ConfigureDigitalEdgeStartTrigger_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_ConfigureDigitalEdgeStartTrigger')
+        return cfunc(vi, source, edge)
+
+    def niFgen_ConfigureDigitalLevelScriptTrigger(self, vi, trigger_id, source, trigger_when):  # noqa: N802
+        cfunc = self.niFgen_ConfigureDigitalLevelScriptTrigger_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_ConfigureDigitalLevelScriptTrigger')
+        return cfunc(vi, trigger_id, source, trigger_when)
+
+    def niFgen_ConfigureFreqList(self, vi, channel_name, frequency_list_handle, amplitude, dc_offset, start_phase):  # noqa: N802
+        cfunc = self.niFgen_ConfigureFreqList_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_ConfigureFreqList')
+        return cfunc(vi, channel_name, frequency_list_handle, amplitude, dc_offset, start_phase)
+
+    def niFgen_ConfigureStandardWaveform(self, vi, channel_name, waveform, amplitude, dc_offset, frequency, start_phase):  # noqa: N802
+        cfunc = self.niFgen_ConfigureStandardWaveform_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_ConfigureStandardWaveform')
+        return cfunc(vi, channel_name, waveform, amplitude, dc_offset, frequency, start_phase)
+
+    def niFgen_CreateAdvancedArbSequence(self, vi, sequence_length, waveform_handles_array, loop_counts_array, sample_counts_array, marker_location_array, coerced_markers_array, sequence_handle):  # noqa: N802
+        cfunc = self.niFgen_CreateAdvancedArbSequence_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_CreateAdvancedArbSequence')
+        return cfunc(vi, sequence_length, waveform_handles_array, loop_counts_array, sample_counts_array, marker_location_array, coerced_markers_array, sequence_handle)
+
+    def niFgen_CreateArbSequence(self, vi, sequence_length, waveform_handles_array, loop_counts_array, sequence_handle):  # noqa: N802
+        cfunc = self.niFgen_CreateArbSequence_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_CreateArbSequence')
+        return cfunc(vi, sequence_length, waveform_handles_array, loop_counts_array, sequence_handle)
+
+    def niFgen_CreateFreqList(self, vi, waveform, frequency_list_length, frequency_array, duration_array, frequency_list_handle):  # noqa: N802
+        cfunc = self.niFgen_CreateFreqList_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_CreateFreqList')
+        return cfunc(vi, waveform, frequency_list_length, frequency_array, duration_array, frequency_list_handle)
+
+    def niFgen_CreateWaveformF64(self, vi, channel_name, waveform_size, waveform_data_array, waveform_handle):  # noqa: N802
+        cfunc = self.niFgen_CreateWaveformF64_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_CreateWaveformF64')
+        return cfunc(vi, channel_name, waveform_size, waveform_data_array, waveform_handle)
+
+    def niFgen_CreateWaveformFromFileF64(self, vi, channel_name, file_name, byte_order, waveform_handle):  # noqa: N802
+        cfunc = self.niFgen_CreateWaveformFromFileF64_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_CreateWaveformFromFileF64')
+        return cfunc(vi, channel_name, file_name, byte_order, waveform_handle)
+
+    def niFgen_CreateWaveformFromFileI16(self, vi, channel_name, file_name, byte_order, waveform_handle):  # noqa: N802
+        cfunc = self.niFgen_CreateWaveformFromFileI16_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_CreateWaveformFromFileI16')
+        return cfunc(vi, channel_name, file_name, byte_order, waveform_handle)
+
+    def niFgen_CreateWaveformI16(self, vi, channel_name, waveform_size, waveform_data_array, waveform_handle):  # noqa: N802
+        cfunc = self.niFgen_CreateWaveformI16_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_CreateWaveformI16')
+        return cfunc(vi, channel_name, waveform_size, waveform_data_array, waveform_handle)
+
+    def niFgen_DefineUserStandardWaveform(self, vi, channel_name, waveform_size, waveform_data_array):  # noqa: N802
+        cfunc = self.niFgen_DefineUserStandardWaveform_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_DefineUserStandardWaveform')
+        return cfunc(vi, channel_name, waveform_size, waveform_data_array)
+
+    def niFgen_DeleteNamedWaveform(self, vi, channel_name, waveform_name):  # noqa: N802
+        cfunc = self.niFgen_DeleteNamedWaveform_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_DeleteNamedWaveform')
+        return cfunc(vi, channel_name, waveform_name)
+
+    def niFgen_DeleteScript(self, vi, channel_name, script_name):  # noqa: N802
+        cfunc = self.niFgen_DeleteScript_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_DeleteScript')
+        return cfunc(vi, channel_name, script_name)
+
+    def niFgen_Disable(self, vi):  # noqa: N802
+        cfunc = self.niFgen_Disable_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_Disable')
+        return cfunc(vi)
+
+    def niFgen_ExportSignal(self, vi, signal, signal_identifier, output_terminal):  # noqa: N802
+        cfunc = self.niFgen_ExportSignal_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_ExportSignal')
+        return cfunc(vi, signal, signal_identifier, output_terminal)
+
+    def niFgen_GetAttributeViBoolean(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
+        cfunc = self.niFgen_GetAttributeViBoolean_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_GetAttributeViBoolean')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
+
+    def niFgen_GetAttributeViInt32(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
+        cfunc = self.niFgen_GetAttributeViInt32_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_GetAttributeViInt32')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
+
+    def niFgen_GetAttributeViReal64(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
+        cfunc = self.niFgen_GetAttributeViReal64_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_GetAttributeViReal64')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
+
+    def niFgen_GetAttributeViString(self, vi, channel_name, attribute_id, array_size, attribute_value):  # noqa: N802
+        cfunc = self.niFgen_GetAttributeViString_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_GetAttributeViString')
+        return cfunc(vi, channel_name, attribute_id, array_size, attribute_value)
+
+    def niFgen_GetError(self, vi, error_code, error_description_buffer_size, error_description):  # noqa: N802
+        cfunc = self.niFgen_GetError_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_GetError')
+        return cfunc(vi, error_code, error_description_buffer_size, error_description)
+
+    def niFgen_GetExtCalLastDateAndTime(self, vi, year, month, day, hour, minute):  # noqa: N802
+        cfunc = self.niFgen_GetExtCalLastDateAndTime_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_GetExtCalLastDateAndTime')
+        return cfunc(vi, year, month, day, hour, minute)
+
+    def niFgen_GetExtCalLastTemp(self, vi, temperature):  # noqa: N802
+        cfunc = self.niFgen_GetExtCalLastTemp_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_GetExtCalLastTemp')
+        return cfunc(vi, temperature)
+
+    def niFgen_GetExtCalRecommendedInterval(self, vi, months):  # noqa: N802
+        cfunc = self.niFgen_GetExtCalRecommendedInterval_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_GetExtCalRecommendedInterval')
+        return cfunc(vi, months)
+
+    def niFgen_GetFIRFilterCoefficients(self, vi, channel_name, array_size, coefficients_array, number_of_coefficients_read):  # noqa: N802
+        cfunc = self.niFgen_GetFIRFilterCoefficients_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_GetFIRFilterCoefficients')
+        return cfunc(vi, channel_name, array_size, coefficients_array, number_of_coefficients_read)
+
+    def niFgen_GetHardwareState(self, vi, state):  # noqa: N802
+        cfunc = self.niFgen_GetHardwareState_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_GetHardwareState')
+        return cfunc(vi, state)
+
+    def niFgen_GetSelfCalLastDateAndTime(self, vi, year, month, day, hour, minute):  # noqa: N802
+        cfunc = self.niFgen_GetSelfCalLastDateAndTime_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_GetSelfCalLastDateAndTime')
+        return cfunc(vi, year, month, day, hour, minute)
+
+    def niFgen_GetSelfCalLastTemp(self, vi, temperature):  # noqa: N802
+        cfunc = self.niFgen_GetSelfCalLastTemp_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_GetSelfCalLastTemp')
+        return cfunc(vi, temperature)
+
+    def niFgen_GetSelfCalSupported(self, vi, self_cal_supported):  # noqa: N802
+        cfunc = self.niFgen_GetSelfCalSupported_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_GetSelfCalSupported')
+        return cfunc(vi, self_cal_supported)
+
+    def niFgen_InitializeWithChannels(self, resource_name, channel_name, reset_device, option_string, vi):  # noqa: N802
+        cfunc = self.niFgen_InitializeWithChannels_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_InitializeWithChannels')
+        return cfunc(resource_name, channel_name, reset_device, option_string, vi)
+
+    def niFgen_InitiateGeneration(self, vi):  # noqa: N802
+        cfunc = self.niFgen_InitiateGeneration_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_InitiateGeneration')
+        return cfunc(vi)
+
+    def niFgen_IsDone(self, vi, done):  # noqa: N802
+        cfunc = self.niFgen_IsDone_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_IsDone')
+        return cfunc(vi, done)
+
+    def niFgen_QueryArbSeqCapabilities(self, vi, maximum_number_of_sequences, minimum_sequence_length, maximum_sequence_length, maximum_loop_count):  # noqa: N802
+        cfunc = self.niFgen_QueryArbSeqCapabilities_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_QueryArbSeqCapabilities')
+        return cfunc(vi, maximum_number_of_sequences, minimum_sequence_length, maximum_sequence_length, maximum_loop_count)
+
+    def niFgen_QueryArbWfmCapabilities(self, vi, maximum_number_of_waveforms, waveform_quantum, minimum_waveform_size, maximum_waveform_size):  # noqa: N802
+        cfunc = self.niFgen_QueryArbWfmCapabilities_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_QueryArbWfmCapabilities')
+        return cfunc(vi, maximum_number_of_waveforms, waveform_quantum, minimum_waveform_size, maximum_waveform_size)
+
+    def niFgen_QueryFreqListCapabilities(self, vi, maximum_number_of_freq_lists, minimum_frequency_list_length, maximum_frequency_list_length, minimum_frequency_list_duration, maximum_frequency_list_duration, frequency_list_duration_quantum):  # noqa: N802
+        cfunc = self.niFgen_QueryFreqListCapabilities_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_QueryFreqListCapabilities')
+        return cfunc(vi, maximum_number_of_freq_lists, minimum_frequency_list_length, maximum_frequency_list_length, minimum_frequency_list_duration, maximum_frequency_list_duration, frequency_list_duration_quantum)
+
+    def niFgen_ReadCurrentTemperature(self, vi, temperature):  # noqa: N802
+        cfunc = self.niFgen_ReadCurrentTemperature_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_ReadCurrentTemperature')
+        return cfunc(vi, temperature)
+
+    def niFgen_ResetDevice(self, vi):  # noqa: N802
+        cfunc = self.niFgen_ResetDevice_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_ResetDevice')
+        return cfunc(vi)
+
+    def niFgen_ResetWithDefaults(self, vi):  # noqa: N802
+        cfunc = self.niFgen_ResetWithDefaults_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_ResetWithDefaults')
+        return cfunc(vi)
+
+    def niFgen_SelfCal(self, vi):  # noqa: N802
+        cfunc = self.niFgen_SelfCal_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_SelfCal')
+        return cfunc(vi)
+
+    def niFgen_SendSoftwareEdgeTrigger(self, vi, trigger, trigger_id):  # noqa: N802
+        cfunc = self.niFgen_SendSoftwareEdgeTrigger_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_SendSoftwareEdgeTrigger')
+        return cfunc(vi, trigger, trigger_id)
+
+    def niFgen_SetAttributeViBoolean(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
+        cfunc = self.niFgen_SetAttributeViBoolean_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_SetAttributeViBoolean')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
+
+    def niFgen_SetAttributeViInt32(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
+        cfunc = self.niFgen_SetAttributeViInt32_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_SetAttributeViInt32')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
+
+    def niFgen_SetAttributeViReal64(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
+        cfunc = self.niFgen_SetAttributeViReal64_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_SetAttributeViReal64')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
+
+    def niFgen_SetAttributeViString(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
+        cfunc = self.niFgen_SetAttributeViString_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_SetAttributeViString')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
+
+    def niFgen_SetNamedWaveformNextWritePosition(self, vi, channel_name, waveform_name, relative_to, offset):  # noqa: N802
+        cfunc = self.niFgen_SetNamedWaveformNextWritePosition_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_SetNamedWaveformNextWritePosition')
+        return cfunc(vi, channel_name, waveform_name, relative_to, offset)
+
+    def niFgen_SetWaveformNextWritePosition(self, vi, channel_name, waveform_handle, relative_to, offset):  # noqa: N802
+        cfunc = self.niFgen_SetWaveformNextWritePosition_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_SetWaveformNextWritePosition')
+        return cfunc(vi, channel_name, waveform_handle, relative_to, offset)
+
+    def niFgen_WaitUntilDone(self, vi, max_time):  # noqa: N802
+        cfunc = self.niFgen_WaitUntilDone_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_WaitUntilDone')
+        return cfunc(vi, max_time)
+
+    def niFgen_WriteBinary16Waveform(self, vi, channel_name, waveform_handle, size, data):  # noqa: N802
+        cfunc = self.niFgen_WriteBinary16Waveform_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_WriteBinary16Waveform')
+        return cfunc(vi, channel_name, waveform_handle, size, data)
+
+    def niFgen_WriteNamedWaveformF64(self, vi, channel_name, waveform_name, size, data):  # noqa: N802
+        cfunc = self.niFgen_WriteNamedWaveformF64_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_WriteNamedWaveformF64')
+        return cfunc(vi, channel_name, waveform_name, size, data)
+
+    def niFgen_WriteNamedWaveformI16(self, vi, channel_name, waveform_name, size, data):  # noqa: N802
+        cfunc = self.niFgen_WriteNamedWaveformI16_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_WriteNamedWaveformI16')
+        return cfunc(vi, channel_name, waveform_name, size, data)
+
+    def niFgen_WriteScript(self, vi, channel_name, script):  # noqa: N802
+        cfunc = self.niFgen_WriteScript_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_WriteScript')
+        return cfunc(vi, channel_name, script)
+
+    def niFgen_WriteWaveform(self, vi, channel_name, waveform_handle, size, data):  # noqa: N802
+        cfunc = self.niFgen_WriteWaveform_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_WriteWaveform')
+        return cfunc(vi, channel_name, waveform_handle, size, data)
+
+    def niFgen_close(self, vi):  # noqa: N802
+        cfunc = self.niFgen_close_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_close')
+        return cfunc(vi)
+
+    def niFgen_error_message(self, vi, error_code, error_message):  # noqa: N802
+        cfunc = self.niFgen_error_message_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_error_message')
+        return cfunc(vi, error_code, error_message)
+
+    def niFgen_reset(self, vi):  # noqa: N802
+        cfunc = self.niFgen_reset_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_reset')
+        return cfunc(vi)
+
+    def niFgen_self_test(self, vi, self_test_result, self_test_message):  # noqa: N802
+        cfunc = self.niFgen_self_test_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niFgen_self_test')
+        return cfunc(vi, self_test_result, self_test_message)
@@ -0,0 +1,13 @@
+#!/usr/bin/python
+# This file was generated
+
+from niscope.enums import *          # noqa: F403,F401,H303
+from niscope.errors import Error     # noqa: F401
+from niscope.errors import NiscopeWarning   # noqa: F401
+from niscope.errors import WarningPolicy   # noqa: F401
+from niscope.session import Session  # noqa: F401
+
+from niscope.waveform_info import WaveformInfo  # noqa: F401
+
+from niscope.waveform_info import struct_niScope_wfmInfo  # noqa: F401
+
@@ -0,0 +1,176 @@
+'''Producer/consumer pipeline that fetches on a background thread while the caller processes earlier data.
+
+The producer thread fetches into preallocated buffers. A buffer is only fetched into again once
+the caller is done with the item that uses it, so no memory is allocated while acquiring.
+'''
+
+import collections
+import threading
+
+from six.moves import queue
+
+
+class AcquisitionPipeline(object):
+    '''Calls fetch(buffer) on a background thread and returns the items it fetched when iterated over.
+
+    fetch(buffer) writes into one of the preallocated buffers and returns the item to hand to the
+    caller, which typically holds views of the buffer. It ends the pipeline by returning None or
+    raising StopIteration; any other exception is raised again by the iterator.
+
+    The buffer of an item is handed back to the producer thread when the next item is requested, so
+    process or copy an item before moving on. When all buffers hold items that have not been consumed
+    yet, the producer waits (back-pressure), or with drop_when_full reuses the buffer of the oldest
+    waiting item, which is counted in dropped_count.
+
+    abort() stops the producer thread after the fetch in progress. Leaving a with block calls it:
+
+        with session.channels['0'].fetch_pipeline(...) as pipeline:
+            for item in pipeline:
+                process(item)
+
+    on_stop(), if given, is called on the producer thread once it has stopped, after the last item,
+    an error or abort(), i.e. to set back driver properties that were changed for the pipeline.
+    '''
+
+    def __init__(self, fetch, buffers, drop_when_full=False, on_stop=None):
+        if len(buffers) < 1:
+            raise ValueError('At least one buffer is required')
+        self._fetch = fetch
+        self._drop_when_full = drop_when_full
+        self._on_stop = on_stop
+        # Buffers that are not in use. The producer takes one before each fetch and the consumer gives
+        # it back when it is done with the item.
+        self._free_buffers = queue.Queue()
+        for buffer in buffers:
+            self._free_buffers.put(buffer)
+        # (buffer, item) tuples waiting to be consumed, oldest first, and (None, None) once the producer
+        # has stopped. Not a Queue, because with drop_when_full an item is sometimes put back in front.
+        self._items = collections.deque()
+        self._items_available = threading.Condition()
+        self._current_buffer = None
+        self._stopped = threading.Event()
+        self._error = None
+        self._fetched_count = 0
+        self._dropped_count = 0
+        self._consumed_count = 0
+        self._thread = threading.Thread(target=self._produce, name='AcquisitionPipeline')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.abort()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._current_buffer is not None:
+            self._free_buffers.put(self._current_buffer)
+            self._current_buffer = None
+        with self._items_available:
+            while not self._items:
+                self._items_available.wait()
+            buffer, item = self._items[0]
+            # Leave the end marker for later calls
+            if buffer is not None:
+                self._items.popleft()
+        if buffer is None:
+            error, self._error = self._error, None
+            if error is not None:
+                raise error
+            raise StopIteration
+        self._current_buffer = buffer
+        self._consumed_count += 1
+        return item
+
+    next = __next__  # Python 2
+
+    @property
+    def fetched_count(self):
+        '''Number of items fetched by the producer thread.'''
+        return self._fetched_count
+
+    @property
+    def dropped_count(self):
+        '''Number of items whose buffer was reused before they were consumed, with drop_when_full.'''
+        return self._dropped_count
+
+    @property
+    def consumed_count(self):
+        '''Number of items returned by the iterator.'''
+        return self._consumed_count
+
+    @property
+    def backlog(self):
+        '''Number of items fetched and waiting to be consumed.'''
+        with self._items_available:
+            return sum(1 for buffer, _ in self._items if buffer is not None)
+
+    def abort(self):
+        '''Stops the producer thread and waits for the fetch in progress to complete.
+
+        Items that were fetched but not consumed yet can still be iterated over.
+        '''
+        self._stopped.set()
+        # Wakes up the producer if it waits for a buffer
+        self._free_buffers.put(None)
+        self._thread.join()
+
+    def _put_item(self, buffer, item, oldest=False):
+        with self._items_available:
+            if oldest:
+                self._items.appendleft((buffer, item))
+            else:
+                self._items.append((buffer, item))
+            self._items_available.notify()
+
+    def _take_buffer(self):
+        '''Returns (buffer, stolen); stolen is the waiting (buffer, item) tuple whose buffer is reused, or None.'''
+        if self._drop_when_full:
+            try:
+                return self._free_buffers.get_nowait(), None
+            except queue.Empty:
+                with self._items_available:
+                    if self._items:
+                        stolen = self._items.popleft()
+                        return stolen[0], stolen
+                # The consumer just took the last waiting item; wait for it to give a buffer back
+        return self._free_buffers.get(), None
+
+    def _produce(self):
+        stolen = None
+        try:
+            while not self._stopped.is_set():
+                buffer, stolen = self._take_buffer()
+                if buffer is None or self._stopped.is_set():
+                    break
+                item = self._fetch(buffer)
+                if item is None:
+                    break
+                if stolen is not None:
+                    self._dropped_count += 1
+                    stolen = None
+                self._fetched_count += 1
+                self._put_item(buffer, item)
+        except StopIteration:
+            pass
+        except Exception as e:
+            self._error = e
+            if stolen is not None:
+                # The fetch may have written into the buffer of the waiting item
+                self._dropped_count += 1
+                stolen = None
+        finally:
+            if stolen is not None:
+                # Nothing was fetched into the buffer, so the waiting item is kept
+                self._put_item(stolen[0], stolen[1], oldest=True)
+            if self._on_stop is not None:
+                try:
+                    self._on_stop()
+                except Exception as e:
+                    if self._error is None:
+                        self._error = e
+            self._put_item(None, None)
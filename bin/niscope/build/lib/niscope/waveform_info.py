@@ -0,0 +1,133 @@
+import ctypes
+
+from niscope import visatype
+
+
+# This class is an internal implementation detail
+# ctypes definition
+# Name must match exactly what the name of the structure type is named in the C API.
+class struct_niScope_wfmInfo(ctypes.Structure):  # noqa N801
+    _pack_ = 8
+    _fields_ = [
+        ('absolute_initial_x', visatype.ViReal64),
+        ('relative_initial_x', visatype.ViReal64),
+        ('x_increment', visatype.ViReal64),
+        ('actual_samples', visatype.ViInt32),
+        ('offset', visatype.ViReal64),
+        ('gain', visatype.ViReal64),
+        ('reserved1', visatype.ViReal64),
+        ('reserved2', visatype.ViReal64),
+    ]
+
+    def __init__(self, data=None, absolute_initial_x=0.0, relative_initial_x=0.0,
+                 x_increment=0.0, actual_samples=0, offset=0.0, gain=0.0,
+                 reserved1=0.0, reserved2=0.0):
+        super(ctypes.Structure, self).__init__()
+        if data is not None:
+            self.absolute_initial_x = data.absolute_initial_x
+            self.relative_initial_x = data.relative_initial_x
+            self.x_increment = data.x_increment
+            self.actual_samples = data.actual_samples
+            self.offset = data.offset
+            self.gain = data.gain
+            self.reserved1 = data.reserved1
+            self.reserved2 = data.reserved2
+        else:
+            self.absolute_initial_x = absolute_initial_x
+            self.relative_initial_x = relative_initial_x
+            self.x_increment = x_increment
+            self.actual_samples = actual_samples
+            self.offset = offset
+            self.gain = gain
+            self.reserved1 = reserved1
+            self.reserved2 = reserved2
+
+
+# Built on first use so that numpy is only required by code that uses it
+_numpy_dtype = None
+
+
+def get_numpy_dtype():
+    '''Returns the numpy.dtype with the same fields, offsets and size as struct_niScope_wfmInfo (_pack_ = 8).'''
+    global _numpy_dtype
+    if _numpy_dtype is None:
+        import numpy
+        _numpy_dtype = numpy.dtype({
+            'names': [name for name, _ in struct_niScope_wfmInfo._fields_],
+            'formats': [numpy.dtype(field_type) for _, field_type in struct_niScope_wfmInfo._fields_],
+            'offsets': [getattr(struct_niScope_wfmInfo, name).offset for name, _ in struct_niScope_wfmInfo._fields_],
+            'itemsize': ctypes.sizeof(struct_niScope_wfmInfo),
+        })
+    return _numpy_dtype
+
+
+def as_numpy_array(wfm_info):
+    '''Returns waveform information as a numpy structured array, i.e. info['absolute_initial_x'] is an array of timestamps.
+
+    A ctypes array of struct_niScope_wfmInfo is viewed without copying, so later writes by the driver show
+    through. Any other sequence, such as the list of WaveformInfo returned by fetch(), is copied.
+    '''
+    import numpy
+    dtype = get_numpy_dtype()
+    if isinstance(wfm_info, ctypes.Array):
+        return numpy.frombuffer(wfm_info, dtype=dtype)
+    info_array = numpy.zeros(len(wfm_info), dtype=dtype)
+    for name in dtype.names:
+        info_array[name] = [getattr(info, name) for info in wfm_info]
+    return info_array
+
+
+def scale(wfm, wfm_info, out):
+    '''Scales binary waveforms to voltages in out, as wfm * gain + offset with the gain and offset of each waveform.
+
+    wfm holds the samples of all waveforms one after the other, wfm_info is a structured array from
+    as_numpy_array() with one element per waveform and out is a float32 or float64 array the size of wfm.
+    '''
+    import numpy
+    num_wfms = len(wfm_info)
+    wfm_2d = wfm.reshape(num_wfms, -1)
+    out_2d = out.reshape(num_wfms, -1)
+    numpy.multiply(wfm_2d, wfm_info['gain'][:, numpy.newaxis], out=out_2d, casting='unsafe')
+    numpy.add(out_2d, wfm_info['offset'][:, numpy.newaxis], out=out_2d, casting='unsafe')
+    return out
+
+
+class WaveformInfo(object):
+    def __init__(self, data=None, absolute_initial_x=0.0, relative_initial_x=0.0,
+                 x_increment=0.0, actual_samples=0, offset=0.0, gain=0.0,
+                 reserved1=0.0, reserved2=0.0):
+        if data is not None:
+            self.absolute_initial_x = data.absolute_initial_x
+            self.relative_initial_x = data.relative_initial_x
+            self.x_increment = data.x_increment
+            self.actual_samples = data.actual_samples
+            self.offset = data.offset
+            self.gain = data.gain
+            self.reserved1 = data.reserved1
+            self.reserved2 = data.reserved2
+        else:
+            self.absolute_initial_x = absolute_initial_x
+            self.relative_initial_x = relative_initial_x
+            self.x_increment = x_increment
+            self.actual_samples = actual_samples
+            self.offset = offset
+            self.gain = gain
+            self.reserved1 = reserved1
+            self.reserved2 = reserved2
+
+    def __repr__(self):
+        return '{0}(absolute_initial_x={1}, relative_initial_x={2}, x_increment={3}, actual_samples={4}, offset={5}, gain={6})'.format(
+            self.__class__.__name__, self.absolute_initial_x, self.relative_initial_x, self.x_increment,
+            self.actual_samples, self.offset, self.gain)
+
+    def __str__(self):
+        row_format_g = '{:<20}: {:,.6g}'
+        row_format_d = '{:<20}: {:,}'
+        string_representation = row_format_g.format('Absolute X0', self.absolute_initial_x) + '\n'
+        string_representation += row_format_g.format('Relative X0', self.relative_initial_x) + '\n'
+        string_representation += row_format_g.format('dt', self.x_increment) + '\n'
+        string_representation += row_format_d.format('actual samples', self.actual_samples) + '\n'
+        string_representation += row_format_g.format('offset', self.offset) + '\n'
+        string_representation += row_format_g.format('gain', self.gain)
+        return string_representation
+
@@ -0,0 +1,133 @@
+import collections
+import datetime
+
+from niscope import waveform_info
+
+
+# Yielded by niscope.Session.stream()
+StreamChunk = collections.namedtuple('StreamChunk', ['wfm', 'wfm_info', 'record_number', 'offset', 'backlog'])
+
+# Yielded by niscope.Session.fetch_record_batches()
+RecordBatch = collections.namedtuple('RecordBatch', ['wfm', 'wfm_info', 'record_number', 'records_pending'])
+
+
+class StreamOverflowError(Exception):
+    '''Raised by niscope.Session.stream() when the acquisition got ahead of the stream by more than fits in the onboard memory.
+
+    The samples that were not fetched in time have been overwritten, so the stream can not continue.
+    '''
+
+    def __init__(self, record_number, offset, samples_pending, memory_size):
+        self.record_number = record_number
+        self.offset = offset
+        self.samples_pending = samples_pending
+        self.memory_size = memory_size
+        super(StreamOverflowError, self).__init__('Onboard memory overflow at record {0}, offset {1}: {2} samples per waveform were acquired but not fetched, the onboard memory holds {3}'.format(record_number, offset, samples_pending, memory_size))
+
+
+class FetchBufferPool(object):
+    '''Ring of buffers that are allocated once and reused by every fetch.
+
+    Created by niscope.Session.fetch_buffer_pool(). Each call to fetch() fetches into the next buffer
+    of the ring, so the data returned stays valid until num_buffers more fetches have been made.
+    '''
+
+    _supported_dtypes = ('float64', 'int8', 'int16', 'int32')
+
+    def __init__(self, session, num_samples, dtype=None, num_buffers=2):
+        import numpy
+
+        dtype = numpy.dtype(numpy.float64 if dtype is None else dtype)
+        if dtype.name not in self._supported_dtypes:
+            raise TypeError('Unsupported dtype. Is {0}, expected one of {1}'.format(dtype, ', '.join(self._supported_dtypes)))
+        if num_buffers < 1:
+            raise ValueError('num_buffers must be at least 1, is {0}'.format(num_buffers))
+
+        self._session = session
+        self._num_samples = num_samples
+        self._num_wfms = session._actual_num_wfms()
+        self._buffers = []
+        for _ in range(num_buffers):
+            wfm_info_ctype = (waveform_info.struct_niScope_wfmInfo * self._num_wfms)()
+            self._buffers.append((numpy.zeros(num_samples * self._num_wfms, dtype=dtype), wfm_info_ctype, waveform_info.as_numpy_array(wfm_info_ctype)))
+        self._next_buffer = 0
+
+    def __len__(self):
+        return len(self._buffers)
+
+    @property
+    def num_samples(self):
+        '''Number of samples fetched for each waveform.'''
+        return self._num_samples
+
+    @property
+    def num_wfms(self):
+        '''Number of waveforms fetched, queried when the pool was created.'''
+        return self._num_wfms
+
+    @property
+    def dtype(self):
+        '''numpy.dtype of the sample buffers.'''
+        return self._buffers[0][0].dtype
+
+    @property
+    def buffers(self):
+        '''The buffers of the pool, to pass to fetch_into(). Their contents are an implementation detail.'''
+        return list(self._buffers)
+
+    def fetch(self, timeout=datetime.timedelta(seconds=5.0), num_samples=None):
+        '''fetch
+
+        Fetches into the next buffer of the ring.
+
+        Args:
+            timeout (datetime.timedelta): The time to wait for data to be acquired.
+
+            num_samples (int): The number of samples to fetch for each waveform, at most the num_samples of
+                the pool. None fetches num_samples of the pool.
+
+        Returns:
+            wfm (numpy.array): The samples of each waveform, all samples of waveform 0 first. When fewer samples
+            are fetched this is a view of the start of the buffer.
+
+            wfm_info (numpy.array): Structured array with the timing and scaling information for each waveform, with
+            fields named like the attributes of WaveformInfo. It is a view of the buffer the driver writes into.
+        '''
+        buffer = self._buffers[self._next_buffer]
+        self._next_buffer = (self._next_buffer + 1) % len(self._buffers)
+        return self.fetch_into(buffer, timeout, num_samples)
+
+    def fetch_into(self, buffer, timeout=datetime.timedelta(seconds=5.0), num_samples=None):
+        '''fetch_into
+
+        Same as fetch(), but fetches into the given element of buffers instead of the next buffer of the ring.
+        '''
+        if num_samples is None:
+            num_samples = self._num_samples
+        elif num_samples > self._num_samples:
+            raise ValueError('num_samples must be at most {0}, is {1}'.format(self._num_samples, num_samples))
+        wfm, wfm_info_ctype, wfm_info = buffer
+        self._session._fetch_into_buffers(num_samples, wfm, wfm_info_ctype, timeout)
+        if num_samples < self._num_samples:
+            wfm = wfm[:num_samples * self._num_wfms]
+        return wfm, wfm_info
+
+    def fetch_scaled(self, out, timeout=datetime.timedelta(seconds=5.0)):
+        '''fetch_scaled
+
+        Fetches binary data into the next buffer of the ring and scales it to voltages in out, using the gain
+        and offset of each waveform. The pool must have an integer dtype.
+
+        Args:
+            out (numpy.array): float32 or float64 array of num_samples * num_wfms elements that receives the voltages.
+
+            timeout (datetime.timedelta): The time to wait for data to be acquired.
+
+        Returns:
+            wfm_info (numpy.array): Structured array with the timing and scaling information for each waveform.
+        '''
+        if self.dtype.kind != 'i':
+            raise TypeError('fetch_scaled requires a pool of binary data, dtype is {0}'.format(self.dtype))
+        wfm, wfm_info = self.fetch(timeout)
+        waveform_info.scale(wfm, wfm_info, out)
+        return wfm_info
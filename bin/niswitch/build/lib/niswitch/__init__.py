@@ -0,0 +1,9 @@
+#!/usr/bin/python
+# This file was generated
+
+from niswitch.enums import *          # noqa: F403,F401,H303
+from niswitch.errors import Error     # noqa: F401
+from niswitch.errors import NiswitchWarning   # noqa: F401
+from niswitch.errors import WarningPolicy   # noqa: F401
+from niswitch.session import Session  # noqa: F401
+
@@ -0,0 +1,53 @@
+'''Per-session worker thread used to run driver calls without blocking the caller.
+
+The GIL is released for the duration of every call into the driver runtime and no Python-side
+lock is held while the driver runs. Each session owns at most one SessionExecutor, so blocking
+calls on different sessions (i.e. different instruments) run in parallel, while calls on the
+same session run one at a time and in the order they were submitted.
+'''
+
+import concurrent.futures
+import functools
+
+
+class SessionExecutor(object):
+    '''Runs calls on a session on a dedicated worker thread and returns concurrent.futures.Future objects.
+
+    Any method of the session can be dispatched by name:
+
+        future = session.executor.fetch(num_samples=1000)
+        waveforms = future.result()
+
+    Other callables, such as methods on repeated capabilities, are dispatched using submit():
+
+        future = session.executor.submit(session.channels['0'].fetch, num_samples=1000)
+
+    Do not call session.close() from a callable running on the executor; close() waits for the
+    worker thread to finish.
+    '''
+
+    def __init__(self, session):
+        self._session = session
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+    def __getattr__(self, name):
+        # Look the name up on the class so properties are not read from the driver
+        if not callable(getattr(type(self._session), name, None)):
+            raise AttributeError("'{0}' is not a method of '{1}'".format(name, type(self._session).__name__))
+        method = getattr(self._session, name)
+
+        @functools.wraps(method)
+        def dispatch(*args, **kwargs):
+            return self._pool.submit(method, *args, **kwargs)
+        return dispatch
+
+    def submit(self, fn, *args, **kwargs):
+        '''Schedules fn(*args, **kwargs) on the worker thread and returns a concurrent.futures.Future.'''
+        return self._pool.submit(fn, *args, **kwargs)
+
+    def shutdown(self, wait=True):
+        '''Stops the worker thread once all pending calls have run.
+
+        No new calls can be submitted afterwards.
+        '''
+        self._pool.shutdown(wait=wait)
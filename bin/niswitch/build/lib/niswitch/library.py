@@ -0,0 +1,369 @@
+# This file was generated
+
+import ctypes
+import threading
+
+from niswitch.visatype import *  # noqa: F403,H303
+
+
+class Library(object):
+    '''Library
+
+    Wrapper around driver library.
+    Class will setup the correct ctypes information for every function on first call.
+
+    Binding uses double-checked locking: _func_lock is only taken the first time a function
+    is called. Call bind_all_functions() to bind every function up front, after which no
+    call into the driver takes a Python-side lock.
+    '''
+
+    # ctypes prototype (argtypes, restype) of every function in the driver library
+    _prototypes = {
+        'niSwitch_AbortScan': ([ViSession], ViStatus),  # noqa: F405
+        'niSwitch_CanConnect': ([ViSession, ctypes.POINTER(ViChar), ctypes.POINTER(ViChar), ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niSwitch_Commit': ([ViSession], ViStatus),  # noqa: F405
+        'niSwitch_ConfigureScanList': ([ViSession, ctypes.POINTER(ViChar), ViInt32], ViStatus),  # noqa: F405
+        'niSwitch_ConfigureScanTrigger': ([ViSession, ViReal64, ViInt32, ViInt32], ViStatus),  # noqa: F405
+        'niSwitch_Connect': ([ViSession, ctypes.POINTER(ViChar), ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niSwitch_ConnectMultiple': ([ViSession, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niSwitch_Disable': ([ViSession], ViStatus),  # noqa: F405
+        'niSwitch_Disconnect': ([ViSession, ctypes.POINTER(ViChar), ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niSwitch_DisconnectAll': ([ViSession], ViStatus),  # noqa: F405
+        'niSwitch_DisconnectMultiple': ([ViSession, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niSwitch_GetAttributeViBoolean': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViBoolean)], ViStatus),  # noqa: F405
+        'niSwitch_GetAttributeViInt32': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niSwitch_GetAttributeViReal64': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niSwitch_GetAttributeViString': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ViInt32, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niSwitch_GetChannelName': ([ViSession, ViInt32, ViInt32, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niSwitch_GetError': ([ViSession, ctypes.POINTER(ViStatus), ViInt32, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niSwitch_GetPath': ([ViSession, ctypes.POINTER(ViChar), ctypes.POINTER(ViChar), ViInt32, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niSwitch_GetRelayCount': ([ViSession, ctypes.POINTER(ViChar), ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niSwitch_GetRelayName': ([ViSession, ViInt32, ViInt32, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niSwitch_GetRelayPosition': ([ViSession, ctypes.POINTER(ViChar), ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niSwitch_InitWithTopology': ([ctypes.POINTER(ViChar), ctypes.POINTER(ViChar), ViBoolean, ViBoolean, ctypes.POINTER(ViSession)], ViStatus),  # noqa: F405
+        'niSwitch_InitiateScan': ([ViSession], ViStatus),  # noqa: F405
+        'niSwitch_RelayControl': ([ViSession, ctypes.POINTER(ViChar), ViInt32], ViStatus),  # noqa: F405
+        'niSwitch_ResetWithDefaults': ([ViSession], ViStatus),  # noqa: F405
+        'niSwitch_RouteScanAdvancedOutput': ([ViSession, ViInt32, ViInt32, ViBoolean], ViStatus),  # noqa: F405
+        'niSwitch_RouteTriggerInput': ([ViSession, ViInt32, ViInt32, ViBoolean], ViStatus),  # noqa: F405
+        'niSwitch_SendSoftwareTrigger': ([ViSession], ViStatus),  # noqa: F405
+        'niSwitch_SetAttributeViBoolean': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ViBoolean], ViStatus),  # noqa: F405
+        'niSwitch_SetAttributeViInt32': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ViInt32], ViStatus),  # noqa: F405
+        'niSwitch_SetAttributeViReal64': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ViReal64], ViStatus),  # noqa: F405
+        'niSwitch_SetAttributeViString': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niSwitch_SetContinuousScan': ([ViSession, ViBoolean], ViStatus),  # noqa: F405
+        'niSwitch_SetPath': ([ViSession, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niSwitch_WaitForDebounce': ([ViSession, ViInt32], ViStatus),  # noqa: F405
+        'niSwitch_WaitForScanComplete': ([ViSession, ViInt32], ViStatus),  # noqa: F405
+        'niSwitch_close': ([ViSession], ViStatus),  # noqa: F405
+        'niSwitch_error_message': ([ViSession, ViStatus, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niSwitch_reset': ([ViSession], ViStatus),  # noqa: F405
+        'niSwitch_self_test': ([ViSession, ctypes.POINTER(ViInt16), ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+    }
+
+    def __init__(self, ctypes_library):
+        self._func_lock = threading.Lock()
+        self._library = ctypes_library
+        # We cache the cfunc object from the ctypes.CDLL object
+        self.niSwitch_AbortScan_cfunc = None
+        self.niSwitch_CanConnect_cfunc = None
+        self.niSwitch_Commit_cfunc = None
+        self.niSwitch_ConfigureScanList_cfunc = None
+        self.niSwitch_ConfigureScanTrigger_cfunc = None
+        self.niSwitch_Connect_cfunc = None
+        self.niSwitch_ConnectMultiple_cfunc = None
+        self.niSwitch_Disable_cfunc = None
+        self.niSwitch_Disconnect_cfunc = None
+        self.niSwitch_DisconnectAll_cfunc = None
+        self.niSwitch_DisconnectMultiple_cfunc = None
+        self.niSwitch_GetAttributeViBoolean_cfunc = None
+        self.niSwitch_GetAttributeViInt32_cfunc = None
+        self.niSwitch_GetAttributeViReal64_cfunc = None
+        self.niSwitch_GetAttributeViString_cfunc = None
+        self.niSwitch_GetChannelName_cfunc = None
+        self.niSwitch_GetError_cfunc = None
+        self.niSwitch_GetPath_cfunc = None
+        self.niSwitch_GetRelayCount_cfunc = None
+        self.niSwitch_GetRelayName_cfunc = None
+        self.niSwitch_GetRelayPosition_cfunc = None
+        self.niSwitch_InitWithTopology_cfunc = None
+        self.niSwitch_InitiateScan_cfunc = None
+        self.niSwitch_RelayControl_cfunc = None
+        self.niSwitch_ResetWithDefaults_cfunc = None
+        self.niSwitch_RouteScanAdvancedOutput_cfunc = None
+        self.niSwitch_RouteTriggerInput_cfunc = None
+        self.niSwitch_SendSoftwareTrigger_cfunc = None
+        self.niSwitch_SetAttributeViBoolean_cfunc = None
+        self.niSwitch_SetAttributeViInt32_cfunc = None
+        self.niSwitch_SetAttributeViReal64_cfunc = None
+        self.niSwitch_SetAttributeViString_cfunc = None
+        self.niSwitch_SetContinuousScan_cfunc = None
+        self.niSwitch_SetPath_cfunc = None
+        self.niSwitch_WaitForDebounce_cfunc = None
+        self.niSwitch_WaitForScanComplete_cfunc = None
+        self.niSwitch_close_cfunc = None
+        self.niSwitch_error_message_cfunc = None
+        self.niSwitch_reset_cfunc = None
+        self.niSwitch_self_test_cfunc = None
+
+    def _bind_function(self, c_func_name):
+        with self._func_lock:
+            cfunc = getattr(self, c_func_name + '_cfunc')
+            if cfunc is None:
+                cfunc = getattr(self._library, c_func_name)
+                cfunc.argtypes, cfunc.restype = self._prototypes[c_func_name]
+                # Only publish the cfunc once it is fully typed, other threads read it without the lock
+                setattr(self, c_func_name + '_cfunc', cfunc)
+        return cfunc
+
+    def bind_all_functions(self):
+        '''bind_all_functions
+
+        Resolves and sets up the ctypes information for every function in the driver library.
+        Functions not exported by the driver runtime are left unbound and raise on first call.
+        '''
+        for c_func_name in sorted(self._prototypes):
+            try:
+                self._bind_function(c_func_name)
+            except AttributeError:
+                pass
+
+    def niSwitch_AbortScan(self, vi):  # noqa: N802
+        cfunc = self.niSwitch_AbortScan_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niSwitch_AbortScan')
+        return cfunc(vi)
+
+    def niSwitch_CanConnect(self, vi, channel1, channel2, path_capability):  # noqa: N802
+        cfunc = self.niSwitch_CanConnect_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niSwitch_CanConnect')
+        return cfunc(vi, channel1, channel2, path_capability)
+
+    def niSwitch_Commit(self, vi):  # noqa: N802
+        cfunc = self.niSwitch_Commit_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niSwitch_Commit')
+        return cfunc(vi)
+
+    def niSwitch_ConfigureScanList(self, vi, scanlist, scan_mode):  # noqa: N802
+        cfunc = self.niSwitch_ConfigureScanList_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niSwitch_ConfigureScanList')
+        return cfunc(vi, scanlist, scan_mode)
+
+    def niSwitch_ConfigureScanTrigger(self, vi, scan_delay, trigger_input, scan_advanced_output):  # noqa: N802
+        cfunc = self.niSwitch_ConfigureScanTrigger_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niSwitch_ConfigureScanTrigger')
+        return cfunc(vi, scan_delay, trigger_input, scan_advanced_output)
+
+    def niSwitch_Connect(self, vi, channel1, channel2):  # noqa: N802
+        cfunc = self.niSwitch_Connect_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niSwitch_Connect')
+        return cfunc(vi, channel1, channel2)
+
+    def niSwitch_ConnectMultiple(self, vi, connection_list):  # noqa: N802
+        cfunc = self.niSwitch_ConnectMultiple_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niSwitch_ConnectMultiple')
+        return cfunc(vi, connection_list)
+
+    def niSwitch_Disable(self, vi):  # noqa: N802
+        cfunc = self.niSwitch_Disable_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niSwitch_Disable')
+        return cfunc(vi)
+
+    def niSwitch_Disconnect(self, vi, channel1, channel2):  # noqa: N802
+        cfunc = self.niSwitch_Disconnect_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niSwitch_Disconnect')
+        return cfunc(vi, channel1, channel2)
+
+    def niSwitch_DisconnectAll(self, vi):  # noqa: N802
+        cfunc = self.niSwitch_DisconnectAll_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niSwitch_DisconnectAll')
+        return cfunc(vi)
+
+    def niSwitch_DisconnectMultiple(self, vi, disconnection_list):  # noqa: N802
+        cfunc = self.niSwitch_DisconnectMultiple_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niSwitch_DisconnectMultiple')
+        return cfunc(vi, disconnection_list)
+
+    def niSwitch_GetAttributeViBoolean(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
+        cfunc = self.niSwitch_GetAttributeViBoolean_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niSwitch_GetAttributeViBoolean')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
+
+    def niSwitch_GetAttributeViInt32(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
+        cfunc = self.niSwitch_GetAttributeViInt32_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niSwitch_GetAttributeViInt32')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
+
+    def niSwitch_GetAttributeViReal64(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
+        cfunc = self.niSwitch_GetAttributeViReal64_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niSwitch_GetAttributeViReal64')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
+
+    def niSwitch_GetAttributeViString(self, vi, channel_name, attribute_id, array_size, attribute_value):  # noqa: N802
+        cfunc = self.niSwitch_GetAttributeViString_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niSwitch_GetAttributeViString')
+        return cfunc(vi, channel_name, attribute_id, array_size, attribute_value)
+
+    def niSwitch_GetChannelName(self, vi, index, buffer_size, channel_name_buffer):  # noqa: N802
+        cfunc = self.niSwitch_GetChannelName_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niSwitch_GetChannelName')
+        return cfunc(vi, index, buffer_size, channel_name_buffer)
+
+    def niSwitch_GetError(self, vi, code, buffer_size, description):  # noqa: N802
+        cfunc = self.niSwitch_GetError_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niSwitch_GetError')
+        return cfunc(vi, code, buffer_size, description)
+
+    def niSwitch_GetPath(self, vi, channel1, channel2, buffer_size, path):  # noqa: N802
+        cfunc = self.niSwitch_GetPath_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niSwitch_GetPath')
+        return cfunc(vi, channel1, channel2, buffer_size, path)
+
+    def niSwitch_GetRelayCount(self, vi, relay_name, relay_count):  # noqa: N802
+        cfunc = self.niSwitch_GetRelayCount_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niSwitch_GetRelayCount')
+        return cfunc(vi, relay_name, relay_count)
+
+    def niSwitch_GetRelayName(self, vi, index, relay_name_buffer_size, relay_name_buffer):  # noqa: N802
+        cfunc = self.niSwitch_GetRelayName_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niSwitch_GetRelayName')
+        return cfunc(vi, index, relay_name_buffer_size, relay_name_buffer)
+
+    def niSwitch_GetRelayPosition(self, vi, relay_name, relay_position):  # noqa: N802
+        cfunc = self.niSwitch_GetRelayPosition_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niSwitch_GetRelayPosition')
+        return cfunc(vi, relay_name, relay_position)
+
+    def niSwitch_InitWithTopology(self, resource_name, topology, simulate, reset_device, vi):  # noqa: N802
+        cfunc = self.niSwitch_InitWithTopology_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niSwitch_InitWithTopology')
+        return cfunc(resource_name, topology, simulate, reset_device, vi)
+
+    def niSwitch_InitiateScan(self, vi):  # noqa: N802
+        cfunc = self.niSwitch_InitiateScan_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niSwitch_InitiateScan')
+        return cfunc(vi)
+
+    def niSwitch_RelayControl(self, vi, relay_name, relay_action):  # noqa: N802
+        cfunc = self.niSwitch_RelayControl_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niSwitch_RelayControl')
+        return cfunc(vi, relay_name, relay_action)
+
+    def niSwitch_ResetWithDefaults(self, vi):  # noqa: N802
+        cfunc = self.niSwitch_ResetWithDefaults_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niSwitch_ResetWithDefaults')
+        return cfunc(vi)
+
+    def niSwitch_RouteScanAdvancedOutput(self, vi, scan_advanced_output_connector, scan_advanced_output_bus_line, invert):  # noqa: N802
+        cfunc = self.niSwitch_RouteScanAdvancedOutput_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niSwitch_RouteScanAdvancedOutput')
+        return cfunc(vi, scan_advanced_output_connector, scan_advanced_output_bus_line, invert)
+
+    def niSwitch_RouteTriggerInput(self, vi, trigger_input_connector, trigger_input_bus_line, invert):  # noqa: N802
+        cfunc = self.niSwitch_RouteTriggerInput_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niSwitch_RouteTriggerInput')
+        return cfunc(vi, trigger_input_connector, trigger_input_bus_line, invert)
+
+    def niSwitch_SendSoftwareTrigger(self, vi):  # noqa: N802
+        cfunc = self.niSwitch_SendSoftwareTrigger_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niSwitch_SendSoftwareTrigger')
+        return cfunc(vi)
+
+    def niSwitch_SetAttributeViBoolean(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
+        cfunc = self.niSwitch_SetAttributeViBoolean_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niSwitch_SetAttributeViBoolean')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
+
+    def niSwitch_SetAttributeViInt32(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
+        cfunc = self.niSwitch_SetAttributeViInt32_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niSwitch_SetAttributeViInt32')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
+
+    def niSwitch_SetAttributeViReal64(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
+        cfunc = self.niSwitch_SetAttributeViReal64_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niSwitch_SetAttributeViReal64')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
+
+    def niSwitch_SetAttributeViString(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
+        cfunc = self.niSwitch_SetAttributeViString_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niSwitch_SetAttributeViString')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
+
+    def niSwitch_SetContinuousScan(self, vi, continuous_scan):  # noqa: N802
+        cfunc = self.niSwitch_SetContinuousScan_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niSwitch_SetContinuousScan')
+        return cfunc(vi, continuous_scan)
+
+    def niSwitch_SetPath(self, vi, path_list):  # noqa: N802
+        cfunc = self.niSwitch_SetPath_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niSwitch_SetPath')
+        return cfunc(vi, path_list)
+
+    def niSwitch_WaitForDebounce(self, vi, maximum_time_ms):  # noqa: N802
+        cfunc = self.niSwitch_WaitForDebounce_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niSwitch_WaitForDebounce')
+        return cfunc(vi, maximum_time_ms)
+
+    def niSwitch_WaitForScanComplete(self, vi, maximum_time_ms):  # noqa: N802
+        cfunc = self.niSwitch_WaitForScanComplete_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niSwitch_WaitForScanComplete')
+        return cfunc(vi, maximum_time_ms)
+
+    def niSwitch_close(self, vi):  # noqa: N802
+        cfunc = self.niSwitch_close_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niSwitch_close')
+        return cfunc(vi)
+
+    def niSwitch_error_message(self, vi, error_code, error_message):  # noqa: N802
+        cfunc = self.niSwitch_error_message_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niSwitch_error_message')
+        return cfunc(vi, error_code, error_message)
+
+    def niSwitch_reset(self, vi):  # noqa: N802
+        cfunc = self.niSwitch_reset_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niSwitch_reset')
+        return cfunc(vi)
+
+    def niSwitch_self_test(self, vi, self_test_result, self_test_message):  # noqa: N802
+        cfunc = self.niSwitch_self_test_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niSwitch_self_test')
+        return cfunc(vi, self_test_result, self_test_message)
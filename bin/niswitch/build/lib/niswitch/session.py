@@ -0,0 +1,2982 @@
+# -*- coding: utf-8 -*-
+# This file was generated
+import array  # noqa: F401
+import collections
+import ctypes
+import datetime
+import six
+import threading
+
+from niswitch import _converters
+from niswitch import attributes
+from niswitch import enums
+from niswitch import errors
+from niswitch import executor
+from niswitch import library_singleton
+from niswitch import visatype
+
+# Used for __repr__
+import pprint
+pp = pprint.PrettyPrinter(indent=4)
+
+
+# Helper functions for creating ctypes needed for calling into the driver DLL
+def get_ctypes_pointer_for_buffer(value=None, library_type=None, size=None):
+    if isinstance(value, array.array):
+        assert library_type is not None, 'library_type is required for array.array'
+        if value.itemsize == ctypes.sizeof(library_type) and (value.typecode in 'fd') == (getattr(library_type, '_type_', None) in ('f', 'd')):
+            # Passed by pointer, without copying
+            addr, _ = value.buffer_info()
+            return ctypes.cast(addr, ctypes.POINTER(library_type))
+        # Input buffer of another element type, i.e. array.array('f') for ViReal64
+        return (library_type * len(value))(*value)
+    elif str(type(value)).find("'numpy.ndarray'") != -1:
+        import numpy
+        if library_type is None:
+            return numpy.ctypeslib.as_ctypes(value)
+        dtype = numpy.dtype(library_type)
+        if value.dtype == dtype and value.flags.c_contiguous:
+            # Passed by pointer, without copying
+            return ctypes.cast(value.ctypes.data, ctypes.POINTER(library_type))
+        # Input buffer of another dtype or not contiguous. The ctypes array keeps a reference to the converted copy.
+        return numpy.ctypeslib.as_ctypes(numpy.ascontiguousarray(value.astype(dtype, casting='same_kind', copy=False)))
+    elif isinstance(value, (list, tuple)):
+        assert library_type is not None, 'library_type is required for list'
+        return (library_type * len(value))(*value)
+    else:
+        if library_type is not None and size is not None:
+            return (library_type * size)()
+        else:
+            return None
+
+
+def get_ctypes_and_array(value, array_type):
+    if value is not None:
+        if isinstance(value, array.array) or str(type(value)).find("'numpy.ndarray'") != -1:
+            # get_ctypes_pointer_for_buffer() passes them by pointer when the element type matches
+            value_array = value
+        else:
+            value_array = array.array(array_type, value)
+    else:
+        value_array = None
+
+    return value_array
+
+
+class _Scan(object):
+    def __init__(self, session):
+        self._session = session
+        self._session._initiate_scan()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._session.abort()
+
+
+class _LruCache(object):
+    '''Dictionary with at most maxsize entries that discards the least recently used entry when full'''
+
+    def __init__(self, maxsize):
+        self._maxsize = maxsize
+        self._values = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, create):
+        '''Returns the value stored for key, calling create() and storing its result on a miss'''
+        with self._lock:
+            try:
+                value = self._values.pop(key)
+                self._values[key] = value
+                return value
+            except KeyError:
+                pass
+        # Don't hold the lock while creating the value, create() may call into the driver
+        value = create()
+        with self._lock:
+            self._values[key] = value
+            if len(self._values) > self._maxsize:
+                self._values.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+
+def _get_repeated_capability_cache_key(repeated_capability):
+    '''Returns a hashable key for repeated_capability, or None for values that are not cached (i.e. generators)'''
+    simple_types = six.string_types + six.integer_types
+    if isinstance(repeated_capability, simple_types):
+        # The type is part of the key so that i.e. True and 1 are different keys
+        return (type(repeated_capability), repeated_capability)
+    if isinstance(repeated_capability, slice):
+        return (slice, repeated_capability.start, repeated_capability.stop, repeated_capability.step)
+    if isinstance(repeated_capability, (list, tuple)) and all(isinstance(r, simple_types) for r in repeated_capability):
+        return (type(repeated_capability), ) + tuple((type(r), r) for r in repeated_capability)
+    return None
+
+
+class _RepeatedCapabilities(object):
+    # Maximum number of objects kept by each repeated capability, see __getitem__
+    _cache_size = 128
+
+    def __init__(self, session, prefix):
+        self._session = session
+        self._prefix = prefix
+        self._cache = _LruCache(self._cache_size)
+
+    def __getitem__(self, repeated_capability):
+        '''Set/get properties or call methods with a repeated capability (i.e. channels)'''
+        key = _get_repeated_capability_cache_key(repeated_capability)
+        if key is None:
+            return self._create(repeated_capability)
+        # The objects are immutable, so the ones for recently used repeated capabilities are reused
+        # instead of parsing the repeated capability and encoding the resulting string again
+        return self._cache.get(key, lambda: self._create(repeated_capability))
+
+    def _create(self, repeated_capability):
+        rep_caps = _converters.convert_repeated_capabilities(repeated_capability, self._prefix)
+
+        return self._session._with_repeated_capability(rep_caps)
+
+    def _clear_cache(self):
+        self._cache.clear()
+
+
+class _SessionBase(errors._WarningPolicyMixin):
+    '''Base class for all NI-SWITCH sessions.'''
+
+    # This is needed during __init__. Without it, __setattr__ raises an exception
+    _is_frozen = False
+
+    # Names that __setattr__ accepts without a dir() lookup once the session is frozen: the
+    # properties and the instance attributes set in __init__. Anything else falls back to dir().
+    _settable_names = frozenset([
+        '_vi',
+        '_attribute_cache',
+        '_channel_name_ctypes',
+        '_encoding',
+        '_error_descriptions',
+        '_is_frozen',
+        '_library',
+        '_memoized_results',
+        '_param_list',
+        '_pending_descriptions',
+        '_repeated_capability',
+        '_repeated_capability_ctype',
+        '_warning_filter',
+        'analog_bus_sharing_enable',
+        'bandwidth',
+        'cabled_module_scan_advanced_bus',
+        'cabled_module_trigger_bus',
+        'cache',
+        'channel_count',
+        'characteristic_impedance',
+        'continuous_scan',
+        'digital_filter_enable',
+        'driver_setup',
+        'group_capabilities',
+        'handshaking_initiation',
+        'instrument_firmware_revision',
+        'instrument_manufacturer',
+        'instrument_model',
+        'interchange_check',
+        'io_resource_descriptor',
+        'is_configuration_channel',
+        'is_debounced',
+        'is_scanning',
+        'is_source_channel',
+        'is_waiting_for_trig',
+        'logical_name',
+        'master_slave_scan_advanced_bus',
+        'master_slave_trigger_bus',
+        'max_ac_voltage',
+        'max_carry_ac_current',
+        'max_carry_ac_power',
+        'max_carry_dc_current',
+        'max_carry_dc_power',
+        'max_dc_voltage',
+        'max_switching_ac_current',
+        'max_switching_ac_power',
+        'max_switching_dc_current',
+        'max_switching_dc_power',
+        'number_of_relays',
+        'num_of_columns',
+        'num_of_rows',
+        'parsed_scan_list',
+        'power_down_latching_relays_after_debounce',
+        'range_check',
+        'record_coercions',
+        'scan_advanced_output',
+        'scan_advanced_polarity',
+        'scan_delay',
+        'scan_list',
+        'scan_mode',
+        'serial_number',
+        'settling_time',
+        'simulate',
+        'specific_driver_class_spec_major_version',
+        'specific_driver_class_spec_minor_version',
+        'specific_driver_description',
+        'specific_driver_revision',
+        'specific_driver_vendor',
+        'supported_instrument_models',
+        'temperature',
+        'trigger_input',
+        'trigger_input_polarity',
+        'trigger_mode',
+        'wire_mode',
+    ])
+
+    analog_bus_sharing_enable = attributes.AttributeViBoolean(1150018)
+    '''Type: bool
+
+    Enables or disables sharing of an analog bus line so that multiple  NI SwitchBlock devices may connect to it simultaneously. To enable  multiple NI SwitchBlock devices to share an analog bus line, set this  property to True for each device on the channel that corresponds  with the shared analog bus line. The default value for all devices is  False, which disables sharing of the analog bus.
+    Refer to the Using the Analog Bus on an NI SwitchBlock Carrier topic  in the NI Switches Help for more information about sharing the analog bus.
+
+    Tip:
+    This property can use repeated capabilities (usually channels). If set or get directly on the
+    analog_bus_sharing_enable.Session object, then the set/get will use all repeated capabilities in the session.
+    You can specify a subset of repeated capabilities using the Python index notation on an
+    analog_bus_sharing_enable.Session instance, and calling set/get value on the result.:
+
+        session.channels['0,1'].analog_bus_sharing_enable = var
+        var = session.channels['0,1'].analog_bus_sharing_enable
+    '''
+    bandwidth = attributes.AttributeViReal64(1250005)
+    '''Type: float
+
+    This channel-based property returns the bandwidth for the channel.
+    The units are hertz.
+
+    Tip:
+    This property can use repeated capabilities (usually channels). If set or get directly on the
+    bandwidth.Session object, then the set/get will use all repeated capabilities in the session.
+    You can specify a subset of repeated capabilities using the Python index notation on an
+    bandwidth.Session instance, and calling set/get value on the result.:
+
+        session.channels['0,1'].bandwidth = var
+        var = session.channels['0,1'].bandwidth
+    '''
+    cabled_module_scan_advanced_bus = attributes.AttributeViInt32(1150009)
+    '''Type: int
+
+    This property has been deprecated and may be removed from a future release of  NI-SWITCH.  Use the route_scan_advanced_output method instead.
+    '''
+    cabled_module_trigger_bus = attributes.AttributeViInt32(1150008)
+    '''Type: int
+
+    This property has been deprecated and may be removed from a future release of  NI-SWITCH.  Use the route_trigger_input method instead.
+    '''
+    cache = attributes.AttributeViBoolean(1050004)
+    '''Type: bool
+
+    Specifies whether to cache the value of properties.  When caching is  enabled, the instrument driver keeps track of the current instrument  settings and avoids sending redundant commands to the instrument.
+    The instrument driver can choose always to cache or never to cache  particular properties regardless of the setting of this property.
+    The default value is True.   Use the InitWithOptions  method to override this value.
+
+    Note:
+    One or more of the referenced methods are not in the Python API for this driver.
+    '''
+    channel_count = attributes.AttributeViInt32(1050203)
+    '''Type: int
+
+    Indicates the number of channels that the specific instrument  driver supports.
+    '''
+    characteristic_impedance = attributes.AttributeViReal64(1250016)
+    '''Type: float
+
+    This channel-based property returns the characteristic impedance for the  channel.
+    The units are ohms.
+
+    Tip:
+    This property can use repeated capabilities (usually channels). If set or get directly on the
+    characteristic_impedance.Session object, then the set/get will use all repeated capabilities in the session.
+    You can specify a subset of repeated capabilities using the Python index notation on an
+    characteristic_impedance.Session instance, and calling set/get value on the result.:
+
+        session.channels['0,1'].characteristic_impedance = var
+        var = session.channels['0,1'].characteristic_impedance
+    '''
+    continuous_scan = attributes.AttributeViBoolean(1150002)
+    '''Type: bool
+
+    When a switch device is scanning, the swich can either stop scanning when  the end of the scan (False) or continue scanning from the top of the  scan list again (True).
+    Notice that if you set the scan to continuous (True), the Wait For Scan  Complete operation will always time out and you must call Abort to stop  the scan.
+    '''
+    digital_filter_enable = attributes.AttributeViBoolean(1150016)
+    '''Type: bool
+
+    This property specifies whether to apply the pulse width filter to the  Trigger Input. Enabling the Digital Filter (True) prevents the switch  module from being triggered by pulses that are less than 150 ns on PXI  trigger lines 0–7.
+    When Digital Filter is disabled (False), it is possible for the switch  module to be triggered by noise on the PXI trigger lines. If the device  triggering the switch is capable of sending pulses greater than 150 ns, you should not disable the Digital Filter.
+    '''
+    driver_setup = attributes.AttributeViString(1050007)
+    '''Type: str
+
+    This property indicates the Driver Setup string that the user  specified when initializing the driver.
+    Some cases exist where the end-user must specify instrument driver  options at initialization time.  An example of this is specifying  a particular instrument model from among a family of instruments  that the driver supports.  This is useful when using simulation.   The end-user can specify driver-specific options through  the DriverSetup keyword in the optionsString parameter to the  InitWithOptions method, or through the IVI Configuration Utility.
+    If the user does not specify a Driver Setup string, this property returns an empty string.
+
+    Note:
+    One or more of the referenced methods are not in the Python API for this driver.
+    '''
+    group_capabilities = attributes.AttributeViString(1050401)
+    '''Type: str
+
+    A string that contains a comma-separated list of class-extention groups that  this driver implements.
+    '''
+    handshaking_initiation = attributes.AttributeEnum(attributes.AttributeViInt32, enums.HandshakingInitiation, 1150013)
+    instrument_firmware_revision = attributes.AttributeViString(1050510)
+    '''Type: str
+
+    A string that contains the firmware revision information  for the instrument you are currently using.
+    '''
+    instrument_manufacturer = attributes.AttributeViString(1050511)
+    '''Type: str
+
+    A string that contains the name of the instrument manufacturer you are currently  using.
+    '''
+    instrument_model = attributes.AttributeViString(1050512)
+    '''Type: str
+
+    A string that contains the model number or name of the instrument that you  are currently using.
+    '''
+    interchange_check = attributes.AttributeViBoolean(1050021)
+    '''Type: bool
+
+    Specifies whether to perform interchangeability checking and retrieve  interchangeability warnings when you call  connect, set_path and _initiate_scan methods.
+    The default value is False.
+    Interchangeability warnings indicate that using your application with a  different instrument might cause different behavior.   You call GetNextInterchangeWarning to extract interchange warnings.   Call the ClearInterchangeWarnings method to clear the list  of interchangeability warnings without reading them.
+    Interchangeability checking examines the properties in a  capability group only if you specify a value for at least one  property within that group.  Interchangeability warnings can  occur when an property affects the behavior of the instrument and you  have not set that property, or the property has been invalidated since you set it.
+
+    Note:
+    One or more of the referenced methods are not in the Python API for this driver.
+    '''
+    io_resource_descriptor = attributes.AttributeViString(1050304)
+    '''Type: str
+
+    Indicates the resource descriptor the driver  uses to identify the physical device.
+    If you initialize the driver with a logical name, this  property contains the resource descriptor that corresponds  to the entry in the IVI Configuration utility.
+    If you initialize the instrument driver with the resource  descriptor, this property contains that value.
+    '''
+    is_configuration_channel = attributes.AttributeViBoolean(1250003)
+    '''Type: bool
+
+    This channel-based property specifies whether to reserve the channel for  internal path creation.  A channel that is available for internal path  creation is called a configuration channel.  The driver may use  configuration channels to create paths between two channels you specify in  the connect method.  Configuration channels are not available  for external connections.
+    Set this property to True to mark the channel as a configuration  channel.  Set this property to False to mark the channel as available  for external connections.
+    After you identify a channel as a configuration channel, you cannot  use that channel for external connections.  The connect method  returns the NISWITCH_ERROR_IS_CONFIGURATION_CHANNEL error when you attempt  to establish a connection between a configuration channel and any other  channel.
+
+    Tip:
+    This property can use repeated capabilities (usually channels). If set or get directly on the
+    is_configuration_channel.Session object, then the set/get will use all repeated capabilities in the session.
+    You can specify a subset of repeated capabilities using the Python index notation on an
+    is_configuration_channel.Session instance, and calling set/get value on the result.:
+
+        session.channels['0,1'].is_configuration_channel = var
+        var = session.channels['0,1'].is_configuration_channel
+    '''
+    is_debounced = attributes.AttributeViBoolean(1250002, cacheable=False)
+    '''Type: bool
+
+    This property indicates whether the entire switch device has settled  since the last switching command.  A value of True indicates that all  signals going through the switch device are valid.
+    '''
+    is_scanning = attributes.AttributeViBoolean(1250024, cacheable=False)
+    '''Type: bool
+
+    If True, the switch module is currently scanning through the scan list  (i.e. it is not in the Idle state). If False, the switch module is not  currently scanning through the scan list (i.e. it is in the Idle state).
+    '''
+    is_source_channel = attributes.AttributeViBoolean(1250001)
+    '''Type: bool
+
+    This channel-based property specifies whether you want to identify the  channel as a source channel.  Typically, you set this property to True  when you attach the channel to a power supply, a method generator, or an  active measurement point on the unit under test, and you do not want to  connect the channel to another source.  The driver prevents source  channels from connecting to each other.  The connect method  returns the NISWITCH_ERROR_ATTEMPT_TO_CONNECT_SOURCES when you attempt to  connect two channels that you identify as source channels.
+
+    Tip:
+    This property can use repeated capabilities (usually channels). If set or get directly on the
+    is_source_channel.Session object, then the set/get will use all repeated capabilities in the session.
+    You can specify a subset of repeated capabilities using the Python index notation on an
+    is_source_channel.Session instance, and calling set/get value on the result.:
+
+        session.channels['0,1'].is_source_channel = var
+        var = session.channels['0,1'].is_source_channel
+    '''
+    is_waiting_for_trig = attributes.AttributeViBoolean(1150004, cacheable=False)
+    '''Type: bool
+
+    In a scan list, a semi-colon (;) is used to indicate that at that point in  the scan list, the scan engine should pause until a trigger is received  from the trigger input.  If that trigger is user generated through either  a hardware pulse or the Send SW Trigger operation, it is necessary for the  user to know  when the scan engine has reached such a state.
+    '''
+    logical_name = attributes.AttributeViString(1050305)
+    '''Type: str
+
+    A string containing the logical name you specified when opening the  current IVI session.
+    You may pass a logical name to the init or  InitWithOptions methods.   The IVI Configuration utility must contain an entry for the logical name.   The logical name entry refers to a virtual instrument section in the  IVI Configuration file.  The virtual instrument section specifies a physical  device and initial user options.
+
+    Note:
+    One or more of the referenced methods are not in the Python API for this driver.
+    '''
+    master_slave_scan_advanced_bus = attributes.AttributeViInt32(1150007)
+    '''Type: int
+
+    This property has been deprecated and may be removed from a future release of  NI-SWITCH.  Use the route_scan_advanced_output method instead.
+    '''
+    master_slave_trigger_bus = attributes.AttributeViInt32(1150006)
+    '''Type: int
+
+    This property has been deprecated and may be removed from a future release of  NI-SWITCH.  Use the route_trigger_input method instead.
+    '''
+    max_ac_voltage = attributes.AttributeViReal64(1250007)
+    '''Type: float
+
+    This channel-based property returns the maximum AC voltage the channel  can switch.
+    The units are volts RMS.
+
+    Tip:
+    This property can use repeated capabilities (usually channels). If set or get directly on the
+    max_ac_voltage.Session object, then the set/get will use all repeated capabilities in the session.
+    You can specify a subset of repeated capabilities using the Python index notation on an
+    max_ac_voltage.Session instance, and calling set/get value on the result.:
+
+        session.channels['0,1'].max_ac_voltage = var
+        var = session.channels['0,1'].max_ac_voltage
+    '''
+    max_carry_ac_current = attributes.AttributeViReal64(1250011)
+    '''Type: float
+
+    This channel-based property returns the maximum AC current the channel  can carry.
+    The units are amperes RMS.
+
+    Tip:
+    This property can use repeated capabilities (usually channels). If set or get directly on the
+    max_carry_ac_current.Session object, then the set/get will use all repeated capabilities in the session.
+    You can specify a subset of repeated capabilities using the Python index notation on an
+    max_carry_ac_current.Session instance, and calling set/get value on the result.:
+
+        session.channels['0,1'].max_carry_ac_current = var
+        var = session.channels['0,1'].max_carry_ac_current
+    '''
+    max_carry_ac_power = attributes.AttributeViReal64(1250015)
+    '''Type: float
+
+    This channel-based property returns the maximum AC power the channel can  carry.
+    The units are volt-amperes.
+
+    Tip:
+    This property can use repeated capabilities (usually channels). If set or get directly on the
+    max_carry_ac_power.Session object, then the set/get will use all repeated capabilities in the session.
+    You can specify a subset of repeated capabilities using the Python index notation on an
+    max_carry_ac_power.Session instance, and calling set/get value on the result.:
+
+        session.channels['0,1'].max_carry_ac_power = var
+        var = session.channels['0,1'].max_carry_ac_power
+    '''
+    max_carry_dc_current = attributes.AttributeViReal64(1250010)
+    '''Type: float
+
+    This channel-based property returns the maximum DC current the channel  can carry.
+    The units are amperes.
+
+    Tip:
+    This property can use repeated capabilities (usually channels). If set or get directly on the
+    max_carry_dc_current.Session object, then the set/get will use all repeated capabilities in the session.
+    You can specify a subset of repeated capabilities using the Python index notation on an
+    max_carry_dc_current.Session instance, and calling set/get value on the result.:
+
+        session.channels['0,1'].max_carry_dc_current = var
+        var = session.channels['0,1'].max_carry_dc_current
+    '''
+    max_carry_dc_power = attributes.AttributeViReal64(1250014)
+    '''Type: float
+
+    This channel-based property returns the maximum DC power the channel can  carry.
+    The units are watts.
+
+    Tip:
+    This property can use repeated capabilities (usually channels). If set or get directly on the
+    max_carry_dc_power.Session object, then the set/get will use all repeated capabilities in the session.
+    You can specify a subset of repeated capabilities using the Python index notation on an
+    max_carry_dc_power.Session instance, and calling set/get value on the result.:
+
+        session.channels['0,1'].max_carry_dc_power = var
+        var = session.channels['0,1'].max_carry_dc_power
+    '''
+    max_dc_voltage = attributes.AttributeViReal64(1250006)
+    '''Type: float
+
+    This channel-based property returns the maximum DC voltage the channel  can switch.
+    The units are volts.
+
+    Tip:
+    This property can use repeated capabilities (usually channels). If set or get directly on the
+    max_dc_voltage.Session object, then the set/get will use all repeated capabilities in the session.
+    You can specify a subset of repeated capabilities using the Python index notation on an
+    max_dc_voltage.Session instance, and calling set/get value on the result.:
+
+        session.channels['0,1'].max_dc_voltage = var
+        var = session.channels['0,1'].max_dc_voltage
+    '''
+    max_switching_ac_current = attributes.AttributeViReal64(1250009)
+    '''Type: float
+
+    This channel-based property returns the maximum AC current the channel  can switch.
+    The units are amperes RMS.
+
+    Tip:
+    This property can use repeated capabilities (usually channels). If set or get directly on the
+    max_switching_ac_current.Session object, then the set/get will use all repeated capabilities in the session.
+    You can specify a subset of repeated capabilities using the Python index notation on an
+    max_switching_ac_current.Session instance, and calling set/get value on the result.:
+
+        session.channels['0,1'].max_switching_ac_current = var
+        var = session.channels['0,1'].max_switching_ac_current
+    '''
+    max_switching_ac_power = attributes.AttributeViReal64(1250013)
+    '''Type: float
+
+    This channel-based property returns the maximum AC power the channel can  switch.
+    The units are volt-amperes.
+
+    Tip:
+    This property can use repeated capabilities (usually channels). If set or get directly on the
+    max_switching_ac_power.Session object, then the set/get will use all repeated capabilities in the session.
+    You can specify a subset of repeated capabilities using the Python index notation on an
+    max_switching_ac_power.Session instance, and calling set/get value on the result.:
+
+        session.channels['0,1'].max_switching_ac_power = var
+        var = session.channels['0,1'].max_switching_ac_power
+    '''
+    max_switching_dc_current = attributes.AttributeViReal64(1250008)
+    '''Type: float
+
+    This channel-based property returns the maximum DC current the channel  can switch.
+    The units are amperes.
+
+    Tip:
+    This property can use repeated capabilities (usually channels). If set or get directly on the
+    max_switching_dc_current.Session object, then the set/get will use all repeated capabilities in the session.
+    You can specify a subset of repeated capabilities using the Python index notation on an
+    max_switching_dc_current.Session instance, and calling set/get value on the result.:
+
+        session.channels['0,1'].max_switching_dc_current = var
+        var = session.channels['0,1'].max_switching_dc_current
+    '''
+    max_switching_dc_power = attributes.AttributeViReal64(1250012)
+    '''Type: float
+
+    This channel-based property returns the maximum DC power the channel can  switch.
+    The units are watts.
+
+    Tip:
+    This property can use repeated capabilities (usually channels). If set or get directly on the
+    max_switching_dc_power.Session object, then the set/get will use all repeated capabilities in the session.
+    You can specify a subset of repeated capabilities using the Python index notation on an
+    max_switching_dc_power.Session instance, and calling set/get value on the result.:
+
+        session.channels['0,1'].max_switching_dc_power = var
+        var = session.channels['0,1'].max_switching_dc_power
+    '''
+    number_of_relays = attributes.AttributeViInt32(1150014)
+    '''Type: int
+
+    This property returns the number of relays.
+    '''
+    num_of_columns = attributes.AttributeViInt32(1250019)
+    '''Type: int
+
+    This property returns the number of channels on the column of a matrix or  scanner.  If the switch device is a scanner, this value is the number of  input channels.
+    The wire_mode property affects the number of available  columns.  For example, if your device has 8 input lines and you use the  four-wire mode, then the number of columns you have available is 2.
+    '''
+    num_of_rows = attributes.AttributeViInt32(1250018)
+    '''Type: int
+
+    This property returns the number of channels on the row of a matrix or  scanner.  If the switch device is a scanner, this value is the number of  output channels.
+    The wire_mode property affects the number of available  rows.  For example, if your device has 8 input lines and you use the  two-wire mode, then the number of columns you have available is 4.
+    '''
+    parsed_scan_list = attributes.AttributeViString(1150012)
+    '''Type: str
+
+    This property has been deprecated and may be removed from a future release of  NI-SWITCH.
+    '''
+    power_down_latching_relays_after_debounce = attributes.AttributeViBoolean(1150017)
+    '''Type: bool
+
+    This property specifies whether to power down latching relays after  calling Wait For Debounce.
+    When Power Down Latching Relays After Debounce is enabled (True),  a call to Wait For Debounce ensures that the relays are settled  and the latching relays are powered down.
+    '''
+    range_check = attributes.AttributeViBoolean(1050002)
+    '''Type: bool
+
+    Specifies whether to validate property values and method parameters.   If enabled, the instrument driver validates the parameter values that  you pass to driver methods.  Range checking  parameters is very useful for debugging.  After you validate your program,  you can set this property to False to disable range checking and  maximize performance.
+    The default value is True.   Use the InitWithOptions  method to override this value.
+
+    Note:
+    One or more of the referenced methods are not in the Python API for this driver.
+    '''
+    record_coercions = attributes.AttributeViBoolean(1050006)
+    '''Type: bool
+
+    Specifies whether the IVI engine keeps a list of  the value coercions it makes for ViInt32 and ViReal64 properties.   You call GetNextCoercionRecord to extract and delete the oldest  coercion record from the list.
+    The default value is False.   Use the  InitWithOptions method to override this value.
+
+    Note:
+    One or more of the referenced methods are not in the Python API for this driver.
+    '''
+    scan_advanced_output = attributes.AttributeEnum(attributes.AttributeViInt32, enums.ScanAdvancedOutput, 1250023)
+    '''Type: enums.ScanAdvancedOutput
+
+    This property specifies the method you want to use to notify another  instrument that all signals going through the switch device have settled  following the processing of one entry in the scan list.
+    '''
+    scan_advanced_polarity = attributes.AttributeEnum(attributes.AttributeViInt32, enums.ScanAdvancedPolarity, 1150011)
+    scan_delay = attributes.AttributeViReal64TimeDeltaSeconds(1250025)
+    '''Type: float
+
+    This property specifies the minimum amount of time the switch device  waits before it asserts the scan advanced output trigger after opening or  closing the switch.  The switch device always waits for debounce before  asserting the trigger. The units are seconds.
+    the greater value of the settling time and the value you specify as the  scan delay.
+
+    Note: NI PXI-2501/2503/2565/2590/2591 Users--the actual delay will always be
+    '''
+    scan_list = attributes.AttributeViString(1250020)
+    '''Type: str
+
+    This property contains a scan list, which is a string that specifies  channel connections and trigger conditions.  The _initiate_scan  method makes or breaks connections and waits for triggers according to  the instructions in the scan list.
+    The scan list is comprised of channel names that you separate with  special characters.  These special characters determine the operations the  scanner performs on the channels when it executes this scan list.
+    To create a path between two channels, use the following character between  the two channel names:
+    -> (a dash followed by a '>' sign)
+    Example:  'CH1->CH2' tells the switch to make a path from channel CH1 to channel  CH2.
+    To break or clear a path, use the following character as a prefix before  the path:
+    ~ (tilde)
+    Example:  '~CH1->CH2' tells the switch to break the path from channel CH1 to  channel CH2.
+    To tell the switch device to wait for a trigger event, use the following  character as a separator between paths:
+    ; (semi-colon)
+    Example:  'CH1->CH2;CH3->CH4' tells the switch to make the path from channel CH1  to channel CH2, wait for a trigger, and then make the path from CH3 to  CH4.
+    '''
+    scan_mode = attributes.AttributeEnum(attributes.AttributeViInt32, enums.ScanMode, 1250021)
+    '''Type: enums.ScanMode
+
+    This property specifies what happens to existing connections that  conflict with the connections you make in a scan list.  For example, if  CH1 is already connected to CH2 and the scan list instructs the switch  device to connect CH1 to CH3, this property specifies what happens to the  connection between CH1 and CH2.
+    If the value of this property is ScanMode.NONE, the switch device  takes no action on existing paths.  If the value is  ScanMode.BREAK_BEFORE_MAKE, the switch device breaks conflicting paths  before making new ones.  If the value is ScanMode.BREAK_AFTER_MAKE,  the switch device breaks conflicting paths after making new ones.
+    Most switch devices support only one of the possible values.  In such  cases, this property serves as an indicator of the device's behavior.
+
+    Note:
+    One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or represent True/False, have been removed.
+    '''
+    serial_number = attributes.AttributeViString(1150015)
+    '''Type: str
+
+    This read-only property returns the serial number for the switch device  controlled by this instrument driver.  If the device does not return a  serial number, the driver returns the IVI_ERROR_ATTRIBUTE_NOT_SUPPORTED error.
+    '''
+    settling_time = attributes.AttributeViReal64TimeDeltaSeconds(1250004)
+    '''Type: float
+
+    This channel-based property returns the maximum length of time from after  you make a connection until the signal flowing through the channel  settles. The units are seconds.
+    the greater value of the settling time and the value you specify as the  scan delay.
+
+    Note: NI PXI-2501/2503/2565/2590/2591 Users--the actual delay will always be
+
+    Tip:
+    This property can use repeated capabilities (usually channels). If set or get directly on the
+    settling_time.Session object, then the set/get will use all repeated capabilities in the session.
+    You can specify a subset of repeated capabilities using the Python index notation on an
+    settling_time.Session instance, and calling set/get value on the result.:
+
+        session.channels['0,1'].settling_time = var
+        var = session.channels['0,1'].settling_time
+    '''
+    simulate = attributes.AttributeViBoolean(1050005)
+    '''Type: bool
+
+    Specifies whether or not to simulate instrument driver I/O operations.  If  simulation is enabled, instrument driver methods perform range checking  and call Ivi_GetAttribute and Ivi_SetAttribute methods, but they do not  perform instrument I/O.  For output parameters that represent instrument  data, the instrument driver methods return calculated values.
+    The default value is False.   Use the InitWithOptions  method to override this value.
+
+    Note:
+    One or more of the referenced methods are not in the Python API for this driver.
+    '''
+    specific_driver_class_spec_major_version = attributes.AttributeViInt32(1050515)
+    '''Type: int
+
+    The major version number of the IviSwtch class specification.
+    '''
+    specific_driver_class_spec_minor_version = attributes.AttributeViInt32(1050516)
+    '''Type: int
+
+    The minor version number of the class specification with which this driver is compliant.
+    '''
+    specific_driver_description = attributes.AttributeViString(1050514)
+    '''Type: str
+
+    A string that contains a brief description of the specific  driver.
+    '''
+    specific_driver_revision = attributes.AttributeViString(1050551)
+    '''Type: str
+
+    A string that contains additional version information about this  instrument driver.
+    '''
+    specific_driver_vendor = attributes.AttributeViString(1050513)
+    '''Type: str
+
+    A string that contains the name of the vendor that supplies this driver.
+    '''
+    supported_instrument_models = attributes.AttributeViString(1050327)
+    '''Type: str
+
+    Contains a comma-separated list of supported instrument models.
+    '''
+    temperature = attributes.AttributeViReal64(1150019, cacheable=False)
+    '''Type: float
+
+    This property returns the temperature as read by the Switch module.     The units are degrees Celsius.
+    '''
+    trigger_input = attributes.AttributeEnum(attributes.AttributeViInt32, enums.TriggerInput, 1250022)
+    '''Type: enums.TriggerInput
+
+    This property specifies the source of the trigger for which the switch  device can wait when processing a scan list.  The switch device waits for  a trigger when it encounters a semi-colon in a scan list.  When the trigger  occurs, the switch device advances to the next entry in the scan list.
+    '''
+    trigger_input_polarity = attributes.AttributeEnum(attributes.AttributeViInt32, enums.TriggerInputPolarity, 1150010)
+    '''Type: enums.TriggerInputPolarity
+
+    Determines the behavior of the trigger Input.
+    '''
+    trigger_mode = attributes.AttributeViInt32(1150005)
+    '''Type: int
+
+    This property has been deprecated and may be removed from a future release of  NI-SWITCH.  Use the route_trigger_input and/or route_scan_advanced_output  methods instead.
+    '''
+    wire_mode = attributes.AttributeViInt32(1250017)
+    '''Type: int
+
+    This property returns the wire mode of the switch device.
+    This property affects the values of the num_of_rows and  num_of_columns properties.   The actual number of input and  output lines on the switch device is fixed, but the number of channels  depends on how many lines constitute each channel.
+
+    Tip:
+    This property can use repeated capabilities (usually channels). If set or get directly on the
+    wire_mode.Session object, then the set/get will use all repeated capabilities in the session.
+    You can specify a subset of repeated capabilities using the Python index notation on an
+    wire_mode.Session instance, and calling set/get value on the result.:
+
+        session.channels['0,1'].wire_mode = var
+        var = session.channels['0,1'].wire_mode
+    '''
+
+    def __init__(self, repeated_capability, vi, library, encoding, attribute_cache, error_descriptions, warning_filter, pending_descriptions, freeze_it=False):
+        self._repeated_capability = repeated_capability
+        self._vi = vi
+        self._library = library
+        self._encoding = encoding
+        self._attribute_cache = attribute_cache
+        self._error_descriptions = error_descriptions
+        self._warning_filter = warning_filter
+        self._pending_descriptions = pending_descriptions
+        # Encoded once and passed to every driver call that takes the repeated capability. The driver does not modify it.
+        self._repeated_capability_ctype = None if encoding is None else ctypes.create_string_buffer(repeated_capability.encode(encoding))
+        # Created on first use, see _get_channel_name_ctypes
+        self._channel_name_ctypes = None
+        # Results of methods that only depend on the repeated capability, see the memoized_method template
+        self._memoized_results = {}
+
+        # Store the parameter list for later printing in __repr__
+        self._param_list = "repeated_capability=" + pp.pformat(repeated_capability)
+
+        self._is_frozen = freeze_it
+
+    def __repr__(self):
+        return '{0}.{1}({2})'.format('niswitch', self.__class__.__name__, self._param_list)
+
+    def _with_repeated_capability(self, repeated_capability):
+        '''Returns a _SessionBase for repeated_capability that shares the handle, library and per-session state of this session'''
+        return _SessionBase(vi=self._vi, repeated_capability=repeated_capability, library=self._library, encoding=self._encoding, attribute_cache=self._attribute_cache, error_descriptions=self._error_descriptions, warning_filter=self._warning_filter, pending_descriptions=self._pending_descriptions, freeze_it=True)
+
+    def _session_wide(self):
+        '''Returns a _SessionBase without a repeated capability, for properties and methods that are not channel based'''
+        return self._with_repeated_capability('')
+
+    def __setattr__(self, key, value):
+        if self._is_frozen and key not in self._settable_names and key not in dir(self):
+            raise AttributeError("'{0}' object has no attribute '{1}'".format(type(self).__name__, key))
+        object.__setattr__(self, key, value)
+
+    def _get_error_description(self, error_code):
+        '''_get_error_description
+
+        Returns the error description.
+
+        Descriptions of warnings are kept per session, so a warning returned over and over by the driver
+        (i.e. a coercion warning on every fetch) only costs calls into the driver the first time.
+        '''
+        if errors._is_warning(error_code):
+            return self._error_descriptions.get(error_code, lambda: self._read_error_description(error_code))
+        return self._read_error_description(error_code)
+
+    def _read_error_description(self, error_code):
+        # The description is retrieved after the call that failed, so the last error of the session may
+        # be a different one. Only use it when the codes match.
+        try:
+            last_error_code, error_string = self._get_error()
+            if last_error_code == error_code:
+                return error_string
+        except errors.Error:
+            pass
+
+        try:
+            '''
+            It is expected for _get_error to raise when the session is invalid
+            (IVI spec requires GetError to fail).
+            Use _error_message instead. It doesn't require a session.
+            '''
+            error_string = self._error_message(error_code)
+            return error_string
+        except errors.Error:
+            return "Failed to retrieve error description."
+
+    def _find_attributes(self, names):
+        '''Returns (name, descriptor) pairs for the given property names
+
+        Raises a single AttributeError that lists every name that is not a property.
+        '''
+        found = []
+        unknown = []
+        for name in names:
+            attribute = _SessionBase.__dict__.get(name)
+            if isinstance(attribute, (attributes.Attribute, attributes.AttributeEnum)):
+                found.append((name, attribute))
+            else:
+                unknown.append(name)
+        if unknown:
+            raise AttributeError("'{0}' object has no attribute {1}".format(type(self).__name__, ', '.join(repr(n) for n in unknown)))
+        return found
+
+    def _get_channel_name_ctypes(self):
+        '''Returns (channel name, encoded channel name) pairs for the comma-separated items of the repeated capability'''
+        if self._channel_name_ctypes is None:
+            channel_names = [c.strip() for c in self._repeated_capability.split(',')]
+            self._channel_name_ctypes = [(c, ctypes.create_string_buffer(c.encode(self._encoding))) for c in channel_names]
+        return self._channel_name_ctypes
+
+    def _get_set_attribute_call(self, attribute, value):
+        '''Converts value for attribute and returns the SetAttribute function to call and the value ctype'''
+        value = attribute._to_driver(value)
+        if attribute._vi_type == 'ViString':
+            return self._library.niSwitch_SetAttributeViString, ctypes.create_string_buffer(value.encode(self._encoding))
+        set_attribute_name, value_type = {
+            'ViBoolean': ('niSwitch_SetAttributeViBoolean', visatype.ViBoolean),
+            'ViInt32': ('niSwitch_SetAttributeViInt32', visatype.ViInt32),
+            'ViReal64': ('niSwitch_SetAttributeViReal64', visatype.ViReal64),
+        }[attribute._vi_type]
+        return getattr(self._library, set_attribute_name), value_type(value)
+
+    def _get_attribute_getter(self, vi_type, channel_name_ctype):
+        '''Returns getter(attribute_id) that reads an attribute of API type vi_type for channel_name_ctype from the driver'''
+        vi_ctype = visatype.ViSession(self._vi)
+        if vi_type == 'ViString':
+            def getter(attribute_id):
+                attribute_id_ctype = visatype.ViAttr(attribute_id)
+                error_code = self._library.niSwitch_GetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, visatype.ViInt32(), None)
+                errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=False)
+                buffer_size_ctype = visatype.ViInt32(error_code)
+                attribute_value_ctype = (visatype.ViChar * buffer_size_ctype.value)()
+                error_code = self._library.niSwitch_GetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, buffer_size_ctype, attribute_value_ctype)
+                errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+                return attribute_value_ctype.value.decode(self._encoding)
+            return getter
+
+        get_attribute_name, value_type, python_type = {
+            'ViBoolean': ('niSwitch_GetAttributeViBoolean', visatype.ViBoolean, bool),
+            'ViInt32': ('niSwitch_GetAttributeViInt32', visatype.ViInt32, int),
+            'ViReal64': ('niSwitch_GetAttributeViReal64', visatype.ViReal64, float),
+        }[vi_type]
+        get_attribute = getattr(self._library, get_attribute_name)
+        # One value buffer for all the calls made with this getter
+        value_ctype = value_type()
+
+        def getter(attribute_id):
+            error_code = get_attribute(vi_ctype, channel_name_ctype, visatype.ViAttr(attribute_id), ctypes.pointer(value_ctype))
+            errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+            return python_type(value_ctype.value)
+        return getter
+
+    def _set_attributes(self, channel_name_ctype, calls):
+        '''Makes the (SetAttribute function, attribute ID, value ctype) calls, stopping at the first error'''
+        vi_ctype = visatype.ViSession(self._vi)
+        try:
+            for set_attribute, attribute_id, value_ctype in calls:
+                error_code = set_attribute(vi_ctype, channel_name_ctype, visatype.ViAttr(attribute_id), value_ctype)
+                errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        finally:
+            self._attribute_cache.clear()
+
+    def configure(self, ordered_properties=(), **properties):
+        '''configure
+
+        Sets several properties with one call, i.e.
+
+            session.configure(scan_list='c0->r0;', continuous_scan=True)
+
+        Like properties, it can be called on a repeated capability to set the properties for those channels only.
+
+        Every name and value is checked and converted before anything is sent to the driver, so an
+        unknown name or a value of the wrong type leaves the device untouched. The properties are then
+        set without the per-property overhead of setting them one at a time. If the driver returns an
+        error, the properties after the failing one are not set.
+
+        The valid values of some properties depend on others, so the order can matter. Properties in
+        ordered_properties are set in the order given, before the keyword arguments, i.e.
+
+            session.configure([('scan_list', 'c0->r0;'), ('continuous_scan', True)])
+
+        The order of keyword arguments is only kept by Python 3.6 and later.
+
+        Args:
+            ordered_properties (list of (str, value) tuples or collections.OrderedDict): Property names and the values to set them to, in the order to set them.
+
+            properties: Property names and the values to set them to.
+        '''
+        if hasattr(ordered_properties, 'items'):
+            ordered_properties = ordered_properties.items()
+        name_values = list(ordered_properties) + list(properties.items())
+        calls = []
+        invalid = []
+        found = self._find_attributes([name for name, _ in name_values])
+        for (name, attribute), (_, value) in zip(found, name_values):
+            try:
+                set_attribute, value_ctype = self._get_set_attribute_call(attribute, value)
+            except (AttributeError, TypeError, ValueError) as e:
+                invalid.append('{0}: {1}'.format(name, e))
+                continue
+            calls.append((set_attribute, attribute._attribute_id, value_ctype))
+        if invalid:
+            raise TypeError('Invalid property values: ' + '; '.join(invalid))
+        self._set_attributes(self._repeated_capability_ctype, calls)
+
+    def read_attributes(self, names):
+        '''read_attributes
+
+        Reads several properties with one call and returns a dict that maps each name to its value, i.e.
+
+            values = session.read_attributes(['scan_list', 'continuous_scan'])
+
+        Every name is checked before anything is read from the driver. Values are returned from the
+        attribute cache when it is enabled, see attribute_cache_enabled.
+
+        Args:
+            names (list of str): Names of the properties to read.
+
+        Returns:
+            values (dict): Property values, keyed by name, in the order of names.
+        '''
+        values = collections.OrderedDict()
+        for name, attribute in self._find_attributes(names):
+            getter = self._get_attribute_getter(attribute._vi_type, self._repeated_capability_ctype)
+            if attribute._cacheable:
+                value = self._attribute_cache.get(self._repeated_capability, attribute._attribute_id, getter)
+            else:
+                value = getter(attribute._attribute_id)
+            values[name] = attribute._from_driver(value)
+        return values
+
+    def get(self, name):
+        '''get
+
+        Reads a property for each channel of the repeated capability and returns a numpy.ndarray with one value per channel, i.e.
+
+            values = session.channels[0:64].get('scan_list')
+
+        The channels are the comma-separated items of the repeated capability, in order. A range such as '0-63'
+        is a single item. Boolean, integer and floating-point properties are returned in an array of the matching
+        dtype, other properties (i.e. enums, strings and timedeltas) in an array of objects.
+
+        Values are returned from the attribute cache when it is enabled, see attribute_cache_enabled.
+
+        Requires numpy.
+
+        Args:
+            name (str): Name of the property to read.
+
+        Returns:
+            values (numpy.ndarray): Property value for each channel.
+        '''
+        import numpy
+        [(_, attribute)] = self._find_attributes([name])
+        channel_name_ctypes = self._get_channel_name_ctypes()
+        values = numpy.empty(len(channel_name_ctypes), dtype=attribute._numpy_type or object)
+        for i, (channel_name, channel_name_ctype) in enumerate(channel_name_ctypes):
+            getter = self._get_attribute_getter(attribute._vi_type, channel_name_ctype)
+            if attribute._cacheable:
+                value = self._attribute_cache.get(channel_name, attribute._attribute_id, getter)
+            else:
+                value = getter(attribute._attribute_id)
+            values[i] = attribute._from_driver(value)
+        return values
+
+    def set(self, name, values):
+        '''set
+
+        Sets a property to a different value for each channel of the repeated capability, i.e.
+
+            session.channels[0:64].set('scan_list', values)
+
+        The channels are the comma-separated items of the repeated capability, in order. A range such as '0-63'
+        is a single item. values can be a numpy.ndarray, an array.array or any other sequence with one value per channel.
+
+        Every value is checked and converted before anything is sent to the driver. If the driver returns an
+        error, the channels after the failing one are not set.
+
+        Args:
+            name (str): Name of the property to set.
+
+            values: Property value for each channel.
+        '''
+        [(_, attribute)] = self._find_attributes([name])
+        channel_name_ctypes = self._get_channel_name_ctypes()
+        # numpy.ndarray and array.array convert their items to Python values, which ctypes accepts
+        values = values.tolist() if hasattr(values, 'tolist') else list(values)
+        if len(values) != len(channel_name_ctypes):
+            raise ValueError('{0} values given for {1} channels'.format(len(values), len(channel_name_ctypes)))
+
+        calls = []
+        invalid = []
+        for (channel_name, channel_name_ctype), value in zip(channel_name_ctypes, values):
+            try:
+                calls.append((channel_name_ctype, self._get_set_attribute_call(attribute, value)))
+            except (AttributeError, TypeError, ValueError) as e:
+                invalid.append('{0}: {1}'.format(channel_name, e))
+        if invalid:
+            raise TypeError('Invalid values for {0}: {1}'.format(name, '; '.join(invalid)))
+
+        for channel_name_ctype, (set_attribute, value_ctype) in calls:
+            self._set_attributes(channel_name_ctype, [(set_attribute, attribute._attribute_id, value_ctype)])
+
+    ''' These are code-generated '''
+
+    def _get_attribute_vi_boolean(self, attribute_id):
+        '''_get_attribute_vi_boolean
+
+        This method queries the value of a ViBoolean property. You can use
+        this method to get the values of instrument specific properties and
+        inherent IVI properties. If the property represents an instrument
+        state, this method performs instrument I/O in the following cases: -
+        State caching is disabled for the entire session or for the particular
+        property. - State caching is enabled and the currently cached value is
+        invalid.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        niswitch.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        niswitch.Session instance, and calling this method on the result.:
+
+            session.channels['0,1']._get_attribute_vi_boolean(attribute_id)
+
+        Args:
+            attribute_id (int): Pass the ID of an property. From the method panel window, you can use
+                this control as follows. - Click on the control or press , , or , to
+                display a dialog box containing a hierarchical list of the available
+                properties. Properties whose value cannot be set are dim. Help text is
+                shown for each property. Select an property by double-clicking on it
+                or by selecting it and then pressing . A ring control at the top of the
+                dialog box allows you to see all IVI properties or only the properties
+                of the ViInt32 type. If you choose to see all IVI properties, the data
+                types appear to the right of the property names in the list box. The
+                data types that are not consistent with this method are dim. If you
+                select an property data type that is dim, LabWindows/CVI transfers you
+                to the method panel for the corresponding method that is consistent
+                with the data type. - If you want to enter a variable name, press to
+                change this ring control to a manual input box. - If the property in
+                this ring control has constants as valid values, you can view the
+                constants by moving to the Property Value control and pressing .
+
+
+        Returns:
+            attribute_value (bool): Returns the current value of the property. Pass the address of a
+                ViBoolean variable. From the method panel window, you can use this
+                control as follows. - If the property currently showing in the
+                Property ID ring control has constants as valid values, you can view a
+                list of the constants by pressing on this control. Select a value by
+                double-clicking on it or by selecting it and then pressing .
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
+        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
+        attribute_value_ctype = visatype.ViBoolean()  # case S200
+        error_code = self._library.niSwitch_GetAttributeViBoolean(vi_ctype, channel_name_ctype, attribute_id_ctype, None if attribute_value_ctype is None else (ctypes.pointer(attribute_value_ctype)))
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return bool(attribute_value_ctype.value)
+
+    def _get_attribute_vi_int32(self, attribute_id):
+        '''_get_attribute_vi_int32
+
+        This method queries the value of a ViInt32 property. You can use this
+        method to get the values of instrument specific properties and
+        inherent IVI properties. If the property represents an instrument
+        state, this method performs instrument I/O in the following cases: -
+        State caching is disabled for the entire session or for the particular
+        property. - State caching is enabled and the currently cached value is
+        invalid.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        niswitch.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        niswitch.Session instance, and calling this method on the result.:
+
+            session.channels['0,1']._get_attribute_vi_int32(attribute_id)
+
+        Args:
+            attribute_id (int): Pass the ID of an property. From the method panel window, you can use
+                this control as follows. - Click on the control or press , , or , to
+                display a dialog box containing a hierarchical list of the available
+                properties. Properties whose value cannot be set are dim. Help text is
+                shown for each property. Select an property by double-clicking on it
+                or by selecting it and then pressing . A ring control at the top of the
+                dialog box allows you to see all IVI properties or only the properties
+                of the ViInt32 type. If you choose to see all IVI properties, the data
+                types appear to the right of the property names in the list box. The
+                data types that are not consistent with this method are dim. If you
+                select an property data type that is dim, LabWindows/CVI transfers you
+                to the method panel for the corresponding method that is consistent
+                with the data type. - If you want to enter a variable name, press to
+                change this ring control to a manual input box. - If the property in
+                this ring control has constants as valid values, you can view the
+                constants by moving to the Property Value control and pressing .
+
+
+        Returns:
+            attribute_value (int): Returns the current value of the property. Pass the address of a
+                ViInt32 variable. From the method panel window, you can use this
+                control as follows. - If the property currently showing in the
+                Property ID ring control has constants as valid values, you can view a
+                list of the constants by pressing on this control. Select a value by
+                double-clicking on it or by selecting it and then pressing .
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
+        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
+        attribute_value_ctype = visatype.ViInt32()  # case S200
+        error_code = self._library.niSwitch_GetAttributeViInt32(vi_ctype, channel_name_ctype, attribute_id_ctype, None if attribute_value_ctype is None else (ctypes.pointer(attribute_value_ctype)))
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return int(attribute_value_ctype.value)
+
+    def _get_attribute_vi_real64(self, attribute_id):
+        '''_get_attribute_vi_real64
+
+        This method queries the value of a ViReal64 property. You can use
+        this method to get the values of instrument specific properties and
+        inherent IVI properties. If the property represents an instrument
+        state, this method performs instrument I/O in the following cases: -
+        State caching is disabled for the entire session or for the particular
+        property. - State caching is enabled and the currently cached value is
+        invalid.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        niswitch.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        niswitch.Session instance, and calling this method on the result.:
+
+            session.channels['0,1']._get_attribute_vi_real64(attribute_id)
+
+        Args:
+            attribute_id (int): Pass the ID of an property. From the method panel window, you can use
+                this control as follows. - Click on the control or press , , or , to
+                display a dialog box containing a hierarchical list of the available
+                properties. Properties whose value cannot be set are dim. Help text is
+                shown for each property. Select an property by double-clicking on it
+                or by selecting it and then pressing . A ring control at the top of the
+                dialog box allows you to see all IVI properties or only the properties
+                of the ViInt32 type. If you choose to see all IVI properties, the data
+                types appear to the right of the property names in the list box. The
+                data types that are not consistent with this method are dim. If you
+                select an property data type that is dim, LabWindows/CVI transfers you
+                to the method panel for the corresponding method that is consistent
+                with the data type. - If you want to enter a variable name, press to
+                change this ring control to a manual input box. - If the property in
+                this ring control has constants as valid values, you can view the
+                constants by moving to the Property Value control and pressing .
+
+
+        Returns:
+            attribute_value (float): Returns the current value of the property. Pass the address of a
+                ViReal64 variable. From the method panel window, you can use this
+                control as follows. - If the property currently showing in the
+                Property ID ring control has constants as valid values, you can view a
+                list of the constants by pressing on this control. Select a value by
+                double-clicking on it or by selecting it and then pressing .
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
+        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
+        attribute_value_ctype = visatype.ViReal64()  # case S200
+        error_code = self._library.niSwitch_GetAttributeViReal64(vi_ctype, channel_name_ctype, attribute_id_ctype, None if attribute_value_ctype is None else (ctypes.pointer(attribute_value_ctype)))
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return float(attribute_value_ctype.value)
+
+    def _get_attribute_vi_string(self, attribute_id):
+        '''_get_attribute_vi_string
+
+        This method queries the value of a ViString property. You can use
+        this method to get the values of instrument specific properties and
+        inherent IVI properties. If the property represents an instrument
+        state, this method performs instrument I/O in the following cases: -
+        State caching is disabled for the entire session or for the particular
+        property. - State caching is enabled and the currently cached value is
+        invalid. You must provide a ViChar array to serve as a buffer for the
+        value. You pass the number of bytes in the buffer as the Array Size
+        parameter. If the current value of the property, including the
+        terminating NULL byte, is larger than the size you indicate in the Array
+        Size parameter, the method copies Array Size-1 bytes into the buffer,
+        places an ASCII NULL byte at the end of the buffer, and returns the
+        array size you must pass to get the entire value. For example, if the
+        value is "123456" and the Array Size is 4, the method places "123"
+        into the buffer and returns 7. If you want to call this method just to
+        get the required array size, you can pass 0 for the Array Size and
+        VI_NULL for the Property Value buffer. If you want the method to
+        fill in the buffer regardless of the number of bytes in the value, pass
+        a negative number for the Array Size parameter.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        niswitch.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        niswitch.Session instance, and calling this method on the result.:
+
+            session.channels['0,1']._get_attribute_vi_string(attribute_id)
+
+        Args:
+            attribute_id (int): Pass the ID of an property. From the method panel window, you can use
+                this control as follows. - Click on the control or press , , or , to
+                display a dialog box containing a hierarchical list of the available
+                properties. Properties whose value cannot be set are dim. Help text is
+                shown for each property. Select an property by double-clicking on it
+                or by selecting it and then pressing . A ring control at the top of the
+                dialog box allows you to see all IVI properties or only the properties
+                of the ViInt32 type. If you choose to see all IVI properties, the data
+                types appear to the right of the property names in the list box. The
+                data types that are not consistent with this method are dim. If you
+                select an property data type that is dim, LabWindows/CVI transfers you
+                to the method panel for the corresponding method that is consistent
+                with the data type. - If you want to enter a variable name, press to
+                change this ring control to a manual input box. - If the property in
+                this ring control has constants as valid values, you can view the
+                constants by moving to the Property Value control and pressing .
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
+        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
+        array_size_ctype = visatype.ViInt32()  # case S170
+        attribute_value_ctype = None  # case C050
+        error_code = self._library.niSwitch_GetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, array_size_ctype, attribute_value_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=False)
+        array_size_ctype = visatype.ViInt32(error_code)  # case S180
+        attribute_value_ctype = (visatype.ViChar * array_size_ctype.value)()  # case C060
+        error_code = self._library.niSwitch_GetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, array_size_ctype, attribute_value_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return attribute_value_ctype.value.decode(self._encoding)
+
+    def _get_error(self):
+        '''_get_error
+
+        This method retrieves and then clears the IVI error information for
+        the session or the current execution thread. One exception exists: If
+        the buffer_size parameter is 0, the method does not clear the error
+        information. By passing 0 for the buffer size, the caller can ascertain
+        the buffer size required to get the entire error description string and
+        then call the method again with a sufficiently large buffer. If the
+        user specifies a valid IVI session for the InstrumentHandle parameter,
+        Get Error retrieves and then clears the error information for the
+        session. If the user passes VI_NULL for the InstrumentHandle parameter,
+        this method retrieves and then clears the error information for the
+        current execution thread. If the InstrumentHandle parameter is an
+        invalid session, the method does nothing and returns an error.
+        Normally, the error information describes the first error that occurred
+        since the user last called _get_error or ClearError.
+
+        Note:
+        One or more of the referenced methods are not in the Python API for this driver.
+
+        Returns:
+            code (int): Returns the error code for the session or execution thread. If you pass
+                0 for the Buffer Size, you can pass VI_NULL for this parameter.
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        code_ctype = visatype.ViStatus()  # case S200
+        buffer_size_ctype = visatype.ViInt32()  # case S170
+        description_ctype = None  # case C050
+        error_code = self._library.niSwitch_GetError(vi_ctype, None if code_ctype is None else (ctypes.pointer(code_ctype)), buffer_size_ctype, description_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=True)
+        buffer_size_ctype = visatype.ViInt32(error_code)  # case S180
+        description_ctype = (visatype.ViChar * buffer_size_ctype.value)()  # case C060
+        error_code = self._library.niSwitch_GetError(vi_ctype, None if code_ctype is None else (ctypes.pointer(code_ctype)), buffer_size_ctype, description_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=True)
+        return int(code_ctype.value), description_ctype.value.decode(self._encoding)
+
+    def _set_attribute_vi_boolean(self, attribute_id, attribute_value):
+        '''_set_attribute_vi_boolean
+
+        This method sets the value of a ViBoolean property. This is a
+        low-level method that you can use to set the values of
+        instrument-specific properties and inherent IVI properties. If the
+        property represents an instrument state, this method performs
+        instrument I/O in the following cases: - State caching is disabled for
+        the entire session or for the particular property. - State caching is
+        enabled and the currently cached value is invalid or is different than
+        the value you specify. This instrument driver contains high-level
+        methods that set most of the instrument properties. It is best to use
+        the high-level driver methods as much as possible. They handle order
+        dependencies and multithread locking for you. In addition, they perform
+        status checking only after setting all of the properties. In contrast,
+        when you set multiple properties using the SetAttribute methods, the
+        methods check the instrument status after each call. Also, when state
+        caching is enabled, the high-level methods that configure multiple
+        properties perform instrument I/O only for the properties whose value
+        you change. Thus, you can safely call the high-level methods without
+        the penalty of redundant instrument I/O.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        niswitch.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        niswitch.Session instance, and calling this method on the result.:
+
+            session.channels['0,1']._set_attribute_vi_boolean(attribute_id, attribute_value)
+
+        Args:
+            attribute_id (int): Pass the ID of an property. From the method panel window, you can use
+                this control as follows. - Click on the control or press , , or , to
+                display a dialog box containing a hierarchical list of the available
+                properties. Properties whose value cannot be set are dim. Help text is
+                shown for each property. Select an property by double-clicking on it
+                or by selecting it and then pressing . Read-only properties appear dim
+                in the list box. If you select a read-only property, an error message
+                appears. A ring control at the top of the dialog box allows you to see
+                all IVI properties or only the properties of the ViInt32 type. If you
+                choose to see all IVI properties, the data types appear to the right of
+                the property names in the list box. The data types that are not
+                consistent with this method are dim. If you select an property data
+                type that is dim, LabWindows/CVI transfers you to the method panel for
+                the corresponding method that is consistent with the data type. - If
+                you want to enter a variable name, press to change this ring control to
+                a manual input box. - If the property in this ring control has
+                constants as valid values, you can view the constants by moving to the
+                Property Value control and pressing .
+
+            attribute_value (bool): Pass the value to which you want to set the property. From the method
+                panel window, you can use this control as follows. - If the property
+                currently showing in the Property ID ring control has constants as
+                valid values, you can view a list of the constants by pressing on this
+                control. Select a value by double-clicking on it or by selecting it and
+                then pressing . Note: Some of the values might not be valid depending on
+                the current settings of the instrument session. Default Value: none
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
+        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
+        attribute_value_ctype = visatype.ViBoolean(attribute_value)  # case S150
+        error_code = self._library.niSwitch_SetAttributeViBoolean(vi_ctype, channel_name_ctype, attribute_id_ctype, attribute_value_ctype)
+        self._attribute_cache.clear()
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def _set_attribute_vi_int32(self, attribute_id, attribute_value):
+        '''_set_attribute_vi_int32
+
+        This method sets the value of a ViInt32 property. This is a low-level
+        method that you can use to set the values of instrument-specific
+        properties and inherent IVI properties. If the property represents an
+        instrument state, this method performs instrument I/O in the following
+        cases: - State caching is disabled for the entire session or for the
+        particular property. - State caching is enabled and the currently
+        cached value is invalid or is different than the value you specify. This
+        instrument driver contains high-level methods that set most of the
+        instrument properties. It is best to use the high-level driver methods
+        as much as possible. They handle order dependencies and multithread
+        locking for you. In addition, they perform status checking only after
+        setting all of the properties. In contrast, when you set multiple
+        properties using the SetAttribute methods, the methods check the
+        instrument status after each call. Also, when state caching is enabled,
+        the high-level methods that configure multiple properties perform
+        instrument I/O only for the properties whose value you change. Thus, you
+        can safely call the high-level methods without the penalty of
+        redundant instrument I/O.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        niswitch.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        niswitch.Session instance, and calling this method on the result.:
+
+            session.channels['0,1']._set_attribute_vi_int32(attribute_id, attribute_value)
+
+        Args:
+            attribute_id (int): Pass the ID of an property. From the method panel window, you can use
+                this control as follows. - Click on the control or press , , or , to
+                display a dialog box containing a hierarchical list of the available
+                properties. Properties whose value cannot be set are dim. Help text is
+                shown for each property. Select an property by double-clicking on it
+                or by selecting it and then pressing . Read-only properties appear dim
+                in the list box. If you select a read-only property, an error message
+                appears. A ring control at the top of the dialog box allows you to see
+                all IVI properties or only the properties of the ViInt32 type. If you
+                choose to see all IVI properties, the data types appear to the right of
+                the property names in the list box. The data types that are not
+                consistent with this method are dim. If you select an property data
+                type that is dim, LabWindows/CVI transfers you to the method panel for
+                the corresponding method that is consistent with the data type. - If
+                you want to enter a variable name, press to change this ring control to
+                a manual input box. - If the property in this ring control has
+                constants as valid values, you can view the constants by moving to the
+                Property Value control and pressing .
+
+            attribute_value (int): Pass the value to which you want to set the property. From the method
+                panel window, you can use this control as follows. - If the property
+                currently showing in the Property ID ring control has constants as
+                valid values, you can view a list of the constants by pressing on this
+                control. Select a value by double-clicking on it or by selecting it and
+                then pressing . Note: Some of the values might not be valid depending on
+                the current settings of the instrument session. Default Value: none
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
+        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
+        attribute_value_ctype = visatype.ViInt32(attribute_value)  # case S150
+        error_code = self._library.niSwitch_SetAttributeViInt32(vi_ctype, channel_name_ctype, attribute_id_ctype, attribute_value_ctype)
+        self._attribute_cache.clear()
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def _set_attribute_vi_real64(self, attribute_id, attribute_value):
+        '''_set_attribute_vi_real64
+
+        This method sets the value of a ViReal64 property. This is a
+        low-level method that you can use to set the values of
+        instrument-specific properties and inherent IVI properties. If the
+        property represents an instrument state, this method performs
+        instrument I/O in the following cases: - State caching is disabled for
+        the entire session or for the particular property. - State caching is
+        enabled and the currently cached value is invalid or is different than
+        the value you specify. This instrument driver contains high-level
+        methods that set most of the instrument properties. It is best to use
+        the high-level driver methods as much as possible. They handle order
+        dependencies and multithread locking for you. In addition, they perform
+        status checking only after setting all of the properties. In contrast,
+        when you set multiple properties using the SetAttribute methods, the
+        methods check the instrument status after each call. Also, when state
+        caching is enabled, the high-level methods that configure multiple
+        properties perform instrument I/O only for the properties whose value
+        you change. Thus, you can safely call the high-level methods without
+        the penalty of redundant instrument I/O.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        niswitch.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        niswitch.Session instance, and calling this method on the result.:
+
+            session.channels['0,1']._set_attribute_vi_real64(attribute_id, attribute_value)
+
+        Args:
+            attribute_id (int): Pass the ID of an property. From the method panel window, you can use
+                this control as follows. - Click on the control or press , , or , to
+                display a dialog box containing a hierarchical list of the available
+                properties. Properties whose value cannot be set are dim. Help text is
+                shown for each property. Select an property by double-clicking on it
+                or by selecting it and then pressing . Read-only properties appear dim
+                in the list box. If you select a read-only property, an error message
+                appears. A ring control at the top of the dialog box allows you to see
+                all IVI properties or only the properties of the ViInt32 type. If you
+                choose to see all IVI properties, the data types appear to the right of
+                the property names in the list box. The data types that are not
+                consistent with this method are dim. If you select an property data
+                type that is dim, LabWindows/CVI transfers you to the method panel for
+                the corresponding method that is consistent with the data type. - If
+                you want to enter a variable name, press to change this ring control to
+                a manual input box. - If the property in this ring control has
+                constants as valid values, you can view the constants by moving to the
+                Property Value control and pressing .
+
+            attribute_value (float): Pass the value to which you want to set the property. From the method
+                panel window, you can use this control as follows. - If the property
+                currently showing in the Property ID ring control has constants as
+                valid values, you can view a list of the constants by pressing on this
+                control. Select a value by double-clicking on it or by selecting it and
+                then pressing . Note: Some of the values might not be valid depending on
+                the current settings of the instrument session. Default Value: none
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
+        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
+        attribute_value_ctype = visatype.ViReal64(attribute_value)  # case S150
+        error_code = self._library.niSwitch_SetAttributeViReal64(vi_ctype, channel_name_ctype, attribute_id_ctype, attribute_value_ctype)
+        self._attribute_cache.clear()
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def _set_attribute_vi_string(self, attribute_id, attribute_value):
+        '''_set_attribute_vi_string
+
+        This method sets the value of a ViString property. This is a
+        low-level method that you can use to set the values of
+        instrument-specific properties and inherent IVI properties. If the
+        property represents an instrument state, this method performs
+        instrument I/O in the following cases: - State caching is disabled for
+        the entire session or for the particular property. - State caching is
+        enabled and the currently cached value is invalid or is different than
+        the value you specify. This instrument driver contains high-level
+        methods that set most of the instrument properties. It is best to use
+        the high-level driver methods as much as possible. They handle order
+        dependencies and multithread locking for you. In addition, they perform
+        status checking only after setting all of the properties. In contrast,
+        when you set multiple properties using the SetAttribute methods, the
+        methods check the instrument status after each call. Also, when state
+        caching is enabled, the high-level methods that configure multiple
+        properties perform instrument I/O only for the properties whose value
+        you change. Thus, you can safely call the high-level methods without
+        the penalty of redundant instrument I/O.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        niswitch.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        niswitch.Session instance, and calling this method on the result.:
+
+            session.channels['0,1']._set_attribute_vi_string(attribute_id, attribute_value)
+
+        Args:
+            attribute_id (int): Pass the ID of an property. From the method panel window, you can use
+                this control as follows. - Click on the control or press , , or , to
+                display a dialog box containing a hierarchical list of the available
+                properties. Properties whose value cannot be set are dim. Help text is
+                shown for each property. Select an property by double-clicking on it
+                or by selecting it and then pressing . Read-only properties appear dim
+                in the list box. If you select a read-only property, an error message
+                appears. A ring control at the top of the dialog box allows you to see
+                all IVI properties or only the properties of the ViInt32 type. If you
+                choose to see all IVI properties, the data types appear to the right of
+                the property names in the list box. The data types that are not
+                consistent with this method are dim. If you select an property data
+                type that is dim, LabWindows/CVI transfers you to the method panel for
+                the corresponding method that is consistent with the data type. - If
+                you want to enter a variable name, press to change this ring control to
+                a manual input box. - If the property in this ring control has
+                constants as valid values, you can view the constants by moving to the
+                Property Value control and pressing .
+
+            attribute_value (str): Pass the value to which you want to set the property. From the method
+                panel window, you can use this control as follows. - If the property
+                currently showing in the Property ID ring control has constants as
+                valid values, you can view a list of the constants by pressing on this
+                control. Select a value by double-clicking on it or by selecting it and
+                then pressing . Note: Some of the values might not be valid depending on
+                the current settings of the instrument session. Default Value: none
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
+        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
+        attribute_value_ctype = ctypes.create_string_buffer(attribute_value.encode(self._encoding))  # case C020
+        error_code = self._library.niSwitch_SetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, attribute_value_ctype)
+        self._attribute_cache.clear()
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def _error_message(self, error_code):
+        '''_error_message
+
+        Converts an error code returned by NI-SWITCH into a user-readable
+        string. Generally this information is supplied in error out of any
+        NI-SWITCH VI. Use _error_message for a static lookup of an
+        error code description.
+
+        Args:
+            error_code (int): Status code returned by any NI-SWITCH method. Default Value: 0
+                (VI_SUCCESS)
+
+
+        Returns:
+            error_message (str): The error information formatted into a string. You must pass a ViChar
+                array with at least 256 bytes.
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        error_code_ctype = visatype.ViStatus(error_code)  # case S150
+        error_message_ctype = (visatype.ViChar * 256)()  # case C070
+        error_code = self._library.niSwitch_error_message(vi_ctype, error_code_ctype, error_message_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=True)
+        return error_message_ctype.value.decode(self._encoding)
+
+
+class Session(_SessionBase):
+    '''An NI-SWITCH session to a National Instruments Switch Module
+
+    Thread safety:
+
+    A session can be used from several threads. This applies to every method and property. No Python lock is held while the driver runs, and the driver runs one call on a session at a time. A method called, or a property set or read, while another call on the same session is in progress, directly or through the executor property, waits for that call to complete. Calls on different sessions run in parallel.
+
+    Calls made through the executor property run on the worker thread of the session, one at a time and in the order they were submitted.
+
+    Sequences of calls that depend on each other, such as setting the fetch properties and then fetching, are not atomic. Make them from one thread, or submit them to the executor as one callable. Generators, pipelines and buffer pools returned by the session are used from one thread at a time. Do not call close() while other threads use the session.
+    '''
+
+    _settable_names = _SessionBase._settable_names | frozenset([
+        '_executor',
+        '_executor_lock',
+        'attribute_cache_enabled',
+        'warning_interval',
+        'warning_policy',
+        'channels',
+    ])
+
+    def __init__(self, resource_name, topology="Configured Topology", simulate=False, reset_device=False):
+        '''An NI-SWITCH session to a National Instruments Switch Module
+
+        Returns a session handle used to identify the switch in all subsequent
+        instrument driver calls and sets the topology of the switch.
+        _init_with_topology creates a new IVI instrument driver session
+        for the switch specified in the resourceName parameter. The driver uses
+        the topology specified in the topology parameter and overrides the
+        topology specified in MAX. Note: When initializing an NI SwitchBlock
+        device with topology, you must specify the toplogy created when you
+        configured the device in MAX, using either
+        NISWITCH_TOPOLOGY_CONFIGURED_TOPOLOGY or the toplogy string of the
+        device. Refer to the Initializing with Toplogy for NI SwitchBlock
+        Devices topic in the NI Switches Help for information about determining
+        the topology string of an NI SwitchBlock device. By default, the switch
+        is reset to a known state. Enable simulation by specifying the topology
+        and setting the simulate parameter to True.
+
+        Args:
+            resource_name (str): Resource name of the switch module to initialize. Default value: None
+                Syntax: Optional fields are shown in square brackets ([]). Configured in
+                MAX Under Valid Syntax Devices and Interfaces DeviceName Traditional
+                NI-DAQ Devices SCXI[chassis ID]::slot number PXI System PXI[bus
+                number]::device number TIP: IVI logical names are also valid for the
+                resource name. Default values for optional fields: chassis ID = 1 bus
+                number = 0 Example resource names: Resource Name Description SC1Mod3
+                NI-DAQmx module in chassis "SC1" slot 3 MySwitch NI-DAQmx module renamed
+                to "MySwitch" SCXI1::3 Traditional NI-DAQ module in chassis 1, slot 3
+                SCXI::3 Traditional NI-DAQ module in chassis 1, slot 3 PXI0::16 PXI bus
+                0, device number 16 PXI::16 PXI bus 0, device number 16
+
+            topology (str): Pass the topology name you want to use for the switch you specify with
+                Resource Name parameter. You can also pass
+                NISWITCH_TOPOLOGY_CONFIGURED_TOPOLOGY to use the last topology that
+                was configured for the device in MAX. Default Value:
+                NISWITCH_TOPOLOGY_CONFIGURED_TOPOLOGY Valid Values:
+                NISWITCH_TOPOLOGY_1127_1_WIRE_64X1_MUX
+                NISWITCH_TOPOLOGY_1127_2_WIRE_32X1_MUX
+                NISWITCH_TOPOLOGY_1127_2_WIRE_4X8_MATRIX
+                NISWITCH_TOPOLOGY_1127_4_WIRE_16X1_MUX
+                NISWITCH_TOPOLOGY_1127_INDEPENDENT
+                NISWITCH_TOPOLOGY_1128_1_WIRE_64X1_MUX
+                NISWITCH_TOPOLOGY_1128_2_WIRE_32X1_MUX
+                NISWITCH_TOPOLOGY_1128_2_WIRE_4X8_MATRIX
+                NISWITCH_TOPOLOGY_1128_4_WIRE_16X1_MUX
+                NISWITCH_TOPOLOGY_1128_INDEPENDENT
+                NISWITCH_TOPOLOGY_1129_2_WIRE_16X16_MATRIX
+                NISWITCH_TOPOLOGY_1129_2_WIRE_8X32_MATRIX
+                NISWITCH_TOPOLOGY_1129_2_WIRE_4X64_MATRIX
+                NISWITCH_TOPOLOGY_1129_2_WIRE_DUAL_8X16_MATRIX
+                NISWITCH_TOPOLOGY_1129_2_WIRE_DUAL_4X32_MATRIX
+                NISWITCH_TOPOLOGY_1129_2_WIRE_QUAD_4X16_MATRIX
+                NISWITCH_TOPOLOGY_1130_1_WIRE_256X1_MUX
+                NISWITCH_TOPOLOGY_1130_1_WIRE_DUAL_128X1_MUX
+                NISWITCH_TOPOLOGY_1130_1_WIRE_4X64_MATRIX
+                NISWITCH_TOPOLOGY_1130_1_WIRE_8x32_MATRIX
+                NISWITCH_TOPOLOGY_1130_1_WIRE_OCTAL_32X1_MUX
+                NISWITCH_TOPOLOGY_1130_1_WIRE_QUAD_64X1_MUX
+                NISWITCH_TOPOLOGY_1130_1_WIRE_SIXTEEN_16X1_MUX
+                NISWITCH_TOPOLOGY_1130_2_WIRE_4X32_MATRIX
+                NISWITCH_TOPOLOGY_1130_2_WIRE_128X1_MUX
+                NISWITCH_TOPOLOGY_1130_2_WIRE_OCTAL_16X1_MUX
+                NISWITCH_TOPOLOGY_1130_2_WIRE_QUAD_32X1_MUX
+                NISWITCH_TOPOLOGY_1130_4_WIRE_64X1_MUX
+                NISWITCH_TOPOLOGY_1130_4_WIRE_QUAD_16X1_MUX
+                NISWITCH_TOPOLOGY_1130_INDEPENDENT NISWITCH_TOPOLOGY_1160_16_SPDT
+                NISWITCH_TOPOLOGY_1161_8_SPDT
+                NISWITCH_TOPOLOGY_1163R_OCTAL_4X1_MUX
+                NISWITCH_TOPOLOGY_1166_16_DPDT NISWITCH_TOPOLOGY_1166_32_SPDT
+                NISWITCH_TOPOLOGY_1167_INDEPENDENT
+                NISWITCH_TOPOLOGY_1169_100_SPST NISWITCH_TOPOLOGY_1169_50_DPST
+                NISWITCH_TOPOLOGY_1175_1_WIRE_196X1_MUX
+                NISWITCH_TOPOLOGY_1175_2_WIRE_98X1_MUX
+                NISWITCH_TOPOLOGY_1175_2_WIRE_95X1_MUX
+                NISWITCH_TOPOLOGY_1190_QUAD_4X1_MUX
+                NISWITCH_TOPOLOGY_1191_QUAD_4X1_MUX
+                NISWITCH_TOPOLOGY_1192_8_SPDT NISWITCH_TOPOLOGY_1193_32X1_MUX
+                NISWITCH_TOPOLOGY_1193_16X1_TERMINATED_MUX
+                NISWITCH_TOPOLOGY_1193_DUAL_16X1_MUX
+                NISWITCH_TOPOLOGY_1193_DUAL_8X1_TERMINATED_MUX
+                NISWITCH_TOPOLOGY_1193_QUAD_8X1_MUX
+                NISWITCH_TOPOLOGY_1193_QUAD_4X1_TERMINATED_MUX
+                NISWITCH_TOPOLOGY_1193_INDEPENDENT
+                NISWITCH_TOPOLOGY_1194_QUAD_4X1_MUX
+                NISWITCH_TOPOLOGY_1195_QUAD_4X1_MUX
+                NISWITCH_TOPOLOGY_2501_1_WIRE_48X1_MUX
+                NISWITCH_TOPOLOGY_2501_1_WIRE_48X1_AMPLIFIED_MUX
+                NISWITCH_TOPOLOGY_2501_2_WIRE_24X1_MUX
+                NISWITCH_TOPOLOGY_2501_2_WIRE_24X1_AMPLIFIED_MUX
+                NISWITCH_TOPOLOGY_2501_2_WIRE_DUAL_12X1_MUX
+                NISWITCH_TOPOLOGY_2501_2_WIRE_QUAD_6X1_MUX
+                NISWITCH_TOPOLOGY_2501_2_WIRE_4X6_MATRIX
+                NISWITCH_TOPOLOGY_2501_4_WIRE_12X1_MUX
+                NISWITCH_TOPOLOGY_2503_1_WIRE_48X1_MUX
+                NISWITCH_TOPOLOGY_2503_2_WIRE_24X1_MUX
+                NISWITCH_TOPOLOGY_2503_2_WIRE_DUAL_12X1_MUX
+                NISWITCH_TOPOLOGY_2503_2_WIRE_QUAD_6X1_MUX
+                NISWITCH_TOPOLOGY_2503_2_WIRE_4X6_MATRIX
+                NISWITCH_TOPOLOGY_2503_4_WIRE_12X1_MUX
+                NISWITCH_TOPOLOGY_2510_INDEPENDENT
+                NISWITCH_TOPOLOGY_2512_INDEPENDENT
+                NISWITCH_TOPOLOGY_2514_INDEPENDENT
+                NISWITCH_TOPOLOGY_2515_INDEPENDENT NISWITCH_TOPOLOGY_2520_80_SPST
+                NISWITCH_TOPOLOGY_2521_40_DPST NISWITCH_TOPOLOGY_2522_53_SPDT
+                NISWITCH_TOPOLOGY_2523_26_DPDT
+                NISWITCH_TOPOLOGY_2524_1_WIRE_128X1_MUX
+                NISWITCH_TOPOLOGY_2524_1_WIRE_DUAL_64X1_MUX
+                NISWITCH_TOPOLOGY_2524_1_WIRE_QUAD_32X1_MUX
+                NISWITCH_TOPOLOGY_2524_1_WIRE_OCTAL_16X1_MUX
+                NISWITCH_TOPOLOGY_2524_1_WIRE_SIXTEEN_8X1_MUX
+                NISWITCH_TOPOLOGY_2525_2_WIRE_64X1_MUX
+                NISWITCH_TOPOLOGY_2525_2_WIRE_DUAL_32X1_MUX
+                NISWITCH_TOPOLOGY_2525_2_WIRE_QUAD_16X1_MUX
+                NISWITCH_TOPOLOGY_2525_2_WIRE_OCTAL_8X1_MUX
+                NISWITCH_TOPOLOGY_2525_2_WIRE_SIXTEEN_4X1_MUX
+                NISWITCH_TOPOLOGY_2526_1_WIRE_158X1_MUX
+                NISWITCH_TOPOLOGY_2526_2_WIRE_79X1_MUX
+                NISWITCH_TOPOLOGY_2527_1_WIRE_64X1_MUX
+                NISWITCH_TOPOLOGY_2527_1_WIRE_DUAL_32X1_MUX
+                NISWITCH_TOPOLOGY_2527_2_WIRE_32X1_MUX
+                NISWITCH_TOPOLOGY_2527_2_WIRE_DUAL_16X1_MUX
+                NISWITCH_TOPOLOGY_2527_4_WIRE_16X1_MUX
+                NISWITCH_TOPOLOGY_2527_INDEPENDENT
+                NISWITCH_TOPOLOGY_2529_2_WIRE_DUAL_4X16_MATRIX
+                NISWITCH_TOPOLOGY_2529_2_WIRE_8X16_MATRIX
+                NISWITCH_TOPOLOGY_2529_2_WIRE_4X32_MATRIX
+                NISWITCH_TOPOLOGY_2530_1_WIRE_128X1_MUX
+                NISWITCH_TOPOLOGY_2530_1_WIRE_DUAL_64X1_MUX
+                NISWITCH_TOPOLOGY_2530_1_WIRE_4x32_MATRIX
+                NISWITCH_TOPOLOGY_2530_1_WIRE_8x16_MATRIX
+                NISWITCH_TOPOLOGY_2530_1_WIRE_OCTAL_16X1_MUX
+                NISWITCH_TOPOLOGY_2530_1_WIRE_QUAD_32X1_MUX
+                NISWITCH_TOPOLOGY_2530_2_WIRE_4x16_MATRIX
+                NISWITCH_TOPOLOGY_2530_2_WIRE_64X1_MUX
+                NISWITCH_TOPOLOGY_2530_2_WIRE_DUAL_32X1_MUX
+                NISWITCH_TOPOLOGY_2530_2_WIRE_QUAD_16X1_MUX
+                NISWITCH_TOPOLOGY_2530_4_WIRE_32X1_MUX
+                NISWITCH_TOPOLOGY_2530_4_WIRE_DUAL_16X1_MUX
+                NISWITCH_TOPOLOGY_2530_INDEPENDENT
+                NISWITCH_TOPOLOGY_2531_1_WIRE_4X128_MATRIX
+                NISWITCH_TOPOLOGY_2531_1_WIRE_8X64_MATRIX
+                NISWITCH_TOPOLOGY_2531_1_WIRE_DUAL_4X64_MATRIX
+                NISWITCH_TOPOLOGY_2531_1_WIRE_DUAL_8X32_MATRIX
+                NISWITCH_TOPOLOGY_2531_2_WIRE_4X64_MATRIX
+                NISWITCH_TOPOLOGY_2531_2_WIRE_8X32_MATRIX
+                NISWITCH_TOPOLOGY_2532_1_WIRE_16X32_MATRIX
+                NISWITCH_TOPOLOGY_2532_1_WIRE_4X128_MATRIX
+                NISWITCH_TOPOLOGY_2532_1_WIRE_8X64_MATRIX
+                NISWITCH_TOPOLOGY_2532_1_WIRE_DUAL_16X16_MATRIX
+                NISWITCH_TOPOLOGY_2532_1_WIRE_DUAL_4X64_MATRIX
+                NISWITCH_TOPOLOGY_2532_1_WIRE_DUAL_8X32_MATRIX
+                NISWITCH_TOPOLOGY_2532_1_WIRE_SIXTEEN_2X16_MATRIX
+                NISWITCH_TOPOLOGY_2532_2_WIRE_16X16_MATRIX
+                NISWITCH_TOPOLOGY_2532_2_WIRE_4X64_MATRIX
+                NISWITCH_TOPOLOGY_2532_2_WIRE_8X32_MATRIX
+                NISWITCH_TOPOLOGY_2532_2_WIRE_DUAL_4X32_MATRIX
+                NISWITCH_TOPOLOGY_2533_1_WIRE_4X64_MATRIX
+                NISWITCH_TOPOLOGY_2534_1_WIRE_8X32_MATRIX
+                NISWITCH_TOPOLOGY_2535_1_WIRE_4X136_MATRIX
+                NISWITCH_TOPOLOGY_2536_1_WIRE_8X68_MATRIX
+                NISWITCH_TOPOLOGY_2540_1_WIRE_8X9_MATRIX
+                NISWITCH_TOPOLOGY_2541_1_WIRE_8X12_MATRIX
+                NISWITCH_TOPOLOGY_2542_QUAD_2X1_TERMINATED_MUX
+                NISWITCH_TOPOLOGY_2543_DUAL_4X1_TERMINATED_MUX
+                NISWITCH_TOPOLOGY_2544_8X1_TERMINATED_MUX
+                NISWITCH_TOPOLOGY_2545_4X1_TERMINATED_MUX
+                NISWITCH_TOPOLOGY_2546_DUAL_4X1_MUX
+                NISWITCH_TOPOLOGY_2547_8X1_MUX NISWITCH_TOPOLOGY_2548_4_SPDT
+                NISWITCH_TOPOLOGY_2549_TERMINATED_2_SPDT
+                NISWITCH_TOPOLOGY_2554_4X1_MUX
+                NISWITCH_TOPOLOGY_2555_4X1_TERMINATED_MUX
+                NISWITCH_TOPOLOGY_2556_DUAL_4X1_MUX
+                NISWITCH_TOPOLOGY_2557_8X1_MUX NISWITCH_TOPOLOGY_2558_4_SPDT
+                NISWITCH_TOPOLOGY_2559_TERMINATED_2_SPDT
+                NISWITCH_TOPOLOGY_2564_16_SPST NISWITCH_TOPOLOGY_2564_8_DPST
+                NISWITCH_TOPOLOGY_2565_16_SPST NISWITCH_TOPOLOGY_2566_16_SPDT
+                NISWITCH_TOPOLOGY_2566_8_DPDT NISWITCH_TOPOLOGY_2567_INDEPENDENT
+                NISWITCH_TOPOLOGY_2568_15_DPST NISWITCH_TOPOLOGY_2568_31_SPST
+                NISWITCH_TOPOLOGY_2569_100_SPST NISWITCH_TOPOLOGY_2569_50_DPST
+                NISWITCH_TOPOLOGY_2570_20_DPDT NISWITCH_TOPOLOGY_2570_40_SPDT
+                NISWITCH_TOPOLOGY_2571_66_SPDT
+                NISWITCH_TOPOLOGY_2575_1_WIRE_196X1_MUX
+                NISWITCH_TOPOLOGY_2575_2_WIRE_98X1_MUX
+                NISWITCH_TOPOLOGY_2575_2_WIRE_95X1_MUX
+                NISWITCH_TOPOLOGY_2576_2_WIRE_64X1_MUX
+                NISWITCH_TOPOLOGY_2576_2_WIRE_DUAL_32X1_MUX
+                NISWITCH_TOPOLOGY_2576_2_WIRE_OCTAL_8X1_MUX
+                NISWITCH_TOPOLOGY_2576_2_WIRE_QUAD_16X1_MUX
+                NISWITCH_TOPOLOGY_2576_2_WIRE_SIXTEEN_4X1_MUX
+                NISWITCH_TOPOLOGY_2576_INDEPENDENT
+                NISWITCH_TOPOLOGY_2584_1_WIRE_12X1_MUX
+                NISWITCH_TOPOLOGY_2584_1_WIRE_DUAL_6X1_MUX
+                NISWITCH_TOPOLOGY_2584_2_WIRE_6X1_MUX
+                NISWITCH_TOPOLOGY_2584_INDEPENDENT
+                NISWITCH_TOPOLOGY_2585_1_WIRE_10X1_MUX
+                NISWITCH_TOPOLOGY_2586_10_SPST NISWITCH_TOPOLOGY_2586_5_DPST
+                NISWITCH_TOPOLOGY_2590_4X1_MUX NISWITCH_TOPOLOGY_2591_4X1_MUX
+                NISWITCH_TOPOLOGY_2593_16X1_MUX
+                NISWITCH_TOPOLOGY_2593_8X1_TERMINATED_MUX
+                NISWITCH_TOPOLOGY_2593_DUAL_8X1_MUX
+                NISWITCH_TOPOLOGY_2593_DUAL_4X1_TERMINATED_MUX
+                NISWITCH_TOPOLOGY_2593_INDEPENDENT NISWITCH_TOPOLOGY_2594_4X1_MUX
+                NISWITCH_TOPOLOGY_2595_4X1_MUX
+                NISWITCH_TOPOLOGY_2596_DUAL_6X1_MUX
+                NISWITCH_TOPOLOGY_2597_6X1_TERMINATED_MUX
+                NISWITCH_TOPOLOGY_2598_DUAL_TRANSFER
+                NISWITCH_TOPOLOGY_2599_2_SPDT NISWITCH_TOPOLOGY_2720_INDEPENDENT
+                NISWITCH_TOPOLOGY_2722_INDEPENDENT
+                NISWITCH_TOPOLOGY_2725_INDEPENDENT
+                NISWITCH_TOPOLOGY_2727_INDEPENDENT
+                NISWITCH_TOPOLOGY_2737_2_WIRE_4X64_MATRIX
+                NISWITCH_TOPOLOGY_2738_2_WIRE_8X32_MATRIX
+                NISWITCH_TOPOLOGY_2739_2_WIRE_16X16_MATRIX
+                NISWITCH_TOPOLOGY_2746_QUAD_4X1_MUX
+                NISWITCH_TOPOLOGY_2747_DUAL_8X1_MUX
+                NISWITCH_TOPOLOGY_2748_16X1_MUX
+                NISWITCH_TOPOLOGY_2790_INDEPENDENT
+                NISWITCH_TOPOLOGY_2796_DUAL_6X1_MUX
+                NISWITCH_TOPOLOGY_2797_6X1_TERMINATED_MUX
+                NISWITCH_TOPOLOGY_2798_DUAL_TRANSFER
+                NISWITCH_TOPOLOGY_2799_2_SPDT
+
+            simulate (bool): Enables simulation of the switch module specified in the resource name
+                parameter. Valid Values: True - simulate False - Don't simulate
+                (Default Value)
+
+            reset_device (bool): Specifies whether to reset the switch module during the initialization
+                process. Valid Values: True - Reset Device (Default Value) False
+                - Currently unsupported. The device will not reset.
+
+
+        Returns:
+            session (niswitch.Session): A session object representing the device.
+
+        '''
+        super(Session, self).__init__(repeated_capability='', vi=None, library=None, encoding=None, attribute_cache=attributes.AttributeCache(), error_descriptions=_LruCache(64), warning_filter=errors._WarningFilter(), pending_descriptions=errors._PendingDescriptions(), freeze_it=False)
+        self._library = library_singleton.get()
+        self._encoding = 'windows-1251'
+        self._repeated_capability_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))
+
+        # The executor is created on first use, see the executor property
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+        # Call specified init function
+        self._vi = 0  # This must be set before calling _init_with_topology().
+        self._vi = self._init_with_topology(resource_name, topology, simulate, reset_device)
+
+        # Instantiate any repeated capability objects
+        self.channels = _RepeatedCapabilities(self, '')
+
+        # Store the parameter list for later printing in __repr__
+        param_list = []
+        param_list.append("resource_name=" + pp.pformat(resource_name))
+        param_list.append("topology=" + pp.pformat(topology))
+        param_list.append("simulate=" + pp.pformat(simulate))
+        param_list.append("reset_device=" + pp.pformat(reset_device))
+        self._param_list = ', '.join(param_list)
+
+        self._is_frozen = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def initiate(self):
+        return _Scan(self)
+
+    @property
+    def attribute_cache_enabled(self):
+        '''attribute_cache_enabled
+
+        When True, property values are kept in a Python-side cache after they are first read from the
+        driver, so reading them again does not call into the driver. Methods that can change property
+        values, including setting a property, clear the cache. Properties that change on their own,
+        such as status or temperature, are never cached. Defaults to False.
+
+        Do not enable the cache if another session or process changes the configuration of the device.
+        '''
+        return self._attribute_cache.enabled
+
+    @attribute_cache_enabled.setter
+    def attribute_cache_enabled(self, value):
+        self._attribute_cache.clear()
+        self._attribute_cache.enabled = value
+
+    @property
+    def executor(self):
+        '''executor
+
+        Returns the executor.SessionExecutor that runs calls on this session on a
+        dedicated worker thread. The worker thread is started on first use and
+        stopped by close(), after any pending calls have completed.
+        '''
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = executor.SessionExecutor(self)
+            return self._executor
+
+    def close(self):
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+        self.channels._clear_cache()
+        # The driver can't describe errors of the session once it is closed
+        self._pending_descriptions.resolve()
+        try:
+            self._close()
+        except errors.Error as e:
+            self._pending_descriptions.resolve()
+            self._vi = 0
+            raise
+        self._vi = 0
+
+    ''' These are code-generated '''
+
+    def abort(self):
+        '''abort
+
+        Aborts the scan in progress. Initiate a scan with
+        _initiate_scan. If the switch module is not scanning,
+        NISWITCH_ERROR_NO_SCAN_IN_PROGRESS error is returned.
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        error_code = self._library.niSwitch_AbortScan(vi_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def can_connect(self, channel1, channel2):
+        '''can_connect
+
+        Verifies that a path between channel 1 and channel 2 can be created. If
+        a path is possible in the switch module, the availability of that path
+        is returned given the existing connections. If the path is possible but
+        in use, a NISWITCH_WARN_IMPLICIT_CONNECTION_EXISTS warning is
+        returned.
+
+        Args:
+            channel1 (str): Input one of the channel names of the desired path. Pass the other
+                channel name as the channel 2 parameter. Refer to Devices Overview for
+                valid channel names for the switch module. Examples of valid channel
+                names: ch0, com0, ab0, r1, c2, cjtemp Default value: ""
+
+            channel2 (str): Input one of the channel names of the desired path. Pass the other
+                channel name as the channel 1 parameter. Refer to Devices Overview for
+                valid channel names for the switch module. Examples of valid channel
+                names: ch0, com0, ab0, r1, c2, cjtemp Default value: ""
+
+
+        Returns:
+            path_capability (enums.PathCapability): Indicates whether a path is valid. Possible values include:
+                ------------------------------------ NISWITCH_VAL_PATH_AVAILABLE 1
+                NISWITCH_VAL_PATH_EXISTS 2 NISWITCH_VAL_PATH_UNSUPPORTED 3
+                NISWITCH_VAL_RSRC_IN_USE 4 NISWITCH_VAL_SOURCE_CONFLICT 5
+                NISWITCH_VAL_CHANNEL_NOT_AVAILABLE 6 Notes: (1)
+                NISWITCH_VAL_PATH_AVAILABLE indicates that the driver can create the
+                path at this time. (2) NISWITCH_VAL_PATH_EXISTS indicates that the
+                path already exists. (3) NISWITCH_VAL_PATH_UNSUPPORTED indicates that
+                the instrument is not capable of creating a path between the channels
+                you specify. (4) NISWITCH_VAL_RSRC_IN_USE indicates that although
+                the path is valid, the driver cannot create the path at this moment
+                because the switch device is currently using one or more of the required
+                channels to create another path. You must destroy the other path before
+                creating this one. (5) NISWITCH_VAL_SOURCE_CONFLICT indicates that
+                the instrument cannot create a path because both channels are connected
+                to a different source channel. (6)
+                NISWITCH_VAL_CHANNEL_NOT_AVAILABLE indicates that the driver cannot
+                create a path between the two channels because one of the channels is a
+                configuration channel and thus unavailable for external connections.
+
+                Note:
+                One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or represent True/False, have been removed.
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        channel1_ctype = ctypes.create_string_buffer(channel1.encode(self._encoding))  # case C020
+        channel2_ctype = ctypes.create_string_buffer(channel2.encode(self._encoding))  # case C020
+        path_capability_ctype = visatype.ViInt32()  # case S200
+        error_code = self._library.niSwitch_CanConnect(vi_ctype, channel1_ctype, channel2_ctype, None if path_capability_ctype is None else (ctypes.pointer(path_capability_ctype)))
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return enums.PathCapability(path_capability_ctype.value)
+
+    def commit(self):
+        '''commit
+
+        Downloads the configured scan list and trigger settings to hardware.
+        Calling commit optional as it is implicitly called during
+        _initiate_scan. Use commit to arm triggers in a given
+        order or to control when expensive hardware operations are performed.
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        error_code = self._library.niSwitch_Commit(vi_ctype)
+        self._attribute_cache.clear()
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def configure_scan_list(self, scanlist, scan_mode=enums.ScanMode.BREAK_BEFORE_MAKE):
+        '''configure_scan_list
+
+        Configures the scan list and scan mode used for scanning. Refer to
+        Devices Overview to determine if the switch module supports scanning.
+        The scan list is comprised of a list of channel connections separated by
+        semi-colons. For example, the following scan list will scan the first
+        three channels of a multiplexer: com0->ch0; com0->ch1; com0->ch2; Refer
+        to Scan Lists for more information on scan list syntax To see the status
+        of the scan, call either IsScanning or
+        wait_for_scan_complete. Use the configure_scan_trigger
+        method to configure the scan trigger. Use the _initiate_scan
+        method to start the scan.
+
+        Note:
+        One or more of the referenced methods are not in the Python API for this driver.
+
+        Args:
+            scanlist (str): The scan list to use. The driver uses this value to set the Scan List
+                property. Default value: None
+
+            scan_mode (enums.ScanMode): Specifies how the switch module breaks existing connections when
+                scanning. The driver uses this value to set the Scan Mode property.
+                Refer to scan modes for more information. Default value: Break Before
+                Make
+
+        '''
+        if type(scan_mode) is not enums.ScanMode:
+            raise TypeError('Parameter mode must be of type ' + str(enums.ScanMode))
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        scanlist_ctype = ctypes.create_string_buffer(scanlist.encode(self._encoding))  # case C020
+        scan_mode_ctype = visatype.ViInt32(scan_mode.value)  # case S130
+        error_code = self._library.niSwitch_ConfigureScanList(vi_ctype, scanlist_ctype, scan_mode_ctype)
+        self._attribute_cache.clear()
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def configure_scan_trigger(self, trigger_input, scan_advanced_output, scan_delay=datetime.timedelta(seconds=0.0)):
+        '''configure_scan_trigger
+
+        Configures the scan triggers for the scan list established with
+        configure_scan_list. Refer to Devices Overview to determine if
+        the switch module supports scanning. configure_scan_trigger sets
+        the location that the switch expects to receive an input trigger to
+        advance through the scan list. This method also sets the location
+        where it outputs a scan advanced signal after it completes an entry in
+        the scan list.
+
+        Args:
+            trigger_input (enums.TriggerInput): Trigger source you want the switch module to use during scanning. The
+                driver uses this value to set the trigger_input
+                property. The switch device waits for the trigger you specify when it
+                encounters a semicolon in the scanlist. When the trigger occurs, the
+                switch device advances to the next entry in the scanlist. Refer to the
+                trigger_input topic in the NI Switches Help for a list
+                of valid values.
+
+            scan_advanced_output (enums.ScanAdvancedOutput): Output destination of the scan advanced trigger signal. The driver uses
+                this value to set the scan_advanced_output property.
+                After the switch processes each entry in the scan list, it waits the
+                length of time you specify in the Scan Delay parameter and then asserts
+                a trigger on the line you specify with this parameter. Refer to the
+                scan_advanced_output topic in the NI Switches Help for
+                a list of valid values.
+
+            scan_delay (float): The minimum length of time you want the switch device to wait after it
+                creates a path until it asserts a trigger on the scan advanced output
+                line. The driver uses this value to set the Scan Delay property. The
+                scan delay is in addition to the settling time.The driver uses this
+                value to set the scan_delay property. Express this
+                value in seconds. Default value: 0.0 s
+
+        '''
+        if type(trigger_input) is not enums.TriggerInput:
+            raise TypeError('Parameter mode must be of type ' + str(enums.TriggerInput))
+        if type(scan_advanced_output) is not enums.ScanAdvancedOutput:
+            raise TypeError('Parameter mode must be of type ' + str(enums.ScanAdvancedOutput))
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        scan_delay_ctype = _converters.convert_timedelta_to_seconds(scan_delay, visatype.ViReal64)  # case S140
+        trigger_input_ctype = visatype.ViInt32(trigger_input.value)  # case S130
+        scan_advanced_output_ctype = visatype.ViInt32(scan_advanced_output.value)  # case S130
+        error_code = self._library.niSwitch_ConfigureScanTrigger(vi_ctype, scan_delay_ctype, trigger_input_ctype, scan_advanced_output_ctype)
+        self._attribute_cache.clear()
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def connect(self, channel1, channel2):
+        '''connect
+
+        Creates a path between channel 1 and channel 2. The driver calculates
+        and uses the shortest path between the two channels. Refer to Immediate
+        Operations for information about Channel Usage types. If a path is not
+        available, the method returns one of the following errors: -
+        NISWITCH_ERROR_EXPLICIT_CONNECTION_EXISTS, if the two channels are
+        already explicitly connected by calling either the connect or
+        set_path method. -
+        NISWITCH_ERROR_IS_CONFIGURATION_CHANNEL, if a channel is a
+        configuration channel. Error elaboration contains information about
+        which of the two channels is a configuration channel. -
+        NISWITCH_ERROR_ATTEMPT_TO_CONNECT_SOURCES, if both channels are
+        connected to a different source. Error elaboration contains information
+        about sources channel 1 and 2 connect to. -
+        NISWITCH_ERROR_CANNOT_CONNECT_TO_ITSELF, if channels 1 and 2 are
+        one and the same channel. - NISWITCH_ERROR_PATH_NOT_FOUND, if the
+        driver cannot find a path between the two channels. Note: Paths are
+        bidirectional. For example, if a path exists between channels CH1 and
+        CH2, then the path also exists between channels CH2 and CH1.
+
+        Args:
+            channel1 (str): Input one of the channel names of the desired path. Pass the other
+                channel name as the channel 2 parameter. Refer to Devices Overview for
+                valid channel names for the switch module. Examples of valid channel
+                names: ch0, com0, ab0, r1, c2, cjtemp Default value: None
+
+            channel2 (str): Input one of the channel names of the desired path. Pass the other
+                channel name as the channel 1 parameter. Refer to Devices Overview for
+                valid channel names for the switch module. Examples of valid channel
+                names: ch0, com0, ab0, r1, c2, cjtemp Default value: None
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        channel1_ctype = ctypes.create_string_buffer(channel1.encode(self._encoding))  # case C020
+        channel2_ctype = ctypes.create_string_buffer(channel2.encode(self._encoding))  # case C020
+        error_code = self._library.niSwitch_Connect(vi_ctype, channel1_ctype, channel2_ctype)
+        self._attribute_cache.clear()
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def connect_multiple(self, connection_list):
+        '''connect_multiple
+
+        Creates the connections between channels specified in Connection List.
+        Specify connections with two endpoints only or the explicit path between
+        two endpoints. NI-SWITCH calculates and uses the shortest path between
+        the channels. Refer to Setting Source and Configuration Channels for
+        information about channel usage types. In the event of an error,
+        connecting stops at the point in the list where the error occurred. If a
+        path is not available, the method returns one of the following errors:
+        - NISWITCH_ERROR_EXPLICIT_CONNECTION_EXISTS, if the two channels are
+        already explicitly connected. -
+        NISWITCH_ERROR_IS_CONFIGURATION_CHANNEL, if a channel is a
+        configuration channel. Error elaboration contains information about
+        which of the two channels is a configuration channel. -
+        NISWITCH_ERROR_ATTEMPT_TO_CONNECT_SOURCES, if both channels are
+        connected to a different source. Error elaboration contains information
+        about sources channel 1 and 2 to connect. -
+        NISWITCH_ERROR_CANNOT_CONNECT_TO_ITSELF, if channels 1 and 2 are
+        one and the same channel. - NISWITCH_ERROR_PATH_NOT_FOUND, if the
+        driver cannot find a path between the two channels. Note: Paths are
+        bidirectional. For example, if a path exists between channels ch1 and
+        ch2, then the path also exists between channels ch1 and ch2.
+
+        Args:
+            connection_list (str): Connection List specifies a list of connections between channels to
+                make. NI-SWITCH validates the connection list, and aborts execution of
+                the list if errors are returned. Refer to Connection and Disconnection
+                List Syntax for valid connection list syntax and examples. Refer to
+                Devices Overview for valid channel names for the switch module. Example
+                of a valid connection list: c0 -> r1, [c2 -> r2 -> c3] In this example,
+                r2 is a configuration channel. Default value: None
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        connection_list_ctype = ctypes.create_string_buffer(connection_list.encode(self._encoding))  # case C020
+        error_code = self._library.niSwitch_ConnectMultiple(vi_ctype, connection_list_ctype)
+        self._attribute_cache.clear()
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def disable(self):
+        '''disable
+
+        Places the switch module in a quiescent state where it has minimal or no
+        impact on the system to which it is connected. All channels are
+        disconnected and any scan in progress is aborted.
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        error_code = self._library.niSwitch_Disable(vi_ctype)
+        self._attribute_cache.clear()
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def disconnect(self, channel1, channel2):
+        '''disconnect
+
+        This method destroys the path between two channels that you create
+        with the connect or set_path method. If a path is
+        not connected or not available, the method returns the
+        IVISWTCH_ERROR_NO_SUCH_PATH error.
+
+        Args:
+            channel1 (str): Input one of the channel names of the path to break. Pass the other
+                channel name as the channel 2 parameter. Refer to Devices Overview for
+                valid channel names for the switch module. Examples of valid channel
+                names: ch0, com0, ab0, r1, c2, cjtemp Default value: None
+
+            channel2 (str): Input one of the channel names of the path to break. Pass the other
+                channel name as the channel 1 parameter. Refer to Devices Overview for
+                valid channel names for the switch module. Examples of valid channel
+                names: ch0, com0, ab0, r1, c2, cjtemp Default value: None
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        channel1_ctype = ctypes.create_string_buffer(channel1.encode(self._encoding))  # case C020
+        channel2_ctype = ctypes.create_string_buffer(channel2.encode(self._encoding))  # case C020
+        error_code = self._library.niSwitch_Disconnect(vi_ctype, channel1_ctype, channel2_ctype)
+        self._attribute_cache.clear()
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def disconnect_all(self):
+        '''disconnect_all
+
+        Breaks all existing paths. If the switch module cannot break all paths,
+        NISWITCH_WARN_PATH_REMAINS warning is returned.
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        error_code = self._library.niSwitch_DisconnectAll(vi_ctype)
+        self._attribute_cache.clear()
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def disconnect_multiple(self, disconnection_list):
+        '''disconnect_multiple
+
+        Breaks the connections between channels specified in Disconnection List.
+        If no connections exist between channels, NI-SWITCH returns an error. In
+        the event of an error, the VI stops at the point in the list where the
+        error occurred.
+
+        Args:
+            disconnection_list (str): Disconnection List specifies a list of connections between channels to
+                break. NI-SWITCH validates the disconnection list, and aborts execution
+                of the list if errors are returned. Refer to Connection and
+                Disconnection List Syntax for valid disconnection list syntax and
+                examples. Refer to Devices Overview for valid channel names for the
+                switch module. Example of a valid disconnection list: c0 -> r1, [c2 ->
+                r2 -> c3] In this example, r2 is a configuration channel. Default value:
+                None
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        disconnection_list_ctype = ctypes.create_string_buffer(disconnection_list.encode(self._encoding))  # case C020
+        error_code = self._library.niSwitch_DisconnectMultiple(vi_ctype, disconnection_list_ctype)
+        self._attribute_cache.clear()
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def get_channel_name(self, index):
+        '''get_channel_name
+
+        Returns the channel string that is in the channel table at the specified
+        index. Use get_channel_name in a For Loop to get a complete list
+        of valid channel names for the switch module. Use the Channel Count
+        property to determine the number of channels.
+
+        Args:
+            index (int): A 1-based index into the channel table. Default value: 1 Maximum value:
+                Value of Channel Count property.
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        index_ctype = visatype.ViInt32(index)  # case S150
+        buffer_size_ctype = visatype.ViInt32()  # case S170
+        channel_name_buffer_ctype = None  # case C050
+        error_code = self._library.niSwitch_GetChannelName(vi_ctype, index_ctype, buffer_size_ctype, channel_name_buffer_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=False)
+        buffer_size_ctype = visatype.ViInt32(error_code)  # case S180
+        channel_name_buffer_ctype = (visatype.ViChar * buffer_size_ctype.value)()  # case C060
+        error_code = self._library.niSwitch_GetChannelName(vi_ctype, index_ctype, buffer_size_ctype, channel_name_buffer_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return channel_name_buffer_ctype.value.decode(self._encoding)
+
+    def get_path(self, channel1, channel2):
+        '''get_path
+
+        Returns a string that identifies the explicit path created with
+        connect. Pass this string to set_path to establish
+        the exact same path in future connections. In some cases, multiple paths
+        are available between two channels. When you call connect, the
+        driver selects an available path. With connect, there is no
+        guarantee that the driver selected path will always be the same path
+        through the switch module. get_path only returns those paths
+        explicitly created by niSwitch Connect Channels or set_path.
+        For example, if you connect channels CH1 and CH3,and then channels CH2
+        and CH3, an explicit path between channels CH1 and CH2 does not exist an
+        error is returned
+
+        Args:
+            channel1 (str): Input one of the channel names of the desired path. Pass the other
+                channel name as the channel 2 parameter. Refer to Devices Overview for
+                valid channel names for the switch module. Examples of valid channel
+                names: ch0, com0, ab0, r1, c2, cjtemp Default value: ""
+
+            channel2 (str): Input one of the channel names of the desired path. Pass the other
+                channel name as the channel 1 parameter. Refer to Devices Overview for
+                valid channel names for the switch module. Examples of valid channel
+                names: ch0, com0, ab0, r1, c2, cjtemp Default value: ""
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        channel1_ctype = ctypes.create_string_buffer(channel1.encode(self._encoding))  # case C020
+        channel2_ctype = ctypes.create_string_buffer(channel2.encode(self._encoding))  # case C020
+        buffer_size_ctype = visatype.ViInt32()  # case S170
+        path_ctype = None  # case C050
+        error_code = self._library.niSwitch_GetPath(vi_ctype, channel1_ctype, channel2_ctype, buffer_size_ctype, path_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=False)
+        buffer_size_ctype = visatype.ViInt32(error_code)  # case S180
+        path_ctype = (visatype.ViChar * buffer_size_ctype.value)()  # case C060
+        error_code = self._library.niSwitch_GetPath(vi_ctype, channel1_ctype, channel2_ctype, buffer_size_ctype, path_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return path_ctype.value.decode(self._encoding)
+
+    def get_relay_count(self, relay_name):
+        '''get_relay_count
+
+        Returns the number of times the relay has changed from Closed to Open.
+        Relay count is useful for tracking relay lifetime and usage. Call
+        wait_for_debounce before get_relay_count to ensure an
+        accurate count. Refer to the Relay Count topic in the NI Switches Help
+        to determine if the switch module supports relay counting.
+
+        Args:
+            relay_name (str): Name of the relay. Default value: None Examples of valid relay names:
+                ch0, ab0, 1wire, hlselect Refer to Devices Overview for a list of valid
+                relay names for the switch module.
+
+
+        Returns:
+            relay_count (int): The number of relay cycles.
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        relay_name_ctype = ctypes.create_string_buffer(relay_name.encode(self._encoding))  # case C020
+        relay_count_ctype = visatype.ViInt32()  # case S200
+        error_code = self._library.niSwitch_GetRelayCount(vi_ctype, relay_name_ctype, None if relay_count_ctype is None else (ctypes.pointer(relay_count_ctype)))
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return int(relay_count_ctype.value)
+
+    def get_relay_name(self, index):
+        '''get_relay_name
+
+        Returns the relay name string that is in the relay list at the specified
+        index. Use get_relay_name in a For Loop to get a complete list
+        of valid relay names for the switch module. Use the Number of Relays
+        property to determine the number of relays.
+
+        Args:
+            index (int): A 1-based index into the channel table. Default value: 1 Maximum value:
+                Value of Channel Count property.
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        index_ctype = visatype.ViInt32(index)  # case S150
+        relay_name_buffer_size_ctype = visatype.ViInt32()  # case S170
+        relay_name_buffer_ctype = None  # case C050
+        error_code = self._library.niSwitch_GetRelayName(vi_ctype, index_ctype, relay_name_buffer_size_ctype, relay_name_buffer_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=False)
+        relay_name_buffer_size_ctype = visatype.ViInt32(error_code)  # case S180
+        relay_name_buffer_ctype = (visatype.ViChar * relay_name_buffer_size_ctype.value)()  # case C060
+        error_code = self._library.niSwitch_GetRelayName(vi_ctype, index_ctype, relay_name_buffer_size_ctype, relay_name_buffer_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return relay_name_buffer_ctype.value.decode(self._encoding)
+
+    def get_relay_position(self, relay_name):
+        '''get_relay_position
+
+        Returns the relay position for the relay specified in the Relay Name
+        parameter.
+
+        Args:
+            relay_name (str): Name of the relay. Default value: None Examples of valid relay names:
+                ch0, ab0, 1wire, hlselect Refer to Devices Overview for a list of valid
+                relay names for the switch module.
+
+
+        Returns:
+            relay_position (enums.RelayPosition): Indicates whether the relay is open or closed. NISWITCH_VAL_OPEN 10
+                NIWITCH_VAL_CLOSED 11
+
+                Note:
+                One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or represent True/False, have been removed.
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        relay_name_ctype = ctypes.create_string_buffer(relay_name.encode(self._encoding))  # case C020
+        relay_position_ctype = visatype.ViInt32()  # case S200
+        error_code = self._library.niSwitch_GetRelayPosition(vi_ctype, relay_name_ctype, None if relay_position_ctype is None else (ctypes.pointer(relay_position_ctype)))
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return enums.RelayPosition(relay_position_ctype.value)
+
+    def _init_with_topology(self, resource_name, topology="Configured Topology", simulate=False, reset_device=False):
+        '''_init_with_topology
+
+        Returns a session handle used to identify the switch in all subsequent
+        instrument driver calls and sets the topology of the switch.
+        _init_with_topology creates a new IVI instrument driver session
+        for the switch specified in the resourceName parameter. The driver uses
+        the topology specified in the topology parameter and overrides the
+        topology specified in MAX. Note: When initializing an NI SwitchBlock
+        device with topology, you must specify the toplogy created when you
+        configured the device in MAX, using either
+        NISWITCH_TOPOLOGY_CONFIGURED_TOPOLOGY or the toplogy string of the
+        device. Refer to the Initializing with Toplogy for NI SwitchBlock
+        Devices topic in the NI Switches Help for information about determining
+        the topology string of an NI SwitchBlock device. By default, the switch
+        is reset to a known state. Enable simulation by specifying the topology
+        and setting the simulate parameter to True.
+
+        Args:
+            resource_name (str): Resource name of the switch module to initialize. Default value: None
+                Syntax: Optional fields are shown in square brackets ([]). Configured in
+                MAX Under Valid Syntax Devices and Interfaces DeviceName Traditional
+                NI-DAQ Devices SCXI[chassis ID]::slot number PXI System PXI[bus
+                number]::device number TIP: IVI logical names are also valid for the
+                resource name. Default values for optional fields: chassis ID = 1 bus
+                number = 0 Example resource names: Resource Name Description SC1Mod3
+                NI-DAQmx module in chassis "SC1" slot 3 MySwitch NI-DAQmx module renamed
+                to "MySwitch" SCXI1::3 Traditional NI-DAQ module in chassis 1, slot 3
+                SCXI::3 Traditional NI-DAQ module in chassis 1, slot 3 PXI0::16 PXI bus
+                0, device number 16 PXI::16 PXI bus 0, device number 16
+
+            topology (str): Pass the topology name you want to use for the switch you specify with
+                Resource Name parameter. You can also pass
+                NISWITCH_TOPOLOGY_CONFIGURED_TOPOLOGY to use the last topology that
+                was configured for the device in MAX. Default Value:
+                NISWITCH_TOPOLOGY_CONFIGURED_TOPOLOGY Valid Values:
+                NISWITCH_TOPOLOGY_1127_1_WIRE_64X1_MUX
+                NISWITCH_TOPOLOGY_1127_2_WIRE_32X1_MUX
+                NISWITCH_TOPOLOGY_1127_2_WIRE_4X8_MATRIX
+                NISWITCH_TOPOLOGY_1127_4_WIRE_16X1_MUX
+                NISWITCH_TOPOLOGY_1127_INDEPENDENT
+                NISWITCH_TOPOLOGY_1128_1_WIRE_64X1_MUX
+                NISWITCH_TOPOLOGY_1128_2_WIRE_32X1_MUX
+                NISWITCH_TOPOLOGY_1128_2_WIRE_4X8_MATRIX
+                NISWITCH_TOPOLOGY_1128_4_WIRE_16X1_MUX
+                NISWITCH_TOPOLOGY_1128_INDEPENDENT
+                NISWITCH_TOPOLOGY_1129_2_WIRE_16X16_MATRIX
+                NISWITCH_TOPOLOGY_1129_2_WIRE_8X32_MATRIX
+                NISWITCH_TOPOLOGY_1129_2_WIRE_4X64_MATRIX
+                NISWITCH_TOPOLOGY_1129_2_WIRE_DUAL_8X16_MATRIX
+                NISWITCH_TOPOLOGY_1129_2_WIRE_DUAL_4X32_MATRIX
+                NISWITCH_TOPOLOGY_1129_2_WIRE_QUAD_4X16_MATRIX
+                NISWITCH_TOPOLOGY_1130_1_WIRE_256X1_MUX
+                NISWITCH_TOPOLOGY_1130_1_WIRE_DUAL_128X1_MUX
+                NISWITCH_TOPOLOGY_1130_1_WIRE_4X64_MATRIX
+                NISWITCH_TOPOLOGY_1130_1_WIRE_8x32_MATRIX
+                NISWITCH_TOPOLOGY_1130_1_WIRE_OCTAL_32X1_MUX
+                NISWITCH_TOPOLOGY_1130_1_WIRE_QUAD_64X1_MUX
+                NISWITCH_TOPOLOGY_1130_1_WIRE_SIXTEEN_16X1_MUX
+                NISWITCH_TOPOLOGY_1130_2_WIRE_4X32_MATRIX
+                NISWITCH_TOPOLOGY_1130_2_WIRE_128X1_MUX
+                NISWITCH_TOPOLOGY_1130_2_WIRE_OCTAL_16X1_MUX
+                NISWITCH_TOPOLOGY_1130_2_WIRE_QUAD_32X1_MUX
+                NISWITCH_TOPOLOGY_1130_4_WIRE_64X1_MUX
+                NISWITCH_TOPOLOGY_1130_4_WIRE_QUAD_16X1_MUX
+                NISWITCH_TOPOLOGY_1130_INDEPENDENT NISWITCH_TOPOLOGY_1160_16_SPDT
+                NISWITCH_TOPOLOGY_1161_8_SPDT
+                NISWITCH_TOPOLOGY_1163R_OCTAL_4X1_MUX
+                NISWITCH_TOPOLOGY_1166_16_DPDT NISWITCH_TOPOLOGY_1166_32_SPDT
+                NISWITCH_TOPOLOGY_1167_INDEPENDENT
+                NISWITCH_TOPOLOGY_1169_100_SPST NISWITCH_TOPOLOGY_1169_50_DPST
+                NISWITCH_TOPOLOGY_1175_1_WIRE_196X1_MUX
+                NISWITCH_TOPOLOGY_1175_2_WIRE_98X1_MUX
+                NISWITCH_TOPOLOGY_1175_2_WIRE_95X1_MUX
+                NISWITCH_TOPOLOGY_1190_QUAD_4X1_MUX
+                NISWITCH_TOPOLOGY_1191_QUAD_4X1_MUX
+                NISWITCH_TOPOLOGY_1192_8_SPDT NISWITCH_TOPOLOGY_1193_32X1_MUX
+                NISWITCH_TOPOLOGY_1193_16X1_TERMINATED_MUX
+                NISWITCH_TOPOLOGY_1193_DUAL_16X1_MUX
+                NISWITCH_TOPOLOGY_1193_DUAL_8X1_TERMINATED_MUX
+                NISWITCH_TOPOLOGY_1193_QUAD_8X1_MUX
+                NISWITCH_TOPOLOGY_1193_QUAD_4X1_TERMINATED_MUX
+                NISWITCH_TOPOLOGY_1193_INDEPENDENT
+                NISWITCH_TOPOLOGY_1194_QUAD_4X1_MUX
+                NISWITCH_TOPOLOGY_1195_QUAD_4X1_MUX
+                NISWITCH_TOPOLOGY_2501_1_WIRE_48X1_MUX
+                NISWITCH_TOPOLOGY_2501_1_WIRE_48X1_AMPLIFIED_MUX
+                NISWITCH_TOPOLOGY_2501_2_WIRE_24X1_MUX
+                NISWITCH_TOPOLOGY_2501_2_WIRE_24X1_AMPLIFIED_MUX
+                NISWITCH_TOPOLOGY_2501_2_WIRE_DUAL_12X1_MUX
+                NISWITCH_TOPOLOGY_2501_2_WIRE_QUAD_6X1_MUX
+                NISWITCH_TOPOLOGY_2501_2_WIRE_4X6_MATRIX
+                NISWITCH_TOPOLOGY_2501_4_WIRE_12X1_MUX
+                NISWITCH_TOPOLOGY_2503_1_WIRE_48X1_MUX
+                NISWITCH_TOPOLOGY_2503_2_WIRE_24X1_MUX
+                NISWITCH_TOPOLOGY_2503_2_WIRE_DUAL_12X1_MUX
+                NISWITCH_TOPOLOGY_2503_2_WIRE_QUAD_6X1_MUX
+                NISWITCH_TOPOLOGY_2503_2_WIRE_4X6_MATRIX
+                NISWITCH_TOPOLOGY_2503_4_WIRE_12X1_MUX
+                NISWITCH_TOPOLOGY_2510_INDEPENDENT
+                NISWITCH_TOPOLOGY_2512_INDEPENDENT
+                NISWITCH_TOPOLOGY_2514_INDEPENDENT
+                NISWITCH_TOPOLOGY_2515_INDEPENDENT NISWITCH_TOPOLOGY_2520_80_SPST
+                NISWITCH_TOPOLOGY_2521_40_DPST NISWITCH_TOPOLOGY_2522_53_SPDT
+                NISWITCH_TOPOLOGY_2523_26_DPDT
+                NISWITCH_TOPOLOGY_2524_1_WIRE_128X1_MUX
+                NISWITCH_TOPOLOGY_2524_1_WIRE_DUAL_64X1_MUX
+                NISWITCH_TOPOLOGY_2524_1_WIRE_QUAD_32X1_MUX
+                NISWITCH_TOPOLOGY_2524_1_WIRE_OCTAL_16X1_MUX
+                NISWITCH_TOPOLOGY_2524_1_WIRE_SIXTEEN_8X1_MUX
+                NISWITCH_TOPOLOGY_2525_2_WIRE_64X1_MUX
+                NISWITCH_TOPOLOGY_2525_2_WIRE_DUAL_32X1_MUX
+                NISWITCH_TOPOLOGY_2525_2_WIRE_QUAD_16X1_MUX
+                NISWITCH_TOPOLOGY_2525_2_WIRE_OCTAL_8X1_MUX
+                NISWITCH_TOPOLOGY_2525_2_WIRE_SIXTEEN_4X1_MUX
+                NISWITCH_TOPOLOGY_2526_1_WIRE_158X1_MUX
+                NISWITCH_TOPOLOGY_2526_2_WIRE_79X1_MUX
+                NISWITCH_TOPOLOGY_2527_1_WIRE_64X1_MUX
+                NISWITCH_TOPOLOGY_2527_1_WIRE_DUAL_32X1_MUX
+                NISWITCH_TOPOLOGY_2527_2_WIRE_32X1_MUX
+                NISWITCH_TOPOLOGY_2527_2_WIRE_DUAL_16X1_MUX
+                NISWITCH_TOPOLOGY_2527_4_WIRE_16X1_MUX
+                NISWITCH_TOPOLOGY_2527_INDEPENDENT
+                NISWITCH_TOPOLOGY_2529_2_WIRE_DUAL_4X16_MATRIX
+                NISWITCH_TOPOLOGY_2529_2_WIRE_8X16_MATRIX
+                NISWITCH_TOPOLOGY_2529_2_WIRE_4X32_MATRIX
+                NISWITCH_TOPOLOGY_2530_1_WIRE_128X1_MUX
+                NISWITCH_TOPOLOGY_2530_1_WIRE_DUAL_64X1_MUX
+                NISWITCH_TOPOLOGY_2530_1_WIRE_4x32_MATRIX
+                NISWITCH_TOPOLOGY_2530_1_WIRE_8x16_MATRIX
+                NISWITCH_TOPOLOGY_2530_1_WIRE_OCTAL_16X1_MUX
+                NISWITCH_TOPOLOGY_2530_1_WIRE_QUAD_32X1_MUX
+                NISWITCH_TOPOLOGY_2530_2_WIRE_4x16_MATRIX
+                NISWITCH_TOPOLOGY_2530_2_WIRE_64X1_MUX
+                NISWITCH_TOPOLOGY_2530_2_WIRE_DUAL_32X1_MUX
+                NISWITCH_TOPOLOGY_2530_2_WIRE_QUAD_16X1_MUX
+                NISWITCH_TOPOLOGY_2530_4_WIRE_32X1_MUX
+                NISWITCH_TOPOLOGY_2530_4_WIRE_DUAL_16X1_MUX
+                NISWITCH_TOPOLOGY_2530_INDEPENDENT
+                NISWITCH_TOPOLOGY_2531_1_WIRE_4X128_MATRIX
+                NISWITCH_TOPOLOGY_2531_1_WIRE_8X64_MATRIX
+                NISWITCH_TOPOLOGY_2531_1_WIRE_DUAL_4X64_MATRIX
+                NISWITCH_TOPOLOGY_2531_1_WIRE_DUAL_8X32_MATRIX
+                NISWITCH_TOPOLOGY_2531_2_WIRE_4X64_MATRIX
+                NISWITCH_TOPOLOGY_2531_2_WIRE_8X32_MATRIX
+                NISWITCH_TOPOLOGY_2532_1_WIRE_16X32_MATRIX
+                NISWITCH_TOPOLOGY_2532_1_WIRE_4X128_MATRIX
+                NISWITCH_TOPOLOGY_2532_1_WIRE_8X64_MATRIX
+                NISWITCH_TOPOLOGY_2532_1_WIRE_DUAL_16X16_MATRIX
+                NISWITCH_TOPOLOGY_2532_1_WIRE_DUAL_4X64_MATRIX
+                NISWITCH_TOPOLOGY_2532_1_WIRE_DUAL_8X32_MATRIX
+                NISWITCH_TOPOLOGY_2532_1_WIRE_SIXTEEN_2X16_MATRIX
+                NISWITCH_TOPOLOGY_2532_2_WIRE_16X16_MATRIX
+                NISWITCH_TOPOLOGY_2532_2_WIRE_4X64_MATRIX
+                NISWITCH_TOPOLOGY_2532_2_WIRE_8X32_MATRIX
+                NISWITCH_TOPOLOGY_2532_2_WIRE_DUAL_4X32_MATRIX
+                NISWITCH_TOPOLOGY_2533_1_WIRE_4X64_MATRIX
+                NISWITCH_TOPOLOGY_2534_1_WIRE_8X32_MATRIX
+                NISWITCH_TOPOLOGY_2535_1_WIRE_4X136_MATRIX
+                NISWITCH_TOPOLOGY_2536_1_WIRE_8X68_MATRIX
+                NISWITCH_TOPOLOGY_2540_1_WIRE_8X9_MATRIX
+                NISWITCH_TOPOLOGY_2541_1_WIRE_8X12_MATRIX
+                NISWITCH_TOPOLOGY_2542_QUAD_2X1_TERMINATED_MUX
+                NISWITCH_TOPOLOGY_2543_DUAL_4X1_TERMINATED_MUX
+                NISWITCH_TOPOLOGY_2544_8X1_TERMINATED_MUX
+                NISWITCH_TOPOLOGY_2545_4X1_TERMINATED_MUX
+                NISWITCH_TOPOLOGY_2546_DUAL_4X1_MUX
+                NISWITCH_TOPOLOGY_2547_8X1_MUX NISWITCH_TOPOLOGY_2548_4_SPDT
+                NISWITCH_TOPOLOGY_2549_TERMINATED_2_SPDT
+                NISWITCH_TOPOLOGY_2554_4X1_MUX
+                NISWITCH_TOPOLOGY_2555_4X1_TERMINATED_MUX
+                NISWITCH_TOPOLOGY_2556_DUAL_4X1_MUX
+                NISWITCH_TOPOLOGY_2557_8X1_MUX NISWITCH_TOPOLOGY_2558_4_SPDT
+                NISWITCH_TOPOLOGY_2559_TERMINATED_2_SPDT
+                NISWITCH_TOPOLOGY_2564_16_SPST NISWITCH_TOPOLOGY_2564_8_DPST
+                NISWITCH_TOPOLOGY_2565_16_SPST NISWITCH_TOPOLOGY_2566_16_SPDT
+                NISWITCH_TOPOLOGY_2566_8_DPDT NISWITCH_TOPOLOGY_2567_INDEPENDENT
+                NISWITCH_TOPOLOGY_2568_15_DPST NISWITCH_TOPOLOGY_2568_31_SPST
+                NISWITCH_TOPOLOGY_2569_100_SPST NISWITCH_TOPOLOGY_2569_50_DPST
+                NISWITCH_TOPOLOGY_2570_20_DPDT NISWITCH_TOPOLOGY_2570_40_SPDT
+                NISWITCH_TOPOLOGY_2571_66_SPDT
+                NISWITCH_TOPOLOGY_2575_1_WIRE_196X1_MUX
+                NISWITCH_TOPOLOGY_2575_2_WIRE_98X1_MUX
+                NISWITCH_TOPOLOGY_2575_2_WIRE_95X1_MUX
+                NISWITCH_TOPOLOGY_2576_2_WIRE_64X1_MUX
+                NISWITCH_TOPOLOGY_2576_2_WIRE_DUAL_32X1_MUX
+                NISWITCH_TOPOLOGY_2576_2_WIRE_OCTAL_8X1_MUX
+                NISWITCH_TOPOLOGY_2576_2_WIRE_QUAD_16X1_MUX
+                NISWITCH_TOPOLOGY_2576_2_WIRE_SIXTEEN_4X1_MUX
+                NISWITCH_TOPOLOGY_2576_INDEPENDENT
+                NISWITCH_TOPOLOGY_2584_1_WIRE_12X1_MUX
+                NISWITCH_TOPOLOGY_2584_1_WIRE_DUAL_6X1_MUX
+                NISWITCH_TOPOLOGY_2584_2_WIRE_6X1_MUX
+                NISWITCH_TOPOLOGY_2584_INDEPENDENT
+                NISWITCH_TOPOLOGY_2585_1_WIRE_10X1_MUX
+                NISWITCH_TOPOLOGY_2586_10_SPST NISWITCH_TOPOLOGY_2586_5_DPST
+                NISWITCH_TOPOLOGY_2590_4X1_MUX NISWITCH_TOPOLOGY_2591_4X1_MUX
+                NISWITCH_TOPOLOGY_2593_16X1_MUX
+                NISWITCH_TOPOLOGY_2593_8X1_TERMINATED_MUX
+                NISWITCH_TOPOLOGY_2593_DUAL_8X1_MUX
+                NISWITCH_TOPOLOGY_2593_DUAL_4X1_TERMINATED_MUX
+                NISWITCH_TOPOLOGY_2593_INDEPENDENT NISWITCH_TOPOLOGY_2594_4X1_MUX
+                NISWITCH_TOPOLOGY_2595_4X1_MUX
+                NISWITCH_TOPOLOGY_2596_DUAL_6X1_MUX
+                NISWITCH_TOPOLOGY_2597_6X1_TERMINATED_MUX
+                NISWITCH_TOPOLOGY_2598_DUAL_TRANSFER
+                NISWITCH_TOPOLOGY_2599_2_SPDT NISWITCH_TOPOLOGY_2720_INDEPENDENT
+                NISWITCH_TOPOLOGY_2722_INDEPENDENT
+                NISWITCH_TOPOLOGY_2725_INDEPENDENT
+                NISWITCH_TOPOLOGY_2727_INDEPENDENT
+                NISWITCH_TOPOLOGY_2737_2_WIRE_4X64_MATRIX
+                NISWITCH_TOPOLOGY_2738_2_WIRE_8X32_MATRIX
+                NISWITCH_TOPOLOGY_2739_2_WIRE_16X16_MATRIX
+                NISWITCH_TOPOLOGY_2746_QUAD_4X1_MUX
+                NISWITCH_TOPOLOGY_2747_DUAL_8X1_MUX
+                NISWITCH_TOPOLOGY_2748_16X1_MUX
+                NISWITCH_TOPOLOGY_2790_INDEPENDENT
+                NISWITCH_TOPOLOGY_2796_DUAL_6X1_MUX
+                NISWITCH_TOPOLOGY_2797_6X1_TERMINATED_MUX
+                NISWITCH_TOPOLOGY_2798_DUAL_TRANSFER
+                NISWITCH_TOPOLOGY_2799_2_SPDT
+
+            simulate (bool): Enables simulation of the switch module specified in the resource name
+                parameter. Valid Values: True - simulate False - Don't simulate
+                (Default Value)
+
+            reset_device (bool): Specifies whether to reset the switch module during the initialization
+                process. Valid Values: True - Reset Device (Default Value) False
+                - Currently unsupported. The device will not reset.
+
+
+        Returns:
+            vi (int): A particular NI-SWITCH session established with
+                _init_with_topology, InitWithOptions, or init
+                and used for all subsequent NI-SWITCH calls.
+
+                Note:
+                One or more of the referenced methods are not in the Python API for this driver.
+
+        '''
+        resource_name_ctype = ctypes.create_string_buffer(resource_name.encode(self._encoding))  # case C020
+        topology_ctype = ctypes.create_string_buffer(topology.encode(self._encoding))  # case C020
+        simulate_ctype = visatype.ViBoolean(simulate)  # case S150
+        reset_device_ctype = visatype.ViBoolean(reset_device)  # case S150
+        vi_ctype = visatype.ViSession()  # case S200
+        error_code = self._library.niSwitch_InitWithTopology(resource_name_ctype, topology_ctype, simulate_ctype, reset_device_ctype, None if vi_ctype is None else (ctypes.pointer(vi_ctype)))
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return int(vi_ctype.value)
+
+    def _initiate_scan(self):
+        '''_initiate_scan
+
+        Commits the configured scan list and trigger settings to hardware and
+        initiates the scan. If niSwitch Commit was called earlier, niSwitch
+        Initiate Scan only initiates the scan and returns immediately. Once the
+        scanning operation begins, you cannot perform any other operation other
+        than GetAttribute, AbortScan, or SendSoftwareTrigger. All other
+        methods return NISWITCH_ERROR_SCAN_IN_PROGRESS. To stop the
+        scanning operation, To stop the scanning operation, call
+        abort.
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        error_code = self._library.niSwitch_InitiateScan(vi_ctype)
+        self._attribute_cache.clear()
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def relay_control(self, relay_name, relay_action):
+        '''relay_control
+
+        Controls individual relays of the switch. When controlling individual
+        relays, the protection offered by setting the usage of source channels
+        and configuration channels, and by enabling or disabling analog bus
+        sharing on the NI SwitchBlock, does not apply. Refer to the device book
+        for your switch in the NI Switches Help to determine if the switch
+        supports individual relay control.
+
+        Args:
+            relay_name (str): Name of the relay. Default value: None Examples of valid relay names:
+                ch0, ab0, 1wire, hlselect Refer to Devices Overview for a list of valid
+                relay names for the switch module.
+
+            relay_action (enums.RelayAction): Specifies whether to open or close a given relay. Default value: Relay
+                Close Defined values: NISWITCH_VAL_OPEN_RELAY
+                NISWITCH_VAL_CLOSE_RELAY (Default Value)
+
+                Note:
+                One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or represent True/False, have been removed.
+
+        '''
+        if type(relay_action) is not enums.RelayAction:
+            raise TypeError('Parameter mode must be of type ' + str(enums.RelayAction))
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        relay_name_ctype = ctypes.create_string_buffer(relay_name.encode(self._encoding))  # case C020
+        relay_action_ctype = visatype.ViInt32(relay_action.value)  # case S130
+        error_code = self._library.niSwitch_RelayControl(vi_ctype, relay_name_ctype, relay_action_ctype)
+        self._attribute_cache.clear()
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def reset_with_defaults(self):
+        '''reset_with_defaults
+
+        Resets the switch module and applies initial user specified settings
+        from the logical name used to initialize the session. If the session was
+        created without a logical name, this method is equivalent to
+        reset.
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        error_code = self._library.niSwitch_ResetWithDefaults(vi_ctype)
+        self._attribute_cache.clear()
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def route_scan_advanced_output(self, scan_advanced_output_connector, scan_advanced_output_bus_line, invert=False):
+        '''route_scan_advanced_output
+
+        Routes the scan advanced output trigger from a trigger bus line (TTLx)
+        to the front or rear connector.
+
+        Args:
+            scan_advanced_output_connector (enums.ScanAdvancedOutput): The scan advanced trigger destination. Valid locations are the
+                ScanAdvancedOutput.FRONTCONNECTOR and ScanAdvancedOutput.REARCONNECTOR. Default
+                value: ScanAdvancedOutput.FRONTCONNECTOR
+
+                Note:
+                One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or represent True/False, have been removed.
+
+            scan_advanced_output_bus_line (enums.ScanAdvancedOutput): The trigger line to route the scan advanced output trigger from the
+                front or rear connector. Select ScanAdvancedOutput.NONE to break an existing
+                route. Default value: None Valid Values: ScanAdvancedOutput.NONE
+                ScanAdvancedOutput.TTL0 ScanAdvancedOutput.TTL1 ScanAdvancedOutput.TTL2
+                ScanAdvancedOutput.TTL3 ScanAdvancedOutput.TTL4 ScanAdvancedOutput.TTL5
+                ScanAdvancedOutput.TTL6 ScanAdvancedOutput.TTL7
+
+                Note:
+                One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or represent True/False, have been removed.
+
+            invert (bool): If True, inverts the input trigger signal from falling to rising or
+                vice versa. Default value: False
+
+        '''
+        if type(scan_advanced_output_connector) is not enums.ScanAdvancedOutput:
+            raise TypeError('Parameter mode must be of type ' + str(enums.ScanAdvancedOutput))
+        if type(scan_advanced_output_bus_line) is not enums.ScanAdvancedOutput:
+            raise TypeError('Parameter mode must be of type ' + str(enums.ScanAdvancedOutput))
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        scan_advanced_output_connector_ctype = visatype.ViInt32(scan_advanced_output_connector.value)  # case S130
+        scan_advanced_output_bus_line_ctype = visatype.ViInt32(scan_advanced_output_bus_line.value)  # case S130
+        invert_ctype = visatype.ViBoolean(invert)  # case S150
+        error_code = self._library.niSwitch_RouteScanAdvancedOutput(vi_ctype, scan_advanced_output_connector_ctype, scan_advanced_output_bus_line_ctype, invert_ctype)
+        self._attribute_cache.clear()
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def route_trigger_input(self, trigger_input_connector, trigger_input_bus_line, invert=False):
+        '''route_trigger_input
+
+        Routes the input trigger from the front or rear connector to a trigger
+        bus line (TTLx). To disconnect the route, call this method again and
+        specify None for trigger bus line parameter.
+
+        Args:
+            trigger_input_connector (enums.TriggerInput): The location of the input trigger source on the switch module. Valid
+                locations are the TriggerInput.FRONTCONNECTOR and
+                TriggerInput.REARCONNECTOR. Default value:
+                TriggerInput.FRONTCONNECTOR
+
+                Note:
+                One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or represent True/False, have been removed.
+
+            trigger_input_bus_line (enums.TriggerInput): The trigger line to route the input trigger. Select NISWITCH_VAL_NONE
+                to break an existing route. Default value: None Valid Values:
+                NISWITCH_VAL_NONE TriggerInput.TTL0 TriggerInput.TTL1
+                TriggerInput.TTL2 TriggerInput.TTL3 TriggerInput.TTL4
+                TriggerInput.TTL5 TriggerInput.TTL6 TriggerInput.TTL7
+
+                Note:
+                One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or represent True/False, have been removed.
+
+            invert (bool): If True, inverts the input trigger signal from falling to rising or
+                vice versa. Default value: False
+
+        '''
+        if type(trigger_input_connector) is not enums.TriggerInput:
+            raise TypeError('Parameter mode must be of type ' + str(enums.TriggerInput))
+        if type(trigger_input_bus_line) is not enums.TriggerInput:
+            raise TypeError('Parameter mode must be of type ' + str(enums.TriggerInput))
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        trigger_input_connector_ctype = visatype.ViInt32(trigger_input_connector.value)  # case S130
+        trigger_input_bus_line_ctype = visatype.ViInt32(trigger_input_bus_line.value)  # case S130
+        invert_ctype = visatype.ViBoolean(invert)  # case S150
+        error_code = self._library.niSwitch_RouteTriggerInput(vi_ctype, trigger_input_connector_ctype, trigger_input_bus_line_ctype, invert_ctype)
+        self._attribute_cache.clear()
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def send_software_trigger(self):
+        '''send_software_trigger
+
+        Sends a software trigger to the switch module specified in the NI-SWITCH
+        session. When the trigger input is set to TriggerInput.SOFTWARE_TRIG
+        through either the configure_scan_trigger or the
+        trigger_input property, the scan does not proceed from
+        a semi-colon (wait for trigger) until send_software_trigger is
+        called.
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        error_code = self._library.niSwitch_SendSoftwareTrigger(vi_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def set_continuous_scan(self, continuous_scan):
+        '''set_continuous_scan
+
+        Sets the to loop continuously through the scan list or to stop scanning
+        after one pass through the scan list.
+
+        Args:
+            continuous_scan (bool): If True, loops continuously through the scan list during scanning.
+                If False, the scan stops after one pass through the scan list.
+                Default value: False
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        continuous_scan_ctype = visatype.ViBoolean(continuous_scan)  # case S150
+        error_code = self._library.niSwitch_SetContinuousScan(vi_ctype, continuous_scan_ctype)
+        self._attribute_cache.clear()
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def set_path(self, path_list):
+        '''set_path
+
+        Connects two channels by specifying an explicit path in the path list
+        parameter. set_path is particularly useful where path
+        repeatability is important, such as in calibrated signal paths. If this
+        is not necessary, use connect.
+
+        Args:
+            path_list (str): A string composed of comma-separated paths between channel 1 and channel
+                2. The first and last names in the path are the endpoints of the path.
+                Every other channel in the path are configuration channels. Example of a
+                valid path list string: ch0->com0, com0->ab0. In this example, com0 is a
+                configuration channel. Default value: None Obtain the path list for a
+                previously created path with get_path.
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        path_list_ctype = ctypes.create_string_buffer(path_list.encode(self._encoding))  # case C020
+        error_code = self._library.niSwitch_SetPath(vi_ctype, path_list_ctype)
+        self._attribute_cache.clear()
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def wait_for_debounce(self, maximum_time_ms=datetime.timedelta(milliseconds=5000)):
+        '''wait_for_debounce
+
+        Pauses until all created paths have settled. If the time you specify
+        with the Maximum Time (ms) parameter elapsed before the switch paths
+        have settled, this method returns the
+        NISWITCH_ERROR_MAX_TIME_EXCEEDED error.
+
+        Note:
+        This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.
+
+        Args:
+            maximum_time_ms (int): Specifies the maximum length of time to wait for all relays in the
+                switch module to activate or deactivate. If the specified time elapses
+                before all relays active or deactivate, a timeout error is returned.
+                Default Value:5000 ms
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        maximum_time_ms_ctype = _converters.convert_timedelta_to_milliseconds(maximum_time_ms, visatype.ViInt32)  # case S140
+        error_code = self._library.niSwitch_WaitForDebounce(vi_ctype, maximum_time_ms_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def wait_for_scan_complete(self, maximum_time_ms=datetime.timedelta(milliseconds=5000)):
+        '''wait_for_scan_complete
+
+        Pauses until the switch module stops scanning or the maximum time has
+        elapsed and returns a timeout error. If the time you specify with the
+        Maximum Time (ms) parameter elapsed before the scanning operation has
+        finished, this method returns the NISWITCH_ERROR_MAX_TIME_EXCEEDED
+        error.
+
+        Note:
+        This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.
+
+        Args:
+            maximum_time_ms (int): Specifies the maximum length of time to wait for the switch module to
+                stop scanning. If the specified time elapses before the scan ends,
+                NISWITCH_ERROR_MAX_TIME_EXCEEDED error is returned. Default
+                Value:5000 ms
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        maximum_time_ms_ctype = _converters.convert_timedelta_to_milliseconds(maximum_time_ms, visatype.ViInt32)  # case S140
+        error_code = self._library.niSwitch_WaitForScanComplete(vi_ctype, maximum_time_ms_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def _close(self):
+        '''_close
+
+        Terminates the NI-SWITCH session and all of its properties and
+        deallocates any memory resources the driver uses. Notes: (1) You must
+        unlock the session before calling _close. (2) After calling
+        _close, you cannot use the instrument driver again until you
+        call init or InitWithOptions.
+
+        Note:
+        One or more of the referenced methods are not in the Python API for this driver.
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        error_code = self._library.niSwitch_close(vi_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def reset(self):
+        '''reset
+
+        Disconnects all created paths and returns the switch module to the state
+        at initialization. Configuration channel and source channel settings
+        remain unchanged.
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        error_code = self._library.niSwitch_reset(vi_ctype)
+        self._attribute_cache.clear()
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def self_test(self):
+        '''self_test
+
+        Verifies that the driver can communicate with the switch module.
+
+        Note:
+        This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.
+
+        Returns:
+            self_test_result (int): Value returned from the switch device self-test. Passed 0 Failed 1
+
+            self_test_message (str): Self-test response string from the switch device. You must pass a ViChar
+                array with at least 256 bytes.
+
+        '''
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        self_test_result_ctype = visatype.ViInt16()  # case S200
+        self_test_message_ctype = (visatype.ViChar * 256)()  # case C070
+        error_code = self._library.niSwitch_self_test(vi_ctype, None if self_test_result_ctype is None else (ctypes.pointer(self_test_result_ctype)), self_test_message_ctype)
+        self._attribute_cache.clear()
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return int(self_test_result_ctype.value), self_test_message_ctype.value.decode(self._encoding)
+
+
+
@@ -0,0 +1,236 @@
+enums =
+{   'ApertureTimeUnits': {   'codegen_method': 'public',
+                             'python_name': 'ApertureTimeUnits',
+                             'values': [   {'documentation': {'description': 'Specifies aperture time in seconds.'}, 'name': 'NIDCPOWER_VAL_SECONDS', 'python_name': 'SECONDS', 'value': 1028},
+                                           {   'documentation': {'description': 'Specifies aperture time in power line cycles (PLCs).'},
+                                               'name': 'NIDCPOWER_VAL_POWER_LINE_CYCLES',
+                                               'python_name': 'POWER_LINE_CYCLES',
+                                               'value': 1029}]},
+    'AutoZero': {   'codegen_method': 'public',
+                    'python_name': 'AutoZero',
+                    'values': [   {'documentation': {'description': 'Disables auto zero.'}, 'name': 'NIDCPOWER_VAL_OFF', 'python_name': 'OFF', 'value': 0},
+                                  {'documentation': {'description': 'Makes zero conversions for every measurement.'}, 'name': 'NIDCPOWER_VAL_ON', 'python_name': 'ON', 'value': 1},
+                                  {   'documentation': {   'description': 'Makes zero conversions following the first measurement after initiating the device.  The device uses these zero conversions '
+                                                                          'for the preceding measurement and future  measurements until the device is reinitiated.'},
+                                      'name': 'NIDCPOWER_VAL_ONCE',
+                                      'python_name': 'ONCE',
+                                      'value': 1024}]},
+    'ComplianceLimitSymmetry': {   'codegen_method': 'public',
+                                   'python_name': 'ComplianceLimitSymmetry',
+                                   'values': [   {   'documentation': {'description': 'Compliance limits are specified symmetrically about 0.'},
+                                                     'name': 'SYMMETRIC',
+                                                     'python_name': 'SYMMETRIC',
+                                                     'value': 0},
+                                                 {   'documentation': {'description': 'Compliance limits can be specified asymmetrically with respect to 0.'},
+                                                     'name': 'ASYMMETRIC',
+                                                     'python_name': 'ASYMMETRIC',
+                                                     'value': 1}]},
+    'CurrentLimitBehavior': {   'codegen_method': 'no',
+                                'python_name': 'CurrentLimitBehavior',
+                                'values': [   {'documentation': {'description': ''}, 'name': 'CURRENT_REGULATE', 'prefix': 'CURRENT_', 'python_name': 'REGULATE', 'value': 13613},
+                                              {'documentation': {'description': ''}, 'name': 'CURRENT_TRIP', 'prefix': 'CURRENT_', 'python_name': 'TRIP', 'value': 13614}]},
+    'DCNoiseRejection': {   'codegen_method': 'public',
+                            'python_name': 'DCNoiseRejection',
+                            'values': [   {   'documentation': {'description': 'Second-order rejection of DC noise.'},
+                                              'name': 'NIDCPOWER_VAL_DC_NOISE_REJECTION_SECOND_ORDER',
+                                              'prefix': 'DC_NOISE_REJECTION_',
+                                              'python_name': 'SECOND_ORDER',
+                                              'value': 1043},
+                                          {   'documentation': {'description': 'Normal rejection of DC noise.'},
+                                              'name': 'NIDCPOWER_VAL_DC_NOISE_REJECTION_NORMAL',
+                                              'prefix': 'DC_NOISE_REJECTION_',
+                                              'python_name': 'NORMAL',
+                                              'value': 1044}]},
+    'DigitalEdge': {   'codegen_method': 'public',
+                       'python_name': 'DigitalEdge',
+                       'values': [   {   'documentation': {'description': 'Asserts the trigger on the rising edge of the digital signal.'},
+                                         'name': 'NIDCPOWER_VAL_RISING',
+                                         'python_name': 'RISING',
+                                         'value': 1016},
+                                     {   'documentation': {'description': 'Asserts the trigger on the falling edge of the digital signal.'},
+                                         'name': 'NIDCPOWER_VAL_FALLING',
+                                         'python_name': 'FALLING',
+                                         'value': 1017}]},
+    'Event': {   'codegen_method': 'public',
+                 'python_name': 'Event',
+                 'values': [   {'name': 'NIDCPOWER_VAL_SOURCE_COMPLETE', 'python_name': 'SOURCE_COMPLETE', 'value': 1030},
+                               {'name': 'NIDCPOWER_VAL_MEASURE_COMPLETE', 'python_name': 'MEASURE_COMPLETE', 'value': 1031},
+                               {'name': 'NIDCPOWER_VAL_SEQUENCE_ITERATION_COMPLETE', 'python_name': 'SEQUENCE_ITERATION_COMPLETE', 'value': 1032},
+                               {'name': 'NIDCPOWER_VAL_SEQUENCE_ENGINE_DONE', 'python_name': 'SEQUENCE_ENGINE_DONE', 'value': 1033},
+                               {'name': 'NIDCPOWER_VAL_PULSE_COMPLETE', 'python_name': 'PULSE_COMPLETE', 'value': 1051},
+                               {'name': 'NIDCPOWER_VAL_READY_FOR_PULSE_TRIGGER', 'python_name': 'READY_FOR_PULSE_TRIGGER', 'value': 1052}]},
+    'ExportSignal': {   'codegen_method': 'public',
+                        'python_name': 'ExportSignal',
+                        'values': [   {   'documentation': {'description': 'Exports the Source Complete event.'},
+                                          'name': 'NIDCPOWER_VAL_SOURCE_COMPLETE_EVENT',
+                                          'python_name': 'SOURCE_COMPLETE_EVENT',
+                                          'value': 1030},
+                                      {   'documentation': {'description': 'Exports the Measure Complete event.'},
+                                          'name': 'NIDCPOWER_VAL_MEASURE_COMPLETE_EVENT',
+                                          'python_name': 'MEASURE_COMPLETE_EVENT',
+                                          'value': 1031},
+                                      {   'documentation': {'description': 'Exports the Sequence Iteration Complete event.'},
+                                          'name': 'NIDCPOWER_VAL_SEQUENCE_ITERATION_COMPLETE_EVENT',
+                                          'python_name': 'SEQUENCE_ITERATION_COMPLETE_EVENT',
+                                          'value': 1032},
+                                      {   'documentation': {'description': 'Exports the Sequence Engine Done event.'},
+                                          'name': 'NIDCPOWER_VAL_SEQUENCE_ENGINE_DONE_EVENT',
+                                          'python_name': 'SEQUENCE_ENGINE_DONE_EVENT',
+                                          'value': 1033},
+                                      {   'documentation': {'description': 'Exports the Pulse Complete event.'},
+                                          'name': 'NIDCPOWER_VAL_PULSE_COMPLETE_EVENT',
+                                          'python_name': 'PULSE_COMPLETE_EVENT',
+                                          'value': 1051},
+                                      {   'documentation': {'description': 'Exports the Ready Pulse Trigger event.'},
+                                          'name': 'NIDCPOWER_VAL_READY_FOR_PULSE_TRIGGER_EVENT',
+                                          'python_name': 'READY_FOR_PULSE_TRIGGER_EVENT',
+                                          'value': 1052},
+                                      {'documentation': {'description': 'Exports the Start trigger.'}, 'name': 'NIDCPOWER_VAL_START_TRIGGER', 'python_name': 'START_TRIGGER', 'value': 1034},
+                                      {'documentation': {'description': 'Exports the Source trigger.'}, 'name': 'NIDCPOWER_VAL_SOURCE_TRIGGER', 'python_name': 'SOURCE_TRIGGER', 'value': 1035},
+                                      {'documentation': {'description': 'Exports the Measure trigger.'}, 'name': 'NIDCPOWER_VAL_MEASURE_TRIGGER', 'python_name': 'MEASURE_TRIGGER', 'value': 1036},
+                                      {   'documentation': {'description': 'Exports the Sequence Advance trigger.'},
+                                          'name': 'NIDCPOWER_VAL_SEQUENCE_ADVANCE_TRIGGER',
+                                          'python_name': 'SEQUENCE_ADVANCE_TRIGGER',
+                                          'value': 1037},
+                                      {'documentation': {'description': 'Exports the Pulse trigger.'}, 'name': 'NIDCPOWER_VAL_PULSE_TRIGGER', 'python_name': 'PULSE_TRIGGER', 'value': 1053}]},
+    'MeasureWhen': {   'codegen_method': 'public',
+                       'python_name': 'MeasureWhen',
+                       'values': [   {   'documentation': {'description': 'Acquires a measurement after each Source Complete event completes.'},
+                                         'name': 'NIDCPOWER_VAL_AUTOMATICALLY_AFTER_SOURCE_COMPLETE',
+                                         'python_name': 'AUTOMATICALLY_AFTER_SOURCE_COMPLETE',
+                                         'value': 1025},
+                                     {   'documentation': {'description': 'Acquires a measurement when the niDCPower_Measure function or niDCPower_MeasureMultiple function is called.'},
+                                         'name': 'NIDCPOWER_VAL_ON_DEMAND',
+                                         'python_name': 'ON_DEMAND',
+                                         'value': 1026},
+                                     {   'documentation': {'description': 'Acquires a measurement when a Measure trigger is received.'},
+                                         'name': 'NIDCPOWER_VAL_ON_MEASURE_TRIGGER',
+                                         'python_name': 'ON_MEASURE_TRIGGER',
+                                         'value': 1027}]},
+    'MeasurementTypes': {   'codegen_method': 'public',
+                            'python_name': 'MeasurementTypes',
+                            'values': [   {   'documentation': {'description': 'The device measures current.'},
+                                              'name': 'NIDCPOWER_VAL_MEASURE_CURRENT',
+                                              'prefix': 'MEASURE_',
+                                              'python_name': 'CURRENT',
+                                              'value': 0},
+                                          {   'documentation': {'description': 'The device measures voltage.'},
+                                              'name': 'NIDCPOWER_VAL_MEASURE_VOLTAGE',
+                                              'prefix': 'MEASURE_',
+                                              'python_name': 'VOLTAGE',
+                                              'value': 1}]},
+    'OutputCapacitance': {   'codegen_method': 'public',
+                             'python_name': 'OutputCapacitance',
+                             'values': [   {'documentation': {'description': 'Output Capacitance is low.'}, 'name': 'NIDCPOWER_VAL_LOW', 'python_name': 'LOW', 'value': 1010},
+                                           {'documentation': {'description': 'Output Capacitance is high.'}, 'name': 'NIDCPOWER_VAL_HIGH', 'python_name': 'HIGH', 'value': 1011}]},
+    'OutputFunction': {   'codegen_method': 'public',
+                          'python_name': 'OutputFunction',
+                          'values': [   {'documentation': {'description': 'Sets the output function to DC voltage.'}, 'name': 'NIDCPOWER_VAL_DC_VOLTAGE', 'python_name': 'DC_VOLTAGE', 'value': 1006},
+                                        {'documentation': {'description': 'Sets the output function to DC current.'}, 'name': 'NIDCPOWER_VAL_DC_CURRENT', 'python_name': 'DC_CURRENT', 'value': 1007},
+                                        {   'documentation': {'description': 'Sets the output function to pulse voltage.'},
+                                            'name': 'NIDCPOWER_VAL_PULSE_VOLTAGE',
+                                            'python_name': 'PULSE_VOLTAGE',
+                                            'value': 1049},
+                                        {   'documentation': {'description': 'Sets the output function to pulse current.'},
+                                            'name': 'NIDCPOWER_VAL_PULSE_CURRENT',
+                                            'python_name': 'PULSE_CURRENT',
+                                            'value': 1050}]},
+    'OutputStates': {   'codegen_method': 'public',
+                        'python_name': 'OutputStates',
+                        'values': [   {   'documentation': {'description': 'The device maintains a constant voltage by adjusting the current '},
+                                          'name': 'NIDCPOWER_VAL_OUTPUT_CONSTANT_VOLTAGE',
+                                          'prefix': 'OUTPUT_CONSTANT_',
+                                          'python_name': 'VOLTAGE',
+                                          'value': 0},
+                                      {   'documentation': {'description': 'The device maintains a constant current by adjusting the voltage.'},
+                                          'name': 'NIDCPOWER_VAL_OUTPUT_CONSTANT_CURRENT',
+                                          'prefix': 'OUTPUT_CONSTANT_',
+                                          'python_name': 'CURRENT',
+                                          'value': 1}]},
+    'Polarity': {   'codegen_method': 'public',
+                    'python_name': 'Polarity',
+                    'values': [   {   'documentation': {   'description': 'A high pulse occurs when the event is generated.  The exported signal is low level both before and after the event is '
+                                                                          'generated.'},
+                                      'name': 'NIDCPOWER_VAL_ACTIVE_HIGH',
+                                      'prefix': 'ACTIVE_',
+                                      'python_name': 'HIGH',
+                                      'value': 1018},
+                                  {   'documentation': {   'description': 'A low pulse occurs when the event is generated.  The exported signal is high level both before and after the event is '
+                                                                          'generated.'},
+                                      'name': 'NIDCPOWER_VAL_ACTIVE_LOW',
+                                      'prefix': 'ACTIVE_',
+                                      'python_name': 'LOW',
+                                      'value': 1019}]},
+    'PowerSource': {   'codegen_method': 'public',
+                       'python_name': 'PowerSource',
+                       'values': [   {'documentation': {'description': 'Uses the PXI chassis power source.'}, 'name': 'NIDCPOWER_VAL_INTERNAL', 'python_name': 'INTERNAL', 'value': 1003},
+                                     {   'documentation': {'description': 'Uses the auxiliary power source connected to the device.'},
+                                         'name': 'NIDCPOWER_VAL_AUXILIARY',
+                                         'python_name': 'AUXILIARY',
+                                         'value': 1004},
+                                     {   'documentation': {'description': 'Uses the auxiliary power source if it is available; otherwise uses the PXI chassis power source.'},
+                                         'name': 'NIDCPOWER_VAL_AUTOMATIC',
+                                         'python_name': 'AUTOMATIC',
+                                         'value': 1005}]},
+    'PowerSourceInUse': {   'codegen_method': 'public',
+                            'python_name': 'PowerSourceInUse',
+                            'values': [   {'documentation': {'description': 'Uses the PXI chassis power source.'}, 'name': 'NIDCPOWER_VAL_INTERNAL', 'python_name': 'INTERNAL', 'value': 1003},
+                                          {   'documentation': {   'description': 'Uses the auxiliary power source connected to the device. Only the NI PXI-4110,  NI PXIe-4112, NI PXIe-4113, and NI '
+                                                                                  'PXI-4130 support this value. This is the only supported value  for the NI PXIe-4112 and NI PXIe-4113.'},
+                                              'name': 'NIDCPOWER_VAL_AUXILIARY',
+                                              'python_name': 'AUXILIARY',
+                                              'value': 1004}]},
+    'SelfCalibrationPersistence': {   'codegen_method': 'public',
+                                      'python_name': 'SelfCalibrationPersistence',
+                                      'values': [   {   'documentation': {'description': 'Keep new self calibration values in memory only.'},
+                                                        'name': 'NIDCPOWER_VAL_KEEP_IN_MEMORY',
+                                                        'python_name': 'KEEP_IN_MEMORY',
+                                                        'value': 1045},
+                                                    {   'documentation': {'description': 'Write new self calibration values to hardware.'},
+                                                        'name': 'NIDCPOWER_VAL_WRITE_TO_EEPROM',
+                                                        'python_name': 'WRITE_TO_EEPROM',
+                                                        'value': 1046}]},
+    'SendSoftwareEdgeTriggerType': {   'codegen_method': 'public',
+                                       'python_name': 'SendSoftwareEdgeTriggerType',
+                                       'values': [   {'name': 'NIDCPOWER_VAL_START', 'python_name': 'START', 'value': 1034},
+                                                     {'name': 'NIDCPOWER_VAL_SOURCE', 'python_name': 'SOURCE', 'value': 1035},
+                                                     {'name': 'NIDCPOWER_VAL_MEASURE', 'python_name': 'MEASURE', 'value': 1036},
+                                                     {'name': 'NIDCPOWER_VAL_SEQUENCE_ADVANCE', 'python_name': 'SEQUENCE_ADVANCE', 'value': 1037},
+                                                     {'name': 'NIDCPOWER_VAL_PULSE', 'python_name': 'PULSE', 'value': 1053}]},
+    'Sense': {   'codegen_method': 'public',
+                 'python_name': 'Sense',
+                 'values': [   {'documentation': {'description': 'Local sensing is selected.'}, 'name': 'NIDCPOWER_VAL_LOCAL', 'python_name': 'LOCAL', 'value': 1008},
+                               {'documentation': {'description': 'Remote sensing is selected.'}, 'name': 'NIDCPOWER_VAL_REMOTE', 'python_name': 'REMOTE', 'value': 1009}]},
+    'SourceMode': {   'codegen_method': 'public',
+                      'python_name': 'SourceMode',
+                      'values': [   {   'documentation': {'description': 'The source unit applies a single source configuration.'},
+                                        'name': 'NIDCPOWER_VAL_SINGLE_POINT',
+                                        'python_name': 'SINGLE_POINT',
+                                        'value': 1020},
+                                    {   'documentation': {'description': 'The source unit applies a list of voltage or current configurations sequentially.'},
+                                        'name': 'NIDCPOWER_VAL_SEQUENCE',
+                                        'python_name': 'SEQUENCE',
+                                        'value': 1021}]},
+    'TransientResponse': {   'codegen_method': 'public',
+                             'python_name': 'TransientResponse',
+                             'values': [   {   'documentation': {'description': 'The output responds to changes in load at a normal speed.'},
+                                               'name': 'NIDCPOWER_VAL_NORMAL',
+                                               'python_name': 'NORMAL',
+                                               'value': 1038},
+                                           {'documentation': {'description': 'The output responds to changes in load quickly.'}, 'name': 'NIDCPOWER_VAL_FAST', 'python_name': 'FAST', 'value': 1039},
+                                           {'documentation': {'description': 'The output responds to changes in load slowly.'}, 'name': 'NIDCPOWER_VAL_SLOW', 'python_name': 'SLOW', 'value': 1041},
+                                           {   'documentation': {'description': 'The output responds to changes in load based on specified values.'},
+                                               'name': 'NIDCPOWER_VAL_CUSTOM',
+                                               'python_name': 'CUSTOM',
+                                               'value': 1042}]},
+    'TriggerType': {   'codegen_method': 'public',
+                       'python_name': 'TriggerType',
+                       'values': [   {'documentation': {'description': 'No trigger is configured.'}, 'name': 'NIDCPOWER_VAL_NONE', 'python_name': 'NONE', 'value': 1012},
+                                     {   'documentation': {'description': 'The data operation starts when a digital edge is detected.'},
+                                         'name': 'NIDCPOWER_VAL_DIGITAL_EDGE',
+                                         'python_name': 'DIGITAL_EDGE',
+                                         'value': 1014},
+                                     {   'documentation': {'description': 'The data operation starts when a software trigger occurs.'},
+                                         'name': 'NIDCPOWER_VAL_SOFTWARE_EDGE',
+                                         'python_name': 'SOFTWARE_EDGE',
+                                         'value': 1015}]}}
\ No newline at end of file
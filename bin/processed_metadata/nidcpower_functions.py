@@ -0,0 +1,9529 @@
+function =
+{   'Abort': {   'blocking': False,
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Transitions the NI-DCPower session from the Running state to the\n'
+                                                     'Committed state. If a sequence is running, it is stopped. Any\n'
+                                                     'configuration functions called after this function are not applied until\n'
+                                                     'the niDCPower_Initiate function is called. If power output is enabled\n'
+                                                     'when you call the niDCPower_Abort function, the output channels remain\n'
+                                                     'in their current state and continue providing power.\n'
+                                                     '\n'
+                                                     'Use the niDCPower_ConfigureOutputEnabled function to disable power\n'
+                                                     'output on a per channel basis. Use the niDCPower_reset function to\n'
+                                                     'disable output on all channels.\n'
+                                                     '\n'
+                                                     'Refer to the `Programming\n'
+                                                     'States <REPLACE_DRIVER_SPECIFIC_URL_1(programmingstates)>`__ topic in\n'
+                                                     'the *NI DC Power Supplies and SMUs Help* for information about the\n'
+                                                     'specific NI-DCPower software states.\n'
+                                                     '\n'
+                                                     '**Related Topics:**\n'
+                                                     '\n'
+                                                     '`Programming\n'
+                                                     'States <REPLACE_DRIVER_SPECIFIC_URL_1(programmingstates)>`__\n',
+                                      'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                 'has_repeated_capability': False,
+                 'invalidates_attribute_cache': False,
+                 'is_error_handling': False,
+                 'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                 'name': 'Abort',
+                 'parameters': [   {   'ctypes_type': 'ViSession',
+                                       'ctypes_type_library_call': 'ViSession',
+                                       'ctypes_variable_name': 'vi_ctype',
+                                       'direction': 'in',
+                                       'documentation': {'description': '\nIdentifies a particular instrument session. **vi** is obtained from the\nniDCPower_InitializeWithChannels function.\n'},
+                                       'enum': None,
+                                       'is_buffer': False,
+                                       'is_repeated_capability': False,
+                                       'is_session_handle': True,
+                                       'is_string': False,
+                                       'library_method_call_snippet': 'vi_ctype',
+                                       'name': 'vi',
+                                       'numpy': False,
+                                       'numpy_into_return': False,
+                                       'python_name': 'vi',
+                                       'python_name_or_default_for_init': 'vi',
+                                       'python_name_with_default': 'vi',
+                                       'python_name_with_doc_default': 'vi',
+                                       'python_type': 'int',
+                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                       'type': 'ViSession',
+                                       'use_array': False,
+                                       'use_in_python_api': True,
+                                       'use_list': False}],
+                 'python_code_variables': [],
+                 'python_name': 'abort',
+                 'render_in_library': True,
+                 'render_in_session_base': False,
+                 'returns': 'ViStatus'},
+    'CalAdjustCurrentLimit': {   'codegen_method': 'no',
+                                 'documentation': {   'description': '\n'
+                                                                     'Calculates the calibration constants for the current limit for the\n'
+                                                                     'specified output channel and range. This function compares the array in\n'
+                                                                     '**requestedOutputs** to the array in **measuredOutputs** and calculates\n'
+                                                                     'the calibration constants for the current limit returned by the device.\n'
+                                                                     'Refer to the calibration procedure for the device you are calibrating\n'
+                                                                     'for detailed instructions on the appropriate use of this function. This\n'
+                                                                     'function can only be called from an external calibration session.\n',
+                                                      'note': '\n'
+                                                              'This function is not supported on all devices. Refer to `Supported\n'
+                                                              'Functions by\n'
+                                                              "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                              'for more information about supported devices.\n'},
+                                 'parameters': [   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Identifies a particular instrument calibration session. **vi** is\n'
+                                                                                           'obtained from the niDCPower_InitExtCal function.\n',
+                                                                            'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                       'name': 'vi',
+                                                       'type': 'ViSession'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {'description': 'Specifies the channel name to which these calibration settings apply.'},
+                                                       'name': 'channelName',
+                                                       'type': 'ViChar[]'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {'description': '\nSpecifies the range to calibrate with these settings. Only one channel\nat a time may be calibrated.\n'},
+                                                       'name': 'Range',
+                                                       'type': 'ViReal64'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {'description': '\nSpecifies the number of elements in **requestedOutputs** and\n**measuredOutputs**.\n'},
+                                                       'name': 'numberOfMeasurements',
+                                                       'type': 'ViUInt32'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Specifies an array of the output values that were requested in the\n'
+                                                                                           'niDCPower_ConfigureCurrentLimit function.\n',
+                                                                            'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                       'name': 'requestedOutputs',
+                                                       'type': 'ViReal64[]'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {'description': '\nSpecifies an array of the output values measured by an external\nprecision digital multimeter.\n'},
+                                                       'name': 'measuredOutputs',
+                                                       'type': 'ViReal64[]'}],
+                                 'returns': 'ViStatus'},
+    'CalAdjustCurrentMeasurement': {   'codegen_method': 'no',
+                                       'documentation': {   'description': '\n'
+                                                                           'Calibrates the current measurements returned by the niDCPower_Measure\n'
+                                                                           'function for the specified output channel. This function calculates new\n'
+                                                                           'calibration coefficients for the specified current measurement range\n'
+                                                                           'based on the **reportedOutputs** and **measuredOutputs**. Refer to the\n'
+                                                                           'calibration procedure for the device you are calibrating for detailed\n'
+                                                                           'instructions about the appropriate use of this function. This function\n'
+                                                                           'can only be called in an external calibration session.\n'},
+                                       'parameters': [   {   'direction': 'in',
+                                                             'documentation': {   'description': '\n'
+                                                                                                 'Identifies a particular instrument calibration session. **vi** is\n'
+                                                                                                 'obtained from the niDCPower_InitExtCal function.\n',
+                                                                                  'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                             'name': 'vi',
+                                                             'type': 'ViSession'},
+                                                         {   'direction': 'in',
+                                                             'documentation': {'description': '\nSpecifies the output channel name to which these calibration settings\napply.\n'},
+                                                             'name': 'channelName',
+                                                             'type': 'ViChar[]'},
+                                                         {   'direction': 'in',
+                                                             'documentation': {   'description': '\n'
+                                                                                                 'Specifies the range to calibrate with these settings. Only one channel\n'
+                                                                                                 'at a time may be calibrated.\n'},
+                                                             'name': 'Range',
+                                                             'type': 'ViReal64'},
+                                                         {   'direction': 'in',
+                                                             'documentation': {'description': '\nSpecifies the number of elements in **reportedOutputs** and\n**measuredOutputs**.\n'},
+                                                             'name': 'numberOfMeasurements',
+                                                             'type': 'ViUInt32'},
+                                                         {   'direction': 'in',
+                                                             'documentation': {'description': '\nSpecifies an array of the output values that were returned by the\nniDCPower_Measure function.\n'},
+                                                             'name': 'reportedOutputs',
+                                                             'type': 'ViReal64[]'},
+                                                         {   'direction': 'in',
+                                                             'documentation': {'description': '\nSpecifies an array of the output values measured by an external\nprecision digital multimeter.\n'},
+                                                             'name': 'measuredOutputs',
+                                                             'type': 'ViReal64[]'}],
+                                       'returns': 'ViStatus'},
+    'CalAdjustInternalReference': {   'codegen_method': 'no',
+                                      'documentation': {   'description': '\n'
+                                                                          'Programs the adjusted reference value to the device. Refer to the\n'
+                                                                          'calibration procedure for the device you are calibrating for detailed\n'
+                                                                          'instructions on the appropriate use of this function. This function can\n'
+                                                                          'only be called from an external calibration session.\n',
+                                                           'note': '\n'
+                                                                   'This function is not supported on all devices. Refer to `Supported\n'
+                                                                   'Functions by\n'
+                                                                   "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                                   'for more information about supported devices.\n'},
+                                      'parameters': [   {   'direction': 'in',
+                                                            'documentation': {   'description': '\n'
+                                                                                                'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                                'niDCPower_InitializeWithChannels function.\n'},
+                                                            'name': 'vi',
+                                                            'type': 'ViSession'},
+                                                        {   'direction': 'in',
+                                                            'documentation': {   'description': '\nSpecifies the internal reference to be adjusted.\n**Defined Values**:\n',
+                                                                                 'note': [   '\n'
+                                                                                             'One or more of the referenced values are not in the Python API for this driver. Enums that only define '
+                                                                                             'values, or represent True/False, have been removed.\n'],
+                                                                                 'table_body': [   [   'NIDCPOWER_VAL_INTERNAL_REFERENCE_5V (1054)',
+                                                                                                       'Calibration pin connected to 5 V internal reference.'],
+                                                                                                   [   'NIDCPOWER_VAL_INTERNAL_REFERENCE_100KOHM (1055)',
+                                                                                                       'Calibration pin connected to 100 kΩ internal reference.']]},
+                                                            'name': 'internalReference',
+                                                            'type': 'ViInt32'},
+                                                        {   'direction': 'in',
+                                                            'documentation': {'description': '\nSpecifies the updated value of the internal reference that will be\nprogrammed to the device.\n'},
+                                                            'name': 'adjustedInternalReference',
+                                                            'type': 'ViReal64'}],
+                                      'returns': 'ViStatus'},
+    'CalAdjustOutputResistance': {   'codegen_method': 'no',
+                                     'documentation': {   'description': '\n'
+                                                                         'Compares the array in **requestedOutputs** to the array in\n'
+                                                                         '**measuredOutputs** and calculates the calibration constants for the\n'
+                                                                         'output resistance of the specified channel. Refer to the calibration\n'
+                                                                         'procedure for the device you are calibrating for detailed instructions\n'
+                                                                         'on the appropriate use of this function. This function can only be\n'
+                                                                         'called from an external calibration session.\n',
+                                                          'note': '\n'
+                                                                  'This function is not supported on all devices. Refer to `Supported\n'
+                                                                  'Functions by\n'
+                                                                  "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                                  'for more information about supported devices.\n'},
+                                     'parameters': [   {   'direction': 'in',
+                                                           'documentation': {   'description': '\n'
+                                                                                               'Identifies a particular instrument calibration session. **vi** is\n'
+                                                                                               'obtained from the niDCPower_InitExtCal function.\n',
+                                                                                'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                           'name': 'vi',
+                                                           'type': 'ViSession'},
+                                                       {   'direction': 'in',
+                                                           'documentation': {   'description': '\n'
+                                                                                               'Specifies the output channel name to which these calibration settings\n'
+                                                                                               'apply. Only one channel at a time can be calibrated.\n'},
+                                                           'name': 'channelName',
+                                                           'type': 'ViChar[]'},
+                                                       {   'direction': 'in',
+                                                           'documentation': {'description': '\nSpecifies the number of elements in **requestedOutputs** and\n**measuredOutputs**.\n'},
+                                                           'name': 'numberOfMeasurements',
+                                                           'type': 'ViUInt32'},
+                                                       {   'direction': 'in',
+                                                           'documentation': {   'description': '\n'
+                                                                                               'Specifies an array of the output values that were requested in the\n'
+                                                                                               'niDCPower_ConfigureOutputResistance function.\n',
+                                                                                'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                           'name': 'requestedOutputs',
+                                                           'type': 'ViReal64[]'},
+                                                       {   'direction': 'in',
+                                                           'documentation': {'description': '\nSpecifies an array of the output values measured by an external\nprecision digital multimeter.\n'},
+                                                           'name': 'measuredOutputs',
+                                                           'type': 'ViReal64[]'}],
+                                     'returns': 'ViStatus'},
+    'CalAdjustResidualCurrentOffset': {   'codegen_method': 'no',
+                                          'documentation': {   'description': '\n'
+                                                                              'Calculates the calibration constants for the residual current offsets\n'
+                                                                              'for the specified output channel. Residual offsets account for minor\n'
+                                                                              'offset effects on the device that lie outside of the self-calibration\n'
+                                                                              'circuitry. These offsets can include multiplexer input offsets and\n'
+                                                                              'leakage effects from internal switching.\n'
+                                                                              '\n'
+                                                                              'This function requires that the output be open prior to it being\n'
+                                                                              'invoked.\n'
+                                                                              '\n'
+                                                                              'Refer to the calibration procedure for the device you are calibrating\n'
+                                                                              'for detailed instructions on the appropriate use of this function. This\n'
+                                                                              'function can be called only in an external calibration session.\n',
+                                                               'note': '\n'
+                                                                       'This function is not supported on all devices. Refer to `Supported\n'
+                                                                       'Functions by\n'
+                                                                       "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                                       'for more information about supported devices.\n'},
+                                          'parameters': [   {   'direction': 'in',
+                                                                'documentation': {   'description': '\n'
+                                                                                                    'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                                    'niDCPower_InitializeWithChannels function.\n'},
+                                                                'name': 'vi',
+                                                                'type': 'ViSession'},
+                                                            {   'direction': 'in',
+                                                                'documentation': {   'description': '\n'
+                                                                                                    'Specifies the output channel(s) to which this configuration value\n'
+                                                                                                    'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                                    'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                                    '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                                    'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                                    'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                                    'In the Running state, multiple output channel configurations are\n'
+                                                                                                    'performed sequentially based on the order specified in this parameter.\n'},
+                                                                'name': 'channelName',
+                                                                'type': 'ViChar[]'}],
+                                          'returns': 'ViStatus'},
+    'CalAdjustResidualVoltageOffset': {   'codegen_method': 'no',
+                                          'documentation': {   'description': '\n'
+                                                                              'Calculates the calibration constants for the residual voltage offsets\n'
+                                                                              'for the specified output channel. Residual offsets account for minor\n'
+                                                                              'offset effects on the device that lie outside of the self-calibration\n'
+                                                                              'circuitry. These offsets can include multiplexer input offsets and\n'
+                                                                              'leakage effects from internal switching.\n'
+                                                                              '\n'
+                                                                              'This function requires that the output be shorted prior to it being\n'
+                                                                              'invoked.\n'
+                                                                              '\n'
+                                                                              'Refer to the calibration procedure for the device you are calibrating\n'
+                                                                              'for detailed instructions on the appropriate use of this function. This\n'
+                                                                              'function can be called only in an external calibration session.\n',
+                                                               'note': '\n'
+                                                                       'This function is not supported on all devices. Refer to `Supported\n'
+                                                                       'Functions by\n'
+                                                                       "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                                       'for more information about supported devices.\n'},
+                                          'parameters': [   {   'direction': 'in',
+                                                                'documentation': {   'description': '\n'
+                                                                                                    'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                                    'niDCPower_InitializeWithChannels function.\n'},
+                                                                'name': 'vi',
+                                                                'type': 'ViSession'},
+                                                            {   'direction': 'in',
+                                                                'documentation': {   'description': '\n'
+                                                                                                    'Specifies the output channel(s) to which this configuration value\n'
+                                                                                                    'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                                    'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                                    '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                                    'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                                    'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                                    'In the Running state, multiple output channel configurations are\n'
+                                                                                                    'performed sequentially based on the order specified in this parameter.\n'},
+                                                                'name': 'channelName',
+                                                                'type': 'ViChar[]'}],
+                                          'returns': 'ViStatus'},
+    'CalAdjustVoltageLevel': {   'codegen_method': 'no',
+                                 'documentation': {   'description': '\n'
+                                                                     'Calculates the calibration constants for the voltage level for the\n'
+                                                                     'specified output channel. This function compares the array in\n'
+                                                                     '**requestedOutputs** to the array in **measuredOutputs** and calculates\n'
+                                                                     'the calibration constants for the voltage level of the output channel.\n'
+                                                                     'Refer to the calibration procedure of the device you are calibrating for\n'
+                                                                     'detailed instructions on the appropriate use of this function. This\n'
+                                                                     'function can be called only in an external calibration session.\n',
+                                                      'note': '\n'
+                                                              'This function is not supported on all devices. Refer to `Supported\n'
+                                                              'Functions by\n'
+                                                              "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                              'for more information about supported devices.\n'},
+                                 'parameters': [   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Identifies a particular instrument calibration session. **vi** is\n'
+                                                                                           'obtained from the niDCPower_InitExtCal function.\n',
+                                                                            'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                       'name': 'vi',
+                                                       'type': 'ViSession'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {'description': 'Specifies the output channel to which these calibration settings apply.'},
+                                                       'name': 'channelName',
+                                                       'type': 'ViChar[]'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {'description': '\nSpecifies the range to calibrate with these settings. Only one channel\nat a time may be calibrated.\n'},
+                                                       'name': 'Range',
+                                                       'type': 'ViReal64'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {'description': '\nSpecifies the number of elements in **requestedOutputs** and\n**measuredOutputs**.\n'},
+                                                       'name': 'numberOfMeasurements',
+                                                       'type': 'ViUInt32'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {   'description': '\nSpecifies an array of the output values requested in the\nniDCPower_ConfigureVoltageLevel function.\n',
+                                                                            'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                       'name': 'requestedOutputs',
+                                                       'type': 'ViReal64[]'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {'description': '\nSpecifies an array of the output values measured by an external\nprecision digital multimeter.\n'},
+                                                       'name': 'measuredOutputs',
+                                                       'type': 'ViReal64[]'}],
+                                 'returns': 'ViStatus'},
+    'CalAdjustVoltageMeasurement': {   'codegen_method': 'no',
+                                       'documentation': {   'description': '\n'
+                                                                           'Calculates the calibration constants for the voltage measurements\n'
+                                                                           'returned by the niDCPower_Measure function for the specified output\n'
+                                                                           'channel. This function compares the array in **reportedOutputs** to the\n'
+                                                                           'array in **measuredOutputs** and calculates the calibration constants\n'
+                                                                           'for the voltage measurements returned by the niDCPower_Measure\n'
+                                                                           'function. Refer to the calibration procedure for the device you are\n'
+                                                                           'calibrating for detailed instructions on the appropriate use of this\n'
+                                                                           'function. This function can only be called in an external calibration\n'
+                                                                           'session.\n'},
+                                       'parameters': [   {   'direction': 'in',
+                                                             'documentation': {   'description': '\n'
+                                                                                                 'Identifies a particular instrument calibration session. **vi** is\n'
+                                                                                                 'obtained from the niDCPower_InitExtCal function.\n',
+                                                                                  'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                             'name': 'vi',
+                                                             'type': 'ViSession'},
+                                                         {   'direction': 'in',
+                                                             'documentation': {'description': 'Specifies the channel name to which these calibration settings apply.'},
+                                                             'name': 'channelName',
+                                                             'type': 'ViChar[]'},
+                                                         {   'direction': 'in',
+                                                             'documentation': {   'description': '\n'
+                                                                                                 'Specifies the range to calibrate with these settings. Only one channel\n'
+                                                                                                 'at a time may be calibrated.\n'},
+                                                             'name': 'Range',
+                                                             'type': 'ViReal64'},
+                                                         {   'direction': 'in',
+                                                             'documentation': {'description': '\nSpecifies the number of elements in **reportedOutputs** and\n**measuredOutputs**.\n'},
+                                                             'name': 'numberOfMeasurements',
+                                                             'type': 'ViUInt32'},
+                                                         {   'direction': 'in',
+                                                             'documentation': {'description': '\nSpecifies an array of the output values that were returned by the\nniDCPower_Measure function.\n'},
+                                                             'name': 'reportedOutputs',
+                                                             'type': 'ViReal64[]'},
+                                                         {   'direction': 'in',
+                                                             'documentation': {'description': '\nSpecifies an array of the output values measured by an external\nprecision digital multimeter.\n'},
+                                                             'name': 'measuredOutputs',
+                                                             'type': 'ViReal64[]'}],
+                                       'returns': 'ViStatus'},
+    'CalSelfCalibrate': {   'codegen_method': 'no',
+                            'documentation': {   'description': '\n'
+                                                                'Performs a self-calibration upon the specified channel(s).\n'
+                                                                '\n'
+                                                                'This function disables the output, performs several internal\n'
+                                                                'calculations, and updates calibration values. The updated calibration\n'
+                                                                'values are written to the device hardware if the\n'
+                                                                'NIDCPOWER_ATTR_SELF_CALIBRATION_PERSISTENCE attribute is set to\n'
+                                                                'NIDCPOWER_VAL_WRITE_TO_EEPROM. Refer to the\n'
+                                                                'NIDCPOWER_ATTR_SELF_CALIBRATION_PERSISTENCE attribute topic for more\n'
+                                                                'information about the settings for this attribute.\n'
+                                                                '\n'
+                                                                'When calling niDCPower_CalSelfCalibrate with the PXIe-4162/4163,\n'
+                                                                'specify all channels of your PXIe-4162/4163 with the channelName input.\n'
+                                                                'You cannot self-calibrate a subset of PXIe-4162/4163 channels.\n'
+                                                                '\n'
+                                                                'Refer to the\n'
+                                                                '`Self-Calibration <REPLACE_DRIVER_SPECIFIC_URL_1(selfcal)>`__ topic for\n'
+                                                                'more information about this function.\n'
+                                                                '\n'
+                                                                '**Related Topics:**\n'
+                                                                '\n'
+                                                                '`Self-Calibration <REPLACE_DRIVER_SPECIFIC_URL_1(selfcal)>`__\n',
+                                                 'note': [   '\n'
+                                                             'This function is not supported on all devices. Refer to `Supported\n'
+                                                             'Functions by\n'
+                                                             "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                             'for more information about supported devices.\n',
+                                                             '\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                            'parameters': [   {   'direction': 'in',
+                                                  'documentation': {   'description': '\n'
+                                                                                      'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                      'niDCPower_InitializeWithChannels function.\n'},
+                                                  'name': 'vi',
+                                                  'type': 'ViSession'},
+                                              {   'direction': 'in',
+                                                  'documentation': {   'description': '\n'
+                                                                                      'Specifies the output channel(s) to which this configuration value\n'
+                                                                                      'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                      'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                      '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                      'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                      'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                      'In the Running state, multiple output channel configurations are\n'
+                                                                                      'performed sequentially based on the order specified in this parameter.\n'},
+                                                  'name': 'channelName',
+                                                  'type': 'ViChar[]'}],
+                            'returns': 'ViStatus'},
+    'ChangeExtCalPassword': {   'codegen_method': 'no',
+                                'documentation': {   'description': '\n'
+                                                                    'Changes the **password** that is required to initialize an external\n'
+                                                                    'calibration session. The **password** can be a maximum of four\n'
+                                                                    'alphanumeric characters. If you call this function in a session,\n'
+                                                                    '**password** is changed immediately. If you call this function in an\n'
+                                                                    'external calibration session, **password** is changed only after you\n'
+                                                                    'close the session using the niDCPower_CloseExtCal function with\n'
+                                                                    '**action** set to NIDCPOWER_VAL_COMMIT.\n',
+                                                     'note': [   '\nOne or more of the referenced functions are not in the Python API for this driver.\n',
+                                                                 '\n'
+                                                                 'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or represent '
+                                                                 'True/False, have been removed.\n']},
+                                'parameters': [   {   'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                          'niDCPower_InitExtCal or niDCPower_InitializeWithChannels function.\n',
+                                                                           'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                      'name': 'vi',
+                                                      'type': 'ViSession'},
+                                                  {   'direction': 'in',
+                                                      'documentation': {'description': 'Specifies the previous password used to protect the calibration values.'},
+                                                      'name': 'oldPassword',
+                                                      'type': 'ViChar[]'},
+                                                  {   'direction': 'in',
+                                                      'documentation': {'description': 'Specifies the new password to use to protect the calibration values.'},
+                                                      'name': 'newPassword',
+                                                      'type': 'ViChar[]'}],
+                                'returns': 'ViStatus'},
+    'ClearError': {   'codegen_method': 'no',
+                      'documentation': {   'description': '\n'
+                                                          '| Clears the error code and error description for the IVI session. If\n'
+                                                          '  the user specifies a valid IVI session for **vi**, this function\n'
+                                                          '  clears the error information for the session. If the user passes\n'
+                                                          '  VI_NULL for **vi**, this function clears the error information for\n'
+                                                          '  the current execution thread. If the ViSession parameter is an invalid\n'
+                                                          '  session, the function does nothing and returns an error.\n'
+                                                          '| The function clears the error code by setting it to VI_SUCCESS. If\n'
+                                                          '  the error description string is non-NULL, the function de-allocates\n'
+                                                          '  the error description string and sets the address to VI_NULL.\n'
+                                                          '| Maintaining the error information separately for each thread is useful\n'
+                                                          '  if the user does not have a session handle to pass to the\n'
+                                                          '  niDCPower_GetError function, which occurs when a call to\n'
+                                                          '  niDCPower_InitializeWithChannels fails.\n'},
+                      'parameters': [   {   'direction': 'in',
+                                            'documentation': {'description': '\nIdentifies a particular instrument session. **vi** is obtained from the\nniDCPower_InitializeWithChannels function.\n'},
+                                            'name': 'vi',
+                                            'type': 'ViSession'}],
+                      'returns': 'ViStatus'},
+    'ClearInterchangeWarnings': {   'codegen_method': 'no',
+                                    'documentation': {'description': 'Clears the list of current interchange warnings.'},
+                                    'parameters': [   {   'direction': 'in',
+                                                          'documentation': {   'description': '\n'
+                                                                                              'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                              'niDCPower_InitializeWithChannels function.\n'},
+                                                          'name': 'vi',
+                                                          'type': 'ViSession'}],
+                                    'returns': 'ViStatus'},
+    'CloseExtCal': {   'codegen_method': 'no',
+                       'documentation': {   'description': '\n'
+                                                           'Closes the session specified in **vi** and deallocates the resources\n'
+                                                           'that NI-DCPower reserved for calibration. Refer to the calibration\n'
+                                                           'procedure for the device you are calibrating for detailed instructions\n'
+                                                           'on the appropriate use of this function.\n'},
+                       'parameters': [   {   'direction': 'in',
+                                             'documentation': {   'description': '\n'
+                                                                                 'Identifies a particular instrument calibration session. **vi** is\n'
+                                                                                 'obtained from the niDCPower_InitExtCal function.\n',
+                                                                  'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                             'name': 'vi',
+                                             'type': 'ViSession'},
+                                         {   'direction': 'in',
+                                             'documentation': {   'description': '\nSpecifies how to use the calibration values from this session as the\nsession is closed.\n\n**Defined Values**:\n',
+                                                                  'note': [   '\n'
+                                                                              'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or '
+                                                                              'represent True/False, have been removed.\n'],
+                                                                  'table_body': [   ['NIDCPOWER_VAL_COMMIT (1002)', 'The new calibration constants are stored in the EEPROM.'],
+                                                                                    ['NIDCPOWER_VAL_CANCEL (1001)', 'The old calibration constants are kept, and the new ones are discarded.']]},
+                                             'name': 'Action',
+                                             'type': 'ViInt32'}],
+                       'returns': 'ViStatus'},
+    'Commit': {   'blocking': False,
+                  'codegen_method': 'public',
+                  'documentation': {   'description': '\n'
+                                                      'Applies previously configured settings to the device. Calling this\n'
+                                                      'function moves the NI-DCPower session from the Uncommitted state into\n'
+                                                      'the Committed state. After calling this function, modifying any\n'
+                                                      'attribute reverts the NI-DCPower session to the Uncommitted state. Use\n'
+                                                      'the niDCPower_Initiate function to transition to the Running state.\n'
+                                                      'Refer to the `Programming\n'
+                                                      'States <REPLACE_DRIVER_SPECIFIC_URL_1(programmingstates)>`__ topic in\n'
+                                                      'the *NI DC Power Supplies and SMUs Help* for details about the specific\n'
+                                                      'NI-DCPower software states.\n'
+                                                      '\n'
+                                                      '**Related Topics:**\n'
+                                                      '\n'
+                                                      '`Programming\n'
+                                                      'States <REPLACE_DRIVER_SPECIFIC_URL_1(programmingstates)>`__\n'},
+                  'has_repeated_capability': False,
+                  'invalidates_attribute_cache': True,
+                  'is_error_handling': False,
+                  'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                  'name': 'Commit',
+                  'parameters': [   {   'ctypes_type': 'ViSession',
+                                        'ctypes_type_library_call': 'ViSession',
+                                        'ctypes_variable_name': 'vi_ctype',
+                                        'direction': 'in',
+                                        'documentation': {'description': '\nIdentifies a particular instrument session. **vi** is obtained from the\nniDCPower_InitializeWithChannels function.\n'},
+                                        'enum': None,
+                                        'is_buffer': False,
+                                        'is_repeated_capability': False,
+                                        'is_session_handle': True,
+                                        'is_string': False,
+                                        'library_method_call_snippet': 'vi_ctype',
+                                        'name': 'vi',
+                                        'numpy': False,
+                                        'numpy_into_return': False,
+                                        'python_name': 'vi',
+                                        'python_name_or_default_for_init': 'vi',
+                                        'python_name_with_default': 'vi',
+                                        'python_name_with_doc_default': 'vi',
+                                        'python_type': 'int',
+                                        'size': {'mechanism': 'fixed', 'value': 1},
+                                        'type': 'ViSession',
+                                        'use_array': False,
+                                        'use_in_python_api': True,
+                                        'use_list': False}],
+                  'python_code_variables': [],
+                  'python_name': 'commit',
+                  'render_in_library': True,
+                  'render_in_session_base': False,
+                  'returns': 'ViStatus'},
+    'ConfigureApertureTime': {   'blocking': False,
+                                 'codegen_method': 'public',
+                                 'documentation': {   'description': '\n'
+                                                                     'Configures the aperture time on the specified channel(s).\n'
+                                                                     '\n'
+                                                                     'The supported values depend on the **units**. Refer to the *Aperture\n'
+                                                                     'Time* topic for your device in the *NI DC Power Supplies and SMUs Help*\n'
+                                                                     'for more information. In general, devices support discrete\n'
+                                                                     '**apertureTime** values, and if you configure **apertureTime** to some\n'
+                                                                     'unsupported value, NI-DCPower coerces it up to the next supported value.\n'
+                                                                     '\n'
+                                                                     'Refer to the *Measurement Configuration and Timing* or *DC Noise\n'
+                                                                     'Rejection* topic for your device in the *NI DC Power Supplies and SMUs\n'
+                                                                     'Help* for more information about how to configure your measurements.\n'
+                                                                     '\n'
+                                                                     '**Related Topics:**\n'
+                                                                     '\n'
+                                                                     '`Aperture Time <REPLACE_DRIVER_SPECIFIC_URL_1(aperture)>`__\n',
+                                                      'note': '\n'
+                                                              'This function is not supported on all devices. Refer to `Supported\n'
+                                                              'Functions by\n'
+                                                              "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                              'for more information about supported devices.\n'},
+                                 'has_repeated_capability': True,
+                                 'invalidates_attribute_cache': True,
+                                 'is_error_handling': False,
+                                 'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                 'name': 'ConfigureApertureTime',
+                                 'parameters': [   {   'ctypes_type': 'ViSession',
+                                                       'ctypes_type_library_call': 'ViSession',
+                                                       'ctypes_variable_name': 'vi_ctype',
+                                                       'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                           'niDCPower_InitializeWithChannels function.\n'},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': True,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'vi_ctype',
+                                                       'name': 'vi',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'vi',
+                                                       'python_name_or_default_for_init': 'vi',
+                                                       'python_name_with_default': 'vi',
+                                                       'python_name_with_doc_default': 'vi',
+                                                       'python_type': 'int',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViSession',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False},
+                                                   {   'ctypes_type': 'ViChar[]',
+                                                       'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                       'ctypes_variable_name': 'channel_name_ctype',
+                                                       'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Specifies the output channel(s) to which this configuration value\n'
+                                                                                           'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                           'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                           '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                           'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                           'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                           'In the Running state, multiple output channel configurations are\n'
+                                                                                           'performed sequentially based on the order specified in this parameter.\n'},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': True,
+                                                       'is_session_handle': False,
+                                                       'is_string': True,
+                                                       'library_method_call_snippet': 'channel_name_ctype',
+                                                       'name': 'channelName',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'channel_name',
+                                                       'python_name_or_default_for_init': 'channel_name',
+                                                       'python_name_with_default': 'channel_name',
+                                                       'python_name_with_doc_default': 'channel_name',
+                                                       'python_type': 'str',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViChar[]',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False},
+                                                   {   'ctypes_type': 'ViReal64',
+                                                       'ctypes_type_library_call': 'ViReal64',
+                                                       'ctypes_variable_name': 'aperture_time_ctype',
+                                                       'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Specifies the aperture time. Refer to the *Aperture Time* topic for your\n'
+                                                                                           'device in the *NI DC Power Supplies and SMUs Help* for more information.\n'},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': False,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'aperture_time_ctype',
+                                                       'name': 'apertureTime',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'aperture_time',
+                                                       'python_name_or_default_for_init': 'aperture_time',
+                                                       'python_name_with_default': 'aperture_time',
+                                                       'python_name_with_doc_default': 'aperture_time',
+                                                       'python_type': 'float',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViReal64',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False},
+                                                   {   'ctypes_type': 'ViInt32',
+                                                       'ctypes_type_library_call': 'ViInt32',
+                                                       'ctypes_variable_name': 'units_ctype',
+                                                       'default_value': 'ApertureTimeUnits.SECONDS',
+                                                       'direction': 'in',
+                                                       'documentation': {   'description': '\nSpecifies the units for **apertureTime**.\n**Defined Values**:\n',
+                                                                            'table_body': [   ['NIDCPOWER_VAL_SECONDS (1028)', 'Specifies seconds.'],
+                                                                                              ['NIDCPOWER_VAL_POWER_LINE_CYCLES (1029)', 'Specifies Power Line Cycles.']]},
+                                                       'enum': 'ApertureTimeUnits',
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': False,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'units_ctype',
+                                                       'name': 'Units',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'units',
+                                                       'python_name_or_default_for_init': 'units',
+                                                       'python_name_with_default': 'units=enums.ApertureTimeUnits.SECONDS',
+                                                       'python_name_with_doc_default': 'units=nidcpower.ApertureTimeUnits.SECONDS',
+                                                       'python_type': 'enums.ApertureTimeUnits',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViInt32',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False}],
+                                 'python_code_variables': [],
+                                 'python_name': 'configure_aperture_time',
+                                 'render_in_library': True,
+                                 'render_in_session_base': True,
+                                 'returns': 'ViStatus'},
+    'ConfigureAutoZero': {   'codegen_method': 'no',
+                             'documentation': {   'description': '\n'
+                                                                 'Configures auto zero for the device.\n'
+                                                                 '\n'
+                                                                 'Refer to the `NI PXI-4132 Auto\n'
+                                                                 'Zero <REPLACE_DRIVER_SPECIFIC_URL_1(4132_autozero)>`__ and `NI PXI-4132\n'
+                                                                 'Measurement Configuration and\n'
+                                                                 'Timing <REPLACE_DRIVER_SPECIFIC_URL_1(4132_measureconfigtiming)>`__\n'
+                                                                 'topics in the *NI DC Power Supplies and SMUs Help* for more information\n'
+                                                                 'about how to configure your measurements.\n'
+                                                                 '\n'
+                                                                 '**Related Topics:**\n'
+                                                                 '\n'
+                                                                 '`Auto Zero <REPLACE_DRIVER_SPECIFIC_URL_1(autozero)>`__\n',
+                                                  'note': '\n'
+                                                          'This function is not supported on all devices. Refer to `Supported\n'
+                                                          'Functions by\n'
+                                                          "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                          'for more information about supported devices.\n'},
+                             'invalidates_attribute_cache': True,
+                             'parameters': [   {   'direction': 'in',
+                                                   'documentation': {   'description': '\n'
+                                                                                       'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                       'niDCPower_InitializeWithChannels function.\n'},
+                                                   'name': 'vi',
+                                                   'type': 'ViSession'},
+                                               {   'direction': 'in',
+                                                   'documentation': {   'description': '\n'
+                                                                                       'Specifies the output channel(s) to which this configuration value\n'
+                                                                                       'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                       'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                       '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                       'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                       'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                       'In the Running state, multiple output channel configurations are\n'
+                                                                                       'performed sequentially based on the order specified in this parameter.\n'},
+                                                   'name': 'channelName',
+                                                   'type': 'ViChar[]'},
+                                               {   'direction': 'in',
+                                                   'documentation': {   'description': '\n'
+                                                                                       'Specifies the auto-zero setting. Refer to the *Measurement Configuration\n'
+                                                                                       'and Timing* topic and the *Auto Zero* topic for your device for more\n'
+                                                                                       'information about how to configure your measurements.\n'
+                                                                                       '**Defined Values:**\n',
+                                                                        'table_body': [   ['NIDCPOWER_VAL_OFF (0)', 'Disables auto-zero.'],
+                                                                                          [   'NIDCPOWER_VAL_ONCE (1024)',
+                                                                                              'Makes zero conversions following the first measurement after initiating the device. The device uses '
+                                                                                              'these zero conversions for the preceding measurement and future measurements until the device is '
+                                                                                              'reinitiated.'],
+                                                                                          ['NIDCPOWER_VAL_ON (1)', 'Makes zero conversions for every measurement.']]},
+                                                   'enum': 'AutoZero',
+                                                   'name': 'autoZero',
+                                                   'type': 'ViInt32'}],
+                             'returns': 'ViStatus'},
+    'ConfigureCurrentLevel': {   'codegen_method': 'no',
+                                 'documentation': {   'description': '\n'
+                                                                     'Configures the current level the device attempts to generate for the\n'
+                                                                     'specified channel(s). The channel must be enabled for the specified\n'
+                                                                     'current level to take effect. Refer to the\n'
+                                                                     'niDCPower_ConfigureOutputEnabled function for more information about\n'
+                                                                     'enabling the output channel.\n'
+                                                                     '\n'
+                                                                     'The current level setting is applicable only if the output function of\n'
+                                                                     'the channel is set to NIDCPOWER_VAL_DC_CURRENT. Use\n'
+                                                                     'nidcpower_ConfigureOutputFunction to set the output function. The\n'
+                                                                     'device actively regulates the current at the specified level unless\n'
+                                                                     'doing so causes a voltage greater than the\n'
+                                                                     "niDCPower_ConfigureVoltageLimit across the channels' output terminals.\n"
+                                                                     '\n'
+                                                                     '**Related Topics:**\n'
+                                                                     '\n'
+                                                                     '`Constant Current\n'
+                                                                     'Mode <REPLACE_DRIVER_SPECIFIC_URL_1(constant_current)>`__\n',
+                                                      'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                 'invalidates_attribute_cache': True,
+                                 'parameters': [   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                           'niDCPower_InitializeWithChannels function.\n'},
+                                                       'name': 'vi',
+                                                       'type': 'ViSession'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Specifies the output channel(s) to which this configuration value\n'
+                                                                                           'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                           'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                           '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                           'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                           'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                           'In the Running state, multiple output channel configurations are\n'
+                                                                                           'performed sequentially based on the order specified in this parameter.\n'},
+                                                       'name': 'channelName',
+                                                       'type': 'ViChar[]'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Specifies the current level, in amps, to generate for the specified\n'
+                                                                                           'channel(s).\n'
+                                                                                           '**Valid Values:**\n'
+                                                                                           'The valid values for this parameter are defined by the current level\n'
+                                                                                           'range that is configured using the niDCPower_ConfigureCurrentlevelRange\n'
+                                                                                           'function.\n',
+                                                                            'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                       'name': 'Level',
+                                                       'type': 'ViReal64'}],
+                                 'returns': 'ViStatus'},
+    'ConfigureCurrentLevelRange': {   'codegen_method': 'no',
+                                      'documentation': {   'description': '\n'
+                                                                          'Configures the current level range for the specified channel(s). The\n'
+                                                                          'configured range defines the valid values the current level can be set\n'
+                                                                          'to using the niDCPower_ConfigureCurrentLevel function. The current\n'
+                                                                          'level range setting is applicable only if the output function of the\n'
+                                                                          'channel is set to NIDCPOWER_VAL_DC_CURRENT. Use\n'
+                                                                          'nidcpower_ConfigureOutputFunction to set the output function.\n'
+                                                                          '\n'
+                                                                          'Use the NIDCPOWER_ATTR_CURRENT_LEVEL_AUTORANGE attribute to enable\n'
+                                                                          'automatic selection of the current level range.\n'
+                                                                          '\n'
+                                                                          '**Related Topics:**\n'
+                                                                          '\n'
+                                                                          '`Ranges <REPLACE_DRIVER_SPECIFIC_URL_1(ranges)>`__\n',
+                                                           'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                      'invalidates_attribute_cache': True,
+                                      'parameters': [   {   'direction': 'in',
+                                                            'documentation': {   'description': '\n'
+                                                                                                'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                                'niDCPower_InitializeWithChannels function.\n'},
+                                                            'name': 'vi',
+                                                            'type': 'ViSession'},
+                                                        {   'direction': 'in',
+                                                            'documentation': {   'description': '\n'
+                                                                                                'Specifies the output channel(s) to which this configuration value\n'
+                                                                                                'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                                'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                                '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                                'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                                'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                                'In the Running state, multiple output channel configurations are\n'
+                                                                                                'performed sequentially based on the order specified in this parameter.\n'},
+                                                            'name': 'channelName',
+                                                            'type': 'ViChar[]'},
+                                                        {   'direction': 'in',
+                                                            'documentation': {   'description': '\n'
+                                                                                                'Specifies the current level range, in amps, for the specified channel.\n'
+                                                                                                'For valid ranges, refer to the *ranges* topic for your device in the *NI\n'
+                                                                                                'DC Power Supplies and SMUs Help*.\n'},
+                                                            'name': 'Range',
+                                                            'type': 'ViReal64'}],
+                                      'returns': 'ViStatus'},
+    'ConfigureCurrentLimit': {   'codegen_method': 'no',
+                                 'documentation': {   'description': '\n'
+                                                                     '| Configures the current limit for the specified channel(s). The channel\n'
+                                                                     '  must be enabled for the specified current limit to take effect. Refer\n'
+                                                                     '  to the niDCPower_ConfigureOutputEnabled function for more information\n'
+                                                                     '  about enabling the output channel.\n'
+                                                                     '| The current limit is the current that the output should not exceed\n'
+                                                                     '  when generating the desired niDCPower_ConfigureVoltageLevel. The\n'
+                                                                     '  current limit setting is applicable only if the output function of the\n'
+                                                                     '  channel is set to NIDCPOWER_VAL_DC_VOLTAGE. Use\n'
+                                                                     '  nidcpower_ConfigureOutputFunction to set the output function.\n'
+                                                                     '\n'
+                                                                     '**Related Topics:**\n'
+                                                                     '\n'
+                                                                     '`Compliance <REPLACE_DRIVER_SPECIFIC_URL_1(compliance)>`__\n',
+                                                      'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                 'invalidates_attribute_cache': True,
+                                 'parameters': [   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                           'niDCPower_InitializeWithChannels function.\n'},
+                                                       'name': 'vi',
+                                                       'type': 'ViSession'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Specifies the output channel(s) to which this configuration value\n'
+                                                                                           'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                           'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                           '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                           'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                           'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                           'In the Running state, multiple output channel configurations are\n'
+                                                                                           'performed sequentially based on the order specified in this parameter.\n'},
+                                                       'name': 'channelName',
+                                                       'type': 'ViChar[]'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {   'description': '\nSpecifies how the output should behave when the current limit is\nreached.\n**Defined Values:**\n',
+                                                                            'note': [   '\n'
+                                                                                        'One or more of the referenced values are not in the Python API for this driver. Enums that only define '
+                                                                                        'values, or represent True/False, have been removed.\n'],
+                                                                            'table_body': [   [   'NIDCPOWER_VAL_CURRENT_REGULATE',
+                                                                                                  'Controls output current so that it does not exceed the current limit. Power continues to generate '
+                                                                                                  'even if the current limit is reached.']]},
+                                                       'name': 'Behavior',
+                                                       'type': 'ViInt32'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Specifies the current limit, in amps, on the specified channel(s). The\n'
+                                                                                           'limit is specified as a positive value, but symmetric positive and\n'
+                                                                                           'negative limits are enforced simultaneously.\n'
+                                                                                           '**Valid Values:**\n'
+                                                                                           'The valid values for this parameter are defined by the current limit\n'
+                                                                                           'range that is configured using the niDCPower_ConfigureCurrentlimitRange\n'
+                                                                                           'function.\n',
+                                                                            'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                       'name': 'Limit',
+                                                       'type': 'ViReal64'}],
+                                 'returns': 'ViStatus'},
+    'ConfigureCurrentLimitRange': {   'codegen_method': 'no',
+                                      'documentation': {   'description': '\n'
+                                                                          'Configures the current limit range for the specified channel(s).The\n'
+                                                                          'configured range defines the valid values the current limit can be set\n'
+                                                                          'to using the niDCPower_ConfigureCurrentLimit function. The current\n'
+                                                                          'limit range setting is applicable only if the output function of the\n'
+                                                                          'channel is set to NIDCPOWER_VAL_DC_VOLTAGE. Use\n'
+                                                                          'nidcpower_ConfigureOutputFunction to set the output function.\n'
+                                                                          '\n'
+                                                                          'Use the NIDCPOWER_ATTR_CURRENT_LIMIT_AUTORANGE attribute to enable\n'
+                                                                          'automatic selection of the current limit range.\n'
+                                                                          '\n'
+                                                                          '**Related Topics:**\n'
+                                                                          '\n'
+                                                                          '`Ranges <REPLACE_DRIVER_SPECIFIC_URL_1(ranges)>`__\n',
+                                                           'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                      'invalidates_attribute_cache': True,
+                                      'parameters': [   {   'direction': 'in',
+                                                            'documentation': {   'description': '\n'
+                                                                                                'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                                'niDCPower_InitializeWithChannels function.\n'},
+                                                            'name': 'vi',
+                                                            'type': 'ViSession'},
+                                                        {   'direction': 'in',
+                                                            'documentation': {   'description': '\n'
+                                                                                                'Specifies the output channel(s) to which this configuration value\n'
+                                                                                                'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                                'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                                '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                                'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                                'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                                'In the Running state, multiple output channel configurations are\n'
+                                                                                                'performed sequentially based on the order specified in this parameter.\n'},
+                                                            'name': 'channelName',
+                                                            'type': 'ViChar[]'},
+                                                        {   'direction': 'in',
+                                                            'documentation': {   'description': '\n'
+                                                                                                'Specifies the current limit range, in amps, for the specified channel.\n'
+                                                                                                'For valid ranges, refer to the *ranges* topic for your device in the *NI\n'
+                                                                                                'DC Power Supplies and SMUs Help*.\n'},
+                                                            'name': 'Range',
+                                                            'type': 'ViReal64'}],
+                                      'returns': 'ViStatus'},
+    'ConfigureDigitalEdgeMeasureTrigger': {   'blocking': False,
+                                              'codegen_method': 'public',
+                                              'documentation': {   'description': 'Configures the Measure trigger for digital edge triggering.',
+                                                                   'note': '\n'
+                                                                           'This function is not supported on all devices. Refer to `Supported\n'
+                                                                           'Functions by\n'
+                                                                           "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                                           'for more information about supported devices.\n'},
+                                              'has_repeated_capability': False,
+                                              'invalidates_attribute_cache': True,
+                                              'is_error_handling': False,
+                                              'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                              'name': 'ConfigureDigitalEdgeMeasureTrigger',
+                                              'parameters': [   {   'ctypes_type': 'ViSession',
+                                                                    'ctypes_type_library_call': 'ViSession',
+                                                                    'ctypes_variable_name': 'vi_ctype',
+                                                                    'direction': 'in',
+                                                                    'documentation': {   'description': '\n'
+                                                                                                        'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                                        'niDCPower_InitializeWithChannels function.\n'},
+                                                                    'enum': None,
+                                                                    'is_buffer': False,
+                                                                    'is_repeated_capability': False,
+                                                                    'is_session_handle': True,
+                                                                    'is_string': False,
+                                                                    'library_method_call_snippet': 'vi_ctype',
+                                                                    'name': 'vi',
+                                                                    'numpy': False,
+                                                                    'numpy_into_return': False,
+                                                                    'python_name': 'vi',
+                                                                    'python_name_or_default_for_init': 'vi',
+                                                                    'python_name_with_default': 'vi',
+                                                                    'python_name_with_doc_default': 'vi',
+                                                                    'python_type': 'int',
+                                                                    'size': {'mechanism': 'fixed', 'value': 1},
+                                                                    'type': 'ViSession',
+                                                                    'use_array': False,
+                                                                    'use_in_python_api': True,
+                                                                    'use_list': False},
+                                                                {   'ctypes_type': 'ViChar[]',
+                                                                    'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                                    'ctypes_variable_name': 'input_terminal_ctype',
+                                                                    'direction': 'in',
+                                                                    'documentation': {   'description': '\n'
+                                                                                                        'Specifies the input terminal for the digital edge Measure trigger.\n'
+                                                                                                        '\n'
+                                                                                                        'You can specify any valid input terminal for this function. Valid\n'
+                                                                                                        'terminals are listed in MAX under the **Device Routes** tab. For\n'
+                                                                                                        'PXIe-4162/4163, refer to the Signal Routing topic for the device to\n'
+                                                                                                        'determine which routes are available. This information is not available\n'
+                                                                                                        'on a Device Routes tab in MAX.\n'
+                                                                                                        '\n'
+                                                                                                        'Input terminals can be specified in one of two ways. If the device is\n'
+                                                                                                        'named Dev1 and your terminal is PXI_Trig0, you can specify the terminal\n'
+                                                                                                        'with the fully qualified terminal name, /Dev1/PXI_Trig0, or with the\n'
+                                                                                                        'shortened terminal name, PXI_Trig0. The input terminal can also be a\n'
+                                                                                                        'terminal from another device. For example, you can set the input\n'
+                                                                                                        'terminal on Dev1 to be /Dev2/SourceCompleteEvent.\n'},
+                                                                    'enum': None,
+                                                                    'is_buffer': False,
+                                                                    'is_repeated_capability': False,
+                                                                    'is_session_handle': False,
+                                                                    'is_string': True,
+                                                                    'library_method_call_snippet': 'input_terminal_ctype',
+                                                                    'name': 'inputTerminal',
+                                                                    'numpy': False,
+                                                                    'numpy_into_return': False,
+                                                                    'python_name': 'input_terminal',
+                                                                    'python_name_or_default_for_init': 'input_terminal',
+                                                                    'python_name_with_default': 'input_terminal',
+                                                                    'python_name_with_doc_default': 'input_terminal',
+                                                                    'python_type': 'str',
+                                                                    'size': {'mechanism': 'fixed', 'value': 1},
+                                                                    'type': 'ViChar[]',
+                                                                    'use_array': False,
+                                                                    'use_in_python_api': True,
+                                                                    'use_list': False},
+                                                                {   'ctypes_type': 'ViInt32',
+                                                                    'ctypes_type_library_call': 'ViInt32',
+                                                                    'ctypes_variable_name': 'edge_ctype',
+                                                                    'default_value': 'DigitalEdge.RISING',
+                                                                    'direction': 'in',
+                                                                    'documentation': {   'description': '\n'
+                                                                                                        'Specifies whether to configure the Measure trigger to assert on the\n'
+                                                                                                        'rising or falling edge.\n'
+                                                                                                        '**Defined Values:**\n',
+                                                                                         'table_body': [   [   'NIDCPOWER_VAL_RISING (1016)',
+                                                                                                               'Asserts the trigger on the rising edge of the digital signal.'],
+                                                                                                           [   'NIDCPOWER_VAL_FALLING (1017)',
+                                                                                                               'Asserts the trigger on the falling edge of the digital signal.']]},
+                                                                    'enum': 'DigitalEdge',
+                                                                    'is_buffer': False,
+                                                                    'is_repeated_capability': False,
+                                                                    'is_session_handle': False,
+                                                                    'is_string': False,
+                                                                    'library_method_call_snippet': 'edge_ctype',
+                                                                    'name': 'Edge',
+                                                                    'numpy': False,
+                                                                    'numpy_into_return': False,
+                                                                    'python_name': 'edge',
+                                                                    'python_name_or_default_for_init': 'edge',
+                                                                    'python_name_with_default': 'edge=enums.DigitalEdge.RISING',
+                                                                    'python_name_with_doc_default': 'edge=nidcpower.DigitalEdge.RISING',
+                                                                    'python_type': 'enums.DigitalEdge',
+                                                                    'size': {'mechanism': 'fixed', 'value': 1},
+                                                                    'type': 'ViInt32',
+                                                                    'use_array': False,
+                                                                    'use_in_python_api': True,
+                                                                    'use_list': False}],
+                                              'python_code_variables': [],
+                                              'python_name': 'configure_digital_edge_measure_trigger',
+                                              'render_in_library': True,
+                                              'render_in_session_base': False,
+                                              'returns': 'ViStatus'},
+    'ConfigureDigitalEdgePulseTrigger': {   'blocking': False,
+                                            'codegen_method': 'public',
+                                            'documentation': {   'description': 'Configures the Pulse trigger for digital edge triggering.',
+                                                                 'note': '\n'
+                                                                         'This function is not supported on all devices. Refer to `Supported\n'
+                                                                         'Functions by\n'
+                                                                         "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                                         'for more information about supported devices.\n'},
+                                            'has_repeated_capability': False,
+                                            'invalidates_attribute_cache': True,
+                                            'is_error_handling': False,
+                                            'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                            'name': 'ConfigureDigitalEdgePulseTrigger',
+                                            'parameters': [   {   'ctypes_type': 'ViSession',
+                                                                  'ctypes_type_library_call': 'ViSession',
+                                                                  'ctypes_variable_name': 'vi_ctype',
+                                                                  'direction': 'in',
+                                                                  'documentation': {   'description': '\n'
+                                                                                                      'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                                      'niDCPower_InitializeWithChannels function.\n'},
+                                                                  'enum': None,
+                                                                  'is_buffer': False,
+                                                                  'is_repeated_capability': False,
+                                                                  'is_session_handle': True,
+                                                                  'is_string': False,
+                                                                  'library_method_call_snippet': 'vi_ctype',
+                                                                  'name': 'vi',
+                                                                  'numpy': False,
+                                                                  'numpy_into_return': False,
+                                                                  'python_name': 'vi',
+                                                                  'python_name_or_default_for_init': 'vi',
+                                                                  'python_name_with_default': 'vi',
+                                                                  'python_name_with_doc_default': 'vi',
+                                                                  'python_type': 'int',
+                                                                  'size': {'mechanism': 'fixed', 'value': 1},
+                                                                  'type': 'ViSession',
+                                                                  'use_array': False,
+                                                                  'use_in_python_api': True,
+                                                                  'use_list': False},
+                                                              {   'ctypes_type': 'ViChar[]',
+                                                                  'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                                  'ctypes_variable_name': 'input_terminal_ctype',
+                                                                  'direction': 'in',
+                                                                  'documentation': {   'description': '\n'
+                                                                                                      'Specifies the input terminal for the digital edge Pulse trigger.\n'
+                                                                                                      '\n'
+                                                                                                      'You can specify any valid input terminal for this function. Valid\n'
+                                                                                                      'terminals are listed in MAX under the **Device Routes** tab.\n'
+                                                                                                      '\n'
+                                                                                                      'Input terminals can be specified in one of two ways. If the device is\n'
+                                                                                                      'named Dev1 and your terminal is PXI_Trig0, you can specify the terminal\n'
+                                                                                                      'with the fully qualified terminal name, /Dev1/PXI_Trig0, or with the\n'
+                                                                                                      'shortened terminal name, PXI_Trig0. The input terminal can also be a\n'
+                                                                                                      'terminal from another device. For example, you can set the input\n'
+                                                                                                      'terminal on Dev1 to be /Dev2/SourceCompleteEvent.\n'},
+                                                                  'enum': None,
+                                                                  'is_buffer': False,
+                                                                  'is_repeated_capability': False,
+                                                                  'is_session_handle': False,
+                                                                  'is_string': True,
+                                                                  'library_method_call_snippet': 'input_terminal_ctype',
+                                                                  'name': 'inputTerminal',
+                                                                  'numpy': False,
+                                                                  'numpy_into_return': False,
+                                                                  'python_name': 'input_terminal',
+                                                                  'python_name_or_default_for_init': 'input_terminal',
+                                                                  'python_name_with_default': 'input_terminal',
+                                                                  'python_name_with_doc_default': 'input_terminal',
+                                                                  'python_type': 'str',
+                                                                  'size': {'mechanism': 'fixed', 'value': 1},
+                                                                  'type': 'ViChar[]',
+                                                                  'use_array': False,
+                                                                  'use_in_python_api': True,
+                                                                  'use_list': False},
+                                                              {   'ctypes_type': 'ViInt32',
+                                                                  'ctypes_type_library_call': 'ViInt32',
+                                                                  'ctypes_variable_name': 'edge_ctype',
+                                                                  'default_value': 'DigitalEdge.RISING',
+                                                                  'direction': 'in',
+                                                                  'documentation': {   'description': '\n'
+                                                                                                      'Specifies whether to configure the Pulse trigger to assert on the rising\n'
+                                                                                                      'or falling edge.\n'
+                                                                                                      '**Defined Values:**\n',
+                                                                                       'table_body': [   [   'NIDCPOWER_VAL_RISING (1016)',
+                                                                                                             'Asserts the trigger on the rising edge of the digital signal.'],
+                                                                                                         [   'NIDCPOWER_VAL_FALLING (1017)',
+                                                                                                             'Asserts the trigger on the falling edge of the digital signal.']]},
+                                                                  'enum': 'DigitalEdge',
+                                                                  'is_buffer': False,
+                                                                  'is_repeated_capability': False,
+                                                                  'is_session_handle': False,
+                                                                  'is_string': False,
+                                                                  'library_method_call_snippet': 'edge_ctype',
+                                                                  'name': 'Edge',
+                                                                  'numpy': False,
+                                                                  'numpy_into_return': False,
+                                                                  'python_name': 'edge',
+                                                                  'python_name_or_default_for_init': 'edge',
+                                                                  'python_name_with_default': 'edge=enums.DigitalEdge.RISING',
+                                                                  'python_name_with_doc_default': 'edge=nidcpower.DigitalEdge.RISING',
+                                                                  'python_type': 'enums.DigitalEdge',
+                                                                  'size': {'mechanism': 'fixed', 'value': 1},
+                                                                  'type': 'ViInt32',
+                                                                  'use_array': False,
+                                                                  'use_in_python_api': True,
+                                                                  'use_list': False}],
+                                            'python_code_variables': [],
+                                            'python_name': 'configure_digital_edge_pulse_trigger',
+                                            'render_in_library': True,
+                                            'render_in_session_base': False,
+                                            'returns': 'ViStatus'},
+    'ConfigureDigitalEdgeSequenceAdvanceTrigger': {   'blocking': False,
+                                                      'codegen_method': 'public',
+                                                      'documentation': {   'description': 'Configures the Sequence Advance trigger for digital edge triggering.',
+                                                                           'note': '\n'
+                                                                                   'This function is not supported on all devices. Refer to `Supported\n'
+                                                                                   'Functions by\n'
+                                                                                   "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                                                   'for more information about supported devices.\n'},
+                                                      'has_repeated_capability': False,
+                                                      'invalidates_attribute_cache': True,
+                                                      'is_error_handling': False,
+                                                      'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                                      'name': 'ConfigureDigitalEdgeSequenceAdvanceTrigger',
+                                                      'parameters': [   {   'ctypes_type': 'ViSession',
+                                                                            'ctypes_type_library_call': 'ViSession',
+                                                                            'ctypes_variable_name': 'vi_ctype',
+                                                                            'direction': 'in',
+                                                                            'documentation': {   'description': '\n'
+                                                                                                                'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                                                'niDCPower_InitializeWithChannels function.\n'},
+                                                                            'enum': None,
+                                                                            'is_buffer': False,
+                                                                            'is_repeated_capability': False,
+                                                                            'is_session_handle': True,
+                                                                            'is_string': False,
+                                                                            'library_method_call_snippet': 'vi_ctype',
+                                                                            'name': 'vi',
+                                                                            'numpy': False,
+                                                                            'numpy_into_return': False,
+                                                                            'python_name': 'vi',
+                                                                            'python_name_or_default_for_init': 'vi',
+                                                                            'python_name_with_default': 'vi',
+                                                                            'python_name_with_doc_default': 'vi',
+                                                                            'python_type': 'int',
+                                                                            'size': {'mechanism': 'fixed', 'value': 1},
+                                                                            'type': 'ViSession',
+                                                                            'use_array': False,
+                                                                            'use_in_python_api': True,
+                                                                            'use_list': False},
+                                                                        {   'ctypes_type': 'ViChar[]',
+                                                                            'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                                            'ctypes_variable_name': 'input_terminal_ctype',
+                                                                            'direction': 'in',
+                                                                            'documentation': {   'description': '\n'
+                                                                                                                'Specifies the input terminal for the digital edge Sequence Advance\n'
+                                                                                                                'trigger.\n'
+                                                                                                                '\n'
+                                                                                                                'You can specify any valid input terminal for this function. Valid\n'
+                                                                                                                'terminals are listed in MAX under the **Device Routes** tab. For\n'
+                                                                                                                'PXIe-4162/4163, refer to the Signal Routing topic for the device to\n'
+                                                                                                                'determine which routes are available. This information is not available\n'
+                                                                                                                'on a Device Routes tab in MAX.\n'
+                                                                                                                '\n'
+                                                                                                                'Input terminals can be specified in one of two ways. If the device is\n'
+                                                                                                                'named Dev1 and your terminal is PXI_Trig0, you can specify the terminal\n'
+                                                                                                                'with the fully qualified terminal name, /Dev1/PXI_Trig0, or with the\n'
+                                                                                                                'shortened terminal name, PXI_Trig0. The input terminal can also be a\n'
+                                                                                                                'terminal from another device. For example, you can set the input\n'
+                                                                                                                'terminal on Dev1 to be /Dev2/SourceCompleteEvent.\n'},
+                                                                            'enum': None,
+                                                                            'is_buffer': False,
+                                                                            'is_repeated_capability': False,
+                                                                            'is_session_handle': False,
+                                                                            'is_string': True,
+                                                                            'library_method_call_snippet': 'input_terminal_ctype',
+                                                                            'name': 'inputTerminal',
+                                                                            'numpy': False,
+                                                                            'numpy_into_return': False,
+                                                                            'python_name': 'input_terminal',
+                                                                            'python_name_or_default_for_init': 'input_terminal',
+                                                                            'python_name_with_default': 'input_terminal',
+                                                                            'python_name_with_doc_default': 'input_terminal',
+                                                                            'python_type': 'str',
+                                                                            'size': {'mechanism': 'fixed', 'value': 1},
+                                                                            'type': 'ViChar[]',
+                                                                            'use_array': False,
+                                                                            'use_in_python_api': True,
+                                                                            'use_list': False},
+                                                                        {   'ctypes_type': 'ViInt32',
+                                                                            'ctypes_type_library_call': 'ViInt32',
+                                                                            'ctypes_variable_name': 'edge_ctype',
+                                                                            'default_value': 'DigitalEdge.RISING',
+                                                                            'direction': 'in',
+                                                                            'documentation': {   'description': '\n'
+                                                                                                                'Specifies whether to configure the Sequence Advance trigger to assert on\n'
+                                                                                                                'the rising or falling edge.\n'
+                                                                                                                '**Defined Values:**\n',
+                                                                                                 'table_body': [   [   'NIDCPOWER_VAL_RISING (1016)',
+                                                                                                                       'Asserts the trigger on the rising edge of the digital signal.'],
+                                                                                                                   [   'NIDCPOWER_VAL_FALLING (1017)',
+                                                                                                                       'Asserts the trigger on the falling edge of the digital signal.']]},
+                                                                            'enum': 'DigitalEdge',
+                                                                            'is_buffer': False,
+                                                                            'is_repeated_capability': False,
+                                                                            'is_session_handle': False,
+                                                                            'is_string': False,
+                                                                            'library_method_call_snippet': 'edge_ctype',
+                                                                            'name': 'Edge',
+                                                                            'numpy': False,
+                                                                            'numpy_into_return': False,
+                                                                            'python_name': 'edge',
+                                                                            'python_name_or_default_for_init': 'edge',
+                                                                            'python_name_with_default': 'edge=enums.DigitalEdge.RISING',
+                                                                            'python_name_with_doc_default': 'edge=nidcpower.DigitalEdge.RISING',
+                                                                            'python_type': 'enums.DigitalEdge',
+                                                                            'size': {'mechanism': 'fixed', 'value': 1},
+                                                                            'type': 'ViInt32',
+                                                                            'use_array': False,
+                                                                            'use_in_python_api': True,
+                                                                            'use_list': False}],
+                                                      'python_code_variables': [],
+                                                      'python_name': 'configure_digital_edge_sequence_advance_trigger',
+                                                      'render_in_library': True,
+                                                      'render_in_session_base': False,
+                                                      'returns': 'ViStatus'},
+    'ConfigureDigitalEdgeSourceTrigger': {   'blocking': False,
+                                             'codegen_method': 'public',
+                                             'documentation': {   'description': 'Configures the Source trigger for digital edge triggering.',
+                                                                  'note': '\n'
+                                                                          'This function is not supported on all devices. Refer to `Supported\n'
+                                                                          'Functions by\n'
+                                                                          "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                                          'for more information about supported devices.\n'},
+                                             'has_repeated_capability': False,
+                                             'invalidates_attribute_cache': True,
+                                             'is_error_handling': False,
+                                             'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                             'name': 'ConfigureDigitalEdgeSourceTrigger',
+                                             'parameters': [   {   'ctypes_type': 'ViSession',
+                                                                   'ctypes_type_library_call': 'ViSession',
+                                                                   'ctypes_variable_name': 'vi_ctype',
+                                                                   'direction': 'in',
+                                                                   'documentation': {   'description': '\n'
+                                                                                                       'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                                       'niDCPower_InitializeWithChannels function.\n'},
+                                                                   'enum': None,
+                                                                   'is_buffer': False,
+                                                                   'is_repeated_capability': False,
+                                                                   'is_session_handle': True,
+                                                                   'is_string': False,
+                                                                   'library_method_call_snippet': 'vi_ctype',
+                                                                   'name': 'vi',
+                                                                   'numpy': False,
+                                                                   'numpy_into_return': False,
+                                                                   'python_name': 'vi',
+                                                                   'python_name_or_default_for_init': 'vi',
+                                                                   'python_name_with_default': 'vi',
+                                                                   'python_name_with_doc_default': 'vi',
+                                                                   'python_type': 'int',
+                                                                   'size': {'mechanism': 'fixed', 'value': 1},
+                                                                   'type': 'ViSession',
+                                                                   'use_array': False,
+                                                                   'use_in_python_api': True,
+                                                                   'use_list': False},
+                                                               {   'ctypes_type': 'ViChar[]',
+                                                                   'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                                   'ctypes_variable_name': 'input_terminal_ctype',
+                                                                   'direction': 'in',
+                                                                   'documentation': {   'description': '\n'
+                                                                                                       'Specifies the input terminal for the digital edge Source trigger.\n'
+                                                                                                       '\n'
+                                                                                                       'You can specify any valid input terminal for this function. Valid\n'
+                                                                                                       'terminals are listed in MAX under the **Device Routes** tab. For\n'
+                                                                                                       'PXIe-4162/4163, refer to the Signal Routing topic for the device to\n'
+                                                                                                       'determine which routes are available. This information is not available\n'
+                                                                                                       'on a Device Routes tab in MAX.\n'
+                                                                                                       '\n'
+                                                                                                       'Input terminals can be specified in one of two ways. If the device is\n'
+                                                                                                       'named Dev1 and your terminal is PXI_Trig0, you can specify the terminal\n'
+                                                                                                       'with the fully qualified terminal name, /Dev1/PXI_Trig0, or with the\n'
+                                                                                                       'shortened terminal name, PXI_Trig0. The input terminal can also be a\n'
+                                                                                                       'terminal from another device. For example, you can set the input\n'
+                                                                                                       'terminal on Dev1 to be /Dev2/SourceCompleteEvent.\n'},
+                                                                   'enum': None,
+                                                                   'is_buffer': False,
+                                                                   'is_repeated_capability': False,
+                                                                   'is_session_handle': False,
+                                                                   'is_string': True,
+                                                                   'library_method_call_snippet': 'input_terminal_ctype',
+                                                                   'name': 'inputTerminal',
+                                                                   'numpy': False,
+                                                                   'numpy_into_return': False,
+                                                                   'python_name': 'input_terminal',
+                                                                   'python_name_or_default_for_init': 'input_terminal',
+                                                                   'python_name_with_default': 'input_terminal',
+                                                                   'python_name_with_doc_default': 'input_terminal',
+                                                                   'python_type': 'str',
+                                                                   'size': {'mechanism': 'fixed', 'value': 1},
+                                                                   'type': 'ViChar[]',
+                                                                   'use_array': False,
+                                                                   'use_in_python_api': True,
+                                                                   'use_list': False},
+                                                               {   'ctypes_type': 'ViInt32',
+                                                                   'ctypes_type_library_call': 'ViInt32',
+                                                                   'ctypes_variable_name': 'edge_ctype',
+                                                                   'default_value': 'DigitalEdge.RISING',
+                                                                   'direction': 'in',
+                                                                   'documentation': {   'description': '\n'
+                                                                                                       'Specifies whether to configure the Source trigger to assert on the\n'
+                                                                                                       'rising or falling edge.\n'
+                                                                                                       '**Defined Values:**\n',
+                                                                                        'table_body': [   [   'NIDCPOWER_VAL_RISING (1016)',
+                                                                                                              'Asserts the trigger on the rising edge of the digital signal.'],
+                                                                                                          [   'NIDCPOWER_VAL_FALLING (1017)',
+                                                                                                              'Asserts the trigger on the falling edge of the digital signal.']]},
+                                                                   'enum': 'DigitalEdge',
+                                                                   'is_buffer': False,
+                                                                   'is_repeated_capability': False,
+                                                                   'is_session_handle': False,
+                                                                   'is_string': False,
+                                                                   'library_method_call_snippet': 'edge_ctype',
+                                                                   'name': 'Edge',
+                                                                   'numpy': False,
+                                                                   'numpy_into_return': False,
+                                                                   'python_name': 'edge',
+                                                                   'python_name_or_default_for_init': 'edge',
+                                                                   'python_name_with_default': 'edge=enums.DigitalEdge.RISING',
+                                                                   'python_name_with_doc_default': 'edge=nidcpower.DigitalEdge.RISING',
+                                                                   'python_type': 'enums.DigitalEdge',
+                                                                   'size': {'mechanism': 'fixed', 'value': 1},
+                                                                   'type': 'ViInt32',
+                                                                   'use_array': False,
+                                                                   'use_in_python_api': True,
+                                                                   'use_list': False}],
+                                             'python_code_variables': [],
+                                             'python_name': 'configure_digital_edge_source_trigger',
+                                             'render_in_library': True,
+                                             'render_in_session_base': False,
+                                             'returns': 'ViStatus'},
+    'ConfigureDigitalEdgeStartTrigger': {   'blocking': False,
+                                            'codegen_method': 'public',
+                                            'documentation': {   'description': 'Configures the Start trigger for digital edge triggering.',
+                                                                 'note': '\n'
+                                                                         'This function is not supported on all devices. Refer to `Supported\n'
+                                                                         'Functions by\n'
+                                                                         "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                                         'for more information about supported devices.\n'},
+                                            'has_repeated_capability': False,
+                                            'invalidates_attribute_cache': True,
+                                            'is_error_handling': False,
+                                            'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                            'name': 'ConfigureDigitalEdgeStartTrigger',
+                                            'parameters': [   {   'ctypes_type': 'ViSession',
+                                                                  'ctypes_type_library_call': 'ViSession',
+                                                                  'ctypes_variable_name': 'vi_ctype',
+                                                                  'direction': 'in',
+                                                                  'documentation': {   'description': '\n'
+                                                                                                      'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                                      'niDCPower_InitializeWithChannels function.\n'},
+                                                                  'enum': None,
+                                                                  'is_buffer': False,
+                                                                  'is_repeated_capability': False,
+                                                                  'is_session_handle': True,
+                                                                  'is_string': False,
+                                                                  'library_method_call_snippet': 'vi_ctype',
+                                                                  'name': 'vi',
+                                                                  'numpy': False,
+                                                                  'numpy_into_return': False,
+                                                                  'python_name': 'vi',
+                                                                  'python_name_or_default_for_init': 'vi',
+                                                                  'python_name_with_default': 'vi',
+                                                                  'python_name_with_doc_default': 'vi',
+                                                                  'python_type': 'int',
+                                                                  'size': {'mechanism': 'fixed', 'value': 1},
+                                                                  'type': 'ViSession',
+                                                                  'use_array': False,
+                                                                  'use_in_python_api': True,
+                                                                  'use_list': False},
+                                                              {   'ctypes_type': 'ViChar[]',
+                                                                  'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                                  'ctypes_variable_name': 'input_terminal_ctype',
+                                                                  'direction': 'in',
+                                                                  'documentation': {   'description': '\n'
+                                                                                                      'Specifies the input terminal for the digital edge Start trigger.\n'
+                                                                                                      '\n'
+                                                                                                      'You can specify any valid input terminal for this function. Valid\n'
+                                                                                                      'terminals are listed in MAX under the **Device Routes** tab. For\n'
+                                                                                                      'PXIe-4162/4163, refer to the Signal Routing topic for the device to\n'
+                                                                                                      'determine which routes are available. This information is not available\n'
+                                                                                                      'on a Device Routes tab in MAX.\n'
+                                                                                                      '\n'
+                                                                                                      'Input terminals can be specified in one of two ways. If the device is\n'
+                                                                                                      'named Dev1 and your terminal is PXI_Trig0, you can specify the terminal\n'
+                                                                                                      'with the fully qualified terminal name, /Dev1/PXI_Trig0, or with the\n'
+                                                                                                      'shortened terminal name, PXI_Trig0. The input terminal can also be a\n'
+                                                                                                      'terminal from another device. For example, you can set the input\n'
+                                                                                                      'terminal on Dev1 to be /Dev2/SourceCompleteEvent.\n'},
+                                                                  'enum': None,
+                                                                  'is_buffer': False,
+                                                                  'is_repeated_capability': False,
+                                                                  'is_session_handle': False,
+                                                                  'is_string': True,
+                                                                  'library_method_call_snippet': 'input_terminal_ctype',
+                                                                  'name': 'inputTerminal',
+                                                                  'numpy': False,
+                                                                  'numpy_into_return': False,
+                                                                  'python_name': 'input_terminal',
+                                                                  'python_name_or_default_for_init': 'input_terminal',
+                                                                  'python_name_with_default': 'input_terminal',
+                                                                  'python_name_with_doc_default': 'input_terminal',
+                                                                  'python_type': 'str',
+                                                                  'size': {'mechanism': 'fixed', 'value': 1},
+                                                                  'type': 'ViChar[]',
+                                                                  'use_array': False,
+                                                                  'use_in_python_api': True,
+                                                                  'use_list': False},
+                                                              {   'ctypes_type': 'ViInt32',
+                                                                  'ctypes_type_library_call': 'ViInt32',
+                                                                  'ctypes_variable_name': 'edge_ctype',
+                                                                  'default_value': 'DigitalEdge.RISING',
+                                                                  'direction': 'in',
+                                                                  'documentation': {   'description': '\n'
+                                                                                                      'Specifies whether to configure the Start trigger to assert on the rising\n'
+                                                                                                      'or falling edge.\n'
+                                                                                                      '**Defined Values:**\n',
+                                                                                       'table_body': [   [   'NIDCPOWER_VAL_RISING (1016)',
+                                                                                                             'Asserts the trigger on the rising edge of the digital signal.'],
+                                                                                                         [   'NIDCPOWER_VAL_FALLING (1017)',
+                                                                                                             'Asserts the trigger on the falling edge of the digital signal.']]},
+                                                                  'enum': 'DigitalEdge',
+                                                                  'is_buffer': False,
+                                                                  'is_repeated_capability': False,
+                                                                  'is_session_handle': False,
+                                                                  'is_string': False,
+                                                                  'library_method_call_snippet': 'edge_ctype',
+                                                                  'name': 'Edge',
+                                                                  'numpy': False,
+                                                                  'numpy_into_return': False,
+                                                                  'python_name': 'edge',
+                                                                  'python_name_or_default_for_init': 'edge',
+                                                                  'python_name_with_default': 'edge=enums.DigitalEdge.RISING',
+                                                                  'python_name_with_doc_default': 'edge=nidcpower.DigitalEdge.RISING',
+                                                                  'python_type': 'enums.DigitalEdge',
+                                                                  'size': {'mechanism': 'fixed', 'value': 1},
+                                                                  'type': 'ViInt32',
+                                                                  'use_array': False,
+                                                                  'use_in_python_api': True,
+                                                                  'use_list': False}],
+                                            'python_code_variables': [],
+                                            'python_name': 'configure_digital_edge_start_trigger',
+                                            'render_in_library': True,
+                                            'render_in_session_base': False,
+                                            'returns': 'ViStatus'},
+    'ConfigureOutputEnabled': {   'codegen_method': 'no',
+                                  'documentation': {   'description': '\n'
+                                                                      'Enables or disables generation on the specified channel(s). Depending on\n'
+                                                                      'the selected output function, the voltage level, current level,or output\n'
+                                                                      'resistance must be set in addition to enabling the output to generate\n'
+                                                                      'the desired level. For more information about configuring the output\n'
+                                                                      'level, refer to niDCPower_ConfigureOutputFunction.\n',
+                                                       'note': [   '\n'
+                                                                   'If the device is in the\n'
+                                                                   "`Uncommitted <javascript:LaunchHelp('NI_DC_Power_Supplies_Help.chm::/programmingStates.html#uncommitted')>`__\n"
+                                                                   'state, enabling the output does not take effect until you call the\n'
+                                                                   'niDCPower_Initiate function.\n',
+                                                                   '\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                  'invalidates_attribute_cache': True,
+                                  'parameters': [   {   'direction': 'in',
+                                                        'documentation': {   'description': '\n'
+                                                                                            'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                            'niDCPower_InitializeWithChannels function.\n'},
+                                                        'name': 'vi',
+                                                        'type': 'ViSession'},
+                                                    {   'direction': 'in',
+                                                        'documentation': {   'description': '\n'
+                                                                                            'Specifies the output channel(s) to which this configuration value\n'
+                                                                                            'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                            'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                            '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                            'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                            'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                            'In the Running state, multiple output channel configurations are\n'
+                                                                                            'performed sequentially based on the order specified in this parameter.\n'},
+                                                        'name': 'channelName',
+                                                        'type': 'ViChar[]'},
+                                                    {   'direction': 'in',
+                                                        'documentation': {   'description': '\nSpecifies whether the output is enabled or disabled.\n**Defined Values**:\n',
+                                                                             'table_body': [   ['VI_TRUE', 'Enables generation on the specified output channel(s).'],
+                                                                                               [   'VI_FALSE',
+                                                                                                   'Disables generation on the specified output channel(s). This parameter has no effect on the output '
+                                                                                                   'disconnect relay. To toggle the relay, use the NIDCPOWER_ATTR_OUTPUT_CONNECTED attribute.']]},
+                                                        'name': 'Enabled',
+                                                        'type': 'ViBoolean'}],
+                                  'returns': 'ViStatus'},
+    'ConfigureOutputFunction': {   'codegen_method': 'no',
+                                   'documentation': {   'description': '\n'
+                                                                       'Configures the function the device attempts to generate for the\n'
+                                                                       'specified channel(s).\n'
+                                                                       '\n'
+                                                                       'When NIDCPOWER_VAL_DC_VOLTAGE is selected, the device generates the\n'
+                                                                       'desired voltage level on the output as long as the output current is\n'
+                                                                       'below the current limit. The following functions can be used to\n'
+                                                                       'configure the channel when NIDCPOWER_VAL_DC_VOLTAGE is selected:\n'
+                                                                       '\n'
+                                                                       '-  niDCPower_ConfigureVoltageLevel\n'
+                                                                       '-  niDCPower_ConfigureCurrentLimit\n'
+                                                                       '-  niDCPower_ConfigureVoltageLevelRange\n'
+                                                                       '-  niDCPower_ConfigureCurrentLimitRange\n'
+                                                                       '\n'
+                                                                       'When NIDCPOWER_VAL_DC_CURRENT is selected, the device generates the\n'
+                                                                       'desired current level on the output as long as the output voltage is\n'
+                                                                       'below the voltage limit. The following functions can be used to\n'
+                                                                       'configure the channel when NIDCPOWER_VAL_DC_CURRENT is selected:\n'
+                                                                       '\n'
+                                                                       '-  niDCPower_ConfigureCurrentLevel\n'
+                                                                       '-  niDCPower_ConfigureVoltageLimit\n'
+                                                                       '-  niDCPower_ConfigureCurrentLevelRange\n'
+                                                                       '-  niDCPower_ConfigureVoltageLimitRange\n'
+                                                                       '\n'
+                                                                       'When NIDCPOWER_VAL_PULSE_VOLTAGE is selected, the device generates\n'
+                                                                       'pulses at the desired voltage levels on the output as long as the output\n'
+                                                                       'current is below the current limit. The following VIs can be used to\n'
+                                                                       'configure the channel when NIDCPOWER_VAL_PULSE_VOLTAGE is selected:\n'
+                                                                       '\n'
+                                                                       '-  niDCPower_ConfigurePulseVoltageLevel\n'
+                                                                       '-  niDCPower_ConfigurePulseBiasVoltageLevel\n'
+                                                                       '-  niDCPower_ConfigurePulseCurrentLimit\n'
+                                                                       '-  niDCPower_ConfigurePulseBiasCurrentLimit\n'
+                                                                       '-  niDCPower_ConfigurePulseVoltageLevelRange\n'
+                                                                       '-  niDCPower_ConfigurePulseCurrentLimitRange\n'
+                                                                       '\n'
+                                                                       'When NIDCPOWER_VAL_PULSE_CURRENT is selected, the device generates\n'
+                                                                       'pulses at the desired current levels on the output as long as the output\n'
+                                                                       'voltage is below the voltage limit. The following VIs can be used to\n'
+                                                                       'configure the channel when NIDCPOWER_VAL_PULSE_CURRENT is selected:\n'
+                                                                       '\n'
+                                                                       '-  niDCPower_ConfigurePulseCurrentLevel\n'
+                                                                       '-  niDCPower_ConfigurePulseBiasCurrentLevel\n'
+                                                                       '-  niDCPower_ConfigurePulseVoltageLimit\n'
+                                                                       '-  niDCPower_ConfigurePulseBiasVoltageLimit\n'
+                                                                       '-  niDCPower_ConfigurePulseCurrentLevelRange\n'
+                                                                       '-  niDCPower_ConfigurePulseVoltageLimitRange\n'
+                                                                       '\n'
+                                                                       '**Related Topics:**\n'
+                                                                       '\n'
+                                                                       '`Constant Voltage\n'
+                                                                       'Mode <REPLACE_DRIVER_SPECIFIC_URL_1(constant_voltage)>`__\n'
+                                                                       '\n'
+                                                                       '`Constant Current\n'
+                                                                       'Mode <REPLACE_DRIVER_SPECIFIC_URL_1(constant_current)>`__\n',
+                                                        'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                   'invalidates_attribute_cache': True,
+                                   'parameters': [   {   'direction': 'in',
+                                                         'documentation': {   'description': '\n'
+                                                                                             'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                             'niDCPower_InitializeWithChannels function.\n'},
+                                                         'name': 'vi',
+                                                         'type': 'ViSession'},
+                                                     {   'direction': 'in',
+                                                         'documentation': {   'description': '\n'
+                                                                                             'Specifies the output channel(s) to which this configuration value\n'
+                                                                                             'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                             'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                             '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                             'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                             'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                             'In the Running state, multiple output channel configurations are\n'
+                                                                                             'performed sequentially based on the order specified in this parameter.\n'},
+                                                         'name': 'channelName',
+                                                         'type': 'ViChar[]'},
+                                                     {   'direction': 'in',
+                                                         'documentation': {   'description': '\nConfigures the function to generate for the specified channel(s).\n**Defined Values**:\n',
+                                                                              'table_body': [   ['NIDCPOWER_VAL_DC_VOLTAGE (1006)', 'Sets the output function to DC voltage.'],
+                                                                                                ['NIDCPOWER_VAL_DC_CURRENT (1007)', 'Sets the output function to DC current.'],
+                                                                                                ['NIDCPOWER_VAL_PULSE_VOLTAGE (1049)', 'Sets the output function to pulse voltage.'],
+                                                                                                ['NIDCPOWER_VAL_PULSE_CURRENT (1050)', 'Sets the output function to pulse current.']]},
+                                                         'name': 'Function',
+                                                         'type': 'ViInt32'}],
+                                   'returns': 'ViStatus'},
+    'ConfigureOutputRange': {   'codegen_method': 'no',
+                                'documentation': {   'description': '\n'
+                                                                    'Configures either the voltage level range or the current limit range. If\n'
+                                                                    '**range type** is Voltage, the voltage level range is configured. If\n'
+                                                                    '**range type** is Current, the current limit range is configured.\n'
+                                                                    '\n'
+                                                                    'This function does not configure any of the DC Current output function\n'
+                                                                    'settings. Refer to the niDCPower_ConfigureOutputFunction function for\n'
+                                                                    'more information.\n'
+                                                                    '\n'
+                                                                    'This is a deprecated function. You must use the following functions\n'
+                                                                    'instead of theniDCPower_ConfigureOutputRange function:\n'
+                                                                    '\n'
+                                                                    '-  niDCPower_ConfigureVoltageLevel\n'
+                                                                    '-  niDCPower_ConfigureVoltageLimit\n'
+                                                                    '-  niDCPower_ConfigureCurrentLevel\n'
+                                                                    '-  niDCPower_ConfigureCurrentLimit\n',
+                                                     'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                'invalidates_attribute_cache': True,
+                                'parameters': [   {   'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                          'niDCPower_InitializeWithChannels function.\n'},
+                                                      'name': 'vi',
+                                                      'type': 'ViSession'},
+                                                  {   'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Specifies the output channel(s) to which this configuration value\n'
+                                                                                          'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                          'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                          '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                          'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                          'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                          'In the Running state, multiple output channel configurations are\n'
+                                                                                          'performed sequentially based on the order specified in this parameter.\n'},
+                                                      'name': 'channelName',
+                                                      'type': 'ViChar[]'},
+                                                  {   'direction': 'in',
+                                                      'documentation': {   'description': '\nSpecifies the type of the range: voltage or current.\n**Defined Values**:\n',
+                                                                           'note': [   '\n'
+                                                                                       'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, '
+                                                                                       'or represent True/False, have been removed.\n'],
+                                                                           'table_body': [   ['NIDCPOWER_VAL_RANGE_CURRENT (0)', 'NI-DCPower configures the current range.'],
+                                                                                             ['NIDCPOWER_VAL_RANGE_VOLTAGE (1)', 'NI-DCPower configures the voltage range.']]},
+                                                      'name': 'rangeType',
+                                                      'type': 'ViInt32'},
+                                                  {   'direction': 'in',
+                                                      'documentation': {'description': '\nSpecifies the range to calibrate with these settings. Only one channel\nat a time may be calibrated.\n'},
+                                                      'name': 'Range',
+                                                      'type': 'ViReal64'}],
+                                'returns': 'ViStatus'},
+    'ConfigureOutputResistance': {   'codegen_method': 'no',
+                                     'documentation': {   'description': '\n'
+                                                                         'Configures the output resistance that the device attempts to generate\n'
+                                                                         'for the specified channel or channels. The channel must be enabled for\n'
+                                                                         'the specified output resistance to take effect.\n'
+                                                                         '\n'
+                                                                         'Refer to the nidcpower_ConfigureOutputEnabled function for more\n'
+                                                                         'information about enabling the output channel.\n'
+                                                                         '\n'
+                                                                         'For NI PXIe-4141/4143/4145 devices, output resistance is only supported\n'
+                                                                         'if the output function of the channel is set to\n'
+                                                                         'NIDCPOWER_VAL_DC_VOLTAGE using the niDCPower_ConfigureOutputFunction\n'
+                                                                         'function.\n'
+                                                                         '\n'
+                                                                         'For PXIe-4135, NI PXIe-4137, and NI PXIe-4139 devices, output resistance\n'
+                                                                         'is supported if the output function of the channel is set to\n'
+                                                                         'NIDCPOWER_VAL_DC_CURRENT or NIDCPOWER_VAL_DC_VOLTAGE using the\n'
+                                                                         'niDCPower_ConfigureOutputFunction function.\n'
+                                                                         '\n'
+                                                                         'The device actively regulates the current and voltage to reach the\n'
+                                                                         'specified output resistance, although in DC Voltage output mode, the\n'
+                                                                         'voltage at the output experiences a "virtual drop" that is proportional\n'
+                                                                         'to its current. In DC Current output mode, the output experiences a\n'
+                                                                         '"virtual leakage current" that is proportional to the output voltage.\n',
+                                                          'note': [   '\n'
+                                                                      'This function is not supported on all devices. Refer to `Supported\n'
+                                                                      'Functions by\n'
+                                                                      "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                                      'for more information about supported devices.\n',
+                                                                      '\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                     'invalidates_attribute_cache': True,
+                                     'parameters': [   {   'direction': 'in',
+                                                           'documentation': {   'description': '\n'
+                                                                                               'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                               'niDCPower_InitializeWithChannels function.\n'},
+                                                           'name': 'vi',
+                                                           'type': 'ViSession'},
+                                                       {   'direction': 'in',
+                                                           'documentation': {   'description': '\n'
+                                                                                               'Specifies the output channel(s) to which this configuration value\n'
+                                                                                               'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                               'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                               '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                               'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                               'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                               'In the Running state, multiple output channel configurations are\n'
+                                                                                               'performed sequentially based on the order specified in this parameter.\n'},
+                                                           'name': 'channelName',
+                                                           'type': 'ViChar[]'},
+                                                       {   'direction': 'in',
+                                                           'documentation': {   'description': '\n'
+                                                                                               'Specifies the output resistance, in ohms, for the specified channel.\n'
+                                                                                               'Refer to the `NI PXIe-4141 Programmable Output\n'
+                                                                                               'resistance <REPLACE_DRIVER_SPECIFIC_URL_1(4140_4141_progoutputresist)>`__,\n'
+                                                                                               '`NI PXIe-4143 Programmable Output\n'
+                                                                                               'resistance <REPLACE_DRIVER_SPECIFIC_URL_1(4142_4143_progoutputresist)>`__,\n'
+                                                                                               '`NI PXIe-4145 Programmable Output\n'
+                                                                                               'resistance <REPLACE_DRIVER_SPECIFIC_URL_1(4144_4145_progoutputresist)>`__,or\n'
+                                                                                               '`NI PXIe-4154 Programmable Output\n'
+                                                                                               'resistance <REPLACE_DRIVER_SPECIFIC_URL_1(4154_prog_output_resist)>`__\n'
+                                                                                               'topic in the NI DC Power Supplies and SMUs Help for more information\n'
+                                                                                               'about configuring output resistance.\n'},
+                                                           'name': 'Resistance',
+                                                           'type': 'ViReal64'}],
+                                     'returns': 'ViStatus'},
+    'ConfigurePowerLineFrequency': {   'codegen_method': 'no',
+                                       'documentation': {   'description': '\n'
+                                                                           'Specifies the power line frequency for specified channel(s). NI-DCPower\n'
+                                                                           'uses this value to select a timebase for setting the\n'
+                                                                           'niDCPower_ConfigureApertureTime function in power line cycles (PLCs).\n'
+                                                                           '\n'
+                                                                           'Refer to the *Measurement Configuration and Timing* topic for your\n'
+                                                                           'device in the *NI DC Power Supplies and SMUs Help* for more information\n'
+                                                                           'about how to configure your measurements.\n'
+                                                                           '\n'
+                                                                           '**Related Topics:**\n'
+                                                                           '\n'
+                                                                           '`Measurement Noise\n'
+                                                                           'Rejection <REPLACE_DRIVER_SPECIFIC_URL_1(noiserejectmeasure)>`__\n',
+                                                            'note': '\n'
+                                                                    'This function is not supported on all devices. Refer to `Supported\n'
+                                                                    'Functions by\n'
+                                                                    "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                                    'for more information about supported devices.\n'},
+                                       'invalidates_attribute_cache': True,
+                                       'parameters': [   {   'direction': 'in',
+                                                             'documentation': {   'description': '\n'
+                                                                                                 'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                                 'niDCPower_InitializeWithChannels function.\n'},
+                                                             'name': 'vi',
+                                                             'type': 'ViSession'},
+                                                         {   'direction': 'in',
+                                                             'documentation': {   'description': '\n'
+                                                                                                 'Specifies the power line frequency in hertz for specified channel(s).\n'
+                                                                                                 'NI-DCPower uses this value to select a timebase for the\n'
+                                                                                                 'NIDCPOWER_ATTR_APERTURE_TIME attribute. Refer to the *Measurement\n'
+                                                                                                 'Configuration and Timing* topic for your device for more information\n'
+                                                                                                 'about how to configure your measurements.\n'
+                                                                                                 '**Defined Values**:\n',
+                                                                                  'note': [   'Set this parameter to the frequency of the AC power line.',
+                                                                                              '\n'
+                                                                                              'One or more of the referenced values are not in the Python API for this driver. Enums that only define '
+                                                                                              'values, or represent True/False, have been removed.\n'],
+                                                                                  'table_body': [   ['NIDCPOWER_VAL_50_HERTZ (50.0)', 'Specifies 50 Hz.'],
+                                                                                                    ['NIDCPOWER_VAL_60_HERTZ (60.0)', 'Specifies 60 Hz.']]},
+                                                             'name': 'powerlineFrequency',
+                                                             'type': 'ViReal64'}],
+                                       'returns': 'ViStatus'},
+    'ConfigurePulseBiasCurrentLevel': {   'codegen_method': 'no',
+                                          'documentation': {   'description': '\n'
+                                                                              'Configures the pulse bias current level that the device attempts to\n'
+                                                                              'generate for the specified channel(s) during the off phase of a pulse.\n'
+                                                                              'The channel must be enabled for the specified current level to take\n'
+                                                                              'effect.\n'
+                                                                              '\n'
+                                                                              'Refer to the niDCPower_ConfigureOutputEnabled function for more\n'
+                                                                              'information about enabling the output channel. The pulse current level\n'
+                                                                              'setting is applicable only if the channel is set to the\n'
+                                                                              'NIDCPOWER_VAL_PULSE_CURRENT output function using the\n'
+                                                                              'niDCPower_ConfigureOutputFunction function.\n'
+                                                                              '\n'
+                                                                              'The device actively regulates the current at the specified level unless\n'
+                                                                              'doing so causes a voltage drop greater than the\n'
+                                                                              "NIDCPOWER_ATTR_PULSE_BIAS_VOLTAGE_LIMIT across the channels' output\n"
+                                                                              'terminals.\n',
+                                                               'note': [   '\n'
+                                                                           'This function is not supported on all devices. Refer to `Supported\n'
+                                                                           'Functions by\n'
+                                                                           "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                                           'for more information about supported devices.\n',
+                                                                           '\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                          'invalidates_attribute_cache': True,
+                                          'parameters': [   {   'direction': 'in',
+                                                                'documentation': {   'description': '\n'
+                                                                                                    'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                                    'niDCPower_InitializeWithChannels function.\n'},
+                                                                'name': 'vi',
+                                                                'type': 'ViSession'},
+                                                            {   'direction': 'in',
+                                                                'documentation': {   'description': '\n'
+                                                                                                    'Specifies the output channel(s) to which this configuration value\n'
+                                                                                                    'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                                    'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                                    '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                                    'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                                    'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                                    'In the Running state, multiple output channel configurations are\n'
+                                                                                                    'performed sequentially based on the order specified in this parameter.\n'},
+                                                                'name': 'channelName',
+                                                                'type': 'ViChar[]'},
+                                                            {   'direction': 'in',
+                                                                'documentation': {   'description': '\n'
+                                                                                                    'Specifies the pulse bias current level, in amps, on the specified\n'
+                                                                                                    'channel(s).\n'
+                                                                                                    '**Valid Values:**\n'
+                                                                                                    'The valid values for this parameter are defined by the pulse current\n'
+                                                                                                    'level range that is configured using the\n'
+                                                                                                    'niDCPower_ConfigurePulseCurrentlevelRange function.\n',
+                                                                                     'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                                'name': 'Level',
+                                                                'type': 'ViReal64'}],
+                                          'returns': 'ViStatus'},
+    'ConfigurePulseBiasCurrentLimit': {   'codegen_method': 'no',
+                                          'documentation': {   'description': '\n'
+                                                                              'Configures the pulse bias current limit for the specified channel(s).\n'
+                                                                              'The channel must be enabled for the specified current limit to take\n'
+                                                                              'effect.\n'
+                                                                              '\n'
+                                                                              'Refer to the niDCPower_ConfigureOutputEnabled function for more\n'
+                                                                              'information about enabling the output channel. The pulse bias current\n'
+                                                                              'limit is the current that the output must not exceed when generating the\n'
+                                                                              'desired NIDCPOWER_ATTR_pULSE_bIAS_vOLTAGE_lEVEL. The pulse bias\n'
+                                                                              'current limit setting is only applicable if the channel is set to the\n'
+                                                                              'NIDCPOWER_VAL_PULSE_VOLTAGE output function using the\n'
+                                                                              'niDCPower_ConfigureOutputFunction function.\n',
+                                                               'note': [   '\n'
+                                                                           'This function is not supported on all devices. Refer to `Supported\n'
+                                                                           'Functions by\n'
+                                                                           "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                                           'for more information about supported devices.\n',
+                                                                           '\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                          'invalidates_attribute_cache': True,
+                                          'parameters': [   {   'direction': 'in',
+                                                                'documentation': {   'description': '\n'
+                                                                                                    'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                                    'niDCPower_InitializeWithChannels function.\n'},
+                                                                'name': 'vi',
+                                                                'type': 'ViSession'},
+                                                            {   'direction': 'in',
+                                                                'documentation': {   'description': '\n'
+                                                                                                    'Specifies the output channel(s) to which this configuration value\n'
+                                                                                                    'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                                    'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                                    '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                                    'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                                    'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                                    'In the Running state, multiple output channel configurations are\n'
+                                                                                                    'performed sequentially based on the order specified in this parameter.\n'},
+                                                                'name': 'channelName',
+                                                                'type': 'ViChar[]'},
+                                                            {   'direction': 'in',
+                                                                'documentation': {   'description': '\n'
+                                                                                                    'Specifies the pulse bias current limit, in amps, on the specified\n'
+                                                                                                    'channel(s). The limit is specified as a positive value, but symmetric\n'
+                                                                                                    'positive and negative limits are enforced simultaneously.\n'
+                                                                                                    '**Valid Values:**\n'
+                                                                                                    'The valid values for this parameter are defined by the pulse current\n'
+                                                                                                    'limit range that is configured using the\n'
+                                                                                                    'niDCPower_ConfigurePulseCurrentlimitRange function.\n',
+                                                                                     'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                                'name': 'Limit',
+                                                                'type': 'ViReal64'}],
+                                          'returns': 'ViStatus'},
+    'ConfigurePulseBiasVoltageLevel': {   'codegen_method': 'no',
+                                          'documentation': {   'description': '\n'
+                                                                              'Configures the pulse bias voltage level that the device attempts to\n'
+                                                                              'generate for the specified channel(s) during the off phase of a pulse.\n'
+                                                                              'The channel must be enabled for the specified voltage level to take\n'
+                                                                              'effect.\n'
+                                                                              '\n'
+                                                                              'Refer to the niDCPower_ConfigureOutputEnabled function for more\n'
+                                                                              'information about enabling the output channel. The pulse bias voltage\n'
+                                                                              'level setting is applicable only if the channel is set to the\n'
+                                                                              'NIDCPOWER_VAL_PULSE_VOLTAGE output function using the\n'
+                                                                              'niDCPower_ConfigureOutputFunction function.\n'
+                                                                              '\n'
+                                                                              'The device actively regulates the voltage at the specified level unless\n'
+                                                                              'doing so causes a current greater than the\n'
+                                                                              "NIDCPOWER_ATTR_PULSE_BIAS_CURRENT_LIMIT through the channels'\n"
+                                                                              'output terminals.\n',
+                                                               'note': [   '\n'
+                                                                           'This function is not supported on all devices. Refer to `Supported\n'
+                                                                           'Functions by\n'
+                                                                           "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                                           'for more information about supported devices.\n',
+                                                                           '\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                          'invalidates_attribute_cache': True,
+                                          'parameters': [   {   'direction': 'in',
+                                                                'documentation': {   'description': '\n'
+                                                                                                    'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                                    'niDCPower_InitializeWithChannels function.\n'},
+                                                                'name': 'vi',
+                                                                'type': 'ViSession'},
+                                                            {   'direction': 'in',
+                                                                'documentation': {   'description': '\n'
+                                                                                                    'Specifies the output channel(s) to which this configuration value\n'
+                                                                                                    'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                                    'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                                    '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                                    'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                                    'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                                    'In the Running state, multiple output channel configurations are\n'
+                                                                                                    'performed sequentially based on the order specified in this parameter.\n'},
+                                                                'name': 'channelName',
+                                                                'type': 'ViChar[]'},
+                                                            {   'direction': 'in',
+                                                                'documentation': {   'description': '\n'
+                                                                                                    'Specifies the pulse bias voltage level, in volts, for the output channel\n'
+                                                                                                    'generation.\n'
+                                                                                                    '**Valid Values**:\n'
+                                                                                                    'The valid values for this parameter are defined by the pulse voltage\n'
+                                                                                                    'level range that is selected using the\n'
+                                                                                                    'niDCPower_ConfigurePulseVoltagelevelRange function.\n',
+                                                                                     'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                                'name': 'Level',
+                                                                'type': 'ViReal64'}],
+                                          'returns': 'ViStatus'},
+    'ConfigurePulseBiasVoltageLimit': {   'codegen_method': 'no',
+                                          'documentation': {   'description': '\n'
+                                                                              'Configures the pulse bias voltage limit for the specified channel(s).\n'
+                                                                              'The channel must be enabled for the specified voltage limit to take\n'
+                                                                              'effect.\n'
+                                                                              '\n'
+                                                                              'Refer to the niDCPower_ConfigureOutputEnabled function for more\n'
+                                                                              'information about enabling the output channel. The pulse bias voltage\n'
+                                                                              'limit is the voltage that the output must not exceed when generating the\n'
+                                                                              'desired NIDCPOWER_ATTR_PULSE_bIAS_cURRENT_lEVEL. The pulse bias\n'
+                                                                              'voltage limit setting is only applicable if the channel is set to the\n'
+                                                                              'NIDCPOWER_VAL_PULSE_CURRENT output function using the\n'
+                                                                              'niDCPower_ConfigureOutputFunction function.\n',
+                                                               'note': [   '\n'
+                                                                           'This function is not supported on all devices. Refer to `Supported\n'
+                                                                           'Functions by\n'
+                                                                           "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                                           'for more information about supported devices.\n',
+                                                                           '\nOne or more of the referenced functions are not in the Python API for this driver.\n',
+                                                                           '\nOne or more of the referenced attributes are not in the Python API for this driver.\n']},
+                                          'invalidates_attribute_cache': True,
+                                          'parameters': [   {   'direction': 'in',
+                                                                'documentation': {   'description': '\n'
+                                                                                                    'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                                    'niDCPower_InitializeWithChannels function.\n'},
+                                                                'name': 'vi',
+                                                                'type': 'ViSession'},
+                                                            {   'direction': 'in',
+                                                                'documentation': {   'description': '\n'
+                                                                                                    'Specifies the output channel(s) to which this configuration value\n'
+                                                                                                    'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                                    'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                                    '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                                    'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                                    'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                                    'In the Running state, multiple output channel configurations are\n'
+                                                                                                    'performed sequentially based on the order specified in this parameter.\n'},
+                                                                'name': 'channelName',
+                                                                'type': 'ViChar[]'},
+                                                            {   'direction': 'in',
+                                                                'documentation': {   'description': '\n'
+                                                                                                    'Specifies the pulse bias voltage limit, in volts, on the specified\n'
+                                                                                                    'channel(s). The limit is specified as a positive value, but symmetric\n'
+                                                                                                    'positive and negative limits are enforced simultaneously.\n'
+                                                                                                    '**Valid Values:**\n'
+                                                                                                    'The valid values for this parameter are defined by the pulse voltage\n'
+                                                                                                    'limit range that is configured using the\n'
+                                                                                                    'niDCPower_ConfigurePulseVoltagelimitRange function.\n',
+                                                                                     'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                                'name': 'Limit',
+                                                                'type': 'ViReal64'}],
+                                          'returns': 'ViStatus'},
+    'ConfigurePulseCurrentLevel': {   'codegen_method': 'no',
+                                      'documentation': {   'description': '\n'
+                                                                          'Configures the pulse current level that the device attempts to generate\n'
+                                                                          'for the specified channel(s) during the on phase of a pulse. The channel\n'
+                                                                          'must be enabled for the specified current level to take effect.\n'
+                                                                          '\n'
+                                                                          'Refer to the niDCPower_ConfigureOutputEnabled function for more\n'
+                                                                          'information about enabling the output channel. The pulse current level\n'
+                                                                          'setting is applicable only if the channel is set to the\n'
+                                                                          'NIDCPOWER_VAL_PULSE_CURRENT output function using the\n'
+                                                                          'niDCPower_ConfigureOutputEnabled function.\n'
+                                                                          '\n'
+                                                                          'The device actively regulates the current at the specified level unless\n'
+                                                                          'doing so causes a voltage drop greater than the\n'
+                                                                          "NIDCPOWER_ATTR_PULSE_VOLTAGE_lIMIT across the channels' output\n"
+                                                                          'terminals.\n',
+                                                           'note': [   '\n'
+                                                                       'This function is not supported on all devices. Refer to `Supported\n'
+                                                                       'Functions by\n'
+                                                                       "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                                       'for more information about supported devices.\n',
+                                                                       '\nOne or more of the referenced functions are not in the Python API for this driver.\n',
+                                                                       '\nOne or more of the referenced attributes are not in the Python API for this driver.\n']},
+                                      'invalidates_attribute_cache': True,
+                                      'parameters': [   {   'direction': 'in',
+                                                            'documentation': {   'description': '\n'
+                                                                                                'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                                'niDCPower_InitializeWithChannels function.\n'},
+                                                            'name': 'vi',
+                                                            'type': 'ViSession'},
+                                                        {   'direction': 'in',
+                                                            'documentation': {   'description': '\n'
+                                                                                                'Specifies the output channel(s) to which this configuration value\n'
+                                                                                                'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                                'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                                '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                                'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                                'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                                'In the Running state, multiple output channel configurations are\n'
+                                                                                                'performed sequentially based on the order specified in this parameter.\n'},
+                                                            'name': 'channelName',
+                                                            'type': 'ViChar[]'},
+                                                        {   'direction': 'in',
+                                                            'documentation': {   'description': '\n'
+                                                                                                'Specifies the pulse current level, in amps, on the specified channel(s).\n'
+                                                                                                '**Valid Values:**\n'
+                                                                                                'The valid values for this parameter are defined by the pulse current\n'
+                                                                                                'level range that is configured using the\n'
+                                                                                                'niDCPower_ConfigurePulseCurrentlevelRange function.\n',
+                                                                                 'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                            'name': 'Level',
+                                                            'type': 'ViReal64'}],
+                                      'returns': 'ViStatus'},
+    'ConfigurePulseCurrentLevelRange': {   'codegen_method': 'no',
+                                           'documentation': {   'description': '\n'
+                                                                               'Configures the pulse current level range for the specified channel(s).\n'
+                                                                               '\n'
+                                                                               'The configured range defines the valid values to which you can set the\n'
+                                                                               'pulse current level and pulse bias current level using the\n'
+                                                                               'niDCPower_ConfigurePulseCurrentLevel and\n'
+                                                                               'niDCPower_ConfigurePulseBiasCurrentLevel functions. The pulse current\n'
+                                                                               'level range setting is applicable only if the channel is set to the\n'
+                                                                               'NIDCPOWER_VAL_PULSE_CURRENT output function using the\n'
+                                                                               'niDCPower_ConfigureOutputFunction function.\n',
+                                                                'note': [   '\n'
+                                                                            'This function is not supported on all devices. Refer to `Supported\n'
+                                                                            'Functions by\n'
+                                                                            "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                                            'for more information about supported devices.\n',
+                                                                            '\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                           'invalidates_attribute_cache': True,
+                                           'parameters': [   {   'direction': 'in',
+                                                                 'documentation': {   'description': '\n'
+                                                                                                     'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                                     'niDCPower_InitializeWithChannels function.\n'},
+                                                                 'name': 'vi',
+                                                                 'type': 'ViSession'},
+                                                             {   'direction': 'in',
+                                                                 'documentation': {   'description': '\n'
+                                                                                                     'Specifies the output channel(s) to which this configuration value\n'
+                                                                                                     'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                                     'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                                     '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                                     'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                                     'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                                     'In the Running state, multiple output channel configurations are\n'
+                                                                                                     'performed sequentially based on the order specified in this parameter.\n'},
+                                                                 'name': 'channelName',
+                                                                 'type': 'ViChar[]'},
+                                                             {   'direction': 'in',
+                                                                 'documentation': {   'description': '\n'
+                                                                                                     'Specifies the pulse current level range, in amps, on the specified\n'
+                                                                                                     'channel(s).\n'
+                                                                                                     'For valid ranges, refer to the *ranges* topic for your device in the *NI\n'
+                                                                                                     'DC Power Supplies and SMUs Help*.\n'},
+                                                                 'name': 'Range',
+                                                                 'type': 'ViReal64'}],
+                                           'returns': 'ViStatus'},
+    'ConfigurePulseCurrentLimit': {   'codegen_method': 'no',
+                                      'documentation': {   'description': '\n'
+                                                                          'Configures the pulse current limit for the specified channel(s). The\n'
+                                                                          'channel must be enabled for the specified current limit to take effect.\n'
+                                                                          '\n'
+                                                                          'Refer to the niDCPower_ConfigureOutputEnabled function for more\n'
+                                                                          'information about enabling the output channel. The pulse current limit\n'
+                                                                          'is the current that the output must not exceed when generating the\n'
+                                                                          'desired NIDCPOWER_ATTR_PULSE_vOLTAGE_lEVEL. The pulse current limit\n'
+                                                                          'setting is only applicable if the channel is set to the\n'
+                                                                          'NIDCPOWER_VAL_PULSE_VOLTAGE output function using the\n'
+                                                                          'niDCPower_ConfigureOutputFunction function.\n',
+                                                           'note': [   '\n'
+                                                                       'This function is not supported on all devices. Refer to `Supported\n'
+                                                                       'Functions by\n'
+                                                                       "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                                       'for more information about supported devices.\n',
+                                                                       '\nOne or more of the referenced functions are not in the Python API for this driver.\n',
+                                                                       '\nOne or more of the referenced attributes are not in the Python API for this driver.\n']},
+                                      'invalidates_attribute_cache': True,
+                                      'parameters': [   {   'direction': 'in',
+                                                            'documentation': {   'description': '\n'
+                                                                                                'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                                'niDCPower_InitializeWithChannels function.\n'},
+                                                            'name': 'vi',
+                                                            'type': 'ViSession'},
+                                                        {   'direction': 'in',
+                                                            'documentation': {   'description': '\n'
+                                                                                                'Specifies the output channel(s) to which this configuration value\n'
+                                                                                                'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                                'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                                '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                                'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                                'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                                'In the Running state, multiple output channel configurations are\n'
+                                                                                                'performed sequentially based on the order specified in this parameter.\n'},
+                                                            'name': 'channelName',
+                                                            'type': 'ViChar[]'},
+                                                        {   'direction': 'in',
+                                                            'documentation': {   'description': '\n'
+                                                                                                'Specifies the pulse current limit, in amps, on the specified channel(s).\n'
+                                                                                                'The limit is specified as a positive value, but symmetric positive and\n'
+                                                                                                'negative limits are enforced simultaneously.\n'
+                                                                                                '**Valid Values:**\n'
+                                                                                                'The valid values for this parameter are defined by the pulse current\n'
+                                                                                                'limit range that is configured using the\n'
+                                                                                                'niDCPower_ConfigurePulseCurrentlimitRange function.\n',
+                                                                                 'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                            'name': 'Limit',
+                                                            'type': 'ViReal64'}],
+                                      'returns': 'ViStatus'},
+    'ConfigurePulseCurrentLimitRange': {   'codegen_method': 'no',
+                                           'documentation': {   'description': '\n'
+                                                                               'Configures the pulse current limit range for the specified channel(s).\n'
+                                                                               '\n'
+                                                                               'The configured range defines the valid values to which you can set the\n'
+                                                                               'pulse current limit and pulse bias current limit using the\n'
+                                                                               'niDCPower_ConfigurePulseCurrentLimit and\n'
+                                                                               'niDCPower_ConfigurePulseBiasCurrentLimit functions. The pulse current\n'
+                                                                               'limit range setting is applicable only if the channel is set to the\n'
+                                                                               'NIDCPOWER_VAL_PULSE_VOLTAGE output function using the\n'
+                                                                               'niDCPower_ConfigureOutputFunction function.\n',
+                                                                'note': [   '\n'
+                                                                            'This function is not supported on all devices. Refer to `Supported\n'
+                                                                            'Functions by\n'
+                                                                            "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                                            'for more information about supported devices.\n',
+                                                                            '\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                           'invalidates_attribute_cache': True,
+                                           'parameters': [   {   'direction': 'in',
+                                                                 'documentation': {   'description': '\n'
+                                                                                                     'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                                     'niDCPower_InitializeWithChannels function.\n'},
+                                                                 'name': 'vi',
+                                                                 'type': 'ViSession'},
+                                                             {   'direction': 'in',
+                                                                 'documentation': {   'description': '\n'
+                                                                                                     'Specifies the output channel(s) to which this configuration value\n'
+                                                                                                     'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                                     'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                                     '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                                     'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                                     'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                                     'In the Running state, multiple output channel configurations are\n'
+                                                                                                     'performed sequentially based on the order specified in this parameter.\n'},
+                                                                 'name': 'channelName',
+                                                                 'type': 'ViChar[]'},
+                                                             {   'direction': 'in',
+                                                                 'documentation': {   'description': '\n'
+                                                                                                     'Specifies the pulse current limit range, in amps, on the specified\n'
+                                                                                                     'channel(s).\n'
+                                                                                                     'For valid ranges, refer to the *ranges* topic for your device in the *NI\n'
+                                                                                                     'DC Power Supplies and SMUs Help*.\n'},
+                                                                 'name': 'Range',
+                                                                 'type': 'ViReal64'}],
+                                           'returns': 'ViStatus'},
+    'ConfigurePulseVoltageLevel': {   'codegen_method': 'no',
+                                      'documentation': {   'description': '\n'
+                                                                          'Configures the pulse voltage level that the device attempts to generate\n'
+                                                                          'for the specified channel(s) during the on phase of a pulse. The channel\n'
+                                                                          'must be enabled for the specified voltage level to take effect.\n'
+                                                                          '\n'
+                                                                          'Refer to the niDCPower_ConfigureOutputEnabled function for more\n'
+                                                                          'information about enabling the output channel. The pulse voltage level\n'
+                                                                          'setting is applicable only if the channel is set to the\n'
+                                                                          'NIDCPOWER_VAL_PULSE_VOLTAGE output function using the\n'
+                                                                          'niDCPower_ConfigureOutputFunction function.\n'
+                                                                          '\n'
+                                                                          'The device actively regulates the voltage at the specified level unless\n'
+                                                                          'doing so causes a current greater than the\n'
+                                                                          "NIDCPOWER_ATTR_PULSE_cURRENT_lIMIT through the channels' output\n"
+                                                                          'terminals.\n',
+                                                           'note': [   '\n'
+                                                                       'This function is not supported on all devices. Refer to `Supported\n'
+                                                                       'Functions by\n'
+                                                                       "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                                       'for more information about supported devices.\n',
+                                                                       '\nOne or more of the referenced functions are not in the Python API for this driver.\n',
+                                                                       '\nOne or more of the referenced attributes are not in the Python API for this driver.\n']},
+                                      'invalidates_attribute_cache': True,
+                                      'parameters': [   {   'direction': 'in',
+                                                            'documentation': {   'description': '\n'
+                                                                                                'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                                'niDCPower_InitializeWithChannels function.\n'},
+                                                            'name': 'vi',
+                                                            'type': 'ViSession'},
+                                                        {   'direction': 'in',
+                                                            'documentation': {   'description': '\n'
+                                                                                                'Specifies the output channel(s) to which this configuration value\n'
+                                                                                                'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                                'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                                '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                                'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                                'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                                'In the Running state, multiple output channel configurations are\n'
+                                                                                                'performed sequentially based on the order specified in this parameter.\n'},
+                                                            'name': 'channelName',
+                                                            'type': 'ViChar[]'},
+                                                        {   'direction': 'in',
+                                                            'documentation': {   'description': '\n'
+                                                                                                'Specifies the pulse voltage level, in volts, for the output channel\n'
+                                                                                                'generation.\n'
+                                                                                                '**Valid Values**:\n'
+                                                                                                'The valid values for this parameter are defined by the voltage level\n'
+                                                                                                'range that is selected using the\n'
+                                                                                                'niDCPower_ConfigurePulseVoltagelevelRange function.\n',
+                                                                                 'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                            'name': 'Level',
+                                                            'type': 'ViReal64'}],
+                                      'returns': 'ViStatus'},
+    'ConfigurePulseVoltageLevelRange': {   'codegen_method': 'no',
+                                           'documentation': {   'description': '\n'
+                                                                               'Configures the pulse voltage level range for the specified channel(s).\n'
+                                                                               '\n'
+                                                                               'The configured range defines the valid values to which you can set the\n'
+                                                                               'pulse voltage level and pulse bias voltage level using the\n'
+                                                                               'niDCPower_ConfigurePulseVoltageLevel and\n'
+                                                                               'niDCPower_ConfigurePulseBiasVoltageLevel functions. The pulse voltage\n'
+                                                                               'level range setting is applicable only if the channel is set to the\n'
+                                                                               'NIDCPOWER_VAL_PULSE_VOLTAGE output function using the\n'
+                                                                               'niDCPower_ConfigureOutputFunction function.\n',
+                                                                'note': [   '\n'
+                                                                            'This function is not supported on all devices. Refer to `Supported\n'
+                                                                            'Functions by\n'
+                                                                            "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                                            'for more information about supported devices.\n',
+                                                                            '\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                           'invalidates_attribute_cache': True,
+                                           'parameters': [   {   'direction': 'in',
+                                                                 'documentation': {   'description': '\n'
+                                                                                                     'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                                     'niDCPower_InitializeWithChannels function.\n'},
+                                                                 'name': 'vi',
+                                                                 'type': 'ViSession'},
+                                                             {   'direction': 'in',
+                                                                 'documentation': {   'description': '\n'
+                                                                                                     'Specifies the output channel(s) to which this configuration value\n'
+                                                                                                     'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                                     'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                                     '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                                     'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                                     'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                                     'In the Running state, multiple output channel configurations are\n'
+                                                                                                     'performed sequentially based on the order specified in this parameter.\n'},
+                                                                 'name': 'channelName',
+                                                                 'type': 'ViChar[]'},
+                                                             {   'direction': 'in',
+                                                                 'documentation': {   'description': '\n'
+                                                                                                     'Specifies the pulse voltage level range, in volts, on the specified\n'
+                                                                                                     'channel(s).\n'
+                                                                                                     'For valid ranges, refer to the *ranges* topic for your device in the *NI\n'
+                                                                                                     'DC Power Supplies and SMUs Help*.\n'},
+                                                                 'name': 'Range',
+                                                                 'type': 'ViReal64'}],
+                                           'returns': 'ViStatus'},
+    'ConfigurePulseVoltageLimit': {   'codegen_method': 'no',
+                                      'documentation': {   'description': '\n'
+                                                                          'Configures the pulse voltage limit for the specified channel(s). The\n'
+                                                                          'channel must be enabled for the specified voltage limit to take effect.\n'
+                                                                          '\n'
+                                                                          'Refer to the niDCPower_ConfigureOutputEnabled function for more\n'
+                                                                          'information about enabling the output channel. The pulse voltage limit\n'
+                                                                          'is the voltage that the output must not exceed when generating the\n'
+                                                                          'desired NIDCPOWER_ATTR_PULSE_cURRENT_lEVEL. The pulse voltage limit\n'
+                                                                          'setting is only applicable if the channel is set to the\n'
+                                                                          'NIDCPOWER_VAL_PULSE_CURRENT output function using the\n'
+                                                                          'niDCPower_ConfigureOutputFunction function.\n',
+                                                           'note': [   '\n'
+                                                                       'This function is not supported on all devices. Refer to `Supported\n'
+                                                                       'Functions by\n'
+                                                                       "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                                       'for more information about supported devices.\n',
+                                                                       '\nOne or more of the referenced functions are not in the Python API for this driver.\n',
+                                                                       '\nOne or more of the referenced attributes are not in the Python API for this driver.\n']},
+                                      'invalidates_attribute_cache': True,
+                                      'parameters': [   {   'direction': 'in',
+                                                            'documentation': {   'description': '\n'
+                                                                                                'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                                'niDCPower_InitializeWithChannels function.\n'},
+                                                            'name': 'vi',
+                                                            'type': 'ViSession'},
+                                                        {   'direction': 'in',
+                                                            'documentation': {   'description': '\n'
+                                                                                                'Specifies the output channel(s) to which this configuration value\n'
+                                                                                                'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                                'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                                '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                                'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                                'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                                'In the Running state, multiple output channel configurations are\n'
+                                                                                                'performed sequentially based on the order specified in this parameter.\n'},
+                                                            'name': 'channelName',
+                                                            'type': 'ViChar[]'},
+                                                        {   'direction': 'in',
+                                                            'documentation': {   'description': '\n'
+                                                                                                'Specifies the pulse voltage limit, in volts, on the specified output\n'
+                                                                                                'channel(s). The limit is specified as a positive value, but symmetric\n'
+                                                                                                'positive and negative limits are enforced simultaneously.\n'
+                                                                                                '**Valid Values:**\n'
+                                                                                                'The valid values for this parameter are defined by the pulse voltage\n'
+                                                                                                'limit range that is configured using the\n'
+                                                                                                'niDCPower_ConfigurePulseVoltagelimitRange function.\n',
+                                                                                 'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                            'name': 'Limit',
+                                                            'type': 'ViReal64'}],
+                                      'returns': 'ViStatus'},
+    'ConfigurePulseVoltageLimitRange': {   'codegen_method': 'no',
+                                           'documentation': {   'description': '\n'
+                                                                               'Configures the pulse voltage limit range for the specified channel(s).\n'
+                                                                               '\n'
+                                                                               'The configured range defines the valid values to which you can set the\n'
+                                                                               'pulse voltage limit and pulse bias voltage limit using the\n'
+                                                                               'niDCPower_ConfigurePulseVoltageLimit and\n'
+                                                                               'niDCPower_ConfigurePulseBiasVoltageLimit functions. The pulse voltage\n'
+                                                                               'limit range setting is applicable only if the channel is set to the\n'
+                                                                               'NIDCPOWER_VAL_PULSE_CURRENT output function using the\n'
+                                                                               'niDCPower_ConfigureOutputFunction function.\n'
+                                                                               '\n'
+                                                                               '.\n',
+                                                                'note': [   '\n'
+                                                                            'This function is not supported on all devices. Refer to `Supported\n'
+                                                                            'Functions by\n'
+                                                                            "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                                            'for more information about supported devices.\n',
+                                                                            '\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                           'invalidates_attribute_cache': True,
+                                           'parameters': [   {   'direction': 'in',
+                                                                 'documentation': {   'description': '\n'
+                                                                                                     'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                                     'niDCPower_InitializeWithChannels function.\n'},
+                                                                 'name': 'vi',
+                                                                 'type': 'ViSession'},
+                                                             {   'direction': 'in',
+                                                                 'documentation': {   'description': '\n'
+                                                                                                     'Specifies the output channel(s) to which this configuration value\n'
+                                                                                                     'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                                     'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                                     '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                                     'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                                     'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                                     'In the Running state, multiple output channel configurations are\n'
+                                                                                                     'performed sequentially based on the order specified in this parameter.\n'},
+                                                                 'name': 'channelName',
+                                                                 'type': 'ViChar[]'},
+                                                             {   'direction': 'in',
+                                                                 'documentation': {   'description': '\n'
+                                                                                                     'Specifies the pulse voltage limit range, in volts, on the specified\n'
+                                                                                                     'channel(s).\n'
+                                                                                                     'For valid ranges, refer to the *ranges* topic for your device in the *NI\n'
+                                                                                                     'DC Power Supplies and SMUs Help*.\n'},
+                                                                 'name': 'Range',
+                                                                 'type': 'ViReal64'}],
+                                           'returns': 'ViStatus'},
+    'ConfigureSense': {   'codegen_method': 'no',
+                          'documentation': {   'description': '\n'
+                                                              'Specifies whether to use\n'
+                                                              '`local <REPLACE_DRIVER_SPECIFIC_URL_2(local_and_remote_sense)>`__ or\n'
+                                                              '`remote <REPLACE_DRIVER_SPECIFIC_URL_2(local_and_remote_sense)>`__\n'
+                                                              'sensing of the output voltage on the specified channel(s). Refer to the\n'
+                                                              '*Devices* topic specific to your device in the *NI DC Power Supplies and\n'
+                                                              'SMUs* Help for more information about sensing voltage on supported\n'
+                                                              'channels.\n'
+                                                              '\n'
+                                                              '**Related Topics:**\n'
+                                                              '\n'
+                                                              '`Local and Remote\n'
+                                                              'Sense <REPLACE_DRIVER_SPECIFIC_URL_1(4112_localandremotesense)>`__\n'},
+                          'invalidates_attribute_cache': True,
+                          'parameters': [   {   'direction': 'in',
+                                                'documentation': {   'description': '\n'
+                                                                                    'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                    'niDCPower_InitializeWithChannels function.\n'},
+                                                'name': 'vi',
+                                                'type': 'ViSession'},
+                                            {   'direction': 'in',
+                                                'documentation': {   'description': '\n'
+                                                                                    'Specifies the output channel(s) to which this configuration value\n'
+                                                                                    'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                    'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                    '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                    'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                    'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                    'In the Running state, multiple output channel configurations are\n'
+                                                                                    'performed sequentially based on the order specified in this parameter.\n'},
+                                                'name': 'channelName',
+                                                'type': 'ViChar[]'},
+                                            {   'direction': 'in',
+                                                'documentation': {   'description': '\nSpecifies local or remote sensing on the specified channel(s).\n**Defined Values:**\n',
+                                                                     'table_body': [['NIDCPOWER_VAL_LOCAL (1008)', 'Local sensing'], ['NIDCPOWER_VAL_REMOTE (1009)', 'Remote sensing']]},
+                                                'name': 'Sense',
+                                                'type': 'ViInt32'}],
+                          'returns': 'ViStatus'},
+    'ConfigureSoftwareEdgeMeasureTrigger': {   'codegen_method': 'no',
+                                               'documentation': {   'description': '\n'
+                                                                                   'Configures the Measure trigger for software triggering. Use the\n'
+                                                                                   'niDCPower_SendSoftwareEdgeTrigger function to assert the trigger\n'
+                                                                                   'condition.\n',
+                                                                    'note': '\n'
+                                                                            'This function is not supported on all devices. Refer to `Supported\n'
+                                                                            'Functions by\n'
+                                                                            "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                                            'for more information about supported devices.\n'},
+                                               'invalidates_attribute_cache': True,
+                                               'parameters': [   {   'direction': 'in',
+                                                                     'documentation': {   'description': '\n'
+                                                                                                         'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                                         'niDCPower_InitializeWithChannels function.\n'},
+                                                                     'name': 'vi',
+                                                                     'type': 'ViSession'}],
+                                               'returns': 'ViStatus'},
+    'ConfigureSoftwareEdgePulseTrigger': {   'codegen_method': 'no',
+                                             'documentation': {   'description': '\n'
+                                                                                 'Configures the Pulse trigger for software triggering. Use the\n'
+                                                                                 'niDCPower_SendSoftwareEdgeTrigger function to assert the trigger\n'
+                                                                                 'condition.\n',
+                                                                  'note': '\n'
+                                                                          'This function is not supported on all devices. Refer to `Supported\n'
+                                                                          'Functions by\n'
+                                                                          "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                                          'for more information about supported devices.\n'},
+                                             'invalidates_attribute_cache': True,
+                                             'parameters': [   {   'direction': 'in',
+                                                                   'documentation': {   'description': '\n'
+                                                                                                       'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                                       'niDCPower_InitializeWithChannels function.\n'},
+                                                                   'name': 'vi',
+                                                                   'type': 'ViSession'}],
+                                             'returns': 'ViStatus'},
+    'ConfigureSoftwareEdgeSequenceAdvanceTrigger': {   'codegen_method': 'no',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Configures the Sequence Advance trigger for software triggering. Use the\n'
+                                                                                           'niDCPower_SendSoftwareEdgeTrigger function to assert the trigger\n'
+                                                                                           'condition.\n',
+                                                                            'note': '\n'
+                                                                                    'This function is not supported on all devices. Refer to `Supported\n'
+                                                                                    'Functions by\n'
+                                                                                    "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                                                    'for more information about supported devices.\n'},
+                                                       'invalidates_attribute_cache': True,
+                                                       'parameters': [   {   'direction': 'in',
+                                                                             'documentation': {   'description': '\n'
+                                                                                                                 'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                                                 'niDCPower_InitializeWithChannels function.\n'},
+                                                                             'name': 'vi',
+                                                                             'type': 'ViSession'}],
+                                                       'returns': 'ViStatus'},
+    'ConfigureSoftwareEdgeSourceTrigger': {   'codegen_method': 'no',
+                                              'documentation': {   'description': '\n'
+                                                                                  'Configures the Source trigger for software triggering. Use the\n'
+                                                                                  'niDCPower_SendSoftwareEdgeTrigger function to assert the trigger\n'
+                                                                                  'condition.\n',
+                                                                   'note': '\n'
+                                                                           'This function is not supported on all devices. Refer to `Supported\n'
+                                                                           'Functions by\n'
+                                                                           "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                                           'for more information about supported devices.\n'},
+                                              'invalidates_attribute_cache': True,
+                                              'parameters': [   {   'direction': 'in',
+                                                                    'documentation': {   'description': '\n'
+                                                                                                        'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                                        'niDCPower_InitializeWithChannels function.\n'},
+                                                                    'name': 'vi',
+                                                                    'type': 'ViSession'}],
+                                              'returns': 'ViStatus'},
+    'ConfigureSoftwareEdgeStartTrigger': {   'codegen_method': 'no',
+                                             'documentation': {   'description': '\n'
+                                                                                 'Configures the Start trigger for software triggering. Use the\n'
+                                                                                 'niDCPower_SendSoftwareEdgeTrigger function to assert the trigger\n'
+                                                                                 'condition.\n',
+                                                                  'note': '\n'
+                                                                          'This function is not supported on all devices. Refer to `Supported\n'
+                                                                          'Functions by\n'
+                                                                          "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                                          'for more information about supported devices.\n'},
+                                             'invalidates_attribute_cache': True,
+                                             'parameters': [   {   'direction': 'in',
+                                                                   'documentation': {   'description': '\n'
+                                                                                                       'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                                       'niDCPower_InitializeWithChannels function.\n'},
+                                                                   'name': 'vi',
+                                                                   'type': 'ViSession'}],
+                                             'returns': 'ViStatus'},
+    'ConfigureSourceMode': {   'codegen_method': 'no',
+                               'documentation': {   'description': '\n'
+                                                                   'Configures the NIDCPOWER_ATTR_SOURCE_MODE attribute. Specifies\n'
+                                                                   'whether to run a single output point or a sequence. Refer to the `Single\n'
+                                                                   'Point Source Mode <REPLACE_DRIVER_SPECIFIC_URL_1(singlept)>`__ and\n'
+                                                                   '`Sequence Source Mode <REPLACE_DRIVER_SPECIFIC_URL_1(sequencing)>`__\n'
+                                                                   'topics in the *NI DC Power Supplies and SMUs Help* for more information\n'
+                                                                   'about using this function.\n'},
+                               'invalidates_attribute_cache': True,
+                               'parameters': [   {   'direction': 'in',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                         'niDCPower_InitializeWithChannels function.\n'},
+                                                     'name': 'vi',
+                                                     'type': 'ViSession'},
+                                                 {   'direction': 'in',
+                                                     'documentation': {   'description': '\nSpecifies the source mode for the NI-DCPower session.\n**Defined Values**:\n',
+                                                                          'table_body': [   ['NIDCPOWER_VAL_SINGLE_POINT (1020)', 'Applies a single source configuration.'],
+                                                                                            ['NIDCPOWER_VAL_SEQUENCE (1021)', 'Applies a list of voltage or current configurations sequentially.']]},
+                                                     'name': 'sourceMode',
+                                                     'type': 'ViInt32'}],
+                               'returns': 'ViStatus'},
+    'ConfigureVoltageLevel': {   'codegen_method': 'no',
+                                 'documentation': {   'description': '\n'
+                                                                     'Configures the voltage level the device attempts to generate for the\n'
+                                                                     'specified channel(s). The channel must be enabled for the specified\n'
+                                                                     'voltage level to take effect. Refer to the\n'
+                                                                     'niDCPower_ConfigureOutputEnabled function for more information about\n'
+                                                                     'enabling the output channel.\n'
+                                                                     '\n'
+                                                                     'The voltage level setting is applicable only if the output function of\n'
+                                                                     'the channel is set to NIDCPOWER_VAL_DC_VOLTAGE. Use\n'
+                                                                     'nidcpower_ConfigureOutputFunction to set the output function.\n'
+                                                                     '\n'
+                                                                     'The device actively regulates the voltage at the specified level unless\n'
+                                                                     'doing so causes a current output greater than the\n'
+                                                                     "NIDCPOWER_ATTR_CURRENT_LIMIT across the channels' output terminals.\n"
+                                                                     '\n'
+                                                                     '**Related Topics:**\n'
+                                                                     '\n'
+                                                                     '`Constant Voltage\n'
+                                                                     'Mode <REPLACE_DRIVER_SPECIFIC_URL_1(constant_voltage)>`__\n',
+                                                      'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                 'invalidates_attribute_cache': True,
+                                 'parameters': [   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                           'niDCPower_InitializeWithChannels function.\n'},
+                                                       'name': 'vi',
+                                                       'type': 'ViSession'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Specifies the output channel(s) to which this configuration value\n'
+                                                                                           'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                           'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                           '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                           'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                           'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                           'In the Running state, multiple output channel configurations are\n'
+                                                                                           'performed sequentially based on the order specified in this parameter.\n'},
+                                                       'name': 'channelName',
+                                                       'type': 'ViChar[]'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Specifies the voltage level, in volts, for the output channel\n'
+                                                                                           'generation.\n'
+                                                                                           '**Valid Values**:\n'
+                                                                                           'The valid values for this parameter are defined by the voltage level\n'
+                                                                                           'range that is selected using the niDCPower_ConfigureVoltagelevelRange\n'
+                                                                                           'function.\n',
+                                                                            'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                       'name': 'Level',
+                                                       'type': 'ViReal64'}],
+                                 'returns': 'ViStatus'},
+    'ConfigureVoltageLevelRange': {   'codegen_method': 'no',
+                                      'documentation': {   'description': '\n'
+                                                                          'Configures the voltage level range for the specified channel(s). The\n'
+                                                                          'configured range defines the valid values the voltage level can be set\n'
+                                                                          'to using the niDCPower_ConfigureVoltageLevel function. The voltage\n'
+                                                                          'level range setting is applicable only if the output function of the\n'
+                                                                          'channel is set to NIDCPOWER_VAL_DC_VOLTAGE. Use\n'
+                                                                          'nidcpower_ConfigureOutputFunction to set the output function.\n'
+                                                                          '\n'
+                                                                          'Use the NIDCPOWER_ATTR_VOLTAGE_LEVEL_AUTORANGE attribute to enable\n'
+                                                                          'automatic selection of the voltage level range.\n'
+                                                                          '\n'
+                                                                          '**Related Topics:**\n'
+                                                                          '\n'
+                                                                          '`Ranges <REPLACE_DRIVER_SPECIFIC_URL_1(ranges)>`__\n',
+                                                           'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                      'invalidates_attribute_cache': True,
+                                      'parameters': [   {   'direction': 'in',
+                                                            'documentation': {   'description': '\n'
+                                                                                                'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                                'niDCPower_InitializeWithChannels function.\n'},
+                                                            'name': 'vi',
+                                                            'type': 'ViSession'},
+                                                        {   'direction': 'in',
+                                                            'documentation': {   'description': '\n'
+                                                                                                'Specifies the output channel(s) to which this configuration value\n'
+                                                                                                'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                                'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                                '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                                'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                                'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                                'In the Running state, multiple output channel configurations are\n'
+                                                                                                'performed sequentially based on the order specified in this parameter.\n'},
+                                                            'name': 'channelName',
+                                                            'type': 'ViChar[]'},
+                                                        {   'direction': 'in',
+                                                            'documentation': {   'description': '\n'
+                                                                                                'Specifies the voltage level range, in volts, on the specified\n'
+                                                                                                'channel(s).\n'
+                                                                                                'For valid ranges, refer to the *ranges* topic for your device in the *NI\n'
+                                                                                                'DC Power Supplies and SMUs Help*.\n'},
+                                                            'name': 'Range',
+                                                            'type': 'ViReal64'}],
+                                      'returns': 'ViStatus'},
+    'ConfigureVoltageLimit': {   'codegen_method': 'no',
+                                 'documentation': {   'description': '\n'
+                                                                     'Configures the voltage limit for the specified channel(s). The channel\n'
+                                                                     'must be enabled for the specified voltage limit to take effect. Refer to\n'
+                                                                     'the niDCPower_ConfigureOutputEnabled function for more information\n'
+                                                                     'about enabling the output channel.\n'
+                                                                     '\n'
+                                                                     'The voltage limit is the voltage that the output should not exceed when\n'
+                                                                     'generating the desired niDCPower_ConfigureCurrentLevel. The voltage\n'
+                                                                     'limit setting is applicable only if the output function of the channel\n'
+                                                                     'is set to NIDCPOWER_VAL_DC_CURRENT. Use\n'
+                                                                     'nidcpower_ConfigureOutputFunction to set the output function.\n'
+                                                                     '\n'
+                                                                     '**Related Topics:**\n'
+                                                                     '\n'
+                                                                     '`Compliance <REPLACE_DRIVER_SPECIFIC_URL_1(compliance)>`__\n',
+                                                      'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                 'invalidates_attribute_cache': True,
+                                 'parameters': [   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                           'niDCPower_InitializeWithChannels function.\n'},
+                                                       'name': 'vi',
+                                                       'type': 'ViSession'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Specifies the output channel(s) to which this configuration value\n'
+                                                                                           'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                           'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                           '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                           'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                           'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                           'In the Running state, multiple output channel configurations are\n'
+                                                                                           'performed sequentially based on the order specified in this parameter.\n'},
+                                                       'name': 'channelName',
+                                                       'type': 'ViChar[]'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Specifies the voltage limit, in volts, on the specified output\n'
+                                                                                           'channel(s). The limit is specified as a positive value, but symmetric\n'
+                                                                                           'positive and negative limits are enforced simultaneously.\n'
+                                                                                           '**Valid Values:**\n'
+                                                                                           'The valid values for this parameter are defined by the voltage limit\n'
+                                                                                           'range that is configured using the niDCPower_ConfigureVoltagelimitRange\n'
+                                                                                           'function.\n',
+                                                                            'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                       'name': 'Limit',
+                                                       'type': 'ViReal64'}],
+                                 'returns': 'ViStatus'},
+    'ConfigureVoltageLimitRange': {   'codegen_method': 'no',
+                                      'documentation': {   'description': '\n'
+                                                                          'Configures the voltage limit range for the specified channel(s). The\n'
+                                                                          'configured range defines the valid values the voltage limit can be set\n'
+                                                                          'to using the niDCPower_ConfigureVoltageLimit function. The voltage\n'
+                                                                          'limit range setting is applicable only if the output function of the\n'
+                                                                          'channel is set to NIDCPOWER_VAL_DC_CURRENT. Use\n'
+                                                                          'nidcpower_ConfigureOutputFunction to set the output function.\n'
+                                                                          '\n'
+                                                                          'Use the NIDCPOWER_ATTR_VOLTAGE_LIMIT_AUTORANGE attribute to enable\n'
+                                                                          'automatic selection of the voltage limit range.\n'
+                                                                          '\n'
+                                                                          '**Related Topics:**\n'
+                                                                          '\n'
+                                                                          '`Ranges <REPLACE_DRIVER_SPECIFIC_URL_1(ranges)>`__\n',
+                                                           'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                      'invalidates_attribute_cache': True,
+                                      'parameters': [   {   'direction': 'in',
+                                                            'documentation': {   'description': '\n'
+                                                                                                'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                                'niDCPower_InitializeWithChannels function.\n'},
+                                                            'name': 'vi',
+                                                            'type': 'ViSession'},
+                                                        {   'direction': 'in',
+                                                            'documentation': {   'description': '\n'
+                                                                                                'Specifies the output channel(s) to which this configuration value\n'
+                                                                                                'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                                'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                                '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                                'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                                'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                                'In the Running state, multiple output channel configurations are\n'
+                                                                                                'performed sequentially based on the order specified in this parameter.\n'},
+                                                            'name': 'channelName',
+                                                            'type': 'ViChar[]'},
+                                                        {   'direction': 'in',
+                                                            'documentation': {   'description': '\n'
+                                                                                                'Specifies the voltage limit range, in volts, on the specified\n'
+                                                                                                'channel(s).\n'
+                                                                                                'For valid ranges, refer to the *ranges* topic for your device in the *NI\n'
+                                                                                                'DC Power Supplies and SMUs Help*.\n'},
+                                                            'name': 'Range',
+                                                            'type': 'ViReal64'}],
+                                      'returns': 'ViStatus'},
+    'ConnectInternalReference': {   'codegen_method': 'no',
+                                    'documentation': {   'description': '\n'
+                                                                        'Routes the internal reference to the calibration pin in preparation for\n'
+                                                                        'adjustment. Refer to the calibration procedure for the device you are\n'
+                                                                        'calibrating for detailed instructions on the appropriate use of this\n'
+                                                                        'function. This function can only be called from an external calibration\n'
+                                                                        'session.\n',
+                                                         'note': '\n'
+                                                                 'This function is not supported on all devices. Refer to `Supported\n'
+                                                                 'Functions by\n'
+                                                                 "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                                 'for more information about supported devices.\n'},
+                                    'parameters': [   {   'direction': 'in',
+                                                          'documentation': {   'description': '\n'
+                                                                                              'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                              'niDCPower_InitializeWithChannels function.\n'},
+                                                          'name': 'vi',
+                                                          'type': 'ViSession'},
+                                                      {   'direction': 'in',
+                                                          'documentation': {   'description': '\nSpecifies the internal reference to be connected to the calibration pin.\n**Defined Values**:\n',
+                                                                               'note': [   '\n'
+                                                                                           'One or more of the referenced values are not in the Python API for this driver. Enums that only define '
+                                                                                           'values, or represent True/False, have been removed.\n'],
+                                                                               'table_body': [   ['NIDCPOWER_VAL_INTERNAL_REFERENCE_5V (1054)', 'Calibration pin connected to 5 V internal reference.'],
+                                                                                                 [   'NIDCPOWER_VAL_INTERNAL_REFERENCE_100KOHM (1055)',
+                                                                                                     'Calibration pin connected to 100 kΩ internal reference.'],
+                                                                                                 ['NIDCPOWER_VAL_INTERNAL_REFERENCE_GROUND (1056)', 'Calibration pin connected to ground reference.'],
+                                                                                                 [   'NIDCPOWER_VAL_INTERNAL_REFERENCE_NONE (1057)',
+                                                                                                     'Calibration pin disconnected from internal reference.']]},
+                                                          'name': 'internalReference',
+                                                          'type': 'ViInt32'}],
+                                    'returns': 'ViStatus'},
+    'CreateAdvancedSequence': {   'blocking': False,
+                                  'codegen_method': 'public',
+                                  'documentation': {   'description': '\n'
+                                                                      'Creates an empty advanced sequence. Call the\n'
+                                                                      'niDCPower_CreateAdvancedSequenceStep function to add steps to the\n'
+                                                                      'active advanced sequence.\n'
+                                                                      '\n'
+                                                                      '**Support for this function**\n'
+                                                                      '\n'
+                                                                      'You must set the source mode to Sequence to use this function.\n'
+                                                                      '\n'
+                                                                      'Using the niDCPower_SetSequence function with Advanced Sequence\n'
+                                                                      'functions is unsupported.\n'
+                                                                      '\n'
+                                                                      'Use this function in the Uncommitted or Committed programming states.\n'
+                                                                      'Refer to the `Programming\n'
+                                                                      'States <REPLACE_DRIVER_SPECIFIC_URL_1(programmingstates)>`__ topic in\n'
+                                                                      'the *NI DC Power Supplies and SMUs Help* for more information about\n'
+                                                                      'NI-DCPower programming states.\n'
+                                                                      '\n'
+                                                                      '**Related Topics**:\n'
+                                                                      '\n'
+                                                                      '`Advanced Sequence\n'
+                                                                      'Mode <REPLACE_DRIVER_SPECIFIC_URL_1(advancedsequencemode)>`__\n'
+                                                                      '\n'
+                                                                      '`Programming\n'
+                                                                      'States <REPLACE_DRIVER_SPECIFIC_URL_1(programmingstates)>`__\n'
+                                                                      '\n'
+                                                                      'niDCPower_CreateAdvancedSequenceStep\n',
+                                                       'note': '\n'
+                                                               'This function is not supported on all devices. Refer to `Supported\n'
+                                                               'Functions by\n'
+                                                               "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                               'for more information about supported devices.\n'},
+                                  'has_repeated_capability': False,
+                                  'invalidates_attribute_cache': True,
+                                  'is_error_handling': False,
+                                  'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                  'name': 'CreateAdvancedSequence',
+                                  'parameters': [   {   'ctypes_type': 'ViSession',
+                                                        'ctypes_type_library_call': 'ViSession',
+                                                        'ctypes_variable_name': 'vi_ctype',
+                                                        'direction': 'in',
+                                                        'documentation': {   'description': '\n'
+                                                                                            'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                            'niDCPower_InitializeWithChannels function.\n'},
+                                                        'enum': None,
+                                                        'is_buffer': False,
+                                                        'is_repeated_capability': False,
+                                                        'is_session_handle': True,
+                                                        'is_string': False,
+                                                        'library_method_call_snippet': 'vi_ctype',
+                                                        'name': 'vi',
+                                                        'numpy': False,
+                                                        'numpy_into_return': False,
+                                                        'python_name': 'vi',
+                                                        'python_name_or_default_for_init': 'vi',
+                                                        'python_name_with_default': 'vi',
+                                                        'python_name_with_doc_default': 'vi',
+                                                        'python_type': 'int',
+                                                        'size': {'mechanism': 'fixed', 'value': 1},
+                                                        'type': 'ViSession',
+                                                        'use_array': False,
+                                                        'use_in_python_api': True,
+                                                        'use_list': False},
+                                                    {   'ctypes_type': 'ViConstString',
+                                                        'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                        'ctypes_variable_name': 'sequence_name_ctype',
+                                                        'direction': 'in',
+                                                        'documentation': {'description': 'Specifies the name of the sequence to create.'},
+                                                        'enum': None,
+                                                        'is_buffer': False,
+                                                        'is_repeated_capability': False,
+                                                        'is_session_handle': False,
+                                                        'is_string': True,
+                                                        'library_method_call_snippet': 'sequence_name_ctype',
+                                                        'name': 'sequenceName',
+                                                        'numpy': False,
+                                                        'numpy_into_return': False,
+                                                        'python_name': 'sequence_name',
+                                                        'python_name_or_default_for_init': 'sequence_name',
+                                                        'python_name_with_default': 'sequence_name',
+                                                        'python_name_with_doc_default': 'sequence_name',
+                                                        'python_type': 'str',
+                                                        'size': {'mechanism': 'fixed', 'value': 1},
+                                                        'type': 'ViConstString',
+                                                        'use_array': False,
+                                                        'use_in_python_api': True,
+                                                        'use_list': False},
+                                                    {   'ctypes_type': 'ViInt32',
+                                                        'ctypes_type_library_call': 'ViInt32',
+                                                        'ctypes_variable_name': 'attribute_id_count_ctype',
+                                                        'direction': 'in',
+                                                        'documentation': {'description': 'Specifies the number of attributes in the attributeIDs array.'},
+                                                        'enum': None,
+                                                        'is_buffer': False,
+                                                        'is_repeated_capability': False,
+                                                        'is_session_handle': False,
+                                                        'is_string': False,
+                                                        'library_method_call_snippet': 'attribute_id_count_ctype',
+                                                        'name': 'attributeIdCount',
+                                                        'numpy': False,
+                                                        'numpy_into_return': False,
+                                                        'python_name': 'attribute_id_count',
+                                                        'python_name_or_default_for_init': 'attribute_id_count',
+                                                        'python_name_with_default': 'attribute_id_count',
+                                                        'python_name_with_doc_default': 'attribute_id_count',
+                                                        'python_type': 'int',
+                                                        'size': {'mechanism': 'fixed', 'value': 1},
+                                                        'type': 'ViInt32',
+                                                        'use_array': False,
+                                                        'use_in_python_api': False,
+                                                        'use_list': False},
+                                                    {   'ctypes_type': 'ViInt32',
+                                                        'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                                        'ctypes_variable_name': 'attribute_ids_ctype',
+                                                        'direction': 'in',
+                                                        'documentation': {   'description': '\n'
+                                                                                            'Specifies the attributes you reconfigure per step in the advanced\n'
+                                                                                            'sequence. The following table lists which attributes can be configured\n'
+                                                                                            'in an advanced sequence for each NI-DCPower device that supports\n'
+                                                                                            'advanced sequencing. A ✓ indicates that the attribute can be configured\n'
+                                                                                            'in advanced sequencing. An ✕ indicates that the attribute cannot be\n'
+                                                                                            'configured in advanced sequencing.\n',
+                                                                             'table_body': [   ['NIDCPOWER_ATTR_DC_NOISE_REJECTION', '✓', '✕', '✓', '✕', '✓', '✕', '✕', '✓'],
+                                                                                               ['NIDCPOWER_ATTR_APERTURE_TIME', '✓', '✓', '✓', '✓', '✓', '✓', '✓', '✓'],
+                                                                                               ['NIDCPOWER_ATTR_MEASURE_RECORD_LENGTH', '✓', '✓', '✓', '✓', '✓', '✓', '✓', '✓'],
+                                                                                               ['NIDCPOWER_ATTR_SENSE', '✓', '✓', '✓', '✓', '✓', '✓', '✓', '✓'],
+                                                                                               ['NIDCPOWER_ATTR_OVP_ENABLED', '✓', '✓', '✓', '✕', '✕', '✕', '✕', '✕'],
+                                                                                               ['NIDCPOWER_ATTR_OVP_LIMIT', '✓', '✓', '✓', '✕', '✕', '✕', '✕', '✕'],
+                                                                                               ['NIDCPOWER_ATTR_PULSE_BIAS_DELAY', '✓', '✓', '✓', '✓', '✓', '✕', '✕', '✕'],
+                                                                                               ['NIDCPOWER_ATTR_PULSE_OFF_TIME', '✓', '✓', '✓', '✓', '✓', '✕', '✕', '✕'],
+                                                                                               ['NIDCPOWER_ATTR_PULSE_ON_TIME', '✓', '✓', '✓', '✓', '✓', '✕', '✕', '✕'],
+                                                                                               ['NIDCPOWER_ATTR_SOURCE_DELAY', '✓', '✓', '✓', '✓', '✓', '✓', '✓', '✓'],
+                                                                                               ['NIDCPOWER_ATTR_CURRENT_COMPENSATION_FREQUENCY', '✓', '✕', '✓', '✕', '✓', '✕', '✓', '✓'],
+                                                                                               ['NIDCPOWER_ATTR_CURRENT_GAIN_BANDWIDTH', '✓', '✕', '✓', '✕', '✓', '✕', '✓', '✓'],
+                                                                                               ['NIDCPOWER_ATTR_CURRENT_POLE_ZERO_RATIO', '✓', '✕', '✓', '✕', '✓', '✕', '✓', '✓'],
+                                                                                               ['NIDCPOWER_ATTR_VOLTAGE_COMPENSATION_FREQUENCY', '✓', '✕', '✓', '✕', '✓', '✕', '✓', '✓'],
+                                                                                               ['NIDCPOWER_ATTR_VOLTAGE_GAIN_BANDWIDTH', '✓', '✕', '✓', '✕', '✓', '✕', '✓', '✓'],
+                                                                                               ['NIDCPOWER_ATTR_VOLTAGE_POLE_ZERO_RATIO', '✓', '✕', '✓', '✕', '✓', '✕', '✓', '✓'],
+                                                                                               ['NIDCPOWER_ATTR_CURRENT_LEVEL', '✓', '✓', '✓', '✓', '✓', '✓', '✓', '✓'],
+                                                                                               ['NIDCPOWER_ATTR_CURRENT_LEVEL_RANGE', '✓', '✓', '✓', '✓', '✓', '✓', '✓', '✓'],
+                                                                                               ['NIDCPOWER_ATTR_VOLTAGE_LIMIT', '✓', '✓', '✓', '✓', '✓', '✓', '✓', '✓'],
+                                                                                               ['NIDCPOWER_ATTR_VOLTAGE_LIMIT_RANGE', '✓', '✓', '✓', '✓', '✓', '✓', '✓', '✓'],
+                                                                                               ['NIDCPOWER_ATTR_CURRENT_LIMIT', '✓', '✓', '✓', '✓', '✓', '✓', '✓', '✓'],
+                                                                                               ['NIDCPOWER_ATTR_CURRENT_LIMIT_RANGE', '✓', '✓', '✓', '✓', '✓', '✓', '✓', '✓'],
+                                                                                               ['NIDCPOWER_ATTR_VOLTAGE_LEVEL', '✓', '✓', '✓', '✓', '✓', '✓', '✓', '✓'],
+                                                                                               ['NIDCPOWER_ATTR_VOLTAGE_LEVEL_RANGE', '✓', '✓', '✓', '✓', '✓', '✓', '✓', '✓'],
+                                                                                               ['NIDCPOWER_ATTR_OUTPUT_ENABLED', '✓', '✓', '✓', '✓', '✓', '✓', '✓', '✓'],
+                                                                                               ['NIDCPOWER_ATTR_OUTPUT_FUNCTION', '✓', '✓', '✓', '✓', '✓', '✓', '✓', '✓'],
+                                                                                               ['NIDCPOWER_ATTR_OUTPUT_RESISTANCE', '✓', '✕', '✓', '✕', '✓', '✕', '✓', '✕'],
+                                                                                               ['NIDCPOWER_ATTR_PULSE_BIAS_CURRENT_LEVEL', '✓', '✓', '✓', '✓', '✓', '✕', '✕', '✕'],
+                                                                                               ['NIDCPOWER_ATTR_PULSE_BIAS_VOLTAGE_LIMIT', '✓', '✓', '✓', '✓', '✓', '✕', '✕', '✕'],
+                                                                                               ['NIDCPOWER_ATTR_PULSE_CURRENT_LEVEL', '✓', '✓', '✓', '✓', '✓', '✕', '✕', '✕'],
+                                                                                               ['NIDCPOWER_ATTR_PULSE_CURRENT_LEVEL_RANGE', '✓', '✓', '✓', '✓', '✓', '✕', '✕', '✕'],
+                                                                                               ['NIDCPOWER_ATTR_PULSE_VOLTAGE_LIMIT', '✓', '✓', '✓', '✓', '✓', '✕', '✕', '✕'],
+                                                                                               ['NIDCPOWER_ATTR_PULSE_VOLTAGE_LIMIT_RANGE', '✓', '✓', '✓', '✓', '✓', '✕', '✕', '✕'],
+                                                                                               ['NIDCPOWER_ATTR_PULSE_BIAS_CURRENT_LIMIT', '✓', '✓', '✓', '✓', '✓', '✕', '✕', '✕'],
+                                                                                               ['NIDCPOWER_ATTR_PULSE_BIAS_VOLTAGE_LEVEL', '✓', '✓', '✓', '✓', '✓', '✕', '✕', '✕'],
+                                                                                               ['NIDCPOWER_ATTR_PULSE_CURRENT_LIMIT', '✓', '✓', '✓', '✓', '✓', '✕', '✕', '✕'],
+                                                                                               ['NIDCPOWER_ATTR_PULSE_CURRENT_LIMIT_RANGE', '✓', '✓', '✓', '✓', '✓', '✕', '✕', '✕'],
+                                                                                               ['NIDCPOWER_ATTR_PULSE_VOLTAGE_LEVEL', '✓', '✓', '✓', '✓', '✓', '✕', '✕', '✕'],
+                                                                                               ['NIDCPOWER_ATTR_PULSE_VOLTAGE_LEVEL_RANGE', '✓', '✓', '✓', '✓', '✓', '✕', '✕', '✕'],
+                                                                                               ['NIDCPOWER_ATTR_TRANSIENT_RESPONSE', '✓', '✓', '✓', '✓', '✓', '✓', '✓', '✓']],
+                                                                             'table_header': [   'Attribute',
+                                                                                                 'PXIe-4135',
+                                                                                                 'NI 4136',
+                                                                                                 'NI 4137',
+                                                                                                 'NI 4138',
+                                                                                                 'NI 4139',
+                                                                                                 'NI 4140/4142/4144',
+                                                                                                 'NI 4141/4143/4145',
+                                                                                                 'PXIe-4162/4163']},
+                                                        'enum': None,
+                                                        'is_buffer': True,
+                                                        'is_repeated_capability': False,
+                                                        'is_session_handle': False,
+                                                        'is_string': False,
+                                                        'library_method_call_snippet': 'attribute_ids_ctype',
+                                                        'name': 'attributeIds',
+                                                        'numpy': False,
+                                                        'numpy_into_return': False,
+                                                        'original_type': 'ViInt32[]',
+                                                        'python_name': 'attribute_ids',
+                                                        'python_name_or_default_for_init': 'attribute_ids',
+                                                        'python_name_with_default': 'attribute_ids',
+                                                        'python_name_with_doc_default': 'attribute_ids',
+                                                        'python_type': 'int',
+                                                        'size': {'mechanism': 'len', 'value': 'attributeIdCount'},
+                                                        'type': 'ViInt32',
+                                                        'use_array': False,
+                                                        'use_in_python_api': True,
+                                                        'use_list': True},
+                                                    {   'ctypes_type': 'ViBoolean',
+                                                        'ctypes_type_library_call': 'ViBoolean',
+                                                        'ctypes_variable_name': 'set_as_active_sequence_ctype',
+                                                        'default_value': True,
+                                                        'direction': 'in',
+                                                        'documentation': {'description': 'Specifies that this current sequence is active.'},
+                                                        'enum': None,
+                                                        'is_buffer': False,
+                                                        'is_repeated_capability': False,
+                                                        'is_session_handle': False,
+                                                        'is_string': False,
+                                                        'library_method_call_snippet': 'set_as_active_sequence_ctype',
+                                                        'name': 'setAsActiveSequence',
+                                                        'numpy': False,
+                                                        'numpy_into_return': False,
+                                                        'python_name': 'set_as_active_sequence',
+                                                        'python_name_or_default_for_init': 'set_as_active_sequence',
+                                                        'python_name_with_default': 'set_as_active_sequence=True',
+                                                        'python_name_with_doc_default': 'set_as_active_sequence=True',
+                                                        'python_type': 'bool',
+                                                        'size': {'mechanism': 'fixed', 'value': 1},
+                                                        'type': 'ViBoolean',
+                                                        'use_array': False,
+                                                        'use_in_python_api': True,
+                                                        'use_list': False}],
+                                  'python_code_variables': [],
+                                  'python_name': 'create_advanced_sequence',
+                                  'render_in_library': True,
+                                  'render_in_session_base': False,
+                                  'returns': 'ViStatus'},
+    'CreateAdvancedSequenceStep': {   'blocking': False,
+                                      'codegen_method': 'public',
+                                      'documentation': {   'description': '\n'
+                                                                          'Creates a new advanced sequence step in the advanced sequence specified\n'
+                                                                          'by the Active advanced sequence. When you create an advanced sequence\n'
+                                                                          'step, each attribute you passed to the niDCPower_CreateAdvancedSequence\n'
+                                                                          'function is reset to its default value for that step unless otherwise\n'
+                                                                          'specified.\n'
+                                                                          '\n'
+                                                                          '**Support for this Function**\n'
+                                                                          '\n'
+                                                                          'You must set the source mode to Sequence to use this function.\n'
+                                                                          '\n'
+                                                                          'Using the niDCPower_SetSequence function with Advanced Sequence\n'
+                                                                          'functions is unsupported.\n'
+                                                                          '\n'
+                                                                          '**Related Topics**:\n'
+                                                                          '\n'
+                                                                          '`Advanced Sequence\n'
+                                                                          'Mode <REPLACE_DRIVER_SPECIFIC_URL_1(advancedsequencemode)>`__\n'
+                                                                          '\n'
+                                                                          '`Programming\n'
+                                                                          'States <REPLACE_DRIVER_SPECIFIC_URL_1(programmingstates)>`__\n'
+                                                                          '\n'
+                                                                          'niDCPower_CreateAdvancedSequence\n',
+                                                           'note': '\n'
+                                                                   'This function is not supported on all devices. Refer to `Supported\n'
+                                                                   'Functions by\n'
+                                                                   "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                                   'for more information about supported devices.\n'},
+                                      'has_repeated_capability': False,
+                                      'invalidates_attribute_cache': True,
+                                      'is_error_handling': False,
+                                      'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                      'name': 'CreateAdvancedSequenceStep',
+                                      'parameters': [   {   'ctypes_type': 'ViSession',
+                                                            'ctypes_type_library_call': 'ViSession',
+                                                            'ctypes_variable_name': 'vi_ctype',
+                                                            'direction': 'in',
+                                                            'documentation': {   'description': '\n'
+                                                                                                'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                                'niDCPower_InitializeWithChannels function.\n'},
+                                                            'enum': None,
+                                                            'is_buffer': False,
+                                                            'is_repeated_capability': False,
+                                                            'is_session_handle': True,
+                                                            'is_string': False,
+                                                            'library_method_call_snippet': 'vi_ctype',
+                                                            'name': 'vi',
+                                                            'numpy': False,
+                                                            'numpy_into_return': False,
+                                                            'python_name': 'vi',
+                                                            'python_name_or_default_for_init': 'vi',
+                                                            'python_name_with_default': 'vi',
+                                                            'python_name_with_doc_default': 'vi',
+                                                            'python_type': 'int',
+                                                            'size': {'mechanism': 'fixed', 'value': 1},
+                                                            'type': 'ViSession',
+                                                            'use_array': False,
+                                                            'use_in_python_api': True,
+                                                            'use_list': False},
+                                                        {   'ctypes_type': 'ViBoolean',
+                                                            'ctypes_type_library_call': 'ViBoolean',
+                                                            'ctypes_variable_name': 'set_as_active_step_ctype',
+                                                            'default_value': True,
+                                                            'direction': 'in',
+                                                            'documentation': {'description': 'Specifies that this current step in the active sequence is active.'},
+                                                            'enum': None,
+                                                            'is_buffer': False,
+                                                            'is_repeated_capability': False,
+                                                            'is_session_handle': False,
+                                                            'is_string': False,
+                                                            'library_method_call_snippet': 'set_as_active_step_ctype',
+                                                            'name': 'setAsActiveStep',
+                                                            'numpy': False,
+                                                            'numpy_into_return': False,
+                                                            'python_name': 'set_as_active_step',
+                                                            'python_name_or_default_for_init': 'set_as_active_step',
+                                                            'python_name_with_default': 'set_as_active_step=True',
+                                                            'python_name_with_doc_default': 'set_as_active_step=True',
+                                                            'python_type': 'bool',
+                                                            'size': {'mechanism': 'fixed', 'value': 1},
+                                                            'type': 'ViBoolean',
+                                                            'use_array': False,
+                                                            'use_in_python_api': True,
+                                                            'use_list': False}],
+                                      'python_code_variables': [],
+                                      'python_name': 'create_advanced_sequence_step',
+                                      'render_in_library': True,
+                                      'render_in_session_base': False,
+                                      'returns': 'ViStatus'},
+    'DeleteAdvancedSequence': {   'blocking': False,
+                                  'codegen_method': 'public',
+                                  'documentation': {   'description': '\n'
+                                                                      'Deletes a previously created advanced sequence and all the advanced\n'
+                                                                      'sequence steps in the advanced sequence.\n'
+                                                                      '\n'
+                                                                      '**Support for this Function**\n'
+                                                                      '\n'
+                                                                      'You must set the source mode to Sequence to use this function.\n'
+                                                                      '\n'
+                                                                      'Using the niDCPower_SetSequence function with Advanced Sequence\n'
+                                                                      'functions is unsupported.\n'
+                                                                      '\n'
+                                                                      '**Related Topics**:\n'
+                                                                      '\n'
+                                                                      '`Advanced Sequence\n'
+                                                                      'Mode <REPLACE_DRIVER_SPECIFIC_URL_1(advancedsequencemode)>`__\n'
+                                                                      '\n'
+                                                                      '`Programming\n'
+                                                                      'States <REPLACE_DRIVER_SPECIFIC_URL_1(programmingstates)>`__\n',
+                                                       'note': '\n'
+                                                               'This function is not supported on all devices. Refer to `Supported\n'
+                                                               'Functions by\n'
+                                                               "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                               'for more information about supported devices.\n'},
+                                  'has_repeated_capability': False,
+                                  'invalidates_attribute_cache': True,
+                                  'is_error_handling': False,
+                                  'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                  'name': 'DeleteAdvancedSequence',
+                                  'parameters': [   {   'ctypes_type': 'ViSession',
+                                                        'ctypes_type_library_call': 'ViSession',
+                                                        'ctypes_variable_name': 'vi_ctype',
+                                                        'direction': 'in',
+                                                        'documentation': {   'description': '\n'
+                                                                                            'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                            'niDCPower_InitializeWithChannels function.\n'},
+                                                        'enum': None,
+                                                        'is_buffer': False,
+                                                        'is_repeated_capability': False,
+                                                        'is_session_handle': True,
+                                                        'is_string': False,
+                                                        'library_method_call_snippet': 'vi_ctype',
+                                                        'name': 'vi',
+                                                        'numpy': False,
+                                                        'numpy_into_return': False,
+                                                        'python_name': 'vi',
+                                                        'python_name_or_default_for_init': 'vi',
+                                                        'python_name_with_default': 'vi',
+                                                        'python_name_with_doc_default': 'vi',
+                                                        'python_type': 'int',
+                                                        'size': {'mechanism': 'fixed', 'value': 1},
+                                                        'type': 'ViSession',
+                                                        'use_array': False,
+                                                        'use_in_python_api': True,
+                                                        'use_list': False},
+                                                    {   'ctypes_type': 'ViConstString',
+                                                        'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                        'ctypes_variable_name': 'sequence_name_ctype',
+                                                        'direction': 'in',
+                                                        'documentation': {'description': 'specifies the name of the sequence to delete.'},
+                                                        'enum': None,
+                                                        'is_buffer': False,
+                                                        'is_repeated_capability': False,
+                                                        'is_session_handle': False,
+                                                        'is_string': True,
+                                                        'library_method_call_snippet': 'sequence_name_ctype',
+                                                        'name': 'sequenceName',
+                                                        'numpy': False,
+                                                        'numpy_into_return': False,
+                                                        'python_name': 'sequence_name',
+                                                        'python_name_or_default_for_init': 'sequence_name',
+                                                        'python_name_with_default': 'sequence_name',
+                                                        'python_name_with_doc_default': 'sequence_name',
+                                                        'python_type': 'str',
+                                                        'size': {'mechanism': 'fixed', 'value': 1},
+                                                        'type': 'ViConstString',
+                                                        'use_array': False,
+                                                        'use_in_python_api': True,
+                                                        'use_list': False}],
+                                  'python_code_variables': [],
+                                  'python_name': 'delete_advanced_sequence',
+                                  'render_in_library': True,
+                                  'render_in_session_base': False,
+                                  'returns': 'ViStatus'},
+    'Disable': {   'blocking': False,
+                   'codegen_method': 'public',
+                   'documentation': {   'description': '\n'
+                                                       'This function performs the same actions as the niDCPower_reset\n'
+                                                       'function, except that this function also immediately sets the\n'
+                                                       'NIDCPOWER_ATTR_OUTPUT_ENABLED attribute to VI_FALSE.\n'
+                                                       '\n'
+                                                       'This function opens the output relay on devices that have an output\n'
+                                                       'relay.\n'},
+                   'has_repeated_capability': False,
+                   'invalidates_attribute_cache': True,
+                   'is_error_handling': False,
+                   'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                   'name': 'Disable',
+                   'parameters': [   {   'ctypes_type': 'ViSession',
+                                         'ctypes_type_library_call': 'ViSession',
+                                         'ctypes_variable_name': 'vi_ctype',
+                                         'direction': 'in',
+                                         'documentation': {'description': '\nIdentifies a particular instrument session. **vi** is obtained from the\nniDCPower_InitializeWithChannels function.\n'},
+                                         'enum': None,
+                                         'is_buffer': False,
+                                         'is_repeated_capability': False,
+                                         'is_session_handle': True,
+                                         'is_string': False,
+                                         'library_method_call_snippet': 'vi_ctype',
+                                         'name': 'vi',
+                                         'numpy': False,
+                                         'numpy_into_return': False,
+                                         'python_name': 'vi',
+                                         'python_name_or_default_for_init': 'vi',
+                                         'python_name_with_default': 'vi',
+                                         'python_name_with_doc_default': 'vi',
+                                         'python_type': 'int',
+                                         'size': {'mechanism': 'fixed', 'value': 1},
+                                         'type': 'ViSession',
+                                         'use_array': False,
+                                         'use_in_python_api': True,
+                                         'use_list': False}],
+                   'python_code_variables': [],
+                   'python_name': 'disable',
+                   'render_in_library': True,
+                   'render_in_session_base': False,
+                   'returns': 'ViStatus'},
+    'DisablePulseTrigger': {   'codegen_method': 'no',
+                               'documentation': {   'description': '\n'
+                                                                   'Disables the Pulse trigger. The device does not wait for a pulse trigger\n'
+                                                                   'before performing a pulse operation. Refer to `Pulse\n'
+                                                                   'Mode <REPLACE_DRIVER_SPECIFIC_URL_1(pulsemode)>`__ and `Sequence Source\n'
+                                                                   'Mode <REPLACE_DRIVER_SPECIFIC_URL_1(sequencing)>`__ for more information\n'
+                                                                   'about the Pulse trigger.\n'
+                                                                   '\n'
+                                                                   'This function is necessary only if you configured a Pulse trigger in the\n'
+                                                                   'past and now want to disable it.\n',
+                                                    'note': '\n'
+                                                            'This function is not supported on all devices. Refer to `Supported\n'
+                                                            'Functions by\n'
+                                                            "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                            'for more information about supported devices.\n'},
+                               'parameters': [   {   'direction': 'in',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                         'niDCPower_InitializeWithChannels function.\n'},
+                                                     'name': 'vi',
+                                                     'type': 'ViSession'}],
+                               'returns': 'ViStatus'},
+    'DisableSequenceAdvanceTrigger': {   'codegen_method': 'no',
+                                         'documentation': {   'description': '\n'
+                                                                             'Disables the Sequence Advance trigger. The device does not wait for a\n'
+                                                                             'Sequence Advance trigger before advancing to the next iteration of the\n'
+                                                                             'sequence. Refer to the `Sequence Source\n'
+                                                                             'Mode <REPLACE_DRIVER_SPECIFIC_URL_1(sequencing)>`__ topic for more\n'
+                                                                             'information about the Sequence Advance trigger.\n',
+                                                              'note': '\n'
+                                                                      'This function is not supported on all devices. Refer to `Supported\n'
+                                                                      'Functions by\n'
+                                                                      "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                                      'for more information about supported devices.\n'},
+                                         'parameters': [   {   'direction': 'in',
+                                                               'documentation': {   'description': '\n'
+                                                                                                   'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                                   'niDCPower_InitializeWithChannels function.\n'},
+                                                               'name': 'vi',
+                                                               'type': 'ViSession'}],
+                                         'returns': 'ViStatus'},
+    'DisableSourceTrigger': {   'codegen_method': 'no',
+                                'documentation': {   'description': '\n'
+                                                                    'Disables the Source trigger. The device does not wait for a source\n'
+                                                                    'trigger before performing a source operation. Refer to the `Single Point\n'
+                                                                    'Source Mode <REPLACE_DRIVER_SPECIFIC_URL_1(singlept)>`__ and `Sequence\n'
+                                                                    'Source Mode <REPLACE_DRIVER_SPECIFIC_URL_1(sequencing)>`__ topics for\n'
+                                                                    'more information about the Source trigger.\n',
+                                                     'note': '\n'
+                                                             'This function is not supported on all devices. Refer to `Supported\n'
+                                                             'Functions by\n'
+                                                             "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                             'for more information about supported devices.\n'},
+                                'parameters': [   {   'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                          'niDCPower_InitializeWithChannels function.\n'},
+                                                      'name': 'vi',
+                                                      'type': 'ViSession'}],
+                                'returns': 'ViStatus'},
+    'DisableStartTrigger': {   'codegen_method': 'no',
+                               'documentation': {   'description': '\nDisables the Start trigger. The device does not wait for a Start trigger\nwhen starting generation or acquisition.\n',
+                                                    'note': '\n'
+                                                            'This function is not supported on all devices. Refer to `Supported\n'
+                                                            'Functions by\n'
+                                                            "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                            'for more information about supported devices.\n'},
+                               'parameters': [   {   'direction': 'in',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                         'niDCPower_InitializeWithChannels function.\n'},
+                                                     'name': 'vi',
+                                                     'type': 'ViSession'}],
+                               'returns': 'ViStatus'},
+    'ExportSignal': {   'blocking': False,
+                        'codegen_method': 'public',
+                        'documentation': {   'description': '\n'
+                                                            'Routes signals (triggers and events) to the output terminal you specify.\n'
+                                                            'The route is created when the session is niDCPower_Commit.\n'
+                                                            '\n'
+                                                            '**Related Topics:**\n'
+                                                            '\n'
+                                                            '`Triggers <REPLACE_DRIVER_SPECIFIC_URL_1(trigger)>`__\n',
+                                             'note': '\n'
+                                                     'This function is not supported on all devices. Refer to `Supported\n'
+                                                     'Functions by\n'
+                                                     "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                     'for more information about supported devices.\n'},
+                        'has_repeated_capability': False,
+                        'invalidates_attribute_cache': True,
+                        'is_error_handling': False,
+                        'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                        'name': 'ExportSignal',
+                        'parameters': [   {   'ctypes_type': 'ViSession',
+                                              'ctypes_type_library_call': 'ViSession',
+                                              'ctypes_variable_name': 'vi_ctype',
+                                              'direction': 'in',
+                                              'documentation': {   'description': '\n'
+                                                                                  'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                  'niDCPower_InitializeWithChannels function.\n'},
+                                              'enum': None,
+                                              'is_buffer': False,
+                                              'is_repeated_capability': False,
+                                              'is_session_handle': True,
+                                              'is_string': False,
+                                              'library_method_call_snippet': 'vi_ctype',
+                                              'name': 'vi',
+                                              'numpy': False,
+                                              'numpy_into_return': False,
+                                              'python_name': 'vi',
+                                              'python_name_or_default_for_init': 'vi',
+                                              'python_name_with_default': 'vi',
+                                              'python_name_with_doc_default': 'vi',
+                                              'python_type': 'int',
+                                              'size': {'mechanism': 'fixed', 'value': 1},
+                                              'type': 'ViSession',
+                                              'use_array': False,
+                                              'use_in_python_api': True,
+                                              'use_list': False},
+                                          {   'ctypes_type': 'ViInt32',
+                                              'ctypes_type_library_call': 'ViInt32',
+                                              'ctypes_variable_name': 'signal_ctype',
+                                              'direction': 'in',
+                                              'documentation': {   'description': '\nSpecifies which trigger or event to export.\n**Defined Values:**\n',
+                                                                   'table_body': [   ['NIDCPOWER_VAL_SOURCE_COMPLETE_EVENT (1030)', 'Exports the Source Complete event.'],
+                                                                                     ['NIDCPOWER_VAL_MEASURE_COMPLETE_EVENT (1031)', 'Exports the Measure Complete event.'],
+                                                                                     ['NIDCPOWER_VAL_SEQUENCE_ITERATION_COMPLETE_EVENT (1032)', 'Exports the Sequence Iteration Complete event.'],
+                                                                                     ['NIDCPOWER_VAL_SEQUENCE_ENGINE_DONE_EVENT (1033)', 'Exports the Sequence Engine Done event.'],
+                                                                                     ['NIDCPOWER_VAL_PULSE_COMPLETE_EVENT (1051)', 'Exports the Pulse Complete event.'],
+                                                                                     ['NIDCPOWER_VAL_READY_FOR_PULSE_TRIGGER_EVENT (1052)', 'Exports the Ready Pulse Trigger event.'],
+                                                                                     ['NIDCPOWER_VAL_START_TRIGGER (1034)', 'Exports the Start trigger.'],
+                                                                                     ['NIDCPOWER_VAL_SOURCE_TRIGGER (1035)', 'Exports the Source trigger.'],
+                                                                                     ['NIDCPOWER_VAL_MEASURE_TRIGGER (1036)', 'Exports the Measure trigger.'],
+                                                                                     ['NIDCPOWER_VAL_SEQUENCE_ADVANCE_TRIGGER (1037)', 'Exports the Sequence Advance trigger.'],
+                                                                                     ['NIDCPOWER_VAL_PULSE_TRIGGER (1053)', 'Exports the Pulse trigger.']]},
+                                              'enum': 'ExportSignal',
+                                              'is_buffer': False,
+                                              'is_repeated_capability': False,
+                                              'is_session_handle': False,
+                                              'is_string': False,
+                                              'library_method_call_snippet': 'signal_ctype',
+                                              'name': 'Signal',
+                                              'numpy': False,
+                                              'numpy_into_return': False,
+                                              'python_name': 'signal',
+                                              'python_name_or_default_for_init': 'signal',
+                                              'python_name_with_default': 'signal',
+                                              'python_name_with_doc_default': 'signal',
+                                              'python_type': 'enums.ExportSignal',
+                                              'size': {'mechanism': 'fixed', 'value': 1},
+                                              'type': 'ViInt32',
+                                              'use_array': False,
+                                              'use_in_python_api': True,
+                                              'use_list': False},
+                                          {   'ctypes_type': 'ViChar[]',
+                                              'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                              'ctypes_variable_name': 'signal_identifier_ctype',
+                                              'default_value': '""',
+                                              'direction': 'in',
+                                              'documentation': {'description': 'Reserved for future use. Pass in an empty string for this parameter.'},
+                                              'enum': None,
+                                              'is_buffer': False,
+                                              'is_repeated_capability': False,
+                                              'is_session_handle': False,
+                                              'is_string': True,
+                                              'library_method_call_snippet': 'signal_identifier_ctype',
+                                              'name': 'signalIdentifier',
+                                              'numpy': False,
+                                              'numpy_into_return': False,
+                                              'python_name': 'signal_identifier',
+                                              'python_name_or_default_for_init': 'signal_identifier',
+                                              'python_name_with_default': 'signal_identifier=""',
+                                              'python_name_with_doc_default': 'signal_identifier=\'""\'',
+                                              'python_type': 'str',
+                                              'size': {'mechanism': 'fixed', 'value': 1},
+                                              'type': 'ViChar[]',
+                                              'use_array': False,
+                                              'use_in_python_api': True,
+                                              'use_list': False},
+                                          {   'ctypes_type': 'ViChar[]',
+                                              'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                              'ctypes_variable_name': 'output_terminal_ctype',
+                                              'direction': 'in',
+                                              'documentation': {   'description': '\nSpecifies where to export the selected signal.\n**Relative Terminals**:\n',
+                                                                   'table_body': [   ['""', 'Do not export signal'],
+                                                                                     ['"PXI_Trig0"', 'PXI trigger line 0'],
+                                                                                     ['"PXI_Trig1"', 'PXI trigger line 1'],
+                                                                                     ['"PXI_Trig2"', 'PXI trigger line 2'],
+                                                                                     ['"PXI_Trig3"', 'PXI trigger line 3'],
+                                                                                     ['"PXI_Trig4"', 'PXI trigger line 4'],
+                                                                                     ['"PXI_Trig5"', 'PXI trigger line 5'],
+                                                                                     ['"PXI_Trig6"', 'PXI trigger line 6'],
+                                                                                     ['"PXI_Trig7"', 'PXI trigger line 7']]},
+                                              'enum': None,
+                                              'is_buffer': False,
+                                              'is_repeated_capability': False,
+                                              'is_session_handle': False,
+                                              'is_string': True,
+                                              'library_method_call_snippet': 'output_terminal_ctype',
+                                              'name': 'outputTerminal',
+                                              'numpy': False,
+                                              'numpy_into_return': False,
+                                              'python_name': 'output_terminal',
+                                              'python_name_or_default_for_init': 'output_terminal',
+                                              'python_name_with_default': 'output_terminal',
+                                              'python_name_with_doc_default': 'output_terminal',
+                                              'python_type': 'str',
+                                              'size': {'mechanism': 'fixed', 'value': 1},
+                                              'type': 'ViChar[]',
+                                              'use_array': False,
+                                              'use_in_python_api': True,
+                                              'use_list': False}],
+                        'python_code_variables': [],
+                        'python_name': 'export_signal',
+                        'render_in_library': True,
+                        'render_in_session_base': False,
+                        'returns': 'ViStatus'},
+    'FetchMultiple': {   'blocking': True,
+                         'codegen_method': 'public',
+                         'documentation': {   'description': '\n'
+                                                             'Returns an array of voltage measurements, an array of current\n'
+                                                             'measurements, and an array of compliance measurements that were\n'
+                                                             'previously taken and are stored in the NI-DCPower buffer. This function\n'
+                                                             'should not be used when the NIDCPOWER_ATTR_MEASURE_WHEN attribute is\n'
+                                                             'set to NIDCPOWER_VAL_ON_DEMAND. You must first call\n'
+                                                             'niDCPower_Initiate before calling this function.\n'
+                                                             '\n'
+                                                             'Refer to the `Acquiring\n'
+                                                             'Measurements <REPLACE_DRIVER_SPECIFIC_URL_1(acquiringmeasurements)>`__\n'
+                                                             'and `Compliance <REPLACE_DRIVER_SPECIFIC_URL_1(compliance)>`__ topics in\n'
+                                                             'the *NI DC Power Supplies and SMUs Help* for more information about\n'
+                                                             'configuring this function.\n',
+                                              'note': [   '\n'
+                                                          'This function is not supported on all devices. Refer to `Supported\n'
+                                                          'Functions by\n'
+                                                          "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                          'for more information about supported devices.\n',
+                                                          '\n'
+                                                          'This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same '
+                                                          'session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the '
+                                                          "Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.\n"]},
+                         'has_repeated_capability': True,
+                         'invalidates_attribute_cache': False,
+                         'is_error_handling': False,
+                         'method_templates': [   {'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'},
+                                                 {'documentation_filename': '/numpy_method', 'method_python_name_suffix': '_into', 'session_filename': '/numpy_read_method'}],
+                         'name': 'FetchMultiple',
+                         'parameters': [   {   'ctypes_type': 'ViSession',
+                                               'ctypes_type_library_call': 'ViSession',
+                                               'ctypes_variable_name': 'vi_ctype',
+                                               'direction': 'in',
+                                               'documentation': {   'description': '\n'
+                                                                                   'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                   'niDCPower_InitializeWithChannels function.\n'},
+                                               'enum': None,
+                                               'is_buffer': False,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': True,
+                                               'is_string': False,
+                                               'library_method_call_snippet': 'vi_ctype',
+                                               'name': 'vi',
+                                               'numpy': False,
+                                               'numpy_into_return': False,
+                                               'python_name': 'vi',
+                                               'python_name_or_default_for_init': 'vi',
+                                               'python_name_with_default': 'vi',
+                                               'python_name_with_doc_default': 'vi',
+                                               'python_type': 'int',
+                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                               'type': 'ViSession',
+                                               'use_array': False,
+                                               'use_in_python_api': True,
+                                               'use_list': False},
+                                           {   'ctypes_type': 'ViChar[]',
+                                               'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                               'ctypes_variable_name': 'channel_name_ctype',
+                                               'default_value': 1.0,
+                                               'direction': 'in',
+                                               'documentation': {   'description': '\n'
+                                                                                   'Specifies the output channel(s) to which this configuration value\n'
+                                                                                   'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                   'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                   '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                   'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                   'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                   'In the Running state, multiple output channel configurations are\n'
+                                                                                   'performed sequentially based on the order specified in this parameter.\n'},
+                                               'enum': None,
+                                               'is_buffer': False,
+                                               'is_repeated_capability': True,
+                                               'is_session_handle': False,
+                                               'is_string': True,
+                                               'library_method_call_snippet': 'channel_name_ctype',
+                                               'name': 'channelName',
+                                               'numpy': False,
+                                               'numpy_into_return': False,
+                                               'python_name': 'channel_name',
+                                               'python_name_or_default_for_init': 'channel_name',
+                                               'python_name_with_default': 'channel_name=1.0',
+                                               'python_name_with_doc_default': 'channel_name=1.0',
+                                               'python_type': 'str',
+                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                               'type': 'ViChar[]',
+                                               'use_array': False,
+                                               'use_in_python_api': True,
+                                               'use_list': False},
+                                           {   'ctypes_type': 'ViReal64',
+                                               'ctypes_type_library_call': 'ViReal64',
+                                               'ctypes_variable_name': 'timeout_ctype',
+                                               'default_value': 'datetime.timedelta(seconds=1.0)',
+                                               'direction': 'in',
+                                               'documentation': {   'description': '\n'
+                                                                                   'Specifies the maximum time allowed for this function to complete, in\n'
+                                                                                   'seconds. If the function does not complete within this time interval,\n'
+                                                                                   'NI-DCPower returns an error.\n',
+                                                                    'note': '\n'
+                                                                            'When setting the timeout interval, ensure you take into account any\n'
+                                                                            'triggers so that the timeout interval is long enough for your\n'
+                                                                            'application.\n'},
+                                               'enum': None,
+                                               'is_buffer': False,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': False,
+                                               'is_string': False,
+                                               'library_method_call_snippet': 'timeout_ctype',
+                                               'name': 'Timeout',
+                                               'numpy': False,
+                                               'numpy_into_return': False,
+                                               'python_api_converter_name': 'convert_timedelta_to_seconds',
+                                               'python_name': 'timeout',
+                                               'python_name_or_default_for_init': '_converters.convert_timedelta_to_seconds(timeout, self._encoding)',
+                                               'python_name_with_default': 'timeout=datetime.timedelta(seconds=1.0)',
+                                               'python_name_with_doc_default': "timeout='datetime.timedelta(seconds=1.0)'",
+                                               'python_type': 'datetime.timedelta',
+                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                               'type': 'ViReal64',
+                                               'use_array': False,
+                                               'use_in_python_api': True,
+                                               'use_list': False},
+                                           {   'ctypes_type': 'ViInt32',
+                                               'ctypes_type_library_call': 'ViInt32',
+                                               'ctypes_variable_name': 'count_ctype',
+                                               'direction': 'in',
+                                               'documentation': {'description': 'Specifies the number of measurements to fetch.'},
+                                               'enum': None,
+                                               'is_buffer': False,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': False,
+                                               'is_string': False,
+                                               'library_method_call_snippet': 'count_ctype',
+                                               'name': 'Count',
+                                               'numpy': False,
+                                               'numpy_into_return': False,
+                                               'python_name': 'count',
+                                               'python_name_or_default_for_init': 'count',
+                                               'python_name_with_default': 'count',
+                                               'python_name_with_doc_default': 'count',
+                                               'python_type': 'int',
+                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                               'type': 'ViInt32',
+                                               'use_array': False,
+                                               'use_in_python_api': False,
+                                               'use_list': False},
+                                           {   'ctypes_type': 'ViReal64',
+                                               'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                               'ctypes_variable_name': 'voltage_measurements_ctype',
+                                               'direction': 'out',
+                                               'documentation': {   'description': '\n'
+                                                                                   'Returns an array of voltage measurements. Ensure that sufficient space\n'
+                                                                                   'has been allocated for the returned array.\n'},
+                                               'enum': None,
+                                               'is_buffer': True,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': False,
+                                               'is_string': False,
+                                               'library_method_call_snippet': 'voltage_measurements_ctype',
+                                               'name': 'voltageMeasurements',
+                                               'numpy': True,
+                                               'numpy_into_return': False,
+                                               'numpy_type': 'float64',
+                                               'original_type': 'ViReal64[]',
+                                               'python_name': 'voltage_measurements',
+                                               'python_name_or_default_for_init': 'voltage_measurements',
+                                               'python_name_with_default': 'voltage_measurements',
+                                               'python_name_with_doc_default': 'voltage_measurements',
+                                               'python_type': 'float',
+                                               'size': {'mechanism': 'passed-in', 'value': 'Count'},
+                                               'type': 'ViReal64',
+                                               'use_array': True,
+                                               'use_in_python_api': True,
+                                               'use_list': False},
+                                           {   'ctypes_type': 'ViReal64',
+                                               'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                               'ctypes_variable_name': 'current_measurements_ctype',
+                                               'direction': 'out',
+                                               'documentation': {   'description': '\n'
+                                                                                   'Returns an array of current measurements. Ensure that sufficient space\n'
+                                                                                   'has been allocated for the returned array.\n'},
+                                               'enum': None,
+                                               'is_buffer': True,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': False,
+                                               'is_string': False,
+                                               'library_method_call_snippet': 'current_measurements_ctype',
+                                               'name': 'currentMeasurements',
+                                               'numpy': True,
+                                               'numpy_into_return': False,
+                                               'numpy_type': 'float64',
+                                               'original_type': 'ViReal64[]',
+                                               'python_name': 'current_measurements',
+                                               'python_name_or_default_for_init': 'current_measurements',
+                                               'python_name_with_default': 'current_measurements',
+                                               'python_name_with_doc_default': 'current_measurements',
+                                               'python_type': 'float',
+                                               'size': {'mechanism': 'passed-in', 'value': 'Count'},
+                                               'type': 'ViReal64',
+                                               'use_array': True,
+                                               'use_in_python_api': True,
+                                               'use_list': False},
+                                           {   'ctypes_type': 'ViBoolean',
+                                               'ctypes_type_library_call': 'ctypes.POINTER(ViBoolean)',
+                                               'ctypes_variable_name': 'in_compliance_ctype',
+                                               'direction': 'out',
+                                               'documentation': {   'description': '\n'
+                                                                                   'Returns an array of Boolean values indicating whether the output was in\n'
+                                                                                   'compliance at the time the measurement was taken. Ensure that sufficient\n'
+                                                                                   'space has been allocated for the returned array.\n'},
+                                               'enum': None,
+                                               'is_buffer': True,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': False,
+                                               'is_string': False,
+                                               'library_method_call_snippet': 'in_compliance_ctype',
+                                               'name': 'inCompliance',
+                                               'numpy': True,
+                                               'numpy_into_return': False,
+                                               'numpy_type': 'bool_',
+                                               'original_type': 'ViBoolean[]',
+                                               'python_name': 'in_compliance',
+                                               'python_name_or_default_for_init': 'in_compliance',
+                                               'python_name_with_default': 'in_compliance',
+                                               'python_name_with_doc_default': 'in_compliance',
+                                               'python_type': 'bool',
+                                               'size': {'mechanism': 'passed-in', 'value': 'Count'},
+                                               'type': 'ViBoolean',
+                                               'use_array': False,
+                                               'use_in_python_api': True,
+                                               'use_list': True},
+                                           {   'ctypes_type': 'ViInt32',
+                                               'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                               'ctypes_variable_name': 'actual_count_ctype',
+                                               'direction': 'out',
+                                               'documentation': {'description': '\nIndicates the number of measured values actually retrieved from the\ndevice.\n'},
+                                               'enum': None,
+                                               'is_buffer': False,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': False,
+                                               'is_string': False,
+                                               'library_method_call_snippet': 'None if actual_count_ctype is None else (ctypes.pointer(actual_count_ctype))',
+                                               'name': 'actualCount',
+                                               'numpy': False,
+                                               'numpy_into_return': True,
+                                               'python_name': 'actual_count',
+                                               'python_name_or_default_for_init': 'actual_count',
+                                               'python_name_with_default': 'actual_count',
+                                               'python_name_with_doc_default': 'actual_count',
+                                               'python_type': 'int',
+                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                               'type': 'ViInt32',
+                                               'use_array': False,
+                                               'use_in_python_api': False,
+                                               'use_list': False}],
+                         'python_code_variables': [],
+                         'python_name': 'fetch_multiple',
+                         'render_in_library': True,
+                         'render_in_session_base': True,
+                         'returns': 'ViStatus'},
+    'FetchPipeline': {   'blocking': False,
+                         'codegen_method': 'public',
+                         'documentation': {   'description': '\n'
+                                                             '                Fetches measurements of an initiated session on a background thread into a bounded set of\n'
+                                                             '                preallocated buffers, until abort() is called or a fetch fails. The calling thread processes\n'
+                                                             '                earlier measurements while the next ones are fetched. Errors raised by the fetch are raised\n'
+                                                             '                again when iterating.'},
+                         'has_repeated_capability': True,
+                         'invalidates_attribute_cache': False,
+                         'is_error_handling': False,
+                         'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/fetch_pipeline'}],
+                         'name': 'FetchPipeline',
+                         'parameters': [   {   'ctypes_type': 'ViSession',
+                                               'ctypes_type_library_call': 'ViSession',
+                                               'ctypes_variable_name': 'vi_ctype',
+                                               'direction': 'in',
+                                               'documentation': {'description': 'Identifies a particular instrument session. **vi** is obtained from the niDCPower_InitializeWithChannels function.'},
+                                               'enum': None,
+                                               'is_buffer': False,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': True,
+                                               'is_string': False,
+                                               'library_method_call_snippet': 'vi_ctype',
+                                               'name': 'vi',
+                                               'numpy': False,
+                                               'numpy_into_return': False,
+                                               'python_name': 'vi',
+                                               'python_name_or_default_for_init': 'vi',
+                                               'python_name_with_default': 'vi',
+                                               'python_name_with_doc_default': 'vi',
+                                               'python_type': 'int',
+                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                               'type': 'ViSession',
+                                               'use_array': False,
+                                               'use_in_python_api': True,
+                                               'use_list': False},
+                                           {   'ctypes_type': 'ViChar[]',
+                                               'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                               'ctypes_variable_name': 'channel_name_ctype',
+                                               'direction': 'in',
+                                               'documentation': {'description': 'Specifies the output channel(s) to fetch measurements from.'},
+                                               'enum': None,
+                                               'is_buffer': False,
+                                               'is_repeated_capability': True,
+                                               'is_session_handle': False,
+                                               'is_string': True,
+                                               'library_method_call_snippet': 'channel_name_ctype',
+                                               'name': 'channelName',
+                                               'numpy': False,
+                                               'numpy_into_return': False,
+                                               'python_name': 'channel_name',
+                                               'python_name_or_default_for_init': 'channel_name',
+                                               'python_name_with_default': 'channel_name',
+                                               'python_name_with_doc_default': 'channel_name',
+                                               'python_type': 'str',
+                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                               'type': 'ViChar[]',
+                                               'use_array': False,
+                                               'use_in_python_api': True,
+                                               'use_list': False},
+                                           {   'ctypes_type': 'ViInt32',
+                                               'ctypes_type_library_call': 'ViInt32',
+                                               'ctypes_variable_name': 'count_ctype',
+                                               'direction': 'in',
+                                               'documentation': {   'description': 'The maximum number of measurements in each item. Fewer are returned when the fetch completes with fewer '
+                                                                                   'measurements available.'},
+                                               'enum': None,
+                                               'is_buffer': False,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': False,
+                                               'is_string': False,
+                                               'library_method_call_snippet': 'count_ctype',
+                                               'name': 'count',
+                                               'numpy': False,
+                                               'numpy_into_return': False,
+                                               'python_name': 'count',
+                                               'python_name_or_default_for_init': 'count',
+                                               'python_name_with_default': 'count',
+                                               'python_name_with_doc_default': 'count',
+                                               'python_type': 'int',
+                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                               'type': 'ViInt32',
+                                               'use_array': False,
+                                               'use_in_python_api': True,
+                                               'use_list': False},
+                                           {   'ctypes_type': 'ViInt32',
+                                               'ctypes_type_library_call': 'ViInt32',
+                                               'ctypes_variable_name': 'num_buffers_ctype',
+                                               'default_value': 4,
+                                               'direction': 'in',
+                                               'documentation': {'description': 'The number of preallocated buffers, which bounds the number of items fetched ahead of the consumer.'},
+                                               'enum': None,
+                                               'is_buffer': False,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': False,
+                                               'is_string': False,
+                                               'library_method_call_snippet': 'num_buffers_ctype',
+                                               'name': 'numBuffers',
+                                               'numpy': False,
+                                               'numpy_into_return': False,
+                                               'python_name': 'num_buffers',
+                                               'python_name_or_default_for_init': 'num_buffers',
+                                               'python_name_with_default': 'num_buffers=4',
+                                               'python_name_with_doc_default': 'num_buffers=4',
+                                               'python_type': 'int',
+                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                               'type': 'ViInt32',
+                                               'use_array': False,
+                                               'use_in_python_api': True,
+                                               'use_list': False},
+                                           {   'ctypes_type': 'ViBoolean',
+                                               'ctypes_type_library_call': 'ViBoolean',
+                                               'ctypes_variable_name': 'drop_when_full_ctype',
+                                               'default_value': False,
+                                               'direction': 'in',
+                                               'documentation': {   'description': 'What the background thread does when all buffers hold items that have not been consumed. If False, it waits for '
+                                                                                   'the consumer. If True, it reuses the buffer of the oldest waiting item so that the driver keeps being drained, and '
+                                                                                   'counts the item in **dropped_count**.'},
+                                               'enum': None,
+                                               'is_buffer': False,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': False,
+                                               'is_string': False,
+                                               'library_method_call_snippet': 'drop_when_full_ctype',
+                                               'name': 'dropWhenFull',
+                                               'numpy': False,
+                                               'numpy_into_return': False,
+                                               'python_name': 'drop_when_full',
+                                               'python_name_or_default_for_init': 'drop_when_full',
+                                               'python_name_with_default': 'drop_when_full=False',
+                                               'python_name_with_doc_default': 'drop_when_full=False',
+                                               'python_type': 'bool',
+                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                               'type': 'ViBoolean',
+                                               'use_array': False,
+                                               'use_in_python_api': True,
+                                               'use_list': False},
+                                           {   'ctypes_type': 'ViReal64',
+                                               'ctypes_type_library_call': 'ViReal64',
+                                               'ctypes_variable_name': 'timeout_ctype',
+                                               'default_value': 'datetime.timedelta(seconds=1.0)',
+                                               'direction': 'in',
+                                               'documentation': {'description': 'The maximum time allowed for each fetch to complete. A fetch that times out ends the pipeline with the error.'},
+                                               'enum': None,
+                                               'is_buffer': False,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': False,
+                                               'is_string': False,
+                                               'library_method_call_snippet': 'timeout_ctype',
+                                               'name': 'Timeout',
+                                               'numpy': False,
+                                               'numpy_into_return': False,
+                                               'python_name': 'timeout',
+                                               'python_name_or_default_for_init': 'timeout',
+                                               'python_name_with_default': 'timeout=datetime.timedelta(seconds=1.0)',
+                                               'python_name_with_doc_default': "timeout='datetime.timedelta(seconds=1.0)'",
+                                               'python_type': 'datetime.timedelta',
+                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                               'type': 'ViReal64',
+                                               'use_array': False,
+                                               'use_in_python_api': True,
+                                               'use_list': False},
+                                           {   'ctypes_type': 'ViSession',
+                                               'ctypes_type_library_call': 'ctypes.POINTER(ViSession)',
+                                               'ctypes_variable_name': 'pipeline_ctype',
+                                               'direction': 'out',
+                                               'documentation': {   'description': '\n'
+                                                                                   '                        Iterable of (voltage_measurements, current_measurements, in_compliance) tuples of numpy '
+                                                                                   'arrays of float64, float64 and bool.\n'
+                                                                                   '                        The arrays stay valid until the next item is requested. It also has **fetched_count**, '
+                                                                                   '**dropped_count**, **consumed_count**\n'
+                                                                                   '                        and **backlog** (items waiting) properties, and **abort()**, which stops the background '
+                                                                                   'thread and is called when leaving a with block.\n'
+                                                                                   '\n'
+                                                                                   '                        Example:\n'
+                                                                                   '\n'
+                                                                                   '                        .. code-block:: python\n'
+                                                                                   '\n'
+                                                                                   '                            with session.initiate():\n'
+                                                                                   "                                with session.channels['0'].fetch_pipeline(count=1000) as pipeline:\n"
+                                                                                   '                                    for voltage_measurements, current_measurements, in_compliance in pipeline:\n'
+                                                                                   '                                        process(voltage_measurements, current_measurements)'},
+                                               'enum': None,
+                                               'is_buffer': False,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': False,
+                                               'is_string': False,
+                                               'library_method_call_snippet': 'None if pipeline_ctype is None else (ctypes.pointer(pipeline_ctype))',
+                                               'name': 'pipeline',
+                                               'numpy': False,
+                                               'numpy_into_return': False,
+                                               'python_name': 'pipeline',
+                                               'python_name_or_default_for_init': 'pipeline',
+                                               'python_name_with_default': 'pipeline',
+                                               'python_name_with_doc_default': 'pipeline',
+                                               'python_type': 'nidcpower.pipeline.AcquisitionPipeline',
+                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                               'type': 'ViSession',
+                                               'use_array': False,
+                                               'use_in_python_api': True,
+                                               'use_list': False}],
+                         'python_code_variables': [],
+                         'python_name': 'fetch_pipeline',
+                         'render_in_library': False,
+                         'render_in_session_base': True,
+                         'returns': 'ViStatus'},
+    'GetAttributeViBoolean': {   'blocking': False,
+                                 'codegen_method': 'private',
+                                 'documentation': {   'description': '\n'
+                                                                     '| Queries the value of a ViBoolean attribute.\n'
+                                                                     '| You can use this function to get the values of device-specific\n'
+                                                                     '  attributes and inherent IVI attributes.\n'},
+                                 'has_repeated_capability': True,
+                                 'invalidates_attribute_cache': False,
+                                 'is_error_handling': False,
+                                 'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                 'name': 'GetAttributeViBoolean',
+                                 'parameters': [   {   'ctypes_type': 'ViSession',
+                                                       'ctypes_type_library_call': 'ViSession',
+                                                       'ctypes_variable_name': 'vi_ctype',
+                                                       'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                           'niDCPower_InitializeWithChannels function.\n'},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': True,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'vi_ctype',
+                                                       'name': 'vi',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'vi',
+                                                       'python_name_or_default_for_init': 'vi',
+                                                       'python_name_with_default': 'vi',
+                                                       'python_name_with_doc_default': 'vi',
+                                                       'python_type': 'int',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViSession',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False},
+                                                   {   'ctypes_type': 'ViChar[]',
+                                                       'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                       'ctypes_variable_name': 'channel_name_ctype',
+                                                       'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Specifies the output channel(s) to which this configuration value\n'
+                                                                                           'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                           'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                           '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                           'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                           'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                           'In the Running state, multiple output channel configurations are\n'
+                                                                                           'performed sequentially based on the order specified in this parameter.\n'},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': True,
+                                                       'is_session_handle': False,
+                                                       'is_string': True,
+                                                       'library_method_call_snippet': 'channel_name_ctype',
+                                                       'name': 'channelName',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'channel_name',
+                                                       'python_name_or_default_for_init': 'channel_name',
+                                                       'python_name_with_default': 'channel_name',
+                                                       'python_name_with_doc_default': 'channel_name',
+                                                       'python_type': 'str',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViChar[]',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False},
+                                                   {   'ctypes_type': 'ViAttr',
+                                                       'ctypes_type_library_call': 'ViAttr',
+                                                       'ctypes_variable_name': 'attribute_id_ctype',
+                                                       'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Specifies the ID of an attribute. From the function panel window, you\n'
+                                                                                           'can use this control as follows.\n'
+                                                                                           '\n'
+                                                                                           '-  In the function panel window, click on the control or press **Enter**\n'
+                                                                                           '   or the spacebar to display a dialog box containing hierarchical list\n'
+                                                                                           '   of the available attributes. Help text is shown for each attribute.\n'
+                                                                                           '   Select an attribute by double-clicking on it or by selecting it and\n'
+                                                                                           '   then pressing **Enter**.\n'
+                                                                                           '-  A ring control at the top of the dialog box allows you to see all IVI\n'
+                                                                                           '   attributes or only the attributes of type ViBoolean. If you choose to\n'
+                                                                                           '   see all IVI attributes, the data types appear to the right of the\n'
+                                                                                           '   attribute names in the list box. Attributes with data types other\n'
+                                                                                           '   than ViBoolean are dim. If you select an attribute data type that is\n'
+                                                                                           '   dim, LabWindows/CVI transfers you to the function panel for the\n'
+                                                                                           '   corresponding function that is consistent with the data type.\n'
+                                                                                           '-  If you want to enter a variable name, press **Ctrl**\\ +\\ **T** to\n'
+                                                                                           '   change this ring control to a manual input box. If the attribute in\n'
+                                                                                           '   this ring control has named constants as valid values, you can view\n'
+                                                                                           '   the constants by moving to the value control and pressing **Enter**.\n'},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': False,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'attribute_id_ctype',
+                                                       'name': 'attributeId',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'attribute_id',
+                                                       'python_name_or_default_for_init': 'attribute_id',
+                                                       'python_name_with_default': 'attribute_id',
+                                                       'python_name_with_doc_default': 'attribute_id',
+                                                       'python_type': 'int',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViAttr',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False},
+                                                   {   'ctypes_type': 'ViBoolean',
+                                                       'ctypes_type_library_call': 'ctypes.POINTER(ViBoolean)',
+                                                       'ctypes_variable_name': 'attribute_value_ctype',
+                                                       'direction': 'out',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Returns the current value of the attribute. Passes the address of a\n'
+                                                                                           'ViBoolean variable.\n'
+                                                                                           'If the attribute currently showing in the attribute ring control has\n'
+                                                                                           'constants as valid values, you can view a list of the constants by\n'
+                                                                                           'pressing **Enter** on this control. Select a value by double-clicking on\n'
+                                                                                           'it or by selecting it and then pressing **Enter**.\n'},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': False,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'None if attribute_value_ctype is None else (ctypes.pointer(attribute_value_ctype))',
+                                                       'name': 'attributeValue',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'attribute_value',
+                                                       'python_name_or_default_for_init': 'attribute_value',
+                                                       'python_name_with_default': 'attribute_value',
+                                                       'python_name_with_doc_default': 'attribute_value',
+                                                       'python_type': 'bool',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViBoolean',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False}],
+                                 'python_code_variables': [],
+                                 'python_name': '_get_attribute_vi_boolean',
+                                 'render_in_library': True,
+                                 'render_in_session_base': True,
+                                 'returns': 'ViStatus'},
+    'GetAttributeViInt32': {   'blocking': False,
+                               'codegen_method': 'private',
+                               'documentation': {   'description': '\n'
+                                                                   '| Queries the value of a ViInt32 attribute.\n'
+                                                                   '| You can use this function to get the values of device-specific\n'
+                                                                   '  attributes and inherent IVI attributes.\n'},
+                               'has_repeated_capability': True,
+                               'invalidates_attribute_cache': False,
+                               'is_error_handling': False,
+                               'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                               'name': 'GetAttributeViInt32',
+                               'parameters': [   {   'ctypes_type': 'ViSession',
+                                                     'ctypes_type_library_call': 'ViSession',
+                                                     'ctypes_variable_name': 'vi_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                         'niDCPower_InitializeWithChannels function.\n'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': True,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'vi_ctype',
+                                                     'name': 'vi',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'vi',
+                                                     'python_name_or_default_for_init': 'vi',
+                                                     'python_name_with_default': 'vi',
+                                                     'python_name_with_doc_default': 'vi',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViSession',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViChar[]',
+                                                     'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                     'ctypes_variable_name': 'channel_name_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'Specifies the output channel(s) to which this configuration value\n'
+                                                                                         'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                         'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                         '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                         'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                         'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                         'In the Running state, multiple output channel configurations are\n'
+                                                                                         'performed sequentially based on the order specified in this parameter.\n'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': True,
+                                                     'is_session_handle': False,
+                                                     'is_string': True,
+                                                     'library_method_call_snippet': 'channel_name_ctype',
+                                                     'name': 'channelName',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'channel_name',
+                                                     'python_name_or_default_for_init': 'channel_name',
+                                                     'python_name_with_default': 'channel_name',
+                                                     'python_name_with_doc_default': 'channel_name',
+                                                     'python_type': 'str',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViChar[]',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViAttr',
+                                                     'ctypes_type_library_call': 'ViAttr',
+                                                     'ctypes_variable_name': 'attribute_id_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'Specifies the ID of an attribute. From the function panel window, you\n'
+                                                                                         'can use this control as follows.\n'
+                                                                                         '\n'
+                                                                                         '-  In the function panel window, click on the control or press **Enter**\n'
+                                                                                         '   or the spacebar to display a dialog box containing hierarchical list\n'
+                                                                                         '   of the available attributes. Help text is shown for each attribute.\n'
+                                                                                         '   Select an attribute by double-clicking on it or by selecting it and\n'
+                                                                                         '   then pressing **Enter**.\n'
+                                                                                         '-  A ring control at the top of the dialog box allows you to see all IVI\n'
+                                                                                         '   attributes or only the attributes of type ViInt32. If you choose to\n'
+                                                                                         '   see all IVI attributes, the data types appear to the right of the\n'
+                                                                                         '   attribute names in the list box. Attributes with data types other\n'
+                                                                                         '   than ViInt32 are dim. If you select an attribute data type that is\n'
+                                                                                         '   dim, LabWindows/CVI transfers you to the function panel for the\n'
+                                                                                         '   corresponding function that is consistent with the data type.\n'
+                                                                                         '-  If you want to enter a variable name, press **Ctrl**\\ +\\ **T** to\n'
+                                                                                         '   change this ring control to a manual input box. If the attribute in\n'
+                                                                                         '   this ring control has named constants as valid values, you can view\n'
+                                                                                         '   the constants by moving to the value control and pressing **Enter**.\n'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'attribute_id_ctype',
+                                                     'name': 'attributeId',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'attribute_id',
+                                                     'python_name_or_default_for_init': 'attribute_id',
+                                                     'python_name_with_default': 'attribute_id',
+                                                     'python_name_with_doc_default': 'attribute_id',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViAttr',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViInt32',
+                                                     'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                                     'ctypes_variable_name': 'attribute_value_ctype',
+                                                     'direction': 'out',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'Returns the current value of the attribute. Passes the address of a\n'
+                                                                                         'ViInt32 variable.\n'
+                                                                                         'If the attribute currently showing in the attribute ring control has\n'
+                                                                                         'constants as valid values, you can view a list of the constants by\n'
+                                                                                         'pressing **Enter** on this control. Select a value by double-clicking on\n'
+                                                                                         'it or by selecting it and then pressing **Enter**.\n'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'None if attribute_value_ctype is None else (ctypes.pointer(attribute_value_ctype))',
+                                                     'name': 'attributeValue',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'attribute_value',
+                                                     'python_name_or_default_for_init': 'attribute_value',
+                                                     'python_name_with_default': 'attribute_value',
+                                                     'python_name_with_doc_default': 'attribute_value',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViInt32',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False}],
+                               'python_code_variables': [],
+                               'python_name': '_get_attribute_vi_int32',
+                               'render_in_library': True,
+                               'render_in_session_base': True,
+                               'returns': 'ViStatus'},
+    'GetAttributeViInt64': {   'blocking': False,
+                               'codegen_method': 'private',
+                               'documentation': {   'description': '\n'
+                                                                   '| Queries the value of a ViInt64 attribute.\n'
+                                                                   '| You can use this function to get the values of device-specific\n'
+                                                                   '  attributes and inherent IVI attributes.\n'},
+                               'has_repeated_capability': True,
+                               'invalidates_attribute_cache': False,
+                               'is_error_handling': False,
+                               'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                               'name': 'GetAttributeViInt64',
+                               'parameters': [   {   'ctypes_type': 'ViSession',
+                                                     'ctypes_type_library_call': 'ViSession',
+                                                     'ctypes_variable_name': 'vi_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                         'niDCPower_InitializeWithChannels function.\n'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': True,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'vi_ctype',
+                                                     'name': 'vi',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'vi',
+                                                     'python_name_or_default_for_init': 'vi',
+                                                     'python_name_with_default': 'vi',
+                                                     'python_name_with_doc_default': 'vi',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViSession',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViChar[]',
+                                                     'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                     'ctypes_variable_name': 'channel_name_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'Specifies the output channel(s) to which this configuration value\n'
+                                                                                         'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                         'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                         '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                         'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                         'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                         'In the Running state, multiple output channel configurations are\n'
+                                                                                         'performed sequentially based on the order specified in this parameter.\n'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': True,
+                                                     'is_session_handle': False,
+                                                     'is_string': True,
+                                                     'library_method_call_snippet': 'channel_name_ctype',
+                                                     'name': 'channelName',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'channel_name',
+                                                     'python_name_or_default_for_init': 'channel_name',
+                                                     'python_name_with_default': 'channel_name',
+                                                     'python_name_with_doc_default': 'channel_name',
+                                                     'python_type': 'str',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViChar[]',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViAttr',
+                                                     'ctypes_type_library_call': 'ViAttr',
+                                                     'ctypes_variable_name': 'attribute_id_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'Specifies the ID of an attribute. From the function panel window, you\n'
+                                                                                         'can use this control as follows.\n'
+                                                                                         '\n'
+                                                                                         '-  In the function panel window, click on the control or press **Enter**\n'
+                                                                                         '   or the spacebar to display a dialog box containing hierarchical list\n'
+                                                                                         '   of the available attributes. Help text is shown for each attribute.\n'
+                                                                                         '   Select an attribute by double-clicking on it or by selecting it and\n'
+                                                                                         '   then pressing **Enter**.\n'
+                                                                                         '-  A ring control at the top of the dialog box allows you to see all IVI\n'
+                                                                                         '   attributes or only the attributes of type ViReal64. If you choose to\n'
+                                                                                         '   see all IVI attributes, the data types appear to the right of the\n'
+                                                                                         '   attribute names in the list box. Attributes with data types other\n'
+                                                                                         '   than ViReal64 are dim. If you select an attribute data type that is\n'
+                                                                                         '   dim, LabWindows/CVI transfers you to the function panel for the\n'
+                                                                                         '   corresponding function that is consistent with the data type.\n'
+                                                                                         '-  If you want to enter a variable name, press **Ctrl**\\ +\\ **T** to\n'
+                                                                                         '   change this ring control to a manual input box. If the attribute in\n'
+                                                                                         '   this ring control has named constants as valid values, you can view\n'
+                                                                                         '   the constants by moving to the value control and pressing **Enter**.\n'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'attribute_id_ctype',
+                                                     'name': 'attributeId',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'attribute_id',
+                                                     'python_name_or_default_for_init': 'attribute_id',
+                                                     'python_name_with_default': 'attribute_id',
+                                                     'python_name_with_doc_default': 'attribute_id',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViAttr',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViInt64',
+                                                     'ctypes_type_library_call': 'ctypes.POINTER(ViInt64)',
+                                                     'ctypes_variable_name': 'attribute_value_ctype',
+                                                     'direction': 'out',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'Returns the current value of the attribute. Passes the address of a\n'
+                                                                                         'ViReal64 variable.\n'
+                                                                                         'If the attribute currently showing in the attribute ring control has\n'
+                                                                                         'constants as valid values, you can view a list of the constants by\n'
+                                                                                         'pressing **Enter** on this control. Select a value by double-clicking on\n'
+                                                                                         'it or by selecting it and then pressing **Enter**.\n'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'None if attribute_value_ctype is None else (ctypes.pointer(attribute_value_ctype))',
+                                                     'name': 'attributeValue',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'attribute_value',
+                                                     'python_name_or_default_for_init': 'attribute_value',
+                                                     'python_name_with_default': 'attribute_value',
+                                                     'python_name_with_doc_default': 'attribute_value',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViInt64',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False}],
+                               'python_code_variables': [],
+                               'python_name': '_get_attribute_vi_int64',
+                               'render_in_library': True,
+                               'render_in_session_base': True,
+                               'returns': 'ViStatus'},
+    'GetAttributeViReal64': {   'blocking': False,
+                                'codegen_method': 'private',
+                                'documentation': {   'description': '\n'
+                                                                    '| Queries the value of a ViReal64 attribute.\n'
+                                                                    '| You can use this function to get the values of device-specific\n'
+                                                                    '  attributes and inherent IVI attributes.\n'},
+                                'has_repeated_capability': True,
+                                'invalidates_attribute_cache': False,
+                                'is_error_handling': False,
+                                'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                'name': 'GetAttributeViReal64',
+                                'parameters': [   {   'ctypes_type': 'ViSession',
+                                                      'ctypes_type_library_call': 'ViSession',
+                                                      'ctypes_variable_name': 'vi_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                          'niDCPower_InitializeWithChannels function.\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': True,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'vi_ctype',
+                                                      'name': 'vi',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'vi',
+                                                      'python_name_or_default_for_init': 'vi',
+                                                      'python_name_with_default': 'vi',
+                                                      'python_name_with_doc_default': 'vi',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViSession',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViChar[]',
+                                                      'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                      'ctypes_variable_name': 'channel_name_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Specifies the output channel(s) to which this configuration value\n'
+                                                                                          'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                          'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                          '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                          'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                          'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                          'In the Running state, multiple output channel configurations are\n'
+                                                                                          'performed sequentially based on the order specified in this parameter.\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': True,
+                                                      'is_session_handle': False,
+                                                      'is_string': True,
+                                                      'library_method_call_snippet': 'channel_name_ctype',
+                                                      'name': 'channelName',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'channel_name',
+                                                      'python_name_or_default_for_init': 'channel_name',
+                                                      'python_name_with_default': 'channel_name',
+                                                      'python_name_with_doc_default': 'channel_name',
+                                                      'python_type': 'str',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViChar[]',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViAttr',
+                                                      'ctypes_type_library_call': 'ViAttr',
+                                                      'ctypes_variable_name': 'attribute_id_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Specifies the ID of an attribute. From the function panel window, you\n'
+                                                                                          'can use this control as follows.\n'
+                                                                                          '\n'
+                                                                                          '-  In the function panel window, click on the control or press **Enter**\n'
+                                                                                          '   or the spacebar to display a dialog box containing hierarchical list\n'
+                                                                                          '   of the available attributes. Help text is shown for each attribute.\n'
+                                                                                          '   Select an attribute by double-clicking on it or by selecting it and\n'
+                                                                                          '   then pressing **Enter**.\n'
+                                                                                          '-  A ring control at the top of the dialog box allows you to see all IVI\n'
+                                                                                          '   attributes or only the attributes of type ViReal64. If you choose to\n'
+                                                                                          '   see all IVI attributes, the data types appear to the right of the\n'
+                                                                                          '   attribute names in the list box. Attributes with data types other\n'
+                                                                                          '   than ViReal64 are dim. If you select an attribute data type that is\n'
+                                                                                          '   dim, LabWindows/CVI transfers you to the function panel for the\n'
+                                                                                          '   corresponding function that is consistent with the data type.\n'
+                                                                                          '-  If you want to enter a variable name, press **Ctrl**\\ +\\ **T** to\n'
+                                                                                          '   change this ring control to a manual input box. If the attribute in\n'
+                                                                                          '   this ring control has named constants as valid values, you can view\n'
+                                                                                          '   the constants by moving to the value control and pressing **Enter**.\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'attribute_id_ctype',
+                                                      'name': 'attributeId',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'attribute_id',
+                                                      'python_name_or_default_for_init': 'attribute_id',
+                                                      'python_name_with_default': 'attribute_id',
+                                                      'python_name_with_doc_default': 'attribute_id',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViAttr',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViReal64',
+                                                      'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                                      'ctypes_variable_name': 'attribute_value_ctype',
+                                                      'direction': 'out',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Returns the current value of the attribute. Passes the address of a\n'
+                                                                                          'ViReal64 variable.\n'
+                                                                                          'If the attribute currently showing in the attribute ring control has\n'
+                                                                                          'constants as valid values, you can view a list of the constants by\n'
+                                                                                          'pressing **Enter** on this control. Select a value by double-clicking on\n'
+                                                                                          'it or by selecting it and then pressing **Enter**.\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'None if attribute_value_ctype is None else (ctypes.pointer(attribute_value_ctype))',
+                                                      'name': 'attributeValue',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'attribute_value',
+                                                      'python_name_or_default_for_init': 'attribute_value',
+                                                      'python_name_with_default': 'attribute_value',
+                                                      'python_name_with_doc_default': 'attribute_value',
+                                                      'python_type': 'float',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViReal64',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False}],
+                                'python_code_variables': [],
+                                'python_name': '_get_attribute_vi_real64',
+                                'render_in_library': True,
+                                'render_in_session_base': True,
+                                'returns': 'ViStatus'},
+    'GetAttributeViSession': {   'codegen_method': 'no',
+                                 'documentation': {   'description': '\n'
+                                                                     '| Queries the value of a ViSession attribute.\n'
+                                                                     '| You can use this function to get the values of device-specific\n'
+                                                                     '  attributes and inherent IVI attributes.\n'},
+                                 'parameters': [   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                           'niDCPower_InitializeWithChannels function.\n'},
+                                                       'name': 'vi',
+                                                       'type': 'ViSession'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Specifies the output channel(s) to which this configuration value\n'
+                                                                                           'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                           'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                           '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                           'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                           'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                           'In the Running state, multiple output channel configurations are\n'
+                                                                                           'performed sequentially based on the order specified in this parameter.\n'},
+                                                       'name': 'channelName',
+                                                       'type': 'ViChar[]'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Specifies the ID of an attribute. From the function panel window, you\n'
+                                                                                           'can use this control as follows.\n'
+                                                                                           '\n'
+                                                                                           '-  In the function panel window, click on the control or press **Enter**\n'
+                                                                                           '   or the spacebar to display a dialog box containing hierarchical list\n'
+                                                                                           '   of the available attributes. Help text is shown for each attribute.\n'
+                                                                                           '   Select an attribute by double-clicking on it or by selecting it and\n'
+                                                                                           '   then pressing **Enter**.\n'
+                                                                                           '-  A ring control at the top of the dialog box allows you to see all IVI\n'
+                                                                                           '   attributes or only the attributes of type ViSession. If you choose to\n'
+                                                                                           '   see all IVI attributes, the data types appear to the right of the\n'
+                                                                                           '   attribute names in the list box. Attributes with data types other\n'
+                                                                                           '   than ViSession are dim. If you select an attribute data type that is\n'
+                                                                                           '   dim, LabWindows/CVI transfers you to the function panel for the\n'
+                                                                                           '   corresponding function that is consistent with the data type.\n'
+                                                                                           '-  If you want to enter a variable name, press **Ctrl**\\ +\\ **T** to\n'
+                                                                                           '   change this ring control to a manual input box. If the attribute in\n'
+                                                                                           '   this ring control has named constants as valid values, you can view\n'
+                                                                                           '   the constants by moving to the value control and pressing **Enter**.\n'},
+                                                       'name': 'attributeId',
+                                                       'type': 'ViAttr'},
+                                                   {   'direction': 'out',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Returns the current value of the attribute. Passes the address of a\n'
+                                                                                           'ViSession variable.\n'
+                                                                                           'If the attribute currently showing in the attribute ring control has\n'
+                                                                                           'constants as valid values, you can view a list of the constants by\n'
+                                                                                           'pressing **Enter** on this control. Select a value by double-clicking on\n'
+                                                                                           'it or by selecting it and then pressing **Enter**.\n'},
+                                                       'name': 'attributeValue',
+                                                       'type': 'ViSession'}],
+                                 'returns': 'ViStatus'},
+    'GetAttributeViString': {   'blocking': False,
+                                'codegen_method': 'private',
+                                'documentation': {   'description': '\n'
+                                                                    '| Queries the value of a ViString attribute.\n'
+                                                                    '| You can use this function to get the values of device-specific\n'
+                                                                    '  attributes and inherent IVI attributes.\n'},
+                                'has_repeated_capability': True,
+                                'invalidates_attribute_cache': False,
+                                'is_error_handling': False,
+                                'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                'name': 'GetAttributeViString',
+                                'parameters': [   {   'ctypes_type': 'ViSession',
+                                                      'ctypes_type_library_call': 'ViSession',
+                                                      'ctypes_variable_name': 'vi_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                          'niDCPower_InitializeWithChannels function.\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': True,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'vi_ctype',
+                                                      'name': 'vi',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'vi',
+                                                      'python_name_or_default_for_init': 'vi',
+                                                      'python_name_with_default': 'vi',
+                                                      'python_name_with_doc_default': 'vi',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViSession',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViChar[]',
+                                                      'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                      'ctypes_variable_name': 'channel_name_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Specifies the output channel(s) to which this configuration value\n'
+                                                                                          'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                          'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                          '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                          'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                          'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                          'In the Running state, multiple output channel configurations are\n'
+                                                                                          'performed sequentially based on the order specified in this parameter.\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': True,
+                                                      'is_session_handle': False,
+                                                      'is_string': True,
+                                                      'library_method_call_snippet': 'channel_name_ctype',
+                                                      'name': 'channelName',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'channel_name',
+                                                      'python_name_or_default_for_init': 'channel_name',
+                                                      'python_name_with_default': 'channel_name',
+                                                      'python_name_with_doc_default': 'channel_name',
+                                                      'python_type': 'str',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViChar[]',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViAttr',
+                                                      'ctypes_type_library_call': 'ViAttr',
+                                                      'ctypes_variable_name': 'attribute_id_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Specifies the ID of an attribute. From the function panel window, you\n'
+                                                                                          'can use this control as follows.\n'
+                                                                                          '\n'
+                                                                                          '-  In the function panel window, click on the control or press or the\n'
+                                                                                          '   spacebar to display a dialog box containing hierarchical list of the\n'
+                                                                                          '   available attributes. Help text is shown for each attribute. Select\n'
+                                                                                          '   an attribute by double-clicking on it or by selecting it and then\n'
+                                                                                          '   pressing .\n'
+                                                                                          '-  A ring control at the top of the dialog box allows you to see all IVI\n'
+                                                                                          '   attributes or only the attributes of type ViString. If you choose to\n'
+                                                                                          '   see all IVI attributes, the data types appear to the right of the\n'
+                                                                                          '   attribute names in the list box. Attributes with data types other\n'
+                                                                                          '   than ViString are dimmed. If you select an attribute data type that\n'
+                                                                                          '   is dimmed, LabWindows/CVI transfers you to the function panel for the\n'
+                                                                                          '   corresponding function that is consistent with the data type.\n'
+                                                                                          '-  If you want to enter a variable name, press to change this ring\n'
+                                                                                          '   control to a manual input control. If the attribute in this ring\n'
+                                                                                          '   control has named constants as valid values, you can view the\n'
+                                                                                          '   constants by moving to the value control and pressing .\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'attribute_id_ctype',
+                                                      'name': 'attributeId',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'attribute_id',
+                                                      'python_name_or_default_for_init': 'attribute_id',
+                                                      'python_name_with_default': 'attribute_id',
+                                                      'python_name_with_doc_default': 'attribute_id',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViAttr',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViInt32',
+                                                      'ctypes_type_library_call': 'ViInt32',
+                                                      'ctypes_variable_name': 'buffer_size_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Passes the number of bytes in the buffer and specifies the number of\n'
+                                                                                          'bytes in the ViChar array you specify for **value**. If the current\n'
+                                                                                          'value of **value**, including the terminating NUL byte, is larger than\n'
+                                                                                          'the size you indicate in this parameter, the function copies (buffer\n'
+                                                                                          'size - 1) bytes into the buffer, places an ASCII NUL byte at the end of\n'
+                                                                                          'the buffer, and returns the buffer size you must pass to get the entire\n'
+                                                                                          'value. For example, if the value is 123456 and the buffer size is 4, the\n'
+                                                                                          'function places 123 into the buffer and returns 7.\n'
+                                                                                          'To obtain the required buffer size, you can pass 0 for this attribute\n'
+                                                                                          'and VI_NULL for **value**. If you want the function to fill in the\n'
+                                                                                          'buffer regardless of the number of bytes in the value, pass a negative\n'
+                                                                                          'number for this attribute.\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'buffer_size_ctype',
+                                                      'name': 'bufferSize',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'buffer_size',
+                                                      'python_name_or_default_for_init': 'buffer_size',
+                                                      'python_name_with_default': 'buffer_size',
+                                                      'python_name_with_doc_default': 'buffer_size',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViInt32',
+                                                      'use_array': False,
+                                                      'use_in_python_api': False,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViChar[]',
+                                                      'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                      'ctypes_variable_name': 'attribute_value_ctype',
+                                                      'direction': 'out',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'The buffer in which the function returns the current value of the\n'
+                                                                                          'attribute. The buffer must be of type ViChar and have at least as many\n'
+                                                                                          'bytes as indicated in **bufSize**.\n'
+                                                                                          'If the current value of the attribute, including the terminating NUL\n'
+                                                                                          'byte, contains more bytes that you indicate in this attribute, the\n'
+                                                                                          'function copies (buffer size -1) bytes into the buffer, places an ASCII\n'
+                                                                                          'NUL byte at the end of the buffer, and returns the buffer size you must\n'
+                                                                                          'pass to get the entire value. For example, if the value is 123456 and\n'
+                                                                                          'the buffer size is 4, the function places 123 into the buffer and\n'
+                                                                                          'returns 7.\n'
+                                                                                          'If you specify 0 for **bufSize**, you can pass VI_NULL for this\n'
+                                                                                          'attribute.\n'
+                                                                                          'If the attribute currently showing in the attribute ring control has\n'
+                                                                                          'constants as valid values, you can view a list of the constants by\n'
+                                                                                          'pressing on this control. Select a value by double-clicking on it or by\n'
+                                                                                          'selecting it and then pressing .\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': True,
+                                                      'library_method_call_snippet': 'attribute_value_ctype',
+                                                      'name': 'attributeValue',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'attribute_value',
+                                                      'python_name_or_default_for_init': 'attribute_value',
+                                                      'python_name_with_default': 'attribute_value',
+                                                      'python_name_with_doc_default': 'attribute_value',
+                                                      'python_type': 'str',
+                                                      'size': {'mechanism': 'ivi-dance', 'value': 'bufferSize'},
+                                                      'type': 'ViChar[]',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False}],
+                                'python_code_variables': [],
+                                'python_name': '_get_attribute_vi_string',
+                                'render_in_library': True,
+                                'render_in_session_base': True,
+                                'returns': 'ViStatus'},
+    'GetCalUserDefinedInfo': {   'codegen_method': 'no',
+                                 'documentation': {'description': 'Returns the user-defined information in the device onboard EEPROM.'},
+                                 'parameters': [   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                           'niDCPower_InitExtCal or niDCPower_InitializeWithChannels function.\n',
+                                                                            'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                       'name': 'vi',
+                                                       'type': 'ViSession'},
+                                                   {   'direction': 'out',
+                                                       'documentation': {'description': '\nReturns the user-defined information stored in the device onboard\nEEPROM.\n'},
+                                                       'name': 'Info',
+                                                       'size': {'mechanism': 'fixed', 'value': 256},
+                                                       'type': 'ViChar[]'}],
+                                 'returns': 'ViStatus'},
+    'GetCalUserDefinedInfoMaxSize': {   'codegen_method': 'no',
+                                        'documentation': {   'description': '\n'
+                                                                            'Returns the maximum number of characters that can be used to store\n'
+                                                                            'user-defined information in the device onboard EEPROM.\n'},
+                                        'parameters': [   {   'direction': 'in',
+                                                              'documentation': {   'description': '\n'
+                                                                                                  'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                                  'niDCPower_InitExtCal or niDCPower_InitializeWithChannels function.\n',
+                                                                                   'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                              'name': 'vi',
+                                                              'type': 'ViSession'},
+                                                          {   'direction': 'out',
+                                                              'documentation': {'description': '\nReturns the number of characters that can be stored in the device\nonboard EEPROM.\n'},
+                                                              'name': 'infoSize',
+                                                              'type': 'ViInt32'}],
+                                        'returns': 'ViStatus'},
+    'GetChannelName': {   'blocking': False,
+                          'codegen_method': 'public',
+                          'documentation': {   'description': '\n'
+                                                              'Retrieves the output **channelName** that corresponds to the requested\n'
+                                                              '**index**. Use the NIDCPOWER_ATTR_CHANNEL_COUNT attribute to\n'
+                                                              'determine the upper bound of valid values for **index**.\n'},
+                          'has_repeated_capability': True,
+                          'invalidates_attribute_cache': False,
+                          'is_error_handling': False,
+                          'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                          'name': 'GetChannelName',
+                          'parameters': [   {   'ctypes_type': 'ViSession',
+                                                'ctypes_type_library_call': 'ViSession',
+                                                'ctypes_variable_name': 'vi_ctype',
+                                                'direction': 'in',
+                                                'documentation': {   'description': '\n'
+                                                                                    'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                    'niDCPower_InitializeWithChannels function.\n'},
+                                                'enum': None,
+                                                'is_buffer': False,
+                                                'is_repeated_capability': False,
+                                                'is_session_handle': True,
+                                                'is_string': False,
+                                                'library_method_call_snippet': 'vi_ctype',
+                                                'name': 'vi',
+                                                'numpy': False,
+                                                'numpy_into_return': False,
+                                                'python_name': 'vi',
+                                                'python_name_or_default_for_init': 'vi',
+                                                'python_name_with_default': 'vi',
+                                                'python_name_with_doc_default': 'vi',
+                                                'python_type': 'int',
+                                                'size': {'mechanism': 'fixed', 'value': 1},
+                                                'type': 'ViSession',
+                                                'use_array': False,
+                                                'use_in_python_api': True,
+                                                'use_list': False},
+                                            {   'ctypes_type': 'ViInt32',
+                                                'ctypes_type_library_call': 'ViInt32',
+                                                'ctypes_variable_name': 'index_ctype',
+                                                'direction': 'in',
+                                                'documentation': {'description': '\nSpecifies which output channel name to return. The index values begin at\n1.\n'},
+                                                'enum': None,
+                                                'is_buffer': False,
+                                                'is_repeated_capability': False,
+                                                'is_session_handle': False,
+                                                'is_string': False,
+                                                'library_method_call_snippet': 'index_ctype',
+                                                'name': 'Index',
+                                                'numpy': False,
+                                                'numpy_into_return': False,
+                                                'python_name': 'index',
+                                                'python_name_or_default_for_init': 'index',
+                                                'python_name_with_default': 'index',
+                                                'python_name_with_doc_default': 'index',
+                                                'python_type': 'int',
+                                                'size': {'mechanism': 'fixed', 'value': 1},
+                                                'type': 'ViInt32',
+                                                'use_array': False,
+                                                'use_in_python_api': True,
+                                                'use_list': False},
+                                            {   'ctypes_type': 'ViInt32',
+                                                'ctypes_type_library_call': 'ViInt32',
+                                                'ctypes_variable_name': 'buffer_size_ctype',
+                                                'direction': 'in',
+                                                'documentation': {   'description': '\n'
+                                                                                    'Specifies the number of bytes in the ViChar array you specify for\n'
+                                                                                    '**channelName**. If the **channelName**, including the terminating NUL\n'
+                                                                                    'byte, contains more bytes than you indicate in this attribute, the\n'
+                                                                                    'function copies (buffer size - 1) bytes into the buffer, places an ASCII\n'
+                                                                                    'NUL byte at the end of the buffer, and returns the buffer size you must\n'
+                                                                                    'pass to get the entire value. For example, if the value is 123456 and\n'
+                                                                                    'the buffer size is 4, the function places 123 into the buffer and\n'
+                                                                                    'returns 7.\n'
+                                                                                    'If you pass 0, you can pass VI_NULL for **channelName**.\n'},
+                                                'enum': None,
+                                                'is_buffer': False,
+                                                'is_repeated_capability': False,
+                                                'is_session_handle': False,
+                                                'is_string': False,
+                                                'library_method_call_snippet': 'buffer_size_ctype',
+                                                'name': 'bufferSize',
+                                                'numpy': False,
+                                                'numpy_into_return': False,
+                                                'python_name': 'buffer_size',
+                                                'python_name_or_default_for_init': 'buffer_size',
+                                                'python_name_with_default': 'buffer_size',
+                                                'python_name_with_doc_default': 'buffer_size',
+                                                'python_type': 'int',
+                                                'size': {'mechanism': 'fixed', 'value': 1},
+                                                'type': 'ViInt32',
+                                                'use_array': False,
+                                                'use_in_python_api': False,
+                                                'use_list': False},
+                                            {   'ctypes_type': 'ViChar[]',
+                                                'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                'ctypes_variable_name': 'channel_name_ctype',
+                                                'direction': 'out',
+                                                'documentation': {'description': 'Returns the output channel name that corresponds to **index**.'},
+                                                'enum': None,
+                                                'is_buffer': False,
+                                                'is_repeated_capability': True,
+                                                'is_session_handle': False,
+                                                'is_string': True,
+                                                'library_method_call_snippet': 'channel_name_ctype',
+                                                'name': 'channelName',
+                                                'numpy': False,
+                                                'numpy_into_return': False,
+                                                'python_name': 'channel_name',
+                                                'python_name_or_default_for_init': 'channel_name',
+                                                'python_name_with_default': 'channel_name',
+                                                'python_name_with_doc_default': 'channel_name',
+                                                'python_type': 'str',
+                                                'size': {'mechanism': 'ivi-dance', 'value': 'bufferSize'},
+                                                'type': 'ViChar[]',
+                                                'use_array': False,
+                                                'use_in_python_api': True,
+                                                'use_list': False}],
+                          'python_code_variables': [],
+                          'python_name': 'get_channel_name',
+                          'render_in_library': True,
+                          'render_in_session_base': True,
+                          'returns': 'ViStatus'},
+    'GetError': {   'blocking': False,
+                    'codegen_method': 'private',
+                    'documentation': {   'description': '\n'
+                                                        '| Retrieves and then clears the IVI error information for the session or\n'
+                                                        '  the current execution thread unless **bufferSize** is 0, in which case\n'
+                                                        '  the function does not clear the error information. By passing 0 for\n'
+                                                        '  the buffer size, you can ascertain the buffer size required to get the\n'
+                                                        '  entire error description string and then call the function again with\n'
+                                                        '  a sufficiently large buffer size.\n'
+                                                        '| If the user specifies a valid IVI session for **vi**, this function\n'
+                                                        '  retrieves and then clears the error information for the session. If\n'
+                                                        '  the user passes VI_NULL for **vi**, this function retrieves and then\n'
+                                                        '  clears the error information for the current execution thread. If\n'
+                                                        '  **vi** is an invalid session, the function does nothing and returns an\n'
+                                                        '  error. Normally, the error information describes the first error that\n'
+                                                        '  occurred since the user last called niDCPower_GetError or\n'
+                                                        '  niDCPower_ClearError.\n',
+                                         'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                    'has_repeated_capability': False,
+                    'invalidates_attribute_cache': False,
+                    'is_error_handling': True,
+                    'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                    'name': 'GetError',
+                    'parameters': [   {   'ctypes_type': 'ViSession',
+                                          'ctypes_type_library_call': 'ViSession',
+                                          'ctypes_variable_name': 'vi_ctype',
+                                          'direction': 'in',
+                                          'documentation': {'description': '\nIdentifies a particular instrument session. **vi** is obtained from the\nniDCPower_InitializeWithChannels function.\n'},
+                                          'enum': None,
+                                          'is_buffer': False,
+                                          'is_repeated_capability': False,
+                                          'is_session_handle': True,
+                                          'is_string': False,
+                                          'library_method_call_snippet': 'vi_ctype',
+                                          'name': 'vi',
+                                          'numpy': False,
+                                          'numpy_into_return': False,
+                                          'python_name': 'vi',
+                                          'python_name_or_default_for_init': 'vi',
+                                          'python_name_with_default': 'vi',
+                                          'python_name_with_doc_default': 'vi',
+                                          'python_type': 'int',
+                                          'size': {'mechanism': 'fixed', 'value': 1},
+                                          'type': 'ViSession',
+                                          'use_array': False,
+                                          'use_in_python_api': True,
+                                          'use_list': False},
+                                      {   'ctypes_type': 'ViStatus',
+                                          'ctypes_type_library_call': 'ctypes.POINTER(ViStatus)',
+                                          'ctypes_variable_name': 'code_ctype',
+                                          'direction': 'out',
+                                          'documentation': {'description': 'Returns the error code for the session or execution thread.'},
+                                          'enum': None,
+                                          'is_buffer': False,
+                                          'is_repeated_capability': False,
+                                          'is_session_handle': False,
+                                          'is_string': False,
+                                          'library_method_call_snippet': 'None if code_ctype is None else (ctypes.pointer(code_ctype))',
+                                          'name': 'Code',
+                                          'numpy': False,
+                                          'numpy_into_return': False,
+                                          'python_name': 'code',
+                                          'python_name_or_default_for_init': 'code',
+                                          'python_name_with_default': 'code',
+                                          'python_name_with_doc_default': 'code',
+                                          'python_type': 'int',
+                                          'size': {'mechanism': 'fixed', 'value': 1},
+                                          'type': 'ViStatus',
+                                          'use_array': False,
+                                          'use_in_python_api': True,
+                                          'use_list': False},
+                                      {   'ctypes_type': 'ViInt32',
+                                          'ctypes_type_library_call': 'ViInt32',
+                                          'ctypes_variable_name': 'buffer_size_ctype',
+                                          'direction': 'in',
+                                          'documentation': {   'description': '\n'
+                                                                              'Specifies the number of bytes in the ViChar array you specify for\n'
+                                                                              '**description**.\n'
+                                                                              'If the error description, including the terminating NUL byte, contains\n'
+                                                                              'more bytes than you indicate in this attribute, the function copies\n'
+                                                                              '(buffer size - 1) bytes into the buffer, places an ASCII NUL byte at the\n'
+                                                                              'end of the buffer, and returns the buffer size you must pass to get the\n'
+                                                                              'entire value. For example, if the value is 123456 and the buffer size is\n'
+                                                                              '4, the function places 123 into the buffer and returns 7.\n'
+                                                                              'If you pass 0 for this attribute, you can pass VI_NULL for\n'
+                                                                              '**description**.\n'},
+                                          'enum': None,
+                                          'is_buffer': False,
+                                          'is_repeated_capability': False,
+                                          'is_session_handle': False,
+                                          'is_string': False,
+                                          'library_method_call_snippet': 'buffer_size_ctype',
+                                          'name': 'BufferSize',
+                                          'numpy': False,
+                                          'numpy_into_return': False,
+                                          'python_name': 'buffer_size',
+                                          'python_name_or_default_for_init': 'buffer_size',
+                                          'python_name_with_default': 'buffer_size',
+                                          'python_name_with_doc_default': 'buffer_size',
+                                          'python_type': 'int',
+                                          'size': {'mechanism': 'fixed', 'value': 1},
+                                          'type': 'ViInt32',
+                                          'use_array': False,
+                                          'use_in_python_api': False,
+                                          'use_list': False},
+                                      {   'ctypes_type': 'ViChar[]',
+                                          'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                          'ctypes_variable_name': 'description_ctype',
+                                          'direction': 'out',
+                                          'documentation': {   'description': '\n'
+                                                                              'Returns the error description for the IVI session or execution thread.\n'
+                                                                              'If there is no description, the function returns an empty string.\n'
+                                                                              'The buffer must contain at least as many elements as the value you\n'
+                                                                              'specify with **bufferSize**. If the error description, including the\n'
+                                                                              'terminating NUL byte, contains more bytes than you indicate with\n'
+                                                                              '**bufferSize**, the function copies (buffer size - 1) bytes into the\n'
+                                                                              'buffer, places an ASCII NUL byte at the end of the buffer, and returns\n'
+                                                                              'the buffer size you must pass to get the entire value. For example, if\n'
+                                                                              'the value is 123456 and the buffer size is 4, the function places 123\n'
+                                                                              'into the buffer and returns 7.\n'
+                                                                              'If you pass 0 for **bufferSize**, you can pass VI_NULL for this\n'
+                                                                              'attribute.\n'},
+                                          'enum': None,
+                                          'is_buffer': False,
+                                          'is_repeated_capability': False,
+                                          'is_session_handle': False,
+                                          'is_string': True,
+                                          'library_method_call_snippet': 'description_ctype',
+                                          'name': 'Description',
+                                          'numpy': False,
+                                          'numpy_into_return': False,
+                                          'python_name': 'description',
+                                          'python_name_or_default_for_init': 'description',
+                                          'python_name_with_default': 'description',
+                                          'python_name_with_doc_default': 'description',
+                                          'python_type': 'str',
+                                          'size': {'mechanism': 'ivi-dance', 'value': 'BufferSize'},
+                                          'type': 'ViChar[]',
+                                          'use_array': False,
+                                          'use_in_python_api': True,
+                                          'use_list': False}],
+                    'python_code_variables': [],
+                    'python_name': '_get_error',
+                    'render_in_library': True,
+                    'render_in_session_base': True,
+                    'returns': 'ViStatus'},
+    'GetExtCalLastDateAndTime': {   'blocking': False,
+                                    'codegen_method': 'private',
+                                    'documentation': {   'description': '\n'
+                                                                        'Returns the date and time of the last successful calibration. The time\n'
+                                                                        'returned is 24-hour (military) local time; for example, if the device\n'
+                                                                        'was calibrated at 2:30 PM, this function returns 14 for **hours** and 30\n'
+                                                                        'for **minutes**.\n'},
+                                    'has_repeated_capability': False,
+                                    'invalidates_attribute_cache': False,
+                                    'is_error_handling': False,
+                                    'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                    'name': 'GetExtCalLastDateAndTime',
+                                    'parameters': [   {   'ctypes_type': 'ViSession',
+                                                          'ctypes_type_library_call': 'ViSession',
+                                                          'ctypes_variable_name': 'vi_ctype',
+                                                          'direction': 'in',
+                                                          'documentation': {   'description': '\n'
+                                                                                              'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                              'niDCPower_InitExtCal or niDCPower_InitializeWithChannels function.\n',
+                                                                               'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                          'enum': None,
+                                                          'is_buffer': False,
+                                                          'is_repeated_capability': False,
+                                                          'is_session_handle': True,
+                                                          'is_string': False,
+                                                          'library_method_call_snippet': 'vi_ctype',
+                                                          'name': 'vi',
+                                                          'numpy': False,
+                                                          'numpy_into_return': False,
+                                                          'python_name': 'vi',
+                                                          'python_name_or_default_for_init': 'vi',
+                                                          'python_name_with_default': 'vi',
+                                                          'python_name_with_doc_default': 'vi',
+                                                          'python_type': 'int',
+                                                          'size': {'mechanism': 'fixed', 'value': 1},
+                                                          'type': 'ViSession',
+                                                          'use_array': False,
+                                                          'use_in_python_api': True,
+                                                          'use_list': False},
+                                                      {   'ctypes_type': 'ViInt32',
+                                                          'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                                          'ctypes_variable_name': 'year_ctype',
+                                                          'direction': 'out',
+                                                          'documentation': {'description': 'Returns the **year** the device was last calibrated.'},
+                                                          'enum': None,
+                                                          'is_buffer': False,
+                                                          'is_repeated_capability': False,
+                                                          'is_session_handle': False,
+                                                          'is_string': False,
+                                                          'library_method_call_snippet': 'None if year_ctype is None else (ctypes.pointer(year_ctype))',
+                                                          'name': 'Year',
+                                                          'numpy': False,
+                                                          'numpy_into_return': False,
+                                                          'python_name': 'year',
+                                                          'python_name_or_default_for_init': 'year',
+                                                          'python_name_with_default': 'year',
+                                                          'python_name_with_doc_default': 'year',
+                                                          'python_type': 'int',
+                                                          'size': {'mechanism': 'fixed', 'value': 1},
+                                                          'type': 'ViInt32',
+                                                          'use_array': False,
+                                                          'use_in_python_api': True,
+                                                          'use_list': False},
+                                                      {   'ctypes_type': 'ViInt32',
+                                                          'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                                          'ctypes_variable_name': 'month_ctype',
+                                                          'direction': 'out',
+                                                          'documentation': {'description': 'Returns the **month** in which the device was last calibrated.'},
+                                                          'enum': None,
+                                                          'is_buffer': False,
+                                                          'is_repeated_capability': False,
+                                                          'is_session_handle': False,
+                                                          'is_string': False,
+                                                          'library_method_call_snippet': 'None if month_ctype is None else (ctypes.pointer(month_ctype))',
+                                                          'name': 'Month',
+                                                          'numpy': False,
+                                                          'numpy_into_return': False,
+                                                          'python_name': 'month',
+                                                          'python_name_or_default_for_init': 'month',
+                                                          'python_name_with_default': 'month',
+                                                          'python_name_with_doc_default': 'month',
+                                                          'python_type': 'int',
+                                                          'size': {'mechanism': 'fixed', 'value': 1},
+                                                          'type': 'ViInt32',
+                                                          'use_array': False,
+                                                          'use_in_python_api': True,
+                                                          'use_list': False},
+                                                      {   'ctypes_type': 'ViInt32',
+                                                          'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                                          'ctypes_variable_name': 'day_ctype',
+                                                          'direction': 'out',
+                                                          'documentation': {'description': 'Returns the **day** on which the device was last calibrated.'},
+                                                          'enum': None,
+                                                          'is_buffer': False,
+                                                          'is_repeated_capability': False,
+                                                          'is_session_handle': False,
+                                                          'is_string': False,
+                                                          'library_method_call_snippet': 'None if day_ctype is None else (ctypes.pointer(day_ctype))',
+                                                          'name': 'Day',
+                                                          'numpy': False,
+                                                          'numpy_into_return': False,
+                                                          'python_name': 'day',
+                                                          'python_name_or_default_for_init': 'day',
+                                                          'python_name_with_default': 'day',
+                                                          'python_name_with_doc_default': 'day',
+                                                          'python_type': 'int',
+                                                          'size': {'mechanism': 'fixed', 'value': 1},
+                                                          'type': 'ViInt32',
+                                                          'use_array': False,
+                                                          'use_in_python_api': True,
+                                                          'use_list': False},
+                                                      {   'ctypes_type': 'ViInt32',
+                                                          'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                                          'ctypes_variable_name': 'hour_ctype',
+                                                          'direction': 'out',
+                                                          'documentation': {'description': '\nReturns the **hour** (in 24-hour time) in which the device was last\ncalibrated.\n'},
+                                                          'enum': None,
+                                                          'is_buffer': False,
+                                                          'is_repeated_capability': False,
+                                                          'is_session_handle': False,
+                                                          'is_string': False,
+                                                          'library_method_call_snippet': 'None if hour_ctype is None else (ctypes.pointer(hour_ctype))',
+                                                          'name': 'Hour',
+                                                          'numpy': False,
+                                                          'numpy_into_return': False,
+                                                          'python_name': 'hour',
+                                                          'python_name_or_default_for_init': 'hour',
+                                                          'python_name_with_default': 'hour',
+                                                          'python_name_with_doc_default': 'hour',
+                                                          'python_type': 'int',
+                                                          'size': {'mechanism': 'fixed', 'value': 1},
+                                                          'type': 'ViInt32',
+                                                          'use_array': False,
+                                                          'use_in_python_api': True,
+                                                          'use_list': False},
+                                                      {   'ctypes_type': 'ViInt32',
+                                                          'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                                          'ctypes_variable_name': 'minute_ctype',
+                                                          'direction': 'out',
+                                                          'documentation': {'description': 'Returns the **minute** in which the device was last calibrated.'},
+                                                          'enum': None,
+                                                          'is_buffer': False,
+                                                          'is_repeated_capability': False,
+                                                          'is_session_handle': False,
+                                                          'is_string': False,
+                                                          'library_method_call_snippet': 'None if minute_ctype is None else (ctypes.pointer(minute_ctype))',
+                                                          'name': 'Minute',
+                                                          'numpy': False,
+                                                          'numpy_into_return': False,
+                                                          'python_name': 'minute',
+                                                          'python_name_or_default_for_init': 'minute',
+                                                          'python_name_with_default': 'minute',
+                                                          'python_name_with_doc_default': 'minute',
+                                                          'python_type': 'int',
+                                                          'size': {'mechanism': 'fixed', 'value': 1},
+                                                          'type': 'ViInt32',
+                                                          'use_array': False,
+                                                          'use_in_python_api': True,
+                                                          'use_list': False}],
+                                    'python_code_variables': [],
+                                    'python_name': '_get_ext_cal_last_date_and_time',
+                                    'render_in_library': True,
+                                    'render_in_session_base': False,
+                                    'returns': 'ViStatus'},
+    'GetExtCalLastTemp': {   'blocking': False,
+                             'codegen_method': 'public',
+                             'documentation': {'description': '\nReturns the onboard **temperature** of the device, in degrees Celsius,\nduring the last successful external calibration.\n'},
+                             'has_repeated_capability': False,
+                             'invalidates_attribute_cache': False,
+                             'is_error_handling': False,
+                             'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                             'name': 'GetExtCalLastTemp',
+                             'parameters': [   {   'ctypes_type': 'ViSession',
+                                                   'ctypes_type_library_call': 'ViSession',
+                                                   'ctypes_variable_name': 'vi_ctype',
+                                                   'direction': 'in',
+                                                   'documentation': {   'description': '\n'
+                                                                                       'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                       'niDCPower_InitExtCal or niDCPower_InitializeWithChannels function.\n',
+                                                                        'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                   'enum': None,
+                                                   'is_buffer': False,
+                                                   'is_repeated_capability': False,
+                                                   'is_session_handle': True,
+                                                   'is_string': False,
+                                                   'library_method_call_snippet': 'vi_ctype',
+                                                   'name': 'vi',
+                                                   'numpy': False,
+                                                   'numpy_into_return': False,
+                                                   'python_name': 'vi',
+                                                   'python_name_or_default_for_init': 'vi',
+                                                   'python_name_with_default': 'vi',
+                                                   'python_name_with_doc_default': 'vi',
+                                                   'python_type': 'int',
+                                                   'size': {'mechanism': 'fixed', 'value': 1},
+                                                   'type': 'ViSession',
+                                                   'use_array': False,
+                                                   'use_in_python_api': True,
+                                                   'use_list': False},
+                                               {   'ctypes_type': 'ViReal64',
+                                                   'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                                   'ctypes_variable_name': 'temperature_ctype',
+                                                   'direction': 'out',
+                                                   'documentation': {   'description': '\n'
+                                                                                       'Returns the onboard **temperature** of the device, in degrees Celsius,\n'
+                                                                                       'during the last successful external calibration.\n'},
+                                                   'enum': None,
+                                                   'is_buffer': False,
+                                                   'is_repeated_capability': False,
+                                                   'is_session_handle': False,
+                                                   'is_string': False,
+                                                   'library_method_call_snippet': 'None if temperature_ctype is None else (ctypes.pointer(temperature_ctype))',
+                                                   'name': 'Temperature',
+                                                   'numpy': False,
+                                                   'numpy_into_return': False,
+                                                   'python_name': 'temperature',
+                                                   'python_name_or_default_for_init': 'temperature',
+                                                   'python_name_with_default': 'temperature',
+                                                   'python_name_with_doc_default': 'temperature',
+                                                   'python_type': 'float',
+                                                   'size': {'mechanism': 'fixed', 'value': 1},
+                                                   'type': 'ViReal64',
+                                                   'use_array': False,
+                                                   'use_in_python_api': True,
+                                                   'use_list': False}],
+                             'python_code_variables': [],
+                             'python_name': 'get_ext_cal_last_temp',
+                             'render_in_library': True,
+                             'render_in_session_base': False,
+                             'returns': 'ViStatus'},
+    'GetExtCalRecommendedInterval': {   'blocking': False,
+                                        'codegen_method': 'public',
+                                        'documentation': {'description': '\nReturns the recommended maximum interval, in **months**, between\nexternal calibrations.\n'},
+                                        'has_repeated_capability': False,
+                                        'invalidates_attribute_cache': False,
+                                        'is_error_handling': False,
+                                        'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                        'name': 'GetExtCalRecommendedInterval',
+                                        'parameters': [   {   'ctypes_type': 'ViSession',
+                                                              'ctypes_type_library_call': 'ViSession',
+                                                              'ctypes_variable_name': 'vi_ctype',
+                                                              'direction': 'in',
+                                                              'documentation': {   'description': '\n'
+                                                                                                  'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                                  'niDCPower_InitExtCal or niDCPower_InitializeWithChannels function.\n',
+                                                                                   'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                              'enum': None,
+                                                              'is_buffer': False,
+                                                              'is_repeated_capability': False,
+                                                              'is_session_handle': True,
+                                                              'is_string': False,
+                                                              'library_method_call_snippet': 'vi_ctype',
+                                                              'name': 'vi',
+                                                              'numpy': False,
+                                                              'numpy_into_return': False,
+                                                              'python_name': 'vi',
+                                                              'python_name_or_default_for_init': 'vi',
+                                                              'python_name_with_default': 'vi',
+                                                              'python_name_with_doc_default': 'vi',
+                                                              'python_type': 'int',
+                                                              'size': {'mechanism': 'fixed', 'value': 1},
+                                                              'type': 'ViSession',
+                                                              'use_array': False,
+                                                              'use_in_python_api': True,
+                                                              'use_list': False},
+                                                          {   'ctypes_type': 'ViInt32',
+                                                              'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                                              'ctypes_variable_name': 'months_ctype',
+                                                              'direction': 'out',
+                                                              'documentation': {'description': '\nSpecifies the recommended maximum interval, in **months**, between\nexternal calibrations.\n'},
+                                                              'enum': None,
+                                                              'is_buffer': False,
+                                                              'is_repeated_capability': False,
+                                                              'is_session_handle': False,
+                                                              'is_string': False,
+                                                              'library_method_call_snippet': 'None if months_ctype is None else (ctypes.pointer(months_ctype))',
+                                                              'name': 'Months',
+                                                              'numpy': False,
+                                                              'numpy_into_return': False,
+                                                              'python_name': 'months',
+                                                              'python_name_or_default_for_init': 'months',
+                                                              'python_name_with_default': 'months',
+                                                              'python_name_with_doc_default': 'months',
+                                                              'python_type': 'int',
+                                                              'size': {'mechanism': 'fixed', 'value': 1},
+                                                              'type': 'ViInt32',
+                                                              'use_array': False,
+                                                              'use_in_python_api': True,
+                                                              'use_list': False}],
+                                        'python_code_variables': [],
+                                        'python_name': 'get_ext_cal_recommended_interval',
+                                        'render_in_library': True,
+                                        'render_in_session_base': False,
+                                        'returns': 'ViStatus'},
+    'GetLastExtCalLastDateAndTime': {   'blocking': False,
+                                        'codegen_method': 'public',
+                                        'documentation': {'description': 'Returns the date and time of the last successful calibration.'},
+                                        'has_repeated_capability': False,
+                                        'invalidates_attribute_cache': False,
+                                        'is_error_handling': False,
+                                        'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/datetime_wrappers'}],
+                                        'name': 'GetLastExtCalLastDateAndTime',
+                                        'parameters': [   {   'ctypes_type': 'ViSession',
+                                                              'ctypes_type_library_call': 'ViSession',
+                                                              'ctypes_variable_name': 'vi_ctype',
+                                                              'direction': 'in',
+                                                              'documentation': {   'description': 'Identifies a particular instrument session. **vi** is obtained from the niDCPower_InitExtCal or '
+                                                                                                  'niDCPower_InitializeWithChannels function.',
+                                                                                   'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                              'enum': None,
+                                                              'is_buffer': False,
+                                                              'is_repeated_capability': False,
+                                                              'is_session_handle': True,
+                                                              'is_string': False,
+                                                              'library_method_call_snippet': 'vi_ctype',
+                                                              'name': 'vi',
+                                                              'numpy': False,
+                                                              'numpy_into_return': False,
+                                                              'python_name': 'vi',
+                                                              'python_name_or_default_for_init': 'vi',
+                                                              'python_name_with_default': 'vi',
+                                                              'python_name_with_doc_default': 'vi',
+                                                              'python_type': 'int',
+                                                              'size': {'mechanism': 'fixed', 'value': 1},
+                                                              'type': 'ViSession',
+                                                              'use_array': False,
+                                                              'use_in_python_api': True,
+                                                              'use_list': False},
+                                                          {   'ctypes_type': 'datetime.datetime',
+                                                              'ctypes_type_library_call': 'ctypes.POINTER(datetime.datetime)',
+                                                              'ctypes_variable_name': 'month_ctype',
+                                                              'direction': 'out',
+                                                              'documentation': {'description': 'Indicates date and time of the last calibration.'},
+                                                              'enum': None,
+                                                              'is_buffer': False,
+                                                              'is_repeated_capability': False,
+                                                              'is_session_handle': False,
+                                                              'is_string': False,
+                                                              'library_method_call_snippet': 'None if month_ctype is None else (ctypes.pointer(month_ctype))',
+                                                              'name': 'Month',
+                                                              'numpy': False,
+                                                              'numpy_into_return': False,
+                                                              'python_name': 'month',
+                                                              'python_name_or_default_for_init': 'month',
+                                                              'python_name_with_default': 'month',
+                                                              'python_name_with_doc_default': 'month',
+                                                              'python_type': 'datetime.datetime',
+                                                              'size': {'mechanism': 'fixed', 'value': 1},
+                                                              'type': 'datetime.datetime',
+                                                              'use_array': False,
+                                                              'use_in_python_api': True,
+                                                              'use_list': False}],
+                                        'python_code_variables': [],
+                                        'python_name': 'get_ext_cal_last_date_and_time',
+                                        'real_datetime_call': 'GetExtCalLastDateAndTime',
+                                        'render_in_library': False,
+                                        'render_in_session_base': False,
+                                        'returns': 'ViStatus'},
+    'GetLastSelfCalLastDateAndTime': {   'blocking': False,
+                                         'codegen_method': 'public',
+                                         'documentation': {   'description': 'Returns the date and time of the oldest successful self-calibration from among the channels in the session.',
+                                                              'note': 'This function is not supported on all devices.'},
+                                         'has_repeated_capability': False,
+                                         'invalidates_attribute_cache': False,
+                                         'is_error_handling': False,
+                                         'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/datetime_wrappers'}],
+                                         'name': 'GetLastSelfCalLastDateAndTime',
+                                         'parameters': [   {   'ctypes_type': 'ViSession',
+                                                               'ctypes_type_library_call': 'ViSession',
+                                                               'ctypes_variable_name': 'vi_ctype',
+                                                               'direction': 'in',
+                                                               'documentation': {   'description': 'Identifies a particular instrument session. **vi** is obtained from the niDCPower_InitExtCal or '
+                                                                                                   'niDCPower_InitializeWithChannels function.',
+                                                                                    'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                               'enum': None,
+                                                               'is_buffer': False,
+                                                               'is_repeated_capability': False,
+                                                               'is_session_handle': True,
+                                                               'is_string': False,
+                                                               'library_method_call_snippet': 'vi_ctype',
+                                                               'name': 'vi',
+                                                               'numpy': False,
+                                                               'numpy_into_return': False,
+                                                               'python_name': 'vi',
+                                                               'python_name_or_default_for_init': 'vi',
+                                                               'python_name_with_default': 'vi',
+                                                               'python_name_with_doc_default': 'vi',
+                                                               'python_type': 'int',
+                                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                                               'type': 'ViSession',
+                                                               'use_array': False,
+                                                               'use_in_python_api': True,
+                                                               'use_list': False},
+                                                           {   'ctypes_type': 'datetime.datetime',
+                                                               'ctypes_type_library_call': 'ctypes.POINTER(datetime.datetime)',
+                                                               'ctypes_variable_name': 'month_ctype',
+                                                               'direction': 'out',
+                                                               'documentation': {'description': 'Returns the date and time the device was last calibrated.'},
+                                                               'enum': None,
+                                                               'is_buffer': False,
+                                                               'is_repeated_capability': False,
+                                                               'is_session_handle': False,
+                                                               'is_string': False,
+                                                               'library_method_call_snippet': 'None if month_ctype is None else (ctypes.pointer(month_ctype))',
+                                                               'name': 'Month',
+                                                               'numpy': False,
+                                                               'numpy_into_return': False,
+                                                               'python_name': 'month',
+                                                               'python_name_or_default_for_init': 'month',
+                                                               'python_name_with_default': 'month',
+                                                               'python_name_with_doc_default': 'month',
+                                                               'python_type': 'datetime.datetime',
+                                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                                               'type': 'datetime.datetime',
+                                                               'use_array': False,
+                                                               'use_in_python_api': True,
+                                                               'use_list': False}],
+                                         'python_code_variables': [],
+                                         'python_name': 'get_self_cal_last_date_and_time',
+                                         'real_datetime_call': 'GetSelfCalLastDateAndTime',
+                                         'render_in_library': False,
+                                         'render_in_session_base': False,
+                                         'returns': 'ViStatus'},
+    'GetNextCoercionRecord': {   'codegen_method': 'no',
+                                 'documentation': {   'description': '\n'
+                                                                     'Returns the coercion information associated with the IVI session and\n'
+                                                                     'clears the earliest instance in which NI-DCPower coerced a value you\n'
+                                                                     'specified.\n'},
+                                 'parameters': [   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                           'niDCPower_InitializeWithChannels function.\n'},
+                                                       'name': 'vi',
+                                                       'type': 'ViSession'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Specifies the number of bytes in the ViChar array you specify for\n'
+                                                                                           '**coercionRecord**. If the next coercion record string, including the\n'
+                                                                                           'terminating NUL byte, contains more bytes than you indicate in this\n'
+                                                                                           'attribute, the function copies (buffer size - 1) bytes into the buffer,\n'
+                                                                                           'places an ASCII NUL byte at the end of the buffer, and returns the\n'
+                                                                                           'buffer size you must pass to get the entire value. For example, if the\n'
+                                                                                           'value is 123456 and the buffer size is 4, the function places 123 into\n'
+                                                                                           'the buffer and returns 7.\n'
+                                                                                           'If you pass 0, you can pass VI_NULL for **coercionRecord**.\n'},
+                                                       'name': 'bufferSize',
+                                                       'type': 'ViInt32'},
+                                                   {   'direction': 'out',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Returns the next **coercionRecord** for the IVI session. If there are no\n'
+                                                                                           '**coercionRecords**, the function returns an empty string.\n'},
+                                                       'name': 'coercionRecord',
+                                                       'type': 'ViChar[]'}],
+                                 'returns': 'ViStatus'},
+    'GetNextInterchangeWarning': {   'codegen_method': 'no',
+                                     'documentation': {   'description': '\n'
+                                                                         'This function returns the interchangeability warning associated with the\n'
+                                                                         'IVI session. It retrieves and clears the earliest instance in which the\n'
+                                                                         'class driver recorded an interchangeability warning. Interchangeability\n'
+                                                                         'warnings indicate that using your application with a different device\n'
+                                                                         'may cause a different behavior.\n'
+                                                                         '\n'
+                                                                         'NI-DCPower performs interchangeability checking when the\n'
+                                                                         'NIDCPOWER_ATTR_INTERCHANGE_CHECK attribute is set to VI_TRUE. This\n'
+                                                                         'function returns an empty string in warning if no interchangeability\n'
+                                                                         'warnings remain for the session. In general, NI-DCPower generates\n'
+                                                                         'interchangeability warnings when an attribute that affects the behavior\n'
+                                                                         'of the device is in a state that you did not specify.\n'},
+                                     'parameters': [   {   'direction': 'in',
+                                                           'documentation': {   'description': '\n'
+                                                                                               'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                               'niDCPower_InitializeWithChannels function.\n'},
+                                                           'name': 'vi',
+                                                           'type': 'ViSession'},
+                                                       {   'direction': 'in',
+                                                           'documentation': {   'description': '\n'
+                                                                                               'Specifies the number of bytes in the ViChar array you specify for\n'
+                                                                                               '**interchangeWarning**. If the next interchangeability warning string,\n'
+                                                                                               'including the terminating NUL byte, contains more bytes than you\n'
+                                                                                               'indicate in this attribute, the function copies (buffer size - 1) bytes\n'
+                                                                                               'into the buffer, places an ASCII NUL byte at the end of the buffer, and\n'
+                                                                                               'returns the buffer size you must pass to get the entire value. For\n'
+                                                                                               'example, if the value is 123456 and the buffer size is 4, the function\n'
+                                                                                               'places 123 into the buffer and returns 7.\n'
+                                                                                               'If you pass 0, you can pass VI_NULL for **interchangeWarning**.\n'},
+                                                           'name': 'bufferSize',
+                                                           'type': 'ViInt32'},
+                                                       {   'direction': 'out',
+                                                           'documentation': {   'description': '\n'
+                                                                                               'Returns the next interchange warning for the IVI session. If there are\n'
+                                                                                               'no interchange warnings, the function returns an empty string.\n'},
+                                                           'name': 'interchangeWarning',
+                                                           'type': 'ViChar[]'}],
+                                     'returns': 'ViStatus'},
+    'GetSelfCalLastDateAndTime': {   'blocking': False,
+                                     'codegen_method': 'private',
+                                     'documentation': {   'description': '\n'
+                                                                         'Returns the date and time of the oldest successful self-calibration from\n'
+                                                                         'among the channels in the session.\n'
+                                                                         '\n'
+                                                                         'The time returned is 24-hour (military) local time; for example, if you\n'
+                                                                         'have a session using channels 1 and 2, and a self-calibration was\n'
+                                                                         'performed on channel 1 at 2:30 PM, and a self-calibration was performed\n'
+                                                                         'on channel 2 at 3:00 PM on the same day, this function returns 14 for\n'
+                                                                         '**hours** and 30 for **minutes**.\n',
+                                                          'note': '\n'
+                                                                  'This function is not supported on all devices. Refer to `Supported\n'
+                                                                  'Functions by\n'
+                                                                  "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                                  'for more information about supported devices.\n'},
+                                     'has_repeated_capability': False,
+                                     'invalidates_attribute_cache': False,
+                                     'is_error_handling': False,
+                                     'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                     'name': 'GetSelfCalLastDateAndTime',
+                                     'parameters': [   {   'ctypes_type': 'ViSession',
+                                                           'ctypes_type_library_call': 'ViSession',
+                                                           'ctypes_variable_name': 'vi_ctype',
+                                                           'direction': 'in',
+                                                           'documentation': {   'description': '\n'
+                                                                                               'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                               'niDCPower_InitExtCal or niDCPower_InitializeWithChannels function.\n',
+                                                                                'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                           'enum': None,
+                                                           'is_buffer': False,
+                                                           'is_repeated_capability': False,
+                                                           'is_session_handle': True,
+                                                           'is_string': False,
+                                                           'library_method_call_snippet': 'vi_ctype',
+                                                           'name': 'vi',
+                                                           'numpy': False,
+                                                           'numpy_into_return': False,
+                                                           'python_name': 'vi',
+                                                           'python_name_or_default_for_init': 'vi',
+                                                           'python_name_with_default': 'vi',
+                                                           'python_name_with_doc_default': 'vi',
+                                                           'python_type': 'int',
+                                                           'size': {'mechanism': 'fixed', 'value': 1},
+                                                           'type': 'ViSession',
+                                                           'use_array': False,
+                                                           'use_in_python_api': True,
+                                                           'use_list': False},
+                                                       {   'ctypes_type': 'ViInt32',
+                                                           'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                                           'ctypes_variable_name': 'year_ctype',
+                                                           'direction': 'out',
+                                                           'documentation': {'description': 'Returns the **year** the device was last calibrated.'},
+                                                           'enum': None,
+                                                           'is_buffer': False,
+                                                           'is_repeated_capability': False,
+                                                           'is_session_handle': False,
+                                                           'is_string': False,
+                                                           'library_method_call_snippet': 'None if year_ctype is None else (ctypes.pointer(year_ctype))',
+                                                           'name': 'Year',
+                                                           'numpy': False,
+                                                           'numpy_into_return': False,
+                                                           'python_name': 'year',
+                                                           'python_name_or_default_for_init': 'year',
+                                                           'python_name_with_default': 'year',
+                                                           'python_name_with_doc_default': 'year',
+                                                           'python_type': 'int',
+                                                           'size': {'mechanism': 'fixed', 'value': 1},
+                                                           'type': 'ViInt32',
+                                                           'use_array': False,
+                                                           'use_in_python_api': True,
+                                                           'use_list': False},
+                                                       {   'ctypes_type': 'ViInt32',
+                                                           'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                                           'ctypes_variable_name': 'month_ctype',
+                                                           'direction': 'out',
+                                                           'documentation': {'description': 'Returns the **month** in which the device was last calibrated.'},
+                                                           'enum': None,
+                                                           'is_buffer': False,
+                                                           'is_repeated_capability': False,
+                                                           'is_session_handle': False,
+                                                           'is_string': False,
+                                                           'library_method_call_snippet': 'None if month_ctype is None else (ctypes.pointer(month_ctype))',
+                                                           'name': 'Month',
+                                                           'numpy': False,
+                                                           'numpy_into_return': False,
+                                                           'python_name': 'month',
+                                                           'python_name_or_default_for_init': 'month',
+                                                           'python_name_with_default': 'month',
+                                                           'python_name_with_doc_default': 'month',
+                                                           'python_type': 'int',
+                                                           'size': {'mechanism': 'fixed', 'value': 1},
+                                                           'type': 'ViInt32',
+                                                           'use_array': False,
+                                                           'use_in_python_api': True,
+                                                           'use_list': False},
+                                                       {   'ctypes_type': 'ViInt32',
+                                                           'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                                           'ctypes_variable_name': 'day_ctype',
+                                                           'direction': 'out',
+                                                           'documentation': {'description': 'Returns the **day** on which the device was last calibrated.'},
+                                                           'enum': None,
+                                                           'is_buffer': False,
+                                                           'is_repeated_capability': False,
+                                                           'is_session_handle': False,
+                                                           'is_string': False,
+                                                           'library_method_call_snippet': 'None if day_ctype is None else (ctypes.pointer(day_ctype))',
+                                                           'name': 'Day',
+                                                           'numpy': False,
+                                                           'numpy_into_return': False,
+                                                           'python_name': 'day',
+                                                           'python_name_or_default_for_init': 'day',
+                                                           'python_name_with_default': 'day',
+                                                           'python_name_with_doc_default': 'day',
+                                                           'python_type': 'int',
+                                                           'size': {'mechanism': 'fixed', 'value': 1},
+                                                           'type': 'ViInt32',
+                                                           'use_array': False,
+                                                           'use_in_python_api': True,
+                                                           'use_list': False},
+                                                       {   'ctypes_type': 'ViInt32',
+                                                           'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                                           'ctypes_variable_name': 'hour_ctype',
+                                                           'direction': 'out',
+                                                           'documentation': {'description': '\nReturns the **hour** (in 24-hour time) in which the device was last\ncalibrated.\n'},
+                                                           'enum': None,
+                                                           'is_buffer': False,
+                                                           'is_repeated_capability': False,
+                                                           'is_session_handle': False,
+                                                           'is_string': False,
+                                                           'library_method_call_snippet': 'None if hour_ctype is None else (ctypes.pointer(hour_ctype))',
+                                                           'name': 'Hour',
+                                                           'numpy': False,
+                                                           'numpy_into_return': False,
+                                                           'python_name': 'hour',
+                                                           'python_name_or_default_for_init': 'hour',
+                                                           'python_name_with_default': 'hour',
+                                                           'python_name_with_doc_default': 'hour',
+                                                           'python_type': 'int',
+                                                           'size': {'mechanism': 'fixed', 'value': 1},
+                                                           'type': 'ViInt32',
+                                                           'use_array': False,
+                                                           'use_in_python_api': True,
+                                                           'use_list': False},
+                                                       {   'ctypes_type': 'ViInt32',
+                                                           'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                                           'ctypes_variable_name': 'minute_ctype',
+                                                           'direction': 'out',
+                                                           'documentation': {'description': 'Returns the **minute** in which the device was last calibrated.'},
+                                                           'enum': None,
+                                                           'is_buffer': False,
+                                                           'is_repeated_capability': False,
+                                                           'is_session_handle': False,
+                                                           'is_string': False,
+                                                           'library_method_call_snippet': 'None if minute_ctype is None else (ctypes.pointer(minute_ctype))',
+                                                           'name': 'Minute',
+                                                           'numpy': False,
+                                                           'numpy_into_return': False,
+                                                           'python_name': 'minute',
+                                                           'python_name_or_default_for_init': 'minute',
+                                                           'python_name_with_default': 'minute',
+                                                           'python_name_with_doc_default': 'minute',
+                                                           'python_type': 'int',
+                                                           'size': {'mechanism': 'fixed', 'value': 1},
+                                                           'type': 'ViInt32',
+                                                           'use_array': False,
+                                                           'use_in_python_api': True,
+                                                           'use_list': False}],
+                                     'python_code_variables': [],
+                                     'python_name': '_get_self_cal_last_date_and_time',
+                                     'render_in_library': True,
+                                     'render_in_session_base': False,
+                                     'returns': 'ViStatus'},
+    'GetSelfCalLastTemp': {   'blocking': False,
+                              'codegen_method': 'public',
+                              'documentation': {   'description': '\n'
+                                                                  'Returns the onboard temperature of the device, in degrees Celsius,\n'
+                                                                  'during the oldest successful self-calibration from among the channels in\n'
+                                                                  'the session.\n'
+                                                                  '\n'
+                                                                  'For example, if you have a session using channels 1 and 2, and you\n'
+                                                                  'perform a self-calibration on channel 1 with a device temperature of 25\n'
+                                                                  'degrees Celsius at 2:00, and a self-calibration was performed on channel\n'
+                                                                  '2 at 27 degrees Celsius at 3:00 on the same day, this function returns\n'
+                                                                  '25 for the **temperature** parameter.\n',
+                                                   'note': '\n'
+                                                           'This function is not supported on all devices. Refer to `Supported\n'
+                                                           'Functions by\n'
+                                                           "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                           'for more information about supported devices.\n'},
+                              'has_repeated_capability': False,
+                              'invalidates_attribute_cache': False,
+                              'is_error_handling': False,
+                              'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                              'name': 'GetSelfCalLastTemp',
+                              'parameters': [   {   'ctypes_type': 'ViSession',
+                                                    'ctypes_type_library_call': 'ViSession',
+                                                    'ctypes_variable_name': 'vi_ctype',
+                                                    'direction': 'in',
+                                                    'documentation': {   'description': '\n'
+                                                                                        'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                        'niDCPower_InitExtCal or niDCPower_InitializeWithChannels function.\n',
+                                                                         'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                    'enum': None,
+                                                    'is_buffer': False,
+                                                    'is_repeated_capability': False,
+                                                    'is_session_handle': True,
+                                                    'is_string': False,
+                                                    'library_method_call_snippet': 'vi_ctype',
+                                                    'name': 'vi',
+                                                    'numpy': False,
+                                                    'numpy_into_return': False,
+                                                    'python_name': 'vi',
+                                                    'python_name_or_default_for_init': 'vi',
+                                                    'python_name_with_default': 'vi',
+                                                    'python_name_with_doc_default': 'vi',
+                                                    'python_type': 'int',
+                                                    'size': {'mechanism': 'fixed', 'value': 1},
+                                                    'type': 'ViSession',
+                                                    'use_array': False,
+                                                    'use_in_python_api': True,
+                                                    'use_list': False},
+                                                {   'ctypes_type': 'ViReal64',
+                                                    'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                                    'ctypes_variable_name': 'temperature_ctype',
+                                                    'direction': 'out',
+                                                    'documentation': {   'description': '\n'
+                                                                                        'Returns the onboard **temperature** of the device, in degrees Celsius,\n'
+                                                                                        'during the oldest successful calibration.\n'},
+                                                    'enum': None,
+                                                    'is_buffer': False,
+                                                    'is_repeated_capability': False,
+                                                    'is_session_handle': False,
+                                                    'is_string': False,
+                                                    'library_method_call_snippet': 'None if temperature_ctype is None else (ctypes.pointer(temperature_ctype))',
+                                                    'name': 'Temperature',
+                                                    'numpy': False,
+                                                    'numpy_into_return': False,
+                                                    'python_name': 'temperature',
+                                                    'python_name_or_default_for_init': 'temperature',
+                                                    'python_name_with_default': 'temperature',
+                                                    'python_name_with_doc_default': 'temperature',
+                                                    'python_type': 'float',
+                                                    'size': {'mechanism': 'fixed', 'value': 1},
+                                                    'type': 'ViReal64',
+                                                    'use_array': False,
+                                                    'use_in_python_api': True,
+                                                    'use_list': False}],
+                              'python_code_variables': [],
+                              'python_name': 'get_self_cal_last_temp',
+                              'render_in_library': True,
+                              'render_in_session_base': False,
+                              'returns': 'ViStatus'},
+    'InitExtCal': {   'codegen_method': 'no',
+                      'documentation': {   'description': '\n'
+                                                          'If **password** is valid, this function creates a new IVI instrument\n'
+                                                          'driver session to the device specified in **resourceName** and returns\n'
+                                                          'an instrument handle you use to identify the device in all subsequent\n'
+                                                          'NI-DCPower function calls. This function also sends initialization\n'
+                                                          'commands to set the device to the state necessary for the operation of\n'
+                                                          'NI-DCPower.\n'
+                                                          '\n'
+                                                          'Opening a calibration session always performs a reset. Refer to the\n'
+                                                          'calibration procedure for the device you are calibrating for detailed\n'
+                                                          'instructions on the appropriate use of this function. This function uses\n'
+                                                          'the `deprecated programming state\n'
+                                                          'model <REPLACE_DRIVER_SPECIFIC_URL_1(initializedeprecatedmodel)>`__.\n'},
+                      'parameters': [   {   'direction': 'in',
+                                            'documentation': {   'description': '\n'
+                                                                                'Specifies the **resourceName** assigned by Measurement & Automation\n'
+                                                                                'Explorer (MAX), for example "PXI1Slot3" where "PXI1Slot3" is an\n'
+                                                                                "instrument's **resourceName**. **resourceName** can also be a logical\n"
+                                                                                'IVI name.\n'},
+                                            'name': 'resourceName',
+                                            'type': 'ViRsrc'},
+                                        {   'direction': 'in',
+                                            'documentation': {   'description': '\n'
+                                                                                'Specifies the **password** for opening a calibration session. The\n'
+                                                                                'initial password is factory configured to "NI". **password** can be a\n'
+                                                                                'maximum of four alphanumeric characters.\n'},
+                                            'name': 'Password',
+                                            'type': 'ViChar[]'},
+                                        {   'direction': 'out',
+                                            'documentation': {'description': '\nReturns a handle that you use to identify the session in all subsequent\nNI-DCPower function calls.\n'},
+                                            'name': 'vi',
+                                            'type': 'ViSession'}],
+                      'returns': 'ViStatus'},
+    'InitWithOptions': {   'codegen_method': 'no',
+                           'documentation': {   'description': '\n'
+                                                               'This function is deprecated. Use niDCPower_InitializeWithChannels\n'
+                                                               'instead.\n'
+                                                               '\n'
+                                                               'Creates a new IVI instrument driver session to the device specified in\n'
+                                                               '**resourceName** and returns a session handle you use to identify the\n'
+                                                               'device in all subsequent NI-DCPower function calls. With this function,\n'
+                                                               'you can optionally set the initial state of the following session\n'
+                                                               'attributes:\n'
+                                                               '\n'
+                                                               '-  NIDCPOWER_ATTR_SIMULATE\n'
+                                                               '-  NIDCPOWER_ATTR_DRIVER_SETUP\n'
+                                                               '-  NIDCPOWER_ATTR_RANGE_CHECK\n'
+                                                               '-  NIDCPOWER_ATTR_QUERY_INSTRUMENT_STATUS\n'
+                                                               '-  NIDCPOWER_ATTR_CACHE\n'
+                                                               '-  NIDCPOWER_ATTR_RECORD_COERCIONS\n'
+                                                               '\n'
+                                                               'This function also sends initialization commands to set the device to\n'
+                                                               'the state necessary for NI-DCPower to operate.\n'
+                                                               '\n'
+                                                               'To place the device in a known start-up state when creating a new\n'
+                                                               'session, set **resetDevice** to VI_TRUE. This action is equivalent to\n'
+                                                               'using the niDCPower_reset function.\n'
+                                                               '\n'
+                                                               'To open a session and leave the device in its existing configuration\n'
+                                                               'without passing through a transitional output state, set **resetDevice**\n'
+                                                               'to VI_FALSE, and immediately call the niDCPower_Abort function. Then\n'
+                                                               'configure the device as in the previous session changing only the\n'
+                                                               'desired settings, and then call the niDCPower_Initiate function.\n'
+                                                               '\n'
+                                                               'Refer to the `deprecated programming state\n'
+                                                               'model <REPLACE_DRIVER_SPECIFIC_URL_1(initializedeprecatedmodel)>`__ for\n'
+                                                               'information about the specific software states.\n'},
+                           'parameters': [   {   'direction': 'in',
+                                                 'documentation': {   'description': '\n'
+                                                                                     'Specifies the **resourceName** assigned by Measurement & Automation\n'
+                                                                                     'Explorer (MAX), for example "PXI1Slot3" where "PXI1Slot3" is an\n'
+                                                                                     "instrument's **resourceName**. **resourceName** can also be a logical\n"
+                                                                                     'IVI name.\n'},
+                                                 'name': 'resourceName',
+                                                 'type': 'ViRsrc'},
+                                             {   'direction': 'in',
+                                                 'documentation': {'description': '\nSpecifies whether the device is queried to determine if the device is a\nvalid instrument for NI-DCPower.\n'},
+                                                 'name': 'idQuery',
+                                                 'type': 'ViBoolean'},
+                                             {   'direction': 'in',
+                                                 'documentation': {'description': '\nSpecifies whether to reset the device during the initialization\nprocedure.\n'},
+                                                 'name': 'resetDevice',
+                                                 'type': 'ViBoolean'},
+                                             {   'direction': 'in',
+                                                 'documentation': {   'description': '\n'
+                                                                                     'Specifies the initial value of certain attributes for the session. The\n'
+                                                                                     'syntax for **optionString** is a list of attributes with an assigned\n'
+                                                                                     'value where 1 is VI_TRUE and 0 is VI_FALSE. Each attribute/value\n'
+                                                                                     'combination is delimited with a comma, as shown in the following\n'
+                                                                                     'example:\n'
+                                                                                     '\n'
+                                                                                     '"Simulate=0,RangeCheck=1,QueryInstrStatus=0,Cache=1"\n'
+                                                                                     '\n'
+                                                                                     'If you do not wire this input or pass an empty string, the session\n'
+                                                                                     'assigns the default values, shown in the example, for these attributes.\n'
+                                                                                     'You do not have to specify a value for all the attributes. If you do not\n'
+                                                                                     'specify a value for an attribute, the default value is used.\n'
+                                                                                     '\n'
+                                                                                     'For more information about simulating a device, refer to `Simulating a\n'
+                                                                                     'Power Supply or SMU <REPLACE_DRIVER_SPECIFIC_URL_1(simulate)>`__.\n'},
+                                                 'name': 'optionString',
+                                                 'type': 'ViChar[]'},
+                                             {   'direction': 'out',
+                                                 'documentation': {'description': '\nReturns a handle that you use to identify the device in all subsequent\nNI-DCPower function calls.\n'},
+                                                 'name': 'vi',
+                                                 'type': 'ViSession'}],
+                           'returns': 'ViStatus'},
+    'InitializeWithChannels': {   'blocking': False,
+                                  'codegen_method': 'private',
+                                  'documentation': {   'description': '\n'
+                                                                      'Creates and returns a new NI-DCPower session to the power supply or SMU\n'
+                                                                      'specified in **resource name** to be used in all subsequent NI-DCPower\n'
+                                                                      'function calls. With this function, you can optionally set the initial\n'
+                                                                      'state of the following session attributes:\n'
+                                                                      '\n'
+                                                                      '-  NIDCPOWER_ATTR_SIMULATE\n'
+                                                                      '-  NIDCPOWER_ATTR_DRIVER_SETUP\n'
+                                                                      '\n'
+                                                                      'After calling this function, the session will be in the Uncommitted\n'
+                                                                      'state. Refer to the `Programming\n'
+                                                                      'States <REPLACE_DRIVER_SPECIFIC_URL_1(programmingstates)>`__ topic for\n'
+                                                                      'details about specific software states.\n'
+                                                                      '\n'
+                                                                      'To place the device in a known start-up state when creating a new\n'
+                                                                      'session, set **reset** to VI_TRUE. This action is equivalent to using\n'
+                                                                      'the niDCPower_reset function immediately after initializing the\n'
+                                                                      'session.\n'
+                                                                      '\n'
+                                                                      'To open a session and leave the device in its existing configuration\n'
+                                                                      'without passing through a transitional output state, set **reset** to\n'
+                                                                      'VI_FALSE. Then configure the device as in the previous session,\n'
+                                                                      'changing only the desired settings, and then call the\n'
+                                                                      'niDCPower_Initiate function.\n'
+                                                                      '\n'
+                                                                      '**Related Topics:**\n'
+                                                                      '\n'
+                                                                      '`Programming\n'
+                                                                      'States <REPLACE_DRIVER_SPECIFIC_URL_1(programmingstates)>`__\n'},
+                                  'has_repeated_capability': False,
+                                  'invalidates_attribute_cache': False,
+                                  'is_error_handling': False,
+                                  'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                  'name': 'InitializeWithChannels',
+                                  'parameters': [   {   'ctypes_type': 'ViRsrc',
+                                                        'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                        'ctypes_variable_name': 'resource_name_ctype',
+                                                        'direction': 'in',
+                                                        'documentation': {   'description': '\n'
+                                                                                            'Specifies the **resourceName** assigned by Measurement & Automation\n'
+                                                                                            'Explorer (MAX), for example "PXI1Slot3" where "PXI1Slot3" is an\n'
+                                                                                            "instrument's **resourceName**. **resourceName** can also be a logical\n"
+                                                                                            'IVI name.\n'},
+                                                        'enum': None,
+                                                        'is_buffer': False,
+                                                        'is_repeated_capability': False,
+                                                        'is_session_handle': False,
+                                                        'is_string': True,
+                                                        'library_method_call_snippet': 'resource_name_ctype',
+                                                        'name': 'resourceName',
+                                                        'numpy': False,
+                                                        'numpy_into_return': False,
+                                                        'python_name': 'resource_name',
+                                                        'python_name_or_default_for_init': 'resource_name',
+                                                        'python_name_with_default': 'resource_name',
+                                                        'python_name_with_doc_default': 'resource_name',
+                                                        'python_type': 'str',
+                                                        'size': {'mechanism': 'fixed', 'value': 1},
+                                                        'type': 'ViRsrc',
+                                                        'use_array': False,
+                                                        'use_in_python_api': True,
+                                                        'use_list': False},
+                                                    {   'ctypes_type': 'ViChar[]',
+                                                        'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                        'ctypes_variable_name': 'channels_ctype',
+                                                        'default_value': '""',
+                                                        'direction': 'in',
+                                                        'documentation': {   'description': '\n'
+                                                                                            'Specifies which output channel(s) to include in a new session. Specify\n'
+                                                                                            'multiple channels by using a channel list or a channel range. A channel\n'
+                                                                                            'list is a comma (,) separated sequence of channel names (for example,\n'
+                                                                                            '0,2 specifies channels 0 and 2). A channel range is a lower bound\n'
+                                                                                            'channel followed by a hyphen (-) or colon (:) followed by an upper bound\n'
+                                                                                            'channel (for example, 0-2 specifies channels 0, 1, and 2). In the\n'
+                                                                                            'Running state, multiple output channel configurations are performed\n'
+                                                                                            'sequentially based on the order specified in this parameter. If you do\n'
+                                                                                            'not specify any channels, by default all channels on the device are\n'
+                                                                                            'included in the session.\n'},
+                                                        'enum': None,
+                                                        'is_buffer': False,
+                                                        'is_repeated_capability': False,
+                                                        'is_session_handle': False,
+                                                        'is_string': True,
+                                                        'library_method_call_snippet': 'channels_ctype',
+                                                        'name': 'Channels',
+                                                        'numpy': False,
+                                                        'numpy_into_return': False,
+                                                        'python_name': 'channels',
+                                                        'python_name_or_default_for_init': 'channels',
+                                                        'python_name_with_default': 'channels=""',
+                                                        'python_name_with_doc_default': 'channels=\'""\'',
+                                                        'python_type': 'str',
+                                                        'size': {'mechanism': 'fixed', 'value': 1},
+                                                        'type': 'ViChar[]',
+                                                        'use_array': False,
+                                                        'use_in_python_api': True,
+                                                        'use_list': False},
+                                                    {   'ctypes_type': 'ViBoolean',
+                                                        'ctypes_type_library_call': 'ViBoolean',
+                                                        'ctypes_variable_name': 'reset_ctype',
+                                                        'default_value': False,
+                                                        'direction': 'in',
+                                                        'documentation': {'description': '\nSpecifies whether to reset the device during the initialization\nprocedure.\n'},
+                                                        'enum': None,
+                                                        'is_buffer': False,
+                                                        'is_repeated_capability': False,
+                                                        'is_session_handle': False,
+                                                        'is_string': False,
+                                                        'library_method_call_snippet': 'reset_ctype',
+                                                        'name': 'Reset',
+                                                        'numpy': False,
+                                                        'numpy_into_return': False,
+                                                        'python_name': 'reset',
+                                                        'python_name_or_default_for_init': 'reset',
+                                                        'python_name_with_default': 'reset=False',
+                                                        'python_name_with_doc_default': 'reset=False',
+                                                        'python_type': 'bool',
+                                                        'size': {'mechanism': 'fixed', 'value': 1},
+                                                        'type': 'ViBoolean',
+                                                        'use_array': False,
+                                                        'use_in_python_api': True,
+                                                        'use_list': False},
+                                                    {   'ctypes_type': 'ViChar[]',
+                                                        'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                        'ctypes_variable_name': 'option_string_ctype',
+                                                        'default_value': '""',
+                                                        'direction': 'in',
+                                                        'documentation': {   'description': '\n'
+                                                                                            'Specifies the initial value of certain attributes for the session. The\n'
+                                                                                            'syntax for **optionString** is a list of attributes with an assigned\n'
+                                                                                            'value where 1 is VI_TRUE and 0 is VI_FALSE. For example:\n'
+                                                                                            '\n'
+                                                                                            '"Simulate=0"\n'
+                                                                                            '\n'
+                                                                                            'You do not have to specify a value for all the attributes. If you do not\n'
+                                                                                            'specify a value for an attribute, the default value is used.\n'
+                                                                                            '\n'
+                                                                                            'For more information about simulating a device, refer to `Simulating a\n'
+                                                                                            'Power Supply or SMU <REPLACE_DRIVER_SPECIFIC_URL_1(simulate)>`__.\n'},
+                                                        'enum': None,
+                                                        'is_buffer': False,
+                                                        'is_repeated_capability': False,
+                                                        'is_session_handle': False,
+                                                        'is_string': True,
+                                                        'library_method_call_snippet': 'option_string_ctype',
+                                                        'name': 'optionString',
+                                                        'numpy': False,
+                                                        'numpy_into_return': False,
+                                                        'python_api_converter_name': 'convert_init_with_options_dictionary',
+                                                        'python_name': 'option_string',
+                                                        'python_name_or_default_for_init': '_converters.convert_init_with_options_dictionary(option_string, self._encoding)',
+                                                        'python_name_with_default': 'option_string=""',
+                                                        'python_name_with_doc_default': 'option_string=\'""\'',
+                                                        'python_type': 'dict',
+                                                        'size': {'mechanism': 'fixed', 'value': 1},
+                                                        'type': 'ViChar[]',
+                                                        'use_array': False,
+                                                        'use_in_python_api': True,
+                                                        'use_list': False},
+                                                    {   'ctypes_type': 'ViSession',
+                                                        'ctypes_type_library_call': 'ctypes.POINTER(ViSession)',
+                                                        'ctypes_variable_name': 'vi_ctype',
+                                                        'direction': 'out',
+                                                        'documentation': {   'description': '\n'
+                                                                                            'Returns a session handle that you use to identify the device in all\n'
+                                                                                            'subsequent NI-DCPower function calls.\n'},
+                                                        'enum': None,
+                                                        'is_buffer': False,
+                                                        'is_repeated_capability': False,
+                                                        'is_session_handle': False,
+                                                        'is_string': False,
+                                                        'library_method_call_snippet': 'None if vi_ctype is None else (ctypes.pointer(vi_ctype))',
+                                                        'name': 'vi',
+                                                        'numpy': False,
+                                                        'numpy_into_return': False,
+                                                        'python_name': 'vi',
+                                                        'python_name_or_default_for_init': 'vi',
+                                                        'python_name_with_default': 'vi',
+                                                        'python_name_with_doc_default': 'vi',
+                                                        'python_type': 'int',
+                                                        'size': {'mechanism': 'fixed', 'value': 1},
+                                                        'type': 'ViSession',
+                                                        'use_array': False,
+                                                        'use_in_python_api': True,
+                                                        'use_list': False}],
+                                  'python_code_variables': [],
+                                  'python_name': '_initialize_with_channels',
+                                  'render_in_library': True,
+                                  'render_in_session_base': False,
+                                  'returns': 'ViStatus'},
+    'Initiate': {   'blocking': False,
+                    'codegen_method': 'private',
+                    'documentation': {   'description': '\n'
+                                                        'Starts generation or acquisition, causing the NI-DCPower session to\n'
+                                                        'leave the Uncommitted state or Committed state and enter the Running\n'
+                                                        'state. To return to the Committed state call the niDCPower_Abort\n'
+                                                        'function. Refer to the `Programming\n'
+                                                        'States <REPLACE_DRIVER_SPECIFIC_URL_1(programmingstates)>`__ topic in\n'
+                                                        'the *NI DC Power Supplies and SMUs Help* for information about the\n'
+                                                        'specific NI-DCPower software states.\n'
+                                                        '\n'
+                                                        '**Related Topics:**\n'
+                                                        '\n'
+                                                        '`Programming\n'
+                                                        'States <REPLACE_DRIVER_SPECIFIC_URL_1(programmingstates)>`__\n'},
+                    'has_repeated_capability': False,
+                    'invalidates_attribute_cache': True,
+                    'is_error_handling': False,
+                    'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                    'name': 'Initiate',
+                    'parameters': [   {   'ctypes_type': 'ViSession',
+                                          'ctypes_type_library_call': 'ViSession',
+                                          'ctypes_variable_name': 'vi_ctype',
+                                          'direction': 'in',
+                                          'documentation': {'description': '\nIdentifies a particular instrument session. **vi** is obtained from the\nniDCPower_InitializeWithChannels function.\n'},
+                                          'enum': None,
+                                          'is_buffer': False,
+                                          'is_repeated_capability': False,
+                                          'is_session_handle': True,
+                                          'is_string': False,
+                                          'library_method_call_snippet': 'vi_ctype',
+                                          'name': 'vi',
+                                          'numpy': False,
+                                          'numpy_into_return': False,
+                                          'python_name': 'vi',
+                                          'python_name_or_default_for_init': 'vi',
+                                          'python_name_with_default': 'vi',
+                                          'python_name_with_doc_default': 'vi',
+                                          'python_type': 'int',
+                                          'size': {'mechanism': 'fixed', 'value': 1},
+                                          'type': 'ViSession',
+                                          'use_array': False,
+                                          'use_in_python_api': True,
+                                          'use_list': False}],
+                    'python_code_variables': [],
+                    'python_name': '_initiate',
+                    'render_in_library': True,
+                    'render_in_session_base': False,
+                    'returns': 'ViStatus'},
+    'LoadAdvancedSequence': {   'blocking': False,
+                                'codegen_method': 'public',
+                                'documentation': {   'description': '\n'
+                                                                    '                Creates an advanced sequence with one step per row of **values**, like calling create_advanced_sequence, then\n'
+                                                                    '                create_advanced_sequence_step and setting the properties for each step. All names and columns are checked and\n'
+                                                                    '                converted, with vectorized numpy operations where possible, before anything is sent to the driver. The steps are\n'
+                                                                    '                then created in a single loop that passes the encoded channel string and converted values straight to the '
+                                                                    'driver.\n'
+                                                                    '                If the driver returns an error, the steps after the failing one are not created.'},
+                                'has_repeated_capability': True,
+                                'invalidates_attribute_cache': False,
+                                'is_error_handling': False,
+                                'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/load_advanced_sequence'}],
+                                'name': 'LoadAdvancedSequence',
+                                'parameters': [   {   'ctypes_type': 'ViSession',
+                                                      'ctypes_type_library_call': 'ViSession',
+                                                      'ctypes_variable_name': 'vi_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': 'Identifies a particular instrument session. **vi** is obtained from the niDCPower_InitializeWithChannels '
+                                                                                          'function.'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': True,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'vi_ctype',
+                                                      'name': 'vi',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'vi',
+                                                      'python_name_or_default_for_init': 'vi',
+                                                      'python_name_with_default': 'vi',
+                                                      'python_name_with_doc_default': 'vi',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViSession',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViChar[]',
+                                                      'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                      'ctypes_variable_name': 'channel_name_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {'description': 'Specifies the output channel(s) the property values of the steps are set for.'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': True,
+                                                      'is_session_handle': False,
+                                                      'is_string': True,
+                                                      'library_method_call_snippet': 'channel_name_ctype',
+                                                      'name': 'channelName',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'channel_name',
+                                                      'python_name_or_default_for_init': 'channel_name',
+                                                      'python_name_with_default': 'channel_name',
+                                                      'python_name_with_doc_default': 'channel_name',
+                                                      'python_type': 'str',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViChar[]',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViConstString',
+                                                      'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                      'ctypes_variable_name': 'sequence_name_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {'description': 'Specifies the name of the sequence to create.'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': True,
+                                                      'library_method_call_snippet': 'sequence_name_ctype',
+                                                      'name': 'sequenceName',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'sequence_name',
+                                                      'python_name_or_default_for_init': 'sequence_name',
+                                                      'python_name_with_default': 'sequence_name',
+                                                      'python_name_with_doc_default': 'sequence_name',
+                                                      'python_type': 'str',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViConstString',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViInt32',
+                                                      'ctypes_type_library_call': 'ViInt32',
+                                                      'ctypes_variable_name': 'values_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          '                        Maps each property of the sequence, given by name or by attribute ID, to a column '
+                                                                                          'with its value for every step.\n'
+                                                                                          '                        Columns can be numpy arrays, array.array or any other sequence, and must all have '
+                                                                                          'the same length, which is the\n'
+                                                                                          '                        number of steps. Columns of enum, datetime.timedelta and string properties hold '
+                                                                                          'enum values, datetime.timedelta\n'
+                                                                                          '                        objects and strings.\n'
+                                                                                          '\n'
+                                                                                          '                        Example:\n'
+                                                                                          '\n'
+                                                                                          '                        .. code-block:: python\n'
+                                                                                          '\n'
+                                                                                          "                            session.load_advanced_sequence('sweep', {\n"
+                                                                                          "                                'output_function': [nidcpower.OutputFunction.DC_VOLTAGE] * 2000,\n"
+                                                                                          "                                'voltage_level': numpy.linspace(0.0, 2.0, 2000),\n"
+                                                                                          '                            })'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'values_ctype',
+                                                      'name': 'values',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'values',
+                                                      'python_name_or_default_for_init': 'values',
+                                                      'python_name_with_default': 'values',
+                                                      'python_name_with_doc_default': 'values',
+                                                      'python_type': 'dict',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViInt32',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViBoolean',
+                                                      'ctypes_type_library_call': 'ViBoolean',
+                                                      'ctypes_variable_name': 'set_as_active_sequence_ctype',
+                                                      'default_value': True,
+                                                      'direction': 'in',
+                                                      'documentation': {'description': 'Specifies that this sequence is active.'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'set_as_active_sequence_ctype',
+                                                      'name': 'setAsActiveSequence',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'set_as_active_sequence',
+                                                      'python_name_or_default_for_init': 'set_as_active_sequence',
+                                                      'python_name_with_default': 'set_as_active_sequence=True',
+                                                      'python_name_with_doc_default': 'set_as_active_sequence=True',
+                                                      'python_type': 'bool',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViBoolean',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False}],
+                                'python_code_variables': [],
+                                'python_name': 'load_advanced_sequence',
+                                'render_in_library': False,
+                                'render_in_session_base': True,
+                                'returns': 'ViStatus'},
+    'LockSession': {   'codegen_method': 'no',
+                       'documentation': {   'description': '\n'
+                                                           '| Obtains a multithread lock on the device session. Before doing so, the\n'
+                                                           '  software waits until all other execution threads release their locks\n'
+                                                           '  on the device session.\n'
+                                                           '| Other threads may have obtained a lock on this session for the\n'
+                                                           '  following reasons:\n'
+                                                           '\n'
+                                                           '-  The application called the niDCPower_LockSession function.\n'
+                                                           '-  A call to NI-DCPower locked the session.\n'
+                                                           '-  A call to the IVI engine locked the session.\n'
+                                                           '-  After a call to the niDCPower_LockSession function returns\n'
+                                                           '   successfully, no other threads can access the device session until\n'
+                                                           '   you call the niDCPower_UnlockSession function.\n'
+                                                           '-  Use the niDCPower_LockSession function and the\n'
+                                                           '   niDCPower_UnlockSession function around a sequence of calls to\n'
+                                                           '   instrument driver functions if you require that the device retain its\n'
+                                                           '   settings through the end of the sequence.\n'
+                                                           '\n'
+                                                           'You can safely make nested calls to the niDCPower_LockSession function\n'
+                                                           'within the same thread. To completely unlock the session, you must\n'
+                                                           'balance each call to the niDCPower_LockSession function with a call to\n'
+                                                           'the niDCPower_UnlockSession function. If, however, you use\n'
+                                                           '**Caller_Has_Lock** in all calls to the niDCPower_LockSession and\n'
+                                                           'niDCPower_UnlockSession function within a function, the IVI Library\n'
+                                                           'locks the session only once within the function regardless of the number\n'
+                                                           'of calls you make to the niDCPower_LockSession function. This behavior\n'
+                                                           'allows you to call the niDCPower_UnlockSession function just once at\n'
+                                                           'the end of the function.\n',
+                                            'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                       'parameters': [   {   'direction': 'in',
+                                             'documentation': {   'description': '\n'
+                                                                                 'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                 'niDCPower_InitializeWithChannels function.\n'},
+                                             'name': 'vi',
+                                             'type': 'ViSession'},
+                                         {   'direction': 'out',
+                                             'documentation': {   'description': '\n'
+                                                                                 '| This parameter is optional. If you do not want to use this parameter,\n'
+                                                                                 '  pass VI_NULL.\n'
+                                                                                 '| Use this parameter in complex functions to keep track of whether you\n'
+                                                                                 '  obtain a lock and therefore need to unlock the session. Pass the\n'
+                                                                                 '  address of a local ViBoolean variable. In the declaration of the local\n'
+                                                                                 '  variable, initialize it to VI_FALSE. Pass the address of the same\n'
+                                                                                 '  local variable to any other calls you make to the\n'
+                                                                                 '  niDCPower_LockSession function or the niDCPower_UnlockSession\n'
+                                                                                 '  function in the same function.\n'
+                                                                                 '| The parameter is an input/output parameter. The niDCPower_LockSession\n'
+                                                                                 '  and niDCPower_UnlockSession functions each inspect the current value\n'
+                                                                                 '  and take the following actions.\n'
+                                                                                 '\n'
+                                                                                 '-  If the value is VI_TRUE, the niDCPower_LockSession function does\n'
+                                                                                 '   not lock the session again.\n'
+                                                                                 '-  If the value is VI_FALSE, the niDCPower_LockSession function\n'
+                                                                                 '   obtains the lock and sets the value of the parameter to VI_TRUE.\n'
+                                                                                 '-  If the value is VI_FALSE, the niDCPower_UnlockSession function does\n'
+                                                                                 '   not attempt to unlock the session.\n'
+                                                                                 '-  If the value is VI_TRUE, the niDCPower_UnlockSession function\n'
+                                                                                 '   releases the lock and sets the value of the parameter to VI_FALSE.\n'
+                                                                                 '\n'
+                                                                                 '| Thus, you can, call the niDCPower_UnlockSession function at the end\n'
+                                                                                 '  of your function without worrying about whether you actually have the\n'
+                                                                                 '  lock, as shown in the following example.\n'
+                                                                                 '| ViStatus TestFunc (ViSession vi, ViInt32 flags)\n'
+                                                                                 '  {\n'
+                                                                                 '  ViStatus error = VI_SUCCESS;\n'
+                                                                                 '  ViBoolean haveLock = VI_FALSE;\n'
+                                                                                 '  if (flags & BIT_1)\n'
+                                                                                 '  {\n'
+                                                                                 '  viCheckErr( niDCPower_LockSession(vi, &haveLock;));\n'
+                                                                                 '  viCheckErr( TakeAction1(vi));\n'
+                                                                                 '  if (flags & BIT_2)\n'
+                                                                                 '  {\n'
+                                                                                 '  viCheckErr( niDCPower_UnlockSession(vi, &haveLock;));\n'
+                                                                                 '  viCheckErr( TakeAction2(vi));\n'
+                                                                                 '  viCheckErr( niDCPower_LockSession(vi, &haveLock;);\n'
+                                                                                 '  }\n'
+                                                                                 '  if (flags & BIT_3)\n'
+                                                                                 '  viCheckErr( TakeAction3(vi));\n'
+                                                                                 '  }\n'
+                                                                                 '  Error:\n'
+                                                                                 '  /\\*At this point, you cannot really be sure that you have the lock.\n'
+                                                                                 '  Fortunately, the haveLock variable takes care of that for you.\\*/\n'
+                                                                                 '  niDCPower_UnlockSession(vi, &haveLock;);\n'
+                                                                                 '  return error;\n'
+                                                                                 '| }\n',
+                                                                  'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                             'name': 'callerHasLock',
+                                             'type': 'ViBoolean'}],
+                       'returns': 'ViStatus'},
+    'Measure': {   'blocking': True,
+                   'codegen_method': 'public',
+                   'documentation': {   'description': '\n'
+                                                       'Returns the measured value of either the voltage or current on the\n'
+                                                       'specified output channel. Each call to this function blocks other\n'
+                                                       'function calls until the hardware returns the **measurement**. To\n'
+                                                       'measure multiple output channels, use the niDCPower_MeasureMultiple\n'
+                                                       'function.\n',
+                                        'note': [   '\n'
+                                                    'This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same '
+                                                    'session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the '
+                                                    "Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.\n"]},
+                   'has_repeated_capability': True,
+                   'invalidates_attribute_cache': False,
+                   'is_error_handling': False,
+                   'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                   'name': 'Measure',
+                   'parameters': [   {   'ctypes_type': 'ViSession',
+                                         'ctypes_type_library_call': 'ViSession',
+                                         'ctypes_variable_name': 'vi_ctype',
+                                         'direction': 'in',
+                                         'documentation': {'description': '\nIdentifies a particular instrument session. **vi** is obtained from the\nniDCPower_InitializeWithChannels function.\n'},
+                                         'enum': None,
+                                         'is_buffer': False,
+                                         'is_repeated_capability': False,
+                                         'is_session_handle': True,
+                                         'is_string': False,
+                                         'library_method_call_snippet': 'vi_ctype',
+                                         'name': 'vi',
+                                         'numpy': False,
+                                         'numpy_into_return': False,
+                                         'python_name': 'vi',
+                                         'python_name_or_default_for_init': 'vi',
+                                         'python_name_with_default': 'vi',
+                                         'python_name_with_doc_default': 'vi',
+                                         'python_type': 'int',
+                                         'size': {'mechanism': 'fixed', 'value': 1},
+                                         'type': 'ViSession',
+                                         'use_array': False,
+                                         'use_in_python_api': True,
+                                         'use_list': False},
+                                     {   'ctypes_type': 'ViChar[]',
+                                         'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                         'ctypes_variable_name': 'channel_name_ctype',
+                                         'direction': 'in',
+                                         'documentation': {   'description': '\n'
+                                                                             'Specifies the output channel to measure. Only one measurement at a time\n'
+                                                                             'may be made with the niDCPower_Measure function. Use the\n'
+                                                                             'niDCPower_MeasureMultiple function to measure multiple channels.\n'},
+                                         'enum': None,
+                                         'is_buffer': False,
+                                         'is_repeated_capability': True,
+                                         'is_session_handle': False,
+                                         'is_string': True,
+                                         'library_method_call_snippet': 'channel_name_ctype',
+                                         'name': 'channelName',
+                                         'numpy': False,
+                                         'numpy_into_return': False,
+                                         'python_name': 'channel_name',
+                                         'python_name_or_default_for_init': 'channel_name',
+                                         'python_name_with_default': 'channel_name',
+                                         'python_name_with_doc_default': 'channel_name',
+                                         'python_type': 'str',
+                                         'size': {'mechanism': 'fixed', 'value': 1},
+                                         'type': 'ViChar[]',
+                                         'use_array': False,
+                                         'use_in_python_api': True,
+                                         'use_list': False},
+                                     {   'ctypes_type': 'ViInt32',
+                                         'ctypes_type_library_call': 'ViInt32',
+                                         'ctypes_variable_name': 'measurement_type_ctype',
+                                         'direction': 'in',
+                                         'documentation': {   'description': '\nSpecifies whether a voltage or current value is measured.\n**Defined Values**:\n',
+                                                              'table_body': [   ['NIDCPOWER_VAL_MEASURE_VOLTAGE (1)', 'The device measures voltage.'],
+                                                                                ['NIDCPOWER_VAL_MEASURE_CURRENT (0)', 'The device measures current.']]},
+                                         'enum': 'MeasurementTypes',
+                                         'is_buffer': False,
+                                         'is_repeated_capability': False,
+                                         'is_session_handle': False,
+                                         'is_string': False,
+                                         'library_method_call_snippet': 'measurement_type_ctype',
+                                         'name': 'measurementType',
+                                         'numpy': False,
+                                         'numpy_into_return': False,
+                                         'python_name': 'measurement_type',
+                                         'python_name_or_default_for_init': 'measurement_type',
+                                         'python_name_with_default': 'measurement_type',
+                                         'python_name_with_doc_default': 'measurement_type',
+                                         'python_type': 'enums.MeasurementTypes',
+                                         'size': {'mechanism': 'fixed', 'value': 1},
+                                         'type': 'ViInt32',
+                                         'use_array': False,
+                                         'use_in_python_api': True,
+                                         'use_list': False},
+                                     {   'ctypes_type': 'ViReal64',
+                                         'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                         'ctypes_variable_name': 'measurement_ctype',
+                                         'direction': 'out',
+                                         'documentation': {'description': '\nReturns the value of the measurement, either in volts for voltage or\namps for current.\n'},
+                                         'enum': None,
+                                         'is_buffer': False,
+                                         'is_repeated_capability': False,
+                                         'is_session_handle': False,
+                                         'is_string': False,
+                                         'library_method_call_snippet': 'None if measurement_ctype is None else (ctypes.pointer(measurement_ctype))',
+                                         'name': 'Measurement',
+                                         'numpy': False,
+                                         'numpy_into_return': False,
+                                         'python_name': 'measurement',
+                                         'python_name_or_default_for_init': 'measurement',
+                                         'python_name_with_default': 'measurement',
+                                         'python_name_with_doc_default': 'measurement',
+                                         'python_type': 'float',
+                                         'size': {'mechanism': 'fixed', 'value': 1},
+                                         'type': 'ViReal64',
+                                         'use_array': False,
+                                         'use_in_python_api': True,
+                                         'use_list': False}],
+                   'python_code_variables': [],
+                   'python_name': 'measure',
+                   'render_in_library': True,
+                   'render_in_session_base': True,
+                   'returns': 'ViStatus'},
+    'MeasureMultiple': {   'blocking': True,
+                           'codegen_method': 'public',
+                           'documentation': {   'description': '\n'
+                                                               'Returns arrays of the measured voltage and current values on the\n'
+                                                               'specified output channel(s). Each call to this function blocks other\n'
+                                                               'function calls until the measurements are returned from the device. The\n'
+                                                               'order of the measurements returned in the array corresponds to the order\n'
+                                                               'on the specified output channel(s).\n',
+                                                'note': [   '\n'
+                                                            'This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the '
+                                                            'same session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through '
+                                                            "the Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.\n"]},
+                           'has_repeated_capability': True,
+                           'invalidates_attribute_cache': False,
+                           'is_error_handling': False,
+                           'method_templates': [   {'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'},
+                                                   {'documentation_filename': '/numpy_method', 'method_python_name_suffix': '_into', 'session_filename': '/numpy_read_method'}],
+                           'name': 'MeasureMultiple',
+                           'parameters': [   {   'ctypes_type': 'ViSession',
+                                                 'ctypes_type_library_call': 'ViSession',
+                                                 'ctypes_variable_name': 'vi_ctype',
+                                                 'direction': 'in',
+                                                 'documentation': {   'description': '\n'
+                                                                                     'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                     'niDCPower_InitializeWithChannels function.\n'},
+                                                 'enum': None,
+                                                 'is_buffer': False,
+                                                 'is_repeated_capability': False,
+                                                 'is_session_handle': True,
+                                                 'is_string': False,
+                                                 'library_method_call_snippet': 'vi_ctype',
+                                                 'name': 'vi',
+                                                 'numpy': False,
+                                                 'numpy_into_return': False,
+                                                 'python_name': 'vi',
+                                                 'python_name_or_default_for_init': 'vi',
+                                                 'python_name_with_default': 'vi',
+                                                 'python_name_with_doc_default': 'vi',
+                                                 'python_type': 'int',
+                                                 'size': {'mechanism': 'fixed', 'value': 1},
+                                                 'type': 'ViSession',
+                                                 'use_array': False,
+                                                 'use_in_python_api': True,
+                                                 'use_list': False},
+                                             {   'ctypes_type': 'ViChar[]',
+                                                 'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                 'ctypes_variable_name': 'channel_name_ctype',
+                                                 'direction': 'in',
+                                                 'documentation': {   'description': '\n'
+                                                                                     'Specifies the output channels to measure. You can specify multiple\n'
+                                                                                     'channels by using a channel list or a channel range. A channel list is a\n'
+                                                                                     'comma (,) separated sequence of channel names (e.g. 0,2 specifies\n'
+                                                                                     'channels 0 and 2). A channel range is a lower bound channel followed by\n'
+                                                                                     'a hyphen (-) or colon (:) followed by an upper bound channel (e.g. 0-2\n'
+                                                                                     'specifies channels 0, 1, and 2). If you do not specify a channel name,\n'
+                                                                                     'the function uses all channels in the session.\n'},
+                                                 'enum': None,
+                                                 'is_buffer': False,
+                                                 'is_repeated_capability': True,
+                                                 'is_session_handle': False,
+                                                 'is_string': True,
+                                                 'library_method_call_snippet': 'channel_name_ctype',
+                                                 'name': 'channelName',
+                                                 'numpy': False,
+                                                 'numpy_into_return': False,
+                                                 'python_name': 'channel_name',
+                                                 'python_name_or_default_for_init': 'channel_name',
+                                                 'python_name_with_default': 'channel_name',
+                                                 'python_name_with_doc_default': 'channel_name',
+                                                 'python_type': 'str',
+                                                 'size': {'mechanism': 'fixed', 'value': 1},
+                                                 'type': 'ViChar[]',
+                                                 'use_array': False,
+                                                 'use_in_python_api': True,
+                                                 'use_list': False},
+                                             {   'ctypes_type': 'ViReal64',
+                                                 'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                                 'ctypes_variable_name': 'voltage_measurements_ctype',
+                                                 'direction': 'out',
+                                                 'documentation': {   'description': '\n'
+                                                                                     'Returns an array of voltage measurements. The measurements in the array\n'
+                                                                                     'are returned in the same order as the channels specified in\n'
+                                                                                     '**channelName**. Ensure that sufficient space has been allocated for the\n'
+                                                                                     'returned array.\n'},
+                                                 'enum': None,
+                                                 'is_buffer': True,
+                                                 'is_repeated_capability': False,
+                                                 'is_session_handle': False,
+                                                 'is_string': False,
+                                                 'library_method_call_snippet': 'voltage_measurements_ctype',
+                                                 'name': 'voltageMeasurements',
+                                                 'numpy': True,
+                                                 'numpy_into_return': False,
+                                                 'numpy_type': 'float64',
+                                                 'original_type': 'ViReal64[]',
+                                                 'python_name': 'voltage_measurements',
+                                                 'python_name_or_default_for_init': 'voltage_measurements',
+                                                 'python_name_with_default': 'voltage_measurements',
+                                                 'python_name_with_doc_default': 'voltage_measurements',
+                                                 'python_type': 'float',
+                                                 'size': {'mechanism': 'python-code', 'value': 'channel_count'},
+                                                 'type': 'ViReal64',
+                                                 'use_array': False,
+                                                 'use_in_python_api': True,
+                                                 'use_list': True},
+                                             {   'ctypes_type': 'ViReal64',
+                                                 'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                                 'ctypes_variable_name': 'current_measurements_ctype',
+                                                 'direction': 'out',
+                                                 'documentation': {   'description': '\n'
+                                                                                     'Returns an array of current measurements. The measurements in the array\n'
+                                                                                     'are returned in the same order as the channels specified in\n'
+                                                                                     '**channelName**. Ensure that sufficient space has been allocated for the\n'
+                                                                                     'returned array.\n'},
+                                                 'enum': None,
+                                                 'is_buffer': True,
+                                                 'is_repeated_capability': False,
+                                                 'is_session_handle': False,
+                                                 'is_string': False,
+                                                 'library_method_call_snippet': 'current_measurements_ctype',
+                                                 'name': 'currentMeasurements',
+                                                 'numpy': True,
+                                                 'numpy_into_return': False,
+                                                 'numpy_type': 'float64',
+                                                 'original_type': 'ViReal64[]',
+                                                 'python_name': 'current_measurements',
+                                                 'python_name_or_default_for_init': 'current_measurements',
+                                                 'python_name_with_default': 'current_measurements',
+                                                 'python_name_with_doc_default': 'current_measurements',
+                                                 'python_type': 'float',
+                                                 'size': {'mechanism': 'python-code', 'value': 'channel_count'},
+                                                 'type': 'ViReal64',
+                                                 'use_array': False,
+                                                 'use_in_python_api': True,
+                                                 'use_list': True}],
+                           'python_code_variables': [('channel_count', 'self._parse_channel_count_memoized()')],
+                           'python_name': 'measure_multiple',
+                           'render_in_library': True,
+                           'render_in_session_base': True,
+                           'returns': 'ViStatus'},
+    'ParseChannelCount': {   'blocking': False,
+                             'codegen_method': 'private',
+                             'documentation': {'description': 'Returns the number of channels.'},
+                             'has_repeated_capability': True,
+                             'invalidates_attribute_cache': False,
+                             'is_error_handling': False,
+                             'method_templates': [   {'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'},
+                                                     {'method_python_name_suffix': '_memoized', 'session_filename': '/memoized_method'}],
+                             'name': 'ParseChannelCount',
+                             'parameters': [   {   'ctypes_type': 'ViSession',
+                                                   'ctypes_type_library_call': 'ViSession',
+                                                   'ctypes_variable_name': 'vi_ctype',
+                                                   'direction': 'in',
+                                                   'enum': None,
+                                                   'is_buffer': False,
+                                                   'is_repeated_capability': False,
+                                                   'is_session_handle': True,
+                                                   'is_string': False,
+                                                   'library_method_call_snippet': 'vi_ctype',
+                                                   'name': 'vi',
+                                                   'numpy': False,
+                                                   'numpy_into_return': False,
+                                                   'python_name': 'vi',
+                                                   'python_name_or_default_for_init': 'vi',
+                                                   'python_name_with_default': 'vi',
+                                                   'python_name_with_doc_default': 'vi',
+                                                   'python_type': 'int',
+                                                   'size': {'mechanism': 'fixed', 'value': 1},
+                                                   'type': 'ViSession',
+                                                   'use_array': False,
+                                                   'use_in_python_api': True,
+                                                   'use_list': False},
+                                               {   'ctypes_type': 'ViConstString',
+                                                   'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                   'ctypes_variable_name': 'channels_string_ctype',
+                                                   'direction': 'in',
+                                                   'enum': None,
+                                                   'is_buffer': False,
+                                                   'is_repeated_capability': True,
+                                                   'is_session_handle': False,
+                                                   'is_string': True,
+                                                   'library_method_call_snippet': 'channels_string_ctype',
+                                                   'name': 'channelsString',
+                                                   'numpy': False,
+                                                   'numpy_into_return': False,
+                                                   'python_name': 'channels_string',
+                                                   'python_name_or_default_for_init': 'channels_string',
+                                                   'python_name_with_default': 'channels_string',
+                                                   'python_name_with_doc_default': 'channels_string',
+                                                   'python_type': 'str',
+                                                   'size': {'mechanism': 'fixed', 'value': 1},
+                                                   'type': 'ViConstString',
+                                                   'use_array': False,
+                                                   'use_in_python_api': True,
+                                                   'use_list': False},
+                                               {   'ctypes_type': 'ViUInt32',
+                                                   'ctypes_type_library_call': 'ctypes.POINTER(ViUInt32)',
+                                                   'ctypes_variable_name': 'number_of_channels_ctype',
+                                                   'direction': 'out',
+                                                   'enum': None,
+                                                   'is_buffer': False,
+                                                   'is_repeated_capability': False,
+                                                   'is_session_handle': False,
+                                                   'is_string': False,
+                                                   'library_method_call_snippet': 'None if number_of_channels_ctype is None else (ctypes.pointer(number_of_channels_ctype))',
+                                                   'name': 'numberOfChannels',
+                                                   'numpy': False,
+                                                   'numpy_into_return': False,
+                                                   'python_name': 'number_of_channels',
+                                                   'python_name_or_default_for_init': 'number_of_channels',
+                                                   'python_name_with_default': 'number_of_channels',
+                                                   'python_name_with_doc_default': 'number_of_channels',
+                                                   'python_type': 'int',
+                                                   'size': {'mechanism': 'fixed', 'value': 1},
+                                                   'type': 'ViUInt32',
+                                                   'use_array': False,
+                                                   'use_in_python_api': True,
+                                                   'use_list': False}],
+                             'python_code_variables': [],
+                             'python_name': '_parse_channel_count',
+                             'render_in_library': True,
+                             'render_in_session_base': True,
+                             'returns': 'ViStatus'},
+    'QueryInCompliance': {   'blocking': False,
+                             'codegen_method': 'public',
+                             'documentation': {   'description': '\n'
+                                                                 'Queries the specified output device to determine if it is operating at\n'
+                                                                 'the `compliance <REPLACE_DRIVER_SPECIFIC_URL_2(compliance)>`__ limit.\n'
+                                                                 '\n'
+                                                                 'The compliance limit is the current limit when the output function is\n'
+                                                                 'set to NIDCPOWER_VAL_DC_VOLTAGE. If the output is operating at the\n'
+                                                                 'compliance limit, the output reaches the current limit before the\n'
+                                                                 'desired voltage level. Refer to the niDCPower_ConfigureOutputFunction\n'
+                                                                 'function and the niDCPower_ConfigureCurrentLimit function for more\n'
+                                                                 'information about output function and current limit, respectively.\n'
+                                                                 '\n'
+                                                                 'The compliance limit is the voltage limit when the output function is\n'
+                                                                 'set to NIDCPOWER_VAL_DC_CURRENT. If the output is operating at the\n'
+                                                                 'compliance limit, the output reaches the voltage limit before the\n'
+                                                                 'desired current level. Refer to the niDCPower_ConfigureOutputFunction\n'
+                                                                 'function and the niDCPower_ConfigureVoltageLimit function for more\n'
+                                                                 'information about output function and voltage limit, respectively.\n'
+                                                                 '\n'
+                                                                 '**Related Topics:**\n'
+                                                                 '\n'
+                                                                 '`Compliance <REPLACE_DRIVER_SPECIFIC_URL_1(compliance)>`__\n',
+                                                  'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                             'has_repeated_capability': True,
+                             'invalidates_attribute_cache': False,
+                             'is_error_handling': False,
+                             'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                             'name': 'QueryInCompliance',
+                             'parameters': [   {   'ctypes_type': 'ViSession',
+                                                   'ctypes_type_library_call': 'ViSession',
+                                                   'ctypes_variable_name': 'vi_ctype',
+                                                   'direction': 'in',
+                                                   'documentation': {   'description': '\n'
+                                                                                       'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                       'niDCPower_InitializeWithChannels function.\n'},
+                                                   'enum': None,
+                                                   'is_buffer': False,
+                                                   'is_repeated_capability': False,
+                                                   'is_session_handle': True,
+                                                   'is_string': False,
+                                                   'library_method_call_snippet': 'vi_ctype',
+                                                   'name': 'vi',
+                                                   'numpy': False,
+                                                   'numpy_into_return': False,
+                                                   'python_name': 'vi',
+                                                   'python_name_or_default_for_init': 'vi',
+                                                   'python_name_with_default': 'vi',
+                                                   'python_name_with_doc_default': 'vi',
+                                                   'python_type': 'int',
+                                                   'size': {'mechanism': 'fixed', 'value': 1},
+                                                   'type': 'ViSession',
+                                                   'use_array': False,
+                                                   'use_in_python_api': True,
+                                                   'use_list': False},
+                                               {   'ctypes_type': 'ViChar[]',
+                                                   'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                   'ctypes_variable_name': 'channel_name_ctype',
+                                                   'direction': 'in',
+                                                   'documentation': {'description': '\nSpecifies the output channel to query. Compliance status can only be\nqueried for one channel at a time.\n'},
+                                                   'enum': None,
+                                                   'is_buffer': False,
+                                                   'is_repeated_capability': True,
+                                                   'is_session_handle': False,
+                                                   'is_string': True,
+                                                   'library_method_call_snippet': 'channel_name_ctype',
+                                                   'name': 'channelName',
+                                                   'numpy': False,
+                                                   'numpy_into_return': False,
+                                                   'python_name': 'channel_name',
+                                                   'python_name_or_default_for_init': 'channel_name',
+                                                   'python_name_with_default': 'channel_name',
+                                                   'python_name_with_doc_default': 'channel_name',
+                                                   'python_type': 'str',
+                                                   'size': {'mechanism': 'fixed', 'value': 1},
+                                                   'type': 'ViChar[]',
+                                                   'use_array': False,
+                                                   'use_in_python_api': True,
+                                                   'use_list': False},
+                                               {   'ctypes_type': 'ViBoolean',
+                                                   'ctypes_type_library_call': 'ctypes.POINTER(ViBoolean)',
+                                                   'ctypes_variable_name': 'in_compliance_ctype',
+                                                   'direction': 'out',
+                                                   'documentation': {'description': 'Returns whether the device output channel is in compliance.'},
+                                                   'enum': None,
+                                                   'is_buffer': False,
+                                                   'is_repeated_capability': False,
+                                                   'is_session_handle': False,
+                                                   'is_string': False,
+                                                   'library_method_call_snippet': 'None if in_compliance_ctype is None else (ctypes.pointer(in_compliance_ctype))',
+                                                   'name': 'inCompliance',
+                                                   'numpy': False,
+                                                   'numpy_into_return': False,
+                                                   'python_name': 'in_compliance',
+                                                   'python_name_or_default_for_init': 'in_compliance',
+                                                   'python_name_with_default': 'in_compliance',
+                                                   'python_name_with_doc_default': 'in_compliance',
+                                                   'python_type': 'bool',
+                                                   'size': {'mechanism': 'fixed', 'value': 1},
+                                                   'type': 'ViBoolean',
+                                                   'use_array': False,
+                                                   'use_in_python_api': True,
+                                                   'use_list': False}],
+                             'python_code_variables': [],
+                             'python_name': 'query_in_compliance',
+                             'render_in_library': True,
+                             'render_in_session_base': True,
+                             'returns': 'ViStatus'},
+    'QueryMaxCurrentLimit': {   'blocking': False,
+                                'codegen_method': 'public',
+                                'documentation': {'description': '\nQueries the maximum current limit on an output channel if the output\nchannel is set to the specified **voltageLevel**.\n'},
+                                'has_repeated_capability': True,
+                                'invalidates_attribute_cache': False,
+                                'is_error_handling': False,
+                                'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                'name': 'QueryMaxCurrentLimit',
+                                'parameters': [   {   'ctypes_type': 'ViSession',
+                                                      'ctypes_type_library_call': 'ViSession',
+                                                      'ctypes_variable_name': 'vi_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                          'niDCPower_InitializeWithChannels function.\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': True,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'vi_ctype',
+                                                      'name': 'vi',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'vi',
+                                                      'python_name_or_default_for_init': 'vi',
+                                                      'python_name_with_default': 'vi',
+                                                      'python_name_with_doc_default': 'vi',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViSession',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViChar[]',
+                                                      'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                      'ctypes_variable_name': 'channel_name_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Specifies the output channel to query. The maximum current limit may\n'
+                                                                                          'only be queried for one channel at a time.\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': True,
+                                                      'is_session_handle': False,
+                                                      'is_string': True,
+                                                      'library_method_call_snippet': 'channel_name_ctype',
+                                                      'name': 'channelName',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'channel_name',
+                                                      'python_name_or_default_for_init': 'channel_name',
+                                                      'python_name_with_default': 'channel_name',
+                                                      'python_name_with_doc_default': 'channel_name',
+                                                      'python_type': 'str',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViChar[]',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViReal64',
+                                                      'ctypes_type_library_call': 'ViReal64',
+                                                      'ctypes_variable_name': 'voltage_level_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {'description': '\nSpecifies the voltage level to use when calculating the\n**maxCurrentLimit**.\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'voltage_level_ctype',
+                                                      'name': 'voltageLevel',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'voltage_level',
+                                                      'python_name_or_default_for_init': 'voltage_level',
+                                                      'python_name_with_default': 'voltage_level',
+                                                      'python_name_with_doc_default': 'voltage_level',
+                                                      'python_type': 'float',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViReal64',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViReal64',
+                                                      'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                                      'ctypes_variable_name': 'max_current_limit_ctype',
+                                                      'direction': 'out',
+                                                      'documentation': {'description': '\nReturns the maximum current limit that can be set with the specified\n**voltageLevel**.\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'None if max_current_limit_ctype is None else (ctypes.pointer(max_current_limit_ctype))',
+                                                      'name': 'maxCurrentLimit',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'max_current_limit',
+                                                      'python_name_or_default_for_init': 'max_current_limit',
+                                                      'python_name_with_default': 'max_current_limit',
+                                                      'python_name_with_doc_default': 'max_current_limit',
+                                                      'python_type': 'float',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViReal64',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False}],
+                                'python_code_variables': [],
+                                'python_name': 'query_max_current_limit',
+                                'render_in_library': True,
+                                'render_in_session_base': True,
+                                'returns': 'ViStatus'},
+    'QueryMaxVoltageLevel': {   'blocking': False,
+                                'codegen_method': 'public',
+                                'documentation': {'description': '\nQueries the maximum voltage level on an output channel if the output\nchannel is set to the specified **currentLimit**.\n'},
+                                'has_repeated_capability': True,
+                                'invalidates_attribute_cache': False,
+                                'is_error_handling': False,
+                                'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                'name': 'QueryMaxVoltageLevel',
+                                'parameters': [   {   'ctypes_type': 'ViSession',
+                                                      'ctypes_type_library_call': 'ViSession',
+                                                      'ctypes_variable_name': 'vi_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                          'niDCPower_InitializeWithChannels function.\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': True,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'vi_ctype',
+                                                      'name': 'vi',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'vi',
+                                                      'python_name_or_default_for_init': 'vi',
+                                                      'python_name_with_default': 'vi',
+                                                      'python_name_with_doc_default': 'vi',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViSession',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViChar[]',
+                                                      'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                      'ctypes_variable_name': 'channel_name_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Specifies the output channel to query. The maximum voltage level may\n'
+                                                                                          'only be queried for one channel at a time.\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': True,
+                                                      'is_session_handle': False,
+                                                      'is_string': True,
+                                                      'library_method_call_snippet': 'channel_name_ctype',
+                                                      'name': 'channelName',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'channel_name',
+                                                      'python_name_or_default_for_init': 'channel_name',
+                                                      'python_name_with_default': 'channel_name',
+                                                      'python_name_with_doc_default': 'channel_name',
+                                                      'python_type': 'str',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViChar[]',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViReal64',
+                                                      'ctypes_type_library_call': 'ViReal64',
+                                                      'ctypes_variable_name': 'current_limit_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {'description': '\nSpecifies the current limit to use when calculating the\n**maxVoltageLevel**.\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'current_limit_ctype',
+                                                      'name': 'currentLimit',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'current_limit',
+                                                      'python_name_or_default_for_init': 'current_limit',
+                                                      'python_name_with_default': 'current_limit',
+                                                      'python_name_with_doc_default': 'current_limit',
+                                                      'python_type': 'float',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViReal64',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViReal64',
+                                                      'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                                      'ctypes_variable_name': 'max_voltage_level_ctype',
+                                                      'direction': 'out',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Returns the maximum voltage level that can be set on an output channel\n'
+                                                                                          'with the specified **currentLimit**.\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'None if max_voltage_level_ctype is None else (ctypes.pointer(max_voltage_level_ctype))',
+                                                      'name': 'maxVoltageLevel',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'max_voltage_level',
+                                                      'python_name_or_default_for_init': 'max_voltage_level',
+                                                      'python_name_with_default': 'max_voltage_level',
+                                                      'python_name_with_doc_default': 'max_voltage_level',
+                                                      'python_type': 'float',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViReal64',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False}],
+                                'python_code_variables': [],
+                                'python_name': 'query_max_voltage_level',
+                                'render_in_library': True,
+                                'render_in_session_base': True,
+                                'returns': 'ViStatus'},
+    'QueryMinCurrentLimit': {   'blocking': False,
+                                'codegen_method': 'public',
+                                'documentation': {'description': '\nQueries the minimum current limit on an output channel if the output\nchannel is set to the specified **voltageLevel**.\n'},
+                                'has_repeated_capability': True,
+                                'invalidates_attribute_cache': False,
+                                'is_error_handling': False,
+                                'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                'name': 'QueryMinCurrentLimit',
+                                'parameters': [   {   'ctypes_type': 'ViSession',
+                                                      'ctypes_type_library_call': 'ViSession',
+                                                      'ctypes_variable_name': 'vi_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                          'niDCPower_InitializeWithChannels function.\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': True,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'vi_ctype',
+                                                      'name': 'vi',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'vi',
+                                                      'python_name_or_default_for_init': 'vi',
+                                                      'python_name_with_default': 'vi',
+                                                      'python_name_with_doc_default': 'vi',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViSession',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViChar[]',
+                                                      'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                      'ctypes_variable_name': 'channel_name_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Specifies the output channel to query. The minimum current limit may\n'
+                                                                                          'only be queried for one channel at a time.\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': True,
+                                                      'is_session_handle': False,
+                                                      'is_string': True,
+                                                      'library_method_call_snippet': 'channel_name_ctype',
+                                                      'name': 'channelName',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'channel_name',
+                                                      'python_name_or_default_for_init': 'channel_name',
+                                                      'python_name_with_default': 'channel_name',
+                                                      'python_name_with_doc_default': 'channel_name',
+                                                      'python_type': 'str',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViChar[]',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViReal64',
+                                                      'ctypes_type_library_call': 'ViReal64',
+                                                      'ctypes_variable_name': 'voltage_level_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {'description': '\nSpecifies the voltage level to use when calculating the\n**minCurrentLimit**.\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'voltage_level_ctype',
+                                                      'name': 'voltageLevel',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'voltage_level',
+                                                      'python_name_or_default_for_init': 'voltage_level',
+                                                      'python_name_with_default': 'voltage_level',
+                                                      'python_name_with_doc_default': 'voltage_level',
+                                                      'python_type': 'float',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViReal64',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViReal64',
+                                                      'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                                      'ctypes_variable_name': 'min_current_limit_ctype',
+                                                      'direction': 'out',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Returns the minimum current limit that can be set on an output channel\n'
+                                                                                          'with the specified **voltageLevel**.\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'None if min_current_limit_ctype is None else (ctypes.pointer(min_current_limit_ctype))',
+                                                      'name': 'minCurrentLimit',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'min_current_limit',
+                                                      'python_name_or_default_for_init': 'min_current_limit',
+                                                      'python_name_with_default': 'min_current_limit',
+                                                      'python_name_with_doc_default': 'min_current_limit',
+                                                      'python_type': 'float',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViReal64',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False}],
+                                'python_code_variables': [],
+                                'python_name': 'query_min_current_limit',
+                                'render_in_library': True,
+                                'render_in_session_base': True,
+                                'returns': 'ViStatus'},
+    'QueryOutputState': {   'blocking': False,
+                            'codegen_method': 'public',
+                            'documentation': {   'description': '\n'
+                                                                'Queries the specified output channel to determine if the output channel\n'
+                                                                'is currently in the state specified by **outputState**.\n'
+                                                                '\n'
+                                                                '**Related Topics:**\n'
+                                                                '\n'
+                                                                '`Compliance <REPLACE_DRIVER_SPECIFIC_URL_1(compliance)>`__\n'},
+                            'has_repeated_capability': True,
+                            'invalidates_attribute_cache': False,
+                            'is_error_handling': False,
+                            'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                            'name': 'QueryOutputState',
+                            'parameters': [   {   'ctypes_type': 'ViSession',
+                                                  'ctypes_type_library_call': 'ViSession',
+                                                  'ctypes_variable_name': 'vi_ctype',
+                                                  'direction': 'in',
+                                                  'documentation': {   'description': '\n'
+                                                                                      'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                      'niDCPower_InitializeWithChannels function.\n'},
+                                                  'enum': None,
+                                                  'is_buffer': False,
+                                                  'is_repeated_capability': False,
+                                                  'is_session_handle': True,
+                                                  'is_string': False,
+                                                  'library_method_call_snippet': 'vi_ctype',
+                                                  'name': 'vi',
+                                                  'numpy': False,
+                                                  'numpy_into_return': False,
+                                                  'python_name': 'vi',
+                                                  'python_name_or_default_for_init': 'vi',
+                                                  'python_name_with_default': 'vi',
+                                                  'python_name_with_doc_default': 'vi',
+                                                  'python_type': 'int',
+                                                  'size': {'mechanism': 'fixed', 'value': 1},
+                                                  'type': 'ViSession',
+                                                  'use_array': False,
+                                                  'use_in_python_api': True,
+                                                  'use_list': False},
+                                              {   'ctypes_type': 'ViChar[]',
+                                                  'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                  'ctypes_variable_name': 'channel_name_ctype',
+                                                  'direction': 'in',
+                                                  'documentation': {'description': '\nSpecifies the output channel to query. The output state may only be\nqueried for one channel at a time.\n'},
+                                                  'enum': None,
+                                                  'is_buffer': False,
+                                                  'is_repeated_capability': True,
+                                                  'is_session_handle': False,
+                                                  'is_string': True,
+                                                  'library_method_call_snippet': 'channel_name_ctype',
+                                                  'name': 'channelName',
+                                                  'numpy': False,
+                                                  'numpy_into_return': False,
+                                                  'python_name': 'channel_name',
+                                                  'python_name_or_default_for_init': 'channel_name',
+                                                  'python_name_with_default': 'channel_name',
+                                                  'python_name_with_doc_default': 'channel_name',
+                                                  'python_type': 'str',
+                                                  'size': {'mechanism': 'fixed', 'value': 1},
+                                                  'type': 'ViChar[]',
+                                                  'use_array': False,
+                                                  'use_in_python_api': True,
+                                                  'use_list': False},
+                                              {   'ctypes_type': 'ViInt32',
+                                                  'ctypes_type_library_call': 'ViInt32',
+                                                  'ctypes_variable_name': 'output_state_ctype',
+                                                  'direction': 'in',
+                                                  'documentation': {   'description': '\nSpecifies the output state of the output channel that is being queried.\n**Defined Values**:\n',
+                                                                       'table_body': [   [   'NIDCPOWER_VAL_OUTPUT_CONSTANT_VOLTAGE (0)',
+                                                                                             'The device maintains a constant voltage by adjusting the current.'],
+                                                                                         [   'NIDCPOWER_VAL_OUTPUT_CONSTANT_CURRENT (1)',
+                                                                                             'The device maintains a constant current by adjusting the voltage.']]},
+                                                  'enum': 'OutputStates',
+                                                  'is_buffer': False,
+                                                  'is_repeated_capability': False,
+                                                  'is_session_handle': False,
+                                                  'is_string': False,
+                                                  'library_method_call_snippet': 'output_state_ctype',
+                                                  'name': 'outputState',
+                                                  'numpy': False,
+                                                  'numpy_into_return': False,
+                                                  'python_name': 'output_state',
+                                                  'python_name_or_default_for_init': 'output_state',
+                                                  'python_name_with_default': 'output_state',
+                                                  'python_name_with_doc_default': 'output_state',
+                                                  'python_type': 'enums.OutputStates',
+                                                  'size': {'mechanism': 'fixed', 'value': 1},
+                                                  'type': 'ViInt32',
+                                                  'use_array': False,
+                                                  'use_in_python_api': True,
+                                                  'use_list': False},
+                                              {   'ctypes_type': 'ViBoolean',
+                                                  'ctypes_type_library_call': 'ctypes.POINTER(ViBoolean)',
+                                                  'ctypes_variable_name': 'in_state_ctype',
+                                                  'direction': 'out',
+                                                  'documentation': {'description': '\nReturns whether the device output channel is in the specified output\nstate.\n'},
+                                                  'enum': None,
+                                                  'is_buffer': False,
+                                                  'is_repeated_capability': False,
+                                                  'is_session_handle': False,
+                                                  'is_string': False,
+                                                  'library_method_call_snippet': 'None if in_state_ctype is None else (ctypes.pointer(in_state_ctype))',
+                                                  'name': 'inState',
+                                                  'numpy': False,
+                                                  'numpy_into_return': False,
+                                                  'python_name': 'in_state',
+                                                  'python_name_or_default_for_init': 'in_state',
+                                                  'python_name_with_default': 'in_state',
+                                                  'python_name_with_doc_default': 'in_state',
+                                                  'python_type': 'bool',
+                                                  'size': {'mechanism': 'fixed', 'value': 1},
+                                                  'type': 'ViBoolean',
+                                                  'use_array': False,
+                                                  'use_in_python_api': True,
+                                                  'use_list': False}],
+                            'python_code_variables': [],
+                            'python_name': 'query_output_state',
+                            'render_in_library': True,
+                            'render_in_session_base': True,
+                            'returns': 'ViStatus'},
+    'ReadCurrentTemperature': {   'blocking': False,
+                                  'codegen_method': 'public',
+                                  'documentation': {'description': '\nReturns the current onboard **temperature**, in degrees Celsius, of the\ndevice.\n'},
+                                  'has_repeated_capability': False,
+                                  'invalidates_attribute_cache': False,
+                                  'is_error_handling': False,
+                                  'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                  'name': 'ReadCurrentTemperature',
+                                  'parameters': [   {   'ctypes_type': 'ViSession',
+                                                        'ctypes_type_library_call': 'ViSession',
+                                                        'ctypes_variable_name': 'vi_ctype',
+                                                        'direction': 'in',
+                                                        'documentation': {   'description': '\n'
+                                                                                            'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                            'niDCPower_InitExtCal or niDCPower_InitializeWithChannels function.\n',
+                                                                             'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                        'enum': None,
+                                                        'is_buffer': False,
+                                                        'is_repeated_capability': False,
+                                                        'is_session_handle': True,
+                                                        'is_string': False,
+                                                        'library_method_call_snippet': 'vi_ctype',
+                                                        'name': 'vi',
+                                                        'numpy': False,
+                                                        'numpy_into_return': False,
+                                                        'python_name': 'vi',
+                                                        'python_name_or_default_for_init': 'vi',
+                                                        'python_name_with_default': 'vi',
+                                                        'python_name_with_doc_default': 'vi',
+                                                        'python_type': 'int',
+                                                        'size': {'mechanism': 'fixed', 'value': 1},
+                                                        'type': 'ViSession',
+                                                        'use_array': False,
+                                                        'use_in_python_api': True,
+                                                        'use_list': False},
+                                                    {   'ctypes_type': 'ViReal64',
+                                                        'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                                        'ctypes_variable_name': 'temperature_ctype',
+                                                        'direction': 'out',
+                                                        'documentation': {'description': 'Returns the onboard **temperature**, in degrees Celsius, of the device.'},
+                                                        'enum': None,
+                                                        'is_buffer': False,
+                                                        'is_repeated_capability': False,
+                                                        'is_session_handle': False,
+                                                        'is_string': False,
+                                                        'library_method_call_snippet': 'None if temperature_ctype is None else (ctypes.pointer(temperature_ctype))',
+                                                        'name': 'Temperature',
+                                                        'numpy': False,
+                                                        'numpy_into_return': False,
+                                                        'python_name': 'temperature',
+                                                        'python_name_or_default_for_init': 'temperature',
+                                                        'python_name_with_default': 'temperature',
+                                                        'python_name_with_doc_default': 'temperature',
+                                                        'python_type': 'float',
+                                                        'size': {'mechanism': 'fixed', 'value': 1},
+                                                        'type': 'ViReal64',
+                                                        'use_array': False,
+                                                        'use_in_python_api': True,
+                                                        'use_list': False}],
+                                  'python_code_variables': [],
+                                  'python_name': 'read_current_temperature',
+                                  'render_in_library': True,
+                                  'render_in_session_base': False,
+                                  'returns': 'ViStatus'},
+    'ResetDevice': {   'blocking': False,
+                       'codegen_method': 'public',
+                       'documentation': {   'description': '\n'
+                                                           'Resets the device to a known state. The function disables power\n'
+                                                           'generation, resets session attributes to their default values, clears\n'
+                                                           'errors such as overtemperature and unexpected loss of auxiliary power,\n'
+                                                           'commits the session attributes, and leaves the session in the\n'
+                                                           'Uncommitted state. This function also performs a hard reset on the\n'
+                                                           'device and driver software. This function has the same functionality as\n'
+                                                           'using reset in Measurement & Automation Explorer. Refer to the\n'
+                                                           '`Programming\n'
+                                                           'States <REPLACE_DRIVER_SPECIFIC_URL_1(programmingstates)>`__ topic for\n'
+                                                           'more information about NI-DCPower software states.\n'
+                                                           '\n'
+                                                           'This will also open the output relay on devices that have an output\n'
+                                                           'relay.\n'},
+                       'has_repeated_capability': False,
+                       'invalidates_attribute_cache': True,
+                       'is_error_handling': False,
+                       'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                       'name': 'ResetDevice',
+                       'parameters': [   {   'ctypes_type': 'ViSession',
+                                             'ctypes_type_library_call': 'ViSession',
+                                             'ctypes_variable_name': 'vi_ctype',
+                                             'direction': 'in',
+                                             'documentation': {   'description': '\n'
+                                                                                 'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                 'niDCPower_InitializeWithChannels function.\n'},
+                                             'enum': None,
+                                             'is_buffer': False,
+                                             'is_repeated_capability': False,
+                                             'is_session_handle': True,
+                                             'is_string': False,
+                                             'library_method_call_snippet': 'vi_ctype',
+                                             'name': 'vi',
+                                             'numpy': False,
+                                             'numpy_into_return': False,
+                                             'python_name': 'vi',
+                                             'python_name_or_default_for_init': 'vi',
+                                             'python_name_with_default': 'vi',
+                                             'python_name_with_doc_default': 'vi',
+                                             'python_type': 'int',
+                                             'size': {'mechanism': 'fixed', 'value': 1},
+                                             'type': 'ViSession',
+                                             'use_array': False,
+                                             'use_in_python_api': True,
+                                             'use_list': False}],
+                       'python_code_variables': [],
+                       'python_name': 'reset_device',
+                       'render_in_library': True,
+                       'render_in_session_base': False,
+                       'returns': 'ViStatus'},
+    'ResetInterchangeCheck': {   'codegen_method': 'no',
+                                 'documentation': {   'description': '\n'
+                                                                     'When developing a complex test system that consists of multiple test\n'
+                                                                     'modules, it is generally a good idea to design the test modules so that\n'
+                                                                     'they can run in any order. To do so requires ensuring that each test\n'
+                                                                     'module completely configures the state of each instrument it uses. If a\n'
+                                                                     'particular test module does not completely configure the state of an\n'
+                                                                     'instrument, the state of the instrument depends on the configuration\n'
+                                                                     'from a previously executed test module. If you execute the test modules\n'
+                                                                     'in a different order, the behavior of the instrument and therefore the\n'
+                                                                     'entire test module is likely to change. This change in behavior is\n'
+                                                                     'generally instrument specific and represents an interchangeability\n'
+                                                                     'problem.\n'
+                                                                     '\n'
+                                                                     'You can use this function to test for such cases. After you call this\n'
+                                                                     'function, the interchangeability checking algorithms in the specific\n'
+                                                                     'driver ignore all previous configuration operations. By calling this\n'
+                                                                     'function at the beginning of a test module, you can determine whether\n'
+                                                                     'the test module has dependencies on the operation of previously executed\n'
+                                                                     'test modules.\n'
+                                                                     '\n'
+                                                                     'This function does not clear the interchangeability warnings from the\n'
+                                                                     'list of previously recorded interchangeability warnings. If you want to\n'
+                                                                     'guarantee that the niDCPower_GetNextInterchangeWarning function only\n'
+                                                                     'returns those interchangeability warnings that are generated after\n'
+                                                                     'calling this function, you must clear the list of interchangeability\n'
+                                                                     'warnings. You can clear the interchangeability warnings list by\n'
+                                                                     'repeatedly calling the niDCPower_GetNextInterchangeWarning function\n'
+                                                                     'until no more interchangeability warnings are returned. If you are not\n'
+                                                                     'interested in the content of those warnings, you can call the\n'
+                                                                     'niDCPower_ClearInterchangeWarnings function.\n',
+                                                      'note': [   '\nniDCPower_GetNextInterchangeWarning does not mark any attributes for\nan interchange check.\n',
+                                                                  '\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                 'parameters': [   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                           'niDCPower_InitializeWithChannels function.\n'},
+                                                       'name': 'vi',
+                                                       'type': 'ViSession'}],
+                                 'returns': 'ViStatus'},
+    'ResetWithDefaults': {   'blocking': False,
+                             'codegen_method': 'public',
+                             'documentation': {   'description': '\n'
+                                                                 'Resets the device to a known state. This function disables power\n'
+                                                                 'generation, resets session attributes to their default values, commits\n'
+                                                                 'the session attributes, and leaves the session in the\n'
+                                                                 "`Running <javascript:LaunchHelp('NI_DC_Power_Supplies_Help.chm::/programmingStates.html#running')>`__\n"
+                                                                 'state. In addition to exhibiting the behavior of the niDCPower_reset\n'
+                                                                 'function, this function can assign user-defined default values for\n'
+                                                                 'configurable attributes from the IVI configuration.\n'},
+                             'has_repeated_capability': False,
+                             'invalidates_attribute_cache': True,
+                             'is_error_handling': False,
+                             'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                             'name': 'ResetWithDefaults',
+                             'parameters': [   {   'ctypes_type': 'ViSession',
+                                                   'ctypes_type_library_call': 'ViSession',
+                                                   'ctypes_variable_name': 'vi_ctype',
+                                                   'direction': 'in',
+                                                   'documentation': {   'description': '\n'
+                                                                                       'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                       'niDCPower_InitializeWithChannels function.\n'},
+                                                   'enum': None,
+                                                   'is_buffer': False,
+                                                   'is_repeated_capability': False,
+                                                   'is_session_handle': True,
+                                                   'is_string': False,
+                                                   'library_method_call_snippet': 'vi_ctype',
+                                                   'name': 'vi',
+                                                   'numpy': False,
+                                                   'numpy_into_return': False,
+                                                   'python_name': 'vi',
+                                                   'python_name_or_default_for_init': 'vi',
+                                                   'python_name_with_default': 'vi',
+                                                   'python_name_with_doc_default': 'vi',
+                                                   'python_type': 'int',
+                                                   'size': {'mechanism': 'fixed', 'value': 1},
+                                                   'type': 'ViSession',
+                                                   'use_array': False,
+                                                   'use_in_python_api': True,
+                                                   'use_list': False}],
+                             'python_code_variables': [],
+                             'python_name': 'reset_with_defaults',
+                             'render_in_library': True,
+                             'render_in_session_base': False,
+                             'returns': 'ViStatus'},
+    'SendSoftwareEdgeTrigger': {   'blocking': False,
+                                   'codegen_method': 'public',
+                                   'documentation': {   'description': '\n'
+                                                                       'Asserts the specified trigger. This function can override an external\n'
+                                                                       'edge trigger.\n'
+                                                                       '\n'
+                                                                       '**Related Topics:**\n'
+                                                                       '\n'
+                                                                       '`Triggers <REPLACE_DRIVER_SPECIFIC_URL_1(trigger)>`__\n',
+                                                        'note': '\n'
+                                                                'This function is not supported on all devices. Refer to `Supported\n'
+                                                                'Functions by\n'
+                                                                "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                                'for more information about supported devices.\n'},
+                                   'has_repeated_capability': False,
+                                   'invalidates_attribute_cache': False,
+                                   'is_error_handling': False,
+                                   'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                   'name': 'SendSoftwareEdgeTrigger',
+                                   'parameters': [   {   'ctypes_type': 'ViSession',
+                                                         'ctypes_type_library_call': 'ViSession',
+                                                         'ctypes_variable_name': 'vi_ctype',
+                                                         'direction': 'in',
+                                                         'documentation': {   'description': '\n'
+                                                                                             'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                             'niDCPower_InitializeWithChannels function.\n'},
+                                                         'enum': None,
+                                                         'is_buffer': False,
+                                                         'is_repeated_capability': False,
+                                                         'is_session_handle': True,
+                                                         'is_string': False,
+                                                         'library_method_call_snippet': 'vi_ctype',
+                                                         'name': 'vi',
+                                                         'numpy': False,
+                                                         'numpy_into_return': False,
+                                                         'python_name': 'vi',
+                                                         'python_name_or_default_for_init': 'vi',
+                                                         'python_name_with_default': 'vi',
+                                                         'python_name_with_doc_default': 'vi',
+                                                         'python_type': 'int',
+                                                         'size': {'mechanism': 'fixed', 'value': 1},
+                                                         'type': 'ViSession',
+                                                         'use_array': False,
+                                                         'use_in_python_api': True,
+                                                         'use_list': False},
+                                                     {   'ctypes_type': 'ViInt32',
+                                                         'ctypes_type_library_call': 'ViInt32',
+                                                         'ctypes_variable_name': 'trigger_ctype',
+                                                         'default_value': 'SendSoftwareEdgeTriggerType.START',
+                                                         'direction': 'in',
+                                                         'documentation': {   'description': '\nSpecifies which trigger to assert.\n**Defined Values:**\n',
+                                                                              'table_body': [   ['NIDCPOWER_VAL_START_TRIGGER (1034)', 'Asserts the Start trigger.'],
+                                                                                                ['NIDCPOWER_VAL_SOURCE_TRIGGER (1035)', 'Asserts the Source trigger.'],
+                                                                                                ['NIDCPOWER_VAL_MEASURE_TRIGGER (1036)', 'Asserts the Measure trigger.'],
+                                                                                                ['NIDCPOWER_VAL_SEQUENCE_ADVANCE_TRIGGER (1037)', 'Asserts the Sequence Advance trigger.'],
+                                                                                                ['NIDCPOWER_VAL_PULSE_TRIGGER (1053', 'Asserts the Pulse trigger.']]},
+                                                         'enum': 'SendSoftwareEdgeTriggerType',
+                                                         'is_buffer': False,
+                                                         'is_repeated_capability': False,
+                                                         'is_session_handle': False,
+                                                         'is_string': False,
+                                                         'library_method_call_snippet': 'trigger_ctype',
+                                                         'name': 'Trigger',
+                                                         'numpy': False,
+                                                         'numpy_into_return': False,
+                                                         'python_name': 'trigger',
+                                                         'python_name_or_default_for_init': 'trigger',
+                                                         'python_name_with_default': 'trigger=enums.SendSoftwareEdgeTriggerType.START',
+                                                         'python_name_with_doc_default': 'trigger=nidcpower.SendSoftwareEdgeTriggerType.START',
+                                                         'python_type': 'enums.SendSoftwareEdgeTriggerType',
+                                                         'size': {'mechanism': 'fixed', 'value': 1},
+                                                         'type': 'ViInt32',
+                                                         'use_array': False,
+                                                         'use_in_python_api': True,
+                                                         'use_list': False}],
+                                   'python_code_variables': [],
+                                   'python_name': 'send_software_edge_trigger',
+                                   'render_in_library': True,
+                                   'render_in_session_base': False,
+                                   'returns': 'ViStatus'},
+    'SetAttributeViBoolean': {   'blocking': False,
+                                 'codegen_method': 'private',
+                                 'documentation': {   'description': '\n'
+                                                                     '| Sets the value of a ViBoolean attribute.\n'
+                                                                     '| This is a low-level function that you can use to set the values of\n'
+                                                                     '  device-specific attributes and inherent IVI attributes.\n'},
+                                 'has_repeated_capability': True,
+                                 'invalidates_attribute_cache': True,
+                                 'is_error_handling': False,
+                                 'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                 'name': 'SetAttributeViBoolean',
+                                 'parameters': [   {   'ctypes_type': 'ViSession',
+                                                       'ctypes_type_library_call': 'ViSession',
+                                                       'ctypes_variable_name': 'vi_ctype',
+                                                       'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                           'niDCPower_InitializeWithChannels function.\n'},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': True,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'vi_ctype',
+                                                       'name': 'vi',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'vi',
+                                                       'python_name_or_default_for_init': 'vi',
+                                                       'python_name_with_default': 'vi',
+                                                       'python_name_with_doc_default': 'vi',
+                                                       'python_type': 'int',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViSession',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False},
+                                                   {   'ctypes_type': 'ViChar[]',
+                                                       'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                       'ctypes_variable_name': 'channel_name_ctype',
+                                                       'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Specifies the output channel(s) to which this configuration value\n'
+                                                                                           'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                           'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                           '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                           'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                           'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                           'In the Running state, multiple output channel configurations are\n'
+                                                                                           'performed sequentially based on the order specified in this parameter.\n'},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': True,
+                                                       'is_session_handle': False,
+                                                       'is_string': True,
+                                                       'library_method_call_snippet': 'channel_name_ctype',
+                                                       'name': 'channelName',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'channel_name',
+                                                       'python_name_or_default_for_init': 'channel_name',
+                                                       'python_name_with_default': 'channel_name',
+                                                       'python_name_with_doc_default': 'channel_name',
+                                                       'python_type': 'str',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViChar[]',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False},
+                                                   {   'ctypes_type': 'ViAttr',
+                                                       'ctypes_type_library_call': 'ViAttr',
+                                                       'ctypes_variable_name': 'attribute_id_ctype',
+                                                       'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Specifies the ID of an attribute. From the function panel window, you\n'
+                                                                                           'can use this control as follows.\n'
+                                                                                           '\n'
+                                                                                           '-  In the function panel window, click on the control or press **Enter**\n'
+                                                                                           '   or the spacebar to display a dialog box containing hierarchical list\n'
+                                                                                           '   of the available attributes. Attributes whose value cannot be set are\n'
+                                                                                           '   dim. Help text is shown for each attribute. Select an attribute by\n'
+                                                                                           '   double-clicking on it or by selecting it and then pressing **Enter**.\n'
+                                                                                           '-  Read-only attributes appear dim in the list box. If you select a\n'
+                                                                                           '   read-only attribute, an error message appears. A ring control at the\n'
+                                                                                           '   top of the dialog box allows you to see all IVI attributes or only\n'
+                                                                                           '   the attributes of type ViBoolean. If you choose to see all IVI\n'
+                                                                                           '   attributes, the data types appear to the right of the attribute names\n'
+                                                                                           '   in the list box. Attributes with data types other than ViBoolean are\n'
+                                                                                           '   dim. If you select an attribute data type that is dim, LabWindows/CVI\n'
+                                                                                           '   transfers you to the function panel for the corresponding function\n'
+                                                                                           '   that is consistent with the data type.\n'
+                                                                                           '-  If you want to enter a variable name, press **Ctrl**\\ +\\ **T** to\n'
+                                                                                           '   change this ring control to a manual input box. If the attribute in\n'
+                                                                                           '   this ring control has named constants as valid values, you can view\n'
+                                                                                           '   the constants by moving to the value control and pressing **Enter**.\n'},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': False,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'attribute_id_ctype',
+                                                       'name': 'attributeId',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'attribute_id',
+                                                       'python_name_or_default_for_init': 'attribute_id',
+                                                       'python_name_with_default': 'attribute_id',
+                                                       'python_name_with_doc_default': 'attribute_id',
+                                                       'python_type': 'int',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViAttr',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False},
+                                                   {   'ctypes_type': 'ViBoolean',
+                                                       'ctypes_type_library_call': 'ViBoolean',
+                                                       'ctypes_variable_name': 'attribute_value_ctype',
+                                                       'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Specifies the value to which you want to set the attribute. If the\n'
+                                                                                           'attribute currently showing in the attribute ring control has constants\n'
+                                                                                           'as valid values, you can view a list of the constants by pressing\n'
+                                                                                           '**Enter** on this control. Select a value by double-clicking on it or by\n'
+                                                                                           'selecting it and then pressing **Enter**.\n',
+                                                                            'note': '\nSome of the values might not be valid depending upon the current\nsettings of the device session.\n'},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': False,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'attribute_value_ctype',
+                                                       'name': 'attributeValue',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'attribute_value',
+                                                       'python_name_or_default_for_init': 'attribute_value',
+                                                       'python_name_with_default': 'attribute_value',
+                                                       'python_name_with_doc_default': 'attribute_value',
+                                                       'python_type': 'bool',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViBoolean',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False}],
+                                 'python_code_variables': [],
+                                 'python_name': '_set_attribute_vi_boolean',
+                                 'render_in_library': True,
+                                 'render_in_session_base': True,
+                                 'returns': 'ViStatus'},
+    'SetAttributeViInt32': {   'blocking': False,
+                               'codegen_method': 'private',
+                               'documentation': {   'description': '\n'
+                                                                   '| Sets the value of a ViInt32 attribute.\n'
+                                                                   '| This is a low-level function that you can use to set the values of\n'
+                                                                   '  device-specific attributes and inherent IVI attributes.\n'},
+                               'has_repeated_capability': True,
+                               'invalidates_attribute_cache': True,
+                               'is_error_handling': False,
+                               'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                               'name': 'SetAttributeViInt32',
+                               'parameters': [   {   'ctypes_type': 'ViSession',
+                                                     'ctypes_type_library_call': 'ViSession',
+                                                     'ctypes_variable_name': 'vi_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                         'niDCPower_InitializeWithChannels function.\n'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': True,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'vi_ctype',
+                                                     'name': 'vi',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'vi',
+                                                     'python_name_or_default_for_init': 'vi',
+                                                     'python_name_with_default': 'vi',
+                                                     'python_name_with_doc_default': 'vi',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViSession',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViChar[]',
+                                                     'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                     'ctypes_variable_name': 'channel_name_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'Specifies the output channel(s) to which this configuration value\n'
+                                                                                         'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                         'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                         '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                         'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                         'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                         'In the Running state, multiple output channel configurations are\n'
+                                                                                         'performed sequentially based on the order specified in this parameter.\n'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': True,
+                                                     'is_session_handle': False,
+                                                     'is_string': True,
+                                                     'library_method_call_snippet': 'channel_name_ctype',
+                                                     'name': 'channelName',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'channel_name',
+                                                     'python_name_or_default_for_init': 'channel_name',
+                                                     'python_name_with_default': 'channel_name',
+                                                     'python_name_with_doc_default': 'channel_name',
+                                                     'python_type': 'str',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViChar[]',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViAttr',
+                                                     'ctypes_type_library_call': 'ViAttr',
+                                                     'ctypes_variable_name': 'attribute_id_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'Specifies the ID of an attribute. From the function panel window, you\n'
+                                                                                         'can use this control as follows.\n'
+                                                                                         '\n'
+                                                                                         '-  In the function panel window, click on the control or press **Enter**\n'
+                                                                                         '   or the spacebar to display a dialog box containing hierarchical list\n'
+                                                                                         '   of the available attributes. Attributes whose value cannot be set are\n'
+                                                                                         '   dim. Help text is shown for each attribute. Select an attribute by\n'
+                                                                                         '   double-clicking on it or by selecting it and then pressing **Enter**.\n'
+                                                                                         '-  Read-only attributes appear dim in the list box. If you select a\n'
+                                                                                         '   read-only attribute, an error message appears. A ring control at the\n'
+                                                                                         '   top of the dialog box allows you to see all IVI attributes or only\n'
+                                                                                         '   the attributes of type ViInt32. If you choose to see all IVI\n'
+                                                                                         '   attributes, the data types appear to the right of the attribute names\n'
+                                                                                         '   in the list box. Attributes with data types other than ViInt32 are\n'
+                                                                                         '   dim. If you select an attribute data type that is dim, LabWindows/CVI\n'
+                                                                                         '   transfers you to the function panel for the corresponding function\n'
+                                                                                         '   that is consistent with the data type.\n'
+                                                                                         '-  If you want to enter a variable name, press **Ctrl**\\ +\\ **T** to\n'
+                                                                                         '   change this ring control to a manual input box. If the attribute in\n'
+                                                                                         '   this ring control has named constants as valid values, you can view\n'
+                                                                                         '   the constants by moving to the value control and pressing **Enter**.\n'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'attribute_id_ctype',
+                                                     'name': 'attributeId',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'attribute_id',
+                                                     'python_name_or_default_for_init': 'attribute_id',
+                                                     'python_name_with_default': 'attribute_id',
+                                                     'python_name_with_doc_default': 'attribute_id',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViAttr',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViInt32',
+                                                     'ctypes_type_library_call': 'ViInt32',
+                                                     'ctypes_variable_name': 'attribute_value_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'Specifies the value to which you want to set the attribute. If the\n'
+                                                                                         'attribute currently showing in the attribute ring control has constants\n'
+                                                                                         'as valid values, you can view a list of the constants by pressing\n'
+                                                                                         '**Enter** on this control. Select a value by double-clicking on it or by\n'
+                                                                                         'selecting it and then pressing **Enter**.\n',
+                                                                          'note': '\nSome of the values might not be valid depending upon the current\nsettings of the device session.\n'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'attribute_value_ctype',
+                                                     'name': 'attributeValue',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'attribute_value',
+                                                     'python_name_or_default_for_init': 'attribute_value',
+                                                     'python_name_with_default': 'attribute_value',
+                                                     'python_name_with_doc_default': 'attribute_value',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViInt32',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False}],
+                               'python_code_variables': [],
+                               'python_name': '_set_attribute_vi_int32',
+                               'render_in_library': True,
+                               'render_in_session_base': True,
+                               'returns': 'ViStatus'},
+    'SetAttributeViInt64': {   'blocking': False,
+                               'codegen_method': 'private',
+                               'documentation': {   'description': '\n'
+                                                                   '| Sets the value of a ViInt64 attribute.\n'
+                                                                   '| This is a low-level function that you can use to set the values of\n'
+                                                                   '  device-specific attributes and inherent IVI attributes.\n'},
+                               'has_repeated_capability': True,
+                               'invalidates_attribute_cache': True,
+                               'is_error_handling': False,
+                               'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                               'name': 'SetAttributeViInt64',
+                               'parameters': [   {   'ctypes_type': 'ViSession',
+                                                     'ctypes_type_library_call': 'ViSession',
+                                                     'ctypes_variable_name': 'vi_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                         'niDCPower_InitializeWithChannels function.\n'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': True,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'vi_ctype',
+                                                     'name': 'vi',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'vi',
+                                                     'python_name_or_default_for_init': 'vi',
+                                                     'python_name_with_default': 'vi',
+                                                     'python_name_with_doc_default': 'vi',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViSession',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViChar[]',
+                                                     'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                     'ctypes_variable_name': 'channel_name_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'Specifies the output channel(s) to which this configuration value\n'
+                                                                                         'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                         'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                         '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                         'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                         'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                         'In the Running state, multiple output channel configurations are\n'
+                                                                                         'performed sequentially based on the order specified in this parameter.\n'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': True,
+                                                     'is_session_handle': False,
+                                                     'is_string': True,
+                                                     'library_method_call_snippet': 'channel_name_ctype',
+                                                     'name': 'channelName',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'channel_name',
+                                                     'python_name_or_default_for_init': 'channel_name',
+                                                     'python_name_with_default': 'channel_name',
+                                                     'python_name_with_doc_default': 'channel_name',
+                                                     'python_type': 'str',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViChar[]',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViAttr',
+                                                     'ctypes_type_library_call': 'ViAttr',
+                                                     'ctypes_variable_name': 'attribute_id_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'Specifies the ID of an attribute. From the function panel window, you\n'
+                                                                                         'can use this control as follows.\n'
+                                                                                         '\n'
+                                                                                         '-  In the function panel window, click on the control or press **Enter**\n'
+                                                                                         '   or the spacebar to display a dialog box containing hierarchical list\n'
+                                                                                         '   of the available attributes. Attributes whose value cannot be set are\n'
+                                                                                         '   dim. Help text is shown for each attribute. Select an attribute by\n'
+                                                                                         '   double-clicking on it or by selecting it and then pressing **Enter**.\n'
+                                                                                         '-  Read-only attributes appear dim in the list box. If you select a\n'
+                                                                                         '   read-only attribute, an error message appears. A ring control at the\n'
+                                                                                         '   top of the dialog box allows you to see all IVI attributes or only\n'
+                                                                                         '   the attributes of type ViReal64. If you choose to see all IVI\n'
+                                                                                         '   attributes, the data types appear to the right of the attribute names\n'
+                                                                                         '   in the list box. Attributes with data types other than ViReal64 are\n'
+                                                                                         '   dim. If you select an attribute data type that is dim, LabWindows/CVI\n'
+                                                                                         '   transfers you to the function panel for the corresponding function\n'
+                                                                                         '   that is consistent with the data type.\n'
+                                                                                         '-  If you want to enter a variable name, press **Ctrl**\\ +\\ **T** to\n'
+                                                                                         '   change this ring control to a manual input box. If the attribute in\n'
+                                                                                         '   this ring control has named constants as valid values, you can view\n'
+                                                                                         '   the constants by moving to the value control and pressing **Enter**.\n'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'attribute_id_ctype',
+                                                     'name': 'attributeId',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'attribute_id',
+                                                     'python_name_or_default_for_init': 'attribute_id',
+                                                     'python_name_with_default': 'attribute_id',
+                                                     'python_name_with_doc_default': 'attribute_id',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViAttr',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViInt64',
+                                                     'ctypes_type_library_call': 'ViInt64',
+                                                     'ctypes_variable_name': 'attribute_value_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'Specifies the value to which you want to set the attribute. If the\n'
+                                                                                         'attribute currently showing in the attribute ring control has constants\n'
+                                                                                         'as valid values, you can view a list of the constants by pressing\n'
+                                                                                         '**Enter** on this control. Select a value by double-clicking on it or by\n'
+                                                                                         'selecting it and then pressing **Enter**.\n',
+                                                                          'note': '\nSome of the values might not be valid depending upon the current\nsettings of the device session.\n'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'attribute_value_ctype',
+                                                     'name': 'attributeValue',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'attribute_value',
+                                                     'python_name_or_default_for_init': 'attribute_value',
+                                                     'python_name_with_default': 'attribute_value',
+                                                     'python_name_with_doc_default': 'attribute_value',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViInt64',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False}],
+                               'python_code_variables': [],
+                               'python_name': '_set_attribute_vi_int64',
+                               'render_in_library': True,
+                               'render_in_session_base': True,
+                               'returns': 'ViStatus'},
+    'SetAttributeViReal64': {   'blocking': False,
+                                'codegen_method': 'private',
+                                'documentation': {   'description': '\n'
+                                                                    '| Sets the value of a ViReal64 attribute.\n'
+                                                                    '| This is a low-level function that you can use to set the values of\n'
+                                                                    '  device-specific attributes and inherent IVI attributes.\n'},
+                                'has_repeated_capability': True,
+                                'invalidates_attribute_cache': True,
+                                'is_error_handling': False,
+                                'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                'name': 'SetAttributeViReal64',
+                                'parameters': [   {   'ctypes_type': 'ViSession',
+                                                      'ctypes_type_library_call': 'ViSession',
+                                                      'ctypes_variable_name': 'vi_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                          'niDCPower_InitializeWithChannels function.\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': True,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'vi_ctype',
+                                                      'name': 'vi',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'vi',
+                                                      'python_name_or_default_for_init': 'vi',
+                                                      'python_name_with_default': 'vi',
+                                                      'python_name_with_doc_default': 'vi',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViSession',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViChar[]',
+                                                      'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                      'ctypes_variable_name': 'channel_name_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Specifies the output channel(s) to which this configuration value\n'
+                                                                                          'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                          'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                          '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                          'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                          'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                          'In the Running state, multiple output channel configurations are\n'
+                                                                                          'performed sequentially based on the order specified in this parameter.\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': True,
+                                                      'is_session_handle': False,
+                                                      'is_string': True,
+                                                      'library_method_call_snippet': 'channel_name_ctype',
+                                                      'name': 'channelName',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'channel_name',
+                                                      'python_name_or_default_for_init': 'channel_name',
+                                                      'python_name_with_default': 'channel_name',
+                                                      'python_name_with_doc_default': 'channel_name',
+                                                      'python_type': 'str',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViChar[]',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViAttr',
+                                                      'ctypes_type_library_call': 'ViAttr',
+                                                      'ctypes_variable_name': 'attribute_id_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Specifies the ID of an attribute. From the function panel window, you\n'
+                                                                                          'can use this control as follows.\n'
+                                                                                          '\n'
+                                                                                          '-  In the function panel window, click on the control or press **Enter**\n'
+                                                                                          '   or the spacebar to display a dialog box containing hierarchical list\n'
+                                                                                          '   of the available attributes. Attributes whose value cannot be set are\n'
+                                                                                          '   dim. Help text is shown for each attribute. Select an attribute by\n'
+                                                                                          '   double-clicking on it or by selecting it and then pressing **Enter**.\n'
+                                                                                          '-  Read-only attributes appear dim in the list box. If you select a\n'
+                                                                                          '   read-only attribute, an error message appears. A ring control at the\n'
+                                                                                          '   top of the dialog box allows you to see all IVI attributes or only\n'
+                                                                                          '   the attributes of type ViReal64. If you choose to see all IVI\n'
+                                                                                          '   attributes, the data types appear to the right of the attribute names\n'
+                                                                                          '   in the list box. Attributes with data types other than ViReal64 are\n'
+                                                                                          '   dim. If you select an attribute data type that is dim, LabWindows/CVI\n'
+                                                                                          '   transfers you to the function panel for the corresponding function\n'
+                                                                                          '   that is consistent with the data type.\n'
+                                                                                          '-  If you want to enter a variable name, press **Ctrl**\\ +\\ **T** to\n'
+                                                                                          '   change this ring control to a manual input box. If the attribute in\n'
+                                                                                          '   this ring control has named constants as valid values, you can view\n'
+                                                                                          '   the constants by moving to the value control and pressing **Enter**.\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'attribute_id_ctype',
+                                                      'name': 'attributeId',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'attribute_id',
+                                                      'python_name_or_default_for_init': 'attribute_id',
+                                                      'python_name_with_default': 'attribute_id',
+                                                      'python_name_with_doc_default': 'attribute_id',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViAttr',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViReal64',
+                                                      'ctypes_type_library_call': 'ViReal64',
+                                                      'ctypes_variable_name': 'attribute_value_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Specifies the value to which you want to set the attribute. If the\n'
+                                                                                          'attribute currently showing in the attribute ring control has constants\n'
+                                                                                          'as valid values, you can view a list of the constants by pressing\n'
+                                                                                          '**Enter** on this control. Select a value by double-clicking on it or by\n'
+                                                                                          'selecting it and then pressing **Enter**.\n',
+                                                                           'note': '\nSome of the values might not be valid depending upon the current\nsettings of the device session.\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'attribute_value_ctype',
+                                                      'name': 'attributeValue',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'attribute_value',
+                                                      'python_name_or_default_for_init': 'attribute_value',
+                                                      'python_name_with_default': 'attribute_value',
+                                                      'python_name_with_doc_default': 'attribute_value',
+                                                      'python_type': 'float',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViReal64',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False}],
+                                'python_code_variables': [],
+                                'python_name': '_set_attribute_vi_real64',
+                                'render_in_library': True,
+                                'render_in_session_base': True,
+                                'returns': 'ViStatus'},
+    'SetAttributeViSession': {   'codegen_method': 'no',
+                                 'documentation': {   'description': '\n'
+                                                                     '| Sets the value of a ViSession attribute.\n'
+                                                                     '| This is a low-level function that you can use to set the values of\n'
+                                                                     '  device-specific attributes and inherent IVI attributes.\n'},
+                                 'invalidates_attribute_cache': True,
+                                 'parameters': [   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                           'niDCPower_InitializeWithChannels function.\n'},
+                                                       'name': 'vi',
+                                                       'type': 'ViSession'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Specifies the output channel(s) to which this configuration value\n'
+                                                                                           'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                           'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                           '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                           'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                           'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                           'In the Running state, multiple output channel configurations are\n'
+                                                                                           'performed sequentially based on the order specified in this parameter.\n'},
+                                                       'name': 'channelName',
+                                                       'type': 'ViChar[]'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Specifies the ID of an attribute. From the function panel window, you\n'
+                                                                                           'can use this control as follows.\n'
+                                                                                           '\n'
+                                                                                           '-  In the function panel window, click on the control or press **Enter**\n'
+                                                                                           '   or the spacebar to display a dialog box containing hierarchical list\n'
+                                                                                           '   of the available attributes. Attributes whose value cannot be set are\n'
+                                                                                           '   dim. Help text is shown for each attribute. Select an attribute by\n'
+                                                                                           '   double-clicking on it or by selecting it and then pressing **Enter**.\n'
+                                                                                           '-  Read-only attributes appear dim in the list box. If you select a\n'
+                                                                                           '   read-only attribute, an error message appears. A ring control at the\n'
+                                                                                           '   top of the dialog box allows you to see all IVI attributes or only\n'
+                                                                                           '   the attributes of type ViSession. If you choose to see all IVI\n'
+                                                                                           '   attributes, the data types appear to the right of the attribute names\n'
+                                                                                           '   in the list box. Attributes with data types other than ViSession are\n'
+                                                                                           '   dim. If you select an attribute data type that is dim, LabWindows/CVI\n'
+                                                                                           '   transfers you to the function panel for the corresponding function\n'
+                                                                                           '   that is consistent with the data type.\n'
+                                                                                           '-  If you want to enter a variable name, press **Ctrl**\\ +\\ **T** to\n'
+                                                                                           '   change this ring control to a manual input box. If the attribute in\n'
+                                                                                           '   this ring control has named constants as valid values, you can view\n'
+                                                                                           '   the constants by moving to the value control and pressing **Enter**.\n'},
+                                                       'name': 'attributeId',
+                                                       'type': 'ViAttr'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Specifies the value to which you want to set the attribute. If the\n'
+                                                                                           'attribute currently showing in the attribute ring control has constants\n'
+                                                                                           'as valid values, you can view a list of the constants by pressing\n'
+                                                                                           '**Enter** on this control. Select a value by double-clicking on it or by\n'
+                                                                                           'selecting it and then pressing **Enter**.\n',
+                                                                            'note': '\nSome of the values might not be valid depending upon the current\nsettings of the device session.\n'},
+                                                       'name': 'attributeValue',
+                                                       'type': 'ViSession'}],
+                                 'returns': 'ViStatus'},
+    'SetAttributeViString': {   'blocking': False,
+                                'codegen_method': 'private',
+                                'documentation': {   'description': '\n'
+                                                                    '| Sets the value of a ViString attribute.\n'
+                                                                    '| This is a low-level function that you can use to set the values of\n'
+                                                                    '  device-specific attributes and inherent IVI attributes.\n'},
+                                'has_repeated_capability': True,
+                                'invalidates_attribute_cache': True,
+                                'is_error_handling': False,
+                                'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                'name': 'SetAttributeViString',
+                                'parameters': [   {   'ctypes_type': 'ViSession',
+                                                      'ctypes_type_library_call': 'ViSession',
+                                                      'ctypes_variable_name': 'vi_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                          'niDCPower_InitializeWithChannels function.\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': True,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'vi_ctype',
+                                                      'name': 'vi',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'vi',
+                                                      'python_name_or_default_for_init': 'vi',
+                                                      'python_name_with_default': 'vi',
+                                                      'python_name_with_doc_default': 'vi',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViSession',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViChar[]',
+                                                      'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                      'ctypes_variable_name': 'channel_name_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Specifies the output channel(s) to which this configuration value\n'
+                                                                                          'applies. Specify multiple channels by using a channel list or a channel\n'
+                                                                                          'range. A channel list is a comma (,) separated sequence of channel names\n'
+                                                                                          '(for example, 0,2 specifies channels 0 and 2). A channel range is a\n'
+                                                                                          'lower bound channel followed by a hyphen (-) or colon (:) followed by an\n'
+                                                                                          'upper bound channel (for example, 0-2 specifies channels 0, 1, and 2).\n'
+                                                                                          'In the Running state, multiple output channel configurations are\n'
+                                                                                          'performed sequentially based on the order specified in this parameter.\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': True,
+                                                      'is_session_handle': False,
+                                                      'is_string': True,
+                                                      'library_method_call_snippet': 'channel_name_ctype',
+                                                      'name': 'channelName',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'channel_name',
+                                                      'python_name_or_default_for_init': 'channel_name',
+                                                      'python_name_with_default': 'channel_name',
+                                                      'python_name_with_doc_default': 'channel_name',
+                                                      'python_type': 'str',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViChar[]',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViAttr',
+                                                      'ctypes_type_library_call': 'ViAttr',
+                                                      'ctypes_variable_name': 'attribute_id_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Specifies the ID of an attribute. From the function panel window, you\n'
+                                                                                          'can use this control as follows.\n'
+                                                                                          '\n'
+                                                                                          '-  In the function panel window, click on the control or press **Enter**\n'
+                                                                                          '   or the spacebar to display a dialog box containing hierarchical list\n'
+                                                                                          '   of the available attributes. Attributes whose value cannot be set are\n'
+                                                                                          '   dim. Help text is shown for each attribute. Select an attribute by\n'
+                                                                                          '   double-clicking on it or by selecting it and then pressing **Enter**.\n'
+                                                                                          '-  Read-only attributes appear dim in the list box. If you select a\n'
+                                                                                          '   read-only attribute, an error message appears. A ring control at the\n'
+                                                                                          '   top of the dialog box allows you to see all IVI attributes or only\n'
+                                                                                          '   the attributes of type ViString. If you choose to see all IVI\n'
+                                                                                          '   attributes, the data types appear to the right of the attribute names\n'
+                                                                                          '   in the list box. Attributes with data types other than ViString are\n'
+                                                                                          '   dim. If you select an attribute data type that is dim, LabWindows/CVI\n'
+                                                                                          '   transfers you to the function panel for the corresponding function\n'
+                                                                                          '   that is consistent with the data type.\n'
+                                                                                          '-  If you want to enter a variable name, press **Ctrl**\\ +\\ **T** to\n'
+                                                                                          '   change this ring control to a manual input box. If the attribute in\n'
+                                                                                          '   this ring control has named constants as valid values, you can view\n'
+                                                                                          '   the constants by moving to the value control and pressing **Enter**.\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'attribute_id_ctype',
+                                                      'name': 'attributeId',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'attribute_id',
+                                                      'python_name_or_default_for_init': 'attribute_id',
+                                                      'python_name_with_default': 'attribute_id',
+                                                      'python_name_with_doc_default': 'attribute_id',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViAttr',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViChar[]',
+                                                      'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                      'ctypes_variable_name': 'attribute_value_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Specifies the value to which you want to set the attribute. If the\n'
+                                                                                          'attribute currently showing in the attribute ring control has constants\n'
+                                                                                          'as valid values, you can view a list of the constants by pressing\n'
+                                                                                          '**Enter** on this control. Select a value by double-clicking on it or by\n'
+                                                                                          'selecting it and then pressing **Enter**.\n',
+                                                                           'note': '\nSome of the values might not be valid depending upon the current\nsettings of the device session.\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': True,
+                                                      'library_method_call_snippet': 'attribute_value_ctype',
+                                                      'name': 'attributeValue',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'attribute_value',
+                                                      'python_name_or_default_for_init': 'attribute_value',
+                                                      'python_name_with_default': 'attribute_value',
+                                                      'python_name_with_doc_default': 'attribute_value',
+                                                      'python_type': 'str',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViChar[]',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False}],
+                                'python_code_variables': [],
+                                'python_name': '_set_attribute_vi_string',
+                                'render_in_library': True,
+                                'render_in_session_base': True,
+                                'returns': 'ViStatus'},
+    'SetCalUserDefinedInfo': {   'codegen_method': 'no',
+                                 'documentation': {   'description': '\n'
+                                                                     'Stores a user-defined string of characters in the device onboard EEPROM.\n'
+                                                                     'If the string is longer than the maximum allowable size, it is\n'
+                                                                     'truncated. This function overwrites any existing user-defined\n'
+                                                                     'information.\n'
+                                                                     '\n'
+                                                                     'If you call this function in a session, **info** is immediately changed.\n'
+                                                                     'If you call this function in an external calibration session, **info**\n'
+                                                                     'is changed only after you close the session using the\n'
+                                                                     'niDCPower_CloseExtCal function with **action** set to\n'
+                                                                     'NIDCPOWER_VAL_COMMIT.\n',
+                                                      'note': [   '\nOne or more of the referenced functions are not in the Python API for this driver.\n',
+                                                                  '\n'
+                                                                  'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or represent '
+                                                                  'True/False, have been removed.\n']},
+                                 'parameters': [   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                           'niDCPower_InitExtCal or niDCPower_InitializeWithChannels function.\n',
+                                                                            'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                       'name': 'vi',
+                                                       'type': 'ViSession'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {'description': 'Specifies the string to store in the device onboard EEPROM.'},
+                                                       'name': 'Info',
+                                                       'type': 'ViChar[]'}],
+                                 'returns': 'ViStatus'},
+    'SetSequence': {   'blocking': False,
+                       'codegen_method': 'public',
+                       'documentation': {   'description': '\n'
+                                                           'Configures a series of voltage or current outputs and corresponding\n'
+                                                           'source delays. The source mode must be set to\n'
+                                                           '`Sequence <REPLACE_DRIVER_SPECIFIC_URL_1(sequencing)>`__ for this\n'
+                                                           'function to take effect.\n'
+                                                           '\n'
+                                                           'Refer to the `Configuring the Source\n'
+                                                           'Unit <REPLACE_DRIVER_SPECIFIC_URL_1(configuringthesourceunit)>`__ topic\n'
+                                                           'in the *NI DC Power Supplies and SMUs Help* for more information about\n'
+                                                           'how to configure your device.\n'
+                                                           '\n'
+                                                           'Use this function in the Uncommitted or Committed programming states.\n'
+                                                           'Refer to the `Programming\n'
+                                                           'States <REPLACE_DRIVER_SPECIFIC_URL_1(programmingstates)>`__ topic in\n'
+                                                           'the *NI DC Power Supplies and SMUs Help* for more information about\n'
+                                                           'NI-DCPower programming states.\n',
+                                            'note': '\n'
+                                                    'This function is not supported on all devices. Refer to `Supported\n'
+                                                    'Functions by\n'
+                                                    "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                    'for more information about supported devices.\n'},
+                       'has_repeated_capability': True,
+                       'invalidates_attribute_cache': True,
+                       'is_error_handling': False,
+                       'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                       'name': 'SetSequence',
+                       'parameters': [   {   'ctypes_type': 'ViSession',
+                                             'ctypes_type_library_call': 'ViSession',
+                                             'ctypes_variable_name': 'vi_ctype',
+                                             'direction': 'in',
+                                             'documentation': {   'description': '\n'
+                                                                                 'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                 'niDCPower_InitializeWithChannels function.\n'},
+                                             'enum': None,
+                                             'is_buffer': False,
+                                             'is_repeated_capability': False,
+                                             'is_session_handle': True,
+                                             'is_string': False,
+                                             'library_method_call_snippet': 'vi_ctype',
+                                             'name': 'vi',
+                                             'numpy': False,
+                                             'numpy_into_return': False,
+                                             'python_name': 'vi',
+                                             'python_name_or_default_for_init': 'vi',
+                                             'python_name_with_default': 'vi',
+                                             'python_name_with_doc_default': 'vi',
+                                             'python_type': 'int',
+                                             'size': {'mechanism': 'fixed', 'value': 1},
+                                             'type': 'ViSession',
+                                             'use_array': False,
+                                             'use_in_python_api': True,
+                                             'use_list': False},
+                                         {   'ctypes_type': 'ViChar[]',
+                                             'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                             'ctypes_variable_name': 'channel_name_ctype',
+                                             'direction': 'in',
+                                             'documentation': {   'description': '\n'
+                                                                                 'Specifies the output channel to which this configuration value applies.\n'
+                                                                                 'You can only set a sequence for one channel at a time.\n'},
+                                             'enum': None,
+                                             'is_buffer': False,
+                                             'is_repeated_capability': True,
+                                             'is_session_handle': False,
+                                             'is_string': True,
+                                             'library_method_call_snippet': 'channel_name_ctype',
+                                             'name': 'channelName',
+                                             'numpy': False,
+                                             'numpy_into_return': False,
+                                             'python_name': 'channel_name',
+                                             'python_name_or_default_for_init': 'channel_name',
+                                             'python_name_with_default': 'channel_name',
+                                             'python_name_with_doc_default': 'channel_name',
+                                             'python_type': 'str',
+                                             'size': {'mechanism': 'fixed', 'value': 1},
+                                             'type': 'ViChar[]',
+                                             'use_array': False,
+                                             'use_in_python_api': True,
+                                             'use_list': False},
+                                         {   'ctypes_type': 'ViReal64',
+                                             'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                             'ctypes_variable_name': 'values_ctype',
+                                             'default_value': None,
+                                             'direction': 'in',
+                                             'documentation': {   'description': '\n'
+                                                                                 'Specifies the series of voltage levels or current levels, depending on\n'
+                                                                                 'the configured `output\n'
+                                                                                 'function <REPLACE_DRIVER_SPECIFIC_URL_1(programming_output)>`__.\n'
+                                                                                 '**Valid values**:\n'
+                                                                                 'The valid values for this parameter are defined by the voltage level\n'
+                                                                                 'range or current level range.\n'},
+                                             'enum': None,
+                                             'is_buffer': True,
+                                             'is_repeated_capability': False,
+                                             'is_session_handle': False,
+                                             'is_string': False,
+                                             'library_method_call_snippet': 'values_ctype',
+                                             'name': 'Values',
+                                             'numpy': False,
+                                             'numpy_into_return': False,
+                                             'original_type': 'ViReal64[]',
+                                             'python_name': 'values',
+                                             'python_name_or_default_for_init': 'values',
+                                             'python_name_with_default': 'values=None',
+                                             'python_name_with_doc_default': 'values=None',
+                                             'python_type': 'float',
+                                             'size': {'mechanism': 'len', 'value': 'Size'},
+                                             'type': 'ViReal64',
+                                             'use_array': False,
+                                             'use_in_python_api': True,
+                                             'use_list': True},
+                                         {   'ctypes_type': 'ViReal64',
+                                             'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                             'ctypes_variable_name': 'source_delays_ctype',
+                                             'direction': 'in',
+                                             'documentation': {   'description': '\n'
+                                                                                 'Specifies the source delay that follows the configuration of each value\n'
+                                                                                 'in the sequence.\n'
+                                                                                 '**Valid Values**:\n'
+                                                                                 'The valid values are between 0 and 167 seconds.\n'},
+                                             'enum': None,
+                                             'is_buffer': True,
+                                             'is_repeated_capability': False,
+                                             'is_session_handle': False,
+                                             'is_string': False,
+                                             'library_method_call_snippet': 'source_delays_ctype',
+                                             'name': 'sourceDelays',
+                                             'numpy': False,
+                                             'numpy_into_return': False,
+                                             'original_type': 'ViReal64[]',
+                                             'python_name': 'source_delays',
+                                             'python_name_or_default_for_init': 'source_delays',
+                                             'python_name_with_default': 'source_delays',
+                                             'python_name_with_doc_default': 'source_delays',
+                                             'python_type': 'float',
+                                             'size': {'mechanism': 'fixed', 'value': 1},
+                                             'type': 'ViReal64',
+                                             'use_array': False,
+                                             'use_in_python_api': True,
+                                             'use_list': True},
+                                         {   'ctypes_type': 'ViUInt32',
+                                             'ctypes_type_library_call': 'ViUInt32',
+                                             'ctypes_variable_name': 'size_ctype',
+                                             'direction': 'in',
+                                             'documentation': {   'description': '\n'
+                                                                                 'The number of elements in the Values and the Source Delays arrays. The\n'
+                                                                                 'Values and Source Delays arrays should have the same size.\n'},
+                                             'enum': None,
+                                             'is_buffer': False,
+                                             'is_repeated_capability': False,
+                                             'is_session_handle': False,
+                                             'is_string': False,
+                                             'library_method_call_snippet': 'size_ctype',
+                                             'name': 'Size',
+                                             'numpy': False,
+                                             'numpy_into_return': False,
+                                             'python_name': 'size',
+                                             'python_name_or_default_for_init': 'size',
+                                             'python_name_with_default': 'size',
+                                             'python_name_with_doc_default': 'size',
+                                             'python_type': 'int',
+                                             'size': {'mechanism': 'fixed', 'value': 1},
+                                             'type': 'ViUInt32',
+                                             'use_array': False,
+                                             'use_in_python_api': False,
+                                             'use_list': False}],
+                       'python_code_variables': [],
+                       'python_name': 'set_sequence',
+                       'render_in_library': True,
+                       'render_in_session_base': True,
+                       'returns': 'ViStatus'},
+    'StreamMeasurements': {   'blocking': False,
+                              'codegen_method': 'public',
+                              'documentation': {   'description': '\n'
+                                                                  '                Fetches the measurements of an initiated session in chunks of what has been acquired. Before each fetch, the\n'
+                                                                  '                generator reads fetch_backlog and fetches what is available, up to **chunk** measurements, into reusable\n'
+                                                                  '                buffers. When nothing has been acquired yet, it waits up to **timeout** for a single measurement, so a slow\n'
+                                                                  '                acquisition does not time out waiting for a full chunk. Reading what is ready as it is acquired keeps long\n'
+                                                                  '                acquisitions from overflowing measure_buffer_size.'},
+                              'has_repeated_capability': True,
+                              'invalidates_attribute_cache': False,
+                              'is_error_handling': False,
+                              'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/stream_measurements'}],
+                              'name': 'StreamMeasurements',
+                              'parameters': [   {   'ctypes_type': 'ViSession',
+                                                    'ctypes_type_library_call': 'ViSession',
+                                                    'ctypes_variable_name': 'vi_ctype',
+                                                    'direction': 'in',
+                                                    'documentation': {   'description': 'Identifies a particular instrument session. **vi** is obtained from the niDCPower_InitializeWithChannels '
+                                                                                        'function.'},
+                                                    'enum': None,
+                                                    'is_buffer': False,
+                                                    'is_repeated_capability': False,
+                                                    'is_session_handle': True,
+                                                    'is_string': False,
+                                                    'library_method_call_snippet': 'vi_ctype',
+                                                    'name': 'vi',
+                                                    'numpy': False,
+                                                    'numpy_into_return': False,
+                                                    'python_name': 'vi',
+                                                    'python_name_or_default_for_init': 'vi',
+                                                    'python_name_with_default': 'vi',
+                                                    'python_name_with_doc_default': 'vi',
+                                                    'python_type': 'int',
+                                                    'size': {'mechanism': 'fixed', 'value': 1},
+                                                    'type': 'ViSession',
+                                                    'use_array': False,
+                                                    'use_in_python_api': True,
+                                                    'use_list': False},
+                                                {   'ctypes_type': 'ViChar[]',
+                                                    'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                    'ctypes_variable_name': 'channel_name_ctype',
+                                                    'direction': 'in',
+                                                    'documentation': {'description': 'Specifies the output channel to fetch measurements from.'},
+                                                    'enum': None,
+                                                    'is_buffer': False,
+                                                    'is_repeated_capability': True,
+                                                    'is_session_handle': False,
+                                                    'is_string': True,
+                                                    'library_method_call_snippet': 'channel_name_ctype',
+                                                    'name': 'channelName',
+                                                    'numpy': False,
+                                                    'numpy_into_return': False,
+                                                    'python_name': 'channel_name',
+                                                    'python_name_or_default_for_init': 'channel_name',
+                                                    'python_name_with_default': 'channel_name',
+                                                    'python_name_with_doc_default': 'channel_name',
+                                                    'python_type': 'str',
+                                                    'size': {'mechanism': 'fixed', 'value': 1},
+                                                    'type': 'ViChar[]',
+                                                    'use_array': False,
+                                                    'use_in_python_api': True,
+                                                    'use_list': False},
+                                                {   'ctypes_type': 'ViInt32',
+                                                    'ctypes_type_library_call': 'ViInt32',
+                                                    'ctypes_variable_name': 'chunk_ctype',
+                                                    'default_value': 1000,
+                                                    'direction': 'in',
+                                                    'documentation': {   'description': 'The maximum number of measurements in each item. Fewer are returned when fewer have been acquired or are left '
+                                                                                        'to fetch.'},
+                                                    'enum': None,
+                                                    'is_buffer': False,
+                                                    'is_repeated_capability': False,
+                                                    'is_session_handle': False,
+                                                    'is_string': False,
+                                                    'library_method_call_snippet': 'chunk_ctype',
+                                                    'name': 'chunk',
+                                                    'numpy': False,
+                                                    'numpy_into_return': False,
+                                                    'python_name': 'chunk',
+                                                    'python_name_or_default_for_init': 'chunk',
+                                                    'python_name_with_default': 'chunk=1000',
+                                                    'python_name_with_doc_default': 'chunk=1000',
+                                                    'python_type': 'int',
+                                                    'size': {'mechanism': 'fixed', 'value': 1},
+                                                    'type': 'ViInt32',
+                                                    'use_array': False,
+                                                    'use_in_python_api': True,
+                                                    'use_list': False},
+                                                {   'ctypes_type': 'ViInt32',
+                                                    'ctypes_type_library_call': 'ViInt32',
+                                                    'ctypes_variable_name': 'count_ctype',
+                                                    'default_value': None,
+                                                    'direction': 'in',
+                                                    'documentation': {   'description': '\n'
+                                                                                        '                        The total number of measurements to fetch. When None, the measurements of one measure '
+                                                                                        'record are fetched if\n'
+                                                                                        '                        measure_record_length_is_finite is True, and measurements are fetched until the '
+                                                                                        'generator is closed otherwise.\n'
+                                                                                        '                        For sequences, pass the number of measure records times measure_record_length.'},
+                                                    'enum': None,
+                                                    'is_buffer': False,
+                                                    'is_repeated_capability': False,
+                                                    'is_session_handle': False,
+                                                    'is_string': False,
+                                                    'library_method_call_snippet': 'count_ctype',
+                                                    'name': 'count',
+                                                    'numpy': False,
+                                                    'numpy_into_return': False,
+                                                    'python_name': 'count',
+                                                    'python_name_or_default_for_init': 'count',
+                                                    'python_name_with_default': 'count=None',
+                                                    'python_name_with_doc_default': 'count=None',
+                                                    'python_type': 'int',
+                                                    'size': {'mechanism': 'fixed', 'value': 1},
+                                                    'type': 'ViInt32',
+                                                    'use_array': False,
+                                                    'use_in_python_api': True,
+                                                    'use_list': False},
+                                                {   'ctypes_type': 'ViInt32',
+                                                    'ctypes_type_library_call': 'ViInt32',
+                                                    'ctypes_variable_name': 'num_buffers_ctype',
+                                                    'default_value': 4,
+                                                    'direction': 'in',
+                                                    'documentation': {   'description': 'The number of preallocated buffers the measurements are fetched into. The arrays of an item stay valid until '
+                                                                                        '**num_buffers** more items have been fetched.'},
+                                                    'enum': None,
+                                                    'is_buffer': False,
+                                                    'is_repeated_capability': False,
+                                                    'is_session_handle': False,
+                                                    'is_string': False,
+                                                    'library_method_call_snippet': 'num_buffers_ctype',
+                                                    'name': 'numBuffers',
+                                                    'numpy': False,
+                                                    'numpy_into_return': False,
+                                                    'python_name': 'num_buffers',
+                                                    'python_name_or_default_for_init': 'num_buffers',
+                                                    'python_name_with_default': 'num_buffers=4',
+                                                    'python_name_with_doc_default': 'num_buffers=4',
+                                                    'python_type': 'int',
+                                                    'size': {'mechanism': 'fixed', 'value': 1},
+                                                    'type': 'ViInt32',
+                                                    'use_array': False,
+                                                    'use_in_python_api': True,
+                                                    'use_list': False},
+                                                {   'ctypes_type': 'ViReal64',
+                                                    'ctypes_type_library_call': 'ViReal64',
+                                                    'ctypes_variable_name': 'timeout_ctype',
+                                                    'default_value': 'datetime.timedelta(seconds=1.0)',
+                                                    'direction': 'in',
+                                                    'documentation': {'description': 'The maximum time to wait for a measurement when none have been acquired yet.'},
+                                                    'enum': None,
+                                                    'is_buffer': False,
+                                                    'is_repeated_capability': False,
+                                                    'is_session_handle': False,
+                                                    'is_string': False,
+                                                    'library_method_call_snippet': 'timeout_ctype',
+                                                    'name': 'Timeout',
+                                                    'numpy': False,
+                                                    'numpy_into_return': False,
+                                                    'python_name': 'timeout',
+                                                    'python_name_or_default_for_init': 'timeout',
+                                                    'python_name_with_default': 'timeout=datetime.timedelta(seconds=1.0)',
+                                                    'python_name_with_doc_default': "timeout='datetime.timedelta(seconds=1.0)'",
+                                                    'python_type': 'datetime.timedelta',
+                                                    'size': {'mechanism': 'fixed', 'value': 1},
+                                                    'type': 'ViReal64',
+                                                    'use_array': False,
+                                                    'use_in_python_api': True,
+                                                    'use_list': False},
+                                                {   'ctypes_type': 'ViSession',
+                                                    'ctypes_type_library_call': 'ctypes.POINTER(ViSession)',
+                                                    'ctypes_variable_name': 'measurements_ctype',
+                                                    'direction': 'out',
+                                                    'documentation': {   'description': '\n'
+                                                                                        '                        Generator of (voltage_measurements, current_measurements, in_compliance, timestamps) '
+                                                                                        'tuples of numpy arrays of\n'
+                                                                                        '                        float64, float64, bool and float64. **timestamps** is the time of each measurement in '
+                                                                                        'seconds, relative to the first\n'
+                                                                                        '                        measurement fetched, computed from measure_record_delta_time.\n'
+                                                                                        '\n'
+                                                                                        '                        Example:\n'
+                                                                                        '\n'
+                                                                                        '                        .. code-block:: python\n'
+                                                                                        '\n'
+                                                                                        '                            with session.initiate():\n'
+                                                                                        '                                for voltage_measurements, current_measurements, in_compliance, timestamps in '
+                                                                                        "session.channels['0'].stream_measurements(chunk=1000):\n"
+                                                                                        '                                    process(timestamps, voltage_measurements)'},
+                                                    'enum': None,
+                                                    'is_buffer': False,
+                                                    'is_repeated_capability': False,
+                                                    'is_session_handle': False,
+                                                    'is_string': False,
+                                                    'library_method_call_snippet': 'None if measurements_ctype is None else (ctypes.pointer(measurements_ctype))',
+                                                    'name': 'measurements',
+                                                    'numpy': False,
+                                                    'numpy_into_return': False,
+                                                    'python_name': 'measurements',
+                                                    'python_name_or_default_for_init': 'measurements',
+                                                    'python_name_with_default': 'measurements',
+                                                    'python_name_with_doc_default': 'measurements',
+                                                    'python_type': 'generator',
+                                                    'size': {'mechanism': 'fixed', 'value': 1},
+                                                    'type': 'ViSession',
+                                                    'use_array': False,
+                                                    'use_in_python_api': True,
+                                                    'use_list': False}],
+                              'python_code_variables': [],
+                              'python_name': 'stream_measurements',
+                              'render_in_library': False,
+                              'render_in_session_base': True,
+                              'returns': 'ViStatus'},
+    'UnlockSession': {   'codegen_method': 'no',
+                         'documentation': {   'description': '\n'
+                                                             'Releases a lock that you acquired on an device session using\n'
+                                                             'niDCPower_LockSession. Refer to niDCPower_LockSession for additional\n'
+                                                             'information on session locks.\n',
+                                              'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                         'parameters': [   {   'direction': 'in',
+                                               'documentation': {   'description': '\n'
+                                                                                   'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                   'niDCPower_InitializeWithChannels function.\n'},
+                                               'name': 'vi',
+                                               'type': 'ViSession'},
+                                           {   'direction': 'out',
+                                               'documentation': {   'description': '\n'
+                                                                                   '| This attribute is optional. If you do not want to use this attribute,\n'
+                                                                                   '  pass VI_NULL.\n'
+                                                                                   '| Use this attribute in complex functions to keep track of whether you\n'
+                                                                                   '  obtain a lock and therefore need to unlock the session.\n'
+                                                                                   '| Pass the address of a local ViBoolean variable. In the declaration of\n'
+                                                                                   '  the local variable, initialize it to VI_FALSE. Pass the address of\n'
+                                                                                   '  the same local variable to any other calls you make to\n'
+                                                                                   '  niDCPower_LockSession or niDCPower_UnlockSessionin the same\n'
+                                                                                   '  function.\n'
+                                                                                   '| The parameter is an input/output parameter. niDCPower_LockSession and\n'
+                                                                                   '  niDCPower_UnlockSessioneach inspect the current value and take the\n'
+                                                                                   '  following actions.\n'
+                                                                                   '\n'
+                                                                                   '-  If the value is VI_TRUE, niDCPower_LockSession does not lock the\n'
+                                                                                   '   session again.\n'
+                                                                                   '-  If the value is VI_FALSE, niDCPower_LockSession obtains the lock\n'
+                                                                                   '   and sets the value of the parameter to VI_TRUE.\n'
+                                                                                   '-  If the value is VI_FALSE, niDCPower_UnlockSessiondoes not attempt\n'
+                                                                                   '   to unlock the session.\n'
+                                                                                   '-  If the value is VI_TRUE, niDCPower_UnlockSessionreleases the lock\n'
+                                                                                   '   and sets the value of the parameter to VI_FALSE.\n'
+                                                                                   '\n'
+                                                                                   '| Thus, you can, call niDCPower_UnlockSession at the end of your\n'
+                                                                                   '  function without worrying about whether you actually have the lock, as\n'
+                                                                                   '  the following example shows.\n'
+                                                                                   '| ViStatus TestFunc (ViSession vi, ViInt32 flags)\n'
+                                                                                   '  {\n'
+                                                                                   '  ViStatus error = VI_SUCCESS;\n'
+                                                                                   '  ViBoolean haveLock = VI_FALSE;\n'
+                                                                                   '  if (flags & BIT_1)\n'
+                                                                                   '  {\n'
+                                                                                   '  viCheckErr( niDCPower_LockSession(vi, &haveLock;));\n'
+                                                                                   '  viCheckErr( TakeAction1(vi));\n'
+                                                                                   '  if (flags & BIT_2)\n'
+                                                                                   '  {\n'
+                                                                                   '  viCheckErr( niDCPower_UnlockSession(vi, &haveLock;));\n'
+                                                                                   '  viCheckErr( TakeAction2(vi));\n'
+                                                                                   '  viCheckErr( niDCPower_LockSession(vi, &haveLock;);\n'
+                                                                                   '  }\n'
+                                                                                   '  if (flags & BIT_3)\n'
+                                                                                   '  viCheckErr( TakeAction3(vi));\n'
+                                                                                   '  }\n'
+                                                                                   '  Error:\n'
+                                                                                   '  /\\*At this point, you cannot really be sure that you have the lock.\n'
+                                                                                   '  Fortunately, the haveLock variable takes care of that for you.\\*/\n'
+                                                                                   '  niDCPower_UnlockSession(vi, &haveLock;);\n'
+                                                                                   '  return error;\n'
+                                                                                   '  }\n',
+                                                                    'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                               'name': 'callerHasLock',
+                                               'type': 'ViBoolean'}],
+                         'returns': 'ViStatus'},
+    'WaitForEvent': {   'blocking': True,
+                        'codegen_method': 'public',
+                        'documentation': {   'description': '\n'
+                                                            'Waits until the device has generated the specified event.\n'
+                                                            '\n'
+                                                            'The session monitors whether each type of event has occurred at least\n'
+                                                            'once since the last time this function or the niDCPower_Initiate\n'
+                                                            'function were called. If an event has only been generated once and you\n'
+                                                            'call this function successively, the function times out. Individual\n'
+                                                            'events must be generated between separate calls of this function.\n',
+                                             'note': [   '\n'
+                                                         'Refer to `Supported Functions by\n'
+                                                         "Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__\n"
+                                                         'for more information about supported devices.\n',
+                                                         '\n'
+                                                         'This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same '
+                                                         'session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the '
+                                                         "Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.\n"]},
+                        'has_repeated_capability': False,
+                        'invalidates_attribute_cache': False,
+                        'is_error_handling': False,
+                        'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                        'name': 'WaitForEvent',
+                        'parameters': [   {   'ctypes_type': 'ViSession',
+                                              'ctypes_type_library_call': 'ViSession',
+                                              'ctypes_variable_name': 'vi_ctype',
+                                              'direction': 'in',
+                                              'documentation': {   'description': '\n'
+                                                                                  'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                  'niDCPower_InitializeWithChannels function.\n'},
+                                              'enum': None,
+                                              'is_buffer': False,
+                                              'is_repeated_capability': False,
+                                              'is_session_handle': True,
+                                              'is_string': False,
+                                              'library_method_call_snippet': 'vi_ctype',
+                                              'name': 'vi',
+                                              'numpy': False,
+                                              'numpy_into_return': False,
+                                              'python_name': 'vi',
+                                              'python_name_or_default_for_init': 'vi',
+                                              'python_name_with_default': 'vi',
+                                              'python_name_with_doc_default': 'vi',
+                                              'python_type': 'int',
+                                              'size': {'mechanism': 'fixed', 'value': 1},
+                                              'type': 'ViSession',
+                                              'use_array': False,
+                                              'use_in_python_api': True,
+                                              'use_list': False},
+                                          {   'ctypes_type': 'ViInt32',
+                                              'ctypes_type_library_call': 'ViInt32',
+                                              'ctypes_variable_name': 'event_id_ctype',
+                                              'direction': 'in',
+                                              'documentation': {   'description': '\nSpecifies which event to wait for.\n**Defined Values:**\n',
+                                                                   'table_body': [   ['NIDCPOWER_VAL_SOURCE_COMPLETE_EVENT (1030)', 'Waits for the Source Complete event.'],
+                                                                                     ['NIDCPOWER_VAL_MEASURE_COMPLETE_EVENT (1031)', 'Waits for the Measure Complete event.'],
+                                                                                     ['NIDCPOWER_VAL_SEQUENCE_ITERATION_COMPLETE_EVENT (1032)', 'Waits for the Sequence Iteration Complete event.'],
+                                                                                     ['NIDCPOWER_VAL_SEQUENCE_ENGINE_DONE_EVENT (1033)', 'Waits for the Sequence Engine Done event.'],
+                                                                                     ['NIDCPOWER_VAL_PULSE_COMPLETE_EVENT (1051 )', 'Waits for the Pulse Complete event.'],
+                                                                                     ['NIDCPOWER_VAL_READY_FOR_PULSE_TRIGGER_EVENT (1052)', 'Waits for the Ready for Pulse Trigger event.']]},
+                                              'enum': 'Event',
+                                              'is_buffer': False,
+                                              'is_repeated_capability': False,
+                                              'is_session_handle': False,
+                                              'is_string': False,
+                                              'library_method_call_snippet': 'event_id_ctype',
+                                              'name': 'eventId',
+                                              'numpy': False,
+                                              'numpy_into_return': False,
+                                              'python_name': 'event_id',
+                                              'python_name_or_default_for_init': 'event_id',
+                                              'python_name_with_default': 'event_id',
+                                              'python_name_with_doc_default': 'event_id',
+                                              'python_type': 'enums.Event',
+                                              'size': {'mechanism': 'fixed', 'value': 1},
+                                              'type': 'ViInt32',
+                                              'use_array': False,
+                                              'use_in_python_api': True,
+                                              'use_list': False},
+                                          {   'ctypes_type': 'ViReal64',
+                                              'ctypes_type_library_call': 'ViReal64',
+                                              'ctypes_variable_name': 'timeout_ctype',
+                                              'default_value': 'datetime.timedelta(seconds=10.0)',
+                                              'direction': 'in',
+                                              'documentation': {   'description': '\n'
+                                                                                  'Specifies the maximum time allowed for this function to complete, in\n'
+                                                                                  'seconds. If the function does not complete within this time interval,\n'
+                                                                                  'NI-DCPower returns an error.\n',
+                                                                   'note': '\n'
+                                                                           'When setting the timeout interval, ensure you take into account any\n'
+                                                                           'triggers so that the timeout interval is long enough for your\n'
+                                                                           'application.\n'},
+                                              'enum': None,
+                                              'is_buffer': False,
+                                              'is_repeated_capability': False,
+                                              'is_session_handle': False,
+                                              'is_string': False,
+                                              'library_method_call_snippet': 'timeout_ctype',
+                                              'name': 'Timeout',
+                                              'numpy': False,
+                                              'numpy_into_return': False,
+                                              'python_api_converter_name': 'convert_timedelta_to_seconds',
+                                              'python_name': 'timeout',
+                                              'python_name_or_default_for_init': '_converters.convert_timedelta_to_seconds(timeout, self._encoding)',
+                                              'python_name_with_default': 'timeout=datetime.timedelta(seconds=10.0)',
+                                              'python_name_with_doc_default': "timeout='datetime.timedelta(seconds=10.0)'",
+                                              'python_type': 'datetime.timedelta',
+                                              'size': {'mechanism': 'fixed', 'value': 1},
+                                              'type': 'ViReal64',
+                                              'use_array': False,
+                                              'use_in_python_api': True,
+                                              'use_list': False}],
+                        'python_code_variables': [],
+                        'python_name': 'wait_for_event',
+                        'render_in_library': True,
+                        'render_in_session_base': False,
+                        'returns': 'ViStatus'},
+    '_init_function': {   'blocking': False,
+                          'codegen_method': 'no',
+                          'documentation': {   'description': '\n'
+                                                              'Creates and returns a new NI-DCPower session to the power supply or SMU\n'
+                                                              'specified in **resource name** to be used in all subsequent NI-DCPower\n'
+                                                              'function calls. With this function, you can optionally set the initial\n'
+                                                              'state of the following session attributes:\n'
+                                                              '\n'
+                                                              '-  NIDCPOWER_ATTR_SIMULATE\n'
+                                                              '-  NIDCPOWER_ATTR_DRIVER_SETUP\n'
+                                                              '\n'
+                                                              'After calling this function, the session will be in the Uncommitted\n'
+                                                              'state. Refer to the `Programming\n'
+                                                              'States <REPLACE_DRIVER_SPECIFIC_URL_1(programmingstates)>`__ topic for\n'
+                                                              'details about specific software states.\n'
+                                                              '\n'
+                                                              'To place the device in a known start-up state when creating a new\n'
+                                                              'session, set **reset** to VI_TRUE. This action is equivalent to using\n'
+                                                              'the niDCPower_reset function immediately after initializing the\n'
+                                                              'session.\n'
+                                                              '\n'
+                                                              'To open a session and leave the device in its existing configuration\n'
+                                                              'without passing through a transitional output state, set **reset** to\n'
+                                                              'VI_FALSE. Then configure the device as in the previous session,\n'
+                                                              'changing only the desired settings, and then call the\n'
+                                                              'niDCPower_Initiate function.\n'
+                                                              '\n'
+                                                              '**Related Topics:**\n'
+                                                              '\n'
+                                                              '`Programming\n'
+                                                              'States <REPLACE_DRIVER_SPECIFIC_URL_1(programmingstates)>`__\n'},
+                          'has_repeated_capability': False,
+                          'invalidates_attribute_cache': False,
+                          'is_error_handling': False,
+                          'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                          'name': 'InitializeWithChannels',
+                          'parameters': [   {   'ctypes_type': 'ViRsrc',
+                                                'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                'ctypes_variable_name': 'resource_name_ctype',
+                                                'direction': 'in',
+                                                'documentation': {   'description': '\n'
+                                                                                    'Specifies the **resourceName** assigned by Measurement & Automation\n'
+                                                                                    'Explorer (MAX), for example "PXI1Slot3" where "PXI1Slot3" is an\n'
+                                                                                    "instrument's **resourceName**. **resourceName** can also be a logical\n"
+                                                                                    'IVI name.\n'},
+                                                'enum': None,
+                                                'is_buffer': False,
+                                                'is_repeated_capability': False,
+                                                'is_session_handle': False,
+                                                'is_string': True,
+                                                'library_method_call_snippet': 'resource_name_ctype',
+                                                'name': 'resourceName',
+                                                'numpy': False,
+                                                'numpy_into_return': False,
+                                                'python_name': 'resource_name',
+                                                'python_name_or_default_for_init': 'resource_name',
+                                                'python_name_with_default': 'resource_name',
+                                                'python_name_with_doc_default': 'resource_name',
+                                                'python_type': 'str',
+                                                'size': {'mechanism': 'fixed', 'value': 1},
+                                                'type': 'ViRsrc',
+                                                'use_array': False,
+                                                'use_in_python_api': True,
+                                                'use_list': False},
+                                            {   'ctypes_type': 'ViChar[]',
+                                                'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                'ctypes_variable_name': 'channels_ctype',
+                                                'default_value': '""',
+                                                'direction': 'in',
+                                                'documentation': {   'description': '\n'
+                                                                                    'Specifies which output channel(s) to include in a new session. Specify\n'
+                                                                                    'multiple channels by using a channel list or a channel range. A channel\n'
+                                                                                    'list is a comma (,) separated sequence of channel names (for example,\n'
+                                                                                    '0,2 specifies channels 0 and 2). A channel range is a lower bound\n'
+                                                                                    'channel followed by a hyphen (-) or colon (:) followed by an upper bound\n'
+                                                                                    'channel (for example, 0-2 specifies channels 0, 1, and 2). In the\n'
+                                                                                    'Running state, multiple output channel configurations are performed\n'
+                                                                                    'sequentially based on the order specified in this parameter. If you do\n'
+                                                                                    'not specify any channels, by default all channels on the device are\n'
+                                                                                    'included in the session.\n'},
+                                                'enum': None,
+                                                'is_buffer': False,
+                                                'is_repeated_capability': False,
+                                                'is_session_handle': False,
+                                                'is_string': True,
+                                                'library_method_call_snippet': 'channels_ctype',
+                                                'name': 'Channels',
+                                                'numpy': False,
+                                                'numpy_into_return': False,
+                                                'python_name': 'channels',
+                                                'python_name_or_default_for_init': 'channels',
+                                                'python_name_with_default': 'channels=""',
+                                                'python_name_with_doc_default': 'channels=\'""\'',
+                                                'python_type': 'str',
+                                                'size': {'mechanism': 'fixed', 'value': 1},
+                                                'type': 'ViChar[]',
+                                                'use_array': False,
+                                                'use_in_python_api': True,
+                                                'use_list': False},
+                                            {   'ctypes_type': 'ViBoolean',
+                                                'ctypes_type_library_call': 'ViBoolean',
+                                                'ctypes_variable_name': 'reset_ctype',
+                                                'default_value': False,
+                                                'direction': 'in',
+                                                'documentation': {'description': '\nSpecifies whether to reset the device during the initialization\nprocedure.\n'},
+                                                'enum': None,
+                                                'is_buffer': False,
+                                                'is_repeated_capability': False,
+                                                'is_session_handle': False,
+                                                'is_string': False,
+                                                'library_method_call_snippet': 'reset_ctype',
+                                                'name': 'Reset',
+                                                'numpy': False,
+                                                'numpy_into_return': False,
+                                                'python_name': 'reset',
+                                                'python_name_or_default_for_init': 'reset',
+                                                'python_name_with_default': 'reset=False',
+                                                'python_name_with_doc_default': 'reset=False',
+                                                'python_type': 'bool',
+                                                'size': {'mechanism': 'fixed', 'value': 1},
+                                                'type': 'ViBoolean',
+                                                'use_array': False,
+                                                'use_in_python_api': True,
+                                                'use_list': False},
+                                            {   'ctypes_type': 'ViChar[]',
+                                                'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                'ctypes_variable_name': 'option_string_ctype',
+                                                'default_value': '""',
+                                                'direction': 'in',
+                                                'documentation': {   'description': '\n'
+                                                                                    'Specifies the initial value of certain attributes for the session. The\n'
+                                                                                    'syntax for **options** is a dictionary of attributes with an assigned\n'
+                                                                                    'value. For example:\n'
+                                                                                    '\n'
+                                                                                    "{ 'simulate': False }\n"
+                                                                                    '\n'
+                                                                                    'You do not have to specify a value for all the attributes. If you do not\n'
+                                                                                    'specify a value for an attribute, the default value is used.\n'
+                                                                                    '\n'
+                                                                                    'Advanced Example:\n'
+                                                                                    "{ 'simulate': True, 'driver_setup': { 'Model': '<model number>',  'BoardType': '<type>' } }\n",
+                                                                     'table_body': [   ['range_check', 'True'],
+                                                                                       ['query_instrument_status', 'False'],
+                                                                                       ['cache', 'True'],
+                                                                                       ['simulate', 'False'],
+                                                                                       ['record_value_coersions', 'False'],
+                                                                                       ['driver_setup', '{}']],
+                                                                     'table_header': ['Attribute', 'Default']},
+                                                'enum': None,
+                                                'is_buffer': False,
+                                                'is_repeated_capability': False,
+                                                'is_session_handle': False,
+                                                'is_string': True,
+                                                'library_method_call_snippet': 'option_string_ctype',
+                                                'name': 'optionString',
+                                                'numpy': False,
+                                                'numpy_into_return': False,
+                                                'python_api_converter_name': 'convert_init_with_options_dictionary',
+                                                'python_name': 'options',
+                                                'python_name_or_default_for_init': '_converters.convert_init_with_options_dictionary(option_string, self._encoding)',
+                                                'python_name_with_default': 'options={}',
+                                                'python_name_with_doc_default': 'option_string=\'""\'',
+                                                'python_type': 'dict',
+                                                'size': {'mechanism': 'fixed', 'value': 1},
+                                                'type': 'ViChar[]',
+                                                'use_array': False,
+                                                'use_in_python_api': True,
+                                                'use_list': False},
+                                            {   'ctypes_type': 'ViSession',
+                                                'ctypes_type_library_call': 'ctypes.POINTER(ViSession)',
+                                                'ctypes_variable_name': 'vi_ctype',
+                                                'direction': 'out',
+                                                'documentation': {'description': '\nA session object representing the device.\n'},
+                                                'enum': None,
+                                                'is_buffer': False,
+                                                'is_repeated_capability': False,
+                                                'is_session_handle': False,
+                                                'is_string': False,
+                                                'library_method_call_snippet': 'None if vi_ctype is None else (ctypes.pointer(vi_ctype))',
+                                                'name': 'vi',
+                                                'numpy': False,
+                                                'numpy_into_return': False,
+                                                'python_name': 'session',
+                                                'python_name_or_default_for_init': 'vi',
+                                                'python_name_with_default': 'vi',
+                                                'python_name_with_doc_default': 'vi',
+                                                'python_type': 'nidcpower.Session',
+                                                'size': {'mechanism': 'fixed', 'value': 1},
+                                                'type': 'ViSession',
+                                                'use_array': False,
+                                                'use_in_python_api': True,
+                                                'use_list': False}],
+                          'python_code_variables': [],
+                          'python_name': '_initialize_with_channels',
+                          'render_in_library': True,
+                          'render_in_session_base': False,
+                          'returns': 'ViStatus'},
+    'close': {   'blocking': False,
+                 'codegen_method': 'private',
+                 'documentation': {   'description': '\n'
+                                                     'Closes the session specified in **vi** and deallocates the resources\n'
+                                                     'that NI-DCPower reserves. If power output is enabled when you call this\n'
+                                                     'function, the output channels remain in their existing state and\n'
+                                                     'continue providing power. Use the niDCPower_ConfigureOutputEnabled\n'
+                                                     'function to disable power output on a per channel basis. Use the\n'
+                                                     'niDCPower_reset function to disable power output on all channel(s).\n'
+                                                     '\n'
+                                                     '**Related Topics:**\n'
+                                                     '\n'
+                                                     '`Programming\n'
+                                                     'States <REPLACE_DRIVER_SPECIFIC_URL_1(programmingstates)>`__\n',
+                                      'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                 'has_repeated_capability': False,
+                 'invalidates_attribute_cache': False,
+                 'is_error_handling': False,
+                 'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                 'name': 'close',
+                 'parameters': [   {   'ctypes_type': 'ViSession',
+                                       'ctypes_type_library_call': 'ViSession',
+                                       'ctypes_variable_name': 'vi_ctype',
+                                       'direction': 'in',
+                                       'documentation': {'description': '\nIdentifies a particular instrument session. **vi** is obtained from the\nniDCPower_InitializeWithChannels function.\n'},
+                                       'enum': None,
+                                       'is_buffer': False,
+                                       'is_repeated_capability': False,
+                                       'is_session_handle': True,
+                                       'is_string': False,
+                                       'library_method_call_snippet': 'vi_ctype',
+                                       'name': 'vi',
+                                       'numpy': False,
+                                       'numpy_into_return': False,
+                                       'python_name': 'vi',
+                                       'python_name_or_default_for_init': 'vi',
+                                       'python_name_with_default': 'vi',
+                                       'python_name_with_doc_default': 'vi',
+                                       'python_type': 'int',
+                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                       'type': 'ViSession',
+                                       'use_array': False,
+                                       'use_in_python_api': True,
+                                       'use_list': False}],
+                 'python_code_variables': [],
+                 'python_name': '_close',
+                 'render_in_library': True,
+                 'render_in_session_base': False,
+                 'returns': 'ViStatus'},
+    'error_message': {   'blocking': False,
+                         'codegen_method': 'private',
+                         'documentation': {'description': '\nConverts a status code returned by an instrument driver function into a\nuser-readable string.\n'},
+                         'has_repeated_capability': False,
+                         'invalidates_attribute_cache': False,
+                         'is_error_handling': True,
+                         'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                         'name': 'error_message',
+                         'parameters': [   {   'ctypes_type': 'ViSession',
+                                               'ctypes_type_library_call': 'ViSession',
+                                               'ctypes_variable_name': 'vi_ctype',
+                                               'direction': 'in',
+                                               'documentation': {   'description': '\n'
+                                                                                   'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                   'niDCPower_InitializeWithChannels function.\n'},
+                                               'enum': None,
+                                               'is_buffer': False,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': True,
+                                               'is_string': False,
+                                               'library_method_call_snippet': 'vi_ctype',
+                                               'name': 'vi',
+                                               'numpy': False,
+                                               'numpy_into_return': False,
+                                               'python_name': 'vi',
+                                               'python_name_or_default_for_init': 'vi',
+                                               'python_name_with_default': 'vi',
+                                               'python_name_with_doc_default': 'vi',
+                                               'python_type': 'int',
+                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                               'type': 'ViSession',
+                                               'use_array': False,
+                                               'use_in_python_api': True,
+                                               'use_list': False},
+                                           {   'ctypes_type': 'ViStatus',
+                                               'ctypes_type_library_call': 'ViStatus',
+                                               'ctypes_variable_name': 'error_code_ctype',
+                                               'direction': 'in',
+                                               'documentation': {'description': '\nSpecifies the **status** parameter that is returned from any of the\nNI-DCPower functions.\n'},
+                                               'enum': None,
+                                               'is_buffer': False,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': False,
+                                               'is_string': False,
+                                               'library_method_call_snippet': 'error_code_ctype',
+                                               'name': 'errorCode',
+                                               'numpy': False,
+                                               'numpy_into_return': False,
+                                               'python_name': 'error_code',
+                                               'python_name_or_default_for_init': 'error_code',
+                                               'python_name_with_default': 'error_code',
+                                               'python_name_with_doc_default': 'error_code',
+                                               'python_type': 'int',
+                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                               'type': 'ViStatus',
+                                               'use_array': False,
+                                               'use_in_python_api': True,
+                                               'use_list': False},
+                                           {   'ctypes_type': 'ViChar[]',
+                                               'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                               'ctypes_variable_name': 'error_message_ctype',
+                                               'direction': 'out',
+                                               'documentation': {   'description': '\n'
+                                                                                   'Returns the user-readable message string that corresponds to the status\n'
+                                                                                   'code you specify.\n'
+                                                                                   'You must pass a ViChar array with at least 256 bytes.\n'},
+                                               'enum': None,
+                                               'is_buffer': False,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': False,
+                                               'is_string': True,
+                                               'library_method_call_snippet': 'error_message_ctype',
+                                               'name': 'errorMessage',
+                                               'numpy': False,
+                                               'numpy_into_return': False,
+                                               'python_name': 'error_message',
+                                               'python_name_or_default_for_init': 'error_message',
+                                               'python_name_with_default': 'error_message',
+                                               'python_name_with_doc_default': 'error_message',
+                                               'python_type': 'str',
+                                               'size': {'mechanism': 'fixed', 'value': 256},
+                                               'type': 'ViChar[]',
+                                               'use_array': False,
+                                               'use_in_python_api': True,
+                                               'use_list': False}],
+                         'python_code_variables': [],
+                         'python_name': '_error_message',
+                         'render_in_library': True,
+                         'render_in_session_base': True,
+                         'returns': 'ViStatus'},
+    'init': {   'codegen_method': 'no',
+                'documentation': {   'description': '\n'
+                                                    'This function is deprecated. Use niDCPower_InitializeWithChannels\n'
+                                                    'instead.\n'
+                                                    '\n'
+                                                    'Creates a new IVI instrument driver session to the device specified in\n'
+                                                    '**resourceName** and returns a session handle you use to identify the\n'
+                                                    'device in all subsequent NI-DCPower function calls. This function also\n'
+                                                    'sends initialization commands to set the device to the state necessary\n'
+                                                    'for the operation of NI-DCPower.\n'
+                                                    '\n'
+                                                    'To place the device in a known start-up state when creating a new\n'
+                                                    'session, set **resetDevice** to VI_TRUE. This action is equivalent to\n'
+                                                    'using the niDCPower_reset function.\n'
+                                                    '\n'
+                                                    'To open a session and leave the device in its existing configuration\n'
+                                                    'without passing through a transitional output state, set **resetDevice**\n'
+                                                    'to VI_FALSE, and immediately call the niDCPower_Abort function. Then\n'
+                                                    'configure the device as in the previous session, changing only the\n'
+                                                    'desired settings, and then call the niDCPower_Initiate function. Refer\n'
+                                                    'to the `deprecated programming state\n'
+                                                    'model <REPLACE_DRIVER_SPECIFIC_URL_1(initializedeprecatedmodel)>`__ for\n'
+                                                    'information about the specific software states.\n'},
+                'parameters': [   {   'direction': 'in',
+                                      'documentation': {   'description': '\n'
+                                                                          'Specifies the **resourceName** assigned by Measurement & Automation\n'
+                                                                          'Explorer (MAX), for example "PXI1Slot3" where "PXI1Slot3" is an\n'
+                                                                          "instrument's **resourceName**. **resourceName** can also be a logical\n"
+                                                                          'IVI name.\n'},
+                                      'name': 'resourceName',
+                                      'type': 'ViRsrc'},
+                                  {   'direction': 'in',
+                                      'documentation': {   'description': '\n'
+                                                                          'Specifies whether the device is queried to determine if the device is a\n'
+                                                                          'valid instrument for NI-DCPower.\n'
+                                                                          '**Defined Values**:\n',
+                                                           'table_body': [['VI_TRUE (1)', 'Perform ID query.'], ['VI_FALSE (0)', 'Do not perform ID query.']]},
+                                      'name': 'idQuery',
+                                      'type': 'ViBoolean'},
+                                  {   'direction': 'in',
+                                      'documentation': {   'description': '\nSpecifies whether to reset the device during the initialization\nprocedure.\n**Defined Values**:\n',
+                                                           'table_body': [['VI_TRUE (1)', 'Reset the device.'], ['VI_FALSE (0)', 'Do not reset the device.']]},
+                                      'name': 'resetDevice',
+                                      'type': 'ViBoolean'},
+                                  {   'direction': 'out',
+                                      'documentation': {'description': '\nReturns a session handle that you use to identify the session in all\nsubsequent NI-DCPower function calls.\n'},
+                                      'name': 'vi',
+                                      'type': 'ViSession'}],
+                'returns': 'ViStatus'},
+    'reset': {   'blocking': False,
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Resets the device to a known state. This function disables power\n'
+                                                     'generation, resets session attributes to their default values, commits\n'
+                                                     'the session attributes, and leaves the session in the Uncommitted state.\n'
+                                                     'Refer to the `Programming\n'
+                                                     'States <REPLACE_DRIVER_SPECIFIC_URL_1(programmingstates)>`__ topic for\n'
+                                                     'more information about NI-DCPower software states.\n'},
+                 'has_repeated_capability': False,
+                 'invalidates_attribute_cache': True,
+                 'is_error_handling': False,
+                 'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                 'name': 'reset',
+                 'parameters': [   {   'ctypes_type': 'ViSession',
+                                       'ctypes_type_library_call': 'ViSession',
+                                       'ctypes_variable_name': 'vi_ctype',
+                                       'direction': 'in',
+                                       'documentation': {'description': '\nIdentifies a particular instrument session. **vi** is obtained from the\nniDCPower_InitializeWithChannels function.\n'},
+                                       'enum': None,
+                                       'is_buffer': False,
+                                       'is_repeated_capability': False,
+                                       'is_session_handle': True,
+                                       'is_string': False,
+                                       'library_method_call_snippet': 'vi_ctype',
+                                       'name': 'vi',
+                                       'numpy': False,
+                                       'numpy_into_return': False,
+                                       'python_name': 'vi',
+                                       'python_name_or_default_for_init': 'vi',
+                                       'python_name_with_default': 'vi',
+                                       'python_name_with_doc_default': 'vi',
+                                       'python_type': 'int',
+                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                       'type': 'ViSession',
+                                       'use_array': False,
+                                       'use_in_python_api': True,
+                                       'use_list': False}],
+                 'python_code_variables': [],
+                 'python_name': 'reset',
+                 'render_in_library': True,
+                 'render_in_session_base': False,
+                 'returns': 'ViStatus'},
+    'revision_query': {   'codegen_method': 'no',
+                          'documentation': {'description': 'Returns the revision information of NI-DCPower and the device firmware.'},
+                          'parameters': [   {   'direction': 'in',
+                                                'documentation': {   'description': '\n'
+                                                                                    'Identifies a particular instrument session. **vi** is obtained from the\n'
+                                                                                    'niDCPower_InitializeWithChannels function.\n'},
+                                                'name': 'vi',
+                                                'type': 'ViSession'},
+                                            {   'direction': 'out',
+                                                'documentation': {'description': 'Returns the driver revision information for NI-DCPower.'},
+                                                'name': 'instrumentDriverRevision',
+                                                'type': 'ViChar[]'},
+                                            {   'direction': 'out',
+                                                'documentation': {   'description': '\n'
+                                                                                    'Returns firmware revision information for the device you are using. The\n'
+                                                                                    'size of this array must be at least 256 bytes.\n'},
+                                                'name': 'firmwareRevision',
+                                                'type': 'ViChar[]'}],
+                          'returns': 'ViStatus'},
+    'self_test': {   'blocking': True,
+                     'codegen_method': 'public',
+                     'documentation': {   'description': '\n'
+                                                         'Performs the device self-test routine and returns the test result(s).\n'
+                                                         'Calling this function implicitly calls the niDCPower_reset function.\n'
+                                                         '\n'
+                                                         'When calling niDCPower_self_test with the PXIe-4162/4163, specify all\n'
+                                                         'channels of your PXIe-4162/4163 with the channels input of\n'
+                                                         'niDCPower_InitializeWithChannels. You cannot self test a subset of\n'
+                                                         'PXIe-4162/4163 channels.\n',
+                                          'note': [   '\n'
+                                                      'This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same '
+                                                      'session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the '
+                                                      "Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.\n"]},
+                     'has_repeated_capability': False,
+                     'invalidates_attribute_cache': True,
+                     'is_error_handling': False,
+                     'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                     'name': 'self_test',
+                     'parameters': [   {   'ctypes_type': 'ViSession',
+                                           'ctypes_type_library_call': 'ViSession',
+                                           'ctypes_variable_name': 'vi_ctype',
+                                           'direction': 'in',
+                                           'documentation': {'description': '\nIdentifies a particular instrument session. **vi** is obtained from the\nniDCPower_InitializeWithChannels function.\n'},
+                                           'enum': None,
+                                           'is_buffer': False,
+                                           'is_repeated_capability': False,
+                                           'is_session_handle': True,
+                                           'is_string': False,
+                                           'library_method_call_snippet': 'vi_ctype',
+                                           'name': 'vi',
+                                           'numpy': False,
+                                           'numpy_into_return': False,
+                                           'python_name': 'vi',
+                                           'python_name_or_default_for_init': 'vi',
+                                           'python_name_with_default': 'vi',
+                                           'python_name_with_doc_default': 'vi',
+                                           'python_type': 'int',
+                                           'size': {'mechanism': 'fixed', 'value': 1},
+                                           'type': 'ViSession',
+                                           'use_array': False,
+                                           'use_in_python_api': True,
+                                           'use_list': False},
+                                       {   'ctypes_type': 'ViInt16',
+                                           'ctypes_type_library_call': 'ctypes.POINTER(ViInt16)',
+                                           'ctypes_variable_name': 'self_test_result_ctype',
+                                           'direction': 'out',
+                                           'documentation': {   'description': 'Returns the value result from the device self-test.',
+                                                                'table_body': [['0', 'Self test passed.'], ['1', 'Self test failed.']],
+                                                                'table_header': ['Self-Test Code', 'Description']},
+                                           'enum': None,
+                                           'is_buffer': False,
+                                           'is_repeated_capability': False,
+                                           'is_session_handle': False,
+                                           'is_string': False,
+                                           'library_method_call_snippet': 'None if self_test_result_ctype is None else (ctypes.pointer(self_test_result_ctype))',
+                                           'name': 'selfTestResult',
+                                           'numpy': False,
+                                           'numpy_into_return': False,
+                                           'python_name': 'self_test_result',
+                                           'python_name_or_default_for_init': 'self_test_result',
+                                           'python_name_with_default': 'self_test_result',
+                                           'python_name_with_doc_default': 'self_test_result',
+                                           'python_type': 'int',
+                                           'size': {'mechanism': 'fixed', 'value': 1},
+                                           'type': 'ViInt16',
+                                           'use_array': False,
+                                           'use_in_python_api': True,
+                                           'use_list': False},
+                                       {   'ctypes_type': 'ViChar[]',
+                                           'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                           'ctypes_variable_name': 'self_test_message_ctype',
+                                           'direction': 'out',
+                                           'documentation': {'description': '\nReturns the self-test result message. The size of this array must be at\nleast 256 bytes.\n'},
+                                           'enum': None,
+                                           'is_buffer': False,
+                                           'is_repeated_capability': False,
+                                           'is_session_handle': False,
+                                           'is_string': True,
+                                           'library_method_call_snippet': 'self_test_message_ctype',
+                                           'name': 'selfTestMessage',
+                                           'numpy': False,
+                                           'numpy_into_return': False,
+                                           'python_name': 'self_test_message',
+                                           'python_name_or_default_for_init': 'self_test_message',
+                                           'python_name_with_default': 'self_test_message',
+                                           'python_name_with_doc_default': 'self_test_message',
+                                           'python_type': 'str',
+                                           'size': {'mechanism': 'fixed', 'value': 256},
+                                           'type': 'ViChar[]',
+                                           'use_array': False,
+                                           'use_in_python_api': True,
+                                           'use_list': False}],
+                     'python_code_variables': [],
+                     'python_name': 'self_test',
+                     'render_in_library': True,
+                     'render_in_session_base': False,
+                     'returns': 'ViStatus'}}
\ No newline at end of file
@@ -0,0 +1,1411 @@
+attributes =
+{   1050002: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies whether to validate attribute values and function parameters. If  enabled, the instrument driver validates the parameter values passed '
+                                                     'to  driver functions. Range checking parameters is very useful for debugging.  After the user program is validated, this attribute can be set to '
+                                                     'VI_FALSE (0) to  disable range checking and maximize performance.\n'
+                                                     'The default value is VI_TRUE (1). Use the niDMM_InitWithOptions function to  override this value.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:User Options:Range Check',
+                 'name': 'RANGE_CHECK',
+                 'python_name': 'range_check',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1050003: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies whether the instrument driver queries the instrument status after  each operation. Querying the instrument status is very useful for '
+                                                     'debugging.  After the user program is validated, this attribute can be set to VI_FALSE (0) to  disable status checking and maximize '
+                                                     'performance.\n'
+                                                     'The instrument driver can choose to ignore status checking for particular  attributes regardless of the setting of this attribute.\n'
+                                                     'The default value is VI_TRUE (1). Use the niDMM_InitWithOptions function to  override this value.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:User Options:Query Instrument Status',
+                 'name': 'QUERY_INSTRUMENT_STATUS',
+                 'python_name': 'query_instrument_status',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1050004: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': 'Specifies whether to cache the value of attributes. When caching is enabled,  the instrument driver keeps track of the current instrument '
+                                                     'settings and  avoids sending redundant commands to the instrument. Thus, it significantly  increases execution speed. The instrument driver can '
+                                                     'choose always to cache  or to never cache particular attributes regardless of the setting of this  attribute. The default value is VI_TRUE (1). '
+                                                     'Use the niDMM_InitWithOptions  function to override this value.'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:User Options:Cache',
+                 'name': 'CACHE',
+                 'python_name': 'cache',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1050005: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies whether or not to simulate instrument driver I/O operations. If  simulation is enabled, instrument driver functions perform range '
+                                                     'checking and  call IVI Get and Set functions, but they do not perform  instrument I/O. For output parameters that represent instrument data, '
+                                                     'the  instrument driver functions return calculated values.\n'
+                                                     'The default value is VI_FALSE (0). Use the niDMM_InitWithOptions function to  override this setting.\n'
+                                                     'Simulate can only be set within the InitWithOptions function.  The attribute value cannot be changed outside of the function.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:User Options:Simulate',
+                 'name': 'SIMULATE',
+                 'python_name': 'simulate',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1050006: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies whether the IVI engine keeps a list of the value coercions it makes  for ViInt32 and ViReal64 attributes. Call '
+                                                     'niDMM_GetNextCoercionRecord to extract  and delete the oldest coercion record from the list.\n'
+                                                     'The default value is VI_FALSE (0). Use the niDMM_InitWithOptions function to  override this value.\n',
+                                      'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:User Options:Record Value Coercions',
+                 'name': 'RECORD_COERCIONS',
+                 'python_name': 'record_coercions',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1050007: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'This attribute indicates the Driver Setup string that the user specified when  initializing the driver.\n'
+                                                     'Some cases exist where the end-user must specify instrument driver options  at initialization time.  An example of this is specifying a '
+                                                     'particular  instrument model from among a family of instruments that the driver supports.   This is useful when using simulation.  The end-user '
+                                                     'can specify  driver-specific options through the DriverSetup keyword in the optionsString  parameter to the niDMM Init With Options.vi.\n'
+                                                     'If the user does not specify a Driver Setup string, this attribute returns  an empty string.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:User Options:Driver Setup',
+                 'name': 'DRIVER_SETUP',
+                 'python_name': 'driver_setup',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1050021: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies whether to perform interchangeability checking and log  interchangeability warnings when you call niDMM functions.\n'
+                                                     'The default value is VI_FALSE.\n'
+                                                     'Interchangeability warnings indicate that using your application with a  different instrument might cause different behavior.  Call '
+                                                     'niDMM_GetNextInterchangeWarning  to extract interchange warnings.  Call niDMM_ClearInterchangeWarnings  to clear the list of interchangeability '
+                                                     'warnings  without reading them.\n'
+                                                     'Interchangeability checking examines the attributes in a capability group  only if you specify a value for at least one attribute within that '
+                                                     'group.   Interchangeability warnings can occur when an attribute affects the behavior  of the instrument and you have not set that attribute, or '
+                                                     'the attribute has  been invalidated since you set it.\n',
+                                      'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:User Options:Interchange Check',
+                 'name': 'INTERCHANGE_CHECK',
+                 'python_name': 'interchange_check',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1050101: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': '\n'
+                                                     'A code that describes the first error that occurred since the last call\n'
+                                                     'to niDMM Get Error for the session. The value follows the VXIplug&play\n'
+                                                     'conventions. A negative value describes an error condition. A positive\n'
+                                                     'value describes a warning condition. A zero indicates that no error or\n'
+                                                     'warning occurred. The error and warning values can be status codes\n'
+                                                     'defined by IVI, VISA, class drivers, or specific drivers.\n'},
+                 'enum': None,
+                 'lv_property': 'Obsolete:Inherent IVI Attributes:Error Info:Primary Error',
+                 'name': 'PRIMARY_ERROR',
+                 'python_name': 'primary_error',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1050102: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': '\n'
+                                                     'An optional code that provides additional information concerning the\n'
+                                                     'primary error condition. The error and warning values can be status\n'
+                                                     'codes defined by IVI, VISA, class drivers, or specific drivers. Zero\n'
+                                                     'indicates no additional information.\n'},
+                 'enum': None,
+                 'lv_property': 'Obsolete:Inherent IVI Attributes:Error Info:Secondary Error',
+                 'name': 'SECONDARY_ERROR',
+                 'python_name': 'secondary_error',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1050103: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nAn optional string that contains additional information concerning the\nprimary error condition.\n'},
+                 'enum': None,
+                 'lv_property': 'Obsolete:Inherent IVI Attributes:Error Info:Error Elaboration',
+                 'name': 'ERROR_ELABORATION',
+                 'python_name': 'error_elaboration',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1050203: {   'access': 'read only',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': 'Indicates the number of channels that the specific instrument driver  supports. For each attribute for which the IVI_VAL_MULTI_CHANNEL flag  '
+                                                     'attribute is set, the IVI engine maintains a separate cache value for each  channel.'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Instrument Capabilities:Channel Count',
+                 'name': 'CHANNEL_COUNT',
+                 'python_name': 'channel_count',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1050302: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': '\n'
+                                                     'The prefix for the specific instrument driver.  The name of each  user-callable function in this driver starts with this prefix.\n'
+                                                     'The prefix can be up to a maximum of eight characters.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Instrument Capabilities:Specific Driver Prefix',
+                 'name': 'SPECIFIC_DRIVER_PREFIX',
+                 'python_name': 'specific_driver_prefix',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1050304: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nA string containing the resource descriptor of the instrument.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Advanced Session Information:I/O Resource Descriptor',
+                 'name': 'IO_RESOURCE_DESCRIPTOR',
+                 'python_name': 'io_resource_descriptor',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1050305: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nA string containing the logical name of the instrument.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Advanced Session Information:Logical Name',
+                 'name': 'LOGICAL_NAME',
+                 'python_name': 'logical_name',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1050327: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nA string containing the instrument models supported by the specific driver.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Specific Driver Capabilities:Supported Instrument Models',
+                 'name': 'SUPPORTED_INSTRUMENT_MODELS',
+                 'python_name': 'supported_instrument_models',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1050401: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nA string containing the capabilities and extension groups supported by the  specific driver.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Specific Driver Capabilities:Group Capabilities',
+                 'name': 'GROUP_CAPABILITIES',
+                 'python_name': 'group_capabilities',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1050501: {   'access': 'read only',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'no',
+                 'documentation': {'description': 'The major version number of the IVI engine.'},
+                 'enum': None,
+                 'lv_property': 'Obsolete:Inherent IVI Attributes:Version Info:Engine Major Version',
+                 'name': 'ENGINE_MAJOR_VERSION',
+                 'python_name': 'engine_major_version',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1050502: {   'access': 'read only',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'no',
+                 'documentation': {'description': 'The minor version number of the IVI engine.'},
+                 'enum': None,
+                 'lv_property': 'Obsolete:Inherent IVI Attributes:Version Info:Engine Minor Version',
+                 'name': 'ENGINE_MINOR_VERSION',
+                 'python_name': 'engine_minor_version',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1050503: {   'access': 'read only',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nReturns the major version number of this instrument driver.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Version Info:Specific Driver Major Version',
+                 'name': 'SPECIFIC_DRIVER_MAJOR_VERSION',
+                 'python_name': 'specific_driver_major_version',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1050504: {   'access': 'read only',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nThe minor version number of this instrument driver.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Version Info:Specific Driver Minor Version',
+                 'name': 'SPECIFIC_DRIVER_MINOR_VERSION',
+                 'python_name': 'specific_driver_minor_version',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1050510: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nA string containing the instrument firmware revision number.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Instrument Identification:Instrument Firmware Revision',
+                 'name': 'INSTRUMENT_FIRMWARE_REVISION',
+                 'python_name': 'instrument_firmware_revision',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1050511: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nA string containing the manufacturer of the instrument.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Instrument Identification:Instrument Manufacturer',
+                 'name': 'INSTRUMENT_MANUFACTURER',
+                 'python_name': 'instrument_manufacturer',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1050512: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nA string containing the instrument model.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Instrument Identification:Instrument Model',
+                 'name': 'INSTRUMENT_MODEL',
+                 'python_name': 'instrument_model',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1050513: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nA string containing the vendor of the specific driver.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Specific Driver Identification:Specific Driver Vendor',
+                 'name': 'SPECIFIC_DRIVER_VENDOR',
+                 'python_name': 'specific_driver_vendor',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1050514: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nA string containing a description of the specific driver.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Specific Driver Identification:Specific Driver Description',
+                 'name': 'SPECIFIC_DRIVER_DESCRIPTION',
+                 'python_name': 'specific_driver_description',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1050515: {   'access': 'read only',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nThe major version number of the class specification for the specific driver.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Specific Driver Identification:Specific Driver Class Spec Major Version',
+                 'name': 'SPECIFIC_DRIVER_CLASS_SPEC_MAJOR_VERSION',
+                 'python_name': 'specific_driver_class_spec_major_version',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1050516: {   'access': 'read only',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nThe minor version number of the class specification for the specific driver.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Specific Driver Identification:Specific Driver Class Spec Minor Version',
+                 'name': 'SPECIFIC_DRIVER_CLASS_SPEC_MINOR_VERSION',
+                 'python_name': 'specific_driver_class_spec_minor_version',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1050551: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nA string that contains additional version information about this specific  instrument driver.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Version Info:Specific Driver Revision',
+                 'name': 'SPECIFIC_DRIVER_REVISION',
+                 'python_name': 'specific_driver_revision',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1050553: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nA string that contains additional version information about the IVI\nengine.\n'},
+                 'enum': None,
+                 'lv_property': 'Obsolete:Inherent IVI Attributes:Version Info:Engine Revision',
+                 'name': 'ENGINE_REVISION',
+                 'python_name': 'engine_revision',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1150001: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nA string containing the type of instrument used in the current session.\n'},
+                 'enum': None,
+                 'lv_property': 'Obsolete:Misc:IDQuery response',
+                 'name': 'ID_QUERY_RESPONSE',
+                 'python_name': 'id_query_response',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1150002: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nSpecifies the polarity of the generated measurement complete signal.\n'},
+                 'enum': 'MeasurementDestinationSlope',
+                 'lv_property': 'Trigger:Measurement Destination Slope',
+                 'name': 'MEAS_DEST_SLOPE',
+                 'python_name': 'meas_dest_slope',
+                 'python_type': 'enums.MeasurementDestinationSlope',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150003: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'For the NI 4050 only, specifies the shunt resistance value.\n'
+                                                     'The NI 4050 requires an external shunt resistor for current measurements.  This attribute should be set to the value of shunt resistor.\n'},
+                 'enum': None,
+                 'lv_property': 'Configuration:Measurement Options:Shunt Value',
+                 'name': 'SHUNT_VALUE',
+                 'python_name': 'shunt_value',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150010: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nSpecifies the edge of the signal from the specified sample trigger source on  which the DMM is triggered.\n'},
+                 'enum': 'SampleTrigSlope',
+                 'lv_property': 'Multi Point Acquisition:Sample Trig Slope',
+                 'name': 'SAMPLE_TRIGGER_SLOPE',
+                 'python_name': 'sample_trigger_slope',
+                 'python_type': 'enums.SampleTrigSlope',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150014: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies how the NI 4065 and NI 4070/4071/4072 acquire data. When you call  niDMM_ConfigureMeasurementDigits, NI-DMM sets this attribute to '
+                                                     'NIDMM_VAL_IVIDMM_MODE.  When you call niDMM_ConfigureWaveformAcquisition, NI-DMM sets this attribute to NIDMM_VAL_WAVEFORM_MODE.  If you are '
+                                                     'programming attributes directly, you must set this attribute before  setting other configuration attributes.\n'},
+                 'enum': 'OperationMode',
+                 'lv_property': 'Configuration:Advanced:Operation Mode',
+                 'name': 'OPERATION_MODE',
+                 'python_name': 'operation_mode',
+                 'python_type': 'enums.OperationMode',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150018: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': 'For the NI 4070/4071/4072 only, specifies the rate of the waveform acquisition in Samples per second (S/s).  The valid Range is 10.0-1,800,000 '
+                                                     'S/s. Values are coerced to the  closest integer divisor of 1,800,000. The default value is 1,800,000.'},
+                 'enum': None,
+                 'lv_property': 'Waveform Acquisition:Waveform Rate',
+                 'name': 'WAVEFORM_RATE',
+                 'python_name': 'waveform_rate',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150019: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nFor the NI 4070/4071/4072 only, specifies the number of points to acquire in a waveform acquisition.\n'},
+                 'enum': None,
+                 'lv_property': 'Waveform Acquisition:Waveform Points',
+                 'name': 'WAVEFORM_POINTS',
+                 'python_name': 'waveform_points',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150022: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nFor the NI 4070/4071/4072 only, specifies the ADC calibration mode.\n'},
+                 'enum': 'ADCCalibration',
+                 'lv_property': 'Configuration:Measurement Options:ADC Calibration',
+                 'name': 'ADC_CALIBRATION',
+                 'python_name': 'adc_calibration',
+                 'python_type': 'enums.ADCCalibration',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150023: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nFor the NI 4070/4071/4072 only, enables or disables offset compensated ohms.\n'},
+                 'enum': None,
+                 'lv_property': 'Configuration:Measurement Options:Offset Compensated Ohms',
+                 'name': 'OFFSET_COMP_OHMS',
+                 'python_name': 'offset_comp_ohms',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150025: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nSpecifies the current source provided during diode measurements.\nThe NI 4050 and NI 4060 are not supported.\n'},
+                 'enum': None,
+                 'lv_property': 'Configuration:Measurement Options:Current Source',
+                 'name': 'CURRENT_SOURCE',
+                 'python_name': 'current_source',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150026: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nSpecifies the DC noise rejection mode.\nThe NI 4050 and NI 4060 are not supported.\n'},
+                 'enum': 'DCNoiseRejection',
+                 'lv_property': 'Configuration:Measurement Options:DC Noise Rejection',
+                 'name': 'DC_NOISE_REJECTION',
+                 'python_name': 'dc_noise_rejection',
+                 'python_type': 'enums.DCNoiseRejection',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150027: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nFor the NI 4070/4071/4072 only, specifies the coupling during a waveform acquisition.\n'},
+                 'enum': 'WaveformCoupling',
+                 'lv_property': 'Waveform Acquisition:Waveform Coupling',
+                 'name': 'WAVEFORM_COUPLING',
+                 'python_name': 'waveform_coupling',
+                 'python_type': 'enums.WaveformCoupling',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150028: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64TimeDeltaSeconds',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the settling time in seconds. To override the default settling time,  set this attribute. To return to the default, set this attribute '
+                                                     'to  NIDMM_VAL_SETTLE_TIME_AUTO (-1).\n'
+                                                     'The NI 4050 and NI 4060 are not supported.\n',
+                                      'note': [   '\n'
+                                                  'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or represent True/False, have been '
+                                                  'removed.\n']},
+                 'enum': None,
+                 'lv_property': 'Configuration:Advanced:Settle Time',
+                 'name': 'SETTLE_TIME',
+                 'python_name': 'settle_time',
+                 'python_type': 'datetime.timedelta',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150029: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nSpecifies the input resistance of the instrument.\nThe NI 4050 and NI 4060 are not supported.\n'},
+                 'enum': None,
+                 'lv_property': 'Configuration:Measurement Options:Input Resistance',
+                 'name': 'INPUT_RESISTANCE',
+                 'python_name': 'input_resistance',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150031: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': '\n'
+                                                     'For the NI 4060 only, specifies a delay interval after an sample external trigger.\n'
+                                                     '0\n'
+                                                     'NIDMM_ATTR_SAMPLE_INTERVAL is only used when the Sample Trigger attribute is set to  INTERVAL.\n'
+                                                     '1\n'
+                                                     'NIDMM_ATTR_SAMPLE_INTERVAL is used as a delay after ANY type of Sample  Trigger\n'},
+                 'enum': None,
+                 'lv_property': 'Multi Point Acquisition:Sample Delay Mode',
+                 'name': 'SAMPLE_DELAY_MODE',
+                 'python_name': 'sample_delay_mode',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150032: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the number of averages to perform in a measurement. For the NI 4070/4071/4072,  applies only when the aperture time is not set to AUTO '
+                                                     'and Auto Zero is ON.  The default is 1.\n'
+                                                     'The NI 4050 and NI 4060 are not supported.\n'},
+                 'enum': None,
+                 'lv_property': 'Configuration:Advanced:Number Of Averages',
+                 'name': 'NUMBER_OF_AVERAGES',
+                 'python_name': 'number_of_averages',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150034: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the number of measurements transferred at a time from the  instrument to an internal buffer. When set to NIDMM_VAL_LATENCY_AUTO (-1),  '
+                                                     'NI-DMM chooses the transfer size.\n',
+                                      'note': [   '\n'
+                                                  'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or represent True/False, have been '
+                                                  'removed.\n']},
+                 'enum': None,
+                 'lv_property': 'Multi Point Acquisition:Advanced:Latency',
+                 'name': 'LATENCY',
+                 'python_name': 'latency',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150037: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Size in samples of the internal data buffer. Maximum is 134,217,727 (OX7FFFFFF) samples. When  set to NIDMM_VAL_BUFFER_SIZE_AUTO (-1), NI-DMM '
+                                                     'chooses the buffer size.\n',
+                                      'note': [   '\n'
+                                                  'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or represent True/False, have been '
+                                                  'removed.\n']},
+                 'enum': None,
+                 'lv_property': 'Multi Point Acquisition:Advanced:Buffer Size',
+                 'name': 'BUFFER_SIZE',
+                 'python_name': 'buffer_size',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150044: {   'access': 'read only',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': False,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'For the NI 4070/4071/4072 only, specifies the value of the frequency voltage range.  If Auto Ranging, shows the actual value of the active '
+                                                     'frequency voltage range.  If not Auto Ranging, the value of this attribute is the same as that of  NIDMM_ATTR_FREQ_VOLTAGE_RANGE.\n'},
+                 'enum': None,
+                 'lv_property': 'Configuration:Measurement Options:Frequency Voltage Auto Range Value',
+                 'name': 'FREQ_VOLTAGE_AUTORANGE',
+                 'python_name': 'freq_voltage_autorange',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150045: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'For the NI 4072 only,  the type of cable compensation that is applied to the current capacitance  or inductance measurement for the current '
+                                                     'range.\n'
+                                                     'Changing the function or the range through this attribute or through niDMM_ConfigureMeasurementDigits  resets the value of this attribute to the '
+                                                     'default value.\n'},
+                 'enum': 'CableCompensationType',
+                 'lv_property': 'Configuration:Measurement Options:Capacitance and Inductance:Cable Compensation Type',
+                 'name': 'CABLE_COMP_TYPE',
+                 'python_name': 'cable_comp_type',
+                 'python_type': 'enums.CableCompensationType',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150046: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'For the NI 4072 only, represents the reactive part (reactance) of the short cable compensation.  The valid range is any real number greater than '
+                                                     '0. The default value (-1)  indicates that compensation has not taken place.\n'
+                                                     'Changing the function or the range through this attribute or through niDMM_ConfigureMeasurementDigits  resets the value of this attribute to the '
+                                                     'default value.\n'},
+                 'enum': None,
+                 'lv_property': 'Configuration:Measurement Options:Capacitance and Inductance:Short Cable Compensation Values:Reactance',
+                 'name': 'SHORT_CABLE_COMP_REACTANCE',
+                 'python_name': 'short_cable_comp_reactance',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150047: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'For the NI 4072 only, represents the active part (resistance) of the short cable compensation.  The valid range is any real number greater than '
+                                                     '0. The default value (-1)  indicates that compensation has not taken place.\n'
+                                                     'Changing the function or the range through this attribute or through niDMM_ConfigureMeasurementDigits  resets the value of this attribute to the '
+                                                     'default value.\n'},
+                 'enum': None,
+                 'lv_property': 'Configuration:Measurement Options:Capacitance and Inductance:Short Cable Compensation Values:Resistance',
+                 'name': 'SHORT_CABLE_COMP_RESISTANCE',
+                 'python_name': 'short_cable_comp_resistance',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150048: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'For the NI 4072 only, specifies the reactive part (susceptance) of the open cable compensation.  The valid range is any real number greater than '
+                                                     '0. The default value (-1.0)  indicates that compensation has not taken place.\n'
+                                                     'Changing the function or the range through this attribute or through niDMM_ConfigureMeasurementDigits  resets the value of this attribute to the '
+                                                     'default value.\n'},
+                 'enum': None,
+                 'lv_property': 'Configuration:Measurement Options:Capacitance and Inductance:Open Cable Compensation Values:Susceptance',
+                 'name': 'OPEN_CABLE_COMP_SUSCEPTANCE',
+                 'python_name': 'open_cable_comp_susceptance',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150049: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'For the NI 4072 only, specifies the active part (conductance) of the open cable compensation.  The valid range is any real number greater than '
+                                                     '0. The default value (-1.0)  indicates that compensation has not taken place.\n'
+                                                     'Changing the function or the range through this attribute or through niDMM_ConfigureMeasurementDigits  resets the value of this attribute to the '
+                                                     'default value.\n'},
+                 'enum': None,
+                 'lv_property': 'Configuration:Measurement Options:Capacitance and Inductance:Open Cable Compensation Values:Conductance',
+                 'name': 'OPEN_CABLE_COMP_CONDUCTANCE',
+                 'python_name': 'open_cable_comp_conductance',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150052: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nFor the NI 4072 only, specifies the type of algorithm that the measurement processing uses for  capacitance and inductance measurements.\n'},
+                 'enum': 'LCCalculationModel',
+                 'lv_property': 'Configuration:Measurement Options:Capacitance and Inductance:Advanced:Calculation Model',
+                 'name': 'LC_CALCULATION_MODEL',
+                 'python_name': 'lc_calculation_model',
+                 'python_type': 'enums.LCCalculationModel',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150053: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nFor the NI 4072 only, controls the available DC bias for capacitance measurements.\n'},
+                 'enum': None,
+                 'lv_property': 'Configuration:Measurement Options:Capacitance and Inductance:Advanced:DC Bias',
+                 'name': 'DC_BIAS',
+                 'python_name': 'dc_bias',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150054: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'A string containing the serial number of the instrument. This attribute corresponds  to the serial number label that is attached to most '
+                                                     'products.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Instrument Identification:Instrument Serial Number',
+                 'name': 'SERIAL_NUMBER',
+                 'python_name': 'serial_number',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1150055: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nFor the NI 4072 only, specifies the number of LC measurements that are averaged to produce one reading.\n'},
+                 'enum': None,
+                 'lv_property': 'Configuration:Measurement Options:Capacitance and Inductance:Number of LC Measurements To Average',
+                 'name': 'LC_NUMBER_MEAS_TO_AVERAGE',
+                 'python_name': 'lc_number_meas_to_average',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150061: {   'access': 'read only',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': 'The PCI product ID.'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Instrument Identification:Instrument Product ID',
+                 'name': 'INSTRUMENT_PRODUCT_ID',
+                 'python_name': 'instrument_product_id',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150120: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the type of RTD used to measure temperature. The default value is NIDMM_VAL_TEMP_RTD_PT3851.\n'
+                                                     'Refer to the NIDMM_ATTR_TEMP_RTD_TYPE topic in the NI Digital Multimeters Help for additional information about defined values.\n'},
+                 'enum': 'RTDType',
+                 'lv_property': 'Configuration:Measurement Options:Temperature:Resistance Temperature Detector:RTD Type',
+                 'name': 'TEMP_RTD_TYPE',
+                 'python_name': 'temp_rtd_type',
+                 'python_type': 'enums.RTDType',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150121: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the Callendar-Van Dusen A coefficient for RTD scaling when the RTD Type property   is set to Custom. The default value is 3.9083e-3 '
+                                                     '(Pt3851).\n'},
+                 'enum': None,
+                 'lv_property': 'Configuration:Measurement Options:Temperature:Resistance Temperature Detector:RTD A',
+                 'name': 'TEMP_RTD_A',
+                 'python_name': 'temp_rtd_a',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150122: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the Callendar-Van Dusen B coefficient for RTD scaling when the RTD Type property  is set to Custom. The default value is '
+                                                     '-5.775e-7(Pt3851).\n'},
+                 'enum': None,
+                 'lv_property': 'Configuration:Measurement Options:Temperature:Resistance Temperature Detector:RTD B',
+                 'name': 'TEMP_RTD_B',
+                 'python_name': 'temp_rtd_b',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150123: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the Callendar-Van Dusen C coefficient for RTD scaling when the RTD Type property  is set to Custom. The default value is '
+                                                     '-4.183e-12(Pt3851).\n'},
+                 'enum': None,
+                 'lv_property': 'Configuration:Measurement Options:Temperature:Resistance Temperature Detector:RTD C',
+                 'name': 'TEMP_RTD_C',
+                 'python_name': 'temp_rtd_c',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150124: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the type of thermistor used to measure the temperature. The default value is  NIDMM_VAL_TEMP_THERMISTOR_44006.\n'
+                                                     'Refer to the NIDMM_ATTR_TEMP_THERMISTOR_TYPE topic in the NI Digital Multimeters Help for additional information about defined values.\n'},
+                 'enum': 'ThermistorType',
+                 'lv_property': 'Configuration:Measurement Options:Temperature:Thermistor:Thermistor Type',
+                 'name': 'TEMP_THERMISTOR_TYPE',
+                 'python_name': 'temp_thermistor_type',
+                 'python_type': 'enums.ThermistorType',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150125: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the Steinhart-Hart A coefficient for thermistor scaling when the Thermistor Type  property is set to Custom. The default value is '
+                                                     '0.0010295 (44006).\n'},
+                 'enum': None,
+                 'lv_property': 'Configuration:Measurement Options:Temperature:Thermistor:Thermistor A',
+                 'name': 'TEMP_THERMISTOR_A',
+                 'python_name': 'temp_thermistor_a',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150126: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the Steinhart-Hart B coefficient for thermistor scaling when the Thermistor Type  proerty is set to Custom. The default value is '
+                                                     '0.0002391 (44006).\n'},
+                 'enum': None,
+                 'lv_property': 'Configuration:Measurement Options:Temperature:Thermistor:Thermistor B',
+                 'name': 'TEMP_THERMISTOR_B',
+                 'python_name': 'temp_thermistor_b',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150127: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the Steinhart-Hart C coefficient for thermistor scaling when the Thermistor Type  property is set to Custom. The default value is '
+                                                     '1.568e-7 (44006).\n'},
+                 'enum': None,
+                 'lv_property': 'Configuration:Measurement Options:Temperature:Thermistor:Thermistor C',
+                 'name': 'TEMP_THERMISTOR_C',
+                 'python_name': 'temp_thermistor_c',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1250001: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the measurement function.\n'
+                                                     'Refer to the NIDMM_ATTR_FUNCTION topic in  the NI Digital Multimeters Help for device-specific information.\n'
+                                                     'If you are setting this attribute directly, you must also set the NIDMM_ATTR_OPERATION_MODE attribute,  which controls whether the DMM takes '
+                                                     'standard single or multipoint measurements, or acquires a waveform.  If you are programming attributes directly, you must set the '
+                                                     'NIDMM_ATTR_OPERATION_MODE attribute before  setting other configuration attributes. If the NIDMM_ATTR_OPERATION_MODE attribute is set to '
+                                                     'NIDMM_VAL_WAVEFORM_MODE,  the only valid function types are NIDMM_VAL_WAVEFORM_VOLTAGE and NIDMM_VAL_WAVEFORM_CURRENT. Set the  '
+                                                     'NIDMM_ATTR_OPERATION_MODE attribute to NIDMM_VAL_IVIDMM_MODE to set all other function values.\n'},
+                 'enum': 'Function',
+                 'lv_property': 'Configuration:Function',
+                 'name': 'FUNCTION',
+                 'python_name': 'function',
+                 'python_type': 'enums.Function',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1250002: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the measurement range. Use positive values to represent the  absolute value of the maximum expected measurement. The value is in '
+                                                     'units  appropriate for the current value of the NIDMM_ATTR_FUNCTION attribute. For  example, if NIDMM_ATTR_FUNCTION is set to NIDMM_VAL_VOLTS, '
+                                                     'the units are  volts.\n'
+                                                     'The NI 4050 and NI 4060 only support Auto Range when the trigger and  sample trigger is set to IMMEDIATE.\n'
+                                                     'NIDMM_VAL_AUTO_RANGE_ON -1.0\n'
+                                                     'NI-DMM performs an Auto Range before acquiring the measurement.\n'
+                                                     'NIDMM_VAL_AUTO_RANGE_OFF -2.0\n'
+                                                     'NI-DMM sets the Range to the current NIDMM_ATTR_AUTO_RANGE_VALUE and uses this range  for all subsequent measurements until the measurement '
+                                                     'configuration is changed.\n'
+                                                     'NIDMM_VAL_AUTO_RANGE_ONCE -3.0\n'
+                                                     'NI-DMM performs an Auto Range before acquiring the next measurement. The NIDMM_ATTR_AUTO_RANGE_VALUE  is stored and used for all subsequent '
+                                                     'measurements until the measurement configuration is changed.\n',
+                                      'note': [   '\n'
+                                                  'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or represent True/False, have been '
+                                                  'removed.\n']},
+                 'enum': None,
+                 'lv_property': 'Configuration:Range',
+                 'name': 'RANGE',
+                 'python_name': 'range',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1250003: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the measurement resolution in digits. Setting this  attribute to higher values increases the measurement accuracy. Setting this  '
+                                                     'attribute to lower values increases the measurement speed.\n'
+                                                     'NI-DMM ignores this attribute for capacitance and inductance measurements on the NI 4072.  To achieve better resolution for such measurements, '
+                                                     'use the NIDMM_ATTR_LC_NUMBER_MEAS_TO_AVERAGE attribute.\n'},
+                 'enum': None,
+                 'lv_property': 'Configuration:Digits Resolution',
+                 'name': 'RESOLUTION_DIGITS',
+                 'python_name': 'resolution_digits',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1250004: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the trigger source. When niDMM_Initiate is called, the DMM waits  for the trigger specified with this attribute. After it receives the '
+                                                     'trigger,  the DMM waits the length of time specified with the NIDMM_ATTR_TRIGGER_DELAY  attribute. The DMM then takes a measurement.\n'
+                                                     'This attribute is not supported on the NI 4050.\n'
+                                                     'To determine which values are supported by each device, refer to the LabWindows/CVI Trigger Routing section in  the NI Digital Multimeters '
+                                                     'Help.\n'},
+                 'enum': 'TriggerSource',
+                 'lv_property': 'Trigger:Trigger Source',
+                 'name': 'TRIGGER_SOURCE',
+                 'python_name': 'trigger_source',
+                 'python_type': 'enums.TriggerSource',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1250005: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64TimeDeltaSeconds',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the time (in seconds) that the DMM waits after it has received a trigger before taking a measurement.  The default value is AUTO DELAY '
+                                                     '(-1), which means that the DMM waits an appropriate settling time before taking  the measurement. (-1) signifies that AUTO DELAY is on, and (-2) '
+                                                     'signifies that AUTO DELAY is off.\n'
+                                                     'The NI 4065 and NI 4070/4071/4072 use the value specified in this attribute as additional settling time.  For the The NI 4065 and NI '
+                                                     '4070/4071/4072, the valid range for Trigger Delay is AUTO DELAY (-1) or 0.0-149.0  seconds and the onboard timing resolution is 34.72 ns.\n'
+                                                     'On the NI 4060, if this attribute is set to 0, the DMM does not settle before taking the measurement.  On the NI 4060, the valid range for AUTO '
+                                                     'DELAY (-1) is 0.0-12.0 seconds and the onboard timing resolution  is 100 ms.\n'
+                                                     'When using the NI 4050, this attribute must be set to AUTO DELAY (-1).\n'
+                                                     'Use positive values to set the trigger delay in seconds.\n'
+                                                     'Valid Range: NIDMM_VAL_AUTO_DELAY (-1.0), 0.0-12.0 seconds (NI 4060 only)\n'
+                                                     'Default Value: NIDMM_VAL_AUTO_DELAY\n',
+                                      'note': [   '\n'
+                                                  'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or represent True/False, have been '
+                                                  'removed.\n']},
+                 'enum': None,
+                 'lv_property': 'Trigger:Trigger Delay',
+                 'name': 'TRIGGER_DELAY',
+                 'python_name': 'trigger_delay',
+                 'python_type': 'datetime.timedelta',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1250006: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the minimum frequency component of the input signal for AC  measurements. This attribute affects the DMM only when you set the  '
+                                                     'NIDMM_ATTR_FUNCTION attribute to AC measurements.\n'
+                                                     'The valid range is 1 Hz-300 kHz for the NI 4070/4071/4072, 10 Hz-100 kHz  for the NI 4065, and 20 Hz-25 kHz for the NI 4050 and NI 4060.\n'},
+                 'enum': None,
+                 'lv_property': 'Configuration:Measurement Options:Min Frequency',
+                 'name': 'AC_MIN_FREQ',
+                 'python_name': 'ac_min_freq',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1250007: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the maximum frequency component of the input signal for AC  measurements. This attribute is used only for error checking and verifies  '
+                                                     'that the value of this parameter is less than the maximum frequency  of the device. This attribute affects the DMM only when you set the   '
+                                                     'NIDMM_ATTR_FUNCTION attribute to AC measurements.\n'
+                                                     'The valid range is 1 Hz-300 kHz for the NI 4070/4071/4072, 10 Hz-100 kHz  for the NI 4065, and 20 Hz-25 kHz for the NI 4050 and NI 4060.\n'},
+                 'enum': None,
+                 'lv_property': 'Configuration:Measurement Options:Max Frequency',
+                 'name': 'AC_MAX_FREQ',
+                 'python_name': 'ac_max_freq',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1250008: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the measurement resolution in absolute units. Setting this  attribute to higher values increases the measurement accuracy. Setting '
+                                                     'this  attribute to lower values increases the measurement speed.\n'
+                                                     'NI-DMM ignores this attribute for capacitance and inductance measurements on the NI 4072.  To achieve better resolution for such measurements, '
+                                                     'use the NIDMM_ATTR_LC_NUMBER_MEAS_TO_AVERAGE attribute.\n'},
+                 'enum': None,
+                 'lv_property': 'Configuration:Absolute Resolution',
+                 'name': 'RESOLUTION_ABSOLUTE',
+                 'python_name': 'resolution_absolute',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1250101: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nSpecifies the maximum amplitude of the input signal for frequency  measurements.\n'},
+                 'enum': None,
+                 'lv_property': 'Configuration:Measurement Options:Frequency Voltage Range',
+                 'name': 'FREQ_VOLTAGE_RANGE',
+                 'python_name': 'freq_voltage_range',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1250201: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\nSpecifies the type of device used to measure the temperature. The default value is NIDMM_VAL_4_THERMOCOUPLE.\n',
+                                      'note': [   '\n'
+                                                  'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or represent True/False, have been '
+                                                  'removed.\n']},
+                 'enum': 'TransducerType',
+                 'lv_property': 'Configuration:Measurement Options:Temperature:Transducer Type',
+                 'name': 'TEMP_TRANSDUCER_TYPE',
+                 'python_name': 'temp_transducer_type',
+                 'python_type': 'enums.TransducerType',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1250231: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nSpecifies the type of thermocouple used to measure the temperature. The default value is NIDMM_VAL_TEMP_TC_J.\n'},
+                 'enum': 'ThermocoupleType',
+                 'lv_property': 'Configuration:Measurement Options:Temperature:Thermocouple:Thermocouple Type',
+                 'name': 'TEMP_TC_TYPE',
+                 'python_name': 'temp_tc_type',
+                 'python_type': 'enums.ThermocoupleType',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1250232: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the type of reference junction to be used in the reference junction compensation  of a thermocouple. The only supported value, '
+                                                     'NIDMM_VAL_TEMP_REF_JUNC_FIXED, is fixed.\n',
+                                      'note': [   '\n'
+                                                  'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or represent True/False, have been '
+                                                  'removed.\n']},
+                 'enum': 'ThermocoupleReferenceJunctionType',
+                 'lv_property': 'Configuration:Measurement Options:Temperature:Thermocouple:Reference Junction Type',
+                 'name': 'TEMP_TC_REF_JUNC_TYPE',
+                 'python_name': 'temp_tc_ref_junc_type',
+                 'python_type': 'enums.ThermocoupleReferenceJunctionType',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1250233: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the reference junction temperature when a fixed reference junction is used to take  a thermocouple measurement. The default value is '
+                                                     '25.0 (°C).\n'},
+                 'enum': None,
+                 'lv_property': 'Configuration:Measurement Options:Temperature:Thermocouple:Fixed Reference Junction',
+                 'name': 'TEMP_TC_FIXED_REF_JUNC',
+                 'python_name': 'temp_tc_fixed_ref_junc',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1250242: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nSpecifies the RTD resistance at 0 degrees Celsius. This applies to all supported RTDs,  including custom RTDs. The default value is 100 (?).\n'},
+                 'enum': None,
+                 'lv_property': 'Configuration:Measurement Options:Temperature:Resistance Temperature Detector:RTD Resistance',
+                 'name': 'TEMP_RTD_RES',
+                 'python_name': 'temp_rtd_res',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1250301: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nSpecifies the number of measurements the DMM takes each time it receives a  trigger in a multiple point acquisition.\n'},
+                 'enum': None,
+                 'lv_property': 'Multi Point Acquisition:Sample Count',
+                 'name': 'SAMPLE_COUNT',
+                 'python_name': 'sample_count',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1250302: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the sample trigger source.\n'
+                                                     'To determine which values are supported by each device, refer to the LabWindows/CVI Trigger Routing section in  the NI Digital Multimeters '
+                                                     'Help.\n'},
+                 'enum': 'SampleTrigger',
+                 'lv_property': 'Multi Point Acquisition:Sample Trigger',
+                 'name': 'SAMPLE_TRIGGER',
+                 'python_name': 'sample_trigger',
+                 'python_type': 'enums.SampleTrigger',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1250303: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64TimeDeltaSeconds',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the amount of time in seconds the DMM waits between measurement cycles.  This attribute only applies when the '
+                                                     'NIDMM_ATTR_SAMPLE_TRIGGER attribute is set to INTERVAL.\n'
+                                                     'On the NI 4060, the value for this attribute is used as the settling time.  When this attribute is set to 0, the NI 4060 does not settle '
+                                                     'between  measurement cycles. The onboard timing resolution is 1 µs on the NI 4060.\n'
+                                                     'The NI 4065 and NI 4070/4071/4072 use the value specified in this attribute as additional  delay. On the NI 4065 and NI 4070/4071/4072, the '
+                                                     'onboard timing resolution is 34.72 ns and  the valid range is 0-149 s.\n'
+                                                     'Only positive values are valid when setting the sample interval.\n'
+                                                     'The NI 4050 is not supported.\n'},
+                 'enum': None,
+                 'lv_property': 'Multi Point Acquisition:Sample Interval',
+                 'name': 'SAMPLE_INTERVAL',
+                 'python_name': 'sample_interval',
+                 'python_type': 'datetime.timedelta',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1250304: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the number of triggers the DMM receives before returning to the  Idle state.\n'
+                                                     'This attribute can be set to any positive ViInt32 value for the NI 4065 and NI 4070/4071/4072.\n'
+                                                     'The NI 4050 and NI 4060 support this attribute being set to 1.\n'
+                                                     'Refer to the Multiple Point Acquisitions section of the NI Digital Multimeters Help for more information.\n'},
+                 'enum': None,
+                 'lv_property': 'Multi Point Acquisition:Trigger Count',
+                 'name': 'TRIGGER_COUNT',
+                 'python_name': 'trigger_count',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1250305: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the destination of the measurement complete (MC) signal.\n'
+                                                     'The NI 4050 is not supported.\n'
+                                                     'To determine which values are supported by each device, refer to the LabWindows/CVI Trigger Routing section in  the NI Digital Multimeters '
+                                                     'Help.\n'},
+                 'enum': 'MeasurementCompleteDest',
+                 'lv_property': 'Trigger:Measurement Complete Dest',
+                 'name': 'MEAS_COMPLETE_DEST',
+                 'python_name': 'meas_complete_dest',
+                 'python_type': 'enums.MeasurementCompleteDest',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1250321: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the measurement aperture time for the current configuration.  Aperture time is specified in units set by '
+                                                     'NIDMM_ATTR_APERTURE_TIME_UNITS. To  override the default aperture, set this attribute to the desired  aperture time after calling '
+                                                     'niDMM_ConfigureMeasurement. To return to the  default, set this attribute to NIDMM_VAL_APERTURE_TIME_AUTO (-1).\n'
+                                                     'On the NI 4070/4071/4072, the minimum aperture time is 8.89 usec,  and the maximum aperture time is 149 sec. Any number of powerline cycles '
+                                                     '(PLCs)  within the minimum and maximum ranges is allowed on the NI 4070/4071/4072.\n'
+                                                     'On the NI 4065 the minimum aperture time is 333 µs, and the maximum aperture time  is 78.2 s. If setting the number of averages directly, the '
+                                                     'total measurement time is  aperture time X the number of averages, which must be less than 72.8 s. The aperture  times allowed are 333 µs, 667 '
+                                                     'µs, or multiples of 1.11 ms-for example 1.11 ms, 2.22 ms,  3.33 ms, and so on. If you set an aperture time other than 333 µs, 667 µs, or '
+                                                     'multiples  of 1.11 ms, the value will be coerced up to the next supported aperture time.\n'
+                                                     'On the NI 4060, when the powerline frequency is 60 Hz, the PLCs allowed are  1 PLC, 6 PLC, 12 PLC, and 120 PLC. When the powerline frequency is '
+                                                     '50 Hz, the  PLCs allowed are 1 PLC, 5 PLC, 10 PLC, and 100 PLC.\n',
+                                      'note': [   '\nOne or more of the referenced functions are not in the Python API for this driver.\n',
+                                                  '\n'
+                                                  'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or represent True/False, have been '
+                                                  'removed.\n']},
+                 'enum': None,
+                 'lv_property': 'Configuration:Advanced:Aperture Time',
+                 'name': 'APERTURE_TIME',
+                 'python_name': 'aperture_time',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1250322: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nSpecifies the units of aperture time for the current configuration.\nThe NI 4060 does not support an aperture time set in seconds.\n'},
+                 'enum': 'ApertureTimeUnits',
+                 'lv_property': 'Configuration:Advanced:Aperture Time Units',
+                 'name': 'APERTURE_TIME_UNITS',
+                 'python_name': 'aperture_time_units',
+                 'python_type': 'enums.ApertureTimeUnits',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1250331: {   'access': 'read only',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': False,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the value of the range. If auto ranging, shows the actual value of  the active range. The value of this attribute is set during a read '
+                                                     'operation.\n'},
+                 'enum': None,
+                 'lv_property': 'Configuration:Auto Range Value',
+                 'name': 'AUTO_RANGE_VALUE',
+                 'python_name': 'auto_range_value',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1250332: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nSpecifies the AutoZero mode.\nThe NI 4050 is not supported.\n'},
+                 'enum': 'AutoZero',
+                 'lv_property': 'Configuration:Measurement Options:Auto Zero',
+                 'name': 'AUTO_ZERO',
+                 'python_name': 'auto_zero',
+                 'python_type': 'enums.AutoZero',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1250333: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the powerline frequency. The NI 4050 and NI 4060 use this value to select an aperture time to reject  powerline noise by selecting the '
+                                                     'appropriate internal sample clock and filter. The NI 4065 and  NI 4070/4071/4072 use this value to select a timebase for setting the '
+                                                     'NIDMM_ATTR_APERTURE_TIME  attribute in powerline cycles (PLCs).\n'
+                                                     'After configuring powerline frequency, set the NIDMM_ATTR_APERTURE_TIME_UNITS attribute to PLCs.  When setting the NIDMM_ATTR_APERTURE_TIME '
+                                                     'attribute, select the number of PLCs for the powerline frequency.  For example, if powerline frequency = 50 Hz (or 20ms) and aperture time in '
+                                                     'PLCs = 5, then aperture time in  Seconds = 20ms * 5 PLCs = 100 ms. Similarly, if powerline frequency = 60 Hz (or 16.667 ms) and aperture time  '
+                                                     'in PLCs = 6, then aperture time in Seconds = 16.667 ms * 6 PLCs = 100 ms.\n'},
+                 'enum': None,
+                 'lv_property': 'Configuration:Measurement Options:Powerline Frequency',
+                 'name': 'POWERLINE_FREQ',
+                 'python_name': 'powerline_freq',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1250334: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nSpecifies the edge of the signal from the specified trigger source on which  the DMM is triggered.\n'},
+                 'enum': 'TriggerSlope',
+                 'lv_property': 'Trigger:Trigger Slope',
+                 'name': 'TRIGGER_SLOPE',
+                 'python_name': 'trigger_slope',
+                 'python_type': 'enums.TriggerSlope',
+                 'resettable': 'No',
+                 'type': 'ViInt32'}}
\ No newline at end of file
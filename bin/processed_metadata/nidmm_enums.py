@@ -0,0 +1,275 @@
+enums =
+{   'ADCCalibration': {   'codegen_method': 'public',
+                          'python_name': 'ADCCalibration',
+                          'values': [   {   'documentation': {'description': 'The DMM enables or disables ADC calibration for you.'},
+                                            'name': 'NIDMM_VAL_ADC_CALIBRATION_AUTO',
+                                            'prefix': 'ADC_CALIBRATION_',
+                                            'python_name': 'AUTO',
+                                            'value': -1},
+                                        {   'documentation': {'description': 'The DMM does not compensate for changes to the gain.'},
+                                            'name': 'NIDMM_VAL_ADC_CALIBRATION_OFF',
+                                            'prefix': 'ADC_CALIBRATION_',
+                                            'python_name': 'OFF',
+                                            'value': 0},
+                                        {   'documentation': {'description': 'The DMM measures an internal reference to calculate the correct gain for the  measurement.'},
+                                            'name': 'NIDMM_VAL_ADC_CALIBRATION_ON',
+                                            'prefix': 'ADC_CALIBRATION_',
+                                            'python_name': 'ON',
+                                            'value': 1}]},
+    'AcquisitionStatus': {   'codegen_method': 'public',
+                             'python_name': 'AcquisitionStatus',
+                             'values': [   {'documentation': {'description': 'Running'}, 'name': 'RUNNING', 'python_name': 'RUNNING', 'value': 0},
+                                           {'documentation': {'description': 'Finished with **Backlog**'}, 'name': 'FINISHED_WITH_BACKLOG', 'python_name': 'FINISHED_WITH_BACKLOG', 'value': 1},
+                                           {   'documentation': {'description': 'Finished with no **Backlog**'},
+                                               'name': 'FINISHED_WITH_NO_BACKLOG',
+                                               'python_name': 'FINISHED_WITH_NO_BACKLOG',
+                                               'value': 2},
+                                           {'documentation': {'description': 'Paused'}, 'name': 'PAUSED', 'python_name': 'PAUSED', 'value': 3},
+                                           {   'documentation': {'description': 'No acquisition in progress'},
+                                               'name': 'NO_ACQUISITION_IN_PROGRESS',
+                                               'python_name': 'NO_ACQUISITION_IN_PROGRESS',
+                                               'value': 4}]},
+    'ApertureTimeUnits': {   'codegen_method': 'public',
+                             'python_name': 'ApertureTimeUnits',
+                             'values': [   {'documentation': {'description': 'Seconds'}, 'name': 'NIDMM_VAL_SECONDS', 'python_name': 'SECONDS', 'value': 0},
+                                           {'documentation': {'description': 'Powerline Cycles'}, 'name': 'NIDMM_VAL_POWER_LINE_CYCLES', 'python_name': 'POWER_LINE_CYCLES', 'value': 1}]},
+    'AutoZero': {   'codegen_method': 'public',
+                    'python_name': 'AutoZero',
+                    'values': [   {   'documentation': {'description': 'The drivers chooses the AutoZero setting based on the configured function  and resolution.'},
+                                      'name': 'NIDMM_VAL_AUTO_ZERO_AUTO',
+                                      'prefix': 'AUTO_ZERO_',
+                                      'python_name': 'AUTO',
+                                      'value': -1},
+                                  {'documentation': {'description': 'Disables AutoZero.'}, 'name': 'NIDMM_VAL_AUTO_ZERO_OFF', 'prefix': 'AUTO_ZERO_', 'python_name': 'OFF', 'value': 0},
+                                  {   'documentation': {   'description': 'The DMM internally disconnects the input signal following each measurement  and takes a zero reading. It then subtracts the '
+                                                                          'zero reading from the  preceding reading.'},
+                                      'name': 'NIDMM_VAL_AUTO_ZERO_ON',
+                                      'prefix': 'AUTO_ZERO_',
+                                      'python_name': 'ON',
+                                      'value': 1},
+                                  {   'documentation': {   'description': 'The DMM internally disconnects the input signal for the first measurement  and takes a zero reading. It then subtracts the '
+                                                                          'zero reading from the first  reading and the following readings.'},
+                                      'name': 'NIDMM_VAL_AUTO_ZERO_ONCE',
+                                      'prefix': 'AUTO_ZERO_',
+                                      'python_name': 'ONCE',
+                                      'value': 2}]},
+    'CableCompensationType': {   'codegen_method': 'public',
+                                 'python_name': 'CableCompensationType',
+                                 'values': [   {   'documentation': {'description': 'No Cable Compensation'},
+                                                   'name': 'NIDMM_VAL_CABLE_COMP_NONE',
+                                                   'prefix': 'CABLE_COMP_',
+                                                   'python_name': 'NONE',
+                                                   'value': 0},
+                                               {   'documentation': {'description': 'Open Cable Compensation'},
+                                                   'name': 'NIDMM_VAL_CABLE_COMP_OPEN',
+                                                   'prefix': 'CABLE_COMP_',
+                                                   'python_name': 'OPEN',
+                                                   'value': 1},
+                                               {   'documentation': {'description': 'Short Cable Compensation'},
+                                                   'name': 'NIDMM_VAL_CABLE_COMP_SHORT',
+                                                   'prefix': 'CABLE_COMP_',
+                                                   'python_name': 'SHORT',
+                                                   'value': 2},
+                                               {   'documentation': {'description': 'Open and Short Cable Compensation'},
+                                                   'name': 'NIDMM_VAL_CABLE_COMP_OPEN_AND_SHORT',
+                                                   'prefix': 'CABLE_COMP_',
+                                                   'python_name': 'OPEN_AND_SHORT',
+                                                   'value': 3}]},
+    'DCNoiseRejection': {   'codegen_method': 'public',
+                            'python_name': 'DCNoiseRejection',
+                            'values': [   {   'documentation': {'description': 'The driver chooses the DC noise rejection setting based on the configured  function and resolution.'},
+                                              'name': 'NIDMM_VAL_DCNR_AUTO',
+                                              'prefix': 'DCNR_',
+                                              'python_name': 'AUTO',
+                                              'value': -1},
+                                          {   'documentation': {'description': 'NI-DMM weighs all samples equally.'},
+                                              'name': 'NIDMM_VAL_DCNR_NORMAL',
+                                              'prefix': 'DCNR_',
+                                              'python_name': 'NORMAL',
+                                              'value': 0},
+                                          {   'documentation': {   'description': 'NI-DMM weighs the samples taken in the middle of the aperture time more than  samples taken at the beginning and '
+                                                                                  'the end of the measurement using a  triangular weighing function.'},
+                                              'name': 'NIDMM_VAL_DCNR_SECOND_ORDER',
+                                              'prefix': 'DCNR_',
+                                              'python_name': 'SECOND_ORDER',
+                                              'value': 1},
+                                          {   'documentation': {   'description': 'NI-DMM weighs the samples taken in the middle of the aperture time more than  samples taken at the beginning and '
+                                                                                  'the end of the measurement using a  bell-curve weighing function.'},
+                                              'name': 'NIDMM_VAL_DCNR_HIGH_ORDER',
+                                              'prefix': 'DCNR_',
+                                              'python_name': 'HIGH_ORDER',
+                                              'value': 2}]},
+    'Function': {   'codegen_method': 'public',
+                    'python_name': 'Function',
+                    'values': [   {'documentation': {'description': 'DC Voltage'}, 'name': 'NIDMM_VAL_DC_VOLTS', 'python_name': 'DC_VOLTS', 'value': 1},
+                                  {'documentation': {'description': 'AC Voltage'}, 'name': 'NIDMM_VAL_AC_VOLTS', 'python_name': 'AC_VOLTS', 'value': 2},
+                                  {'documentation': {'description': 'DC Current'}, 'name': 'NIDMM_VAL_DC_CURRENT', 'python_name': 'DC_CURRENT', 'value': 3},
+                                  {'documentation': {'description': 'AC Current'}, 'name': 'NIDMM_VAL_AC_CURRENT', 'python_name': 'AC_CURRENT', 'value': 4},
+                                  {'documentation': {'description': '2-Wire Resistance'}, 'name': 'NIDMM_VAL_2_WIRE_RES', 'python_name': '_2_WIRE_RES', 'value': 5},
+                                  {'documentation': {'description': '4-Wire Resistance'}, 'name': 'NIDMM_VAL_4_WIRE_RES', 'python_name': '_4_WIRE_RES', 'value': 101},
+                                  {'documentation': {'description': 'Frequency'}, 'name': 'NIDMM_VAL_FREQ', 'python_name': 'FREQ', 'value': 104},
+                                  {'documentation': {'description': 'Period'}, 'name': 'NIDMM_VAL_PERIOD', 'python_name': 'PERIOD', 'value': 105},
+                                  {'documentation': {'description': 'NI 4065, and NI 4070/4071/4072 supported.'}, 'name': 'TEMPERATURE', 'python_name': 'TEMPERATURE', 'value': 108},
+                                  {'documentation': {'description': 'AC Voltage with DC Coupling'}, 'name': 'NIDMM_VAL_AC_VOLTS_DC_COUPLED', 'python_name': 'AC_VOLTS_DC_COUPLED', 'value': 1001},
+                                  {'documentation': {'description': 'Diode'}, 'name': 'NIDMM_VAL_DIODE', 'python_name': 'DIODE', 'value': 1002},
+                                  {'documentation': {'description': 'Waveform voltage'}, 'name': 'NIDMM_VAL_WAVEFORM_VOLTAGE', 'python_name': 'WAVEFORM_VOLTAGE', 'value': 1003},
+                                  {'documentation': {'description': 'Waveform current'}, 'name': 'NIDMM_VAL_WAVEFORM_CURRENT', 'python_name': 'WAVEFORM_CURRENT', 'value': 1004},
+                                  {'documentation': {'description': 'Capacitance'}, 'name': 'NIDMM_VAL_CAPACITANCE', 'python_name': 'CAPACITANCE', 'value': 1005},
+                                  {'documentation': {'description': 'Inductance'}, 'name': 'NIDMM_VAL_INDUCTANCE', 'python_name': 'INDUCTANCE', 'value': 1006}]},
+    'LCCalculationModel': {   'codegen_method': 'public',
+                              'python_name': 'LCCalculationModel',
+                              'values': [   {   'documentation': {'description': 'NI-DMM chooses the algorithm based on function and range'},
+                                                'name': 'NIDMM_VAL_CALC_MODEL_AUTO',
+                                                'prefix': 'CALC_MODEL_',
+                                                'python_name': 'AUTO',
+                                                'value': -1},
+                                            {   'documentation': {'description': 'NI-DMM uses the series impedance model to calculate capacitance and inductance'},
+                                                'name': 'NIDMM_VAL_CALC_MODEL_SERIES',
+                                                'prefix': 'CALC_MODEL_',
+                                                'python_name': 'SERIES',
+                                                'value': 0},
+                                            {   'documentation': {'description': 'NI-DMM uses the parallel admittance model to calculate capacitance and inductance'},
+                                                'name': 'NIDMM_VAL_CALC_MODEL_PARALLEL',
+                                                'prefix': 'CALC_MODEL_',
+                                                'python_name': 'PARALLEL',
+                                                'value': 1}]},
+    'MeasurementCompleteDest': {   'codegen_method': 'public',
+                                   'python_name': 'MeasurementCompleteDest',
+                                   'values': [   {'documentation': {'description': 'No Trigger'}, 'name': 'NIDMM_VAL_NONE', 'python_name': 'NONE', 'value': -1},
+                                                 {'documentation': {'description': 'AUX I/O Connector'}, 'name': 'NIDMM_VAL_EXTERNAL', 'python_name': 'EXTERNAL', 'value': 2},
+                                                 {'documentation': {'description': 'PXI Trigger Line 0'}, 'name': 'NIDMM_VAL_PXI_TRIG0', 'python_name': 'PXI_TRIG0', 'value': 111},
+                                                 {'documentation': {'description': 'PXI Trigger Line 1'}, 'name': 'NIDMM_VAL_PXI_TRIG1', 'python_name': 'PXI_TRIG1', 'value': 112},
+                                                 {'documentation': {'description': 'PXI Trigger Line 2'}, 'name': 'NIDMM_VAL_PXI_TRIG2', 'python_name': 'PXI_TRIG2', 'value': 113},
+                                                 {'documentation': {'description': 'PXI Trigger Line 3'}, 'name': 'NIDMM_VAL_PXI_TRIG3', 'python_name': 'PXI_TRIG3', 'value': 114},
+                                                 {'documentation': {'description': 'PXI Trigger Line 4'}, 'name': 'NIDMM_VAL_PXI_TRIG4', 'python_name': 'PXI_TRIG4', 'value': 115},
+                                                 {'documentation': {'description': 'PXI Trigger Line 5'}, 'name': 'NIDMM_VAL_PXI_TRIG5', 'python_name': 'PXI_TRIG5', 'value': 116},
+                                                 {'documentation': {'description': 'PXI Trigger Line 6'}, 'name': 'NIDMM_VAL_PXI_TRIG6', 'python_name': 'PXI_TRIG6', 'value': 117},
+                                                 {'documentation': {'description': 'PXI Trigger Line 7'}, 'name': 'NIDMM_VAL_PXI_TRIG7', 'python_name': 'PXI_TRIG7', 'value': 118},
+                                                 {   'documentation': {'description': 'Internal Trigger Line of a PXI/SCXI Combination Chassis'},
+                                                     'name': 'NIDMM_VAL_LBR_TRIG0',
+                                                     'python_name': 'LBR_TRIG0',
+                                                     'value': 1003}]},
+    'MeasurementDestinationSlope': {   'codegen_method': 'public',
+                                       'python_name': 'MeasurementDestinationSlope',
+                                       'values': [   {'documentation': {'description': 'Rising Edgs'}, 'name': 'NIDMM_VAL_POSITIVE', 'python_name': 'POSITIVE', 'value': 0},
+                                                     {'documentation': {'description': 'Falling Edge'}, 'name': 'NIDMM_VAL_NEGATIVE', 'python_name': 'NEGATIVE', 'value': 1}]},
+    'OperationMode': {   'codegen_method': 'public',
+                         'python_name': 'OperationMode',
+                         'values': [   {'documentation': {'description': 'IviDmm Mode'}, 'name': 'NIDMM_VAL_IVIDMM_MODE', 'python_name': 'IVIDMM', 'suffix': '_MODE', 'value': 0},
+                                       {'documentation': {'description': 'Waveform acquisition mode'}, 'name': 'NIDMM_VAL_WAVEFORM_MODE', 'python_name': 'WAVEFORM', 'suffix': '_MODE', 'value': 1}]},
+    'RTDType': {   'codegen_method': 'public',
+                   'python_name': 'RTDType',
+                   'values': [   {   'documentation': {'description': '\nPerforms Callendar-Van Dusen RTD scaling with the user-specified A, B,\nand C coefficients.\n'},
+                                     'name': 'NIDMM_VAL_TEMP_RTD_CUSTOM',
+                                     'prefix': 'TEMP_RTD_',
+                                     'python_name': 'CUSTOM',
+                                     'value': 0},
+                                 {   'documentation': {'description': 'Performs scaling for a Pt 3750 RTD.'},
+                                     'name': 'NIDMM_VAL_TEMP_RTD_PT3750',
+                                     'prefix': 'TEMP_RTD_',
+                                     'python_name': 'PT3750',
+                                     'value': 1},
+                                 {   'documentation': {'description': 'Performs scaling for a Pt 3851 RTD.'},
+                                     'name': 'NIDMM_VAL_TEMP_RTD_PT3851',
+                                     'prefix': 'TEMP_RTD_',
+                                     'python_name': 'PT3851',
+                                     'value': 2},
+                                 {   'documentation': {'description': 'Performs scaling for a Pt 3911 RTD.'},
+                                     'name': 'NIDMM_VAL_TEMP_RTD_PT3911',
+                                     'prefix': 'TEMP_RTD_',
+                                     'python_name': 'PT3911',
+                                     'value': 3},
+                                 {   'documentation': {'description': 'Performs scaling for a Pt 3916 RTD.'},
+                                     'name': 'NIDMM_VAL_TEMP_RTD_PT3916',
+                                     'prefix': 'TEMP_RTD_',
+                                     'python_name': 'PT3916',
+                                     'value': 4},
+                                 {   'documentation': {'description': 'Performs scaling for a Pt 3920 RTD.'},
+                                     'name': 'NIDMM_VAL_TEMP_RTD_PT3920',
+                                     'prefix': 'TEMP_RTD_',
+                                     'python_name': 'PT3920',
+                                     'value': 5},
+                                 {   'documentation': {'description': 'Performs scaling for a Pt 3928 RTD.'},
+                                     'name': 'NIDMM_VAL_TEMP_RTD_PT3928',
+                                     'prefix': 'TEMP_RTD_',
+                                     'python_name': 'PT3928',
+                                     'value': 6}]},
+    'SampleTrigSlope': {   'codegen_method': 'public',
+                           'python_name': 'SampleTrigSlope',
+                           'values': [   {'documentation': {'description': 'Rising Edgs'}, 'name': 'NIDMM_VAL_POSITIVE', 'python_name': 'POSITIVE', 'value': 0},
+                                         {'documentation': {'description': 'Falling Edge'}, 'name': 'NIDMM_VAL_NEGATIVE', 'python_name': 'NEGATIVE', 'value': 1}]},
+    'SampleTrigger': {   'codegen_method': 'public',
+                         'python_name': 'SampleTrigger',
+                         'values': [   {'documentation': {'description': 'No Trigger'}, 'name': 'NIDMM_VAL_IMMEDIATE', 'python_name': 'IMMEDIATE', 'value': 1},
+                                       {'documentation': {'description': 'AUX I/O Connector Trigger Line 0'}, 'name': 'NIDMM_VAL_EXTERNAL', 'python_name': 'EXTERNAL', 'value': 2},
+                                       {'documentation': {'description': 'Software Trigger'}, 'name': 'NIDMM_VAL_SOFTWARE_TRIG', 'python_name': 'SOFTWARE_TRIG', 'value': 3},
+                                       {'documentation': {'description': 'Interval Trigger'}, 'name': 'NIDMM_VAL_INTERVAL', 'python_name': 'INTERVAL', 'value': 10},
+                                       {'documentation': {'description': 'PXI Trigger Line 0'}, 'name': 'NIDMM_VAL_PXI_TRIG0', 'python_name': 'PXI_TRIG0', 'value': 111},
+                                       {'documentation': {'description': 'PXI Trigger Line 1'}, 'name': 'NIDMM_VAL_PXI_TRIG1', 'python_name': 'PXI_TRIG1', 'value': 112},
+                                       {'documentation': {'description': 'PXI Trigger Line 2'}, 'name': 'NIDMM_VAL_PXI_TRIG2', 'python_name': 'PXI_TRIG2', 'value': 113},
+                                       {'documentation': {'description': 'PXI Trigger Line 3'}, 'name': 'NIDMM_VAL_PXI_TRIG3', 'python_name': 'PXI_TRIG3', 'value': 114},
+                                       {'documentation': {'description': 'PXI Trigger Line 4'}, 'name': 'NIDMM_VAL_PXI_TRIG4', 'python_name': 'PXI_TRIG4', 'value': 115},
+                                       {'documentation': {'description': 'PXI Trigger Line 5'}, 'name': 'NIDMM_VAL_PXI_TRIG5', 'python_name': 'PXI_TRIG5', 'value': 116},
+                                       {'documentation': {'description': 'PXI Trigger Line 6'}, 'name': 'NIDMM_VAL_PXI_TRIG6', 'python_name': 'PXI_TRIG6', 'value': 117},
+                                       {'documentation': {'description': 'PXI Trigger Line 7'}, 'name': 'NIDMM_VAL_PXI_TRIG7', 'python_name': 'PXI_TRIG7', 'value': 118},
+                                       {'documentation': {'description': 'PXI Star Trigger Line'}, 'name': 'NIDMM_VAL_PXI_STAR', 'python_name': 'PXI_STAR', 'value': 131},
+                                       {'documentation': {'description': 'AUX I/0 Connector Trigger Line 1'}, 'name': 'NIDMM_VAL_AUX_TRIG1', 'python_name': 'AUX_TRIG1', 'value': 1001},
+                                       {   'documentation': {'description': 'Internal Trigger Line of a PXI/SCXI Combination Chassis'},
+                                           'name': 'NIDMM_VAL_LBR_TRIG1',
+                                           'python_name': 'LBR_TRIG1',
+                                           'value': 1004}]},
+    'ThermistorType': {   'codegen_method': 'public',
+                          'python_name': 'ThermistorType',
+                          'values': [   {'documentation': {'description': 'Custom'}, 'name': 'NIDMM_VAL_TEMP_THERMISTOR_CUSTOM', 'prefix': 'TEMP_THERMISTOR_', 'python_name': 'CUSTOM', 'value': 0},
+                                        {'documentation': {'description': '44004'}, 'name': 'NIDMM_VAL_TEMP_THERMISTOR_44004', 'prefix': 'TEMP_THERMISTOR_', 'python_name': '_44004', 'value': 1},
+                                        {'documentation': {'description': '44006'}, 'name': 'NIDMM_VAL_TEMP_THERMISTOR_44006', 'prefix': 'TEMP_THERMISTOR_', 'python_name': '_44006', 'value': 2},
+                                        {'documentation': {'description': '44007'}, 'name': 'NIDMM_VAL_TEMP_THERMISTOR_44007', 'prefix': 'TEMP_THERMISTOR_', 'python_name': '_44007', 'value': 3}]},
+    'ThermocoupleReferenceJunctionType': {   'codegen_method': 'public',
+                                             'python_name': 'ThermocoupleReferenceJunctionType',
+                                             'values': [   {   'documentation': {'description': '\nThermocouple reference juction is fixed at the user-specified\ntemperature.\n'},
+                                                               'name': 'FIXED',
+                                                               'python_name': 'FIXED',
+                                                               'value': 2}]},
+    'ThermocoupleType': {   'codegen_method': 'public',
+                            'python_name': 'ThermocoupleType',
+                            'values': [   {'documentation': {'description': 'Thermocouple type B'}, 'name': 'NIDMM_VAL_TEMP_TC_B', 'prefix': 'TEMP_TC_', 'python_name': 'B', 'value': 1},
+                                          {'documentation': {'description': 'Thermocouple type E'}, 'name': 'NIDMM_VAL_TEMP_TC_E', 'prefix': 'TEMP_TC_', 'python_name': 'E', 'value': 4},
+                                          {'documentation': {'description': 'Thermocouple type J'}, 'name': 'NIDMM_VAL_TEMP_TC_J', 'prefix': 'TEMP_TC_', 'python_name': 'J', 'value': 6},
+                                          {'documentation': {'description': 'Thermocouple type K'}, 'name': 'NIDMM_VAL_TEMP_TC_K', 'prefix': 'TEMP_TC_', 'python_name': 'K', 'value': 7},
+                                          {'documentation': {'description': 'Thermocouple type N'}, 'name': 'NIDMM_VAL_TEMP_TC_N', 'prefix': 'TEMP_TC_', 'python_name': 'N', 'value': 8},
+                                          {'documentation': {'description': 'Thermocouple type R'}, 'name': 'NIDMM_VAL_TEMP_TC_R', 'prefix': 'TEMP_TC_', 'python_name': 'R', 'value': 9},
+                                          {'documentation': {'description': 'Thermocouple type S'}, 'name': 'NIDMM_VAL_TEMP_TC_S', 'prefix': 'TEMP_TC_', 'python_name': 'S', 'value': 10},
+                                          {'documentation': {'description': 'Thermocouple type T'}, 'name': 'NIDMM_VAL_TEMP_TC_T', 'prefix': 'TEMP_TC_', 'python_name': 'T', 'value': 11}]},
+    'TransducerType': {   'codegen_method': 'public',
+                          'python_name': 'TransducerType',
+                          'values': [   {'documentation': {'description': 'Thermocouple'}, 'name': 'NIDMM_VAL_THERMOCOUPLE', 'python_name': 'THERMOCOUPLE', 'value': 1},
+                                        {'documentation': {'description': 'Thermistor'}, 'name': 'NIDMM_VAL_THERMISTOR', 'python_name': 'THERMISTOR', 'value': 2},
+                                        {'documentation': {'description': '2-wire RTD'}, 'name': 'NIDMM_VAL_2_WIRE_RTD', 'python_name': '_2_WIRE_RTD', 'value': 3},
+                                        {'documentation': {'description': '4-wire RTD'}, 'name': 'NIDMM_VAL_4_WIRE_RTD', 'python_name': '_4_WIRE_RTD', 'value': 4}]},
+    'TriggerSlope': {   'codegen_method': 'public',
+                        'python_name': 'TriggerSlope',
+                        'values': [   {'documentation': {'description': 'Rising Edgs'}, 'name': 'NIDMM_VAL_POSITIVE', 'python_name': 'POSITIVE', 'value': 0},
+                                      {'documentation': {'description': 'Falling Edge'}, 'name': 'NIDMM_VAL_NEGATIVE', 'python_name': 'NEGATIVE', 'value': 1}]},
+    'TriggerSource': {   'codegen_method': 'public',
+                         'python_name': 'TriggerSource',
+                         'values': [   {'documentation': {'description': 'No Trigger'}, 'name': 'NIDMM_VAL_IMMEDIATE', 'python_name': 'IMMEDIATE', 'value': 1},
+                                       {'documentation': {'description': 'AUX I/O Connector Trigger Line 0'}, 'name': 'NIDMM_VAL_EXTERNAL', 'python_name': 'EXTERNAL', 'value': 2},
+                                       {'documentation': {'description': 'Software Trigger'}, 'name': 'NIDMM_VAL_SOFTWARE_TRIG', 'python_name': 'SOFTWARE_TRIG', 'value': 3},
+                                       {'documentation': {'description': 'PXI Trigger Line 0'}, 'name': 'NIDMM_VAL_PXI_TRIG0', 'python_name': 'PXI_TRIG0', 'value': 111},
+                                       {'documentation': {'description': 'PXI Trigger Line 1'}, 'name': 'NIDMM_VAL_PXI_TRIG1', 'python_name': 'PXI_TRIG1', 'value': 112},
+                                       {'documentation': {'description': 'PXI Trigger Line 2'}, 'name': 'NIDMM_VAL_PXI_TRIG2', 'python_name': 'PXI_TRIG2', 'value': 113},
+                                       {'documentation': {'description': 'PXI Trigger Line 3'}, 'name': 'NIDMM_VAL_PXI_TRIG3', 'python_name': 'PXI_TRIG3', 'value': 114},
+                                       {'documentation': {'description': 'PXI Trigger Line 4'}, 'name': 'NIDMM_VAL_PXI_TRIG4', 'python_name': 'PXI_TRIG4', 'value': 115},
+                                       {'documentation': {'description': 'PXI Trigger Line 5'}, 'name': 'NIDMM_VAL_PXI_TRIG5', 'python_name': 'PXI_TRIG5', 'value': 116},
+                                       {'documentation': {'description': 'PXI Trigger Line 6'}, 'name': 'NIDMM_VAL_PXI_TRIG6', 'python_name': 'PXI_TRIG6', 'value': 117},
+                                       {'documentation': {'description': 'PXI Trigger Line 7'}, 'name': 'NIDMM_VAL_PXI_TRIG7', 'python_name': 'PXI_TRIG7', 'value': 118},
+                                       {'documentation': {'description': 'PXI Star Trigger Line'}, 'name': 'NIDMM_VAL_PXI_STAR', 'python_name': 'PXI_STAR', 'value': 131},
+                                       {'documentation': {'description': 'AUX I/O Connector Trigger Line 1'}, 'name': 'NIDMM_VAL_AUX_TRIG1', 'python_name': 'AUX_TRIG1', 'value': 1001},
+                                       {   'documentation': {'description': 'Internal Trigger Line of a PXI/SCXI Combination Chassis'},
+                                           'name': 'NIDMM_VAL_LBR_TRIG1',
+                                           'python_name': 'LBR_TRIG1',
+                                           'value': 1004}]},
+    'WaveformCoupling': {   'codegen_method': 'public',
+                            'python_name': 'WaveformCoupling',
+                            'values': [   {'documentation': {'description': 'AC Coupled'}, 'name': 'NIDMM_VAL_WAVEFORM_COUPLING_AC', 'prefix': 'WAVEFORM_COUPLING_', 'python_name': 'AC', 'value': 0},
+                                          {'documentation': {'description': 'DC Coupled'}, 'name': 'NIDMM_VAL_WAVEFORM_COUPLING_DC', 'prefix': 'WAVEFORM_COUPLING_', 'python_name': 'DC', 'value': 1}]}}
\ No newline at end of file
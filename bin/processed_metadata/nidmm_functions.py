@@ -0,0 +1,7694 @@
+function =
+{   'Abort': {   'blocking': False,
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nAborts a previously initiated measurement and returns the DMM to the\nIdle state.\n'},
+                 'has_repeated_capability': False,
+                 'invalidates_attribute_cache': False,
+                 'is_error_handling': False,
+                 'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                 'name': 'Abort',
+                 'parameters': [   {   'ctypes_type': 'ViSession',
+                                       'ctypes_type_library_call': 'ViSession',
+                                       'ctypes_variable_name': 'vi_ctype',
+                                       'direction': 'in',
+                                       'documentation': {   'description': '\n'
+                                                                           'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                           'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                           'None.\n',
+                                                            'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                       'enum': None,
+                                       'is_buffer': False,
+                                       'is_repeated_capability': False,
+                                       'is_session_handle': True,
+                                       'is_string': False,
+                                       'library_method_call_snippet': 'vi_ctype',
+                                       'name': 'vi',
+                                       'numpy': False,
+                                       'numpy_into_return': False,
+                                       'python_name': 'vi',
+                                       'python_name_or_default_for_init': 'vi',
+                                       'python_name_with_default': 'vi',
+                                       'python_name_with_doc_default': 'vi',
+                                       'python_type': 'int',
+                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                       'type': 'ViSession',
+                                       'use_array': False,
+                                       'use_in_python_api': True,
+                                       'use_list': False}],
+                 'python_code_variables': [],
+                 'python_name': 'abort',
+                 'render_in_library': True,
+                 'render_in_session_base': False,
+                 'returns': 'ViStatus'},
+    'CalAdjustACFilter': {   'codegen_method': 'no',
+                             'documentation': {   'description': '\n'
+                                                                 'For the NI 4080/4081/4082 and the NI 4070/4071/4072, calibrates the\n'
+                                                                 'filter coefficients used for AC measurements of the supplied **Mode**\n'
+                                                                 'and **Range**.\n',
+                                                  'note': '\nRefer to the calibration procedure for your device before using this\nfunction.\n'},
+                             'parameters': [   {   'direction': 'in',
+                                                   'documentation': {   'description': '\n'
+                                                                                       'The session handle that you obtain from niDMM_InitExtCal. The handle\n'
+                                                                                       'identifies a particular instrument calibration session.\n',
+                                                                        'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                   'name': 'vi',
+                                                   'type': 'ViSession'},
+                                               {   'direction': 'in',
+                                                   'documentation': {   'description': '\n'
+                                                                                       'Specifies the calibration **mode** used to acquire the measurement.\n'
+                                                                                       '\n'
+                                                                                       'For valid modes, refer to the calibration procedure for your device.\n'},
+                                                   'name': 'Mode',
+                                                   'type': 'ViInt32'},
+                                               {   'direction': 'in',
+                                                   'documentation': {   'description': '\n'
+                                                                                       'Specifies the **range** to calibrate.\n'
+                                                                                       '\n'
+                                                                                       'For valid ranges, refer to the calibration procedure for your device.\n'
+                                                                                       'Auto-ranging is not supported for calibration operations.\n'},
+                                                   'name': 'Range',
+                                                   'type': 'ViReal64'},
+                                               {'direction': 'in', 'documentation': {'description': 'Specifies the **frequency** of the input signal.'}, 'name': 'Frequency', 'type': 'ViReal64'},
+                                               {   'direction': 'in',
+                                                   'documentation': {'description': 'Specifies the **expected_value** of the measurement.'},
+                                                   'name': 'expectedValue',
+                                                   'type': 'ViReal64'}],
+                             'returns': 'ViStatus'},
+    'CalAdjustGain': {   'codegen_method': 'no',
+                         'documentation': {   'description': '\nCalibrates the gain coefficient for the supplied **Mode**, **Range**,\nand **Input_Resistance**.\n',
+                                              'note': '\nThe NI 4050 and NI 4060 are not supported.\nRefer to the calibration procedure for your device before using this\nfunction.\n'},
+                         'parameters': [   {   'direction': 'in',
+                                               'documentation': {   'description': '\n'
+                                                                                   'The session handle that you obtain from niDMM_InitExtCal. The handle\n'
+                                                                                   'identifies a particular instrument calibration session.\n',
+                                                                    'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                               'name': 'vi',
+                                               'type': 'ViSession'},
+                                           {   'direction': 'in',
+                                               'documentation': {   'description': '\n'
+                                                                                   'Specifies the calibration **mode** used to acquire the measurement.\n'
+                                                                                   '\n'
+                                                                                   'For valid modes, refer to the calibration procedure for your device.\n'},
+                                               'name': 'Mode',
+                                               'type': 'ViInt32'},
+                                           {   'direction': 'in',
+                                               'documentation': {   'description': '\n'
+                                                                                   'Specifies the **range** to calibrate.\n'
+                                                                                   '\n'
+                                                                                   'For valid ranges, refer to the calibration procedure for your device.\n'
+                                                                                   'Auto-ranging is not supported for calibration operations.\n'},
+                                               'name': 'Range',
+                                               'type': 'ViReal64'},
+                                           {   'direction': 'in',
+                                               'documentation': {   'description': '\n'
+                                                                                   'Specifies the **input_resistance** that the device should use.\n'
+                                                                                   '**input_resistance** values are coerced up to the closest\n'
+                                                                                   '**input_resistance**.\n'},
+                                               'name': 'inputResistance',
+                                               'type': 'ViReal64'},
+                                           {'direction': 'in', 'documentation': {'description': 'Specifies the **expected_value** of the measurement.'}, 'name': 'expectedValue', 'type': 'ViReal64'}],
+                         'returns': 'ViStatus'},
+    'CalAdjustLC': {   'codegen_method': 'no',
+                       'documentation': {   'description': '\nFor the NI 4082 and NI 4072 only, performs a specialized LC calibration\nstep depending on the specified **Type**.\n',
+                                            'note': '\nRefer to the calibration procedure for your device before using this\nfunction.\n'},
+                       'parameters': [   {   'direction': 'in',
+                                             'documentation': {   'description': '\n'
+                                                                                 'The session handle that you obtain from niDMM_InitExtCal. The handle\n'
+                                                                                 'identifies a particular instrument calibration session.\n',
+                                                                  'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                             'name': 'vi',
+                                             'type': 'ViSession'},
+                                         {   'direction': 'in',
+                                             'documentation': {   'description': 'Specifies which of the LC calibration steps to perform.',
+                                                                  'table_body': [   ['L & C Open (default)', 'Calibrates the open compensation.'],
+                                                                                    ['L & C Short', 'Calibrates the short compensation.'],
+                                                                                    ['L & C 25 Ω', 'Calibrates the 25 Ω resistance.'],
+                                                                                    ['L & C 1 kΩ', 'Calibrates the 1 kΩ resistance.'],
+                                                                                    ['L & C 5 kΩ', 'Calibrates the 5 kΩ resistance.'],
+                                                                                    ['L & C 100 kΩ', 'Calibrates the 100 kΩ resistance.']]},
+                                             'name': 'Type',
+                                             'type': 'ViInt32'}],
+                       'returns': 'ViStatus'},
+    'CalAdjustLinearization': {   'codegen_method': 'no',
+                                  'documentation': {'description': 'For the NI 4065 only, compensates for any non-linearities.'},
+                                  'parameters': [   {   'direction': 'in',
+                                                        'documentation': {   'description': '\n'
+                                                                                            'The session handle that you obtain from niDMM_InitExtCal. The handle\n'
+                                                                                            'identifies a particular instrument calibration session.\n',
+                                                                             'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                        'name': 'vi',
+                                                        'type': 'ViSession'},
+                                                    {   'direction': 'in',
+                                                        'documentation': {   'description': '\n'
+                                                                                            'Specifies the calibration **function** used to acquire the measurement.\n'
+                                                                                            '\n'
+                                                                                            'For valid modes, refer to the *NI 4065 6½ Digit DMM Calibration\n'
+                                                                                            'Procedure*.\n'},
+                                                        'name': 'Function',
+                                                        'type': 'ViInt32'},
+                                                    {   'direction': 'in',
+                                                        'documentation': {   'description': '\n'
+                                                                                            'Specifies the **range** to calibrate. **range** values are coerced up to\n'
+                                                                                            'the closest **range**.\n'
+                                                                                            '\n'
+                                                                                            'For valid ranges, refer to the *NI 4065 6½ Digit DMM Calibration\n'
+                                                                                            'Procedure*. Auto-ranging is not supported for calibration operations.\n'},
+                                                        'name': 'Range',
+                                                        'type': 'ViReal64'},
+                                                    {   'direction': 'in',
+                                                        'documentation': {   'description': '\n'
+                                                                                            'Specifies the **input_resistance** that the device should use.\n'
+                                                                                            '**input_resistance** values are coerced up to the closest\n'
+                                                                                            '**input_resistance**.\n'},
+                                                        'name': 'inputResistance',
+                                                        'type': 'ViReal64'},
+                                                    {   'direction': 'in',
+                                                        'documentation': {'description': 'Specifies the **expected_value** of the measurement.'},
+                                                        'name': 'expectedValue',
+                                                        'type': 'ViReal64'}],
+                                  'returns': 'ViStatus'},
+    'CalAdjustMisc': {   'codegen_method': 'no',
+                         'documentation': {   'description': '\nPerforms a specialized calibration step depending on the specified\n**Type**.\n',
+                                              'note': '\nThe NI 4050 and NI 4060 are not supported.\nRefer to the calibration procedure for your device before using this\nfunction.\n'},
+                         'parameters': [   {   'direction': 'in',
+                                               'documentation': {   'description': '\n'
+                                                                                   'The session handle that you obtain from niDMM_InitExtCal. The handle\n'
+                                                                                   'identifies a particular instrument calibration session.\n',
+                                                                    'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                               'name': 'vi',
+                                               'type': 'ViSession'},
+                                           {   'direction': 'in',
+                                               'documentation': {   'description': 'Specifies which of the miscellaneous calibration steps to perform.',
+                                                                    'table_body': [   ['NIDMM_EXTCAL_MISCCAL_VREF (default)', 'Calibrate the Voltage Reference.'],
+                                                                                      ['NIDMM_EXTCAL_MISCCAL_RREF', 'Calibrate the Resistance Reference.'],
+                                                                                      ['NIDMM_EXTCAL_MISCCAL_ZINT', 'Calibrate the Internal Impedance.'],
+                                                                                      ['NIDMM_EXTCAL_MISCCAL_2WIRELEAKAGE', 'Calibrate the 2-wire Leakage resistance.'],
+                                                                                      ['NIDMM_EXTCAL_MISCCAL_4WIRELEAKAGE', 'Calibrate the 4-wire Leakage resistance.'],
+                                                                                      ['NIDMM_EXTCAL_MISCCAL_SECTION', 'Update calibration information and verify calibration completeness.']]},
+                                               'name': 'Type',
+                                               'type': 'ViInt32'}],
+                         'returns': 'ViStatus'},
+    'CalAdjustOffset': {   'codegen_method': 'no',
+                           'documentation': {   'description': '\nCalibrates the offset and Auto Zero offset for the supplied **Mode**,\n**Range**, and **Input_Resistance**.\n',
+                                                'note': '\nThe NI 4050 and NI 4060 are not supported.\nRefer to the calibration procedure for your device before using this\nfunction.\n'},
+                           'parameters': [   {   'direction': 'in',
+                                                 'documentation': {   'description': '\n'
+                                                                                     'The session handle that you obtain from niDMM_InitExtCal. The handle\n'
+                                                                                     'identifies a particular instrument calibration session.\n',
+                                                                      'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                 'name': 'vi',
+                                                 'type': 'ViSession'},
+                                             {   'direction': 'in',
+                                                 'documentation': {   'description': '\n'
+                                                                                     'Specifies the calibration **mode** used to acquire the measurement.\n'
+                                                                                     '\n'
+                                                                                     'For valid modes, refer to the calibration procedure for your device.\n'},
+                                                 'name': 'Mode',
+                                                 'type': 'ViInt32'},
+                                             {   'direction': 'in',
+                                                 'documentation': {   'description': '\n'
+                                                                                     'Specifies the **range** to calibrate.\n'
+                                                                                     '\n'
+                                                                                     'For valid ranges, refer to the calibration procedure for your device.\n'
+                                                                                     'Auto-ranging is not supported for calibration operations.\n'},
+                                                 'name': 'Range',
+                                                 'type': 'ViReal64'},
+                                             {   'direction': 'in',
+                                                 'documentation': {   'description': '\n'
+                                                                                     'Specifies the **input_resistance** that the device should use.\n'
+                                                                                     '**input_resistance** values are coerced up to the closest\n'
+                                                                                     '**input_resistance**.\n'},
+                                                 'name': 'inputResistance',
+                                                 'type': 'ViReal64'}],
+                           'returns': 'ViStatus'},
+    'CheckAttributeViBoolean': {   'codegen_method': 'no',
+                                   'documentation': {'description': '\nThis function checks the validity of a value you specify for a ViBoolean\nattribute.\n'},
+                                   'parameters': [   {   'direction': 'in',
+                                                         'documentation': {   'description': '\n'
+                                                                                             'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                             'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                             'None.\n',
+                                                                              'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                         'name': 'vi',
+                                                         'type': 'ViSession'},
+                                                     {   'direction': 'in',
+                                                         'documentation': {   'description': '\n'
+                                                                                             'This parameter is ignored. National Instruments DMMs do not support\n'
+                                                                                             'channel names since they only have a single channel. This parameter is\n'
+                                                                                             'included in order to support interchangeability and upgradability to\n'
+                                                                                             'multiple channel DMMs.\n'
+                                                                                             '\n'
+                                                                                             'The default value is " " (an empty string).\n'},
+                                                         'name': 'channelName',
+                                                         'type': 'ViConstString'},
+                                                     {'direction': 'in', 'documentation': {'description': 'Pass the ID of an attribute.'}, 'name': 'attributeId', 'type': 'ViAttr'},
+                                                     {   'direction': 'in',
+                                                         'documentation': {'description': 'Pass the value that you want to set the attribute to.'},
+                                                         'name': 'attributeValue',
+                                                         'type': 'ViBoolean'}],
+                                   'returns': 'ViStatus'},
+    'CheckAttributeViInt32': {   'codegen_method': 'no',
+                                 'documentation': {'description': '\nThis function checks the validity of a value you specify for a ViInt32\nattribute.\n'},
+                                 'parameters': [   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                           'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                           'None.\n',
+                                                                            'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                       'name': 'vi',
+                                                       'type': 'ViSession'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'This parameter is ignored. National Instruments DMMs do not support\n'
+                                                                                           'channel names since they only have a single channel. This parameter is\n'
+                                                                                           'included in order to support interchangeability and upgradability to\n'
+                                                                                           'multiple channel DMMs.\n'
+                                                                                           '\n'
+                                                                                           'The default value is " " (an empty string).\n'},
+                                                       'name': 'channelName',
+                                                       'type': 'ViConstString'},
+                                                   {'direction': 'in', 'documentation': {'description': 'Pass the ID of an attribute.'}, 'name': 'attributeId', 'type': 'ViAttr'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {'description': 'Pass the value that you want to set the attribute to.'},
+                                                       'name': 'attributeValue',
+                                                       'type': 'ViInt32'}],
+                                 'returns': 'ViStatus'},
+    'CheckAttributeViReal64': {   'codegen_method': 'no',
+                                  'documentation': {'description': '\nThis function checks the validity of a value you specify for a ViReal64\nattribute.\n'},
+                                  'parameters': [   {   'direction': 'in',
+                                                        'documentation': {   'description': '\n'
+                                                                                            'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                            'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                            'None.\n',
+                                                                             'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                        'name': 'vi',
+                                                        'type': 'ViSession'},
+                                                    {   'direction': 'in',
+                                                        'documentation': {   'description': '\n'
+                                                                                            'This parameter is ignored. National Instruments DMMs do not support\n'
+                                                                                            'channel names since they only have a single channel. This parameter is\n'
+                                                                                            'included in order to support interchangeability and upgradability to\n'
+                                                                                            'multiple channel DMMs.\n'
+                                                                                            '\n'
+                                                                                            'The default value is " " (an empty string).\n'},
+                                                        'name': 'channelName',
+                                                        'type': 'ViConstString'},
+                                                    {'direction': 'in', 'documentation': {'description': 'Pass the ID of an attribute.'}, 'name': 'attributeId', 'type': 'ViAttr'},
+                                                    {   'direction': 'in',
+                                                        'documentation': {'description': 'Pass the value that you want to set the attribute to.'},
+                                                        'name': 'attributeValue',
+                                                        'type': 'ViReal64'}],
+                                  'returns': 'ViStatus'},
+    'CheckAttributeViSession': {   'codegen_method': 'no',
+                                   'documentation': {'description': '\nThis function checks the validity of a value you specify for a ViSession\nattribute.\n'},
+                                   'parameters': [   {   'direction': 'in',
+                                                         'documentation': {   'description': '\n'
+                                                                                             'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                             'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                             'None.\n',
+                                                                              'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                         'name': 'vi',
+                                                         'type': 'ViSession'},
+                                                     {   'direction': 'in',
+                                                         'documentation': {   'description': '\n'
+                                                                                             'This parameter is ignored. National Instruments DMMs do not support\n'
+                                                                                             'channel names since they only have a single channel. This parameter is\n'
+                                                                                             'included in order to support interchangeability and upgradability to\n'
+                                                                                             'multiple channel DMMs.\n'
+                                                                                             '\n'
+                                                                                             'The default value is " " (an empty string).\n'},
+                                                         'name': 'channelName',
+                                                         'type': 'ViConstString'},
+                                                     {'direction': 'in', 'documentation': {'description': 'Pass the ID of an attribute.'}, 'name': 'attributeId', 'type': 'ViAttr'},
+                                                     {   'direction': 'in',
+                                                         'documentation': {'description': 'Pass the value that you want to set the attribute to.'},
+                                                         'name': 'attributeValue',
+                                                         'type': 'ViSession'}],
+                                   'returns': 'ViStatus'},
+    'CheckAttributeViString': {   'codegen_method': 'no',
+                                  'documentation': {'description': '\nThis function checks the validity of a value you specify for a ViString\nattribute.\n'},
+                                  'parameters': [   {   'direction': 'in',
+                                                        'documentation': {   'description': '\n'
+                                                                                            'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                            'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                            'None.\n',
+                                                                             'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                        'name': 'vi',
+                                                        'type': 'ViSession'},
+                                                    {   'direction': 'in',
+                                                        'documentation': {   'description': '\n'
+                                                                                            'This parameter is ignored. National Instruments DMMs do not support\n'
+                                                                                            'channel names since they only have a single channel. This parameter is\n'
+                                                                                            'included in order to support interchangeability and upgradability to\n'
+                                                                                            'multiple channel DMMs.\n'
+                                                                                            '\n'
+                                                                                            'The default value is " " (an empty string).\n'},
+                                                        'name': 'channelName',
+                                                        'type': 'ViConstString'},
+                                                    {'direction': 'in', 'documentation': {'description': 'Pass the ID of an attribute.'}, 'name': 'attributeId', 'type': 'ViAttr'},
+                                                    {   'direction': 'in',
+                                                        'documentation': {'description': 'Pass the value that you want to set the attribute to.'},
+                                                        'name': 'attributeValue',
+                                                        'type': 'ViChar[ ]'}],
+                                  'returns': 'ViStatus'},
+    'ClearError': {   'codegen_method': 'no',
+                      'documentation': {   'description': '\n'
+                                                          'Clears the error information for the current execution thread and the\n'
+                                                          'IVI session you specify. If you pass VI_NULL for the\n'
+                                                          '**Instrument_Handle** parameter, this function clears the error\n'
+                                                          'information only for the current execution thread.\n'},
+                      'parameters': [   {   'direction': 'in',
+                                            'documentation': {   'description': '\n'
+                                                                                'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                'None.\n',
+                                                                 'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                            'name': 'vi',
+                                            'type': 'ViSession'}],
+                      'returns': 'ViStatus'},
+    'ClearInterchangeWarnings': {   'codegen_method': 'no',
+                                    'documentation': {'description': 'Clears the list of current interchange warnings.'},
+                                    'parameters': [   {   'direction': 'in',
+                                                          'documentation': {   'description': '\n'
+                                                                                              'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                              'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                              'None.\n',
+                                                                               'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                          'name': 'vi',
+                                                          'type': 'ViSession'}],
+                                    'returns': 'ViStatus'},
+    'CloseExtCal': {   'codegen_method': 'no',
+                       'documentation': {   'description': '\n'
+                                                           'Performs the specified **Action**, closes the specified external\n'
+                                                           'calibration session obtained from niDMM_InitExtCal, and deallocates\n'
+                                                           'resources that it reserved.\n',
+                                            'note': [   '\nThe NI 4050 and NI 4060 are not supported.\nRefer to the calibration procedure for your device before using this\nfunction.\n',
+                                                        '\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                       'parameters': [   {   'direction': 'in',
+                                             'documentation': {   'description': '\n'
+                                                                                 'The session handle that you obtain from niDMM_InitExtCal. The handle\n'
+                                                                                 'identifies a particular instrument calibration session.\n',
+                                                                  'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                             'name': 'vi',
+                                             'type': 'ViSession'},
+                                         {   'direction': 'in',
+                                             'documentation': {   'description': 'Specifies whether the driver saves the updated calibration constants.',
+                                                                  'table_body': [   [   'NIDMM_EXTCAL_ACTION_ABORT (default)',
+                                                                                        'Restores the calibration constants to what they were before starting the external calibration procedure.'],
+                                                                                    ['NIDMM_EXTCAL_ACTION_SAVE', 'Saves the new calibration constants to the device.']]},
+                                             'name': 'Action',
+                                             'type': 'ViInt32'}],
+                       'returns': 'ViStatus'},
+    'ConfigureACBandwidth': {   'blocking': False,
+                                'codegen_method': 'public',
+                                'documentation': {'description': '\nConfigures the NIDMM_ATTR_AC_MIN_FREQ and NIDMM_ATTR_AC_MAX_FREQ\nattributes, which the DMM uses for AC measurements.\n'},
+                                'has_repeated_capability': False,
+                                'invalidates_attribute_cache': True,
+                                'is_error_handling': False,
+                                'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                'name': 'ConfigureACBandwidth',
+                                'parameters': [   {   'ctypes_type': 'ViSession',
+                                                      'ctypes_type_library_call': 'ViSession',
+                                                      'ctypes_variable_name': 'vi_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                          'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                          'None.\n',
+                                                                           'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': True,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'vi_ctype',
+                                                      'name': 'vi',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'vi',
+                                                      'python_name_or_default_for_init': 'vi',
+                                                      'python_name_with_default': 'vi',
+                                                      'python_name_with_doc_default': 'vi',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViSession',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViReal64',
+                                                      'ctypes_type_library_call': 'ViReal64',
+                                                      'ctypes_variable_name': 'ac_minimum_frequency_hz_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Specifies the minimum expected frequency component of the input signal\n'
+                                                                                          'in hertz. This parameter affects the DMM only when you set the\n'
+                                                                                          'NIDMM_ATTR_FUNCTION attribute to AC measurements. NI-DMM uses this\n'
+                                                                                          'parameter to calculate the proper aperture for the measurement.\n'
+                                                                                          'The driver sets the NIDMM_ATTR_AC_MIN_FREQ attribute to this value.\n'
+                                                                                          'The valid range is 1 Hz–300 kHz for the NI 4080/4081/4082 and the NI\n'
+                                                                                          '4070/4071/4072, 10 Hz–100 Hz for the NI 4065, and 20 Hz–25 kHz for the\n'
+                                                                                          'NI 4050 and NI 4060.\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'ac_minimum_frequency_hz_ctype',
+                                                      'name': 'acMinimumFrequencyHz',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'ac_minimum_frequency_hz',
+                                                      'python_name_or_default_for_init': 'ac_minimum_frequency_hz',
+                                                      'python_name_with_default': 'ac_minimum_frequency_hz',
+                                                      'python_name_with_doc_default': 'ac_minimum_frequency_hz',
+                                                      'python_type': 'float',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViReal64',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViReal64',
+                                                      'ctypes_type_library_call': 'ViReal64',
+                                                      'ctypes_variable_name': 'ac_maximum_frequency_hz_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Specifies the maximum expected frequency component of the input signal\n'
+                                                                                          'in hertz within the device limits. This parameter is used only for error\n'
+                                                                                          'checking and verifies that the value of this parameter is less than the\n'
+                                                                                          'maximum frequency of the device.\n'
+                                                                                          '\n'
+                                                                                          'This parameter affects the DMM only when you set the\n'
+                                                                                          'NIDMM_ATTR_FUNCTION attribute to AC measurements. The driver sets the\n'
+                                                                                          'NIDMM_ATTR_AC_MAX_FREQ attribute to this value. The valid range is 1\n'
+                                                                                          'Hz–300 kHz for the NI 4080/4081/4082 and the NI 4070/4071/4072, 10\n'
+                                                                                          'Hz–100 Hz for the NI 4065, and 20 Hz–25 kHz for the NI 4050 and NI 4060.\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'ac_maximum_frequency_hz_ctype',
+                                                      'name': 'acMaximumFrequencyHz',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'ac_maximum_frequency_hz',
+                                                      'python_name_or_default_for_init': 'ac_maximum_frequency_hz',
+                                                      'python_name_with_default': 'ac_maximum_frequency_hz',
+                                                      'python_name_with_doc_default': 'ac_maximum_frequency_hz',
+                                                      'python_type': 'float',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViReal64',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False}],
+                                'python_code_variables': [],
+                                'python_name': 'configure_ac_bandwidth',
+                                'render_in_library': True,
+                                'render_in_session_base': False,
+                                'returns': 'ViStatus'},
+    'ConfigureADCCalibration': {   'codegen_method': 'no',
+                                   'documentation': {   'description': '\n'
+                                                                       'For the NI 4080/4081/4082 and NI 4070/4071/4072, allows the DMM to\n'
+                                                                       'compensate for gain drift since the last external calibration or\n'
+                                                                       'self-calibration. When **ADC_Calibration** is ON, the DMM measures an\n'
+                                                                       'internal reference to calculate the correct gain for the measurement.\n'
+                                                                       'When **ADC_Calibration** is OFF, the DMM does not compensate for\n'
+                                                                       'changes to the gain.\n'},
+                                   'invalidates_attribute_cache': True,
+                                   'parameters': [   {   'direction': 'in',
+                                                         'documentation': {   'description': '\n'
+                                                                                             'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                             'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                             'None.\n',
+                                                                              'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                         'name': 'vi',
+                                                         'type': 'ViSession'},
+                                                     {   'direction': 'in',
+                                                         'documentation': {   'description': '\n'
+                                                                                             'Specifies the **ADC_Calibration** setting. The driver sets\n'
+                                                                                             'NIDMM_ATTR_ADC_CALIBRATION to this value.\n'
+                                                                                             'NIDMM_VAL_ADC_CALIBRATION_ON enables **ADC_Calibration**.\n'
+                                                                                             'NIDMM_VAL_ADC_CALIBRATION_OFF disables **ADC_Calibration**. If you\n'
+                                                                                             'set the value to NIDMM_VAL_ADC_CALIBRATION_AUTO, the driver\n'
+                                                                                             'determines whether to enable **ADC_Calibration** based on the\n'
+                                                                                             'measurement function and resolution that you configure. If you configure\n'
+                                                                                             'the NI 4080/4081/4082 or NI 4070/4071/4072 for a 6½–digit and greater\n'
+                                                                                             'resolution DC measurement, the driver enables ADC Calibration. For all\n'
+                                                                                             'other measurement configurations, the driver disables\n'
+                                                                                             '**ADC_Calibration**.\n',
+                                                                              'table_body': [   [   'NIDMM_VAL_ADC_CALIBRATION_AUTO (default)',
+                                                                                                    '-1.0',
+                                                                                                    'The DMM enables or disables **ADC_Calibration** based on the configured function and resolution.'],
+                                                                                                ['NIDMM_VAL_ADC_CALIBRATION_OFF', '0', 'The DMM does not compensate for changes to the gain.'],
+                                                                                                [   'NIDMM_VAL_ADC_CALIBRATION_ON',
+                                                                                                    '1',
+                                                                                                    'The DMM measures an internal reference to calculate the correct gain for the measurement.']],
+                                                                              'table_header': ['Name', 'Value', 'Description']},
+                                                         'name': 'adcCalibration',
+                                                         'type': 'ViInt32'}],
+                                   'returns': 'ViStatus'},
+    'ConfigureAutoZeroMode': {   'codegen_method': 'no',
+                                 'documentation': {   'description': '\n'
+                                                                     'Configures the DMM for **Auto_Zero_Mode**. When **Auto_Zero_Mode**\n'
+                                                                     'is ON, the DMM internally disconnects the input signal and takes a zero\n'
+                                                                     'reading. It then subtracts the zero reading from the measurement. This\n'
+                                                                     'prevents offset voltages present on the input circuitry of the DMM from\n'
+                                                                     'affecting measurement accuracy. When **Auto_Zero_Mode** is OFF, the\n'
+                                                                     'DMM does not compensate for zero reading offset.\n'},
+                                 'invalidates_attribute_cache': True,
+                                 'parameters': [   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                           'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                           'None.\n',
+                                                                            'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                       'name': 'vi',
+                                                       'type': 'ViSession'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Specifies the **auto_zero_mode**. NI-DMM sets the\n'
+                                                                                           'NIDMM_ATTR_AUTO_ZERO attribute to this value.\n'
+                                                                                           '\n'
+                                                                                           'ON enables **auto_zero_mode** for each measurement. ONCE enables\n'
+                                                                                           '**auto_zero_mode** before the next measurement. The\n'
+                                                                                           '**auto_zero_mode** value is stored and used in subsequent measurements\n'
+                                                                                           'until the device is reconfigured.\n'
+                                                                                           '\n'
+                                                                                           'OFF disables **auto_zero_mode**. If you set this parameter to AUTO,\n'
+                                                                                           'NI-DMM determines whether to enable Auto Zero based on the measurement\n'
+                                                                                           'function that you configure. If you configure the NI 4080/4081/4082 or\n'
+                                                                                           'the NI 4070/4071/4072 for a 6½–digit and greater resolution DC\n'
+                                                                                           'measurement, NI-DMM sets **auto_zero_mode** to ON.\n'
+                                                                                           '\n'
+                                                                                           'For all other DC measurement configurations on the NI 4080/4081/4082 or\n'
+                                                                                           'the NI 4070/4071/4072, NI-DMM sets **auto_zero_mode** to ONCE. For all\n'
+                                                                                           'AC measurements or waveform acquisitions on the NI 4080/4081/4082 or the\n'
+                                                                                           'NI 4070/4071/4072, NI-DMM sets **auto_zero_mode** to OFF. For NI 4060,\n'
+                                                                                           '**auto_zero_mode** is set to OFF when AUTO is selected.\n'
+                                                                                           '\n'
+                                                                                           'For NI 4065 devices, **auto_zero_mode** is always ON.\n'
+                                                                                           '**auto_zero_mode** is an integral part of the signal measurement phase\n'
+                                                                                           'and adds no extra time to the overall measurement.\n',
+                                                                            'note': 'The NI 4060/4065 does *not* support this setting.',
+                                                                            'table_body': [   [   'NIDMM_VAL_AUTO_ZERO_AUTO (default)',
+                                                                                                  '-1',
+                                                                                                  'NI-DMM chooses the Auto Zero setting based on the configured function and resolution.'],
+                                                                                              ['NIDMM_VAL_AUTO_ZERO_OFF', '0', 'Disables Auto Zero.'],
+                                                                                              [   'NIDMM_VAL_AUTO_ZERO_ON',
+                                                                                                  '1',
+                                                                                                  'The DMM internally disconnects the input signal following each measurement and takes a zero '
+                                                                                                  'reading. It then subtracts the zero reading from the preceding reading.'],
+                                                                                              [   'NIDMM_VAL_AUTO_ZERO_ONCE',
+                                                                                                  '2',
+                                                                                                  'The DMM internally disconnects the input signal following the first measurement and takes a zero '
+                                                                                                  'reading. It then subtracts the zero reading from the preceding reading and each measurement that '
+                                                                                                  'follows.']]},
+                                                       'name': 'autoZeroMode',
+                                                       'type': 'ViInt32'}],
+                                 'returns': 'ViStatus'},
+    'ConfigureCableCompType': {   'codegen_method': 'no',
+                                  'documentation': {   'description': '\n'
+                                                                      'For the NI 4082 and NI 4072 only, sets the\n'
+                                                                      'NIDMM_ATTR_CABLE_COMP_TYPE attribute for the current\n'
+                                                                      'capacitance/inductance mode range.\n'},
+                                  'invalidates_attribute_cache': True,
+                                  'parameters': [   {   'direction': 'in',
+                                                        'documentation': {   'description': '\n'
+                                                                                            'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                            'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                            'None.\n',
+                                                                             'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                        'name': 'vi',
+                                                        'type': 'ViSession'},
+                                                    {   'direction': 'in',
+                                                        'documentation': {'description': '\nSpecifies the type of cable compensation that is used for the current\nrange.\n'},
+                                                        'name': 'cableCompType',
+                                                        'type': 'ViInt32'}],
+                                  'returns': 'ViStatus'},
+    'ConfigureCurrentSource': {   'codegen_method': 'no',
+                                  'documentation': {'description': '\nThe NI 4050 and NI 4060 are not supported. Configures the\n**Current_Source** for diode measurements.\n'},
+                                  'invalidates_attribute_cache': True,
+                                  'parameters': [   {   'direction': 'in',
+                                                        'documentation': {   'description': '\n'
+                                                                                            'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                            'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                            'None.\n',
+                                                                             'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                        'name': 'vi',
+                                                        'type': 'ViSession'},
+                                                    {   'direction': 'in',
+                                                        'documentation': {   'description': '\n'
+                                                                                            'Specifies the **current_source** provided during diode measurements.\n'
+                                                                                            'For valid ranges, refer to the device sections for your device. The\n'
+                                                                                            'driver sets NIDMM_ATTR_CURRENT_SOURCE to this value.\n',
+                                                                             'note': [   '\n'
+                                                                                         'One or more of the referenced values are not in the Python API for this driver. Enums that only define '
+                                                                                         'values, or represent True/False, have been removed.\n'],
+                                                                             'table_body': [   ['NIDMM_VAL_1_MICROAMP', '1 µA', 'NI 4080/4081/4082 and NI 4070/4071/4072'],
+                                                                                               ['NIDMM_VAL_10_MICROAMP', '10 µA', 'NI 4080/4081/4082 and NI 4070/4071/4072 only'],
+                                                                                               ['NIDMM_VAL_100_MICROAMP', '100 µA', 'NI 4080/4081/4082, NI 4070/4071/4072, and NI 4065'],
+                                                                                               ['NIDMM_VAL_1_MILLIAMP (default)', '1 mA', 'NI 4080/4081/4082, NI 4070/4071/4072, and NI 4065']]},
+                                                        'name': 'currentSource',
+                                                        'type': 'ViReal64'}],
+                                  'returns': 'ViStatus'},
+    'ConfigureFixedRefJunction': {   'codegen_method': 'no',
+                                     'documentation': {'description': '\nConfigures the fixed reference junction temperature for a thermocouple\nwith a fixed reference junction type.\n'},
+                                     'invalidates_attribute_cache': True,
+                                     'parameters': [   {   'direction': 'in',
+                                                           'documentation': {   'description': '\n'
+                                                                                               'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                               'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                               'None.\n',
+                                                                                'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                           'name': 'vi',
+                                                           'type': 'ViSession'},
+                                                       {   'direction': 'in',
+                                                           'documentation': {   'description': '\n'
+                                                                                               'Specifies the reference junction temperature when a fixed reference\n'
+                                                                                               'junction is used to take a thermocouple measurement. The units are\n'
+                                                                                               'degrees Celsius. NI-DMM uses this value to set the Fixed Reference\n'
+                                                                                               'Junction property. The default is 25.00 (°C).\n'},
+                                                           'name': 'fixedReferenceJunction',
+                                                           'type': 'ViReal64'}],
+                                     'returns': 'ViStatus'},
+    'ConfigureFrequencyVoltageRange': {   'codegen_method': 'no',
+                                          'documentation': {   'description': '\n'
+                                                                              'For the NI 4080/4081/4082 and the NI 4070/4071/4072 only, specifies the\n'
+                                                                              'expected maximum amplitude of the input signal for frequency and period\n'
+                                                                              'measurements.\n'},
+                                          'invalidates_attribute_cache': True,
+                                          'parameters': [   {   'direction': 'in',
+                                                                'documentation': {   'description': '\n'
+                                                                                                    'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                                    'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                                    'None.\n',
+                                                                                     'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                                'name': 'vi',
+                                                                'type': 'ViSession'},
+                                                            {   'direction': 'in',
+                                                                'documentation': {   'description': '\n'
+                                                                                                    'Sets the expected maximum amplitude of the input signal. Refer to the\n'
+                                                                                                    '`NI 4080 <REPLACE_DRIVER_SPECIFIC_URL_1(4080_functional_overview)>`__,\n'
+                                                                                                    '`NI 4081 <REPLACE_DRIVER_SPECIFIC_URL_1(4081_functional_overview)>`__,\n'
+                                                                                                    '`NI 4072 <REPLACE_DRIVER_SPECIFIC_URL_1(4082)>`__,\n'
+                                                                                                    '`NI 4070 <REPLACE_DRIVER_SPECIFIC_URL_1(4070_functional_overview)>`__,\n'
+                                                                                                    '`NI 4071 <REPLACE_DRIVER_SPECIFIC_URL_1(4071_functional_overview)>`__,\n'
+                                                                                                    'and `NI 4072 <REPLACE_DRIVER_SPECIFIC_URL_1(4072)>`__ sections for a\n'
+                                                                                                    'list of valid values. NI-DMM sets NIDMM_ATTR_FREQ_VOLTAGE_RANGE to\n'
+                                                                                                    'this value. The minimum peak-to-peak signal amplitude that can be\n'
+                                                                                                    'detected is 10% of the specified **voltage_range**.\n',
+                                                                                     'note': [   '\n'
+                                                                                                 'One or more of the referenced values are not in the Python API for this driver. Enums that only '
+                                                                                                 'define values, or represent True/False, have been removed.\n'],
+                                                                                     'table_body': [   [   'NIDMM_VAL_AUTO_RANGE_ON (default)',
+                                                                                                           '-1.0',
+                                                                                                           'Configures the DMM to take an Auto Range measurement to calculate the voltage range before '
+                                                                                                           'each frequency or period measurement.'],
+                                                                                                       [   'NIDMM_VAL_AUTO_RANGE_OFF',
+                                                                                                           '-2.0',
+                                                                                                           'Disables Auto Ranging. The driver sets the voltage range to the last calculated voltage '
+                                                                                                           'range.']],
+                                                                                     'table_header': ['Name', 'Value', 'Description']},
+                                                                'name': 'voltageRange',
+                                                                'type': 'ViReal64'}],
+                                          'returns': 'ViStatus'},
+    'ConfigureMeasCompleteDest': {   'codegen_method': 'no',
+                                     'documentation': {   'description': '\n'
+                                                                         'Specifies the destination of the DMM Measurement Complete (MC) signal.\n'
+                                                                         'Refer to `Triggering <REPLACE_DRIVER_SPECIFIC_URL_1(trigger)>`__ for\n'
+                                                                         'more information.\n'},
+                                     'invalidates_attribute_cache': True,
+                                     'parameters': [   {   'direction': 'in',
+                                                           'documentation': {   'description': '\n'
+                                                                                               'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                               'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                               'None.\n',
+                                                                                'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                           'name': 'vi',
+                                                           'type': 'ViSession'},
+                                                       {   'direction': 'in',
+                                                           'documentation': {   'description': '\n'
+                                                                                               'Specifies the destination of the Measurement Complete signal. This\n'
+                                                                                               'signal is issued when the DMM completes a single measurement. The driver\n'
+                                                                                               'sets the NIDMM_ATTR_MEAS_COMPLETE_DEST attribute to this value. This\n'
+                                                                                               'signal is commonly referred to as Voltmeter Complete.\n',
+                                                                                'note': '\n'
+                                                                                        'To determine which values are supported by each device, refer to the\n'
+                                                                                        '`LabWindows/CVI Trigger\n'
+                                                                                        'Routing <REPLACE_DRIVER_SPECIFIC_URL_1(cvitrigger_routing)>`__ section.\n'},
+                                                           'name': 'measCompleteDestination',
+                                                           'type': 'ViInt32'}],
+                                     'returns': 'ViStatus'},
+    'ConfigureMeasCompleteSlope': {   'codegen_method': 'no',
+                                      'documentation': {'description': '\nSets the Measurement Complete signal to either rising edge (positive) or\nfalling edge (negative) polarity.\n'},
+                                      'invalidates_attribute_cache': True,
+                                      'parameters': [   {   'direction': 'in',
+                                                            'documentation': {   'description': '\n'
+                                                                                                'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                                'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                                'None.\n',
+                                                                                 'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                            'name': 'vi',
+                                                            'type': 'ViSession'},
+                                                        {   'direction': 'in',
+                                                            'documentation': {   'description': '\n'
+                                                                                                'Specifies the polarity of the signal that is generated. The driver sets\n'
+                                                                                                'NIDMM_ATTR_MEAS_DEST_SLOPE to this value.\n',
+                                                                                 'note': [   '\n'
+                                                                                             'One or more of the referenced values are not in the Python API for this driver. Enums that only define '
+                                                                                             'values, or represent True/False, have been removed.\n'],
+                                                                                 'table_body': [   [   'Rising Edge',
+                                                                                                       '0',
+                                                                                                       'NIDMM_VAL_POSITIVE',
+                                                                                                       'The driver triggers on the rising edge of the trigger signal.'],
+                                                                                                   [   'Falling Edge (default)',
+                                                                                                       '1',
+                                                                                                       'NIDMM_VAL_NEGATIVE',
+                                                                                                       'The driver triggers on the falling edge of the trigger signal.']]},
+                                                            'name': 'measCompleteSlope',
+                                                            'type': 'ViInt32'}],
+                                      'returns': 'ViStatus'},
+    'ConfigureMeasurementAbsolute': {   'blocking': False,
+                                        'codegen_method': 'public',
+                                        'documentation': {   'description': '\n'
+                                                                            'Configures the common attributes of the measurement. These attributes\n'
+                                                                            'include NIDMM_ATTR_FUNCTION, NIDMM_ATTR_RANGE, and\n'
+                                                                            'NIDMM_ATTR_RESOLUTION_ABSOLUTE.\n'},
+                                        'has_repeated_capability': False,
+                                        'invalidates_attribute_cache': True,
+                                        'is_error_handling': False,
+                                        'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                        'name': 'ConfigureMeasurementAbsolute',
+                                        'parameters': [   {   'ctypes_type': 'ViSession',
+                                                              'ctypes_type_library_call': 'ViSession',
+                                                              'ctypes_variable_name': 'vi_ctype',
+                                                              'direction': 'in',
+                                                              'documentation': {   'description': '\n'
+                                                                                                  'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                                  'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                                  'None.\n',
+                                                                                   'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                              'enum': None,
+                                                              'is_buffer': False,
+                                                              'is_repeated_capability': False,
+                                                              'is_session_handle': True,
+                                                              'is_string': False,
+                                                              'library_method_call_snippet': 'vi_ctype',
+                                                              'name': 'vi',
+                                                              'numpy': False,
+                                                              'numpy_into_return': False,
+                                                              'python_name': 'vi',
+                                                              'python_name_or_default_for_init': 'vi',
+                                                              'python_name_with_default': 'vi',
+                                                              'python_name_with_doc_default': 'vi',
+                                                              'python_type': 'int',
+                                                              'size': {'mechanism': 'fixed', 'value': 1},
+                                                              'type': 'ViSession',
+                                                              'use_array': False,
+                                                              'use_in_python_api': True,
+                                                              'use_list': False},
+                                                          {   'ctypes_type': 'ViInt32',
+                                                              'ctypes_type_library_call': 'ViInt32',
+                                                              'ctypes_variable_name': 'measurement_function_ctype',
+                                                              'direction': 'in',
+                                                              'documentation': {   'description': '\n'
+                                                                                                  'Specifies the **measurement_function** used to acquire the measurement.\n'
+                                                                                                  'The driver sets NIDMM_ATTR_FUNCTION to this value.\n'},
+                                                              'enum': 'Function',
+                                                              'is_buffer': False,
+                                                              'is_repeated_capability': False,
+                                                              'is_session_handle': False,
+                                                              'is_string': False,
+                                                              'library_method_call_snippet': 'measurement_function_ctype',
+                                                              'name': 'measurementFunction',
+                                                              'numpy': False,
+                                                              'numpy_into_return': False,
+                                                              'python_name': 'measurement_function',
+                                                              'python_name_or_default_for_init': 'measurement_function',
+                                                              'python_name_with_default': 'measurement_function',
+                                                              'python_name_with_doc_default': 'measurement_function',
+                                                              'python_type': 'enums.Function',
+                                                              'size': {'mechanism': 'fixed', 'value': 1},
+                                                              'type': 'ViInt32',
+                                                              'use_array': False,
+                                                              'use_in_python_api': True,
+                                                              'use_list': False},
+                                                          {   'ctypes_type': 'ViReal64',
+                                                              'ctypes_type_library_call': 'ViReal64',
+                                                              'ctypes_variable_name': 'range_ctype',
+                                                              'direction': 'in',
+                                                              'documentation': {   'description': '\n'
+                                                                                                  'Specifies the **range** for the function specified in the\n'
+                                                                                                  '**Measurement_Function** parameter. When frequency is specified in the\n'
+                                                                                                  '**Measurement_Function** parameter, you must supply the minimum\n'
+                                                                                                  'frequency expected in the **range** parameter. For example, you must\n'
+                                                                                                  'type in 100 Hz if you are measuring 101 Hz or higher.\n'
+                                                                                                  'For all other functions, you must supply a **range** that exceeds the\n'
+                                                                                                  'value that you are measuring. For example, you must type in 10 V if you\n'
+                                                                                                  'are measuring 9 V. **range** values are coerced up to the closest input\n'
+                                                                                                  '**range**. Refer to the `Devices\n'
+                                                                                                  'Overview <REPLACE_DRIVER_SPECIFIC_URL_1(devices)>`__ for a list of valid\n'
+                                                                                                  'ranges. The driver sets NIDMM_ATTR_RANGE to this value. The default is\n'
+                                                                                                  '0.02 V.\n',
+                                                                                   'note': [   '\n'
+                                                                                               'The NI 4050, NI 4060, and NI 4065 only support Auto Range when the\n'
+                                                                                               'trigger and sample trigger are set to IMMEDIATE.\n',
+                                                                                               '\n'
+                                                                                               'One or more of the referenced values are not in the Python API for this driver. Enums that only define '
+                                                                                               'values, or represent True/False, have been removed.\n'],
+                                                                                   'table_body': [   [   'NIDMM_VAL_AUTO_RANGE_ON',
+                                                                                                         '-1.0',
+                                                                                                         'NI-DMM performs an Auto Range before acquiring the measurement.'],
+                                                                                                     [   'NIDMM_VAL_AUTO_RANGE_OFF',
+                                                                                                         '-2.0',
+                                                                                                         'NI-DMM sets the Range to the current NIDMM_ATTR_AUTO_RANGE_VALUE and uses this range for all '
+                                                                                                         'subsequent measurements until the measurement configuration is changed.'],
+                                                                                                     [   'NIDMM_VAL_AUTO_RANGE_ONCE',
+                                                                                                         '-3.0',
+                                                                                                         'NI-DMM performs an Auto Range before acquiring the measurement. The '
+                                                                                                         'NIDMM_ATTR_AUTO_RANGE_VALUE is stored and used for all subsequent measurements until the '
+                                                                                                         'measurement configuration is changed.']]},
+                                                              'enum': None,
+                                                              'is_buffer': False,
+                                                              'is_repeated_capability': False,
+                                                              'is_session_handle': False,
+                                                              'is_string': False,
+                                                              'library_method_call_snippet': 'range_ctype',
+                                                              'name': 'Range',
+                                                              'numpy': False,
+                                                              'numpy_into_return': False,
+                                                              'python_name': 'range',
+                                                              'python_name_or_default_for_init': 'range',
+                                                              'python_name_with_default': 'range',
+                                                              'python_name_with_doc_default': 'range',
+                                                              'python_type': 'float',
+                                                              'size': {'mechanism': 'fixed', 'value': 1},
+                                                              'type': 'ViReal64',
+                                                              'use_array': False,
+                                                              'use_in_python_api': True,
+                                                              'use_list': False},
+                                                          {   'ctypes_type': 'ViReal64',
+                                                              'ctypes_type_library_call': 'ViReal64',
+                                                              'ctypes_variable_name': 'resolution_absolute_ctype',
+                                                              'direction': 'in',
+                                                              'documentation': {   'description': '\n'
+                                                                                                  'Specifies the absolute resolution for the measurement. NI-DMM sets\n'
+                                                                                                  'NIDMM_ATTR_RESOLUTION_ABSOLUTE to this value. This parameter is\n'
+                                                                                                  'ignored when the **Range** parameter is set to\n'
+                                                                                                  'NIDMM_VAL_AUTO_RANGE_ON (-1.0) or NIDMM_VAL_AUTO_RANGE_ONCE\n'
+                                                                                                  '(-3.0). The default is 0.001 V.\n',
+                                                                                   'note': [   '\n'
+                                                                                               'NI-DMM ignores this parameter for capacitance and inductance\n'
+                                                                                               'measurements on the NI 4072. To achieve better resolution for such\n'
+                                                                                               'measurements, use the NIDMM_ATTR_LC_NUMBER_MEAS_TO_AVERAGE\n'
+                                                                                               'attribute.\n',
+                                                                                               '\n'
+                                                                                               'One or more of the referenced values are not in the Python API for this driver. Enums that only define '
+                                                                                               'values, or represent True/False, have been removed.\n']},
+                                                              'enum': None,
+                                                              'is_buffer': False,
+                                                              'is_repeated_capability': False,
+                                                              'is_session_handle': False,
+                                                              'is_string': False,
+                                                              'library_method_call_snippet': 'resolution_absolute_ctype',
+                                                              'name': 'resolutionAbsolute',
+                                                              'numpy': False,
+                                                              'numpy_into_return': False,
+                                                              'python_name': 'resolution_absolute',
+                                                              'python_name_or_default_for_init': 'resolution_absolute',
+                                                              'python_name_with_default': 'resolution_absolute',
+                                                              'python_name_with_doc_default': 'resolution_absolute',
+                                                              'python_type': 'float',
+                                                              'size': {'mechanism': 'fixed', 'value': 1},
+                                                              'type': 'ViReal64',
+                                                              'use_array': False,
+                                                              'use_in_python_api': True,
+                                                              'use_list': False}],
+                                        'python_code_variables': [],
+                                        'python_name': 'configure_measurement_absolute',
+                                        'render_in_library': True,
+                                        'render_in_session_base': False,
+                                        'returns': 'ViStatus'},
+    'ConfigureMeasurementDigits': {   'blocking': False,
+                                      'codegen_method': 'public',
+                                      'documentation': {   'description': '\n'
+                                                                          'Configures the common attributes of the measurement. These attributes\n'
+                                                                          'include NIDMM_ATTR_FUNCTION, NIDMM_ATTR_RANGE, and\n'
+                                                                          'NIDMM_ATTR_RESOLUTION_DIGITS.\n'},
+                                      'has_repeated_capability': False,
+                                      'invalidates_attribute_cache': True,
+                                      'is_error_handling': False,
+                                      'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                      'name': 'ConfigureMeasurementDigits',
+                                      'parameters': [   {   'ctypes_type': 'ViSession',
+                                                            'ctypes_type_library_call': 'ViSession',
+                                                            'ctypes_variable_name': 'vi_ctype',
+                                                            'direction': 'in',
+                                                            'documentation': {   'description': '\n'
+                                                                                                'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                                'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                                'None.\n',
+                                                                                 'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                            'enum': None,
+                                                            'is_buffer': False,
+                                                            'is_repeated_capability': False,
+                                                            'is_session_handle': True,
+                                                            'is_string': False,
+                                                            'library_method_call_snippet': 'vi_ctype',
+                                                            'name': 'vi',
+                                                            'numpy': False,
+                                                            'numpy_into_return': False,
+                                                            'python_name': 'vi',
+                                                            'python_name_or_default_for_init': 'vi',
+                                                            'python_name_with_default': 'vi',
+                                                            'python_name_with_doc_default': 'vi',
+                                                            'python_type': 'int',
+                                                            'size': {'mechanism': 'fixed', 'value': 1},
+                                                            'type': 'ViSession',
+                                                            'use_array': False,
+                                                            'use_in_python_api': True,
+                                                            'use_list': False},
+                                                        {   'ctypes_type': 'ViInt32',
+                                                            'ctypes_type_library_call': 'ViInt32',
+                                                            'ctypes_variable_name': 'measurement_function_ctype',
+                                                            'direction': 'in',
+                                                            'documentation': {   'description': '\n'
+                                                                                                'Specifies the **measurement_function** used to acquire the measurement.\n'
+                                                                                                'The driver sets NIDMM_ATTR_FUNCTION to this value.\n'},
+                                                            'enum': 'Function',
+                                                            'is_buffer': False,
+                                                            'is_repeated_capability': False,
+                                                            'is_session_handle': False,
+                                                            'is_string': False,
+                                                            'library_method_call_snippet': 'measurement_function_ctype',
+                                                            'name': 'measurementFunction',
+                                                            'numpy': False,
+                                                            'numpy_into_return': False,
+                                                            'python_name': 'measurement_function',
+                                                            'python_name_or_default_for_init': 'measurement_function',
+                                                            'python_name_with_default': 'measurement_function',
+                                                            'python_name_with_doc_default': 'measurement_function',
+                                                            'python_type': 'enums.Function',
+                                                            'size': {'mechanism': 'fixed', 'value': 1},
+                                                            'type': 'ViInt32',
+                                                            'use_array': False,
+                                                            'use_in_python_api': True,
+                                                            'use_list': False},
+                                                        {   'ctypes_type': 'ViReal64',
+                                                            'ctypes_type_library_call': 'ViReal64',
+                                                            'ctypes_variable_name': 'range_ctype',
+                                                            'direction': 'in',
+                                                            'documentation': {   'description': '\n'
+                                                                                                'Specifies the range for the function specified in the\n'
+                                                                                                '**Measurement_Function** parameter. When frequency is specified in the\n'
+                                                                                                '**Measurement_Function** parameter, you must supply the minimum\n'
+                                                                                                'frequency expected in the **range** parameter. For example, you must\n'
+                                                                                                'type in 100 Hz if you are measuring 101 Hz or higher.\n'
+                                                                                                'For all other functions, you must supply a range that exceeds the value\n'
+                                                                                                'that you are measuring. For example, you must type in 10 V if you are\n'
+                                                                                                'measuring 9 V. range values are coerced up to the closest input range.\n'
+                                                                                                'Refer to the `Devices\n'
+                                                                                                'Overview <REPLACE_DRIVER_SPECIFIC_URL_1(devices)>`__ for a list of valid\n'
+                                                                                                'ranges. The driver sets NIDMM_ATTR_RANGE to this value. The default is\n'
+                                                                                                '0.02 V.\n',
+                                                                                 'note': [   '\n'
+                                                                                             'The NI 4050, NI 4060, and NI 4065 only support Auto Range when the\n'
+                                                                                             'trigger and sample trigger are set to IMMEDIATE.\n',
+                                                                                             '\n'
+                                                                                             'One or more of the referenced values are not in the Python API for this driver. Enums that only define '
+                                                                                             'values, or represent True/False, have been removed.\n'],
+                                                                                 'table_body': [   [   'NIDMM_VAL_AUTO_RANGE_ON',
+                                                                                                       '-1.0',
+                                                                                                       'NI-DMM performs an Auto Range before acquiring the measurement.'],
+                                                                                                   [   'NIDMM_VAL_AUTO_RANGE_OFF',
+                                                                                                       '-2.0',
+                                                                                                       'NI-DMM sets the Range to the current NIDMM_ATTR_AUTO_RANGE_VALUE and uses this range for all '
+                                                                                                       'subsequent measurements until the measurement configuration is changed.'],
+                                                                                                   [   'NIDMM_VAL_AUTO_RANGE_ONCE',
+                                                                                                       '-3.0',
+                                                                                                       'NI-DMM performs an Auto Range before acquiring the measurement. The '
+                                                                                                       'NIDMM_ATTR_AUTO_RANGE_VALUE is stored and used for all subsequent measurements until the '
+                                                                                                       'measurement configuration is changed.']]},
+                                                            'enum': None,
+                                                            'is_buffer': False,
+                                                            'is_repeated_capability': False,
+                                                            'is_session_handle': False,
+                                                            'is_string': False,
+                                                            'library_method_call_snippet': 'range_ctype',
+                                                            'name': 'Range',
+                                                            'numpy': False,
+                                                            'numpy_into_return': False,
+                                                            'python_name': 'range',
+                                                            'python_name_or_default_for_init': 'range',
+                                                            'python_name_with_default': 'range',
+                                                            'python_name_with_doc_default': 'range',
+                                                            'python_type': 'float',
+                                                            'size': {'mechanism': 'fixed', 'value': 1},
+                                                            'type': 'ViReal64',
+                                                            'use_array': False,
+                                                            'use_in_python_api': True,
+                                                            'use_list': False},
+                                                        {   'ctypes_type': 'ViReal64',
+                                                            'ctypes_type_library_call': 'ViReal64',
+                                                            'ctypes_variable_name': 'resolution_digits_ctype',
+                                                            'direction': 'in',
+                                                            'documentation': {   'description': '\n'
+                                                                                                'Specifies the resolution of the measurement in digits. The driver sets\n'
+                                                                                                'the `Devices Overview <REPLACE_DRIVER_SPECIFIC_URL_1(devices)>`__ for a\n'
+                                                                                                'list of valid ranges. The driver sets NIDMM_ATTR_RESOLUTION_DIGITS\n'
+                                                                                                'attribute to this value. This parameter is ignored when the **Range**\n'
+                                                                                                'parameter is set to NIDMM_VAL_AUTO_RANGE_ON (-1.0) or\n'
+                                                                                                'NIDMM_VAL_AUTO_RANGE_ONCE (-3.0). The default is 5½.\n',
+                                                                                 'note': [   '\n'
+                                                                                             'NI-DMM ignores this parameter for capacitance and inductance\n'
+                                                                                             'measurements on the NI 4072. To achieve better resolution for such\n'
+                                                                                             'measurements, use the NIDMM_ATTR_LC_NUMBER_MEAS_TO_AVERAGE\n'
+                                                                                             'attribute.\n',
+                                                                                             '\n'
+                                                                                             'One or more of the referenced values are not in the Python API for this driver. Enums that only define '
+                                                                                             'values, or represent True/False, have been removed.\n']},
+                                                            'enum': None,
+                                                            'is_buffer': False,
+                                                            'is_repeated_capability': False,
+                                                            'is_session_handle': False,
+                                                            'is_string': False,
+                                                            'library_method_call_snippet': 'resolution_digits_ctype',
+                                                            'name': 'resolutionDigits',
+                                                            'numpy': False,
+                                                            'numpy_into_return': False,
+                                                            'python_name': 'resolution_digits',
+                                                            'python_name_or_default_for_init': 'resolution_digits',
+                                                            'python_name_with_default': 'resolution_digits',
+                                                            'python_name_with_doc_default': 'resolution_digits',
+                                                            'python_type': 'float',
+                                                            'size': {'mechanism': 'fixed', 'value': 1},
+                                                            'type': 'ViReal64',
+                                                            'use_array': False,
+                                                            'use_in_python_api': True,
+                                                            'use_list': False}],
+                                      'python_code_variables': [],
+                                      'python_name': 'configure_measurement_digits',
+                                      'render_in_library': True,
+                                      'render_in_session_base': False,
+                                      'returns': 'ViStatus'},
+    'ConfigureMultiPoint': {   'blocking': False,
+                               'codegen_method': 'public',
+                               'documentation': {   'description': '\n'
+                                                                   'Configures the attributes for multipoint measurements. These attributes\n'
+                                                                   'include NIDMM_ATTR_TRIGGER_COUNT, NIDMM_ATTR_SAMPLE_COUNT,\n'
+                                                                   'NIDMM_ATTR_SAMPLE_TRIGGER, and NIDMM_ATTR_SAMPLE_INTERVAL.\n'
+                                                                   '\n'
+                                                                   'For continuous acquisitions, set NIDMM_ATTR_TRIGGER_COUNT or\n'
+                                                                   'NIDMM_ATTR_SAMPLE_COUNT to zero. For more information, refer to\n'
+                                                                   '`Multiple Point\n'
+                                                                   'Acquisitions <REPLACE_DRIVER_SPECIFIC_URL_1(multi_point)>`__,\n'
+                                                                   '`Triggering <REPLACE_DRIVER_SPECIFIC_URL_1(trigger)>`__, and `Using\n'
+                                                                   'Switches <REPLACE_DRIVER_SPECIFIC_URL_1(switch_selection)>`__.\n'},
+                               'has_repeated_capability': False,
+                               'invalidates_attribute_cache': True,
+                               'is_error_handling': False,
+                               'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                               'name': 'ConfigureMultiPoint',
+                               'parameters': [   {   'ctypes_type': 'ViSession',
+                                                     'ctypes_type_library_call': 'ViSession',
+                                                     'ctypes_variable_name': 'vi_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                         'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                         'None.\n',
+                                                                          'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': True,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'vi_ctype',
+                                                     'name': 'vi',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'vi',
+                                                     'python_name_or_default_for_init': 'vi',
+                                                     'python_name_with_default': 'vi',
+                                                     'python_name_with_doc_default': 'vi',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViSession',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViInt32',
+                                                     'ctypes_type_library_call': 'ViInt32',
+                                                     'ctypes_variable_name': 'trigger_count_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'Sets the number of triggers you want the DMM to receive before returning\n'
+                                                                                         'to the Idle state. The driver sets NIDMM_ATTR_TRIGGER_COUNT to this\n'
+                                                                                         'value. The default value is 1.\n'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'trigger_count_ctype',
+                                                     'name': 'triggerCount',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'trigger_count',
+                                                     'python_name_or_default_for_init': 'trigger_count',
+                                                     'python_name_with_default': 'trigger_count',
+                                                     'python_name_with_doc_default': 'trigger_count',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViInt32',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViInt32',
+                                                     'ctypes_type_library_call': 'ViInt32',
+                                                     'ctypes_variable_name': 'sample_count_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'Sets the number of measurements the DMM makes in each measurement\n'
+                                                                                         'sequence initiated by a trigger. The driver sets\n'
+                                                                                         'NIDMM_ATTR_SAMPLE_COUNT to this value. The default value is 1.\n'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'sample_count_ctype',
+                                                     'name': 'sampleCount',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'sample_count',
+                                                     'python_name_or_default_for_init': 'sample_count',
+                                                     'python_name_with_default': 'sample_count',
+                                                     'python_name_with_doc_default': 'sample_count',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViInt32',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViInt32',
+                                                     'ctypes_type_library_call': 'ViInt32',
+                                                     'ctypes_variable_name': 'sample_trigger_ctype',
+                                                     'default_value': 'SampleTrigger.IMMEDIATE',
+                                                     'direction': 'in',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'Specifies the **sample_trigger** source you want to use. The driver\n'
+                                                                                         'sets NIDMM_ATTR_SAMPLE_TRIGGER to this value. The default is\n'
+                                                                                         'Immediate.\n',
+                                                                          'note': '\n'
+                                                                                  'To determine which values are supported by each device, refer to the\n'
+                                                                                  '`LabWindows/CVI Trigger\n'
+                                                                                  'Routing <REPLACE_DRIVER_SPECIFIC_URL_1(cvitrigger_routing)>`__ section.\n'},
+                                                     'enum': 'SampleTrigger',
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'sample_trigger_ctype',
+                                                     'name': 'sampleTrigger',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'sample_trigger',
+                                                     'python_name_or_default_for_init': 'sample_trigger',
+                                                     'python_name_with_default': 'sample_trigger=enums.SampleTrigger.IMMEDIATE',
+                                                     'python_name_with_doc_default': 'sample_trigger=nidmm.SampleTrigger.IMMEDIATE',
+                                                     'python_type': 'enums.SampleTrigger',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViInt32',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViReal64',
+                                                     'ctypes_type_library_call': 'ViReal64',
+                                                     'ctypes_variable_name': 'sample_interval_ctype',
+                                                     'default_value': 'datetime.timedelta(seconds=-1)',
+                                                     'direction': 'in',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'Sets the amount of time in seconds the DMM waits between measurement\n'
+                                                                                         'cycles. The driver sets NIDMM_ATTR_SAMPLE_INTERVAL to this value.\n'
+                                                                                         'Specify a sample interval to add settling time between measurement\n'
+                                                                                         'cycles or to decrease the measurement rate. **sample_interval** only\n'
+                                                                                         'applies when the **Sample_Trigger** is set to INTERVAL.\n'
+                                                                                         '\n'
+                                                                                         'On the NI 4060, the **sample_interval** value is used as the settling\n'
+                                                                                         'time. When sample interval is set to 0, the DMM does not settle between\n'
+                                                                                         'measurement cycles. The NI 4065 and NI 4070/4071/4072 use the value\n'
+                                                                                         'specified in **sample_interval** as additional delay. The default value\n'
+                                                                                         '(-1) ensures that the DMM settles for a recommended time. This is the\n'
+                                                                                         'same as using an Immediate trigger.\n',
+                                                                          'note': 'This attribute is not used on the NI 4080/4081/4082 and the NI 4050.'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'sample_interval_ctype',
+                                                     'name': 'sampleInterval',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_api_converter_name': 'convert_timedelta_to_seconds',
+                                                     'python_api_converter_type': 'datetime.timedelta',
+                                                     'python_name': 'sample_interval',
+                                                     'python_name_or_default_for_init': '_converters.convert_timedelta_to_seconds(sample_interval, self._encoding)',
+                                                     'python_name_with_default': 'sample_interval=datetime.timedelta(seconds=-1)',
+                                                     'python_name_with_doc_default': "sample_interval='datetime.timedelta(seconds=-1)'",
+                                                     'python_type': 'float',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViReal64',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False}],
+                               'python_code_variables': [],
+                               'python_name': 'configure_multi_point',
+                               'render_in_library': True,
+                               'render_in_session_base': False,
+                               'returns': 'ViStatus'},
+    'ConfigureOffsetCompOhms': {   'codegen_method': 'no',
+                                   'documentation': {   'description': '\n'
+                                                                       'For NI 4080/4081/4082 and NI 4070/4071/4072, allows the DMM to\n'
+                                                                       'compensate for voltage offsets in resistance measurements. When\n'
+                                                                       '**Offset_Comp_Ohms** is enabled, the DMM measures the resistance twice\n'
+                                                                       '(once with the current source on and again with it turned off). Any\n'
+                                                                       'voltage offset present in both measurements is cancelled out.\n'
+                                                                       '**Offset_Comp_Ohms** is useful when measuring resistance values less\n'
+                                                                       'than 10 KΩ.\n'},
+                                   'invalidates_attribute_cache': True,
+                                   'parameters': [   {   'direction': 'in',
+                                                         'documentation': {   'description': '\n'
+                                                                                             'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                             'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                             'None.\n',
+                                                                              'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                         'name': 'vi',
+                                                         'type': 'ViSession'},
+                                                     {   'direction': 'in',
+                                                         'documentation': {   'description': '\n'
+                                                                                             'Enables or disables **offset_comp_ohms**. The driver sets\n'
+                                                                                             'NIDMM_ATTR_OFFSET_COMP_OHMS to this value.\n',
+                                                                              'note': [   '\n'
+                                                                                          'One or more of the referenced values are not in the Python API for this driver. Enums that only define '
+                                                                                          'values, or represent True/False, have been removed.\n'],
+                                                                              'table_body': [   ['NIDMM_VAL_OFFSET_COMP_OHMS_OFF (default)', '0', 'Off disables **Offset_Comp_Ohms**.'],
+                                                                                                ['NIDMM_VAL_OFFSET_COMP_OHMS_ON', '1', 'On enables **Offset_Comp_Ohms**.']],
+                                                                              'table_header': ['Name', 'Value', 'Description']},
+                                                         'name': 'offsetCompOhms',
+                                                         'type': 'ViInt32'}],
+                                   'returns': 'ViStatus'},
+    'ConfigureOpenCableCompValues': {   'blocking': False,
+                                        'codegen_method': 'public',
+                                        'documentation': {   'description': '\n'
+                                                                            'For the NI 4082 and NI 4072 only, configures the\n'
+                                                                            'NIDMM_ATTR_OPEN_CABLE_COMP_CONDUCTANCE and\n'
+                                                                            'NIDMM_ATTR_OPEN_CABLE_COMP_SUSCEPTANCE attributes.\n'},
+                                        'has_repeated_capability': False,
+                                        'invalidates_attribute_cache': True,
+                                        'is_error_handling': False,
+                                        'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                        'name': 'ConfigureOpenCableCompValues',
+                                        'parameters': [   {   'ctypes_type': 'ViSession',
+                                                              'ctypes_type_library_call': 'ViSession',
+                                                              'ctypes_variable_name': 'vi_ctype',
+                                                              'direction': 'in',
+                                                              'documentation': {   'description': '\n'
+                                                                                                  'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                                  'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                                  'None.\n',
+                                                                                   'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                              'enum': None,
+                                                              'is_buffer': False,
+                                                              'is_repeated_capability': False,
+                                                              'is_session_handle': True,
+                                                              'is_string': False,
+                                                              'library_method_call_snippet': 'vi_ctype',
+                                                              'name': 'vi',
+                                                              'numpy': False,
+                                                              'numpy_into_return': False,
+                                                              'python_name': 'vi',
+                                                              'python_name_or_default_for_init': 'vi',
+                                                              'python_name_with_default': 'vi',
+                                                              'python_name_with_doc_default': 'vi',
+                                                              'python_type': 'int',
+                                                              'size': {'mechanism': 'fixed', 'value': 1},
+                                                              'type': 'ViSession',
+                                                              'use_array': False,
+                                                              'use_in_python_api': True,
+                                                              'use_list': False},
+                                                          {   'ctypes_type': 'ViReal64',
+                                                              'ctypes_type_library_call': 'ViReal64',
+                                                              'ctypes_variable_name': 'conductance_ctype',
+                                                              'direction': 'in',
+                                                              'documentation': {'description': 'Specifies the open cable compensation **conductance**.'},
+                                                              'enum': None,
+                                                              'is_buffer': False,
+                                                              'is_repeated_capability': False,
+                                                              'is_session_handle': False,
+                                                              'is_string': False,
+                                                              'library_method_call_snippet': 'conductance_ctype',
+                                                              'name': 'Conductance',
+                                                              'numpy': False,
+                                                              'numpy_into_return': False,
+                                                              'python_name': 'conductance',
+                                                              'python_name_or_default_for_init': 'conductance',
+                                                              'python_name_with_default': 'conductance',
+                                                              'python_name_with_doc_default': 'conductance',
+                                                              'python_type': 'float',
+                                                              'size': {'mechanism': 'fixed', 'value': 1},
+                                                              'type': 'ViReal64',
+                                                              'use_array': False,
+                                                              'use_in_python_api': True,
+                                                              'use_list': False},
+                                                          {   'ctypes_type': 'ViReal64',
+                                                              'ctypes_type_library_call': 'ViReal64',
+                                                              'ctypes_variable_name': 'susceptance_ctype',
+                                                              'direction': 'in',
+                                                              'documentation': {'description': 'Specifies the open cable compensation **susceptance**.'},
+                                                              'enum': None,
+                                                              'is_buffer': False,
+                                                              'is_repeated_capability': False,
+                                                              'is_session_handle': False,
+                                                              'is_string': False,
+                                                              'library_method_call_snippet': 'susceptance_ctype',
+                                                              'name': 'Susceptance',
+                                                              'numpy': False,
+                                                              'numpy_into_return': False,
+                                                              'python_name': 'susceptance',
+                                                              'python_name_or_default_for_init': 'susceptance',
+                                                              'python_name_with_default': 'susceptance',
+                                                              'python_name_with_doc_default': 'susceptance',
+                                                              'python_type': 'float',
+                                                              'size': {'mechanism': 'fixed', 'value': 1},
+                                                              'type': 'ViReal64',
+                                                              'use_array': False,
+                                                              'use_in_python_api': True,
+                                                              'use_list': False}],
+                                        'python_code_variables': [],
+                                        'python_name': 'configure_open_cable_comp_values',
+                                        'render_in_library': True,
+                                        'render_in_session_base': False,
+                                        'returns': 'ViStatus'},
+    'ConfigurePowerLineFrequency': {   'blocking': False,
+                                       'codegen_method': 'public',
+                                       'documentation': {'description': 'Specifies the powerline frequency.'},
+                                       'has_repeated_capability': False,
+                                       'invalidates_attribute_cache': True,
+                                       'is_error_handling': False,
+                                       'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                       'name': 'ConfigurePowerLineFrequency',
+                                       'parameters': [   {   'ctypes_type': 'ViSession',
+                                                             'ctypes_type_library_call': 'ViSession',
+                                                             'ctypes_variable_name': 'vi_ctype',
+                                                             'direction': 'in',
+                                                             'documentation': {   'description': '\n'
+                                                                                                 'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                                 'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                                 'None.\n',
+                                                                                  'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                             'enum': None,
+                                                             'is_buffer': False,
+                                                             'is_repeated_capability': False,
+                                                             'is_session_handle': True,
+                                                             'is_string': False,
+                                                             'library_method_call_snippet': 'vi_ctype',
+                                                             'name': 'vi',
+                                                             'numpy': False,
+                                                             'numpy_into_return': False,
+                                                             'python_name': 'vi',
+                                                             'python_name_or_default_for_init': 'vi',
+                                                             'python_name_with_default': 'vi',
+                                                             'python_name_with_doc_default': 'vi',
+                                                             'python_type': 'int',
+                                                             'size': {'mechanism': 'fixed', 'value': 1},
+                                                             'type': 'ViSession',
+                                                             'use_array': False,
+                                                             'use_in_python_api': True,
+                                                             'use_list': False},
+                                                         {   'ctypes_type': 'ViReal64',
+                                                             'ctypes_type_library_call': 'ViReal64',
+                                                             'ctypes_variable_name': 'power_line_frequency_hz_ctype',
+                                                             'direction': 'in',
+                                                             'documentation': {   'description': '\n'
+                                                                                                 '**Powerline Frequency** specifies the powerline frequency in hertz.\n'
+                                                                                                 'NI-DMM sets the Powerline Frequency property to this value.\n'},
+                                                             'enum': None,
+                                                             'is_buffer': False,
+                                                             'is_repeated_capability': False,
+                                                             'is_session_handle': False,
+                                                             'is_string': False,
+                                                             'library_method_call_snippet': 'power_line_frequency_hz_ctype',
+                                                             'name': 'powerLineFrequencyHz',
+                                                             'numpy': False,
+                                                             'numpy_into_return': False,
+                                                             'python_name': 'power_line_frequency_hz',
+                                                             'python_name_or_default_for_init': 'power_line_frequency_hz',
+                                                             'python_name_with_default': 'power_line_frequency_hz',
+                                                             'python_name_with_doc_default': 'power_line_frequency_hz',
+                                                             'python_type': 'float',
+                                                             'size': {'mechanism': 'fixed', 'value': 1},
+                                                             'type': 'ViReal64',
+                                                             'use_array': False,
+                                                             'use_in_python_api': True,
+                                                             'use_list': False}],
+                                       'python_code_variables': [],
+                                       'python_name': 'configure_power_line_frequency',
+                                       'render_in_library': True,
+                                       'render_in_session_base': False,
+                                       'returns': 'ViStatus'},
+    'ConfigureRTDCustom': {   'blocking': False,
+                              'codegen_method': 'public',
+                              'documentation': {'description': 'Configures the A, B, and C parameters for a custom RTD.'},
+                              'has_repeated_capability': False,
+                              'invalidates_attribute_cache': True,
+                              'is_error_handling': False,
+                              'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                              'name': 'ConfigureRTDCustom',
+                              'parameters': [   {   'ctypes_type': 'ViSession',
+                                                    'ctypes_type_library_call': 'ViSession',
+                                                    'ctypes_variable_name': 'vi_ctype',
+                                                    'direction': 'in',
+                                                    'documentation': {   'description': '\n'
+                                                                                        'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                        'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                        'None.\n',
+                                                                         'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                    'enum': None,
+                                                    'is_buffer': False,
+                                                    'is_repeated_capability': False,
+                                                    'is_session_handle': True,
+                                                    'is_string': False,
+                                                    'library_method_call_snippet': 'vi_ctype',
+                                                    'name': 'vi',
+                                                    'numpy': False,
+                                                    'numpy_into_return': False,
+                                                    'python_name': 'vi',
+                                                    'python_name_or_default_for_init': 'vi',
+                                                    'python_name_with_default': 'vi',
+                                                    'python_name_with_doc_default': 'vi',
+                                                    'python_type': 'int',
+                                                    'size': {'mechanism': 'fixed', 'value': 1},
+                                                    'type': 'ViSession',
+                                                    'use_array': False,
+                                                    'use_in_python_api': True,
+                                                    'use_list': False},
+                                                {   'ctypes_type': 'ViReal64',
+                                                    'ctypes_type_library_call': 'ViReal64',
+                                                    'ctypes_variable_name': 'rtd_a_ctype',
+                                                    'direction': 'in',
+                                                    'documentation': {   'description': '\n'
+                                                                                        'Specifies the Callendar-Van Dusen A coefficient for RTD scaling when RTD\n'
+                                                                                        'Type parameter is set to Custom in the niDMM_ConfigureRTDType function.\n'
+                                                                                        'The default is 3.9083e-3 (Pt3851)\n'},
+                                                    'enum': None,
+                                                    'is_buffer': False,
+                                                    'is_repeated_capability': False,
+                                                    'is_session_handle': False,
+                                                    'is_string': False,
+                                                    'library_method_call_snippet': 'rtd_a_ctype',
+                                                    'name': 'rtdA',
+                                                    'numpy': False,
+                                                    'numpy_into_return': False,
+                                                    'python_name': 'rtd_a',
+                                                    'python_name_or_default_for_init': 'rtd_a',
+                                                    'python_name_with_default': 'rtd_a',
+                                                    'python_name_with_doc_default': 'rtd_a',
+                                                    'python_type': 'float',
+                                                    'size': {'mechanism': 'fixed', 'value': 1},
+                                                    'type': 'ViReal64',
+                                                    'use_array': False,
+                                                    'use_in_python_api': True,
+                                                    'use_list': False},
+                                                {   'ctypes_type': 'ViReal64',
+                                                    'ctypes_type_library_call': 'ViReal64',
+                                                    'ctypes_variable_name': 'rtd_b_ctype',
+                                                    'direction': 'in',
+                                                    'documentation': {   'description': '\n'
+                                                                                        'Specifies the Callendar-Van Dusen B coefficient for RTD scaling when RTD\n'
+                                                                                        'Type parameter is set to Custom in the niDMM_ConfigureRTDType function.\n'
+                                                                                        'The default is -5.775e-7 (Pt3851).\n'},
+                                                    'enum': None,
+                                                    'is_buffer': False,
+                                                    'is_repeated_capability': False,
+                                                    'is_session_handle': False,
+                                                    'is_string': False,
+                                                    'library_method_call_snippet': 'rtd_b_ctype',
+                                                    'name': 'rtdB',
+                                                    'numpy': False,
+                                                    'numpy_into_return': False,
+                                                    'python_name': 'rtd_b',
+                                                    'python_name_or_default_for_init': 'rtd_b',
+                                                    'python_name_with_default': 'rtd_b',
+                                                    'python_name_with_doc_default': 'rtd_b',
+                                                    'python_type': 'float',
+                                                    'size': {'mechanism': 'fixed', 'value': 1},
+                                                    'type': 'ViReal64',
+                                                    'use_array': False,
+                                                    'use_in_python_api': True,
+                                                    'use_list': False},
+                                                {   'ctypes_type': 'ViReal64',
+                                                    'ctypes_type_library_call': 'ViReal64',
+                                                    'ctypes_variable_name': 'rtd_c_ctype',
+                                                    'direction': 'in',
+                                                    'documentation': {   'description': '\n'
+                                                                                        'Specifies the Callendar-Van Dusen C coefficient for RTD scaling when RTD\n'
+                                                                                        'Type parameter is set to Custom in the niDMM_ConfigureRTDType function.\n'
+                                                                                        'The default is -4.183e-12 (Pt3851).\n'},
+                                                    'enum': None,
+                                                    'is_buffer': False,
+                                                    'is_repeated_capability': False,
+                                                    'is_session_handle': False,
+                                                    'is_string': False,
+                                                    'library_method_call_snippet': 'rtd_c_ctype',
+                                                    'name': 'rtdC',
+                                                    'numpy': False,
+                                                    'numpy_into_return': False,
+                                                    'python_name': 'rtd_c',
+                                                    'python_name_or_default_for_init': 'rtd_c',
+                                                    'python_name_with_default': 'rtd_c',
+                                                    'python_name_with_doc_default': 'rtd_c',
+                                                    'python_type': 'float',
+                                                    'size': {'mechanism': 'fixed', 'value': 1},
+                                                    'type': 'ViReal64',
+                                                    'use_array': False,
+                                                    'use_in_python_api': True,
+                                                    'use_list': False}],
+                              'python_code_variables': [],
+                              'python_name': 'configure_rtd_custom',
+                              'render_in_library': True,
+                              'render_in_session_base': False,
+                              'returns': 'ViStatus'},
+    'ConfigureRTDType': {   'blocking': False,
+                            'codegen_method': 'public',
+                            'documentation': {'description': 'Configures the RTD Type and RTD Resistance parameters for an RTD.'},
+                            'has_repeated_capability': False,
+                            'invalidates_attribute_cache': True,
+                            'is_error_handling': False,
+                            'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                            'name': 'ConfigureRTDType',
+                            'parameters': [   {   'ctypes_type': 'ViSession',
+                                                  'ctypes_type_library_call': 'ViSession',
+                                                  'ctypes_variable_name': 'vi_ctype',
+                                                  'direction': 'in',
+                                                  'documentation': {   'description': '\n'
+                                                                                      'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                      'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                      'None.\n',
+                                                                       'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                  'enum': None,
+                                                  'is_buffer': False,
+                                                  'is_repeated_capability': False,
+                                                  'is_session_handle': True,
+                                                  'is_string': False,
+                                                  'library_method_call_snippet': 'vi_ctype',
+                                                  'name': 'vi',
+                                                  'numpy': False,
+                                                  'numpy_into_return': False,
+                                                  'python_name': 'vi',
+                                                  'python_name_or_default_for_init': 'vi',
+                                                  'python_name_with_default': 'vi',
+                                                  'python_name_with_doc_default': 'vi',
+                                                  'python_type': 'int',
+                                                  'size': {'mechanism': 'fixed', 'value': 1},
+                                                  'type': 'ViSession',
+                                                  'use_array': False,
+                                                  'use_in_python_api': True,
+                                                  'use_list': False},
+                                              {   'ctypes_type': 'ViInt32',
+                                                  'ctypes_type_library_call': 'ViInt32',
+                                                  'ctypes_variable_name': 'rtd_type_ctype',
+                                                  'direction': 'in',
+                                                  'documentation': {   'description': '\n'
+                                                                                      'Specifies the type of RTD used to measure the temperature resistance.\n'
+                                                                                      'NI-DMM uses this value to set the RTD Type property. The default is\n'
+                                                                                      'NIDMM_VAL_TEMP_RTD_PT3851.\n',
+                                                                       'table_body': [   ['Callendar-Van Dusen Coefficient', '', '', '', '', '', ''],
+                                                                                         [   'NIDMM_VAL_TEMP_RTD_PT3851',
+                                                                                             'IEC-751 DIN 43760 BS 1904 ASTM-E1137 EN-60751',
+                                                                                             'Platinum',
+                                                                                             '.003851',
+                                                                                             '100 Ω 1000 Ω',
+                                                                                             'A = 3.9083 × 10\\ :sup:`–3` B = –5.775×10:sup:`–7` C = –4.183×10:sup:`–12`',
+                                                                                             'Most common RTDs'],
+                                                                                         [   'NIDMM_VAL_TEMP_RTD_PT3750',
+                                                                                             'Low-cost vendor compliant RTD\\*',
+                                                                                             'Platinum',
+                                                                                             '.003750',
+                                                                                             '1000 Ω',
+                                                                                             'A = 3.81 × 10\\ :sup:`–3` B = –6.02×10:sup:`–7` C = –6.0×10:sup:`–12`',
+                                                                                             'Low-cost RTD'],
+                                                                                         [   'NIDMM_VAL_TEMP_RTD_PT3916',
+                                                                                             'JISC 1604',
+                                                                                             'Platinum',
+                                                                                             '.003916',
+                                                                                             '100 Ω',
+                                                                                             'A = 3.9739 × 10\\ :sup:`–3` B = –5.870×10:sup:`–7` C = –4.4 ×10\\ :sup:`–12`',
+                                                                                             'Used in primarily in Japan'],
+                                                                                         [   'NIDMM_VAL_TEMP_RTD_PT3920',
+                                                                                             'US Industrial Standard D-100 American',
+                                                                                             'Platinum',
+                                                                                             '.003920',
+                                                                                             '100 Ω',
+                                                                                             'A = 3.9787 × 10\\ :sup:`–3` B = –5.8686×10:sup:`–7` C = –4.167 ×10\\ :sup:`–12`',
+                                                                                             'Low-cost RTD'],
+                                                                                         [   'NIDMM_VAL_TEMP_RTD_PT3911',
+                                                                                             'US Industrial Standard American',
+                                                                                             'Platinum',
+                                                                                             '.003911',
+                                                                                             '100 Ω',
+                                                                                             'A = 3.9692 × 10\\ :sup:`–3` B = –5.8495×10:sup:`–7` C = –4.233 ×10\\ :sup:`–12`',
+                                                                                             'Low-cost RTD'],
+                                                                                         [   'NIDMM_VAL_TEMP_RTD_PT3928',
+                                                                                             'ITS-90',
+                                                                                             'Platinum',
+                                                                                             '.003928',
+                                                                                             '100 Ω',
+                                                                                             'A = 3.9888 × 10\\ :sup:`–3` B = –5.915×10:sup:`–7` C = –3.85 ×10\\ :sup:`–12`',
+                                                                                             'The definition of temperature'],
+                                                                                         ['\\*No standard. Check the TCR.', '', '', '', '', '', '']],
+                                                                       'table_header': ['Enum', 'Standards', 'Material', 'TCR (α)', 'Typical R\\ :sub:`0` (Ω)', 'Notes', '']},
+                                                  'enum': 'RTDType',
+                                                  'is_buffer': False,
+                                                  'is_repeated_capability': False,
+                                                  'is_session_handle': False,
+                                                  'is_string': False,
+                                                  'library_method_call_snippet': 'rtd_type_ctype',
+                                                  'name': 'rtdType',
+                                                  'numpy': False,
+                                                  'numpy_into_return': False,
+                                                  'python_name': 'rtd_type',
+                                                  'python_name_or_default_for_init': 'rtd_type',
+                                                  'python_name_with_default': 'rtd_type',
+                                                  'python_name_with_doc_default': 'rtd_type',
+                                                  'python_type': 'enums.RTDType',
+                                                  'size': {'mechanism': 'fixed', 'value': 1},
+                                                  'type': 'ViInt32',
+                                                  'use_array': False,
+                                                  'use_in_python_api': True,
+                                                  'use_list': False},
+                                              {   'ctypes_type': 'ViReal64',
+                                                  'ctypes_type_library_call': 'ViReal64',
+                                                  'ctypes_variable_name': 'rtd_resistance_ctype',
+                                                  'direction': 'in',
+                                                  'documentation': {   'description': '\n'
+                                                                                      'Specifies the RTD resistance in ohms at 0 °C. NI-DMM uses this value to\n'
+                                                                                      'set the RTD Resistance property. The default is 100 (Ω).\n'},
+                                                  'enum': None,
+                                                  'is_buffer': False,
+                                                  'is_repeated_capability': False,
+                                                  'is_session_handle': False,
+                                                  'is_string': False,
+                                                  'library_method_call_snippet': 'rtd_resistance_ctype',
+                                                  'name': 'rtdResistance',
+                                                  'numpy': False,
+                                                  'numpy_into_return': False,
+                                                  'python_name': 'rtd_resistance',
+                                                  'python_name_or_default_for_init': 'rtd_resistance',
+                                                  'python_name_with_default': 'rtd_resistance',
+                                                  'python_name_with_doc_default': 'rtd_resistance',
+                                                  'python_type': 'float',
+                                                  'size': {'mechanism': 'fixed', 'value': 1},
+                                                  'type': 'ViReal64',
+                                                  'use_array': False,
+                                                  'use_in_python_api': True,
+                                                  'use_list': False}],
+                            'python_code_variables': [],
+                            'python_name': 'configure_rtd_type',
+                            'render_in_library': True,
+                            'render_in_session_base': False,
+                            'returns': 'ViStatus'},
+    'ConfigureSampleTriggerSlope': {   'codegen_method': 'no',
+                                       'documentation': {'description': '\nSets the NIDMM_ATTR_SAMPLE_TRIGGER_SLOPE to either rising edge\n(positive) or falling edge (negative) polarity.\n'},
+                                       'invalidates_attribute_cache': True,
+                                       'parameters': [   {   'direction': 'in',
+                                                             'documentation': {   'description': '\n'
+                                                                                                 'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                                 'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                                 'None.\n',
+                                                                                  'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                             'name': 'vi',
+                                                             'type': 'ViSession'},
+                                                         {   'direction': 'in',
+                                                             'documentation': {   'description': '\n'
+                                                                                                 'Specifies the polarity of the Trigger signal on which the measurement is\n'
+                                                                                                 'triggered for values of either NIDMM_VAL_POSITIVE or\n'
+                                                                                                 'NIDMM_VAL_NEGATIVE. The driver sets\n'
+                                                                                                 'NIDMM_ATTR_SAMPLE_TRIGGER_SLOPE to this value.\n',
+                                                                                  'note': [   '\n'
+                                                                                              'One or more of the referenced values are not in the Python API for this driver. Enums that only define '
+                                                                                              'values, or represent True/False, have been removed.\n'],
+                                                                                  'table_body': [   [   'Rising Edge',
+                                                                                                        '0',
+                                                                                                        'NIDMM_VAL_POSITIVE',
+                                                                                                        'The driver triggers on the rising edge of the trigger signal.'],
+                                                                                                    [   'Falling Edge (default)',
+                                                                                                        '1',
+                                                                                                        'NIDMM_VAL_NEGATIVE',
+                                                                                                        'The driver triggers on the falling edge of the trigger signal.']]},
+                                                             'name': 'sampleTriggerSlope',
+                                                             'type': 'ViInt32'}],
+                                       'returns': 'ViStatus'},
+    'ConfigureShortCableCompValues': {   'blocking': False,
+                                         'codegen_method': 'public',
+                                         'documentation': {   'description': '\n'
+                                                                             'For the NI 4082 and NI 4072 only, configures the\n'
+                                                                             'NIDMM_ATTR_SHORT_CABLE_COMP_RESISTANCE and\n'
+                                                                             'NIDMM_ATTR_SHORT_CABLE_COMP_REACTANCE attributes.\n'},
+                                         'has_repeated_capability': False,
+                                         'invalidates_attribute_cache': True,
+                                         'is_error_handling': False,
+                                         'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                         'name': 'ConfigureShortCableCompValues',
+                                         'parameters': [   {   'ctypes_type': 'ViSession',
+                                                               'ctypes_type_library_call': 'ViSession',
+                                                               'ctypes_variable_name': 'vi_ctype',
+                                                               'direction': 'in',
+                                                               'documentation': {   'description': '\n'
+                                                                                                   'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                                   'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                                   'None.\n',
+                                                                                    'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                               'enum': None,
+                                                               'is_buffer': False,
+                                                               'is_repeated_capability': False,
+                                                               'is_session_handle': True,
+                                                               'is_string': False,
+                                                               'library_method_call_snippet': 'vi_ctype',
+                                                               'name': 'vi',
+                                                               'numpy': False,
+                                                               'numpy_into_return': False,
+                                                               'python_name': 'vi',
+                                                               'python_name_or_default_for_init': 'vi',
+                                                               'python_name_with_default': 'vi',
+                                                               'python_name_with_doc_default': 'vi',
+                                                               'python_type': 'int',
+                                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                                               'type': 'ViSession',
+                                                               'use_array': False,
+                                                               'use_in_python_api': True,
+                                                               'use_list': False},
+                                                           {   'ctypes_type': 'ViReal64',
+                                                               'ctypes_type_library_call': 'ViReal64',
+                                                               'ctypes_variable_name': 'resistance_ctype',
+                                                               'direction': 'in',
+                                                               'documentation': {'description': 'Specifies the short cable compensation **resistance**.'},
+                                                               'enum': None,
+                                                               'is_buffer': False,
+                                                               'is_repeated_capability': False,
+                                                               'is_session_handle': False,
+                                                               'is_string': False,
+                                                               'library_method_call_snippet': 'resistance_ctype',
+                                                               'name': 'Resistance',
+                                                               'numpy': False,
+                                                               'numpy_into_return': False,
+                                                               'python_name': 'resistance',
+                                                               'python_name_or_default_for_init': 'resistance',
+                                                               'python_name_with_default': 'resistance',
+                                                               'python_name_with_doc_default': 'resistance',
+                                                               'python_type': 'float',
+                                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                                               'type': 'ViReal64',
+                                                               'use_array': False,
+                                                               'use_in_python_api': True,
+                                                               'use_list': False},
+                                                           {   'ctypes_type': 'ViReal64',
+                                                               'ctypes_type_library_call': 'ViReal64',
+                                                               'ctypes_variable_name': 'reactance_ctype',
+                                                               'direction': 'in',
+                                                               'documentation': {'description': 'Specifies the short cable compensation **reactance**.'},
+                                                               'enum': None,
+                                                               'is_buffer': False,
+                                                               'is_repeated_capability': False,
+                                                               'is_session_handle': False,
+                                                               'is_string': False,
+                                                               'library_method_call_snippet': 'reactance_ctype',
+                                                               'name': 'Reactance',
+                                                               'numpy': False,
+                                                               'numpy_into_return': False,
+                                                               'python_name': 'reactance',
+                                                               'python_name_or_default_for_init': 'reactance',
+                                                               'python_name_with_default': 'reactance',
+                                                               'python_name_with_doc_default': 'reactance',
+                                                               'python_type': 'float',
+                                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                                               'type': 'ViReal64',
+                                                               'use_array': False,
+                                                               'use_in_python_api': True,
+                                                               'use_list': False}],
+                                         'python_code_variables': [],
+                                         'python_name': 'configure_short_cable_comp_values',
+                                         'render_in_library': True,
+                                         'render_in_session_base': False,
+                                         'returns': 'ViStatus'},
+    'ConfigureThermistorCustom': {   'blocking': False,
+                                     'codegen_method': 'public',
+                                     'documentation': {'description': 'Configures the A, B, and C parameters for a custom thermistor.'},
+                                     'has_repeated_capability': False,
+                                     'invalidates_attribute_cache': True,
+                                     'is_error_handling': False,
+                                     'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                     'name': 'ConfigureThermistorCustom',
+                                     'parameters': [   {   'ctypes_type': 'ViSession',
+                                                           'ctypes_type_library_call': 'ViSession',
+                                                           'ctypes_variable_name': 'vi_ctype',
+                                                           'direction': 'in',
+                                                           'documentation': {   'description': '\n'
+                                                                                               'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                               'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                               'None.\n',
+                                                                                'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                           'enum': None,
+                                                           'is_buffer': False,
+                                                           'is_repeated_capability': False,
+                                                           'is_session_handle': True,
+                                                           'is_string': False,
+                                                           'library_method_call_snippet': 'vi_ctype',
+                                                           'name': 'vi',
+                                                           'numpy': False,
+                                                           'numpy_into_return': False,
+                                                           'python_name': 'vi',
+                                                           'python_name_or_default_for_init': 'vi',
+                                                           'python_name_with_default': 'vi',
+                                                           'python_name_with_doc_default': 'vi',
+                                                           'python_type': 'int',
+                                                           'size': {'mechanism': 'fixed', 'value': 1},
+                                                           'type': 'ViSession',
+                                                           'use_array': False,
+                                                           'use_in_python_api': True,
+                                                           'use_list': False},
+                                                       {   'ctypes_type': 'ViReal64',
+                                                           'ctypes_type_library_call': 'ViReal64',
+                                                           'ctypes_variable_name': 'thermistor_a_ctype',
+                                                           'direction': 'in',
+                                                           'documentation': {   'description': '\n'
+                                                                                               'Specifies the Steinhart-Hart A coefficient for thermistor scaling when\n'
+                                                                                               'Thermistor Type is set to Custom in the niDMM_ConfigureThermistorType\n'
+                                                                                               'function. The default is 1.0295e-3 (44006).\n',
+                                                                                'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                           'enum': None,
+                                                           'is_buffer': False,
+                                                           'is_repeated_capability': False,
+                                                           'is_session_handle': False,
+                                                           'is_string': False,
+                                                           'library_method_call_snippet': 'thermistor_a_ctype',
+                                                           'name': 'thermistorA',
+                                                           'numpy': False,
+                                                           'numpy_into_return': False,
+                                                           'python_name': 'thermistor_a',
+                                                           'python_name_or_default_for_init': 'thermistor_a',
+                                                           'python_name_with_default': 'thermistor_a',
+                                                           'python_name_with_doc_default': 'thermistor_a',
+                                                           'python_type': 'float',
+                                                           'size': {'mechanism': 'fixed', 'value': 1},
+                                                           'type': 'ViReal64',
+                                                           'use_array': False,
+                                                           'use_in_python_api': True,
+                                                           'use_list': False},
+                                                       {   'ctypes_type': 'ViReal64',
+                                                           'ctypes_type_library_call': 'ViReal64',
+                                                           'ctypes_variable_name': 'thermistor_b_ctype',
+                                                           'direction': 'in',
+                                                           'documentation': {   'description': '\n'
+                                                                                               'Specifies the Steinhart-Hart B coefficient for thermistor scaling when\n'
+                                                                                               'Thermistor Type is set to Custom in the niDMM_ConfigureThermistorType\n'
+                                                                                               'function. The default is 2.391e-4 (44006).\n',
+                                                                                'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                           'enum': None,
+                                                           'is_buffer': False,
+                                                           'is_repeated_capability': False,
+                                                           'is_session_handle': False,
+                                                           'is_string': False,
+                                                           'library_method_call_snippet': 'thermistor_b_ctype',
+                                                           'name': 'thermistorB',
+                                                           'numpy': False,
+                                                           'numpy_into_return': False,
+                                                           'python_name': 'thermistor_b',
+                                                           'python_name_or_default_for_init': 'thermistor_b',
+                                                           'python_name_with_default': 'thermistor_b',
+                                                           'python_name_with_doc_default': 'thermistor_b',
+                                                           'python_type': 'float',
+                                                           'size': {'mechanism': 'fixed', 'value': 1},
+                                                           'type': 'ViReal64',
+                                                           'use_array': False,
+                                                           'use_in_python_api': True,
+                                                           'use_list': False},
+                                                       {   'ctypes_type': 'ViReal64',
+                                                           'ctypes_type_library_call': 'ViReal64',
+                                                           'ctypes_variable_name': 'thermistor_c_ctype',
+                                                           'direction': 'in',
+                                                           'documentation': {   'description': '\n'
+                                                                                               'Specifies the Steinhart-Hart C coefficient for thermistor scaling when\n'
+                                                                                               'Thermistor Type is set to Custom in the niDMM_ConfigureThermistorType\n'
+                                                                                               'function. The default is 1.568e-7 (44006).\n',
+                                                                                'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                           'enum': None,
+                                                           'is_buffer': False,
+                                                           'is_repeated_capability': False,
+                                                           'is_session_handle': False,
+                                                           'is_string': False,
+                                                           'library_method_call_snippet': 'thermistor_c_ctype',
+                                                           'name': 'thermistorC',
+                                                           'numpy': False,
+                                                           'numpy_into_return': False,
+                                                           'python_name': 'thermistor_c',
+                                                           'python_name_or_default_for_init': 'thermistor_c',
+                                                           'python_name_with_default': 'thermistor_c',
+                                                           'python_name_with_doc_default': 'thermistor_c',
+                                                           'python_type': 'float',
+                                                           'size': {'mechanism': 'fixed', 'value': 1},
+                                                           'type': 'ViReal64',
+                                                           'use_array': False,
+                                                           'use_in_python_api': True,
+                                                           'use_list': False}],
+                                     'python_code_variables': [],
+                                     'python_name': 'configure_thermistor_custom',
+                                     'render_in_library': True,
+                                     'render_in_session_base': False,
+                                     'returns': 'ViStatus'},
+    'ConfigureThermistorType': {   'codegen_method': 'no',
+                                   'documentation': {'description': 'Configures the thermistor type.'},
+                                   'invalidates_attribute_cache': True,
+                                   'parameters': [   {   'direction': 'in',
+                                                         'documentation': {   'description': '\n'
+                                                                                             'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                             'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                             'None.\n',
+                                                                              'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                         'name': 'vi',
+                                                         'type': 'ViSession'},
+                                                     {   'direction': 'in',
+                                                         'documentation': {   'description': '\n'
+                                                                                             'Specifies the type of thermistor used to measure the temperature. NI-DMM\n'
+                                                                                             'uses this value to set the Thermistor Type property. The default is\n'
+                                                                                             'NIDMM_VAL_TEMP_THERMISTOR_44006.\n'
+                                                                                             '\n'
+                                                                                             '+--------------------+--------------------+--------------------+--------------------+\n'
+                                                                                             '| **Defined Values** | **Thermistor       | **Value**          | **25 °C            |\n'
+                                                                                             '|                    | Type**             |                    | Resistance**       |\n'
+                                                                                             '+--------------------+--------------------+--------------------+--------------------+\n'
+                                                                                             '| NIDMM_VAL_TEMP_ | Custom             | 0                  | —                  |\n'
+                                                                                             '| THERMISTOR_CUSTOM |                    |                    |                    |\n'
+                                                                                             '+--------------------+--------------------+--------------------+--------------------+\n'
+                                                                                             '| NIDMM_VAL_TEMP_ | 44004              | 1                  | 2.25 kΩ            |\n'
+                                                                                             '| THERMISTOR_44004  |                    |                    |                    |\n'
+                                                                                             '+--------------------+--------------------+--------------------+--------------------+\n'
+                                                                                             '| NIDMM_VAL_TEMP_ | 44006              | 2                  | 10 kΩ              |\n'
+                                                                                             '| THERMISTOR_44006  |                    |                    |                    |\n'
+                                                                                             '+--------------------+--------------------+--------------------+--------------------+\n'
+                                                                                             '| NIDMM_VAL_TEMP_ | 44007              | 3                  | 5 kΩ               |\n'
+                                                                                             '| THERMISTOR_44007  |                    |                    |                    |\n'
+                                                                                             '+--------------------+--------------------+--------------------+--------------------+\n',
+                                                                              'note': [   '\n'
+                                                                                          'One or more of the referenced values are not in the Python API for this driver. Enums that only define '
+                                                                                          'values, or represent True/False, have been removed.\n']},
+                                                         'name': 'thermistorType',
+                                                         'type': 'ViInt32'}],
+                                   'returns': 'ViStatus'},
+    'ConfigureThermocouple': {   'blocking': False,
+                                 'codegen_method': 'public',
+                                 'documentation': {'description': '\nConfigures the thermocouple type and reference junction type for a\nchosen thermocouple.\n'},
+                                 'has_repeated_capability': False,
+                                 'invalidates_attribute_cache': True,
+                                 'is_error_handling': False,
+                                 'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                 'name': 'ConfigureThermocouple',
+                                 'parameters': [   {   'ctypes_type': 'ViSession',
+                                                       'ctypes_type_library_call': 'ViSession',
+                                                       'ctypes_variable_name': 'vi_ctype',
+                                                       'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                           'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                           'None.\n',
+                                                                            'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': True,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'vi_ctype',
+                                                       'name': 'vi',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'vi',
+                                                       'python_name_or_default_for_init': 'vi',
+                                                       'python_name_with_default': 'vi',
+                                                       'python_name_with_doc_default': 'vi',
+                                                       'python_type': 'int',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViSession',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False},
+                                                   {   'ctypes_type': 'ViInt32',
+                                                       'ctypes_type_library_call': 'ViInt32',
+                                                       'ctypes_variable_name': 'thermocouple_type_ctype',
+                                                       'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Specifies the type of thermocouple used to measure the temperature.\n'
+                                                                                           'NI-DMM uses this value to set the Thermocouple Type property. The\n'
+                                                                                           'default is NIDMM_VAL_TEMP_TC_J.\n',
+                                                                            'table_body': [   ['NIDMM_VAL_TEMP_TC_B', 'Thermocouple type B'],
+                                                                                              ['NIDMM_VAL_TEMP_TC_E', 'Thermocouple type E'],
+                                                                                              ['NIDMM_VAL_TEMP_TC_J', 'Thermocouple type J'],
+                                                                                              ['NIDMM_VAL_TEMP_TC_K', 'Thermocouple type K'],
+                                                                                              ['NIDMM_VAL_TEMP_TC_N', 'Thermocouple type N'],
+                                                                                              ['NIDMM_VAL_TEMP_TC_R', 'Thermocouple type R'],
+                                                                                              ['NIDMM_VAL_TEMP_TC_S', 'Thermocouple type S'],
+                                                                                              ['NIDMM_VAL_TEMP_TC_T', 'Thermocouple type T']]},
+                                                       'enum': 'ThermocoupleType',
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': False,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'thermocouple_type_ctype',
+                                                       'name': 'thermocoupleType',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'thermocouple_type',
+                                                       'python_name_or_default_for_init': 'thermocouple_type',
+                                                       'python_name_with_default': 'thermocouple_type',
+                                                       'python_name_with_doc_default': 'thermocouple_type',
+                                                       'python_type': 'enums.ThermocoupleType',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViInt32',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False},
+                                                   {   'ctypes_type': 'ViInt32',
+                                                       'ctypes_type_library_call': 'ViInt32',
+                                                       'ctypes_variable_name': 'reference_junction_type_ctype',
+                                                       'default_value': 'ThermocoupleReferenceJunctionType.FIXED',
+                                                       'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Specifies the type of reference junction to be used in the reference\n'
+                                                                                           'junction compensation of a thermocouple measurement. NI-DMM uses this\n'
+                                                                                           'value to set the Reference Junction Type property. The only supported\n'
+                                                                                           'value is NIDMM_VAL_TEMP_REF_JUNC_FIXED.\n',
+                                                                            'note': [   '\n'
+                                                                                        'One or more of the referenced values are not in the Python API for this driver. Enums that only define '
+                                                                                        'values, or represent True/False, have been removed.\n']},
+                                                       'enum': 'ThermocoupleReferenceJunctionType',
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': False,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'reference_junction_type_ctype',
+                                                       'name': 'referenceJunctionType',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'reference_junction_type',
+                                                       'python_name_or_default_for_init': 'reference_junction_type',
+                                                       'python_name_with_default': 'reference_junction_type=enums.ThermocoupleReferenceJunctionType.FIXED',
+                                                       'python_name_with_doc_default': 'reference_junction_type=nidmm.ThermocoupleReferenceJunctionType.FIXED',
+                                                       'python_type': 'enums.ThermocoupleReferenceJunctionType',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViInt32',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False}],
+                                 'python_code_variables': [],
+                                 'python_name': 'configure_thermocouple',
+                                 'render_in_library': True,
+                                 'render_in_session_base': False,
+                                 'returns': 'ViStatus'},
+    'ConfigureTransducerType': {   'codegen_method': 'no',
+                                   'documentation': {'description': 'Configures the transducer type.'},
+                                   'invalidates_attribute_cache': True,
+                                   'parameters': [   {   'direction': 'in',
+                                                         'documentation': {   'description': '\n'
+                                                                                             'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                             'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                             'None.\n',
+                                                                              'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                         'name': 'vi',
+                                                         'type': 'ViSession'},
+                                                     {   'direction': 'in',
+                                                         'documentation': {   'description': '\n'
+                                                                                             'Specifies the type of device used to measure the temperature. NI-DMM\n'
+                                                                                             'uses this value to set the Transducer Type property. The default is\n'
+                                                                                             'NIDMM_VAL_THERMOCOUPLE.\n',
+                                                                              'table_body': [   ['NIDMM_VAL_2_WIRE_RTD', '2-wire RTD'],
+                                                                                                ['NIDMM_VAL_4_WIRE_RTD', '4-wire RTD'],
+                                                                                                ['NIDMM_VAL_THERMISTOR', 'Thermistor'],
+                                                                                                ['NIDMM_VAL_THERMOCOUPLE', 'Thermocouple']]},
+                                                         'name': 'transducerType',
+                                                         'type': 'ViInt32'}],
+                                   'returns': 'ViStatus'},
+    'ConfigureTrigger': {   'blocking': False,
+                            'codegen_method': 'public',
+                            'documentation': {   'description': '\n'
+                                                                'Configures the DMM **Trigger_Source** and **Trigger_Delay**. Refer to\n'
+                                                                '`Triggering <REPLACE_DRIVER_SPECIFIC_URL_1(trigger)>`__ and `Using\n'
+                                                                'Switches <REPLACE_DRIVER_SPECIFIC_URL_1(switch_selection)>`__ for more\n'
+                                                                'information.\n'},
+                            'has_repeated_capability': False,
+                            'invalidates_attribute_cache': True,
+                            'is_error_handling': False,
+                            'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                            'name': 'ConfigureTrigger',
+                            'parameters': [   {   'ctypes_type': 'ViSession',
+                                                  'ctypes_type_library_call': 'ViSession',
+                                                  'ctypes_variable_name': 'vi_ctype',
+                                                  'direction': 'in',
+                                                  'documentation': {   'description': '\n'
+                                                                                      'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                      'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                      'None.\n',
+                                                                       'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                  'enum': None,
+                                                  'is_buffer': False,
+                                                  'is_repeated_capability': False,
+                                                  'is_session_handle': True,
+                                                  'is_string': False,
+                                                  'library_method_call_snippet': 'vi_ctype',
+                                                  'name': 'vi',
+                                                  'numpy': False,
+                                                  'numpy_into_return': False,
+                                                  'python_name': 'vi',
+                                                  'python_name_or_default_for_init': 'vi',
+                                                  'python_name_with_default': 'vi',
+                                                  'python_name_with_doc_default': 'vi',
+                                                  'python_type': 'int',
+                                                  'size': {'mechanism': 'fixed', 'value': 1},
+                                                  'type': 'ViSession',
+                                                  'use_array': False,
+                                                  'use_in_python_api': True,
+                                                  'use_list': False},
+                                              {   'ctypes_type': 'ViInt32',
+                                                  'ctypes_type_library_call': 'ViInt32',
+                                                  'ctypes_variable_name': 'trigger_source_ctype',
+                                                  'direction': 'in',
+                                                  'documentation': {   'description': '\n'
+                                                                                      'Specifies the **trigger_source** that initiates the acquisition. The\n'
+                                                                                      'driver sets NIDMM_ATTR_TRIGGER_SOURCE to this value. Software\n'
+                                                                                      'configures the DMM to wait until niDMM_SendSoftwareTrigger is called\n'
+                                                                                      'before triggering the DMM.\n',
+                                                                       'note': '\n'
+                                                                               'To determine which values are supported by each device, refer to the\n'
+                                                                               '`LabWindows/CVI Trigger\n'
+                                                                               'Routing <REPLACE_DRIVER_SPECIFIC_URL_1(cvitrigger_routing)>`__ section.\n'},
+                                                  'enum': 'TriggerSource',
+                                                  'is_buffer': False,
+                                                  'is_repeated_capability': False,
+                                                  'is_session_handle': False,
+                                                  'is_string': False,
+                                                  'library_method_call_snippet': 'trigger_source_ctype',
+                                                  'name': 'triggerSource',
+                                                  'numpy': False,
+                                                  'numpy_into_return': False,
+                                                  'python_name': 'trigger_source',
+                                                  'python_name_or_default_for_init': 'trigger_source',
+                                                  'python_name_with_default': 'trigger_source',
+                                                  'python_name_with_doc_default': 'trigger_source',
+                                                  'python_type': 'enums.TriggerSource',
+                                                  'size': {'mechanism': 'fixed', 'value': 1},
+                                                  'type': 'ViInt32',
+                                                  'use_array': False,
+                                                  'use_in_python_api': True,
+                                                  'use_list': False},
+                                              {   'ctypes_type': 'ViReal64',
+                                                  'ctypes_type_library_call': 'ViReal64',
+                                                  'ctypes_variable_name': 'trigger_delay_ctype',
+                                                  'default_value': 'datetime.timedelta(seconds=-1)',
+                                                  'direction': 'in',
+                                                  'documentation': {   'description': '\n'
+                                                                                      'Specifies the time that the DMM waits after it has received a trigger\n'
+                                                                                      'before taking a measurement. The driver sets the\n'
+                                                                                      'NIDMM_ATTR_TRIGGER_DELAY attribute to this value. By default,\n'
+                                                                                      '**trigger_delay** is NIDMM_VAL_AUTO_DELAY (-1), which means the DMM\n'
+                                                                                      'waits an appropriate settling time before taking the measurement. On the\n'
+                                                                                      'NI 4060, if you set **trigger_delay** to 0, the DMM does not settle\n'
+                                                                                      'before taking the measurement. The NI 4065 and NI 4070/4071/4072 use the\n'
+                                                                                      'value specified in **trigger_delay** as additional settling time.\n',
+                                                                       'note': [   '\nWhen using the NI 4050, **Trigger_Delay** must be set to\nNIDMM_VAL_AUTO_DELAY (-1).\n',
+                                                                                   '\n'
+                                                                                   'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or '
+                                                                                   'represent True/False, have been removed.\n']},
+                                                  'enum': None,
+                                                  'is_buffer': False,
+                                                  'is_repeated_capability': False,
+                                                  'is_session_handle': False,
+                                                  'is_string': False,
+                                                  'library_method_call_snippet': 'trigger_delay_ctype',
+                                                  'name': 'triggerDelay',
+                                                  'numpy': False,
+                                                  'numpy_into_return': False,
+                                                  'python_api_converter_name': 'convert_timedelta_to_seconds',
+                                                  'python_api_converter_type': 'datetime.timedelta',
+                                                  'python_name': 'trigger_delay',
+                                                  'python_name_or_default_for_init': '_converters.convert_timedelta_to_seconds(trigger_delay, self._encoding)',
+                                                  'python_name_with_default': 'trigger_delay=datetime.timedelta(seconds=-1)',
+                                                  'python_name_with_doc_default': "trigger_delay='datetime.timedelta(seconds=-1)'",
+                                                  'python_type': 'float',
+                                                  'size': {'mechanism': 'fixed', 'value': 1},
+                                                  'type': 'ViReal64',
+                                                  'use_array': False,
+                                                  'use_in_python_api': True,
+                                                  'use_list': False}],
+                            'python_code_variables': [],
+                            'python_name': 'configure_trigger',
+                            'render_in_library': True,
+                            'render_in_session_base': False,
+                            'returns': 'ViStatus'},
+    'ConfigureTriggerSlope': {   'codegen_method': 'no',
+                                 'documentation': {'description': '\nSets the NIDMM_ATTR_TRIGGER_SLOPE attribute to either rising edge\n(positive) or falling edge (negative) polarity.\n'},
+                                 'invalidates_attribute_cache': True,
+                                 'parameters': [   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                           'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                           'None.\n',
+                                                                            'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                       'name': 'vi',
+                                                       'type': 'ViSession'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Specifies the polarity of the trigger signal on which the measurement is\n'
+                                                                                           'triggered for values of either NIDMM_VAL_POSITIVE or\n'
+                                                                                           'NIDMM_VAL_NEGATIVE. The driver sets the NIDMM_ATTR_TRIGGER_SLOPE\n'
+                                                                                           'attribute to this value.\n',
+                                                                            'note': [   '\n'
+                                                                                        'One or more of the referenced values are not in the Python API for this driver. Enums that only define '
+                                                                                        'values, or represent True/False, have been removed.\n'],
+                                                                            'table_body': [   ['NIDMM_VAL_POSITIVE', '0', 'The driver triggers on the rising edge of the trigger signal.'],
+                                                                                              ['NIDMM_VAL_NEGATIVE (default)', '1', 'The driver triggers on the falling edge of the trigger signal.']]},
+                                                       'name': 'triggerSlope',
+                                                       'type': 'ViInt32'}],
+                                 'returns': 'ViStatus'},
+    'ConfigureWaveformAcquisition': {   'blocking': False,
+                                        'codegen_method': 'public',
+                                        'documentation': {   'description': '\n'
+                                                                            'Configures the DMM for waveform acquisitions. This feature is supported\n'
+                                                                            'on the NI 4080/4081/4082 and the NI 4070/4071/4072.\n'},
+                                        'has_repeated_capability': False,
+                                        'invalidates_attribute_cache': True,
+                                        'is_error_handling': False,
+                                        'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                        'name': 'ConfigureWaveformAcquisition',
+                                        'parameters': [   {   'ctypes_type': 'ViSession',
+                                                              'ctypes_type_library_call': 'ViSession',
+                                                              'ctypes_variable_name': 'vi_ctype',
+                                                              'direction': 'in',
+                                                              'documentation': {   'description': '\n'
+                                                                                                  'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                                  'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                                  'None.\n',
+                                                                                   'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                              'enum': None,
+                                                              'is_buffer': False,
+                                                              'is_repeated_capability': False,
+                                                              'is_session_handle': True,
+                                                              'is_string': False,
+                                                              'library_method_call_snippet': 'vi_ctype',
+                                                              'name': 'vi',
+                                                              'numpy': False,
+                                                              'numpy_into_return': False,
+                                                              'python_name': 'vi',
+                                                              'python_name_or_default_for_init': 'vi',
+                                                              'python_name_with_default': 'vi',
+                                                              'python_name_with_doc_default': 'vi',
+                                                              'python_type': 'int',
+                                                              'size': {'mechanism': 'fixed', 'value': 1},
+                                                              'type': 'ViSession',
+                                                              'use_array': False,
+                                                              'use_in_python_api': True,
+                                                              'use_list': False},
+                                                          {   'ctypes_type': 'ViInt32',
+                                                              'ctypes_type_library_call': 'ViInt32',
+                                                              'ctypes_variable_name': 'measurement_function_ctype',
+                                                              'direction': 'in',
+                                                              'documentation': {   'description': '\n'
+                                                                                                  'Specifies the **measurement_function** used in a waveform acquisition.\n'
+                                                                                                  'The driver sets NIDMM_ATTR_FUNCTION to this value.\n',
+                                                                                   'table_body': [   ['NIDMM_VAL_WAVEFORM_VOLTAGE (default)', '1003', 'Voltage Waveform'],
+                                                                                                     ['NIDMM_VAL_WAVEFORM_CURRENT', '1004', 'Current Waveform']]},
+                                                              'enum': 'Function',
+                                                              'is_buffer': False,
+                                                              'is_repeated_capability': False,
+                                                              'is_session_handle': False,
+                                                              'is_string': False,
+                                                              'library_method_call_snippet': 'measurement_function_ctype',
+                                                              'name': 'measurementFunction',
+                                                              'numpy': False,
+                                                              'numpy_into_return': False,
+                                                              'python_name': 'measurement_function',
+                                                              'python_name_or_default_for_init': 'measurement_function',
+                                                              'python_name_with_default': 'measurement_function',
+                                                              'python_name_with_doc_default': 'measurement_function',
+                                                              'python_type': 'enums.Function',
+                                                              'size': {'mechanism': 'fixed', 'value': 1},
+                                                              'type': 'ViInt32',
+                                                              'use_array': False,
+                                                              'use_in_python_api': True,
+                                                              'use_list': False},
+                                                          {   'ctypes_type': 'ViReal64',
+                                                              'ctypes_type_library_call': 'ViReal64',
+                                                              'ctypes_variable_name': 'range_ctype',
+                                                              'direction': 'in',
+                                                              'documentation': {   'description': '\n'
+                                                                                                  'Specifies the expected maximum amplitude of the input signal and sets\n'
+                                                                                                  'the **range** for the **Measurement_Function**. NI-DMM sets\n'
+                                                                                                  'NIDMM_ATTR_RANGE to this value. **range** values are coerced up to the\n'
+                                                                                                  'closest input **range**. The default is 10.0.\n'
+                                                                                                  '\n'
+                                                                                                  'For valid ranges refer to the topics in\n'
+                                                                                                  '`Devices <REPLACE_DRIVER_SPECIFIC_URL_1(devices)>`__.\n'
+                                                                                                  '\n'
+                                                                                                  'Auto-ranging is not supported during waveform acquisitions.\n'},
+                                                              'enum': None,
+                                                              'is_buffer': False,
+                                                              'is_repeated_capability': False,
+                                                              'is_session_handle': False,
+                                                              'is_string': False,
+                                                              'library_method_call_snippet': 'range_ctype',
+                                                              'name': 'Range',
+                                                              'numpy': False,
+                                                              'numpy_into_return': False,
+                                                              'python_name': 'range',
+                                                              'python_name_or_default_for_init': 'range',
+                                                              'python_name_with_default': 'range',
+                                                              'python_name_with_doc_default': 'range',
+                                                              'python_type': 'float',
+                                                              'size': {'mechanism': 'fixed', 'value': 1},
+                                                              'type': 'ViReal64',
+                                                              'use_array': False,
+                                                              'use_in_python_api': True,
+                                                              'use_list': False},
+                                                          {   'ctypes_type': 'ViReal64',
+                                                              'ctypes_type_library_call': 'ViReal64',
+                                                              'ctypes_variable_name': 'rate_ctype',
+                                                              'direction': 'in',
+                                                              'documentation': {   'description': '\n'
+                                                                                                  'Specifies the **rate** of the acquisition in samples per second. NI-DMM\n'
+                                                                                                  'sets NIDMM_ATTR_WAVEFORM_RATE to this value.\n'
+                                                                                                  '\n'
+                                                                                                  'The valid **Range** is 10.0–1,800,000 S/s. **rate** values are coerced\n'
+                                                                                                  'to the closest integer divisor of 1,800,000. The default value is\n'
+                                                                                                  '1,800,000.\n'},
+                                                              'enum': None,
+                                                              'is_buffer': False,
+                                                              'is_repeated_capability': False,
+                                                              'is_session_handle': False,
+                                                              'is_string': False,
+                                                              'library_method_call_snippet': 'rate_ctype',
+                                                              'name': 'Rate',
+                                                              'numpy': False,
+                                                              'numpy_into_return': False,
+                                                              'python_name': 'rate',
+                                                              'python_name_or_default_for_init': 'rate',
+                                                              'python_name_with_default': 'rate',
+                                                              'python_name_with_doc_default': 'rate',
+                                                              'python_type': 'float',
+                                                              'size': {'mechanism': 'fixed', 'value': 1},
+                                                              'type': 'ViReal64',
+                                                              'use_array': False,
+                                                              'use_in_python_api': True,
+                                                              'use_list': False},
+                                                          {   'ctypes_type': 'ViInt32',
+                                                              'ctypes_type_library_call': 'ViInt32',
+                                                              'ctypes_variable_name': 'waveform_points_ctype',
+                                                              'direction': 'in',
+                                                              'documentation': {   'description': '\n'
+                                                                                                  'Specifies the number of points to acquire before the waveform\n'
+                                                                                                  'acquisition completes. NI-DMM sets NIDMM_ATTR_WAVEFORM_POINTS to this\n'
+                                                                                                  'value.\n'
+                                                                                                  '\n'
+                                                                                                  'To calculate the maximum and minimum number of waveform points that you\n'
+                                                                                                  'can acquire in one acquisition, refer to the `Waveform Acquisition\n'
+                                                                                                  'Measurement Cycle <REPLACE_DRIVER_SPECIFIC_URL_1(waveform_cycle)>`__.\n'
+                                                                                                  '\n'
+                                                                                                  'The default value is 500.\n'},
+                                                              'enum': None,
+                                                              'is_buffer': False,
+                                                              'is_repeated_capability': False,
+                                                              'is_session_handle': False,
+                                                              'is_string': False,
+                                                              'library_method_call_snippet': 'waveform_points_ctype',
+                                                              'name': 'waveformPoints',
+                                                              'numpy': False,
+                                                              'numpy_into_return': False,
+                                                              'python_name': 'waveform_points',
+                                                              'python_name_or_default_for_init': 'waveform_points',
+                                                              'python_name_with_default': 'waveform_points',
+                                                              'python_name_with_doc_default': 'waveform_points',
+                                                              'python_type': 'int',
+                                                              'size': {'mechanism': 'fixed', 'value': 1},
+                                                              'type': 'ViInt32',
+                                                              'use_array': False,
+                                                              'use_in_python_api': True,
+                                                              'use_list': False}],
+                                        'python_code_variables': [],
+                                        'python_name': 'configure_waveform_acquisition',
+                                        'render_in_library': True,
+                                        'render_in_session_base': False,
+                                        'returns': 'ViStatus'},
+    'ConfigureWaveformCoupling': {   'codegen_method': 'no',
+                                     'documentation': {'description': '\nFor the NI 4080/4081/4082 and the NI 4070/4071/4072, configures\ninstrument coupling for voltage waveforms.\n'},
+                                     'invalidates_attribute_cache': True,
+                                     'parameters': [   {   'direction': 'in',
+                                                           'documentation': {   'description': '\n'
+                                                                                               'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                               'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                               'None.\n',
+                                                                                'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                           'name': 'vi',
+                                                           'type': 'ViSession'},
+                                                       {   'direction': 'in',
+                                                           'documentation': {   'description': '\nSelects DC or AC coupling. The driver sets\nNIDMM_ATTR_WAVEFORM_COUPLING to this value.\n',
+                                                                                'table_body': [   ['NIDMM_VAL_WAVEFORM_COUPLING_AC', '0', 'AC coupling'],
+                                                                                                  ['NIDMM_VAL_WAVEFORM_COUPLING_DC (default)', '1', 'DC coupling']],
+                                                                                'table_header': ['Name', 'Value', 'Description']},
+                                                           'name': 'waveformCoupling',
+                                                           'type': 'ViInt32'}],
+                                     'returns': 'ViStatus'},
+    'Control': {   'codegen_method': 'no',
+                   'documentation': {   'description': '\n'
+                                                       'Controls the DMM. Use this function if you want a parameter change to be\n'
+                                                       'immediately reflected in the hardware. Use this function before calling\n'
+                                                       'nidMM_Initiate to make the initiate call as quickly as possible.\n',
+                                        'note': '\n'
+                                                'The NI 4050 and NI 4060 are not supported.\n'
+                                                'Calling this function while the DMM is taking measurements results in an\n'
+                                                'error. After the DMM is finished taking measurements, calling this\n'
+                                                'function will make any unfetched data points unavailable.\n'},
+                   'parameters': [   {   'direction': 'in',
+                                         'documentation': {   'description': '\n'
+                                                                             'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                             'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                             'None.\n',
+                                                              'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                         'name': 'vi',
+                                         'type': 'ViSession'},
+                                     {   'direction': 'in',
+                                         'documentation': {   'description': '\n'
+                                                                             'The action you want the driver to perform. Only\n'
+                                                                             'NIDMM_VAL_CONTROL_COMMIT (0) is supported, which commits to hardware\n'
+                                                                             'all of the configured attributes associated with the session.\n',
+                                                              'note': [   '\n'
+                                                                          'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or represent '
+                                                                          'True/False, have been removed.\n']},
+                                         'name': 'controlAction',
+                                         'type': 'ViInt32'}],
+                   'returns': 'ViStatus'},
+    'Disable': {   'blocking': False,
+                   'codegen_method': 'public',
+                   'documentation': {   'description': '\n'
+                                                       'Places the instrument in a quiescent state where it has minimal or no\n'
+                                                       'impact on the system to which it is connected. If a measurement is in\n'
+                                                       'progress when this function is called, the measurement is aborted.\n'},
+                   'has_repeated_capability': False,
+                   'invalidates_attribute_cache': True,
+                   'is_error_handling': False,
+                   'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                   'name': 'Disable',
+                   'parameters': [   {   'ctypes_type': 'ViSession',
+                                         'ctypes_type_library_call': 'ViSession',
+                                         'ctypes_variable_name': 'vi_ctype',
+                                         'direction': 'in',
+                                         'documentation': {   'description': '\n'
+                                                                             'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                             'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                             'None.\n',
+                                                              'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                         'enum': None,
+                                         'is_buffer': False,
+                                         'is_repeated_capability': False,
+                                         'is_session_handle': True,
+                                         'is_string': False,
+                                         'library_method_call_snippet': 'vi_ctype',
+                                         'name': 'vi',
+                                         'numpy': False,
+                                         'numpy_into_return': False,
+                                         'python_name': 'vi',
+                                         'python_name_or_default_for_init': 'vi',
+                                         'python_name_with_default': 'vi',
+                                         'python_name_with_doc_default': 'vi',
+                                         'python_type': 'int',
+                                         'size': {'mechanism': 'fixed', 'value': 1},
+                                         'type': 'ViSession',
+                                         'use_array': False,
+                                         'use_in_python_api': True,
+                                         'use_list': False}],
+                   'python_code_variables': [],
+                   'python_name': 'disable',
+                   'render_in_library': True,
+                   'render_in_session_base': False,
+                   'returns': 'ViStatus'},
+    'Fetch': {   'blocking': True,
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\nReturns the value from a previously initiated measurement. You must call\nniDMM_Initiate before calling this function.\n',
+                                      'note': [   '\n'
+                                                  'This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same session '
+                                                  'wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the Session.executor '
+                                                  "property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.\n"]},
+                 'has_repeated_capability': False,
+                 'invalidates_attribute_cache': False,
+                 'is_error_handling': False,
+                 'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                 'name': 'Fetch',
+                 'parameters': [   {   'ctypes_type': 'ViSession',
+                                       'ctypes_type_library_call': 'ViSession',
+                                       'ctypes_variable_name': 'vi_ctype',
+                                       'direction': 'in',
+                                       'documentation': {   'description': '\n'
+                                                                           'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                           'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                           'None.\n',
+                                                            'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                       'enum': None,
+                                       'is_buffer': False,
+                                       'is_repeated_capability': False,
+                                       'is_session_handle': True,
+                                       'is_string': False,
+                                       'library_method_call_snippet': 'vi_ctype',
+                                       'name': 'vi',
+                                       'numpy': False,
+                                       'numpy_into_return': False,
+                                       'python_name': 'vi',
+                                       'python_name_or_default_for_init': 'vi',
+                                       'python_name_with_default': 'vi',
+                                       'python_name_with_doc_default': 'vi',
+                                       'python_type': 'int',
+                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                       'type': 'ViSession',
+                                       'use_array': False,
+                                       'use_in_python_api': True,
+                                       'use_list': False},
+                                   {   'ctypes_type': 'ViInt32',
+                                       'ctypes_type_library_call': 'ViInt32',
+                                       'ctypes_variable_name': 'maximum_time_ctype',
+                                       'default_value': 'datetime.timedelta(milliseconds=-1)',
+                                       'direction': 'in',
+                                       'documentation': {   'description': '\n'
+                                                                           'Specifies the **maximum_time** allowed for this function to complete in\n'
+                                                                           'milliseconds. If the function does not complete within this time\n'
+                                                                           'interval, the function returns the NIDMM_ERROR_MAX_TIME_EXCEEDED\n'
+                                                                           'error code. This may happen if an external trigger has not been\n'
+                                                                           'received, or if the specified timeout is not long enough for the\n'
+                                                                           'acquisition to complete.\n'
+                                                                           '\n'
+                                                                           'The valid range is 0–86400000. The default value is\n'
+                                                                           'NIDMM_VAL_TIME_LIMIT_AUTO (-1). The DMM calculates the timeout\n'
+                                                                           'automatically.\n',
+                                                            'note': [   '\n'
+                                                                        'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or represent '
+                                                                        'True/False, have been removed.\n']},
+                                       'enum': None,
+                                       'is_buffer': False,
+                                       'is_repeated_capability': False,
+                                       'is_session_handle': False,
+                                       'is_string': False,
+                                       'library_method_call_snippet': 'maximum_time_ctype',
+                                       'name': 'maximumTime',
+                                       'numpy': False,
+                                       'numpy_into_return': False,
+                                       'python_api_converter_name': 'convert_timedelta_to_milliseconds',
+                                       'python_api_converter_type': 'datetime.timedelta',
+                                       'python_name': 'maximum_time',
+                                       'python_name_or_default_for_init': '_converters.convert_timedelta_to_milliseconds(maximum_time, self._encoding)',
+                                       'python_name_with_default': 'maximum_time=datetime.timedelta(milliseconds=-1)',
+                                       'python_name_with_doc_default': "maximum_time='datetime.timedelta(milliseconds=-1)'",
+                                       'python_type': 'int',
+                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                       'type': 'ViInt32',
+                                       'use_array': False,
+                                       'use_in_python_api': True,
+                                       'use_list': False},
+                                   {   'ctypes_type': 'ViReal64',
+                                       'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                       'ctypes_variable_name': 'reading_ctype',
+                                       'direction': 'out',
+                                       'documentation': {'description': 'The measured value returned from the DMM.'},
+                                       'enum': None,
+                                       'is_buffer': False,
+                                       'is_repeated_capability': False,
+                                       'is_session_handle': False,
+                                       'is_string': False,
+                                       'library_method_call_snippet': 'None if reading_ctype is None else (ctypes.pointer(reading_ctype))',
+                                       'name': 'Reading',
+                                       'numpy': False,
+                                       'numpy_into_return': False,
+                                       'python_name': 'reading',
+                                       'python_name_or_default_for_init': 'reading',
+                                       'python_name_with_default': 'reading',
+                                       'python_name_with_doc_default': 'reading',
+                                       'python_type': 'float',
+                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                       'type': 'ViReal64',
+                                       'use_array': False,
+                                       'use_in_python_api': True,
+                                       'use_list': False}],
+                 'python_code_variables': [],
+                 'python_name': 'fetch',
+                 'render_in_library': True,
+                 'render_in_session_base': False,
+                 'returns': 'ViStatus'},
+    'FetchMultiPoint': {   'blocking': True,
+                           'codegen_method': 'public',
+                           'documentation': {   'description': '\n'
+                                                               'Returns an array of values from a previously initiated multipoint\n'
+                                                               'measurement. The number of measurements the DMM makes is determined by\n'
+                                                               'the values you specify for the **Trigger_Count** and **Sample_Count**\n'
+                                                               'parameters of niDMM_ConfigureMultiPoint. You must first call\n'
+                                                               'niDMM_Initiate to initiate a measurement before calling this function.\n',
+                                                'note': [   '\n'
+                                                            'This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the '
+                                                            'same session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through '
+                                                            "the Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.\n"]},
+                           'has_repeated_capability': False,
+                           'invalidates_attribute_cache': False,
+                           'is_error_handling': False,
+                           'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                           'name': 'FetchMultiPoint',
+                           'parameters': [   {   'ctypes_type': 'ViSession',
+                                                 'ctypes_type_library_call': 'ViSession',
+                                                 'ctypes_variable_name': 'vi_ctype',
+                                                 'direction': 'in',
+                                                 'documentation': {   'description': '\n'
+                                                                                     'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                     'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                     'None.\n',
+                                                                      'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                 'enum': None,
+                                                 'is_buffer': False,
+                                                 'is_repeated_capability': False,
+                                                 'is_session_handle': True,
+                                                 'is_string': False,
+                                                 'library_method_call_snippet': 'vi_ctype',
+                                                 'name': 'vi',
+                                                 'numpy': False,
+                                                 'numpy_into_return': False,
+                                                 'python_name': 'vi',
+                                                 'python_name_or_default_for_init': 'vi',
+                                                 'python_name_with_default': 'vi',
+                                                 'python_name_with_doc_default': 'vi',
+                                                 'python_type': 'int',
+                                                 'size': {'mechanism': 'fixed', 'value': 1},
+                                                 'type': 'ViSession',
+                                                 'use_array': False,
+                                                 'use_in_python_api': True,
+                                                 'use_list': False},
+                                             {   'ctypes_type': 'ViInt32',
+                                                 'ctypes_type_library_call': 'ViInt32',
+                                                 'ctypes_variable_name': 'maximum_time_ctype',
+                                                 'default_value': 'datetime.timedelta(milliseconds=-1)',
+                                                 'direction': 'in',
+                                                 'documentation': {   'description': '\n'
+                                                                                     'Specifies the **maximum_time** allowed for this function to complete in\n'
+                                                                                     'milliseconds. If the function does not complete within this time\n'
+                                                                                     'interval, the function returns the NIDMM_ERROR_MAX_TIME_EXCEEDED\n'
+                                                                                     'error code. This may happen if an external trigger has not been\n'
+                                                                                     'received, or if the specified timeout is not long enough for the\n'
+                                                                                     'acquisition to complete.\n'
+                                                                                     '\n'
+                                                                                     'The valid range is 0–86400000. The default value is\n'
+                                                                                     'NIDMM_VAL_TIME_LIMIT_AUTO (-1). The DMM calculates the timeout\n'
+                                                                                     'automatically.\n',
+                                                                      'note': [   '\n'
+                                                                                  'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or '
+                                                                                  'represent True/False, have been removed.\n']},
+                                                 'enum': None,
+                                                 'is_buffer': False,
+                                                 'is_repeated_capability': False,
+                                                 'is_session_handle': False,
+                                                 'is_string': False,
+                                                 'library_method_call_snippet': 'maximum_time_ctype',
+                                                 'name': 'maximumTime',
+                                                 'numpy': False,
+                                                 'numpy_into_return': False,
+                                                 'python_api_converter_name': 'convert_timedelta_to_milliseconds',
+                                                 'python_api_converter_type': 'datetime.timedelta',
+                                                 'python_name': 'maximum_time',
+                                                 'python_name_or_default_for_init': '_converters.convert_timedelta_to_milliseconds(maximum_time, self._encoding)',
+                                                 'python_name_with_default': 'maximum_time=datetime.timedelta(milliseconds=-1)',
+                                                 'python_name_with_doc_default': "maximum_time='datetime.timedelta(milliseconds=-1)'",
+                                                 'python_type': 'int',
+                                                 'size': {'mechanism': 'fixed', 'value': 1},
+                                                 'type': 'ViInt32',
+                                                 'use_array': False,
+                                                 'use_in_python_api': True,
+                                                 'use_list': False},
+                                             {   'ctypes_type': 'ViInt32',
+                                                 'ctypes_type_library_call': 'ViInt32',
+                                                 'ctypes_variable_name': 'array_size_ctype',
+                                                 'direction': 'in',
+                                                 'documentation': {   'description': '\n'
+                                                                                     'Specifies the number of measurements to acquire. The maximum number of\n'
+                                                                                     'measurements for a finite acquisition is the (**Trigger Count** x\n'
+                                                                                     '**Sample Count**) parameters in niDMM_ConfigureMultiPoint.\n'
+                                                                                     '\n'
+                                                                                     'For continuous acquisitions, up to 100,000 points can be returned at\n'
+                                                                                     'once. The number of measurements can be a subset. The valid range is any\n'
+                                                                                     'positive ViInt32. The default value is 1.\n'},
+                                                 'enum': None,
+                                                 'is_buffer': False,
+                                                 'is_repeated_capability': False,
+                                                 'is_session_handle': False,
+                                                 'is_string': False,
+                                                 'library_method_call_snippet': 'array_size_ctype',
+                                                 'name': 'arraySize',
+                                                 'numpy': False,
+                                                 'numpy_into_return': False,
+                                                 'python_name': 'array_size',
+                                                 'python_name_or_default_for_init': 'array_size',
+                                                 'python_name_with_default': 'array_size',
+                                                 'python_name_with_doc_default': 'array_size',
+                                                 'python_type': 'int',
+                                                 'size': {'mechanism': 'fixed', 'value': 1},
+                                                 'type': 'ViInt32',
+                                                 'use_array': False,
+                                                 'use_in_python_api': True,
+                                                 'use_list': False},
+                                             {   'ctypes_type': 'ViReal64',
+                                                 'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                                 'ctypes_variable_name': 'reading_array_ctype',
+                                                 'direction': 'out',
+                                                 'documentation': {   'description': 'An array of measurement values.',
+                                                                      'note': '\nThe size of the **Reading_Array** must be at least the size that you\nspecify for the **Array_Size** parameter.\n'},
+                                                 'enum': None,
+                                                 'is_buffer': True,
+                                                 'is_repeated_capability': False,
+                                                 'is_session_handle': False,
+                                                 'is_string': False,
+                                                 'library_method_call_snippet': 'reading_array_ctype',
+                                                 'name': 'readingArray',
+                                                 'numpy': False,
+                                                 'numpy_into_return': False,
+                                                 'original_type': 'ViReal64[]',
+                                                 'python_name': 'reading_array',
+                                                 'python_name_or_default_for_init': 'reading_array',
+                                                 'python_name_with_default': 'reading_array',
+                                                 'python_name_with_doc_default': 'reading_array',
+                                                 'python_type': 'float',
+                                                 'size': {'mechanism': 'passed-in', 'value': 'arraySize'},
+                                                 'type': 'ViReal64',
+                                                 'use_array': True,
+                                                 'use_in_python_api': True,
+                                                 'use_list': False},
+                                             {   'ctypes_type': 'ViInt32',
+                                                 'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                                 'ctypes_variable_name': 'actual_number_of_points_ctype',
+                                                 'direction': 'out',
+                                                 'documentation': {'description': 'Indicates the number of measured values actually retrieved from the DMM.'},
+                                                 'enum': None,
+                                                 'is_buffer': False,
+                                                 'is_repeated_capability': False,
+                                                 'is_session_handle': False,
+                                                 'is_string': False,
+                                                 'library_method_call_snippet': 'None if actual_number_of_points_ctype is None else (ctypes.pointer(actual_number_of_points_ctype))',
+                                                 'name': 'actualNumberOfPoints',
+                                                 'numpy': False,
+                                                 'numpy_into_return': False,
+                                                 'python_name': 'actual_number_of_points',
+                                                 'python_name_or_default_for_init': 'actual_number_of_points',
+                                                 'python_name_with_default': 'actual_number_of_points',
+                                                 'python_name_with_doc_default': 'actual_number_of_points',
+                                                 'python_type': 'int',
+                                                 'size': {'mechanism': 'fixed', 'value': 1},
+                                                 'type': 'ViInt32',
+                                                 'use_array': False,
+                                                 'use_in_python_api': False,
+                                                 'use_list': False}],
+                           'python_code_variables': [],
+                           'python_name': 'fetch_multi_point',
+                           'render_in_library': True,
+                           'render_in_session_base': False,
+                           'returns': 'ViStatus'},
+    'FetchWaveform': {   'blocking': True,
+                         'codegen_method': 'public',
+                         'documentation': {   'description': '\n'
+                                                             'For the NI 4080/4081/4082 and the NI 4070/4071/4072, returns an array of\n'
+                                                             'values from a previously initiated waveform acquisition. You must call\n'
+                                                             'niDMM_Initiate before calling this function.\n',
+                                              'note': [   '\n'
+                                                          'This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same '
+                                                          'session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the '
+                                                          "Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.\n"]},
+                         'has_repeated_capability': False,
+                         'invalidates_attribute_cache': False,
+                         'is_error_handling': False,
+                         'method_templates': [   {'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'},
+                                                 {'documentation_filename': '/numpy_method', 'method_python_name_suffix': '_into', 'session_filename': '/numpy_read_method'}],
+                         'name': 'FetchWaveform',
+                         'parameters': [   {   'ctypes_type': 'ViSession',
+                                               'ctypes_type_library_call': 'ViSession',
+                                               'ctypes_variable_name': 'vi_ctype',
+                                               'direction': 'in',
+                                               'documentation': {   'description': '\n'
+                                                                                   'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                   'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                   'None.\n',
+                                                                    'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                               'enum': None,
+                                               'is_buffer': False,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': True,
+                                               'is_string': False,
+                                               'library_method_call_snippet': 'vi_ctype',
+                                               'name': 'vi',
+                                               'numpy': False,
+                                               'numpy_into_return': False,
+                                               'python_name': 'vi',
+                                               'python_name_or_default_for_init': 'vi',
+                                               'python_name_with_default': 'vi',
+                                               'python_name_with_doc_default': 'vi',
+                                               'python_type': 'int',
+                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                               'type': 'ViSession',
+                                               'use_array': False,
+                                               'use_in_python_api': True,
+                                               'use_list': False},
+                                           {   'ctypes_type': 'ViInt32',
+                                               'ctypes_type_library_call': 'ViInt32',
+                                               'ctypes_variable_name': 'maximum_time_ctype',
+                                               'default_value': 'datetime.timedelta(milliseconds=-1)',
+                                               'direction': 'in',
+                                               'documentation': {   'description': '\n'
+                                                                                   'Specifies the **maximum_time** allowed for this function to complete in\n'
+                                                                                   'milliseconds. If the function does not complete within this time\n'
+                                                                                   'interval, the function returns the NIDMM_ERROR_MAX_TIME_EXCEEDED\n'
+                                                                                   'error code. This may happen if an external trigger has not been\n'
+                                                                                   'received, or if the specified timeout is not long enough for the\n'
+                                                                                   'acquisition to complete.\n'
+                                                                                   '\n'
+                                                                                   'The valid range is 0–86400000. The default value is\n'
+                                                                                   'NIDMM_VAL_TIME_LIMIT_AUTO (-1). The DMM calculates the timeout\n'
+                                                                                   'automatically.\n',
+                                                                    'note': [   '\n'
+                                                                                'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or '
+                                                                                'represent True/False, have been removed.\n']},
+                                               'enum': None,
+                                               'is_buffer': False,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': False,
+                                               'is_string': False,
+                                               'library_method_call_snippet': 'maximum_time_ctype',
+                                               'name': 'maximumTime',
+                                               'numpy': False,
+                                               'numpy_into_return': False,
+                                               'python_api_converter_name': 'convert_timedelta_to_milliseconds',
+                                               'python_api_converter_type': 'datetime.timedelta',
+                                               'python_name': 'maximum_time',
+                                               'python_name_or_default_for_init': '_converters.convert_timedelta_to_milliseconds(maximum_time, self._encoding)',
+                                               'python_name_with_default': 'maximum_time=datetime.timedelta(milliseconds=-1)',
+                                               'python_name_with_doc_default': "maximum_time='datetime.timedelta(milliseconds=-1)'",
+                                               'python_type': 'int',
+                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                               'type': 'ViInt32',
+                                               'use_array': False,
+                                               'use_in_python_api': True,
+                                               'use_list': False},
+                                           {   'ctypes_type': 'ViInt32',
+                                               'ctypes_type_library_call': 'ViInt32',
+                                               'ctypes_variable_name': 'array_size_ctype',
+                                               'direction': 'in',
+                                               'documentation': {   'description': '\n'
+                                                                                   'Specifies the number of waveform points to return. You specify the total\n'
+                                                                                   'number of points that the DMM acquires in the **Waveform Points**\n'
+                                                                                   'parameter of niDMM_ConfigureWaveformAcquisition. The default value is\n'
+                                                                                   '1.\n'},
+                                               'enum': None,
+                                               'is_buffer': False,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': False,
+                                               'is_string': False,
+                                               'library_method_call_snippet': 'array_size_ctype',
+                                               'name': 'arraySize',
+                                               'numpy': False,
+                                               'numpy_into_return': False,
+                                               'python_name': 'array_size',
+                                               'python_name_or_default_for_init': 'array_size',
+                                               'python_name_with_default': 'array_size',
+                                               'python_name_with_doc_default': 'array_size',
+                                               'python_type': 'int',
+                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                               'type': 'ViInt32',
+                                               'use_array': False,
+                                               'use_in_python_api': False,
+                                               'use_list': False},
+                                           {   'ctypes_type': 'ViReal64',
+                                               'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                               'ctypes_variable_name': 'waveform_array_ctype',
+                                               'direction': 'out',
+                                               'documentation': {'description': '\n**Waveform Array** is an array of measurement values stored in waveform\ndata type.\n'},
+                                               'enum': None,
+                                               'is_buffer': True,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': False,
+                                               'is_string': False,
+                                               'library_method_call_snippet': 'waveform_array_ctype',
+                                               'name': 'waveformArray',
+                                               'numpy': True,
+                                               'numpy_into_return': False,
+                                               'numpy_type': 'float64',
+                                               'original_type': 'ViReal64[]',
+                                               'python_name': 'waveform_array',
+                                               'python_name_or_default_for_init': 'waveform_array',
+                                               'python_name_with_default': 'waveform_array',
+                                               'python_name_with_doc_default': 'waveform_array',
+                                               'python_type': 'float',
+                                               'size': {'mechanism': 'passed-in', 'value': 'arraySize'},
+                                               'type': 'ViReal64',
+                                               'use_array': True,
+                                               'use_in_python_api': True,
+                                               'use_list': False},
+                                           {   'ctypes_type': 'ViInt32',
+                                               'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                               'ctypes_variable_name': 'actual_number_of_points_ctype',
+                                               'direction': 'out',
+                                               'documentation': {'description': 'Indicates the number of measured values actually retrieved from the DMM.'},
+                                               'enum': None,
+                                               'is_buffer': False,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': False,
+                                               'is_string': False,
+                                               'library_method_call_snippet': 'None if actual_number_of_points_ctype is None else (ctypes.pointer(actual_number_of_points_ctype))',
+                                               'name': 'actualNumberOfPoints',
+                                               'numpy': False,
+                                               'numpy_into_return': False,
+                                               'python_name': 'actual_number_of_points',
+                                               'python_name_or_default_for_init': 'actual_number_of_points',
+                                               'python_name_with_default': 'actual_number_of_points',
+                                               'python_name_with_doc_default': 'actual_number_of_points',
+                                               'python_type': 'int',
+                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                               'type': 'ViInt32',
+                                               'use_array': False,
+                                               'use_in_python_api': False,
+                                               'use_list': False}],
+                         'python_code_variables': [],
+                         'python_name': 'fetch_waveform',
+                         'render_in_library': True,
+                         'render_in_session_base': False,
+                         'returns': 'ViStatus'},
+    'FormatMeasAbsolute': {   'codegen_method': 'no',
+                              'documentation': {   'description': '\n'
+                                                                  'Formats the **Measurement** to the proper number of displayed digits\n'
+                                                                  'according to the **Measurement_Function**, **Range**, and\n'
+                                                                  '**Resolution**. Returns the formatted data, range, and mode strings.\n'},
+                              'parameters': [   {   'direction': 'in',
+                                                    'documentation': {   'description': '\n'
+                                                                                        'Specifies the **measurement_function** used to acquire the measurement.\n'
+                                                                                        'The driver sets NIDMM_ATTR_FUNCTION to this value.\n'},
+                                                    'name': 'measurementFunction',
+                                                    'type': 'ViInt32'},
+                                                {   'direction': 'in',
+                                                    'documentation': {'description': 'Specifies the NIDMM_ATTR_RANGE used to acquire the **Measurement**.'},
+                                                    'name': 'Range',
+                                                    'type': 'ViReal64'},
+                                                {   'direction': 'in',
+                                                    'documentation': {'description': 'Specifies the NIDMM_ATTR_RESOLUTION_ABSOLUTE of the **Measurement**.'},
+                                                    'name': 'Resolution',
+                                                    'type': 'ViReal64'},
+                                                {'direction': 'in', 'documentation': {'description': 'Specifies the measured value returned from the DMM.'}, 'name': 'Measurement', 'type': 'ViReal64'},
+                                                {   'direction': 'out',
+                                                    'documentation': {'description': 'Returns a string containing the units of the **Measurement** mode.'},
+                                                    'name': 'modeString',
+                                                    'type': 'ViChar[ ]'},
+                                                {   'direction': 'out',
+                                                    'documentation': {   'description': '\n'
+                                                                                        'Returns the NIDMM_ATTR_RANGE of the **Measurement**, formatted into a\n'
+                                                                                        'string with the correct number of display digits.\n'},
+                                                    'name': 'rangeString',
+                                                    'type': 'ViChar[ ]'},
+                                                {   'direction': 'out',
+                                                    'documentation': {   'description': '\n'
+                                                                                        'Returns the **Measurement**, formatted according to the\n'
+                                                                                        'NIDMM_ATTR_FUNCTION, NIDMM_ATTR_RANGE, and\n'
+                                                                                        'NIDMM_ATTR_RESOLUTION_ABSOLUTE.\n'},
+                                                    'name': 'dataString',
+                                                    'type': 'ViChar[ ]'}],
+                              'returns': 'ViStatus'},
+    'GetApertureTimeInfo': {   'blocking': False,
+                               'codegen_method': 'public',
+                               'documentation': {'description': 'Returns the DMM **Aperture_Time** and **Aperture_Time_Units**.'},
+                               'has_repeated_capability': False,
+                               'invalidates_attribute_cache': False,
+                               'is_error_handling': False,
+                               'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                               'name': 'GetApertureTimeInfo',
+                               'parameters': [   {   'ctypes_type': 'ViSession',
+                                                     'ctypes_type_library_call': 'ViSession',
+                                                     'ctypes_variable_name': 'vi_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                         'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                         'None.\n',
+                                                                          'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': True,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'vi_ctype',
+                                                     'name': 'vi',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'vi',
+                                                     'python_name_or_default_for_init': 'vi',
+                                                     'python_name_with_default': 'vi',
+                                                     'python_name_with_doc_default': 'vi',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViSession',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViReal64',
+                                                     'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                                     'ctypes_variable_name': 'aperture_time_ctype',
+                                                     'direction': 'out',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'Specifies the amount of time the DMM digitizes the input signal for a\n'
+                                                                                         'single measurement. This parameter does not include settling time.\n'
+                                                                                         'Returns the value of the NIDMM_ATTR_APERTURE_TIME attribute. The\n'
+                                                                                         'units of this attribute depend on the value of the\n'
+                                                                                         'NIDMM_ATTR_APERTURE_TIME_UNITS attribute.\n'
+                                                                                         'On the NI 4070/4071/4072, the minimum aperture time is 8.89 µs, and the\n'
+                                                                                         'maximum aperture time is 149 s. Any number of powerline cycles (PLCs)\n'
+                                                                                         'within the minimum and maximum ranges is allowed on the\n'
+                                                                                         'NI 4070/4071/4072.\n'
+                                                                                         'On the NI 4065 the minimum aperture time is 333 µs, and the maximum\n'
+                                                                                         'aperture time is 78.2 s. If setting the number of averages directly, the\n'
+                                                                                         'total measurement time is aperture time X the number of averages, which\n'
+                                                                                         'must be less than 72.8 s. The aperture times allowed are 333 µs, 667 µs,\n'
+                                                                                         'or multiples of 1.11 ms—for example 1.11 ms, 2.22 ms, 3.33 ms, and so\n'
+                                                                                         'on. If you set an aperture time other than 333 µs, 667 µs, or multiples\n'
+                                                                                         'of 1.11 ms, the value will be coerced up to the next supported aperture\n'
+                                                                                         'time.\n'
+                                                                                         'On the NI 4060, when the powerline frequency is 60, the PLCs allowed are\n'
+                                                                                         '1 PLC, 6 PLC, 12 PLC, and 120 PLC. When the powerline frequency is 50,\n'
+                                                                                         'the PLCs allowed are 1 PLC, 5 PLC, 10 PLC, and 100 PLC.\n'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'None if aperture_time_ctype is None else (ctypes.pointer(aperture_time_ctype))',
+                                                     'name': 'apertureTime',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'aperture_time',
+                                                     'python_name_or_default_for_init': 'aperture_time',
+                                                     'python_name_with_default': 'aperture_time',
+                                                     'python_name_with_doc_default': 'aperture_time',
+                                                     'python_type': 'float',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViReal64',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViInt32',
+                                                     'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                                     'ctypes_variable_name': 'aperture_time_units_ctype',
+                                                     'direction': 'out',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'Indicates the units of aperture time as powerline cycles (PLCs) or\n'
+                                                                                         'seconds. Returns the value of the NIDMM_ATTR_APERTURE_TIME_UNITS\n'
+                                                                                         'attribute.\n',
+                                                                          'table_body': [['NIDMM_VAL_SECONDS', '0', 'Seconds'], ['NIDMM_VAL_POWER_LINE_CYCLES', '1', 'Powerline Cycles']]},
+                                                     'enum': 'ApertureTimeUnits',
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'None if aperture_time_units_ctype is None else (ctypes.pointer(aperture_time_units_ctype))',
+                                                     'name': 'apertureTimeUnits',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'aperture_time_units',
+                                                     'python_name_or_default_for_init': 'aperture_time_units',
+                                                     'python_name_with_default': 'aperture_time_units',
+                                                     'python_name_with_doc_default': 'aperture_time_units',
+                                                     'python_type': 'enums.ApertureTimeUnits',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViInt32',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False}],
+                               'python_code_variables': [],
+                               'python_name': 'get_aperture_time_info',
+                               'render_in_library': True,
+                               'render_in_session_base': False,
+                               'returns': 'ViStatus'},
+    'GetAttributeViBoolean': {   'blocking': False,
+                                 'codegen_method': 'private',
+                                 'documentation': {   'description': '\n'
+                                                                     'Queries the value of a ViBoolean attribute. You can use this function to\n'
+                                                                     'get the values of instrument-specific attributes and inherent IVI\n'
+                                                                     'attributes.\n'
+                                                                     '\n'
+                                                                     'If the attribute represents an instrument state, this function performs\n'
+                                                                     'instrument I/O in the following cases:\n'
+                                                                     '\n'
+                                                                     '-  State caching is disabled for the entire session or for the\n'
+                                                                     '   particular attribute.\n'
+                                                                     '-  State caching is enabled, and the currently cached value is invalid.\n'},
+                                 'has_repeated_capability': True,
+                                 'invalidates_attribute_cache': False,
+                                 'is_error_handling': False,
+                                 'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                 'name': 'GetAttributeViBoolean',
+                                 'parameters': [   {   'ctypes_type': 'ViSession',
+                                                       'ctypes_type_library_call': 'ViSession',
+                                                       'ctypes_variable_name': 'vi_ctype',
+                                                       'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                           'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                           'None.\n',
+                                                                            'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': True,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'vi_ctype',
+                                                       'name': 'vi',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'vi',
+                                                       'python_name_or_default_for_init': 'vi',
+                                                       'python_name_with_default': 'vi',
+                                                       'python_name_with_doc_default': 'vi',
+                                                       'python_type': 'int',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViSession',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False},
+                                                   {   'ctypes_type': 'ViConstString',
+                                                       'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                       'ctypes_variable_name': 'channel_name_ctype',
+                                                       'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'This parameter is ignored. National Instruments DMMs do not support\n'
+                                                                                           'channel names since they only have a single channel. This parameter is\n'
+                                                                                           'included in order to support interchangeability and upgradability to\n'
+                                                                                           'multiple channel DMMs.\n'
+                                                                                           '\n'
+                                                                                           'The default value is " " (an empty string).\n'},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': True,
+                                                       'is_session_handle': False,
+                                                       'is_string': True,
+                                                       'library_method_call_snippet': 'channel_name_ctype',
+                                                       'name': 'channelName',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'channel_name',
+                                                       'python_name_or_default_for_init': 'channel_name',
+                                                       'python_name_with_default': 'channel_name',
+                                                       'python_name_with_doc_default': 'channel_name',
+                                                       'python_type': 'str',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViConstString',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False},
+                                                   {   'ctypes_type': 'ViAttr',
+                                                       'ctypes_type_library_call': 'ViAttr',
+                                                       'ctypes_variable_name': 'attribute_id_ctype',
+                                                       'direction': 'in',
+                                                       'documentation': {'description': 'Pass the ID of an attribute.'},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': False,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'attribute_id_ctype',
+                                                       'name': 'attributeId',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'attribute_id',
+                                                       'python_name_or_default_for_init': 'attribute_id',
+                                                       'python_name_with_default': 'attribute_id',
+                                                       'python_name_with_doc_default': 'attribute_id',
+                                                       'python_type': 'int',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViAttr',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False},
+                                                   {   'ctypes_type': 'ViBoolean',
+                                                       'ctypes_type_library_call': 'ctypes.POINTER(ViBoolean)',
+                                                       'ctypes_variable_name': 'attribute_value_ctype',
+                                                       'direction': 'out',
+                                                       'documentation': {'description': '\nReturns the current value of the attribute. Pass the address of a\nViBoolean variable.\n'},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': False,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'None if attribute_value_ctype is None else (ctypes.pointer(attribute_value_ctype))',
+                                                       'name': 'attributeValue',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'attribute_value',
+                                                       'python_name_or_default_for_init': 'attribute_value',
+                                                       'python_name_with_default': 'attribute_value',
+                                                       'python_name_with_doc_default': 'attribute_value',
+                                                       'python_type': 'bool',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViBoolean',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False}],
+                                 'python_code_variables': [],
+                                 'python_name': '_get_attribute_vi_boolean',
+                                 'render_in_library': True,
+                                 'render_in_session_base': True,
+                                 'returns': 'ViStatus'},
+    'GetAttributeViInt32': {   'blocking': False,
+                               'codegen_method': 'private',
+                               'documentation': {   'description': '\n'
+                                                                   'Queries the value of a ViInt32 attribute. You can use this function to\n'
+                                                                   'get the values of instrument-specific attributes and inherent IVI\n'
+                                                                   'attributes.\n'
+                                                                   '\n'
+                                                                   'If the attribute represents an instrument state, this function performs\n'
+                                                                   'instrument I/O in the following cases:\n'
+                                                                   '\n'
+                                                                   '-  State caching is disabled for the entire session or for the\n'
+                                                                   '   particular attribute.\n'
+                                                                   '-  State caching is enabled, and the currently cached value is invalid.\n'},
+                               'has_repeated_capability': True,
+                               'invalidates_attribute_cache': False,
+                               'is_error_handling': False,
+                               'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                               'name': 'GetAttributeViInt32',
+                               'parameters': [   {   'ctypes_type': 'ViSession',
+                                                     'ctypes_type_library_call': 'ViSession',
+                                                     'ctypes_variable_name': 'vi_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                         'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                         'None.\n',
+                                                                          'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': True,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'vi_ctype',
+                                                     'name': 'vi',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'vi',
+                                                     'python_name_or_default_for_init': 'vi',
+                                                     'python_name_with_default': 'vi',
+                                                     'python_name_with_doc_default': 'vi',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViSession',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViConstString',
+                                                     'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                     'ctypes_variable_name': 'channel_name_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'This parameter is ignored. National Instruments DMMs do not support\n'
+                                                                                         'channel names since they only have a single channel. This parameter is\n'
+                                                                                         'included in order to support interchangeability and upgradability to\n'
+                                                                                         'multiple channel DMMs.\n'
+                                                                                         '\n'
+                                                                                         'The default value is " " (an empty string).\n'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': True,
+                                                     'is_session_handle': False,
+                                                     'is_string': True,
+                                                     'library_method_call_snippet': 'channel_name_ctype',
+                                                     'name': 'channelName',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'channel_name',
+                                                     'python_name_or_default_for_init': 'channel_name',
+                                                     'python_name_with_default': 'channel_name',
+                                                     'python_name_with_doc_default': 'channel_name',
+                                                     'python_type': 'str',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViConstString',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViAttr',
+                                                     'ctypes_type_library_call': 'ViAttr',
+                                                     'ctypes_variable_name': 'attribute_id_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {'description': 'Pass the ID of an attribute.'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'attribute_id_ctype',
+                                                     'name': 'attributeId',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'attribute_id',
+                                                     'python_name_or_default_for_init': 'attribute_id',
+                                                     'python_name_with_default': 'attribute_id',
+                                                     'python_name_with_doc_default': 'attribute_id',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViAttr',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViInt32',
+                                                     'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                                     'ctypes_variable_name': 'attribute_value_ctype',
+                                                     'direction': 'out',
+                                                     'documentation': {'description': '\nReturns the current value of the attribute. Pass the address of a\nViInt32 variable.\n'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'None if attribute_value_ctype is None else (ctypes.pointer(attribute_value_ctype))',
+                                                     'name': 'attributeValue',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'attribute_value',
+                                                     'python_name_or_default_for_init': 'attribute_value',
+                                                     'python_name_with_default': 'attribute_value',
+                                                     'python_name_with_doc_default': 'attribute_value',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViInt32',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False}],
+                               'python_code_variables': [],
+                               'python_name': '_get_attribute_vi_int32',
+                               'render_in_library': True,
+                               'render_in_session_base': True,
+                               'returns': 'ViStatus'},
+    'GetAttributeViReal64': {   'blocking': False,
+                                'codegen_method': 'private',
+                                'documentation': {   'description': '\n'
+                                                                    'Queries the value of a ViReal64 attribute. You can use this function to\n'
+                                                                    'get the values of instrument-specific attributes and inherent IVI\n'
+                                                                    'attributes.\n'
+                                                                    '\n'
+                                                                    'If the attribute represents an instrument state, this function performs\n'
+                                                                    'instrument I/O in the following cases:\n'
+                                                                    '\n'
+                                                                    '-  State caching is disabled for the entire session or for the\n'
+                                                                    '   particular attribute.\n'
+                                                                    '-  State caching is enabled, and the currently cached value is invalid.\n'},
+                                'has_repeated_capability': True,
+                                'invalidates_attribute_cache': False,
+                                'is_error_handling': False,
+                                'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                'name': 'GetAttributeViReal64',
+                                'parameters': [   {   'ctypes_type': 'ViSession',
+                                                      'ctypes_type_library_call': 'ViSession',
+                                                      'ctypes_variable_name': 'vi_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                          'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                          'None.\n',
+                                                                           'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': True,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'vi_ctype',
+                                                      'name': 'vi',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'vi',
+                                                      'python_name_or_default_for_init': 'vi',
+                                                      'python_name_with_default': 'vi',
+                                                      'python_name_with_doc_default': 'vi',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViSession',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViConstString',
+                                                      'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                      'ctypes_variable_name': 'channel_name_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'This parameter is ignored. National Instruments DMMs do not support\n'
+                                                                                          'channel names since they only have a single channel. This parameter is\n'
+                                                                                          'included in order to support interchangeability and upgradability to\n'
+                                                                                          'multiple channel DMMs.\n'
+                                                                                          '\n'
+                                                                                          'The default value is " " (an empty string).\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': True,
+                                                      'is_session_handle': False,
+                                                      'is_string': True,
+                                                      'library_method_call_snippet': 'channel_name_ctype',
+                                                      'name': 'channelName',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'channel_name',
+                                                      'python_name_or_default_for_init': 'channel_name',
+                                                      'python_name_with_default': 'channel_name',
+                                                      'python_name_with_doc_default': 'channel_name',
+                                                      'python_type': 'str',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViConstString',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViAttr',
+                                                      'ctypes_type_library_call': 'ViAttr',
+                                                      'ctypes_variable_name': 'attribute_id_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {'description': 'Pass the ID of an attribute.'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'attribute_id_ctype',
+                                                      'name': 'attributeId',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'attribute_id',
+                                                      'python_name_or_default_for_init': 'attribute_id',
+                                                      'python_name_with_default': 'attribute_id',
+                                                      'python_name_with_doc_default': 'attribute_id',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViAttr',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViReal64',
+                                                      'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                                      'ctypes_variable_name': 'attribute_value_ctype',
+                                                      'direction': 'out',
+                                                      'documentation': {'description': '\nReturns the current value of the attribute. Pass the address of a\nViReal64 variable.\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'None if attribute_value_ctype is None else (ctypes.pointer(attribute_value_ctype))',
+                                                      'name': 'attributeValue',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'attribute_value',
+                                                      'python_name_or_default_for_init': 'attribute_value',
+                                                      'python_name_with_default': 'attribute_value',
+                                                      'python_name_with_doc_default': 'attribute_value',
+                                                      'python_type': 'float',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViReal64',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False}],
+                                'python_code_variables': [],
+                                'python_name': '_get_attribute_vi_real64',
+                                'render_in_library': True,
+                                'render_in_session_base': True,
+                                'returns': 'ViStatus'},
+    'GetAttributeViSession': {   'codegen_method': 'no',
+                                 'documentation': {   'description': '\n'
+                                                                     'Queries the value of a ViSession attribute. You can use this function to\n'
+                                                                     'get the values of instrument-specific attributes and inherent IVI\n'
+                                                                     'attributes.\n'
+                                                                     '\n'
+                                                                     'If the attribute represents an instrument state, this function performs\n'
+                                                                     'instrument I/O in the following cases:\n'
+                                                                     '\n'
+                                                                     '-  State caching is disabled for the entire session or for the\n'
+                                                                     '   particular attribute.\n'
+                                                                     '-  State caching is enabled, and the currently cached value is invalid.\n'},
+                                 'parameters': [   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                           'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                           'None.\n',
+                                                                            'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                       'name': 'vi',
+                                                       'type': 'ViSession'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'This parameter is ignored. National Instruments DMMs do not support\n'
+                                                                                           'channel names since they only have a single channel. This parameter is\n'
+                                                                                           'included in order to support interchangeability and upgradability to\n'
+                                                                                           'multiple channel DMMs.\n'
+                                                                                           '\n'
+                                                                                           'The default value is " " (an empty string).\n'},
+                                                       'name': 'channelName',
+                                                       'type': 'ViConstString'},
+                                                   {'direction': 'in', 'documentation': {'description': 'Pass the ID of an attribute.'}, 'name': 'attributeId', 'type': 'ViAttr'},
+                                                   {   'direction': 'out',
+                                                       'documentation': {'description': '\nReturns the current value of the attribute. Pass the address of a\nViSession variable.\n'},
+                                                       'name': 'attributeValue',
+                                                       'type': 'ViSession'}],
+                                 'returns': 'ViStatus'},
+    'GetAttributeViString': {   'blocking': False,
+                                'codegen_method': 'private',
+                                'documentation': {   'description': '\n'
+                                                                    'Queries the value of a ViString attribute. You can use this function to\n'
+                                                                    'get the values of instrument-specific attributes and inherent IVI\n'
+                                                                    'attributes.\n'
+                                                                    '\n'
+                                                                    'If the attribute represents an instrument state, this function performs\n'
+                                                                    'instrument I/O in the following cases:\n'
+                                                                    '\n'
+                                                                    '-  State caching is disabled for the entire session or for the\n'
+                                                                    '   particular attribute.\n'
+                                                                    '-  State caching is enabled, and the currently cached value is invalid.\n'
+                                                                    '   You must provide a ViChar array to serve as a buffer for the value.\n'
+                                                                    '   You pass the number of bytes in the buffer as the Array Size\n'
+                                                                    '   parameter.\n'},
+                                'has_repeated_capability': True,
+                                'invalidates_attribute_cache': False,
+                                'is_error_handling': False,
+                                'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                'name': 'GetAttributeViString',
+                                'parameters': [   {   'ctypes_type': 'ViSession',
+                                                      'ctypes_type_library_call': 'ViSession',
+                                                      'ctypes_variable_name': 'vi_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                          'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                          'None.\n',
+                                                                           'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': True,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'vi_ctype',
+                                                      'name': 'vi',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'vi',
+                                                      'python_name_or_default_for_init': 'vi',
+                                                      'python_name_with_default': 'vi',
+                                                      'python_name_with_doc_default': 'vi',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViSession',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViConstString',
+                                                      'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                      'ctypes_variable_name': 'channel_name_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'This parameter is ignored. National Instruments DMMs do not support\n'
+                                                                                          'channel names since they only have a single channel. This parameter is\n'
+                                                                                          'included in order to support interchangeability and upgradability to\n'
+                                                                                          'multiple channel DMMs.\n'
+                                                                                          '\n'
+                                                                                          'The default value is " " (an empty string).\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': True,
+                                                      'is_session_handle': False,
+                                                      'is_string': True,
+                                                      'library_method_call_snippet': 'channel_name_ctype',
+                                                      'name': 'channelName',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'channel_name',
+                                                      'python_name_or_default_for_init': 'channel_name',
+                                                      'python_name_with_default': 'channel_name',
+                                                      'python_name_with_doc_default': 'channel_name',
+                                                      'python_type': 'str',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViConstString',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViAttr',
+                                                      'ctypes_type_library_call': 'ViAttr',
+                                                      'ctypes_variable_name': 'attribute_id_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {'description': 'Pass the ID of an attribute.'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'attribute_id_ctype',
+                                                      'name': 'attributeId',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'attribute_id',
+                                                      'python_name_or_default_for_init': 'attribute_id',
+                                                      'python_name_with_default': 'attribute_id',
+                                                      'python_name_with_doc_default': 'attribute_id',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViAttr',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViInt32',
+                                                      'ctypes_type_library_call': 'ViInt32',
+                                                      'ctypes_variable_name': 'buffer_size_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Pass the number of bytes in the ViChar array you specify for the\n'
+                                                                                          '**Attribute_Value** parameter.\n'
+                                                                                          '\n'
+                                                                                          'If the current value of the attribute, including the terminating NULL\n'
+                                                                                          'byte, contains more bytes that you indicate in this parameter, the\n'
+                                                                                          'function copies **buffer_size**—1 bytes into the buffer, places an\n'
+                                                                                          'ASCII NUL byte at the end of the buffer, and returns the buffer size you\n'
+                                                                                          'must pass to get the entire value. For example, if the value is "123456"\n'
+                                                                                          'and the **buffer_size** is 4, the function places "123" into the buffer\n'
+                                                                                          'and returns 7.\n'
+                                                                                          '\n'
+                                                                                          'If you pass a negative number, the function copies the value to the\n'
+                                                                                          'buffer regardless of the number of bytes in the value. If you pass 0,\n'
+                                                                                          'you can pass VI_NULL for the **Attribute_Value** buffer parameter.\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'buffer_size_ctype',
+                                                      'name': 'bufferSize',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'buffer_size',
+                                                      'python_name_or_default_for_init': 'buffer_size',
+                                                      'python_name_with_default': 'buffer_size',
+                                                      'python_name_with_doc_default': 'buffer_size',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViInt32',
+                                                      'use_array': False,
+                                                      'use_in_python_api': False,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViChar[]',
+                                                      'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                      'ctypes_variable_name': 'attribute_value_ctype',
+                                                      'direction': 'out',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'The buffer in which the function returns the current value of the\n'
+                                                                                          'attribute. The buffer must be of type ViChar and have at least as many\n'
+                                                                                          'bytes as indicated in the **Buffer_Size** parameter.\n'
+                                                                                          '\n'
+                                                                                          'If you specify 0 for the **Buffer_Size** parameter, you can pass\n'
+                                                                                          'VI_NULL for this parameter.\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': True,
+                                                      'library_method_call_snippet': 'attribute_value_ctype',
+                                                      'name': 'attributeValue',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'attribute_value',
+                                                      'python_name_or_default_for_init': 'attribute_value',
+                                                      'python_name_with_default': 'attribute_value',
+                                                      'python_name_with_doc_default': 'attribute_value',
+                                                      'python_type': 'str',
+                                                      'size': {'mechanism': 'ivi-dance', 'value': 'bufferSize'},
+                                                      'type': 'ViChar[]',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False}],
+                                'python_code_variables': [],
+                                'python_name': '_get_attribute_vi_string',
+                                'render_in_library': True,
+                                'render_in_session_base': True,
+                                'returns': 'ViStatus'},
+    'GetAutoRangeValue': {   'blocking': False,
+                             'codegen_method': 'public',
+                             'documentation': {'description': '\nReturns the **Actual_Range** that the DMM is using, even when Auto\nRange is off.\n'},
+                             'has_repeated_capability': False,
+                             'invalidates_attribute_cache': False,
+                             'is_error_handling': False,
+                             'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                             'name': 'GetAutoRangeValue',
+                             'parameters': [   {   'ctypes_type': 'ViSession',
+                                                   'ctypes_type_library_call': 'ViSession',
+                                                   'ctypes_variable_name': 'vi_ctype',
+                                                   'direction': 'in',
+                                                   'documentation': {   'description': '\n'
+                                                                                       'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                       'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                       'None.\n',
+                                                                        'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                   'enum': None,
+                                                   'is_buffer': False,
+                                                   'is_repeated_capability': False,
+                                                   'is_session_handle': True,
+                                                   'is_string': False,
+                                                   'library_method_call_snippet': 'vi_ctype',
+                                                   'name': 'vi',
+                                                   'numpy': False,
+                                                   'numpy_into_return': False,
+                                                   'python_name': 'vi',
+                                                   'python_name_or_default_for_init': 'vi',
+                                                   'python_name_with_default': 'vi',
+                                                   'python_name_with_doc_default': 'vi',
+                                                   'python_type': 'int',
+                                                   'size': {'mechanism': 'fixed', 'value': 1},
+                                                   'type': 'ViSession',
+                                                   'use_array': False,
+                                                   'use_in_python_api': True,
+                                                   'use_list': False},
+                                               {   'ctypes_type': 'ViReal64',
+                                                   'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                                   'ctypes_variable_name': 'actual_range_ctype',
+                                                   'direction': 'out',
+                                                   'documentation': {   'description': '\n'
+                                                                                       'Indicates the **actual_range** the DMM is using. Returns the value of\n'
+                                                                                       'the NIDMM_ATTR_AUTO_RANGE_VALUE attribute. The units of the returned\n'
+                                                                                       'value depend on the function.\n'},
+                                                   'enum': None,
+                                                   'is_buffer': False,
+                                                   'is_repeated_capability': False,
+                                                   'is_session_handle': False,
+                                                   'is_string': False,
+                                                   'library_method_call_snippet': 'None if actual_range_ctype is None else (ctypes.pointer(actual_range_ctype))',
+                                                   'name': 'actualRange',
+                                                   'numpy': False,
+                                                   'numpy_into_return': False,
+                                                   'python_name': 'actual_range',
+                                                   'python_name_or_default_for_init': 'actual_range',
+                                                   'python_name_with_default': 'actual_range',
+                                                   'python_name_with_doc_default': 'actual_range',
+                                                   'python_type': 'float',
+                                                   'size': {'mechanism': 'fixed', 'value': 1},
+                                                   'type': 'ViReal64',
+                                                   'use_array': False,
+                                                   'use_in_python_api': True,
+                                                   'use_list': False}],
+                             'python_code_variables': [],
+                             'python_name': 'get_auto_range_value',
+                             'render_in_library': True,
+                             'render_in_session_base': False,
+                             'returns': 'ViStatus'},
+    'GetCalCount': {   'codegen_method': 'no',
+                       'documentation': {   'description': 'Returns the calibration **Count** for the specified type of calibration.',
+                                            'note': 'The NI 4050, NI 4060, and NI 4080/4081/4082 are not supported.'},
+                       'parameters': [   {   'direction': 'in',
+                                             'documentation': {   'description': '\n'
+                                                                                 'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                 'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                 'None.\n',
+                                                                  'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                             'name': 'vi',
+                                             'type': 'ViSession'},
+                                         {   'direction': 'in',
+                                             'documentation': {   'description': '\nSpecifies the type of calibration performed (external or\nself-calibration).\n',
+                                                                  'note': [   'The NI 4065 does not support self-calibration.',
+                                                                              '\n'
+                                                                              'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or '
+                                                                              'represent True/False, have been removed.\n'],
+                                                                  'table_body': [   ['NIDMM_VAL_INTERNAL_AREA (default)', '0', 'Self-Calibration'],
+                                                                                    ['NIDMM_VAL_EXTERNAL_AREA', '1', 'External Calibration']]},
+                                             'name': 'calType',
+                                             'type': 'ViInt32'},
+                                         {'direction': 'out', 'documentation': {'description': 'The number of times calibration has been performed.'}, 'name': 'Count', 'type': 'ViInt32'}],
+                       'returns': 'ViStatus'},
+    'GetCalDateAndTime': {   'blocking': False,
+                             'codegen_method': 'private',
+                             'documentation': {'description': 'Returns the date and time of the last calibration performed.', 'note': 'The NI 4050 and NI 4060 are not supported.'},
+                             'has_repeated_capability': False,
+                             'invalidates_attribute_cache': False,
+                             'is_error_handling': False,
+                             'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                             'name': 'GetCalDateAndTime',
+                             'parameters': [   {   'ctypes_type': 'ViSession',
+                                                   'ctypes_type_library_call': 'ViSession',
+                                                   'ctypes_variable_name': 'vi_ctype',
+                                                   'direction': 'in',
+                                                   'documentation': {   'description': '\n'
+                                                                                       'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                       'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                       'None.\n',
+                                                                        'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                   'enum': None,
+                                                   'is_buffer': False,
+                                                   'is_repeated_capability': False,
+                                                   'is_session_handle': True,
+                                                   'is_string': False,
+                                                   'library_method_call_snippet': 'vi_ctype',
+                                                   'name': 'vi',
+                                                   'numpy': False,
+                                                   'numpy_into_return': False,
+                                                   'python_name': 'vi',
+                                                   'python_name_or_default_for_init': 'vi',
+                                                   'python_name_with_default': 'vi',
+                                                   'python_name_with_doc_default': 'vi',
+                                                   'python_type': 'int',
+                                                   'size': {'mechanism': 'fixed', 'value': 1},
+                                                   'type': 'ViSession',
+                                                   'use_array': False,
+                                                   'use_in_python_api': True,
+                                                   'use_list': False},
+                                               {   'ctypes_type': 'ViInt32',
+                                                   'ctypes_type_library_call': 'ViInt32',
+                                                   'ctypes_variable_name': 'cal_type_ctype',
+                                                   'direction': 'in',
+                                                   'documentation': {   'description': '\nSpecifies the type of calibration performed (external or\nself-calibration).\n',
+                                                                        'note': [   'The NI 4065 does not support self-calibration.',
+                                                                                    '\n'
+                                                                                    'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or '
+                                                                                    'represent True/False, have been removed.\n'],
+                                                                        'table_body': [   ['NIDMM_VAL_INTERNAL_AREA (default)', '0', 'Self-Calibration'],
+                                                                                          ['NIDMM_VAL_EXTERNAL_AREA', '1', 'External Calibration']]},
+                                                   'enum': None,
+                                                   'is_buffer': False,
+                                                   'is_repeated_capability': False,
+                                                   'is_session_handle': False,
+                                                   'is_string': False,
+                                                   'library_method_call_snippet': 'cal_type_ctype',
+                                                   'name': 'calType',
+                                                   'numpy': False,
+                                                   'numpy_into_return': False,
+                                                   'python_name': 'cal_type',
+                                                   'python_name_or_default_for_init': 'cal_type',
+                                                   'python_name_with_default': 'cal_type',
+                                                   'python_name_with_doc_default': 'cal_type',
+                                                   'python_type': 'int',
+                                                   'size': {'mechanism': 'fixed', 'value': 1},
+                                                   'type': 'ViInt32',
+                                                   'use_array': False,
+                                                   'use_in_python_api': True,
+                                                   'use_list': False},
+                                               {   'ctypes_type': 'ViInt32',
+                                                   'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                                   'ctypes_variable_name': 'month_ctype',
+                                                   'direction': 'out',
+                                                   'documentation': {'description': 'Indicates the **month** of the last calibration.'},
+                                                   'enum': None,
+                                                   'is_buffer': False,
+                                                   'is_repeated_capability': False,
+                                                   'is_session_handle': False,
+                                                   'is_string': False,
+                                                   'library_method_call_snippet': 'None if month_ctype is None else (ctypes.pointer(month_ctype))',
+                                                   'name': 'Month',
+                                                   'numpy': False,
+                                                   'numpy_into_return': False,
+                                                   'python_name': 'month',
+                                                   'python_name_or_default_for_init': 'month',
+                                                   'python_name_with_default': 'month',
+                                                   'python_name_with_doc_default': 'month',
+                                                   'python_type': 'int',
+                                                   'size': {'mechanism': 'fixed', 'value': 1},
+                                                   'type': 'ViInt32',
+                                                   'use_array': False,
+                                                   'use_in_python_api': True,
+                                                   'use_list': False},
+                                               {   'ctypes_type': 'ViInt32',
+                                                   'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                                   'ctypes_variable_name': 'day_ctype',
+                                                   'direction': 'out',
+                                                   'documentation': {'description': 'Indicates the **day** of the last calibration.'},
+                                                   'enum': None,
+                                                   'is_buffer': False,
+                                                   'is_repeated_capability': False,
+                                                   'is_session_handle': False,
+                                                   'is_string': False,
+                                                   'library_method_call_snippet': 'None if day_ctype is None else (ctypes.pointer(day_ctype))',
+                                                   'name': 'Day',
+                                                   'numpy': False,
+                                                   'numpy_into_return': False,
+                                                   'python_name': 'day',
+                                                   'python_name_or_default_for_init': 'day',
+                                                   'python_name_with_default': 'day',
+                                                   'python_name_with_doc_default': 'day',
+                                                   'python_type': 'int',
+                                                   'size': {'mechanism': 'fixed', 'value': 1},
+                                                   'type': 'ViInt32',
+                                                   'use_array': False,
+                                                   'use_in_python_api': True,
+                                                   'use_list': False},
+                                               {   'ctypes_type': 'ViInt32',
+                                                   'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                                   'ctypes_variable_name': 'year_ctype',
+                                                   'direction': 'out',
+                                                   'documentation': {'description': 'Indicates the **year** of the last calibration.'},
+                                                   'enum': None,
+                                                   'is_buffer': False,
+                                                   'is_repeated_capability': False,
+                                                   'is_session_handle': False,
+                                                   'is_string': False,
+                                                   'library_method_call_snippet': 'None if year_ctype is None else (ctypes.pointer(year_ctype))',
+                                                   'name': 'Year',
+                                                   'numpy': False,
+                                                   'numpy_into_return': False,
+                                                   'python_name': 'year',
+                                                   'python_name_or_default_for_init': 'year',
+                                                   'python_name_with_default': 'year',
+                                                   'python_name_with_doc_default': 'year',
+                                                   'python_type': 'int',
+                                                   'size': {'mechanism': 'fixed', 'value': 1},
+                                                   'type': 'ViInt32',
+                                                   'use_array': False,
+                                                   'use_in_python_api': True,
+                                                   'use_list': False},
+                                               {   'ctypes_type': 'ViInt32',
+                                                   'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                                   'ctypes_variable_name': 'hour_ctype',
+                                                   'direction': 'out',
+                                                   'documentation': {'description': 'Indicates the **hour** of the last calibration.'},
+                                                   'enum': None,
+                                                   'is_buffer': False,
+                                                   'is_repeated_capability': False,
+                                                   'is_session_handle': False,
+                                                   'is_string': False,
+                                                   'library_method_call_snippet': 'None if hour_ctype is None else (ctypes.pointer(hour_ctype))',
+                                                   'name': 'Hour',
+                                                   'numpy': False,
+                                                   'numpy_into_return': False,
+                                                   'python_name': 'hour',
+                                                   'python_name_or_default_for_init': 'hour',
+                                                   'python_name_with_default': 'hour',
+                                                   'python_name_with_doc_default': 'hour',
+                                                   'python_type': 'int',
+                                                   'size': {'mechanism': 'fixed', 'value': 1},
+                                                   'type': 'ViInt32',
+                                                   'use_array': False,
+                                                   'use_in_python_api': True,
+                                                   'use_list': False},
+                                               {   'ctypes_type': 'ViInt32',
+                                                   'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                                   'ctypes_variable_name': 'minute_ctype',
+                                                   'direction': 'out',
+                                                   'documentation': {'description': 'Indicates the **minute** of the last calibration.'},
+                                                   'enum': None,
+                                                   'is_buffer': False,
+                                                   'is_repeated_capability': False,
+                                                   'is_session_handle': False,
+                                                   'is_string': False,
+                                                   'library_method_call_snippet': 'None if minute_ctype is None else (ctypes.pointer(minute_ctype))',
+                                                   'name': 'Minute',
+                                                   'numpy': False,
+                                                   'numpy_into_return': False,
+                                                   'python_name': 'minute',
+                                                   'python_name_or_default_for_init': 'minute',
+                                                   'python_name_with_default': 'minute',
+                                                   'python_name_with_doc_default': 'minute',
+                                                   'python_type': 'int',
+                                                   'size': {'mechanism': 'fixed', 'value': 1},
+                                                   'type': 'ViInt32',
+                                                   'use_array': False,
+                                                   'use_in_python_api': True,
+                                                   'use_list': False}],
+                             'python_code_variables': [],
+                             'python_name': '_get_cal_date_and_time',
+                             'render_in_library': True,
+                             'render_in_session_base': False,
+                             'returns': 'ViStatus'},
+    'GetCalUserDefinedInfo': {   'codegen_method': 'no',
+                                 'documentation': {'description': 'Returns the user-defined calibration information stored in the EEPROM.', 'note': 'The NI 4050 and NI 4060 are not supported.'},
+                                 'parameters': [   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                           'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                           'None.\n',
+                                                                            'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                       'name': 'vi',
+                                                       'type': 'ViSession'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Passes the number of bytes in the ViString you specify for the **Info**\n'
+                                                                                           'parameter.\n'
+                                                                                           '\n'
+                                                                                           'If zero is passed for this parameter, the **buffer_size** needed to\n'
+                                                                                           'store the information is returned. If the Info parameter, including the\n'
+                                                                                           'terminating NULL byte, contains more bytes than you indicate in this\n'
+                                                                                           'parameter, the function copies **buffer_size** - 1 bytes into the\n'
+                                                                                           'buffer, places an ASCII NULL byte at the end of the buffer, and returns\n'
+                                                                                           'the **buffer_size** you must pass to get the entire value.\n'
+                                                                                           '\n'
+                                                                                           'For example, if the value is "123456" and the **buffer_size** is 4, the\n'
+                                                                                           'function places "123" into the buffer and returns 7. If you pass a\n'
+                                                                                           'negative number, the function copies the value to the buffer regardless\n'
+                                                                                           'of the number of bytes in the value.\n'},
+                                                       'name': 'bufferSize',
+                                                       'type': 'ViInt32'},
+                                                   {   'direction': 'out',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Returns the user-defined calibration information stored in the EEPROM.\n'
+                                                                                           'If this is NULL, the **Buffer_Size** needed to store the information is\n'
+                                                                                           'returned.\n'},
+                                                       'name': 'Info',
+                                                       'size': {'mechanism': 'fixed', 'value': 256},
+                                                       'type': 'ViChar[ ]'}],
+                                 'returns': 'ViStatus'},
+    'GetCalUserDefinedInfoMaxSize': {   'codegen_method': 'no',
+                                        'documentation': {   'description': '\n'
+                                                                            'Returns the maximum string length that can be stored in the EEPROM. Use\n'
+                                                                            'niDMM_SetCalUserDefinedInfo to store user-defined information.\n',
+                                                             'note': [   'The NI 4050 and NI 4060 are not supported.',
+                                                                         '\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                        'parameters': [   {   'direction': 'in',
+                                                              'documentation': {   'description': '\n'
+                                                                                                  'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                                  'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                                  'None.\n',
+                                                                                   'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                              'name': 'vi',
+                                                              'type': 'ViSession'},
+                                                          {   'direction': 'out',
+                                                              'documentation': {   'description': '\n'
+                                                                                                  'Returns the value of maximum string length that can be stored in the\n'
+                                                                                                  'EEPROM using niDMM_SetCalUserDefinedInfo. The **info_size** value is\n'
+                                                                                                  'given in characters, but it does not include the termination character.\n',
+                                                                                   'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                              'name': 'infoSize',
+                                                              'type': 'ViInt32'}],
+                                        'returns': 'ViStatus'},
+    'GetChannelName': {   'codegen_method': 'no',
+                          'documentation': {   'description': '\n'
+                                                              'Returns the **Channel_String** that is in the channel table at an\n'
+                                                              '**Index** you specify. Not applicable to National Instruments DMMs.\n'
+                                                              'Included for compliance with the *IviDmm Class Specification*.\n'},
+                          'parameters': [   {   'direction': 'in',
+                                                'documentation': {   'description': '\n'
+                                                                                    'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                    'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                    'None.\n',
+                                                                     'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                'name': 'vi',
+                                                'type': 'ViSession'},
+                                            {'direction': 'in', 'documentation': {'description': 'A 1–based **index** into the channel table.'}, 'name': 'Index', 'type': 'ViInt32'},
+                                            {   'direction': 'in',
+                                                'documentation': {   'description': '\n'
+                                                                                    'Passes the number of bytes in the ViChar array you specify for the\n'
+                                                                                    '**Channel_String** parameter. If the next **Channel_String**,\n'
+                                                                                    'including the terminating NULL byte, contains more bytes than you\n'
+                                                                                    'indicate in this parameter, the function copies\n'
+                                                                                    '**buffer_size** –1 bytes into the buffer, places an ASCII NULL byte at\n'
+                                                                                    'the end of the buffer, and returns the buffer size you must pass to get\n'
+                                                                                    'the entire value.\n'
+                                                                                    '\n'
+                                                                                    'For example, if the value is "123456" and the **buffer_size** is 4, the\n'
+                                                                                    'function places "123" into the buffer and returns 7. If you pass a\n'
+                                                                                    'negative number, the function copies the value to the buffer regardless\n'
+                                                                                    'of the number of bytes in the value. If you pass 0, you can pass\n'
+                                                                                    'VI_NULL for the **Channel_String** buffer parameter. The default value\n'
+                                                                                    'is None.\n'},
+                                                'name': 'bufferSize',
+                                                'type': 'ViInt32'},
+                                            {   'direction': 'out',
+                                                'documentation': {   'description': '\n'
+                                                                                    'Returns the **channel_string** that is in the channel table at the\n'
+                                                                                    '**Index** you specify. Do not modify the contents of the\n'
+                                                                                    '**channel_string**.\n'},
+                                                'name': 'channelString',
+                                                'type': 'ViChar[ ]'}],
+                          'returns': 'ViStatus'},
+    'GetDevTemp': {   'blocking': False,
+                      'codegen_method': 'public',
+                      'documentation': {'description': 'Returns the current **Temperature** of the device.', 'note': 'The NI 4050 and NI 4060 are not supported.'},
+                      'has_repeated_capability': False,
+                      'invalidates_attribute_cache': False,
+                      'is_error_handling': False,
+                      'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                      'name': 'GetDevTemp',
+                      'parameters': [   {   'ctypes_type': 'ViSession',
+                                            'ctypes_type_library_call': 'ViSession',
+                                            'ctypes_variable_name': 'vi_ctype',
+                                            'direction': 'in',
+                                            'documentation': {   'description': '\n'
+                                                                                'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                'None.\n',
+                                                                 'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                            'enum': None,
+                                            'is_buffer': False,
+                                            'is_repeated_capability': False,
+                                            'is_session_handle': True,
+                                            'is_string': False,
+                                            'library_method_call_snippet': 'vi_ctype',
+                                            'name': 'vi',
+                                            'numpy': False,
+                                            'numpy_into_return': False,
+                                            'python_name': 'vi',
+                                            'python_name_or_default_for_init': 'vi',
+                                            'python_name_with_default': 'vi',
+                                            'python_name_with_doc_default': 'vi',
+                                            'python_type': 'int',
+                                            'size': {'mechanism': 'fixed', 'value': 1},
+                                            'type': 'ViSession',
+                                            'use_array': False,
+                                            'use_in_python_api': True,
+                                            'use_list': False},
+                                        {   'ctypes_type': 'ViString',
+                                            'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                            'ctypes_variable_name': 'options_ctype',
+                                            'default_value': '""',
+                                            'direction': 'in',
+                                            'documentation': {'description': 'Reserved.'},
+                                            'enum': None,
+                                            'is_buffer': False,
+                                            'is_repeated_capability': False,
+                                            'is_session_handle': False,
+                                            'is_string': True,
+                                            'library_method_call_snippet': 'options_ctype',
+                                            'name': 'Options',
+                                            'numpy': False,
+                                            'numpy_into_return': False,
+                                            'python_name': 'options',
+                                            'python_name_or_default_for_init': 'options',
+                                            'python_name_with_default': 'options=""',
+                                            'python_name_with_doc_default': 'options=\'""\'',
+                                            'python_type': 'str',
+                                            'size': {'mechanism': 'fixed', 'value': 1},
+                                            'type': 'ViString',
+                                            'use_array': False,
+                                            'use_in_python_api': True,
+                                            'use_list': False},
+                                        {   'ctypes_type': 'ViReal64',
+                                            'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                            'ctypes_variable_name': 'temperature_ctype',
+                                            'direction': 'out',
+                                            'documentation': {'description': 'Returns the current **temperature** of the device.'},
+                                            'enum': None,
+                                            'is_buffer': False,
+                                            'is_repeated_capability': False,
+                                            'is_session_handle': False,
+                                            'is_string': False,
+                                            'library_method_call_snippet': 'None if temperature_ctype is None else (ctypes.pointer(temperature_ctype))',
+                                            'name': 'Temperature',
+                                            'numpy': False,
+                                            'numpy_into_return': False,
+                                            'python_name': 'temperature',
+                                            'python_name_or_default_for_init': 'temperature',
+                                            'python_name_with_default': 'temperature',
+                                            'python_name_with_doc_default': 'temperature',
+                                            'python_type': 'float',
+                                            'size': {'mechanism': 'fixed', 'value': 1},
+                                            'type': 'ViReal64',
+                                            'use_array': False,
+                                            'use_in_python_api': True,
+                                            'use_list': False}],
+                      'python_code_variables': [],
+                      'python_name': 'get_dev_temp',
+                      'render_in_library': True,
+                      'render_in_session_base': False,
+                      'returns': 'ViStatus'},
+    'GetError': {   'blocking': False,
+                    'codegen_method': 'private',
+                    'documentation': {   'description': '\n'
+                                                        'Returns the error information associated with the\n'
+                                                        '**Instrument_Handle**. This function retrieves and then clears the\n'
+                                                        'error information for the session. If you leave the\n'
+                                                        '**Instrument_Handle** unwired, this function retrieves and then clears\n'
+                                                        'the error information for the process.\n'},
+                    'has_repeated_capability': False,
+                    'invalidates_attribute_cache': False,
+                    'is_error_handling': True,
+                    'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                    'name': 'GetError',
+                    'parameters': [   {   'ctypes_type': 'ViSession',
+                                          'ctypes_type_library_call': 'ViSession',
+                                          'ctypes_variable_name': 'vi_ctype',
+                                          'direction': 'in',
+                                          'documentation': {   'description': '\n'
+                                                                              'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                              'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                              'None.\n',
+                                                               'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                          'enum': None,
+                                          'is_buffer': False,
+                                          'is_repeated_capability': False,
+                                          'is_session_handle': True,
+                                          'is_string': False,
+                                          'library_method_call_snippet': 'vi_ctype',
+                                          'name': 'vi',
+                                          'numpy': False,
+                                          'numpy_into_return': False,
+                                          'python_name': 'vi',
+                                          'python_name_or_default_for_init': 'vi',
+                                          'python_name_with_default': 'vi',
+                                          'python_name_with_doc_default': 'vi',
+                                          'python_type': 'int',
+                                          'size': {'mechanism': 'fixed', 'value': 1},
+                                          'type': 'ViSession',
+                                          'use_array': False,
+                                          'use_in_python_api': True,
+                                          'use_list': False},
+                                      {   'ctypes_type': 'ViStatus',
+                                          'ctypes_type_library_call': 'ctypes.POINTER(ViStatus)',
+                                          'ctypes_variable_name': 'error_code_ctype',
+                                          'direction': 'out',
+                                          'documentation': {   'description': '\n'
+                                                                              'Returns the **error_code** for the session or execution thread. If you\n'
+                                                                              'pass 0 for the **Buffer_Size**, you can pass VI_NULL for this\n'
+                                                                              'parameter.\n'},
+                                          'enum': None,
+                                          'is_buffer': False,
+                                          'is_repeated_capability': False,
+                                          'is_session_handle': False,
+                                          'is_string': False,
+                                          'library_method_call_snippet': 'None if error_code_ctype is None else (ctypes.pointer(error_code_ctype))',
+                                          'name': 'errorCode',
+                                          'numpy': False,
+                                          'numpy_into_return': False,
+                                          'python_name': 'error_code',
+                                          'python_name_or_default_for_init': 'error_code',
+                                          'python_name_with_default': 'error_code',
+                                          'python_name_with_doc_default': 'error_code',
+                                          'python_type': 'int',
+                                          'size': {'mechanism': 'fixed', 'value': 1},
+                                          'type': 'ViStatus',
+                                          'use_array': False,
+                                          'use_in_python_api': True,
+                                          'use_list': False},
+                                      {   'ctypes_type': 'ViInt32',
+                                          'ctypes_type_library_call': 'ViInt32',
+                                          'ctypes_variable_name': 'buffer_size_ctype',
+                                          'direction': 'in',
+                                          'documentation': {   'description': '\n'
+                                                                              'Passes the number of bytes in the ViChar array you specify for the\n'
+                                                                              '**Description** parameter. If the error description, including the\n'
+                                                                              'terminating NULL byte, contains more bytes than you indicate in this\n'
+                                                                              'parameter, the function copies **buffer_size** –1 bytes into the\n'
+                                                                              'buffer, places an ASCII NULL byte at the end of the buffer, and returns\n'
+                                                                              'the **buffer_size** you must pass to get the entire value.\n'
+                                                                              '\n'
+                                                                              'For example, if the value is "123456" and the **buffer_size** is 4, the\n'
+                                                                              'function places "123" into the buffer and returns 7. If you pass a\n'
+                                                                              'negative number, the function copies the value to the buffer regardless\n'
+                                                                              'of the number of bytes in the value. If you pass 0, you can pass\n'
+                                                                              'VI_NULL for the **Description** buffer parameter. The default value is\n'
+                                                                              'None.\n'},
+                                          'enum': None,
+                                          'is_buffer': False,
+                                          'is_repeated_capability': False,
+                                          'is_session_handle': False,
+                                          'is_string': False,
+                                          'library_method_call_snippet': 'buffer_size_ctype',
+                                          'name': 'bufferSize',
+                                          'numpy': False,
+                                          'numpy_into_return': False,
+                                          'python_name': 'buffer_size',
+                                          'python_name_or_default_for_init': 'buffer_size',
+                                          'python_name_with_default': 'buffer_size',
+                                          'python_name_with_doc_default': 'buffer_size',
+                                          'python_type': 'int',
+                                          'size': {'mechanism': 'fixed', 'value': 1},
+                                          'type': 'ViInt32',
+                                          'use_array': False,
+                                          'use_in_python_api': False,
+                                          'use_list': False},
+                                      {   'ctypes_type': 'ViChar[]',
+                                          'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                          'ctypes_variable_name': 'description_ctype',
+                                          'direction': 'out',
+                                          'documentation': {   'description': '\n'
+                                                                              'Returns the error **description** for the IVI session or execution\n'
+                                                                              'thread. If there is no **description**, the function returns an empty\n'
+                                                                              'string. The buffer must contain at least as many elements as the value\n'
+                                                                              'you specify with the **Buffer_Size** parameter. If you pass 0 for the\n'
+                                                                              '**Buffer_Size**, you can pass VI_NULL for this parameter.\n'},
+                                          'enum': None,
+                                          'is_buffer': False,
+                                          'is_repeated_capability': False,
+                                          'is_session_handle': False,
+                                          'is_string': True,
+                                          'library_method_call_snippet': 'description_ctype',
+                                          'name': 'Description',
+                                          'numpy': False,
+                                          'numpy_into_return': False,
+                                          'python_name': 'description',
+                                          'python_name_or_default_for_init': 'description',
+                                          'python_name_with_default': 'description',
+                                          'python_name_with_doc_default': 'description',
+                                          'python_type': 'str',
+                                          'size': {'mechanism': 'ivi-dance', 'value': 'bufferSize'},
+                                          'type': 'ViChar[]',
+                                          'use_array': False,
+                                          'use_in_python_api': True,
+                                          'use_list': False}],
+                    'python_code_variables': [],
+                    'python_name': '_get_error',
+                    'render_in_library': True,
+                    'render_in_session_base': True,
+                    'returns': 'ViStatus'},
+    'GetErrorMessage': {   'codegen_method': 'no',
+                           'documentation': {   'description': '\n'
+                                                               'Returns the **Error_Message** as a user-readable string for the\n'
+                                                               'provided **Error_Code**. Calling this function with a **Buffer_Size**\n'
+                                                               'of 0 returns the size needed for the **Error_Message**.\n'},
+                           'parameters': [   {   'direction': 'in',
+                                                 'documentation': {   'description': '\n'
+                                                                                     'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                     'parameter from niDMM_init or niDMM_InitWithOptions. You can also use\n'
+                                                                                     'VI_NULL if you do not have a valid **vi**.\n',
+                                                                      'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                 'name': 'vi',
+                                                 'type': 'ViSession'},
+                                             {   'direction': 'in',
+                                                 'documentation': {'description': '\nThe error code returned from the instrument for which you want to get a\nuser-readable string.\n'},
+                                                 'name': 'errorCode',
+                                                 'type': 'ViStatus'},
+                                             {   'direction': 'in',
+                                                 'documentation': {   'description': '\n'
+                                                                                     'Specifies the number of bytes allocated for the **Error_Message**\n'
+                                                                                     'ViChar array. If the error description that this function returns\n'
+                                                                                     '(including terminating NULL byte) is larger than you indicated in\n'
+                                                                                     '**buffer__size**, the error description will be truncated to fit. If\n'
+                                                                                     'you pass 0 for **buffer__size**, the function returns the buffer size\n'
+                                                                                     'needed for **Error_Message**.\n'},
+                                                 'name': 'Buffer_Size',
+                                                 'type': 'ViInt32'},
+                                             {   'direction': 'out',
+                                                 'documentation': {   'description': '\n'
+                                                                                     'Contains the error information formatted into a user-readable string.\n'
+                                                                                     'The buffer must contain at least as many elements as the value you\n'
+                                                                                     'specify with the **Buffer_Size** parameter. If you pass 0 for\n'
+                                                                                     '**Buffer_Size**, you can pass VI_NULL for this parameter.\n'},
+                                                 'name': 'errorMessage',
+                                                 'type': 'ViChar[ ]'}],
+                           'returns': 'ViStatus'},
+    'GetExtCalRecommendedInterval': {   'blocking': False,
+                                        'codegen_method': 'public',
+                                        'documentation': {   'description': '\nReturns the recommended interval between external recalibration in\n**Months**.\n',
+                                                             'note': 'The NI 4050 and NI 4060 are not supported.'},
+                                        'has_repeated_capability': False,
+                                        'invalidates_attribute_cache': False,
+                                        'is_error_handling': False,
+                                        'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                        'name': 'GetExtCalRecommendedInterval',
+                                        'parameters': [   {   'ctypes_type': 'ViSession',
+                                                              'ctypes_type_library_call': 'ViSession',
+                                                              'ctypes_variable_name': 'vi_ctype',
+                                                              'direction': 'in',
+                                                              'documentation': {   'description': '\n'
+                                                                                                  'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                                  'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                                  'None.\n',
+                                                                                   'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                              'enum': None,
+                                                              'is_buffer': False,
+                                                              'is_repeated_capability': False,
+                                                              'is_session_handle': True,
+                                                              'is_string': False,
+                                                              'library_method_call_snippet': 'vi_ctype',
+                                                              'name': 'vi',
+                                                              'numpy': False,
+                                                              'numpy_into_return': False,
+                                                              'python_name': 'vi',
+                                                              'python_name_or_default_for_init': 'vi',
+                                                              'python_name_with_default': 'vi',
+                                                              'python_name_with_doc_default': 'vi',
+                                                              'python_type': 'int',
+                                                              'size': {'mechanism': 'fixed', 'value': 1},
+                                                              'type': 'ViSession',
+                                                              'use_array': False,
+                                                              'use_in_python_api': True,
+                                                              'use_list': False},
+                                                          {   'ctypes_type': 'ViInt32',
+                                                              'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                                              'ctypes_variable_name': 'months_ctype',
+                                                              'direction': 'out',
+                                                              'documentation': {'description': '\nReturns the recommended number of **months** between external\ncalibrations.\n'},
+                                                              'enum': None,
+                                                              'is_buffer': False,
+                                                              'is_repeated_capability': False,
+                                                              'is_session_handle': False,
+                                                              'is_string': False,
+                                                              'library_method_call_snippet': 'None if months_ctype is None else (ctypes.pointer(months_ctype))',
+                                                              'name': 'Months',
+                                                              'numpy': False,
+                                                              'numpy_into_return': False,
+                                                              'python_name': 'months',
+                                                              'python_name_or_default_for_init': 'months',
+                                                              'python_name_with_default': 'months',
+                                                              'python_name_with_doc_default': 'months',
+                                                              'python_type': 'int',
+                                                              'size': {'mechanism': 'fixed', 'value': 1},
+                                                              'type': 'ViInt32',
+                                                              'use_array': False,
+                                                              'use_in_python_api': True,
+                                                              'use_list': False}],
+                                        'python_code_variables': [],
+                                        'python_name': 'get_ext_cal_recommended_interval',
+                                        'render_in_library': True,
+                                        'render_in_session_base': False,
+                                        'returns': 'ViStatus'},
+    'GetLastCalDateAndTime': {   'blocking': False,
+                                 'codegen_method': 'public',
+                                 'documentation': {'description': 'Returns the date and time of the last calibration performed.', 'note': 'The NI 4050 and NI 4060 are not supported.'},
+                                 'has_repeated_capability': False,
+                                 'invalidates_attribute_cache': False,
+                                 'is_error_handling': False,
+                                 'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/datetime_wrappers'}],
+                                 'name': 'GetLastCalDateAndTime',
+                                 'parameters': [   {   'ctypes_type': 'ViSession',
+                                                       'ctypes_type_library_call': 'ViSession',
+                                                       'ctypes_variable_name': 'vi_ctype',
+                                                       'direction': 'in',
+                                                       'documentation': {   'description': 'Identifies a particular instrument session. You obtain the **vi** parameter from niDMM_init or '
+                                                                                           'niDMM_InitWithOptions. The default is None.',
+                                                                            'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': True,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'vi_ctype',
+                                                       'name': 'vi',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'vi',
+                                                       'python_name_or_default_for_init': 'vi',
+                                                       'python_name_with_default': 'vi',
+                                                       'python_name_with_doc_default': 'vi',
+                                                       'python_type': 'int',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViSession',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False},
+                                                   {   'ctypes_type': 'ViInt32',
+                                                       'ctypes_type_library_call': 'ViInt32',
+                                                       'ctypes_variable_name': 'cal_type_ctype',
+                                                       'direction': 'in',
+                                                       'documentation': {   'description': 'Specifies the type of calibration performed (external or self-calibration).',
+                                                                            'note': [   'The NI 4065 does not support self-calibration.',
+                                                                                        '\n'
+                                                                                        'One or more of the referenced values are not in the Python API for this driver. Enums that only define '
+                                                                                        'values, or represent True/False, have been removed.\n'],
+                                                                            'table_body': [   ['NIDMM_VAL_INTERNAL_AREA (default)', '0', 'Self-Calibration'],
+                                                                                              ['NIDMM_VAL_EXTERNAL_AREA', '1', 'External Calibration']]},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': False,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'cal_type_ctype',
+                                                       'name': 'calType',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'cal_type',
+                                                       'python_name_or_default_for_init': 'cal_type',
+                                                       'python_name_with_default': 'cal_type',
+                                                       'python_name_with_doc_default': 'cal_type',
+                                                       'python_type': 'int',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViInt32',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False},
+                                                   {   'ctypes_type': 'datetime.datetime',
+                                                       'ctypes_type_library_call': 'ctypes.POINTER(datetime.datetime)',
+                                                       'ctypes_variable_name': 'month_ctype',
+                                                       'direction': 'out',
+                                                       'documentation': {'description': 'Indicates date and time of the last calibration.'},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': False,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'None if month_ctype is None else (ctypes.pointer(month_ctype))',
+                                                       'name': 'Month',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'month',
+                                                       'python_name_or_default_for_init': 'month',
+                                                       'python_name_with_default': 'month',
+                                                       'python_name_with_doc_default': 'month',
+                                                       'python_type': 'datetime.datetime',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'datetime.datetime',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False}],
+                                 'python_code_variables': [],
+                                 'python_name': 'get_cal_date_and_time',
+                                 'real_datetime_call': 'GetCalDateAndTime',
+                                 'render_in_library': False,
+                                 'render_in_session_base': False,
+                                 'returns': 'ViStatus'},
+    'GetLastCalTemp': {   'blocking': False,
+                          'codegen_method': 'public',
+                          'documentation': {'description': 'Returns the **Temperature** during the last calibration procedure.', 'note': 'The NI 4050 and NI 4060 are not supported.'},
+                          'has_repeated_capability': False,
+                          'invalidates_attribute_cache': False,
+                          'is_error_handling': False,
+                          'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                          'name': 'GetLastCalTemp',
+                          'parameters': [   {   'ctypes_type': 'ViSession',
+                                                'ctypes_type_library_call': 'ViSession',
+                                                'ctypes_variable_name': 'vi_ctype',
+                                                'direction': 'in',
+                                                'documentation': {   'description': '\n'
+                                                                                    'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                    'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                    'None.\n',
+                                                                     'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                'enum': None,
+                                                'is_buffer': False,
+                                                'is_repeated_capability': False,
+                                                'is_session_handle': True,
+                                                'is_string': False,
+                                                'library_method_call_snippet': 'vi_ctype',
+                                                'name': 'vi',
+                                                'numpy': False,
+                                                'numpy_into_return': False,
+                                                'python_name': 'vi',
+                                                'python_name_or_default_for_init': 'vi',
+                                                'python_name_with_default': 'vi',
+                                                'python_name_with_doc_default': 'vi',
+                                                'python_type': 'int',
+                                                'size': {'mechanism': 'fixed', 'value': 1},
+                                                'type': 'ViSession',
+                                                'use_array': False,
+                                                'use_in_python_api': True,
+                                                'use_list': False},
+                                            {   'ctypes_type': 'ViInt32',
+                                                'ctypes_type_library_call': 'ViInt32',
+                                                'ctypes_variable_name': 'cal_type_ctype',
+                                                'direction': 'in',
+                                                'documentation': {   'description': '\nSpecifies the type of calibration performed (external or\nself-calibration).\n',
+                                                                     'note': [   'The NI 4065 does not support self-calibration.',
+                                                                                 '\n'
+                                                                                 'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or '
+                                                                                 'represent True/False, have been removed.\n'],
+                                                                     'table_body': [   ['NIDMM_VAL_INTERNAL_AREA (default)', '0', 'Self-Calibration'],
+                                                                                       ['NIDMM_VAL_EXTERNAL_AREA', '1', 'External Calibration']]},
+                                                'enum': None,
+                                                'is_buffer': False,
+                                                'is_repeated_capability': False,
+                                                'is_session_handle': False,
+                                                'is_string': False,
+                                                'library_method_call_snippet': 'cal_type_ctype',
+                                                'name': 'calType',
+                                                'numpy': False,
+                                                'numpy_into_return': False,
+                                                'python_name': 'cal_type',
+                                                'python_name_or_default_for_init': 'cal_type',
+                                                'python_name_with_default': 'cal_type',
+                                                'python_name_with_doc_default': 'cal_type',
+                                                'python_type': 'int',
+                                                'size': {'mechanism': 'fixed', 'value': 1},
+                                                'type': 'ViInt32',
+                                                'use_array': False,
+                                                'use_in_python_api': True,
+                                                'use_list': False},
+                                            {   'ctypes_type': 'ViReal64',
+                                                'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                                'ctypes_variable_name': 'temperature_ctype',
+                                                'direction': 'out',
+                                                'documentation': {'description': 'Returns the **temperature** during the last calibration.'},
+                                                'enum': None,
+                                                'is_buffer': False,
+                                                'is_repeated_capability': False,
+                                                'is_session_handle': False,
+                                                'is_string': False,
+                                                'library_method_call_snippet': 'None if temperature_ctype is None else (ctypes.pointer(temperature_ctype))',
+                                                'name': 'Temperature',
+                                                'numpy': False,
+                                                'numpy_into_return': False,
+                                                'python_name': 'temperature',
+                                                'python_name_or_default_for_init': 'temperature',
+                                                'python_name_with_default': 'temperature',
+                                                'python_name_with_doc_default': 'temperature',
+                                                'python_type': 'float',
+                                                'size': {'mechanism': 'fixed', 'value': 1},
+                                                'type': 'ViReal64',
+                                                'use_array': False,
+                                                'use_in_python_api': True,
+                                                'use_list': False}],
+                          'python_code_variables': [],
+                          'python_name': 'get_last_cal_temp',
+                          'render_in_library': True,
+                          'render_in_session_base': False,
+                          'returns': 'ViStatus'},
+    'GetMeasurementPeriod': {   'blocking': False,
+                                'codegen_method': 'public',
+                                'documentation': {   'description': '\n'
+                                                                    'Returns the measurement **Period**, which is the amount of time it takes\n'
+                                                                    'to complete one measurement with the current configuration. Use this\n'
+                                                                    'function right before you begin acquiring data—after you have completely\n'
+                                                                    'configured the measurement and after all configuration functions have\n'
+                                                                    'been called.\n'},
+                                'has_repeated_capability': False,
+                                'invalidates_attribute_cache': False,
+                                'is_error_handling': False,
+                                'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                'name': 'GetMeasurementPeriod',
+                                'parameters': [   {   'ctypes_type': 'ViSession',
+                                                      'ctypes_type_library_call': 'ViSession',
+                                                      'ctypes_variable_name': 'vi_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                          'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                          'None.\n',
+                                                                           'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': True,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'vi_ctype',
+                                                      'name': 'vi',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'vi',
+                                                      'python_name_or_default_for_init': 'vi',
+                                                      'python_name_with_default': 'vi',
+                                                      'python_name_with_doc_default': 'vi',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViSession',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViReal64',
+                                                      'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                                      'ctypes_variable_name': 'period_ctype',
+                                                      'direction': 'out',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Returns the number of seconds it takes to make one measurement.\n'
+                                                                                          '\n'
+                                                                                          'The first measurement in a multipoint acquisition requires additional\n'
+                                                                                          'settling time. This function does not include this additional time or\n'
+                                                                                          'any NIDMM_ATTR_TRIGGER_DELAY associated with the first measurement.\n'
+                                                                                          'Time required for internal measurements, such as\n'
+                                                                                          'NIDMM_ATTR_AUTO_ZERO, is included.\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'None if period_ctype is None else (ctypes.pointer(period_ctype))',
+                                                      'name': 'Period',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'period',
+                                                      'python_name_or_default_for_init': 'period',
+                                                      'python_name_with_default': 'period',
+                                                      'python_name_with_doc_default': 'period',
+                                                      'python_type': 'float',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViReal64',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False}],
+                                'python_code_variables': [],
+                                'python_name': 'get_measurement_period',
+                                'render_in_library': True,
+                                'render_in_session_base': False,
+                                'returns': 'ViStatus'},
+    'GetNextCoercionRecord': {   'codegen_method': 'no',
+                                 'documentation': {   'description': '\n'
+                                                                     'This function returns the coercion information associated with the IVI\n'
+                                                                     'session, and it retrieves and clears the oldest instance in which NI-DMM\n'
+                                                                     'coerced a value you specified to another value.\n'
+                                                                     '\n'
+                                                                     'If you set NIDMM_ATTR_RECORD_COERCIONS to VI_TRUE (1), NI-DMM keeps\n'
+                                                                     'a list of all coercions it makes on ViInt32 or ViReal64 values that you\n'
+                                                                     'pass to NI-DMM functions. Use this function to retrieve information from\n'
+                                                                     'that list.\n'},
+                                 'parameters': [   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                           'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                           'None.\n',
+                                                                            'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                       'name': 'vi',
+                                                       'type': 'ViSession'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Passes the number of bytes in the ViChar array you specify for the\n'
+                                                                                           '**Coercion_Record** parameter. If the next coercion record string,\n'
+                                                                                           'including the terminating NULL byte, contains more bytes than you\n'
+                                                                                           'indicate in this parameter, the function copies **buffer_size** – 1\n'
+                                                                                           'bytes into the buffer, places an ASCII NULL byte at the end of the\n'
+                                                                                           'buffer, and returns the buffer size you must pass to get the entire\n'
+                                                                                           'value.\n'
+                                                                                           '\n'
+                                                                                           'For example, if the value is "123456" and the **buffer_size** is 4, the\n'
+                                                                                           'function places "123" into the buffer and returns 7. If you pass a\n'
+                                                                                           'negative number, the function copies the value to the buffer regardless\n'
+                                                                                           'of the number of bytes in the value.\n'
+                                                                                           '\n'
+                                                                                           'If you pass 0, you can pass VI_NULL for the **Coercion_Record** buffer\n'
+                                                                                           'parameter.\n'
+                                                                                           '\n'
+                                                                                           'The default value is None.\n'},
+                                                       'name': 'bufferSize',
+                                                       'type': 'ViInt32'},
+                                                   {   'direction': 'out',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Returns the next **coercion_record** for the IVI session.\n'
+                                                                                           '\n'
+                                                                                           'If there are no coercions records, the function returns an empty string.\n'
+                                                                                           'The buffer must contain at least as many elements as the value you\n'
+                                                                                           'specify with the **Buffer_Size** parameter.\n'},
+                                                       'name': 'coercionRecord',
+                                                       'type': 'ViChar[ ]'}],
+                                 'returns': 'ViStatus'},
+    'GetNextInterchangeWarning': {   'codegen_method': 'no',
+                                     'documentation': {   'description': '\n'
+                                                                         'This function returns the interchangeability warnings associated with\n'
+                                                                         'the IVI session. It retrieves and clears the oldest instance in which\n'
+                                                                         'the class driver recorded an interchangeability warning.\n'
+                                                                         'Interchangeability warnings indicate that using your application with a\n'
+                                                                         'different instrument might cause different behavior.\n'
+                                                                         '\n'
+                                                                         'The driver performs interchangeability checking when\n'
+                                                                         'NIDMM_ATTR_INTERCHANGE_CHECK is set to VI_TRUE (1). The function\n'
+                                                                         'returns an empty string in the **Interchange_Warning** parameter if no\n'
+                                                                         'interchangeability warnings remain for the session. In general, the\n'
+                                                                         'instrument driver generates interchangeability warnings when an\n'
+                                                                         'attribute that affects the behavior of the instrument is in a state that\n'
+                                                                         'you did not specify.\n'},
+                                     'parameters': [   {   'direction': 'in',
+                                                           'documentation': {   'description': '\n'
+                                                                                               'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                               'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                               'None.\n',
+                                                                                'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                           'name': 'vi',
+                                                           'type': 'ViSession'},
+                                                       {   'direction': 'in',
+                                                           'documentation': {   'description': '\n'
+                                                                                               'Passes the number of bytes in the ViChar array you specify for the\n'
+                                                                                               '**Interchange_Warning** parameter. If the next interchangeability\n'
+                                                                                               'warning string, including the terminating NULL byte, contains more bytes\n'
+                                                                                               'than you indicate in this parameter, the function copies\n'
+                                                                                               '**buffer_size** –1 bytes into the buffer, places an ASCII NULL byte at\n'
+                                                                                               'the end of the buffer, and returns the buffer size you must pass to get\n'
+                                                                                               'the entire value.\n'
+                                                                                               '\n'
+                                                                                               'For example, if the value is "123456" and the **buffer_size** is 4, the\n'
+                                                                                               'function places "123" into the buffer and returns 7. If you pass a\n'
+                                                                                               'negative number, the function copies the value to the buffer regardless\n'
+                                                                                               'of the number of bytes in the value. If you pass 0, you can pass\n'
+                                                                                               'VI_NULL for the **Interchange_Warning** buffer parameter. The default\n'
+                                                                                               'value is None.\n'},
+                                                           'name': 'bufferSize',
+                                                           'type': 'ViInt32'},
+                                                       {   'direction': 'out',
+                                                           'documentation': {   'description': '\n'
+                                                                                               'Returns the next interchange warning for the IVI session. If there are\n'
+                                                                                               'no interchange warnings, the function returns an empty string. The\n'
+                                                                                               'buffer must contain at least as many elements as the value you specify\n'
+                                                                                               'with the **Buffer_Size** parameter.\n'},
+                                                           'name': 'interchangeWarning',
+                                                           'type': 'ViChar[ ]'}],
+                                     'returns': 'ViStatus'},
+    'GetSelfCalSupported': {   'blocking': False,
+                               'codegen_method': 'public',
+                               'documentation': {'description': '\nReturns a Boolean value that expresses whether or not the DMM that you\nare using can perform self-calibration.\n'},
+                               'has_repeated_capability': False,
+                               'invalidates_attribute_cache': False,
+                               'is_error_handling': False,
+                               'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                               'name': 'GetSelfCalSupported',
+                               'parameters': [   {   'ctypes_type': 'ViSession',
+                                                     'ctypes_type_library_call': 'ViSession',
+                                                     'ctypes_variable_name': 'vi_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                         'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                         'None.\n',
+                                                                          'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': True,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'vi_ctype',
+                                                     'name': 'vi',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'vi',
+                                                     'python_name_or_default_for_init': 'vi',
+                                                     'python_name_with_default': 'vi',
+                                                     'python_name_with_doc_default': 'vi',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViSession',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViBoolean',
+                                                     'ctypes_type_library_call': 'ctypes.POINTER(ViBoolean)',
+                                                     'ctypes_variable_name': 'self_cal_supported_ctype',
+                                                     'direction': 'out',
+                                                     'documentation': {   'description': '\nReturns whether Self Cal is supported for the device specified by the\ngiven session.\n',
+                                                                          'table_body': [   ['VI_TRUE', '1', 'The DMM that you are using can perform self-calibration.'],
+                                                                                            ['VI_FALSE', '0', 'The DMM that you are using cannot perform self-calibration.']]},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'None if self_cal_supported_ctype is None else (ctypes.pointer(self_cal_supported_ctype))',
+                                                     'name': 'selfCalSupported',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'self_cal_supported',
+                                                     'python_name_or_default_for_init': 'self_cal_supported',
+                                                     'python_name_with_default': 'self_cal_supported',
+                                                     'python_name_with_doc_default': 'self_cal_supported',
+                                                     'python_type': 'bool',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViBoolean',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False}],
+                               'python_code_variables': [],
+                               'python_name': 'get_self_cal_supported',
+                               'render_in_library': True,
+                               'render_in_session_base': False,
+                               'returns': 'ViStatus'},
+    'InitExtCal': {   'codegen_method': 'no',
+                      'documentation': {   'description': '\n'
+                                                          'The following operations are performed if the **Calibration_Password**\n'
+                                                          'is valid:\n'
+                                                          '\n'
+                                                          '-  Creates a new session for external calibration to the device you\n'
+                                                          '   specify for the **Resource_Name** parameter.\n'
+                                                          '-  Resets the device and prepares the EEPROM for new calibration\n'
+                                                          '   coefficients.\n'
+                                                          '-  Returns a ViSession handle that you use to identify the instrument in\n'
+                                                          '   all calibration adjustments and post-adjustment verification steps.\n'
+                                                          '\n'
+                                                          'After opening a calibration session, the device cannot take valid\n'
+                                                          'measurements using this session until the device has been properly\n'
+                                                          'adjusted. Once the adjustment phase is complete, you can use this\n'
+                                                          'session to verify the new calibration constants. After verification, you\n'
+                                                          'have the option of saving the new calibration constants or reverting to\n'
+                                                          'the previous calibration constants by specifying the **Action**\n'
+                                                          'parameter in niDMM_CloseExtCal.\n'
+                                                          '\n'
+                                                          'If you encounter a fatal error such as a power failure or system crash\n'
+                                                          'while performing an external calibration, you can call\n'
+                                                          'niDMM_RestoreLastExtCalConstants to return the device to a usable\n'
+                                                          'state.\n',
+                                           'note': [   '\n'
+                                                       'The NI 4050 and NI 4060 are not supported.\n'
+                                                       'Refer to the *NI 4065 6½ Digit DMM Calibration Procedure*, the\n'
+                                                       '*NI 4070/4072 6½ Digit FlexDMM Calibration Procedure*, or the *NI 4071\n'
+                                                       '7½–Digit FlexDMM Calibration Procedure* before using this function.\n'
+                                                       'This function creates a new session the first time you invoke it for a\n'
+                                                       'device. If you call this function on the same resource, an error is\n'
+                                                       'returned. You should use niDMM_CloseExtCal to close a session obtained\n'
+                                                       'using this function.\n',
+                                                       '\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                      'parameters': [   {   'direction': 'in',
+                                            'documentation': {   'caution': '\n'
+                                                                            'All IVI names for the **Resource_Name**, such as logical names or\n'
+                                                                            'virtual names, are case-sensitive. If you use logical names, driver\n'
+                                                                            'session names, or virtual names in your program, you must make sure that\n'
+                                                                            'the name you use matches the name in the IVI Configuration Store file\n'
+                                                                            'exactly, without any variations in the case of the characters in the\n'
+                                                                            'name.\n',
+                                                                 'description': '\n'
+                                                                                '| Contains the **resource_name** of the device to initialize. The\n'
+                                                                                '  **resource_name** is assigned in Measurement & Automation Explorer\n'
+                                                                                '  (MAX). Refer to `Related\n'
+                                                                                '  Documentation <REPLACE_DRIVER_SPECIFIC_URL_1(related_documentation)>`__\n'
+                                                                                '  for the *NI Digital Multimeters Getting Started Guide* for more\n'
+                                                                                '  information about configuring and testing the DMM in MAX.\n'
+                                                                                '| Valid Syntax:\n'
+                                                                                '\n'
+                                                                                '-  NI-DAQmx name\n'
+                                                                                '-  DAQ::NI-DAQmx name[::INSTR]\n'
+                                                                                '-  DAQ::Traditional NI-DAQ device number[::INSTR]\n'
+                                                                                '-  IVI logical name\n'},
+                                            'name': 'resourceName',
+                                            'type': 'ViString'},
+                                        {   'direction': 'in',
+                                            'documentation': {   'description': '\n'
+                                                                                'Specifies the password required to enable external calibration\n'
+                                                                                'functionality.\n'
+                                                                                '\n'
+                                                                                'The maximum password string length is eight characters, excluding the\n'
+                                                                                'termination character. "NI" is the factory-default password.\n'},
+                                            'name': 'calibrationPassword',
+                                            'type': 'ViChar[ ]'},
+                                        {   'direction': 'out',
+                                            'documentation': {   'description': '\n'
+                                                                                'The session handle that you obtain from niDMM_InitExtCal. The handle\n'
+                                                                                'identifies a particular instrument calibration session.\n',
+                                                                 'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                            'name': 'vi',
+                                            'type': 'ViSession'}],
+                      'returns': 'ViStatus'},
+    'InitWithOptions': {   'blocking': False,
+                           'codegen_method': 'private',
+                           'documentation': {   'description': '\n'
+                                                               'This function completes the following tasks:\n'
+                                                               '\n'
+                                                               '-  Creates a new IVI instrument driver session and, optionally, sets the\n'
+                                                               '   initial state of the following session attributes:\n'
+                                                               '   NIDMM_ATTR_RANGE_CHECK, NIDMM_ATTR_QUERY_INSTR_STATUS,\n'
+                                                               '   NIDMM_ATTR_CACHE, NIDMM_ATTR_SIMULATE,\n'
+                                                               '   NIDMM_ATTR_RECORD_COERCIONS.\n'
+                                                               '-  Opens a session to the device you specify for the **Resource_Name**\n'
+                                                               '   parameter. If the **ID_Query** parameter is set to VI_TRUE, this\n'
+                                                               '   function queries the instrument ID and checks that it is valid for\n'
+                                                               '   this instrument driver.\n'
+                                                               '-  If the **Reset_Device** parameter is set to VI_TRUE, this function\n'
+                                                               '   resets the instrument to a known state. Sends initialization commands\n'
+                                                               '   to set the instrument to the state necessary for the operation of the\n'
+                                                               '   instrument driver.\n'
+                                                               '-  Returns a ViSession handle that you use to identify the instrument in\n'
+                                                               '   all subsequent instrument driver function calls.\n',
+                                                'note': ['\nOne or more of the referenced attributes are not in the Python API for this driver.\n']},
+                           'has_repeated_capability': False,
+                           'invalidates_attribute_cache': False,
+                           'is_error_handling': False,
+                           'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                           'name': 'InitWithOptions',
+                           'parameters': [   {   'ctypes_type': 'ViString',
+                                                 'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                 'ctypes_variable_name': 'resource_name_ctype',
+                                                 'direction': 'in',
+                                                 'documentation': {   'caution': '\n'
+                                                                                 'All IVI names for the **Resource_Name**, such as logical names or\n'
+                                                                                 'virtual names, are case-sensitive. If you use logical names, driver\n'
+                                                                                 'session names, or virtual names in your program, you must make sure that\n'
+                                                                                 'the name you use matches the name in the IVI Configuration Store file\n'
+                                                                                 'exactly, without any variations in the case of the characters in the\n'
+                                                                                 'name.\n',
+                                                                      'description': '\n'
+                                                                                     '| Contains the **resource_name** of the device to initialize. The\n'
+                                                                                     '  **resource_name** is assigned in Measurement & Automation Explorer\n'
+                                                                                     '  (MAX). Refer to `Related\n'
+                                                                                     '  Documentation <REPLACE_DRIVER_SPECIFIC_URL_1(related_documentation)>`__\n'
+                                                                                     '  for the *NI Digital Multimeters Getting Started Guide* for more\n'
+                                                                                     '  information about configuring and testing the DMM in MAX.\n'
+                                                                                     '| Valid Syntax:\n'
+                                                                                     '\n'
+                                                                                     '-  NI-DAQmx name\n'
+                                                                                     '-  DAQ::NI-DAQmx name[::INSTR]\n'
+                                                                                     '-  DAQ::Traditional NI-DAQ device number[::INSTR]\n'
+                                                                                     '-  IVI logical name\n'},
+                                                 'enum': None,
+                                                 'is_buffer': False,
+                                                 'is_repeated_capability': False,
+                                                 'is_session_handle': False,
+                                                 'is_string': True,
+                                                 'library_method_call_snippet': 'resource_name_ctype',
+                                                 'name': 'resourceName',
+                                                 'numpy': False,
+                                                 'numpy_into_return': False,
+                                                 'python_name': 'resource_name',
+                                                 'python_name_or_default_for_init': 'resource_name',
+                                                 'python_name_with_default': 'resource_name',
+                                                 'python_name_with_doc_default': 'resource_name',
+                                                 'python_type': 'str',
+                                                 'size': {'mechanism': 'fixed', 'value': 1},
+                                                 'type': 'ViString',
+                                                 'use_array': False,
+                                                 'use_in_python_api': True,
+                                                 'use_list': False},
+                                             {   'ctypes_type': 'ViBoolean',
+                                                 'ctypes_type_library_call': 'ViBoolean',
+                                                 'ctypes_variable_name': 'id_query_ctype',
+                                                 'default_value': False,
+                                                 'direction': 'in',
+                                                 'documentation': {   'description': '\n'
+                                                                                     'Verifies that the device you initialize is one that the driver supports.\n'
+                                                                                     'NI-DMM automatically performs this query, so setting this parameter is\n'
+                                                                                     'not necessary.\n'
+                                                                                     'Defined Values:\n',
+                                                                      'table_body': [['VI_TRUE (default)', '1', 'Perform ID Query'], ['VI_FALSE', '0', 'Skip ID Query']]},
+                                                 'enum': None,
+                                                 'is_buffer': False,
+                                                 'is_repeated_capability': False,
+                                                 'is_session_handle': False,
+                                                 'is_string': False,
+                                                 'library_method_call_snippet': 'id_query_ctype',
+                                                 'name': 'idQuery',
+                                                 'numpy': False,
+                                                 'numpy_into_return': False,
+                                                 'python_name': 'id_query',
+                                                 'python_name_or_default_for_init': 'False',
+                                                 'python_name_with_default': 'id_query=False',
+                                                 'python_name_with_doc_default': 'id_query=False',
+                                                 'python_type': 'bool',
+                                                 'size': {'mechanism': 'fixed', 'value': 1},
+                                                 'type': 'ViBoolean',
+                                                 'use_array': False,
+                                                 'use_in_python_api': False,
+                                                 'use_list': False},
+                                             {   'ctypes_type': 'ViBoolean',
+                                                 'ctypes_type_library_call': 'ViBoolean',
+                                                 'ctypes_variable_name': 'reset_device_ctype',
+                                                 'default_value': False,
+                                                 'direction': 'in',
+                                                 'documentation': {   'description': '\nSpecifies whether to reset the instrument during the initialization\nprocedure.\nDefined Values:\n',
+                                                                      'table_body': [['VI_TRUE (default)', '1', 'Reset Device'], ['VI_FALSE', '0', "Don't Reset"]]},
+                                                 'enum': None,
+                                                 'is_buffer': False,
+                                                 'is_repeated_capability': False,
+                                                 'is_session_handle': False,
+                                                 'is_string': False,
+                                                 'library_method_call_snippet': 'reset_device_ctype',
+                                                 'name': 'resetDevice',
+                                                 'numpy': False,
+                                                 'numpy_into_return': False,
+                                                 'python_name': 'reset_device',
+                                                 'python_name_or_default_for_init': 'reset_device',
+                                                 'python_name_with_default': 'reset_device=False',
+                                                 'python_name_with_doc_default': 'reset_device=False',
+                                                 'python_type': 'bool',
+                                                 'size': {'mechanism': 'fixed', 'value': 1},
+                                                 'type': 'ViBoolean',
+                                                 'use_array': False,
+                                                 'use_in_python_api': True,
+                                                 'use_list': False},
+                                             {   'ctypes_type': 'ViString',
+                                                 'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                 'ctypes_variable_name': 'option_string_ctype',
+                                                 'default_value': '""',
+                                                 'direction': 'in',
+                                                 'documentation': {   'description': '\n'
+                                                                                     '| Sets the initial value of certain attributes for the session. The\n'
+                                                                                     '  following table specifies the attribute name, attribute constant, and\n'
+                                                                                     '  default value for each attribute that you can use in this parameter:\n'
+                                                                                     '\n'
+                                                                                     'The format of this string is, "AttributeName=Value." To set multiple\n'
+                                                                                     'attributes, separate their assignments with a comma.\n'
+                                                                                     '\n'
+                                                                                     'If you pass NULL or an empty string for this parameter, the session uses\n'
+                                                                                     'the default values for the attributes. You can override the default\n'
+                                                                                     'values by assigning a value explicitly in an **option_string**\n'
+                                                                                     'parameter. You do not have to specify all of the attributes and may\n'
+                                                                                     'leave any of them out (those left out use the default value).\n'
+                                                                                     '\n'
+                                                                                     'Refer to `Simulating NI Digital\n'
+                                                                                     'Multimeters <REPLACE_DRIVER_SPECIFIC_URL_1(simulation)>`__ for more\n'
+                                                                                     'information.\n',
+                                                                      'note': ['\nOne or more of the referenced attributes are not in the Python API for this driver.\n'],
+                                                                      'table_body': [   ['Check', 'NIDMM_ATTR_RANGE_CHECK', 'VI_TRUE', '1'],
+                                                                                        ['QueryInstrStatus', 'NIDMM_ATTR_QUERY_INSTR_STATUS', 'VI_FALSE', '0'],
+                                                                                        ['Cache', 'NIDMM_ATTR_CACHE', 'VI_TRUE', '1'],
+                                                                                        ['Simulate', 'NIDMM_ATTR_SIMULATE', 'VI_FALSE', '0'],
+                                                                                        ['RecordCoercions', 'NIDMM_ATTR_RECORD_COERCIONS', 'VI_FALSE', '0'],
+                                                                                        ['DriverSetup', 'NIDMM_ATTR_DRIVER_SETUP', '"" (empty string)', '""']]},
+                                                 'enum': None,
+                                                 'is_buffer': False,
+                                                 'is_repeated_capability': False,
+                                                 'is_session_handle': False,
+                                                 'is_string': True,
+                                                 'library_method_call_snippet': 'option_string_ctype',
+                                                 'name': 'optionString',
+                                                 'numpy': False,
+                                                 'numpy_into_return': False,
+                                                 'python_api_converter_name': 'convert_init_with_options_dictionary',
+                                                 'python_api_converter_type': 'dict',
+                                                 'python_name': 'option_string',
+                                                 'python_name_or_default_for_init': '_converters.convert_init_with_options_dictionary(option_string, self._encoding)',
+                                                 'python_name_with_default': 'option_string=""',
+                                                 'python_name_with_doc_default': 'option_string=\'""\'',
+                                                 'python_type': 'str',
+                                                 'size': {'mechanism': 'fixed', 'value': 1},
+                                                 'type': 'ViString',
+                                                 'use_array': False,
+                                                 'use_in_python_api': True,
+                                                 'use_list': False},
+                                             {   'ctypes_type': 'ViSession',
+                                                 'ctypes_type_library_call': 'ctypes.POINTER(ViSession)',
+                                                 'ctypes_variable_name': 'vi_ctype',
+                                                 'direction': 'out',
+                                                 'documentation': {   'description': '\n'
+                                                                                     'Returns a ViSession handle that you use to identify the instrument in\n'
+                                                                                     'all subsequent instrument driver function calls.\n'},
+                                                 'enum': None,
+                                                 'is_buffer': False,
+                                                 'is_repeated_capability': False,
+                                                 'is_session_handle': False,
+                                                 'is_string': False,
+                                                 'library_method_call_snippet': 'None if vi_ctype is None else (ctypes.pointer(vi_ctype))',
+                                                 'name': 'vi',
+                                                 'numpy': False,
+                                                 'numpy_into_return': False,
+                                                 'python_name': 'vi',
+                                                 'python_name_or_default_for_init': 'vi',
+                                                 'python_name_with_default': 'vi',
+                                                 'python_name_with_doc_default': 'vi',
+                                                 'python_type': 'int',
+                                                 'size': {'mechanism': 'fixed', 'value': 1},
+                                                 'type': 'ViSession',
+                                                 'use_array': False,
+                                                 'use_in_python_api': True,
+                                                 'use_list': False}],
+                           'python_code_variables': [],
+                           'python_name': '_init_with_options',
+                           'render_in_library': True,
+                           'render_in_session_base': False,
+                           'returns': 'ViStatus'},
+    'Initiate': {   'blocking': False,
+                    'codegen_method': 'private',
+                    'documentation': {   'description': '\n'
+                                                        'Initiates an acquisition. After you call this function, the DMM leaves\n'
+                                                        'the Idle state and enters the Wait-for-Trigger state. If trigger is set\n'
+                                                        'to Immediate mode, the DMM begins acquiring measurement data. Use\n'
+                                                        'niDMM_Fetch, niDMM_FetchMultiPoint, or niDMM_FetchWaveform to\n'
+                                                        'retrieve the measurement data.\n'},
+                    'has_repeated_capability': False,
+                    'invalidates_attribute_cache': True,
+                    'is_error_handling': False,
+                    'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                    'name': 'Initiate',
+                    'parameters': [   {   'ctypes_type': 'ViSession',
+                                          'ctypes_type_library_call': 'ViSession',
+                                          'ctypes_variable_name': 'vi_ctype',
+                                          'direction': 'in',
+                                          'documentation': {   'description': '\n'
+                                                                              'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                              'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                              'None.\n',
+                                                               'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                          'enum': None,
+                                          'is_buffer': False,
+                                          'is_repeated_capability': False,
+                                          'is_session_handle': True,
+                                          'is_string': False,
+                                          'library_method_call_snippet': 'vi_ctype',
+                                          'name': 'vi',
+                                          'numpy': False,
+                                          'numpy_into_return': False,
+                                          'python_name': 'vi',
+                                          'python_name_or_default_for_init': 'vi',
+                                          'python_name_with_default': 'vi',
+                                          'python_name_with_doc_default': 'vi',
+                                          'python_type': 'int',
+                                          'size': {'mechanism': 'fixed', 'value': 1},
+                                          'type': 'ViSession',
+                                          'use_array': False,
+                                          'use_in_python_api': True,
+                                          'use_list': False}],
+                    'python_code_variables': [],
+                    'python_name': '_initiate',
+                    'render_in_library': True,
+                    'render_in_session_base': False,
+                    'returns': 'ViStatus'},
+    'IsOverRange': {   'codegen_method': 'no',
+                       'documentation': {   'description': '\n'
+                                                           'Takes a **Measurement_Value** and determines if the value is a valid\n'
+                                                           'measurement or a value indicating that an overrange condition occurred.\n'},
+                       'parameters': [   {   'direction': 'in',
+                                             'documentation': {   'description': '\n'
+                                                                                 'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                 'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                 'None.\n',
+                                                                  'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                             'name': 'vi',
+                                             'type': 'ViSession'},
+                                         {   'direction': 'in',
+                                             'documentation': {   'description': 'The measured value returned from the DMM.',
+                                                                  'note': '\nIf an overrange condition occurs, the **Measurement_Value** contains\nan IEEE-defined NaN (Not a Number) value.\n'},
+                                             'name': 'measurementValue',
+                                             'type': 'ViReal64'},
+                                         {   'direction': 'out',
+                                             'documentation': {   'description': '\nReturns whether the measurement value is a valid measurement or an\noverrange condition.\n',
+                                                                  'table_body': [   ['VI_TRUE', '1', 'The value indicates that an overrange condition occurred.'],
+                                                                                    ['VI_FALSE', '0', 'The value is a valid measurement.']]},
+                                             'name': 'isOverRange',
+                                             'type': 'ViBoolean'}],
+                       'returns': 'ViStatus'},
+    'IsUnderRange': {   'codegen_method': 'no',
+                        'documentation': {   'description': '\n'
+                                                            'Takes a **Measurement_Value** and determines if the value is a valid\n'
+                                                            'measurement or a value indicating that an underrange condition occurred.\n'},
+                        'parameters': [   {   'direction': 'in',
+                                              'documentation': {   'description': '\n'
+                                                                                  'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                  'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                  'None.\n',
+                                                                   'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                              'name': 'vi',
+                                              'type': 'ViSession'},
+                                          {   'direction': 'in',
+                                              'documentation': {   'description': 'The measured value returned from the DMM.',
+                                                                   'note': '\nIf an overrange condition occurs, the **Measurement_Value** contains\nan IEEE-defined NaN (Not a Number) value.\n'},
+                                              'name': 'measurementValue',
+                                              'type': 'ViReal64'},
+                                          {   'direction': 'out',
+                                              'documentation': {   'description': '\nReturns whether the **Measurement_Value** is a valid measurement or an\nunderrange condition.\n',
+                                                                   'table_body': [   ['VI_TRUE', '1', 'The value indicates that an underrange condition occurred.'],
+                                                                                     ['VI_FALSE', '0', 'The value is a valid measurement.']]},
+                                              'name': 'isUnderRange',
+                                              'type': 'ViBoolean'}],
+                        'returns': 'ViStatus'},
+    'LockSession': {   'codegen_method': 'no',
+                       'documentation': {   'description': '\n'
+                                                           'This function obtains a multithread lock on the instrument session.\n'
+                                                           'Before it does so, it waits until all other execution threads have\n'
+                                                           'released their locks on the instrument session.\n'
+                                                           '\n'
+                                                           'Other threads might have obtained a lock on this session in the\n'
+                                                           'following ways:\n'
+                                                           '\n'
+                                                           '-  The user application called this function.\n'
+                                                           '-  A call to the instrument driver locked the session.\n'
+                                                           '-  A call to the IVI Library locked the session.\n'
+                                                           '\n'
+                                                           'After your call to this function returns successfully, no other threads\n'
+                                                           'can access the instrument session until you call niDMM_UnlockSession.\n'
+                                                           '\n'
+                                                           'Use this function and niDMM_UnlockSession around a sequence of calls to\n'
+                                                           'instrument driver functions if you require that the instrument retain\n'
+                                                           'its settings through the end of the sequence. You can safely make nested\n'
+                                                           'calls to this function within the same thread.\n'
+                                                           '\n'
+                                                           'To completely unlock the session, you must balance each call to this\n'
+                                                           'function with a call to niDMM_UnlockSession. If, however, you use the\n'
+                                                           '**Caller_Has_Lock** parameter in all calls to this function and\n'
+                                                           'niDMM_UnlockSession within a function, the IVI Library locks the\n'
+                                                           'session only once within the function regardless of the number of calls\n'
+                                                           'you make to this function. This feature allows you to call\n'
+                                                           'niDMM_UnlockSession just once at the end of the function.\n',
+                                            'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                       'parameters': [   {   'direction': 'in',
+                                             'documentation': {   'description': '\n'
+                                                                                 'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                 'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                 'None.\n',
+                                                                  'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                             'name': 'vi',
+                                             'type': 'ViSession'},
+                                         {   'direction': 'out',
+                                             'documentation': {   'description': '\n'
+                                                                                 'This parameter serves as a convenience. If you do not want to use this\n'
+                                                                                 'parameter, pass VI_NULL. Use this parameter in complex functions to\n'
+                                                                                 'keep track of whether you obtain a lock and, therefore, need to unlock\n'
+                                                                                 'the session. To use this parameter, complete the following steps:\n'
+                                                                                 '\n'
+                                                                                 '#. Pass the address of a local ViBoolean variable.\n'
+                                                                                 '#. In the declaration of the local variable, initialize it to VI_FALSE\n'
+                                                                                 '   (0).\n'
+                                                                                 '#. Pass the address of the same local variable to any other calls you\n'
+                                                                                 '   make to this function or niDMM_UnlockSession in the same function.\n'
+                                                                                 '\n'
+                                                                                 'The parameter is an input/output parameter. This function and\n'
+                                                                                 'niDMM_UnlockSession each inspect the current value and take the\n'
+                                                                                 'following actions:\n'
+                                                                                 '\n'
+                                                                                 'If the value is VI_TRUE (1), this function does not lock the session\n'
+                                                                                 'again. If the value is VI_FALSE, this function obtains the lock and\n'
+                                                                                 'sets the value of the parameter to VI_TRUE.\n'
+                                                                                 '\n'
+                                                                                 'If the value is VI_FALSE, niDMM_UnlockSession does not attempt to\n'
+                                                                                 'unlock the session. If the value is VI_TRUE, niDMM_UnlockSession\n'
+                                                                                 'releases the lock and sets the value of the parameter to VI_FALSE.\n'
+                                                                                 'Thus, you can, call niDMM_UnlockSession at the end of your function\n'
+                                                                                 'without worrying about whether you actually have the lock.\n'
+                                                                                 '\n'
+                                                                                 '**Example**\n'
+                                                                                 '\n'
+                                                                                 'ViStatus TestFunc (ViSession vi, ViInt32 flags)\n'
+                                                                                 '\n'
+                                                                                 '{\n'
+                                                                                 '\n'
+                                                                                 '| ViStatus error = VI_SUCCESS;\n'
+                                                                                 '| ViBoolean haveLock = VI_FALSE;\n'
+                                                                                 '| if (flags & BIT_1)\n'
+                                                                                 '\n'
+                                                                                 '| {\n'
+                                                                                 '| viCheckErr( NIDMM_LockSession(vi, &haveLock;));\n'
+                                                                                 '| viCheckErr( TakeAction1(vi));\n'
+                                                                                 '| if (flags & BIT_2)\n'
+                                                                                 '\n'
+                                                                                 '{\n'
+                                                                                 '\n'
+                                                                                 'viCheckErr( NIDMM_UnlockSession(vi, &haveLock;));\n'
+                                                                                 '\n'
+                                                                                 'viCheckErr( TakeAction2(vi));\n'
+                                                                                 '\n'
+                                                                                 'viCheckErr( NIDMM_LockSession(vi, &haveLock;);\n'
+                                                                                 '\n'
+                                                                                 '}\n'
+                                                                                 '\n'
+                                                                                 'if (flags & BIT_3)\n'
+                                                                                 '\n'
+                                                                                 'viCheckErr( TakeAction3(vi));\n'
+                                                                                 '\n'
+                                                                                 '}\n'
+                                                                                 '\n'
+                                                                                 'Error:\n'
+                                                                                 '\n'
+                                                                                 '/\\*\n'
+                                                                                 '\n'
+                                                                                 'At this point, you cannot really be sure that you have the lock.\n'
+                                                                                 'Fortunately, the haveLock variable takes care of that for you.\n'
+                                                                                 '\n'
+                                                                                 '\\*/\n'
+                                                                                 '\n'
+                                                                                 'niDMM_UnlockSession(vi, &haveLock;);\n'
+                                                                                 '\n'
+                                                                                 'return error;\n'
+                                                                                 '\n'
+                                                                                 '}\n',
+                                                                  'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                             'name': 'callerHasLock',
+                                             'type': 'ViBoolean'}],
+                       'returns': 'ViStatus'},
+    'PerformOpenCableComp': {   'blocking': False,
+                                'codegen_method': 'public',
+                                'documentation': {   'description': '\n'
+                                                                    'For the NI 4082 and NI 4072 only, performs the open cable compensation\n'
+                                                                    'measurements for the current capacitance/inductance range, and returns\n'
+                                                                    'open cable compensation **Conductance** and **Susceptance** values. You\n'
+                                                                    'can use the return values of this function as inputs to\n'
+                                                                    'niDMM_ConfigureOpenCableCompValues.\n'
+                                                                    '\n'
+                                                                    'This function returns an error if the value of the NIDMM_ATTR_FUNCTION\n'
+                                                                    'attribute is not set to NIDMM_VAL_CAPACITANCE (1005) or\n'
+                                                                    'NIDMM_VAL_INDUCTANCE (1006).\n'},
+                                'has_repeated_capability': False,
+                                'invalidates_attribute_cache': False,
+                                'is_error_handling': False,
+                                'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                'name': 'PerformOpenCableComp',
+                                'parameters': [   {   'ctypes_type': 'ViSession',
+                                                      'ctypes_type_library_call': 'ViSession',
+                                                      'ctypes_variable_name': 'vi_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                          'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                          'None.\n',
+                                                                           'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': True,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'vi_ctype',
+                                                      'name': 'vi',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'vi',
+                                                      'python_name_or_default_for_init': 'vi',
+                                                      'python_name_with_default': 'vi',
+                                                      'python_name_with_doc_default': 'vi',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViSession',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViReal64',
+                                                      'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                                      'ctypes_variable_name': 'conductance_ctype',
+                                                      'direction': 'out',
+                                                      'documentation': {'description': '\n**conductance** is the measured value of open cable compensation\n**conductance**.\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'None if conductance_ctype is None else (ctypes.pointer(conductance_ctype))',
+                                                      'name': 'Conductance',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'conductance',
+                                                      'python_name_or_default_for_init': 'conductance',
+                                                      'python_name_with_default': 'conductance',
+                                                      'python_name_with_doc_default': 'conductance',
+                                                      'python_type': 'float',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViReal64',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViReal64',
+                                                      'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                                      'ctypes_variable_name': 'susceptance_ctype',
+                                                      'direction': 'out',
+                                                      'documentation': {'description': '\n**susceptance** is the measured value of open cable compensation\n**susceptance**.\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'None if susceptance_ctype is None else (ctypes.pointer(susceptance_ctype))',
+                                                      'name': 'Susceptance',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'susceptance',
+                                                      'python_name_or_default_for_init': 'susceptance',
+                                                      'python_name_with_default': 'susceptance',
+                                                      'python_name_with_doc_default': 'susceptance',
+                                                      'python_type': 'float',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViReal64',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False}],
+                                'python_code_variables': [],
+                                'python_name': 'perform_open_cable_comp',
+                                'render_in_library': True,
+                                'render_in_session_base': False,
+                                'returns': 'ViStatus'},
+    'PerformShortCableComp': {   'blocking': False,
+                                 'codegen_method': 'public',
+                                 'documentation': {   'description': '\n'
+                                                                     'Performs the short cable compensation measurements for the current\n'
+                                                                     'capacitance/inductance range, and returns short cable compensation\n'
+                                                                     '**Resistance** and **Reactance** values. You can use the return values\n'
+                                                                     'of this function as inputs to niDMM_ConfigureShortCableCompValues.\n'
+                                                                     '\n'
+                                                                     'This function returns an error if the value of the NIDMM_ATTR_FUNCTION\n'
+                                                                     'attribute is not set to NIDMM_VAL_CAPACITANCE (1005) or\n'
+                                                                     'NIDMM_VAL_INDUCTANCE (1006).\n'},
+                                 'has_repeated_capability': False,
+                                 'invalidates_attribute_cache': False,
+                                 'is_error_handling': False,
+                                 'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                 'name': 'PerformShortCableComp',
+                                 'parameters': [   {   'ctypes_type': 'ViSession',
+                                                       'ctypes_type_library_call': 'ViSession',
+                                                       'ctypes_variable_name': 'vi_ctype',
+                                                       'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                           'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                           'None.\n',
+                                                                            'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': True,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'vi_ctype',
+                                                       'name': 'vi',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'vi',
+                                                       'python_name_or_default_for_init': 'vi',
+                                                       'python_name_with_default': 'vi',
+                                                       'python_name_with_doc_default': 'vi',
+                                                       'python_type': 'int',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViSession',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False},
+                                                   {   'ctypes_type': 'ViReal64',
+                                                       'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                                       'ctypes_variable_name': 'resistance_ctype',
+                                                       'direction': 'out',
+                                                       'documentation': {'description': '\n**resistance** is the measured value of short cable compensation\n**resistance**.\n'},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': False,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'None if resistance_ctype is None else (ctypes.pointer(resistance_ctype))',
+                                                       'name': 'Resistance',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'resistance',
+                                                       'python_name_or_default_for_init': 'resistance',
+                                                       'python_name_with_default': 'resistance',
+                                                       'python_name_with_doc_default': 'resistance',
+                                                       'python_type': 'float',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViReal64',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False},
+                                                   {   'ctypes_type': 'ViReal64',
+                                                       'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                                       'ctypes_variable_name': 'reactance_ctype',
+                                                       'direction': 'out',
+                                                       'documentation': {'description': '\n**reactance** is the measured value of short cable compensation\n**reactance**.\n'},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': False,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'None if reactance_ctype is None else (ctypes.pointer(reactance_ctype))',
+                                                       'name': 'Reactance',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'reactance',
+                                                       'python_name_or_default_for_init': 'reactance',
+                                                       'python_name_with_default': 'reactance',
+                                                       'python_name_with_doc_default': 'reactance',
+                                                       'python_type': 'float',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViReal64',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False}],
+                                 'python_code_variables': [],
+                                 'python_name': 'perform_short_cable_comp',
+                                 'render_in_library': True,
+                                 'render_in_session_base': False,
+                                 'returns': 'ViStatus'},
+    'Read': {   'blocking': True,
+                'codegen_method': 'public',
+                'documentation': {   'description': 'Acquires a single measurement and returns the measured value.',
+                                     'note': [   '\n'
+                                                 'This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same session '
+                                                 'wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the Session.executor '
+                                                 "property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.\n"]},
+                'has_repeated_capability': False,
+                'invalidates_attribute_cache': False,
+                'is_error_handling': False,
+                'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                'name': 'Read',
+                'parameters': [   {   'ctypes_type': 'ViSession',
+                                      'ctypes_type_library_call': 'ViSession',
+                                      'ctypes_variable_name': 'vi_ctype',
+                                      'direction': 'in',
+                                      'documentation': {   'description': '\n'
+                                                                          'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                          'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                          'None.\n',
+                                                           'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                      'enum': None,
+                                      'is_buffer': False,
+                                      'is_repeated_capability': False,
+                                      'is_session_handle': True,
+                                      'is_string': False,
+                                      'library_method_call_snippet': 'vi_ctype',
+                                      'name': 'vi',
+                                      'numpy': False,
+                                      'numpy_into_return': False,
+                                      'python_name': 'vi',
+                                      'python_name_or_default_for_init': 'vi',
+                                      'python_name_with_default': 'vi',
+                                      'python_name_with_doc_default': 'vi',
+                                      'python_type': 'int',
+                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                      'type': 'ViSession',
+                                      'use_array': False,
+                                      'use_in_python_api': True,
+                                      'use_list': False},
+                                  {   'ctypes_type': 'ViInt32',
+                                      'ctypes_type_library_call': 'ViInt32',
+                                      'ctypes_variable_name': 'maximum_time_ctype',
+                                      'default_value': 'datetime.timedelta(milliseconds=-1)',
+                                      'direction': 'in',
+                                      'documentation': {   'description': '\n'
+                                                                          'Specifies the **maximum_time** allowed for this function to complete in\n'
+                                                                          'milliseconds. If the function does not complete within this time\n'
+                                                                          'interval, the function returns the NIDMM_ERROR_MAX_TIME_EXCEEDED\n'
+                                                                          'error code. This may happen if an external trigger has not been\n'
+                                                                          'received, or if the specified timeout is not long enough for the\n'
+                                                                          'acquisition to complete.\n'
+                                                                          '\n'
+                                                                          'The valid range is 0–86400000. The default value is\n'
+                                                                          'NIDMM_VAL_TIME_LIMIT_AUTO (-1). The DMM calculates the timeout\n'
+                                                                          'automatically.\n',
+                                                           'note': [   '\n'
+                                                                       'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or represent '
+                                                                       'True/False, have been removed.\n']},
+                                      'enum': None,
+                                      'is_buffer': False,
+                                      'is_repeated_capability': False,
+                                      'is_session_handle': False,
+                                      'is_string': False,
+                                      'library_method_call_snippet': 'maximum_time_ctype',
+                                      'name': 'maximumTime',
+                                      'numpy': False,
+                                      'numpy_into_return': False,
+                                      'python_api_converter_name': 'convert_timedelta_to_milliseconds',
+                                      'python_api_converter_type': 'datetime.timedelta',
+                                      'python_name': 'maximum_time',
+                                      'python_name_or_default_for_init': '_converters.convert_timedelta_to_milliseconds(maximum_time, self._encoding)',
+                                      'python_name_with_default': 'maximum_time=datetime.timedelta(milliseconds=-1)',
+                                      'python_name_with_doc_default': "maximum_time='datetime.timedelta(milliseconds=-1)'",
+                                      'python_type': 'int',
+                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                      'type': 'ViInt32',
+                                      'use_array': False,
+                                      'use_in_python_api': True,
+                                      'use_list': False},
+                                  {   'ctypes_type': 'ViReal64',
+                                      'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                      'ctypes_variable_name': 'reading_ctype',
+                                      'direction': 'out',
+                                      'documentation': {'description': 'The measured value returned from the DMM.'},
+                                      'enum': None,
+                                      'is_buffer': False,
+                                      'is_repeated_capability': False,
+                                      'is_session_handle': False,
+                                      'is_string': False,
+                                      'library_method_call_snippet': 'None if reading_ctype is None else (ctypes.pointer(reading_ctype))',
+                                      'name': 'Reading',
+                                      'numpy': False,
+                                      'numpy_into_return': False,
+                                      'python_name': 'reading',
+                                      'python_name_or_default_for_init': 'reading',
+                                      'python_name_with_default': 'reading',
+                                      'python_name_with_doc_default': 'reading',
+                                      'python_type': 'float',
+                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                      'type': 'ViReal64',
+                                      'use_array': False,
+                                      'use_in_python_api': True,
+                                      'use_list': False}],
+                'python_code_variables': [],
+                'python_name': 'read',
+                'render_in_library': True,
+                'render_in_session_base': False,
+                'returns': 'ViStatus'},
+    'ReadMultiPoint': {   'blocking': True,
+                          'codegen_method': 'public',
+                          'documentation': {   'description': '\n'
+                                                              'Acquires multiple measurements and returns an array of measured values.\n'
+                                                              'The number of measurements the DMM makes is determined by the values you\n'
+                                                              'specify for the **Trigger_Count** and **Sample_Count** parameters in\n'
+                                                              'niDMM_ConfigureMultiPoint.\n',
+                                               'note': [   '\n'
+                                                           'This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the '
+                                                           'same session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through '
+                                                           "the Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.\n"]},
+                          'has_repeated_capability': False,
+                          'invalidates_attribute_cache': False,
+                          'is_error_handling': False,
+                          'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                          'name': 'ReadMultiPoint',
+                          'parameters': [   {   'ctypes_type': 'ViSession',
+                                                'ctypes_type_library_call': 'ViSession',
+                                                'ctypes_variable_name': 'vi_ctype',
+                                                'direction': 'in',
+                                                'documentation': {   'description': '\n'
+                                                                                    'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                    'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                    'None.\n',
+                                                                     'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                'enum': None,
+                                                'is_buffer': False,
+                                                'is_repeated_capability': False,
+                                                'is_session_handle': True,
+                                                'is_string': False,
+                                                'library_method_call_snippet': 'vi_ctype',
+                                                'name': 'vi',
+                                                'numpy': False,
+                                                'numpy_into_return': False,
+                                                'python_name': 'vi',
+                                                'python_name_or_default_for_init': 'vi',
+                                                'python_name_with_default': 'vi',
+                                                'python_name_with_doc_default': 'vi',
+                                                'python_type': 'int',
+                                                'size': {'mechanism': 'fixed', 'value': 1},
+                                                'type': 'ViSession',
+                                                'use_array': False,
+                                                'use_in_python_api': True,
+                                                'use_list': False},
+                                            {   'ctypes_type': 'ViInt32',
+                                                'ctypes_type_library_call': 'ViInt32',
+                                                'ctypes_variable_name': 'maximum_time_ctype',
+                                                'default_value': 'datetime.timedelta(milliseconds=-1)',
+                                                'direction': 'in',
+                                                'documentation': {   'description': '\n'
+                                                                                    'Specifies the **maximum_time** allowed for this function to complete in\n'
+                                                                                    'milliseconds. If the function does not complete within this time\n'
+                                                                                    'interval, the function returns the NIDMM_ERROR_MAX_TIME_EXCEEDED\n'
+                                                                                    'error code. This may happen if an external trigger has not been\n'
+                                                                                    'received, or if the specified timeout is not long enough for the\n'
+                                                                                    'acquisition to complete.\n'
+                                                                                    '\n'
+                                                                                    'The valid range is 0–86400000. The default value is\n'
+                                                                                    'NIDMM_VAL_TIME_LIMIT_AUTO (-1). The DMM calculates the timeout\n'
+                                                                                    'automatically.\n',
+                                                                     'note': [   '\n'
+                                                                                 'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or '
+                                                                                 'represent True/False, have been removed.\n']},
+                                                'enum': None,
+                                                'is_buffer': False,
+                                                'is_repeated_capability': False,
+                                                'is_session_handle': False,
+                                                'is_string': False,
+                                                'library_method_call_snippet': 'maximum_time_ctype',
+                                                'name': 'maximumTime',
+                                                'numpy': False,
+                                                'numpy_into_return': False,
+                                                'python_api_converter_name': 'convert_timedelta_to_milliseconds',
+                                                'python_api_converter_type': 'datetime.timedelta',
+                                                'python_name': 'maximum_time',
+                                                'python_name_or_default_for_init': '_converters.convert_timedelta_to_milliseconds(maximum_time, self._encoding)',
+                                                'python_name_with_default': 'maximum_time=datetime.timedelta(milliseconds=-1)',
+                                                'python_name_with_doc_default': "maximum_time='datetime.timedelta(milliseconds=-1)'",
+                                                'python_type': 'int',
+                                                'size': {'mechanism': 'fixed', 'value': 1},
+                                                'type': 'ViInt32',
+                                                'use_array': False,
+                                                'use_in_python_api': True,
+                                                'use_list': False},
+                                            {   'ctypes_type': 'ViInt32',
+                                                'ctypes_type_library_call': 'ViInt32',
+                                                'ctypes_variable_name': 'array_size_ctype',
+                                                'direction': 'in',
+                                                'documentation': {   'description': '\n'
+                                                                                    'Specifies the number of measurements to acquire. The maximum number of\n'
+                                                                                    'measurements for a finite acquisition is the (**Trigger Count** x\n'
+                                                                                    '**Sample Count**) parameters in niDMM_ConfigureMultiPoint.\n'
+                                                                                    '\n'
+                                                                                    'For continuous acquisitions, up to 100,000 points can be returned at\n'
+                                                                                    'once. The number of measurements can be a subset. The valid range is any\n'
+                                                                                    'positive ViInt32. The default value is 1.\n'},
+                                                'enum': None,
+                                                'is_buffer': False,
+                                                'is_repeated_capability': False,
+                                                'is_session_handle': False,
+                                                'is_string': False,
+                                                'library_method_call_snippet': 'array_size_ctype',
+                                                'name': 'arraySize',
+                                                'numpy': False,
+                                                'numpy_into_return': False,
+                                                'python_name': 'array_size',
+                                                'python_name_or_default_for_init': 'array_size',
+                                                'python_name_with_default': 'array_size',
+                                                'python_name_with_doc_default': 'array_size',
+                                                'python_type': 'int',
+                                                'size': {'mechanism': 'fixed', 'value': 1},
+                                                'type': 'ViInt32',
+                                                'use_array': False,
+                                                'use_in_python_api': True,
+                                                'use_list': False},
+                                            {   'ctypes_type': 'ViReal64',
+                                                'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                                'ctypes_variable_name': 'reading_array_ctype',
+                                                'direction': 'out',
+                                                'documentation': {   'description': 'An array of measurement values.',
+                                                                     'note': '\nThe size of the **Reading_Array** must be at least the size that you\nspecify for the **Array_Size** parameter.\n'},
+                                                'enum': None,
+                                                'is_buffer': True,
+                                                'is_repeated_capability': False,
+                                                'is_session_handle': False,
+                                                'is_string': False,
+                                                'library_method_call_snippet': 'reading_array_ctype',
+                                                'name': 'readingArray',
+                                                'numpy': False,
+                                                'numpy_into_return': False,
+                                                'original_type': 'ViReal64[]',
+                                                'python_name': 'reading_array',
+                                                'python_name_or_default_for_init': 'reading_array',
+                                                'python_name_with_default': 'reading_array',
+                                                'python_name_with_doc_default': 'reading_array',
+                                                'python_type': 'float',
+                                                'size': {'mechanism': 'passed-in', 'value': 'arraySize'},
+                                                'type': 'ViReal64',
+                                                'use_array': True,
+                                                'use_in_python_api': True,
+                                                'use_list': False},
+                                            {   'ctypes_type': 'ViInt32',
+                                                'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                                'ctypes_variable_name': 'actual_number_of_points_ctype',
+                                                'direction': 'out',
+                                                'documentation': {'description': 'Indicates the number of measured values actually retrieved from the DMM.'},
+                                                'enum': None,
+                                                'is_buffer': False,
+                                                'is_repeated_capability': False,
+                                                'is_session_handle': False,
+                                                'is_string': False,
+                                                'library_method_call_snippet': 'None if actual_number_of_points_ctype is None else (ctypes.pointer(actual_number_of_points_ctype))',
+                                                'name': 'actualNumberOfPoints',
+                                                'numpy': False,
+                                                'numpy_into_return': False,
+                                                'python_name': 'actual_number_of_points',
+                                                'python_name_or_default_for_init': 'actual_number_of_points',
+                                                'python_name_with_default': 'actual_number_of_points',
+                                                'python_name_with_doc_default': 'actual_number_of_points',
+                                                'python_type': 'int',
+                                                'size': {'mechanism': 'fixed', 'value': 1},
+                                                'type': 'ViInt32',
+                                                'use_array': False,
+                                                'use_in_python_api': False,
+                                                'use_list': False}],
+                          'python_code_variables': [],
+                          'python_name': 'read_multi_point',
+                          'render_in_library': True,
+                          'render_in_session_base': False,
+                          'returns': 'ViStatus'},
+    'ReadStatus': {   'blocking': False,
+                      'codegen_method': 'public',
+                      'documentation': {   'description': '\n'
+                                                          'Returns measurement backlog and acquisition status. Use this function to\n'
+                                                          'determine how many measurements are available before calling\n'
+                                                          'niDMM_Fetch, niDMM_FetchMultiPoint, or niDMM_FetchWaveform.\n',
+                                           'note': 'The NI 4050 is not supported.'},
+                      'has_repeated_capability': False,
+                      'invalidates_attribute_cache': False,
+                      'is_error_handling': False,
+                      'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                      'name': 'ReadStatus',
+                      'parameters': [   {   'ctypes_type': 'ViSession',
+                                            'ctypes_type_library_call': 'ViSession',
+                                            'ctypes_variable_name': 'vi_ctype',
+                                            'direction': 'in',
+                                            'documentation': {   'description': '\n'
+                                                                                'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                'None.\n',
+                                                                 'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                            'enum': None,
+                                            'is_buffer': False,
+                                            'is_repeated_capability': False,
+                                            'is_session_handle': True,
+                                            'is_string': False,
+                                            'library_method_call_snippet': 'vi_ctype',
+                                            'name': 'vi',
+                                            'numpy': False,
+                                            'numpy_into_return': False,
+                                            'python_name': 'vi',
+                                            'python_name_or_default_for_init': 'vi',
+                                            'python_name_with_default': 'vi',
+                                            'python_name_with_doc_default': 'vi',
+                                            'python_type': 'int',
+                                            'size': {'mechanism': 'fixed', 'value': 1},
+                                            'type': 'ViSession',
+                                            'use_array': False,
+                                            'use_in_python_api': True,
+                                            'use_list': False},
+                                        {   'ctypes_type': 'ViInt32',
+                                            'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                            'ctypes_variable_name': 'acquisition_backlog_ctype',
+                                            'direction': 'out',
+                                            'documentation': {   'description': '\n'
+                                                                                'The number of measurements available to be read. If the backlog\n'
+                                                                                'continues to increase, data is eventually overwritten, resulting in an\n'
+                                                                                'error.\n',
+                                                                 'note': '\n'
+                                                                         'On the NI 4060, the **Backlog** does not increase when autoranging. On\n'
+                                                                         'the NI 4065, the **Backlog** does not increase when Range is set to AUTO\n'
+                                                                         'RANGE ON (-1), or before the first point is fetched when Range is set to\n'
+                                                                         'AUTO RANGE ONCE (-3). These behaviors are due to the autorange model of\n'
+                                                                         'the devices.\n'},
+                                            'enum': None,
+                                            'is_buffer': False,
+                                            'is_repeated_capability': False,
+                                            'is_session_handle': False,
+                                            'is_string': False,
+                                            'library_method_call_snippet': 'None if acquisition_backlog_ctype is None else (ctypes.pointer(acquisition_backlog_ctype))',
+                                            'name': 'acquisitionBacklog',
+                                            'numpy': False,
+                                            'numpy_into_return': False,
+                                            'python_name': 'acquisition_backlog',
+                                            'python_name_or_default_for_init': 'acquisition_backlog',
+                                            'python_name_with_default': 'acquisition_backlog',
+                                            'python_name_with_doc_default': 'acquisition_backlog',
+                                            'python_type': 'int',
+                                            'size': {'mechanism': 'fixed', 'value': 1},
+                                            'type': 'ViInt32',
+                                            'use_array': False,
+                                            'use_in_python_api': True,
+                                            'use_list': False},
+                                        {   'ctypes_type': 'ViInt16',
+                                            'ctypes_type_library_call': 'ctypes.POINTER(ViInt16)',
+                                            'ctypes_variable_name': 'acquisition_status_ctype',
+                                            'direction': 'out',
+                                            'documentation': {   'description': '\nIndicates status of the acquisition. The following table shows the\nacquisition states:\n',
+                                                                 'table_body': [   ['0', 'Running'],
+                                                                                   ['1', 'Finished with backlog'],
+                                                                                   ['2', 'Finished with no backlog'],
+                                                                                   ['3', 'Paused'],
+                                                                                   ['4', 'No acquisition in progress']]},
+                                            'enum': 'AcquisitionStatus',
+                                            'is_buffer': False,
+                                            'is_repeated_capability': False,
+                                            'is_session_handle': False,
+                                            'is_string': False,
+                                            'library_method_call_snippet': 'None if acquisition_status_ctype is None else (ctypes.pointer(acquisition_status_ctype))',
+                                            'name': 'acquisitionStatus',
+                                            'numpy': False,
+                                            'numpy_into_return': False,
+                                            'python_name': 'acquisition_status',
+                                            'python_name_or_default_for_init': 'acquisition_status',
+                                            'python_name_with_default': 'acquisition_status',
+                                            'python_name_with_doc_default': 'acquisition_status',
+                                            'python_type': 'enums.AcquisitionStatus',
+                                            'size': {'mechanism': 'fixed', 'value': 1},
+                                            'type': 'ViInt16',
+                                            'use_array': False,
+                                            'use_in_python_api': True,
+                                            'use_list': False}],
+                      'python_code_variables': [],
+                      'python_name': 'read_status',
+                      'render_in_library': True,
+                      'render_in_session_base': False,
+                      'returns': 'ViStatus'},
+    'ReadWaveform': {   'blocking': True,
+                        'codegen_method': 'public',
+                        'documentation': {   'description': '\n'
+                                                            'For the NI 4080/4081/4082 and the NI 4070/4071/4072, acquires a waveform\n'
+                                                            'and returns data as an array of values or as a waveform data type. The\n'
+                                                            'number of elements in the **Waveform_Array** is determined by the\n'
+                                                            'values you specify for the **Waveform_Points** parameter in\n'
+                                                            'niDMM_ConfigureWaveformAcquisition.\n',
+                                             'note': [   '\n'
+                                                         'This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same '
+                                                         'session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the '
+                                                         "Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.\n"]},
+                        'has_repeated_capability': False,
+                        'invalidates_attribute_cache': False,
+                        'is_error_handling': False,
+                        'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                        'name': 'ReadWaveform',
+                        'parameters': [   {   'ctypes_type': 'ViSession',
+                                              'ctypes_type_library_call': 'ViSession',
+                                              'ctypes_variable_name': 'vi_ctype',
+                                              'direction': 'in',
+                                              'documentation': {   'description': '\n'
+                                                                                  'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                  'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                  'None.\n',
+                                                                   'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                              'enum': None,
+                                              'is_buffer': False,
+                                              'is_repeated_capability': False,
+                                              'is_session_handle': True,
+                                              'is_string': False,
+                                              'library_method_call_snippet': 'vi_ctype',
+                                              'name': 'vi',
+                                              'numpy': False,
+                                              'numpy_into_return': False,
+                                              'python_name': 'vi',
+                                              'python_name_or_default_for_init': 'vi',
+                                              'python_name_with_default': 'vi',
+                                              'python_name_with_doc_default': 'vi',
+                                              'python_type': 'int',
+                                              'size': {'mechanism': 'fixed', 'value': 1},
+                                              'type': 'ViSession',
+                                              'use_array': False,
+                                              'use_in_python_api': True,
+                                              'use_list': False},
+                                          {   'ctypes_type': 'ViInt32',
+                                              'ctypes_type_library_call': 'ViInt32',
+                                              'ctypes_variable_name': 'maximum_time_ctype',
+                                              'default_value': 'datetime.timedelta(milliseconds=-1)',
+                                              'direction': 'in',
+                                              'documentation': {   'description': '\n'
+                                                                                  'Specifies the **maximum_time** allowed for this function to complete in\n'
+                                                                                  'milliseconds. If the function does not complete within this time\n'
+                                                                                  'interval, the function returns the NIDMM_ERROR_MAX_TIME_EXCEEDED\n'
+                                                                                  'error code. This may happen if an external trigger has not been\n'
+                                                                                  'received, or if the specified timeout is not long enough for the\n'
+                                                                                  'acquisition to complete.\n'
+                                                                                  '\n'
+                                                                                  'The valid range is 0–86400000. The default value is\n'
+                                                                                  'NIDMM_VAL_TIME_LIMIT_AUTO (-1). The DMM calculates the timeout\n'
+                                                                                  'automatically.\n',
+                                                                   'note': [   '\n'
+                                                                               'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or '
+                                                                               'represent True/False, have been removed.\n']},
+                                              'enum': None,
+                                              'is_buffer': False,
+                                              'is_repeated_capability': False,
+                                              'is_session_handle': False,
+                                              'is_string': False,
+                                              'library_method_call_snippet': 'maximum_time_ctype',
+                                              'name': 'maximumTime',
+                                              'numpy': False,
+                                              'numpy_into_return': False,
+                                              'python_api_converter_name': 'convert_timedelta_to_milliseconds',
+                                              'python_api_converter_type': 'datetime.timedelta',
+                                              'python_name': 'maximum_time',
+                                              'python_name_or_default_for_init': '_converters.convert_timedelta_to_milliseconds(maximum_time, self._encoding)',
+                                              'python_name_with_default': 'maximum_time=datetime.timedelta(milliseconds=-1)',
+                                              'python_name_with_doc_default': "maximum_time='datetime.timedelta(milliseconds=-1)'",
+                                              'python_type': 'int',
+                                              'size': {'mechanism': 'fixed', 'value': 1},
+                                              'type': 'ViInt32',
+                                              'use_array': False,
+                                              'use_in_python_api': True,
+                                              'use_list': False},
+                                          {   'ctypes_type': 'ViInt32',
+                                              'ctypes_type_library_call': 'ViInt32',
+                                              'ctypes_variable_name': 'array_size_ctype',
+                                              'direction': 'in',
+                                              'documentation': {   'description': '\n'
+                                                                                  'Specifies the number of waveform points to return. You specify the total\n'
+                                                                                  'number of points that the DMM acquires in the **Waveform Points**\n'
+                                                                                  'parameter of niDMM_ConfigureWaveformAcquisition. The default value is\n'
+                                                                                  '1.\n'},
+                                              'enum': None,
+                                              'is_buffer': False,
+                                              'is_repeated_capability': False,
+                                              'is_session_handle': False,
+                                              'is_string': False,
+                                              'library_method_call_snippet': 'array_size_ctype',
+                                              'name': 'arraySize',
+                                              'numpy': False,
+                                              'numpy_into_return': False,
+                                              'python_name': 'array_size',
+                                              'python_name_or_default_for_init': 'array_size',
+                                              'python_name_with_default': 'array_size',
+                                              'python_name_with_doc_default': 'array_size',
+                                              'python_type': 'int',
+                                              'size': {'mechanism': 'fixed', 'value': 1},
+                                              'type': 'ViInt32',
+                                              'use_array': False,
+                                              'use_in_python_api': True,
+                                              'use_list': False},
+                                          {   'ctypes_type': 'ViReal64',
+                                              'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                              'ctypes_variable_name': 'waveform_array_ctype',
+                                              'direction': 'out',
+                                              'documentation': {   'description': 'An array of measurement values.',
+                                                                   'note': '\nThe size of the **Waveform_Array** must be at least the size that you\nspecify for the **Array_Size** parameter.\n'},
+                                              'enum': None,
+                                              'is_buffer': True,
+                                              'is_repeated_capability': False,
+                                              'is_session_handle': False,
+                                              'is_string': False,
+                                              'library_method_call_snippet': 'waveform_array_ctype',
+                                              'name': 'waveformArray',
+                                              'numpy': False,
+                                              'numpy_into_return': False,
+                                              'original_type': 'ViReal64[]',
+                                              'python_name': 'waveform_array',
+                                              'python_name_or_default_for_init': 'waveform_array',
+                                              'python_name_with_default': 'waveform_array',
+                                              'python_name_with_doc_default': 'waveform_array',
+                                              'python_type': 'float',
+                                              'size': {'mechanism': 'passed-in', 'value': 'arraySize'},
+                                              'type': 'ViReal64',
+                                              'use_array': True,
+                                              'use_in_python_api': True,
+                                              'use_list': False},
+                                          {   'ctypes_type': 'ViInt32',
+                                              'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                              'ctypes_variable_name': 'actual_number_of_points_ctype',
+                                              'direction': 'out',
+                                              'documentation': {'description': 'Indicates the number of measured values actually retrieved from the DMM.'},
+                                              'enum': None,
+                                              'is_buffer': False,
+                                              'is_repeated_capability': False,
+                                              'is_session_handle': False,
+                                              'is_string': False,
+                                              'library_method_call_snippet': 'None if actual_number_of_points_ctype is None else (ctypes.pointer(actual_number_of_points_ctype))',
+                                              'name': 'actualNumberOfPoints',
+                                              'numpy': False,
+                                              'numpy_into_return': False,
+                                              'python_name': 'actual_number_of_points',
+                                              'python_name_or_default_for_init': 'actual_number_of_points',
+                                              'python_name_with_default': 'actual_number_of_points',
+                                              'python_name_with_doc_default': 'actual_number_of_points',
+                                              'python_type': 'int',
+                                              'size': {'mechanism': 'fixed', 'value': 1},
+                                              'type': 'ViInt32',
+                                              'use_array': False,
+                                              'use_in_python_api': False,
+                                              'use_list': False}],
+                        'python_code_variables': [],
+                        'python_name': 'read_waveform',
+                        'render_in_library': True,
+                        'render_in_session_base': False,
+                        'returns': 'ViStatus'},
+    'ResetInterchangeCheck': {   'codegen_method': 'no',
+                                 'documentation': {   'description': '\n'
+                                                                     'When developing a complex test system that consists of multiple test\n'
+                                                                     'modules, it is generally a good idea to design the test modules so that\n'
+                                                                     'they can run in any order. To do so requires ensuring that each test\n'
+                                                                     'module completely configures the state of each instrument it uses.\n'
+                                                                     '\n'
+                                                                     'If a particular test module does not completely configure the state of\n'
+                                                                     'an instrument, the state of the instrument depends on the configuration\n'
+                                                                     'from a previously executed test module. If you execute the test modules\n'
+                                                                     'in a different order, the behavior of the instrument and therefore the\n'
+                                                                     'entire test module is likely to change. This change in behavior is\n'
+                                                                     'generally instrument specific and represents an interchangeability\n'
+                                                                     'problem. You can use this function to test for such cases. After you\n'
+                                                                     'call this function, the interchangeability checking algorithms in NI-DMM\n'
+                                                                     'ignore all previous configuration operations. By calling this function\n'
+                                                                     'at the beginning of a test module, you can determine whether the test\n'
+                                                                     'module has dependencies on the operation of previously executed test\n'
+                                                                     'modules.\n'
+                                                                     '\n'
+                                                                     'This function does not clear the interchangeability warnings from the\n'
+                                                                     'list of previously recorded interchangeability warnings. If you want to\n'
+                                                                     'guarantee that niDMM_GetNextInterchangeWarning only returns those\n'
+                                                                     'interchangeability warnings that are generated after calling this\n'
+                                                                     'function, you must clear the list of interchangeability warnings. You\n'
+                                                                     'can clear the interchangeability warnings list by repeatedly calling\n'
+                                                                     'niDMM_GetNextInterchangeWarning until no more interchangeability\n'
+                                                                     'warnings are returned. If you are not interested in the content of those\n'
+                                                                     'warnings, you can call niDMM_ClearInterchangeWarnings.\n',
+                                                      'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                 'parameters': [   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                           'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                           'None.\n',
+                                                                            'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                       'name': 'vi',
+                                                       'type': 'ViSession'}],
+                                 'returns': 'ViStatus'},
+    'ResetWithDefaults': {   'blocking': False,
+                             'codegen_method': 'public',
+                             'documentation': {   'description': '\n'
+                                                                 'Resets the instrument to a known state and sends initialization commands\n'
+                                                                 'to the DMM. The initialization commands set the DMM settings to the\n'
+                                                                 'state necessary for the operation of NI-DMM. All user-defined default\n'
+                                                                 'values associated with a logical name are applied after setting the DMM.\n'},
+                             'has_repeated_capability': False,
+                             'invalidates_attribute_cache': True,
+                             'is_error_handling': False,
+                             'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                             'name': 'ResetWithDefaults',
+                             'parameters': [   {   'ctypes_type': 'ViSession',
+                                                   'ctypes_type_library_call': 'ViSession',
+                                                   'ctypes_variable_name': 'vi_ctype',
+                                                   'direction': 'in',
+                                                   'documentation': {   'description': '\n'
+                                                                                       'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                       'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                       'None.\n',
+                                                                        'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                   'enum': None,
+                                                   'is_buffer': False,
+                                                   'is_repeated_capability': False,
+                                                   'is_session_handle': True,
+                                                   'is_string': False,
+                                                   'library_method_call_snippet': 'vi_ctype',
+                                                   'name': 'vi',
+                                                   'numpy': False,
+                                                   'numpy_into_return': False,
+                                                   'python_name': 'vi',
+                                                   'python_name_or_default_for_init': 'vi',
+                                                   'python_name_with_default': 'vi',
+                                                   'python_name_with_doc_default': 'vi',
+                                                   'python_type': 'int',
+                                                   'size': {'mechanism': 'fixed', 'value': 1},
+                                                   'type': 'ViSession',
+                                                   'use_array': False,
+                                                   'use_in_python_api': True,
+                                                   'use_list': False}],
+                             'python_code_variables': [],
+                             'python_name': 'reset_with_defaults',
+                             'render_in_library': True,
+                             'render_in_session_base': False,
+                             'returns': 'ViStatus'},
+    'RestoreLastExtCalConstants': {   'codegen_method': 'no',
+                                      'documentation': {   'description': '\n'
+                                                                          'Reverts the device to the calibration constants from the last complete\n'
+                                                                          'external calibration. This function recovers the hardware if a fatal\n'
+                                                                          'system error should occur during an external or self-calibration\n'
+                                                                          'procedure.\n'
+                                                                          '\n'
+                                                                          'After calling this function, you should call niDMM_SelfCal before\n'
+                                                                          'taking measurements with the device to adjust the device for any\n'
+                                                                          'temperature drifts since the last external calibration.\n',
+                                                           'note': 'The NI 4050, NI 4060, and NI 4080/4081/4082 are not supported.'},
+                                      'parameters': [   {   'direction': 'in',
+                                                            'documentation': {   'description': '\n'
+                                                                                                'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                                'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                                'None.\n',
+                                                                                 'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                            'name': 'vi',
+                                                            'type': 'ViSession'}],
+                                      'returns': 'ViStatus'},
+    'SelfCal': {   'blocking': True,
+                   'codegen_method': 'public',
+                   'documentation': {   'description': '\nFor the NI 4080/4081/4082 and the NI 4070/4071/4072, executes the\nself-calibration routine to maintain measurement accuracy.\n',
+                                        'note': [   '\n'
+                                                    'This function calls niDMM_reset, and any configurations previous to\n'
+                                                    'the call will be lost. All attributes will be set to their default\n'
+                                                    'values after the call returns.\n',
+                                                    '\n'
+                                                    'This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same '
+                                                    'session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the '
+                                                    "Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.\n"]},
+                   'has_repeated_capability': False,
+                   'invalidates_attribute_cache': True,
+                   'is_error_handling': False,
+                   'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                   'name': 'SelfCal',
+                   'parameters': [   {   'ctypes_type': 'ViSession',
+                                         'ctypes_type_library_call': 'ViSession',
+                                         'ctypes_variable_name': 'vi_ctype',
+                                         'direction': 'in',
+                                         'documentation': {   'description': '\n'
+                                                                             'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                             'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                             'None.\n',
+                                                              'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                         'enum': None,
+                                         'is_buffer': False,
+                                         'is_repeated_capability': False,
+                                         'is_session_handle': True,
+                                         'is_string': False,
+                                         'library_method_call_snippet': 'vi_ctype',
+                                         'name': 'vi',
+                                         'numpy': False,
+                                         'numpy_into_return': False,
+                                         'python_name': 'vi',
+                                         'python_name_or_default_for_init': 'vi',
+                                         'python_name_with_default': 'vi',
+                                         'python_name_with_doc_default': 'vi',
+                                         'python_type': 'int',
+                                         'size': {'mechanism': 'fixed', 'value': 1},
+                                         'type': 'ViSession',
+                                         'use_array': False,
+                                         'use_in_python_api': True,
+                                         'use_list': False}],
+                   'python_code_variables': [],
+                   'python_name': 'self_cal',
+                   'render_in_library': True,
+                   'render_in_session_base': False,
+                   'returns': 'ViStatus'},
+    'SendSoftwareTrigger': {   'blocking': False,
+                               'codegen_method': 'public',
+                               'documentation': {   'description': '\n'
+                                                                   'Sends a command to trigger the DMM. Call this function if you have\n'
+                                                                   'configured either the NIDMM_ATTR_TRIGGER_SOURCE or\n'
+                                                                   'NIDMM_ATTR_SAMPLE_TRIGGER attributes. If the\n'
+                                                                   'NIDMM_ATTR_TRIGGER_SOURCE and/or NIDMM_ATTR_SAMPLE_TRIGGER\n'
+                                                                   'attributes are set to NIDMM_VAL_EXTERNAL or NIDMM_VAL_TTL\\ *n*, you\n'
+                                                                   'can use this function to override the trigger source that you configured\n'
+                                                                   'and trigger the device. The NI 4050 and NI 4060 are not supported.\n',
+                                                    'note': [   '\n'
+                                                                'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or represent '
+                                                                'True/False, have been removed.\n']},
+                               'has_repeated_capability': False,
+                               'invalidates_attribute_cache': False,
+                               'is_error_handling': False,
+                               'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                               'name': 'SendSoftwareTrigger',
+                               'parameters': [   {   'ctypes_type': 'ViSession',
+                                                     'ctypes_type_library_call': 'ViSession',
+                                                     'ctypes_variable_name': 'vi_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                         'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                         'None.\n',
+                                                                          'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': True,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'vi_ctype',
+                                                     'name': 'vi',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'vi',
+                                                     'python_name_or_default_for_init': 'vi',
+                                                     'python_name_with_default': 'vi',
+                                                     'python_name_with_doc_default': 'vi',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViSession',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False}],
+                               'python_code_variables': [],
+                               'python_name': 'send_software_trigger',
+                               'render_in_library': True,
+                               'render_in_session_base': False,
+                               'returns': 'ViStatus'},
+    'SetAttributeViBoolean': {   'blocking': False,
+                                 'codegen_method': 'private',
+                                 'documentation': {   'description': '\n'
+                                                                     'This function sets the value of a ViBoolean attribute.\n'
+                                                                     '\n'
+                                                                     'This is a low-level function that you can use to set the values of\n'
+                                                                     'instrument-specific attributes and inherent IVI attributes.\n'
+                                                                     '\n'
+                                                                     'If the attribute represents an instrument state, this function performs\n'
+                                                                     'instrument I/O in the following cases:\n'
+                                                                     '\n'
+                                                                     '-  State caching is disabled for the entire session or for the\n'
+                                                                     '   particular attribute.\n'
+                                                                     '-  State caching is enabled, and the currently cached value is invalid\n'
+                                                                     '   or is different than the value you specify.\n'
+                                                                     '\n'
+                                                                     'This instrument driver contains high-level functions that set most of\n'
+                                                                     'the instrument attributes. It is best to use the high-level driver\n'
+                                                                     'functions as much as possible. They handle order dependencies and\n'
+                                                                     'multithread locking for you. In addition, they perform status checking\n'
+                                                                     'only after setting all of the attributes.\n'
+                                                                     '\n'
+                                                                     'In contrast, when you set multiple attributes using the SetAttribute\n'
+                                                                     'functions, the functions check the instrument status after each call.\n'
+                                                                     'Also, when state caching is enabled, the high-level functions that\n'
+                                                                     'configure multiple attributes perform instrument I/O only for the\n'
+                                                                     'attributes whose value you change. Thus, you can safely call the\n'
+                                                                     'high-level functions without the penalty of redundant instrument I/O.\n'},
+                                 'has_repeated_capability': True,
+                                 'invalidates_attribute_cache': True,
+                                 'is_error_handling': False,
+                                 'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                 'name': 'SetAttributeViBoolean',
+                                 'parameters': [   {   'ctypes_type': 'ViSession',
+                                                       'ctypes_type_library_call': 'ViSession',
+                                                       'ctypes_variable_name': 'vi_ctype',
+                                                       'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                           'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                           'None.\n',
+                                                                            'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': True,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'vi_ctype',
+                                                       'name': 'vi',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'vi',
+                                                       'python_name_or_default_for_init': 'vi',
+                                                       'python_name_with_default': 'vi',
+                                                       'python_name_with_doc_default': 'vi',
+                                                       'python_type': 'int',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViSession',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False},
+                                                   {   'ctypes_type': 'ViConstString',
+                                                       'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                       'ctypes_variable_name': 'channel_name_ctype',
+                                                       'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'This parameter is ignored. National Instruments DMMs do not support\n'
+                                                                                           'channel names since they only have a single channel. This parameter is\n'
+                                                                                           'included in order to support interchangeability and upgradability to\n'
+                                                                                           'multiple channel DMMs.\n'
+                                                                                           '\n'
+                                                                                           'The default value is " " (an empty string).\n'},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': True,
+                                                       'is_session_handle': False,
+                                                       'is_string': True,
+                                                       'library_method_call_snippet': 'channel_name_ctype',
+                                                       'name': 'channelName',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'channel_name',
+                                                       'python_name_or_default_for_init': 'channel_name',
+                                                       'python_name_with_default': 'channel_name',
+                                                       'python_name_with_doc_default': 'channel_name',
+                                                       'python_type': 'str',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViConstString',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False},
+                                                   {   'ctypes_type': 'ViAttr',
+                                                       'ctypes_type_library_call': 'ViAttr',
+                                                       'ctypes_variable_name': 'attribute_id_ctype',
+                                                       'direction': 'in',
+                                                       'documentation': {'description': 'Pass the ID of an attribute.'},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': False,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'attribute_id_ctype',
+                                                       'name': 'attributeId',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'attribute_id',
+                                                       'python_name_or_default_for_init': 'attribute_id',
+                                                       'python_name_with_default': 'attribute_id',
+                                                       'python_name_with_doc_default': 'attribute_id',
+                                                       'python_type': 'int',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViAttr',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False},
+                                                   {   'ctypes_type': 'ViBoolean',
+                                                       'ctypes_type_library_call': 'ViBoolean',
+                                                       'ctypes_variable_name': 'attribute_value_ctype',
+                                                       'direction': 'in',
+                                                       'documentation': {'description': 'Pass the value that you want to set the attribute to.'},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': False,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'attribute_value_ctype',
+                                                       'name': 'attributeValue',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'attribute_value',
+                                                       'python_name_or_default_for_init': 'attribute_value',
+                                                       'python_name_with_default': 'attribute_value',
+                                                       'python_name_with_doc_default': 'attribute_value',
+                                                       'python_type': 'bool',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViBoolean',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False}],
+                                 'python_code_variables': [],
+                                 'python_name': '_set_attribute_vi_boolean',
+                                 'render_in_library': True,
+                                 'render_in_session_base': True,
+                                 'returns': 'ViStatus'},
+    'SetAttributeViInt32': {   'blocking': False,
+                               'codegen_method': 'private',
+                               'documentation': {   'description': '\n'
+                                                                   'This function sets the value of a ViInt32 attribute.\n'
+                                                                   '\n'
+                                                                   'This is a low-level function that you can use to set the values of\n'
+                                                                   'instrument-specific attributes and inherent IVI attributes.\n'
+                                                                   '\n'
+                                                                   'If the attribute represents an instrument state, this function performs\n'
+                                                                   'instrument I/O in the following cases:\n'
+                                                                   '\n'
+                                                                   '-  State caching is disabled for the entire session or for the\n'
+                                                                   '   particular attribute.\n'
+                                                                   '-  State caching is enabled, and the currently cached value is invalid\n'
+                                                                   '   or is different than the value you specify.\n'
+                                                                   '\n'
+                                                                   'This instrument driver contains high-level functions that set most of\n'
+                                                                   'the instrument attributes. It is best to use the high-level driver\n'
+                                                                   'functions as much as possible. They handle order dependencies and\n'
+                                                                   'multithread locking for you. In addition, they perform status checking\n'
+                                                                   'only after setting all of the attributes.\n'
+                                                                   '\n'
+                                                                   'In contrast, when you set multiple attributes using the SetAttribute\n'
+                                                                   'functions, the functions check the instrument status after each call.\n'
+                                                                   'Also, when state caching is enabled, the high-level functions that\n'
+                                                                   'configure multiple attributes perform instrument I/O only for the\n'
+                                                                   'attributes whose value you change. Thus, you can safely call the\n'
+                                                                   'high-level functions without the penalty of redundant instrument I/O.\n'},
+                               'has_repeated_capability': True,
+                               'invalidates_attribute_cache': True,
+                               'is_error_handling': False,
+                               'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                               'name': 'SetAttributeViInt32',
+                               'parameters': [   {   'ctypes_type': 'ViSession',
+                                                     'ctypes_type_library_call': 'ViSession',
+                                                     'ctypes_variable_name': 'vi_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                         'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                         'None.\n',
+                                                                          'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': True,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'vi_ctype',
+                                                     'name': 'vi',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'vi',
+                                                     'python_name_or_default_for_init': 'vi',
+                                                     'python_name_with_default': 'vi',
+                                                     'python_name_with_doc_default': 'vi',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViSession',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViConstString',
+                                                     'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                     'ctypes_variable_name': 'channel_name_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'This parameter is ignored. National Instruments DMMs do not support\n'
+                                                                                         'channel names since they only have a single channel. This parameter is\n'
+                                                                                         'included in order to support interchangeability and upgradability to\n'
+                                                                                         'multiple channel DMMs.\n'
+                                                                                         '\n'
+                                                                                         'The default value is " " (an empty string).\n'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': True,
+                                                     'is_session_handle': False,
+                                                     'is_string': True,
+                                                     'library_method_call_snippet': 'channel_name_ctype',
+                                                     'name': 'channelName',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'channel_name',
+                                                     'python_name_or_default_for_init': 'channel_name',
+                                                     'python_name_with_default': 'channel_name',
+                                                     'python_name_with_doc_default': 'channel_name',
+                                                     'python_type': 'str',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViConstString',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViAttr',
+                                                     'ctypes_type_library_call': 'ViAttr',
+                                                     'ctypes_variable_name': 'attribute_id_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {'description': 'Pass the ID of an attribute.'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'attribute_id_ctype',
+                                                     'name': 'attributeId',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'attribute_id',
+                                                     'python_name_or_default_for_init': 'attribute_id',
+                                                     'python_name_with_default': 'attribute_id',
+                                                     'python_name_with_doc_default': 'attribute_id',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViAttr',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViInt32',
+                                                     'ctypes_type_library_call': 'ViInt32',
+                                                     'ctypes_variable_name': 'attribute_value_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {'description': 'Pass the value that you want to set the attribute to.'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'attribute_value_ctype',
+                                                     'name': 'attributeValue',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'attribute_value',
+                                                     'python_name_or_default_for_init': 'attribute_value',
+                                                     'python_name_with_default': 'attribute_value',
+                                                     'python_name_with_doc_default': 'attribute_value',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViInt32',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False}],
+                               'python_code_variables': [],
+                               'python_name': '_set_attribute_vi_int32',
+                               'render_in_library': True,
+                               'render_in_session_base': True,
+                               'returns': 'ViStatus'},
+    'SetAttributeViReal64': {   'blocking': False,
+                                'codegen_method': 'private',
+                                'documentation': {   'description': '\n'
+                                                                    'This function sets the value of a ViReal64 attribute.\n'
+                                                                    '\n'
+                                                                    'This is a low-level function that you can use to set the values of\n'
+                                                                    'instrument-specific attributes and inherent IVI attributes.\n'
+                                                                    '\n'
+                                                                    'If the attribute represents an instrument state, this function performs\n'
+                                                                    'instrument I/O in the following cases:\n'
+                                                                    '\n'
+                                                                    '-  State caching is disabled for the entire session or for the\n'
+                                                                    '   particular attribute.\n'
+                                                                    '-  State caching is enabled, and the currently cached value is invalid\n'
+                                                                    '   or is different than the value you specify.\n'
+                                                                    '\n'
+                                                                    'This instrument driver contains high-level functions that set most of\n'
+                                                                    'the instrument attributes. It is best to use the high-level driver\n'
+                                                                    'functions as much as possible. They handle order dependencies and\n'
+                                                                    'multithread locking for you. In addition, they perform status checking\n'
+                                                                    'only after setting all of the attributes.\n'
+                                                                    '\n'
+                                                                    'In contrast, when you set multiple attributes using the SetAttribute\n'
+                                                                    'functions, the functions check the instrument status after each call.\n'
+                                                                    'Also, when state caching is enabled, the high-level functions that\n'
+                                                                    'configure multiple attributes perform instrument I/O only for the\n'
+                                                                    'attributes whose value you change. Thus, you can safely call the\n'
+                                                                    'high-level functions without the penalty of redundant instrument I/O.\n'},
+                                'has_repeated_capability': True,
+                                'invalidates_attribute_cache': True,
+                                'is_error_handling': False,
+                                'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                'name': 'SetAttributeViReal64',
+                                'parameters': [   {   'ctypes_type': 'ViSession',
+                                                      'ctypes_type_library_call': 'ViSession',
+                                                      'ctypes_variable_name': 'vi_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                          'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                          'None.\n',
+                                                                           'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': True,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'vi_ctype',
+                                                      'name': 'vi',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'vi',
+                                                      'python_name_or_default_for_init': 'vi',
+                                                      'python_name_with_default': 'vi',
+                                                      'python_name_with_doc_default': 'vi',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViSession',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViConstString',
+                                                      'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                      'ctypes_variable_name': 'channel_name_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'This parameter is ignored. National Instruments DMMs do not support\n'
+                                                                                          'channel names since they only have a single channel. This parameter is\n'
+                                                                                          'included in order to support interchangeability and upgradability to\n'
+                                                                                          'multiple channel DMMs.\n'
+                                                                                          '\n'
+                                                                                          'The default value is " " (an empty string).\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': True,
+                                                      'is_session_handle': False,
+                                                      'is_string': True,
+                                                      'library_method_call_snippet': 'channel_name_ctype',
+                                                      'name': 'channelName',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'channel_name',
+                                                      'python_name_or_default_for_init': 'channel_name',
+                                                      'python_name_with_default': 'channel_name',
+                                                      'python_name_with_doc_default': 'channel_name',
+                                                      'python_type': 'str',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViConstString',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViAttr',
+                                                      'ctypes_type_library_call': 'ViAttr',
+                                                      'ctypes_variable_name': 'attribute_id_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {'description': 'Pass the ID of an attribute.'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'attribute_id_ctype',
+                                                      'name': 'attributeId',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'attribute_id',
+                                                      'python_name_or_default_for_init': 'attribute_id',
+                                                      'python_name_with_default': 'attribute_id',
+                                                      'python_name_with_doc_default': 'attribute_id',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViAttr',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViReal64',
+                                                      'ctypes_type_library_call': 'ViReal64',
+                                                      'ctypes_variable_name': 'attribute_value_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {'description': 'Pass the value that you want to set the attribute to.'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'attribute_value_ctype',
+                                                      'name': 'attributeValue',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'attribute_value',
+                                                      'python_name_or_default_for_init': 'attribute_value',
+                                                      'python_name_with_default': 'attribute_value',
+                                                      'python_name_with_doc_default': 'attribute_value',
+                                                      'python_type': 'float',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViReal64',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False}],
+                                'python_code_variables': [],
+                                'python_name': '_set_attribute_vi_real64',
+                                'render_in_library': True,
+                                'render_in_session_base': True,
+                                'returns': 'ViStatus'},
+    'SetAttributeViSession': {   'codegen_method': 'no',
+                                 'documentation': {   'description': '\n'
+                                                                     'This function sets the value of a ViSession attribute.\n'
+                                                                     '\n'
+                                                                     'This is a low-level function that you can use to set the values of\n'
+                                                                     'instrument-specific attributes and inherent IVI attributes.\n'
+                                                                     '\n'
+                                                                     'If the attribute represents an instrument state, this function performs\n'
+                                                                     'instrument I/O in the following cases:\n'
+                                                                     '\n'
+                                                                     '-  State caching is disabled for the entire session or for the\n'
+                                                                     '   particular attribute.\n'
+                                                                     '-  State caching is enabled, and the currently cached value is invalid\n'
+                                                                     '   or is different than the value you specify.\n'},
+                                 'invalidates_attribute_cache': True,
+                                 'parameters': [   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                           'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                           'None.\n',
+                                                                            'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                       'name': 'vi',
+                                                       'type': 'ViSession'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'This parameter is ignored. National Instruments DMMs do not support\n'
+                                                                                           'channel names since they only have a single channel. This parameter is\n'
+                                                                                           'included in order to support interchangeability and upgradability to\n'
+                                                                                           'multiple channel DMMs.\n'
+                                                                                           '\n'
+                                                                                           'The default value is " " (an empty string).\n'},
+                                                       'name': 'channelName',
+                                                       'type': 'ViConstString'},
+                                                   {'direction': 'in', 'documentation': {'description': 'Pass the ID of an attribute.'}, 'name': 'attributeId', 'type': 'ViAttr'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {'description': 'Pass the value that you want to set the attribute to.'},
+                                                       'name': 'attributeValue',
+                                                       'type': 'ViSession'}],
+                                 'returns': 'ViStatus'},
+    'SetAttributeViString': {   'blocking': False,
+                                'codegen_method': 'private',
+                                'documentation': {   'description': '\n'
+                                                                    'This function sets the value of a ViString attribute.\n'
+                                                                    '\n'
+                                                                    'This is a low-level function that you can use to set the values of\n'
+                                                                    'instrument-specific attributes and inherent IVI attributes.\n'
+                                                                    '\n'
+                                                                    'If the attribute represents an instrument state, this function performs\n'
+                                                                    'instrument I/O in the following cases:\n'
+                                                                    '\n'
+                                                                    '-  State caching is disabled for the entire session or for the\n'
+                                                                    '   particular attribute.\n'
+                                                                    '-  State caching is enabled, and the currently cached value is invalid\n'
+                                                                    '   or is different than the value you specify.\n'
+                                                                    '\n'
+                                                                    'This instrument driver contains high-level functions that set most of\n'
+                                                                    'the instrument attributes. It is best to use the high-level driver\n'
+                                                                    'functions as much as possible. They handle order dependencies and\n'
+                                                                    'multithread locking for you. In addition, they perform status checking\n'
+                                                                    'only after setting all of the attributes.\n'
+                                                                    '\n'
+                                                                    'In contrast, when you set multiple attributes using the SetAttribute\n'
+                                                                    'functions, the functions check the instrument status after each call.\n'
+                                                                    'Also, when state caching is enabled, the high-level functions that\n'
+                                                                    'configure multiple attributes perform instrument I/O only for the\n'
+                                                                    'attributes whose value you change. Thus, you can safely call the\n'
+                                                                    'high-level functions without the penalty of redundant instrument I/O.\n'},
+                                'has_repeated_capability': True,
+                                'invalidates_attribute_cache': True,
+                                'is_error_handling': False,
+                                'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                'name': 'SetAttributeViString',
+                                'parameters': [   {   'ctypes_type': 'ViSession',
+                                                      'ctypes_type_library_call': 'ViSession',
+                                                      'ctypes_variable_name': 'vi_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                          'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                          'None.\n',
+                                                                           'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': True,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'vi_ctype',
+                                                      'name': 'vi',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'vi',
+                                                      'python_name_or_default_for_init': 'vi',
+                                                      'python_name_with_default': 'vi',
+                                                      'python_name_with_doc_default': 'vi',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViSession',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViConstString',
+                                                      'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                      'ctypes_variable_name': 'channel_name_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'This parameter is ignored. National Instruments DMMs do not support\n'
+                                                                                          'channel names since they only have a single channel. This parameter is\n'
+                                                                                          'included in order to support interchangeability and upgradability to\n'
+                                                                                          'multiple channel DMMs.\n'
+                                                                                          '\n'
+                                                                                          'The default value is " " (an empty string).\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': True,
+                                                      'is_session_handle': False,
+                                                      'is_string': True,
+                                                      'library_method_call_snippet': 'channel_name_ctype',
+                                                      'name': 'channelName',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'channel_name',
+                                                      'python_name_or_default_for_init': 'channel_name',
+                                                      'python_name_with_default': 'channel_name',
+                                                      'python_name_with_doc_default': 'channel_name',
+                                                      'python_type': 'str',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViConstString',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViAttr',
+                                                      'ctypes_type_library_call': 'ViAttr',
+                                                      'ctypes_variable_name': 'attribute_id_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {'description': 'Pass the ID of an attribute.'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'attribute_id_ctype',
+                                                      'name': 'attributeId',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'attribute_id',
+                                                      'python_name_or_default_for_init': 'attribute_id',
+                                                      'python_name_with_default': 'attribute_id',
+                                                      'python_name_with_doc_default': 'attribute_id',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViAttr',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViChar[]',
+                                                      'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                      'ctypes_variable_name': 'attribute_value_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {'description': 'Pass the value that you want to set the attribute to.'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': True,
+                                                      'library_method_call_snippet': 'attribute_value_ctype',
+                                                      'name': 'attributeValue',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'attribute_value',
+                                                      'python_name_or_default_for_init': 'attribute_value',
+                                                      'python_name_with_default': 'attribute_value',
+                                                      'python_name_with_doc_default': 'attribute_value',
+                                                      'python_type': 'str',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViChar[]',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False}],
+                                'python_code_variables': [],
+                                'python_name': '_set_attribute_vi_string',
+                                'render_in_library': True,
+                                'render_in_session_base': True,
+                                'returns': 'ViStatus'},
+    'SetCalPassword': {   'codegen_method': 'no',
+                          'documentation': {   'description': '\n'
+                                                              'Changes the password required to enable external calibration\n'
+                                                              'functionality for the specified instrument. The maximum password string\n'
+                                                              'length is eight characters, excluding the termination character. "NI" is\n'
+                                                              'the default password.\n',
+                                               'note': '\n'
+                                                       'The NI 4050 and NI 4060 are not supported.\n'
+                                                       'A password is required for external calibration. Be sure to record the\n'
+                                                       'password in a secure location.\n'},
+                          'parameters': [   {   'direction': 'in',
+                                                'documentation': {   'description': '\n'
+                                                                                    'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                    'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                    'None.\n',
+                                                                     'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                'name': 'vi',
+                                                'type': 'ViSession'},
+                                            {   'direction': 'in',
+                                                'documentation': {   'description': '\n'
+                                                                                    'Specifies the current password required to enable external calibration\n'
+                                                                                    'functionality. The maximum password string length is eight characters,\n'
+                                                                                    'excluding the termination character.\n'},
+                                                'name': 'oldPassword',
+                                                'type': 'ViChar[ ]'},
+                                            {   'direction': 'in',
+                                                'documentation': {   'description': '\n'
+                                                                                    'Specifies the **new_password** required to enable external calibration\n'
+                                                                                    'functionality. The maximum password string length is eight characters,\n'
+                                                                                    'excluding the termination character.\n'},
+                                                'name': 'newPassword',
+                                                'type': 'ViChar[ ]'}],
+                          'returns': 'ViStatus'},
+    'SetCalUserDefinedInfo': {   'codegen_method': 'no',
+                                 'documentation': {   'description': '\n'
+                                                                     'Stores the user-defined information in the EEPROM. Use\n'
+                                                                     'niDMM_GetCalUserDefinedInfoMaxSize to learn the maximum string size\n'
+                                                                     'that is allowed. If the **Info** string size is larger than the maximum\n'
+                                                                     'string size, NI-DMM stores as much of the information as possible,\n'
+                                                                     'truncates the remainder, and returns a warning.\n',
+                                                      'note': ['The NI 4050 and NI 4060 are not supported.', '\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                 'parameters': [   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                           'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                           'None.\n',
+                                                                            'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                       'name': 'vi',
+                                                       'type': 'ViSession'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Specifies the user-defined information to be stored in the EEPROM such\n'
+                                                                                           'as the operator who performed the calibration operation or system\n'
+                                                                                           'information. Use niDMM_GetCalUserDefinedinfoMaxSize to learn the\n'
+                                                                                           'maximum string size that is allowed. If the **info** string size is\n'
+                                                                                           'larger than the maximum string size, NI-DMM stores as much of the\n'
+                                                                                           'information as possible, truncates the remainder, and return a warning.\n',
+                                                                            'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                       'name': 'Info',
+                                                       'type': 'ViChar[ ]'}],
+                                 'returns': 'ViStatus'},
+    'UnlockSession': {   'codegen_method': 'no',
+                         'documentation': {   'description': '\n'
+                                                             'This function releases a lock that you acquired on an instrument session\n'
+                                                             'using niDMM_LockSession. Refer to niDMM_LockSession for additional\n'
+                                                             'information on session locks.\n',
+                                              'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                         'parameters': [   {   'direction': 'in',
+                                               'documentation': {   'description': '\n'
+                                                                                   'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                   'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                   'None.\n',
+                                                                    'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                               'name': 'vi',
+                                               'type': 'ViSession'},
+                                           {   'direction': 'out',
+                                               'documentation': {   'description': '\n'
+                                                                                   'This parameter serves as a convenience. If you do not want to use this\n'
+                                                                                   'parameter, pass VI_NULL.\n'
+                                                                                   '\n'
+                                                                                   'Use this parameter in complex functions to keep track of whether you\n'
+                                                                                   'obtain a lock and, therefore, need to unlock the session.\n'
+                                                                                   '\n'
+                                                                                   'To use this parameter, complete the following steps:\n'
+                                                                                   '\n'
+                                                                                   '#. Pass the address of a local ViBoolean variable.\n'
+                                                                                   '#. In the declaration of the local variable, initialize it to VI_FALSE\n'
+                                                                                   '   (0).\n'
+                                                                                   '#. Pass the address of the same local variable to any other calls you\n'
+                                                                                   '   make to niDMM_LockSession or this function in the same function.\n'
+                                                                                   '\n'
+                                                                                   'The parameter is an input/output parameter. niDMM_LockSession and this\n'
+                                                                                   'function each inspect the current value and take the following actions:\n'
+                                                                                   '\n'
+                                                                                   'If the value is VI_TRUE (1), niDMM_LockSession does not lock the\n'
+                                                                                   'session again. If the value is VI_FALSE, niDMM_LockSession obtains the\n'
+                                                                                   'lock and sets the value of the parameter to VI_TRUE.\n'
+                                                                                   '\n'
+                                                                                   'If the value is VI_FALSE, this function does not attempt to unlock the\n'
+                                                                                   'session. If the value is VI_TRUE, this function releases the lock and\n'
+                                                                                   'sets the value of the parameter to VI_FALSE. Thus, you can, call this\n'
+                                                                                   'function at the end of your function without worrying about whether you\n'
+                                                                                   'actually have the lock.\n'
+                                                                                   '\n'
+                                                                                   '**Example**\n'
+                                                                                   '\n'
+                                                                                   'ViStatus TestFunc (ViSession vi, ViInt32 flags)\n'
+                                                                                   '\n'
+                                                                                   '{\n'
+                                                                                   '\n'
+                                                                                   'ViStatus error = VI_SUCCESS;\n'
+                                                                                   '\n'
+                                                                                   'ViBoolean haveLock = VI_FALSE;\n'
+                                                                                   '\n'
+                                                                                   'if (flags & BIT_1)\n'
+                                                                                   '\n'
+                                                                                   '{\n'
+                                                                                   '\n'
+                                                                                   'viCheckErr( NIDMM_LockSession(vi, &haveLock;));\n'
+                                                                                   '\n'
+                                                                                   'viCheckErr( TakeAction1(vi));\n'
+                                                                                   '\n'
+                                                                                   'if (flags & BIT_2)\n'
+                                                                                   '\n'
+                                                                                   '{\n'
+                                                                                   '\n'
+                                                                                   'viCheckErr( NIDMM_UnlockSession(vi, &haveLock;));\n'
+                                                                                   '\n'
+                                                                                   'viCheckErr( TakeAction2(vi));\n'
+                                                                                   '\n'
+                                                                                   'viCheckErr( NIDMM_LockSession(vi, &haveLock;);\n'
+                                                                                   '\n'
+                                                                                   '}\n'
+                                                                                   '\n'
+                                                                                   'if (flags & BIT_3)\n'
+                                                                                   '\n'
+                                                                                   'viCheckErr( TakeAction3(vi));\n'
+                                                                                   '\n'
+                                                                                   '}\n'
+                                                                                   '\n'
+                                                                                   'Error:\n'
+                                                                                   '\n'
+                                                                                   '/\\*\n'
+                                                                                   '\n'
+                                                                                   'At this point, you cannot really be sure that you have the lock.\n'
+                                                                                   'Fortunately, the haveLock variable takes care of that for you.\n'
+                                                                                   '\n'
+                                                                                   '\\*/\n'
+                                                                                   '\n'
+                                                                                   'niDMM_UnlockSession(vi, &haveLock;);\n'
+                                                                                   '\n'
+                                                                                   'return error;\n'
+                                                                                   '\n'
+                                                                                   '}\n',
+                                                                    'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                               'name': 'callerHasLock',
+                                               'type': 'ViBoolean'}],
+                         'returns': 'ViStatus'},
+    '_init_function': {   'blocking': False,
+                          'codegen_method': 'no',
+                          'documentation': {   'description': '\n'
+                                                              'This function completes the following tasks:\n'
+                                                              '\n'
+                                                              '-  Creates a new IVI instrument driver session and, optionally, sets the\n'
+                                                              '   initial state of the following session attributes:\n'
+                                                              '   NIDMM_ATTR_RANGE_CHECK, NIDMM_ATTR_QUERY_INSTR_STATUS,\n'
+                                                              '   NIDMM_ATTR_CACHE, NIDMM_ATTR_SIMULATE,\n'
+                                                              '   NIDMM_ATTR_RECORD_COERCIONS.\n'
+                                                              '-  Opens a session to the device you specify for the **Resource_Name**\n'
+                                                              '   parameter. If the **ID_Query** parameter is set to VI_TRUE, this\n'
+                                                              '   function queries the instrument ID and checks that it is valid for\n'
+                                                              '   this instrument driver.\n'
+                                                              '-  If the **Reset_Device** parameter is set to VI_TRUE, this function\n'
+                                                              '   resets the instrument to a known state. Sends initialization commands\n'
+                                                              '   to set the instrument to the state necessary for the operation of the\n'
+                                                              '   instrument driver.\n'
+                                                              '-  Returns a ViSession handle that you use to identify the instrument in\n'
+                                                              '   all subsequent instrument driver function calls.\n',
+                                               'note': ['\nOne or more of the referenced attributes are not in the Python API for this driver.\n']},
+                          'has_repeated_capability': False,
+                          'invalidates_attribute_cache': False,
+                          'is_error_handling': False,
+                          'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                          'name': 'InitWithOptions',
+                          'parameters': [   {   'ctypes_type': 'ViString',
+                                                'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                'ctypes_variable_name': 'resource_name_ctype',
+                                                'direction': 'in',
+                                                'documentation': {   'caution': '\n'
+                                                                                'All IVI names for the **Resource_Name**, such as logical names or\n'
+                                                                                'virtual names, are case-sensitive. If you use logical names, driver\n'
+                                                                                'session names, or virtual names in your program, you must make sure that\n'
+                                                                                'the name you use matches the name in the IVI Configuration Store file\n'
+                                                                                'exactly, without any variations in the case of the characters in the\n'
+                                                                                'name.\n',
+                                                                     'description': '\n'
+                                                                                    '| Contains the **resource_name** of the device to initialize. The\n'
+                                                                                    '  **resource_name** is assigned in Measurement & Automation Explorer\n'
+                                                                                    '  (MAX). Refer to `Related\n'
+                                                                                    '  Documentation <REPLACE_DRIVER_SPECIFIC_URL_1(related_documentation)>`__\n'
+                                                                                    '  for the *NI Digital Multimeters Getting Started Guide* for more\n'
+                                                                                    '  information about configuring and testing the DMM in MAX.\n'
+                                                                                    '| Valid Syntax:\n'
+                                                                                    '\n'
+                                                                                    '-  NI-DAQmx name\n'
+                                                                                    '-  DAQ::NI-DAQmx name[::INSTR]\n'
+                                                                                    '-  DAQ::Traditional NI-DAQ device number[::INSTR]\n'
+                                                                                    '-  IVI logical name\n'},
+                                                'enum': None,
+                                                'is_buffer': False,
+                                                'is_repeated_capability': False,
+                                                'is_session_handle': False,
+                                                'is_string': True,
+                                                'library_method_call_snippet': 'resource_name_ctype',
+                                                'name': 'resourceName',
+                                                'numpy': False,
+                                                'numpy_into_return': False,
+                                                'python_name': 'resource_name',
+                                                'python_name_or_default_for_init': 'resource_name',
+                                                'python_name_with_default': 'resource_name',
+                                                'python_name_with_doc_default': 'resource_name',
+                                                'python_type': 'str',
+                                                'size': {'mechanism': 'fixed', 'value': 1},
+                                                'type': 'ViString',
+                                                'use_array': False,
+                                                'use_in_python_api': True,
+                                                'use_list': False},
+                                            {   'ctypes_type': 'ViBoolean',
+                                                'ctypes_type_library_call': 'ViBoolean',
+                                                'ctypes_variable_name': 'id_query_ctype',
+                                                'default_value': False,
+                                                'direction': 'in',
+                                                'documentation': {   'description': '\n'
+                                                                                    'Verifies that the device you initialize is one that the driver supports.\n'
+                                                                                    'NI-DMM automatically performs this query, so setting this parameter is\n'
+                                                                                    'not necessary.\n'
+                                                                                    'Defined Values:\n',
+                                                                     'table_body': [['VI_TRUE (default)', '1', 'Perform ID Query'], ['VI_FALSE', '0', 'Skip ID Query']]},
+                                                'enum': None,
+                                                'is_buffer': False,
+                                                'is_repeated_capability': False,
+                                                'is_session_handle': False,
+                                                'is_string': False,
+                                                'library_method_call_snippet': 'id_query_ctype',
+                                                'name': 'idQuery',
+                                                'numpy': False,
+                                                'numpy_into_return': False,
+                                                'python_name': 'id_query',
+                                                'python_name_or_default_for_init': 'False',
+                                                'python_name_with_default': 'id_query=False',
+                                                'python_name_with_doc_default': 'id_query=False',
+                                                'python_type': 'bool',
+                                                'size': {'mechanism': 'fixed', 'value': 1},
+                                                'type': 'ViBoolean',
+                                                'use_array': False,
+                                                'use_in_python_api': False,
+                                                'use_list': False},
+                                            {   'ctypes_type': 'ViBoolean',
+                                                'ctypes_type_library_call': 'ViBoolean',
+                                                'ctypes_variable_name': 'reset_device_ctype',
+                                                'default_value': False,
+                                                'direction': 'in',
+                                                'documentation': {   'description': '\nSpecifies whether to reset the instrument during the initialization\nprocedure.\nDefined Values:\n',
+                                                                     'table_body': [['VI_TRUE (default)', '1', 'Reset Device'], ['VI_FALSE', '0', "Don't Reset"]]},
+                                                'enum': None,
+                                                'is_buffer': False,
+                                                'is_repeated_capability': False,
+                                                'is_session_handle': False,
+                                                'is_string': False,
+                                                'library_method_call_snippet': 'reset_device_ctype',
+                                                'name': 'resetDevice',
+                                                'numpy': False,
+                                                'numpy_into_return': False,
+                                                'python_name': 'reset_device',
+                                                'python_name_or_default_for_init': 'reset_device',
+                                                'python_name_with_default': 'reset_device=False',
+                                                'python_name_with_doc_default': 'reset_device=False',
+                                                'python_type': 'bool',
+                                                'size': {'mechanism': 'fixed', 'value': 1},
+                                                'type': 'ViBoolean',
+                                                'use_array': False,
+                                                'use_in_python_api': True,
+                                                'use_list': False},
+                                            {   'ctypes_type': 'ViString',
+                                                'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                'ctypes_variable_name': 'option_string_ctype',
+                                                'default_value': '""',
+                                                'direction': 'in',
+                                                'documentation': {   'description': '\n'
+                                                                                    'Specifies the initial value of certain attributes for the session. The\n'
+                                                                                    'syntax for **options** is a dictionary of attributes with an assigned\n'
+                                                                                    'value. For example:\n'
+                                                                                    '\n'
+                                                                                    "{ 'simulate': False }\n"
+                                                                                    '\n'
+                                                                                    'You do not have to specify a value for all the attributes. If you do not\n'
+                                                                                    'specify a value for an attribute, the default value is used.\n'
+                                                                                    '\n'
+                                                                                    'Advanced Example:\n'
+                                                                                    "{ 'simulate': True, 'driver_setup': { 'Model': '<model number>',  'BoardType': '<type>' } }\n",
+                                                                     'table_body': [   ['range_check', 'True'],
+                                                                                       ['query_instrument_status', 'False'],
+                                                                                       ['cache', 'True'],
+                                                                                       ['simulate', 'False'],
+                                                                                       ['record_value_coersions', 'False'],
+                                                                                       ['driver_setup', '{}']],
+                                                                     'table_header': ['Attribute', 'Default']},
+                                                'enum': None,
+                                                'is_buffer': False,
+                                                'is_repeated_capability': False,
+                                                'is_session_handle': False,
+                                                'is_string': True,
+                                                'library_method_call_snippet': 'option_string_ctype',
+                                                'name': 'optionString',
+                                                'numpy': False,
+                                                'numpy_into_return': False,
+                                                'python_api_converter_name': 'convert_init_with_options_dictionary',
+                                                'python_api_converter_type': 'dict',
+                                                'python_name': 'options',
+                                                'python_name_or_default_for_init': '_converters.convert_init_with_options_dictionary(option_string, self._encoding)',
+                                                'python_name_with_default': 'options={}',
+                                                'python_name_with_doc_default': 'option_string=\'""\'',
+                                                'python_type': 'str',
+                                                'size': {'mechanism': 'fixed', 'value': 1},
+                                                'type': 'ViString',
+                                                'use_array': False,
+                                                'use_in_python_api': True,
+                                                'use_list': False},
+                                            {   'ctypes_type': 'ViSession',
+                                                'ctypes_type_library_call': 'ctypes.POINTER(ViSession)',
+                                                'ctypes_variable_name': 'vi_ctype',
+                                                'direction': 'out',
+                                                'documentation': {'description': '\nA session object representing the device.\n'},
+                                                'enum': None,
+                                                'is_buffer': False,
+                                                'is_repeated_capability': False,
+                                                'is_session_handle': False,
+                                                'is_string': False,
+                                                'library_method_call_snippet': 'None if vi_ctype is None else (ctypes.pointer(vi_ctype))',
+                                                'name': 'vi',
+                                                'numpy': False,
+                                                'numpy_into_return': False,
+                                                'python_name': 'session',
+                                                'python_name_or_default_for_init': 'vi',
+                                                'python_name_with_default': 'vi',
+                                                'python_name_with_doc_default': 'vi',
+                                                'python_type': 'nidmm.Session',
+                                                'size': {'mechanism': 'fixed', 'value': 1},
+                                                'type': 'ViSession',
+                                                'use_array': False,
+                                                'use_in_python_api': True,
+                                                'use_list': False}],
+                          'python_code_variables': [],
+                          'python_name': '_init_with_options',
+                          'render_in_library': True,
+                          'render_in_session_base': False,
+                          'returns': 'ViStatus'},
+    'close': {   'blocking': False,
+                 'codegen_method': 'private',
+                 'documentation': {'description': 'Closes the specified session and deallocates resources that it reserved.'},
+                 'has_repeated_capability': False,
+                 'invalidates_attribute_cache': False,
+                 'is_error_handling': False,
+                 'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                 'name': 'close',
+                 'parameters': [   {   'ctypes_type': 'ViSession',
+                                       'ctypes_type_library_call': 'ViSession',
+                                       'ctypes_variable_name': 'vi_ctype',
+                                       'direction': 'in',
+                                       'documentation': {   'description': '\n'
+                                                                           'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                           'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                           'None.\n',
+                                                            'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                       'enum': None,
+                                       'is_buffer': False,
+                                       'is_repeated_capability': False,
+                                       'is_session_handle': True,
+                                       'is_string': False,
+                                       'library_method_call_snippet': 'vi_ctype',
+                                       'name': 'vi',
+                                       'numpy': False,
+                                       'numpy_into_return': False,
+                                       'python_name': 'vi',
+                                       'python_name_or_default_for_init': 'vi',
+                                       'python_name_with_default': 'vi',
+                                       'python_name_with_doc_default': 'vi',
+                                       'python_type': 'int',
+                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                       'type': 'ViSession',
+                                       'use_array': False,
+                                       'use_in_python_api': True,
+                                       'use_list': False}],
+                 'python_code_variables': [],
+                 'python_name': '_close',
+                 'render_in_library': True,
+                 'render_in_session_base': False,
+                 'returns': 'ViStatus'},
+    'error_message': {   'blocking': False,
+                         'codegen_method': 'private',
+                         'documentation': {'description': '\nTakes the **Error_Code** returned by the instrument driver functions,\ninterprets it, and returns it as a user-readable string.\n'},
+                         'has_repeated_capability': False,
+                         'invalidates_attribute_cache': False,
+                         'is_error_handling': True,
+                         'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                         'name': 'error_message',
+                         'parameters': [   {   'ctypes_type': 'ViSession',
+                                               'ctypes_type_library_call': 'ViSession',
+                                               'ctypes_variable_name': 'vi_ctype',
+                                               'direction': 'in',
+                                               'documentation': {   'description': '\n'
+                                                                                   'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                   'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                   'None.\n',
+                                                                    'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                               'enum': None,
+                                               'is_buffer': False,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': True,
+                                               'is_string': False,
+                                               'library_method_call_snippet': 'vi_ctype',
+                                               'name': 'vi',
+                                               'numpy': False,
+                                               'numpy_into_return': False,
+                                               'python_name': 'vi',
+                                               'python_name_or_default_for_init': 'vi',
+                                               'python_name_with_default': 'vi',
+                                               'python_name_with_doc_default': 'vi',
+                                               'python_type': 'int',
+                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                               'type': 'ViSession',
+                                               'use_array': False,
+                                               'use_in_python_api': True,
+                                               'use_list': False},
+                                           {   'ctypes_type': 'ViStatus',
+                                               'ctypes_type_library_call': 'ViStatus',
+                                               'ctypes_variable_name': 'error_code_ctype',
+                                               'direction': 'in',
+                                               'documentation': {'description': '\nThe **error_code** returned from the instrument. The default is 0,\nindicating VI_SUCCESS.\n'},
+                                               'enum': None,
+                                               'is_buffer': False,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': False,
+                                               'is_string': False,
+                                               'library_method_call_snippet': 'error_code_ctype',
+                                               'name': 'errorCode',
+                                               'numpy': False,
+                                               'numpy_into_return': False,
+                                               'python_name': 'error_code',
+                                               'python_name_or_default_for_init': 'error_code',
+                                               'python_name_with_default': 'error_code',
+                                               'python_name_with_doc_default': 'error_code',
+                                               'python_type': 'int',
+                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                               'type': 'ViStatus',
+                                               'use_array': False,
+                                               'use_in_python_api': True,
+                                               'use_list': False},
+                                           {   'ctypes_type': 'ViChar[]',
+                                               'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                               'ctypes_variable_name': 'error_message_ctype',
+                                               'direction': 'out',
+                                               'documentation': {'description': 'The error information formatted into a string.'},
+                                               'enum': None,
+                                               'is_buffer': False,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': False,
+                                               'is_string': True,
+                                               'library_method_call_snippet': 'error_message_ctype',
+                                               'name': 'errorMessage',
+                                               'numpy': False,
+                                               'numpy_into_return': False,
+                                               'python_name': 'error_message',
+                                               'python_name_or_default_for_init': 'error_message',
+                                               'python_name_with_default': 'error_message',
+                                               'python_name_with_doc_default': 'error_message',
+                                               'python_type': 'str',
+                                               'size': {'mechanism': 'fixed', 'value': 256},
+                                               'type': 'ViChar[]',
+                                               'use_array': False,
+                                               'use_in_python_api': True,
+                                               'use_list': False}],
+                         'python_code_variables': [],
+                         'python_name': '_error_message',
+                         'render_in_library': True,
+                         'render_in_session_base': True,
+                         'returns': 'ViStatus'},
+    'error_query': {   'codegen_method': 'no',
+                       'documentation': {   'description': '\n'
+                                                           'Reads an **Error_Code** and message from the DMM error queue. National\n'
+                                                           'Instruments DMMs do not contain an error queue. Errors are reported as\n'
+                                                           'they occur. Therefore, this function does not detect errors; it is\n'
+                                                           'included for compliance with the *IviDmm Class Specification*.\n'},
+                       'parameters': [   {   'direction': 'in',
+                                             'documentation': {   'description': '\n'
+                                                                                 'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                 'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                 'None.\n',
+                                                                  'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                             'name': 'vi',
+                                             'type': 'ViSession'},
+                                         {   'direction': 'out',
+                                             'documentation': {'description': '\nThe **error_code** returned from the instrument.\n\nThe default value is VI_SUCCESS (0).\n'},
+                                             'name': 'errorCode',
+                                             'type': 'ViStatus'},
+                                         {   'direction': 'out',
+                                             'documentation': {   'description': 'Formats the **Error_Code** into a user-readable message string.',
+                                                                  'note': 'The array must contain at least 256 elements ViChar[256].'},
+                                             'name': 'errorMessage',
+                                             'type': 'ViChar[ ]'}],
+                       'returns': 'ViStatus'},
+    'init': {   'codegen_method': 'no',
+                'documentation': {   'description': '\n'
+                                                    'This function completes the following tasks:\n'
+                                                    '\n'
+                                                    '-  Creates a new IVI instrument driver session.\n'
+                                                    '-  Opens a session to the device you specify for the **Resource_Name**\n'
+                                                    '   parameter.\n'
+                                                    '\n'
+                                                    '-  If the **ID_Query** parameter is set to VI_TRUE (1), this function\n'
+                                                    '   queries the instrument ID and checks that it is valid for this\n'
+                                                    '   instrument driver.\n'
+                                                    '\n'
+                                                    '-  If the **Reset_Device** parameter is set to VI_TRUE (1), this\n'
+                                                    '   function resets the instrument to a known state. Sends initialization\n'
+                                                    '   commands to set the instrument to the state necessary for the\n'
+                                                    '   operation of the instrument driver.\n'
+                                                    '\n'
+                                                    '-  Returns a ViSession handle that you use to identify the instrument in\n'
+                                                    '   all subsequent instrument driver function calls.\n'},
+                'parameters': [   {   'direction': 'in',
+                                      'documentation': {   'caution': '\n'
+                                                                      'All IVI names for the **Resource_Name**, such as logical names or\n'
+                                                                      'virtual names, are case-sensitive. If you use logical names, driver\n'
+                                                                      'session names, or virtual names in your program, you must make sure that\n'
+                                                                      'the name you use matches the name in the IVI Configuration Store file\n'
+                                                                      'exactly, without any variations in the case of the characters in the\n'
+                                                                      'name.\n',
+                                                           'description': '\n'
+                                                                          '| Contains the **resource_name** of the device to initialize. The\n'
+                                                                          '  **resource_name** is assigned in Measurement & Automation Explorer\n'
+                                                                          '  (MAX). Refer to `Related\n'
+                                                                          '  Documentation <REPLACE_DRIVER_SPECIFIC_URL_1(related_documentation)>`__\n'
+                                                                          '  for the *NI Digital Multimeters Getting Started Guide* for more\n'
+                                                                          '  information about configuring and testing the DMM in MAX.\n'
+                                                                          '| Valid Syntax:\n'
+                                                                          '\n'
+                                                                          '-  NI-DAQmx name\n'
+                                                                          '-  DAQ::NI-DAQmx name[::INSTR]\n'
+                                                                          '-  DAQ::Traditional NI-DAQ device number[::INSTR]\n'
+                                                                          '-  IVI logical name\n'},
+                                      'name': 'resourceName',
+                                      'type': 'ViString'},
+                                  {   'direction': 'in',
+                                      'documentation': {   'description': '\n'
+                                                                          'Verifies that the device you initialize is one that the driver supports.\n'
+                                                                          'NI-DMM automatically performs this query, so setting this parameter is\n'
+                                                                          'not necessary.\n'
+                                                                          'Defined Values:\n',
+                                                           'table_body': [['VI_TRUE (default)', '1', 'Perform ID Query'], ['VI_FALSE', '0', 'Skip ID Query']]},
+                                      'name': 'idQuery',
+                                      'type': 'ViBoolean'},
+                                  {   'direction': 'in',
+                                      'documentation': {   'description': '\nSpecifies whether to reset the instrument during the initialization\nprocedure.\nDefined Values:\n',
+                                                           'table_body': [['VI_TRUE (default)', '1', 'Reset Device'], ['VI_FALSE', '0', "Don't Reset"]]},
+                                      'name': 'resetDevice',
+                                      'type': 'ViBoolean'},
+                                  {   'direction': 'out',
+                                      'documentation': {'description': '\nReturns a ViSession handle that you use to identify the instrument in\nall subsequent instrument driver function calls.\n'},
+                                      'name': 'vi',
+                                      'type': 'ViSession'}],
+                'returns': 'ViStatus'},
+    'reset': {   'blocking': False,
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Resets the instrument to a known state and sends initialization commands\n'
+                                                     'to the instrument. The initialization commands set instrument settings\n'
+                                                     'to the state necessary for the operation of the instrument driver.\n'},
+                 'has_repeated_capability': False,
+                 'invalidates_attribute_cache': True,
+                 'is_error_handling': False,
+                 'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                 'name': 'reset',
+                 'parameters': [   {   'ctypes_type': 'ViSession',
+                                       'ctypes_type_library_call': 'ViSession',
+                                       'ctypes_variable_name': 'vi_ctype',
+                                       'direction': 'in',
+                                       'documentation': {   'description': '\n'
+                                                                           'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                           'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                           'None.\n',
+                                                            'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                       'enum': None,
+                                       'is_buffer': False,
+                                       'is_repeated_capability': False,
+                                       'is_session_handle': True,
+                                       'is_string': False,
+                                       'library_method_call_snippet': 'vi_ctype',
+                                       'name': 'vi',
+                                       'numpy': False,
+                                       'numpy_into_return': False,
+                                       'python_name': 'vi',
+                                       'python_name_or_default_for_init': 'vi',
+                                       'python_name_with_default': 'vi',
+                                       'python_name_with_doc_default': 'vi',
+                                       'python_type': 'int',
+                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                       'type': 'ViSession',
+                                       'use_array': False,
+                                       'use_in_python_api': True,
+                                       'use_list': False}],
+                 'python_code_variables': [],
+                 'python_name': 'reset',
+                 'render_in_library': True,
+                 'render_in_session_base': False,
+                 'returns': 'ViStatus'},
+    'revision_query': {   'codegen_method': 'no',
+                          'documentation': {'description': '\nReturns the revision numbers of the instrument driver and instrument\nfirmware.\n'},
+                          'parameters': [   {   'direction': 'in',
+                                                'documentation': {   'description': '\n'
+                                                                                    'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                                    'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                                    'None.\n',
+                                                                     'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                'name': 'vi',
+                                                'type': 'ViSession'},
+                                            {   'direction': 'out',
+                                                'documentation': {   'description': '\nReturns a string containing the instrument driver software revision\nnumbers.\n',
+                                                                     'note': 'The array must contain at least 256 elements ViChar[256].'},
+                                                'name': 'instrumentDriverRevision',
+                                                'type': 'ViChar[ ]'},
+                                            {   'direction': 'out',
+                                                'documentation': {   'description': '\nReturns a string containing the instrument **firmware_revision**\nnumbers.\n',
+                                                                     'note': 'The array must contain at least 256 elements ViChar[256].'},
+                                                'name': 'firmwareRevision',
+                                                'type': 'ViChar[ ]'}],
+                          'returns': 'ViStatus'},
+    'self_test': {   'blocking': True,
+                     'codegen_method': 'public',
+                     'documentation': {   'description': '\nPerforms a self-test on the DMM to ensure that the DMM is functioning\nproperly. Self-test does not calibrate the DMM.\n',
+                                          'note': [   '\n'
+                                                      'This function calls niDMM_reset, and any configurations previous to\n'
+                                                      'the call will be lost. All attributes will be set to their default\n'
+                                                      'values after the call returns.\n',
+                                                      '\n'
+                                                      'This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same '
+                                                      'session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the '
+                                                      "Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.\n"]},
+                     'has_repeated_capability': False,
+                     'invalidates_attribute_cache': True,
+                     'is_error_handling': False,
+                     'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                     'name': 'self_test',
+                     'parameters': [   {   'ctypes_type': 'ViSession',
+                                           'ctypes_type_library_call': 'ViSession',
+                                           'ctypes_variable_name': 'vi_ctype',
+                                           'direction': 'in',
+                                           'documentation': {   'description': '\n'
+                                                                               'Identifies a particular instrument session. You obtain the **vi**\n'
+                                                                               'parameter from niDMM_init or niDMM_InitWithOptions. The default is\n'
+                                                                               'None.\n',
+                                                                'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                           'enum': None,
+                                           'is_buffer': False,
+                                           'is_repeated_capability': False,
+                                           'is_session_handle': True,
+                                           'is_string': False,
+                                           'library_method_call_snippet': 'vi_ctype',
+                                           'name': 'vi',
+                                           'numpy': False,
+                                           'numpy_into_return': False,
+                                           'python_name': 'vi',
+                                           'python_name_or_default_for_init': 'vi',
+                                           'python_name_with_default': 'vi',
+                                           'python_name_with_doc_default': 'vi',
+                                           'python_type': 'int',
+                                           'size': {'mechanism': 'fixed', 'value': 1},
+                                           'type': 'ViSession',
+                                           'use_array': False,
+                                           'use_in_python_api': True,
+                                           'use_list': False},
+                                       {   'ctypes_type': 'ViInt16',
+                                           'ctypes_type_library_call': 'ctypes.POINTER(ViInt16)',
+                                           'ctypes_variable_name': 'self_test_result_ctype',
+                                           'direction': 'out',
+                                           'documentation': {   'description': '\n'
+                                                                               'Contains the value returned from the instrument self-test. Zero\n'
+                                                                               'indicates success.\n'
+                                                                               '\n'
+                                                                               'On the NI 4080/4082 and NI 4070/4072, the error code 1013 indicates that\n'
+                                                                               'you should check the fuse and replace it, if necessary.\n',
+                                                                'note': '\n'
+                                                                        'Self-test does not check the fuse on the NI 4065, NI 4071, and\n'
+                                                                        'NI 4081. Hence, even if the fuse is blown on the device, self-test does\n'
+                                                                        'not return error code 1013.\n'},
+                                           'enum': None,
+                                           'is_buffer': False,
+                                           'is_repeated_capability': False,
+                                           'is_session_handle': False,
+                                           'is_string': False,
+                                           'library_method_call_snippet': 'None if self_test_result_ctype is None else (ctypes.pointer(self_test_result_ctype))',
+                                           'name': 'selfTestResult',
+                                           'numpy': False,
+                                           'numpy_into_return': False,
+                                           'python_name': 'self_test_result',
+                                           'python_name_or_default_for_init': 'self_test_result',
+                                           'python_name_with_default': 'self_test_result',
+                                           'python_name_with_doc_default': 'self_test_result',
+                                           'python_type': 'int',
+                                           'size': {'mechanism': 'fixed', 'value': 1},
+                                           'type': 'ViInt16',
+                                           'use_array': False,
+                                           'use_in_python_api': True,
+                                           'use_list': False},
+                                       {   'ctypes_type': 'ViChar[]',
+                                           'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                           'ctypes_variable_name': 'self_test_message_ctype',
+                                           'direction': 'out',
+                                           'documentation': {   'description': '\n'
+                                                                               'This parameter contains the string returned from the instrument\n'
+                                                                               'self-test. The array must contain at least 256 elements.\n'
+                                                                               '\n'
+                                                                               'For the NI 4050 and NI 4060, the error codes returned for self-test\n'
+                                                                               'failures include the following:\n'
+                                                                               '\n'
+                                                                               '-  NIDMM_ERROR_AC_TEST_FAILURE\n'
+                                                                               '-  NIDMM_ERROR_DC_TEST_FAILURE\n'
+                                                                               '-  NIDMM_ERROR_RESISTANCE_TEST_FAILURE\n'
+                                                                               '\n'
+                                                                               'These error codes indicate that the DMM should be repaired.\n'
+                                                                               '\n'
+                                                                               'For the NI 4080/4081/4082 and the NI 4070/4071/4072, the error code\n'
+                                                                               'returned for a self-test failure is NIDMM_ERROR_SELF_TEST_FAILURE.\n'
+                                                                               'This error code indicates that the DMM should be repaired.\n'},
+                                           'enum': None,
+                                           'is_buffer': False,
+                                           'is_repeated_capability': False,
+                                           'is_session_handle': False,
+                                           'is_string': True,
+                                           'library_method_call_snippet': 'self_test_message_ctype',
+                                           'name': 'selfTestMessage',
+                                           'numpy': False,
+                                           'numpy_into_return': False,
+                                           'python_name': 'self_test_message',
+                                           'python_name_or_default_for_init': 'self_test_message',
+                                           'python_name_with_default': 'self_test_message',
+                                           'python_name_with_doc_default': 'self_test_message',
+                                           'python_type': 'str',
+                                           'size': {'mechanism': 'fixed', 'value': 256},
+                                           'type': 'ViChar[]',
+                                           'use_array': False,
+                                           'use_in_python_api': True,
+                                           'use_list': False}],
+                     'python_code_variables': [],
+                     'python_name': 'self_test',
+                     'render_in_library': True,
+                     'render_in_session_base': False,
+                     'returns': 'ViStatus'}}
\ No newline at end of file
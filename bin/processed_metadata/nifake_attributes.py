@@ -0,0 +1,118 @@
+attributes =
+{   1000000: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': 'An attribute of type bool with read/write access.'},
+                 'enum': None,
+                 'lv_property': 'Fake attributes:Read Write Bool',
+                 'name': 'READ_WRITE_BOOL',
+                 'python_name': 'read_write_bool',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1000001: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': 'An attribute of type float with read/write access.'},
+                 'enum': None,
+                 'lv_property': 'Fake attributes:Read Write Float',
+                 'name': 'READ_WRITE_DOUBLE',
+                 'python_name': 'read_write_double',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1000002: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': 'An attribute of type string with read/write access.'},
+                 'enum': None,
+                 'lv_property': 'Fake attributes:Read Write String',
+                 'name': 'READ_WRITE_STRING',
+                 'python_name': 'read_write_string',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1000003: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': 'An attribute of type Color with read/write access.'},
+                 'enum': 'Color',
+                 'lv_property': 'Fake attributes:Read Write Color',
+                 'name': 'READ_WRITE_COLOR',
+                 'python_name': 'read_write_color',
+                 'python_type': 'enums.Color',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1000004: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': 'An attribute of type integer with read/write access.'},
+                 'enum': None,
+                 'lv_property': 'Fake attributes:Read Write Int',
+                 'name': 'READ_WRITE_INTEGER',
+                 'python_name': 'read_write_integer',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1000005: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': 'An attribute with an enum that is also a float'},
+                 'enum': 'FloatEnum',
+                 'lv_property': 'Fake attributes:Float enum',
+                 'name': 'FLOAT_ENUM',
+                 'python_name': 'float_enum',
+                 'python_type': 'enums.FloatEnum',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1000006: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt64',
+                 'cacheable': False,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': 'An attribute of type 64-bit integer with read/write access.'},
+                 'enum': None,
+                 'lv_property': 'Fake attributes:Read Write long long',
+                 'name': 'READ_WRITE_INT64',
+                 'python_name': 'read_write_int64',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt64'},
+    1000007: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64TimeDeltaSeconds',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': 'Attribute in seconds'},
+                 'enum': None,
+                 'lv_property': 'Fake attributes:Read Write Double with Converter',
+                 'name': 'READ_WRITE_DOUBLE_WITH_CONVERTER',
+                 'python_name': 'read_write_double_with_converter',
+                 'python_type': 'datetime.timedelta',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1000008: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32TimeDeltaMilliseconds',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': 'Attribute in milliseconds'},
+                 'enum': None,
+                 'lv_property': 'Fake attributes:Read Write Int with Converter',
+                 'name': 'READ_WRITE_INTEGER_WITH_CONVERTER',
+                 'python_name': 'read_write_integer_with_converter',
+                 'python_type': 'datetime.timedelta',
+                 'resettable': 'No',
+                 'type': 'ViInt32'}}
\ No newline at end of file
@@ -0,0 +1,20 @@
+enums =
+{   'Color': {   'codegen_method': 'public',
+                 'python_name': 'Color',
+                 'values': [   {'documentation': {'description': 'Like blood.'}, 'name': 'NIFAKE_VAL_RED', 'python_name': 'RED', 'value': 1},
+                               {'documentation': {'description': 'Like the sky.'}, 'name': 'NIFAKE_VAL_BLUE', 'python_name': 'BLUE', 'value': 2},
+                               {'documentation': {'description': 'Like a banana.'}, 'name': 'NIFAKE_VAL_YELLOW', 'python_name': 'YELLOW', 'value': 2},
+                               {'documentation': {'description': "Like this developer's conscience."}, 'name': 'NIFAKE_VAL_BLACK', 'python_name': 'BLACK', 'value': 2}]},
+    'FloatEnum': {   'codegen_method': 'public',
+                     'python_name': 'FloatEnum',
+                     'values': [   {'documentation': {'description': 'Specifies 3.5 digits resolution.'}, 'name': 'NIFAKE_VAL_THREE_POINT_FIVE', 'python_name': 'THREE_POINT_FIVE', 'value': 3.5},
+                                   {'documentation': {'description': 'Specifies 4.5 digits resolution.'}, 'name': 'NIFAKE_VAL_FOUR_POINT_FIVE', 'python_name': 'FOUR_POINT_FIVE', 'value': 4.5},
+                                   {'documentation': {'description': 'Specifies 5.5 digits resolution.'}, 'name': 'NIFAKE_VAL_FIVE_POINT_FIVE', 'python_name': 'FIVE_POINT_FIVE', 'value': 5.5},
+                                   {'documentation': {'description': 'Specifies 6.5 digits resolution.'}, 'name': 'NIFAKE_VAL_SIX_POINT_FIVE', 'python_name': 'SIX_POINT_FIVE', 'value': 6.5},
+                                   {'documentation': {'description': 'Specifies 7.5 digits resolution.'}, 'name': 'NIFAKE_VAL_SEVEN_POINT_FIVE', 'python_name': 'SEVEN_POINT_FIVE', 'value': 7.5}]},
+    'Turtle': {   'codegen_method': 'public',
+                  'python_name': 'Turtle',
+                  'values': [   {'documentation': {'description': 'Wields two katanas.'}, 'name': 'NIFAKE_VAL_LEONARDO', 'python_name': 'LEONARDO', 'value': 0},
+                                {'documentation': {'description': 'Uses a bo staff.'}, 'name': 'NIFAKE_VAL_DONATELLO', 'python_name': 'DONATELLO', 'value': 1},
+                                {'documentation': {'description': 'Has a pair of sai.'}, 'name': 'NIFAKE_VAL_RAPHAEL', 'python_name': 'RAPHAEL', 'value': 2},
+                                {'documentation': {'description': 'Owns nunchucks.'}, 'name': 'NIFAKE_VAL_MICHELANGELO', 'python_name': 'MICHELANGELO', 'value': 3}]}}
\ No newline at end of file
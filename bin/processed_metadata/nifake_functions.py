@@ -0,0 +1,4702 @@
+function =
+{   'Abort': {   'blocking': False,
+                 'codegen_method': 'public',
+                 'documentation': {'description': 'Aborts a previously initiated thingie.'},
+                 'has_repeated_capability': False,
+                 'invalidates_attribute_cache': False,
+                 'is_error_handling': False,
+                 'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                 'name': 'Abort',
+                 'parameters': [   {   'ctypes_type': 'ViSession',
+                                       'ctypes_type_library_call': 'ViSession',
+                                       'ctypes_variable_name': 'vi_ctype',
+                                       'direction': 'in',
+                                       'documentation': {'description': 'Identifies a particular instrument session.'},
+                                       'enum': None,
+                                       'is_buffer': False,
+                                       'is_repeated_capability': False,
+                                       'is_session_handle': True,
+                                       'is_string': False,
+                                       'library_method_call_snippet': 'vi_ctype',
+                                       'name': 'vi',
+                                       'numpy': False,
+                                       'numpy_into_return': False,
+                                       'python_name': 'vi',
+                                       'python_name_or_default_for_init': 'vi',
+                                       'python_name_with_default': 'vi',
+                                       'python_name_with_doc_default': 'vi',
+                                       'python_type': 'int',
+                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                       'type': 'ViSession',
+                                       'use_array': False,
+                                       'use_in_python_api': True,
+                                       'use_list': False}],
+                 'python_code_variables': [],
+                 'python_name': 'abort',
+                 'render_in_library': True,
+                 'render_in_session_base': False,
+                 'returns': 'ViStatus'},
+    'BoolArrayOutputFunction': {   'blocking': False,
+                                   'codegen_method': 'public',
+                                   'documentation': {'description': 'This function returns an array of booleans.'},
+                                   'has_repeated_capability': False,
+                                   'invalidates_attribute_cache': False,
+                                   'is_error_handling': False,
+                                   'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                   'name': 'BoolArrayOutputFunction',
+                                   'parameters': [   {   'ctypes_type': 'ViSession',
+                                                         'ctypes_type_library_call': 'ViSession',
+                                                         'ctypes_variable_name': 'vi_ctype',
+                                                         'direction': 'in',
+                                                         'documentation': {'description': 'Identifies a particular instrument session. You obtain the **vi**'},
+                                                         'enum': None,
+                                                         'is_buffer': False,
+                                                         'is_repeated_capability': False,
+                                                         'is_session_handle': True,
+                                                         'is_string': False,
+                                                         'library_method_call_snippet': 'vi_ctype',
+                                                         'name': 'vi',
+                                                         'numpy': False,
+                                                         'numpy_into_return': False,
+                                                         'python_name': 'vi',
+                                                         'python_name_or_default_for_init': 'vi',
+                                                         'python_name_with_default': 'vi',
+                                                         'python_name_with_doc_default': 'vi',
+                                                         'python_type': 'int',
+                                                         'size': {'mechanism': 'fixed', 'value': 1},
+                                                         'type': 'ViSession',
+                                                         'use_array': False,
+                                                         'use_in_python_api': True,
+                                                         'use_list': False},
+                                                     {   'ctypes_type': 'ViInt32',
+                                                         'ctypes_type_library_call': 'ViInt32',
+                                                         'ctypes_variable_name': 'number_of_elements_ctype',
+                                                         'direction': 'in',
+                                                         'documentation': {'description': 'Number of elements in the array.'},
+                                                         'enum': None,
+                                                         'is_buffer': False,
+                                                         'is_repeated_capability': False,
+                                                         'is_session_handle': False,
+                                                         'is_string': False,
+                                                         'library_method_call_snippet': 'number_of_elements_ctype',
+                                                         'name': 'numberOfElements',
+                                                         'numpy': False,
+                                                         'numpy_into_return': False,
+                                                         'python_name': 'number_of_elements',
+                                                         'python_name_or_default_for_init': 'number_of_elements',
+                                                         'python_name_with_default': 'number_of_elements',
+                                                         'python_name_with_doc_default': 'number_of_elements',
+                                                         'python_type': 'int',
+                                                         'size': {'mechanism': 'fixed', 'value': 1},
+                                                         'type': 'ViInt32',
+                                                         'use_array': False,
+                                                         'use_in_python_api': True,
+                                                         'use_list': False},
+                                                     {   'ctypes_type': 'ViBoolean',
+                                                         'ctypes_type_library_call': 'ctypes.POINTER(ViBoolean)',
+                                                         'ctypes_variable_name': 'an_array_ctype',
+                                                         'direction': 'out',
+                                                         'documentation': {'description': 'Contains an array of booleans'},
+                                                         'enum': None,
+                                                         'is_buffer': True,
+                                                         'is_repeated_capability': False,
+                                                         'is_session_handle': False,
+                                                         'is_string': False,
+                                                         'library_method_call_snippet': 'an_array_ctype',
+                                                         'name': 'anArray',
+                                                         'numpy': False,
+                                                         'numpy_into_return': False,
+                                                         'original_type': 'ViBoolean[]',
+                                                         'python_name': 'an_array',
+                                                         'python_name_or_default_for_init': 'an_array',
+                                                         'python_name_with_default': 'an_array',
+                                                         'python_name_with_doc_default': 'an_array',
+                                                         'python_type': 'bool',
+                                                         'size': {'mechanism': 'passed-in', 'value': 'numberOfElements'},
+                                                         'type': 'ViBoolean',
+                                                         'use_array': False,
+                                                         'use_in_python_api': True,
+                                                         'use_list': True}],
+                                   'python_code_variables': [],
+                                   'python_name': 'bool_array_output_function',
+                                   'render_in_library': True,
+                                   'render_in_session_base': False,
+                                   'returns': 'ViStatus'},
+    'ClearError': {   'codegen_method': 'no',
+                      'documentation': {'description': 'Clears the error for the current thread and session'},
+                      'parameters': [{'direction': 'in', 'documentation': {'description': 'Identifies a particular instrument session.'}, 'enum': None, 'name': 'vi', 'type': 'ViSession'}],
+                      'returns': 'ViStatus'},
+    'EnumArrayOutputFunction': {   'blocking': False,
+                                   'codegen_method': 'public',
+                                   'documentation': {'description': 'This function returns an array of enums, stored as 16 bit integers under the hood.'},
+                                   'has_repeated_capability': False,
+                                   'invalidates_attribute_cache': False,
+                                   'is_error_handling': False,
+                                   'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                   'name': 'EnumArrayOutputFunction',
+                                   'parameters': [   {   'ctypes_type': 'ViSession',
+                                                         'ctypes_type_library_call': 'ViSession',
+                                                         'ctypes_variable_name': 'vi_ctype',
+                                                         'direction': 'in',
+                                                         'documentation': {'description': 'Identifies a particular instrument session. You obtain the **vi**'},
+                                                         'enum': None,
+                                                         'is_buffer': False,
+                                                         'is_repeated_capability': False,
+                                                         'is_session_handle': True,
+                                                         'is_string': False,
+                                                         'library_method_call_snippet': 'vi_ctype',
+                                                         'name': 'vi',
+                                                         'numpy': False,
+                                                         'numpy_into_return': False,
+                                                         'python_name': 'vi',
+                                                         'python_name_or_default_for_init': 'vi',
+                                                         'python_name_with_default': 'vi',
+                                                         'python_name_with_doc_default': 'vi',
+                                                         'python_type': 'int',
+                                                         'size': {'mechanism': 'fixed', 'value': 1},
+                                                         'type': 'ViSession',
+                                                         'use_array': False,
+                                                         'use_in_python_api': True,
+                                                         'use_list': False},
+                                                     {   'ctypes_type': 'ViInt32',
+                                                         'ctypes_type_library_call': 'ViInt32',
+                                                         'ctypes_variable_name': 'number_of_elements_ctype',
+                                                         'direction': 'in',
+                                                         'documentation': {'description': 'Number of elements in the array.'},
+                                                         'enum': None,
+                                                         'is_buffer': False,
+                                                         'is_repeated_capability': False,
+                                                         'is_session_handle': False,
+                                                         'is_string': False,
+                                                         'library_method_call_snippet': 'number_of_elements_ctype',
+                                                         'name': 'numberOfElements',
+                                                         'numpy': False,
+                                                         'numpy_into_return': False,
+                                                         'python_name': 'number_of_elements',
+                                                         'python_name_or_default_for_init': 'number_of_elements',
+                                                         'python_name_with_default': 'number_of_elements',
+                                                         'python_name_with_doc_default': 'number_of_elements',
+                                                         'python_type': 'int',
+                                                         'size': {'mechanism': 'fixed', 'value': 1},
+                                                         'type': 'ViInt32',
+                                                         'use_array': False,
+                                                         'use_in_python_api': True,
+                                                         'use_list': False},
+                                                     {   'ctypes_type': 'ViInt16',
+                                                         'ctypes_type_library_call': 'ctypes.POINTER(ViInt16)',
+                                                         'ctypes_variable_name': 'an_array_ctype',
+                                                         'direction': 'out',
+                                                         'documentation': {'description': 'Contains an array of enums, stored as 16 bit integers under the hood '},
+                                                         'enum': 'Turtle',
+                                                         'is_buffer': True,
+                                                         'is_repeated_capability': False,
+                                                         'is_session_handle': False,
+                                                         'is_string': False,
+                                                         'library_method_call_snippet': 'an_array_ctype',
+                                                         'name': 'anArray',
+                                                         'numpy': False,
+                                                         'numpy_into_return': False,
+                                                         'original_type': 'ViInt16[]',
+                                                         'python_name': 'an_array',
+                                                         'python_name_or_default_for_init': 'an_array',
+                                                         'python_name_with_default': 'an_array',
+                                                         'python_name_with_doc_default': 'an_array',
+                                                         'python_type': 'enums.Turtle',
+                                                         'size': {'mechanism': 'passed-in', 'value': 'numberOfElements'},
+                                                         'type': 'ViInt16',
+                                                         'use_array': False,
+                                                         'use_in_python_api': True,
+                                                         'use_list': True}],
+                                   'python_code_variables': [],
+                                   'python_name': 'enum_array_output_function',
+                                   'render_in_library': True,
+                                   'render_in_session_base': False,
+                                   'returns': 'ViStatus'},
+    'EnumInputFunctionWithDefaults': {   'blocking': False,
+                                         'codegen_method': 'public',
+                                         'documentation': {   'description': 'This function takes one parameter other than the session, which happens to be an enum and has a default value defined in '
+                                                                             'functions_addon.'},
+                                         'has_repeated_capability': False,
+                                         'invalidates_attribute_cache': False,
+                                         'is_error_handling': False,
+                                         'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                         'name': 'EnumInputFunctionWithDefaults',
+                                         'parameters': [   {   'ctypes_type': 'ViSession',
+                                                               'ctypes_type_library_call': 'ViSession',
+                                                               'ctypes_variable_name': 'vi_ctype',
+                                                               'direction': 'in',
+                                                               'documentation': {'description': 'Identifies a particular instrument session. You obtain the **vi**'},
+                                                               'enum': None,
+                                                               'is_buffer': False,
+                                                               'is_repeated_capability': False,
+                                                               'is_session_handle': True,
+                                                               'is_string': False,
+                                                               'library_method_call_snippet': 'vi_ctype',
+                                                               'name': 'vi',
+                                                               'numpy': False,
+                                                               'numpy_into_return': False,
+                                                               'python_name': 'vi',
+                                                               'python_name_or_default_for_init': 'vi',
+                                                               'python_name_with_default': 'vi',
+                                                               'python_name_with_doc_default': 'vi',
+                                                               'python_type': 'int',
+                                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                                               'type': 'ViSession',
+                                                               'use_array': False,
+                                                               'use_in_python_api': True,
+                                                               'use_list': False},
+                                                           {   'ctypes_type': 'ViInt16',
+                                                               'ctypes_type_library_call': 'ViInt16',
+                                                               'ctypes_variable_name': 'a_turtle_ctype',
+                                                               'default_value': 'Turtle.LEONARDO',
+                                                               'direction': 'in',
+                                                               'documentation': {   'description': 'Indicates a ninja turtle',
+                                                                                    'table_body': [['0', 'Leonardo'], ['1', 'Donatello'], ['2', 'Raphael'], ['3', 'Mich elangelo']]},
+                                                               'enum': 'Turtle',
+                                                               'is_buffer': False,
+                                                               'is_repeated_capability': False,
+                                                               'is_session_handle': False,
+                                                               'is_string': False,
+                                                               'library_method_call_snippet': 'a_turtle_ctype',
+                                                               'name': 'aTurtle',
+                                                               'numpy': False,
+                                                               'numpy_into_return': False,
+                                                               'python_name': 'a_turtle',
+                                                               'python_name_or_default_for_init': 'a_turtle',
+                                                               'python_name_with_default': 'a_turtle=enums.Turtle.LEONARDO',
+                                                               'python_name_with_doc_default': 'a_turtle=nifake.Turtle.LEONARDO',
+                                                               'python_type': 'enums.Turtle',
+                                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                                               'type': 'ViInt16',
+                                                               'use_array': False,
+                                                               'use_in_python_api': True,
+                                                               'use_list': False}],
+                                         'python_code_variables': [],
+                                         'python_name': 'enum_input_function_with_defaults',
+                                         'render_in_library': True,
+                                         'render_in_session_base': False,
+                                         'returns': 'ViStatus'},
+    'FetchWaveform': {   'blocking': True,
+                         'codegen_method': 'public',
+                         'documentation': {   'description': 'Returns waveform data.',
+                                              'note': [   '\n'
+                                                          'This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same '
+                                                          'session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the '
+                                                          "Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.\n"]},
+                         'has_repeated_capability': False,
+                         'invalidates_attribute_cache': False,
+                         'is_error_handling': False,
+                         'method_templates': [   {'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'},
+                                                 {'documentation_filename': '/numpy_method', 'method_python_name_suffix': '_into', 'session_filename': '/numpy_read_method'}],
+                         'name': 'FetchWaveform',
+                         'parameters': [   {   'ctypes_type': 'ViSession',
+                                               'ctypes_type_library_call': 'ViSession',
+                                               'ctypes_variable_name': 'vi_ctype',
+                                               'direction': 'in',
+                                               'documentation': {'description': 'Identifies a particular instrument session.'},
+                                               'enum': None,
+                                               'is_buffer': False,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': True,
+                                               'is_string': False,
+                                               'library_method_call_snippet': 'vi_ctype',
+                                               'name': 'vi',
+                                               'numpy': False,
+                                               'numpy_into_return': False,
+                                               'python_name': 'vi',
+                                               'python_name_or_default_for_init': 'vi',
+                                               'python_name_with_default': 'vi',
+                                               'python_name_with_doc_default': 'vi',
+                                               'python_type': 'int',
+                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                               'type': 'ViSession',
+                                               'use_array': False,
+                                               'use_in_python_api': True,
+                                               'use_list': False},
+                                           {   'ctypes_type': 'ViInt32',
+                                               'ctypes_type_library_call': 'ViInt32',
+                                               'ctypes_variable_name': 'number_of_samples_ctype',
+                                               'direction': 'in',
+                                               'documentation': {'description': 'Number of samples to return'},
+                                               'enum': None,
+                                               'is_buffer': False,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': False,
+                                               'is_string': False,
+                                               'library_method_call_snippet': 'number_of_samples_ctype',
+                                               'name': 'numberOfSamples',
+                                               'numpy': False,
+                                               'numpy_into_return': False,
+                                               'python_name': 'number_of_samples',
+                                               'python_name_or_default_for_init': 'number_of_samples',
+                                               'python_name_with_default': 'number_of_samples',
+                                               'python_name_with_doc_default': 'number_of_samples',
+                                               'python_type': 'int',
+                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                               'type': 'ViInt32',
+                                               'use_array': False,
+                                               'use_in_python_api': False,
+                                               'use_list': False},
+                                           {   'ctypes_type': 'ViReal64',
+                                               'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                               'ctypes_variable_name': 'waveform_data_ctype',
+                                               'direction': 'out',
+                                               'documentation': {'description': 'Samples fetched from the device. Array should be numberOfSamples big.'},
+                                               'enum': None,
+                                               'is_buffer': True,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': False,
+                                               'is_string': False,
+                                               'library_method_call_snippet': 'waveform_data_ctype',
+                                               'name': 'waveformData',
+                                               'numpy': True,
+                                               'numpy_into_return': False,
+                                               'numpy_type': 'float64',
+                                               'original_type': 'ViReal64[]',
+                                               'python_name': 'waveform_data',
+                                               'python_name_or_default_for_init': 'waveform_data',
+                                               'python_name_with_default': 'waveform_data',
+                                               'python_name_with_doc_default': 'waveform_data',
+                                               'python_type': 'float',
+                                               'size': {'mechanism': 'passed-in', 'value': 'numberOfSamples'},
+                                               'type': 'ViReal64',
+                                               'use_array': True,
+                                               'use_in_python_api': True,
+                                               'use_list': False},
+                                           {   'ctypes_type': 'ViInt32',
+                                               'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                               'ctypes_variable_name': 'actual_number_of_samples_ctype',
+                                               'direction': 'out',
+                                               'documentation': {'description': 'Number of samples actually fetched.'},
+                                               'enum': None,
+                                               'is_buffer': False,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': False,
+                                               'is_string': False,
+                                               'library_method_call_snippet': 'None if actual_number_of_samples_ctype is None else (ctypes.pointer(actual_number_of_samples_ctype))',
+                                               'name': 'actualNumberOfSamples',
+                                               'numpy': False,
+                                               'numpy_into_return': False,
+                                               'python_name': 'actual_number_of_samples',
+                                               'python_name_or_default_for_init': 'actual_number_of_samples',
+                                               'python_name_with_default': 'actual_number_of_samples',
+                                               'python_name_with_doc_default': 'actual_number_of_samples',
+                                               'python_type': 'int',
+                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                               'type': 'ViInt32',
+                                               'use_array': False,
+                                               'use_in_python_api': False,
+                                               'use_list': False}],
+                         'python_code_variables': [],
+                         'python_name': 'fetch_waveform',
+                         'render_in_library': True,
+                         'render_in_session_base': False,
+                         'returns': 'ViStatus'},
+    'GetABoolean': {   'blocking': False,
+                       'codegen_method': 'public',
+                       'documentation': {'description': 'Returns a boolean.', 'note': 'This function rules!'},
+                       'has_repeated_capability': False,
+                       'invalidates_attribute_cache': False,
+                       'is_error_handling': False,
+                       'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                       'name': 'GetABoolean',
+                       'parameters': [   {   'ctypes_type': 'ViSession',
+                                             'ctypes_type_library_call': 'ViSession',
+                                             'ctypes_variable_name': 'vi_ctype',
+                                             'direction': 'in',
+                                             'documentation': {'description': 'Identifies a particular instrument session.'},
+                                             'enum': None,
+                                             'is_buffer': False,
+                                             'is_repeated_capability': False,
+                                             'is_session_handle': True,
+                                             'is_string': False,
+                                             'library_method_call_snippet': 'vi_ctype',
+                                             'name': 'vi',
+                                             'numpy': False,
+                                             'numpy_into_return': False,
+                                             'python_name': 'vi',
+                                             'python_name_or_default_for_init': 'vi',
+                                             'python_name_with_default': 'vi',
+                                             'python_name_with_doc_default': 'vi',
+                                             'python_type': 'int',
+                                             'size': {'mechanism': 'fixed', 'value': 1},
+                                             'type': 'ViSession',
+                                             'use_array': False,
+                                             'use_in_python_api': True,
+                                             'use_list': False},
+                                         {   'ctypes_type': 'ViBoolean',
+                                             'ctypes_type_library_call': 'ctypes.POINTER(ViBoolean)',
+                                             'ctypes_variable_name': 'a_boolean_ctype',
+                                             'direction': 'out',
+                                             'documentation': {'description': 'Contains a boolean.'},
+                                             'enum': None,
+                                             'is_buffer': False,
+                                             'is_repeated_capability': False,
+                                             'is_session_handle': False,
+                                             'is_string': False,
+                                             'library_method_call_snippet': 'None if a_boolean_ctype is None else (ctypes.pointer(a_boolean_ctype))',
+                                             'name': 'aBoolean',
+                                             'numpy': False,
+                                             'numpy_into_return': False,
+                                             'python_name': 'a_boolean',
+                                             'python_name_or_default_for_init': 'a_boolean',
+                                             'python_name_with_default': 'a_boolean',
+                                             'python_name_with_doc_default': 'a_boolean',
+                                             'python_type': 'bool',
+                                             'size': {'mechanism': 'fixed', 'value': 1},
+                                             'type': 'ViBoolean',
+                                             'use_array': False,
+                                             'use_in_python_api': True,
+                                             'use_list': False}],
+                       'python_code_variables': [],
+                       'python_name': 'get_a_boolean',
+                       'render_in_library': True,
+                       'render_in_session_base': False,
+                       'returns': 'ViStatus'},
+    'GetANumber': {   'blocking': False,
+                      'codegen_method': 'public',
+                      'documentation': {'description': 'Returns a number.', 'note': 'This function rules!'},
+                      'has_repeated_capability': False,
+                      'invalidates_attribute_cache': False,
+                      'is_error_handling': False,
+                      'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                      'name': 'GetANumber',
+                      'parameters': [   {   'ctypes_type': 'ViSession',
+                                            'ctypes_type_library_call': 'ViSession',
+                                            'ctypes_variable_name': 'vi_ctype',
+                                            'direction': 'in',
+                                            'documentation': {'description': 'Identifies a particular instrument session.'},
+                                            'enum': None,
+                                            'is_buffer': False,
+                                            'is_repeated_capability': False,
+                                            'is_session_handle': True,
+                                            'is_string': False,
+                                            'library_method_call_snippet': 'vi_ctype',
+                                            'name': 'vi',
+                                            'numpy': False,
+                                            'numpy_into_return': False,
+                                            'python_name': 'vi',
+                                            'python_name_or_default_for_init': 'vi',
+                                            'python_name_with_default': 'vi',
+                                            'python_name_with_doc_default': 'vi',
+                                            'python_type': 'int',
+                                            'size': {'mechanism': 'fixed', 'value': 1},
+                                            'type': 'ViSession',
+                                            'use_array': False,
+                                            'use_in_python_api': True,
+                                            'use_list': False},
+                                        {   'ctypes_type': 'ViInt16',
+                                            'ctypes_type_library_call': 'ctypes.POINTER(ViInt16)',
+                                            'ctypes_variable_name': 'a_number_ctype',
+                                            'direction': 'out',
+                                            'documentation': {'description': 'Contains a number.'},
+                                            'enum': None,
+                                            'is_buffer': False,
+                                            'is_repeated_capability': False,
+                                            'is_session_handle': False,
+                                            'is_string': False,
+                                            'library_method_call_snippet': 'None if a_number_ctype is None else (ctypes.pointer(a_number_ctype))',
+                                            'name': 'aNumber',
+                                            'numpy': False,
+                                            'numpy_into_return': False,
+                                            'python_name': 'a_number',
+                                            'python_name_or_default_for_init': 'a_number',
+                                            'python_name_with_default': 'a_number',
+                                            'python_name_with_doc_default': 'a_number',
+                                            'python_type': 'int',
+                                            'size': {'mechanism': 'fixed', 'value': 1},
+                                            'type': 'ViInt16',
+                                            'use_array': False,
+                                            'use_in_python_api': True,
+                                            'use_list': False}],
+                      'python_code_variables': [],
+                      'python_name': 'get_a_number',
+                      'render_in_library': True,
+                      'render_in_session_base': False,
+                      'returns': 'ViStatus'},
+    'GetAStringOfFixedMaximumSize': {   'blocking': False,
+                                        'codegen_method': 'public',
+                                        'documentation': {'description': 'Illustrates resturning a string of fixed size.'},
+                                        'has_repeated_capability': False,
+                                        'invalidates_attribute_cache': False,
+                                        'is_error_handling': False,
+                                        'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                        'name': 'GetAStringOfFixedMaximumSize',
+                                        'parameters': [   {   'ctypes_type': 'ViSession',
+                                                              'ctypes_type_library_call': 'ViSession',
+                                                              'ctypes_variable_name': 'vi_ctype',
+                                                              'direction': 'in',
+                                                              'documentation': {'description': 'Identifies a particular instrument session.'},
+                                                              'enum': None,
+                                                              'is_buffer': False,
+                                                              'is_repeated_capability': False,
+                                                              'is_session_handle': True,
+                                                              'is_string': False,
+                                                              'library_method_call_snippet': 'vi_ctype',
+                                                              'name': 'vi',
+                                                              'numpy': False,
+                                                              'numpy_into_return': False,
+                                                              'python_name': 'vi',
+                                                              'python_name_or_default_for_init': 'vi',
+                                                              'python_name_with_default': 'vi',
+                                                              'python_name_with_doc_default': 'vi',
+                                                              'python_type': 'int',
+                                                              'size': {'mechanism': 'fixed', 'value': 1},
+                                                              'type': 'ViSession',
+                                                              'use_array': False,
+                                                              'use_in_python_api': True,
+                                                              'use_list': False},
+                                                          {   'ctypes_type': 'ViChar[]',
+                                                              'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                              'ctypes_variable_name': 'a_string_ctype',
+                                                              'direction': 'out',
+                                                              'documentation': {'description': 'String comes back here. Buffer must be 256 big.'},
+                                                              'enum': None,
+                                                              'is_buffer': False,
+                                                              'is_repeated_capability': False,
+                                                              'is_session_handle': False,
+                                                              'is_string': True,
+                                                              'library_method_call_snippet': 'a_string_ctype',
+                                                              'name': 'aString',
+                                                              'numpy': False,
+                                                              'numpy_into_return': False,
+                                                              'python_name': 'a_string',
+                                                              'python_name_or_default_for_init': 'a_string',
+                                                              'python_name_with_default': 'a_string',
+                                                              'python_name_with_doc_default': 'a_string',
+                                                              'python_type': 'str',
+                                                              'size': {'mechanism': 'fixed', 'value': 256},
+                                                              'type': 'ViChar[]',
+                                                              'use_array': False,
+                                                              'use_in_python_api': True,
+                                                              'use_list': False}],
+                                        'python_code_variables': [],
+                                        'python_name': 'get_a_string_of_fixed_maximum_size',
+                                        'render_in_library': True,
+                                        'render_in_session_base': False,
+                                        'returns': 'ViStatus'},
+    'GetAnIviDanceString': {   'blocking': False,
+                               'codegen_method': 'public',
+                               'documentation': {'description': 'Returns a string using the IVI dance.'},
+                               'has_repeated_capability': False,
+                               'invalidates_attribute_cache': False,
+                               'is_error_handling': False,
+                               'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                               'name': 'GetAnIviDanceString',
+                               'parameters': [   {   'ctypes_type': 'ViSession',
+                                                     'ctypes_type_library_call': 'ViSession',
+                                                     'ctypes_variable_name': 'vi_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {'description': 'Identifies a particular instrument session.'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': True,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'vi_ctype',
+                                                     'name': 'vi',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'vi',
+                                                     'python_name_or_default_for_init': 'vi',
+                                                     'python_name_with_default': 'vi',
+                                                     'python_name_with_doc_default': 'vi',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViSession',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViInt32',
+                                                     'ctypes_type_library_call': 'ViInt32',
+                                                     'ctypes_variable_name': 'buffer_size_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {'description': 'Number of bytes in aString You can IVI-dance with this.'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'buffer_size_ctype',
+                                                     'name': 'bufferSize',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'buffer_size',
+                                                     'python_name_or_default_for_init': 'buffer_size',
+                                                     'python_name_with_default': 'buffer_size',
+                                                     'python_name_with_doc_default': 'buffer_size',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViInt32',
+                                                     'use_array': False,
+                                                     'use_in_python_api': False,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViChar[]',
+                                                     'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                     'ctypes_variable_name': 'a_string_ctype',
+                                                     'direction': 'out',
+                                                     'documentation': {'description': 'Returns the string.'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': True,
+                                                     'library_method_call_snippet': 'a_string_ctype',
+                                                     'name': 'aString',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'a_string',
+                                                     'python_name_or_default_for_init': 'a_string',
+                                                     'python_name_with_default': 'a_string',
+                                                     'python_name_with_doc_default': 'a_string',
+                                                     'python_type': 'str',
+                                                     'size': {'mechanism': 'ivi-dance', 'value': 'bufferSize'},
+                                                     'type': 'ViChar[]',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False}],
+                               'python_code_variables': [],
+                               'python_name': 'get_an_ivi_dance_string',
+                               'render_in_library': True,
+                               'render_in_session_base': False,
+                               'returns': 'ViStatus'},
+    'GetArrayForPythonCodeCustomType': {   'blocking': False,
+                                           'codegen_method': 'public',
+                                           'documentation': {'description': 'This function returns an array for use in python-code size mechanism.'},
+                                           'has_repeated_capability': False,
+                                           'invalidates_attribute_cache': False,
+                                           'is_error_handling': False,
+                                           'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                           'name': 'GetArrayForPythonCodeCustomType',
+                                           'parameters': [   {   'ctypes_type': 'ViSession',
+                                                                 'ctypes_type_library_call': 'ViSession',
+                                                                 'ctypes_variable_name': 'vi_ctype',
+                                                                 'direction': 'in',
+                                                                 'documentation': {'description': 'Identifies a particular instrument session.'},
+                                                                 'enum': None,
+                                                                 'is_buffer': False,
+                                                                 'is_repeated_capability': False,
+                                                                 'is_session_handle': True,
+                                                                 'is_string': False,
+                                                                 'library_method_call_snippet': 'vi_ctype',
+                                                                 'name': 'vi',
+                                                                 'numpy': False,
+                                                                 'numpy_into_return': False,
+                                                                 'python_name': 'vi',
+                                                                 'python_name_or_default_for_init': 'vi',
+                                                                 'python_name_with_default': 'vi',
+                                                                 'python_name_with_doc_default': 'vi',
+                                                                 'python_type': 'int',
+                                                                 'size': {'mechanism': 'fixed', 'value': 1},
+                                                                 'type': 'ViSession',
+                                                                 'use_array': False,
+                                                                 'use_in_python_api': True,
+                                                                 'use_list': False},
+                                                             {   'ctypes_type': 'ViInt32',
+                                                                 'ctypes_type_library_call': 'ViInt32',
+                                                                 'ctypes_variable_name': 'number_of_elements_ctype',
+                                                                 'direction': 'in',
+                                                                 'documentation': {'description': 'Number of elements in the array.'},
+                                                                 'enum': None,
+                                                                 'is_buffer': False,
+                                                                 'is_repeated_capability': False,
+                                                                 'is_session_handle': False,
+                                                                 'is_string': False,
+                                                                 'library_method_call_snippet': 'number_of_elements_ctype',
+                                                                 'name': 'numberOfElements',
+                                                                 'numpy': False,
+                                                                 'numpy_into_return': False,
+                                                                 'python_name': 'number_of_elements',
+                                                                 'python_name_or_default_for_init': 'number_of_elements',
+                                                                 'python_name_with_default': 'number_of_elements',
+                                                                 'python_name_with_doc_default': 'number_of_elements',
+                                                                 'python_type': 'int',
+                                                                 'size': {'mechanism': 'python-code', 'value': 'self.get_array_size_for_python_code()'},
+                                                                 'type': 'ViInt32',
+                                                                 'use_array': False,
+                                                                 'use_in_python_api': True,
+                                                                 'use_list': False},
+                                                             {   'ctypes_type': 'custom_struct',
+                                                                 'ctypes_type_library_call': 'ctypes.POINTER(custom_struct.custom_struct)',
+                                                                 'ctypes_variable_name': 'array_out_ctype',
+                                                                 'direction': 'out',
+                                                                 'documentation': {'description': 'Array of custom type using puthon-code size mechanism'},
+                                                                 'enum': None,
+                                                                 'is_buffer': True,
+                                                                 'is_repeated_capability': False,
+                                                                 'is_session_handle': False,
+                                                                 'is_string': False,
+                                                                 'library_method_call_snippet': 'array_out_ctype',
+                                                                 'name': 'arrayOut',
+                                                                 'numpy': False,
+                                                                 'numpy_into_return': False,
+                                                                 'original_type': 'custom_struct[]',
+                                                                 'python_name': 'array_out',
+                                                                 'python_name_or_default_for_init': 'array_out',
+                                                                 'python_name_with_default': 'array_out',
+                                                                 'python_name_with_doc_default': 'array_out',
+                                                                 'python_type': 'CustomStruct',
+                                                                 'size': {'mechanism': 'python-code', 'value': 'self.get_array_size_for_python_code()'},
+                                                                 'type': 'custom_struct',
+                                                                 'use_array': False,
+                                                                 'use_in_python_api': True,
+                                                                 'use_list': True}],
+                                           'python_code_variables': [],
+                                           'python_name': 'get_array_for_python_code_custom_type',
+                                           'render_in_library': True,
+                                           'render_in_session_base': False,
+                                           'returns': 'ViStatus'},
+    'GetArrayForPythonCodeDouble': {   'blocking': False,
+                                       'codegen_method': 'public',
+                                       'documentation': {'description': 'This function returns an array for use in python-code size mechanism.'},
+                                       'has_repeated_capability': False,
+                                       'invalidates_attribute_cache': False,
+                                       'is_error_handling': False,
+                                       'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                       'name': 'GetArrayForPythonCodeDouble',
+                                       'parameters': [   {   'ctypes_type': 'ViSession',
+                                                             'ctypes_type_library_call': 'ViSession',
+                                                             'ctypes_variable_name': 'vi_ctype',
+                                                             'direction': 'in',
+                                                             'documentation': {'description': 'Identifies a particular instrument session.'},
+                                                             'enum': None,
+                                                             'is_buffer': False,
+                                                             'is_repeated_capability': False,
+                                                             'is_session_handle': True,
+                                                             'is_string': False,
+                                                             'library_method_call_snippet': 'vi_ctype',
+                                                             'name': 'vi',
+                                                             'numpy': False,
+                                                             'numpy_into_return': False,
+                                                             'python_name': 'vi',
+                                                             'python_name_or_default_for_init': 'vi',
+                                                             'python_name_with_default': 'vi',
+                                                             'python_name_with_doc_default': 'vi',
+                                                             'python_type': 'int',
+                                                             'size': {'mechanism': 'fixed', 'value': 1},
+                                                             'type': 'ViSession',
+                                                             'use_array': False,
+                                                             'use_in_python_api': True,
+                                                             'use_list': False},
+                                                         {   'ctypes_type': 'ViInt32',
+                                                             'ctypes_type_library_call': 'ViInt32',
+                                                             'ctypes_variable_name': 'number_of_elements_ctype',
+                                                             'direction': 'in',
+                                                             'documentation': {'description': 'Number of elements in the array.'},
+                                                             'enum': None,
+                                                             'is_buffer': False,
+                                                             'is_repeated_capability': False,
+                                                             'is_session_handle': False,
+                                                             'is_string': False,
+                                                             'library_method_call_snippet': 'number_of_elements_ctype',
+                                                             'name': 'numberOfElements',
+                                                             'numpy': False,
+                                                             'numpy_into_return': False,
+                                                             'python_name': 'number_of_elements',
+                                                             'python_name_or_default_for_init': 'number_of_elements',
+                                                             'python_name_with_default': 'number_of_elements',
+                                                             'python_name_with_doc_default': 'number_of_elements',
+                                                             'python_type': 'int',
+                                                             'size': {'mechanism': 'python-code', 'value': 'self.get_array_size_for_python_code()'},
+                                                             'type': 'ViInt32',
+                                                             'use_array': False,
+                                                             'use_in_python_api': True,
+                                                             'use_list': False},
+                                                         {   'ctypes_type': 'ViReal64',
+                                                             'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                                             'ctypes_variable_name': 'array_out_ctype',
+                                                             'direction': 'out',
+                                                             'documentation': {'description': 'Array of double using puthon-code size mechanism'},
+                                                             'enum': None,
+                                                             'is_buffer': True,
+                                                             'is_repeated_capability': False,
+                                                             'is_session_handle': False,
+                                                             'is_string': False,
+                                                             'library_method_call_snippet': 'array_out_ctype',
+                                                             'name': 'arrayOut',
+                                                             'numpy': False,
+                                                             'numpy_into_return': False,
+                                                             'original_type': 'ViReal64[]',
+                                                             'python_name': 'array_out',
+                                                             'python_name_or_default_for_init': 'array_out',
+                                                             'python_name_with_default': 'array_out',
+                                                             'python_name_with_doc_default': 'array_out',
+                                                             'python_type': 'float',
+                                                             'size': {'mechanism': 'python-code', 'value': 'self.get_array_size_for_python_code()'},
+                                                             'type': 'ViReal64',
+                                                             'use_array': False,
+                                                             'use_in_python_api': True,
+                                                             'use_list': True}],
+                                       'python_code_variables': [],
+                                       'python_name': 'get_array_for_python_code_double',
+                                       'render_in_library': True,
+                                       'render_in_session_base': False,
+                                       'returns': 'ViStatus'},
+    'GetArraySizeForPythonCode': {   'blocking': False,
+                                     'codegen_method': 'public',
+                                     'documentation': {'description': 'This function returns the size of the array for use in python-code size mechanism.'},
+                                     'has_repeated_capability': False,
+                                     'invalidates_attribute_cache': False,
+                                     'is_error_handling': False,
+                                     'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                     'name': 'GetArraySizeForPythonCode',
+                                     'parameters': [   {   'ctypes_type': 'ViSession',
+                                                           'ctypes_type_library_call': 'ViSession',
+                                                           'ctypes_variable_name': 'vi_ctype',
+                                                           'direction': 'in',
+                                                           'documentation': {'description': 'Identifies a particular instrument session.'},
+                                                           'enum': None,
+                                                           'is_buffer': False,
+                                                           'is_repeated_capability': False,
+                                                           'is_session_handle': True,
+                                                           'is_string': False,
+                                                           'library_method_call_snippet': 'vi_ctype',
+                                                           'name': 'vi',
+                                                           'numpy': False,
+                                                           'numpy_into_return': False,
+                                                           'python_name': 'vi',
+                                                           'python_name_or_default_for_init': 'vi',
+                                                           'python_name_with_default': 'vi',
+                                                           'python_name_with_doc_default': 'vi',
+                                                           'python_type': 'int',
+                                                           'size': {'mechanism': 'fixed', 'value': 1},
+                                                           'type': 'ViSession',
+                                                           'use_array': False,
+                                                           'use_in_python_api': True,
+                                                           'use_list': False},
+                                                       {   'ctypes_type': 'ViInt32',
+                                                           'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                                           'ctypes_variable_name': 'size_out_ctype',
+                                                           'direction': 'out',
+                                                           'documentation': {'description': 'Size of array'},
+                                                           'enum': None,
+                                                           'is_buffer': False,
+                                                           'is_repeated_capability': False,
+                                                           'is_session_handle': False,
+                                                           'is_string': False,
+                                                           'library_method_call_snippet': 'None if size_out_ctype is None else (ctypes.pointer(size_out_ctype))',
+                                                           'name': 'sizeOut',
+                                                           'numpy': False,
+                                                           'numpy_into_return': False,
+                                                           'python_name': 'size_out',
+                                                           'python_name_or_default_for_init': 'size_out',
+                                                           'python_name_with_default': 'size_out',
+                                                           'python_name_with_doc_default': 'size_out',
+                                                           'python_type': 'int',
+                                                           'size': {'mechanism': 'fixed', 'value': 1},
+                                                           'type': 'ViInt32',
+                                                           'use_array': False,
+                                                           'use_in_python_api': True,
+                                                           'use_list': False}],
+                                     'python_code_variables': [],
+                                     'python_name': 'get_array_size_for_python_code',
+                                     'render_in_library': True,
+                                     'render_in_session_base': False,
+                                     'returns': 'ViStatus'},
+    'GetArrayUsingIVIDance': {   'blocking': False,
+                                 'codegen_method': 'public',
+                                 'documentation': {'description': 'This function returns an array of float whose size is determined with the IVI dance.'},
+                                 'has_repeated_capability': False,
+                                 'invalidates_attribute_cache': False,
+                                 'is_error_handling': False,
+                                 'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                 'name': 'GetArrayUsingIVIDance',
+                                 'parameters': [   {   'ctypes_type': 'ViSession',
+                                                       'ctypes_type_library_call': 'ViSession',
+                                                       'ctypes_variable_name': 'vi_ctype',
+                                                       'direction': 'in',
+                                                       'documentation': {'description': 'Identifies a particular instrument session.'},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': True,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'vi_ctype',
+                                                       'name': 'vi',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'vi',
+                                                       'python_name_or_default_for_init': 'vi',
+                                                       'python_name_with_default': 'vi',
+                                                       'python_name_with_doc_default': 'vi',
+                                                       'python_type': 'int',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViSession',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False},
+                                                   {   'ctypes_type': 'ViInt32',
+                                                       'ctypes_type_library_call': 'ViInt32',
+                                                       'ctypes_variable_name': 'array_size_ctype',
+                                                       'direction': 'in',
+                                                       'documentation': {'description': 'Specifies the size of the buffer for copyint arrayOut onto.'},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': False,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'array_size_ctype',
+                                                       'name': 'arraySize',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'array_size',
+                                                       'python_name_or_default_for_init': 'array_size',
+                                                       'python_name_with_default': 'array_size',
+                                                       'python_name_with_doc_default': 'array_size',
+                                                       'python_type': 'int',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViInt32',
+                                                       'use_array': False,
+                                                       'use_in_python_api': False,
+                                                       'use_list': False},
+                                                   {   'ctypes_type': 'ViReal64',
+                                                       'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                                       'ctypes_variable_name': 'array_out_ctype',
+                                                       'direction': 'out',
+                                                       'documentation': {'description': 'The array returned by this function'},
+                                                       'enum': None,
+                                                       'is_buffer': True,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': False,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'array_out_ctype',
+                                                       'name': 'arrayOut',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'original_type': 'ViReal64[]',
+                                                       'python_name': 'array_out',
+                                                       'python_name_or_default_for_init': 'array_out',
+                                                       'python_name_with_default': 'array_out',
+                                                       'python_name_with_doc_default': 'array_out',
+                                                       'python_type': 'float',
+                                                       'size': {'mechanism': 'ivi-dance', 'value': 'arraySize'},
+                                                       'type': 'ViReal64',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': True}],
+                                 'python_code_variables': [],
+                                 'python_name': 'get_array_using_ivi_dance',
+                                 'render_in_library': True,
+                                 'render_in_session_base': False,
+                                 'returns': 'ViStatus'},
+    'GetAttributeViBoolean': {   'blocking': False,
+                                 'codegen_method': 'private',
+                                 'documentation': {'description': 'Queries the value of a ViBoolean attribute.'},
+                                 'has_repeated_capability': True,
+                                 'invalidates_attribute_cache': False,
+                                 'is_error_handling': False,
+                                 'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                 'name': 'GetAttributeViBoolean',
+                                 'parameters': [   {   'ctypes_type': 'ViSession',
+                                                       'ctypes_type_library_call': 'ViSession',
+                                                       'ctypes_variable_name': 'vi_ctype',
+                                                       'direction': 'in',
+                                                       'documentation': {'description': 'Identifies a particular instrument session.'},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': True,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'vi_ctype',
+                                                       'name': 'vi',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'vi',
+                                                       'python_name_or_default_for_init': 'vi',
+                                                       'python_name_with_default': 'vi',
+                                                       'python_name_with_doc_default': 'vi',
+                                                       'python_type': 'int',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViSession',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False},
+                                                   {   'ctypes_type': 'ViConstString',
+                                                       'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                       'ctypes_variable_name': 'channel_name_ctype',
+                                                       'direction': 'in',
+                                                       'documentation': {'description': 'This is the channel(s) that this function will apply to.'},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': True,
+                                                       'is_session_handle': False,
+                                                       'is_string': True,
+                                                       'library_method_call_snippet': 'channel_name_ctype',
+                                                       'name': 'channelName',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'channel_name',
+                                                       'python_name_or_default_for_init': 'channel_name',
+                                                       'python_name_with_default': 'channel_name',
+                                                       'python_name_with_doc_default': 'channel_name',
+                                                       'python_type': 'str',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViConstString',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False},
+                                                   {   'ctypes_type': 'ViAttr',
+                                                       'ctypes_type_library_call': 'ViAttr',
+                                                       'ctypes_variable_name': 'attribute_id_ctype',
+                                                       'direction': 'in',
+                                                       'documentation': {'description': 'Pass the ID of an attribute.'},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': False,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'attribute_id_ctype',
+                                                       'name': 'attributeId',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'attribute_id',
+                                                       'python_name_or_default_for_init': 'attribute_id',
+                                                       'python_name_with_default': 'attribute_id',
+                                                       'python_name_with_doc_default': 'attribute_id',
+                                                       'python_type': 'int',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViAttr',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False},
+                                                   {   'ctypes_type': 'ViBoolean',
+                                                       'ctypes_type_library_call': 'ctypes.POINTER(ViBoolean)',
+                                                       'ctypes_variable_name': 'attribute_value_ctype',
+                                                       'direction': 'out',
+                                                       'documentation': {'description': 'Returns the value of the attribute.'},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': False,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'None if attribute_value_ctype is None else (ctypes.pointer(attribute_value_ctype))',
+                                                       'name': 'attributeValue',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'attribute_value',
+                                                       'python_name_or_default_for_init': 'attribute_value',
+                                                       'python_name_with_default': 'attribute_value',
+                                                       'python_name_with_doc_default': 'attribute_value',
+                                                       'python_type': 'bool',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViBoolean',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False}],
+                                 'python_code_variables': [],
+                                 'python_name': '_get_attribute_vi_boolean',
+                                 'render_in_library': True,
+                                 'render_in_session_base': True,
+                                 'returns': 'ViStatus'},
+    'GetAttributeViInt32': {   'blocking': False,
+                               'codegen_method': 'private',
+                               'documentation': {'description': 'Queries the value of a ViInt32 attribute.'},
+                               'has_repeated_capability': True,
+                               'invalidates_attribute_cache': False,
+                               'is_error_handling': False,
+                               'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                               'name': 'GetAttributeViInt32',
+                               'parameters': [   {   'ctypes_type': 'ViSession',
+                                                     'ctypes_type_library_call': 'ViSession',
+                                                     'ctypes_variable_name': 'vi_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {'description': 'Identifies a particular instrument session.'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': True,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'vi_ctype',
+                                                     'name': 'vi',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'vi',
+                                                     'python_name_or_default_for_init': 'vi',
+                                                     'python_name_with_default': 'vi',
+                                                     'python_name_with_doc_default': 'vi',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViSession',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViConstString',
+                                                     'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                     'ctypes_variable_name': 'channel_name_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {'description': 'This is the channel(s) that this function will apply to.'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': True,
+                                                     'is_session_handle': False,
+                                                     'is_string': True,
+                                                     'library_method_call_snippet': 'channel_name_ctype',
+                                                     'name': 'channelName',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'channel_name',
+                                                     'python_name_or_default_for_init': 'channel_name',
+                                                     'python_name_with_default': 'channel_name',
+                                                     'python_name_with_doc_default': 'channel_name',
+                                                     'python_type': 'str',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViConstString',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViAttr',
+                                                     'ctypes_type_library_call': 'ViAttr',
+                                                     'ctypes_variable_name': 'attribute_id_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {'description': 'Pass the ID of an attribute.'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'attribute_id_ctype',
+                                                     'name': 'attributeId',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'attribute_id',
+                                                     'python_name_or_default_for_init': 'attribute_id',
+                                                     'python_name_with_default': 'attribute_id',
+                                                     'python_name_with_doc_default': 'attribute_id',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViAttr',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViInt32',
+                                                     'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                                     'ctypes_variable_name': 'attribute_value_ctype',
+                                                     'direction': 'out',
+                                                     'documentation': {'description': 'Returns the value of the attribute.'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'None if attribute_value_ctype is None else (ctypes.pointer(attribute_value_ctype))',
+                                                     'name': 'attributeValue',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'attribute_value',
+                                                     'python_name_or_default_for_init': 'attribute_value',
+                                                     'python_name_with_default': 'attribute_value',
+                                                     'python_name_with_doc_default': 'attribute_value',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViInt32',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False}],
+                               'python_code_variables': [],
+                               'python_name': '_get_attribute_vi_int32',
+                               'render_in_library': True,
+                               'render_in_session_base': True,
+                               'returns': 'ViStatus'},
+    'GetAttributeViInt64': {   'blocking': False,
+                               'codegen_method': 'private',
+                               'documentation': {'description': 'Queries the value of a ViInt64 attribute.'},
+                               'has_repeated_capability': True,
+                               'invalidates_attribute_cache': False,
+                               'is_error_handling': False,
+                               'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                               'name': 'GetAttributeViInt64',
+                               'parameters': [   {   'ctypes_type': 'ViSession',
+                                                     'ctypes_type_library_call': 'ViSession',
+                                                     'ctypes_variable_name': 'vi_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {'description': 'Identifies a particular instrument session.'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': True,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'vi_ctype',
+                                                     'name': 'vi',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'vi',
+                                                     'python_name_or_default_for_init': 'vi',
+                                                     'python_name_with_default': 'vi',
+                                                     'python_name_with_doc_default': 'vi',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViSession',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViConstString',
+                                                     'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                     'ctypes_variable_name': 'channel_name_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {'description': 'This is the channel(s) that this function will apply to.'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': True,
+                                                     'is_session_handle': False,
+                                                     'is_string': True,
+                                                     'library_method_call_snippet': 'channel_name_ctype',
+                                                     'name': 'channelName',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'channel_name',
+                                                     'python_name_or_default_for_init': 'channel_name',
+                                                     'python_name_with_default': 'channel_name',
+                                                     'python_name_with_doc_default': 'channel_name',
+                                                     'python_type': 'str',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViConstString',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViAttr',
+                                                     'ctypes_type_library_call': 'ViAttr',
+                                                     'ctypes_variable_name': 'attribute_id_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {'description': 'Pass the ID of an attribute.'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'attribute_id_ctype',
+                                                     'name': 'attributeId',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'attribute_id',
+                                                     'python_name_or_default_for_init': 'attribute_id',
+                                                     'python_name_with_default': 'attribute_id',
+                                                     'python_name_with_doc_default': 'attribute_id',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViAttr',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViInt64',
+                                                     'ctypes_type_library_call': 'ctypes.POINTER(ViInt64)',
+                                                     'ctypes_variable_name': 'attribute_value_ctype',
+                                                     'direction': 'out',
+                                                     'documentation': {'description': 'Returns the value of the attribute.'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'None if attribute_value_ctype is None else (ctypes.pointer(attribute_value_ctype))',
+                                                     'name': 'attributeValue',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'attribute_value',
+                                                     'python_name_or_default_for_init': 'attribute_value',
+                                                     'python_name_with_default': 'attribute_value',
+                                                     'python_name_with_doc_default': 'attribute_value',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViInt64',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False}],
+                               'python_code_variables': [],
+                               'python_name': '_get_attribute_vi_int64',
+                               'render_in_library': True,
+                               'render_in_session_base': True,
+                               'returns': 'ViStatus'},
+    'GetAttributeViReal64': {   'blocking': False,
+                                'codegen_method': 'private',
+                                'documentation': {'description': 'Queries the value of a ViReal attribute.'},
+                                'has_repeated_capability': True,
+                                'invalidates_attribute_cache': False,
+                                'is_error_handling': False,
+                                'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                'name': 'GetAttributeViReal64',
+                                'parameters': [   {   'ctypes_type': 'ViSession',
+                                                      'ctypes_type_library_call': 'ViSession',
+                                                      'ctypes_variable_name': 'vi_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {'description': 'Identifies a particular instrument session.'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': True,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'vi_ctype',
+                                                      'name': 'vi',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'vi',
+                                                      'python_name_or_default_for_init': 'vi',
+                                                      'python_name_with_default': 'vi',
+                                                      'python_name_with_doc_default': 'vi',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViSession',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViConstString',
+                                                      'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                      'ctypes_variable_name': 'channel_name_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {'description': 'This is the channel(s) that this function will apply to.'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': True,
+                                                      'is_session_handle': False,
+                                                      'is_string': True,
+                                                      'library_method_call_snippet': 'channel_name_ctype',
+                                                      'name': 'channelName',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'channel_name',
+                                                      'python_name_or_default_for_init': 'channel_name',
+                                                      'python_name_with_default': 'channel_name',
+                                                      'python_name_with_doc_default': 'channel_name',
+                                                      'python_type': 'str',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViConstString',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViAttr',
+                                                      'ctypes_type_library_call': 'ViAttr',
+                                                      'ctypes_variable_name': 'attribute_id_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {'description': 'Pass the ID of an attribute.'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'attribute_id_ctype',
+                                                      'name': 'attributeId',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'attribute_id',
+                                                      'python_name_or_default_for_init': 'attribute_id',
+                                                      'python_name_with_default': 'attribute_id',
+                                                      'python_name_with_doc_default': 'attribute_id',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViAttr',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViReal64',
+                                                      'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                                      'ctypes_variable_name': 'attribute_value_ctype',
+                                                      'direction': 'out',
+                                                      'documentation': {'description': 'Returns the value of the attribute.'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'None if attribute_value_ctype is None else (ctypes.pointer(attribute_value_ctype))',
+                                                      'name': 'attributeValue',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'attribute_value',
+                                                      'python_name_or_default_for_init': 'attribute_value',
+                                                      'python_name_with_default': 'attribute_value',
+                                                      'python_name_with_doc_default': 'attribute_value',
+                                                      'python_type': 'float',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViReal64',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False}],
+                                'python_code_variables': [],
+                                'python_name': '_get_attribute_vi_real64',
+                                'render_in_library': True,
+                                'render_in_session_base': True,
+                                'returns': 'ViStatus'},
+    'GetAttributeViSession': {   'codegen_method': 'no',
+                                 'documentation': {'description': 'Queries the value of a ViSession attribute.'},
+                                 'parameters': [   {   'direction': 'in',
+                                                       'documentation': {'description': 'Identifies a particular instrument session.'},
+                                                       'enum': None,
+                                                       'name': 'vi',
+                                                       'type': 'ViSession'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {'description': 'This is the channel(s) that this function will apply to.'},
+                                                       'enum': None,
+                                                       'name': 'channelName',
+                                                       'type': 'ViConstString'},
+                                                   {'direction': 'in', 'documentation': {'description': 'Pass the ID of an attribute.'}, 'enum': None, 'name': 'attributeId', 'type': 'ViAttr'},
+                                                   {   'direction': 'out',
+                                                       'documentation': {'description': 'Returns the value of the attribute.'},
+                                                       'enum': None,
+                                                       'name': 'attributeValue',
+                                                       'type': 'ViSession'}],
+                                 'returns': 'ViStatus'},
+    'GetAttributeViString': {   'blocking': False,
+                                'codegen_method': 'private',
+                                'documentation': {'description': 'Queries the value of a ViBoolean attribute.'},
+                                'has_repeated_capability': True,
+                                'invalidates_attribute_cache': False,
+                                'is_error_handling': False,
+                                'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                'name': 'GetAttributeViString',
+                                'parameters': [   {   'ctypes_type': 'ViSession',
+                                                      'ctypes_type_library_call': 'ViSession',
+                                                      'ctypes_variable_name': 'vi_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {'description': 'Identifies a particular instrument session.'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': True,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'vi_ctype',
+                                                      'name': 'vi',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'vi',
+                                                      'python_name_or_default_for_init': 'vi',
+                                                      'python_name_with_default': 'vi',
+                                                      'python_name_with_doc_default': 'vi',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViSession',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViConstString',
+                                                      'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                      'ctypes_variable_name': 'channel_name_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {'description': 'This is the channel(s) that this function will apply to.'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': True,
+                                                      'is_session_handle': False,
+                                                      'is_string': True,
+                                                      'library_method_call_snippet': 'channel_name_ctype',
+                                                      'name': 'channelName',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'channel_name',
+                                                      'python_name_or_default_for_init': 'channel_name',
+                                                      'python_name_with_default': 'channel_name',
+                                                      'python_name_with_doc_default': 'channel_name',
+                                                      'python_type': 'str',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViConstString',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViAttr',
+                                                      'ctypes_type_library_call': 'ViAttr',
+                                                      'ctypes_variable_name': 'attribute_id_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {'description': 'Pass the ID of an attribute.'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'attribute_id_ctype',
+                                                      'name': 'attributeId',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'attribute_id',
+                                                      'python_name_or_default_for_init': 'attribute_id',
+                                                      'python_name_with_default': 'attribute_id',
+                                                      'python_name_with_doc_default': 'attribute_id',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViAttr',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViInt32',
+                                                      'ctypes_type_library_call': 'ViInt32',
+                                                      'ctypes_variable_name': 'buffer_size_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {'description': 'Number of bytes in attributeValue. You can IVI-dance with this.'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'buffer_size_ctype',
+                                                      'name': 'bufferSize',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'buffer_size',
+                                                      'python_name_or_default_for_init': 'buffer_size',
+                                                      'python_name_with_default': 'buffer_size',
+                                                      'python_name_with_doc_default': 'buffer_size',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViInt32',
+                                                      'use_array': False,
+                                                      'use_in_python_api': False,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViChar[]',
+                                                      'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                      'ctypes_variable_name': 'attribute_value_ctype',
+                                                      'direction': 'out',
+                                                      'documentation': {'description': 'Returns the value of the attribute.'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': True,
+                                                      'library_method_call_snippet': 'attribute_value_ctype',
+                                                      'name': 'attributeValue',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'attribute_value',
+                                                      'python_name_or_default_for_init': 'attribute_value',
+                                                      'python_name_with_default': 'attribute_value',
+                                                      'python_name_with_doc_default': 'attribute_value',
+                                                      'python_type': 'str',
+                                                      'size': {'mechanism': 'ivi-dance', 'value': 'bufferSize'},
+                                                      'type': 'ViChar[]',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False}],
+                                'python_code_variables': [],
+                                'python_name': '_get_attribute_vi_string',
+                                'render_in_library': True,
+                                'render_in_session_base': True,
+                                'returns': 'ViStatus'},
+    'GetCalDateAndTime': {   'blocking': False,
+                             'codegen_method': 'private',
+                             'documentation': {'description': 'Returns the date and time of the last calibration performed.'},
+                             'has_repeated_capability': False,
+                             'invalidates_attribute_cache': False,
+                             'is_error_handling': False,
+                             'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                             'name': 'GetCalDateAndTime',
+                             'parameters': [   {   'ctypes_type': 'ViSession',
+                                                   'ctypes_type_library_call': 'ViSession',
+                                                   'ctypes_variable_name': 'vi_ctype',
+                                                   'direction': 'in',
+                                                   'documentation': {'description': 'Identifies a particular instrument session.'},
+                                                   'enum': None,
+                                                   'is_buffer': False,
+                                                   'is_repeated_capability': False,
+                                                   'is_session_handle': True,
+                                                   'is_string': False,
+                                                   'library_method_call_snippet': 'vi_ctype',
+                                                   'name': 'vi',
+                                                   'numpy': False,
+                                                   'numpy_into_return': False,
+                                                   'python_name': 'vi',
+                                                   'python_name_or_default_for_init': 'vi',
+                                                   'python_name_with_default': 'vi',
+                                                   'python_name_with_doc_default': 'vi',
+                                                   'python_type': 'int',
+                                                   'size': {'mechanism': 'fixed', 'value': 1},
+                                                   'type': 'ViSession',
+                                                   'use_array': False,
+                                                   'use_in_python_api': True,
+                                                   'use_list': False},
+                                               {   'ctypes_type': 'ViInt32',
+                                                   'ctypes_type_library_call': 'ViInt32',
+                                                   'ctypes_variable_name': 'cal_type_ctype',
+                                                   'direction': 'in',
+                                                   'documentation': {'description': 'Specifies the type of calibration performed (external or self-calibration).'},
+                                                   'enum': None,
+                                                   'is_buffer': False,
+                                                   'is_repeated_capability': False,
+                                                   'is_session_handle': False,
+                                                   'is_string': False,
+                                                   'library_method_call_snippet': 'cal_type_ctype',
+                                                   'name': 'calType',
+                                                   'numpy': False,
+                                                   'numpy_into_return': False,
+                                                   'python_name': 'cal_type',
+                                                   'python_name_or_default_for_init': 'cal_type',
+                                                   'python_name_with_default': 'cal_type',
+                                                   'python_name_with_doc_default': 'cal_type',
+                                                   'python_type': 'int',
+                                                   'size': {'mechanism': 'fixed', 'value': 1},
+                                                   'type': 'ViInt32',
+                                                   'use_array': False,
+                                                   'use_in_python_api': True,
+                                                   'use_list': False},
+                                               {   'ctypes_type': 'ViInt32',
+                                                   'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                                   'ctypes_variable_name': 'month_ctype',
+                                                   'direction': 'out',
+                                                   'documentation': {'description': 'Indicates the **month** of the last calibration.'},
+                                                   'enum': None,
+                                                   'is_buffer': False,
+                                                   'is_repeated_capability': False,
+                                                   'is_session_handle': False,
+                                                   'is_string': False,
+                                                   'library_method_call_snippet': 'None if month_ctype is None else (ctypes.pointer(month_ctype))',
+                                                   'name': 'Month',
+                                                   'numpy': False,
+                                                   'numpy_into_return': False,
+                                                   'python_name': 'month',
+                                                   'python_name_or_default_for_init': 'month',
+                                                   'python_name_with_default': 'month',
+                                                   'python_name_with_doc_default': 'month',
+                                                   'python_type': 'int',
+                                                   'size': {'mechanism': 'fixed', 'value': 1},
+                                                   'type': 'ViInt32',
+                                                   'use_array': False,
+                                                   'use_in_python_api': True,
+                                                   'use_list': False},
+                                               {   'ctypes_type': 'ViInt32',
+                                                   'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                                   'ctypes_variable_name': 'day_ctype',
+                                                   'direction': 'out',
+                                                   'documentation': {'description': 'Indicates the **day** of the last calibration.'},
+                                                   'enum': None,
+                                                   'is_buffer': False,
+                                                   'is_repeated_capability': False,
+                                                   'is_session_handle': False,
+                                                   'is_string': False,
+                                                   'library_method_call_snippet': 'None if day_ctype is None else (ctypes.pointer(day_ctype))',
+                                                   'name': 'Day',
+                                                   'numpy': False,
+                                                   'numpy_into_return': False,
+                                                   'python_name': 'day',
+                                                   'python_name_or_default_for_init': 'day',
+                                                   'python_name_with_default': 'day',
+                                                   'python_name_with_doc_default': 'day',
+                                                   'python_type': 'int',
+                                                   'size': {'mechanism': 'fixed', 'value': 1},
+                                                   'type': 'ViInt32',
+                                                   'use_array': False,
+                                                   'use_in_python_api': True,
+                                                   'use_list': False},
+                                               {   'ctypes_type': 'ViInt32',
+                                                   'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                                   'ctypes_variable_name': 'year_ctype',
+                                                   'direction': 'out',
+                                                   'documentation': {'description': 'Indicates the **year** of the last calibration.'},
+                                                   'enum': None,
+                                                   'is_buffer': False,
+                                                   'is_repeated_capability': False,
+                                                   'is_session_handle': False,
+                                                   'is_string': False,
+                                                   'library_method_call_snippet': 'None if year_ctype is None else (ctypes.pointer(year_ctype))',
+                                                   'name': 'Year',
+                                                   'numpy': False,
+                                                   'numpy_into_return': False,
+                                                   'python_name': 'year',
+                                                   'python_name_or_default_for_init': 'year',
+                                                   'python_name_with_default': 'year',
+                                                   'python_name_with_doc_default': 'year',
+                                                   'python_type': 'int',
+                                                   'size': {'mechanism': 'fixed', 'value': 1},
+                                                   'type': 'ViInt32',
+                                                   'use_array': False,
+                                                   'use_in_python_api': True,
+                                                   'use_list': False},
+                                               {   'ctypes_type': 'ViInt32',
+                                                   'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                                   'ctypes_variable_name': 'hour_ctype',
+                                                   'direction': 'out',
+                                                   'documentation': {'description': 'Indicates the **hour** of the last calibration.'},
+                                                   'enum': None,
+                                                   'is_buffer': False,
+                                                   'is_repeated_capability': False,
+                                                   'is_session_handle': False,
+                                                   'is_string': False,
+                                                   'library_method_call_snippet': 'None if hour_ctype is None else (ctypes.pointer(hour_ctype))',
+                                                   'name': 'Hour',
+                                                   'numpy': False,
+                                                   'numpy_into_return': False,
+                                                   'python_name': 'hour',
+                                                   'python_name_or_default_for_init': 'hour',
+                                                   'python_name_with_default': 'hour',
+                                                   'python_name_with_doc_default': 'hour',
+                                                   'python_type': 'int',
+                                                   'size': {'mechanism': 'fixed', 'value': 1},
+                                                   'type': 'ViInt32',
+                                                   'use_array': False,
+                                                   'use_in_python_api': True,
+                                                   'use_list': False},
+                                               {   'ctypes_type': 'ViInt32',
+                                                   'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                                   'ctypes_variable_name': 'minute_ctype',
+                                                   'direction': 'out',
+                                                   'documentation': {'description': 'Indicates the **minute** of the last calibration.'},
+                                                   'enum': None,
+                                                   'is_buffer': False,
+                                                   'is_repeated_capability': False,
+                                                   'is_session_handle': False,
+                                                   'is_string': False,
+                                                   'library_method_call_snippet': 'None if minute_ctype is None else (ctypes.pointer(minute_ctype))',
+                                                   'name': 'Minute',
+                                                   'numpy': False,
+                                                   'numpy_into_return': False,
+                                                   'python_name': 'minute',
+                                                   'python_name_or_default_for_init': 'minute',
+                                                   'python_name_with_default': 'minute',
+                                                   'python_name_with_doc_default': 'minute',
+                                                   'python_type': 'int',
+                                                   'size': {'mechanism': 'fixed', 'value': 1},
+                                                   'type': 'ViInt32',
+                                                   'use_array': False,
+                                                   'use_in_python_api': True,
+                                                   'use_list': False}],
+                             'python_code_variables': [],
+                             'python_name': '_get_cal_date_and_time',
+                             'render_in_library': True,
+                             'render_in_session_base': False,
+                             'returns': 'ViStatus'},
+    'GetCustomType': {   'blocking': False,
+                         'codegen_method': 'public',
+                         'documentation': {'description': 'This function returns a custom type.'},
+                         'has_repeated_capability': False,
+                         'invalidates_attribute_cache': False,
+                         'is_error_handling': False,
+                         'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                         'name': 'GetCustomType',
+                         'parameters': [   {   'ctypes_type': 'ViSession',
+                                               'ctypes_type_library_call': 'ViSession',
+                                               'ctypes_variable_name': 'vi_ctype',
+                                               'direction': 'in',
+                                               'documentation': {'description': 'Identifies a particular instrument session.'},
+                                               'enum': None,
+                                               'is_buffer': False,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': True,
+                                               'is_string': False,
+                                               'library_method_call_snippet': 'vi_ctype',
+                                               'name': 'vi',
+                                               'numpy': False,
+                                               'numpy_into_return': False,
+                                               'python_name': 'vi',
+                                               'python_name_or_default_for_init': 'vi',
+                                               'python_name_with_default': 'vi',
+                                               'python_name_with_doc_default': 'vi',
+                                               'python_type': 'int',
+                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                               'type': 'ViSession',
+                                               'use_array': False,
+                                               'use_in_python_api': True,
+                                               'use_list': False},
+                                           {   'ctypes_type': 'custom_struct',
+                                               'ctypes_type_library_call': 'ctypes.POINTER(custom_struct.custom_struct)',
+                                               'ctypes_variable_name': 'cs_ctype',
+                                               'direction': 'out',
+                                               'documentation': {'description': 'Set using custom type'},
+                                               'enum': None,
+                                               'is_buffer': False,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': False,
+                                               'is_string': False,
+                                               'library_method_call_snippet': 'None if cs_ctype is None else (ctypes.pointer(cs_ctype))',
+                                               'name': 'cs',
+                                               'numpy': False,
+                                               'numpy_into_return': False,
+                                               'python_name': 'cs',
+                                               'python_name_or_default_for_init': 'cs',
+                                               'python_name_with_default': 'cs',
+                                               'python_name_with_doc_default': 'cs',
+                                               'python_type': 'CustomStruct',
+                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                               'type': 'custom_struct',
+                                               'use_array': False,
+                                               'use_in_python_api': True,
+                                               'use_list': False}],
+                         'python_code_variables': [],
+                         'python_name': 'get_custom_type',
+                         'render_in_library': True,
+                         'render_in_session_base': False,
+                         'returns': 'ViStatus'},
+    'GetCustomTypeArray': {   'blocking': False,
+                              'codegen_method': 'public',
+                              'documentation': {'description': 'This function returns a custom type.'},
+                              'has_repeated_capability': False,
+                              'invalidates_attribute_cache': False,
+                              'is_error_handling': False,
+                              'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                              'name': 'GetCustomTypeArray',
+                              'parameters': [   {   'ctypes_type': 'ViSession',
+                                                    'ctypes_type_library_call': 'ViSession',
+                                                    'ctypes_variable_name': 'vi_ctype',
+                                                    'direction': 'in',
+                                                    'documentation': {'description': 'Identifies a particular instrument session.'},
+                                                    'enum': None,
+                                                    'is_buffer': False,
+                                                    'is_repeated_capability': False,
+                                                    'is_session_handle': True,
+                                                    'is_string': False,
+                                                    'library_method_call_snippet': 'vi_ctype',
+                                                    'name': 'vi',
+                                                    'numpy': False,
+                                                    'numpy_into_return': False,
+                                                    'python_name': 'vi',
+                                                    'python_name_or_default_for_init': 'vi',
+                                                    'python_name_with_default': 'vi',
+                                                    'python_name_with_doc_default': 'vi',
+                                                    'python_type': 'int',
+                                                    'size': {'mechanism': 'fixed', 'value': 1},
+                                                    'type': 'ViSession',
+                                                    'use_array': False,
+                                                    'use_in_python_api': True,
+                                                    'use_list': False},
+                                                {   'ctypes_type': 'ViInt32',
+                                                    'ctypes_type_library_call': 'ViInt32',
+                                                    'ctypes_variable_name': 'number_of_elements_ctype',
+                                                    'direction': 'in',
+                                                    'documentation': {'description': 'Number of elements in the array.'},
+                                                    'enum': None,
+                                                    'is_buffer': False,
+                                                    'is_repeated_capability': False,
+                                                    'is_session_handle': False,
+                                                    'is_string': False,
+                                                    'library_method_call_snippet': 'number_of_elements_ctype',
+                                                    'name': 'numberOfElements',
+                                                    'numpy': False,
+                                                    'numpy_into_return': False,
+                                                    'python_name': 'number_of_elements',
+                                                    'python_name_or_default_for_init': 'number_of_elements',
+                                                    'python_name_with_default': 'number_of_elements',
+                                                    'python_name_with_doc_default': 'number_of_elements',
+                                                    'python_type': 'int',
+                                                    'size': {'mechanism': 'fixed', 'value': 1},
+                                                    'type': 'ViInt32',
+                                                    'use_array': False,
+                                                    'use_in_python_api': True,
+                                                    'use_list': False},
+                                                {   'ctypes_type': 'custom_struct',
+                                                    'ctypes_type_library_call': 'ctypes.POINTER(custom_struct.custom_struct)',
+                                                    'ctypes_variable_name': 'cs_ctype',
+                                                    'direction': 'out',
+                                                    'documentation': {'description': 'Get using custom type'},
+                                                    'enum': None,
+                                                    'is_buffer': True,
+                                                    'is_repeated_capability': False,
+                                                    'is_session_handle': False,
+                                                    'is_string': False,
+                                                    'library_method_call_snippet': 'cs_ctype',
+                                                    'name': 'cs',
+                                                    'numpy': False,
+                                                    'numpy_into_return': False,
+                                                    'original_type': 'custom_struct[]',
+                                                    'python_name': 'cs',
+                                                    'python_name_or_default_for_init': 'cs',
+                                                    'python_name_with_default': 'cs',
+                                                    'python_name_with_doc_default': 'cs',
+                                                    'python_type': 'CustomStruct',
+                                                    'size': {'mechanism': 'passed-in', 'value': 'numberOfElements'},
+                                                    'type': 'custom_struct',
+                                                    'use_array': False,
+                                                    'use_in_python_api': True,
+                                                    'use_list': True}],
+                              'python_code_variables': [],
+                              'python_name': 'get_custom_type_array',
+                              'render_in_library': True,
+                              'render_in_session_base': False,
+                              'returns': 'ViStatus'},
+    'GetEnumValue': {   'blocking': False,
+                        'codegen_method': 'public',
+                        'documentation': {'description': 'Returns an enum value', 'note': 'Splinter is not supported.'},
+                        'has_repeated_capability': False,
+                        'invalidates_attribute_cache': False,
+                        'is_error_handling': False,
+                        'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                        'name': 'GetEnumValue',
+                        'parameters': [   {   'ctypes_type': 'ViSession',
+                                              'ctypes_type_library_call': 'ViSession',
+                                              'ctypes_variable_name': 'vi_ctype',
+                                              'direction': 'in',
+                                              'documentation': {'description': 'Identifies a particular instrument session.'},
+                                              'enum': None,
+                                              'is_buffer': False,
+                                              'is_repeated_capability': False,
+                                              'is_session_handle': True,
+                                              'is_string': False,
+                                              'library_method_call_snippet': 'vi_ctype',
+                                              'name': 'vi',
+                                              'numpy': False,
+                                              'numpy_into_return': False,
+                                              'python_name': 'vi',
+                                              'python_name_or_default_for_init': 'vi',
+                                              'python_name_with_default': 'vi',
+                                              'python_name_with_doc_default': 'vi',
+                                              'python_type': 'int',
+                                              'size': {'mechanism': 'fixed', 'value': 1},
+                                              'type': 'ViSession',
+                                              'use_array': False,
+                                              'use_in_python_api': True,
+                                              'use_list': False},
+                                          {   'ctypes_type': 'ViInt32',
+                                              'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                              'ctypes_variable_name': 'a_quantity_ctype',
+                                              'direction': 'out',
+                                              'documentation': {'description': 'This is an amount.', 'note': 'The amount will be between -2^31 and (2^31-1)'},
+                                              'enum': None,
+                                              'is_buffer': False,
+                                              'is_repeated_capability': False,
+                                              'is_session_handle': False,
+                                              'is_string': False,
+                                              'library_method_call_snippet': 'None if a_quantity_ctype is None else (ctypes.pointer(a_quantity_ctype))',
+                                              'name': 'aQuantity',
+                                              'numpy': False,
+                                              'numpy_into_return': False,
+                                              'python_name': 'a_quantity',
+                                              'python_name_or_default_for_init': 'a_quantity',
+                                              'python_name_with_default': 'a_quantity',
+                                              'python_name_with_doc_default': 'a_quantity',
+                                              'python_type': 'int',
+                                              'size': {'mechanism': 'fixed', 'value': 1},
+                                              'type': 'ViInt32',
+                                              'use_array': False,
+                                              'use_in_python_api': True,
+                                              'use_list': False},
+                                          {   'ctypes_type': 'ViInt16',
+                                              'ctypes_type_library_call': 'ctypes.POINTER(ViInt16)',
+                                              'ctypes_variable_name': 'a_turtle_ctype',
+                                              'direction': 'out',
+                                              'documentation': {   'description': 'Indicates a ninja turtle',
+                                                                   'table_body': [['0', 'Leonardo'], ['1', 'Donatello'], ['2', 'Raphael'], ['3', 'Mich elangelo']]},
+                                              'enum': 'Turtle',
+                                              'is_buffer': False,
+                                              'is_repeated_capability': False,
+                                              'is_session_handle': False,
+                                              'is_string': False,
+                                              'library_method_call_snippet': 'None if a_turtle_ctype is None else (ctypes.pointer(a_turtle_ctype))',
+                                              'name': 'aTurtle',
+                                              'numpy': False,
+                                              'numpy_into_return': False,
+                                              'python_name': 'a_turtle',
+                                              'python_name_or_default_for_init': 'a_turtle',
+                                              'python_name_with_default': 'a_turtle',
+                                              'python_name_with_doc_default': 'a_turtle',
+                                              'python_type': 'enums.Turtle',
+                                              'size': {'mechanism': 'fixed', 'value': 1},
+                                              'type': 'ViInt16',
+                                              'use_array': False,
+                                              'use_in_python_api': True,
+                                              'use_list': False}],
+                        'python_code_variables': [],
+                        'python_name': 'get_enum_value',
+                        'render_in_library': True,
+                        'render_in_session_base': False,
+                        'returns': 'ViStatus'},
+    'GetError': {   'blocking': False,
+                    'codegen_method': 'private',
+                    'documentation': {'description': 'Returns the error information associated with the session.'},
+                    'has_repeated_capability': False,
+                    'invalidates_attribute_cache': False,
+                    'is_error_handling': True,
+                    'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                    'name': 'GetError',
+                    'parameters': [   {   'ctypes_type': 'ViSession',
+                                          'ctypes_type_library_call': 'ViSession',
+                                          'ctypes_variable_name': 'vi_ctype',
+                                          'direction': 'in',
+                                          'documentation': {'description': 'Identifies a particular instrument session.'},
+                                          'enum': None,
+                                          'is_buffer': False,
+                                          'is_repeated_capability': False,
+                                          'is_session_handle': True,
+                                          'is_string': False,
+                                          'library_method_call_snippet': 'vi_ctype',
+                                          'name': 'vi',
+                                          'numpy': False,
+                                          'numpy_into_return': False,
+                                          'python_name': 'vi',
+                                          'python_name_or_default_for_init': 'vi',
+                                          'python_name_with_default': 'vi',
+                                          'python_name_with_doc_default': 'vi',
+                                          'python_type': 'int',
+                                          'size': {'mechanism': 'fixed', 'value': 1},
+                                          'type': 'ViSession',
+                                          'use_array': False,
+                                          'use_in_python_api': True,
+                                          'use_list': False},
+                                      {   'ctypes_type': 'ViStatus',
+                                          'ctypes_type_library_call': 'ctypes.POINTER(ViStatus)',
+                                          'ctypes_variable_name': 'error_code_ctype',
+                                          'direction': 'out',
+                                          'documentation': {'description': 'Returns errorCode for the session. If you pass 0 for bufferSize, you can pass VI_NULL for this.'},
+                                          'enum': None,
+                                          'is_buffer': False,
+                                          'is_repeated_capability': False,
+                                          'is_session_handle': False,
+                                          'is_string': False,
+                                          'library_method_call_snippet': 'None if error_code_ctype is None else (ctypes.pointer(error_code_ctype))',
+                                          'name': 'errorCode',
+                                          'numpy': False,
+                                          'numpy_into_return': False,
+                                          'python_name': 'error_code',
+                                          'python_name_or_default_for_init': 'error_code',
+                                          'python_name_with_default': 'error_code',
+                                          'python_name_with_doc_default': 'error_code',
+                                          'python_type': 'int',
+                                          'size': {'mechanism': 'fixed', 'value': 1},
+                                          'type': 'ViStatus',
+                                          'use_array': False,
+                                          'use_in_python_api': True,
+                                          'use_list': False},
+                                      {   'ctypes_type': 'ViInt32',
+                                          'ctypes_type_library_call': 'ViInt32',
+                                          'ctypes_variable_name': 'buffer_size_ctype',
+                                          'direction': 'in',
+                                          'documentation': {'description': 'Number of bytes in description buffer.'},
+                                          'enum': None,
+                                          'is_buffer': False,
+                                          'is_repeated_capability': False,
+                                          'is_session_handle': False,
+                                          'is_string': False,
+                                          'library_method_call_snippet': 'buffer_size_ctype',
+                                          'name': 'bufferSize',
+                                          'numpy': False,
+                                          'numpy_into_return': False,
+                                          'python_name': 'buffer_size',
+                                          'python_name_or_default_for_init': 'buffer_size',
+                                          'python_name_with_default': 'buffer_size',
+                                          'python_name_with_doc_default': 'buffer_size',
+                                          'python_type': 'int',
+                                          'size': {'mechanism': 'fixed', 'value': 1},
+                                          'type': 'ViInt32',
+                                          'use_array': False,
+                                          'use_in_python_api': False,
+                                          'use_list': False},
+                                      {   'ctypes_type': 'ViChar[]',
+                                          'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                          'ctypes_variable_name': 'description_ctype',
+                                          'direction': 'out',
+                                          'documentation': {'description': 'At least bufferSize big, string comes out here.'},
+                                          'enum': None,
+                                          'is_buffer': False,
+                                          'is_repeated_capability': False,
+                                          'is_session_handle': False,
+                                          'is_string': True,
+                                          'library_method_call_snippet': 'description_ctype',
+                                          'name': 'description',
+                                          'numpy': False,
+                                          'numpy_into_return': False,
+                                          'python_name': 'description',
+                                          'python_name_or_default_for_init': 'description',
+                                          'python_name_with_default': 'description',
+                                          'python_name_with_doc_default': 'description',
+                                          'python_type': 'str',
+                                          'size': {'mechanism': 'ivi-dance', 'value': 'bufferSize'},
+                                          'type': 'ViChar[]',
+                                          'use_array': False,
+                                          'use_in_python_api': True,
+                                          'use_list': False}],
+                    'python_code_variables': [],
+                    'python_name': '_get_error',
+                    'render_in_library': True,
+                    'render_in_session_base': True,
+                    'returns': 'ViStatus'},
+    'GetErrorMessage': {   'codegen_method': 'no',
+                           'documentation': {'description': 'Returns the errorMessage as a user-readable string. Uses IVI-dance'},
+                           'parameters': [   {'direction': 'in', 'documentation': {'description': 'Identifies a particular instrument session.'}, 'enum': None, 'name': 'vi', 'type': 'ViSession'},
+                                             {   'direction': 'in',
+                                                 'documentation': {'description': 'The error code returned for which you want to get a string.'},
+                                                 'enum': None,
+                                                 'name': 'errorCode',
+                                                 'type': 'ViStatus'},
+                                             {   'direction': 'in',
+                                                 'documentation': {'description': 'Number of bytes allocated for errorMessage'},
+                                                 'enum': None,
+                                                 'name': 'buffer_size',
+                                                 'type': 'ViInt32'},
+                                             {   'direction': 'out',
+                                                 'documentation': {'description': 'Error information formatted into a user-readable string.'},
+                                                 'enum': None,
+                                                 'name': 'errorMessage',
+                                                 'type': 'ViChar[]'}],
+                           'returns': 'ViStatus'},
+    'GetLastCalDateAndTime': {   'blocking': False,
+                                 'codegen_method': 'public',
+                                 'documentation': {'description': 'Returns the date and time of the last calibration performed.'},
+                                 'has_repeated_capability': False,
+                                 'invalidates_attribute_cache': False,
+                                 'is_error_handling': False,
+                                 'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/datetime_wrappers'}],
+                                 'name': 'GetLastCalDateAndTime',
+                                 'parameters': [   {   'ctypes_type': 'ViSession',
+                                                       'ctypes_type_library_call': 'ViSession',
+                                                       'ctypes_variable_name': 'vi_ctype',
+                                                       'direction': 'in',
+                                                       'documentation': {'description': 'Identifies a particular instrument session.'},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': True,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'vi_ctype',
+                                                       'name': 'vi',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'vi',
+                                                       'python_name_or_default_for_init': 'vi',
+                                                       'python_name_with_default': 'vi',
+                                                       'python_name_with_doc_default': 'vi',
+                                                       'python_type': 'int',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViSession',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False},
+                                                   {   'ctypes_type': 'ViInt32',
+                                                       'ctypes_type_library_call': 'ViInt32',
+                                                       'ctypes_variable_name': 'cal_type_ctype',
+                                                       'direction': 'in',
+                                                       'documentation': {'description': 'Specifies the type of calibration performed (external or self-calibration).'},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': False,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'cal_type_ctype',
+                                                       'name': 'calType',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'cal_type',
+                                                       'python_name_or_default_for_init': 'cal_type',
+                                                       'python_name_with_default': 'cal_type',
+                                                       'python_name_with_doc_default': 'cal_type',
+                                                       'python_type': 'int',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViInt32',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False},
+                                                   {   'ctypes_type': 'datetime.datetime',
+                                                       'ctypes_type_library_call': 'ctypes.POINTER(datetime.datetime)',
+                                                       'ctypes_variable_name': 'month_ctype',
+                                                       'direction': 'out',
+                                                       'documentation': {'description': 'Indicates date and time of the last calibration.'},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': False,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'None if month_ctype is None else (ctypes.pointer(month_ctype))',
+                                                       'name': 'Month',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'month',
+                                                       'python_name_or_default_for_init': 'month',
+                                                       'python_name_with_default': 'month',
+                                                       'python_name_with_doc_default': 'month',
+                                                       'python_type': 'datetime.datetime',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'datetime.datetime',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False}],
+                                 'python_code_variables': [],
+                                 'python_name': 'get_cal_date_and_time',
+                                 'real_datetime_call': 'GetCalDateAndTime',
+                                 'render_in_library': False,
+                                 'render_in_session_base': False,
+                                 'returns': 'ViStatus'},
+    'InitWithOptions': {   'blocking': False,
+                           'codegen_method': 'private',
+                           'documentation': {'description': 'Creates a new IVI instrument driver session.'},
+                           'has_repeated_capability': False,
+                           'invalidates_attribute_cache': False,
+                           'is_error_handling': False,
+                           'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                           'name': 'InitWithOptions',
+                           'parameters': [   {   'ctypes_type': 'ViString',
+                                                 'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                 'ctypes_variable_name': 'resource_name_ctype',
+                                                 'direction': 'in',
+                                                 'documentation': {'caution': 'This is just some string.', 'description': 'Contains the **resource_name** of the device to initialize.'},
+                                                 'enum': None,
+                                                 'is_buffer': False,
+                                                 'is_repeated_capability': False,
+                                                 'is_session_handle': False,
+                                                 'is_string': True,
+                                                 'library_method_call_snippet': 'resource_name_ctype',
+                                                 'name': 'resourceName',
+                                                 'numpy': False,
+                                                 'numpy_into_return': False,
+                                                 'python_name': 'resource_name',
+                                                 'python_name_or_default_for_init': 'resource_name',
+                                                 'python_name_with_default': 'resource_name',
+                                                 'python_name_with_doc_default': 'resource_name',
+                                                 'python_type': 'str',
+                                                 'size': {'mechanism': 'fixed', 'value': 1},
+                                                 'type': 'ViString',
+                                                 'use_array': False,
+                                                 'use_in_python_api': True,
+                                                 'use_list': False},
+                                             {   'ctypes_type': 'ViBoolean',
+                                                 'ctypes_type_library_call': 'ViBoolean',
+                                                 'ctypes_variable_name': 'id_query_ctype',
+                                                 'default_value': False,
+                                                 'direction': 'in',
+                                                 'documentation': {   'description': 'NI-FAKE is probably not needed.',
+                                                                      'table_body': [['VI_TRUE (default)', '1', 'Perform ID Query'], ['VI_FALSE', '0', 'Skip ID Query']]},
+                                                 'enum': None,
+                                                 'is_buffer': False,
+                                                 'is_repeated_capability': False,
+                                                 'is_session_handle': False,
+                                                 'is_string': False,
+                                                 'library_method_call_snippet': 'id_query_ctype',
+                                                 'name': 'idQuery',
+                                                 'numpy': False,
+                                                 'numpy_into_return': False,
+                                                 'python_name': 'id_query',
+                                                 'python_name_or_default_for_init': 'False',
+                                                 'python_name_with_default': 'id_query=False',
+                                                 'python_name_with_doc_default': 'id_query=False',
+                                                 'python_type': 'bool',
+                                                 'size': {'mechanism': 'fixed', 'value': 1},
+                                                 'type': 'ViBoolean',
+                                                 'use_array': False,
+                                                 'use_in_python_api': False,
+                                                 'use_list': False},
+                                             {   'ctypes_type': 'ViBoolean',
+                                                 'ctypes_type_library_call': 'ViBoolean',
+                                                 'ctypes_variable_name': 'reset_device_ctype',
+                                                 'default_value': False,
+                                                 'direction': 'in',
+                                                 'documentation': {   'description': 'Specifies whether to reset',
+                                                                      'table_body': [['VI_TRUE (default)', '1', 'Reset Device'], ['VI_FALSE', '0', "Don't Reset"]]},
+                                                 'enum': None,
+                                                 'is_buffer': False,
+                                                 'is_repeated_capability': False,
+                                                 'is_session_handle': False,
+                                                 'is_string': False,
+                                                 'library_method_call_snippet': 'reset_device_ctype',
+                                                 'name': 'resetDevice',
+                                                 'numpy': False,
+                                                 'numpy_into_return': False,
+                                                 'python_name': 'reset_device',
+                                                 'python_name_or_default_for_init': 'reset_device',
+                                                 'python_name_with_default': 'reset_device=False',
+                                                 'python_name_with_doc_default': 'reset_device=False',
+                                                 'python_type': 'bool',
+                                                 'size': {'mechanism': 'fixed', 'value': 1},
+                                                 'type': 'ViBoolean',
+                                                 'use_array': False,
+                                                 'use_in_python_api': True,
+                                                 'use_list': False},
+                                             {   'ctypes_type': 'ViString',
+                                                 'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                 'ctypes_variable_name': 'option_string_ctype',
+                                                 'direction': 'in',
+                                                 'documentation': {'description': 'Some options'},
+                                                 'enum': None,
+                                                 'is_buffer': False,
+                                                 'is_repeated_capability': False,
+                                                 'is_session_handle': False,
+                                                 'is_string': True,
+                                                 'library_method_call_snippet': 'option_string_ctype',
+                                                 'name': 'optionString',
+                                                 'numpy': False,
+                                                 'numpy_into_return': False,
+                                                 'python_api_converter_name': 'convert_init_with_options_dictionary',
+                                                 'python_name': 'option_string',
+                                                 'python_name_or_default_for_init': 'option_string',
+                                                 'python_name_with_default': 'option_string',
+                                                 'python_name_with_doc_default': 'option_string',
+                                                 'python_type': 'dict',
+                                                 'size': {'mechanism': 'fixed', 'value': 1},
+                                                 'type': 'ViString',
+                                                 'use_array': False,
+                                                 'use_in_python_api': True,
+                                                 'use_list': False},
+                                             {   'ctypes_type': 'ViSession',
+                                                 'ctypes_type_library_call': 'ctypes.POINTER(ViSession)',
+                                                 'ctypes_variable_name': 'vi_ctype',
+                                                 'direction': 'out',
+                                                 'documentation': {'description': 'Returns a ViSession handle that you use.'},
+                                                 'enum': None,
+                                                 'is_buffer': False,
+                                                 'is_repeated_capability': False,
+                                                 'is_session_handle': False,
+                                                 'is_string': False,
+                                                 'library_method_call_snippet': 'None if vi_ctype is None else (ctypes.pointer(vi_ctype))',
+                                                 'name': 'vi',
+                                                 'numpy': False,
+                                                 'numpy_into_return': False,
+                                                 'python_name': 'vi',
+                                                 'python_name_or_default_for_init': 'vi',
+                                                 'python_name_with_default': 'vi',
+                                                 'python_name_with_doc_default': 'vi',
+                                                 'python_type': 'int',
+                                                 'size': {'mechanism': 'fixed', 'value': 1},
+                                                 'type': 'ViSession',
+                                                 'use_array': False,
+                                                 'use_in_python_api': True,
+                                                 'use_list': False}],
+                           'python_code_variables': [],
+                           'python_name': '_init_with_options',
+                           'render_in_library': True,
+                           'render_in_session_base': False,
+                           'returns': 'ViStatus'},
+    'Initiate': {   'blocking': False,
+                    'codegen_method': 'private',
+                    'documentation': {'description': 'Initiates a thingie.'},
+                    'has_repeated_capability': False,
+                    'invalidates_attribute_cache': False,
+                    'is_error_handling': False,
+                    'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                    'name': 'Initiate',
+                    'parameters': [   {   'ctypes_type': 'ViSession',
+                                          'ctypes_type_library_call': 'ViSession',
+                                          'ctypes_variable_name': 'vi_ctype',
+                                          'direction': 'in',
+                                          'documentation': {'description': 'Identifies a particular instrument session.'},
+                                          'enum': None,
+                                          'is_buffer': False,
+                                          'is_repeated_capability': False,
+                                          'is_session_handle': True,
+                                          'is_string': False,
+                                          'library_method_call_snippet': 'vi_ctype',
+                                          'name': 'vi',
+                                          'numpy': False,
+                                          'numpy_into_return': False,
+                                          'python_name': 'vi',
+                                          'python_name_or_default_for_init': 'vi',
+                                          'python_name_with_default': 'vi',
+                                          'python_name_with_doc_default': 'vi',
+                                          'python_type': 'int',
+                                          'size': {'mechanism': 'fixed', 'value': 1},
+                                          'type': 'ViSession',
+                                          'use_array': False,
+                                          'use_in_python_api': True,
+                                          'use_list': False}],
+                    'python_code_variables': [],
+                    'python_name': '_initiate',
+                    'render_in_library': True,
+                    'render_in_session_base': False,
+                    'returns': 'ViStatus'},
+    'MultipleArrayTypes': {   'blocking': False,
+                              'codegen_method': 'public',
+                              'documentation': {'description': 'Receives and returns multiple types of arrays.'},
+                              'has_repeated_capability': False,
+                              'invalidates_attribute_cache': False,
+                              'is_error_handling': False,
+                              'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                              'name': 'MultipleArrayTypes',
+                              'parameters': [   {   'ctypes_type': 'ViSession',
+                                                    'ctypes_type_library_call': 'ViSession',
+                                                    'ctypes_variable_name': 'vi_ctype',
+                                                    'direction': 'in',
+                                                    'documentation': {'description': 'Identifies a particular instrument session.'},
+                                                    'enum': None,
+                                                    'is_buffer': False,
+                                                    'is_repeated_capability': False,
+                                                    'is_session_handle': True,
+                                                    'is_string': False,
+                                                    'library_method_call_snippet': 'vi_ctype',
+                                                    'name': 'vi',
+                                                    'numpy': False,
+                                                    'numpy_into_return': False,
+                                                    'python_name': 'vi',
+                                                    'python_name_or_default_for_init': 'vi',
+                                                    'python_name_with_default': 'vi',
+                                                    'python_name_with_doc_default': 'vi',
+                                                    'python_type': 'int',
+                                                    'size': {'mechanism': 'fixed', 'value': 1},
+                                                    'type': 'ViSession',
+                                                    'use_array': False,
+                                                    'use_in_python_api': True,
+                                                    'use_list': False},
+                                                {   'ctypes_type': 'ViInt32',
+                                                    'ctypes_type_library_call': 'ViInt32',
+                                                    'ctypes_variable_name': 'output_array_size_ctype',
+                                                    'direction': 'in',
+                                                    'documentation': {'description': 'Size of the array that will be returned.'},
+                                                    'enum': None,
+                                                    'is_buffer': False,
+                                                    'is_repeated_capability': False,
+                                                    'is_session_handle': False,
+                                                    'is_string': False,
+                                                    'library_method_call_snippet': 'output_array_size_ctype',
+                                                    'name': 'outputArraySize',
+                                                    'numpy': False,
+                                                    'numpy_into_return': False,
+                                                    'python_name': 'output_array_size',
+                                                    'python_name_or_default_for_init': 'output_array_size',
+                                                    'python_name_with_default': 'output_array_size',
+                                                    'python_name_with_doc_default': 'output_array_size',
+                                                    'python_type': 'int',
+                                                    'size': {'mechanism': 'fixed', 'value': 1},
+                                                    'type': 'ViInt32',
+                                                    'use_array': False,
+                                                    'use_in_python_api': True,
+                                                    'use_list': False},
+                                                {   'ctypes_type': 'ViReal64',
+                                                    'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                                    'ctypes_variable_name': 'output_array_ctype',
+                                                    'direction': 'out',
+                                                    'documentation': {'description': 'Array that will be returned.', 'note': 'The size must be at least outputArraySize.'},
+                                                    'enum': None,
+                                                    'is_buffer': True,
+                                                    'is_repeated_capability': False,
+                                                    'is_session_handle': False,
+                                                    'is_string': False,
+                                                    'library_method_call_snippet': 'output_array_ctype',
+                                                    'name': 'outputArray',
+                                                    'numpy': False,
+                                                    'numpy_into_return': False,
+                                                    'original_type': 'ViReal64[]',
+                                                    'python_name': 'output_array',
+                                                    'python_name_or_default_for_init': 'output_array',
+                                                    'python_name_with_default': 'output_array',
+                                                    'python_name_with_doc_default': 'output_array',
+                                                    'python_type': 'float',
+                                                    'size': {'mechanism': 'passed-in', 'value': 'outputArraySize'},
+                                                    'type': 'ViReal64',
+                                                    'use_array': False,
+                                                    'use_in_python_api': True,
+                                                    'use_list': True},
+                                                {   'ctypes_type': 'ViReal64',
+                                                    'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                                    'ctypes_variable_name': 'output_array_of_fixed_length_ctype',
+                                                    'direction': 'out',
+                                                    'documentation': {'description': 'An array of doubles with fixed size.'},
+                                                    'enum': None,
+                                                    'is_buffer': True,
+                                                    'is_repeated_capability': False,
+                                                    'is_session_handle': False,
+                                                    'is_string': False,
+                                                    'library_method_call_snippet': 'output_array_of_fixed_length_ctype',
+                                                    'name': 'outputArrayOfFixedLength',
+                                                    'numpy': False,
+                                                    'numpy_into_return': False,
+                                                    'original_type': 'ViReal64[]',
+                                                    'python_name': 'output_array_of_fixed_length',
+                                                    'python_name_or_default_for_init': 'output_array_of_fixed_length',
+                                                    'python_name_with_default': 'output_array_of_fixed_length',
+                                                    'python_name_with_doc_default': 'output_array_of_fixed_length',
+                                                    'python_type': 'float',
+                                                    'size': {'mechanism': 'fixed', 'value': 3},
+                                                    'type': 'ViReal64',
+                                                    'use_array': False,
+                                                    'use_in_python_api': True,
+                                                    'use_list': True},
+                                                {   'ctypes_type': 'ViInt32',
+                                                    'ctypes_type_library_call': 'ViInt32',
+                                                    'ctypes_variable_name': 'input_array_sizes_ctype',
+                                                    'direction': 'in',
+                                                    'documentation': {'description': 'Size of inputArrayOfFloats and inputArrayOfIntegers'},
+                                                    'enum': None,
+                                                    'is_buffer': False,
+                                                    'is_repeated_capability': False,
+                                                    'is_session_handle': False,
+                                                    'is_string': False,
+                                                    'library_method_call_snippet': 'input_array_sizes_ctype',
+                                                    'name': 'inputArraySizes',
+                                                    'numpy': False,
+                                                    'numpy_into_return': False,
+                                                    'python_name': 'input_array_sizes',
+                                                    'python_name_or_default_for_init': 'input_array_sizes',
+                                                    'python_name_with_default': 'input_array_sizes',
+                                                    'python_name_with_doc_default': 'input_array_sizes',
+                                                    'python_type': 'int',
+                                                    'size': {'mechanism': 'fixed', 'value': 1},
+                                                    'type': 'ViInt32',
+                                                    'use_array': False,
+                                                    'use_in_python_api': False,
+                                                    'use_list': False},
+                                                {   'ctypes_type': 'ViReal64',
+                                                    'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                                    'ctypes_variable_name': 'input_array_of_floats_ctype',
+                                                    'direction': 'in',
+                                                    'documentation': {'description': 'Array of floats'},
+                                                    'enum': None,
+                                                    'is_buffer': True,
+                                                    'is_repeated_capability': False,
+                                                    'is_session_handle': False,
+                                                    'is_string': False,
+                                                    'library_method_call_snippet': 'input_array_of_floats_ctype',
+                                                    'name': 'inputArrayOfFloats',
+                                                    'numpy': False,
+                                                    'numpy_into_return': False,
+                                                    'original_type': 'ViReal64[]',
+                                                    'python_name': 'input_array_of_floats',
+                                                    'python_name_or_default_for_init': 'input_array_of_floats',
+                                                    'python_name_with_default': 'input_array_of_floats',
+                                                    'python_name_with_doc_default': 'input_array_of_floats',
+                                                    'python_type': 'float',
+                                                    'size': {'mechanism': 'len', 'value': 'inputArraySizes'},
+                                                    'type': 'ViReal64',
+                                                    'use_array': False,
+                                                    'use_in_python_api': True,
+                                                    'use_list': True},
+                                                {   'ctypes_type': 'ViInt16',
+                                                    'ctypes_type_library_call': 'ctypes.POINTER(ViInt16)',
+                                                    'ctypes_variable_name': 'input_array_of_integers_ctype',
+                                                    'default_value': None,
+                                                    'direction': 'in',
+                                                    'documentation': {'description': 'Array of integers. Optional. If passed in then size must match that of inputArrayOfFloats.'},
+                                                    'enum': None,
+                                                    'is_buffer': True,
+                                                    'is_repeated_capability': False,
+                                                    'is_session_handle': False,
+                                                    'is_string': False,
+                                                    'library_method_call_snippet': 'input_array_of_integers_ctype',
+                                                    'name': 'inputArrayOfIntegers',
+                                                    'numpy': False,
+                                                    'numpy_into_return': False,
+                                                    'original_type': 'ViInt16[]',
+                                                    'python_name': 'input_array_of_integers',
+                                                    'python_name_or_default_for_init': 'input_array_of_integers',
+                                                    'python_name_with_default': 'input_array_of_integers=None',
+                                                    'python_name_with_doc_default': 'input_array_of_integers=None',
+                                                    'python_type': 'int',
+                                                    'size': {'mechanism': 'fixed', 'value': 1},
+                                                    'type': 'ViInt16',
+                                                    'use_array': False,
+                                                    'use_in_python_api': True,
+                                                    'use_list': True}],
+                              'python_code_variables': [],
+                              'python_name': 'multiple_array_types',
+                              'render_in_library': True,
+                              'render_in_session_base': False,
+                              'returns': 'ViStatus'},
+    'OneInputFunction': {   'blocking': False,
+                            'codegen_method': 'public',
+                            'documentation': {'description': 'This function takes one parameter other than the session.'},
+                            'has_repeated_capability': False,
+                            'invalidates_attribute_cache': False,
+                            'is_error_handling': False,
+                            'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                            'name': 'OneInputFunction',
+                            'parameters': [   {   'ctypes_type': 'ViSession',
+                                                  'ctypes_type_library_call': 'ViSession',
+                                                  'ctypes_variable_name': 'vi_ctype',
+                                                  'direction': 'in',
+                                                  'documentation': {'description': 'Identifies a particular instrument session. You obtain the **vi**'},
+                                                  'enum': None,
+                                                  'is_buffer': False,
+                                                  'is_repeated_capability': False,
+                                                  'is_session_handle': True,
+                                                  'is_string': False,
+                                                  'library_method_call_snippet': 'vi_ctype',
+                                                  'name': 'vi',
+                                                  'numpy': False,
+                                                  'numpy_into_return': False,
+                                                  'python_name': 'vi',
+                                                  'python_name_or_default_for_init': 'vi',
+                                                  'python_name_with_default': 'vi',
+                                                  'python_name_with_doc_default': 'vi',
+                                                  'python_type': 'int',
+                                                  'size': {'mechanism': 'fixed', 'value': 1},
+                                                  'type': 'ViSession',
+                                                  'use_array': False,
+                                                  'use_in_python_api': True,
+                                                  'use_list': False},
+                                              {   'ctypes_type': 'ViInt32',
+                                                  'ctypes_type_library_call': 'ViInt32',
+                                                  'ctypes_variable_name': 'a_number_ctype',
+                                                  'direction': 'in',
+                                                  'documentation': {'description': 'Contains a number'},
+                                                  'enum': None,
+                                                  'is_buffer': False,
+                                                  'is_repeated_capability': False,
+                                                  'is_session_handle': False,
+                                                  'is_string': False,
+                                                  'library_method_call_snippet': 'a_number_ctype',
+                                                  'name': 'aNumber',
+                                                  'numpy': False,
+                                                  'numpy_into_return': False,
+                                                  'python_name': 'a_number',
+                                                  'python_name_or_default_for_init': 'a_number',
+                                                  'python_name_with_default': 'a_number',
+                                                  'python_name_with_doc_default': 'a_number',
+                                                  'python_type': 'int',
+                                                  'size': {'mechanism': 'fixed', 'value': 1},
+                                                  'type': 'ViInt32',
+                                                  'use_array': False,
+                                                  'use_in_python_api': True,
+                                                  'use_list': False}],
+                            'python_code_variables': [],
+                            'python_name': 'one_input_function',
+                            'render_in_library': True,
+                            'render_in_session_base': False,
+                            'returns': 'ViStatus'},
+    'ParametersAreMultipleTypes': {   'blocking': False,
+                                      'codegen_method': 'public',
+                                      'documentation': {'description': 'Has parameters of multiple types.'},
+                                      'has_repeated_capability': False,
+                                      'invalidates_attribute_cache': False,
+                                      'is_error_handling': False,
+                                      'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                      'name': 'ParametersAreMultipleTypes',
+                                      'parameters': [   {   'ctypes_type': 'ViSession',
+                                                            'ctypes_type_library_call': 'ViSession',
+                                                            'ctypes_variable_name': 'vi_ctype',
+                                                            'direction': 'in',
+                                                            'documentation': {'description': 'Identifies a particular instrument session.'},
+                                                            'enum': None,
+                                                            'is_buffer': False,
+                                                            'is_repeated_capability': False,
+                                                            'is_session_handle': True,
+                                                            'is_string': False,
+                                                            'library_method_call_snippet': 'vi_ctype',
+                                                            'name': 'vi',
+                                                            'numpy': False,
+                                                            'numpy_into_return': False,
+                                                            'python_name': 'vi',
+                                                            'python_name_or_default_for_init': 'vi',
+                                                            'python_name_with_default': 'vi',
+                                                            'python_name_with_doc_default': 'vi',
+                                                            'python_type': 'int',
+                                                            'size': {'mechanism': 'fixed', 'value': 1},
+                                                            'type': 'ViSession',
+                                                            'use_array': False,
+                                                            'use_in_python_api': True,
+                                                            'use_list': False},
+                                                        {   'ctypes_type': 'ViBoolean',
+                                                            'ctypes_type_library_call': 'ViBoolean',
+                                                            'ctypes_variable_name': 'a_boolean_ctype',
+                                                            'direction': 'in',
+                                                            'documentation': {'description': 'Contains a boolean.'},
+                                                            'enum': None,
+                                                            'is_buffer': False,
+                                                            'is_repeated_capability': False,
+                                                            'is_session_handle': False,
+                                                            'is_string': False,
+                                                            'library_method_call_snippet': 'a_boolean_ctype',
+                                                            'name': 'aBoolean',
+                                                            'numpy': False,
+                                                            'numpy_into_return': False,
+                                                            'python_name': 'a_boolean',
+                                                            'python_name_or_default_for_init': 'a_boolean',
+                                                            'python_name_with_default': 'a_boolean',
+                                                            'python_name_with_doc_default': 'a_boolean',
+                                                            'python_type': 'bool',
+                                                            'size': {'mechanism': 'fixed', 'value': 1},
+                                                            'type': 'ViBoolean',
+                                                            'use_array': False,
+                                                            'use_in_python_api': True,
+                                                            'use_list': False},
+                                                        {   'ctypes_type': 'ViInt32',
+                                                            'ctypes_type_library_call': 'ViInt32',
+                                                            'ctypes_variable_name': 'an_int32_ctype',
+                                                            'direction': 'in',
+                                                            'documentation': {'description': 'Contains a 32-bit integer.'},
+                                                            'enum': None,
+                                                            'is_buffer': False,
+                                                            'is_repeated_capability': False,
+                                                            'is_session_handle': False,
+                                                            'is_string': False,
+                                                            'library_method_call_snippet': 'an_int32_ctype',
+                                                            'name': 'anInt32',
+                                                            'numpy': False,
+                                                            'numpy_into_return': False,
+                                                            'python_name': 'an_int32',
+                                                            'python_name_or_default_for_init': 'an_int32',
+                                                            'python_name_with_default': 'an_int32',
+                                                            'python_name_with_doc_default': 'an_int32',
+                                                            'python_type': 'int',
+                                                            'size': {'mechanism': 'fixed', 'value': 1},
+                                                            'type': 'ViInt32',
+                                                            'use_array': False,
+                                                            'use_in_python_api': True,
+                                                            'use_list': False},
+                                                        {   'ctypes_type': 'ViInt64',
+                                                            'ctypes_type_library_call': 'ViInt64',
+                                                            'ctypes_variable_name': 'an_int64_ctype',
+                                                            'direction': 'in',
+                                                            'documentation': {'description': 'Contains a 64-bit integer.'},
+                                                            'enum': None,
+                                                            'is_buffer': False,
+                                                            'is_repeated_capability': False,
+                                                            'is_session_handle': False,
+                                                            'is_string': False,
+                                                            'library_method_call_snippet': 'an_int64_ctype',
+                                                            'name': 'anInt64',
+                                                            'numpy': False,
+                                                            'numpy_into_return': False,
+                                                            'python_name': 'an_int64',
+                                                            'python_name_or_default_for_init': 'an_int64',
+                                                            'python_name_with_default': 'an_int64',
+                                                            'python_name_with_doc_default': 'an_int64',
+                                                            'python_type': 'int',
+                                                            'size': {'mechanism': 'fixed', 'value': 1},
+                                                            'type': 'ViInt64',
+                                                            'use_array': False,
+                                                            'use_in_python_api': True,
+                                                            'use_list': False},
+                                                        {   'ctypes_type': 'ViInt16',
+                                                            'ctypes_type_library_call': 'ViInt16',
+                                                            'ctypes_variable_name': 'an_int_enum_ctype',
+                                                            'direction': 'in',
+                                                            'documentation': {   'description': 'Indicates a ninja turtle',
+                                                                                 'table_body': [['0', 'Leonardo'], ['1', 'Donatello'], ['2', 'Raphael'], ['3', 'Mich elangelo']]},
+                                                            'enum': 'Turtle',
+                                                            'is_buffer': False,
+                                                            'is_repeated_capability': False,
+                                                            'is_session_handle': False,
+                                                            'is_string': False,
+                                                            'library_method_call_snippet': 'an_int_enum_ctype',
+                                                            'name': 'anIntEnum',
+                                                            'numpy': False,
+                                                            'numpy_into_return': False,
+                                                            'python_name': 'an_int_enum',
+                                                            'python_name_or_default_for_init': 'an_int_enum',
+                                                            'python_name_with_default': 'an_int_enum',
+                                                            'python_name_with_doc_default': 'an_int_enum',
+                                                            'python_type': 'enums.Turtle',
+                                                            'size': {'mechanism': 'fixed', 'value': 1},
+                                                            'type': 'ViInt16',
+                                                            'use_array': False,
+                                                            'use_in_python_api': True,
+                                                            'use_list': False},
+                                                        {   'ctypes_type': 'ViReal64',
+                                                            'ctypes_type_library_call': 'ViReal64',
+                                                            'ctypes_variable_name': 'a_float_ctype',
+                                                            'direction': 'in',
+                                                            'documentation': {'description': 'The measured value.'},
+                                                            'enum': None,
+                                                            'is_buffer': False,
+                                                            'is_repeated_capability': False,
+                                                            'is_session_handle': False,
+                                                            'is_string': False,
+                                                            'library_method_call_snippet': 'a_float_ctype',
+                                                            'name': 'aFloat',
+                                                            'numpy': False,
+                                                            'numpy_into_return': False,
+                                                            'python_name': 'a_float',
+                                                            'python_name_or_default_for_init': 'a_float',
+                                                            'python_name_with_default': 'a_float',
+                                                            'python_name_with_doc_default': 'a_float',
+                                                            'python_type': 'float',
+                                                            'size': {'mechanism': 'fixed', 'value': 1},
+                                                            'type': 'ViReal64',
+                                                            'use_array': False,
+                                                            'use_in_python_api': True,
+                                                            'use_list': False},
+                                                        {   'ctypes_type': 'ViReal64',
+                                                            'ctypes_type_library_call': 'ViReal64',
+                                                            'ctypes_variable_name': 'a_float_enum_ctype',
+                                                            'direction': 'in',
+                                                            'documentation': {'description': 'A float enum.'},
+                                                            'enum': 'FloatEnum',
+                                                            'is_buffer': False,
+                                                            'is_repeated_capability': False,
+                                                            'is_session_handle': False,
+                                                            'is_string': False,
+                                                            'library_method_call_snippet': 'a_float_enum_ctype',
+                                                            'name': 'aFloatEnum',
+                                                            'numpy': False,
+                                                            'numpy_into_return': False,
+                                                            'python_name': 'a_float_enum',
+                                                            'python_name_or_default_for_init': 'a_float_enum',
+                                                            'python_name_with_default': 'a_float_enum',
+                                                            'python_name_with_doc_default': 'a_float_enum',
+                                                            'python_type': 'enums.FloatEnum',
+                                                            'size': {'mechanism': 'fixed', 'value': 1},
+                                                            'type': 'ViReal64',
+                                                            'use_array': False,
+                                                            'use_in_python_api': True,
+                                                            'use_list': False},
+                                                        {   'ctypes_type': 'ViInt32',
+                                                            'ctypes_type_library_call': 'ViInt32',
+                                                            'ctypes_variable_name': 'string_size_ctype',
+                                                            'direction': 'in',
+                                                            'documentation': {'description': 'Number of bytes allocated for aString'},
+                                                            'enum': None,
+                                                            'is_buffer': False,
+                                                            'is_repeated_capability': False,
+                                                            'is_session_handle': False,
+                                                            'is_string': False,
+                                                            'library_method_call_snippet': 'string_size_ctype',
+                                                            'name': 'stringSize',
+                                                            'numpy': False,
+                                                            'numpy_into_return': False,
+                                                            'python_name': 'string_size',
+                                                            'python_name_or_default_for_init': 'string_size',
+                                                            'python_name_with_default': 'string_size',
+                                                            'python_name_with_doc_default': 'string_size',
+                                                            'python_type': 'int',
+                                                            'size': {'mechanism': 'fixed', 'value': 1},
+                                                            'type': 'ViInt32',
+                                                            'use_array': False,
+                                                            'use_in_python_api': False,
+                                                            'use_list': False},
+                                                        {   'ctypes_type': 'ViChar[]',
+                                                            'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                            'ctypes_variable_name': 'a_string_ctype',
+                                                            'direction': 'in',
+                                                            'documentation': {'description': 'An IVI dance string.'},
+                                                            'enum': None,
+                                                            'is_buffer': False,
+                                                            'is_repeated_capability': False,
+                                                            'is_session_handle': False,
+                                                            'is_string': True,
+                                                            'library_method_call_snippet': 'a_string_ctype',
+                                                            'name': 'aString',
+                                                            'numpy': False,
+                                                            'numpy_into_return': False,
+                                                            'python_name': 'a_string',
+                                                            'python_name_or_default_for_init': 'a_string',
+                                                            'python_name_with_default': 'a_string',
+                                                            'python_name_with_doc_default': 'a_string',
+                                                            'python_type': 'str',
+                                                            'size': {'mechanism': 'len', 'value': 'stringSize'},
+                                                            'type': 'ViChar[]',
+                                                            'use_array': False,
+                                                            'use_in_python_api': True,
+                                                            'use_list': False}],
+                                      'python_code_variables': [],
+                                      'python_name': 'parameters_are_multiple_types',
+                                      'render_in_library': True,
+                                      'render_in_session_base': False,
+                                      'returns': 'ViStatus'},
+    'PoorlyNamedSimpleFunction': {   'blocking': False,
+                                     'codegen_method': 'public',
+                                     'documentation': {'description': 'This function takes no parameters other than the session.'},
+                                     'has_repeated_capability': False,
+                                     'invalidates_attribute_cache': False,
+                                     'is_error_handling': False,
+                                     'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                     'name': 'PoorlyNamedSimpleFunction',
+                                     'parameters': [   {   'ctypes_type': 'ViSession',
+                                                           'ctypes_type_library_call': 'ViSession',
+                                                           'ctypes_variable_name': 'vi_ctype',
+                                                           'direction': 'in',
+                                                           'documentation': {'description': 'Identifies a particular instrument session. You obtain the **vi**'},
+                                                           'enum': None,
+                                                           'is_buffer': False,
+                                                           'is_repeated_capability': False,
+                                                           'is_session_handle': True,
+                                                           'is_string': False,
+                                                           'library_method_call_snippet': 'vi_ctype',
+                                                           'name': 'vi',
+                                                           'numpy': False,
+                                                           'numpy_into_return': False,
+                                                           'python_name': 'vi',
+                                                           'python_name_or_default_for_init': 'vi',
+                                                           'python_name_with_default': 'vi',
+                                                           'python_name_with_doc_default': 'vi',
+                                                           'python_type': 'int',
+                                                           'size': {'mechanism': 'fixed', 'value': 1},
+                                                           'type': 'ViSession',
+                                                           'use_array': False,
+                                                           'use_in_python_api': True,
+                                                           'use_list': False}],
+                                     'python_code_variables': [],
+                                     'python_name': 'simple_function',
+                                     'render_in_library': True,
+                                     'render_in_session_base': False,
+                                     'returns': 'ViStatus'},
+    'Read': {   'blocking': True,
+                'codegen_method': 'public',
+                'documentation': {   'description': 'Acquires a single measurement and returns the measured value.',
+                                     'note': [   '\n'
+                                                 'This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same session '
+                                                 'wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the Session.executor '
+                                                 "property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.\n"]},
+                'has_repeated_capability': False,
+                'invalidates_attribute_cache': False,
+                'is_error_handling': False,
+                'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                'name': 'Read',
+                'parameters': [   {   'ctypes_type': 'ViSession',
+                                      'ctypes_type_library_call': 'ViSession',
+                                      'ctypes_variable_name': 'vi_ctype',
+                                      'direction': 'in',
+                                      'documentation': {'description': 'Identifies a particular instrument session.'},
+                                      'enum': None,
+                                      'is_buffer': False,
+                                      'is_repeated_capability': False,
+                                      'is_session_handle': True,
+                                      'is_string': False,
+                                      'library_method_call_snippet': 'vi_ctype',
+                                      'name': 'vi',
+                                      'numpy': False,
+                                      'numpy_into_return': False,
+                                      'python_name': 'vi',
+                                      'python_name_or_default_for_init': 'vi',
+                                      'python_name_with_default': 'vi',
+                                      'python_name_with_doc_default': 'vi',
+                                      'python_type': 'int',
+                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                      'type': 'ViSession',
+                                      'use_array': False,
+                                      'use_in_python_api': True,
+                                      'use_list': False},
+                                  {   'ctypes_type': 'ViReal64',
+                                      'ctypes_type_library_call': 'ViReal64',
+                                      'ctypes_variable_name': 'maximum_time_ctype',
+                                      'direction': 'in',
+                                      'documentation': {'description': 'Specifies the **maximum_time** allowed in seconds.'},
+                                      'enum': None,
+                                      'is_buffer': False,
+                                      'is_repeated_capability': False,
+                                      'is_session_handle': False,
+                                      'is_string': False,
+                                      'library_method_call_snippet': 'maximum_time_ctype',
+                                      'name': 'maximumTime',
+                                      'numpy': False,
+                                      'numpy_into_return': False,
+                                      'python_api_converter_name': 'convert_timedelta_to_seconds',
+                                      'python_name': 'maximum_time',
+                                      'python_name_or_default_for_init': 'maximum_time',
+                                      'python_name_with_default': 'maximum_time',
+                                      'python_name_with_doc_default': 'maximum_time',
+                                      'python_type': 'datetime.timedelta',
+                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                      'type': 'ViReal64',
+                                      'use_array': False,
+                                      'use_in_python_api': True,
+                                      'use_list': False},
+                                  {   'ctypes_type': 'ViReal64',
+                                      'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                      'ctypes_variable_name': 'reading_ctype',
+                                      'direction': 'out',
+                                      'documentation': {'description': 'The measured value.'},
+                                      'enum': None,
+                                      'is_buffer': False,
+                                      'is_repeated_capability': False,
+                                      'is_session_handle': False,
+                                      'is_string': False,
+                                      'library_method_call_snippet': 'None if reading_ctype is None else (ctypes.pointer(reading_ctype))',
+                                      'name': 'reading',
+                                      'numpy': False,
+                                      'numpy_into_return': False,
+                                      'python_name': 'reading',
+                                      'python_name_or_default_for_init': 'reading',
+                                      'python_name_with_default': 'reading',
+                                      'python_name_with_doc_default': 'reading',
+                                      'python_type': 'float',
+                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                      'type': 'ViReal64',
+                                      'use_array': False,
+                                      'use_in_python_api': True,
+                                      'use_list': False}],
+                'python_code_variables': [],
+                'python_name': 'read',
+                'render_in_library': True,
+                'render_in_session_base': False,
+                'returns': 'ViStatus'},
+    'ReadFromChannel': {   'blocking': True,
+                           'codegen_method': 'public',
+                           'documentation': {   'description': 'Acquires a single measurement and returns the measured value.',
+                                                'note': [   '\n'
+                                                            'This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the '
+                                                            'same session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through '
+                                                            "the Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.\n"]},
+                           'has_repeated_capability': True,
+                           'invalidates_attribute_cache': False,
+                           'is_error_handling': False,
+                           'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                           'name': 'ReadFromChannel',
+                           'parameters': [   {   'ctypes_type': 'ViSession',
+                                                 'ctypes_type_library_call': 'ViSession',
+                                                 'ctypes_variable_name': 'vi_ctype',
+                                                 'direction': 'in',
+                                                 'documentation': {'description': 'Identifies a particular instrument session.'},
+                                                 'enum': None,
+                                                 'is_buffer': False,
+                                                 'is_repeated_capability': False,
+                                                 'is_session_handle': True,
+                                                 'is_string': False,
+                                                 'library_method_call_snippet': 'vi_ctype',
+                                                 'name': 'vi',
+                                                 'numpy': False,
+                                                 'numpy_into_return': False,
+                                                 'python_name': 'vi',
+                                                 'python_name_or_default_for_init': 'vi',
+                                                 'python_name_with_default': 'vi',
+                                                 'python_name_with_doc_default': 'vi',
+                                                 'python_type': 'int',
+                                                 'size': {'mechanism': 'fixed', 'value': 1},
+                                                 'type': 'ViSession',
+                                                 'use_array': False,
+                                                 'use_in_python_api': True,
+                                                 'use_list': False},
+                                             {   'ctypes_type': 'ViConstString',
+                                                 'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                 'ctypes_variable_name': 'channel_name_ctype',
+                                                 'direction': 'in',
+                                                 'documentation': {'description': 'This is the channel(s) that this function will apply to.'},
+                                                 'enum': None,
+                                                 'is_buffer': False,
+                                                 'is_repeated_capability': True,
+                                                 'is_session_handle': False,
+                                                 'is_string': True,
+                                                 'library_method_call_snippet': 'channel_name_ctype',
+                                                 'name': 'channelName',
+                                                 'numpy': False,
+                                                 'numpy_into_return': False,
+                                                 'python_name': 'channel_name',
+                                                 'python_name_or_default_for_init': 'channel_name',
+                                                 'python_name_with_default': 'channel_name',
+                                                 'python_name_with_doc_default': 'channel_name',
+                                                 'python_type': 'str',
+                                                 'size': {'mechanism': 'fixed', 'value': 1},
+                                                 'type': 'ViConstString',
+                                                 'use_array': False,
+                                                 'use_in_python_api': True,
+                                                 'use_list': False},
+                                             {   'ctypes_type': 'ViInt32',
+                                                 'ctypes_type_library_call': 'ViInt32',
+                                                 'ctypes_variable_name': 'maximum_time_ctype',
+                                                 'direction': 'in',
+                                                 'documentation': {'description': 'Specifies the **maximum_time** allowed in microseconds.'},
+                                                 'enum': None,
+                                                 'is_buffer': False,
+                                                 'is_repeated_capability': False,
+                                                 'is_session_handle': False,
+                                                 'is_string': False,
+                                                 'library_method_call_snippet': 'maximum_time_ctype',
+                                                 'name': 'maximumTime',
+                                                 'numpy': False,
+                                                 'numpy_into_return': False,
+                                                 'python_api_converter_name': 'convert_timedelta_to_microseconds',
+                                                 'python_name': 'maximum_time',
+                                                 'python_name_or_default_for_init': 'maximum_time',
+                                                 'python_name_with_default': 'maximum_time',
+                                                 'python_name_with_doc_default': 'maximum_time',
+                                                 'python_type': 'datetime.timedelta',
+                                                 'size': {'mechanism': 'fixed', 'value': 1},
+                                                 'type': 'ViInt32',
+                                                 'use_array': False,
+                                                 'use_in_python_api': True,
+                                                 'use_list': False},
+                                             {   'ctypes_type': 'ViReal64',
+                                                 'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                                 'ctypes_variable_name': 'reading_ctype',
+                                                 'direction': 'out',
+                                                 'documentation': {'description': 'The measured value.'},
+                                                 'enum': None,
+                                                 'is_buffer': False,
+                                                 'is_repeated_capability': False,
+                                                 'is_session_handle': False,
+                                                 'is_string': False,
+                                                 'library_method_call_snippet': 'None if reading_ctype is None else (ctypes.pointer(reading_ctype))',
+                                                 'name': 'reading',
+                                                 'numpy': False,
+                                                 'numpy_into_return': False,
+                                                 'python_name': 'reading',
+                                                 'python_name_or_default_for_init': 'reading',
+                                                 'python_name_with_default': 'reading',
+                                                 'python_name_with_doc_default': 'reading',
+                                                 'python_type': 'float',
+                                                 'size': {'mechanism': 'fixed', 'value': 1},
+                                                 'type': 'ViReal64',
+                                                 'use_array': False,
+                                                 'use_in_python_api': True,
+                                                 'use_list': False}],
+                           'python_code_variables': [],
+                           'python_name': 'read_from_channel',
+                           'render_in_library': True,
+                           'render_in_session_base': True,
+                           'returns': 'ViStatus'},
+    'ReturnANumberAndAString': {   'blocking': False,
+                                   'codegen_method': 'public',
+                                   'documentation': {'description': 'Returns a number and a string.', 'note': 'This function rules!'},
+                                   'has_repeated_capability': False,
+                                   'invalidates_attribute_cache': False,
+                                   'is_error_handling': False,
+                                   'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                   'name': 'ReturnANumberAndAString',
+                                   'parameters': [   {   'ctypes_type': 'ViSession',
+                                                         'ctypes_type_library_call': 'ViSession',
+                                                         'ctypes_variable_name': 'vi_ctype',
+                                                         'direction': 'in',
+                                                         'documentation': {'description': 'Identifies a particular instrument session.'},
+                                                         'enum': None,
+                                                         'is_buffer': False,
+                                                         'is_repeated_capability': False,
+                                                         'is_session_handle': True,
+                                                         'is_string': False,
+                                                         'library_method_call_snippet': 'vi_ctype',
+                                                         'name': 'vi',
+                                                         'numpy': False,
+                                                         'numpy_into_return': False,
+                                                         'python_name': 'vi',
+                                                         'python_name_or_default_for_init': 'vi',
+                                                         'python_name_with_default': 'vi',
+                                                         'python_name_with_doc_default': 'vi',
+                                                         'python_type': 'int',
+                                                         'size': {'mechanism': 'fixed', 'value': 1},
+                                                         'type': 'ViSession',
+                                                         'use_array': False,
+                                                         'use_in_python_api': True,
+                                                         'use_list': False},
+                                                     {   'ctypes_type': 'ViInt16',
+                                                         'ctypes_type_library_call': 'ctypes.POINTER(ViInt16)',
+                                                         'ctypes_variable_name': 'a_number_ctype',
+                                                         'direction': 'out',
+                                                         'documentation': {'description': 'Contains a number.'},
+                                                         'enum': None,
+                                                         'is_buffer': False,
+                                                         'is_repeated_capability': False,
+                                                         'is_session_handle': False,
+                                                         'is_string': False,
+                                                         'library_method_call_snippet': 'None if a_number_ctype is None else (ctypes.pointer(a_number_ctype))',
+                                                         'name': 'aNumber',
+                                                         'numpy': False,
+                                                         'numpy_into_return': False,
+                                                         'python_name': 'a_number',
+                                                         'python_name_or_default_for_init': 'a_number',
+                                                         'python_name_with_default': 'a_number',
+                                                         'python_name_with_doc_default': 'a_number',
+                                                         'python_type': 'int',
+                                                         'size': {'mechanism': 'fixed', 'value': 1},
+                                                         'type': 'ViInt16',
+                                                         'use_array': False,
+                                                         'use_in_python_api': True,
+                                                         'use_list': False},
+                                                     {   'ctypes_type': 'ViChar[]',
+                                                         'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                         'ctypes_variable_name': 'a_string_ctype',
+                                                         'direction': 'out',
+                                                         'documentation': {'description': 'Contains a string. Buffer must be 256 bytes or larger.'},
+                                                         'enum': None,
+                                                         'is_buffer': False,
+                                                         'is_repeated_capability': False,
+                                                         'is_session_handle': False,
+                                                         'is_string': True,
+                                                         'library_method_call_snippet': 'a_string_ctype',
+                                                         'name': 'aString',
+                                                         'numpy': False,
+                                                         'numpy_into_return': False,
+                                                         'python_name': 'a_string',
+                                                         'python_name_or_default_for_init': 'a_string',
+                                                         'python_name_with_default': 'a_string',
+                                                         'python_name_with_doc_default': 'a_string',
+                                                         'python_type': 'str',
+                                                         'size': {'mechanism': 'fixed', 'value': 256},
+                                                         'type': 'ViChar[]',
+                                                         'use_array': False,
+                                                         'use_in_python_api': True,
+                                                         'use_list': False}],
+                                   'python_code_variables': [],
+                                   'python_name': 'return_a_number_and_a_string',
+                                   'render_in_library': True,
+                                   'render_in_session_base': False,
+                                   'returns': 'ViStatus'},
+    'ReturnMultipleTypes': {   'blocking': False,
+                               'codegen_method': 'public',
+                               'documentation': {'description': 'Returns multiple types.'},
+                               'has_repeated_capability': False,
+                               'invalidates_attribute_cache': False,
+                               'is_error_handling': False,
+                               'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                               'name': 'ReturnMultipleTypes',
+                               'parameters': [   {   'ctypes_type': 'ViSession',
+                                                     'ctypes_type_library_call': 'ViSession',
+                                                     'ctypes_variable_name': 'vi_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {'description': 'Identifies a particular instrument session.'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': True,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'vi_ctype',
+                                                     'name': 'vi',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'vi',
+                                                     'python_name_or_default_for_init': 'vi',
+                                                     'python_name_with_default': 'vi',
+                                                     'python_name_with_doc_default': 'vi',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViSession',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViBoolean',
+                                                     'ctypes_type_library_call': 'ctypes.POINTER(ViBoolean)',
+                                                     'ctypes_variable_name': 'a_boolean_ctype',
+                                                     'direction': 'out',
+                                                     'documentation': {'description': 'Contains a boolean.'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'None if a_boolean_ctype is None else (ctypes.pointer(a_boolean_ctype))',
+                                                     'name': 'aBoolean',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'a_boolean',
+                                                     'python_name_or_default_for_init': 'a_boolean',
+                                                     'python_name_with_default': 'a_boolean',
+                                                     'python_name_with_doc_default': 'a_boolean',
+                                                     'python_type': 'bool',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViBoolean',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViInt32',
+                                                     'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                                     'ctypes_variable_name': 'an_int32_ctype',
+                                                     'direction': 'out',
+                                                     'documentation': {'description': 'Contains a 32-bit integer.'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'None if an_int32_ctype is None else (ctypes.pointer(an_int32_ctype))',
+                                                     'name': 'anInt32',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'an_int32',
+                                                     'python_name_or_default_for_init': 'an_int32',
+                                                     'python_name_with_default': 'an_int32',
+                                                     'python_name_with_doc_default': 'an_int32',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViInt32',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViInt64',
+                                                     'ctypes_type_library_call': 'ctypes.POINTER(ViInt64)',
+                                                     'ctypes_variable_name': 'an_int64_ctype',
+                                                     'direction': 'out',
+                                                     'documentation': {'description': 'Contains a 64-bit integer.'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'None if an_int64_ctype is None else (ctypes.pointer(an_int64_ctype))',
+                                                     'name': 'anInt64',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'an_int64',
+                                                     'python_name_or_default_for_init': 'an_int64',
+                                                     'python_name_with_default': 'an_int64',
+                                                     'python_name_with_doc_default': 'an_int64',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViInt64',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViInt16',
+                                                     'ctypes_type_library_call': 'ctypes.POINTER(ViInt16)',
+                                                     'ctypes_variable_name': 'an_int_enum_ctype',
+                                                     'direction': 'out',
+                                                     'documentation': {   'description': 'Indicates a ninja turtle',
+                                                                          'table_body': [['0', 'Leonardo'], ['1', 'Donatello'], ['2', 'Raphael'], ['3', 'Mich elangelo']]},
+                                                     'enum': 'Turtle',
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'None if an_int_enum_ctype is None else (ctypes.pointer(an_int_enum_ctype))',
+                                                     'name': 'anIntEnum',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'an_int_enum',
+                                                     'python_name_or_default_for_init': 'an_int_enum',
+                                                     'python_name_with_default': 'an_int_enum',
+                                                     'python_name_with_doc_default': 'an_int_enum',
+                                                     'python_type': 'enums.Turtle',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViInt16',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViReal64',
+                                                     'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                                     'ctypes_variable_name': 'a_float_ctype',
+                                                     'direction': 'out',
+                                                     'documentation': {'description': 'The measured value.'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'None if a_float_ctype is None else (ctypes.pointer(a_float_ctype))',
+                                                     'name': 'aFloat',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'a_float',
+                                                     'python_name_or_default_for_init': 'a_float',
+                                                     'python_name_with_default': 'a_float',
+                                                     'python_name_with_doc_default': 'a_float',
+                                                     'python_type': 'float',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViReal64',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViReal64',
+                                                     'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                                     'ctypes_variable_name': 'a_float_enum_ctype',
+                                                     'direction': 'out',
+                                                     'documentation': {'description': 'A float enum.'},
+                                                     'enum': 'FloatEnum',
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'None if a_float_enum_ctype is None else (ctypes.pointer(a_float_enum_ctype))',
+                                                     'name': 'aFloatEnum',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'a_float_enum',
+                                                     'python_name_or_default_for_init': 'a_float_enum',
+                                                     'python_name_with_default': 'a_float_enum',
+                                                     'python_name_with_doc_default': 'a_float_enum',
+                                                     'python_type': 'enums.FloatEnum',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViReal64',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViInt32',
+                                                     'ctypes_type_library_call': 'ViInt32',
+                                                     'ctypes_variable_name': 'array_size_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {'description': 'Number of measurements to acquire.'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'array_size_ctype',
+                                                     'name': 'arraySize',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'array_size',
+                                                     'python_name_or_default_for_init': 'array_size',
+                                                     'python_name_with_default': 'array_size',
+                                                     'python_name_with_doc_default': 'array_size',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViInt32',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViReal64',
+                                                     'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                                     'ctypes_variable_name': 'an_array_ctype',
+                                                     'direction': 'out',
+                                                     'documentation': {'description': 'An array of measurement values.', 'note': 'The size must be at least arraySize.'},
+                                                     'enum': None,
+                                                     'is_buffer': True,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'an_array_ctype',
+                                                     'name': 'anArray',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'original_type': 'ViReal64[]',
+                                                     'python_name': 'an_array',
+                                                     'python_name_or_default_for_init': 'an_array',
+                                                     'python_name_with_default': 'an_array',
+                                                     'python_name_with_doc_default': 'an_array',
+                                                     'python_type': 'float',
+                                                     'size': {'mechanism': 'passed-in', 'value': 'arraySize'},
+                                                     'type': 'ViReal64',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': True},
+                                                 {   'ctypes_type': 'ViInt32',
+                                                     'ctypes_type_library_call': 'ViInt32',
+                                                     'ctypes_variable_name': 'string_size_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {'description': 'Number of bytes allocated for aString'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'string_size_ctype',
+                                                     'name': 'stringSize',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'string_size',
+                                                     'python_name_or_default_for_init': 'string_size',
+                                                     'python_name_with_default': 'string_size',
+                                                     'python_name_with_doc_default': 'string_size',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViInt32',
+                                                     'use_array': False,
+                                                     'use_in_python_api': False,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViChar[]',
+                                                     'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                     'ctypes_variable_name': 'a_string_ctype',
+                                                     'direction': 'out',
+                                                     'documentation': {'description': 'An IVI dance string.'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': True,
+                                                     'library_method_call_snippet': 'a_string_ctype',
+                                                     'name': 'aString',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'a_string',
+                                                     'python_name_or_default_for_init': 'a_string',
+                                                     'python_name_with_default': 'a_string',
+                                                     'python_name_with_doc_default': 'a_string',
+                                                     'python_type': 'str',
+                                                     'size': {'mechanism': 'ivi-dance', 'value': 'stringSize'},
+                                                     'type': 'ViChar[]',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False}],
+                               'python_code_variables': [],
+                               'python_name': 'return_multiple_types',
+                               'render_in_library': True,
+                               'render_in_session_base': False,
+                               'returns': 'ViStatus'},
+    'SetAttributeViBoolean': {   'blocking': False,
+                                 'codegen_method': 'private',
+                                 'documentation': {'description': 'This function sets the value of a ViBoolean attribute.'},
+                                 'has_repeated_capability': True,
+                                 'invalidates_attribute_cache': True,
+                                 'is_error_handling': False,
+                                 'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                 'name': 'SetAttributeViBoolean',
+                                 'parameters': [   {   'ctypes_type': 'ViSession',
+                                                       'ctypes_type_library_call': 'ViSession',
+                                                       'ctypes_variable_name': 'vi_ctype',
+                                                       'direction': 'in',
+                                                       'documentation': {'description': 'Identifies a particular instrument session.'},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': True,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'vi_ctype',
+                                                       'name': 'vi',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'vi',
+                                                       'python_name_or_default_for_init': 'vi',
+                                                       'python_name_with_default': 'vi',
+                                                       'python_name_with_doc_default': 'vi',
+                                                       'python_type': 'int',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViSession',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False},
+                                                   {   'ctypes_type': 'ViConstString',
+                                                       'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                       'ctypes_variable_name': 'channel_name_ctype',
+                                                       'direction': 'in',
+                                                       'documentation': {'description': 'This is the channel(s) that this function will apply to.'},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': True,
+                                                       'is_session_handle': False,
+                                                       'is_string': True,
+                                                       'library_method_call_snippet': 'channel_name_ctype',
+                                                       'name': 'channelName',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'channel_name',
+                                                       'python_name_or_default_for_init': 'channel_name',
+                                                       'python_name_with_default': 'channel_name',
+                                                       'python_name_with_doc_default': 'channel_name',
+                                                       'python_type': 'str',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViConstString',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False},
+                                                   {   'ctypes_type': 'ViAttr',
+                                                       'ctypes_type_library_call': 'ViAttr',
+                                                       'ctypes_variable_name': 'attribute_id_ctype',
+                                                       'direction': 'in',
+                                                       'documentation': {'description': 'Pass the ID of an attribute.'},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': False,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'attribute_id_ctype',
+                                                       'name': 'attributeId',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'attribute_id',
+                                                       'python_name_or_default_for_init': 'attribute_id',
+                                                       'python_name_with_default': 'attribute_id',
+                                                       'python_name_with_doc_default': 'attribute_id',
+                                                       'python_type': 'int',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViAttr',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False},
+                                                   {   'ctypes_type': 'ViBoolean',
+                                                       'ctypes_type_library_call': 'ViBoolean',
+                                                       'ctypes_variable_name': 'attribute_value_ctype',
+                                                       'direction': 'in',
+                                                       'documentation': {'description': 'Pass the value that you want to set the attribute to.'},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': False,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'attribute_value_ctype',
+                                                       'name': 'attributeValue',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'attribute_value',
+                                                       'python_name_or_default_for_init': 'attribute_value',
+                                                       'python_name_with_default': 'attribute_value',
+                                                       'python_name_with_doc_default': 'attribute_value',
+                                                       'python_type': 'bool',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViBoolean',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False}],
+                                 'python_code_variables': [],
+                                 'python_name': '_set_attribute_vi_boolean',
+                                 'render_in_library': True,
+                                 'render_in_session_base': True,
+                                 'returns': 'ViStatus'},
+    'SetAttributeViInt32': {   'blocking': False,
+                               'codegen_method': 'private',
+                               'documentation': {'description': 'This function sets the value of a ViInt32 attribute.'},
+                               'has_repeated_capability': True,
+                               'invalidates_attribute_cache': True,
+                               'is_error_handling': False,
+                               'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                               'name': 'SetAttributeViInt32',
+                               'parameters': [   {   'ctypes_type': 'ViSession',
+                                                     'ctypes_type_library_call': 'ViSession',
+                                                     'ctypes_variable_name': 'vi_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {'description': 'Identifies a particular instrument session.'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': True,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'vi_ctype',
+                                                     'name': 'vi',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'vi',
+                                                     'python_name_or_default_for_init': 'vi',
+                                                     'python_name_with_default': 'vi',
+                                                     'python_name_with_doc_default': 'vi',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViSession',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViConstString',
+                                                     'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                     'ctypes_variable_name': 'channel_name_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {'description': 'This is the channel(s) that this function will apply to.'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': True,
+                                                     'is_session_handle': False,
+                                                     'is_string': True,
+                                                     'library_method_call_snippet': 'channel_name_ctype',
+                                                     'name': 'channelName',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'channel_name',
+                                                     'python_name_or_default_for_init': 'channel_name',
+                                                     'python_name_with_default': 'channel_name',
+                                                     'python_name_with_doc_default': 'channel_name',
+                                                     'python_type': 'str',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViConstString',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViAttr',
+                                                     'ctypes_type_library_call': 'ViAttr',
+                                                     'ctypes_variable_name': 'attribute_id_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {'description': 'Pass the ID of an attribute.'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'attribute_id_ctype',
+                                                     'name': 'attributeId',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'attribute_id',
+                                                     'python_name_or_default_for_init': 'attribute_id',
+                                                     'python_name_with_default': 'attribute_id',
+                                                     'python_name_with_doc_default': 'attribute_id',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViAttr',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViInt32',
+                                                     'ctypes_type_library_call': 'ViInt32',
+                                                     'ctypes_variable_name': 'attribute_value_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {'description': 'Pass the value that you want to set the attribute to.'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'attribute_value_ctype',
+                                                     'name': 'attributeValue',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'attribute_value',
+                                                     'python_name_or_default_for_init': 'attribute_value',
+                                                     'python_name_with_default': 'attribute_value',
+                                                     'python_name_with_doc_default': 'attribute_value',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViInt32',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False}],
+                               'python_code_variables': [],
+                               'python_name': '_set_attribute_vi_int32',
+                               'render_in_library': True,
+                               'render_in_session_base': True,
+                               'returns': 'ViStatus'},
+    'SetAttributeViInt64': {   'blocking': False,
+                               'codegen_method': 'private',
+                               'documentation': {'description': 'This function sets the value of a ViInt64 attribute.'},
+                               'has_repeated_capability': True,
+                               'invalidates_attribute_cache': True,
+                               'is_error_handling': False,
+                               'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                               'name': 'SetAttributeViInt64',
+                               'parameters': [   {   'ctypes_type': 'ViSession',
+                                                     'ctypes_type_library_call': 'ViSession',
+                                                     'ctypes_variable_name': 'vi_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {'description': 'Identifies a particular instrument session.'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': True,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'vi_ctype',
+                                                     'name': 'vi',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'vi',
+                                                     'python_name_or_default_for_init': 'vi',
+                                                     'python_name_with_default': 'vi',
+                                                     'python_name_with_doc_default': 'vi',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViSession',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViConstString',
+                                                     'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                     'ctypes_variable_name': 'channel_name_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {'description': 'This is the channel(s) that this function will apply to.'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': True,
+                                                     'is_session_handle': False,
+                                                     'is_string': True,
+                                                     'library_method_call_snippet': 'channel_name_ctype',
+                                                     'name': 'channelName',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'channel_name',
+                                                     'python_name_or_default_for_init': 'channel_name',
+                                                     'python_name_with_default': 'channel_name',
+                                                     'python_name_with_doc_default': 'channel_name',
+                                                     'python_type': 'str',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViConstString',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViAttr',
+                                                     'ctypes_type_library_call': 'ViAttr',
+                                                     'ctypes_variable_name': 'attribute_id_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {'description': 'Pass the ID of an attribute.'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'attribute_id_ctype',
+                                                     'name': 'attributeId',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'attribute_id',
+                                                     'python_name_or_default_for_init': 'attribute_id',
+                                                     'python_name_with_default': 'attribute_id',
+                                                     'python_name_with_doc_default': 'attribute_id',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViAttr',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViInt64',
+                                                     'ctypes_type_library_call': 'ViInt64',
+                                                     'ctypes_variable_name': 'attribute_value_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {'description': 'Pass the value that you want to set the attribute to.'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'attribute_value_ctype',
+                                                     'name': 'attributeValue',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'attribute_value',
+                                                     'python_name_or_default_for_init': 'attribute_value',
+                                                     'python_name_with_default': 'attribute_value',
+                                                     'python_name_with_doc_default': 'attribute_value',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViInt64',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False}],
+                               'python_code_variables': [],
+                               'python_name': '_set_attribute_vi_int64',
+                               'render_in_library': True,
+                               'render_in_session_base': True,
+                               'returns': 'ViStatus'},
+    'SetAttributeViReal64': {   'blocking': False,
+                                'codegen_method': 'private',
+                                'documentation': {'description': 'This function sets the value of a ViReal64 attribute.'},
+                                'has_repeated_capability': True,
+                                'invalidates_attribute_cache': True,
+                                'is_error_handling': False,
+                                'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                'name': 'SetAttributeViReal64',
+                                'parameters': [   {   'ctypes_type': 'ViSession',
+                                                      'ctypes_type_library_call': 'ViSession',
+                                                      'ctypes_variable_name': 'vi_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {'description': 'Identifies a particular instrument session.'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': True,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'vi_ctype',
+                                                      'name': 'vi',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'vi',
+                                                      'python_name_or_default_for_init': 'vi',
+                                                      'python_name_with_default': 'vi',
+                                                      'python_name_with_doc_default': 'vi',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViSession',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViConstString',
+                                                      'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                      'ctypes_variable_name': 'channel_name_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {'description': 'This is the channel(s) that this function will apply to.'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': True,
+                                                      'is_session_handle': False,
+                                                      'is_string': True,
+                                                      'library_method_call_snippet': 'channel_name_ctype',
+                                                      'name': 'channelName',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'channel_name',
+                                                      'python_name_or_default_for_init': 'channel_name',
+                                                      'python_name_with_default': 'channel_name',
+                                                      'python_name_with_doc_default': 'channel_name',
+                                                      'python_type': 'str',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViConstString',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViAttr',
+                                                      'ctypes_type_library_call': 'ViAttr',
+                                                      'ctypes_variable_name': 'attribute_id_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {'description': 'Pass the ID of an attribute.'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'attribute_id_ctype',
+                                                      'name': 'attributeId',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'attribute_id',
+                                                      'python_name_or_default_for_init': 'attribute_id',
+                                                      'python_name_with_default': 'attribute_id',
+                                                      'python_name_with_doc_default': 'attribute_id',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViAttr',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViReal64',
+                                                      'ctypes_type_library_call': 'ViReal64',
+                                                      'ctypes_variable_name': 'attribute_value_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {'description': 'Pass the value that you want to set the attribute to.'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'attribute_value_ctype',
+                                                      'name': 'attributeValue',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'attribute_value',
+                                                      'python_name_or_default_for_init': 'attribute_value',
+                                                      'python_name_with_default': 'attribute_value',
+                                                      'python_name_with_doc_default': 'attribute_value',
+                                                      'python_type': 'float',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViReal64',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False}],
+                                'python_code_variables': [],
+                                'python_name': '_set_attribute_vi_real64',
+                                'render_in_library': True,
+                                'render_in_session_base': True,
+                                'returns': 'ViStatus'},
+    'SetAttributeViSession': {   'codegen_method': 'no',
+                                 'documentation': {'description': 'This function sets the value of a ViSession attribute.'},
+                                 'invalidates_attribute_cache': True,
+                                 'parameters': [   {   'direction': 'in',
+                                                       'documentation': {'description': 'Identifies a particular instrument session.'},
+                                                       'enum': None,
+                                                       'name': 'vi',
+                                                       'type': 'ViSession'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {'description': 'This is the channel(s) that this function will apply to.'},
+                                                       'enum': None,
+                                                       'name': 'channelName',
+                                                       'type': 'ViConstString'},
+                                                   {'direction': 'in', 'documentation': {'description': 'Pass the ID of an attribute.'}, 'enum': None, 'name': 'attributeId', 'type': 'ViAttr'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {'description': 'Pass the value that you want to set the attribute to.'},
+                                                       'enum': None,
+                                                       'name': 'attributeValue',
+                                                       'type': 'ViSession'}],
+                                 'returns': 'ViStatus'},
+    'SetAttributeViString': {   'blocking': False,
+                                'codegen_method': 'private',
+                                'documentation': {'description': 'This function sets the value of a ViString attribute.'},
+                                'has_repeated_capability': True,
+                                'invalidates_attribute_cache': True,
+                                'is_error_handling': False,
+                                'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                'name': 'SetAttributeViString',
+                                'parameters': [   {   'ctypes_type': 'ViSession',
+                                                      'ctypes_type_library_call': 'ViSession',
+                                                      'ctypes_variable_name': 'vi_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {'description': 'Identifies a particular instrument session.'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': True,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'vi_ctype',
+                                                      'name': 'vi',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'vi',
+                                                      'python_name_or_default_for_init': 'vi',
+                                                      'python_name_with_default': 'vi',
+                                                      'python_name_with_doc_default': 'vi',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViSession',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViConstString',
+                                                      'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                      'ctypes_variable_name': 'channel_name_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {'description': 'This is the channel(s) that this function will apply to.'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': True,
+                                                      'is_session_handle': False,
+                                                      'is_string': True,
+                                                      'library_method_call_snippet': 'channel_name_ctype',
+                                                      'name': 'channelName',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'channel_name',
+                                                      'python_name_or_default_for_init': 'channel_name',
+                                                      'python_name_with_default': 'channel_name',
+                                                      'python_name_with_doc_default': 'channel_name',
+                                                      'python_type': 'str',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViConstString',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViAttr',
+                                                      'ctypes_type_library_call': 'ViAttr',
+                                                      'ctypes_variable_name': 'attribute_id_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {'description': 'Pass the ID of an attribute.'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'attribute_id_ctype',
+                                                      'name': 'attributeId',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'attribute_id',
+                                                      'python_name_or_default_for_init': 'attribute_id',
+                                                      'python_name_with_default': 'attribute_id',
+                                                      'python_name_with_doc_default': 'attribute_id',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViAttr',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViChar[]',
+                                                      'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                      'ctypes_variable_name': 'attribute_value_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {'description': 'Pass the value that you want to set the attribute to.'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': True,
+                                                      'library_method_call_snippet': 'attribute_value_ctype',
+                                                      'name': 'attributeValue',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'attribute_value',
+                                                      'python_name_or_default_for_init': 'attribute_value',
+                                                      'python_name_with_default': 'attribute_value',
+                                                      'python_name_with_doc_default': 'attribute_value',
+                                                      'python_type': 'str',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViChar[]',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False}],
+                                'python_code_variables': [],
+                                'python_name': '_set_attribute_vi_string',
+                                'render_in_library': True,
+                                'render_in_session_base': True,
+                                'returns': 'ViStatus'},
+    'SetCustomType': {   'blocking': False,
+                         'codegen_method': 'public',
+                         'documentation': {'description': 'This function takes a custom type.'},
+                         'has_repeated_capability': False,
+                         'invalidates_attribute_cache': False,
+                         'is_error_handling': False,
+                         'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                         'name': 'SetCustomType',
+                         'parameters': [   {   'ctypes_type': 'ViSession',
+                                               'ctypes_type_library_call': 'ViSession',
+                                               'ctypes_variable_name': 'vi_ctype',
+                                               'direction': 'in',
+                                               'documentation': {'description': 'Identifies a particular instrument session.'},
+                                               'enum': None,
+                                               'is_buffer': False,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': True,
+                                               'is_string': False,
+                                               'library_method_call_snippet': 'vi_ctype',
+                                               'name': 'vi',
+                                               'numpy': False,
+                                               'numpy_into_return': False,
+                                               'python_name': 'vi',
+                                               'python_name_or_default_for_init': 'vi',
+                                               'python_name_with_default': 'vi',
+                                               'python_name_with_doc_default': 'vi',
+                                               'python_type': 'int',
+                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                               'type': 'ViSession',
+                                               'use_array': False,
+                                               'use_in_python_api': True,
+                                               'use_list': False},
+                                           {   'ctypes_type': 'custom_struct',
+                                               'ctypes_type_library_call': 'custom_struct.custom_struct',
+                                               'ctypes_variable_name': 'cs_ctype',
+                                               'direction': 'in',
+                                               'documentation': {'description': 'Set using custom type'},
+                                               'enum': None,
+                                               'is_buffer': False,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': False,
+                                               'is_string': False,
+                                               'library_method_call_snippet': 'cs_ctype',
+                                               'name': 'cs',
+                                               'numpy': False,
+                                               'numpy_into_return': False,
+                                               'python_name': 'cs',
+                                               'python_name_or_default_for_init': 'cs',
+                                               'python_name_with_default': 'cs',
+                                               'python_name_with_doc_default': 'cs',
+                                               'python_type': 'CustomStruct',
+                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                               'type': 'custom_struct',
+                                               'use_array': False,
+                                               'use_in_python_api': True,
+                                               'use_list': False}],
+                         'python_code_variables': [],
+                         'python_name': 'set_custom_type',
+                         'render_in_library': True,
+                         'render_in_session_base': False,
+                         'returns': 'ViStatus'},
+    'SetCustomTypeArray': {   'blocking': False,
+                              'codegen_method': 'public',
+                              'documentation': {'description': 'This function takes an array of custom types.'},
+                              'has_repeated_capability': False,
+                              'invalidates_attribute_cache': False,
+                              'is_error_handling': False,
+                              'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                              'name': 'SetCustomTypeArray',
+                              'parameters': [   {   'ctypes_type': 'ViSession',
+                                                    'ctypes_type_library_call': 'ViSession',
+                                                    'ctypes_variable_name': 'vi_ctype',
+                                                    'direction': 'in',
+                                                    'documentation': {'description': 'Identifies a particular instrument session.'},
+                                                    'enum': None,
+                                                    'is_buffer': False,
+                                                    'is_repeated_capability': False,
+                                                    'is_session_handle': True,
+                                                    'is_string': False,
+                                                    'library_method_call_snippet': 'vi_ctype',
+                                                    'name': 'vi',
+                                                    'numpy': False,
+                                                    'numpy_into_return': False,
+                                                    'python_name': 'vi',
+                                                    'python_name_or_default_for_init': 'vi',
+                                                    'python_name_with_default': 'vi',
+                                                    'python_name_with_doc_default': 'vi',
+                                                    'python_type': 'int',
+                                                    'size': {'mechanism': 'fixed', 'value': 1},
+                                                    'type': 'ViSession',
+                                                    'use_array': False,
+                                                    'use_in_python_api': True,
+                                                    'use_list': False},
+                                                {   'ctypes_type': 'ViInt32',
+                                                    'ctypes_type_library_call': 'ViInt32',
+                                                    'ctypes_variable_name': 'number_of_elements_ctype',
+                                                    'direction': 'in',
+                                                    'documentation': {'description': 'Number of elements in the array.'},
+                                                    'enum': None,
+                                                    'is_buffer': False,
+                                                    'is_repeated_capability': False,
+                                                    'is_session_handle': False,
+                                                    'is_string': False,
+                                                    'library_method_call_snippet': 'number_of_elements_ctype',
+                                                    'name': 'numberOfElements',
+                                                    'numpy': False,
+                                                    'numpy_into_return': False,
+                                                    'python_name': 'number_of_elements',
+                                                    'python_name_or_default_for_init': 'number_of_elements',
+                                                    'python_name_with_default': 'number_of_elements',
+                                                    'python_name_with_doc_default': 'number_of_elements',
+                                                    'python_type': 'int',
+                                                    'size': {'mechanism': 'fixed', 'value': 1},
+                                                    'type': 'ViInt32',
+                                                    'use_array': False,
+                                                    'use_in_python_api': False,
+                                                    'use_list': False},
+                                                {   'ctypes_type': 'custom_struct',
+                                                    'ctypes_type_library_call': 'ctypes.POINTER(custom_struct.custom_struct)',
+                                                    'ctypes_variable_name': 'cs_ctype',
+                                                    'direction': 'in',
+                                                    'documentation': {'description': 'Set using custom type'},
+                                                    'enum': None,
+                                                    'is_buffer': True,
+                                                    'is_repeated_capability': False,
+                                                    'is_session_handle': False,
+                                                    'is_string': False,
+                                                    'library_method_call_snippet': 'cs_ctype',
+                                                    'name': 'cs',
+                                                    'numpy': False,
+                                                    'numpy_into_return': False,
+                                                    'original_type': 'custom_struct[]',
+                                                    'python_name': 'cs',
+                                                    'python_name_or_default_for_init': 'cs',
+                                                    'python_name_with_default': 'cs',
+                                                    'python_name_with_doc_default': 'cs',
+                                                    'python_type': 'CustomStruct',
+                                                    'size': {'mechanism': 'len', 'value': 'numberOfElements'},
+                                                    'type': 'custom_struct',
+                                                    'use_array': False,
+                                                    'use_in_python_api': True,
+                                                    'use_list': True}],
+                              'python_code_variables': [],
+                              'python_name': 'set_custom_type_array',
+                              'render_in_library': True,
+                              'render_in_session_base': False,
+                              'returns': 'ViStatus'},
+    'TwoInputFunction': {   'blocking': False,
+                            'codegen_method': 'public',
+                            'documentation': {'description': 'This function takes two parameters other than the session.'},
+                            'has_repeated_capability': False,
+                            'invalidates_attribute_cache': False,
+                            'is_error_handling': False,
+                            'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                            'name': 'TwoInputFunction',
+                            'parameters': [   {   'ctypes_type': 'ViSession',
+                                                  'ctypes_type_library_call': 'ViSession',
+                                                  'ctypes_variable_name': 'vi_ctype',
+                                                  'direction': 'in',
+                                                  'documentation': {'description': 'Identifies a particular instrument session. You obtain the **vi**'},
+                                                  'enum': None,
+                                                  'is_buffer': False,
+                                                  'is_repeated_capability': False,
+                                                  'is_session_handle': True,
+                                                  'is_string': False,
+                                                  'library_method_call_snippet': 'vi_ctype',
+                                                  'name': 'vi',
+                                                  'numpy': False,
+                                                  'numpy_into_return': False,
+                                                  'python_name': 'vi',
+                                                  'python_name_or_default_for_init': 'vi',
+                                                  'python_name_with_default': 'vi',
+                                                  'python_name_with_doc_default': 'vi',
+                                                  'python_type': 'int',
+                                                  'size': {'mechanism': 'fixed', 'value': 1},
+                                                  'type': 'ViSession',
+                                                  'use_array': False,
+                                                  'use_in_python_api': True,
+                                                  'use_list': False},
+                                              {   'ctypes_type': 'ViReal64',
+                                                  'ctypes_type_library_call': 'ViReal64',
+                                                  'ctypes_variable_name': 'a_number_ctype',
+                                                  'direction': 'in',
+                                                  'documentation': {'description': 'Contains a number'},
+                                                  'enum': None,
+                                                  'is_buffer': False,
+                                                  'is_repeated_capability': False,
+                                                  'is_session_handle': False,
+                                                  'is_string': False,
+                                                  'library_method_call_snippet': 'a_number_ctype',
+                                                  'name': 'aNumber',
+                                                  'numpy': False,
+                                                  'numpy_into_return': False,
+                                                  'python_name': 'a_number',
+                                                  'python_name_or_default_for_init': 'a_number',
+                                                  'python_name_with_default': 'a_number',
+                                                  'python_name_with_doc_default': 'a_number',
+                                                  'python_type': 'float',
+                                                  'size': {'mechanism': 'fixed', 'value': 1},
+                                                  'type': 'ViReal64',
+                                                  'use_array': False,
+                                                  'use_in_python_api': True,
+                                                  'use_list': False},
+                                              {   'ctypes_type': 'ViChar[]',
+                                                  'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                  'ctypes_variable_name': 'a_string_ctype',
+                                                  'direction': 'in',
+                                                  'documentation': {'description': 'Contains a string'},
+                                                  'enum': None,
+                                                  'is_buffer': False,
+                                                  'is_repeated_capability': False,
+                                                  'is_session_handle': False,
+                                                  'is_string': True,
+                                                  'library_method_call_snippet': 'a_string_ctype',
+                                                  'name': 'aString',
+                                                  'numpy': False,
+                                                  'numpy_into_return': False,
+                                                  'python_name': 'a_string',
+                                                  'python_name_or_default_for_init': 'a_string',
+                                                  'python_name_with_default': 'a_string',
+                                                  'python_name_with_doc_default': 'a_string',
+                                                  'python_type': 'str',
+                                                  'size': {'mechanism': 'fixed', 'value': 1},
+                                                  'type': 'ViChar[]',
+                                                  'use_array': False,
+                                                  'use_in_python_api': True,
+                                                  'use_list': False}],
+                            'python_code_variables': [],
+                            'python_name': 'two_input_function',
+                            'render_in_library': True,
+                            'render_in_session_base': False,
+                            'returns': 'ViStatus'},
+    'Use64BitNumber': {   'blocking': False,
+                          'codegen_method': 'public',
+                          'documentation': {'description': 'Returns a number and a string.', 'note': 'This function rules!'},
+                          'has_repeated_capability': False,
+                          'invalidates_attribute_cache': False,
+                          'is_error_handling': False,
+                          'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                          'name': 'Use64BitNumber',
+                          'parameters': [   {   'ctypes_type': 'ViSession',
+                                                'ctypes_type_library_call': 'ViSession',
+                                                'ctypes_variable_name': 'vi_ctype',
+                                                'direction': 'in',
+                                                'documentation': {'description': 'Identifies a particular instrument session.'},
+                                                'enum': None,
+                                                'is_buffer': False,
+                                                'is_repeated_capability': False,
+                                                'is_session_handle': True,
+                                                'is_string': False,
+                                                'library_method_call_snippet': 'vi_ctype',
+                                                'name': 'vi',
+                                                'numpy': False,
+                                                'numpy_into_return': False,
+                                                'python_name': 'vi',
+                                                'python_name_or_default_for_init': 'vi',
+                                                'python_name_with_default': 'vi',
+                                                'python_name_with_doc_default': 'vi',
+                                                'python_type': 'int',
+                                                'size': {'mechanism': 'fixed', 'value': 1},
+                                                'type': 'ViSession',
+                                                'use_array': False,
+                                                'use_in_python_api': True,
+                                                'use_list': False},
+                                            {   'ctypes_type': 'ViInt64',
+                                                'ctypes_type_library_call': 'ViInt64',
+                                                'ctypes_variable_name': 'input_ctype',
+                                                'direction': 'in',
+                                                'documentation': {'description': 'A big number on its way in.'},
+                                                'enum': None,
+                                                'is_buffer': False,
+                                                'is_repeated_capability': False,
+                                                'is_session_handle': False,
+                                                'is_string': False,
+                                                'library_method_call_snippet': 'input_ctype',
+                                                'name': 'input',
+                                                'numpy': False,
+                                                'numpy_into_return': False,
+                                                'python_name': 'input',
+                                                'python_name_or_default_for_init': 'input',
+                                                'python_name_with_default': 'input',
+                                                'python_name_with_doc_default': 'input',
+                                                'python_type': 'int',
+                                                'size': {'mechanism': 'fixed', 'value': 1},
+                                                'type': 'ViInt64',
+                                                'use_array': False,
+                                                'use_in_python_api': True,
+                                                'use_list': False},
+                                            {   'ctypes_type': 'ViInt64',
+                                                'ctypes_type_library_call': 'ctypes.POINTER(ViInt64)',
+                                                'ctypes_variable_name': 'output_ctype',
+                                                'direction': 'out',
+                                                'documentation': {'description': 'A big number on its way out.'},
+                                                'enum': None,
+                                                'is_buffer': False,
+                                                'is_repeated_capability': False,
+                                                'is_session_handle': False,
+                                                'is_string': False,
+                                                'library_method_call_snippet': 'None if output_ctype is None else (ctypes.pointer(output_ctype))',
+                                                'name': 'output',
+                                                'numpy': False,
+                                                'numpy_into_return': False,
+                                                'python_name': 'output',
+                                                'python_name_or_default_for_init': 'output',
+                                                'python_name_with_default': 'output',
+                                                'python_name_with_doc_default': 'output',
+                                                'python_type': 'int',
+                                                'size': {'mechanism': 'fixed', 'value': 1},
+                                                'type': 'ViInt64',
+                                                'use_array': False,
+                                                'use_in_python_api': True,
+                                                'use_list': False}],
+                          'python_code_variables': [],
+                          'python_name': 'use64_bit_number',
+                          'render_in_library': True,
+                          'render_in_session_base': False,
+                          'returns': 'ViStatus'},
+    'WriteWaveform': {   'blocking': False,
+                         'codegen_method': 'public',
+                         'documentation': {'description': 'Writes waveform to the driver'},
+                         'has_repeated_capability': False,
+                         'invalidates_attribute_cache': False,
+                         'is_error_handling': False,
+                         'method_templates': [   {'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'},
+                                                 {'documentation_filename': '/numpy_method', 'method_python_name_suffix': '_numpy', 'session_filename': '/numpy_write_method'}],
+                         'name': 'WriteWaveform',
+                         'parameters': [   {   'ctypes_type': 'ViSession',
+                                               'ctypes_type_library_call': 'ViSession',
+                                               'ctypes_variable_name': 'vi_ctype',
+                                               'direction': 'in',
+                                               'documentation': {'description': 'Identifies a particular instrument session.'},
+                                               'enum': None,
+                                               'is_buffer': False,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': True,
+                                               'is_string': False,
+                                               'library_method_call_snippet': 'vi_ctype',
+                                               'name': 'vi',
+                                               'numpy': False,
+                                               'numpy_into_return': False,
+                                               'python_name': 'vi',
+                                               'python_name_or_default_for_init': 'vi',
+                                               'python_name_with_default': 'vi',
+                                               'python_name_with_doc_default': 'vi',
+                                               'python_type': 'int',
+                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                               'type': 'ViSession',
+                                               'use_array': False,
+                                               'use_in_python_api': True,
+                                               'use_list': False},
+                                           {   'ctypes_type': 'ViInt32',
+                                               'ctypes_type_library_call': 'ViInt32',
+                                               'ctypes_variable_name': 'number_of_samples_ctype',
+                                               'direction': 'in',
+                                               'documentation': {'description': 'How many samples the waveform contains.'},
+                                               'enum': None,
+                                               'is_buffer': False,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': False,
+                                               'is_string': False,
+                                               'library_method_call_snippet': 'number_of_samples_ctype',
+                                               'name': 'numberOfSamples',
+                                               'numpy': False,
+                                               'numpy_into_return': False,
+                                               'python_name': 'number_of_samples',
+                                               'python_name_or_default_for_init': 'number_of_samples',
+                                               'python_name_with_default': 'number_of_samples',
+                                               'python_name_with_doc_default': 'number_of_samples',
+                                               'python_type': 'int',
+                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                               'type': 'ViInt32',
+                                               'use_array': False,
+                                               'use_in_python_api': False,
+                                               'use_list': False},
+                                           {   'ctypes_type': 'ViReal64',
+                                               'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                               'ctypes_variable_name': 'waveform_ctype',
+                                               'direction': 'in',
+                                               'documentation': {'description': 'Waveform data.'},
+                                               'enum': None,
+                                               'is_buffer': True,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': False,
+                                               'is_string': False,
+                                               'library_method_call_snippet': 'waveform_ctype',
+                                               'name': 'waveform',
+                                               'numpy': True,
+                                               'numpy_into_return': False,
+                                               'numpy_type': 'float64',
+                                               'original_type': 'ViReal64[]',
+                                               'python_name': 'waveform',
+                                               'python_name_or_default_for_init': 'waveform',
+                                               'python_name_with_default': 'waveform',
+                                               'python_name_with_doc_default': 'waveform',
+                                               'python_type': 'float',
+                                               'size': {'mechanism': 'len', 'value': 'numberOfSamples'},
+                                               'type': 'ViReal64',
+                                               'use_array': True,
+                                               'use_in_python_api': True,
+                                               'use_list': False}],
+                         'python_code_variables': [],
+                         'python_name': 'write_waveform',
+                         'render_in_library': True,
+                         'render_in_session_base': False,
+                         'returns': 'ViStatus'},
+    '_init_function': {   'blocking': False,
+                          'codegen_method': 'no',
+                          'documentation': {'description': 'Creates a new IVI instrument driver session.'},
+                          'has_repeated_capability': False,
+                          'invalidates_attribute_cache': False,
+                          'is_error_handling': False,
+                          'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                          'name': 'InitWithOptions',
+                          'parameters': [   {   'ctypes_type': 'ViString',
+                                                'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                'ctypes_variable_name': 'resource_name_ctype',
+                                                'direction': 'in',
+                                                'documentation': {'caution': 'This is just some string.', 'description': 'Contains the **resource_name** of the device to initialize.'},
+                                                'enum': None,
+                                                'is_buffer': False,
+                                                'is_repeated_capability': False,
+                                                'is_session_handle': False,
+                                                'is_string': True,
+                                                'library_method_call_snippet': 'resource_name_ctype',
+                                                'name': 'resourceName',
+                                                'numpy': False,
+                                                'numpy_into_return': False,
+                                                'python_name': 'resource_name',
+                                                'python_name_or_default_for_init': 'resource_name',
+                                                'python_name_with_default': 'resource_name',
+                                                'python_name_with_doc_default': 'resource_name',
+                                                'python_type': 'str',
+                                                'size': {'mechanism': 'fixed', 'value': 1},
+                                                'type': 'ViString',
+                                                'use_array': False,
+                                                'use_in_python_api': True,
+                                                'use_list': False},
+                                            {   'ctypes_type': 'ViBoolean',
+                                                'ctypes_type_library_call': 'ViBoolean',
+                                                'ctypes_variable_name': 'id_query_ctype',
+                                                'default_value': False,
+                                                'direction': 'in',
+                                                'documentation': {   'description': 'NI-FAKE is probably not needed.',
+                                                                     'table_body': [['VI_TRUE (default)', '1', 'Perform ID Query'], ['VI_FALSE', '0', 'Skip ID Query']]},
+                                                'enum': None,
+                                                'is_buffer': False,
+                                                'is_repeated_capability': False,
+                                                'is_session_handle': False,
+                                                'is_string': False,
+                                                'library_method_call_snippet': 'id_query_ctype',
+                                                'name': 'idQuery',
+                                                'numpy': False,
+                                                'numpy_into_return': False,
+                                                'python_name': 'id_query',
+                                                'python_name_or_default_for_init': 'False',
+                                                'python_name_with_default': 'id_query=False',
+                                                'python_name_with_doc_default': 'id_query=False',
+                                                'python_type': 'bool',
+                                                'size': {'mechanism': 'fixed', 'value': 1},
+                                                'type': 'ViBoolean',
+                                                'use_array': False,
+                                                'use_in_python_api': False,
+                                                'use_list': False},
+                                            {   'ctypes_type': 'ViBoolean',
+                                                'ctypes_type_library_call': 'ViBoolean',
+                                                'ctypes_variable_name': 'reset_device_ctype',
+                                                'default_value': False,
+                                                'direction': 'in',
+                                                'documentation': {   'description': 'Specifies whether to reset',
+                                                                     'table_body': [['VI_TRUE (default)', '1', 'Reset Device'], ['VI_FALSE', '0', "Don't Reset"]]},
+                                                'enum': None,
+                                                'is_buffer': False,
+                                                'is_repeated_capability': False,
+                                                'is_session_handle': False,
+                                                'is_string': False,
+                                                'library_method_call_snippet': 'reset_device_ctype',
+                                                'name': 'resetDevice',
+                                                'numpy': False,
+                                                'numpy_into_return': False,
+                                                'python_name': 'reset_device',
+                                                'python_name_or_default_for_init': 'reset_device',
+                                                'python_name_with_default': 'reset_device=False',
+                                                'python_name_with_doc_default': 'reset_device=False',
+                                                'python_type': 'bool',
+                                                'size': {'mechanism': 'fixed', 'value': 1},
+                                                'type': 'ViBoolean',
+                                                'use_array': False,
+                                                'use_in_python_api': True,
+                                                'use_list': False},
+                                            {   'ctypes_type': 'ViString',
+                                                'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                'ctypes_variable_name': 'option_string_ctype',
+                                                'direction': 'in',
+                                                'documentation': {   'description': '\n'
+                                                                                    'Specifies the initial value of certain attributes for the session. The\n'
+                                                                                    'syntax for **options** is a dictionary of attributes with an assigned\n'
+                                                                                    'value. For example:\n'
+                                                                                    '\n'
+                                                                                    "{ 'simulate': False }\n"
+                                                                                    '\n'
+                                                                                    'You do not have to specify a value for all the attributes. If you do not\n'
+                                                                                    'specify a value for an attribute, the default value is used.\n'
+                                                                                    '\n'
+                                                                                    'Advanced Example:\n'
+                                                                                    "{ 'simulate': True, 'driver_setup': { 'Model': '<model number>',  'BoardType': '<type>' } }\n",
+                                                                     'table_body': [   ['range_check', 'True'],
+                                                                                       ['query_instrument_status', 'False'],
+                                                                                       ['cache', 'True'],
+                                                                                       ['simulate', 'False'],
+                                                                                       ['record_value_coersions', 'False'],
+                                                                                       ['driver_setup', '{}']],
+                                                                     'table_header': ['Attribute', 'Default']},
+                                                'enum': None,
+                                                'is_buffer': False,
+                                                'is_repeated_capability': False,
+                                                'is_session_handle': False,
+                                                'is_string': True,
+                                                'library_method_call_snippet': 'option_string_ctype',
+                                                'name': 'optionString',
+                                                'numpy': False,
+                                                'numpy_into_return': False,
+                                                'python_api_converter_name': 'convert_init_with_options_dictionary',
+                                                'python_name': 'options',
+                                                'python_name_or_default_for_init': 'option_string',
+                                                'python_name_with_default': 'options={}',
+                                                'python_name_with_doc_default': 'option_string',
+                                                'python_type': 'dict',
+                                                'size': {'mechanism': 'fixed', 'value': 1},
+                                                'type': 'ViString',
+                                                'use_array': False,
+                                                'use_in_python_api': True,
+                                                'use_list': False},
+                                            {   'ctypes_type': 'ViSession',
+                                                'ctypes_type_library_call': 'ctypes.POINTER(ViSession)',
+                                                'ctypes_variable_name': 'vi_ctype',
+                                                'direction': 'out',
+                                                'documentation': {'description': '\nA session object representing the device.\n'},
+                                                'enum': None,
+                                                'is_buffer': False,
+                                                'is_repeated_capability': False,
+                                                'is_session_handle': False,
+                                                'is_string': False,
+                                                'library_method_call_snippet': 'None if vi_ctype is None else (ctypes.pointer(vi_ctype))',
+                                                'name': 'vi',
+                                                'numpy': False,
+                                                'numpy_into_return': False,
+                                                'python_name': 'session',
+                                                'python_name_or_default_for_init': 'vi',
+                                                'python_name_with_default': 'vi',
+                                                'python_name_with_doc_default': 'vi',
+                                                'python_type': 'nifake.Session',
+                                                'size': {'mechanism': 'fixed', 'value': 1},
+                                                'type': 'ViSession',
+                                                'use_array': False,
+                                                'use_in_python_api': True,
+                                                'use_list': False}],
+                          'python_code_variables': [],
+                          'python_name': '_init_with_options',
+                          'render_in_library': True,
+                          'render_in_session_base': False,
+                          'returns': 'ViStatus'},
+    'close': {   'blocking': False,
+                 'codegen_method': 'private',
+                 'documentation': {'description': 'Closes the specified session and deallocates resources that it reserved.'},
+                 'has_repeated_capability': False,
+                 'invalidates_attribute_cache': False,
+                 'is_error_handling': False,
+                 'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                 'name': 'close',
+                 'parameters': [   {   'ctypes_type': 'ViSession',
+                                       'ctypes_type_library_call': 'ViSession',
+                                       'ctypes_variable_name': 'vi_ctype',
+                                       'direction': 'in',
+                                       'documentation': {'description': 'Identifies a particular instrument session.'},
+                                       'enum': None,
+                                       'is_buffer': False,
+                                       'is_repeated_capability': False,
+                                       'is_session_handle': True,
+                                       'is_string': False,
+                                       'library_method_call_snippet': 'vi_ctype',
+                                       'name': 'vi',
+                                       'numpy': False,
+                                       'numpy_into_return': False,
+                                       'python_name': 'vi',
+                                       'python_name_or_default_for_init': 'vi',
+                                       'python_name_with_default': 'vi',
+                                       'python_name_with_doc_default': 'vi',
+                                       'python_type': 'int',
+                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                       'type': 'ViSession',
+                                       'use_array': False,
+                                       'use_in_python_api': True,
+                                       'use_list': False}],
+                 'python_code_variables': [],
+                 'python_name': '_close',
+                 'render_in_library': True,
+                 'render_in_session_base': False,
+                 'returns': 'ViStatus'},
+    'error_message': {   'blocking': False,
+                         'codegen_method': 'private',
+                         'documentation': {'description': 'Takes the errorCode returned by a functiona and returns it as a user-readable string.'},
+                         'has_repeated_capability': False,
+                         'invalidates_attribute_cache': False,
+                         'is_error_handling': True,
+                         'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                         'name': 'error_message',
+                         'parameters': [   {   'ctypes_type': 'ViSession',
+                                               'ctypes_type_library_call': 'ViSession',
+                                               'ctypes_variable_name': 'vi_ctype',
+                                               'direction': 'in',
+                                               'documentation': {'description': 'Identifies a particular instrument session.'},
+                                               'enum': None,
+                                               'is_buffer': False,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': True,
+                                               'is_string': False,
+                                               'library_method_call_snippet': 'vi_ctype',
+                                               'name': 'vi',
+                                               'numpy': False,
+                                               'numpy_into_return': False,
+                                               'python_name': 'vi',
+                                               'python_name_or_default_for_init': 'vi',
+                                               'python_name_with_default': 'vi',
+                                               'python_name_with_doc_default': 'vi',
+                                               'python_type': 'int',
+                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                               'type': 'ViSession',
+                                               'use_array': False,
+                                               'use_in_python_api': True,
+                                               'use_list': False},
+                                           {   'ctypes_type': 'ViStatus',
+                                               'ctypes_type_library_call': 'ViStatus',
+                                               'ctypes_variable_name': 'error_code_ctype',
+                                               'direction': 'in',
+                                               'documentation': {'description': 'The errorCode returned from the instrument.'},
+                                               'enum': None,
+                                               'is_buffer': False,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': False,
+                                               'is_string': False,
+                                               'library_method_call_snippet': 'error_code_ctype',
+                                               'name': 'errorCode',
+                                               'numpy': False,
+                                               'numpy_into_return': False,
+                                               'python_name': 'error_code',
+                                               'python_name_or_default_for_init': 'error_code',
+                                               'python_name_with_default': 'error_code',
+                                               'python_name_with_doc_default': 'error_code',
+                                               'python_type': 'int',
+                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                               'type': 'ViStatus',
+                                               'use_array': False,
+                                               'use_in_python_api': True,
+                                               'use_list': False},
+                                           {   'ctypes_type': 'ViChar[]',
+                                               'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                               'ctypes_variable_name': 'error_message_ctype',
+                                               'direction': 'out',
+                                               'documentation': {'description': 'The error information formatted into a string.'},
+                                               'enum': None,
+                                               'is_buffer': False,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': False,
+                                               'is_string': True,
+                                               'library_method_call_snippet': 'error_message_ctype',
+                                               'name': 'errorMessage',
+                                               'numpy': False,
+                                               'numpy_into_return': False,
+                                               'python_name': 'error_message',
+                                               'python_name_or_default_for_init': 'error_message',
+                                               'python_name_with_default': 'error_message',
+                                               'python_name_with_doc_default': 'error_message',
+                                               'python_type': 'str',
+                                               'size': {'mechanism': 'fixed', 'value': 256},
+                                               'type': 'ViChar[]',
+                                               'use_array': False,
+                                               'use_in_python_api': True,
+                                               'use_list': False}],
+                         'python_code_variables': [],
+                         'python_name': '_error_message',
+                         'render_in_library': True,
+                         'render_in_session_base': True,
+                         'returns': 'ViStatus'}}
\ No newline at end of file
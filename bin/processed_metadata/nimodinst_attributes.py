@@ -0,0 +1,111 @@
+attributes =
+{   0: {   'access': 'read',
+           'attribute_class': 'AttributeViString',
+           'cacheable': True,
+           'channel_based': 'False',
+           'codegen_method': 'public',
+           'documentation': {'description': 'The name of the device, which can be used to open an instrument driver session for that device'},
+           'enum': None,
+           'name': 'DEVICE_NAME',
+           'python_name': 'device_name',
+           'python_type': 'str',
+           'resettable': 'No',
+           'type': 'ViString'},
+    1: {   'access': 'read',
+           'attribute_class': 'AttributeViString',
+           'cacheable': True,
+           'channel_based': 'False',
+           'codegen_method': 'public',
+           'documentation': {'description': 'The model of the device (for example, NI PXI-5122)'},
+           'enum': None,
+           'name': 'DEVICE_MODEL',
+           'python_name': 'device_model',
+           'python_type': 'str',
+           'resettable': 'No',
+           'type': 'ViString'},
+    2: {   'access': 'read',
+           'attribute_class': 'AttributeViString',
+           'cacheable': True,
+           'channel_based': 'False',
+           'codegen_method': 'public',
+           'documentation': {'description': 'The serial number of the device'},
+           'enum': None,
+           'name': 'SERIAL_NUMBER',
+           'python_name': 'serial_number',
+           'python_type': 'str',
+           'resettable': 'No',
+           'type': 'ViString'},
+    10: {   'access': 'read',
+            'attribute_class': 'AttributeViInt32',
+            'cacheable': True,
+            'channel_based': 'False',
+            'codegen_method': 'public',
+            'documentation': {   'description': 'The slot (for example, in a PXI chassis) in which the device is installed. This attribute can only be queried for PXI devices installed in a chassis '
+                                                'that has been properly identified in MAX.'},
+            'enum': None,
+            'name': 'SLOT_NUMBER',
+            'python_name': 'slot_number',
+            'python_type': 'int',
+            'resettable': 'No',
+            'type': 'ViInt32'},
+    11: {   'access': 'read',
+            'attribute_class': 'AttributeViInt32',
+            'cacheable': True,
+            'channel_based': 'False',
+            'codegen_method': 'public',
+            'documentation': {   'description': 'The number of the chassis in which the device is installed. This attribute can only be queried for PXI devices installed in a chassis that has been '
+                                                'properly identified in MAX.'},
+            'enum': None,
+            'name': 'CHASSIS_NUMBER',
+            'python_name': 'chassis_number',
+            'python_type': 'int',
+            'resettable': 'No',
+            'type': 'ViInt32'},
+    12: {   'access': 'read',
+            'attribute_class': 'AttributeViInt32',
+            'cacheable': True,
+            'channel_based': 'False',
+            'codegen_method': 'public',
+            'documentation': {'description': 'The bus on which the device has been enumerated.'},
+            'enum': None,
+            'name': 'BUS_NUMBER',
+            'python_name': 'bus_number',
+            'python_type': 'int',
+            'resettable': 'No',
+            'type': 'ViInt32'},
+    13: {   'access': 'read',
+            'attribute_class': 'AttributeViInt32',
+            'cacheable': True,
+            'channel_based': 'False',
+            'codegen_method': 'public',
+            'documentation': {'description': 'The socket number on which the device has been enumerated'},
+            'enum': None,
+            'name': 'SOCKET_NUMBER',
+            'python_name': 'socket_number',
+            'python_type': 'int',
+            'resettable': 'No',
+            'type': 'ViInt32'},
+    17: {   'access': 'read',
+            'attribute_class': 'AttributeViInt32',
+            'cacheable': True,
+            'channel_based': 'False',
+            'codegen_method': 'public',
+            'documentation': {'description': '**PCIEXPRESS_LINK_WIDTH**'},
+            'enum': None,
+            'name': 'PCIEXPRESS_LINK_WIDTH',
+            'python_name': 'pciexpress_link_width',
+            'python_type': 'int',
+            'resettable': 'No',
+            'type': 'ViInt32'},
+    18: {   'access': 'read',
+            'attribute_class': 'AttributeViInt32',
+            'cacheable': True,
+            'channel_based': 'False',
+            'codegen_method': 'public',
+            'documentation': {'description': '**MAX_PCIEXPRESS_LINK_WIDTH**'},
+            'enum': None,
+            'name': 'MAX_PCIEXPRESS_LINK_WIDTH',
+            'python_name': 'max_pciexpress_link_width',
+            'python_type': 'int',
+            'resettable': 'No',
+            'type': 'ViInt32'}}
\ No newline at end of file
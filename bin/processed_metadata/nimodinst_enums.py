@@ -0,0 +1,2 @@
+enums =
+{}
\ No newline at end of file
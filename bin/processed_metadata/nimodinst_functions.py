@@ -0,0 +1,526 @@
+function =
+{   'CloseInstalledDevicesSession': {   'blocking': False,
+                                        'codegen_method': 'private',
+                                        'documentation': {   'description': '\n'
+                                                                            'Cleans up the NI-ModInst session created by a call to\n'
+                                                                            'niModInst_OpenInstalledDevicesSession. Call this function when you are\n'
+                                                                            'finished using the session handle and do not use this handle again.\n'},
+                                        'has_repeated_capability': False,
+                                        'invalidates_attribute_cache': False,
+                                        'is_error_handling': False,
+                                        'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                        'name': 'CloseInstalledDevicesSession',
+                                        'parameters': [   {   'ctypes_type': 'ViSession',
+                                                              'ctypes_type_library_call': 'ViSession',
+                                                              'ctypes_variable_name': 'handle_ctype',
+                                                              'direction': 'in',
+                                                              'documentation': {'description': '\nThe NI-ModInst session handle created by\nniModInst_OpenInstalledDevicesSession.\n'},
+                                                              'enum': None,
+                                                              'is_buffer': False,
+                                                              'is_repeated_capability': False,
+                                                              'is_session_handle': True,
+                                                              'is_string': False,
+                                                              'library_method_call_snippet': 'handle_ctype',
+                                                              'name': 'handle',
+                                                              'numpy': False,
+                                                              'numpy_into_return': False,
+                                                              'python_name': 'handle',
+                                                              'python_name_or_default_for_init': 'handle',
+                                                              'python_name_with_default': 'handle',
+                                                              'python_name_with_doc_default': 'handle',
+                                                              'python_type': 'int',
+                                                              'size': {'mechanism': 'fixed', 'value': 1},
+                                                              'type': 'ViSession',
+                                                              'use_array': False,
+                                                              'use_in_python_api': True,
+                                                              'use_list': False}],
+                                        'python_code_variables': [],
+                                        'python_name': '_close_installed_devices_session',
+                                        'render_in_library': True,
+                                        'render_in_session_base': False,
+                                        'returns': 'ViStatus'},
+    'GetExtendedErrorInfo': {   'blocking': False,
+                                'codegen_method': 'private',
+                                'documentation': {   'description': '\n'
+                                                                    'Returns detailed information about the last error that occurred in the\n'
+                                                                    'current thread during a call to one of the NI-ModInst functions. When\n'
+                                                                    'one of the other functions returns a negative value as its return value,\n'
+                                                                    'immediately call this function to get detailed information about the\n'
+                                                                    'error. Because error information is stored on a thread-by-thread basis,\n'
+                                                                    'be sure to call this function in the same thread that called the\n'
+                                                                    'function that returned an error. The extended error information is\n'
+                                                                    'returned as a string. To find out the length of the error information\n'
+                                                                    'string before you allocate a buffer for it, call this function and pass\n'
+                                                                    '0 as the errorInfoBufferSize parameter or NULL as the errorInfo\n'
+                                                                    'parameter. When you do this, the function returns the size of the buffer\n'
+                                                                    'required to hold the error information string as its return value. You\n'
+                                                                    'can then allocate an appropriately sized string character buffer and\n'
+                                                                    'call this function again.\n'},
+                                'has_repeated_capability': False,
+                                'invalidates_attribute_cache': False,
+                                'is_error_handling': True,
+                                'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                'name': 'GetExtendedErrorInfo',
+                                'parameters': [   {   'ctypes_type': 'ViInt32',
+                                                      'ctypes_type_library_call': 'ViInt32',
+                                                      'ctypes_variable_name': 'error_info_buffer_size_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'The size of the buffer allocated and passed in as the errorInfo\n'
+                                                                                          'parameter. The buffer should be large enough to hold the errorInfo\n'
+                                                                                          'string (including a NULL terminating character). The size of the buffer\n'
+                                                                                          'allocated and passed in as the errorInfo parameter. The buffer should be\n'
+                                                                                          'large enough to hold the errorInfo string (including a NULL terminating\n'
+                                                                                          'character). Refer to the function help to find out how to determine the\n'
+                                                                                          'exact buffer size required.\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'error_info_buffer_size_ctype',
+                                                      'name': 'errorInfoBufferSize',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'error_info_buffer_size',
+                                                      'python_name_or_default_for_init': 'error_info_buffer_size',
+                                                      'python_name_with_default': 'error_info_buffer_size',
+                                                      'python_name_with_doc_default': 'error_info_buffer_size',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViInt32',
+                                                      'use_array': False,
+                                                      'use_in_python_api': False,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViChar[]',
+                                                      'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                      'ctypes_variable_name': 'error_info_ctype',
+                                                      'direction': 'out',
+                                                      'documentation': {'description': 'The character buffer into which the error information string is copied.'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': True,
+                                                      'library_method_call_snippet': 'error_info_ctype',
+                                                      'name': 'errorInfo',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'error_info',
+                                                      'python_name_or_default_for_init': 'error_info',
+                                                      'python_name_with_default': 'error_info',
+                                                      'python_name_with_doc_default': 'error_info',
+                                                      'python_type': 'str',
+                                                      'size': {'mechanism': 'ivi-dance', 'value': 'errorInfoBufferSize'},
+                                                      'type': 'ViChar[]',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False}],
+                                'python_code_variables': [],
+                                'python_name': '_get_extended_error_info',
+                                'render_in_library': True,
+                                'render_in_session_base': True,
+                                'returns': 'ViStatus'},
+    'GetInstalledDeviceAttributeViInt32': {   'blocking': False,
+                                              'codegen_method': 'private',
+                                              'documentation': {   'description': '\n'
+                                                                                  'Returns an integer attribute specified by the attributeID parameter for\n'
+                                                                                  'a device specified by the handle and index parameters. The handle\n'
+                                                                                  'parameter is expected to be a valid handle returned by\n'
+                                                                                  'niModInst_OpenInstalledDevicesSession. It therefore acts as a handle to\n'
+                                                                                  'a list of installed devices. The index parameter specifies the device in\n'
+                                                                                  'the list for which you want the attribute.\n'},
+                                              'has_repeated_capability': False,
+                                              'invalidates_attribute_cache': False,
+                                              'is_error_handling': False,
+                                              'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                              'name': 'GetInstalledDeviceAttributeViInt32',
+                                              'parameters': [   {   'ctypes_type': 'ViSession',
+                                                                    'ctypes_type_library_call': 'ViSession',
+                                                                    'ctypes_variable_name': 'handle_ctype',
+                                                                    'direction': 'in',
+                                                                    'documentation': {'description': '\nThe NI-ModInst session handle created by\nniModInst_OpenInstalledDevicesSession.\n'},
+                                                                    'enum': None,
+                                                                    'is_buffer': False,
+                                                                    'is_repeated_capability': False,
+                                                                    'is_session_handle': True,
+                                                                    'is_string': False,
+                                                                    'library_method_call_snippet': 'handle_ctype',
+                                                                    'name': 'handle',
+                                                                    'numpy': False,
+                                                                    'numpy_into_return': False,
+                                                                    'python_name': 'handle',
+                                                                    'python_name_or_default_for_init': 'handle',
+                                                                    'python_name_with_default': 'handle',
+                                                                    'python_name_with_doc_default': 'handle',
+                                                                    'python_type': 'int',
+                                                                    'size': {'mechanism': 'fixed', 'value': 1},
+                                                                    'type': 'ViSession',
+                                                                    'use_array': False,
+                                                                    'use_in_python_api': True,
+                                                                    'use_list': False},
+                                                                {   'ctypes_type': 'ViInt32',
+                                                                    'ctypes_type_library_call': 'ViInt32',
+                                                                    'ctypes_variable_name': 'index_ctype',
+                                                                    'direction': 'in',
+                                                                    'documentation': {   'description': '\n'
+                                                                                                        'A zero-based index that specifies the device for which you want the\n'
+                                                                                                        'attribute. This index parameter should be between 0 and (deviceCount -\n'
+                                                                                                        '1), inclusive, where deviceCount is the number of installed devices\n'
+                                                                                                        'returned by niModInst_OpenInstalledDevicesSession.\n'},
+                                                                    'enum': None,
+                                                                    'is_buffer': False,
+                                                                    'is_repeated_capability': False,
+                                                                    'is_session_handle': False,
+                                                                    'is_string': False,
+                                                                    'library_method_call_snippet': 'index_ctype',
+                                                                    'name': 'index',
+                                                                    'numpy': False,
+                                                                    'numpy_into_return': False,
+                                                                    'python_name': 'index',
+                                                                    'python_name_or_default_for_init': 'index',
+                                                                    'python_name_with_default': 'index',
+                                                                    'python_name_with_doc_default': 'index',
+                                                                    'python_type': 'int',
+                                                                    'size': {'mechanism': 'fixed', 'value': 1},
+                                                                    'type': 'ViInt32',
+                                                                    'use_array': False,
+                                                                    'use_in_python_api': True,
+                                                                    'use_list': False},
+                                                                {   'ctypes_type': 'ViInt32',
+                                                                    'ctypes_type_library_call': 'ViInt32',
+                                                                    'ctypes_variable_name': 'attribute_id_ctype',
+                                                                    'direction': 'in',
+                                                                    'documentation': {   'description': '\n'
+                                                                                                        'The ID of the integer attribute you want to query. Valid Values Slot\n'
+                                                                                                        'Number--the slot (for example, in a PXI chassis) in which the device is\n'
+                                                                                                        'installed. This attribute can only be queried for PXI devices installed\n'
+                                                                                                        'in a chassis that has been properly identified in MAX. Chassis\n'
+                                                                                                        'Number--the number of the chassis in which the device is installed. This\n'
+                                                                                                        'attribute can only be queried for PXI devices installed in a chassis\n'
+                                                                                                        'that has been properly identified in MAX. Bus Number--the bus on which\n'
+                                                                                                        'the device has been enumerated. Socket Number--the socket number on\n'
+                                                                                                        'which the device has been enumerated. Notes The bus number and socket\n'
+                                                                                                        'number can be used to form a VISA resource string for this device, of\n'
+                                                                                                        'the form "PXI::::INSTR". Traditional NI-DAQ devices do not support the\n'
+                                                                                                        'chassis number, bus number, and socket number attributes.\n'},
+                                                                    'enum': None,
+                                                                    'is_buffer': False,
+                                                                    'is_repeated_capability': False,
+                                                                    'is_session_handle': False,
+                                                                    'is_string': False,
+                                                                    'library_method_call_snippet': 'attribute_id_ctype',
+                                                                    'name': 'attributeID',
+                                                                    'numpy': False,
+                                                                    'numpy_into_return': False,
+                                                                    'python_name': 'attribute_id',
+                                                                    'python_name_or_default_for_init': 'attribute_id',
+                                                                    'python_name_with_default': 'attribute_id',
+                                                                    'python_name_with_doc_default': 'attribute_id',
+                                                                    'python_type': 'int',
+                                                                    'size': {'mechanism': 'fixed', 'value': 1},
+                                                                    'type': 'ViInt32',
+                                                                    'use_array': False,
+                                                                    'use_in_python_api': True,
+                                                                    'use_list': False},
+                                                                {   'ctypes_type': 'ViInt32',
+                                                                    'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                                                    'ctypes_variable_name': 'attribute_value_ctype',
+                                                                    'direction': 'out',
+                                                                    'documentation': {   'description': '\n'
+                                                                                                        'A pointer to a signed 32-bit integer variable that receives the value of\n'
+                                                                                                        'the requested attribute.\n'},
+                                                                    'enum': None,
+                                                                    'is_buffer': False,
+                                                                    'is_repeated_capability': False,
+                                                                    'is_session_handle': False,
+                                                                    'is_string': False,
+                                                                    'library_method_call_snippet': 'None if attribute_value_ctype is None else (ctypes.pointer(attribute_value_ctype))',
+                                                                    'name': 'attributeValue',
+                                                                    'numpy': False,
+                                                                    'numpy_into_return': False,
+                                                                    'python_name': 'attribute_value',
+                                                                    'python_name_or_default_for_init': 'attribute_value',
+                                                                    'python_name_with_default': 'attribute_value',
+                                                                    'python_name_with_doc_default': 'attribute_value',
+                                                                    'python_type': 'int',
+                                                                    'size': {'mechanism': 'fixed', 'value': 1},
+                                                                    'type': 'ViInt32',
+                                                                    'use_array': False,
+                                                                    'use_in_python_api': True,
+                                                                    'use_list': False}],
+                                              'python_code_variables': [],
+                                              'python_name': '_get_installed_device_attribute_vi_int32',
+                                              'render_in_library': True,
+                                              'render_in_session_base': False,
+                                              'returns': 'ViStatus'},
+    'GetInstalledDeviceAttributeViString': {   'blocking': False,
+                                               'codegen_method': 'private',
+                                               'documentation': {   'description': '\n'
+                                                                                   'Returns a string attribute specified by the attributeID parameter for a\n'
+                                                                                   'device specified by the handle and index parameters. The handle\n'
+                                                                                   'parameter is expected to be a valid handle returned by\n'
+                                                                                   'niModInst_OpenInstalledDevicesSession. Therefore, it acts as a handle\n'
+                                                                                   'to a list of installed devices. The index parameter specifies for which\n'
+                                                                                   'device in the list you want the attribute. To find out the length of the\n'
+                                                                                   'device name string before you allocate a buffer for it, simply call this\n'
+                                                                                   'function and pass 0 as the attributeValueBufferSize parameter or NULL as\n'
+                                                                                   'the attributeValue parameter. When you do this, the function returns the\n'
+                                                                                   'size of the buffer required to hold the attribute value string as its\n'
+                                                                                   'return value. You can then allocate an appropriately sized character\n'
+                                                                                   'buffer and call this function again.\n'},
+                                               'has_repeated_capability': False,
+                                               'invalidates_attribute_cache': False,
+                                               'is_error_handling': False,
+                                               'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                               'name': 'GetInstalledDeviceAttributeViString',
+                                               'parameters': [   {   'ctypes_type': 'ViSession',
+                                                                     'ctypes_type_library_call': 'ViSession',
+                                                                     'ctypes_variable_name': 'handle_ctype',
+                                                                     'direction': 'in',
+                                                                     'documentation': {'description': '\nThe NI-ModInst session handle created by\nniModInst_OpenInstalledDevicesSession.\n'},
+                                                                     'enum': None,
+                                                                     'is_buffer': False,
+                                                                     'is_repeated_capability': False,
+                                                                     'is_session_handle': True,
+                                                                     'is_string': False,
+                                                                     'library_method_call_snippet': 'handle_ctype',
+                                                                     'name': 'handle',
+                                                                     'numpy': False,
+                                                                     'numpy_into_return': False,
+                                                                     'python_name': 'handle',
+                                                                     'python_name_or_default_for_init': 'handle',
+                                                                     'python_name_with_default': 'handle',
+                                                                     'python_name_with_doc_default': 'handle',
+                                                                     'python_type': 'int',
+                                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                                     'type': 'ViSession',
+                                                                     'use_array': False,
+                                                                     'use_in_python_api': True,
+                                                                     'use_list': False},
+                                                                 {   'ctypes_type': 'ViInt32',
+                                                                     'ctypes_type_library_call': 'ViInt32',
+                                                                     'ctypes_variable_name': 'index_ctype',
+                                                                     'direction': 'in',
+                                                                     'documentation': {   'description': '\n'
+                                                                                                         'A zero-based index that specifies the device for which you want the\n'
+                                                                                                         'attribute. This index parameter should be between 0 and (deviceCount -\n'
+                                                                                                         '1), inclusive, where deviceCount is the number of installed devices\n'
+                                                                                                         'returned by niModInst_OpenInstalledDevicesSession.\n'},
+                                                                     'enum': None,
+                                                                     'is_buffer': False,
+                                                                     'is_repeated_capability': False,
+                                                                     'is_session_handle': False,
+                                                                     'is_string': False,
+                                                                     'library_method_call_snippet': 'index_ctype',
+                                                                     'name': 'index',
+                                                                     'numpy': False,
+                                                                     'numpy_into_return': False,
+                                                                     'python_name': 'index',
+                                                                     'python_name_or_default_for_init': 'index',
+                                                                     'python_name_with_default': 'index',
+                                                                     'python_name_with_doc_default': 'index',
+                                                                     'python_type': 'int',
+                                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                                     'type': 'ViInt32',
+                                                                     'use_array': False,
+                                                                     'use_in_python_api': True,
+                                                                     'use_list': False},
+                                                                 {   'ctypes_type': 'ViInt32',
+                                                                     'ctypes_type_library_call': 'ViInt32',
+                                                                     'ctypes_variable_name': 'attribute_id_ctype',
+                                                                     'direction': 'in',
+                                                                     'documentation': {   'description': '\n'
+                                                                                                         'The ID of the string attribute you want to query. Valid Values\n'
+                                                                                                         'NIMODINST_ATTR_DEVICE_NAME--the name of the device, which can be used\n'
+                                                                                                         'to open an instrument driver session for that device\n'
+                                                                                                         'NIMODINST_ATTR_DEVICE_MODEL--the model of the device (for example, NI\n'
+                                                                                                         'PXI-5122) NIMODINST_ATTR_SERIAL_NUMBER--the serial number of the\n'
+                                                                                                         'device\n'},
+                                                                     'enum': None,
+                                                                     'is_buffer': False,
+                                                                     'is_repeated_capability': False,
+                                                                     'is_session_handle': False,
+                                                                     'is_string': False,
+                                                                     'library_method_call_snippet': 'attribute_id_ctype',
+                                                                     'name': 'attributeID',
+                                                                     'numpy': False,
+                                                                     'numpy_into_return': False,
+                                                                     'python_name': 'attribute_id',
+                                                                     'python_name_or_default_for_init': 'attribute_id',
+                                                                     'python_name_with_default': 'attribute_id',
+                                                                     'python_name_with_doc_default': 'attribute_id',
+                                                                     'python_type': 'int',
+                                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                                     'type': 'ViInt32',
+                                                                     'use_array': False,
+                                                                     'use_in_python_api': True,
+                                                                     'use_list': False},
+                                                                 {   'ctypes_type': 'ViInt32',
+                                                                     'ctypes_type_library_call': 'ViInt32',
+                                                                     'ctypes_variable_name': 'attribute_value_buffer_size_ctype',
+                                                                     'direction': 'in',
+                                                                     'documentation': {   'description': '\n'
+                                                                                                         'The size of the buffer allocated and passed in as the attributeValue\n'
+                                                                                                         'parameter. The buffer should be large enough to hold the attribute value\n'
+                                                                                                         'string (including a NULL terminating character). Refer to the\n'
+                                                                                                         'Description section for information on how to determine the exact buffer\n'
+                                                                                                         'size required.\n'},
+                                                                     'enum': None,
+                                                                     'is_buffer': False,
+                                                                     'is_repeated_capability': False,
+                                                                     'is_session_handle': False,
+                                                                     'is_string': False,
+                                                                     'library_method_call_snippet': 'attribute_value_buffer_size_ctype',
+                                                                     'name': 'attributeValueBufferSize',
+                                                                     'numpy': False,
+                                                                     'numpy_into_return': False,
+                                                                     'python_name': 'attribute_value_buffer_size',
+                                                                     'python_name_or_default_for_init': 'attribute_value_buffer_size',
+                                                                     'python_name_with_default': 'attribute_value_buffer_size',
+                                                                     'python_name_with_doc_default': 'attribute_value_buffer_size',
+                                                                     'python_type': 'int',
+                                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                                     'type': 'ViInt32',
+                                                                     'use_array': False,
+                                                                     'use_in_python_api': False,
+                                                                     'use_list': False},
+                                                                 {   'ctypes_type': 'ViChar[]',
+                                                                     'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                                     'ctypes_variable_name': 'attribute_value_ctype',
+                                                                     'direction': 'out',
+                                                                     'documentation': {'description': 'The character buffer into which the attribute value string is copied.'},
+                                                                     'enum': None,
+                                                                     'is_buffer': False,
+                                                                     'is_repeated_capability': False,
+                                                                     'is_session_handle': False,
+                                                                     'is_string': True,
+                                                                     'library_method_call_snippet': 'attribute_value_ctype',
+                                                                     'name': 'attributeValue',
+                                                                     'numpy': False,
+                                                                     'numpy_into_return': False,
+                                                                     'python_name': 'attribute_value',
+                                                                     'python_name_or_default_for_init': 'attribute_value',
+                                                                     'python_name_with_default': 'attribute_value',
+                                                                     'python_name_with_doc_default': 'attribute_value',
+                                                                     'python_type': 'str',
+                                                                     'size': {'mechanism': 'ivi-dance', 'value': 'attributeValueBufferSize'},
+                                                                     'type': 'ViChar[]',
+                                                                     'use_array': False,
+                                                                     'use_in_python_api': True,
+                                                                     'use_list': False}],
+                                               'python_code_variables': [],
+                                               'python_name': '_get_installed_device_attribute_vi_string',
+                                               'render_in_library': True,
+                                               'render_in_session_base': False,
+                                               'returns': 'ViStatus'},
+    'OpenInstalledDevicesSession': {   'blocking': False,
+                                       'codegen_method': 'private',
+                                       'documentation': {   'description': '\n'
+                                                                           'Creates a handle to a list of installed devices supported by the\n'
+                                                                           'specified driver. Call this function and pass in the name of a National\n'
+                                                                           'Instruments instrument driver, such as "NI-SCOPE". This function\n'
+                                                                           'searches the system and constructs a list of all the installed devices\n'
+                                                                           'that are supported by that driver, and then returns both a handle to\n'
+                                                                           'this list and the number of devices found. The handle is used with other\n'
+                                                                           'functions to query for attributes such as device name and model, and to\n'
+                                                                           'safely discard the list when finished. Note This handle reflects the\n'
+                                                                           'system state when the handle is created (that is, when you call this\n'
+                                                                           'function. If you remove devices from the system or rename them in\n'
+                                                                           'Measurement & Automation Explorer (MAX), this handle may not refer to an\n'
+                                                                           'accurate list of devices. You should destroy the handle using\n'
+                                                                           'niModInst_CloseInstalledDevicesSession and create a new handle using\n'
+                                                                           'this function.\n'},
+                                       'has_repeated_capability': False,
+                                       'invalidates_attribute_cache': False,
+                                       'is_error_handling': False,
+                                       'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                       'name': 'OpenInstalledDevicesSession',
+                                       'parameters': [   {   'ctypes_type': 'ViConstString',
+                                                             'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                             'ctypes_variable_name': 'driver_ctype',
+                                                             'direction': 'in',
+                                                             'documentation': {   'description': '\n'
+                                                                                                 'A string specifying the driver whose supported devices you want to find.\n'
+                                                                                                 'This string is not case-sensitive. Some examples are: NI-SCOPE niScope\n'
+                                                                                                 'NI-FGEN niFgen NI-HSDIO niHSDIO NI-DMM niDMM NI-SWITCH niSwitch Note If\n'
+                                                                                                 'you use the empty string for this parameter, NI-ModInst creates a list\n'
+                                                                                                 'of all Modular Instruments devices installed in the system.\n'},
+                                                             'enum': None,
+                                                             'is_buffer': False,
+                                                             'is_repeated_capability': False,
+                                                             'is_session_handle': False,
+                                                             'is_string': True,
+                                                             'library_method_call_snippet': 'driver_ctype',
+                                                             'name': 'driver',
+                                                             'numpy': False,
+                                                             'numpy_into_return': False,
+                                                             'python_name': 'driver',
+                                                             'python_name_or_default_for_init': 'driver',
+                                                             'python_name_with_default': 'driver',
+                                                             'python_name_with_doc_default': 'driver',
+                                                             'python_type': 'str',
+                                                             'size': {'mechanism': 'fixed', 'value': 1},
+                                                             'type': 'ViConstString',
+                                                             'use_array': False,
+                                                             'use_in_python_api': True,
+                                                             'use_list': False},
+                                                         {   'ctypes_type': 'ViSession',
+                                                             'ctypes_type_library_call': 'ctypes.POINTER(ViSession)',
+                                                             'ctypes_variable_name': 'handle_ctype',
+                                                             'direction': 'out',
+                                                             'documentation': {   'description': '\n'
+                                                                                                 'A pointer to a ViSession variable that receives the value of the\n'
+                                                                                                 'NI-ModInst session handle. This value acts as a handle to the list of\n'
+                                                                                                 'installed devices and is used in other NI-ModInst functions.\n'},
+                                                             'enum': None,
+                                                             'is_buffer': False,
+                                                             'is_repeated_capability': False,
+                                                             'is_session_handle': False,
+                                                             'is_string': False,
+                                                             'library_method_call_snippet': 'None if handle_ctype is None else (ctypes.pointer(handle_ctype))',
+                                                             'name': 'handle',
+                                                             'numpy': False,
+                                                             'numpy_into_return': False,
+                                                             'python_name': 'handle',
+                                                             'python_name_or_default_for_init': 'handle',
+                                                             'python_name_with_default': 'handle',
+                                                             'python_name_with_doc_default': 'handle',
+                                                             'python_type': 'int',
+                                                             'size': {'mechanism': 'fixed', 'value': 1},
+                                                             'type': 'ViSession',
+                                                             'use_array': False,
+                                                             'use_in_python_api': True,
+                                                             'use_list': False},
+                                                         {   'ctypes_type': 'ViInt32',
+                                                             'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                                             'ctypes_variable_name': 'device_count_ctype',
+                                                             'direction': 'out',
+                                                             'documentation': {   'description': '\n'
+                                                                                                 'A pointer to an integer variable that receives the number of devices\n'
+                                                                                                 'found in the system that are supported by the driver specified in the\n'
+                                                                                                 'driver parameter.\n'},
+                                                             'enum': None,
+                                                             'is_buffer': False,
+                                                             'is_repeated_capability': False,
+                                                             'is_session_handle': False,
+                                                             'is_string': False,
+                                                             'library_method_call_snippet': 'None if device_count_ctype is None else (ctypes.pointer(device_count_ctype))',
+                                                             'name': 'deviceCount',
+                                                             'numpy': False,
+                                                             'numpy_into_return': False,
+                                                             'python_name': 'device_count',
+                                                             'python_name_or_default_for_init': 'device_count',
+                                                             'python_name_with_default': 'device_count',
+                                                             'python_name_with_doc_default': 'device_count',
+                                                             'python_type': 'int',
+                                                             'size': {'mechanism': 'fixed', 'value': 1},
+                                                             'type': 'ViInt32',
+                                                             'use_array': False,
+                                                             'use_in_python_api': True,
+                                                             'use_list': False}],
+                                       'python_code_variables': [],
+                                       'python_name': '_open_installed_devices_session',
+                                       'render_in_library': True,
+                                       'render_in_session_base': False,
+                                       'returns': 'ViStatus'}}
\ No newline at end of file
@@ -0,0 +1,3850 @@
+attributes =
+{   1050002: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies whether to validate attribute values and function parameters.   If enabled, the instrument driver validates the parameters values that '
+                                                     'you  pass to driver functions.  Range checking parameters is very useful for  debugging.  After you validate your program, you can set this '
+                                                     'attribute to  VI_FALSE to disable range checking and maximize performance.\n'
+                                                     'The default value is VI_TRUE.   Use the niScope_InitWithOptions  function to override this value.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:User Options:Range Check',
+                 'name': 'RANGE_CHECK',
+                 'python_name': 'range_check',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1050003: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies whether the instrument driver queries the instrument status  after each operation.  Querying the instrument status is very useful for  '
+                                                     'debugging.  After you validate your program, you can set this attribute to  VI_FALSE to disable status checking and maximize performance\n'
+                                                     'The instrument driver can choose to ignore status checking for  particular attributes regardless of the setting of this attribute.\n'
+                                                     'The default value is VI_TRUE.   Use the niScope_InitWithOptions  function to override this value.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:User Options:Query Instrument Status',
+                 'name': 'QUERY_INSTRUMENT_STATUS',
+                 'python_name': 'query_instrument_status',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1050004: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies whether to cache the value of attributes.  When caching is  enabled, the instrument driver keeps track of the current instrument  '
+                                                     'settings and avoids sending redundant commands to the instrument.  Thus,  you can significantly increase execution speed.\n'
+                                                     'The instrument driver can choose to always cache or to never cache  particular attributes regardless of the setting of this attribute.\n'
+                                                     'The default value is VI_TRUE.   Use niScope_InitWithOptions  to override this value.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:User Options:Cache',
+                 'name': 'CACHE',
+                 'python_name': 'cache',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1050005: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies whether or not to simulate instrument driver I/O operations.  If  simulation is enabled, instrument driver functions perform range '
+                                                     'checking  and call Ivi_GetAttribute and Ivi_SetAttribute functions, but they do not  perform instrument I/O.  For output parameters that '
+                                                     'represent instrument  data, the instrument driver functions return calculated values.\n'
+                                                     'The default value is VI_FALSE.   Use the niScope_InitWithOptions  function to override this value.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:User Options:Simulate',
+                 'name': 'SIMULATE',
+                 'python_name': 'simulate',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1050006: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies whether the IVI engine keeps a list of the value coercions it  makes for ViInt32 and ViReal64 attributes.  You call  '
+                                                     'Ivi_GetNextCoercionInfo to extract and delete the oldest coercion record  from the list.\n'
+                                                     'The default value is VI_FALSE.   Use the niScope_InitWithOptions  function to override this value.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:User Options:Record Value Coercions',
+                 'name': 'RECORD_COERCIONS',
+                 'python_name': 'record_coercions',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1050007: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': False,
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'This attribute indicates the Driver Setup string that the user  specified when initializing the driver.\n'
+                                                     'Some cases exist where the end-user must specify instrument driver  options at initialization.  An example of this is specifying  a particular '
+                                                     'instrument model from among a family of instruments  that the driver supports.  This is useful when using simulation.   The end-user can specify '
+                                                     'driver-specific options through  the DriverSetup keyword in the optionsString parameter in  niScope_InitWithOptions, or through the IVI '
+                                                     'Configuration Utility.\n'
+                                                     'If the user does not specify a Driver Setup string, this attribute returns an empty string.\n'},
+                 'enum': None,
+                 'lv_property': '',
+                 'name': 'DRIVER_SETUP',
+                 'python_name': 'driver_setup',
+                 'python_type': 'str',
+                 'resettable': False,
+                 'type': 'ViString'},
+    1050021: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nNI-SCOPE does not generate interchange warnings and therefore ignores this attribute.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:User Options:Interchange Check',
+                 'name': 'INTERCHANGE_CHECK',
+                 'python_name': 'interchange_check',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1050203: {   'access': 'read only',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Indicates the number of channels that the specific instrument driver  supports.\n'
+                                                     'For channel-based properties, the IVI engine maintains a separate cache value for each channel.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Driver Capabilities:Channel Count',
+                 'name': 'CHANNEL_COUNT',
+                 'python_name': 'channel_count',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1050302: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nA string that contains the prefix for the instrument driver. The name of each user-callable  function in this driver starts with this prefix.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Driver Identification:Driver Prefix',
+                 'name': 'SPECIFIC_DRIVER_PREFIX',
+                 'python_name': 'specific_driver_prefix',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1050304: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Indicates the resource descriptor the driver uses to identify the physical device.  If you initialize the driver with a logical name, this '
+                                                     'attribute contains the resource descriptor  that corresponds to the entry in the IVI Configuration utility.\n'
+                                                     'If you initialize the instrument driver with the resource descriptor, this attribute contains that  value.You can pass a logical name to '
+                                                     'niScope_Init or niScope_InitWithOptions. The IVI Configuration  utility must contain an entry for the logical name. The logical name entry '
+                                                     'refers to a virtual  instrument section in the IVI Configuration file. The virtual instrument section specifies a physical  device and initial '
+                                                     'user options.\n',
+                                      'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Advanced Session Information:Resource Descriptor',
+                 'name': 'IO_RESOURCE_DESCRIPTOR',
+                 'python_name': 'io_resource_descriptor',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1050305: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'A string containing the logical name you specified when opening the current IVI session.  You can pass a logical name to niScope_Init or '
+                                                     'niScope_InitWithOptions. The IVI Configuration  utility must contain an entry for the logical name. The logical name entry refers to a virtual  '
+                                                     'instrument section in the IVI Configuration file. The virtual instrument section specifies a physical  device and initial user options.\n',
+                                      'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Advanced Session Information:Logical Name',
+                 'name': 'LOGICAL_NAME',
+                 'python_name': 'logical_name',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1050327: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nA string that contains a comma-separated list of the instrument model numbers supported by this driver.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Driver Capabilities:Supported Instrument Models',
+                 'name': 'SUPPORTED_INSTRUMENT_MODELS',
+                 'python_name': 'supported_instrument_models',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1050401: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nA string that contains a comma-separated list of class extension groups that this driver implements.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Driver Capabilities:Class Group Capabilities',
+                 'name': 'GROUP_CAPABILITIES',
+                 'python_name': 'group_capabilities',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1050510: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nA string that contains the firmware revision information  for the instrument you are currently using.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Instrument Identification:Firmware Revision',
+                 'name': 'INSTRUMENT_FIRMWARE_REVISION',
+                 'python_name': 'instrument_firmware_revision',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1050511: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nA string that contains the name of the instrument manufacturer.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Instrument Identification:Manufacturer',
+                 'name': 'INSTRUMENT_MANUFACTURER',
+                 'python_name': 'instrument_manufacturer',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1050512: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nA string that contains the model number of the current instrument.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Instrument Identification:Model',
+                 'name': 'INSTRUMENT_MODEL',
+                 'python_name': 'instrument_model',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1050513: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nA string that contains the name of the vendor that supplies this driver.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Driver Identification:Driver Vendor',
+                 'name': 'SPECIFIC_DRIVER_VENDOR',
+                 'python_name': 'specific_driver_vendor',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1050514: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nA string that contains a brief description of the specific  driver\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Driver Identification:Description',
+                 'name': 'SPECIFIC_DRIVER_DESCRIPTION',
+                 'python_name': 'specific_driver_description',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1050515: {   'access': 'read only',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nThe major version number of the class specification with which this driver is compliant.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Driver Identification:Class Specification Major Version',
+                 'name': 'SPECIFIC_DRIVER_CLASS_SPEC_MAJOR_VERSION',
+                 'python_name': 'specific_driver_class_spec_major_version',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1050516: {   'access': 'read only',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nThe minor version number of the class specification with which this driver is compliant.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Driver Identification:Class Specification Minor Version',
+                 'name': 'SPECIFIC_DRIVER_CLASS_SPEC_MINOR_VERSION',
+                 'python_name': 'specific_driver_class_spec_minor_version',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1050551: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nA string that contains additional version information about this  instrument driver.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Driver Identification:Revision',
+                 'name': 'SPECIFIC_DRIVER_REVISION',
+                 'python_name': 'specific_driver_revision',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1150001: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the number of records to acquire. Can be used for multi-record acquisition  and single-record acquisitions. Setting this to 1 '
+                                                     'indicates a single-record acquisition.\n'},
+                 'enum': None,
+                 'lv_property': 'Horizontal:Number of Records',
+                 'name': 'HORZ_NUM_RECORDS',
+                 'python_name': 'horz_num_records',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150002: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the input source for the PLL reference clock (the 1 MHz to 20 MHz clock on the NI 5122, the 10 MHz clock  for the NI '
+                                                     '5112/5620/5621/5911) to which the digitizer will be phase-locked; for the NI 5102, this is the source  of the board clock.\n'},
+                 'enum': None,
+                 'lv_property': 'Clocking:Reference (Input) Clock Source',
+                 'name': 'INPUT_CLOCK_SOURCE',
+                 'python_name': 'input_clock_source',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1150003: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': "\nSpecifies the output source for the 10 MHz clock to which another digitizer's sample clock can be phased-locked.\n"},
+                 'enum': None,
+                 'lv_property': 'Clocking:Output Clock Source',
+                 'name': 'OUTPUT_CLOCK_SOURCE',
+                 'python_name': 'output_clock_source',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1150004: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nIndicates whether the digitizer enforces real-time measurements  or allows equivalent-time measurements.\n'},
+                 'enum': None,
+                 'lv_property': 'Horizontal:Enforce Realtime',
+                 'name': 'HORZ_ENFORCE_REALTIME',
+                 'python_name': 'horz_enforce_realtime',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1150005: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Indicates the bit width of the binary data in the acquired waveform.  Useful for determining which Binary Fetch function to use. Compare to '
+                                                     'NISCOPE_ATTR_RESOLUTION.\n'
+                                                     'To configure the device to store samples with a lower resolution that the native, set this attribute to the desired binary width.\n'
+                                                     'This can be useful for streaming at faster speeds at the cost of resolution. The least significant bits will be lost with this configuration.\n'
+                                                     'Valid Values: 8, 16, 32\n'},
+                 'enum': None,
+                 'lv_property': 'Acquisition:Binary Sample Width',
+                 'name': 'BINARY_SAMPLE_WIDTH',
+                 'python_name': 'binary_sample_width',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150006: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': 'Specifies the size of the hysteresis window on either side of the trigger level.  The digitizer triggers when the trigger signal passes through '
+                                                     'the threshold you specify  with the Trigger Level parameter, has the slope you specify with the Trigger Slope parameter,  and passes through the '
+                                                     'hysteresis window that you specify with this parameter.'},
+                 'enum': None,
+                 'lv_property': 'Triggering:Trigger Hysteresis',
+                 'name': 'TRIGGER_HYSTERESIS',
+                 'python_name': 'trigger_hysteresis',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150007: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'For the NI 5102, specifies the line on which the sample clock is sent or received. For the NI 5112/5620/5621/5911,  specifies the line on which '
+                                                     'the one-time sync pulse is sent or received. This line should be the same for all devices to be synchronized.\n'},
+                 'enum': None,
+                 'lv_property': 'Clocking:Clock Sync Pulse Source',
+                 'name': 'CLOCK_SYNC_PULSE_SOURCE',
+                 'python_name': 'clock_sync_pulse_source',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1150008: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies whether you want the device to be a master or a slave. The master typically originates  the trigger signal and clock sync pulse. For a '
+                                                     'standalone device, set this attribute to VI_FALSE.\n'},
+                 'enum': None,
+                 'lv_property': 'Synchronization:Master Enable',
+                 'name': 'MASTER_ENABLE',
+                 'python_name': 'master_enable',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1150009: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specify the sampling rate for the acquisition in Samples per second.\n'
+                                                     'Valid Values:\n'
+                                                     'The combination of sampling rate and min record length must allow the  digitizer to sample at a valid sampling rate for the acquisition type '
+                                                     'specified  in niScope_ConfigureAcquisition and not require more memory than the  onboard memory module allows.\n',
+                                      'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                 'enum': None,
+                 'lv_property': 'Horizontal:Min Sample Rate',
+                 'name': 'MIN_SAMPLE_RATE',
+                 'python_name': 'min_sample_rate',
+                 'python_type': 'float',
+                 'resettable': 'Yes',
+                 'type': 'ViReal64'},
+    1150012: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies whether you want a trigger to occur when the signal enters or leaves the window specified by  NISCOPE_ATTR_TRIGGER_WINDOW_LOW_LEVEL, '
+                                                     'or NISCOPE_ATTR_TRIGGER_WINDOW_HIGH_LEVEL.\n'},
+                 'enum': 'TriggerWindowMode',
+                 'lv_property': 'Triggering:Trigger Window:Window Mode',
+                 'name': 'TRIGGER_WINDOW_MODE',
+                 'python_name': 'trigger_window_mode',
+                 'python_type': 'enums.TriggerWindowMode',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150013: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Pass the lower voltage threshold you want the digitizer to use for  window triggering.\n'
+                                                     'The digitizer triggers when the trigger signal enters or leaves  the window you specify with NISCOPE_ATTR_TRIGGER_WINDOW_LOW_LEVEL and '
+                                                     'NISCOPE_ATTR_TRIGGER_WINDOW_HIGH_LEVEL.\n'
+                                                     'Units: Volts\n'
+                                                     'Valid Values:\n'
+                                                     'The values of the Vertical Range and Vertical Offset parameters in  niScope_ConfigureVertical determine the valid range for the  Low Window '
+                                                     'Level on the channel you use as the Trigger Source parameter  in niScope_ConfigureTriggerSource.  The value you pass for this parameter  must '
+                                                     'meet the following conditions.\n'
+                                                     'Low Trigger Level <= Vertical Range/2 + Vertical Offset\n'
+                                                     'Low Trigger Level >= (-Vertical Range/2) + Vertical Offset\n'
+                                                     'Low Trigger Level < High Trigger Level\n',
+                                      'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                 'enum': None,
+                 'lv_property': 'Triggering:Trigger Window:Low Level',
+                 'name': 'TRIGGER_WINDOW_LOW_LEVEL',
+                 'python_name': 'trigger_window_low_level',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150014: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Pass the upper voltage threshold you want the digitizer to use for  window triggering.\n'
+                                                     'The digitizer triggers when the trigger signal enters or leaves  the window you specify with NISCOPE_ATTR_TRIGGER_WINDOW_LOW_LEVEL and '
+                                                     'NISCOPE_ATTR_TRIGGER_WINDOW_HIGH_LEVEL\n'
+                                                     'Valid Values:\n'
+                                                     'The values of the Vertical Range and Vertical Offset parameters in  niScope_ConfigureVertical determine the valid range for the  High Window '
+                                                     'Level on the channel you use as the Trigger Source parameter  in niScope_ConfigureTriggerSource.  The value you pass for this parameter  must '
+                                                     'meet the following conditions.\n'
+                                                     'High Trigger Level <= Vertical Range/2 + Vertical Offset\n'
+                                                     'High Trigger Level >= (-Vertical Range/2) + Vertical Offset\n'
+                                                     'High Trigger Level > Low Trigger Level\n',
+                                      'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                 'enum': None,
+                 'lv_property': 'Triggering:Trigger Window:High Level',
+                 'name': 'TRIGGER_WINDOW_HIGH_LEVEL',
+                 'python_name': 'trigger_window_high_level',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150016: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the units of the reference levels.\n'
+                                                     'NISCOPE_VAL_MEAS_VOLTAGE--Specifies that the reference levels are given in units of volts\n'
+                                                     'NISCOPE_VAL_MEAS_PERCENTAGE--Percentage units, where the measurements voltage low and voltage high represent 0% and 100%, respectively.\n'
+                                                     'Default: NISCOPE_VAL_MEAS_PERCENTAGE\n',
+                                      'note': [   '\n'
+                                                  'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or represent True/False, have been '
+                                                  'removed.\n']},
+                 'enum': 'RefLevelUnits',
+                 'lv_property': 'Waveform Measurement:Reference Levels:Units',
+                 'name': 'MEAS_REF_LEVEL_UNITS',
+                 'python_name': 'meas_ref_level_units',
+                 'python_type': 'enums.RefLevelUnits',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150018: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the second channel for two-channel measurements, such as NISCOPE_VAL_ADD_CHANNELS. If processing steps are registered with this '
+                                                     'channel, the processing is done before the waveform is used in a two-channel measurement.\n'
+                                                     "Default: '0'\n"},
+                 'enum': None,
+                 'lv_property': 'Waveform Measurement:Other Channel',
+                 'name': 'MEAS_OTHER_CHANNEL',
+                 'python_name': 'meas_other_channel',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1150019: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Digital hysteresis that is used in several of the scalar waveform measurements. This attribute specifies the percentage of the full-scale '
+                                                     'vertical range for the hysteresis window size.\n'
+                                                     'Default: 2%\n'},
+                 'enum': None,
+                 'lv_property': 'Waveform Measurement:Hysteresis Percent',
+                 'name': 'MEAS_HYSTERESIS_PERCENT',
+                 'python_name': 'meas_hysteresis_percent',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150020: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the size (that is, the number of bins) in the last acquisition histogram. This histogram is used to determine several scalar '
+                                                     'measurements, most importantly voltage low and voltage high.\n'
+                                                     'Default: 256\n'},
+                 'enum': None,
+                 'lv_property': 'Waveform Measurement:Last Acq. Histogram Size',
+                 'name': 'MEAS_LAST_ACQ_HISTOGRAM_SIZE',
+                 'python_name': 'meas_last_acq_histogram_size',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150021: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Determines the multiple acquisition voltage histogram size. The size is set the first time a voltage histogram measurement is called after '
+                                                     'clearing the measurement history with the function niScope_ClearWaveformMeasurementStats.\n'
+                                                     'Default: 256\n'},
+                 'enum': None,
+                 'lv_property': 'Waveform Measurement:Voltage Histogram:Size',
+                 'name': 'MEAS_VOLTAGE_HISTOGRAM_SIZE',
+                 'python_name': 'meas_voltage_histogram_size',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150022: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nSpecifies the lowest voltage value included in the multiple-acquisition voltage histogram. The units are always volts.\nDefault: -10.0 V\n'},
+                 'enum': None,
+                 'lv_property': 'Waveform Measurement:Voltage Histogram:Low Volts',
+                 'name': 'MEAS_VOLTAGE_HISTOGRAM_LOW_VOLTS',
+                 'python_name': 'meas_voltage_histogram_low_volts',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150023: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nSpecifies the highest voltage value included in the multiple acquisition voltage histogram. The units are always volts.\nDefault: 10.0 V\n'},
+                 'enum': None,
+                 'lv_property': 'Waveform Measurement:Voltage Histogram:High Volts',
+                 'name': 'MEAS_VOLTAGE_HISTOGRAM_HIGH_VOLTS',
+                 'python_name': 'meas_voltage_histogram_high_volts',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150024: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Determines the multiple acquisition voltage histogram size. The size is set during the first call to a time histogram measurement after clearing '
+                                                     'the measurement history with niScope_ClearWaveformMeasurementStats.\n'
+                                                     'Default: 256\n'},
+                 'enum': None,
+                 'lv_property': 'Waveform Measurement:Time Histogram:Size',
+                 'name': 'MEAS_TIME_HISTOGRAM_SIZE',
+                 'python_name': 'meas_time_histogram_size',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150025: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nSpecifies the lowest voltage value included in the multiple acquisition time histogram. The units are always volts.\nDefault: -10.0 V\n'},
+                 'enum': None,
+                 'lv_property': 'Waveform Measurement:Time Histogram:Low Volts',
+                 'name': 'MEAS_TIME_HISTOGRAM_LOW_VOLTS',
+                 'python_name': 'meas_time_histogram_low_volts',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150026: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nSpecifies the highest voltage value included in the multiple-acquisition time histogram. The units are always volts.\nDefault: 10.0 V\n'},
+                 'enum': None,
+                 'lv_property': 'Waveform Measurement:Time Histogram:High Volts',
+                 'name': 'MEAS_TIME_HISTOGRAM_HIGH_VOLTS',
+                 'python_name': 'meas_time_histogram_high_volts',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150027: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nSpecifies the lowest time value included in the multiple-acquisition time histogram. The units are always seconds.\nDefault: -5.0e-4 seconds\n'},
+                 'enum': None,
+                 'lv_property': 'Waveform Measurement:Time Histogram:Low Time',
+                 'name': 'MEAS_TIME_HISTOGRAM_LOW_TIME',
+                 'python_name': 'meas_time_histogram_low_time',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150028: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nSpecifies the highest time value included in the multiple acquisition time histogram. The units are always seconds.\nDefault: 5.0e-4 seconds\n'},
+                 'enum': None,
+                 'lv_property': 'Waveform Measurement:Time Histogram:High Time',
+                 'name': 'MEAS_TIME_HISTOGRAM_HIGH_TIME',
+                 'python_name': 'meas_time_histogram_high_time',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150029: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the polynomial order used for the polynomial interpolation measurement. For example, an order of 1 is linear interpolation whereas an '
+                                                     'order of 2 specifies parabolic interpolation. Any positive integer is valid.\n'
+                                                     'Default: 1\n'},
+                 'enum': None,
+                 'lv_property': 'Waveform Measurement:Interpolation:Polynomial Interpolation Order',
+                 'name': 'MEAS_POLYNOMIAL_INTERPOLATION_ORDER',
+                 'python_name': 'meas_polynomial_interpolation_order',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150030: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'The new number of points for polynomial interpolation is the sampling factor times the input number of points. For example, if you acquire 1,000 '
+                                                     'points with the digitizer and set this attribute to 2.5, calling niScope_FetchWaveformMeasurementArray with the '
+                                                     'NISCOPE_VAL_POLYNOMIAL_INTERPOLATION measurement resamples the waveform to 2,500 points.\n'
+                                                     'Default: 2.0\n',
+                                      'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                 'enum': None,
+                 'lv_property': 'Waveform Measurement:Interpolation:Sampling Factor',
+                 'name': 'MEAS_INTERPOLATION_SAMPLING_FACTOR',
+                 'python_name': 'meas_interpolation_sampling_factor',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150031: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the cutoff frequency in hertz for filters of type lowpass and highpass. The cutoff frequency definition varies depending on the '
+                                                     'filter.\n'
+                                                     'Default: 1.0e6 Hz\n'},
+                 'enum': None,
+                 'lv_property': 'Waveform Measurement:Filter:Cutoff Frequency',
+                 'name': 'MEAS_FILTER_CUTOFF_FREQ',
+                 'python_name': 'meas_filter_cutoff_freq',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150032: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'The center frequency in hertz for filters of type bandpass and bandstop. The width of the filter is specified by NISCOPE_ATTR_MEAS_FILTER_WIDTH, '
+                                                     'where the cutoff frequencies are the center ± width.\n'
+                                                     'Default: 1.0e6 Hz\n'},
+                 'enum': None,
+                 'lv_property': 'Waveform Measurement:Filter:Center Frequency',
+                 'name': 'MEAS_FILTER_CENTER_FREQ',
+                 'python_name': 'meas_filter_center_freq',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150033: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the amount of ripple in the passband in units of decibels (positive values). Used only for Chebyshev filters. The more ripple allowed '
+                                                     'gives a sharper cutoff for a given filter order.\n'
+                                                     'Default: 0.1 dB\n'},
+                 'enum': None,
+                 'lv_property': 'Waveform Measurement:Filter:Ripple',
+                 'name': 'MEAS_FILTER_RIPPLE',
+                 'python_name': 'meas_filter_ripple',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150034: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'The percentage (0 - 100%) of the IIR filtered waveform to eliminate from the beginning of the waveform. This allows eliminating the transient '
+                                                     'portion of the waveform that is undefined due to the assumptions necessary at the boundary condition.\n'
+                                                     'Default: 20.0%\n'},
+                 'enum': None,
+                 'lv_property': 'Waveform Measurement:Filter:Percent Waveform Transient',
+                 'name': 'MEAS_FILTER_TRANSIENT_WAVEFORM_PERCENT',
+                 'python_name': 'meas_filter_transient_waveform_percent',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150035: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the type of filter, for both IIR and FIR filters. The allowed values are the following:\n'
+                                                     '·  NISCOPE_VAL_MEAS_LOWPASS\n'
+                                                     '·  NISCOPE_VAL_MEAS_HIGHPASS\n'
+                                                     '·  NISCOPE_VAL_MEAS_BANDPASS\n'
+                                                     '·  NISCOPE_VAL_MEAS_BANDSTOP\n'
+                                                     'Default: NISCOPE_VAL_MEAS_LOWPASS\n',
+                                      'note': [   '\n'
+                                                  'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or represent True/False, have been '
+                                                  'removed.\n']},
+                 'enum': 'FilterType',
+                 'lv_property': 'Waveform Measurement:Filter:Type',
+                 'name': 'MEAS_FILTER_TYPE',
+                 'python_name': 'meas_filter_type',
+                 'python_type': 'enums.FilterType',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150036: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nSpecifies the order of an IIR filter. All positive integers are valid.\nDefault: 2\n'},
+                 'enum': None,
+                 'lv_property': 'Waveform Measurement:Filter:IIR Order',
+                 'name': 'MEAS_FILTER_ORDER',
+                 'python_name': 'meas_filter_order',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150037: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nDefines the number of taps (coefficients) for an FIR filter.\nDefault: 25\n'},
+                 'enum': None,
+                 'lv_property': 'Waveform Measurement:Filter:FIR Taps',
+                 'name': 'MEAS_FILTER_TAPS',
+                 'python_name': 'meas_filter_taps',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150038: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Stores the low reference level used in many scalar measurements. Different channels  may have different reference levels. Do not use the '
+                                                     'IVI-defined, nonchannel-based attributes such as  NISCOPE_ATTR_MEAS_LOW_REF if you use this attribute to set various channels to different '
+                                                     'values.\n'
+                                                     'Default: 10%\n',
+                                      'note': ['\nOne or more of the referenced attributes are not in the Python API for this driver.\n']},
+                 'enum': None,
+                 'lv_property': 'Waveform Measurement:Reference Levels:Channel Based Low Ref Level',
+                 'name': 'MEAS_CHAN_LOW_REF_LEVEL',
+                 'python_name': 'meas_chan_low_ref_level',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150039: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Stores the mid reference level used in many scalar measurements. Different channels  may have different reference levels. Do not use the '
+                                                     'IVI-defined, nonchannel-based attributes such as  NISCOPE_ATTR_MEAS_MID_REF if you use this attribute to set various channels to different '
+                                                     'values.\n'
+                                                     'Default: 50%\n',
+                                      'note': ['\nOne or more of the referenced attributes are not in the Python API for this driver.\n']},
+                 'enum': None,
+                 'lv_property': 'Waveform Measurement:Reference Levels:Channel Based Mid Ref Level',
+                 'name': 'MEAS_CHAN_MID_REF_LEVEL',
+                 'python_name': 'meas_chan_mid_ref_level',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150040: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Stores the high reference level used in many scalar measurements. Different channels may have different reference  levels. Do not use the '
+                                                     'IVI-defined, nonchannel-based attributes such as NISCOPE_ATTR_MEAS_HIGH_REF if you use  this attribute to set various channels to different '
+                                                     'values.\n'
+                                                     'Default: 90%\n',
+                                      'note': ['\nOne or more of the referenced attributes are not in the Python API for this driver.\n']},
+                 'enum': None,
+                 'lv_property': 'Waveform Measurement:Reference Levels:Channel Based High Ref Level',
+                 'name': 'MEAS_CHAN_HIGH_REF_LEVEL',
+                 'python_name': 'meas_chan_high_ref_level',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150041: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the width of bandpass and bandstop type filters in hertz. The cutoff frequencies occur at NISCOPE_ATTR_MEAS_FILTER_CENTER_FREQ ± '
+                                                     'one-half width.\n'
+                                                     'Default: 1.0e3 Hz\n'},
+                 'enum': None,
+                 'lv_property': 'Waveform Measurement:Filter:Width',
+                 'name': 'MEAS_FILTER_WIDTH',
+                 'python_name': 'meas_filter_width',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150042: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the FIR window type. The possible choices are:\n'
+                                                     'NISCOPE_VAL_NONE\n'
+                                                     'NISCOPE_VAL_HANNING_WINDOW\n'
+                                                     'NISCOPE_VAL_HAMMING_WINDOW\n'
+                                                     'NISCOPE_VAL_TRIANGLE_WINDOW\n'
+                                                     'NISCOPE_VAL_FLAT_TOP_WINDOW\n'
+                                                     'NISCOPE_VAL_BLACKMAN_WINDOW\n'
+                                                     'The symmetric windows are applied to the FIR filter coefficients to limit passband ripple in FIR filters.\n'
+                                                     'Default: NISCOPE_VAL_NONE\n',
+                                      'note': [   '\n'
+                                                  'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or represent True/False, have been '
+                                                  'removed.\n']},
+                 'enum': 'FIRFilterWindow',
+                 'lv_property': 'Waveform Measurement:Filter:FIR Window',
+                 'name': 'MEAS_FIR_FILTER_WINDOW',
+                 'python_name': 'meas_fir_filter_window',
+                 'python_type': 'enums.FIRFilterWindow',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150043: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Every element of an array is multiplied by this scalar value during the Array Gain measurement.  Refer to NISCOPE_VAL_ARRAY_GAIN for more '
+                                                     'information.\n'
+                                                     'Default: 1.0\n'},
+                 'enum': None,
+                 'lv_property': 'Waveform Measurement:Array Gain',
+                 'name': 'MEAS_ARRAY_GAIN',
+                 'python_name': 'meas_array_gain',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150044: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Every element of an array is added to this scalar value during the Array Offset measurement. Refer to NISCOPE_VAL_ARRAY_OFFSET for more '
+                                                     'information.\n'
+                                                     'Default: 0.0\n'},
+                 'enum': None,
+                 'lv_property': 'Waveform Measurement:Array Offset',
+                 'name': 'MEAS_ARRAY_OFFSET',
+                 'python_name': 'meas_array_offset',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150045: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the method used to map percentage reference units to voltages for the reference. Possible values are:\n'
+                                                     'NISCOPE_VAL_MEAS_LOW_HIGH\n'
+                                                     'NISCOPE_VAL_MEAS_MIN_MAX\n'
+                                                     'NISCOPE_VAL_MEAS_BASE_TOP\n'
+                                                     'Default: NISCOPE_VAL_MEAS_BASE_TOP\n',
+                                      'note': [   '\n'
+                                                  'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or represent True/False, have been '
+                                                  'removed.\n']},
+                 'enum': 'PercentageMethod',
+                 'lv_property': 'Waveform Measurement:Reference Levels:Percentage Units Method',
+                 'name': 'MEAS_PERCENTAGE_METHOD',
+                 'python_name': 'meas_percentage_method',
+                 'python_type': 'enums.PercentageMethod',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150046: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64TimeDeltaSeconds',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the delay for the trigger from the master to the slave in seconds.  This value adjusts the initial X value of the slave devices to '
+                                                     'correct for the  propagation delay between the master trigger output and slave trigger input.\n'},
+                 'enum': None,
+                 'lv_property': 'Synchronization:Trigger Calibration Delay:Slave Trigger Delay',
+                 'name': 'SLAVE_TRIGGER_DELAY',
+                 'python_name': 'slave_trigger_delay',
+                 'python_type': 'datetime.timedelta',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150047: {   'access': 'read only',
+                 'attribute_class': 'AttributeViReal64TimeDeltaSeconds',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'This is a factory-programmed value that specifies the delay for the trigger  to the PXI Star Trigger line in seconds.  By itself, this attribute '
+                                                     'has no  effect on the acquired data.  However, depending on how the trigger lines  are routed between the master and slave devices, you can use '
+                                                     'this value as  a starting point to set NISCOPE_ATTR_SLAVE_TRIGGER_DELAY.\n'},
+                 'enum': None,
+                 'lv_property': 'Synchronization:Trigger Calibration Delay:Trigger to Star Delay',
+                 'name': 'TRIGGER_TO_STAR_DELAY',
+                 'python_name': 'trigger_to_star_delay',
+                 'python_type': 'datetime.timedelta',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150048: {   'access': 'read only',
+                 'attribute_class': 'AttributeViReal64TimeDeltaSeconds',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'This is a factory-programmed value that specifies the delay for the trigger  to the RTSI bus in seconds.  By itself, this attribute has no '
+                                                     'effect on the  acquired data.  However, depending on how the trigger lines are routed between  the master and slave devices, you can use this '
+                                                     'value as a starting point to set   NISCOPE_ATTR_SLAVE_TRIGGER_DELAY.\n'},
+                 'enum': None,
+                 'lv_property': 'Synchronization:Trigger Calibration Delay:Trigger to RTSI Delay',
+                 'name': 'TRIGGER_TO_RTSI_DELAY',
+                 'python_name': 'trigger_to_rtsi_delay',
+                 'python_type': 'datetime.timedelta',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150049: {   'access': 'read only',
+                 'attribute_class': 'AttributeViReal64TimeDeltaSeconds',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'This is a factory-programmed value that specifies the delay for the trigger  to the PFI lines in seconds.  By itself, this attribute has no '
+                                                     'effect on the  acquired data.  However, depending on how the trigger lines are routed between  the master and slave devices, you can use this '
+                                                     'value as a starting point to set  NISCOPE_ATTR_SLAVE_TRIGGER_DELAY.\n'},
+                 'enum': None,
+                 'lv_property': 'Synchronization:Trigger Calibration Delay:Trigger to PFI Delay',
+                 'name': 'TRIGGER_TO_PFI_DELAY',
+                 'python_name': 'trigger_to_pfi_delay',
+                 'python_type': 'datetime.timedelta',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150050: {   'access': 'read only',
+                 'attribute_class': 'AttributeViReal64TimeDeltaSeconds',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'This is a factory-programmed value that specifies the delay for PXI Star  Trigger line to the trigger input in seconds.  By itself, this '
+                                                     'attribute  has no effect on the acquired data.  However, depending on how the trigger  lines are routed between the master and slave devices, '
+                                                     'you can use this value  as a starting point to set NISCOPE_ATTR_SLAVE_TRIGGER_DELAY.\n'},
+                 'enum': None,
+                 'lv_property': 'Synchronization:Trigger Calibration Delay:Trigger from Star Delay',
+                 'name': 'TRIGGER_FROM_STAR_DELAY',
+                 'python_name': 'trigger_from_star_delay',
+                 'python_type': 'datetime.timedelta',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150051: {   'access': 'read only',
+                 'attribute_class': 'AttributeViReal64TimeDeltaSeconds',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'This is a factory-programmed value that specifies the delay for the RTSI bus  to the trigger input in seconds.  By itself, this attribute has no '
+                                                     'effect on  the acquired data.  However, depending on how the trigger lines are routed  between the master and slave devices, you can use this '
+                                                     'value as a starting point  to set NISCOPE_ATTR_SLAVE_TRIGGER_DELAY.\n'},
+                 'enum': None,
+                 'lv_property': 'Synchronization:Trigger Calibration Delay:Trigger from RTSI Delay',
+                 'name': 'TRIGGER_FROM_RTSI_DELAY',
+                 'python_name': 'trigger_from_rtsi_delay',
+                 'python_type': 'datetime.timedelta',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150052: {   'access': 'read only',
+                 'attribute_class': 'AttributeViReal64TimeDeltaSeconds',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'This is a factory-programmed value that specifies the delay for the PFI lines  to the trigger input in seconds.  By itself, this attribute has '
+                                                     'no effect on  the acquired data.  However, depending on how the trigger lines are routed  between the master and slave devices, you can use this '
+                                                     'value as a starting  point to set NISCOPE_ATTR_SLAVE_TRIGGER_DELAY.\n'},
+                 'enum': None,
+                 'lv_property': 'Synchronization:Trigger Calibration Delay:Trigger from PFI Delay',
+                 'name': 'TRIGGER_FROM_PFI_DELAY',
+                 'python_name': 'trigger_from_pfi_delay',
+                 'python_type': 'datetime.timedelta',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150053: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the source the digitizer monitors for a start (acquisition arm) trigger.   When the start trigger is received, the digitizer begins '
+                                                     'acquiring pretrigger  samples.\n'
+                                                     'Valid Values:\n'
+                                                     "NISCOPE_VAL_IMMEDIATE     ('VAL_IMMEDIATE')    - Triggers immediately\n"
+                                                     "NISCOPE_VAL_RTSI_0        ('VAL_RTSI_0')       - RTSI 0\n"
+                                                     "NISCOPE_VAL_RTSI_1        ('VAL_RTSI_1')       - RTSI 1\n"
+                                                     "NISCOPE_VAL_RTSI_2        ('VAL_RTSI_2')       - RTSI 2\n"
+                                                     "NISCOPE_VAL_RTSI_3        ('VAL_RTSI_3')       - RTSI 3\n"
+                                                     "NISCOPE_VAL_RTSI_4        ('VAL_RTSI_4')       - RTSI 4\n"
+                                                     "NISCOPE_VAL_RTSI_5        ('VAL_RTSI_5')       - RTSI 5\n"
+                                                     "NISCOPE_VAL_RTSI_6        ('VAL_RTSI_6')       - RTSI 6\n"
+                                                     "NISCOPE_VAL_PFI_0         ('VAL_PFI_0')        - PFI 0\n"
+                                                     "NISCOPE_VAL_PFI_1         ('VAL_PFI_1')        - PFI 1\n"
+                                                     "NISCOPE_VAL_PFI_2         ('VAL_PFI_2')        - PFI 2\n"
+                                                     "NISCOPE_VAL_PXI_STAR      ('VAL_PXI_STAR')     - PXI Star Trigger\n",
+                                      'note': [   '\n'
+                                                  'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or represent True/False, have been '
+                                                  'removed.\n']},
+                 'enum': None,
+                 'lv_property': 'Synchronization:Start Trigger (Acq. Arm):Source',
+                 'name': 'ACQ_ARM_SOURCE',
+                 'python_name': 'acq_arm_source',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1150065: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nSpecifies the record arm source.\n'},
+                 'enum': None,
+                 'lv_property': 'Synchronization:Record Arm Source',
+                 'name': 'RECORD_ARM_SOURCE',
+                 'python_name': 'record_arm_source',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1150068: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Indicates whether more records can be configured with niScope_ConfigureHorizontalTiming  than fit in the onboard memory. If this attribute is '
+                                                     'set to VI_TRUE, it is necessary  to fetch records while the acquisition is in progress.  Eventually, some of  the records will be overwritten.  '
+                                                     'An error is returned from the fetch function  if you attempt to fetch a record that has been overwritten.\n'},
+                 'enum': None,
+                 'lv_property': 'Horizontal:Enable Records > Memory',
+                 'name': 'ALLOW_MORE_RECORDS_THAN_MEMORY',
+                 'python_name': 'allow_more_records_than_memory',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1150069: {   'access': 'read only',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nReturns the total combined amount of onboard memory for all channels in bytes.\n'},
+                 'enum': None,
+                 'lv_property': 'Horizontal:Memory Size',
+                 'name': 'ONBOARD_MEMORY_SIZE',
+                 'python_name': 'onboard_memory_size',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150070: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'The number of averages for each bin in an RIS acquisition.  The number of averages  times the oversampling factor is the minimum number of '
+                                                     'real-time acquisitions  necessary to reconstruct the RIS waveform.  Averaging is useful in RIS because  the trigger times are not evenly spaced, '
+                                                     'so adjacent points in the reconstructed  waveform not be accurately spaced.  By averaging, the errors in both time and  voltage are smoothed.\n'},
+                 'enum': None,
+                 'lv_property': 'Horizontal:RIS Num Avg',
+                 'name': 'RIS_NUM_AVERAGES',
+                 'python_name': 'ris_num_averages',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150071: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the algorithm for random-interleaved sampling, which is used if the sample rate exceeds the  value of '
+                                                     'NISCOPE_ATTR_MAX_REAL_TIME_SAMPLING_RATE.\n'},
+                 'enum': 'RISMethod',
+                 'lv_property': 'Horizontal:RIS Method',
+                 'name': 'RIS_METHOD',
+                 'python_name': 'ris_method',
+                 'python_type': 'enums.RISMethod',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150072: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Set to VI_TRUE to retrieve one array with alternating values on the NI 5620/5621.  For example, this attribute can be used to retrieve a single '
+                                                     'array with I and Q interleaved  instead of two separate arrays. If set to VI_TRUE, the resulting array will be twice the size of the actual '
+                                                     'record length.\n'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):Advanced:Fetch Interleaved Data',
+                 'name': 'FETCH_INTERLEAVED_DATA',
+                 'python_name': 'fetch_interleaved_data',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1150073: {   'access': 'read only',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nReturns the maximum real time sample rate in Hz.\n'},
+                 'enum': None,
+                 'lv_property': 'Horizontal:Maximum Real Time Sample Rate',
+                 'name': 'MAX_REAL_TIME_SAMPLING_RATE',
+                 'python_name': 'max_real_time_sampling_rate',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150074: {   'access': 'read only',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nReturns the maximum sample rate in RIS mode in Hz.\n'},
+                 'enum': None,
+                 'lv_property': 'Horizontal:Maximum RIS Rate',
+                 'name': 'MAX_RIS_RATE',
+                 'python_name': 'max_ris_rate',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150075: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nSpecifies the input impedance for the external analog trigger channel in Ohms.\nValid Values:\n50      - 50 ohms\n1000000 - 1 mega ohm\n'},
+                 'enum': None,
+                 'lv_property': 'Triggering:Trigger Impedance',
+                 'name': 'TRIGGER_IMPEDANCE',
+                 'python_name': 'trigger_impedance',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150076: {   'access': 'read only',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': 'Indicates the device number associated with the current session.'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):Advanced:Device Number',
+                 'name': 'DEVICE_NUMBER',
+                 'python_name': 'device_number',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150077: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nPosition to start fetching within one record.\nDefault Value: NISCOPE_VAL_PRETRIGGER\n'},
+                 'enum': 'FetchRelativeTo',
+                 'lv_property': 'Fetch:Fetch Relative To',
+                 'name': 'FETCH_RELATIVE_TO',
+                 'python_name': 'fetch_relative_to',
+                 'python_type': 'enums.FetchRelativeTo',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150078: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Offset in samples to start fetching data within each record. The offset is applied relative to  NISCOPE_ATTR_FETCH_RELATIVE_TO.The offset can be '
+                                                     'positive or negative.\n'
+                                                     'Default Value: 0\n'},
+                 'enum': None,
+                 'lv_property': 'Fetch:Fetch Offset',
+                 'name': 'FETCH_OFFSET',
+                 'python_name': 'fetch_offset',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150079: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nZero-based index of the first record to fetch.  Use NISCOPE_FETCH_NUM_RECORDS to set the number of records to fetch.\nDefault Value: 0.\n'},
+                 'enum': None,
+                 'lv_property': 'Fetch:Fetch Record Number',
+                 'name': 'FETCH_RECORD_NUMBER',
+                 'python_name': 'fetch_record_number',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150080: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nNumber of records to fetch. Use -1 to fetch all configured records.\nDefault Value: -1\n'},
+                 'enum': None,
+                 'lv_property': 'Fetch:Fetch Number of Records',
+                 'name': 'FETCH_NUM_RECORDS',
+                 'python_name': 'fetch_num_records',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150081: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nNumber of samples to fetch when performing a measurement. Use -1 to fetch the actual record length.\nDefault Value: -1\n'},
+                 'enum': None,
+                 'lv_property': 'Fetch:Fetch Meas Num Samples',
+                 'name': 'FETCH_MEAS_NUM_SAMPLES',
+                 'python_name': 'fetch_meas_num_samples',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150082: {   'access': 'read only',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': False,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Actual number of samples acquired in the record specified by NISCOPE_ATTR_FETCH_RECORD_NUMBER from the NISCOPE_ATTR_FETCH_RELATIVE_TO and '
+                                                     'NISCOPE_ATTR_FETCH_OFFSET attributes.\n'},
+                 'enum': None,
+                 'lv_property': 'Fetch:Points Done',
+                 'name': 'POINTS_DONE',
+                 'python_name': 'points_done',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150083: {   'access': 'read only',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': False,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nSpecifies the number of records that have been completely acquired.\n'},
+                 'enum': None,
+                 'lv_property': 'Fetch:Records Done',
+                 'name': 'RECORDS_DONE',
+                 'python_name': 'records_done',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150084: {   'access': 'read only',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': False,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Returns the number of samples (NISCOPE_ATTR_POINTS_DONE) that have been acquired but not fetched  for the record specified by '
+                                                     'NISCOPE_ATTR_FETCH_RECORD_NUMBER.\n'},
+                 'enum': None,
+                 'lv_property': 'Fetch:Fetch Backlog',
+                 'name': 'BACKLOG',
+                 'python_name': 'backlog',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150085: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'When set to true and the digitizer is set to master, the number of pretrigger samples  and total samples are adjusted to be able to synchronize '
+                                                     'a master and slave 5102.\n'},
+                 'enum': None,
+                 'lv_property': 'Horizontal:Advanced:5102 Adjust Pretrigger Samples',
+                 'name': '5102_ADJUST_PRETRIGGER_SAMPLES',
+                 'python_name': '_5102_adjust_pretrigger_samples',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1150086: {   'access': 'read only',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': False,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nReturns the temperature of the device in degrees Celsius from the onboard sensor.\n'},
+                 'enum': None,
+                 'lv_property': 'Device:Temperature',
+                 'name': 'DEVICE_TEMPERATURE',
+                 'python_name': 'device_temperature',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150087: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the source of the sample clock timebase, which is the timebase used to control waveform sampling.  The actual sample rate may be the '
+                                                     'timebase itself or a divided version of the timebase, depending on the  NISCOPE_ATTR_MIN_SAMPLE_RATE (for internal sources) or the '
+                                                     'NISCOPE_ATTR_SAMP_CLK_TIMEBASE_DIV (for external sources).\n'},
+                 'enum': None,
+                 'lv_property': 'Clocking:Sample Clock Timebase Source',
+                 'name': 'SAMP_CLK_TIMEBASE_SRC',
+                 'python_name': 'samp_clk_timebase_src',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1150088: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'If NISCOPE_ATTR_SAMP_CLK_TIMEBASE_SRC is an external source, specifies the frequency in hertz of the external clock used as the timebase '
+                                                     'source.\n'},
+                 'enum': None,
+                 'lv_property': 'Clocking:Sample Clock Timebase Rate',
+                 'name': 'SAMP_CLK_TIMEBASE_RATE',
+                 'python_name': 'samp_clk_timebase_rate',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150089: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'If NISCOPE_ATTR_SAMP_CLK_TIMEBASE_SRC is an external source, specifies the ratio between the sample clock timebase rate and the actual sample '
+                                                     'rate, which can be slower.\n'},
+                 'enum': None,
+                 'lv_property': 'Clocking:Sample Clock Timebase Divisor',
+                 'name': 'SAMP_CLK_TIMEBASE_DIV',
+                 'python_name': 'samp_clk_timebase_div',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150090: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'If NISCOPE_ATTR_INPUT_CLOCK_SOURCE is an external source, this attribute specifies the frequency of the input,  or reference clock, to which the '
+                                                     'internal sample clock timebase is synchronized. The frequency is in hertz.\n'},
+                 'enum': None,
+                 'lv_property': 'Clocking:Reference Clock Rate',
+                 'name': 'REF_CLK_RATE',
+                 'python_name': 'ref_clk_rate',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150091: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'no',
+                 'documentation': {'description': 'Exports the sample clock to a specified terminal.'},
+                 'enum': None,
+                 'lv_property': 'Clocking:Exported Sample Clock Output Terminal',
+                 'name': 'EXPORTED_SAMPLE_CLOCK_OUTPUT_TERMINAL',
+                 'python_name': 'exported_sample_clock_output_terminal',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1150093: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     "Restores the video-triggered data retrieved by the digitizer to the video signal's zero reference point.\n"
+                                                     'Valid Values:\n'
+                                                     'VI_TRUE - Enable DC restore\n'
+                                                     'VI_FALSE - Disable DC restore\n'},
+                 'enum': None,
+                 'lv_property': 'Triggering:Trigger Video:Enable DC Restore',
+                 'name': 'ENABLE_DC_RESTORE',
+                 'python_name': 'enable_dc_restore',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1150094: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the source the digitizer monitors for an advance trigger.   When the advance trigger is received, the digitizer begins acquiring '
+                                                     'pretrigger  samples.\n'},
+                 'enum': None,
+                 'lv_property': 'Synchronization:Advance Trigger:Source',
+                 'name': 'ADV_TRIG_SRC',
+                 'python_name': 'adv_trig_src',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1150095: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the source the digitizer monitors for an arm reference trigger.   When the arm reference trigger is received, the digitizer begins '
+                                                     'looking for a  reference (stop) trigger from the user-configured trigger source.\n'},
+                 'enum': None,
+                 'lv_property': 'Synchronization:Arm Reference Trigger:Source',
+                 'name': 'ARM_REF_TRIG_SRC',
+                 'python_name': 'arm_ref_trig_src',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1150096: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nThis attribute controls whether the TDC is used to compute an accurate trigger.\n'},
+                 'enum': None,
+                 'lv_property': 'Horizontal:Advanced:Enable TDC',
+                 'name': 'REF_TRIG_TDC_ENABLE',
+                 'python_name': 'ref_trig_tdc_enable',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1150097: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the destination to export the Start trigger.   When the start trigger is received, the digitizer begins acquiring  samples.\n'
+                                                     'Consult your device documentation for a specific list of valid destinations.\n'},
+                 'enum': None,
+                 'lv_property': 'Synchronization:Start Trigger (Acq. Arm):Output Terminal',
+                 'name': 'EXPORTED_START_TRIGGER_OUTPUT_TERMINAL',
+                 'python_name': 'exported_start_trigger_output_terminal',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1150098: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the destination export for the reference (stop) trigger.\n'
+                                                     'Consult your device documentation for a specific list of valid destinations.\n'},
+                 'enum': None,
+                 'lv_property': 'Triggering:Trigger Output Terminal',
+                 'name': 'EXPORTED_REF_TRIGGER_OUTPUT_TERMINAL',
+                 'python_name': 'exported_ref_trigger_output_terminal',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1150099: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the destination for the End of Record Event.    When this event is asserted, the digitizer has completed sampling for the current '
+                                                     'record.\n'
+                                                     'Consult your device documentation for a specific list of valid destinations.\n'},
+                 'enum': None,
+                 'lv_property': 'Synchronization:End of Record:Output Terminal',
+                 'name': 'END_OF_RECORD_EVENT_OUTPUT_TERMINAL',
+                 'python_name': 'end_of_record_event_output_terminal',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1150100: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': False,
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nSpecifies the poll interval in milliseconds to use during RIS acquisitions to check  whether the acquisition is complete.\n'},
+                 'enum': None,
+                 'lv_property': '',
+                 'name': 'POLL_INTERVAL',
+                 'python_name': 'poll_interval',
+                 'python_type': 'int',
+                 'resettable': False,
+                 'type': 'ViInt32'},
+    1150101: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the destination for the End of Acquisition Event.    When this event is asserted, the digitizer has completed sampling for all '
+                                                     'records.\n'
+                                                     'Consult your device documentation for a specific list of valid destinations.\n'},
+                 'enum': None,
+                 'lv_property': 'Synchronization:End of Acquisition:Output Terminal',
+                 'name': 'END_OF_ACQUISITION_EVENT_OUTPUT_TERMINAL',
+                 'python_name': 'end_of_acquisition_event_output_terminal',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1150102: {   'access': 'read only',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nIndicates the bit width of valid data (as opposed to padding bits) in the acquired waveform. Compare to NISCOPE_ATTR_BINARY_SAMPLE_WIDTH.\n'},
+                 'enum': None,
+                 'lv_property': 'Acquisition:Resolution',
+                 'name': 'RESOLUTION',
+                 'python_name': 'resolution',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150103: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64TimeDeltaSeconds',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Pass the length of time you want the digitizer to wait after it starts acquiring  data until the digitizer enables the trigger system to detect '
+                                                     'a reference (stop) trigger.\n'
+                                                     'Units: Seconds\n'
+                                                     'Valid Values: 0.0 - 171.8\n'},
+                 'enum': None,
+                 'lv_property': 'Triggering:Start To Ref Trigger Holdoff',
+                 'name': 'START_TO_REF_TRIGGER_HOLDOFF',
+                 'python_name': 'start_to_ref_trigger_holdoff',
+                 'python_type': 'datetime.timedelta',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150104: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nReturns the serial number of the device.\n'},
+                 'enum': None,
+                 'lv_property': 'Device:Serial Number',
+                 'name': 'SERIAL_NUMBER',
+                 'python_name': 'serial_number',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1150105: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': 'Gets or sets the binary phase DAC value that controls the delay added to the Phase Locked Loop (PLL) of the sample clock.',
+                                      'note': 'if this value is set, sample clock adjust and TClk will not be able to do any sub-sample adjustment of the timebase sample clock.'},
+                 'enum': None,
+                 'lv_property': 'Clocking:Advanced:Oscillator Phase DAC Value',
+                 'name': 'OSCILLATOR_PHASE_DAC_VALUE',
+                 'python_name': 'oscillator_phase_dac_value',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150106: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Indicates whether the digitizer should use RIS sample rates when searching for a frequency in autosetup.\n'
+                                                     'Valid Values:\n'
+                                                     'VI_TRUE  (1) - Use RIS sample rates in autosetup\n'
+                                                     'VI_FALSE (0) - Do not use RIS sample rates in autosetup\n'},
+                 'enum': None,
+                 'lv_property': 'Acquisition:Advanced:Enable RIS in Auto Setup',
+                 'name': 'RIS_IN_AUTO_SETUP_ENABLE',
+                 'python_name': 'ris_in_auto_setup_enable',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1150107: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nSpecifies the terminal configuration for the channel.\n'},
+                 'enum': 'TerminalConfiguration',
+                 'lv_property': 'Vertical:Channel Terminal Configuration',
+                 'name': 'CHANNEL_TERMINAL_CONFIGURATION',
+                 'python_name': 'channel_terminal_configuration',
+                 'python_type': 'enums.TerminalConfiguration',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150109: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the destination to export the advance trigger.   When the advance trigger is received, the digitizer begins acquiring  samples for the '
+                                                     'Nth record.\n'
+                                                     'Consult your device documentation for a specific list of valid destinations.\n'},
+                 'enum': None,
+                 'lv_property': 'Synchronization:Advance Trigger:Output Terminal',
+                 'name': 'EXPORTED_ADVANCE_TRIGGER_OUTPUT_TERMINAL',
+                 'python_name': 'exported_advance_trigger_output_terminal',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1150110: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the destination for the Ready for Start Event.   When this event is asserted, the digitizer is ready to receive a start trigger.\n'
+                                                     'Consult your device documentation for a specific list of valid destinations.\n'},
+                 'enum': None,
+                 'lv_property': 'Synchronization:Ready for Start:Output Terminal',
+                 'name': 'READY_FOR_START_EVENT_OUTPUT_TERMINAL',
+                 'python_name': 'ready_for_start_event_output_terminal',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1150111: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the destination for the Ready for Reference Event.   When this event is asserted, the digitizer is ready to receive a reference '
+                                                     'trigger.\n'
+                                                     'Consult your device documentation for a specific list of valid destinations.\n'},
+                 'enum': None,
+                 'lv_property': 'Synchronization:Ready for Reference:Output Terminal',
+                 'name': 'READY_FOR_REF_EVENT_OUTPUT_TERMINAL',
+                 'python_name': 'ready_for_ref_event_output_terminal',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1150112: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the destination for the Ready for Advance Event.    When this event is asserted, the digitizer is ready to receive an advance '
+                                                     'trigger.\n'
+                                                     'Consult your device documentation for a specific list of valid destinations.\n'},
+                 'enum': None,
+                 'lv_property': 'Synchronization:Ready for Advance:Output Terminal',
+                 'name': 'READY_FOR_ADVANCE_EVENT_OUTPUT_TERMINAL',
+                 'python_name': 'ready_for_advance_event_output_terminal',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1150128: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies whether the digitizer acquires the waveform using multiple ADCs for the channel  enabling a higher maximum real-time sampling rate.\n'
+                                                     'Valid Values:\n'
+                                                     'VI_TRUE  (1) - Use multiple interleaved ADCs on this channel\n'
+                                                     "VI_FALSE (0) - Use only this channel's ADC to acquire data for this channel\n"},
+                 'enum': None,
+                 'lv_property': 'Horizontal:Enable Time Interleaved Sampling',
+                 'name': 'ENABLE_TIME_INTERLEAVED_SAMPLING',
+                 'python_name': 'enable_time_interleaved_sampling',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1150129: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nSpecifies the destination for the 5 Volt signal.\nConsult your device documentation for a specific list of valid destinations.\n'},
+                 'enum': None,
+                 'lv_property': 'Synchronization:5 Volt Power:Output Terminal',
+                 'name': '5V_OUT_OUTPUT_TERMINAL',
+                 'python_name': '_5v_out_output_terminal',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1150271: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'The NI 5922 flexible-resolution digitizer uses an onboard FIR lowpass antialias filter.\n'
+                                                     'Use this attribute to select from several types of filters to achieve desired filtering characteristics.\n'},
+                 'enum': 'FlexFIRAntialiasFilterType',
+                 'lv_property': 'Vertical:Advanced:Flex FIR Antialias Filter Type',
+                 'name': 'FLEX_FIR_ANTIALIAS_FILTER_TYPE',
+                 'python_name': 'flex_fir_antialias_filter_type',
+                 'python_type': 'enums.FlexFIRAntialiasFilterType',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150278: {   'access': 'read only',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': False,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies if the last acquisition was auto triggered.   You can use the Auto Triggered attribute to find out if the last acquisition was '
+                                                     'triggered.\n'},
+                 'enum': None,
+                 'lv_property': 'Triggering:Auto Triggered',
+                 'name': 'TRIGGER_AUTO_TRIGGERED',
+                 'python_name': 'trigger_auto_triggered',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1150279: {   'access': 'read only',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Returns the calibration gain for the current device configuration.\n'
+                                                     '**Related topics:**\n'
+                                                     '`NI 5122/5124/5142\n'
+                                                     'Calibration <digitizers.chm::/5122_Calibration.html>`__\n',
+                                      'note': '\nThis property is only supported by the NI PXI-5900 differential\namplifier.\n'},
+                 'enum': None,
+                 'lv_property': 'Device:Accessory:Gain',
+                 'name': 'ACCESSORY_GAIN',
+                 'python_name': 'accessory_gain',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150280: {   'access': 'read only',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Returns the calibration offset for the current device configuration.\n'
+                                                     '**Related topics:**\n'
+                                                     '`NI 5122/5124/5142\n'
+                                                     'Calibration <digitizers.chm::/5122_Calibration.html>`__\n',
+                                      'note': '\nThis property is supported only by the NI PXI-5900 differential\namplifier.\n'},
+                 'enum': None,
+                 'lv_property': 'Device:Accessory:Offset',
+                 'name': 'ACCESSORY_OFFSET',
+                 'python_name': 'accessory_offset',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150300: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Enables/disables the Digital Down Converter (DDC) block of the digitizer.  When the DDC block is disabled, all DDC-related properties are '
+                                                     'disabled and  have no effect on the acquired signal.\n'
+                                                     'Default Value: VI_FALSE\n'},
+                 'enum': None,
+                 'lv_property': 'Onboard Signal Processing:DDC:DDC Enabled',
+                 'name': 'DDC_ENABLED',
+                 'python_name': 'ddc_enabled',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1150302: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nEnables/disables frequency translating the data around the user-selected center  frequency down to baseband.\nDefault Value: VI_TRUE\n'},
+                 'enum': None,
+                 'lv_property': 'Onboard Signal Processing:DDC:Frequency Translation Enabled',
+                 'name': 'DDC_FREQUENCY_TRANSLATION_ENABLED',
+                 'python_name': 'ddc_frequency_translation_enabled',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1150303: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nThe frequency at which the DDC block frequency translates the input data.\nDefault Value: 10 MHz\n'},
+                 'enum': None,
+                 'lv_property': 'Onboard Signal Processing:DDC:Center Frequency',
+                 'name': 'DDC_CENTER_FREQUENCY',
+                 'python_name': 'ddc_center_frequency',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150304: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nThe way in which data is processed by the DDC block.\nValid Values:\nReal (0)\nComplex (1)\nDefault Value: Complex\n'},
+                 'enum': 'DataProcessingMode',
+                 'lv_property': 'Onboard Signal Processing:DDC:Data Processing Mode',
+                 'name': 'DDC_DATA_PROCESSING_MODE',
+                 'python_name': 'ddc_data_processing_mode',
+                 'python_type': 'enums.DataProcessingMode',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150305: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nThe I center frequency phase in degrees at the first point of the acquisition.\nDefault Value: 0\n'},
+                 'enum': None,
+                 'lv_property': 'Onboard Signal Processing:DDC:Signal Adjustments:Frequency Translation:Frequency Translation Phase I',
+                 'name': 'DDC_FREQUENCY_TRANSLATION_PHASE_I',
+                 'python_name': 'ddc_frequency_translation_phase_i',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150306: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'The Q center frequency phase in degrees at the first point of the acquisition.  Use this attribute only when '
+                                                     'NISCOPE_ATTR_DDC_DATA_PROCESSING_MODE is set to Complex.\n'
+                                                     'Default Value: 90\n'},
+                 'enum': None,
+                 'lv_property': 'Onboard Signal Processing:DDC:Signal Adjustments:Frequency Translation:Frequency Translation Phase Q',
+                 'name': 'DDC_FREQUENCY_TRANSLATION_PHASE_Q',
+                 'python_name': 'ddc_frequency_translation_phase_q',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150307: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nApplies gain to the specified channel in hardware before any onboard processing.\nValid Values:\n-1.5 to 1.5\n'},
+                 'enum': None,
+                 'lv_property': 'Vertical:Advanced:Digital Gain',
+                 'name': 'DIGITAL_GAIN',
+                 'python_name': 'digital_gain',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150308: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nApplies offset to the specified channel in hardware before any onboard processing.\nValid Values:\n-1.5 to 1.5 V\n'},
+                 'enum': None,
+                 'lv_property': 'Vertical:Advanced:Digital Offset',
+                 'name': 'DIGITAL_OFFSET',
+                 'python_name': 'digital_offset',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150309: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Configures error reporting when the DDC block detects an overflow in any of its  stages. Overflows lead to clipping of the waveform.\n'
+                                                     'Valid Values:\n'
+                                                     'Warning (0)\n'
+                                                     'Error (1)\n'
+                                                     'Disabled (2)\n'
+                                                     'Default Value: Warning\n'},
+                 'enum': 'OverflowErrorReporting',
+                 'lv_property': 'Onboard Signal Processing:OSP Overflow Error Reporting',
+                 'name': 'OVERFLOW_ERROR_REPORTING',
+                 'python_name': 'overflow_error_reporting',
+                 'python_type': 'enums.OverflowErrorReporting',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150310: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nIndicates the channel that is the input of the Q path of the DDC.\nDefault Value: The channel that the attribute is configured off of.\n'},
+                 'enum': None,
+                 'lv_property': 'Onboard Signal Processing:DDC:Q Source',
+                 'name': 'DDC_Q_SOURCE',
+                 'python_name': 'ddc_q_source',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1150311: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Enables/disables interleaving of the I and Q data.  When disabled, the traditional  niScope_Fetch() functions will return the I waveform for '
+                                                     'each acquisition followed by  the Q waveform.  When enabled, the I and Q  data are interleaved into a single waveform.  In the interleaving '
+                                                     'case, you must  allocate twice as many elements in the array as number of samples being fetched (since each  sample contains an I and a Q '
+                                                     'component).\n'
+                                                     'Default Value: VI_TRUE\n'},
+                 'enum': None,
+                 'lv_property': 'Onboard Signal Processing:DDC:Fetch Interleaved IQ Data',
+                 'name': 'FETCH_INTERLEAVED_IQ_DATA',
+                 'python_name': 'fetch_interleaved_iq_data',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1150312: {   'access': 'read only',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': 'Returns the number of coefficients that the FIR filter can accept.  This filter is designed  to compensate the input signal for artifacts '
+                                                     'introduced to the signal outside of the digitizer.   However, since this is a generic FIR filter any coefficients are valid.  Coefficients '
+                                                     'should be  between +1 and -1 in value.'},
+                 'enum': None,
+                 'lv_property': 'Onboard Signal Processing:Equalization:Equalization Num Coefficients',
+                 'name': 'EQUALIZATION_NUM_COEFFICIENTS',
+                 'python_name': 'equalization_num_coefficients',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150313: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': 'Enables the onboard signal processing FIR block. This block is connected directly to the input signal.  This filter is designed to compensate '
+                                                     'the input signal for artifacts introduced to the signal outside  of the digitizer. However, since this is a generic FIR filter any coefficients '
+                                                     'are valid.  Coefficients  should be between +1 and -1 in value.'},
+                 'enum': None,
+                 'lv_property': 'Onboard Signal Processing:Equalization:Equalization Filter Enabled',
+                 'name': 'EQUALIZATION_FILTER_ENABLED',
+                 'python_name': 'equalization_filter_enabled',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1150314: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nIndicates which analog compare circuitry to use on the device.\n'},
+                 'enum': 'RefTriggerDetectorLocation',
+                 'lv_property': 'Triggering:Onboard Signal Processing:Ref Trigger Detection Location',
+                 'name': 'REF_TRIGGER_DETECTOR_LOCATION',
+                 'python_name': 'ref_trigger_detector_location',
+                 'python_type': 'enums.RefTriggerDetectorLocation',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150315: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64TimeDeltaSeconds',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'The amount of time the trigger circuit must not detect a signal above the trigger level before  the trigger is armed.  This attribute is useful '
+                                                     'for triggering at the beginning and not in the  middle of signal bursts.\n'},
+                 'enum': None,
+                 'lv_property': 'Triggering:Onboard Signal Processing:Ref Trigger Min Quiet Time',
+                 'name': 'REF_TRIGGER_MINIMUM_QUIET_TIME',
+                 'python_name': 'ref_trigger_minimum_quiet_time',
+                 'python_type': 'datetime.timedelta',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150316: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the maximum number of samples to transfer at one time from the device to host memory. Increasing this number should result in better '
+                                                     'fetching performance because the driver does not need to restart the transfers as often. However, increasing this number may also increase the '
+                                                     'amount of page-locked memory required from the system.\n'},
+                 'enum': None,
+                 'lv_property': 'Fetch:Data Transfer Block Size',
+                 'name': 'DATA_TRANSFER_BLOCK_SIZE',
+                 'python_name': 'data_transfer_block_size',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150318: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nEnables the bandpass filter on the specificed channel.  The default value is FALSE.\n'},
+                 'enum': None,
+                 'lv_property': 'Vertical:Advanced:Bandpass Filter Enabled',
+                 'name': 'BANDPASS_FILTER_ENABLED',
+                 'python_name': 'bandpass_filter_enabled',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1150319: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Enables or Disables the analog dither on the device.  The default value is FALSE.\n'
+                                                     'Using dither can improve the spectral performance of the device by reducing the effects of quantization.  However, adding dither increases the '
+                                                     'power level to the ADC, so you may need to either decrease the signal level or increase your vertical range.\n'},
+                 'enum': None,
+                 'lv_property': 'Vertical:Advanced:Dither Enabled',
+                 'name': 'DITHER_ENABLED',
+                 'python_name': 'dither_enabled',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1150320: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': 'Enables the onboard signal processing block that resamples the input waveform to the user desired sample rate.  The default value is FALSE.'},
+                 'enum': None,
+                 'lv_property': 'Onboard Signal Processing:Fractional Resample:Fractional Resample Enabled',
+                 'name': 'FRACTIONAL_RESAMPLE_ENABLED',
+                 'python_name': 'fractional_resample_enabled',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1150321: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nThis property specifies the maximum bandwidth that the device is allowed to consume.\n'},
+                 'enum': None,
+                 'lv_property': 'Fetch:Advanced:Maximum Bandwidth',
+                 'name': 'DATA_TRANSFER_MAXIMUM_BANDWIDTH',
+                 'python_name': 'data_transfer_maximum_bandwidth',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150322: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'This property specifies the size of (read request|memory write) data payload. Due to alignment of the data buffers, the hardware may not always '
+                                                     'generate a packet of this size.\n'},
+                 'enum': None,
+                 'lv_property': 'Fetch:Advanced:Preferred Packet Size',
+                 'name': 'DATA_TRANSFER_PREFERRED_PACKET_SIZE',
+                 'python_name': 'data_transfer_preferred_packet_size',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150328: {   'access': 'read only',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': '\nReturns the current number of samples available to stream from a peer-to-peer endpoint.\n',
+                                      'note': 'This attribute can be used only with high-speed digitizers that support peer-to-peer streaming.'},
+                 'enum': None,
+                 'lv_property': 'Peer-to-Peer:Samples Available In Endpoint',
+                 'name': 'P2P_SAMPLES_AVAIL_IN_ENDPOINT',
+                 'python_name': 'p2p_samples_avail_in_endpoint',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150329: {   'access': 'read only',
+                 'attribute_class': 'AttributeViInt64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': '\n'
+                                                     'Returns the address of a hardware register used to grant permisison for the peer-to-peer endpoint to write  data to another peer.. The type of '
+                                                     'this address is determined by the  NISCOPE_ATTR_P2P_DATA_TRANS_PERMISSION_ADDR_TYPE attribute. Permission is granted in bytes and the register  '
+                                                     'is additive.\n',
+                                      'note': 'This attribute can be used only with high-speed digitizers that support peer-to-peer streaming.'},
+                 'enum': None,
+                 'lv_property': 'Peer-to-Peer:Manual:Configuration:Data Transfer Permission Address',
+                 'name': 'P2P_DATA_TRANS_PERMISSION_ADDR',
+                 'python_name': 'p2p_data_trans_permission_addr',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt64'},
+    1150330: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the type of address returned from the NISCOPE_ATTR_P2P_DATA_TRANS_PERMISSION_ADDR attribute.\n'
+                                                     'Valid Values:\n'
+                                                     'Physical (0)\n'
+                                                     'Virtual (1)\n'
+                                                     'Default Value: Virtual\n',
+                                      'note': 'This attribute can be used only with high-speed digitizers that support peer-to-peer streaming.'},
+                 'enum': 'AddressType',
+                 'lv_property': 'Peer-to-Peer:Manual:Configuration:Data Transfer Permission Address Type',
+                 'name': 'P2P_DATA_TRANS_PERMISSION_ADDR_TYPE',
+                 'python_name': 'p2p_data_trans_permission_addr_type',
+                 'python_type': 'enums.AddressType',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150331: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the destination for data written by the peer-to-peer endpoint. The type of this address is specified  by the '
+                                                     'NISCOPE_ATTR_P2P_DESTINATION_WINDOW_ADDR_TYPE attribute.\n'
+                                                     'Valid Values: A valid, non-NULL physical or virtual address.\n',
+                                      'note': 'This attribute can be used only with high-speed digitizers that support peer-to-peer streaming.'},
+                 'enum': None,
+                 'lv_property': 'Peer-to-Peer:Manual:Configuration:Destination Window Address',
+                 'name': 'P2P_DESTINATION_WINDOW_ADDR',
+                 'python_name': 'p2p_destination_window_addr',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt64'},
+    1150332: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the type of the NISCOPE_ATTR_P2P_DESTINATION_WINDOW_ADDR attribute.\n'
+                                                     'Valid Values:\n'
+                                                     'Physical (0)\n'
+                                                     'Virtual (1)\n'
+                                                     'Default Value: Virtual\n',
+                                      'note': 'This attribute can be used only with high-speed digitizers that support peer-to-peer streaming.'},
+                 'enum': 'AddressType',
+                 'lv_property': 'Peer-to-Peer:Manual:Configuration:Destination Window Address Type',
+                 'name': 'P2P_DESTINATION_WINDOW_ADDR_TYPE',
+                 'python_name': 'p2p_destination_window_addr_type',
+                 'python_type': 'enums.AddressType',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150333: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the size, in bytes, of the destination window determined by the  NISCOPE_ATTR_P2P_DESTINATION_WINDOW_ADDRESS and the '
+                                                     'NISCOPE_ATTR_P2P_DESTINATION_WINDOW_ADDRESS_TYPE  attributes.\n'
+                                                     'Valid Values: Any non-NULL value.\n',
+                                      'note': [   'This attribute can be used only with high-speed digitizers that support peer-to-peer streaming.',
+                                                  '\nOne or more of the referenced attributes are not in the Python API for this driver.\n']},
+                 'enum': None,
+                 'lv_property': 'Peer-to-Peer:Manual:Configuration:Destination Window Size',
+                 'name': 'P2P_DESTINATION_WINDOW_SIZE',
+                 'python_name': 'p2p_destination_window_size',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt64'},
+    1150334: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the event to push the NISCOPE_ATTR_P2P_NOTIFY_MESSAGE_PUSH_VALUE attribute to the  NISCOPE_ATTR_P2P_NOTIFY_MESSAGE_PUSH_ADDR '
+                                                     'attribute. Setting this attribute to NISCOPE_VAL_NOTIFY_DONE pushes  the message when the acquisition has completed.\n'
+                                                     'Valid Values:\n'
+                                                     'Never (0)\n'
+                                                     'Done (1)\n'
+                                                     'Default Value: Done\n',
+                                      'note': [   'This attribute can be used only with high-speed digitizers that support peer-to-peer streaming.',
+                                                  '\n'
+                                                  'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or represent True/False, have been '
+                                                  'removed.\n']},
+                 'enum': 'NotificationType',
+                 'lv_property': 'Peer-to-Peer:Manual:Notification:Push Message On',
+                 'name': 'P2P_NOTIFY_PUSH_MESSAGE_ON',
+                 'python_name': 'p2p_notify_push_message_on',
+                 'python_type': 'enums.NotificationType',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150335: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': '\nSpecifies the address to Push Message push Value to on the event specified by the  NISCOPE_ATTR_P2P_NOTIFY_PUSH_MESSAGE_ON attribute.\n',
+                                      'note': 'This attribute can be used only with high-speed digitizers that support peer-to-peer streaming.'},
+                 'enum': None,
+                 'lv_property': 'Peer-to-Peer:Manual:Notification:Message Push Address',
+                 'name': 'P2P_NOTIFY_MESSAGE_PUSH_ADDR',
+                 'python_name': 'p2p_notify_message_push_addr',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt64'},
+    1150336: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the type of the NISCOPE_ATTR_P2P_NOTIFY_MESSAGE_PUSH_ADDR attribute.\n'
+                                                     'Valid Values:\n'
+                                                     'Physical (0)\n'
+                                                     'Virtual (1)\n'
+                                                     'Default Value: Virtual\n',
+                                      'note': 'This attribute can be used only with high-speed digitizers that support peer-to-peer streaming.'},
+                 'enum': 'AddressType',
+                 'lv_property': 'Peer-to-Peer:Manual:Notification:Message Push Address Type',
+                 'name': 'P2P_NOTIFY_MESSAGE_PUSH_ADDR_TYPE',
+                 'python_name': 'p2p_notify_message_push_addr_type',
+                 'python_type': 'enums.AddressType',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150337: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': 'Specifies the value to be pushed to the NISCOPE_ATTR_P2P_NOTIFY_MESSAGE_PUSH_ADDR attribute on the event specified  by the '
+                                                     'NISCOPE_ATTR_MESSAGE_PUSH_ON attribute.',
+                                      'note': [   'This attribute can be used only with high-speed digitizers that support peer-to-peer streaming.',
+                                                  '\nOne or more of the referenced attributes are not in the Python API for this driver.\n']},
+                 'enum': None,
+                 'lv_property': 'Peer-to-Peer:Manual:Notification:Message Push Value',
+                 'name': 'P2P_NOTIFY_MESSAGE_PUSH_VALUE',
+                 'python_name': 'p2p_notify_message_push_value',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt64'},
+    1150338: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': '\nSpecifies whether the digitizer writes data to the peer-to-peer endpoint.\nDefault Value: VI_FALSE\n',
+                                      'note': 'This attribute can be used only with high-speed digitizers that support peer-to-peer streaming.'},
+                 'enum': None,
+                 'lv_property': 'Peer-to-Peer:P2P Enabled',
+                 'name': 'P2P_ENABLED',
+                 'python_name': 'p2p_enabled',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1150339: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies which channels are written to a peer-to-peer endpoint. If multiple channels are specified,  the channels are interleaved by sample.\n'
+                                                     'Default Value: 0\n',
+                                      'note': 'This attribute can be used only with high-speed digitizers that support peer-to-peer streaming.'},
+                 'enum': None,
+                 'lv_property': 'Peer-to-Peer:Channels to Stream',
+                 'name': 'P2P_CHANNELS_TO_STREAM',
+                 'python_name': 'p2p_channels_to_stream',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1150340: {   'access': 'read only',
+                 'attribute_class': 'AttributeViInt64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': '\nReturns the number of samples transferred through the peer-to-peer endpoint since it was last reset.\n',
+                                      'note': 'This attribute can be used only with high-speed digitizers that support peer-to-peer streaming.'},
+                 'enum': None,
+                 'lv_property': 'Peer-to-Peer:Samples Transferred',
+                 'name': 'P2P_SAMPLES_TRANSFERRED',
+                 'python_name': 'p2p_samples_transferred',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt64'},
+    1150341: {   'access': 'read only',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': '\nReturns the most number of samples available to stream from a peer-to-peer endpoint since the last  time this attribute was read.\n',
+                                      'note': 'This attribute can be used only with high-speed digitizers that support peer-to-peer streaming.'},
+                 'enum': None,
+                 'lv_property': 'Peer-to-Peer:Most Samples Available in Endpoint',
+                 'name': 'P2P_MOST_SAMPLES_AVAIL_IN_ENDPOINT',
+                 'python_name': 'p2p_most_samples_avail_in_endpoint',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150342: {   'access': 'read only',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': '\nReturns the size in samples of the peer-to-peer endpoint.\n',
+                                      'note': 'This attribute can be used only with high-speed digitizers that support peer-to-peer streaming.'},
+                 'enum': None,
+                 'lv_property': 'Peer-to-Peer:Endpoint Size',
+                 'name': 'P2P_ENDPOINT_SIZE',
+                 'python_name': 'p2p_endpoint_size',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150343: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': '\n'
+                                                     'Enables/disables the advanced attributes for a peer-to-peer endpoint. These attributes cannot be used if  an endpoint is being configured by '
+                                                     'NI-P2P, or a resource reservation error will occur.\n'
+                                                     'Default Value: VI_FALSE\n',
+                                      'note': 'This attribute can be used only with high-speed digitizers that support peer-to-peer streaming.'},
+                 'enum': None,
+                 'lv_property': 'Peer-to-Peer:Manual:Manual Configuration Enabled',
+                 'name': 'P2P_ADVANCED_ATTRIBUTES_ENABLED',
+                 'python_name': 'p2p_advanced_attributes_enabled',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1150344: {   'access': 'read only',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': '\nReturns TRUE if the endpoint FIFO has overflowed. Reset the endpoint to clear the overflow condition.\n',
+                                      'note': 'This attribute can be used only with high-speed digitizers that support peer-to-peer streaming.'},
+                 'enum': None,
+                 'lv_property': 'Peer-to-Peer:Endpoint Overflow',
+                 'name': 'P2P_ENDPOINT_OVERFLOW',
+                 'python_name': 'p2p_endpoint_overflow',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1150345: {   'access': 'read only',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': '\nReturns the number of FIFO-based peer-to-peer endpoints this device supports.\n',
+                                      'note': 'This attribute can be used only with high-speed digitizers that support peer-to-peer streaming.'},
+                 'enum': None,
+                 'lv_property': 'Peer-to-Peer:FIFO Endpoint Count',
+                 'name': 'P2P_FIFO_ENDPOINT_COUNT',
+                 'python_name': 'p2p_fifo_endpoint_count',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150354: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': '\nSpecifies whether the digitizer writes data to onboard memory when a peer-to-peer endpoint is enabled.\nDefault Value: VI_FALSE\n',
+                                      'note': 'This attribute can be used only with high-speed digitizers that support peer-to-peer streaming.'},
+                 'enum': None,
+                 'lv_property': 'Peer-to-Peer:Onboard Memory Enabled',
+                 'name': 'P2P_ONBOARD_MEMORY_ENABLED',
+                 'python_name': 'p2p_onboard_memory_enabled',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1150366: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64TimeDeltaSeconds',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'End of Record to Advance Trigger Holdoff is the length of time (in\n'
+                                                     'seconds) that a device waits between the completion of one record and\n'
+                                                     'the acquisition of pre-trigger samples for the next record. During this\n'
+                                                     'time, the acquisition engine state delays the transition to the Wait for\n'
+                                                     'Advance Trigger state, and will not store samples in onboard memory,\n'
+                                                     'accept an Advance Trigger, or trigger on the input signal..\n'
+                                                     '**Supported Devices**: NI 5185/5186\n'},
+                 'enum': None,
+                 'lv_property': 'Triggering:End of Record to Advance Trigger Holdoff',
+                 'name': 'END_OF_RECORD_TO_ADVANCE_TRIGGER_HOLDOFF',
+                 'python_name': 'end_of_record_to_advance_trigger_holdoff',
+                 'python_type': 'datetime.timedelta',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150367: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'If `Sample Clock Timebase\n'
+                                                     'Source <pniScope_SampleClockTimebaseSource.html>`__ is an external\n'
+                                                     'source, this property specifies the ratio between the `Sample Clock\n'
+                                                     'Timebase Rate <pniScope_SampleClockTimebaseRate.html>`__ and the actual\n'
+                                                     'sample rate, which can be higher. This property can be used in\n'
+                                                     'conjunction with the `Sample Clock Timebase Divisor\n'
+                                                     'Property <pniscope_SampleClockTimebaseDivisor.html>`__.\n'
+                                                     'Some devices use multiple ADCs to sample the same channel at an\n'
+                                                     'effective sample rate that is greater than the specified clock rate.\n'
+                                                     'When providing an external sample clock use this property to indicate\n'
+                                                     'when you want a higher sample rate. Valid values for this property vary\n'
+                                                     'by device and current configuration.\n'
+                                                     '**Related topics:**\n'
+                                                     '`Sample Clock <digitizers.chm::/Sample_Clock.html>`__\n',
+                                      'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                 'enum': None,
+                 'lv_property': 'Clocking:Sample Clock Timebase Multiplier',
+                 'name': 'SAMPLE_CLOCK_TIMEBASE_MULTIPLIER',
+                 'python_name': 'sample_clock_timebase_multiplier',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150373: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\nDetermines which trigger peer-to-peer data is streamed relative to. The\ndefault value is **Start Trigger**.\n',
+                                      'note': 'On the NI 5122/5622, only **Start Trigger** is valid for this property.'},
+                 'enum': 'StreamingPositionType',
+                 'lv_property': 'Peer-to-Peer:Stream Relative To',
+                 'name': 'STREAM_RELATIVE_TO',
+                 'python_name': 'stream_relative_to',
+                 'python_type': 'enums.StreamingPositionType',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150374: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64TimeDeltaSeconds',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\nGets or sets the absolute time offset of the sample clock relative to\nthe reference clock in terms of seconds.\n',
+                                      'note': '\n'
+                                              'Configures the sample clock relationship with respect to the reference\n'
+                                              'clock. This parameter is factored into NI-TClk adjustments and is\n'
+                                              'typically used to improve the repeatability of NI-TClk Synchronization.\n'
+                                              'When this parameter is read, the currently programmed value is returned.\n'
+                                              'The range of the absolute sample clock offset is [-.5 sample clock\n'
+                                              'periods, .5 sample clock periods]. The default absolute sample clock\n'
+                                              'offset is 0s.\n'},
+                 'enum': None,
+                 'lv_property': 'Clocking:Advanced:Absolute Sample Clock Offset',
+                 'name': 'ABSOLUTE_SAMPLE_CLOCK_OFFSET',
+                 'python_name': 'absolute_sample_clock_offset',
+                 'python_type': 'datetime.timedelta',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150375: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': 'Gets the absolute file path to the bitfile loaded on the FPGA.', 'note': 'Gets the absolute file path to the bitfile loaded on the FPGA.'},
+                 'enum': None,
+                 'lv_property': 'Device:FPGA Bitfile Path',
+                 'name': 'FPGA_BITFILE_PATH',
+                 'python_name': 'fpga_bitfile_path',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1150376: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Enables the interleaving offset correction on the specified channel. The\n'
+                                                     'default value is TRUE.\n'
+                                                     '**Related topics:**\n'
+                                                     '`Timed Interleaved\n'
+                                                     'Sampling <digitizers.chm::/TimeInterleavedSampling.html>`__\n',
+                                      'note': 'If disabled, warranted specifications are not guaranteed.'},
+                 'enum': None,
+                 'lv_property': 'Vertical:Advanced:Interleaving Offset Correction Enabled',
+                 'name': 'INTERLEAVING_OFFSET_CORRECTION_ENABLED',
+                 'python_name': 'interleaving_offset_correction_enabled',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1150377: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the frequency for the highpass filter in Hz. The device uses\n'
+                                                     'one of the valid values listed below. If an invalid value is specified,\n'
+                                                     'no coercion occurs. The default value is 0.\n'
+                                                     '**(PXIe-5164) Valid Values:**\n'
+                                                     '0 90 450\n'
+                                                     '**Related topics:**\n'
+                                                     '`Digital Filtering <digitizers.chm::/Digital_Filtering_Overview.html>`__\n'},
+                 'enum': None,
+                 'lv_property': 'Vertical:Advanced:High Pass Filter Frequency',
+                 'name': 'HIGH_PASS_FILTER_FREQUENCY',
+                 'python_name': 'high_pass_filter_frequency',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1150380: {   'access': 'read only',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': '\n'
+                                                     'Returns the number of samples transferred per record when you set the\n'
+                                                     '`Stream Relative To <pniScope_P2PStreamRelativeTo.html>`__ property to\n'
+                                                     '**Reference Trigger** or **Sync Trigger**.\n',
+                                      'note': [   'This property is only supported on NI 5160/5162 digitizers.',
+                                                  '\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                 'enum': None,
+                 'lv_property': 'Peer-to-Peer:Samples Transferred Per Record',
+                 'name': 'SAMPLES_TRANSFERRED_PER_RECORD',
+                 'python_name': 'samples_transferred_per_record',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1151000: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nSpecifies the Carrier NCO Center Frequency. The coerced value can be read back..\nDefault Value: 15.0e6\n'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):Carrier Mixer:NCO Center Frequency',
+                 'name': 'DDC_NCO_FREQUENCY',
+                 'python_name': 'ddc_nco_frequency',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1151001: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nSpecifies the Carrier Phase Offset. The coerced value can be read back.\nDefault Value: 0.0\n'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):Carrier Mixer:Phase Offset',
+                 'name': 'DDC_NCO_PHASE',
+                 'python_name': 'ddc_nco_phase',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1151002: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': ''},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):Advanced:Mux Mode',
+                 'name': 'MUX_MODE_REGISTER',
+                 'python_name': 'mux_mode_register',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1151003: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nSet this to VI_FALSE to disable programming of the DDC.\nDefault Value: VI_TRUE\n'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):Advanced:Enable DDC',
+                 'name': 'DDC_ENABLE',
+                 'python_name': 'ddc_enable',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1151010: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': '\n'
+                                                     'Controls the decimation in the CIC filter. The CIC filter reduces the sample rate  of a wideband signal to a rate that other filters in the DDC '
+                                                     'can process.\n'
+                                                     'Default Value: 4\n'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):CIC Filter:Decimation',
+                 'name': 'DDC_CIC_DECIMATION',
+                 'python_name': 'ddc_cic_decimation',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1151011: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': '\n'
+                                                     'Controls the shift gain at the input to the CIC filter. The CIC filter reduces  the sample rate of a wideband signal to a rate that other '
+                                                     'filters in the DDC can process.\n'
+                                                     'Default Value: 0\n'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):CIC Filter:Shift Gain',
+                 'name': 'DDC_CIC_SHIFT_GAIN',
+                 'python_name': 'ddc_cic_shift_gain',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1151020: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nSet this to VI_TRUE to enable the frequency discriminator.\nDefault Value: VI_FALSE\n'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):Frequency Discriminator:Enable',
+                 'name': 'DDC_DISCRIMINATOR_ENABLED',
+                 'python_name': 'ddc_discriminator_enabled',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1151021: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nSets the amount of decimation, from 1 to 8.\nDefault Value: 1\n'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):Frequency Discriminator:FIR Decimation',
+                 'name': 'DDC_DISCRIMINATOR_FIR_DECIMATION',
+                 'python_name': 'ddc_discriminator_fir_decimation',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1151022: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nSets the discriminator FIR symmetry to symmetric or asymmetric.\nDefault Value: Symmetric\n'},
+                 'enum': 'DiscriminatorFIRSymmetry',
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):Frequency Discriminator:FIR Symmetry',
+                 'name': 'DDC_DISCRIMINATOR_FIR_SYMMETRY',
+                 'python_name': 'ddc_discriminator_fir_symmetry',
+                 'python_type': 'enums.DiscriminatorFIRSymmetry',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1151023: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nSets the discriminator FIR symmetry type to even or odd.\nDefault Value: Even\n'},
+                 'enum': 'DiscriminatorFIRSymmetryType',
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):Frequency Discriminator:FIR Symmetry Type',
+                 'name': 'DDC_DISCRIMINATOR_FIR_SYMMETRY_TYPE',
+                 'python_name': 'ddc_discriminator_fir_symmetry_type',
+                 'python_type': 'enums.DiscriminatorFIRSymmetryType',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1151024: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nSets the discriminator FIR number of taps.\nValid Values:\n1 to 63.\nDefault Value: 1\n'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):Frequency Discriminator:FIR Taps',
+                 'name': 'DDC_DISCRIMINATOR_FIR_NUM_TAPS',
+                 'python_name': 'ddc_discriminator_fir_num_taps',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1151025: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nSets the number of delays in the discriminator, from 1 to 8.\nDefault Value: 1\n'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):Frequency Discriminator:Delay',
+                 'name': 'DDC_DISCRIMINATOR_DELAY',
+                 'python_name': 'ddc_discriminator_delay',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1151026: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nSets the discriminator FIR input source to phase, magnitude, or resampler.\nDefault Value: Phase\n'},
+                 'enum': 'DiscriminatorFIRInputSource',
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):Frequency Discriminator:FIR Input Source',
+                 'name': 'DDC_DISCRIMINATOR_FIR_INPUT_SOURCE',
+                 'python_name': 'ddc_discriminator_fir_input_source',
+                 'python_type': 'enums.DiscriminatorFIRInputSource',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1151027: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': '\n'
+                                                     'Programs the coordinate converter to multiply the phase output by 1, 2, 4, or 8. Multiplying the phase output  removes phase modulation before '
+                                                     'the frequency is measured.\n'
+                                                     'Default Value: 0\n'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):Frequency Discriminator:Phase Multiplier',
+                 'name': 'DDC_DISCRIMINATOR_PHASE_MULTIPLIER',
+                 'python_name': 'ddc_discriminator_phase_multiplier',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1151030: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nSpecifies the programmable FIR filter decimation.\nDefault Value: 1\n'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):Programmable FIR Filter:Decimation',
+                 'name': 'DDC_PFIR_DECIMATION',
+                 'python_name': 'ddc_pfir_decimation',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1151031: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': '\n'
+                                                     'Sets either a symmetric or asymmetric filter.\n'
+                                                     'Valid Values:\n'
+                                                     'NISCOPE_VAL_SYMMETRIC (0)\n'
+                                                     'NISCOPE_VAL_ASYMMETRIC (1)\n'
+                                                     'Default Value: Symmetric\n',
+                                      'note': [   '\n'
+                                                  'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or represent True/False, have been '
+                                                  'removed.\n']},
+                 'enum': 'ProgFIRFilterSymmetry',
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):Programmable FIR Filter:Symmetry',
+                 'name': 'DDC_PFIR_SYMMETRY',
+                 'python_name': 'ddc_pfir_symmetry',
+                 'python_type': 'enums.ProgFIRFilterSymmetry',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1151032: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': '\nSets either even or odd symmetry.\nValid Values:\nNISCOPE_VAL_EVEN (0)\nNISCOPE_VAL_ODD (1)\nDefault Value: Even\n',
+                                      'note': [   '\n'
+                                                  'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or represent True/False, have been '
+                                                  'removed.\n']},
+                 'enum': 'ProgFIRFilterSymmetryType',
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):Programmable FIR Filter:Symmetry Type',
+                 'name': 'DDC_PFIR_SYMMETRY_TYPE',
+                 'python_name': 'ddc_pfir_symmetry_type',
+                 'python_type': 'enums.ProgFIRFilterSymmetryType',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1151033: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nNumber of taps in the FIR filter, from 1 to 255.\nDefault Value: 1\n'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):Programmable FIR Filter:Taps',
+                 'name': 'DDC_PFIR_NUM_TAPS',
+                 'python_name': 'ddc_pfir_num_taps',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1151034: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nSets either a complex filter or a dual real filter.\nValid Values:\nNISCOPE_VAL_REAL (0)\nNISCOPE_VAL_COMPLEX (1)\nDefault Value: Real\n'},
+                 'enum': 'ProgFIRFilterRealComplex',
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):Programmable FIR Filter:Real/Complex',
+                 'name': 'DDC_PFIR_REAL_OR_COMPLEX',
+                 'python_name': 'ddc_pfir_real_or_complex',
+                 'python_type': 'enums.ProgFIRFilterRealComplex',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1151040: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nSets the maximum gain and minimum signal levels in the AGC.\nDefault Value: 6.020600\n'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):AGC:Upper Gain Limit',
+                 'name': 'DDC_AGC_UPPER_GAIN_LIMIT',
+                 'python_name': 'ddc_agc_upper_gain_limit',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1151041: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nSets the minimum gain and maximum signal levels in the AGC.\nDefault Value: 6.020600\n'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):AGC:Lower Gain Limit',
+                 'name': 'DDC_AGC_LOWER_GAIN_LIMIT',
+                 'python_name': 'ddc_agc_lower_gain_limit',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1151042: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nAlong with NISCOPE_ATTR_DDC_AGC_LOOP_GAIN_0_MANTISSA, sets the loop gain for the AGC.\nDefault Value: 0\n'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):AGC:Loop Gain 0 Exponent',
+                 'name': 'DDC_AGC_LOOP_GAIN_0_EXPONENT',
+                 'python_name': 'ddc_agc_loop_gain_0_exponent',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1151043: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nAlong with NISCOPE_ATTR_DDC_AGC_LOOP_GAIN_0_EXPONENT, sets the loop gain for the AGC.\nDefault Value: 0\n'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):AGC:Loop Gain 0 Mantissa',
+                 'name': 'DDC_AGC_LOOP_GAIN_0_MANTISSA',
+                 'python_name': 'ddc_agc_loop_gain_0_mantissa',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1151044: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nAlong with NISCOPE_ATTR_DDC_AGC_LOOP_GAIN_1_MANTISSA, sets the loop gain for the AGC.\nDefault Value: 0\n'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):AGC:Loop Gain 1 Exponent',
+                 'name': 'DDC_AGC_LOOP_GAIN_1_EXPONENT',
+                 'python_name': 'ddc_agc_loop_gain_1_exponent',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1151045: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nAlong with NISCOPE_ATTR_DDC_AGC_LOOP_GAIN_1_EXPONENT, sets the loop gain for the AGC.\nDefault Value: 0\n'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):AGC:Loop Gain 1 Mantissa',
+                 'name': 'DDC_AGC_LOOP_GAIN_1_MANTISSA',
+                 'python_name': 'ddc_agc_loop_gain_1_mantissa',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1151046: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nSets the gain error in the AGC.\nDefault Value: 0x034D\n'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):AGC:Threshold',
+                 'name': 'DDC_AGC_THRESHOLD',
+                 'python_name': 'ddc_agc_threshold',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1151047: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nAverages the AGC values.\nValid Values:\n0 - Mean\n1 - Median\nDefault Value: 0\n'},
+                 'enum': 'AGCAverageControl',
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):AGC:Average Control',
+                 'name': 'DDC_AGC_AVERAGE_CONTROL',
+                 'python_name': 'ddc_agc_average_control',
+                 'python_type': 'enums.AGCAverageControl',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1151050: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nEnables or bypasses the halfband filters. If set to VI_TRUE, halfband filters are bypassed.\nDefault Value: VI_TRUE\n'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):HalfBand Filter:Bypass',
+                 'name': 'DDC_HALFBAND_BYPASSED',
+                 'python_name': 'ddc_halfband_bypassed',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1151051: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nEnables halfband filter 1.\nDefault Value: VI_TRUE\n'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):HalfBand Filter:Filter 1 Enable',
+                 'name': 'DDC_HALFBAND_1_ENABLED',
+                 'python_name': 'ddc_halfband_1_enabled',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1151052: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nEnables halfband filter 2.\nDefault Value: VI_FALSE\n'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):HalfBand Filter:Filter 2 Enable',
+                 'name': 'DDC_HALFBAND_2_ENABLED',
+                 'python_name': 'ddc_halfband_2_enabled',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1151053: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nEnables halfband filter 3.\nDefault Value: VI_FALSE\n'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):HalfBand Filter:Filter 3 Enable',
+                 'name': 'DDC_HALFBAND_3_ENABLED',
+                 'python_name': 'ddc_halfband_3_enabled',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1151054: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nEnables halfband filter 4.\nDefault Value: VI_FALSE\n'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):HalfBand Filter:Filter 4 Enable',
+                 'name': 'DDC_HALFBAND_4_ENABLED',
+                 'python_name': 'ddc_halfband_4_enabled',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1151055: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nEnables halfband filter 5.\nDefault Value: VI_FALSE\n'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):HalfBand Filter:Filter 5 Enable',
+                 'name': 'DDC_HALFBAND_5_ENABLED',
+                 'python_name': 'ddc_halfband_5_enabled',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1151070: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the source for the AOUT parallel output from the DDC.\n'
+                                                     'Valid Values:\n'
+                                                     'NISCOPE_VAL_I_DATA (0)\n'
+                                                     'NISCOPE_VAL_MAGNITUDE_DATA (1)\n'
+                                                     'NISCOPE_VAL_FREQ_DATA (2)\n'
+                                                     'Default Value: I Data\n',
+                                      'note': [   '\n'
+                                                  'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or represent True/False, have been '
+                                                  'removed.\n']},
+                 'enum': 'AOUTParallelOutputSource',
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):Output Configuration:Parallel:AOUT Source',
+                 'name': 'DDC_AOUT_PARALLEL_OUTPUT_SOURCE',
+                 'python_name': 'ddc_aout_parallel_output_source',
+                 'python_type': 'enums.AOUTParallelOutputSource',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1151071: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the source for the BOUT parallel output from the DDC.\n'
+                                                     'Valid Values:\n'
+                                                     'NISCOPE_VAL_MAGNITUDE_DATA (1)\n'
+                                                     'NISCOPE_VAL_Q_DATA (3)\n'
+                                                     'NISCOPE_VAL_PHASE_DATA (4)\n'
+                                                     'Default Value: Q Data\n',
+                                      'note': [   '\n'
+                                                  'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or represent True/False, have been '
+                                                  'removed.\n']},
+                 'enum': 'BOUTParallelOutputSource',
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):Output Configuration:Parallel:BOUT Source',
+                 'name': 'DDC_BOUT_PARALLEL_OUTPUT_SOURCE',
+                 'python_name': 'ddc_bout_parallel_output_source',
+                 'python_type': 'enums.BOUTParallelOutputSource',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1151072: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nEnables the special test mode where the carrier NCO outputs are set to 0x7FFF.\nDefault Value: VI_FALSE\n'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):Advanced:Test Mode Sin/Cos',
+                 'name': 'DDC_TEST_SINE_COSINE',
+                 'python_name': 'ddc_test_sine_cosine',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1151073: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': '\n'
+                                                     'Selects the source for the input to the coordinate converter, either the HB filter or the programmable FIR.\n'
+                                                     'Valid Values:\n'
+                                                     '0 - Resampler HB 1 - Programmable FIR Default Value: 1\n'},
+                 'enum': 'CoordinateConverterInput',
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):Advanced:Coordinate Converter Input',
+                 'name': 'DDC_COORDINATE_CONVERTER_INPUT',
+                 'python_name': 'ddc_coordinate_converter_input',
+                 'python_type': 'enums.CoordinateConverterInput',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1151074: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nEither enables or zeros out the Q input to coordinate converter.\nDefault Value: I and Q\n'},
+                 'enum': 'QInputtoCoordConverter',
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):Advanced:Q Input to Coord. Converter',
+                 'name': 'DDC_Q_INPUT_TO_COORD_CONVERTER_INPUT',
+                 'python_name': 'ddc_q_input_to_coord_converter_input',
+                 'python_type': 'enums.QInputtoCoordConverter',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1151080: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nSource for Syncout CLK.\nValid Values:\n0 - CLKIN\n1 - PROCCLK\nDefault Value: CLKIN\n'},
+                 'enum': 'SyncoutCLKSelect',
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):Advanced:Syncout CLK Select',
+                 'name': 'DDC_SYNCOUT_CLK_SELECT',
+                 'python_name': 'ddc_syncout_clk_select',
+                 'python_type': 'enums.SyncoutCLKSelect',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1151120: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': '\n'
+                                                     'When TRUE, updates the timing NCO frequency to zero the feedback of the phase accumulator as well as  update the phase and frequency.\n'
+                                                     'Default Value: VI_TRUE\n'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):Advanced:Timing NCO:Phase Accum. Load on Update',
+                 'name': 'DDC_TIMING_NCO_PHASE_ACCUM_LOAD',
+                 'python_name': 'ddc_timing_nco_phase_accum_load',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1151121: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nIf set to FALSE, enables the accumulator in the timing NCO. If set to TRUE, zeros out feedback  in the accumulator.\nDefault Value: VI_FALSE\n'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):Advanced:Timing NCO:Clear Phase Accum.',
+                 'name': 'DDC_TIMING_NCO_CLEAR_PHASE_ACCUM',
+                 'python_name': 'ddc_timing_nco_clear_phase_accum',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1151122: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nIf set to TRUE, enables offset frequency in the timing NCO. If set to FALSE, applies no offset frequency.\nDefault Value: VI_FALSE\n'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):Advanced:Timing NCO:Enable Offset Freq.',
+                 'name': 'DDC_TIMING_NCO_ENABLE_OFFSET_FREQ',
+                 'python_name': 'ddc_timing_nco_enable_offset_freq',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1151123: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the number of offset bits in the timing NCO.\n'
+                                                     'Valid Values:\n'
+                                                     '0 - 8 bits\n'
+                                                     '1 - 16 bits\n'
+                                                     '2 - 24 bits\n'
+                                                     '3 - 32 bits\n'
+                                                     'Default Value: 8 bits\n'},
+                 'enum': 'TimingNCOFreqOffsetBits',
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):Advanced:Timing NCO:Frequency Offset Bits',
+                 'name': 'DDC_TIMING_NCO_NUM_OFFSET_FREQ_BITS',
+                 'python_name': 'ddc_timing_nco_num_offset_freq_bits',
+                 'python_type': 'enums.TimingNCOFreqOffsetBits',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1151124: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nControls the frequency of the timing NCO. Specifies the timing NCO center frequency in binary format:\nN = (Fout / Fresampler) X 2^32\n'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):Advanced:Timing NCO:Center Frequency',
+                 'name': 'DDC_TIMING_NCO_CENTER_FREQUENCY',
+                 'python_name': 'ddc_timing_nco_center_frequency',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1151125: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': '\n'
+                                                     'Offsets the phase of the timing NCO in binary format.  The value is transfered to the Active Register during the next initiate acquisition '
+                                                     'operation.\n'
+                                                     'Default Value: 0\n'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):Advanced:Timing NCO:Phase Offset',
+                 'name': 'DDC_TIMING_NCO_PHASE_OFFSET',
+                 'python_name': 'ddc_timing_nco_phase_offset',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1151126: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': '\n'
+                                                     'Selects the resampling filter mode.\n'
+                                                     'Valid Values:\n'
+                                                     '1 - Resampler Enabled 2 - HB 1 Enabled 3 - Resampler and HB 1 6 - Both HB Filters 7 - Resampler and Both HB Filters Default Value: 1\n'},
+                 'enum': 'ResamplerFilterMode',
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):Advanced:Resampler:Filter Mode',
+                 'name': 'DDC_RESAMPLER_FILTER_MODE_SELECT',
+                 'python_name': 'ddc_resampler_filter_mode_select',
+                 'python_type': 'enums.ResamplerFilterMode',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1151127: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nEither enables or bypasses the resampler filter in the DDC.  Set to VI_TRUE to bypass the resampling filter section.\nDefault Value: VI_TRUE\n'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):Advanced:Resampler:Bypass',
+                 'name': 'DDC_RESAMPLER_BYPASS',
+                 'python_name': 'ddc_resampler_bypass',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1151128: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nPrograms the delay between output samples when interpolating. These outputs can be delayed from 2 to 255 clocks.\nDefault Value: 16\n'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):Advanced:Resampler:Output Pulse Delay',
+                 'name': 'DDC_RESAMPLER_OUTPUT_PULSE_DELAY',
+                 'python_name': 'ddc_resampler_output_pulse_delay',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1151129: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nDivides down the Resampler NCO output by the value loaded into the register plus one.\nDefault Value: 2\n'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):Advanced:Resampler:NCO Divide',
+                 'name': 'DDC_NCO_DIVIDE',
+                 'python_name': 'ddc_nco_divide',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1151130: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': '\n'
+                                                     'Divides down the reference clock by the value loaded into the register plus one.  Load with a value that is one less than the desired period.\n'
+                                                     'Default Value: 2\n'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):Advanced:Resampler:Reference Divide',
+                 'name': 'DDC_REFERENCE_DIVIDE',
+                 'python_name': 'ddc_reference_divide',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1151300: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nSet to VI_TRUE to enable the analog dither on the NI 5620/5621.\nDefault Value: VI_FALSE\n'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):Advanced:Enable Dither',
+                 'name': 'ENABLE_DITHER',
+                 'python_name': 'enable_dither',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1151301: {   'access': 'read only',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nReturns the combined DDC decimation.\n'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):Combined Decimation',
+                 'name': 'DDC_COMBINED_DECIMATION',
+                 'python_name': 'ddc_combined_decimation',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1151302: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nVoltage of the DAC that controls the oscillator, used for external calibration.\n'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):Advanced:Serial DAC Cal Voltage',
+                 'name': 'SERIAL_DAC_CAL_VOLTAGE',
+                 'python_name': 'serial_dac_cal_voltage',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1151303: {   'access': 'read only',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': False,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'If TRUE, the PLL has remained locked to the external reference clock since it was last checked. If FALSE,  the PLL has become unlocked from the '
+                                                     'external reference clock since it was last checked.\n'},
+                 'enum': None,
+                 'lv_property': 'Clocking:PLL Lock Status',
+                 'name': 'PLL_LOCK_STATUS',
+                 'python_name': 'pll_lock_status',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1151304: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64TimeDeltaSeconds',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the delay in seconds that is used by niScope_InitiateAcquisition to allow additional  delay between programming of the vertical range, '
+                                                     'trigger level, DDC, and the start of the acquisition.  This attribute is only supported for the NI 5112 and the NI 5620/5621.\n'},
+                 'enum': None,
+                 'lv_property': 'Acquisition:Delay before Initiate',
+                 'name': 'DELAY_BEFORE_INITIATE',
+                 'python_name': 'delay_before_initiate',
+                 'python_type': 'datetime.timedelta',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1151305: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nUsed for directly accessing the\n`DDC <Digitizers.chm::/Glossary.html#DDC>`__ registers.\n'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):Advanced:DDC Direct Register Address',
+                 'name': 'DDC_DIRECT_REGISTER_ADDRESS',
+                 'python_name': 'ddc_direct_register_address',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1151306: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nUsed for directly accessing the\n`DDC <Digitizers.chm::/Glossary.html#DDC>`__ registers. The default\nvalue is 0.\n'},
+                 'enum': None,
+                 'lv_property': 'Device Specific:IF Digitizer (5620 and 5621):Advanced:DDC Direct Register Data',
+                 'name': 'DDC_DIRECT_REGISTER_DATA',
+                 'python_name': 'ddc_direct_register_data',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1250001: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the absolute value of the input range for a channel in volts.  For example, to acquire a sine wave that spans between -5 and +5 V, set '
+                                                     'this attribute to 10.0 V.\n'
+                                                     'Refer to the NI High-Speed Digitizers Help for a list of supported vertical ranges for each device.  If the specified range is not supported by '
+                                                     'a device, the value is coerced  up to the next valid range.\n'},
+                 'enum': None,
+                 'lv_property': 'Vertical:Vertical Range',
+                 'name': 'VERTICAL_RANGE',
+                 'python_name': 'vertical_range',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1250002: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the location of the center of the range. The value is with respect to ground and is in volts.  For example, to acquire a sine wave '
+                                                     'that spans between 0.0 and 10.0 V, set this attribute to 5.0 V.\n',
+                                      'note': 'This attribute is not supported by all digitizers.Refer to the NI High-Speed Digitizers Help for a list of vertical offsets supported for each device.'},
+                 'enum': None,
+                 'lv_property': 'Vertical:Vertical Offset',
+                 'name': 'VERTICAL_OFFSET',
+                 'python_name': 'vertical_offset',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1250003: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies how the digitizer couples the input signal for the channel.  When input coupling changes, the input stage takes a finite amount of '
+                                                     'time to settle.\n'},
+                 'enum': 'VerticalCoupling',
+                 'lv_property': 'Vertical:Vertical Coupling',
+                 'name': 'VERTICAL_COUPLING',
+                 'python_name': 'vertical_coupling',
+                 'python_type': 'enums.VerticalCoupling',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1250004: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the probe attenuation for the input channel. For example, for a 10:1 probe,  set this attribute to 10.0.\n'
+                                                     'Valid Values:\n'
+                                                     'Any positive real number. Typical values are 1, 10, and 100.\n'},
+                 'enum': None,
+                 'lv_property': 'Vertical:Probe Attenuation',
+                 'name': 'PROBE_ATTENUATION',
+                 'python_name': 'probe_attenuation',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1250005: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies whether the digitizer acquires a waveform for the channel.\n'
+                                                     'Valid Values:\n'
+                                                     'VI_TRUE  (1) - Acquire data on this channel\n'
+                                                     "VI_FALSE (0) - Don't acquire data on this channel\n"},
+                 'enum': None,
+                 'lv_property': 'Vertical:Channel Enabled',
+                 'name': 'CHANNEL_ENABLED',
+                 'python_name': 'channel_enabled',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1250006: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the bandwidth of the channel. Express this value as the frequency at which the input  circuitry attenuates the input signal by 3 dB. '
+                                                     'The units are hertz.\n'
+                                                     'Defined Values:\n'
+                                                     'NISCOPE_VAL_BANDWIDTH_FULL (-1.0)\n'
+                                                     'NISCOPE_VAL_BANDWIDTH_DEVICE_DEFAULT (0.0)\n'
+                                                     'NISCOPE_VAL_20MHZ_BANDWIDTH (20000000.0)\n'
+                                                     'NISCOPE_VAL_100MHZ_BANDWIDTH (100000000.0)\n'
+                                                     'NISCOPE_VAL_20MHZ_MAX_INPUT_FREQUENCY (20000000.0)\n'
+                                                     'NISCOPE_VAL_100MHZ_MAX_INPUT_FREQUENCY (100000000.0)\n',
+                                      'note': [   '\n'
+                                                  'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or represent True/False, have been '
+                                                  'removed.\n']},
+                 'enum': None,
+                 'lv_property': 'Vertical:Maximum Input Frequency',
+                 'name': 'MAX_INPUT_FREQUENCY',
+                 'python_name': 'max_input_frequency',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1250007: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64TimeDeltaSeconds',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nSpecifies the length of time that corresponds to the record length.\nUnits: Seconds\n'},
+                 'enum': None,
+                 'lv_property': 'Horizontal:Advanced:Time Per Record',
+                 'name': 'HORZ_TIME_PER_RECORD',
+                 'python_name': 'horz_time_per_record',
+                 'python_type': 'datetime.timedelta',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1250008: {   'access': 'read only',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Returns the actual number of points the digitizer acquires for each channel.  The value is equal to or greater than the minimum number of points '
+                                                     'you specify with  NISCOPE_ATTR_HORZ_MIN_NUM_PTS.\n'
+                                                     'Allocate a ViReal64 array of this size or greater to pass as the WaveformArray parameter of  the Read and Fetch functions. This attribute is '
+                                                     'only valid after a call to the one of the  Configure Horizontal functions.\n'},
+                 'enum': None,
+                 'lv_property': 'Horizontal:Actual Record Length',
+                 'name': 'HORZ_RECORD_LENGTH',
+                 'python_name': 'horz_record_length',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1250009: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the minimum number of points you require in the waveform record for each channel.  NI-SCOPE uses the value you specify to configure '
+                                                     'the record length that the digitizer uses  for waveform acquisition. NISCOPE_ATTR_HORZ_RECORD_LENGTH returns the actual record length.\n'
+                                                     'Valid Values: 1 - available onboard memory\n'},
+                 'enum': None,
+                 'lv_property': 'Horizontal:Min Number of Points',
+                 'name': 'HORZ_MIN_NUM_PTS',
+                 'python_name': 'horz_min_num_pts',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1250010: {   'access': 'read only',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Returns the effective sample rate using the current configuration. The units are samples per second.  This attribute is only valid after a call '
+                                                     'to the one of the Configure Horizontal functions.\n'
+                                                     'Units: Hertz (Samples / Second)\n'},
+                 'enum': None,
+                 'lv_property': 'Horizontal:Actual Sample Rate',
+                 'name': 'HORZ_SAMPLE_RATE',
+                 'python_name': 'horz_sample_rate',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1250011: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the position of the Reference Event in the waveform record.  When the digitizer detects a trigger, it waits the length of time the  '
+                                                     'NISCOPE_ATTR_TRIGGER_DELAY_TIME attribute specifies. The event that occurs when  the delay time elapses is the Reference Event. The Reference '
+                                                     'Event is relative to the  start of the record and is a percentage of the record length. For example, the value 50.0  corresponds to the center '
+                                                     'of the waveform record and 0.0 corresponds to the first element in the waveform record.\n'
+                                                     'Valid Values: 0.0 - 100.0\n'},
+                 'enum': None,
+                 'lv_property': 'Horizontal:Reference Position',
+                 'name': 'HORZ_RECORD_REF_POSITION',
+                 'python_name': 'horz_record_ref_position',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1250012: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nSpecifies the type of trigger to use.\n'},
+                 'enum': 'TriggerType',
+                 'lv_property': 'Triggering:Trigger Type',
+                 'name': 'TRIGGER_TYPE',
+                 'python_name': 'trigger_type',
+                 'python_type': 'enums.TriggerType',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1250013: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nSpecifies the source the digitizer monitors for the trigger event.\n'},
+                 'enum': None,
+                 'lv_property': 'Triggering:Trigger Source',
+                 'name': 'TRIGGER_SOURCE',
+                 'python_name': 'trigger_source',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1250014: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies how the digitizer couples the trigger source. This attribute affects instrument operation only when  NISCOPE_ATTR_TRIGGER_TYPE is set '
+                                                     'to NISCOPE_VAL_EDGE_TRIGGER, NISCOPE_VAL_HYSTERESIS_TRIGGER, or NISCOPE_VAL_WINDOW_TRIGGER.\n'},
+                 'enum': 'TriggerCoupling',
+                 'lv_property': 'Triggering:Trigger Coupling',
+                 'name': 'TRIGGER_COUPLING',
+                 'python_name': 'trigger_coupling',
+                 'python_type': 'enums.TriggerCoupling',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1250015: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64TimeDeltaSeconds',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the trigger delay time in seconds. The trigger delay time is the length of time the digitizer waits  after it receives the trigger. '
+                                                     'The event that occurs when the trigger delay elapses is the Reference Event.\n'
+                                                     'Valid Values: 0.0 - 171.8\n'},
+                 'enum': None,
+                 'lv_property': 'Triggering:Trigger Delay',
+                 'name': 'TRIGGER_DELAY_TIME',
+                 'python_name': 'trigger_delay_time',
+                 'python_type': 'datetime.timedelta',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1250016: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64TimeDeltaSeconds',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the length of time (in seconds) the digitizer waits after detecting a trigger before  enabling the trigger subsystem to detect another '
+                                                     'trigger. This attribute affects instrument operation  only when the digitizer requires multiple acquisitions to build a complete waveform. The '
+                                                     'digitizer requires  multiple waveform acquisitions when it uses equivalent-time sampling or when the digitizer is configured for a  multi-record '
+                                                     'acquisition through a call to niScope_ConfigureHorizontalTiming.\n'
+                                                     'Valid Values: 0.0 - 171.8\n'},
+                 'enum': None,
+                 'lv_property': 'Triggering:Trigger Holdoff',
+                 'name': 'TRIGGER_HOLDOFF',
+                 'python_name': 'trigger_holdoff',
+                 'python_type': 'datetime.timedelta',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1250017: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the voltage threshold for the trigger subsystem. The units are volts.  This attribute affects instrument behavior only when the '
+                                                     'NISCOPE_ATTR_TRIGGER_TYPE is set to  NISCOPE_VAL_EDGE_TRIGGER, NISCOPE_VAL_HYSTERESIS_TRIGGER, or NISCOPE_VAL_WINDOW_TRIGGER.\n'
+                                                     'Valid Values:\n'
+                                                     'The values of the range and offset parameters in niScope_ConfigureVertical determine the valid range for the trigger level  on the channel you '
+                                                     'use as the Trigger Source. The value you pass for this parameter must meet the following conditions:\n'},
+                 'enum': None,
+                 'lv_property': 'Triggering:Trigger Level',
+                 'name': 'TRIGGER_LEVEL',
+                 'python_name': 'trigger_level',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1250018: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies if a rising or a falling edge triggers the digitizer.  This attribute affects instrument operation only when NISCOPE_ATTR_TRIGGER_TYPE '
+                                                     'is set to  NISCOPE_VAL_EDGE_TRIGGER, NISCOPE_VAL_HYSTERESIS_TRIGGER, or NISCOPE_VAL_WINDOW_TRIGGER.\n'},
+                 'enum': 'TriggerSlope',
+                 'lv_property': 'Triggering:Trigger Slope',
+                 'name': 'TRIGGER_SLOPE',
+                 'python_name': 'trigger_slope',
+                 'python_type': 'enums.TriggerSlope',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1250101: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nSpecifies how the digitizer acquires data and fills the waveform record.\n'},
+                 'enum': 'AcquisitionType',
+                 'lv_property': 'Acquisition:Acquisition Type',
+                 'name': 'ACQUISITION_TYPE',
+                 'python_name': 'acquisition_type',
+                 'python_type': 'enums.AcquisitionType',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1250102: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Configures the device to automatically complete an acquisition if a trigger has not been received.\n'
+                                                     'Valid Values:\n'
+                                                     'None (1)         - Normal triggering\n'
+                                                     'Auto Trigger (2) - Auto trigger acquisition if no trigger arrives\n'},
+                 'enum': 'TriggerModifier',
+                 'lv_property': 'Triggering:Trigger Modifier',
+                 'name': 'TRIGGER_MODIFIER',
+                 'python_name': 'trigger_modifier',
+                 'python_type': 'enums.TriggerModifier',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1250103: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nSpecifies the input impedance for the channel in Ohms.\n'},
+                 'enum': None,
+                 'lv_property': 'Vertical:Input Impedance',
+                 'name': 'INPUT_IMPEDANCE',
+                 'python_name': 'input_impedance',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1250106: {   'access': 'read only',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nIndicates the sample mode the digitizer is currently using.\n'},
+                 'enum': None,
+                 'lv_property': 'Acquisition:Sample Mode',
+                 'name': 'SAMPLE_MODE',
+                 'python_name': 'sample_mode',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1250109: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64TimeDeltaSeconds',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the length of time from the trigger event to the first point in  the waveform record in seconds.  If the value is positive, the first '
+                                                     'point  in the waveform record occurs after the trigger event (same as specifying  NISCOPE_ATTR_TRIGGER_DELAY_TIME).  If the value is negative, '
+                                                     'the first point  in the waveform record occurs before the trigger event (same as specifying  NISCOPE_ATTR_HORZ_RECORD_REF_POSITION).\n'},
+                 'enum': None,
+                 'lv_property': 'Horizontal:Advanced:Acquisition Start Time',
+                 'name': 'ACQUISITION_START_TIME',
+                 'python_name': 'acquisition_start_time',
+                 'python_type': 'datetime.timedelta',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1250201: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nSpecifies the type of video signal, such as NTSC, PAL, or SECAM.\n'},
+                 'enum': 'VideoSignalFormat',
+                 'lv_property': 'Triggering:Trigger Video:Signal Format',
+                 'name': 'TV_TRIGGER_SIGNAL_FORMAT',
+                 'python_name': 'tv_trigger_signal_format',
+                 'python_type': 'enums.VideoSignalFormat',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1250204: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nSpecifies whether the video signal sync is positive or negative.\n'},
+                 'enum': 'VideoPolarity',
+                 'lv_property': 'Triggering:Trigger Video:Polarity',
+                 'name': 'TV_TRIGGER_POLARITY',
+                 'python_name': 'tv_trigger_polarity',
+                 'python_type': 'enums.VideoPolarity',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1250205: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nSpecifies the condition in the video signal that causes the digitizer to trigger.\n'},
+                 'enum': 'VideoTriggerEvent',
+                 'lv_property': 'Triggering:Trigger Video:Event',
+                 'name': 'TV_TRIGGER_EVENT',
+                 'python_name': 'tv_trigger_event',
+                 'python_type': 'enums.VideoTriggerEvent',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1250206: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies the line on which to trigger, if NISCOPE_ATTR_TV_TRIGGER_EVENT is set to line number. The  valid ranges of the attribute depend on the '
+                                                     'signal format selected.  M-NTSC has a valid range of 1 to 525.  B/G-PAL, SECAM, 576i, and 576p have a valid range of  1 to 625. 720p has a valid '
+                                                     'range of 1 to 750. 1080i and 1080p have a valid range of 1125.\n'},
+                 'enum': None,
+                 'lv_property': 'Triggering:Trigger Video:Line Number',
+                 'name': 'TV_TRIGGER_LINE_NUMBER',
+                 'python_name': 'tv_trigger_line_number',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'}}
\ No newline at end of file
@@ -0,0 +1,708 @@
+enums =
+{   'AGCAverageControl': {   'codegen_method': 'no',
+                             'python_name': 'AGCAverageControl',
+                             'values': [   {'documentation': {'description': 'Mean average.'}, 'name': 'MEAN', 'python_name': 'MEAN', 'value': 0},
+                                           {'documentation': {'description': 'Median average.'}, 'name': 'MEDIAN', 'python_name': 'MEDIAN', 'value': 1}]},
+    'AOUTParallelOutputSource': {   'codegen_method': 'no',
+                                    'python_name': 'AOUTParallelOutputSource',
+                                    'values': [   {   'documentation': {'description': '\nSpecifies I data as the source for the AOUT parallel output from the\nDDC.\n'},
+                                                      'name': 'I_DATA',
+                                                      'python_name': 'I',
+                                                      'suffix': '_DATA',
+                                                      'value': 0},
+                                                  {   'documentation': {'description': '\nSpecifies magnitude data as the source for the AOUT parallel output from\nthe DDC.\n'},
+                                                      'name': 'MAGNITUDE_DATA',
+                                                      'python_name': 'MAGNITUDE',
+                                                      'suffix': '_DATA',
+                                                      'value': 1},
+                                                  {   'documentation': {'description': '\nSpecifies frequency data as the source for the AOUT parallel output from\nthe DDC.\n'},
+                                                      'name': 'FREQUENCY_DATA',
+                                                      'python_name': 'FREQUENCY',
+                                                      'suffix': '_DATA',
+                                                      'value': 2}]},
+    'AcquisitionStatus': {   'codegen_method': 'public',
+                             'python_name': 'AcquisitionStatus',
+                             'values': [   {'name': 'NISCOPE_VAL_ACQ_COMPLETE', 'prefix': 'ACQ_', 'python_name': 'COMPLETE', 'value': 1},
+                                           {'name': 'NISCOPE_VAL_ACQ_IN_PROGRESS', 'prefix': 'ACQ_', 'python_name': 'IN_PROGRESS', 'value': 0},
+                                           {'name': 'NISCOPE_VAL_ACQ_STATUS_UNKNOWN', 'prefix': 'ACQ_', 'python_name': 'STATUS_UNKNOWN', 'value': -1}]},
+    'AcquisitionType': {   'codegen_method': 'public',
+                           'python_name': 'AcquisitionType',
+                           'values': [   {   'documentation': {'description': 'Sets the digitizer to normal resolution mode. The digitizer can use real-time sampling or equivalent-time sampling.'},
+                                             'name': 'NISCOPE_VAL_NORMAL',
+                                             'python_name': 'NORMAL',
+                                             'value': 0},
+                                         {   'documentation': {   'description': 'Sets the digitizer to flexible resolution mode if supported.  The digitizer uses different hardware configurations '
+                                                                                 'to change the resolution depending on the sampling rate used.'},
+                                             'name': 'NISCOPE_VAL_FLEXRES',
+                                             'python_name': 'FLEXRES',
+                                             'value': 1001},
+                                         {'documentation': {'description': 'Sets the digitizer to DDC mode on the NI 5620/5621.'}, 'name': 'NISCOPE_VAL_DDC', 'python_name': 'DDC', 'value': 1002}]},
+    'AddressType': {   'codegen_method': 'no',
+                       'python_name': 'AddressType',
+                       'values': [   {'documentation': {'description': 'Physical address.'}, 'name': 'NISCOPE_VAL_ADDR_PHYSICAL', 'prefix': 'ADDR_', 'python_name': 'PHYSICAL', 'value': 0},
+                                     {'documentation': {'description': 'Virtual address.'}, 'name': 'NISCOPE_VAL_ADDR_VIRTUAL', 'prefix': 'ADDR_', 'python_name': 'VIRTUAL', 'value': 1}]},
+    'ArrayMeasurement': {   'codegen_method': 'public',
+                            'python_name': 'ArrayMeasurement',
+                            'values': [   {'name': 'NISCOPE_VAL_NO_MEASUREMENT', 'python_name': 'NO_MEASUREMENT', 'value': 4000},
+                                          {'name': 'NISCOPE_VAL_LAST_ACQ_HISTOGRAM', 'python_name': 'LAST_ACQ_HISTOGRAM', 'value': 4001},
+                                          {'name': 'NISCOPE_VAL_FFT_PHASE_SPECTRUM', 'python_name': 'FFT_PHASE_SPECTRUM', 'value': 4002},
+                                          {'name': 'NISCOPE_VAL_FFT_AMP_SPECTRUM_VOLTS_RMS', 'python_name': 'FFT_AMP_SPECTRUM_VOLTS_RMS', 'value': 4003},
+                                          {'name': 'NISCOPE_VAL_MULTI_ACQ_VOLTAGE_HISTOGRAM', 'python_name': 'MULTI_ACQ_VOLTAGE_HISTOGRAM', 'value': 4004},
+                                          {'name': 'NISCOPE_VAL_MULTI_ACQ_TIME_HISTOGRAM', 'python_name': 'MULTI_ACQ_TIME_HISTOGRAM', 'value': 4005},
+                                          {'name': 'NISCOPE_VAL_ARRAY_INTEGRAL', 'python_name': 'ARRAY_INTEGRAL', 'value': 4006},
+                                          {'name': 'NISCOPE_VAL_DERIVATIVE', 'python_name': 'DERIVATIVE', 'value': 4007},
+                                          {'name': 'NISCOPE_VAL_INVERSE', 'python_name': 'INVERSE', 'value': 4008},
+                                          {'name': 'NISCOPE_VAL_HANNING_WINDOW', 'python_name': 'HANNING_WINDOW', 'value': 4009},
+                                          {'name': 'NISCOPE_VAL_FLAT_TOP_WINDOW', 'python_name': 'FLAT_TOP_WINDOW', 'value': 4010},
+                                          {'name': 'NISCOPE_VAL_POLYNOMIAL_INTERPOLATION', 'python_name': 'POLYNOMIAL_INTERPOLATION', 'value': 4011},
+                                          {'name': 'NISCOPE_VAL_MULTIPLY_CHANNELS', 'python_name': 'MULTIPLY_CHANNELS', 'value': 4012},
+                                          {'name': 'NISCOPE_VAL_ADD_CHANNELS', 'python_name': 'ADD_CHANNELS', 'value': 4013},
+                                          {'name': 'NISCOPE_VAL_SUBTRACT_CHANNELS', 'python_name': 'SUBTRACT_CHANNELS', 'value': 4014},
+                                          {'name': 'NISCOPE_VAL_DIVIDE_CHANNELS', 'python_name': 'DIVIDE_CHANNELS', 'value': 4015},
+                                          {'name': 'NISCOPE_VAL_MULTI_ACQ_AVERAGE', 'python_name': 'MULTI_ACQ_AVERAGE', 'value': 4016},
+                                          {'name': 'NISCOPE_VAL_BUTTERWORTH_FILTER', 'python_name': 'BUTTERWORTH_FILTER', 'value': 4017},
+                                          {'name': 'NISCOPE_VAL_CHEBYSHEV_FILTER', 'python_name': 'CHEBYSHEV_FILTER', 'value': 4018},
+                                          {'name': 'NISCOPE_VAL_FFT_AMP_SPECTRUM_DB', 'python_name': 'FFT_AMP_SPECTRUM_DB', 'value': 4019},
+                                          {'name': 'NISCOPE_VAL_HAMMING_WINDOW', 'python_name': 'HAMMING_WINDOW', 'value': 4020},
+                                          {'name': 'NISCOPE_VAL_WINDOWED_FIR_FILTER', 'python_name': 'WINDOWED_FIR_FILTER', 'value': 4021},
+                                          {'name': 'NISCOPE_VAL_BESSEL_FILTER', 'python_name': 'BESSEL_FILTER', 'value': 4022},
+                                          {'name': 'NISCOPE_VAL_TRIANGLE_WINDOW', 'python_name': 'TRIANGLE_WINDOW', 'value': 4023},
+                                          {'name': 'NISCOPE_VAL_BLACKMAN_WINDOW', 'python_name': 'BLACKMAN_WINDOW', 'value': 4024},
+                                          {'name': 'NISCOPE_VAL_ARRAY_OFFSET', 'python_name': 'ARRAY_OFFSET', 'value': 4025},
+                                          {'name': 'NISCOPE_VAL_ARRAY_GAIN', 'python_name': 'ARRAY_GAIN', 'value': 4026}]},
+    'BOUTParallelOutputSource': {   'codegen_method': 'no',
+                                    'python_name': 'BOUTParallelOutputSource',
+                                    'values': [   {   'documentation': {'description': 'Specifies magnitude data as the source.'},
+                                                      'name': 'MAGNITUDE_DATA',
+                                                      'python_name': 'MAGNITUDE',
+                                                      'suffix': '_DATA',
+                                                      'value': 1},
+                                                  {'documentation': {'description': 'Specifies Q data as the source.'}, 'name': 'Q_DATA', 'python_name': 'Q', 'suffix': '_DATA', 'value': 3},
+                                                  {   'documentation': {'description': 'Specifies phase data as the source.'},
+                                                      'name': 'PHASE_DATA',
+                                                      'python_name': 'PHASE',
+                                                      'suffix': '_DATA',
+                                                      'value': 4}]},
+    'ClearableMeasurement': {   'codegen_method': 'public',
+                                'python_name': 'ClearableMeasurement',
+                                'values': [   {'name': 'ALL_MEASUREMENTS', 'python_name': 'ALL_MEASUREMENTS', 'value': 10000},
+                                              {'name': 'MULTI_ACQ_VOLTAGE_HISTOGRAM', 'python_name': 'MULTI_ACQ_VOLTAGE_HISTOGRAM', 'value': 4004},
+                                              {'name': 'MULTI_ACQ_TIME_HISTOGRAM', 'python_name': 'MULTI_ACQ_TIME_HISTOGRAM', 'value': 4005},
+                                              {'name': 'MULTI_ACQ_AVERAGE', 'python_name': 'MULTI_ACQ_AVERAGE', 'value': 4016},
+                                              {'name': 'FREQUENCY', 'python_name': 'FREQUENCY', 'value': 2},
+                                              {'name': 'AVERAGE_FREQUENCY', 'python_name': 'AVERAGE_FREQUENCY', 'value': 1016},
+                                              {'name': 'FFT_FREQUENCY', 'python_name': 'FFT_FREQUENCY', 'value': 1008},
+                                              {'name': 'PERIOD', 'python_name': 'PERIOD', 'value': 3},
+                                              {'name': 'AVERAGE_PERIOD', 'python_name': 'AVERAGE_PERIOD', 'value': 1015},
+                                              {'name': 'RISE_TIME', 'python_name': 'RISE_TIME', 'value': 0},
+                                              {'name': 'FALL_TIME', 'python_name': 'FALL_TIME', 'value': 1},
+                                              {'name': 'RISE_SLEW_RATE', 'python_name': 'RISE_SLEW_RATE', 'value': 1010},
+                                              {'name': 'FALL_SLEW_RATE', 'python_name': 'FALL_SLEW_RATE', 'value': 1011},
+                                              {'name': 'OVERSHOOT', 'python_name': 'OVERSHOOT', 'value': 18},
+                                              {'name': 'PRESHOOT', 'python_name': 'PRESHOOT', 'value': 19},
+                                              {'name': 'VOLTAGE_RMS', 'python_name': 'VOLTAGE_RMS', 'value': 4},
+                                              {'name': 'VOLTAGE_CYCLE_RMS', 'python_name': 'VOLTAGE_CYCLE_RMS', 'value': 16},
+                                              {'name': 'AC_ESTIMATE', 'python_name': 'AC_ESTIMATE', 'value': 1012},
+                                              {'name': 'FFT_AMPLITUDE', 'python_name': 'FFT_AMPLITUDE', 'value': 1009},
+                                              {'name': 'VOLTAGE_AVERAGE', 'python_name': 'VOLTAGE_AVERAGE', 'value': 10},
+                                              {'name': 'VOLTAGE_CYCLE_AVERAGE', 'python_name': 'VOLTAGE_CYCLE_AVERAGE', 'value': 17},
+                                              {'name': 'DC_ESTIMATE', 'python_name': 'DC_ESTIMATE', 'value': 1013},
+                                              {'name': 'VOLTAGE_MAX', 'python_name': 'VOLTAGE_MAX', 'value': 6},
+                                              {'name': 'VOLTAGE_MIN', 'python_name': 'VOLTAGE_MIN', 'value': 7},
+                                              {'name': 'VOLTAGE_PEAK_TO_PEAK', 'python_name': 'VOLTAGE_PEAK_TO_PEAK', 'value': 5},
+                                              {'name': 'VOLTAGE_HIGH', 'python_name': 'VOLTAGE_HIGH', 'value': 8},
+                                              {'name': 'VOLTAGE_LOW', 'python_name': 'VOLTAGE_LOW', 'value': 9},
+                                              {'name': 'AMPLITUDE', 'python_name': 'AMPLITUDE', 'value': 15},
+                                              {'name': 'VOLTAGE_TOP', 'python_name': 'VOLTAGE_TOP', 'value': 1007},
+                                              {'name': 'VOLTAGE_BASE', 'python_name': 'VOLTAGE_BASE', 'value': 1006},
+                                              {'name': 'VOLTAGE_BASE_TO_TOP', 'python_name': 'VOLTAGE_BASE_TO_TOP', 'value': 1017},
+                                              {'name': 'WIDTH_NEG', 'python_name': 'WIDTH_NEG', 'value': 11},
+                                              {'name': 'WIDTH_POS', 'python_name': 'WIDTH_POS', 'value': 12},
+                                              {'name': 'DUTY_CYCLE_NEG', 'python_name': 'DUTY_CYCLE_NEG', 'value': 13},
+                                              {'name': 'DUTY_CYCLE_POS', 'python_name': 'DUTY_CYCLE_POS', 'value': 14},
+                                              {'name': 'INTEGRAL', 'python_name': 'INTEGRAL', 'value': 1005},
+                                              {'name': 'AREA', 'python_name': 'AREA', 'value': 1003},
+                                              {'name': 'CYCLE_AREA', 'python_name': 'CYCLE_AREA', 'value': 1004},
+                                              {'name': 'TIME_DELAY', 'python_name': 'TIME_DELAY', 'value': 1014},
+                                              {'name': 'PHASE_DELAY', 'python_name': 'PHASE_DELAY', 'value': 1018},
+                                              {'name': 'LOW_REF_VOLTS', 'python_name': 'LOW_REF_VOLTS', 'value': 1000},
+                                              {'name': 'MID_REF_VOLTS', 'python_name': 'MID_REF_VOLTS', 'value': 1001},
+                                              {'name': 'HIGH_REF_VOLTS', 'python_name': 'HIGH_REF_VOLTS', 'value': 1002},
+                                              {'name': 'VOLTAGE_HISTOGRAM_MEAN', 'python_name': 'VOLTAGE_HISTOGRAM_MEAN', 'value': 2000},
+                                              {'name': 'VOLTAGE_HISTOGRAM_STDEV', 'python_name': 'VOLTAGE_HISTOGRAM_STDEV', 'value': 2001},
+                                              {'name': 'VOLTAGE_HISTOGRAM_MEDIAN', 'python_name': 'VOLTAGE_HISTOGRAM_MEDIAN', 'value': 2003},
+                                              {'name': 'VOLTAGE_HISTOGRAM_MODE', 'python_name': 'VOLTAGE_HISTOGRAM_MODE', 'value': 2010},
+                                              {'name': 'VOLTAGE_HISTOGRAM_MAX', 'python_name': 'VOLTAGE_HISTOGRAM_MAX', 'value': 2005},
+                                              {'name': 'VOLTAGE_HISTOGRAM_MIN', 'python_name': 'VOLTAGE_HISTOGRAM_MIN', 'value': 2006},
+                                              {'name': 'VOLTAGE_HISTOGRAM_PEAK_TO_PEAK', 'python_name': 'VOLTAGE_HISTOGRAM_PEAK_TO_PEAK', 'value': 2002},
+                                              {'name': 'VOLTAGE_HISTOGRAM_MEAN_PLUS_STDEV', 'python_name': 'VOLTAGE_HISTOGRAM_MEAN_PLUS_STDEV', 'value': 2007},
+                                              {'name': 'VOLTAGE_HISTOGRAM_MEAN_PLUS_2_STDEV', 'python_name': 'VOLTAGE_HISTOGRAM_MEAN_PLUS_2_STDEV', 'value': 2008},
+                                              {'name': 'VOLTAGE_HISTOGRAM_MEAN_PLUS_3_STDEV', 'python_name': 'VOLTAGE_HISTOGRAM_MEAN_PLUS_3_STDEV', 'value': 2009},
+                                              {'name': 'VOLTAGE_HISTOGRAM_HITS', 'python_name': 'VOLTAGE_HISTOGRAM_HITS', 'value': 2004},
+                                              {'name': 'VOLTAGE_HISTOGRAM_NEW_HITS', 'python_name': 'VOLTAGE_HISTOGRAM_NEW_HITS', 'value': 2011},
+                                              {'name': 'TIME_HISTOGRAM_MEAN', 'python_name': 'TIME_HISTOGRAM_MEAN', 'value': 3000},
+                                              {'name': 'TIME_HISTOGRAM_STDEV', 'python_name': 'TIME_HISTOGRAM_STDEV', 'value': 3001},
+                                              {'name': 'TIME_HISTOGRAM_MEDIAN', 'python_name': 'TIME_HISTOGRAM_MEDIAN', 'value': 3003},
+                                              {'name': 'TIME_HISTOGRAM_MODE', 'python_name': 'TIME_HISTOGRAM_MODE', 'value': 3010},
+                                              {'name': 'TIME_HISTOGRAM_MAX', 'python_name': 'TIME_HISTOGRAM_MAX', 'value': 3005},
+                                              {'name': 'TIME_HISTOGRAM_MIN', 'python_name': 'TIME_HISTOGRAM_MIN', 'value': 3006},
+                                              {'name': 'TIME_HISTOGRAM_PEAK_TO_PEAK', 'python_name': 'TIME_HISTOGRAM_PEAK_TO_PEAK', 'value': 3002},
+                                              {'name': 'TIME_HISTOGRAM_MEAN_PLUS_STDEV', 'python_name': 'TIME_HISTOGRAM_MEAN_PLUS_STDEV', 'value': 3007},
+                                              {'name': 'TIME_HISTOGRAM_MEAN_PLUS_2_STDEV', 'python_name': 'TIME_HISTOGRAM_MEAN_PLUS_2_STDEV', 'value': 3008},
+                                              {'name': 'TIME_HISTOGRAM_MEAN_PLUS_3_STDEV', 'python_name': 'TIME_HISTOGRAM_MEAN_PLUS_3_STDEV', 'value': 3009},
+                                              {'name': 'TIME_HISTOGRAM_HITS', 'python_name': 'TIME_HISTOGRAM_HITS', 'value': 3004},
+                                              {'name': 'TIME_HISTOGRAM_NEW_HITS', 'python_name': 'TIME_HISTOGRAM_NEW_HITS', 'value': 3011}]},
+    'CoordinateConverterInput': {   'codegen_method': 'no',
+                                    'python_name': 'CoordinateConverterInput',
+                                    'values': [   {   'documentation': {'description': '\nSelects the HB filter as the source for the input to the coordinate\nconverter.\n'},
+                                                      'name': 'RESAMPLER_HB',
+                                                      'python_name': 'RESAMPLER_HB',
+                                                      'value': 0},
+                                                  {   'documentation': {'description': '\nSelects the programmable FIR filter as the source for the input to the\ncoordinate converter.\n'},
+                                                      'name': 'PROGRAMMABLE_FIR',
+                                                      'python_name': 'PROGRAMMABLE_FIR',
+                                                      'value': 1}]},
+    'DataJustificationMode': {   'codegen_method': 'no',
+                                 'python_name': 'DataJustificationMode',
+                                 'values': [   {'documentation': {'description': ''}, 'name': 'LEFT', 'python_name': 'LEFT', 'value': 1},
+                                               {'documentation': {'description': ''}, 'name': 'RIGHT', 'python_name': 'RIGHT', 'value': 2}]},
+    'DataProcessingMode': {   'codegen_method': 'public',
+                              'python_name': 'DataProcessingMode',
+                              'values': [   {'documentation': {'description': 'The waveform data points are real numbers (I data).'}, 'name': 'NISCOPE_VAL_REAL', 'python_name': 'REAL', 'value': 0},
+                                            {   'documentation': {'description': 'The waveform data points are complex numbers (IQ data).'},
+                                                'name': 'NISCOPE_VAL_COMPLEX',
+                                                'python_name': 'COMPLEX',
+                                                'value': 1}]},
+    'DiscriminatorFIRInputSource': {   'codegen_method': 'no',
+                                       'python_name': 'DiscriminatorFIRInputSource',
+                                       'values': [   {   'documentation': {'description': 'Sets the discriminator FIR input source to phase.'},
+                                                         'name': 'NISCOPE_VAL_PHASE',
+                                                         'python_name': 'PHASE',
+                                                         'value': 0},
+                                                     {   'documentation': {'description': 'Sets the discriminator FIR input source to magnitude.'},
+                                                         'name': 'NISCOPE_VAL_MAGNITUDE',
+                                                         'python_name': 'MAGNITUDE',
+                                                         'value': 1},
+                                                     {'name': 'NISCOPE_VAL_RESAMPLER', 'python_name': 'RESAMPLER', 'value': 2},
+                                                     {   'documentation': {'description': 'Sets the discriminator FIR input source to resampler.'},
+                                                         'name': 'RESAMPLER',
+                                                         'python_name': 'RESAMPLER',
+                                                         'value': 3}]},
+    'DiscriminatorFIRSymmetry': {   'codegen_method': 'no',
+                                    'python_name': 'DiscriminatorFIRSymmetry',
+                                    'values': [   {   'documentation': {'description': 'Sets the discriminator FIR symmetry to symmetric.'},
+                                                      'name': 'NISCOPE_VAL_SYMMETRIC',
+                                                      'python_name': 'SYMMETRIC',
+                                                      'value': 0},
+                                                  {   'documentation': {'description': 'Sets the discriminator FIR symmetry to asymmetric.'},
+                                                      'name': 'NISCOPE_VAL_ASYMMETRIC',
+                                                      'python_name': 'ASYMMETRIC',
+                                                      'value': 1}]},
+    'DiscriminatorFIRSymmetryType': {   'codegen_method': 'no',
+                                        'python_name': 'DiscriminatorFIRSymmetryType',
+                                        'values': [   {   'documentation': {'description': 'Sets the discriminator FIR symmetry type to even.'},
+                                                          'name': 'NISCOPE_VAL_EVEN',
+                                                          'python_name': 'EVEN',
+                                                          'value': 0},
+                                                      {   'documentation': {'description': 'Sets the discriminator FIR symmetry type to odd.'},
+                                                          'name': 'NISCOPE_VAL_ODD',
+                                                          'python_name': 'ODD',
+                                                          'value': 1}]},
+    'ExportableSignals': {   'codegen_method': 'public',
+                             'python_name': 'ExportableSignals',
+                             'values': [   {'name': 'NISCOPE_VAL_START_TRIGGER', 'python_name': 'START_TRIGGER', 'value': 2},
+                                           {'name': 'NISCOPE_VAL_ADVANCE_TRIGGER', 'python_name': 'ADVANCE_TRIGGER', 'value': 5},
+                                           {'name': 'NISCOPE_VAL_REF_TRIGGER', 'python_name': 'REF_TRIGGER', 'value': 1},
+                                           {'name': 'NISCOPE_VAL_END_OF_RECORD_EVENT', 'python_name': 'END_OF_RECORD_EVENT', 'value': 4},
+                                           {'name': 'NISCOPE_VAL_END_OF_ACQUISITION_EVENT', 'python_name': 'END_OF_ACQUISITION_EVENT', 'value': 3},
+                                           {'name': 'NISCOPE_VAL_READY_FOR_START_EVENT', 'python_name': 'READY_FOR_START_EVENT', 'value': 7},
+                                           {'name': 'NISCOPE_VAL_READY_FOR_ADVANCE_EVENT', 'python_name': 'READY_FOR_ADVANCE_EVENT', 'value': 6},
+                                           {'name': 'NISCOPE_VAL_READY_FOR_REF_EVENT', 'python_name': 'READY_FOR_REF_EVENT', 'value': 10},
+                                           {'name': 'NISCOPE_VAL_REF_CLOCK', 'python_name': 'REF_CLOCK', 'value': 100},
+                                           {'name': 'NISCOPE_VAL_SAMPLE_CLOCK', 'python_name': 'SAMPLE_CLOCK', 'value': 101},
+                                           {'name': 'NISCOPE_VAL_5V_OUT', 'python_name': '_5V_OUT', 'value': 13}]},
+    'FIRFilterWindow': {   'codegen_method': 'public',
+                           'python_name': 'FIRFilterWindow',
+                           'values': [   {'documentation': {'description': 'No window.'}, 'name': 'NONE', 'python_name': 'NONE', 'value': 0},
+                                         {'documentation': {'description': 'Specifies a Hanning window.'}, 'name': 'HANNING', 'python_name': 'HANNING', 'value': 409},
+                                         {'documentation': {'description': 'Specifies a Flat Top window.'}, 'name': 'FLAT_TOP', 'python_name': 'FLAT_TOP', 'value': 410},
+                                         {'documentation': {'description': 'Specifies a Hamming window.'}, 'name': 'HAMMING', 'python_name': 'HAMMING', 'value': 420},
+                                         {'documentation': {'description': 'Specifies a Triangle window.'}, 'name': 'TRIANGLE', 'python_name': 'TRIANGLE', 'value': 423},
+                                         {'documentation': {'description': 'Specifies a Blackman window.'}, 'name': 'BLACKMAN', 'python_name': 'BLACKMAN', 'value': 424}]},
+    'FetchRelativeTo': {   'codegen_method': 'public',
+                           'python_name': 'FetchRelativeTo',
+                           'values': [   {   'documentation': {   'description': 'The read pointer is set to zero when a new acquisition is initiated. After every fetch the read pointer is '
+                                                                                 'incremeted to be the sample after the last sample retrieved.  Therefore, you can repeatedly fetch relative to the '
+                                                                                 'read pointer for a continuous acquisition program.'},
+                                             'name': 'NISCOPE_VAL_READ_POINTER',
+                                             'python_name': 'READ_POINTER',
+                                             'value': 388},
+                                         {   'documentation': {'description': 'Fetches relative to the first pretrigger point requested with niScope_ConfigureHorizontalTiming.'},
+                                             'name': 'NISCOPE_VAL_PRETRIGGER',
+                                             'python_name': 'PRETRIGGER',
+                                             'value': 477},
+                                         {'documentation': {'description': 'Fetch data at the last sample acquired.'}, 'name': 'NISCOPE_VAL_NOW', 'python_name': 'NOW', 'value': 481},
+                                         {   'documentation': {'description': 'Fetch data starting at the first point sampled by the digitizer.'},
+                                             'name': 'NISCOPE_VAL_START',
+                                             'python_name': 'START',
+                                             'value': 482},
+                                         {'documentation': {'description': 'Fetch at the first posttrigger sample.'}, 'name': 'NISCOPE_VAL_TRIGGER', 'python_name': 'TRIGGER', 'value': 483}]},
+    'FilterType': {   'codegen_method': 'public',
+                      'python_name': 'FilterType',
+                      'values': [   {'documentation': {'description': 'Specifies lowpass as the filter type.'}, 'name': 'LOWPASS', 'python_name': 'LOWPASS', 'value': 0},
+                                    {'documentation': {'description': 'Specifies highpass as the filter type.'}, 'name': 'HIGHPASS', 'python_name': 'HIGHPASS', 'value': 1},
+                                    {'documentation': {'description': 'Specifies bandpass as the filter type.'}, 'name': 'BANDPASS', 'python_name': 'BANDPASS', 'value': 2},
+                                    {'documentation': {'description': 'Specifies bandstop as the filter type.'}, 'name': 'BANDSTOP', 'python_name': 'BANDSTOP', 'value': 3}]},
+    'FlexFIRAntialiasFilterType': {   'codegen_method': 'public',
+                                      'python_name': 'FlexFIRAntialiasFilterType',
+                                      'values': [   {   'documentation': {'description': 'This filter is optimized for alias protection and frequency-domain flatness'},
+                                                        'name': 'NISCOPE_VAL_48_TAP_STANDARD',
+                                                        'python_name': '_48_TAP_STANDARD',
+                                                        'value': 0},
+                                                    {   'documentation': {'description': 'This filter is optimized for the lowest possible bandwidth for a 48 tap filter and maximizes the SNR'},
+                                                        'name': 'NISCOPE_VAL_48_TAP_HANNING',
+                                                        'python_name': '_48_TAP_HANNING',
+                                                        'value': 1},
+                                                    {   'documentation': {'description': 'This filter is optimized for the lowest possible bandwidth for a 16 tap filter and maximizes the SNR'},
+                                                        'name': 'NISCOPE_VAL_16_TAP_HANNING',
+                                                        'python_name': '_16_TAP_HANNING',
+                                                        'value': 2},
+                                                    {   'documentation': {'description': 'This filter is optimized for the lowest possible bandwidth for a 8 tap filter and maximizes the SNR'},
+                                                        'name': 'NISCOPE_VAL_8_TAP_HANNING',
+                                                        'python_name': '_8_TAP_HANNING',
+                                                        'value': 3}]},
+    'NotificationType': {   'codegen_method': 'no',
+                            'python_name': 'NotificationType',
+                            'values': [   {'documentation': {'description': 'Never send notification.'}, 'name': 'NISCOPE_VAL_NOTIFY_NEVER', 'prefix': 'NOTIFY_', 'python_name': 'NEVER', 'value': 0},
+                                          {   'documentation': {'description': 'Notify when digitizer acquisition is done.'},
+                                              'name': 'NISCOPE_VAL_NOTIFY_DONE',
+                                              'prefix': 'NOTIFY_',
+                                              'python_name': 'DONE',
+                                              'value': 1}]},
+    'Option': {   'codegen_method': 'public',
+                  'python_name': 'Option',
+                  'values': [   {   'documentation': {'description': 'Self Calibrating all Channels'},
+                                    'name': 'NISCOPE_VAL_SELF_CALIBRATE_ALL_CHANNELS',
+                                    'python_name': 'SELF_CALIBRATE_ALL_CHANNELS',
+                                    'value': 0},
+                                {   'documentation': {'description': 'Restore External Calibration.'},
+                                    'name': 'NISCOPE_VAL_RESTORE_EXTERNAL_CALIBRATION',
+                                    'python_name': 'RESTORE_EXTERNAL_CALIBRATION',
+                                    'value': 1}]},
+    'OverflowErrorReporting': {   'codegen_method': 'public',
+                                  'python_name': 'OverflowErrorReporting',
+                                  'values': [   {   'documentation': {'description': '\nExecution stops and NI-SCOPE returns an error when an overflow has\noccurred in the OSP block.\n'},
+                                                    'name': 'NISCOPE_VAL_ERROR_REPORTING_ERROR',
+                                                    'prefix': 'ERROR_REPORTING_',
+                                                    'python_name': 'ERROR',
+                                                    'value': 0},
+                                                {   'documentation': {'description': '\nExecution continues and NI-SCOPE returns a warning when an overflow has\noccurred in the OSP block.\n'},
+                                                    'name': 'NISCOPE_VAL_ERROR_REPORTING_WARNING',
+                                                    'prefix': 'ERROR_REPORTING_',
+                                                    'python_name': 'WARNING',
+                                                    'value': 1},
+                                                {   'documentation': {'description': '\nNI-SCOPE does not return an error when an overflow has occurred in the\nOSP block.\n'},
+                                                    'name': 'NISCOPE_VAL_ERROR_REPORTING_DISABLED',
+                                                    'prefix': 'ERROR_REPORTING_',
+                                                    'python_name': 'DISABLED',
+                                                    'value': 2}]},
+    'PercentageMethod': {   'codegen_method': 'public',
+                            'python_name': 'PercentageMethod',
+                            'values': [   {   'documentation': {'description': '\nSpecifies that the reference level percentages should be computed using\nthe low/high method,\n'},
+                                              'name': 'LOWHIGH',
+                                              'python_name': 'LOWHIGH',
+                                              'value': 0},
+                                          {   'documentation': {'description': 'Reference level percentages are computed using the min/max method.'},
+                                              'name': 'MINMAX',
+                                              'python_name': 'MINMAX',
+                                              'value': 1},
+                                          {   'documentation': {'description': 'Reference level percentages are computed using the base/top method.'},
+                                              'name': 'BASETOP',
+                                              'python_name': 'BASETOP',
+                                              'value': 2}]},
+    'ProgFIRFilterRealComplex': {   'codegen_method': 'no',
+                                    'python_name': 'ProgFIRFilterRealComplex',
+                                    'values': [   {'documentation': {'description': 'Sets a dual real filter.'}, 'name': 'REAL', 'python_name': 'REAL', 'value': 0},
+                                                  {'documentation': {'description': 'Sets a complex filter.'}, 'name': 'COMPLEX', 'python_name': 'COMPLEX', 'value': 1}]},
+    'ProgFIRFilterSymmetry': {   'codegen_method': 'no',
+                                 'python_name': 'ProgFIRFilterSymmetry',
+                                 'values': [   {'documentation': {'description': 'Sets a symmetric filter.'}, 'name': 'NISCOPE_VAL_SYMMETRIC', 'python_name': 'SYMMETRIC', 'value': 0},
+                                               {'documentation': {'description': 'Sets an asymmetric filter.'}, 'name': 'NISCOPE_VAL_ASYMMETRIC', 'python_name': 'ASYMMETRIC', 'value': 1}]},
+    'ProgFIRFilterSymmetryType': {   'codegen_method': 'no',
+                                     'python_name': 'ProgFIRFilterSymmetryType',
+                                     'values': [   {   'documentation': {'description': 'Sets the discriminator FIR symmetry type to even.'},
+                                                       'name': 'NISCOPE_VAL_EVEN',
+                                                       'python_name': 'EVEN',
+                                                       'value': 0},
+                                                   {   'documentation': {'description': 'Sets the discriminator FIR symmetry type to odd.'},
+                                                       'name': 'NISCOPE_VAL_ODD',
+                                                       'python_name': 'ODD',
+                                                       'value': 1}]},
+    'QInputtoCoordConverter': {   'codegen_method': 'no',
+                                  'python_name': 'QInputtoCoordConverter',
+                                  'values': [   {'documentation': {'description': 'Enables the Q input to coordinate converter.'}, 'name': 'I_AND_Q', 'python_name': 'I_AND_Q', 'value': 0},
+                                                {'documentation': {'description': 'Zeroes out the Q input the to coordinate converter.'}, 'name': 'Q_ZEROED', 'python_name': 'Q_ZEROED', 'value': 1}]},
+    'RISMethod': {   'codegen_method': 'public',
+                     'python_name': 'RISMethod',
+                     'values': [   {   'documentation': {   'description': 'Acquires exactly the specified number of records for each bin in the RIS acquisition.  An error is returned from the fetch '
+                                                                           'function if the RIS acquisition does not successfully acquire the specified number of waveforms within the timeout '
+                                                                           'period.  You may call the fetch function again to allow more time for the acquisition to finish.'},
+                                       'name': 'NISCOPE_VAL_RIS_EXACT_NUM_AVERAGES',
+                                       'prefix': 'RIS_',
+                                       'python_name': 'EXACT_NUM_AVERAGES',
+                                       'value': 1},
+                                   {   'documentation': {'description': '\nEach RIS sample is the average of a least a minimum number of randomly\ndistributed points.\n'},
+                                       'name': 'NISCOPE_VAL_RIS_MIN_NUM_AVERAGES',
+                                       'prefix': 'RIS_',
+                                       'python_name': 'MIN_NUM_AVERAGES',
+                                       'value': 2},
+                                   {   'documentation': {   'description': 'Returns the RIS waveform after the specified timeout even if it is incomplete.  If no waveforms have been acquired in '
+                                                                           'certain bins, these bins will have a NaN (when fetching scaled data) or a zero (when fetching binary data). A warning '
+                                                                           '(positive error code) is returned from the fetch function if the RIS acquisition did not finish.  The acquisition aborts '
+                                                                           'when data is returned.'},
+                                       'name': 'NISCOPE_VAL_RIS_INCOMPLETE',
+                                       'prefix': 'RIS_',
+                                       'python_name': 'INCOMPLETE',
+                                       'value': 3},
+                                   {   'documentation': {'description': 'Limits the waveforms in the various bins to be within 200 ps of the center of the bin.'},
+                                       'name': 'NISCOPE_VAL_RIS_LIMITED_BIN_WIDTH',
+                                       'prefix': 'RIS_',
+                                       'python_name': 'LIMITED_BIN_WIDTH',
+                                       'value': 5}]},
+    'RefLevelUnits': {   'codegen_method': 'public',
+                         'python_name': 'RefLevelUnits',
+                         'values': [   {'documentation': {'description': 'Specifies that the reference levels are given in units of volts.'}, 'name': 'VOLTS', 'python_name': 'VOLTS', 'value': 0},
+                                       {   'documentation': {'description': '\n(Default) Specifies that the reference levels are given in percentage\nunits.\n'},
+                                           'name': 'PERCENTAGE',
+                                           'python_name': 'PERCENTAGE',
+                                           'value': 1}]},
+    'RefTriggerDetectorLocation': {   'codegen_method': 'public',
+                                      'python_name': 'RefTriggerDetectorLocation',
+                                      'values': [   {   'documentation': {   'description': 'use the hardware analog circuitry to implement the reference trigger.  This option will trigger before '
+                                                                                            'any onboard signal processing.'},
+                                                        'name': 'NISCOPE_VAL_ANALOG_DETECTION_CIRCUIT',
+                                                        'python_name': 'ANALOG_DETECTION_CIRCUIT',
+                                                        'value': 0},
+                                                    {   'documentation': {   'description': 'use the onboard signal processing logic to implement the reference trigger.  This option will trigger '
+                                                                                            'based on the onboard signal processed data.'},
+                                                        'name': 'NISCOPE_VAL_DDC_OUTPUT',
+                                                        'python_name': 'DDC_OUTPUT',
+                                                        'value': 1}]},
+    'ResamplerFilterMode': {   'codegen_method': 'no',
+                               'python_name': 'ResamplerFilterMode',
+                               'values': [   {'documentation': {'description': 'Resampler enabled.'}, 'name': 'RESAMPLER_ENABLED', 'python_name': 'RESAMPLER_ENABLED', 'value': 1},
+                                             {'documentation': {'description': 'HB 1 enabled.'}, 'name': 'HB_1_ENABLED', 'python_name': 'HB_1_ENABLED', 'value': 2},
+                                             {'documentation': {'description': 'Resampler and HB 1.'}, 'name': 'RESAMPLER_AND_HB_1', 'python_name': 'RESAMPLER_AND_HB_1', 'value': 3},
+                                             {'documentation': {'description': 'Both HB Filters.'}, 'name': 'BOTH_HB_FILTERS', 'python_name': 'BOTH_HB_FILTERS', 'value': 6},
+                                             {   'documentation': {'description': 'Resampler and Both HB Filters.'},
+                                                 'name': 'RESAMPLER_AND_BOTH_HB_FILTERS',
+                                                 'python_name': 'RESAMPLER_AND_BOTH_HB_FILTERS',
+                                                 'value': 7}]},
+    'ScalarMeasurement': {   'codegen_method': 'public',
+                             'python_name': 'ScalarMeasurement',
+                             'values': [   {'documentation': {'description': 'None'}, 'name': 'NISCOPE_VAL_NO_MEASUREMENT', 'python_name': 'NO_MEASUREMENT', 'value': 4000},
+                                           {'name': 'NISCOPE_VAL_FREQUENCY', 'python_name': 'FREQUENCY', 'value': 2},
+                                           {'name': 'NISCOPE_VAL_AVERAGE_FREQUENCY', 'python_name': 'AVERAGE_FREQUENCY', 'value': 1016},
+                                           {'name': 'NISCOPE_VAL_FFT_FREQUENCY', 'python_name': 'FFT_FREQUENCY', 'value': 1008},
+                                           {'name': 'NISCOPE_VAL_PERIOD', 'python_name': 'PERIOD', 'value': 3},
+                                           {'name': 'NISCOPE_VAL_AVERAGE_PERIOD', 'python_name': 'AVERAGE_PERIOD', 'value': 1015},
+                                           {'name': 'NISCOPE_VAL_RISE_TIME', 'python_name': 'RISE_TIME', 'value': 0},
+                                           {'name': 'NISCOPE_VAL_FALL_TIME', 'python_name': 'FALL_TIME', 'value': 1},
+                                           {'name': 'NISCOPE_VAL_RISE_SLEW_RATE', 'python_name': 'RISE_SLEW_RATE', 'value': 1010},
+                                           {'name': 'NISCOPE_VAL_FALL_SLEW_RATE', 'python_name': 'FALL_SLEW_RATE', 'value': 1011},
+                                           {'name': 'NISCOPE_VAL_OVERSHOOT', 'python_name': 'OVERSHOOT', 'value': 18},
+                                           {'name': 'NISCOPE_VAL_PRESHOOT', 'python_name': 'PRESHOOT', 'value': 19},
+                                           {'name': 'NISCOPE_VAL_VOLTAGE_RMS', 'python_name': 'VOLTAGE_RMS', 'value': 4},
+                                           {'name': 'NISCOPE_VAL_VOLTAGE_CYCLE_RMS', 'python_name': 'VOLTAGE_CYCLE_RMS', 'value': 16},
+                                           {'name': 'NISCOPE_VAL_AC_ESTIMATE', 'python_name': 'AC_ESTIMATE', 'value': 1012},
+                                           {'name': 'NISCOPE_VAL_FFT_AMPLITUDE', 'python_name': 'FFT_AMPLITUDE', 'value': 1009},
+                                           {'name': 'NISCOPE_VAL_VOLTAGE_AVERAGE', 'python_name': 'VOLTAGE_AVERAGE', 'value': 10},
+                                           {'name': 'NISCOPE_VAL_VOLTAGE_CYCLE_AVERAGE', 'python_name': 'VOLTAGE_CYCLE_AVERAGE', 'value': 17},
+                                           {'name': 'NISCOPE_VAL_DC_ESTIMATE', 'python_name': 'DC_ESTIMATE', 'value': 1013},
+                                           {'name': 'NISCOPE_VAL_VOLTAGE_MAX', 'python_name': 'VOLTAGE_MAX', 'value': 6},
+                                           {'name': 'NISCOPE_VAL_VOLTAGE_MIN', 'python_name': 'VOLTAGE_MIN', 'value': 7},
+                                           {'name': 'NISCOPE_VAL_VOLTAGE_PEAK_TO_PEAK', 'python_name': 'VOLTAGE_PEAK_TO_PEAK', 'value': 5},
+                                           {'name': 'NISCOPE_VAL_VOLTAGE_HIGH', 'python_name': 'VOLTAGE_HIGH', 'value': 8},
+                                           {'name': 'NISCOPE_VAL_VOLTAGE_LOW', 'python_name': 'VOLTAGE_LOW', 'value': 9},
+                                           {'name': 'NISCOPE_VAL_AMPLITUDE', 'python_name': 'AMPLITUDE', 'value': 15},
+                                           {'name': 'NISCOPE_VAL_VOLTAGE_TOP', 'python_name': 'VOLTAGE_TOP', 'value': 1007},
+                                           {'name': 'NISCOPE_VAL_VOLTAGE_BASE', 'python_name': 'VOLTAGE_BASE', 'value': 1006},
+                                           {'name': 'NISCOPE_VAL_VOLTAGE_BASE_TO_TOP', 'python_name': 'VOLTAGE_BASE_TO_TOP', 'value': 1017},
+                                           {'name': 'NISCOPE_VAL_WIDTH_NEG', 'python_name': 'WIDTH_NEG', 'value': 11},
+                                           {'name': 'NISCOPE_VAL_WIDTH_POS', 'python_name': 'WIDTH_POS', 'value': 12},
+                                           {'name': 'NISCOPE_VAL_DUTY_CYCLE_NEG', 'python_name': 'DUTY_CYCLE_NEG', 'value': 13},
+                                           {'name': 'NISCOPE_VAL_DUTY_CYCLE_POS', 'python_name': 'DUTY_CYCLE_POS', 'value': 14},
+                                           {'name': 'NISCOPE_VAL_INTEGRAL', 'python_name': 'INTEGRAL', 'value': 1005},
+                                           {'name': 'NISCOPE_VAL_AREA', 'python_name': 'AREA', 'value': 1003},
+                                           {'name': 'NISCOPE_VAL_CYCLE_AREA', 'python_name': 'CYCLE_AREA', 'value': 1004},
+                                           {'name': 'NISCOPE_VAL_TIME_DELAY', 'python_name': 'TIME_DELAY', 'value': 1014},
+                                           {'name': 'NISCOPE_VAL_PHASE_DELAY', 'python_name': 'PHASE_DELAY', 'value': 1018},
+                                           {'name': 'NISCOPE_VAL_LOW_REF_VOLTS', 'python_name': 'LOW_REF_VOLTS', 'value': 1000},
+                                           {'name': 'NISCOPE_VAL_MID_REF_VOLTS', 'python_name': 'MID_REF_VOLTS', 'value': 1001},
+                                           {'name': 'NISCOPE_VAL_HIGH_REF_VOLTS', 'python_name': 'HIGH_REF_VOLTS', 'value': 1002},
+                                           {'name': 'NISCOPE_VAL_VOLTAGE_HISTOGRAM_MEAN', 'python_name': 'VOLTAGE_HISTOGRAM_MEAN', 'value': 2000},
+                                           {'name': 'NISCOPE_VAL_VOLTAGE_HISTOGRAM_STDEV', 'python_name': 'VOLTAGE_HISTOGRAM_STDEV', 'value': 2001},
+                                           {'name': 'NISCOPE_VAL_VOLTAGE_HISTOGRAM_MEDIAN', 'python_name': 'VOLTAGE_HISTOGRAM_MEDIAN', 'value': 2003},
+                                           {'name': 'NISCOPE_VAL_VOLTAGE_HISTOGRAM_MODE', 'python_name': 'VOLTAGE_HISTOGRAM_MODE', 'value': 2010},
+                                           {'name': 'NISCOPE_VAL_VOLTAGE_HISTOGRAM_MAX', 'python_name': 'VOLTAGE_HISTOGRAM_MAX', 'value': 2005},
+                                           {'name': 'NISCOPE_VAL_VOLTAGE_HISTOGRAM_MIN', 'python_name': 'VOLTAGE_HISTOGRAM_MIN', 'value': 2006},
+                                           {'name': 'NISCOPE_VAL_VOLTAGE_HISTOGRAM_PEAK_TO_PEAK', 'python_name': 'VOLTAGE_HISTOGRAM_PEAK_TO_PEAK', 'value': 2002},
+                                           {'name': 'NISCOPE_VAL_VOLTAGE_HISTOGRAM_MEAN_PLUS_STDEV', 'python_name': 'VOLTAGE_HISTOGRAM_MEAN_PLUS_STDEV', 'value': 2007},
+                                           {'name': 'NISCOPE_VAL_VOLTAGE_HISTOGRAM_MEAN_PLUS_2_STDEV', 'python_name': 'VOLTAGE_HISTOGRAM_MEAN_PLUS_2_STDEV', 'value': 2008},
+                                           {'name': 'NISCOPE_VAL_VOLTAGE_HISTOGRAM_MEAN_PLUS_3_STDEV', 'python_name': 'VOLTAGE_HISTOGRAM_MEAN_PLUS_3_STDEV', 'value': 2009},
+                                           {'name': 'NISCOPE_VAL_VOLTAGE_HISTOGRAM_HITS', 'python_name': 'VOLTAGE_HISTOGRAM_HITS', 'value': 2004},
+                                           {'name': 'NISCOPE_VAL_VOLTAGE_HISTOGRAM_NEW_HITS', 'python_name': 'VOLTAGE_HISTOGRAM_NEW_HITS', 'value': 2011},
+                                           {'name': 'NISCOPE_VAL_TIME_HISTOGRAM_MEAN', 'python_name': 'TIME_HISTOGRAM_MEAN', 'value': 3000},
+                                           {'name': 'NISCOPE_VAL_TIME_HISTOGRAM_STDEV', 'python_name': 'TIME_HISTOGRAM_STDEV', 'value': 3001},
+                                           {'name': 'NISCOPE_VAL_TIME_HISTOGRAM_MEDIAN', 'python_name': 'TIME_HISTOGRAM_MEDIAN', 'value': 3003},
+                                           {'name': 'NISCOPE_VAL_TIME_HISTOGRAM_MODE', 'python_name': 'TIME_HISTOGRAM_MODE', 'value': 3010},
+                                           {'name': 'NISCOPE_VAL_TIME_HISTOGRAM_MAX', 'python_name': 'TIME_HISTOGRAM_MAX', 'value': 3005},
+                                           {'name': 'NISCOPE_VAL_TIME_HISTOGRAM_MIN', 'python_name': 'TIME_HISTOGRAM_MIN', 'value': 3006},
+                                           {'name': 'NISCOPE_VAL_TIME_HISTOGRAM_PEAK_TO_PEAK', 'python_name': 'TIME_HISTOGRAM_PEAK_TO_PEAK', 'value': 3002},
+                                           {'name': 'NISCOPE_VAL_TIME_HISTOGRAM_MEAN_PLUS_STDEV', 'python_name': 'TIME_HISTOGRAM_MEAN_PLUS_STDEV', 'value': 3008},
+                                           {'name': 'NISCOPE_VAL_TIME_HISTOGRAM_MEAN_PLUS_2_STDEV', 'python_name': 'TIME_HISTOGRAM_MEAN_PLUS_2_STDEV', 'value': 3009},
+                                           {'name': 'NISCOPE_VAL_TIME_HISTOGRAM_HITS', 'python_name': 'TIME_HISTOGRAM_HITS', 'value': 3004},
+                                           {'name': 'NISCOPE_VAL_TIME_HISTOGRAM_NEW_HITS', 'python_name': 'TIME_HISTOGRAM_NEW_HITS', 'value': 3011}]},
+    'StreamingPositionType': {   'codegen_method': 'public',
+                                 'python_name': 'StreamingPositionType',
+                                 'values': [   {   'documentation': {'description': 'Data is streamed from the start trigger.'},
+                                                   'name': 'START_TRIGGER',
+                                                   'python_name': 'START',
+                                                   'suffix': '_TRIGGER',
+                                                   'value': 0},
+                                               {   'documentation': {'description': '\nData is streamed relative to the reference trigger and reference\nposition.\n'},
+                                                   'name': 'REFERENCE_TRIGGER',
+                                                   'python_name': 'REFERENCE',
+                                                   'suffix': '_TRIGGER',
+                                                   'value': 1},
+                                               {   'documentation': {'description': 'Data is streamed relative to the sync trigger and reference position.'},
+                                                   'name': 'SYNC_TRIGGER',
+                                                   'python_name': 'SYNC',
+                                                   'suffix': '_TRIGGER',
+                                                   'value': 2}]},
+    'SyncoutCLKSelect': {   'codegen_method': 'no',
+                            'python_name': 'SyncoutCLKSelect',
+                            'values': [   {'documentation': {'description': 'Specifies CLKIN as the source for Syncout CLK.'}, 'name': 'CLKIN', 'python_name': 'CLKIN', 'value': 0},
+                                          {'documentation': {'description': 'Specifies PROCCLK as the source for Syncout CLK.'}, 'name': 'PROCCLK', 'python_name': 'PROCCLK', 'value': 1}]},
+    'TerminalConfiguration': {   'codegen_method': 'public',
+                                 'python_name': 'TerminalConfiguration',
+                                 'values': [   {'documentation': {'description': 'Channel is single ended'}, 'name': 'NISCOPE_VAL_SINGLE_ENDED', 'python_name': 'SINGLE_ENDED', 'value': 0},
+                                               {   'documentation': {'description': 'Channel is unbalanced differential'},
+                                                   'name': 'NISCOPE_VAL_UNBALANCED_DIFFERENTIAL',
+                                                   'python_name': 'UNBALANCED_DIFFERENTIAL',
+                                                   'value': 1},
+                                               {'documentation': {'description': 'Channel is differential'}, 'name': 'NISCOPE_VAL_DIFFERENTIAL', 'python_name': 'DIFFERENTIAL', 'value': 2}]},
+    'TimingNCOFreqOffsetBits': {   'codegen_method': 'no',
+                                   'python_name': 'TimingNCOFreqOffsetBits',
+                                   'values': [   {   'documentation': {'description': 'Specifies 8 offset bits in the timing NCO.'},
+                                                     'name': '_8_BITS',
+                                                     'python_name': '_8',
+                                                     'suffix': '_BITS',
+                                                     'value': 0},
+                                                 {   'documentation': {'description': 'Specifies 16 offset bits in the timing NCO.'},
+                                                     'name': '_16_BITS',
+                                                     'python_name': '_16',
+                                                     'suffix': '_BITS',
+                                                     'value': 1},
+                                                 {   'documentation': {'description': 'Specifies 24 offset bits in the timing NCO.'},
+                                                     'name': '_24_BITS',
+                                                     'python_name': '_24',
+                                                     'suffix': '_BITS',
+                                                     'value': 2},
+                                                 {   'documentation': {'description': 'Specifies 32 offset bits in the timing NCO.'},
+                                                     'name': '_32_BITS',
+                                                     'python_name': '_32',
+                                                     'suffix': '_BITS',
+                                                     'value': 3}]},
+    'TriggerCoupling': {   'codegen_method': 'public',
+                           'python_name': 'TriggerCoupling',
+                           'values': [   {'documentation': {'description': 'AC coupling'}, 'name': 'NISCOPE_VAL_AC', 'python_name': 'AC', 'value': 0},
+                                         {'documentation': {'description': 'DC coupling'}, 'name': 'NISCOPE_VAL_DC', 'python_name': 'DC', 'value': 1},
+                                         {'documentation': {'description': 'Highpass filter coupling'}, 'name': 'NISCOPE_VAL_HF_REJECT', 'python_name': 'HF_REJECT', 'value': 2},
+                                         {'documentation': {'description': 'Lowpass filter coupling'}, 'name': 'NISCOPE_VAL_LF_REJECT', 'python_name': 'LF_REJECT', 'value': 3},
+                                         {   'documentation': {'description': 'Highpass and lowpass filter coupling'},
+                                             'name': 'NISCOPE_VAL_AC_PLUS_HF_REJECT',
+                                             'python_name': 'AC_PLUS_HF_REJECT',
+                                             'value': 1001}]},
+    'TriggerModifier': {   'codegen_method': 'public',
+                           'python_name': 'TriggerModifier',
+                           'values': [   {'documentation': {'description': 'Normal triggering.'}, 'name': 'NISCOPE_VAL_NO_TRIGGER_MOD', 'python_name': 'NO_TRIGGER_MOD', 'value': 1},
+                                         {   'documentation': {'description': '\nSoftware will trigger an acquisition automatically if no trigger arrives\nafter a certain amount of time.\n'},
+                                             'name': 'NISCOPE_VAL_AUTO',
+                                             'python_name': 'AUTO',
+                                             'value': 2}]},
+    'TriggerSlope': {   'codegen_method': 'public',
+                        'python_name': 'TriggerSlope',
+                        'values': [   {'documentation': {'description': 'Falling edge'}, 'name': 'NISCOPE_VAL_NEGATIVE', 'python_name': 'NEGATIVE', 'value': 0},
+                                      {'documentation': {'description': 'Rising edge'}, 'name': 'NISCOPE_VAL_POSITIVE', 'python_name': 'POSITIVE', 'value': 1}]},
+    'TriggerType': {   'codegen_method': 'public',
+                       'python_name': 'TriggerType',
+                       'values': [   {   'documentation': {   'description': 'Configures the digitizer for edge triggering.  An edge trigger occurs when the trigger signal crosses the trigger level '
+                                                                             'specified with the set trigger slope.  You configure the trigger level and slope with niScope_ConfigureTriggerEdge.'},
+                                         'name': 'NISCOPE_VAL_EDGE_TRIGGER',
+                                         'python_name': 'EDGE',
+                                         'suffix': '_TRIGGER',
+                                         'value': 1},
+                                     {   'documentation': {   'description': 'Configures the digitizer for video/TV triggering.   You configure the video trigger parameters like signal Format, Line '
+                                                                             'to trigger off of, Polarity, and Enable DC Restore with niScope_ConfigureTriggerVideo.'},
+                                         'name': 'NISCOPE_VAL_TV_TRIGGER',
+                                         'python_name': 'TV',
+                                         'suffix': '_TRIGGER',
+                                         'value': 5},
+                                     {   'documentation': {   'description': 'Configures the digitizer for immediate triggering.   An immediate trigger occurs as soon as the pretrigger samples are '
+                                                                             'acquired.'},
+                                         'name': 'NISCOPE_VAL_IMMEDIATE_TRIGGER',
+                                         'python_name': 'IMMEDIATE',
+                                         'suffix': '_TRIGGER',
+                                         'value': 6},
+                                     {   'documentation': {   'description': 'Configures the digitizer for hysteresis triggering.  A hysteresis trigger occurs when the trigger signal crosses the '
+                                                                             'trigger level with the specified slope and passes through the hysteresis window you specify. You configure the trigger '
+                                                                             'level, slope, and hysteresis with niScope_ConfigureTriggerHysteresis.'},
+                                         'name': 'NISCOPE_VAL_HYSTERESIS_TRIGGER',
+                                         'python_name': 'HYSTERESIS',
+                                         'suffix': '_TRIGGER',
+                                         'value': 1001},
+                                     {   'documentation': {   'description': 'Configures the digitizer for digital triggering. A digital trigger occurs when the trigger signal has the specified '
+                                                                             'slope. You configure the trigger slope with niScope_ConfigureTriggerDigital.'},
+                                         'name': 'NISCOPE_VAL_DIGITAL_TRIGGER',
+                                         'python_name': 'DIGITAL',
+                                         'suffix': '_TRIGGER',
+                                         'value': 1002},
+                                     {   'documentation': {   'description': 'Configures the digitizer for window triggering.  A window trigger occurs when the trigger signal enters or leaves the '
+                                                                             'window defined by the values you specify with the Low Window Level, High Window Level, and Window Mode Parameters.  You '
+                                                                             'configure the low window level high window level, and window mode with niScope_ConfigureTriggerWindow.'},
+                                         'name': 'NISCOPE_VAL_WINDOW_TRIGGER',
+                                         'python_name': 'WINDOW',
+                                         'suffix': '_TRIGGER',
+                                         'value': 1003},
+                                     {   'documentation': {'description': 'Configures the digitizer for software triggering.  A software trigger occurs when niScope_SendSoftwareTrigger is called.'},
+                                         'name': 'NISCOPE_VAL_SOFTWARE_TRIGGER',
+                                         'python_name': 'SOFTWARE',
+                                         'suffix': '_TRIGGER',
+                                         'value': 1004}]},
+    'TriggerWindowMode': {   'codegen_method': 'public',
+                             'python_name': 'TriggerWindowMode',
+                             'values': [   {   'documentation': {'description': 'Trigger upon entering the window'},
+                                               'name': 'NISCOPE_VAL_ENTERING_WINDOW',
+                                               'python_name': 'ENTERING',
+                                               'suffix': '_WINDOW',
+                                               'value': 0},
+                                           {   'documentation': {'description': 'Trigger upon leaving the window'},
+                                               'name': 'NISCOPE_VAL_LEAVING_WINDOW',
+                                               'python_name': 'LEAVING',
+                                               'suffix': '_WINDOW',
+                                               'value': 1}]},
+    'VerticalCoupling': {   'codegen_method': 'public',
+                            'python_name': 'VerticalCoupling',
+                            'values': [   {'documentation': {'description': 'AC coupling'}, 'name': 'NISCOPE_VAL_AC', 'python_name': 'AC', 'value': 0},
+                                          {'documentation': {'description': 'DC coupling'}, 'name': 'NISCOPE_VAL_DC', 'python_name': 'DC', 'value': 1},
+                                          {'documentation': {'description': 'GND coupling'}, 'name': 'NISCOPE_VAL_GND', 'python_name': 'GND', 'value': 2}]},
+    'VideoPolarity': {   'codegen_method': 'public',
+                         'python_name': 'VideoPolarity',
+                         'values': [   {   'documentation': {'description': 'Specifies that the video signal has positive polarity.'},
+                                           'name': 'NISCOPE_VAL_TV_POSITIVE',
+                                           'prefix': 'TV_',
+                                           'python_name': 'POSITIVE',
+                                           'value': 1},
+                                       {   'documentation': {'description': 'Specifies that the video signal has negative polarity.'},
+                                           'name': 'NISCOPE_VAL_TV_NEGATIVE',
+                                           'prefix': 'TV_',
+                                           'python_name': 'NEGATIVE',
+                                           'value': 2}]},
+    'VideoSignalFormat': {   'codegen_method': 'public',
+                             'python_name': 'VideoSignalFormat',
+                             'values': [   {'documentation': {'description': 'NTSC signal format supports line numbers from 1 to 525'}, 'name': 'NISCOPE_VAL_NTSC', 'python_name': 'NTSC', 'value': 1},
+                                           {'documentation': {'description': 'PAL signal format supports line numbers from 1 to 625'}, 'name': 'NISCOPE_VAL_PAL', 'python_name': 'PAL', 'value': 2},
+                                           {   'documentation': {'description': 'SECAM signal format supports line numbers from 1 to 625'},
+                                               'name': 'NISCOPE_VAL_SECAM',
+                                               'python_name': 'SECAM',
+                                               'value': 3},
+                                           {   'documentation': {'description': 'M-PAL signal format supports line numbers from 1 to 525'},
+                                               'name': 'NISCOPE_VAL_M_PAL',
+                                               'python_name': 'M_PAL',
+                                               'value': 1001},
+                                           {   'documentation': {'description': '480 lines, interlaced, 59.94 fields per second'},
+                                               'name': 'NISCOPE_VAL_480I_59_94_FIELDS_PER_SECOND',
+                                               'python_name': '_480I_59_94_FIELDS_PER_SECOND',
+                                               'value': 1010},
+                                           {   'documentation': {'description': '480 lines, interlaced, 60 fields per second'},
+                                               'name': 'NISCOPE_VAL_480I_60_FIELDS_PER_SECOND',
+                                               'python_name': '_480I_60_FIELDS_PER_SECOND',
+                                               'value': 1011},
+                                           {   'documentation': {'description': '480 lines, progressive, 59.94 frames per second'},
+                                               'name': 'NISCOPE_VAL_480P_59_94_FRAMES_PER_SECOND',
+                                               'python_name': '_480P_59_94_FRAMES_PER_SECOND',
+                                               'value': 1015},
+                                           {   'documentation': {'description': '480 lines, progressive,60 frames per second'},
+                                               'name': 'NISCOPE_VAL_480P_60_FRAMES_PER_SECOND',
+                                               'python_name': '_480P_60_FRAMES_PER_SECOND',
+                                               'value': 1016},
+                                           {   'documentation': {'description': '576 lines, interlaced, 50 fields per second'},
+                                               'name': 'NISCOPE_VAL_576I_50_FIELDS_PER_SECOND',
+                                               'python_name': '_576I_50_FIELDS_PER_SECOND',
+                                               'value': 1020},
+                                           {   'documentation': {'description': '576 lines, progressive, 50 frames per second'},
+                                               'name': 'NISCOPE_VAL_576P_50_FRAMES_PER_SECOND',
+                                               'python_name': '_576P_50_FRAMES_PER_SECOND',
+                                               'value': 1025},
+                                           {   'documentation': {'description': '720 lines, progressive, 50 frames per second'},
+                                               'name': 'NISCOPE_VAL_720P_50_FRAMES_PER_SECOND',
+                                               'python_name': '_720P_50_FRAMES_PER_SECOND',
+                                               'value': 1031},
+                                           {   'documentation': {'description': '720 lines, progressive, 59.94 frames per second'},
+                                               'name': 'NISCOPE_VAL_720P_59_94_FRAMES_PER_SECOND',
+                                               'python_name': '_720P_59_94_FRAMES_PER_SECOND',
+                                               'value': 1032},
+                                           {   'documentation': {'description': '720 lines, progressive, 60 frames per second'},
+                                               'name': 'NISCOPE_VAL_720P_60_FRAMES_PER_SECOND',
+                                               'python_name': '_720P_60_FRAMES_PER_SECOND',
+                                               'value': 1033},
+                                           {   'documentation': {'description': '1,080 lines, interlaced, 50 fields per second'},
+                                               'name': 'NISCOPE_VAL_1080I_50_FIELDS_PER_SECOND',
+                                               'python_name': '_1080I_50_FIELDS_PER_SECOND',
+                                               'value': 1040},
+                                           {   'documentation': {'description': '1,080 lines, interlaced, 59.94 fields per second'},
+                                               'name': 'NISCOPE_VAL_1080I_59_94_FIELDS_PER_SECOND',
+                                               'python_name': '_1080I_59_94_FIELDS_PER_SECOND',
+                                               'value': 1041},
+                                           {   'documentation': {'description': '1,080 lines, interlaced, 60 fields per second'},
+                                               'name': 'NISCOPE_VAL_1080I_60_FIELDS_PER_SECOND',
+                                               'python_name': '_1080I_60_FIELDS_PER_SECOND',
+                                               'value': 1042},
+                                           {   'documentation': {'description': '1,080 lines, progressive, 24 frames per second'},
+                                               'name': 'NISCOPE_VAL_1080P_24_FRAMES_PER_SECOND',
+                                               'python_name': '_1080P_24_FRAMES_PER_SECOND',
+                                               'value': 1045}]},
+    'VideoTriggerEvent': {   'codegen_method': 'public',
+                             'python_name': 'VideoTriggerEvent',
+                             'values': [   {   'documentation': {'description': 'Trigger on field 1 of the signal'},
+                                               'name': 'NISCOPE_VAL_TV_EVENT_FIELD1',
+                                               'prefix': 'TV_EVENT_',
+                                               'python_name': 'FIELD1',
+                                               'value': 1},
+                                           {   'documentation': {'description': 'Trigger on field 2 of the signal'},
+                                               'name': 'NISCOPE_VAL_TV_EVENT_FIELD2',
+                                               'prefix': 'TV_EVENT_',
+                                               'python_name': 'FIELD2',
+                                               'value': 2},
+                                           {   'documentation': {'description': 'Trigger on the first field acquired'},
+                                               'name': 'NISCOPE_VAL_TV_EVENT_ANY_FIELD',
+                                               'prefix': 'TV_EVENT_',
+                                               'python_name': 'ANY_FIELD',
+                                               'value': 3},
+                                           {   'documentation': {'description': 'Trigger on the first line acquired'},
+                                               'name': 'NISCOPE_VAL_TV_EVENT_ANY_LINE',
+                                               'prefix': 'TV_EVENT_',
+                                               'python_name': 'ANY_LINE',
+                                               'value': 4},
+                                           {   'documentation': {'description': 'Trigger on a specific line of a video signal.  Valid values vary depending on the signal format configured.'},
+                                               'name': 'NISCOPE_VAL_TV_EVENT_LINE_NUMBER',
+                                               'prefix': 'TV_EVENT_',
+                                               'python_name': 'LINE_NUMBER',
+                                               'value': 5}]},
+    'WhichTrigger': {   'codegen_method': 'public',
+                        'python_name': 'WhichTrigger',
+                        'values': [   {'name': 'NISCOPE_VAL_SOFTWARE_TRIGGER_START', 'prefix': 'SOFTWARE_TRIGGER_', 'python_name': 'START', 'value': 0},
+                                      {'name': 'NISCOPE_VAL_SOFTWARE_TRIGGER_ARM_REFERENCE', 'prefix': 'SOFTWARE_TRIGGER_', 'python_name': 'ARM_REFERENCE', 'value': 1},
+                                      {'name': 'NISCOPE_VAL_SOFTWARE_TRIGGER_REFERENCE', 'prefix': 'SOFTWARE_TRIGGER_', 'python_name': 'REFERENCE', 'value': 2},
+                                      {'name': 'NISCOPE_VAL_SOFTWARE_TRIGGER_ADVANCE', 'prefix': 'SOFTWARE_TRIGGER_', 'python_name': 'ADVANCE', 'value': 3}]}}
\ No newline at end of file
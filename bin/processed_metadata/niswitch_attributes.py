@@ -0,0 +1,975 @@
+attributes =
+{   1050002: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies whether to validate attribute values and function parameters.   If enabled, the instrument driver validates the parameter values that  '
+                                                     'you pass to driver functions.  Range checking  parameters is very useful for debugging.  After you validate your program,  you can set this '
+                                                     'attribute to VI_FALSE to disable range checking and  maximize performance.\n'
+                                                     'The default value is VI_TRUE.   Use the niSwitch_InitWithOptions  function to override this value.\n',
+                                      'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:User Options:Range Check',
+                 'name': 'RANGE_CHECK',
+                 'python_name': 'range_check',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1050003: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies whether the instrument driver queries the instrument status  after each operation.  Querying the instrument status is very useful for  '
+                                                     'debugging.  After you validate your program, you can set this attribute to  VI_FALSE to disable status checking and maximize performance\n'
+                                                     'The instrument driver can choose to ignore status checking for  particular attributes regardless of the setting of this attribute.\n'
+                                                     'The default value is VI_TRUE.   Use the niSwitch_InitWithOptions  function to override this value.\n',
+                                      'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:User Options:Query Instrument Status',
+                 'name': 'QUERY_INSTRUMENT_STATUS',
+                 'python_name': 'query_instrument_status',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1050004: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies whether to cache the value of attributes.  When caching is  enabled, the instrument driver keeps track of the current instrument  '
+                                                     'settings and avoids sending redundant commands to the instrument.\n'
+                                                     'The instrument driver can choose always to cache or never to cache  particular attributes regardless of the setting of this attribute.\n'
+                                                     'The default value is VI_TRUE.   Use the niSwitch_InitWithOptions  function to override this value.\n',
+                                      'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:User Options:Cache',
+                 'name': 'CACHE',
+                 'python_name': 'cache',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1050005: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies whether or not to simulate instrument driver I/O operations.  If  simulation is enabled, instrument driver functions perform range '
+                                                     'checking  and call Ivi_GetAttribute and Ivi_SetAttribute functions, but they do not  perform instrument I/O.  For output parameters that '
+                                                     'represent instrument  data, the instrument driver functions return calculated values.\n'
+                                                     'The default value is VI_FALSE.   Use the niSwitch_InitWithOptions  function to override this value.\n',
+                                      'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:User Options:Simulate',
+                 'name': 'SIMULATE',
+                 'python_name': 'simulate',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1050006: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies whether the IVI engine keeps a list of  the value coercions it makes for ViInt32 and ViReal64 attributes.   You call '
+                                                     'niSwitch_GetNextCoercionRecord to extract and delete the oldest  coercion record from the list.\n'
+                                                     'The default value is VI_FALSE.   Use the  niSwitch_InitWithOptions function to override this value.\n',
+                                      'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:User Options:Record Value Coercions',
+                 'name': 'RECORD_COERCIONS',
+                 'python_name': 'record_coercions',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1050007: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'This attribute indicates the Driver Setup string that the user  specified when initializing the driver.\n'
+                                                     'Some cases exist where the end-user must specify instrument driver  options at initialization time.  An example of this is specifying  a '
+                                                     'particular instrument model from among a family of instruments  that the driver supports.  This is useful when using simulation.   The end-user '
+                                                     'can specify driver-specific options through  the DriverSetup keyword in the optionsString parameter to the  niSwitch_InitWithOptions function, '
+                                                     'or through the IVI Configuration Utility.\n'
+                                                     'If the user does not specify a Driver Setup string, this attribute returns an empty string.\n',
+                                      'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Advanced Session Information:Driver Setup',
+                 'name': 'DRIVER_SETUP',
+                 'python_name': 'driver_setup',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1050021: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Specifies whether to perform interchangeability checking and retrieve  interchangeability warnings when you call  niSwitch_Connect, '
+                                                     'niSwitch_SetPath and niSwitch_InitiateScan functions.\n'
+                                                     'The default value is VI_FALSE.\n'
+                                                     'Interchangeability warnings indicate that using your application with a  different instrument might cause different behavior.   You call '
+                                                     'niSwitch_GetNextInterchangeWarning to extract interchange warnings.   Call the niSwitch_ClearInterchangeWarnings function to clear the list  of '
+                                                     'interchangeability warnings without reading them.\n'
+                                                     'Interchangeability checking examines the attributes in a  capability group only if you specify a value for at least one  attribute within that '
+                                                     'group.  Interchangeability warnings can  occur when an attribute affects the behavior of the instrument and you  have not set that attribute, or '
+                                                     'the attribute has been invalidated since you set it.\n',
+                                      'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:User Options:Interchange Check',
+                 'name': 'INTERCHANGE_CHECK',
+                 'python_name': 'interchange_check',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1050203: {   'access': 'read only',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nIndicates the number of channels that the specific instrument  driver supports.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Driver Capabilities:Channel Count',
+                 'name': 'CHANNEL_COUNT',
+                 'python_name': 'channel_count',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1050302: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'no',
+                 'documentation': {'description': '\nA string that contains the prefix for the instrument driver.  The name of each  user-callable function in this driver starts with this prefix.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Driver Identification:Driver Prefix',
+                 'name': 'SPECIFIC_DRIVER_PREFIX',
+                 'python_name': 'specific_driver_prefix',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1050304: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Indicates the resource descriptor the driver  uses to identify the physical device.\n'
+                                                     'If you initialize the driver with a logical name, this  attribute contains the resource descriptor that corresponds  to the entry in the IVI '
+                                                     'Configuration utility.\n'
+                                                     'If you initialize the instrument driver with the resource  descriptor, this attribute contains that value.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Advanced Session Information:IO Resource Descriptor',
+                 'name': 'IO_RESOURCE_DESCRIPTOR',
+                 'python_name': 'io_resource_descriptor',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1050305: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'A string containing the logical name you specified when opening the  current IVI session.\n'
+                                                     'You may pass a logical name to the niSwitch_init or  niSwitch_InitWithOptions functions.   The IVI Configuration utility must contain an entry '
+                                                     'for the logical name.   The logical name entry refers to a virtual instrument section in the  IVI Configuration file.  The virtual instrument '
+                                                     'section specifies a physical  device and initial user options.\n',
+                                      'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Advanced Session Information:Logical Name',
+                 'name': 'LOGICAL_NAME',
+                 'python_name': 'logical_name',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1050327: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nContains a comma-separated list of supported instrument models.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Driver Capabilities:Supported Instrument Models',
+                 'name': 'SUPPORTED_INSTRUMENT_MODELS',
+                 'python_name': 'supported_instrument_models',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1050401: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nA string that contains a comma-separated list of class-extention groups that  this driver implements.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Driver Capabilities:Class Group Capabilities',
+                 'name': 'GROUP_CAPABILITIES',
+                 'python_name': 'group_capabilities',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1050510: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nA string that contains the firmware revision information  for the instrument you are currently using.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Instrument Identification:Firmware Revision',
+                 'name': 'INSTRUMENT_FIRMWARE_REVISION',
+                 'python_name': 'instrument_firmware_revision',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1050511: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nA string that contains the name of the instrument manufacturer you are currently  using.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Instrument Identification:Manufacturer',
+                 'name': 'INSTRUMENT_MANUFACTURER',
+                 'python_name': 'instrument_manufacturer',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1050512: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nA string that contains the model number or name of the instrument that you  are currently using.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Instrument Identification:Model',
+                 'name': 'INSTRUMENT_MODEL',
+                 'python_name': 'instrument_model',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1050513: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nA string that contains the name of the vendor that supplies this driver.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Driver Identification:Driver Vendor',
+                 'name': 'SPECIFIC_DRIVER_VENDOR',
+                 'python_name': 'specific_driver_vendor',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1050514: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nA string that contains a brief description of the specific  driver.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Driver Identification:Description',
+                 'name': 'SPECIFIC_DRIVER_DESCRIPTION',
+                 'python_name': 'specific_driver_description',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1050515: {   'access': 'read only',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nThe major version number of the IviSwtch class specification.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Driver Identification:Class Specification Major Version',
+                 'name': 'SPECIFIC_DRIVER_CLASS_SPEC_MAJOR_VERSION',
+                 'python_name': 'specific_driver_class_spec_major_version',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1050516: {   'access': 'read only',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nThe minor version number of the class specification with which this driver is compliant.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Driver Identification:Class Specification Minor Version',
+                 'name': 'SPECIFIC_DRIVER_CLASS_SPEC_MINOR_VERSION',
+                 'python_name': 'specific_driver_class_spec_minor_version',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1050551: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nA string that contains additional version information about this  instrument driver.\n'},
+                 'enum': None,
+                 'lv_property': 'Inherent IVI Attributes:Driver Identification:Revision',
+                 'name': 'SPECIFIC_DRIVER_REVISION',
+                 'python_name': 'specific_driver_revision',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1150001: {   'access': 'read only',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'no',
+                 'documentation': {   'description': 'This attribute has been deprecated and may be removed from a future release of  NI-SWITCH.  Use the NISWITCH_ATTR_SERIAL_NUMBER (string flavor) '
+                                                     'instead.'},
+                 'enum': None,
+                 'lv_property': 'Obsolete Attributes:Serial Number',
+                 'name': 'SERIAL_NUMBER_I32',
+                 'python_name': 'serial_number_i32',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150002: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'When a switch device is scanning, the swich can either stop scanning when  the end of the scan (VI_FALSE) or continue scanning from the top of '
+                                                     'the  scan list again (VI_TRUE).\n'
+                                                     'Notice that if you set the scan to continuous (VI_TRUE), the Wait For Scan  Complete operation will always time out and you must call Abort to '
+                                                     'stop  the scan.\n'},
+                 'enum': None,
+                 'lv_property': 'Scanning Configuration:Continuous Scan',
+                 'name': 'CONTINUOUS_SCAN',
+                 'python_name': 'continuous_scan',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1150004: {   'access': 'read only',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': False,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': 'In a scan list, a semi-colon (;) is used to indicate that at that point in  the scan list, the scan engine should pause until a trigger is '
+                                                     'received  from the trigger input.  If that trigger is user generated through either  a hardware pulse or the Send SW Trigger operation, it is '
+                                                     'necessary for the  user to know  when the scan engine has reached such a state.'},
+                 'enum': None,
+                 'lv_property': 'Scanning Configuration:Is Waiting for Trigger?',
+                 'name': 'IS_WAITING_FOR_TRIG',
+                 'python_name': 'is_waiting_for_trig',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1150005: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'This attribute has been deprecated and may be removed from a future release of  NI-SWITCH.  Use the niSwitch_RouteTriggerInput and/or '
+                                                     'niSwitch_RouteScanAdvancedOutput  functions instead.\n'},
+                 'enum': None,
+                 'lv_property': 'Obsolete Attributes:Trigger Mode',
+                 'name': 'TRIGGER_MODE',
+                 'python_name': 'trigger_mode',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150006: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'This attribute has been deprecated and may be removed from a future release of  NI-SWITCH.  Use the niSwitch_RouteTriggerInput function '
+                                                     'instead.\n'},
+                 'enum': None,
+                 'lv_property': 'Obsolete Attributes:Master Slave Trigger Bus',
+                 'name': 'MASTER_SLAVE_TRIGGER_BUS',
+                 'python_name': 'master_slave_trigger_bus',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150007: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'This attribute has been deprecated and may be removed from a future release of  NI-SWITCH.  Use the niSwitch_RouteScanAdvancedOutput function '
+                                                     'instead.\n'},
+                 'enum': None,
+                 'lv_property': 'Obsolete Attributes:Master Slave Scan Advanced Bus',
+                 'name': 'MASTER_SLAVE_SCAN_ADVANCED_BUS',
+                 'python_name': 'master_slave_scan_advanced_bus',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150008: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'This attribute has been deprecated and may be removed from a future release of  NI-SWITCH.  Use the niSwitch_RouteTriggerInput function '
+                                                     'instead.\n'},
+                 'enum': None,
+                 'lv_property': 'Obsolete Attributes:Cabled Module Trigger Bus',
+                 'name': 'CABLED_MODULE_TRIGGER_BUS',
+                 'python_name': 'cabled_module_trigger_bus',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150009: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'This attribute has been deprecated and may be removed from a future release of  NI-SWITCH.  Use the niSwitch_RouteScanAdvancedOutput function '
+                                                     'instead.\n'},
+                 'enum': None,
+                 'lv_property': 'Obsolete Attributes:Cabled Module Scan Advanced Bus',
+                 'name': 'CABLED_MODULE_SCAN_ADVANCED_BUS',
+                 'python_name': 'cabled_module_scan_advanced_bus',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150010: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': 'Determines the behavior of the trigger Input.'},
+                 'enum': 'TriggerInputPolarity',
+                 'lv_property': 'Scanning Configuration:Trigger Input Polarity',
+                 'name': 'TRIGGER_INPUT_POLARITY',
+                 'python_name': 'trigger_input_polarity',
+                 'python_type': 'enums.TriggerInputPolarity',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150011: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'enum': 'ScanAdvancedPolarity',
+                 'lv_property': 'Scanning Configuration:Scan Advanced Polarity',
+                 'name': 'SCAN_ADVANCED_POLARITY',
+                 'python_name': 'scan_advanced_polarity',
+                 'python_type': 'enums.ScanAdvancedPolarity',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150012: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nThis attribute has been deprecated and may be removed from a future release of  NI-SWITCH.\n'},
+                 'enum': None,
+                 'lv_property': 'Obsolete Attributes:Parsed Scan List',
+                 'name': 'PARSED_SCAN_LIST',
+                 'python_name': 'parsed_scan_list',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1150013: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'enum': 'HandshakingInitiation',
+                 'lv_property': 'Scanning Configuration:Handshaking Initiation',
+                 'name': 'HANDSHAKING_INITIATION',
+                 'python_name': 'handshaking_initiation',
+                 'python_type': 'enums.HandshakingInitiation',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150014: {   'access': 'read only',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': 'This attribute returns the number of relays.'},
+                 'enum': None,
+                 'lv_property': 'Module Characteristics:Number of Relays',
+                 'name': 'NUMBER_OF_RELAYS',
+                 'python_name': 'number_of_relays',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1150015: {   'access': 'read only',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': 'This read-only attribute returns the serial number for the switch device  controlled by this instrument driver.  If the device does not return '
+                                                     'a  serial number, the driver returns the IVI_ERROR_ATTRIBUTE_NOT_SUPPORTED error.'},
+                 'enum': None,
+                 'lv_property': 'Module Characteristics:Serial Number',
+                 'name': 'SERIAL_NUMBER',
+                 'python_name': 'serial_number',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1150016: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'This property specifies whether to apply the pulse width filter to the  Trigger Input. Enabling the Digital Filter (VI_TRUE) prevents the '
+                                                     'switch  module from being triggered by pulses that are less than 150 ns on PXI  trigger lines 0–7.\n'
+                                                     'When Digital Filter is disabled (VI_FALSE), it is possible for the switch  module to be triggered by noise on the PXI trigger lines. If the '
+                                                     'device  triggering the switch is capable of sending pulses greater than 150 ns, you should not disable the Digital Filter.\n'},
+                 'enum': None,
+                 'lv_property': 'Scanning Configuration:Digital Filter Enable',
+                 'name': 'DIGITAL_FILTER_ENABLE',
+                 'python_name': 'digital_filter_enable',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1150017: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'This property specifies whether to power down latching relays after  calling Wait For Debounce.\n'
+                                                     'When Power Down Latching Relays After Debounce is enabled (VI_TRUE),  a call to Wait For Debounce ensures that the relays are settled  and the '
+                                                     'latching relays are powered down.\n'},
+                 'enum': None,
+                 'lv_property': 'Module Characteristics:Power Down Latching Relays After Debounce',
+                 'name': 'POWER_DOWN_LATCHING_RELAYS_AFTER_DEBOUNCE',
+                 'python_name': 'power_down_latching_relays_after_debounce',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1150018: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Enables or disables sharing of an analog bus line so that multiple  NI SwitchBlock devices may connect to it simultaneously. To enable  multiple '
+                                                     'NI SwitchBlock devices to share an analog bus line, set this  attribute to VI_TRUE for each device on the channel that corresponds  with the '
+                                                     'shared analog bus line. The default value for all devices is  VI_FALSE, which disables sharing of the analog bus.\n'
+                                                     'Refer to the Using the Analog Bus on an NI SwitchBlock Carrier topic  in the NI Switches Help for more information about sharing the analog '
+                                                     'bus.\n'},
+                 'enum': None,
+                 'lv_property': 'Channel Configuration:Analog Bus Sharing Enable',
+                 'name': 'ANALOG_BUS_SHARING_ENABLE',
+                 'python_name': 'analog_bus_sharing_enable',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1150019: {   'access': 'read only',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': False,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nThis attribute returns the temperature as read by the Switch module.     The units are degrees Celsius.\n'},
+                 'enum': None,
+                 'lv_property': 'Module Characteristics:Temperature',
+                 'name': 'TEMPERATURE',
+                 'python_name': 'temperature',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1250001: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': 'This channel-based attribute specifies whether you want to identify the  channel as a source channel.  Typically, you set this attribute to '
+                                                     'VI_TRUE  when you attach the channel to a power supply, a function generator, or an  active measurement point on the unit under test, and you do '
+                                                     'not want to  connect the channel to another source.  The driver prevents source  channels from connecting to each other.  The niSwitch_Connect '
+                                                     'function  returns the NISWITCH_ERROR_ATTEMPT_TO_CONNECT_SOURCES when you attempt to  connect two channels that you identify as source channels.'},
+                 'enum': None,
+                 'lv_property': 'Channel Configuration:Is Source Channel',
+                 'name': 'IS_SOURCE_CHANNEL',
+                 'python_name': 'is_source_channel',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1250002: {   'access': 'read only',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': False,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'This attribute indicates whether the entire switch device has settled  since the last switching command.  A value of VI_TRUE indicates that all  '
+                                                     'signals going through the switch device are valid.\n'},
+                 'enum': None,
+                 'lv_property': 'Module Characteristics:Is Debounced',
+                 'name': 'IS_DEBOUNCED',
+                 'python_name': 'is_debounced',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1250003: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'This channel-based attribute specifies whether to reserve the channel for  internal path creation.  A channel that is available for internal '
+                                                     'path  creation is called a configuration channel.  The driver may use  configuration channels to create paths between two channels you specify '
+                                                     'in  the niSwitch_Connect function.  Configuration channels are not available  for external connections.\n'
+                                                     'Set this attribute to VI_TRUE to mark the channel as a configuration  channel.  Set this attribute to VI_FALSE to mark the channel as available  '
+                                                     'for external connections.\n'
+                                                     'After you identify a channel as a configuration channel, you cannot  use that channel for external connections.  The niSwitch_Connect function  '
+                                                     'returns the NISWITCH_ERROR_IS_CONFIGURATION_CHANNEL error when you attempt  to establish a connection between a configuration channel and any '
+                                                     'other  channel.\n'},
+                 'enum': None,
+                 'lv_property': 'Channel Configuration:Is Configuration Channel',
+                 'name': 'IS_CONFIGURATION_CHANNEL',
+                 'python_name': 'is_configuration_channel',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1250004: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64TimeDeltaSeconds',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'This channel-based attribute returns the maximum length of time from after  you make a connection until the signal flowing through the channel  '
+                                                     'settles. The units are seconds.\n'
+                                                     'the greater value of the settling time and the value you specify as the  scan delay.\n',
+                                      'note': 'NI PXI-2501/2503/2565/2590/2591 Users--the actual delay will always be'},
+                 'enum': None,
+                 'lv_property': 'Module Characteristics:Settling Time',
+                 'name': 'SETTLING_TIME',
+                 'python_api_converter_type': 'datetime.timedelta',
+                 'python_name': 'settling_time',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1250005: {   'access': 'read only',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nThis channel-based attribute returns the bandwidth for the channel.\nThe units are hertz.\n'},
+                 'enum': None,
+                 'lv_property': 'Module Characteristics:Bandwidth',
+                 'name': 'BANDWIDTH',
+                 'python_name': 'bandwidth',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1250006: {   'access': 'read only',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nThis channel-based attribute returns the maximum DC voltage the channel  can switch.\nThe units are volts.\n'},
+                 'enum': None,
+                 'lv_property': 'Module Characteristics:Maximum DC Voltage',
+                 'name': 'MAX_DC_VOLTAGE',
+                 'python_name': 'max_dc_voltage',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1250007: {   'access': 'read only',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nThis channel-based attribute returns the maximum AC voltage the channel  can switch.\nThe units are volts RMS.\n'},
+                 'enum': None,
+                 'lv_property': 'Module Characteristics:Maximum AC Voltage',
+                 'name': 'MAX_AC_VOLTAGE',
+                 'python_name': 'max_ac_voltage',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1250008: {   'access': 'read only',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nThis channel-based attribute returns the maximum DC current the channel  can switch.\nThe units are amperes.\n'},
+                 'enum': None,
+                 'lv_property': 'Module Characteristics:Maximum Switching DC Current',
+                 'name': 'MAX_SWITCHING_DC_CURRENT',
+                 'python_name': 'max_switching_dc_current',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1250009: {   'access': 'read only',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nThis channel-based attribute returns the maximum AC current the channel  can switch.\nThe units are amperes RMS.\n'},
+                 'enum': None,
+                 'lv_property': 'Module Characteristics:Maximum Switching AC Current',
+                 'name': 'MAX_SWITCHING_AC_CURRENT',
+                 'python_name': 'max_switching_ac_current',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1250010: {   'access': 'read only',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nThis channel-based attribute returns the maximum DC current the channel  can carry.\nThe units are amperes.\n'},
+                 'enum': None,
+                 'lv_property': 'Module Characteristics:Maximum Carry DC Current',
+                 'name': 'MAX_CARRY_DC_CURRENT',
+                 'python_name': 'max_carry_dc_current',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1250011: {   'access': 'read only',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nThis channel-based attribute returns the maximum AC current the channel  can carry.\nThe units are amperes RMS.\n'},
+                 'enum': None,
+                 'lv_property': 'Module Characteristics:Maximum Carry AC Current',
+                 'name': 'MAX_CARRY_AC_CURRENT',
+                 'python_name': 'max_carry_ac_current',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1250012: {   'access': 'read only',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nThis channel-based attribute returns the maximum DC power the channel can  switch.\nThe units are watts.\n'},
+                 'enum': None,
+                 'lv_property': 'Module Characteristics:Maximum Switching DC Power',
+                 'name': 'MAX_SWITCHING_DC_POWER',
+                 'python_name': 'max_switching_dc_power',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1250013: {   'access': 'read only',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nThis channel-based attribute returns the maximum AC power the channel can  switch.\nThe units are volt-amperes.\n'},
+                 'enum': None,
+                 'lv_property': 'Module Characteristics:Maximum Switching AC Power',
+                 'name': 'MAX_SWITCHING_AC_POWER',
+                 'python_name': 'max_switching_ac_power',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1250014: {   'access': 'read only',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nThis channel-based attribute returns the maximum DC power the channel can  carry.\nThe units are watts.\n'},
+                 'enum': None,
+                 'lv_property': 'Module Characteristics:Maximum Carry DC Power',
+                 'name': 'MAX_CARRY_DC_POWER',
+                 'python_name': 'max_carry_dc_power',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1250015: {   'access': 'read only',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nThis channel-based attribute returns the maximum AC power the channel can  carry.\nThe units are volt-amperes.\n'},
+                 'enum': None,
+                 'lv_property': 'Module Characteristics:Maximum Carry AC Power',
+                 'name': 'MAX_CARRY_AC_POWER',
+                 'python_name': 'max_carry_ac_power',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1250016: {   'access': 'read only',
+                 'attribute_class': 'AttributeViReal64',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {'description': '\nThis channel-based attribute returns the characteristic impedance for the  channel.\nThe units are ohms.\n'},
+                 'enum': None,
+                 'lv_property': 'Module Characteristics:Characteristic Impedance',
+                 'name': 'CHARACTERISTIC_IMPEDANCE',
+                 'python_name': 'characteristic_impedance',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'},
+    1250017: {   'access': 'read only',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'True',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'This attribute returns the wire mode of the switch device.\n'
+                                                     'This attribute affects the values of the NISWITCH_ATTR_NUM_OF_ROWS and  NISWITCH_ATTR_NUM_OF_COLUMNS attributes.   The actual number of input '
+                                                     'and  output lines on the switch device is fixed, but the number of channels  depends on how many lines constitute each channel.\n'},
+                 'enum': None,
+                 'lv_property': 'Module Characteristics:Wire mode',
+                 'name': 'WIRE_MODE',
+                 'python_name': 'wire_mode',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1250018: {   'access': 'read only',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'This attribute returns the number of channels on the row of a matrix or  scanner.  If the switch device is a scanner, this value is the number '
+                                                     'of  output channels.\n'
+                                                     'The NISWITCH_ATTR_WIRE_MODE attribute affects the number of available  rows.  For example, if your device has 8 input lines and you use the  '
+                                                     'two-wire mode, then the number of columns you have available is 4.\n'},
+                 'enum': None,
+                 'lv_property': 'Matrix Configuration:Number of Rows',
+                 'name': 'NUM_OF_ROWS',
+                 'python_name': 'num_of_rows',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1250019: {   'access': 'read only',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'This attribute returns the number of channels on the column of a matrix or  scanner.  If the switch device is a scanner, this value is the '
+                                                     'number of  input channels.\n'
+                                                     'The NISWITCH_ATTR_WIRE_MODE attribute affects the number of available  columns.  For example, if your device has 8 input lines and you use the  '
+                                                     'four-wire mode, then the number of columns you have available is 2.\n'},
+                 'enum': None,
+                 'lv_property': 'Matrix Configuration:Number of Columns',
+                 'name': 'NUM_OF_COLUMNS',
+                 'python_name': 'num_of_columns',
+                 'python_type': 'int',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1250020: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViString',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'This attribute contains a scan list, which is a string that specifies  channel connections and trigger conditions.  The niSwitch_InitiateScan  '
+                                                     'function makes or breaks connections and waits for triggers according to  the instructions in the scan list.\n'
+                                                     'The scan list is comprised of channel names that you separate with  special characters.  These special characters determine the operations the  '
+                                                     'scanner performs on the channels when it executes this scan list.\n'
+                                                     'To create a path between two channels, use the following character between  the two channel names:\n'
+                                                     "-> (a dash followed by a '>' sign)\n"
+                                                     "Example:  'CH1->CH2' tells the switch to make a path from channel CH1 to channel  CH2.\n"
+                                                     'To break or clear a path, use the following character as a prefix before  the path:\n'
+                                                     '~ (tilde)\n'
+                                                     "Example:  '~CH1->CH2' tells the switch to break the path from channel CH1 to  channel CH2.\n"
+                                                     'To tell the switch device to wait for a trigger event, use the following  character as a separator between paths:\n'
+                                                     '; (semi-colon)\n'
+                                                     "Example:  'CH1->CH2;CH3->CH4' tells the switch to make the path from channel CH1  to channel CH2, wait for a trigger, and then make the path "
+                                                     'from CH3 to  CH4.\n'},
+                 'enum': None,
+                 'lv_property': 'Scanning Configuration:Scan List',
+                 'name': 'SCAN_LIST',
+                 'python_name': 'scan_list',
+                 'python_type': 'str',
+                 'resettable': 'No',
+                 'type': 'ViString'},
+    1250021: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'This attribute specifies what happens to existing connections that  conflict with the connections you make in a scan list.  For example, if  CH1 '
+                                                     'is already connected to CH2 and the scan list instructs the switch  device to connect CH1 to CH3, this attribute specifies what happens to the  '
+                                                     'connection between CH1 and CH2.\n'
+                                                     'If the value of this attribute is NISWITCH_VAL_NONE, the switch device  takes no action on existing paths.  If the value is  '
+                                                     'NISWITCH_VAL_BREAK_BEFORE_MAKE, the switch device breaks conflicting paths  before making new ones.  If the value is '
+                                                     'NISWITCH_VAL_BREAK_AFTER_MAKE,  the switch device breaks conflicting paths after making new ones.\n'
+                                                     "Most switch devices support only one of the possible values.  In such  cases, this attribute serves as an indicator of the device's behavior.\n",
+                                      'note': [   '\n'
+                                                  'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or represent True/False, have been '
+                                                  'removed.\n']},
+                 'enum': 'ScanMode',
+                 'lv_property': 'Scanning Configuration:Scan Mode',
+                 'name': 'SCAN_MODE',
+                 'python_name': 'scan_mode',
+                 'python_type': 'enums.ScanMode',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1250022: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'This attribute specifies the source of the trigger for which the switch  device can wait when processing a scan list.  The switch device waits '
+                                                     'for  a trigger when it encounters a semi-colon in a scan list.  When the trigger  occurs, the switch device advances to the next entry in the '
+                                                     'scan list.\n'},
+                 'enum': 'TriggerInput',
+                 'lv_property': 'Scanning Configuration:Trigger Input',
+                 'name': 'TRIGGER_INPUT',
+                 'python_name': 'trigger_input',
+                 'python_type': 'enums.TriggerInput',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1250023: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViInt32',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'This attribute specifies the method you want to use to notify another  instrument that all signals going through the switch device have settled  '
+                                                     'following the processing of one entry in the scan list.\n'},
+                 'enum': 'ScanAdvancedOutput',
+                 'lv_property': 'Scanning Configuration:Scan Advanced Output',
+                 'name': 'SCAN_ADVANCED_OUTPUT',
+                 'python_name': 'scan_advanced_output',
+                 'python_type': 'enums.ScanAdvancedOutput',
+                 'resettable': 'No',
+                 'type': 'ViInt32'},
+    1250024: {   'access': 'read only',
+                 'attribute_class': 'AttributeViBoolean',
+                 'cacheable': False,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': 'If VI_TRUE, the switch module is currently scanning through the scan list  (i.e. it is not in the Idle state). If VI_FALSE, the switch module is '
+                                                     'not  currently scanning through the scan list (i.e. it is in the Idle state).'},
+                 'enum': None,
+                 'lv_property': 'Scanning Configuration:Is Scanning',
+                 'name': 'IS_SCANNING',
+                 'python_name': 'is_scanning',
+                 'python_type': 'bool',
+                 'resettable': 'No',
+                 'type': 'ViBoolean'},
+    1250025: {   'access': 'read-write',
+                 'attribute_class': 'AttributeViReal64TimeDeltaSeconds',
+                 'cacheable': True,
+                 'channel_based': 'False',
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'This attribute specifies the minimum amount of time the switch device  waits before it asserts the scan advanced output trigger after opening '
+                                                     'or  closing the switch.  The switch device always waits for debounce before  asserting the trigger. The units are seconds.\n'
+                                                     'the greater value of the settling time and the value you specify as the  scan delay.\n',
+                                      'note': 'NI PXI-2501/2503/2565/2590/2591 Users--the actual delay will always be'},
+                 'enum': None,
+                 'lv_property': 'Scanning Configuration:Scan Delay',
+                 'name': 'SCAN_DELAY',
+                 'python_api_converter_type': 'datetime.timedelta',
+                 'python_name': 'scan_delay',
+                 'python_type': 'float',
+                 'resettable': 'No',
+                 'type': 'ViReal64'}}
\ No newline at end of file
@@ -0,0 +1,568 @@
+enums =
+{   'CabledModuleScanAdvancedBus': {   'codegen_method': 'no',
+                                       'python_name': 'CabledModuleScanAdvancedBus',
+                                       'values': [   {'documentation': {'description': ''}, 'name': 'NONE', 'python_name': 'NONE', 'value': 0},
+                                                     {   'documentation': {   'description': '\n'
+                                                                                             'The switch module waits until it receives a trigger on the PXI\\_Trig0\n'
+                                                                                             'line before processing the next entry in the scan list.\n'},
+                                                         'name': 'PXI_TRIG0',
+                                                         'python_name': 'PXI_TRIG0',
+                                                         'value': 111},
+                                                     {   'documentation': {   'description': '\n'
+                                                                                             'The switch module waits until it receives a trigger on the PXI\\_Trig1\n'
+                                                                                             'line before processing the next entry in the scan list.\n'},
+                                                         'name': 'PXI_TRIG1',
+                                                         'python_name': 'PXI_TRIG1',
+                                                         'value': 112},
+                                                     {   'documentation': {   'description': '\n'
+                                                                                             'The switch module waits until it receives a trigger on the PXI\\_Trig2\n'
+                                                                                             'line before processing the next entry in the scan list.\n'},
+                                                         'name': 'PXI_TRIG2',
+                                                         'python_name': 'PXI_TRIG2',
+                                                         'value': 113},
+                                                     {   'documentation': {   'description': '\n'
+                                                                                             'The switch module waits until it receives a trigger on the PXI\\_Trig3\n'
+                                                                                             'line before processing the next entry in the scan list.\n'},
+                                                         'name': 'PXI_TRIG3',
+                                                         'python_name': 'PXI_TRIG3',
+                                                         'value': 114},
+                                                     {   'documentation': {   'description': '\n'
+                                                                                             'The switch module waits until it receives a trigger on the PXI\\_Trig4\n'
+                                                                                             'line before processing the next entry in the scan list.\n'},
+                                                         'name': 'PXI_TRIG4',
+                                                         'python_name': 'PXI_TRIG4',
+                                                         'value': 115},
+                                                     {   'documentation': {   'description': '\n'
+                                                                                             'The switch module waits until it receives a trigger on the PXI\\_Trig5\n'
+                                                                                             'line before processing the next entry in the scan list.\n'},
+                                                         'name': 'PXI_TRIG5',
+                                                         'python_name': 'PXI_TRIG5',
+                                                         'value': 116},
+                                                     {   'documentation': {   'description': '\n'
+                                                                                             'The switch module waits until it receives a trigger on the PXI\\_Trig6\n'
+                                                                                             'line before processing the next entry in the scan list.\n'},
+                                                         'name': 'PXI_TRIG6',
+                                                         'python_name': 'PXI_TRIG6',
+                                                         'value': 117},
+                                                     {   'documentation': {   'description': '\n'
+                                                                                             'The switch module waits until it receives a trigger on the PXI\\_Trig7\n'
+                                                                                             'line before processing the next entry in the scan list.\n'},
+                                                         'name': 'PXI_TRIG7',
+                                                         'python_name': 'PXI_TRIG7',
+                                                         'value': 118}]},
+    'CabledModuleTriggerBus': {   'codegen_method': 'no',
+                                  'python_name': 'CabledModuleTriggerBus',
+                                  'values': [   {'documentation': {'description': ''}, 'name': 'NONE', 'python_name': 'NONE', 'value': 0},
+                                                {'documentation': {'description': ''}, 'name': 'PXI_TRIG0', 'python_name': 'PXI_TRIG0', 'value': 111},
+                                                {'documentation': {'description': ''}, 'name': 'PXI_TRIG1', 'python_name': 'PXI_TRIG1', 'value': 112},
+                                                {'documentation': {'description': ''}, 'name': 'PXI_TRIG2', 'python_name': 'PXI_TRIG2', 'value': 113},
+                                                {'documentation': {'description': ''}, 'name': 'PXI_TRIG3', 'python_name': 'PXI_TRIG3', 'value': 114},
+                                                {'documentation': {'description': ''}, 'name': 'PXI_TRIG4', 'python_name': 'PXI_TRIG4', 'value': 115},
+                                                {'documentation': {'description': ''}, 'name': 'PXI_TRIG5', 'python_name': 'PXI_TRIG5', 'value': 116},
+                                                {'documentation': {'description': ''}, 'name': 'PXI_TRIG6', 'python_name': 'PXI_TRIG6', 'value': 117},
+                                                {'documentation': {'description': ''}, 'name': 'PXI_TRIG7', 'python_name': 'PXI_TRIG7', 'value': 118}]},
+    'HandshakingInitiation': {   'codegen_method': 'public',
+                                 'python_name': 'HandshakingInitiation',
+                                 'values': [   {   'documentation': {   'description': '\n'
+                                                                                       'The `niSwitch Initiate\n'
+                                                                                       'Scan <switchviref.chm::/niSwitch_Initiate_Scan.html>`__ VI does not\n'
+                                                                                       'return until the switch hardware is waiting for a trigger input. This\n'
+                                                                                       'ensures that if you initiate the measurement device after calling the\n'
+                                                                                       '`niSwitch Initiate\n'
+                                                                                       'Scan <switchviref.chm::/niSwitch_Initiate_Scan.html>`__ VI , the switch\n'
+                                                                                       'is sure to receive the first measurement complete (MC) signal sent by\n'
+                                                                                       'the measurement device. The measurement device should be configured to\n'
+                                                                                       'first take a measurement, send MC, then wait for scanner advanced output\n'
+                                                                                       'signal. Thus, the first MC of the measurement device initiates\n'
+                                                                                       'handshaking.\n'},
+                                                   'name': 'MEASUREMENT_DEVICE_INITIATED',
+                                                   'python_name': 'MEASUREMENT_DEVICE',
+                                                   'suffix': '_INITIATED',
+                                                   'value': 0},
+                                               {   'documentation': {   'description': '\n'
+                                                                                       'The `niSwitch Initiate\n'
+                                                                                       'Scan <switchviref.chm::/niSwitch_Initiate_Scan.html>`__ VI returns\n'
+                                                                                       'immediately after beginning scan list execution. It is assumed that the\n'
+                                                                                       'measurement device has already been configured and is waiting for the\n'
+                                                                                       'scanner advanced signal. The measurement should be configured to first\n'
+                                                                                       'wait for a trigger, then take a measurement. Thus, the first scanner\n'
+                                                                                       'advanced output signal of the switch module initiates handshaking.\n'},
+                                                   'name': 'SWITCH_INITIATED',
+                                                   'python_name': 'SWITCH',
+                                                   'suffix': '_INITIATED',
+                                                   'value': 1}]},
+    'MasterSlaveScanAdvancedBus': {   'codegen_method': 'no',
+                                      'python_name': 'MasterSlaveScanAdvancedBus',
+                                      'values': [   {'documentation': {'description': ''}, 'name': 'NONE', 'python_name': 'NONE', 'value': 0},
+                                                    {   'documentation': {   'description': '\n'
+                                                                                            'The switch module waits until it receives a trigger on the PXI\\_Trig0\n'
+                                                                                            'line before processing the next entry in the scan list.\n'},
+                                                        'name': 'PXI_TRIG0',
+                                                        'python_name': 'PXI_TRIG0',
+                                                        'value': 111},
+                                                    {   'documentation': {   'description': '\n'
+                                                                                            'The switch module waits until it receives a trigger on the PXI\\_Trig1\n'
+                                                                                            'line before processing the next entry in the scan list.\n'},
+                                                        'name': 'PXI_TRIG1',
+                                                        'python_name': 'PXI_TRIG1',
+                                                        'value': 112},
+                                                    {   'documentation': {   'description': '\n'
+                                                                                            'The switch module waits until it receives a trigger on the PXI\\_Trig2\n'
+                                                                                            'line before processing the next entry in the scan list.\n'},
+                                                        'name': 'PXI_TRIG2',
+                                                        'python_name': 'PXI_TRIG2',
+                                                        'value': 113},
+                                                    {   'documentation': {   'description': '\n'
+                                                                                            'The switch module waits until it receives a trigger on the PXI\\_Trig3\n'
+                                                                                            'line before processing the next entry in the scan list.\n'},
+                                                        'name': 'PXI_TRIG3',
+                                                        'python_name': 'PXI_TRIG3',
+                                                        'value': 114},
+                                                    {   'documentation': {   'description': '\n'
+                                                                                            'The switch module waits until it receives a trigger on the PXI\\_Trig4\n'
+                                                                                            'line before processing the next entry in the scan list.\n'},
+                                                        'name': 'PXI_TRIG4',
+                                                        'python_name': 'PXI_TRIG4',
+                                                        'value': 115},
+                                                    {   'documentation': {   'description': '\n'
+                                                                                            'The switch module waits until it receives a trigger on the PXI\\_Trig5\n'
+                                                                                            'line before processing the next entry in the scan list.\n'},
+                                                        'name': 'PXI_TRIG5',
+                                                        'python_name': 'PXI_TRIG5',
+                                                        'value': 116},
+                                                    {   'documentation': {   'description': '\n'
+                                                                                            'The switch module waits until it receives a trigger on the PXI\\_Trig6\n'
+                                                                                            'line before processing the next entry in the scan list.\n'},
+                                                        'name': 'PXI_TRIG6',
+                                                        'python_name': 'PXI_TRIG6',
+                                                        'value': 117},
+                                                    {   'documentation': {   'description': '\n'
+                                                                                            'The switch module waits until it receives a trigger on the PXI\\_Trig7\n'
+                                                                                            'line before processing the next entry in the scan list.\n'},
+                                                        'name': 'PXI_TRIG7',
+                                                        'python_name': 'PXI_TRIG7',
+                                                        'value': 118}]},
+    'MasterSlaveTriggerBus': {   'codegen_method': 'no',
+                                 'python_name': 'MasterSlaveTriggerBus',
+                                 'values': [   {'documentation': {'description': ''}, 'name': 'NONE', 'python_name': 'NONE', 'value': 0},
+                                               {   'documentation': {   'description': '\n'
+                                                                                       'The switch module waits until it receives a trigger on the PXI\\_Trig0\n'
+                                                                                       'line before processing the next entry in the scan list.\n'},
+                                                   'name': 'PXI_TRIG0',
+                                                   'python_name': 'PXI_TRIG0',
+                                                   'value': 111},
+                                               {   'documentation': {   'description': '\n'
+                                                                                       'The switch module waits until it receives a trigger on the PXI\\_Trig1\n'
+                                                                                       'line before processing the next entry in the scan list.\n'},
+                                                   'name': 'PXI_TRIG1',
+                                                   'python_name': 'PXI_TRIG1',
+                                                   'value': 112},
+                                               {   'documentation': {   'description': '\n'
+                                                                                       'The switch module waits until it receives a trigger on the PXI\\_Trig2\n'
+                                                                                       'line before processing the next entry in the scan list.\n'},
+                                                   'name': 'PXI_TRIG2',
+                                                   'python_name': 'PXI_TRIG2',
+                                                   'value': 113},
+                                               {   'documentation': {   'description': '\n'
+                                                                                       'The switch module waits until it receives a trigger on the PXI\\_Trig3\n'
+                                                                                       'line before processing the next entry in the scan list.\n'},
+                                                   'name': 'PXI_TRIG3',
+                                                   'python_name': 'PXI_TRIG3',
+                                                   'value': 114},
+                                               {   'documentation': {   'description': '\n'
+                                                                                       'The switch module waits until it receives a trigger on the PXI\\_Trig4\n'
+                                                                                       'line before processing the next entry in the scan list.\n'},
+                                                   'name': 'PXI_TRIG4',
+                                                   'python_name': 'PXI_TRIG4',
+                                                   'value': 115},
+                                               {   'documentation': {   'description': '\n'
+                                                                                       'The switch module waits until it receives a trigger on the PXI\\_Trig5\n'
+                                                                                       'line before processing the next entry in the scan list.\n'},
+                                                   'name': 'PXI_TRIG5',
+                                                   'python_name': 'PXI_TRIG5',
+                                                   'value': 116},
+                                               {   'documentation': {   'description': '\n'
+                                                                                       'The switch module waits until it receives a trigger on the PXI\\_Trig6\n'
+                                                                                       'line before processing the next entry in the scan list.\n'},
+                                                   'name': 'PXI_TRIG6',
+                                                   'python_name': 'PXI_TRIG6',
+                                                   'value': 117},
+                                               {   'documentation': {   'description': '\n'
+                                                                                       'The switch module waits until it receives a trigger on the PXI\\_Trig7\n'
+                                                                                       'line before processing the next entry in the scan list.\n'},
+                                                   'name': 'PXI_TRIG7',
+                                                   'python_name': 'PXI_TRIG7',
+                                                   'value': 118}]},
+    'PathCapability': {   'codegen_method': 'public',
+                          'python_name': 'PathCapability',
+                          'values': [   {'documentation': {'description': 'Path Available'}, 'name': 'PATH_AVAILABLE', 'python_name': 'PATH_AVAILABLE', 'value': 1},
+                                        {'documentation': {'description': 'Path Exists'}, 'name': 'PATH_EXISTS', 'python_name': 'PATH_EXISTS', 'value': 2},
+                                        {'documentation': {'description': 'Path Unsupported'}, 'name': 'PATH_UNSUPPORTED', 'python_name': 'PATH_UNSUPPORTED', 'value': 3},
+                                        {'documentation': {'description': 'Resource in use'}, 'name': 'RESOURCE_IN_USE', 'python_name': 'RESOURCE_IN_USE', 'value': 4},
+                                        {'documentation': {'description': 'Source conflict'}, 'name': 'SOURCE_CONFLICT', 'python_name': 'SOURCE_CONFLICT', 'value': 5},
+                                        {'documentation': {'description': 'Channel not available'}, 'name': 'CHANNEL_NOT_AVAILABLE', 'python_name': 'CHANNEL_NOT_AVAILABLE', 'value': 6}]},
+    'RelayAction': {   'codegen_method': 'public',
+                       'python_name': 'RelayAction',
+                       'values': [   {'documentation': {'description': 'Open Relay'}, 'name': 'OPEN_RELAY', 'python_name': 'OPEN', 'suffix': '_RELAY', 'value': 20},
+                                     {'documentation': {'description': 'Close Relay'}, 'name': 'CLOSE_RELAY', 'python_name': 'CLOSE', 'suffix': '_RELAY', 'value': 21}]},
+    'RelayPosition': {   'codegen_method': 'public',
+                         'python_name': 'RelayPosition',
+                         'values': [   {'documentation': {'description': 'Open'}, 'name': 'OPEN', 'python_name': 'OPEN', 'value': 10},
+                                       {'documentation': {'description': 'Closed'}, 'name': 'CLOSED', 'python_name': 'CLOSED', 'value': 11}]},
+    'ScanAdvancedOutput': {   'codegen_method': 'public',
+                              'python_name': 'ScanAdvancedOutput',
+                              'values': [   {   'documentation': {'description': 'The switch device does not produce a Scan Advanced Output trigger.'},
+                                                'name': 'NISWITCH_VAL_NONE',
+                                                'python_name': 'NONE',
+                                                'value': 0},
+                                            {   'documentation': {'description': 'External Trigger. The switch device produces the Scan Advanced Output  trigger on the external trigger output.'},
+                                                'name': 'NISWITCH_VAL_EXTERNAL',
+                                                'python_name': 'EXTERNAL',
+                                                'value': 2},
+                                            {   'documentation': {'description': 'The switch device produces the Scan Advanced Output on the PXI TRIG0 line.'},
+                                                'name': 'NISWITCH_VAL_TTL0',
+                                                'python_name': 'TTL0',
+                                                'value': 111},
+                                            {   'documentation': {'description': 'The switch device produces the Scan Advanced Output on the PXI TRIG1 line.'},
+                                                'name': 'NISWITCH_VAL_TTL1',
+                                                'python_name': 'TTL1',
+                                                'value': 112},
+                                            {   'documentation': {'description': 'The switch device produces the Scan Advanced Output on the PXI TRIG2 line.'},
+                                                'name': 'NISWITCH_VAL_TTL2',
+                                                'python_name': 'TTL2',
+                                                'value': 113},
+                                            {   'documentation': {'description': 'The switch device produces the Scan Advanced Output on the PXI TRIG3 line.'},
+                                                'name': 'NISWITCH_VAL_TTL3',
+                                                'python_name': 'TTL3',
+                                                'value': 114},
+                                            {   'documentation': {'description': 'The switch device produces the Scan Advanced Output on the PXI TRIG4 line.'},
+                                                'name': 'NISWITCH_VAL_TTL4',
+                                                'python_name': 'TTL4',
+                                                'value': 115},
+                                            {   'documentation': {'description': 'The switch device produces the Scan Advanced Output on the PXI TRIG5 line.'},
+                                                'name': 'NISWITCH_VAL_TTL5',
+                                                'python_name': 'TTL5',
+                                                'value': 116},
+                                            {   'documentation': {'description': 'The switch device produces the Scan Advanced Output on the PXI TRIG6 line.'},
+                                                'name': 'NISWITCH_VAL_TTL6',
+                                                'python_name': 'TTL6',
+                                                'value': 117},
+                                            {   'documentation': {'description': 'The switch device produces the Scan Advanced Output on the PXI TRIG7 line.'},
+                                                'name': 'NISWITCH_VAL_TTL7',
+                                                'python_name': 'TTL7',
+                                                'value': 118},
+                                            {   'documentation': {   'description': '\n'
+                                                                                    'The switch module produces the Scan Advanced Output Trigger on the PXI\n'
+                                                                                    'Star trigger bus before processing the next entry in the scan list.\n'},
+                                                'name': 'PXI_STAR',
+                                                'python_name': 'PXI_STAR',
+                                                'value': 125},
+                                            {   'documentation': {'description': 'The switch device produces the Scan Advanced Output  trigger on the rear connector.'},
+                                                'name': 'NISWITCH_VAL_REARCONNECTOR',
+                                                'python_name': 'REARCONNECTOR',
+                                                'value': 1000},
+                                            {   'documentation': {'description': 'The switch device produces the Scan Advanced Output  trigger on the front connector.'},
+                                                'name': 'NISWITCH_VAL_FRONTCONNECTOR',
+                                                'python_name': 'FRONTCONNECTOR',
+                                                'value': 1001},
+                                            {   'documentation': {'description': '\nThe switch module produces the Scan Advanced Output Trigger on the rear\nconnector module 1.\n'},
+                                                'name': 'REARCONNECTOR_MODULE1',
+                                                'python_name': 'REARCONNECTOR_MODULE1',
+                                                'value': 1021},
+                                            {   'documentation': {'description': '\nThe switch module produces the Scan Advanced Output Trigger on the rear\nconnector module 2.\n'},
+                                                'name': 'REARCONNECTOR_MODULE2',
+                                                'python_name': 'REARCONNECTOR_MODULE2',
+                                                'value': 1022},
+                                            {   'documentation': {'description': '\nThe switch module produces the Scan Advanced Output Trigger on the rear\nconnector module 3.\n'},
+                                                'name': 'REARCONNECTOR_MODULE3',
+                                                'python_name': 'REARCONNECTOR_MODULE3',
+                                                'value': 1023},
+                                            {   'documentation': {'description': '\nThe switch module produces the Scan Advanced Output Trigger on the rear\nconnector module 4.\n'},
+                                                'name': 'REARCONNECTOR_MODULE4',
+                                                'python_name': 'REARCONNECTOR_MODULE4',
+                                                'value': 1024},
+                                            {   'documentation': {'description': '\nThe switch module produces the Scan Advanced Output Trigger on the rear\nconnector module 5.\n'},
+                                                'name': 'REARCONNECTOR_MODULE5',
+                                                'python_name': 'REARCONNECTOR_MODULE5',
+                                                'value': 1025},
+                                            {   'documentation': {'description': '\nThe switch module produces the Scan Advanced Output Trigger on the rear\nconnector module 6.\n'},
+                                                'name': 'REARCONNECTOR_MODULE6',
+                                                'python_name': 'REARCONNECTOR_MODULE6',
+                                                'value': 1026},
+                                            {   'documentation': {'description': '\nThe switch module produces the Scan Advanced Output Trigger on the rear\nconnector module 7.\n'},
+                                                'name': 'REARCONNECTOR_MODULE7',
+                                                'python_name': 'REARCONNECTOR_MODULE7',
+                                                'value': 1027},
+                                            {   'documentation': {'description': '\nThe switch module produces the Scan Advanced Output Trigger on the rear\nconnector module 8.\n'},
+                                                'name': 'REARCONNECTOR_MODULE8',
+                                                'python_name': 'REARCONNECTOR_MODULE8',
+                                                'value': 1028},
+                                            {   'documentation': {'description': '\nThe switch module produces the Scan Advanced Ouptut Trigger on the rear\nconnector module 9.\n'},
+                                                'name': 'REARCONNECTOR_MODULE9',
+                                                'python_name': 'REARCONNECTOR_MODULE9',
+                                                'value': 1029},
+                                            {   'documentation': {'description': '\nThe switch module produces the Scan Advanced Output Trigger on the rear\nconnector module 10.\n'},
+                                                'name': 'REARCONNECTOR_MODULE10',
+                                                'python_name': 'REARCONNECTOR_MODULE10',
+                                                'value': 1030},
+                                            {   'documentation': {'description': '\nThe switch module produces the Scan Advanced Output Trigger on the rear\nconnector module 11.\n'},
+                                                'name': 'REARCONNECTOR_MODULE11',
+                                                'python_name': 'REARCONNECTOR_MODULE11',
+                                                'value': 1031},
+                                            {   'documentation': {'description': '\nThe switch module produces the Scan Advanced Output Trigger on the rear\nconnector module 12.\n'},
+                                                'name': 'REARCONNECTOR_MODULE12',
+                                                'python_name': 'REARCONNECTOR_MODULE12',
+                                                'value': 1032},
+                                            {   'documentation': {'description': '\nThe switch module produces the Scan Advanced Output Trigger on the front\nconnector module 1.\n'},
+                                                'name': 'FRONTCONNECTOR_MODULE1',
+                                                'python_name': 'FRONTCONNECTOR_MODULE1',
+                                                'value': 1041},
+                                            {   'documentation': {'description': '\nThe switch module produces the Scan Advanced Output Trigger on the front\nconnector module 2.\n'},
+                                                'name': 'FRONTCONNECTOR_MODULE2',
+                                                'python_name': 'FRONTCONNECTOR_MODULE2',
+                                                'value': 1042},
+                                            {   'documentation': {'description': '\nThe switch module produces the Scan Advanced Output Trigger on the front\nconnector module 3.\n'},
+                                                'name': 'FRONTCONNECTOR_MODULE3',
+                                                'python_name': 'FRONTCONNECTOR_MODULE3',
+                                                'value': 1043},
+                                            {   'documentation': {'description': '\nThe switch module produces the Scan Advanced Output Trigger on the front\nconnector module 4.\n'},
+                                                'name': 'FRONTCONNECTOR_MODULE4',
+                                                'python_name': 'FRONTCONNECTOR_MODULE4',
+                                                'value': 1044},
+                                            {   'documentation': {'description': '\nThe switch module produces the Scan Advanced Output Trigger on the front\nconnector module 5.\n'},
+                                                'name': 'FRONTCONNECTOR_MODULE5',
+                                                'python_name': 'FRONTCONNECTOR_MODULE5',
+                                                'value': 1045},
+                                            {   'documentation': {'description': '\nThe switch module produces the Scan Advanced Output Trigger on the front\nconnector module 6.\n'},
+                                                'name': 'FRONTCONNECTOR_MODULE6',
+                                                'python_name': 'FRONTCONNECTOR_MODULE6',
+                                                'value': 1046},
+                                            {   'documentation': {'description': '\nThe switch module produces the Scan Advanced Output Trigger on the front\nconnector module 7.\n'},
+                                                'name': 'FRONTCONNECTOR_MODULE7',
+                                                'python_name': 'FRONTCONNECTOR_MODULE7',
+                                                'value': 1047},
+                                            {   'documentation': {'description': '\nThe switch module produces the Scan Advanced Output Trigger on the front\nconnector module 8.\n'},
+                                                'name': 'FRONTCONNECTOR_MODULE8',
+                                                'python_name': 'FRONTCONNECTOR_MODULE8',
+                                                'value': 1048},
+                                            {   'documentation': {'description': '\nThe switch module produces the Scan Advanced Output Trigger on the front\nconnector module 9.\n'},
+                                                'name': 'FRONTCONNECTOR_MODULE9',
+                                                'python_name': 'FRONTCONNECTOR_MODULE9',
+                                                'value': 1049},
+                                            {   'documentation': {'description': '\nThe switch module produces the Scan Advanced Output Trigger on the front\nconnector module 10.\n'},
+                                                'name': 'FRONTCONNECTOR_MODULE10',
+                                                'python_name': 'FRONTCONNECTOR_MODULE10',
+                                                'value': 1050},
+                                            {   'documentation': {'description': '\nThe switch module produces the Scan Advanced Output Trigger on the front\nconnector module 11.\n'},
+                                                'name': 'FRONTCONNECTOR_MODULE11',
+                                                'python_name': 'FRONTCONNECTOR_MODULE11',
+                                                'value': 1051},
+                                            {   'documentation': {'description': '\nThe switch module produces the Scan Advanced Output Trigger on the front\nconnector module 12.\n'},
+                                                'name': 'FRONTCONNECTOR_MODULE12',
+                                                'python_name': 'FRONTCONNECTOR_MODULE12',
+                                                'value': 1052}]},
+    'ScanAdvancedPolarity': {   'codegen_method': 'public',
+                                'python_name': 'ScanAdvancedPolarity',
+                                'values': [   {   'documentation': {'description': 'The trigger occurs on the rising edge of the signal.'},
+                                                  'name': 'NISWITCH_VAL_RISING_EDGE',
+                                                  'python_name': 'RISING',
+                                                  'suffix': '_EDGE',
+                                                  'value': 0},
+                                              {   'documentation': {'description': 'The trigger occurs on the falling edge of the signal.'},
+                                                  'name': 'NISWITCH_VAL_FALLING_EDGE',
+                                                  'python_name': 'FALLING',
+                                                  'suffix': '_EDGE',
+                                                  'value': 1}]},
+    'ScanMode': {   'codegen_method': 'public',
+                    'python_name': 'ScanMode',
+                    'values': [   {'documentation': {'description': 'No implicit action on connections when scanning.'}, 'name': 'NISWITCH_VAL_NONE', 'python_name': 'NONE', 'value': 0},
+                                  {   'documentation': {'description': 'When scanning, the switch device breaks existing connections before  making new connections.'},
+                                      'name': 'NISWITCH_VAL_BREAK_BEFORE_MAKE',
+                                      'python_name': 'BREAK_BEFORE_MAKE',
+                                      'value': 1},
+                                  {   'documentation': {'description': 'When scanning, the switch device breaks existing connections after making  new connections.'},
+                                      'name': 'NISWITCH_VAL_BREAK_AFTER_MAKE',
+                                      'python_name': 'BREAK_AFTER_MAKE',
+                                      'value': 2}]},
+    'TriggerInput': {   'codegen_method': 'public',
+                        'python_name': 'TriggerInput',
+                        'values': [   {   'documentation': {'description': 'Immediate Trigger. The switch device does not wait for a trigger before  processing the next entry in the scan list.'},
+                                          'name': 'NISWITCH_VAL_IMMEDIATE',
+                                          'python_name': 'IMMEDIATE',
+                                          'value': 1},
+                                      {   'documentation': {   'description': 'External Trigger. The switch device waits until it receives a trigger  from an external source through the external '
+                                                                              'trigger input before  processing the next entry in the scan list.'},
+                                          'name': 'NISWITCH_VAL_EXTERNAL',
+                                          'python_name': 'EXTERNAL',
+                                          'value': 2},
+                                      {   'documentation': {   'description': 'The switch device waits until you call the niSwitch_SendSoftwareTrigger  function before processing the next entry in '
+                                                                              'the scan list.'},
+                                          'name': 'NISWITCH_VAL_SOFTWARE_TRIG',
+                                          'python_name': 'SOFTWARE_TRIG',
+                                          'value': 3},
+                                      {   'documentation': {   'description': 'The switch device waits until it receives a trigger on the PXI TRIG0 line before processing the next entry in the scan '
+                                                                              'list.'},
+                                          'name': 'NISWITCH_VAL_TTL0',
+                                          'python_name': 'TTL0',
+                                          'value': 111},
+                                      {   'documentation': {   'description': 'The switch device waits until it receives a trigger on the PXI TRIG1 line before processing the next entry in the scan '
+                                                                              'list.'},
+                                          'name': 'NISWITCH_VAL_TTL1',
+                                          'python_name': 'TTL1',
+                                          'value': 112},
+                                      {   'documentation': {   'description': 'The switch device waits until it receives a trigger on the PXI TRIG2 line before processing the next entry in the scan '
+                                                                              'list.'},
+                                          'name': 'NISWITCH_VAL_TTL2',
+                                          'python_name': 'TTL2',
+                                          'value': 113},
+                                      {   'documentation': {   'description': 'The switch device waits until it receives a trigger on the PXI TRIG3 line before processing the next entry in the scan '
+                                                                              'list.'},
+                                          'name': 'NISWITCH_VAL_TTL3',
+                                          'python_name': 'TTL3',
+                                          'value': 114},
+                                      {   'documentation': {   'description': 'The switch device waits until it receives a trigger on the PXI TRIG4 line before processing the next entry in the scan '
+                                                                              'list.'},
+                                          'name': 'NISWITCH_VAL_TTL4',
+                                          'python_name': 'TTL4',
+                                          'value': 115},
+                                      {   'documentation': {   'description': 'The switch device waits until it receives a trigger on the PXI TRIG5 line before processing the next entry in the scan '
+                                                                              'list.'},
+                                          'name': 'NISWITCH_VAL_TTL5',
+                                          'python_name': 'TTL5',
+                                          'value': 116},
+                                      {   'documentation': {   'description': 'The switch device waits until it receives a trigger on the PXI TRIG6 line before processing the next entry in the scan '
+                                                                              'list.'},
+                                          'name': 'NISWITCH_VAL_TTL6',
+                                          'python_name': 'TTL6',
+                                          'value': 117},
+                                      {   'documentation': {   'description': 'The switch device waits until it receives a trigger on the PXI TRIG7 line before processing the next entry in the scan '
+                                                                              'list.'},
+                                          'name': 'NISWITCH_VAL_TTL7',
+                                          'python_name': 'TTL7',
+                                          'value': 118},
+                                      {   'documentation': {   'description': 'The switch device waits until it receives a trigger on the PXI STAR  trigger bus before processing the next entry in '
+                                                                              'the scan list.'},
+                                          'name': 'NISWITCH_VAL_PXI_STAR',
+                                          'python_name': 'PXI_STAR',
+                                          'value': 125},
+                                      {   'documentation': {'description': 'The switch device waits until it receives a trigger on the  rear connector.'},
+                                          'name': 'NISWITCH_VAL_REARCONNECTOR',
+                                          'python_name': 'REARCONNECTOR',
+                                          'value': 1000},
+                                      {   'documentation': {'description': 'The switch device waits until it receives a trigger on the  front connector.'},
+                                          'name': 'NISWITCH_VAL_FRONTCONNECTOR',
+                                          'python_name': 'FRONTCONNECTOR',
+                                          'value': 1001},
+                                      {   'documentation': {'description': '\nThe switch module waits until it receives a trigger on the rear\nconnector module 1.\n'},
+                                          'name': 'REARCONNECTOR_MODULE1',
+                                          'python_name': 'REARCONNECTOR_MODULE1',
+                                          'value': 1021},
+                                      {   'documentation': {'description': '\nThe switch module waits until it receives a trigger on the rear\nconnector module 2.\n'},
+                                          'name': 'REARCONNECTOR_MODULE2',
+                                          'python_name': 'REARCONNECTOR_MODULE2',
+                                          'value': 1022},
+                                      {   'documentation': {'description': '\nThe switch module waits until it receives a trigger on the rear\nconnector module 3.\n'},
+                                          'name': 'REARCONNECTOR_MODULE3',
+                                          'python_name': 'REARCONNECTOR_MODULE3',
+                                          'value': 1023},
+                                      {   'documentation': {'description': '\nThe switch module waits until it receives a trigger on the rear\nconnector module 4.\n'},
+                                          'name': 'REARCONNECTOR_MODULE4',
+                                          'python_name': 'REARCONNECTOR_MODULE4',
+                                          'value': 1024},
+                                      {   'documentation': {'description': '\nThe switch module waits until it receives a trigger on the rear\nconnector module 5.\n'},
+                                          'name': 'REARCONNECTOR_MODULE5',
+                                          'python_name': 'REARCONNECTOR_MODULE5',
+                                          'value': 1025},
+                                      {   'documentation': {'description': '\nThe switch module waits until it receives a trigger on the rear\nconnector module 6.\n'},
+                                          'name': 'REARCONNECTOR_MODULE6',
+                                          'python_name': 'REARCONNECTOR_MODULE6',
+                                          'value': 1026},
+                                      {   'documentation': {'description': '\nThe switch module waits until it receives a trigger on the rear\nconnector module 7.\n'},
+                                          'name': 'REARCONNECTOR_MODULE7',
+                                          'python_name': 'REARCONNECTOR_MODULE7',
+                                          'value': 1027},
+                                      {   'documentation': {'description': '\nThe switch module waits until it receives a trigger on the rear\nconnector module 8.\n'},
+                                          'name': 'REARCONNECTOR_MODULE8',
+                                          'python_name': 'REARCONNECTOR_MODULE8',
+                                          'value': 1028},
+                                      {   'documentation': {'description': '\nThe switch module waits until it receives a trigger on the rear\nconnector module 9.\n'},
+                                          'name': 'REARCONNECTOR_MODULE9',
+                                          'python_name': 'REARCONNECTOR_MODULE9',
+                                          'value': 1029},
+                                      {   'documentation': {'description': '\nThe switch module waits until it receives a trigger on the rear\nconnector module 10.\n'},
+                                          'name': 'REARCONNECTOR_MODULE10',
+                                          'python_name': 'REARCONNECTOR_MODULE10',
+                                          'value': 1030},
+                                      {   'documentation': {'description': '\nThe switch module waits until it receives a trigger on the rear\nconnector module 11.\n'},
+                                          'name': 'REARCONNECTOR_MODULE11',
+                                          'python_name': 'REARCONNECTOR_MODULE11',
+                                          'value': 1031},
+                                      {   'documentation': {'description': '\nThe switch module waits until it receives a trigger on the rear\nconnector module 12.\n'},
+                                          'name': 'REARCONNECTOR_MODULE12',
+                                          'python_name': 'REARCONNECTOR_MODULE12',
+                                          'value': 1032},
+                                      {   'documentation': {'description': '\nThe switch module waits until it receives a trigger on the front\nconnector module 1.\n'},
+                                          'name': 'FRONTCONNECTOR_MODULE1',
+                                          'python_name': 'FRONTCONNECTOR_MODULE1',
+                                          'value': 1041},
+                                      {   'documentation': {'description': '\nThe switch module waits until it receives a trigger on the front\nconnector module 2.\n'},
+                                          'name': 'FRONTCONNECTOR_MODULE2',
+                                          'python_name': 'FRONTCONNECTOR_MODULE2',
+                                          'value': 1042},
+                                      {   'documentation': {'description': '\nThe switch module waits until it receives a trigger on the front\nconnector module 3.\n'},
+                                          'name': 'FRONTCONNECTOR_MODULE3',
+                                          'python_name': 'FRONTCONNECTOR_MODULE3',
+                                          'value': 1043},
+                                      {   'documentation': {'description': '\nThe switch module waits until it receives a trigger on the front\nconnector module 4.\n'},
+                                          'name': 'FRONTCONNECTOR_MODULE4',
+                                          'python_name': 'FRONTCONNECTOR_MODULE4',
+                                          'value': 1044},
+                                      {   'documentation': {'description': '\nThe switch module waits until it receives a trigger on the front\nconnector module 5.\n'},
+                                          'name': 'FRONTCONNECTOR_MODULE5',
+                                          'python_name': 'FRONTCONNECTOR_MODULE5',
+                                          'value': 1045},
+                                      {   'documentation': {'description': '\nThe switch module waits until it receives a trigger on the front\nconnector module 6.\n'},
+                                          'name': 'FRONTCONNECTOR_MODULE6',
+                                          'python_name': 'FRONTCONNECTOR_MODULE6',
+                                          'value': 1046},
+                                      {   'documentation': {'description': '\nThe switch module waits until it receives a trigger on the front\nconnector module 7.\n'},
+                                          'name': 'FRONTCONNECTOR_MODULE7',
+                                          'python_name': 'FRONTCONNECTOR_MODULE7',
+                                          'value': 1047},
+                                      {   'documentation': {'description': '\nThe switch module waits until it receives a trigger on the front\nconnector module 8.\n'},
+                                          'name': 'FRONTCONNECTOR_MODULE8',
+                                          'python_name': 'FRONTCONNECTOR_MODULE8',
+                                          'value': 1048},
+                                      {   'documentation': {'description': '\nThe switch module waits until it receives a trigger on the front\nconnector module 9.\n'},
+                                          'name': 'FRONTCONNECTOR_MODULE9',
+                                          'python_name': 'FRONTCONNECTOR_MODULE9',
+                                          'value': 1049},
+                                      {   'documentation': {'description': '\nThe switch module waits until it receives a trigger on the front\nconnector module 10.\n'},
+                                          'name': 'FRONTCONNECTOR_MODULE10',
+                                          'python_name': 'FRONTCONNECTOR_MODULE10',
+                                          'value': 1050},
+                                      {   'documentation': {'description': '\nThe switch module waits until it receives a trigger on the front\nconnector module 11.\n'},
+                                          'name': 'FRONTCONNECTOR_MODULE11',
+                                          'python_name': 'FRONTCONNECTOR_MODULE11',
+                                          'value': 1051},
+                                      {   'documentation': {'description': '\nThe switch module waits until it receives a trigger on the front\nconnector module 12.\n'},
+                                          'name': 'FRONTCONNECTOR_MODULE12',
+                                          'python_name': 'FRONTCONNECTOR_MODULE12',
+                                          'value': 1052}]},
+    'TriggerInputPolarity': {   'codegen_method': 'public',
+                                'python_name': 'TriggerInputPolarity',
+                                'values': [   {   'documentation': {'description': 'The trigger occurs on the rising edge of the signal.'},
+                                                  'name': 'NISWITCH_VAL_RISING_EDGE',
+                                                  'python_name': 'RISING',
+                                                  'suffix': '_EDGE',
+                                                  'value': 0},
+                                              {   'documentation': {'description': 'The trigger occurs on the falling edge of the signal.'},
+                                                  'name': 'NISWITCH_VAL_FALLING_EDGE',
+                                                  'python_name': 'FALLING',
+                                                  'suffix': '_EDGE',
+                                                  'value': 1}]},
+    'TriggerMode': {   'codegen_method': 'no',
+                       'python_name': 'TriggerMode',
+                       'values': [   {'documentation': {'description': ''}, 'name': 'SINGLE', 'python_name': 'SINGLE', 'value': 0},
+                                     {'documentation': {'description': ''}, 'name': 'MASTER', 'python_name': 'MASTER', 'value': 1},
+                                     {'documentation': {'description': ''}, 'name': 'SLAVE', 'python_name': 'SLAVE', 'value': 2}]}}
\ No newline at end of file
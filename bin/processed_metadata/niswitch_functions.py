@@ -0,0 +1,5817 @@
+function =
+{   'AbortScan': {   'blocking': False,
+                     'codegen_method': 'public',
+                     'documentation': {   'description': '\n'
+                                                         'Aborts the scan in progress. Initiate a scan with\n'
+                                                         'niSwitch_InitiateScan. If the switch module is not scanning,\n'
+                                                         'NISWITCH_ERROR_NO_SCAN_IN_PROGRESS error is returned.\n'},
+                     'has_repeated_capability': False,
+                     'invalidates_attribute_cache': False,
+                     'is_error_handling': False,
+                     'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                     'name': 'AbortScan',
+                     'parameters': [   {   'ctypes_type': 'ViSession',
+                                           'ctypes_type_library_call': 'ViSession',
+                                           'ctypes_variable_name': 'vi_ctype',
+                                           'direction': 'in',
+                                           'documentation': {   'description': '\n'
+                                                                               'A particular NI-SWITCH session established with\n'
+                                                                               'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                               'and used for all subsequent NI-SWITCH calls.\n',
+                                                                'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                           'enum': None,
+                                           'is_buffer': False,
+                                           'is_repeated_capability': False,
+                                           'is_session_handle': True,
+                                           'is_string': False,
+                                           'library_method_call_snippet': 'vi_ctype',
+                                           'name': 'vi',
+                                           'numpy': False,
+                                           'numpy_into_return': False,
+                                           'python_name': 'vi',
+                                           'python_name_or_default_for_init': 'vi',
+                                           'python_name_with_default': 'vi',
+                                           'python_name_with_doc_default': 'vi',
+                                           'python_type': 'int',
+                                           'size': {'mechanism': 'fixed', 'value': 1},
+                                           'type': 'ViSession',
+                                           'use_array': False,
+                                           'use_in_python_api': True,
+                                           'use_list': False}],
+                     'python_code_variables': [],
+                     'python_name': 'abort',
+                     'render_in_library': True,
+                     'render_in_session_base': False,
+                     'returns': 'ViStatus'},
+    'CanConnect': {   'blocking': False,
+                      'codegen_method': 'public',
+                      'documentation': {   'description': '\n'
+                                                          'Verifies that a path between channel 1 and channel 2 can be created. If\n'
+                                                          'a path is possible in the switch module, the availability of that path\n'
+                                                          'is returned given the existing connections. If the path is possible but\n'
+                                                          'in use, a NISWITCH_WARN_IMPLICIT_CONNECTION_EXISTS warning is\n'
+                                                          'returned.\n'},
+                      'has_repeated_capability': False,
+                      'invalidates_attribute_cache': False,
+                      'is_error_handling': False,
+                      'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                      'name': 'CanConnect',
+                      'parameters': [   {   'ctypes_type': 'ViSession',
+                                            'ctypes_type_library_call': 'ViSession',
+                                            'ctypes_variable_name': 'vi_ctype',
+                                            'direction': 'in',
+                                            'documentation': {   'description': '\n'
+                                                                                'A particular NI-SWITCH session established with\n'
+                                                                                'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                'and used for all subsequent NI-SWITCH calls.\n',
+                                                                 'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                            'enum': None,
+                                            'is_buffer': False,
+                                            'is_repeated_capability': False,
+                                            'is_session_handle': True,
+                                            'is_string': False,
+                                            'library_method_call_snippet': 'vi_ctype',
+                                            'name': 'vi',
+                                            'numpy': False,
+                                            'numpy_into_return': False,
+                                            'python_name': 'vi',
+                                            'python_name_or_default_for_init': 'vi',
+                                            'python_name_with_default': 'vi',
+                                            'python_name_with_doc_default': 'vi',
+                                            'python_type': 'int',
+                                            'size': {'mechanism': 'fixed', 'value': 1},
+                                            'type': 'ViSession',
+                                            'use_array': False,
+                                            'use_in_python_api': True,
+                                            'use_list': False},
+                                        {   'ctypes_type': 'ViConstString',
+                                            'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                            'ctypes_variable_name': 'channel1_ctype',
+                                            'direction': 'in',
+                                            'documentation': {   'description': '\n'
+                                                                                'Input one of the channel names of the desired path. Pass the other\n'
+                                                                                'channel name as the channel 2 parameter. Refer to Devices Overview for\n'
+                                                                                'valid channel names for the switch module. Examples of valid channel\n'
+                                                                                'names: ch0, com0, ab0, r1, c2, cjtemp Default value: ""\n'},
+                                            'enum': None,
+                                            'is_buffer': False,
+                                            'is_repeated_capability': False,
+                                            'is_session_handle': False,
+                                            'is_string': True,
+                                            'library_method_call_snippet': 'channel1_ctype',
+                                            'name': 'channel1',
+                                            'numpy': False,
+                                            'numpy_into_return': False,
+                                            'python_name': 'channel1',
+                                            'python_name_or_default_for_init': 'channel1',
+                                            'python_name_with_default': 'channel1',
+                                            'python_name_with_doc_default': 'channel1',
+                                            'python_type': 'str',
+                                            'size': {'mechanism': 'fixed', 'value': 1},
+                                            'type': 'ViConstString',
+                                            'use_array': False,
+                                            'use_in_python_api': True,
+                                            'use_list': False},
+                                        {   'ctypes_type': 'ViConstString',
+                                            'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                            'ctypes_variable_name': 'channel2_ctype',
+                                            'direction': 'in',
+                                            'documentation': {   'description': '\n'
+                                                                                'Input one of the channel names of the desired path. Pass the other\n'
+                                                                                'channel name as the channel 1 parameter. Refer to Devices Overview for\n'
+                                                                                'valid channel names for the switch module. Examples of valid channel\n'
+                                                                                'names: ch0, com0, ab0, r1, c2, cjtemp Default value: ""\n'},
+                                            'enum': None,
+                                            'is_buffer': False,
+                                            'is_repeated_capability': False,
+                                            'is_session_handle': False,
+                                            'is_string': True,
+                                            'library_method_call_snippet': 'channel2_ctype',
+                                            'name': 'channel2',
+                                            'numpy': False,
+                                            'numpy_into_return': False,
+                                            'python_name': 'channel2',
+                                            'python_name_or_default_for_init': 'channel2',
+                                            'python_name_with_default': 'channel2',
+                                            'python_name_with_doc_default': 'channel2',
+                                            'python_type': 'str',
+                                            'size': {'mechanism': 'fixed', 'value': 1},
+                                            'type': 'ViConstString',
+                                            'use_array': False,
+                                            'use_in_python_api': True,
+                                            'use_list': False},
+                                        {   'ctypes_type': 'ViInt32',
+                                            'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                            'ctypes_variable_name': 'path_capability_ctype',
+                                            'direction': 'out',
+                                            'documentation': {   'description': '\n'
+                                                                                'Indicates whether a path is valid. Possible values include:\n'
+                                                                                '------------------------------------ NISWITCH_VAL_PATH_AVAILABLE 1\n'
+                                                                                'NISWITCH_VAL_PATH_EXISTS 2 NISWITCH_VAL_PATH_UNSUPPORTED 3\n'
+                                                                                'NISWITCH_VAL_RSRC_IN_USE 4 NISWITCH_VAL_SOURCE_CONFLICT 5\n'
+                                                                                'NISWITCH_VAL_CHANNEL_NOT_AVAILABLE 6 Notes: (1)\n'
+                                                                                'NISWITCH_VAL_PATH_AVAILABLE indicates that the driver can create the\n'
+                                                                                'path at this time. (2) NISWITCH_VAL_PATH_EXISTS indicates that the\n'
+                                                                                'path already exists. (3) NISWITCH_VAL_PATH_UNSUPPORTED indicates that\n'
+                                                                                'the instrument is not capable of creating a path between the channels\n'
+                                                                                'you specify. (4) NISWITCH_VAL_RSRC_IN_USE indicates that although\n'
+                                                                                'the path is valid, the driver cannot create the path at this moment\n'
+                                                                                'because the switch device is currently using one or more of the required\n'
+                                                                                'channels to create another path. You must destroy the other path before\n'
+                                                                                'creating this one. (5) NISWITCH_VAL_SOURCE_CONFLICT indicates that\n'
+                                                                                'the instrument cannot create a path because both channels are connected\n'
+                                                                                'to a different source channel. (6)\n'
+                                                                                'NISWITCH_VAL_CHANNEL_NOT_AVAILABLE indicates that the driver cannot\n'
+                                                                                'create a path between the two channels because one of the channels is a\n'
+                                                                                'configuration channel and thus unavailable for external connections.\n',
+                                                                 'note': [   '\n'
+                                                                             'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or '
+                                                                             'represent True/False, have been removed.\n']},
+                                            'enum': 'PathCapability',
+                                            'is_buffer': False,
+                                            'is_repeated_capability': False,
+                                            'is_session_handle': False,
+                                            'is_string': False,
+                                            'library_method_call_snippet': 'None if path_capability_ctype is None else (ctypes.pointer(path_capability_ctype))',
+                                            'name': 'pathCapability',
+                                            'numpy': False,
+                                            'numpy_into_return': False,
+                                            'python_name': 'path_capability',
+                                            'python_name_or_default_for_init': 'path_capability',
+                                            'python_name_with_default': 'path_capability',
+                                            'python_name_with_doc_default': 'path_capability',
+                                            'python_type': 'enums.PathCapability',
+                                            'size': {'mechanism': 'fixed', 'value': 1},
+                                            'type': 'ViInt32',
+                                            'use_array': False,
+                                            'use_in_python_api': True,
+                                            'use_list': False}],
+                      'python_code_variables': [],
+                      'python_name': 'can_connect',
+                      'render_in_library': True,
+                      'render_in_session_base': False,
+                      'returns': 'ViStatus'},
+    'CheckAttributeViBoolean': {   'codegen_method': 'no',
+                                   'documentation': {'description': '\nThis function checks the validity of a value you specify for a ViBoolean\nattribute.\n'},
+                                   'parameters': [   {   'direction': 'in',
+                                                         'documentation': {   'description': '\n'
+                                                                                             'A particular NI-SWITCH session established with\n'
+                                                                                             'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                             'and used for all subsequent NI-SWITCH calls.\n',
+                                                                              'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                         'name': 'vi',
+                                                         'type': 'ViSession'},
+                                                     {   'direction': 'in',
+                                                         'documentation': {   'description': '\n'
+                                                                                             'Some attributes are unique per channel. For these, pass the name of the\n'
+                                                                                             'channel. Other attributes are unique per switch device. Pass VI_NULL or\n'
+                                                                                             'an empty string for this parameter. Default Value: ""\n'},
+                                                         'name': 'channelName',
+                                                         'type': 'ViConstString'},
+                                                     {   'direction': 'in',
+                                                         'documentation': {   'description': '\n'
+                                                                                             'Pass the ID of an attribute. From the function panel window, you can use\n'
+                                                                                             'this control as follows. - Click on the control or press , , or , to\n'
+                                                                                             'display a dialog box containing a hierarchical list of the available\n'
+                                                                                             'attributes. Attributes whose value cannot be set are dim. Help text is\n'
+                                                                                             'shown for each attribute. Select an attribute by double-clicking on it\n'
+                                                                                             'or by selecting it and then pressing . Read-only attributes appear dim\n'
+                                                                                             'in the list box. If you select a read-only attribute, an error message\n'
+                                                                                             'appears. A ring control at the top of the dialog box allows you to see\n'
+                                                                                             'all IVI attributes or only the attributes of the ViBoolean type. If you\n'
+                                                                                             'choose to see all IVI attributes, the data types appear to the right of\n'
+                                                                                             'the attribute names in the list box. The data types that are not\n'
+                                                                                             'consistent with this function are dim. If you select an attribute data\n'
+                                                                                             'type that is dim, LabWindows/CVI transfers you to the function panel for\n'
+                                                                                             'the corresponding function that is consistent with the data type. - If\n'
+                                                                                             'you want to enter a variable name, press to change this ring control to\n'
+                                                                                             'a manual input box. - If the attribute in this ring control has\n'
+                                                                                             'constants as valid values, you can view the constants by moving to the\n'
+                                                                                             'Attribute Value control and pressing .\n'},
+                                                         'name': 'attributeId',
+                                                         'type': 'ViAttr'},
+                                                     {   'direction': 'in',
+                                                         'documentation': {   'description': '\n'
+                                                                                             'Pass the value which you want to verify as a valid value for the\n'
+                                                                                             'attribute. From the function panel window, you can use this control as\n'
+                                                                                             'follows. - If the attribute currently showing in the Attribute ID ring\n'
+                                                                                             'control has constants as valid values, you can view a list of the\n'
+                                                                                             'constants by pressing on this control. Select a value by double-clicking\n'
+                                                                                             'on it or by selecting it and then pressing . Note: Some of the values\n'
+                                                                                             'might not be valid depending on the current settings of the instrument\n'
+                                                                                             'session. Default Value: none\n'},
+                                                         'name': 'attributeValue',
+                                                         'type': 'ViBoolean'}],
+                                   'returns': 'ViStatus'},
+    'CheckAttributeViInt32': {   'codegen_method': 'no',
+                                 'documentation': {'description': '\nThis function checks the validity of a value you specify for a ViInt32\nattribute.\n'},
+                                 'parameters': [   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'A particular NI-SWITCH session established with\n'
+                                                                                           'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                           'and used for all subsequent NI-SWITCH calls.\n',
+                                                                            'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                       'name': 'vi',
+                                                       'type': 'ViSession'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Some attributes are unique per channel. For these, pass the name of the\n'
+                                                                                           'channel. Other attributes are unique per switch device. Pass VI_NULL or\n'
+                                                                                           'an empty string for this parameter. Default Value: ""\n'},
+                                                       'name': 'channelName',
+                                                       'type': 'ViConstString'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Pass the ID of an attribute. From the function panel window, you can use\n'
+                                                                                           'this control as follows. - Click on the control or press , , or , to\n'
+                                                                                           'display a dialog box containing a hierarchical list of the available\n'
+                                                                                           'attributes. Attributes whose value cannot be set are dim. Help text is\n'
+                                                                                           'shown for each attribute. Select an attribute by double-clicking on it\n'
+                                                                                           'or by selecting it and then pressing . Read-only attributes appear dim\n'
+                                                                                           'in the list box. If you select a read-only attribute, an error message\n'
+                                                                                           'appears. A ring control at the top of the dialog box allows you to see\n'
+                                                                                           'all IVI attributes or only the attributes of the ViInt32 type. If you\n'
+                                                                                           'choose to see all IVI attributes, the data types appear to the right of\n'
+                                                                                           'the attribute names in the list box. The data types that are not\n'
+                                                                                           'consistent with this function are dim. If you select an attribute data\n'
+                                                                                           'type that is dim, LabWindows/CVI transfers you to the function panel for\n'
+                                                                                           'the corresponding function that is consistent with the data type. - If\n'
+                                                                                           'you want to enter a variable name, press to change this ring control to\n'
+                                                                                           'a manual input box. - If the attribute in this ring control has\n'
+                                                                                           'constants as valid values, you can view the constants by moving to the\n'
+                                                                                           'Attribute Value control and pressing .\n'},
+                                                       'name': 'attributeId',
+                                                       'type': 'ViAttr'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Pass the value which you want to verify as a valid value for the\n'
+                                                                                           'attribute. From the function panel window, you can use this control as\n'
+                                                                                           'follows. - If the attribute currently showing in the Attribute ID ring\n'
+                                                                                           'control has constants as valid values, you can view a list of the\n'
+                                                                                           'constants by pressing on this control. Select a value by double-clicking\n'
+                                                                                           'on it or by selecting it and then pressing . Note: Some of the values\n'
+                                                                                           'might not be valid depending on the current settings of the instrument\n'
+                                                                                           'session. Default Value: none\n'},
+                                                       'name': 'attributeValue',
+                                                       'type': 'ViInt32'}],
+                                 'returns': 'ViStatus'},
+    'CheckAttributeViReal64': {   'codegen_method': 'no',
+                                  'documentation': {'description': '\nThis function checks the validity of a value you specify for a ViReal64\nattribute.\n'},
+                                  'parameters': [   {   'direction': 'in',
+                                                        'documentation': {   'description': '\n'
+                                                                                            'A particular NI-SWITCH session established with\n'
+                                                                                            'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                            'and used for all subsequent NI-SWITCH calls.\n',
+                                                                             'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                        'name': 'vi',
+                                                        'type': 'ViSession'},
+                                                    {   'direction': 'in',
+                                                        'documentation': {   'description': '\n'
+                                                                                            'Some attributes are unique per channel. For these, pass the name of the\n'
+                                                                                            'channel. Other attributes are unique per switch device. Pass VI_NULL or\n'
+                                                                                            'an empty string for this parameter. Default Value: ""\n'},
+                                                        'name': 'channelName',
+                                                        'type': 'ViConstString'},
+                                                    {   'direction': 'in',
+                                                        'documentation': {   'description': '\n'
+                                                                                            'Pass the ID of an attribute. From the function panel window, you can use\n'
+                                                                                            'this control as follows. - Click on the control or press , , or , to\n'
+                                                                                            'display a dialog box containing a hierarchical list of the available\n'
+                                                                                            'attributes. Attributes whose value cannot be set are dim. Help text is\n'
+                                                                                            'shown for each attribute. Select an attribute by double-clicking on it\n'
+                                                                                            'or by selecting it and then pressing . Read-only attributes appear dim\n'
+                                                                                            'in the list box. If you select a read-only attribute, an error message\n'
+                                                                                            'appears. A ring control at the top of the dialog box allows you to see\n'
+                                                                                            'all IVI attributes or only the attributes of the ViReal64 type. If you\n'
+                                                                                            'choose to see all IVI attributes, the data types appear to the right of\n'
+                                                                                            'the attribute names in the list box. The data types that are not\n'
+                                                                                            'consistent with this function are dim. If you select an attribute data\n'
+                                                                                            'type that is dim, LabWindows/CVI transfers you to the function panel for\n'
+                                                                                            'the corresponding function that is consistent with the data type. - If\n'
+                                                                                            'you want to enter a variable name, press to change this ring control to\n'
+                                                                                            'a manual input box. - If the attribute in this ring control has\n'
+                                                                                            'constants as valid values, you can view the constants by moving to the\n'
+                                                                                            'Attribute Value control and pressing .\n'},
+                                                        'name': 'attributeId',
+                                                        'type': 'ViAttr'},
+                                                    {   'direction': 'in',
+                                                        'documentation': {   'description': '\n'
+                                                                                            'Pass the value which you want to verify as a valid value for the\n'
+                                                                                            'attribute. From the function panel window, you can use this control as\n'
+                                                                                            'follows. - If the attribute currently showing in the Attribute ID ring\n'
+                                                                                            'control has constants as valid values, you can view a list of the\n'
+                                                                                            'constants by pressing on this control. Select a value by double-clicking\n'
+                                                                                            'on it or by selecting it and then pressing . Note: Some of the values\n'
+                                                                                            'might not be valid depending on the current settings of the instrument\n'
+                                                                                            'session. Default Value: none\n'},
+                                                        'name': 'attributeValue',
+                                                        'type': 'ViReal64'}],
+                                  'returns': 'ViStatus'},
+    'CheckAttributeViSession': {   'codegen_method': 'no',
+                                   'documentation': {'description': '\nThis function checks the validity of a value you specify for a ViSession\nattribute.\n'},
+                                   'parameters': [   {   'direction': 'in',
+                                                         'documentation': {   'description': '\n'
+                                                                                             'A particular NI-SWITCH session established with\n'
+                                                                                             'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                             'and used for all subsequent NI-SWITCH calls.\n',
+                                                                              'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                         'name': 'vi',
+                                                         'type': 'ViSession'},
+                                                     {   'direction': 'in',
+                                                         'documentation': {   'description': '\n'
+                                                                                             'Some attributes are unique per channel. For these, pass the name of the\n'
+                                                                                             'channel. Other attributes are unique per switch device. Pass VI_NULL or\n'
+                                                                                             'an empty string for this parameter. Default Value: ""\n'},
+                                                         'name': 'channelName',
+                                                         'type': 'ViConstString'},
+                                                     {   'direction': 'in',
+                                                         'documentation': {   'description': '\n'
+                                                                                             'Pass the ID of an attribute. From the function panel window, you can use\n'
+                                                                                             'this control as follows. - Click on the control or press , , or , to\n'
+                                                                                             'display a dialog box containing a hierarchical list of the available\n'
+                                                                                             'attributes. Attributes whose value cannot be set are dim. Help text is\n'
+                                                                                             'shown for each attribute. Select an attribute by double-clicking on it\n'
+                                                                                             'or by selecting it and then pressing . Read-only attributes appear dim\n'
+                                                                                             'in the list box. If you select a read-only attribute, an error message\n'
+                                                                                             'appears. A ring control at the top of the dialog box allows you to see\n'
+                                                                                             'all IVI attributes or only the attributes of the ViSession type. If you\n'
+                                                                                             'choose to see all IVI attributes, the data types appear to the right of\n'
+                                                                                             'the attribute names in the list box. The data types that are not\n'
+                                                                                             'consistent with this function are dim. If you select an attribute data\n'
+                                                                                             'type that is dim, LabWindows/CVI transfers you to the function panel for\n'
+                                                                                             'the corresponding function that is consistent with the data type. - If\n'
+                                                                                             'you want to enter a variable name, press to change this ring control to\n'
+                                                                                             'a manual input box. - If the attribute in this ring control has\n'
+                                                                                             'constants as valid values, you can view the constants by moving to the\n'
+                                                                                             'Attribute Value control and pressing .\n'},
+                                                         'name': 'attributeId',
+                                                         'type': 'ViAttr'},
+                                                     {   'direction': 'in',
+                                                         'documentation': {   'description': '\n'
+                                                                                             'Pass the value which you want to verify as a valid value for the\n'
+                                                                                             'attribute. From the function panel window, you can use this control as\n'
+                                                                                             'follows. - If the attribute currently showing in the Attribute ID ring\n'
+                                                                                             'control has constants as valid values, you can view a list of the\n'
+                                                                                             'constants by pressing on this control. Select a value by double-clicking\n'
+                                                                                             'on it or by selecting it and then pressing . Note: Some of the values\n'
+                                                                                             'might not be valid depending on the current settings of the instrument\n'
+                                                                                             'session. Default Value: none\n'},
+                                                         'name': 'attributeValue',
+                                                         'type': 'ViSession'}],
+                                   'returns': 'ViStatus'},
+    'CheckAttributeViString': {   'codegen_method': 'no',
+                                  'documentation': {'description': '\nThis function checks the validity of a value you specify for a ViString\nattribute.\n'},
+                                  'parameters': [   {   'direction': 'in',
+                                                        'documentation': {   'description': '\n'
+                                                                                            'A particular NI-SWITCH session established with\n'
+                                                                                            'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                            'and used for all subsequent NI-SWITCH calls.\n',
+                                                                             'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                        'name': 'vi',
+                                                        'type': 'ViSession'},
+                                                    {   'direction': 'in',
+                                                        'documentation': {   'description': '\n'
+                                                                                            'Some attributes are unique per channel. For these, pass the name of the\n'
+                                                                                            'channel. Other attributes are unique per switch device. Pass VI_NULL or\n'
+                                                                                            'an empty string for this parameter. Default Value: ""\n'},
+                                                        'name': 'channelName',
+                                                        'type': 'ViConstString'},
+                                                    {   'direction': 'in',
+                                                        'documentation': {   'description': '\n'
+                                                                                            'Pass the ID of an attribute. From the function panel window, you can use\n'
+                                                                                            'this control as follows. - Click on the control or press , , or , to\n'
+                                                                                            'display a dialog box containing a hierarchical list of the available\n'
+                                                                                            'attributes. Attributes whose value cannot be set are dim. Help text is\n'
+                                                                                            'shown for each attribute. Select an attribute by double-clicking on it\n'
+                                                                                            'or by selecting it and then pressing . Read-only attributes appear dim\n'
+                                                                                            'in the list box. If you select a read-only attribute, an error message\n'
+                                                                                            'appears. A ring control at the top of the dialog box allows you to see\n'
+                                                                                            'all IVI attributes or only the attributes of the ViString type. If you\n'
+                                                                                            'choose to see all IVI attributes, the data types appear to the right of\n'
+                                                                                            'the attribute names in the list box. The data types that are not\n'
+                                                                                            'consistent with this function are dim. If you select an attribute data\n'
+                                                                                            'type that is dim, LabWindows/CVI transfers you to the function panel for\n'
+                                                                                            'the corresponding function that is consistent with the data type. - If\n'
+                                                                                            'you want to enter a variable name, press to change this ring control to\n'
+                                                                                            'a manual input box. - If the attribute in this ring control has\n'
+                                                                                            'constants as valid values, you can view the constants by moving to the\n'
+                                                                                            'Attribute Value control and pressing .\n'},
+                                                        'name': 'attributeId',
+                                                        'type': 'ViAttr'},
+                                                    {   'direction': 'in',
+                                                        'documentation': {   'description': '\n'
+                                                                                            'Pass the value which you want to verify as a valid value for the\n'
+                                                                                            'attribute. From the function panel window, you can use this control as\n'
+                                                                                            'follows. - If the attribute currently showing in the Attribute ID ring\n'
+                                                                                            'control has constants as valid values, you can view a list of the\n'
+                                                                                            'constants by pressing on this control. Select a value by double-clicking\n'
+                                                                                            'on it or by selecting it and then pressing . Note: Some of the values\n'
+                                                                                            'might not be valid depending on the current settings of the instrument\n'
+                                                                                            'session. Default Value: none\n'},
+                                                        'name': 'attributeValue',
+                                                        'type': 'ViChar[]'}],
+                                  'returns': 'ViStatus'},
+    'ClearError': {   'codegen_method': 'no',
+                      'documentation': {   'description': '\n'
+                                                          'This function clears the error code and error description for the IVI\n'
+                                                          'session. If the user specifies a valid IVI session for the\n'
+                                                          'instrument_handle parameter, this function clears the error information\n'
+                                                          'for the session. If the user passes VI_NULL for the Vi parameter, this\n'
+                                                          'function clears the error information for the current execution thread.\n'
+                                                          'If the Vi parameter is an invalid session, the function does nothing and\n'
+                                                          'returns an error. The function clears the error code by setting it to\n'
+                                                          'VI_SUCCESS, If the error description string is non-NULL, the function\n'
+                                                          'deallocates the error description string and sets the address to\n'
+                                                          'VI_NULL. Maintaining the error information separately for each thread\n'
+                                                          'is useful if the user does not have a session handle to pass to the\n'
+                                                          'niSwitch_GetError function, which occurs when a call to niSwitch_init\n'
+                                                          'or niSwitch_InitWithOptions fails.\n',
+                                           'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                      'parameters': [   {   'direction': 'in',
+                                            'documentation': {   'description': '\n'
+                                                                                'A particular NI-SWITCH session established with\n'
+                                                                                'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                'and used for all subsequent NI-SWITCH calls.\n',
+                                                                 'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                            'name': 'vi',
+                                            'type': 'ViSession'}],
+                      'returns': 'ViStatus'},
+    'ClearInterchangeWarnings': {   'codegen_method': 'no',
+                                    'documentation': {'description': 'This function clears the list of current interchange warnings.'},
+                                    'parameters': [   {   'direction': 'in',
+                                                          'documentation': {   'description': '\n'
+                                                                                              'A particular NI-SWITCH session established with\n'
+                                                                                              'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                              'and used for all subsequent NI-SWITCH calls.\n',
+                                                                               'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                          'name': 'vi',
+                                                          'type': 'ViSession'}],
+                                    'returns': 'ViStatus'},
+    'Commit': {   'blocking': False,
+                  'codegen_method': 'public',
+                  'documentation': {   'description': '\n'
+                                                      'Downloads the configured scan list and trigger settings to hardware.\n'
+                                                      'Calling niSwitch_Commit optional as it is implicitly called during\n'
+                                                      'niSwitch_InitiateScan. Use niSwitch_Commit to arm triggers in a given\n'
+                                                      'order or to control when expensive hardware operations are performed.\n'},
+                  'has_repeated_capability': False,
+                  'invalidates_attribute_cache': True,
+                  'is_error_handling': False,
+                  'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                  'name': 'Commit',
+                  'parameters': [   {   'ctypes_type': 'ViSession',
+                                        'ctypes_type_library_call': 'ViSession',
+                                        'ctypes_variable_name': 'vi_ctype',
+                                        'direction': 'in',
+                                        'documentation': {   'description': '\n'
+                                                                            'A particular NI-SWITCH session established with\n'
+                                                                            'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                            'and used for all subsequent NI-SWITCH calls.\n',
+                                                             'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                        'enum': None,
+                                        'is_buffer': False,
+                                        'is_repeated_capability': False,
+                                        'is_session_handle': True,
+                                        'is_string': False,
+                                        'library_method_call_snippet': 'vi_ctype',
+                                        'name': 'vi',
+                                        'numpy': False,
+                                        'numpy_into_return': False,
+                                        'python_name': 'vi',
+                                        'python_name_or_default_for_init': 'vi',
+                                        'python_name_with_default': 'vi',
+                                        'python_name_with_doc_default': 'vi',
+                                        'python_type': 'int',
+                                        'size': {'mechanism': 'fixed', 'value': 1},
+                                        'type': 'ViSession',
+                                        'use_array': False,
+                                        'use_in_python_api': True,
+                                        'use_list': False}],
+                  'python_code_variables': [],
+                  'python_name': 'commit',
+                  'render_in_library': True,
+                  'render_in_session_base': False,
+                  'returns': 'ViStatus'},
+    'ConfigureScanList': {   'blocking': False,
+                             'codegen_method': 'public',
+                             'documentation': {   'description': '\n'
+                                                                 'Configures the scan list and scan mode used for scanning. Refer to\n'
+                                                                 'Devices Overview to determine if the switch module supports scanning.\n'
+                                                                 'The scan list is comprised of a list of channel connections separated by\n'
+                                                                 'semi-colons. For example, the following scan list will scan the first\n'
+                                                                 'three channels of a multiplexer: com0->ch0; com0->ch1; com0->ch2; Refer\n'
+                                                                 'to Scan Lists for more information on scan list syntax To see the status\n'
+                                                                 'of the scan, call either niSwitch_IsScanning or\n'
+                                                                 'niSwitch_WaitForScanComplete. Use the niSwitch_ConfigureScanTrigger\n'
+                                                                 'function to configure the scan trigger. Use the niSwitch_InitiateScan\n'
+                                                                 'function to start the scan.\n',
+                                                  'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                             'has_repeated_capability': False,
+                             'invalidates_attribute_cache': True,
+                             'is_error_handling': False,
+                             'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                             'name': 'ConfigureScanList',
+                             'parameters': [   {   'ctypes_type': 'ViSession',
+                                                   'ctypes_type_library_call': 'ViSession',
+                                                   'ctypes_variable_name': 'vi_ctype',
+                                                   'direction': 'in',
+                                                   'documentation': {   'description': '\n'
+                                                                                       'A particular NI-SWITCH session established with\n'
+                                                                                       'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                       'and used for all subsequent NI-SWITCH calls.\n',
+                                                                        'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                   'enum': None,
+                                                   'is_buffer': False,
+                                                   'is_repeated_capability': False,
+                                                   'is_session_handle': True,
+                                                   'is_string': False,
+                                                   'library_method_call_snippet': 'vi_ctype',
+                                                   'name': 'vi',
+                                                   'numpy': False,
+                                                   'numpy_into_return': False,
+                                                   'python_name': 'vi',
+                                                   'python_name_or_default_for_init': 'vi',
+                                                   'python_name_with_default': 'vi',
+                                                   'python_name_with_doc_default': 'vi',
+                                                   'python_type': 'int',
+                                                   'size': {'mechanism': 'fixed', 'value': 1},
+                                                   'type': 'ViSession',
+                                                   'use_array': False,
+                                                   'use_in_python_api': True,
+                                                   'use_list': False},
+                                               {   'ctypes_type': 'ViConstString',
+                                                   'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                   'ctypes_variable_name': 'scanlist_ctype',
+                                                   'direction': 'in',
+                                                   'documentation': {'description': '\nThe scan list to use. The driver uses this value to set the Scan List\nattribute. Default value: None\n'},
+                                                   'enum': None,
+                                                   'is_buffer': False,
+                                                   'is_repeated_capability': False,
+                                                   'is_session_handle': False,
+                                                   'is_string': True,
+                                                   'library_method_call_snippet': 'scanlist_ctype',
+                                                   'name': 'Scanlist',
+                                                   'numpy': False,
+                                                   'numpy_into_return': False,
+                                                   'python_name': 'scanlist',
+                                                   'python_name_or_default_for_init': 'scanlist',
+                                                   'python_name_with_default': 'scanlist',
+                                                   'python_name_with_doc_default': 'scanlist',
+                                                   'python_type': 'str',
+                                                   'size': {'mechanism': 'fixed', 'value': 1},
+                                                   'type': 'ViConstString',
+                                                   'use_array': False,
+                                                   'use_in_python_api': True,
+                                                   'use_list': False},
+                                               {   'ctypes_type': 'ViInt32',
+                                                   'ctypes_type_library_call': 'ViInt32',
+                                                   'ctypes_variable_name': 'scan_mode_ctype',
+                                                   'default_value': 'ScanMode.BREAK_BEFORE_MAKE',
+                                                   'direction': 'in',
+                                                   'documentation': {   'description': '\n'
+                                                                                       'Specifies how the switch module breaks existing connections when\n'
+                                                                                       'scanning. The driver uses this value to set the Scan Mode attribute.\n'
+                                                                                       'Refer to scan modes for more information. Default value: Break Before\n'
+                                                                                       'Make\n'},
+                                                   'enum': 'ScanMode',
+                                                   'is_buffer': False,
+                                                   'is_repeated_capability': False,
+                                                   'is_session_handle': False,
+                                                   'is_string': False,
+                                                   'library_method_call_snippet': 'scan_mode_ctype',
+                                                   'name': 'scanMode',
+                                                   'numpy': False,
+                                                   'numpy_into_return': False,
+                                                   'python_name': 'scan_mode',
+                                                   'python_name_or_default_for_init': 'scan_mode',
+                                                   'python_name_with_default': 'scan_mode=enums.ScanMode.BREAK_BEFORE_MAKE',
+                                                   'python_name_with_doc_default': 'scan_mode=niswitch.ScanMode.BREAK_BEFORE_MAKE',
+                                                   'python_type': 'enums.ScanMode',
+                                                   'size': {'mechanism': 'fixed', 'value': 1},
+                                                   'type': 'ViInt32',
+                                                   'use_array': False,
+                                                   'use_in_python_api': True,
+                                                   'use_list': False}],
+                             'python_code_variables': [],
+                             'python_name': 'configure_scan_list',
+                             'render_in_library': True,
+                             'render_in_session_base': False,
+                             'returns': 'ViStatus'},
+    'ConfigureScanTrigger': {   'blocking': False,
+                                'codegen_method': 'public',
+                                'documentation': {   'description': '\n'
+                                                                    'Configures the scan triggers for the scan list established with\n'
+                                                                    'niSwitch_ConfigureScanList. Refer to Devices Overview to determine if\n'
+                                                                    'the switch module supports scanning. niSwitch_ConfigureScanTrigger sets\n'
+                                                                    'the location that the switch expects to receive an input trigger to\n'
+                                                                    'advance through the scan list. This function also sets the location\n'
+                                                                    'where it outputs a scan advanced signal after it completes an entry in\n'
+                                                                    'the scan list.\n'},
+                                'has_repeated_capability': False,
+                                'invalidates_attribute_cache': True,
+                                'is_error_handling': False,
+                                'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                'name': 'ConfigureScanTrigger',
+                                'parameters': [   {   'ctypes_type': 'ViSession',
+                                                      'ctypes_type_library_call': 'ViSession',
+                                                      'ctypes_variable_name': 'vi_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'A particular NI-SWITCH session established with\n'
+                                                                                          'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                          'and used for all subsequent NI-SWITCH calls.\n',
+                                                                           'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': True,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'vi_ctype',
+                                                      'name': 'vi',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'vi',
+                                                      'python_name_or_default_for_init': 'vi',
+                                                      'python_name_with_default': 'vi',
+                                                      'python_name_with_doc_default': 'vi',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViSession',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViReal64',
+                                                      'ctypes_type_library_call': 'ViReal64',
+                                                      'ctypes_variable_name': 'scan_delay_ctype',
+                                                      'default_value': 'datetime.timedelta(seconds=0.0)',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'The minimum length of time you want the switch device to wait after it\n'
+                                                                                          'creates a path until it asserts a trigger on the scan advanced output\n'
+                                                                                          'line. The driver uses this value to set the Scan Delay attribute. The\n'
+                                                                                          'scan delay is in addition to the settling time.The driver uses this\n'
+                                                                                          'value to set the NISWITCH_ATTR_SCAN_DELAY attribute. Express this\n'
+                                                                                          'value in seconds. Default value: 0.0 s\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'scan_delay_ctype',
+                                                      'name': 'scanDelay',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_api_converter_name': 'convert_timedelta_to_seconds',
+                                                      'python_api_converter_type': 'datetime.timedelta',
+                                                      'python_name': 'scan_delay',
+                                                      'python_name_or_default_for_init': '_converters.convert_timedelta_to_seconds(scan_delay, self._encoding)',
+                                                      'python_name_with_default': 'scan_delay=datetime.timedelta(seconds=0.0)',
+                                                      'python_name_with_doc_default': "scan_delay='datetime.timedelta(seconds=0.0)'",
+                                                      'python_type': 'float',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViReal64',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViInt32',
+                                                      'ctypes_type_library_call': 'ViInt32',
+                                                      'ctypes_variable_name': 'trigger_input_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Trigger source you want the switch module to use during scanning. The\n'
+                                                                                          'driver uses this value to set the NISWITCH_ATTR_TRIGGER_INPUT\n'
+                                                                                          'attribute. The switch device waits for the trigger you specify when it\n'
+                                                                                          'encounters a semicolon in the scanlist. When the trigger occurs, the\n'
+                                                                                          'switch device advances to the next entry in the scanlist. Refer to the\n'
+                                                                                          'NISWITCH_ATTR_TRIGGER_INPUT topic in the NI Switches Help for a list\n'
+                                                                                          'of valid values.\n'},
+                                                      'enum': 'TriggerInput',
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'trigger_input_ctype',
+                                                      'name': 'triggerInput',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'trigger_input',
+                                                      'python_name_or_default_for_init': 'trigger_input',
+                                                      'python_name_with_default': 'trigger_input',
+                                                      'python_name_with_doc_default': 'trigger_input',
+                                                      'python_type': 'enums.TriggerInput',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViInt32',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViInt32',
+                                                      'ctypes_type_library_call': 'ViInt32',
+                                                      'ctypes_variable_name': 'scan_advanced_output_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Output destination of the scan advanced trigger signal. The driver uses\n'
+                                                                                          'this value to set the NISWITCH_ATTR_SCAN_ADVANCED_OUTPUT attribute.\n'
+                                                                                          'After the switch processes each entry in the scan list, it waits the\n'
+                                                                                          'length of time you specify in the Scan Delay parameter and then asserts\n'
+                                                                                          'a trigger on the line you specify with this parameter. Refer to the\n'
+                                                                                          'NISWITCH_ATTR_SCAN_ADVANCED_OUTPUT topic in the NI Switches Help for\n'
+                                                                                          'a list of valid values.\n'},
+                                                      'enum': 'ScanAdvancedOutput',
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'scan_advanced_output_ctype',
+                                                      'name': 'scanAdvancedOutput',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'scan_advanced_output',
+                                                      'python_name_or_default_for_init': 'scan_advanced_output',
+                                                      'python_name_with_default': 'scan_advanced_output',
+                                                      'python_name_with_doc_default': 'scan_advanced_output',
+                                                      'python_type': 'enums.ScanAdvancedOutput',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViInt32',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False}],
+                                'python_code_variables': [],
+                                'python_name': 'configure_scan_trigger',
+                                'render_in_library': True,
+                                'render_in_session_base': False,
+                                'returns': 'ViStatus'},
+    'Connect': {   'blocking': False,
+                   'codegen_method': 'public',
+                   'documentation': {   'description': '\n'
+                                                       'Creates a path between channel 1 and channel 2. The driver calculates\n'
+                                                       'and uses the shortest path between the two channels. Refer to Immediate\n'
+                                                       'Operations for information about Channel Usage types. If a path is not\n'
+                                                       'available, the function returns one of the following errors: -\n'
+                                                       'NISWITCH_ERROR_EXPLICIT_CONNECTION_EXISTS, if the two channels are\n'
+                                                       'already explicitly connected by calling either the niSwitch_Connect or\n'
+                                                       'niSwitch_SetPath function. -\n'
+                                                       'NISWITCH_ERROR_IS_CONFIGURATION_CHANNEL, if a channel is a\n'
+                                                       'configuration channel. Error elaboration contains information about\n'
+                                                       'which of the two channels is a configuration channel. -\n'
+                                                       'NISWITCH_ERROR_ATTEMPT_TO_CONNECT_SOURCES, if both channels are\n'
+                                                       'connected to a different source. Error elaboration contains information\n'
+                                                       'about sources channel 1 and 2 connect to. -\n'
+                                                       'NISWITCH_ERROR_CANNOT_CONNECT_TO_ITSELF, if channels 1 and 2 are\n'
+                                                       'one and the same channel. - NISWITCH_ERROR_PATH_NOT_FOUND, if the\n'
+                                                       'driver cannot find a path between the two channels. Note: Paths are\n'
+                                                       'bidirectional. For example, if a path exists between channels CH1 and\n'
+                                                       'CH2, then the path also exists between channels CH2 and CH1.\n'},
+                   'has_repeated_capability': False,
+                   'invalidates_attribute_cache': True,
+                   'is_error_handling': False,
+                   'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                   'name': 'Connect',
+                   'parameters': [   {   'ctypes_type': 'ViSession',
+                                         'ctypes_type_library_call': 'ViSession',
+                                         'ctypes_variable_name': 'vi_ctype',
+                                         'direction': 'in',
+                                         'documentation': {   'description': '\n'
+                                                                             'A particular NI-SWITCH session established with\n'
+                                                                             'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                             'and used for all subsequent NI-SWITCH calls.\n',
+                                                              'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                         'enum': None,
+                                         'is_buffer': False,
+                                         'is_repeated_capability': False,
+                                         'is_session_handle': True,
+                                         'is_string': False,
+                                         'library_method_call_snippet': 'vi_ctype',
+                                         'name': 'vi',
+                                         'numpy': False,
+                                         'numpy_into_return': False,
+                                         'python_name': 'vi',
+                                         'python_name_or_default_for_init': 'vi',
+                                         'python_name_with_default': 'vi',
+                                         'python_name_with_doc_default': 'vi',
+                                         'python_type': 'int',
+                                         'size': {'mechanism': 'fixed', 'value': 1},
+                                         'type': 'ViSession',
+                                         'use_array': False,
+                                         'use_in_python_api': True,
+                                         'use_list': False},
+                                     {   'ctypes_type': 'ViConstString',
+                                         'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                         'ctypes_variable_name': 'channel1_ctype',
+                                         'direction': 'in',
+                                         'documentation': {   'description': '\n'
+                                                                             'Input one of the channel names of the desired path. Pass the other\n'
+                                                                             'channel name as the channel 2 parameter. Refer to Devices Overview for\n'
+                                                                             'valid channel names for the switch module. Examples of valid channel\n'
+                                                                             'names: ch0, com0, ab0, r1, c2, cjtemp Default value: None\n'},
+                                         'enum': None,
+                                         'is_buffer': False,
+                                         'is_repeated_capability': False,
+                                         'is_session_handle': False,
+                                         'is_string': True,
+                                         'library_method_call_snippet': 'channel1_ctype',
+                                         'name': 'channel1',
+                                         'numpy': False,
+                                         'numpy_into_return': False,
+                                         'python_name': 'channel1',
+                                         'python_name_or_default_for_init': 'channel1',
+                                         'python_name_with_default': 'channel1',
+                                         'python_name_with_doc_default': 'channel1',
+                                         'python_type': 'str',
+                                         'size': {'mechanism': 'fixed', 'value': 1},
+                                         'type': 'ViConstString',
+                                         'use_array': False,
+                                         'use_in_python_api': True,
+                                         'use_list': False},
+                                     {   'ctypes_type': 'ViConstString',
+                                         'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                         'ctypes_variable_name': 'channel2_ctype',
+                                         'direction': 'in',
+                                         'documentation': {   'description': '\n'
+                                                                             'Input one of the channel names of the desired path. Pass the other\n'
+                                                                             'channel name as the channel 1 parameter. Refer to Devices Overview for\n'
+                                                                             'valid channel names for the switch module. Examples of valid channel\n'
+                                                                             'names: ch0, com0, ab0, r1, c2, cjtemp Default value: None\n'},
+                                         'enum': None,
+                                         'is_buffer': False,
+                                         'is_repeated_capability': False,
+                                         'is_session_handle': False,
+                                         'is_string': True,
+                                         'library_method_call_snippet': 'channel2_ctype',
+                                         'name': 'channel2',
+                                         'numpy': False,
+                                         'numpy_into_return': False,
+                                         'python_name': 'channel2',
+                                         'python_name_or_default_for_init': 'channel2',
+                                         'python_name_with_default': 'channel2',
+                                         'python_name_with_doc_default': 'channel2',
+                                         'python_type': 'str',
+                                         'size': {'mechanism': 'fixed', 'value': 1},
+                                         'type': 'ViConstString',
+                                         'use_array': False,
+                                         'use_in_python_api': True,
+                                         'use_list': False}],
+                   'python_code_variables': [],
+                   'python_name': 'connect',
+                   'render_in_library': True,
+                   'render_in_session_base': False,
+                   'returns': 'ViStatus'},
+    'ConnectMultiple': {   'blocking': False,
+                           'codegen_method': 'public',
+                           'documentation': {   'description': '\n'
+                                                               'Creates the connections between channels specified in Connection List.\n'
+                                                               'Specify connections with two endpoints only or the explicit path between\n'
+                                                               'two endpoints. NI-SWITCH calculates and uses the shortest path between\n'
+                                                               'the channels. Refer to Setting Source and Configuration Channels for\n'
+                                                               'information about channel usage types. In the event of an error,\n'
+                                                               'connecting stops at the point in the list where the error occurred. If a\n'
+                                                               'path is not available, the function returns one of the following errors:\n'
+                                                               '- NISWITCH_ERROR_EXPLICIT_CONNECTION_EXISTS, if the two channels are\n'
+                                                               'already explicitly connected. -\n'
+                                                               'NISWITCH_ERROR_IS_CONFIGURATION_CHANNEL, if a channel is a\n'
+                                                               'configuration channel. Error elaboration contains information about\n'
+                                                               'which of the two channels is a configuration channel. -\n'
+                                                               'NISWITCH_ERROR_ATTEMPT_TO_CONNECT_SOURCES, if both channels are\n'
+                                                               'connected to a different source. Error elaboration contains information\n'
+                                                               'about sources channel 1 and 2 to connect. -\n'
+                                                               'NISWITCH_ERROR_CANNOT_CONNECT_TO_ITSELF, if channels 1 and 2 are\n'
+                                                               'one and the same channel. - NISWITCH_ERROR_PATH_NOT_FOUND, if the\n'
+                                                               'driver cannot find a path between the two channels. Note: Paths are\n'
+                                                               'bidirectional. For example, if a path exists between channels ch1 and\n'
+                                                               'ch2, then the path also exists between channels ch1 and ch2.\n'},
+                           'has_repeated_capability': False,
+                           'invalidates_attribute_cache': True,
+                           'is_error_handling': False,
+                           'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                           'name': 'ConnectMultiple',
+                           'parameters': [   {   'ctypes_type': 'ViSession',
+                                                 'ctypes_type_library_call': 'ViSession',
+                                                 'ctypes_variable_name': 'vi_ctype',
+                                                 'direction': 'in',
+                                                 'documentation': {   'description': '\n'
+                                                                                     'A particular NI-SWITCH session established with\n'
+                                                                                     'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                     'and used for all subsequent NI-SWITCH calls.\n',
+                                                                      'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                 'enum': None,
+                                                 'is_buffer': False,
+                                                 'is_repeated_capability': False,
+                                                 'is_session_handle': True,
+                                                 'is_string': False,
+                                                 'library_method_call_snippet': 'vi_ctype',
+                                                 'name': 'vi',
+                                                 'numpy': False,
+                                                 'numpy_into_return': False,
+                                                 'python_name': 'vi',
+                                                 'python_name_or_default_for_init': 'vi',
+                                                 'python_name_with_default': 'vi',
+                                                 'python_name_with_doc_default': 'vi',
+                                                 'python_type': 'int',
+                                                 'size': {'mechanism': 'fixed', 'value': 1},
+                                                 'type': 'ViSession',
+                                                 'use_array': False,
+                                                 'use_in_python_api': True,
+                                                 'use_list': False},
+                                             {   'ctypes_type': 'ViConstString',
+                                                 'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                 'ctypes_variable_name': 'connection_list_ctype',
+                                                 'direction': 'in',
+                                                 'documentation': {   'description': '\n'
+                                                                                     'Connection List specifies a list of connections between channels to\n'
+                                                                                     'make. NI-SWITCH validates the connection list, and aborts execution of\n'
+                                                                                     'the list if errors are returned. Refer to Connection and Disconnection\n'
+                                                                                     'List Syntax for valid connection list syntax and examples. Refer to\n'
+                                                                                     'Devices Overview for valid channel names for the switch module. Example\n'
+                                                                                     'of a valid connection list: c0 -> r1, [c2 -> r2 -> c3] In this example,\n'
+                                                                                     'r2 is a configuration channel. Default value: None\n'},
+                                                 'enum': None,
+                                                 'is_buffer': False,
+                                                 'is_repeated_capability': False,
+                                                 'is_session_handle': False,
+                                                 'is_string': True,
+                                                 'library_method_call_snippet': 'connection_list_ctype',
+                                                 'name': 'connectionList',
+                                                 'numpy': False,
+                                                 'numpy_into_return': False,
+                                                 'python_name': 'connection_list',
+                                                 'python_name_or_default_for_init': 'connection_list',
+                                                 'python_name_with_default': 'connection_list',
+                                                 'python_name_with_doc_default': 'connection_list',
+                                                 'python_type': 'str',
+                                                 'size': {'mechanism': 'fixed', 'value': 1},
+                                                 'type': 'ViConstString',
+                                                 'use_array': False,
+                                                 'use_in_python_api': True,
+                                                 'use_list': False}],
+                           'python_code_variables': [],
+                           'python_name': 'connect_multiple',
+                           'render_in_library': True,
+                           'render_in_session_base': False,
+                           'returns': 'ViStatus'},
+    'Disable': {   'blocking': False,
+                   'codegen_method': 'public',
+                   'documentation': {   'description': '\n'
+                                                       'Places the switch module in a quiescent state where it has minimal or no\n'
+                                                       'impact on the system to which it is connected. All channels are\n'
+                                                       'disconnected and any scan in progress is aborted.\n'},
+                   'has_repeated_capability': False,
+                   'invalidates_attribute_cache': True,
+                   'is_error_handling': False,
+                   'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                   'name': 'Disable',
+                   'parameters': [   {   'ctypes_type': 'ViSession',
+                                         'ctypes_type_library_call': 'ViSession',
+                                         'ctypes_variable_name': 'vi_ctype',
+                                         'direction': 'in',
+                                         'documentation': {   'description': '\n'
+                                                                             'A particular NI-SWITCH session established with\n'
+                                                                             'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                             'and used for all subsequent NI-SWITCH calls.\n',
+                                                              'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                         'enum': None,
+                                         'is_buffer': False,
+                                         'is_repeated_capability': False,
+                                         'is_session_handle': True,
+                                         'is_string': False,
+                                         'library_method_call_snippet': 'vi_ctype',
+                                         'name': 'vi',
+                                         'numpy': False,
+                                         'numpy_into_return': False,
+                                         'python_name': 'vi',
+                                         'python_name_or_default_for_init': 'vi',
+                                         'python_name_with_default': 'vi',
+                                         'python_name_with_doc_default': 'vi',
+                                         'python_type': 'int',
+                                         'size': {'mechanism': 'fixed', 'value': 1},
+                                         'type': 'ViSession',
+                                         'use_array': False,
+                                         'use_in_python_api': True,
+                                         'use_list': False}],
+                   'python_code_variables': [],
+                   'python_name': 'disable',
+                   'render_in_library': True,
+                   'render_in_session_base': False,
+                   'returns': 'ViStatus'},
+    'Disconnect': {   'blocking': False,
+                      'codegen_method': 'public',
+                      'documentation': {   'description': '\n'
+                                                          'This function destroys the path between two channels that you create\n'
+                                                          'with the niSwitch_Connect or niSwitch_SetPath function. If a path is\n'
+                                                          'not connected or not available, the function returns the\n'
+                                                          'IVISWTCH_ERROR_NO_SUCH_PATH error.\n'},
+                      'has_repeated_capability': False,
+                      'invalidates_attribute_cache': True,
+                      'is_error_handling': False,
+                      'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                      'name': 'Disconnect',
+                      'parameters': [   {   'ctypes_type': 'ViSession',
+                                            'ctypes_type_library_call': 'ViSession',
+                                            'ctypes_variable_name': 'vi_ctype',
+                                            'direction': 'in',
+                                            'documentation': {   'description': '\n'
+                                                                                'A particular NI-SWITCH session established with\n'
+                                                                                'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                'and used for all subsequent NI-SWITCH calls.\n',
+                                                                 'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                            'enum': None,
+                                            'is_buffer': False,
+                                            'is_repeated_capability': False,
+                                            'is_session_handle': True,
+                                            'is_string': False,
+                                            'library_method_call_snippet': 'vi_ctype',
+                                            'name': 'vi',
+                                            'numpy': False,
+                                            'numpy_into_return': False,
+                                            'python_name': 'vi',
+                                            'python_name_or_default_for_init': 'vi',
+                                            'python_name_with_default': 'vi',
+                                            'python_name_with_doc_default': 'vi',
+                                            'python_type': 'int',
+                                            'size': {'mechanism': 'fixed', 'value': 1},
+                                            'type': 'ViSession',
+                                            'use_array': False,
+                                            'use_in_python_api': True,
+                                            'use_list': False},
+                                        {   'ctypes_type': 'ViConstString',
+                                            'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                            'ctypes_variable_name': 'channel1_ctype',
+                                            'direction': 'in',
+                                            'documentation': {   'description': '\n'
+                                                                                'Input one of the channel names of the path to break. Pass the other\n'
+                                                                                'channel name as the channel 2 parameter. Refer to Devices Overview for\n'
+                                                                                'valid channel names for the switch module. Examples of valid channel\n'
+                                                                                'names: ch0, com0, ab0, r1, c2, cjtemp Default value: None\n'},
+                                            'enum': None,
+                                            'is_buffer': False,
+                                            'is_repeated_capability': False,
+                                            'is_session_handle': False,
+                                            'is_string': True,
+                                            'library_method_call_snippet': 'channel1_ctype',
+                                            'name': 'channel1',
+                                            'numpy': False,
+                                            'numpy_into_return': False,
+                                            'python_name': 'channel1',
+                                            'python_name_or_default_for_init': 'channel1',
+                                            'python_name_with_default': 'channel1',
+                                            'python_name_with_doc_default': 'channel1',
+                                            'python_type': 'str',
+                                            'size': {'mechanism': 'fixed', 'value': 1},
+                                            'type': 'ViConstString',
+                                            'use_array': False,
+                                            'use_in_python_api': True,
+                                            'use_list': False},
+                                        {   'ctypes_type': 'ViConstString',
+                                            'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                            'ctypes_variable_name': 'channel2_ctype',
+                                            'direction': 'in',
+                                            'documentation': {   'description': '\n'
+                                                                                'Input one of the channel names of the path to break. Pass the other\n'
+                                                                                'channel name as the channel 1 parameter. Refer to Devices Overview for\n'
+                                                                                'valid channel names for the switch module. Examples of valid channel\n'
+                                                                                'names: ch0, com0, ab0, r1, c2, cjtemp Default value: None\n'},
+                                            'enum': None,
+                                            'is_buffer': False,
+                                            'is_repeated_capability': False,
+                                            'is_session_handle': False,
+                                            'is_string': True,
+                                            'library_method_call_snippet': 'channel2_ctype',
+                                            'name': 'channel2',
+                                            'numpy': False,
+                                            'numpy_into_return': False,
+                                            'python_name': 'channel2',
+                                            'python_name_or_default_for_init': 'channel2',
+                                            'python_name_with_default': 'channel2',
+                                            'python_name_with_doc_default': 'channel2',
+                                            'python_type': 'str',
+                                            'size': {'mechanism': 'fixed', 'value': 1},
+                                            'type': 'ViConstString',
+                                            'use_array': False,
+                                            'use_in_python_api': True,
+                                            'use_list': False}],
+                      'python_code_variables': [],
+                      'python_name': 'disconnect',
+                      'render_in_library': True,
+                      'render_in_session_base': False,
+                      'returns': 'ViStatus'},
+    'DisconnectAll': {   'blocking': False,
+                         'codegen_method': 'public',
+                         'documentation': {'description': '\nBreaks all existing paths. If the switch module cannot break all paths,\nNISWITCH_WARN_PATH_REMAINS warning is returned.\n'},
+                         'has_repeated_capability': False,
+                         'invalidates_attribute_cache': True,
+                         'is_error_handling': False,
+                         'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                         'name': 'DisconnectAll',
+                         'parameters': [   {   'ctypes_type': 'ViSession',
+                                               'ctypes_type_library_call': 'ViSession',
+                                               'ctypes_variable_name': 'vi_ctype',
+                                               'direction': 'in',
+                                               'documentation': {   'description': '\n'
+                                                                                   'A particular NI-SWITCH session established with\n'
+                                                                                   'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                   'and used for all subsequent NI-SWITCH calls.\n',
+                                                                    'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                               'enum': None,
+                                               'is_buffer': False,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': True,
+                                               'is_string': False,
+                                               'library_method_call_snippet': 'vi_ctype',
+                                               'name': 'vi',
+                                               'numpy': False,
+                                               'numpy_into_return': False,
+                                               'python_name': 'vi',
+                                               'python_name_or_default_for_init': 'vi',
+                                               'python_name_with_default': 'vi',
+                                               'python_name_with_doc_default': 'vi',
+                                               'python_type': 'int',
+                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                               'type': 'ViSession',
+                                               'use_array': False,
+                                               'use_in_python_api': True,
+                                               'use_list': False}],
+                         'python_code_variables': [],
+                         'python_name': 'disconnect_all',
+                         'render_in_library': True,
+                         'render_in_session_base': False,
+                         'returns': 'ViStatus'},
+    'DisconnectMultiple': {   'blocking': False,
+                              'codegen_method': 'public',
+                              'documentation': {   'description': '\n'
+                                                                  'Breaks the connections between channels specified in Disconnection List.\n'
+                                                                  'If no connections exist between channels, NI-SWITCH returns an error. In\n'
+                                                                  'the event of an error, the VI stops at the point in the list where the\n'
+                                                                  'error occurred.\n'},
+                              'has_repeated_capability': False,
+                              'invalidates_attribute_cache': True,
+                              'is_error_handling': False,
+                              'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                              'name': 'DisconnectMultiple',
+                              'parameters': [   {   'ctypes_type': 'ViSession',
+                                                    'ctypes_type_library_call': 'ViSession',
+                                                    'ctypes_variable_name': 'vi_ctype',
+                                                    'direction': 'in',
+                                                    'documentation': {   'description': '\n'
+                                                                                        'A particular NI-SWITCH session established with\n'
+                                                                                        'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                        'and used for all subsequent NI-SWITCH calls.\n',
+                                                                         'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                    'enum': None,
+                                                    'is_buffer': False,
+                                                    'is_repeated_capability': False,
+                                                    'is_session_handle': True,
+                                                    'is_string': False,
+                                                    'library_method_call_snippet': 'vi_ctype',
+                                                    'name': 'vi',
+                                                    'numpy': False,
+                                                    'numpy_into_return': False,
+                                                    'python_name': 'vi',
+                                                    'python_name_or_default_for_init': 'vi',
+                                                    'python_name_with_default': 'vi',
+                                                    'python_name_with_doc_default': 'vi',
+                                                    'python_type': 'int',
+                                                    'size': {'mechanism': 'fixed', 'value': 1},
+                                                    'type': 'ViSession',
+                                                    'use_array': False,
+                                                    'use_in_python_api': True,
+                                                    'use_list': False},
+                                                {   'ctypes_type': 'ViConstString',
+                                                    'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                    'ctypes_variable_name': 'disconnection_list_ctype',
+                                                    'direction': 'in',
+                                                    'documentation': {   'description': '\n'
+                                                                                        'Disconnection List specifies a list of connections between channels to\n'
+                                                                                        'break. NI-SWITCH validates the disconnection list, and aborts execution\n'
+                                                                                        'of the list if errors are returned. Refer to Connection and\n'
+                                                                                        'Disconnection List Syntax for valid disconnection list syntax and\n'
+                                                                                        'examples. Refer to Devices Overview for valid channel names for the\n'
+                                                                                        'switch module. Example of a valid disconnection list: c0 -> r1, [c2 ->\n'
+                                                                                        'r2 -> c3] In this example, r2 is a configuration channel. Default value:\n'
+                                                                                        'None\n'},
+                                                    'enum': None,
+                                                    'is_buffer': False,
+                                                    'is_repeated_capability': False,
+                                                    'is_session_handle': False,
+                                                    'is_string': True,
+                                                    'library_method_call_snippet': 'disconnection_list_ctype',
+                                                    'name': 'disconnectionList',
+                                                    'numpy': False,
+                                                    'numpy_into_return': False,
+                                                    'python_name': 'disconnection_list',
+                                                    'python_name_or_default_for_init': 'disconnection_list',
+                                                    'python_name_with_default': 'disconnection_list',
+                                                    'python_name_with_doc_default': 'disconnection_list',
+                                                    'python_type': 'str',
+                                                    'size': {'mechanism': 'fixed', 'value': 1},
+                                                    'type': 'ViConstString',
+                                                    'use_array': False,
+                                                    'use_in_python_api': True,
+                                                    'use_list': False}],
+                              'python_code_variables': [],
+                              'python_name': 'disconnect_multiple',
+                              'render_in_library': True,
+                              'render_in_session_base': False,
+                              'returns': 'ViStatus'},
+    'GetAttributeViBoolean': {   'blocking': False,
+                                 'codegen_method': 'private',
+                                 'documentation': {   'description': '\n'
+                                                                     'This function queries the value of a ViBoolean attribute. You can use\n'
+                                                                     'this function to get the values of instrument specific attributes and\n'
+                                                                     'inherent IVI attributes. If the attribute represents an instrument\n'
+                                                                     'state, this function performs instrument I/O in the following cases: -\n'
+                                                                     'State caching is disabled for the entire session or for the particular\n'
+                                                                     'attribute. - State caching is enabled and the currently cached value is\n'
+                                                                     'invalid.\n'},
+                                 'has_repeated_capability': True,
+                                 'invalidates_attribute_cache': False,
+                                 'is_error_handling': False,
+                                 'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                 'name': 'GetAttributeViBoolean',
+                                 'parameters': [   {   'ctypes_type': 'ViSession',
+                                                       'ctypes_type_library_call': 'ViSession',
+                                                       'ctypes_variable_name': 'vi_ctype',
+                                                       'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'A particular NI-SWITCH session established with\n'
+                                                                                           'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                           'and used for all subsequent NI-SWITCH calls.\n',
+                                                                            'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': True,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'vi_ctype',
+                                                       'name': 'vi',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'vi',
+                                                       'python_name_or_default_for_init': 'vi',
+                                                       'python_name_with_default': 'vi',
+                                                       'python_name_with_doc_default': 'vi',
+                                                       'python_type': 'int',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViSession',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False},
+                                                   {   'ctypes_type': 'ViConstString',
+                                                       'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                       'ctypes_variable_name': 'channel_name_ctype',
+                                                       'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Some attributes are unique per channel. For these, pass the name of the\n'
+                                                                                           'channel. Other attributes are unique per switch device. Pass VI_NULL or\n'
+                                                                                           'an empty string for this parameter. Default Value: ""\n'},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': True,
+                                                       'is_session_handle': False,
+                                                       'is_string': True,
+                                                       'library_method_call_snippet': 'channel_name_ctype',
+                                                       'name': 'channelName',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'channel_name',
+                                                       'python_name_or_default_for_init': 'channel_name',
+                                                       'python_name_with_default': 'channel_name',
+                                                       'python_name_with_doc_default': 'channel_name',
+                                                       'python_type': 'str',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViConstString',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False},
+                                                   {   'ctypes_type': 'ViAttr',
+                                                       'ctypes_type_library_call': 'ViAttr',
+                                                       'ctypes_variable_name': 'attribute_id_ctype',
+                                                       'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Pass the ID of an attribute. From the function panel window, you can use\n'
+                                                                                           'this control as follows. - Click on the control or press , , or , to\n'
+                                                                                           'display a dialog box containing a hierarchical list of the available\n'
+                                                                                           'attributes. Attributes whose value cannot be set are dim. Help text is\n'
+                                                                                           'shown for each attribute. Select an attribute by double-clicking on it\n'
+                                                                                           'or by selecting it and then pressing . A ring control at the top of the\n'
+                                                                                           'dialog box allows you to see all IVI attributes or only the attributes\n'
+                                                                                           'of the ViInt32 type. If you choose to see all IVI attributes, the data\n'
+                                                                                           'types appear to the right of the attribute names in the list box. The\n'
+                                                                                           'data types that are not consistent with this function are dim. If you\n'
+                                                                                           'select an attribute data type that is dim, LabWindows/CVI transfers you\n'
+                                                                                           'to the function panel for the corresponding function that is consistent\n'
+                                                                                           'with the data type. - If you want to enter a variable name, press to\n'
+                                                                                           'change this ring control to a manual input box. - If the attribute in\n'
+                                                                                           'this ring control has constants as valid values, you can view the\n'
+                                                                                           'constants by moving to the Attribute Value control and pressing .\n'},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': False,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'attribute_id_ctype',
+                                                       'name': 'attributeId',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'attribute_id',
+                                                       'python_name_or_default_for_init': 'attribute_id',
+                                                       'python_name_with_default': 'attribute_id',
+                                                       'python_name_with_doc_default': 'attribute_id',
+                                                       'python_type': 'int',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViAttr',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False},
+                                                   {   'ctypes_type': 'ViBoolean',
+                                                       'ctypes_type_library_call': 'ctypes.POINTER(ViBoolean)',
+                                                       'ctypes_variable_name': 'attribute_value_ctype',
+                                                       'direction': 'out',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Returns the current value of the attribute. Pass the address of a\n'
+                                                                                           'ViBoolean variable. From the function panel window, you can use this\n'
+                                                                                           'control as follows. - If the attribute currently showing in the\n'
+                                                                                           'Attribute ID ring control has constants as valid values, you can view a\n'
+                                                                                           'list of the constants by pressing on this control. Select a value by\n'
+                                                                                           'double-clicking on it or by selecting it and then pressing .\n'},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': False,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'None if attribute_value_ctype is None else (ctypes.pointer(attribute_value_ctype))',
+                                                       'name': 'attributeValue',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'attribute_value',
+                                                       'python_name_or_default_for_init': 'attribute_value',
+                                                       'python_name_with_default': 'attribute_value',
+                                                       'python_name_with_doc_default': 'attribute_value',
+                                                       'python_type': 'bool',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViBoolean',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False}],
+                                 'python_code_variables': [],
+                                 'python_name': '_get_attribute_vi_boolean',
+                                 'render_in_library': True,
+                                 'render_in_session_base': True,
+                                 'returns': 'ViStatus'},
+    'GetAttributeViInt32': {   'blocking': False,
+                               'codegen_method': 'private',
+                               'documentation': {   'description': '\n'
+                                                                   'This function queries the value of a ViInt32 attribute. You can use this\n'
+                                                                   'function to get the values of instrument specific attributes and\n'
+                                                                   'inherent IVI attributes. If the attribute represents an instrument\n'
+                                                                   'state, this function performs instrument I/O in the following cases: -\n'
+                                                                   'State caching is disabled for the entire session or for the particular\n'
+                                                                   'attribute. - State caching is enabled and the currently cached value is\n'
+                                                                   'invalid.\n'},
+                               'has_repeated_capability': True,
+                               'invalidates_attribute_cache': False,
+                               'is_error_handling': False,
+                               'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                               'name': 'GetAttributeViInt32',
+                               'parameters': [   {   'ctypes_type': 'ViSession',
+                                                     'ctypes_type_library_call': 'ViSession',
+                                                     'ctypes_variable_name': 'vi_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'A particular NI-SWITCH session established with\n'
+                                                                                         'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                         'and used for all subsequent NI-SWITCH calls.\n',
+                                                                          'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': True,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'vi_ctype',
+                                                     'name': 'vi',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'vi',
+                                                     'python_name_or_default_for_init': 'vi',
+                                                     'python_name_with_default': 'vi',
+                                                     'python_name_with_doc_default': 'vi',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViSession',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViConstString',
+                                                     'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                     'ctypes_variable_name': 'channel_name_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'Some attributes are unique per channel. For these, pass the name of the\n'
+                                                                                         'channel. Other attributes are unique per switch device. Pass VI_NULL or\n'
+                                                                                         'an empty string for this parameter. Default Value: ""\n'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': True,
+                                                     'is_session_handle': False,
+                                                     'is_string': True,
+                                                     'library_method_call_snippet': 'channel_name_ctype',
+                                                     'name': 'channelName',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'channel_name',
+                                                     'python_name_or_default_for_init': 'channel_name',
+                                                     'python_name_with_default': 'channel_name',
+                                                     'python_name_with_doc_default': 'channel_name',
+                                                     'python_type': 'str',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViConstString',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViAttr',
+                                                     'ctypes_type_library_call': 'ViAttr',
+                                                     'ctypes_variable_name': 'attribute_id_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'Pass the ID of an attribute. From the function panel window, you can use\n'
+                                                                                         'this control as follows. - Click on the control or press , , or , to\n'
+                                                                                         'display a dialog box containing a hierarchical list of the available\n'
+                                                                                         'attributes. Attributes whose value cannot be set are dim. Help text is\n'
+                                                                                         'shown for each attribute. Select an attribute by double-clicking on it\n'
+                                                                                         'or by selecting it and then pressing . A ring control at the top of the\n'
+                                                                                         'dialog box allows you to see all IVI attributes or only the attributes\n'
+                                                                                         'of the ViInt32 type. If you choose to see all IVI attributes, the data\n'
+                                                                                         'types appear to the right of the attribute names in the list box. The\n'
+                                                                                         'data types that are not consistent with this function are dim. If you\n'
+                                                                                         'select an attribute data type that is dim, LabWindows/CVI transfers you\n'
+                                                                                         'to the function panel for the corresponding function that is consistent\n'
+                                                                                         'with the data type. - If you want to enter a variable name, press to\n'
+                                                                                         'change this ring control to a manual input box. - If the attribute in\n'
+                                                                                         'this ring control has constants as valid values, you can view the\n'
+                                                                                         'constants by moving to the Attribute Value control and pressing .\n'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'attribute_id_ctype',
+                                                     'name': 'attributeId',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'attribute_id',
+                                                     'python_name_or_default_for_init': 'attribute_id',
+                                                     'python_name_with_default': 'attribute_id',
+                                                     'python_name_with_doc_default': 'attribute_id',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViAttr',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViInt32',
+                                                     'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                                     'ctypes_variable_name': 'attribute_value_ctype',
+                                                     'direction': 'out',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'Returns the current value of the attribute. Pass the address of a\n'
+                                                                                         'ViInt32 variable. From the function panel window, you can use this\n'
+                                                                                         'control as follows. - If the attribute currently showing in the\n'
+                                                                                         'Attribute ID ring control has constants as valid values, you can view a\n'
+                                                                                         'list of the constants by pressing on this control. Select a value by\n'
+                                                                                         'double-clicking on it or by selecting it and then pressing .\n'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'None if attribute_value_ctype is None else (ctypes.pointer(attribute_value_ctype))',
+                                                     'name': 'attributeValue',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'attribute_value',
+                                                     'python_name_or_default_for_init': 'attribute_value',
+                                                     'python_name_with_default': 'attribute_value',
+                                                     'python_name_with_doc_default': 'attribute_value',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViInt32',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False}],
+                               'python_code_variables': [],
+                               'python_name': '_get_attribute_vi_int32',
+                               'render_in_library': True,
+                               'render_in_session_base': True,
+                               'returns': 'ViStatus'},
+    'GetAttributeViReal64': {   'blocking': False,
+                                'codegen_method': 'private',
+                                'documentation': {   'description': '\n'
+                                                                    'This function queries the value of a ViReal64 attribute. You can use\n'
+                                                                    'this function to get the values of instrument specific attributes and\n'
+                                                                    'inherent IVI attributes. If the attribute represents an instrument\n'
+                                                                    'state, this function performs instrument I/O in the following cases: -\n'
+                                                                    'State caching is disabled for the entire session or for the particular\n'
+                                                                    'attribute. - State caching is enabled and the currently cached value is\n'
+                                                                    'invalid.\n'},
+                                'has_repeated_capability': True,
+                                'invalidates_attribute_cache': False,
+                                'is_error_handling': False,
+                                'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                'name': 'GetAttributeViReal64',
+                                'parameters': [   {   'ctypes_type': 'ViSession',
+                                                      'ctypes_type_library_call': 'ViSession',
+                                                      'ctypes_variable_name': 'vi_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'A particular NI-SWITCH session established with\n'
+                                                                                          'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                          'and used for all subsequent NI-SWITCH calls.\n',
+                                                                           'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': True,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'vi_ctype',
+                                                      'name': 'vi',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'vi',
+                                                      'python_name_or_default_for_init': 'vi',
+                                                      'python_name_with_default': 'vi',
+                                                      'python_name_with_doc_default': 'vi',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViSession',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViConstString',
+                                                      'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                      'ctypes_variable_name': 'channel_name_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Some attributes are unique per channel. For these, pass the name of the\n'
+                                                                                          'channel. Other attributes are unique per switch device. Pass VI_NULL or\n'
+                                                                                          'an empty string for this parameter. Default Value: ""\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': True,
+                                                      'is_session_handle': False,
+                                                      'is_string': True,
+                                                      'library_method_call_snippet': 'channel_name_ctype',
+                                                      'name': 'channelName',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'channel_name',
+                                                      'python_name_or_default_for_init': 'channel_name',
+                                                      'python_name_with_default': 'channel_name',
+                                                      'python_name_with_doc_default': 'channel_name',
+                                                      'python_type': 'str',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViConstString',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViAttr',
+                                                      'ctypes_type_library_call': 'ViAttr',
+                                                      'ctypes_variable_name': 'attribute_id_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Pass the ID of an attribute. From the function panel window, you can use\n'
+                                                                                          'this control as follows. - Click on the control or press , , or , to\n'
+                                                                                          'display a dialog box containing a hierarchical list of the available\n'
+                                                                                          'attributes. Attributes whose value cannot be set are dim. Help text is\n'
+                                                                                          'shown for each attribute. Select an attribute by double-clicking on it\n'
+                                                                                          'or by selecting it and then pressing . A ring control at the top of the\n'
+                                                                                          'dialog box allows you to see all IVI attributes or only the attributes\n'
+                                                                                          'of the ViInt32 type. If you choose to see all IVI attributes, the data\n'
+                                                                                          'types appear to the right of the attribute names in the list box. The\n'
+                                                                                          'data types that are not consistent with this function are dim. If you\n'
+                                                                                          'select an attribute data type that is dim, LabWindows/CVI transfers you\n'
+                                                                                          'to the function panel for the corresponding function that is consistent\n'
+                                                                                          'with the data type. - If you want to enter a variable name, press to\n'
+                                                                                          'change this ring control to a manual input box. - If the attribute in\n'
+                                                                                          'this ring control has constants as valid values, you can view the\n'
+                                                                                          'constants by moving to the Attribute Value control and pressing .\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'attribute_id_ctype',
+                                                      'name': 'attributeId',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'attribute_id',
+                                                      'python_name_or_default_for_init': 'attribute_id',
+                                                      'python_name_with_default': 'attribute_id',
+                                                      'python_name_with_doc_default': 'attribute_id',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViAttr',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViReal64',
+                                                      'ctypes_type_library_call': 'ctypes.POINTER(ViReal64)',
+                                                      'ctypes_variable_name': 'attribute_value_ctype',
+                                                      'direction': 'out',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Returns the current value of the attribute. Pass the address of a\n'
+                                                                                          'ViReal64 variable. From the function panel window, you can use this\n'
+                                                                                          'control as follows. - If the attribute currently showing in the\n'
+                                                                                          'Attribute ID ring control has constants as valid values, you can view a\n'
+                                                                                          'list of the constants by pressing on this control. Select a value by\n'
+                                                                                          'double-clicking on it or by selecting it and then pressing .\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'None if attribute_value_ctype is None else (ctypes.pointer(attribute_value_ctype))',
+                                                      'name': 'attributeValue',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'attribute_value',
+                                                      'python_name_or_default_for_init': 'attribute_value',
+                                                      'python_name_with_default': 'attribute_value',
+                                                      'python_name_with_doc_default': 'attribute_value',
+                                                      'python_type': 'float',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViReal64',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False}],
+                                'python_code_variables': [],
+                                'python_name': '_get_attribute_vi_real64',
+                                'render_in_library': True,
+                                'render_in_session_base': True,
+                                'returns': 'ViStatus'},
+    'GetAttributeViSession': {   'codegen_method': 'no',
+                                 'documentation': {   'description': '\n'
+                                                                     'This function queries the value of a ViSession attribute. You can use\n'
+                                                                     'this function to get the values of instrument specific attributes and\n'
+                                                                     'inherent IVI attributes. If the attribute represents an instrument\n'
+                                                                     'state, this function performs instrument I/O in the following cases: -\n'
+                                                                     'State caching is disabled for the entire session or for the particular\n'
+                                                                     'attribute. - State caching is enabled and the currently cached value is\n'
+                                                                     'invalid.\n'},
+                                 'parameters': [   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'A particular NI-SWITCH session established with\n'
+                                                                                           'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                           'and used for all subsequent NI-SWITCH calls.\n',
+                                                                            'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                       'name': 'vi',
+                                                       'type': 'ViSession'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Some attributes are unique per channel. For these, pass the name of the\n'
+                                                                                           'channel. Other attributes are unique per switch device. Pass VI_NULL or\n'
+                                                                                           'an empty string for this parameter. Default Value: ""\n'},
+                                                       'name': 'channelName',
+                                                       'type': 'ViConstString'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Pass the ID of an attribute. From the function panel window, you can use\n'
+                                                                                           'this control as follows. - Click on the control or press , , or , to\n'
+                                                                                           'display a dialog box containing a hierarchical list of the available\n'
+                                                                                           'attributes. Attributes whose value cannot be set are dim. Help text is\n'
+                                                                                           'shown for each attribute. Select an attribute by double-clicking on it\n'
+                                                                                           'or by selecting it and then pressing . A ring control at the top of the\n'
+                                                                                           'dialog box allows you to see all IVI attributes or only the attributes\n'
+                                                                                           'of the ViInt32 type. If you choose to see all IVI attributes, the data\n'
+                                                                                           'types appear to the right of the attribute names in the list box. The\n'
+                                                                                           'data types that are not consistent with this function are dim. If you\n'
+                                                                                           'select an attribute data type that is dim, LabWindows/CVI transfers you\n'
+                                                                                           'to the function panel for the corresponding function that is consistent\n'
+                                                                                           'with the data type. - If you want to enter a variable name, press to\n'
+                                                                                           'change this ring control to a manual input box. - If the attribute in\n'
+                                                                                           'this ring control has constants as valid values, you can view the\n'
+                                                                                           'constants by moving to the Attribute Value control and pressing .\n'},
+                                                       'name': 'attributeId',
+                                                       'type': 'ViAttr'},
+                                                   {   'direction': 'out',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Returns the current value of the attribute. Pass the address of a\n'
+                                                                                           'ViSession variable. From the function panel window, you can use this\n'
+                                                                                           'control as follows. - If the attribute currently showing in the\n'
+                                                                                           'Attribute ID ring control has constants as valid values, you can view a\n'
+                                                                                           'list of the constants by pressing on this control. Select a value by\n'
+                                                                                           'double-clicking on it or by selecting it and then pressing .\n'},
+                                                       'name': 'attributeValue',
+                                                       'type': 'ViSession'}],
+                                 'returns': 'ViStatus'},
+    'GetAttributeViString': {   'blocking': False,
+                                'codegen_method': 'private',
+                                'documentation': {   'description': '\n'
+                                                                    'This function queries the value of a ViString attribute. You can use\n'
+                                                                    'this function to get the values of instrument specific attributes and\n'
+                                                                    'inherent IVI attributes. If the attribute represents an instrument\n'
+                                                                    'state, this function performs instrument I/O in the following cases: -\n'
+                                                                    'State caching is disabled for the entire session or for the particular\n'
+                                                                    'attribute. - State caching is enabled and the currently cached value is\n'
+                                                                    'invalid. You must provide a ViChar array to serve as a buffer for the\n'
+                                                                    'value. You pass the number of bytes in the buffer as the Array Size\n'
+                                                                    'parameter. If the current value of the attribute, including the\n'
+                                                                    'terminating NULL byte, is larger than the size you indicate in the Array\n'
+                                                                    'Size parameter, the function copies Array Size-1 bytes into the buffer,\n'
+                                                                    'places an ASCII NULL byte at the end of the buffer, and returns the\n'
+                                                                    'array size you must pass to get the entire value. For example, if the\n'
+                                                                    'value is "123456" and the Array Size is 4, the function places "123"\n'
+                                                                    'into the buffer and returns 7. If you want to call this function just to\n'
+                                                                    'get the required array size, you can pass 0 for the Array Size and\n'
+                                                                    'VI_NULL for the Attribute Value buffer. If you want the function to\n'
+                                                                    'fill in the buffer regardless of the number of bytes in the value, pass\n'
+                                                                    'a negative number for the Array Size parameter.\n'},
+                                'has_repeated_capability': True,
+                                'invalidates_attribute_cache': False,
+                                'is_error_handling': False,
+                                'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                'name': 'GetAttributeViString',
+                                'parameters': [   {   'ctypes_type': 'ViSession',
+                                                      'ctypes_type_library_call': 'ViSession',
+                                                      'ctypes_variable_name': 'vi_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'A particular NI-SWITCH session established with\n'
+                                                                                          'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                          'and used for all subsequent NI-SWITCH calls.\n',
+                                                                           'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': True,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'vi_ctype',
+                                                      'name': 'vi',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'vi',
+                                                      'python_name_or_default_for_init': 'vi',
+                                                      'python_name_with_default': 'vi',
+                                                      'python_name_with_doc_default': 'vi',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViSession',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViConstString',
+                                                      'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                      'ctypes_variable_name': 'channel_name_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Some attributes are unique per channel. For these, pass the name of the\n'
+                                                                                          'channel. Other attributes are unique per switch device. Pass VI_NULL or\n'
+                                                                                          'an empty string for this parameter. Default Value: ""\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': True,
+                                                      'is_session_handle': False,
+                                                      'is_string': True,
+                                                      'library_method_call_snippet': 'channel_name_ctype',
+                                                      'name': 'channelName',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'channel_name',
+                                                      'python_name_or_default_for_init': 'channel_name',
+                                                      'python_name_with_default': 'channel_name',
+                                                      'python_name_with_doc_default': 'channel_name',
+                                                      'python_type': 'str',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViConstString',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViAttr',
+                                                      'ctypes_type_library_call': 'ViAttr',
+                                                      'ctypes_variable_name': 'attribute_id_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Pass the ID of an attribute. From the function panel window, you can use\n'
+                                                                                          'this control as follows. - Click on the control or press , , or , to\n'
+                                                                                          'display a dialog box containing a hierarchical list of the available\n'
+                                                                                          'attributes. Attributes whose value cannot be set are dim. Help text is\n'
+                                                                                          'shown for each attribute. Select an attribute by double-clicking on it\n'
+                                                                                          'or by selecting it and then pressing . A ring control at the top of the\n'
+                                                                                          'dialog box allows you to see all IVI attributes or only the attributes\n'
+                                                                                          'of the ViInt32 type. If you choose to see all IVI attributes, the data\n'
+                                                                                          'types appear to the right of the attribute names in the list box. The\n'
+                                                                                          'data types that are not consistent with this function are dim. If you\n'
+                                                                                          'select an attribute data type that is dim, LabWindows/CVI transfers you\n'
+                                                                                          'to the function panel for the corresponding function that is consistent\n'
+                                                                                          'with the data type. - If you want to enter a variable name, press to\n'
+                                                                                          'change this ring control to a manual input box. - If the attribute in\n'
+                                                                                          'this ring control has constants as valid values, you can view the\n'
+                                                                                          'constants by moving to the Attribute Value control and pressing .\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'attribute_id_ctype',
+                                                      'name': 'attributeId',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'attribute_id',
+                                                      'python_name_or_default_for_init': 'attribute_id',
+                                                      'python_name_with_default': 'attribute_id',
+                                                      'python_name_with_doc_default': 'attribute_id',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViAttr',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViInt32',
+                                                      'ctypes_type_library_call': 'ViInt32',
+                                                      'ctypes_variable_name': 'array_size_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Pass the number of bytes in the ViChar array you specify for the\n'
+                                                                                          'Attribute Value parameter. If the current value of the attribute,\n'
+                                                                                          'including the terminating NUL byte, contains more bytes that you\n'
+                                                                                          'indicate in this parameter, the function copies Array Size-1 bytes into\n'
+                                                                                          'the buffer, places an ASCII NUL byte at the end of the buffer, and\n'
+                                                                                          'returns the array size you must pass to get the entire value. For\n'
+                                                                                          'example, if the value is "123456" and the Array Size is 4, the function\n'
+                                                                                          'places "123" into the buffer and returns 7. If you pass a negative\n'
+                                                                                          'number, the function copies the value to the buffer regardless of the\n'
+                                                                                          'number of bytes in the value. If you pass 0, you can pass VI_NULL for\n'
+                                                                                          'the Attribute Value buffer parameter. Default Value:512\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'array_size_ctype',
+                                                      'name': 'arraySize',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'array_size',
+                                                      'python_name_or_default_for_init': 'array_size',
+                                                      'python_name_with_default': 'array_size',
+                                                      'python_name_with_doc_default': 'array_size',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViInt32',
+                                                      'use_array': False,
+                                                      'use_in_python_api': False,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViChar[]',
+                                                      'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                      'ctypes_variable_name': 'attribute_value_ctype',
+                                                      'direction': 'out',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'The buffer in which the function returns the current value of the\n'
+                                                                                          'attribute. The buffer must be of type ViChar and have at least as many\n'
+                                                                                          'bytes as indicated in the Array Size parameter. If the current value of\n'
+                                                                                          'the attribute, including the terminating NUL byte, contains more bytes\n'
+                                                                                          'that you indicate in this parameter, the function copies Array Size-1\n'
+                                                                                          'bytes into the buffer, places an ASCII NUL byte at the end of the\n'
+                                                                                          'buffer, and returns the array size you must pass to get the entire\n'
+                                                                                          'value. For example, if the value is "123456" and the Array Size is 4,\n'
+                                                                                          'the function places "123" into the buffer and returns 7. If you specify\n'
+                                                                                          '0 for the Array Size parameter, you can pass VI_NULL for this\n'
+                                                                                          'parameter. From the function panel window, you can use this control as\n'
+                                                                                          'follows. - If the attribute currently showing in the Attribute ID ring\n'
+                                                                                          'control has constants as valid values, you can view a list of the\n'
+                                                                                          'constants by pressing on this control. Select a value by double-clicking\n'
+                                                                                          'on it or by selecting it and then pressing .\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': True,
+                                                      'library_method_call_snippet': 'attribute_value_ctype',
+                                                      'name': 'attributeValue',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'attribute_value',
+                                                      'python_name_or_default_for_init': 'attribute_value',
+                                                      'python_name_with_default': 'attribute_value',
+                                                      'python_name_with_doc_default': 'attribute_value',
+                                                      'python_type': 'str',
+                                                      'size': {'mechanism': 'ivi-dance', 'value': 'arraySize'},
+                                                      'type': 'ViChar[]',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False}],
+                                'python_code_variables': [],
+                                'python_name': '_get_attribute_vi_string',
+                                'render_in_library': True,
+                                'render_in_session_base': True,
+                                'returns': 'ViStatus'},
+    'GetChannelName': {   'blocking': False,
+                          'codegen_method': 'public',
+                          'documentation': {   'description': '\n'
+                                                              'Returns the channel string that is in the channel table at the specified\n'
+                                                              'index. Use niSwitch_GetChannelName in a For Loop to get a complete list\n'
+                                                              'of valid channel names for the switch module. Use the Channel Count\n'
+                                                              'attribute to determine the number of channels.\n'},
+                          'has_repeated_capability': False,
+                          'invalidates_attribute_cache': False,
+                          'is_error_handling': False,
+                          'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                          'name': 'GetChannelName',
+                          'parameters': [   {   'ctypes_type': 'ViSession',
+                                                'ctypes_type_library_call': 'ViSession',
+                                                'ctypes_variable_name': 'vi_ctype',
+                                                'direction': 'in',
+                                                'documentation': {   'description': '\n'
+                                                                                    'A particular NI-SWITCH session established with\n'
+                                                                                    'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                    'and used for all subsequent NI-SWITCH calls.\n',
+                                                                     'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                'enum': None,
+                                                'is_buffer': False,
+                                                'is_repeated_capability': False,
+                                                'is_session_handle': True,
+                                                'is_string': False,
+                                                'library_method_call_snippet': 'vi_ctype',
+                                                'name': 'vi',
+                                                'numpy': False,
+                                                'numpy_into_return': False,
+                                                'python_name': 'vi',
+                                                'python_name_or_default_for_init': 'vi',
+                                                'python_name_with_default': 'vi',
+                                                'python_name_with_doc_default': 'vi',
+                                                'python_type': 'int',
+                                                'size': {'mechanism': 'fixed', 'value': 1},
+                                                'type': 'ViSession',
+                                                'use_array': False,
+                                                'use_in_python_api': True,
+                                                'use_list': False},
+                                            {   'ctypes_type': 'ViInt32',
+                                                'ctypes_type_library_call': 'ViInt32',
+                                                'ctypes_variable_name': 'index_ctype',
+                                                'direction': 'in',
+                                                'documentation': {'description': '\nA 1-based index into the channel table. Default value: 1 Maximum value:\nValue of Channel Count attribute.\n'},
+                                                'enum': None,
+                                                'is_buffer': False,
+                                                'is_repeated_capability': False,
+                                                'is_session_handle': False,
+                                                'is_string': False,
+                                                'library_method_call_snippet': 'index_ctype',
+                                                'name': 'Index',
+                                                'numpy': False,
+                                                'numpy_into_return': False,
+                                                'python_name': 'index',
+                                                'python_name_or_default_for_init': 'index',
+                                                'python_name_with_default': 'index',
+                                                'python_name_with_doc_default': 'index',
+                                                'python_type': 'int',
+                                                'size': {'mechanism': 'fixed', 'value': 1},
+                                                'type': 'ViInt32',
+                                                'use_array': False,
+                                                'use_in_python_api': True,
+                                                'use_list': False},
+                                            {   'ctypes_type': 'ViInt32',
+                                                'ctypes_type_library_call': 'ViInt32',
+                                                'ctypes_variable_name': 'buffer_size_ctype',
+                                                'direction': 'in',
+                                                'documentation': {   'description': '\n'
+                                                                                    'Pass the number of bytes in the ViChar array you specify for the Channel\n'
+                                                                                    'Name Buffer parameter. If the channel name string, including the\n'
+                                                                                    'terminating NUL byte, contains more bytes than you indicate in this\n'
+                                                                                    'parameter, the function copies Buffer Size - 1 bytes into the buffer,\n'
+                                                                                    'places an ASCII NUL byte at the end of the buffer, and returns the\n'
+                                                                                    'buffer size you must pass to get the entire value. For example, if the\n'
+                                                                                    'value is "123456" and the Buffer Size is 4, the function places "123"\n'
+                                                                                    'into the buffer and returns 7. If you pass a negative number, the\n'
+                                                                                    'function copies the value to the buffer regardless of the number of\n'
+                                                                                    'bytes in the value. If you pass 0, you can pass VI_NULL for the\n'
+                                                                                    'Coercion Record buffer parameter. Default Value: None\n'},
+                                                'enum': None,
+                                                'is_buffer': False,
+                                                'is_repeated_capability': False,
+                                                'is_session_handle': False,
+                                                'is_string': False,
+                                                'library_method_call_snippet': 'buffer_size_ctype',
+                                                'name': 'bufferSize',
+                                                'numpy': False,
+                                                'numpy_into_return': False,
+                                                'python_name': 'buffer_size',
+                                                'python_name_or_default_for_init': 'buffer_size',
+                                                'python_name_with_default': 'buffer_size',
+                                                'python_name_with_doc_default': 'buffer_size',
+                                                'python_type': 'int',
+                                                'size': {'mechanism': 'fixed', 'value': 1},
+                                                'type': 'ViInt32',
+                                                'use_array': False,
+                                                'use_in_python_api': False,
+                                                'use_list': False},
+                                            {   'ctypes_type': 'ViChar[]',
+                                                'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                'ctypes_variable_name': 'channel_name_buffer_ctype',
+                                                'direction': 'out',
+                                                'documentation': {'description': '\nReturns the channel name that is in the channel table at the index you\nspecify.\n'},
+                                                'enum': None,
+                                                'is_buffer': False,
+                                                'is_repeated_capability': False,
+                                                'is_session_handle': False,
+                                                'is_string': True,
+                                                'library_method_call_snippet': 'channel_name_buffer_ctype',
+                                                'name': 'channelNameBuffer',
+                                                'numpy': False,
+                                                'numpy_into_return': False,
+                                                'python_name': 'channel_name_buffer',
+                                                'python_name_or_default_for_init': 'channel_name_buffer',
+                                                'python_name_with_default': 'channel_name_buffer',
+                                                'python_name_with_doc_default': 'channel_name_buffer',
+                                                'python_type': 'str',
+                                                'size': {'mechanism': 'ivi-dance', 'value': 'bufferSize'},
+                                                'type': 'ViChar[]',
+                                                'use_array': False,
+                                                'use_in_python_api': True,
+                                                'use_list': False}],
+                          'python_code_variables': [],
+                          'python_name': 'get_channel_name',
+                          'render_in_library': True,
+                          'render_in_session_base': False,
+                          'returns': 'ViStatus'},
+    'GetError': {   'blocking': False,
+                    'codegen_method': 'private',
+                    'documentation': {   'description': '\n'
+                                                        'This function retrieves and then clears the IVI error information for\n'
+                                                        'the session or the current execution thread. One exception exists: If\n'
+                                                        'the buffer_size parameter is 0, the function does not clear the error\n'
+                                                        'information. By passing 0 for the buffer size, the caller can ascertain\n'
+                                                        'the buffer size required to get the entire error description string and\n'
+                                                        'then call the function again with a sufficiently large buffer. If the\n'
+                                                        'user specifies a valid IVI session for the InstrumentHandle parameter,\n'
+                                                        'Get Error retrieves and then clears the error information for the\n'
+                                                        'session. If the user passes VI_NULL for the InstrumentHandle parameter,\n'
+                                                        'this function retrieves and then clears the error information for the\n'
+                                                        'current execution thread. If the InstrumentHandle parameter is an\n'
+                                                        'invalid session, the function does nothing and returns an error.\n'
+                                                        'Normally, the error information describes the first error that occurred\n'
+                                                        'since the user last called niSwitch_GetError or niSwitch_ClearError.\n',
+                                         'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                    'has_repeated_capability': False,
+                    'invalidates_attribute_cache': False,
+                    'is_error_handling': True,
+                    'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                    'name': 'GetError',
+                    'parameters': [   {   'ctypes_type': 'ViSession',
+                                          'ctypes_type_library_call': 'ViSession',
+                                          'ctypes_variable_name': 'vi_ctype',
+                                          'direction': 'in',
+                                          'documentation': {   'description': '\n'
+                                                                              'A particular NI-SWITCH session established with\n'
+                                                                              'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                              'and used for all subsequent NI-SWITCH calls.\n',
+                                                               'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                          'enum': None,
+                                          'is_buffer': False,
+                                          'is_repeated_capability': False,
+                                          'is_session_handle': True,
+                                          'is_string': False,
+                                          'library_method_call_snippet': 'vi_ctype',
+                                          'name': 'vi',
+                                          'numpy': False,
+                                          'numpy_into_return': False,
+                                          'python_name': 'vi',
+                                          'python_name_or_default_for_init': 'vi',
+                                          'python_name_with_default': 'vi',
+                                          'python_name_with_doc_default': 'vi',
+                                          'python_type': 'int',
+                                          'size': {'mechanism': 'fixed', 'value': 1},
+                                          'type': 'ViSession',
+                                          'use_array': False,
+                                          'use_in_python_api': True,
+                                          'use_list': False},
+                                      {   'ctypes_type': 'ViStatus',
+                                          'ctypes_type_library_call': 'ctypes.POINTER(ViStatus)',
+                                          'ctypes_variable_name': 'code_ctype',
+                                          'direction': 'out',
+                                          'documentation': {   'description': '\n'
+                                                                              'Returns the error code for the session or execution thread. If you pass\n'
+                                                                              '0 for the Buffer Size, you can pass VI_NULL for this parameter.\n'},
+                                          'enum': None,
+                                          'is_buffer': False,
+                                          'is_repeated_capability': False,
+                                          'is_session_handle': False,
+                                          'is_string': False,
+                                          'library_method_call_snippet': 'None if code_ctype is None else (ctypes.pointer(code_ctype))',
+                                          'name': 'Code',
+                                          'numpy': False,
+                                          'numpy_into_return': False,
+                                          'python_name': 'code',
+                                          'python_name_or_default_for_init': 'code',
+                                          'python_name_with_default': 'code',
+                                          'python_name_with_doc_default': 'code',
+                                          'python_type': 'int',
+                                          'size': {'mechanism': 'fixed', 'value': 1},
+                                          'type': 'ViStatus',
+                                          'use_array': False,
+                                          'use_in_python_api': True,
+                                          'use_list': False},
+                                      {   'ctypes_type': 'ViInt32',
+                                          'ctypes_type_library_call': 'ViInt32',
+                                          'ctypes_variable_name': 'buffer_size_ctype',
+                                          'direction': 'in',
+                                          'documentation': {   'description': '\n'
+                                                                              'Pass the number of bytes in the ViChar array you specify for the\n'
+                                                                              'Description parameter. If the error description, including the\n'
+                                                                              'terminating NUL byte, contains more bytes than you indicate in this\n'
+                                                                              'parameter, the function copies buffer_size - 1 bytes into the buffer,\n'
+                                                                              'places an ASCII NUL byte at the end of the buffer, and returns the\n'
+                                                                              'buffer size you must pass to get the entire value. For example, if the\n'
+                                                                              'value is "123456" and the Buffer Size is 4, the function places "123"\n'
+                                                                              'into the buffer and returns 7. If you pass a negative number, the\n'
+                                                                              'function copies the value to the buffer regardless of the number of\n'
+                                                                              'bytes in the value. If you pass 0, you can pass VI_NULL for the\n'
+                                                                              'Description buffer parameter. Default Value: None\n'},
+                                          'enum': None,
+                                          'is_buffer': False,
+                                          'is_repeated_capability': False,
+                                          'is_session_handle': False,
+                                          'is_string': False,
+                                          'library_method_call_snippet': 'buffer_size_ctype',
+                                          'name': 'BufferSize',
+                                          'numpy': False,
+                                          'numpy_into_return': False,
+                                          'python_name': 'buffer_size',
+                                          'python_name_or_default_for_init': 'buffer_size',
+                                          'python_name_with_default': 'buffer_size',
+                                          'python_name_with_doc_default': 'buffer_size',
+                                          'python_type': 'int',
+                                          'size': {'mechanism': 'fixed', 'value': 1},
+                                          'type': 'ViInt32',
+                                          'use_array': False,
+                                          'use_in_python_api': False,
+                                          'use_list': False},
+                                      {   'ctypes_type': 'ViChar[]',
+                                          'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                          'ctypes_variable_name': 'description_ctype',
+                                          'direction': 'out',
+                                          'documentation': {   'description': '\n'
+                                                                              'Returns the error description for the IVI session or execution thread.\n'
+                                                                              'If there is no description, the function returns an empty string. The\n'
+                                                                              'buffer must contain at least as many elements as the value you specify\n'
+                                                                              'with the Buffer Size parameter. If the error description, including the\n'
+                                                                              'terminating NUL byte, contains more bytes than you indicate with the\n'
+                                                                              'Buffer Size parameter, the function copies Buffer Size - 1 bytes into\n'
+                                                                              'the buffer, places an ASCII NUL byte at the end of the buffer, and\n'
+                                                                              'returns the buffer size you must pass to get the entire value. For\n'
+                                                                              'example, if the value is "123456" and the Buffer Size is 4, the function\n'
+                                                                              'places "123" into the buffer and returns 7. If you pass 0 for the Buffer\n'
+                                                                              'Size, you can pass VI_NULL for this parameter.\n'},
+                                          'enum': None,
+                                          'is_buffer': False,
+                                          'is_repeated_capability': False,
+                                          'is_session_handle': False,
+                                          'is_string': True,
+                                          'library_method_call_snippet': 'description_ctype',
+                                          'name': 'Description',
+                                          'numpy': False,
+                                          'numpy_into_return': False,
+                                          'python_name': 'description',
+                                          'python_name_or_default_for_init': 'description',
+                                          'python_name_with_default': 'description',
+                                          'python_name_with_doc_default': 'description',
+                                          'python_type': 'str',
+                                          'size': {'mechanism': 'ivi-dance', 'value': 'BufferSize'},
+                                          'type': 'ViChar[]',
+                                          'use_array': False,
+                                          'use_in_python_api': True,
+                                          'use_list': False}],
+                    'python_code_variables': [],
+                    'python_name': '_get_error',
+                    'render_in_library': True,
+                    'render_in_session_base': True,
+                    'returns': 'ViStatus'},
+    'GetNextCoercionRecord': {   'codegen_method': 'no',
+                                 'documentation': {   'description': '\n'
+                                                                     'This function returns the coercion information associated with the IVI\n'
+                                                                     'session. This function retrieves and clears the oldest instance in which\n'
+                                                                     'the instrument driver coerced a value you specified to another value. If\n'
+                                                                     'you set the NISWITCH_ATTR_RECORD_COERCIONS attribute to VI_TRUE, the\n'
+                                                                     'instrument driver keeps a list of all coercions it makes on ViInt32 or\n'
+                                                                     'ViReal64 values you pass to instrument driver functions. You use this\n'
+                                                                     'function to retrieve information from that list. If the next coercion\n'
+                                                                     'record string, including the terminating NUL byte, contains more bytes\n'
+                                                                     'than you indicate in this parameter, the function copies Buffer Size - 1\n'
+                                                                     'bytes into the buffer, places an ASCII NUL byte at the end of the\n'
+                                                                     'buffer, and returns the buffer size you must pass to get the entire\n'
+                                                                     'value. For example, if the value is "123456" and the Buffer Size is 4,\n'
+                                                                     'the function places "123" into the buffer and returns 7. If you pass a\n'
+                                                                     'negative number, the function copies the value to the buffer regardless\n'
+                                                                     'of the number of bytes in the value. If you pass 0, you can pass\n'
+                                                                     'VI_NULL for the Coercion Record buffer parameter. The function returns\n'
+                                                                     'an empty string in the Coercion Record parameter if no coercion records\n'
+                                                                     'remain for the session.\n'},
+                                 'parameters': [   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'A particular NI-SWITCH session established with\n'
+                                                                                           'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                           'and used for all subsequent NI-SWITCH calls.\n',
+                                                                            'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                       'name': 'vi',
+                                                       'type': 'ViSession'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Pass the number of bytes in the ViChar array you specify for the\n'
+                                                                                           'Coercion Record parameter. If the next coercion record string, including\n'
+                                                                                           'the terminating NUL byte, contains more bytes than you indicate in this\n'
+                                                                                           'parameter, the function copies Buffer Size - 1 bytes into the buffer,\n'
+                                                                                           'places an ASCII NUL byte at the end of the buffer, and returns the\n'
+                                                                                           'buffer size you must pass to get the entire value. For example, if the\n'
+                                                                                           'value is "123456" and the Buffer Size is 4, the function places "123"\n'
+                                                                                           'into the buffer and returns 7. If you pass a negative number, the\n'
+                                                                                           'function copies the value to the buffer regardless of the number of\n'
+                                                                                           'bytes in the value. If you pass 0, you can pass VI_NULL for the\n'
+                                                                                           'Coercion Record buffer parameter. Default Value: None\n'},
+                                                       'name': 'bufferSize',
+                                                       'type': 'ViInt32'},
+                                                   {   'direction': 'out',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Returns the next coercion record for the IVI session. If there are no\n'
+                                                                                           'coercion records, the function returns an empty string. The buffer must\n'
+                                                                                           'contain at least as many elements as the value you specify with the\n'
+                                                                                           'Buffer Size parameter. If the next coercion record string, including the\n'
+                                                                                           'terminating NUL byte, contains more bytes than you indicate with the\n'
+                                                                                           'Buffer Size parameter, the function copies Buffer Size - 1 bytes into\n'
+                                                                                           'the buffer, places an ASCII NUL byte at the end of the buffer, and\n'
+                                                                                           'returns the buffer size you must pass to get the entire value. For\n'
+                                                                                           'example, if the value is "123456" and the Buffer Size is 4, the function\n'
+                                                                                           'places "123" into the buffer and returns 7. This parameter returns an\n'
+                                                                                           'empty string if no coercion records remain for the session.\n'},
+                                                       'name': 'coercionRecord',
+                                                       'type': 'ViChar[]'}],
+                                 'returns': 'ViStatus'},
+    'GetNextInterchangeWarning': {   'codegen_method': 'no',
+                                     'documentation': {   'description': '\n'
+                                                                         'This function returns the interchangeability warnings associated with\n'
+                                                                         'the IVI session. It retrieves and clears the oldest instance in which\n'
+                                                                         'the class driver recorded an interchangeability warning.\n'
+                                                                         'Interchangeability warnings indicate that using your application with a\n'
+                                                                         'different instrument might cause different behavior. You use this\n'
+                                                                         'function to retrieve interchangeability warnings. The driver performs\n'
+                                                                         'interchangeability checking when the NISWITCH_ATTR_INTERCHANGE_CHECK\n'
+                                                                         'attribute is set to VI_TRUE. The function returns an empty string in\n'
+                                                                         'the Interchange Warning parameter if no interchangeability warnings\n'
+                                                                         'remain for the session. In general, the instrument driver generates\n'
+                                                                         'interchangeability warnings when an attribute that affects the behavior\n'
+                                                                         'of the instrument is in a state that you did not specify.\n'},
+                                     'parameters': [   {   'direction': 'in',
+                                                           'documentation': {   'description': '\n'
+                                                                                               'A particular NI-SWITCH session established with\n'
+                                                                                               'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                               'and used for all subsequent NI-SWITCH calls.\n',
+                                                                                'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                           'name': 'vi',
+                                                           'type': 'ViSession'},
+                                                       {   'direction': 'in',
+                                                           'documentation': {   'description': '\n'
+                                                                                               'Pass the number of bytes in the ViChar array you specify for the\n'
+                                                                                               'Interchange Warning parameter. If the next interchangeability warning\n'
+                                                                                               'string, including the terminating NUL byte, contains more bytes than you\n'
+                                                                                               'indicate in this parameter, the function copies Buffer Size - 1 bytes\n'
+                                                                                               'into the buffer, places an ASCII NUL byte at the end of the buffer, and\n'
+                                                                                               'returns the buffer size you must pass to get the entire value. For\n'
+                                                                                               'example, if the value is "123456" and the Buffer Size is 4, the function\n'
+                                                                                               'places "123" into the buffer and returns 7. If you pass a negative\n'
+                                                                                               'number, the function copies the value to the buffer regardless of the\n'
+                                                                                               'number of bytes in the value. If you pass 0, you can pass VI_NULL for\n'
+                                                                                               'the Interchange Warning buffer parameter. Default Value: None\n'},
+                                                           'name': 'bufferSize',
+                                                           'type': 'ViInt32'},
+                                                       {   'direction': 'out',
+                                                           'documentation': {   'description': '\n'
+                                                                                               'Returns the next interchange warning for the IVI session. If there are\n'
+                                                                                               'no interchange warnings, the function returns an empty string. The\n'
+                                                                                               'buffer must contain at least as many elements as the value you specify\n'
+                                                                                               'with the Buffer Size parameter. If the next interchangeability warning\n'
+                                                                                               'string, including the terminating NUL byte, contains more bytes than you\n'
+                                                                                               'indicate with the Buffer Size parameter, the function copies Buffer Size\n'
+                                                                                               '- 1 bytes into the buffer, places an ASCII NUL byte at the end of the\n'
+                                                                                               'buffer, and returns the buffer size you must pass to get the entire\n'
+                                                                                               'value. For example, if the value is "123456" and the Buffer Size is 4,\n'
+                                                                                               'the function places "123" into the buffer and returns 7. This parameter\n'
+                                                                                               'returns an empty string if no interchangeability warnings remain for the\n'
+                                                                                               'session.\n'},
+                                                           'name': 'interchangeWarning',
+                                                           'type': 'ViChar[]'}],
+                                     'returns': 'ViStatus'},
+    'GetPath': {   'blocking': False,
+                   'codegen_method': 'public',
+                   'documentation': {   'description': '\n'
+                                                       'Returns a string that identifies the explicit path created with\n'
+                                                       'niSwitch_Connect. Pass this string to niSwitch_SetPath to establish\n'
+                                                       'the exact same path in future connections. In some cases, multiple paths\n'
+                                                       'are available between two channels. When you call niSwitch_Connect, the\n'
+                                                       'driver selects an available path. With niSwitch_Connect, there is no\n'
+                                                       'guarantee that the driver selected path will always be the same path\n'
+                                                       'through the switch module. niSwitch_GetPath only returns those paths\n'
+                                                       'explicitly created by niSwitch Connect Channels or niSwitch_SetPath.\n'
+                                                       'For example, if you connect channels CH1 and CH3,and then channels CH2\n'
+                                                       'and CH3, an explicit path between channels CH1 and CH2 does not exist an\n'
+                                                       'error is returned\n'},
+                   'has_repeated_capability': False,
+                   'invalidates_attribute_cache': False,
+                   'is_error_handling': False,
+                   'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                   'name': 'GetPath',
+                   'parameters': [   {   'ctypes_type': 'ViSession',
+                                         'ctypes_type_library_call': 'ViSession',
+                                         'ctypes_variable_name': 'vi_ctype',
+                                         'direction': 'in',
+                                         'documentation': {   'description': '\n'
+                                                                             'A particular NI-SWITCH session established with\n'
+                                                                             'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                             'and used for all subsequent NI-SWITCH calls.\n',
+                                                              'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                         'enum': None,
+                                         'is_buffer': False,
+                                         'is_repeated_capability': False,
+                                         'is_session_handle': True,
+                                         'is_string': False,
+                                         'library_method_call_snippet': 'vi_ctype',
+                                         'name': 'vi',
+                                         'numpy': False,
+                                         'numpy_into_return': False,
+                                         'python_name': 'vi',
+                                         'python_name_or_default_for_init': 'vi',
+                                         'python_name_with_default': 'vi',
+                                         'python_name_with_doc_default': 'vi',
+                                         'python_type': 'int',
+                                         'size': {'mechanism': 'fixed', 'value': 1},
+                                         'type': 'ViSession',
+                                         'use_array': False,
+                                         'use_in_python_api': True,
+                                         'use_list': False},
+                                     {   'ctypes_type': 'ViConstString',
+                                         'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                         'ctypes_variable_name': 'channel1_ctype',
+                                         'direction': 'in',
+                                         'documentation': {   'description': '\n'
+                                                                             'Input one of the channel names of the desired path. Pass the other\n'
+                                                                             'channel name as the channel 2 parameter. Refer to Devices Overview for\n'
+                                                                             'valid channel names for the switch module. Examples of valid channel\n'
+                                                                             'names: ch0, com0, ab0, r1, c2, cjtemp Default value: ""\n'},
+                                         'enum': None,
+                                         'is_buffer': False,
+                                         'is_repeated_capability': False,
+                                         'is_session_handle': False,
+                                         'is_string': True,
+                                         'library_method_call_snippet': 'channel1_ctype',
+                                         'name': 'channel1',
+                                         'numpy': False,
+                                         'numpy_into_return': False,
+                                         'python_name': 'channel1',
+                                         'python_name_or_default_for_init': 'channel1',
+                                         'python_name_with_default': 'channel1',
+                                         'python_name_with_doc_default': 'channel1',
+                                         'python_type': 'str',
+                                         'size': {'mechanism': 'fixed', 'value': 1},
+                                         'type': 'ViConstString',
+                                         'use_array': False,
+                                         'use_in_python_api': True,
+                                         'use_list': False},
+                                     {   'ctypes_type': 'ViConstString',
+                                         'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                         'ctypes_variable_name': 'channel2_ctype',
+                                         'direction': 'in',
+                                         'documentation': {   'description': '\n'
+                                                                             'Input one of the channel names of the desired path. Pass the other\n'
+                                                                             'channel name as the channel 1 parameter. Refer to Devices Overview for\n'
+                                                                             'valid channel names for the switch module. Examples of valid channel\n'
+                                                                             'names: ch0, com0, ab0, r1, c2, cjtemp Default value: ""\n'},
+                                         'enum': None,
+                                         'is_buffer': False,
+                                         'is_repeated_capability': False,
+                                         'is_session_handle': False,
+                                         'is_string': True,
+                                         'library_method_call_snippet': 'channel2_ctype',
+                                         'name': 'channel2',
+                                         'numpy': False,
+                                         'numpy_into_return': False,
+                                         'python_name': 'channel2',
+                                         'python_name_or_default_for_init': 'channel2',
+                                         'python_name_with_default': 'channel2',
+                                         'python_name_with_doc_default': 'channel2',
+                                         'python_type': 'str',
+                                         'size': {'mechanism': 'fixed', 'value': 1},
+                                         'type': 'ViConstString',
+                                         'use_array': False,
+                                         'use_in_python_api': True,
+                                         'use_list': False},
+                                     {   'ctypes_type': 'ViInt32',
+                                         'ctypes_type_library_call': 'ViInt32',
+                                         'ctypes_variable_name': 'buffer_size_ctype',
+                                         'direction': 'in',
+                                         'documentation': {   'description': '\n'
+                                                                             'Pass the number of bytes in the ViChar array you specify for the Path\n'
+                                                                             'List parameter. If the current value of the attribute, including the\n'
+                                                                             'terminating NULL byte, contains more bytes that you indicate in this\n'
+                                                                             'parameter, the function copies Buffer Size - 1 bytes into the buffer,\n'
+                                                                             'places an ASCII NULL byte at the end of the buffer, and returns the\n'
+                                                                             'buffer size you must pass to get the entire value. For example, if the\n'
+                                                                             'value is "R1->C1" and the Buffer Size is 4, the function places "R1-"\n'
+                                                                             'into the buffer and returns 7. If you pass 0, you can pass VI_NULL for\n'
+                                                                             'the Path parameter. This enables you to find out the path size and to\n'
+                                                                             'allocate the buffer of the appropriate size before calling this function\n'
+                                                                             'again.\n'},
+                                         'enum': None,
+                                         'is_buffer': False,
+                                         'is_repeated_capability': False,
+                                         'is_session_handle': False,
+                                         'is_string': False,
+                                         'library_method_call_snippet': 'buffer_size_ctype',
+                                         'name': 'bufferSize',
+                                         'numpy': False,
+                                         'numpy_into_return': False,
+                                         'python_name': 'buffer_size',
+                                         'python_name_or_default_for_init': 'buffer_size',
+                                         'python_name_with_default': 'buffer_size',
+                                         'python_name_with_doc_default': 'buffer_size',
+                                         'python_type': 'int',
+                                         'size': {'mechanism': 'fixed', 'value': 1},
+                                         'type': 'ViInt32',
+                                         'use_array': False,
+                                         'use_in_python_api': False,
+                                         'use_list': False},
+                                     {   'ctypes_type': 'ViChar[]',
+                                         'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                         'ctypes_variable_name': 'path_ctype',
+                                         'direction': 'out',
+                                         'documentation': {   'description': '\n'
+                                                                             'A string composed of comma-separated paths between channel 1 and channel\n'
+                                                                             '2. The first and last names in the path are the endpoints of the path.\n'
+                                                                             'All other channels in the path are configuration channels. Examples of\n'
+                                                                             'returned paths: ch0->com0, com0->ab0\n'},
+                                         'enum': None,
+                                         'is_buffer': False,
+                                         'is_repeated_capability': False,
+                                         'is_session_handle': False,
+                                         'is_string': True,
+                                         'library_method_call_snippet': 'path_ctype',
+                                         'name': 'Path',
+                                         'numpy': False,
+                                         'numpy_into_return': False,
+                                         'python_name': 'path',
+                                         'python_name_or_default_for_init': 'path',
+                                         'python_name_with_default': 'path',
+                                         'python_name_with_doc_default': 'path',
+                                         'python_type': 'str',
+                                         'size': {'mechanism': 'ivi-dance', 'value': 'bufferSize'},
+                                         'type': 'ViChar[]',
+                                         'use_array': False,
+                                         'use_in_python_api': True,
+                                         'use_list': False}],
+                   'python_code_variables': [],
+                   'python_name': 'get_path',
+                   'render_in_library': True,
+                   'render_in_session_base': False,
+                   'returns': 'ViStatus'},
+    'GetRelayCount': {   'blocking': False,
+                         'codegen_method': 'public',
+                         'documentation': {   'description': '\n'
+                                                             'Returns the number of times the relay has changed from Closed to Open.\n'
+                                                             'Relay count is useful for tracking relay lifetime and usage. Call\n'
+                                                             'niSwitch_WaitForDebounce before niSwitch_GetRelayCount to ensure an\n'
+                                                             'accurate count. Refer to the Relay Count topic in the NI Switches Help\n'
+                                                             'to determine if the switch module supports relay counting.\n'},
+                         'has_repeated_capability': False,
+                         'invalidates_attribute_cache': False,
+                         'is_error_handling': False,
+                         'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                         'name': 'GetRelayCount',
+                         'parameters': [   {   'ctypes_type': 'ViSession',
+                                               'ctypes_type_library_call': 'ViSession',
+                                               'ctypes_variable_name': 'vi_ctype',
+                                               'direction': 'in',
+                                               'documentation': {   'description': '\n'
+                                                                                   'A particular NI-SWITCH session established with\n'
+                                                                                   'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                   'and used for all subsequent NI-SWITCH calls.\n',
+                                                                    'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                               'enum': None,
+                                               'is_buffer': False,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': True,
+                                               'is_string': False,
+                                               'library_method_call_snippet': 'vi_ctype',
+                                               'name': 'vi',
+                                               'numpy': False,
+                                               'numpy_into_return': False,
+                                               'python_name': 'vi',
+                                               'python_name_or_default_for_init': 'vi',
+                                               'python_name_with_default': 'vi',
+                                               'python_name_with_doc_default': 'vi',
+                                               'python_type': 'int',
+                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                               'type': 'ViSession',
+                                               'use_array': False,
+                                               'use_in_python_api': True,
+                                               'use_list': False},
+                                           {   'ctypes_type': 'ViConstString',
+                                               'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                               'ctypes_variable_name': 'relay_name_ctype',
+                                               'direction': 'in',
+                                               'documentation': {   'description': '\n'
+                                                                                   'Name of the relay. Default value: None Examples of valid relay names:\n'
+                                                                                   'ch0, ab0, 1wire, hlselect Refer to Devices Overview for a list of valid\n'
+                                                                                   'relay names for the switch module.\n'},
+                                               'enum': None,
+                                               'is_buffer': False,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': False,
+                                               'is_string': True,
+                                               'library_method_call_snippet': 'relay_name_ctype',
+                                               'name': 'relayName',
+                                               'numpy': False,
+                                               'numpy_into_return': False,
+                                               'python_name': 'relay_name',
+                                               'python_name_or_default_for_init': 'relay_name',
+                                               'python_name_with_default': 'relay_name',
+                                               'python_name_with_doc_default': 'relay_name',
+                                               'python_type': 'str',
+                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                               'type': 'ViConstString',
+                                               'use_array': False,
+                                               'use_in_python_api': True,
+                                               'use_list': False},
+                                           {   'ctypes_type': 'ViInt32',
+                                               'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                               'ctypes_variable_name': 'relay_count_ctype',
+                                               'direction': 'out',
+                                               'documentation': {'description': 'The number of relay cycles.'},
+                                               'enum': None,
+                                               'is_buffer': False,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': False,
+                                               'is_string': False,
+                                               'library_method_call_snippet': 'None if relay_count_ctype is None else (ctypes.pointer(relay_count_ctype))',
+                                               'name': 'relayCount',
+                                               'numpy': False,
+                                               'numpy_into_return': False,
+                                               'python_name': 'relay_count',
+                                               'python_name_or_default_for_init': 'relay_count',
+                                               'python_name_with_default': 'relay_count',
+                                               'python_name_with_doc_default': 'relay_count',
+                                               'python_type': 'int',
+                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                               'type': 'ViInt32',
+                                               'use_array': False,
+                                               'use_in_python_api': True,
+                                               'use_list': False}],
+                         'python_code_variables': [],
+                         'python_name': 'get_relay_count',
+                         'render_in_library': True,
+                         'render_in_session_base': False,
+                         'returns': 'ViStatus'},
+    'GetRelayName': {   'blocking': False,
+                        'codegen_method': 'public',
+                        'documentation': {   'description': '\n'
+                                                            'Returns the relay name string that is in the relay list at the specified\n'
+                                                            'index. Use niSwitch_GetRelayName in a For Loop to get a complete list\n'
+                                                            'of valid relay names for the switch module. Use the Number of Relays\n'
+                                                            'attribute to determine the number of relays.\n'},
+                        'has_repeated_capability': False,
+                        'invalidates_attribute_cache': False,
+                        'is_error_handling': False,
+                        'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                        'name': 'GetRelayName',
+                        'parameters': [   {   'ctypes_type': 'ViSession',
+                                              'ctypes_type_library_call': 'ViSession',
+                                              'ctypes_variable_name': 'vi_ctype',
+                                              'direction': 'in',
+                                              'documentation': {   'description': '\n'
+                                                                                  'A particular NI-SWITCH session established with\n'
+                                                                                  'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                  'and used for all subsequent NI-SWITCH calls.\n',
+                                                                   'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                              'enum': None,
+                                              'is_buffer': False,
+                                              'is_repeated_capability': False,
+                                              'is_session_handle': True,
+                                              'is_string': False,
+                                              'library_method_call_snippet': 'vi_ctype',
+                                              'name': 'vi',
+                                              'numpy': False,
+                                              'numpy_into_return': False,
+                                              'python_name': 'vi',
+                                              'python_name_or_default_for_init': 'vi',
+                                              'python_name_with_default': 'vi',
+                                              'python_name_with_doc_default': 'vi',
+                                              'python_type': 'int',
+                                              'size': {'mechanism': 'fixed', 'value': 1},
+                                              'type': 'ViSession',
+                                              'use_array': False,
+                                              'use_in_python_api': True,
+                                              'use_list': False},
+                                          {   'ctypes_type': 'ViInt32',
+                                              'ctypes_type_library_call': 'ViInt32',
+                                              'ctypes_variable_name': 'index_ctype',
+                                              'direction': 'in',
+                                              'documentation': {'description': '\nA 1-based index into the channel table. Default value: 1 Maximum value:\nValue of Channel Count attribute.\n'},
+                                              'enum': None,
+                                              'is_buffer': False,
+                                              'is_repeated_capability': False,
+                                              'is_session_handle': False,
+                                              'is_string': False,
+                                              'library_method_call_snippet': 'index_ctype',
+                                              'name': 'Index',
+                                              'numpy': False,
+                                              'numpy_into_return': False,
+                                              'python_name': 'index',
+                                              'python_name_or_default_for_init': 'index',
+                                              'python_name_with_default': 'index',
+                                              'python_name_with_doc_default': 'index',
+                                              'python_type': 'int',
+                                              'size': {'mechanism': 'fixed', 'value': 1},
+                                              'type': 'ViInt32',
+                                              'use_array': False,
+                                              'use_in_python_api': True,
+                                              'use_list': False},
+                                          {   'ctypes_type': 'ViInt32',
+                                              'ctypes_type_library_call': 'ViInt32',
+                                              'ctypes_variable_name': 'relay_name_buffer_size_ctype',
+                                              'direction': 'in',
+                                              'documentation': {   'description': '\n'
+                                                                                  'Pass the number of bytes in the ViChar array you specify for the Relay\n'
+                                                                                  'Name Buffer parameter. If the relay name string, including the\n'
+                                                                                  'terminating NUL byte, contains more bytes than you indicate in this\n'
+                                                                                  'parameter, the function copies Buffer Size - 1 bytes into the buffer,\n'
+                                                                                  'places an ASCII NUL byte at the end of the buffer, and returns the\n'
+                                                                                  'buffer size you must pass to get the entire value. For example, if the\n'
+                                                                                  'value is "123456" and the Buffer Size is 4, the function places "123"\n'
+                                                                                  'into the buffer and returns 7. If you pass a negative number, the\n'
+                                                                                  'function copies the value to the buffer regardless of the number of\n'
+                                                                                  'bytes in the value. If you pass 0, you can pass VI_NULL for the\n'
+                                                                                  'Coercion Record buffer parameter. Default Value: None\n'},
+                                              'enum': None,
+                                              'is_buffer': False,
+                                              'is_repeated_capability': False,
+                                              'is_session_handle': False,
+                                              'is_string': False,
+                                              'library_method_call_snippet': 'relay_name_buffer_size_ctype',
+                                              'name': 'relayNameBufferSize',
+                                              'numpy': False,
+                                              'numpy_into_return': False,
+                                              'python_name': 'relay_name_buffer_size',
+                                              'python_name_or_default_for_init': 'relay_name_buffer_size',
+                                              'python_name_with_default': 'relay_name_buffer_size',
+                                              'python_name_with_doc_default': 'relay_name_buffer_size',
+                                              'python_type': 'int',
+                                              'size': {'mechanism': 'fixed', 'value': 1},
+                                              'type': 'ViInt32',
+                                              'use_array': False,
+                                              'use_in_python_api': False,
+                                              'use_list': False},
+                                          {   'ctypes_type': 'ViChar[]',
+                                              'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                              'ctypes_variable_name': 'relay_name_buffer_ctype',
+                                              'direction': 'out',
+                                              'documentation': {'description': 'Returns the relay name for the index you specify.'},
+                                              'enum': None,
+                                              'is_buffer': False,
+                                              'is_repeated_capability': False,
+                                              'is_session_handle': False,
+                                              'is_string': True,
+                                              'library_method_call_snippet': 'relay_name_buffer_ctype',
+                                              'name': 'relayNameBuffer',
+                                              'numpy': False,
+                                              'numpy_into_return': False,
+                                              'python_name': 'relay_name_buffer',
+                                              'python_name_or_default_for_init': 'relay_name_buffer',
+                                              'python_name_with_default': 'relay_name_buffer',
+                                              'python_name_with_doc_default': 'relay_name_buffer',
+                                              'python_type': 'str',
+                                              'size': {'mechanism': 'ivi-dance', 'value': 'relayNameBufferSize'},
+                                              'type': 'ViChar[]',
+                                              'use_array': False,
+                                              'use_in_python_api': True,
+                                              'use_list': False}],
+                        'python_code_variables': [],
+                        'python_name': 'get_relay_name',
+                        'render_in_library': True,
+                        'render_in_session_base': False,
+                        'returns': 'ViStatus'},
+    'GetRelayPosition': {   'blocking': False,
+                            'codegen_method': 'public',
+                            'documentation': {'description': '\nReturns the relay position for the relay specified in the Relay Name\nparameter.\n'},
+                            'has_repeated_capability': False,
+                            'invalidates_attribute_cache': False,
+                            'is_error_handling': False,
+                            'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                            'name': 'GetRelayPosition',
+                            'parameters': [   {   'ctypes_type': 'ViSession',
+                                                  'ctypes_type_library_call': 'ViSession',
+                                                  'ctypes_variable_name': 'vi_ctype',
+                                                  'direction': 'in',
+                                                  'documentation': {   'description': '\n'
+                                                                                      'A particular NI-SWITCH session established with\n'
+                                                                                      'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                      'and used for all subsequent NI-SWITCH calls.\n',
+                                                                       'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                  'enum': None,
+                                                  'is_buffer': False,
+                                                  'is_repeated_capability': False,
+                                                  'is_session_handle': True,
+                                                  'is_string': False,
+                                                  'library_method_call_snippet': 'vi_ctype',
+                                                  'name': 'vi',
+                                                  'numpy': False,
+                                                  'numpy_into_return': False,
+                                                  'python_name': 'vi',
+                                                  'python_name_or_default_for_init': 'vi',
+                                                  'python_name_with_default': 'vi',
+                                                  'python_name_with_doc_default': 'vi',
+                                                  'python_type': 'int',
+                                                  'size': {'mechanism': 'fixed', 'value': 1},
+                                                  'type': 'ViSession',
+                                                  'use_array': False,
+                                                  'use_in_python_api': True,
+                                                  'use_list': False},
+                                              {   'ctypes_type': 'ViConstString',
+                                                  'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                  'ctypes_variable_name': 'relay_name_ctype',
+                                                  'direction': 'in',
+                                                  'documentation': {   'description': '\n'
+                                                                                      'Name of the relay. Default value: None Examples of valid relay names:\n'
+                                                                                      'ch0, ab0, 1wire, hlselect Refer to Devices Overview for a list of valid\n'
+                                                                                      'relay names for the switch module.\n'},
+                                                  'enum': None,
+                                                  'is_buffer': False,
+                                                  'is_repeated_capability': False,
+                                                  'is_session_handle': False,
+                                                  'is_string': True,
+                                                  'library_method_call_snippet': 'relay_name_ctype',
+                                                  'name': 'relayName',
+                                                  'numpy': False,
+                                                  'numpy_into_return': False,
+                                                  'python_name': 'relay_name',
+                                                  'python_name_or_default_for_init': 'relay_name',
+                                                  'python_name_with_default': 'relay_name',
+                                                  'python_name_with_doc_default': 'relay_name',
+                                                  'python_type': 'str',
+                                                  'size': {'mechanism': 'fixed', 'value': 1},
+                                                  'type': 'ViConstString',
+                                                  'use_array': False,
+                                                  'use_in_python_api': True,
+                                                  'use_list': False},
+                                              {   'ctypes_type': 'ViInt32',
+                                                  'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+                                                  'ctypes_variable_name': 'relay_position_ctype',
+                                                  'direction': 'out',
+                                                  'documentation': {   'description': '\nIndicates whether the relay is open or closed. NISWITCH_VAL_OPEN 10\nNIWITCH_VAL_CLOSED 11\n',
+                                                                       'note': [   '\n'
+                                                                                   'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or '
+                                                                                   'represent True/False, have been removed.\n']},
+                                                  'enum': 'RelayPosition',
+                                                  'is_buffer': False,
+                                                  'is_repeated_capability': False,
+                                                  'is_session_handle': False,
+                                                  'is_string': False,
+                                                  'library_method_call_snippet': 'None if relay_position_ctype is None else (ctypes.pointer(relay_position_ctype))',
+                                                  'name': 'relayPosition',
+                                                  'numpy': False,
+                                                  'numpy_into_return': False,
+                                                  'python_name': 'relay_position',
+                                                  'python_name_or_default_for_init': 'relay_position',
+                                                  'python_name_with_default': 'relay_position',
+                                                  'python_name_with_doc_default': 'relay_position',
+                                                  'python_type': 'enums.RelayPosition',
+                                                  'size': {'mechanism': 'fixed', 'value': 1},
+                                                  'type': 'ViInt32',
+                                                  'use_array': False,
+                                                  'use_in_python_api': True,
+                                                  'use_list': False}],
+                            'python_code_variables': [],
+                            'python_name': 'get_relay_position',
+                            'render_in_library': True,
+                            'render_in_session_base': False,
+                            'returns': 'ViStatus'},
+    'InitWithOptions': {   'codegen_method': 'no',
+                           'documentation': {   'description': '\n'
+                                                               'Returns a session handle used to identify the switch module in all\n'
+                                                               'subsequent instrument driver calls and optionally sets the initial state\n'
+                                                               'of the session. niSwitch_InitWithOptions creates a new IVI instrument\n'
+                                                               'driver session for the switch module specified in the resource name\n'
+                                                               'parameter. If multiple topologies are valid for that device, the driver\n'
+                                                               'uses the default topology specified in MAX. The topology is also\n'
+                                                               'configurable in the options string parameter. Note: When initializing an\n'
+                                                               'NI SwitchBlock device with topology, you must specify the topology\n'
+                                                               'created when you configured the device in MAX, using either Configured\n'
+                                                               'Topology or the topology string of the device. Refer to the Initializing\n'
+                                                               'with Topology for NI SwitchBlock Devices topic in the NI Switches Help\n'
+                                                               'for information about determining the topology string of an NI\n'
+                                                               'SwitchBlock device. By default, the switch module is reset to a known\n'
+                                                               'state. Enable simulation in the options string parameter. An error is\n'
+                                                               'returned if a session to the specified resource exists in another\n'
+                                                               'process. The same session is returned if niSwitch_InitWithOptions is\n'
+                                                               'called twice in the same process for the same resource with the same\n'
+                                                               'topology.\n',
+                                                'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                           'parameters': [   {   'direction': 'in',
+                                                 'documentation': {   'description': '\n'
+                                                                                     'Resource name of the switch module to initialize. Default value: None\n'
+                                                                                     'Syntax: Optional fields are shown in square brackets ([]). Configured in\n'
+                                                                                     'MAX Under Valid Syntax Devices and Interfaces DeviceName Traditional\n'
+                                                                                     'NI-DAQ Devices SCXI[chassis ID]::slot number PXI System PXI[bus\n'
+                                                                                     'number]::device number TIP: IVI logical names are also valid for the\n'
+                                                                                     'resource name. Default values for optional fields: chassis ID = 1 bus\n'
+                                                                                     'number = 0 Example resource names: Resource Name Description SC1Mod3\n'
+                                                                                     'NI-DAQmx module in chassis "SC1" slot 3 MySwitch NI-DAQmx module renamed\n'
+                                                                                     'to "MySwitch" SCXI1::3 Traditional NI-DAQ module in chassis 1, slot 3\n'
+                                                                                     'SCXI::3 Traditional NI-DAQ module in chassis 1, slot 3 PXI0::16 PXI bus\n'
+                                                                                     '0, device number 16 PXI::16 PXI bus 0, device number 16\n'},
+                                                 'name': 'resourceName',
+                                                 'type': 'ViRsrc'},
+                                             {   'direction': 'in',
+                                                 'documentation': {   'description': '\n'
+                                                                                     'This parameter is ignored. Because NI-SWITCH supports multiple switch\n'
+                                                                                     'modules, it always queries the switch device to determine which device\n'
+                                                                                     'is installed. For this reason, this VI may return\n'
+                                                                                     'NISWITCH_ERROR_FAIL_ID_QUERY even if this parameter is set to\n'
+                                                                                     'VI_FALSE. Valid Values: VI_TRUE - (Default Value) VI_FALSE -\n'
+                                                                                     'Currently unsupported.\n'},
+                                                 'name': 'idQuery',
+                                                 'type': 'ViBoolean'},
+                                             {   'direction': 'in',
+                                                 'documentation': {   'description': '\n'
+                                                                                     'Specifies whether to reset the switch module during the initialization\n'
+                                                                                     'process. Valid Values: VI_TRUE - Reset Device (Default Value) VI_FALSE\n'
+                                                                                     '- Currently unsupported. The device will not reset.\n'},
+                                                 'name': 'resetDevice',
+                                                 'type': 'ViBoolean'},
+                                             {   'direction': 'in',
+                                                 'documentation': {   'description': '\n'
+                                                                                     'Sets initial values of certain attributes for the NI-SWITCH session.\n'
+                                                                                     'Default value: Simulate=0,RangeCheck=1,DriverSetup=topology:1127/2-Wire\n'
+                                                                                     '32x1 Mux The following table lists the attribute string names you can\n'
+                                                                                     'use: RangeCheck 1 NISWITCH_ATTR_RANGE_CHECK QueryInstrStatus 1\n'
+                                                                                     'NISWITCH_ATTR_QUERY_INSTRUMENT_STATUS Cache 1 NISWITCH_ATTR_CACHE\n'
+                                                                                     'Simulate 0 NISWITCH_ATTR_SIMULATE RecordCoercions 0\n'
+                                                                                     'NISWITCH_ATTR_RECORD_COERCIONS DriverSetup topology 1127/2-Wire 32x1\n'
+                                                                                     'Mux The format of the option string is, "AttributeStringName=Value"\n'
+                                                                                     'where AttributeStringName is the string name of the attribute shown\n'
+                                                                                     'above and Value is the value to which the attribute will be set. To set\n'
+                                                                                     'multiple attributes, separate assignments with a comma. If you pass an\n'
+                                                                                     'empty string for this parameter, the NI-SWITCH session uses the default\n'
+                                                                                     'values for the attributes. You can override the default values by\n'
+                                                                                     'explicitly assigning a value. You do not have to specify all of the\n'
+                                                                                     'available attributes. If you do not specify an attribute, its default\n'
+                                                                                     'value is used. Use the DriverSetup attribute to set the topology or the\n'
+                                                                                     'resource type (DAQmx or Traditional DAQ) of the switch module. This\n'
+                                                                                     'attribute can contain config token/value pairs within it.\n'
+                                                                                     'DriverSetup=[config token]:[value];[config token 2]:[value 2] Valid\n'
+                                                                                     'Config Tokens and Values: Config Token topology - Refer to Device book\n'
+                                                                                     'for your switch in the NI Switches Help for valid values. You can also\n'
+                                                                                     'set the value of the topology config token to Configured Topology to\n'
+                                                                                     'specify the last topology that was configured for the device in MAX.\n'
+                                                                                     'Default: MAX configured topology for each device. resourcetype - "daqmx"\n'
+                                                                                     'for devices configured under NI-DAQmx Devices in MAX or "legacy" for\n'
+                                                                                     'devices configured under Traditional NI-DAQ Devices in MAX. Default:\n'
+                                                                                     'daqmx For example, use the following string to set an NI SCXI-1127 as a\n'
+                                                                                     '2-wire 32x1 multiplexer configured in MAX under DAQmx Devices:\n'
+                                                                                     '"DriverSetup=topology:1127/2-Wire 32x1 Mux;resourcetype:daqmx" The\n'
+                                                                                     'DriverSetup string is particularly important when using NI-SWITCH\n'
+                                                                                     'through the IviSwitch class driver. To enable simulation, set simulate\n'
+                                                                                     'equal to 1 and specify the switch module and topology of the switch\n'
+                                                                                     'module to simulate. The following string enables simulation for an\n'
+                                                                                     'SCXI-1127 configured as a 2-wire 32x1 multiplexer. "Simulate=1,\n'
+                                                                                     'DriverSetup=topology:1127/2-Wire 32x1 Mux" If simulate is set to 1 and\n'
+                                                                                     'the DriverSetup string specifies a topology, the topology is used to\n'
+                                                                                     'determine which device to simulate. If the DriverSetup string does not\n'
+                                                                                     'specify a topology, the device specified in resource name is simulated.\n'},
+                                                 'name': 'optionsString',
+                                                 'type': 'ViConstString'},
+                                             {   'direction': 'out',
+                                                 'documentation': {   'description': '\n'
+                                                                                     'A particular NI-SWITCH session established with\n'
+                                                                                     'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                     'and used for all subsequent NI-SWITCH calls.\n',
+                                                                      'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                 'name': 'vi',
+                                                 'type': 'ViSession'}],
+                           'returns': 'ViStatus'},
+    'InitWithTopology': {   'blocking': False,
+                            'codegen_method': 'private',
+                            'documentation': {   'description': '\n'
+                                                                'Returns a session handle used to identify the switch in all subsequent\n'
+                                                                'instrument driver calls and sets the topology of the switch.\n'
+                                                                'niSwitch_InitWithTopology creates a new IVI instrument driver session\n'
+                                                                'for the switch specified in the resourceName parameter. The driver uses\n'
+                                                                'the topology specified in the topology parameter and overrides the\n'
+                                                                'topology specified in MAX. Note: When initializing an NI SwitchBlock\n'
+                                                                'device with topology, you must specify the toplogy created when you\n'
+                                                                'configured the device in MAX, using either\n'
+                                                                'NISWITCH_TOPOLOGY_CONFIGURED_TOPOLOGY or the toplogy string of the\n'
+                                                                'device. Refer to the Initializing with Toplogy for NI SwitchBlock\n'
+                                                                'Devices topic in the NI Switches Help for information about determining\n'
+                                                                'the topology string of an NI SwitchBlock device. By default, the switch\n'
+                                                                'is reset to a known state. Enable simulation by specifying the topology\n'
+                                                                'and setting the simulate parameter to VI_TRUE.\n'},
+                            'has_repeated_capability': False,
+                            'invalidates_attribute_cache': False,
+                            'is_error_handling': False,
+                            'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                            'name': 'InitWithTopology',
+                            'parameters': [   {   'ctypes_type': 'ViRsrc',
+                                                  'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                  'ctypes_variable_name': 'resource_name_ctype',
+                                                  'direction': 'in',
+                                                  'documentation': {   'description': '\n'
+                                                                                      'Resource name of the switch module to initialize. Default value: None\n'
+                                                                                      'Syntax: Optional fields are shown in square brackets ([]). Configured in\n'
+                                                                                      'MAX Under Valid Syntax Devices and Interfaces DeviceName Traditional\n'
+                                                                                      'NI-DAQ Devices SCXI[chassis ID]::slot number PXI System PXI[bus\n'
+                                                                                      'number]::device number TIP: IVI logical names are also valid for the\n'
+                                                                                      'resource name. Default values for optional fields: chassis ID = 1 bus\n'
+                                                                                      'number = 0 Example resource names: Resource Name Description SC1Mod3\n'
+                                                                                      'NI-DAQmx module in chassis "SC1" slot 3 MySwitch NI-DAQmx module renamed\n'
+                                                                                      'to "MySwitch" SCXI1::3 Traditional NI-DAQ module in chassis 1, slot 3\n'
+                                                                                      'SCXI::3 Traditional NI-DAQ module in chassis 1, slot 3 PXI0::16 PXI bus\n'
+                                                                                      '0, device number 16 PXI::16 PXI bus 0, device number 16\n'},
+                                                  'enum': None,
+                                                  'is_buffer': False,
+                                                  'is_repeated_capability': False,
+                                                  'is_session_handle': False,
+                                                  'is_string': True,
+                                                  'library_method_call_snippet': 'resource_name_ctype',
+                                                  'name': 'resourceName',
+                                                  'numpy': False,
+                                                  'numpy_into_return': False,
+                                                  'python_name': 'resource_name',
+                                                  'python_name_or_default_for_init': 'resource_name',
+                                                  'python_name_with_default': 'resource_name',
+                                                  'python_name_with_doc_default': 'resource_name',
+                                                  'python_type': 'str',
+                                                  'size': {'mechanism': 'fixed', 'value': 1},
+                                                  'type': 'ViRsrc',
+                                                  'use_array': False,
+                                                  'use_in_python_api': True,
+                                                  'use_list': False},
+                                              {   'ctypes_type': 'ViConstString',
+                                                  'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                  'ctypes_variable_name': 'topology_ctype',
+                                                  'default_value': '"Configured Topology"',
+                                                  'direction': 'in',
+                                                  'documentation': {   'description': '\n'
+                                                                                      'Pass the topology name you want to use for the switch you specify with\n'
+                                                                                      'Resource Name parameter. You can also pass\n'
+                                                                                      'NISWITCH_TOPOLOGY_CONFIGURED_TOPOLOGY to use the last topology that\n'
+                                                                                      'was configured for the device in MAX. Default Value:\n'
+                                                                                      'NISWITCH_TOPOLOGY_CONFIGURED_TOPOLOGY Valid Values:\n'
+                                                                                      'NISWITCH_TOPOLOGY_1127_1_WIRE_64X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_1127_2_WIRE_32X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_1127_2_WIRE_4X8_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_1127_4_WIRE_16X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_1127_INDEPENDENT\n'
+                                                                                      'NISWITCH_TOPOLOGY_1128_1_WIRE_64X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_1128_2_WIRE_32X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_1128_2_WIRE_4X8_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_1128_4_WIRE_16X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_1128_INDEPENDENT\n'
+                                                                                      'NISWITCH_TOPOLOGY_1129_2_WIRE_16X16_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_1129_2_WIRE_8X32_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_1129_2_WIRE_4X64_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_1129_2_WIRE_DUAL_8X16_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_1129_2_WIRE_DUAL_4X32_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_1129_2_WIRE_QUAD_4X16_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_1130_1_WIRE_256X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_1130_1_WIRE_DUAL_128X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_1130_1_WIRE_4X64_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_1130_1_WIRE_8x32_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_1130_1_WIRE_OCTAL_32X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_1130_1_WIRE_QUAD_64X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_1130_1_WIRE_SIXTEEN_16X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_1130_2_WIRE_4X32_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_1130_2_WIRE_128X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_1130_2_WIRE_OCTAL_16X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_1130_2_WIRE_QUAD_32X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_1130_4_WIRE_64X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_1130_4_WIRE_QUAD_16X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_1130_INDEPENDENT NISWITCH_TOPOLOGY_1160_16_SPDT\n'
+                                                                                      'NISWITCH_TOPOLOGY_1161_8_SPDT\n'
+                                                                                      'NISWITCH_TOPOLOGY_1163R_OCTAL_4X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_1166_16_DPDT NISWITCH_TOPOLOGY_1166_32_SPDT\n'
+                                                                                      'NISWITCH_TOPOLOGY_1167_INDEPENDENT\n'
+                                                                                      'NISWITCH_TOPOLOGY_1169_100_SPST NISWITCH_TOPOLOGY_1169_50_DPST\n'
+                                                                                      'NISWITCH_TOPOLOGY_1175_1_WIRE_196X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_1175_2_WIRE_98X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_1175_2_WIRE_95X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_1190_QUAD_4X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_1191_QUAD_4X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_1192_8_SPDT NISWITCH_TOPOLOGY_1193_32X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_1193_16X1_TERMINATED_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_1193_DUAL_16X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_1193_DUAL_8X1_TERMINATED_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_1193_QUAD_8X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_1193_QUAD_4X1_TERMINATED_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_1193_INDEPENDENT\n'
+                                                                                      'NISWITCH_TOPOLOGY_1194_QUAD_4X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_1195_QUAD_4X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2501_1_WIRE_48X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2501_1_WIRE_48X1_AMPLIFIED_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2501_2_WIRE_24X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2501_2_WIRE_24X1_AMPLIFIED_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2501_2_WIRE_DUAL_12X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2501_2_WIRE_QUAD_6X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2501_2_WIRE_4X6_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2501_4_WIRE_12X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2503_1_WIRE_48X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2503_2_WIRE_24X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2503_2_WIRE_DUAL_12X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2503_2_WIRE_QUAD_6X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2503_2_WIRE_4X6_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2503_4_WIRE_12X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2510_INDEPENDENT\n'
+                                                                                      'NISWITCH_TOPOLOGY_2512_INDEPENDENT\n'
+                                                                                      'NISWITCH_TOPOLOGY_2514_INDEPENDENT\n'
+                                                                                      'NISWITCH_TOPOLOGY_2515_INDEPENDENT NISWITCH_TOPOLOGY_2520_80_SPST\n'
+                                                                                      'NISWITCH_TOPOLOGY_2521_40_DPST NISWITCH_TOPOLOGY_2522_53_SPDT\n'
+                                                                                      'NISWITCH_TOPOLOGY_2523_26_DPDT\n'
+                                                                                      'NISWITCH_TOPOLOGY_2524_1_WIRE_128X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2524_1_WIRE_DUAL_64X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2524_1_WIRE_QUAD_32X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2524_1_WIRE_OCTAL_16X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2524_1_WIRE_SIXTEEN_8X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2525_2_WIRE_64X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2525_2_WIRE_DUAL_32X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2525_2_WIRE_QUAD_16X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2525_2_WIRE_OCTAL_8X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2525_2_WIRE_SIXTEEN_4X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2526_1_WIRE_158X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2526_2_WIRE_79X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2527_1_WIRE_64X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2527_1_WIRE_DUAL_32X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2527_2_WIRE_32X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2527_2_WIRE_DUAL_16X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2527_4_WIRE_16X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2527_INDEPENDENT\n'
+                                                                                      'NISWITCH_TOPOLOGY_2529_2_WIRE_DUAL_4X16_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2529_2_WIRE_8X16_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2529_2_WIRE_4X32_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2530_1_WIRE_128X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2530_1_WIRE_DUAL_64X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2530_1_WIRE_4x32_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2530_1_WIRE_8x16_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2530_1_WIRE_OCTAL_16X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2530_1_WIRE_QUAD_32X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2530_2_WIRE_4x16_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2530_2_WIRE_64X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2530_2_WIRE_DUAL_32X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2530_2_WIRE_QUAD_16X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2530_4_WIRE_32X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2530_4_WIRE_DUAL_16X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2530_INDEPENDENT\n'
+                                                                                      'NISWITCH_TOPOLOGY_2531_1_WIRE_4X128_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2531_1_WIRE_8X64_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2531_1_WIRE_DUAL_4X64_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2531_1_WIRE_DUAL_8X32_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2531_2_WIRE_4X64_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2531_2_WIRE_8X32_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2532_1_WIRE_16X32_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2532_1_WIRE_4X128_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2532_1_WIRE_8X64_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2532_1_WIRE_DUAL_16X16_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2532_1_WIRE_DUAL_4X64_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2532_1_WIRE_DUAL_8X32_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2532_1_WIRE_SIXTEEN_2X16_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2532_2_WIRE_16X16_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2532_2_WIRE_4X64_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2532_2_WIRE_8X32_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2532_2_WIRE_DUAL_4X32_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2533_1_WIRE_4X64_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2534_1_WIRE_8X32_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2535_1_WIRE_4X136_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2536_1_WIRE_8X68_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2540_1_WIRE_8X9_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2541_1_WIRE_8X12_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2542_QUAD_2X1_TERMINATED_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2543_DUAL_4X1_TERMINATED_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2544_8X1_TERMINATED_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2545_4X1_TERMINATED_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2546_DUAL_4X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2547_8X1_MUX NISWITCH_TOPOLOGY_2548_4_SPDT\n'
+                                                                                      'NISWITCH_TOPOLOGY_2549_TERMINATED_2_SPDT\n'
+                                                                                      'NISWITCH_TOPOLOGY_2554_4X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2555_4X1_TERMINATED_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2556_DUAL_4X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2557_8X1_MUX NISWITCH_TOPOLOGY_2558_4_SPDT\n'
+                                                                                      'NISWITCH_TOPOLOGY_2559_TERMINATED_2_SPDT\n'
+                                                                                      'NISWITCH_TOPOLOGY_2564_16_SPST NISWITCH_TOPOLOGY_2564_8_DPST\n'
+                                                                                      'NISWITCH_TOPOLOGY_2565_16_SPST NISWITCH_TOPOLOGY_2566_16_SPDT\n'
+                                                                                      'NISWITCH_TOPOLOGY_2566_8_DPDT NISWITCH_TOPOLOGY_2567_INDEPENDENT\n'
+                                                                                      'NISWITCH_TOPOLOGY_2568_15_DPST NISWITCH_TOPOLOGY_2568_31_SPST\n'
+                                                                                      'NISWITCH_TOPOLOGY_2569_100_SPST NISWITCH_TOPOLOGY_2569_50_DPST\n'
+                                                                                      'NISWITCH_TOPOLOGY_2570_20_DPDT NISWITCH_TOPOLOGY_2570_40_SPDT\n'
+                                                                                      'NISWITCH_TOPOLOGY_2571_66_SPDT\n'
+                                                                                      'NISWITCH_TOPOLOGY_2575_1_WIRE_196X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2575_2_WIRE_98X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2575_2_WIRE_95X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2576_2_WIRE_64X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2576_2_WIRE_DUAL_32X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2576_2_WIRE_OCTAL_8X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2576_2_WIRE_QUAD_16X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2576_2_WIRE_SIXTEEN_4X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2576_INDEPENDENT\n'
+                                                                                      'NISWITCH_TOPOLOGY_2584_1_WIRE_12X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2584_1_WIRE_DUAL_6X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2584_2_WIRE_6X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2584_INDEPENDENT\n'
+                                                                                      'NISWITCH_TOPOLOGY_2585_1_WIRE_10X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2586_10_SPST NISWITCH_TOPOLOGY_2586_5_DPST\n'
+                                                                                      'NISWITCH_TOPOLOGY_2590_4X1_MUX NISWITCH_TOPOLOGY_2591_4X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2593_16X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2593_8X1_TERMINATED_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2593_DUAL_8X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2593_DUAL_4X1_TERMINATED_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2593_INDEPENDENT NISWITCH_TOPOLOGY_2594_4X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2595_4X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2596_DUAL_6X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2597_6X1_TERMINATED_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2598_DUAL_TRANSFER\n'
+                                                                                      'NISWITCH_TOPOLOGY_2599_2_SPDT NISWITCH_TOPOLOGY_2720_INDEPENDENT\n'
+                                                                                      'NISWITCH_TOPOLOGY_2722_INDEPENDENT\n'
+                                                                                      'NISWITCH_TOPOLOGY_2725_INDEPENDENT\n'
+                                                                                      'NISWITCH_TOPOLOGY_2727_INDEPENDENT\n'
+                                                                                      'NISWITCH_TOPOLOGY_2737_2_WIRE_4X64_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2738_2_WIRE_8X32_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2739_2_WIRE_16X16_MATRIX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2746_QUAD_4X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2747_DUAL_8X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2748_16X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2790_INDEPENDENT\n'
+                                                                                      'NISWITCH_TOPOLOGY_2796_DUAL_6X1_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2797_6X1_TERMINATED_MUX\n'
+                                                                                      'NISWITCH_TOPOLOGY_2798_DUAL_TRANSFER\n'
+                                                                                      'NISWITCH_TOPOLOGY_2799_2_SPDT\n'},
+                                                  'enum': None,
+                                                  'is_buffer': False,
+                                                  'is_repeated_capability': False,
+                                                  'is_session_handle': False,
+                                                  'is_string': True,
+                                                  'library_method_call_snippet': 'topology_ctype',
+                                                  'name': 'Topology',
+                                                  'numpy': False,
+                                                  'numpy_into_return': False,
+                                                  'python_name': 'topology',
+                                                  'python_name_or_default_for_init': 'topology',
+                                                  'python_name_with_default': 'topology="Configured Topology"',
+                                                  'python_name_with_doc_default': 'topology=\'"Configured Topology"\'',
+                                                  'python_type': 'str',
+                                                  'size': {'mechanism': 'fixed', 'value': 1},
+                                                  'type': 'ViConstString',
+                                                  'use_array': False,
+                                                  'use_in_python_api': True,
+                                                  'use_list': False},
+                                              {   'ctypes_type': 'ViBoolean',
+                                                  'ctypes_type_library_call': 'ViBoolean',
+                                                  'ctypes_variable_name': 'simulate_ctype',
+                                                  'default_value': False,
+                                                  'direction': 'in',
+                                                  'documentation': {   'description': '\n'
+                                                                                      'Enables simulation of the switch module specified in the resource name\n'
+                                                                                      "parameter. Valid Values: VI_TRUE - simulate VI_FALSE - Don't simulate\n"
+                                                                                      '(Default Value)\n'},
+                                                  'enum': None,
+                                                  'is_buffer': False,
+                                                  'is_repeated_capability': False,
+                                                  'is_session_handle': False,
+                                                  'is_string': False,
+                                                  'library_method_call_snippet': 'simulate_ctype',
+                                                  'name': 'Simulate',
+                                                  'numpy': False,
+                                                  'numpy_into_return': False,
+                                                  'python_name': 'simulate',
+                                                  'python_name_or_default_for_init': 'simulate',
+                                                  'python_name_with_default': 'simulate=False',
+                                                  'python_name_with_doc_default': 'simulate=False',
+                                                  'python_type': 'bool',
+                                                  'size': {'mechanism': 'fixed', 'value': 1},
+                                                  'type': 'ViBoolean',
+                                                  'use_array': False,
+                                                  'use_in_python_api': True,
+                                                  'use_list': False},
+                                              {   'ctypes_type': 'ViBoolean',
+                                                  'ctypes_type_library_call': 'ViBoolean',
+                                                  'ctypes_variable_name': 'reset_device_ctype',
+                                                  'default_value': False,
+                                                  'direction': 'in',
+                                                  'documentation': {   'description': '\n'
+                                                                                      'Specifies whether to reset the switch module during the initialization\n'
+                                                                                      'process. Valid Values: VI_TRUE - Reset Device (Default Value) VI_FALSE\n'
+                                                                                      '- Currently unsupported. The device will not reset.\n'},
+                                                  'enum': None,
+                                                  'is_buffer': False,
+                                                  'is_repeated_capability': False,
+                                                  'is_session_handle': False,
+                                                  'is_string': False,
+                                                  'library_method_call_snippet': 'reset_device_ctype',
+                                                  'name': 'resetDevice',
+                                                  'numpy': False,
+                                                  'numpy_into_return': False,
+                                                  'python_name': 'reset_device',
+                                                  'python_name_or_default_for_init': 'reset_device',
+                                                  'python_name_with_default': 'reset_device=False',
+                                                  'python_name_with_doc_default': 'reset_device=False',
+                                                  'python_type': 'bool',
+                                                  'size': {'mechanism': 'fixed', 'value': 1},
+                                                  'type': 'ViBoolean',
+                                                  'use_array': False,
+                                                  'use_in_python_api': True,
+                                                  'use_list': False},
+                                              {   'ctypes_type': 'ViSession',
+                                                  'ctypes_type_library_call': 'ctypes.POINTER(ViSession)',
+                                                  'ctypes_variable_name': 'vi_ctype',
+                                                  'default_value': '""',
+                                                  'direction': 'out',
+                                                  'documentation': {   'description': '\n'
+                                                                                      'A particular NI-SWITCH session established with\n'
+                                                                                      'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                      'and used for all subsequent NI-SWITCH calls.\n',
+                                                                       'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                  'enum': None,
+                                                  'is_buffer': False,
+                                                  'is_repeated_capability': False,
+                                                  'is_session_handle': False,
+                                                  'is_string': False,
+                                                  'library_method_call_snippet': 'None if vi_ctype is None else (ctypes.pointer(vi_ctype))',
+                                                  'name': 'vi',
+                                                  'numpy': False,
+                                                  'numpy_into_return': False,
+                                                  'python_name': 'vi',
+                                                  'python_name_or_default_for_init': 'vi',
+                                                  'python_name_with_default': 'vi=""',
+                                                  'python_name_with_doc_default': 'vi=\'""\'',
+                                                  'python_type': 'int',
+                                                  'size': {'mechanism': 'fixed', 'value': 1},
+                                                  'type': 'ViSession',
+                                                  'use_array': False,
+                                                  'use_in_python_api': True,
+                                                  'use_list': False}],
+                            'python_code_variables': [],
+                            'python_name': '_init_with_topology',
+                            'render_in_library': True,
+                            'render_in_session_base': False,
+                            'returns': 'ViStatus'},
+    'InitiateScan': {   'blocking': False,
+                        'codegen_method': 'private',
+                        'documentation': {   'description': '\n'
+                                                            'Commits the configured scan list and trigger settings to hardware and\n'
+                                                            'initiates the scan. If niSwitch Commit was called earlier, niSwitch\n'
+                                                            'Initiate Scan only initiates the scan and returns immediately. Once the\n'
+                                                            'scanning operation begins, you cannot perform any other operation other\n'
+                                                            'than GetAttribute, AbortScan, or SendSoftwareTrigger. All other\n'
+                                                            'functions return NISWITCH_ERROR_SCAN_IN_PROGRESS. To stop the\n'
+                                                            'scanning operation, To stop the scanning operation, call\n'
+                                                            'niSwitch_AbortScan.\n'},
+                        'has_repeated_capability': False,
+                        'invalidates_attribute_cache': True,
+                        'is_error_handling': False,
+                        'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                        'name': 'InitiateScan',
+                        'parameters': [   {   'ctypes_type': 'ViSession',
+                                              'ctypes_type_library_call': 'ViSession',
+                                              'ctypes_variable_name': 'vi_ctype',
+                                              'direction': 'in',
+                                              'documentation': {   'description': '\n'
+                                                                                  'A particular NI-SWITCH session established with\n'
+                                                                                  'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                  'and used for all subsequent NI-SWITCH calls.\n',
+                                                                   'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                              'enum': None,
+                                              'is_buffer': False,
+                                              'is_repeated_capability': False,
+                                              'is_session_handle': True,
+                                              'is_string': False,
+                                              'library_method_call_snippet': 'vi_ctype',
+                                              'name': 'vi',
+                                              'numpy': False,
+                                              'numpy_into_return': False,
+                                              'python_name': 'vi',
+                                              'python_name_or_default_for_init': 'vi',
+                                              'python_name_with_default': 'vi',
+                                              'python_name_with_doc_default': 'vi',
+                                              'python_type': 'int',
+                                              'size': {'mechanism': 'fixed', 'value': 1},
+                                              'type': 'ViSession',
+                                              'use_array': False,
+                                              'use_in_python_api': True,
+                                              'use_list': False}],
+                        'python_code_variables': [],
+                        'python_name': '_initiate_scan',
+                        'render_in_library': True,
+                        'render_in_session_base': False,
+                        'returns': 'ViStatus'},
+    'IsDebounced': {   'codegen_method': 'no',
+                       'documentation': {'description': '\nIndicates if all created paths have settled by returning the value of\nthe NISWITCH_ATTR_IS_DEBOUNCED attribute.\n'},
+                       'parameters': [   {   'direction': 'in',
+                                             'documentation': {   'description': '\n'
+                                                                                 'A particular NI-SWITCH session established with\n'
+                                                                                 'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                 'and used for all subsequent NI-SWITCH calls.\n',
+                                                                  'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                             'name': 'vi',
+                                             'type': 'ViSession'},
+                                         {   'direction': 'out',
+                                             'documentation': {   'description': '\n'
+                                                                                 'VI_TRUE indicates that all created paths have settled. VI_FALSE\n'
+                                                                                 'indicates that all created paths have not settled.\n'},
+                                             'name': 'isDebounced',
+                                             'type': 'ViBoolean'}],
+                       'returns': 'ViStatus'},
+    'IsScanning': {   'codegen_method': 'no',
+                      'documentation': {'description': 'Indicates the status of the scan.'},
+                      'parameters': [   {   'direction': 'in',
+                                            'documentation': {   'description': '\n'
+                                                                                'A particular NI-SWITCH session established with\n'
+                                                                                'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                'and used for all subsequent NI-SWITCH calls.\n',
+                                                                 'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                            'name': 'vi',
+                                            'type': 'ViSession'},
+                                        {   'direction': 'out',
+                                            'documentation': {   'description': '\n'
+                                                                                'The driver returns the value of NISWITCH_ATTR_IS_SCANNING attribute.\n'
+                                                                                'VI_TRUE indicates that the switch device is scanning. VI_FALSE\n'
+                                                                                'indicates that the switch device is idle.\n'},
+                                            'name': 'isScanning',
+                                            'type': 'ViBoolean'}],
+                      'returns': 'ViStatus'},
+    'LockSession': {   'codegen_method': 'no',
+                       'documentation': {   'description': '\n'
+                                                           'This function obtains a multithread lock on the instrument session.\n'
+                                                           'Before it does so, it waits until all other execution threads have\n'
+                                                           'released their locks on the instrument session. Other threads might have\n'
+                                                           "obtained a lock on this session in the following ways: - The user's\n"
+                                                           'application called niSwitch_LockSession. - A call to the instrument\n'
+                                                           'driver locked the session. - A call to the IVI engine locked the\n'
+                                                           'session. After your call to niSwitch_LockSession returns successfully,\n'
+                                                           'no other threads can access the instrument session until you call\n'
+                                                           'niSwitch_UnlockSession. Use niSwitch_LockSession and\n'
+                                                           'niSwitch_UnlockSession around a sequence of calls to instrument driver\n'
+                                                           'functions if you require that the instrument retain its settings through\n'
+                                                           'the end of the sequence. You can safely make nested calls to\n'
+                                                           'niSwitch_LockSession within the same thread. To completely unlock the\n'
+                                                           'session, you must balance each call to niSwitch_LockSession with a call\n'
+                                                           'to niSwitch_UnlockSession. If, however, you use the Caller Has Lock\n'
+                                                           'parameter in all calls to niSwitch_LockSession and\n'
+                                                           'niSwitch_UnlockSession within a function, the IVI Library locks the\n'
+                                                           'session only once within the function regardless of the number of calls\n'
+                                                           'you make to niSwitch_LockSession. This allows you to call\n'
+                                                           'niSwitch_UnlockSession just once at the end of the function.\n',
+                                            'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                       'parameters': [   {   'direction': 'in',
+                                             'documentation': {   'description': '\n'
+                                                                                 'A particular NI-SWITCH session established with\n'
+                                                                                 'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                 'and used for all subsequent NI-SWITCH calls.\n',
+                                                                  'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                             'name': 'vi',
+                                             'type': 'ViSession'},
+                                         {   'direction': 'out',
+                                             'documentation': {   'description': '\n'
+                                                                                 'This parameter serves as a convenience. If you do not want to use this\n'
+                                                                                 'parameter, pass VI_NULL. Use this parameter in complex functions to\n'
+                                                                                 'keep track of whether you obtain a lock and therefore need to unlock the\n'
+                                                                                 'session. Pass the address of a local ViBoolean variable. In the\n'
+                                                                                 'declaration of the local variable, initialize it to VI_FALSE. Pass the\n'
+                                                                                 'address of the same local variable to any other calls you make to\n'
+                                                                                 'niSwitch_LockSession or niSwitch_UnlockSession in the same function.\n'
+                                                                                 'The parameter is an input/output parameter. niSwitch_LockSession and\n'
+                                                                                 'niSwitch_UnlockSession each inspect the current value and take the\n'
+                                                                                 'following actions: - If the value is VI_TRUE, niSwitch_LockSession\n'
+                                                                                 'does not lock the session again. If the value is VI_FALSE,\n'
+                                                                                 'niSwitch_LockSession obtains the lock and sets the value of the\n'
+                                                                                 'parameter to VI_TRUE. - If the value is VI_FALSE,\n'
+                                                                                 'niSwitch_UnlockSession does not attempt to unlock the session. If the\n'
+                                                                                 'value is VI_TRUE, niSwitch_UnlockSession releases the lock and sets\n'
+                                                                                 'the value of the parameter to VI_FALSE. Thus, you can, call\n'
+                                                                                 'niSwitch_UnlockSession at the end of your function without worrying\n'
+                                                                                 'about whether you actually have the lock. Example: ViStatus TestFunc\n'
+                                                                                 '(ViSession vi, ViInt32 flags) { ViStatus error = VI_SUCCESS; ViBoolean\n'
+                                                                                 'haveLock = VI_FALSE; if (flags & BIT_1) { viCheckErr(\n'
+                                                                                 'niSwitch_LockSession(vi, &haveLock;)); viCheckErr( TakeAction1(vi)); if\n'
+                                                                                 '(flags & BIT_2) { viCheckErr( niSwitch_UnlockSession(vi, &haveLock;));\n'
+                                                                                 'viCheckErr( TakeAction2(vi)); viCheckErr( niSwitch_LockSession(vi,\n'
+                                                                                 '&haveLock;); } if (flags & BIT_3) viCheckErr( TakeAction3(vi)); }\n'
+                                                                                 'Error: /\\* At this point, you cannot really be sure that you have the\n'
+                                                                                 'lock. Fortunately, the haveLock variable takes care of that for you. \\*/\n'
+                                                                                 'niSwitch_UnlockSession(vi, &haveLock;); return error; }\n',
+                                                                  'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                             'name': 'callerHasLock',
+                                             'type': 'ViBoolean'}],
+                       'returns': 'ViStatus'},
+    'RelayControl': {   'blocking': False,
+                        'codegen_method': 'public',
+                        'documentation': {   'description': '\n'
+                                                            'Controls individual relays of the switch. When controlling individual\n'
+                                                            'relays, the protection offered by setting the usage of source channels\n'
+                                                            'and configuration channels, and by enabling or disabling analog bus\n'
+                                                            'sharing on the NI SwitchBlock, does not apply. Refer to the device book\n'
+                                                            'for your switch in the NI Switches Help to determine if the switch\n'
+                                                            'supports individual relay control.\n'},
+                        'has_repeated_capability': False,
+                        'invalidates_attribute_cache': True,
+                        'is_error_handling': False,
+                        'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                        'name': 'RelayControl',
+                        'parameters': [   {   'ctypes_type': 'ViSession',
+                                              'ctypes_type_library_call': 'ViSession',
+                                              'ctypes_variable_name': 'vi_ctype',
+                                              'direction': 'in',
+                                              'documentation': {   'description': '\n'
+                                                                                  'A particular NI-SWITCH session established with\n'
+                                                                                  'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                  'and used for all subsequent NI-SWITCH calls.\n',
+                                                                   'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                              'enum': None,
+                                              'is_buffer': False,
+                                              'is_repeated_capability': False,
+                                              'is_session_handle': True,
+                                              'is_string': False,
+                                              'library_method_call_snippet': 'vi_ctype',
+                                              'name': 'vi',
+                                              'numpy': False,
+                                              'numpy_into_return': False,
+                                              'python_name': 'vi',
+                                              'python_name_or_default_for_init': 'vi',
+                                              'python_name_with_default': 'vi',
+                                              'python_name_with_doc_default': 'vi',
+                                              'python_type': 'int',
+                                              'size': {'mechanism': 'fixed', 'value': 1},
+                                              'type': 'ViSession',
+                                              'use_array': False,
+                                              'use_in_python_api': True,
+                                              'use_list': False},
+                                          {   'ctypes_type': 'ViConstString',
+                                              'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                              'ctypes_variable_name': 'relay_name_ctype',
+                                              'direction': 'in',
+                                              'documentation': {   'description': '\n'
+                                                                                  'Name of the relay. Default value: None Examples of valid relay names:\n'
+                                                                                  'ch0, ab0, 1wire, hlselect Refer to Devices Overview for a list of valid\n'
+                                                                                  'relay names for the switch module.\n'},
+                                              'enum': None,
+                                              'is_buffer': False,
+                                              'is_repeated_capability': False,
+                                              'is_session_handle': False,
+                                              'is_string': True,
+                                              'library_method_call_snippet': 'relay_name_ctype',
+                                              'name': 'relayName',
+                                              'numpy': False,
+                                              'numpy_into_return': False,
+                                              'python_name': 'relay_name',
+                                              'python_name_or_default_for_init': 'relay_name',
+                                              'python_name_with_default': 'relay_name',
+                                              'python_name_with_doc_default': 'relay_name',
+                                              'python_type': 'str',
+                                              'size': {'mechanism': 'fixed', 'value': 1},
+                                              'type': 'ViConstString',
+                                              'use_array': False,
+                                              'use_in_python_api': True,
+                                              'use_list': False},
+                                          {   'ctypes_type': 'ViInt32',
+                                              'ctypes_type_library_call': 'ViInt32',
+                                              'ctypes_variable_name': 'relay_action_ctype',
+                                              'direction': 'in',
+                                              'documentation': {   'description': '\n'
+                                                                                  'Specifies whether to open or close a given relay. Default value: Relay\n'
+                                                                                  'Close Defined values: NISWITCH_VAL_OPEN_RELAY\n'
+                                                                                  'NISWITCH_VAL_CLOSE_RELAY (Default Value)\n',
+                                                                   'note': [   '\n'
+                                                                               'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or '
+                                                                               'represent True/False, have been removed.\n']},
+                                              'enum': 'RelayAction',
+                                              'is_buffer': False,
+                                              'is_repeated_capability': False,
+                                              'is_session_handle': False,
+                                              'is_string': False,
+                                              'library_method_call_snippet': 'relay_action_ctype',
+                                              'name': 'relayAction',
+                                              'numpy': False,
+                                              'numpy_into_return': False,
+                                              'python_name': 'relay_action',
+                                              'python_name_or_default_for_init': 'relay_action',
+                                              'python_name_with_default': 'relay_action',
+                                              'python_name_with_doc_default': 'relay_action',
+                                              'python_type': 'enums.RelayAction',
+                                              'size': {'mechanism': 'fixed', 'value': 1},
+                                              'type': 'ViInt32',
+                                              'use_array': False,
+                                              'use_in_python_api': True,
+                                              'use_list': False}],
+                        'python_code_variables': [],
+                        'python_name': 'relay_control',
+                        'render_in_library': True,
+                        'render_in_session_base': False,
+                        'returns': 'ViStatus'},
+    'ResetInterchangeCheck': {   'codegen_method': 'no',
+                                 'documentation': {   'description': '\n'
+                                                                     'When developing a complex test system that consists of multiple test\n'
+                                                                     'modules, it is generally a good idea to design the test modules so that\n'
+                                                                     'they can run in any order. To do so requires ensuring that each test\n'
+                                                                     'module completely configures the state of each instrument it uses. If a\n'
+                                                                     'particular test module does not completely configure the state of an\n'
+                                                                     'instrument, the state of the instrument depends on the configuration\n'
+                                                                     'from a previously executed test module. If you execute the test modules\n'
+                                                                     'in a different order, the behavior of the instrument and therefore the\n'
+                                                                     'entire test module is likely to change. This change in behavior is\n'
+                                                                     'generally instrument specific and represents an interchangeability\n'
+                                                                     'problem. You can use this function to test for such cases. After you\n'
+                                                                     'call this function, the interchangeability checking algorithms in the\n'
+                                                                     'specific driver ignore all previous configuration operations. By calling\n'
+                                                                     'this function at the beginning of a test module, you can determine\n'
+                                                                     'whether the test module has dependencies on the operation of previously\n'
+                                                                     'executed test modules. This function does not clear the\n'
+                                                                     'interchangeability warnings from the list of previously recorded\n'
+                                                                     'interchangeability warnings. If you want to guarantee that the\n'
+                                                                     'niSwitch_GetNextInterchangeWarning function only returns those\n'
+                                                                     'interchangeability warnings that are generated after calling this\n'
+                                                                     'function, you must clear the list of interchangeability warnings. You\n'
+                                                                     'can clear the interchangeability warnings list by repeatedly calling the\n'
+                                                                     'niSwitch_GetNextInterchangeWarning function until no more\n'
+                                                                     'interchangeability warnings are returned. If you are not interested in\n'
+                                                                     'the content of those warnings, you can call the\n'
+                                                                     'niSwitch_ClearInterchangeWarnings function.\n',
+                                                      'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                 'parameters': [   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'A particular NI-SWITCH session established with\n'
+                                                                                           'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                           'and used for all subsequent NI-SWITCH calls.\n',
+                                                                            'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                       'name': 'vi',
+                                                       'type': 'ViSession'}],
+                                 'returns': 'ViStatus'},
+    'ResetWithDefaults': {   'blocking': False,
+                             'codegen_method': 'public',
+                             'documentation': {   'description': '\n'
+                                                                 'Resets the switch module and applies initial user specified settings\n'
+                                                                 'from the logical name used to initialize the session. If the session was\n'
+                                                                 'created without a logical name, this function is equivalent to\n'
+                                                                 'niSwitch_reset.\n'},
+                             'has_repeated_capability': False,
+                             'invalidates_attribute_cache': True,
+                             'is_error_handling': False,
+                             'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                             'name': 'ResetWithDefaults',
+                             'parameters': [   {   'ctypes_type': 'ViSession',
+                                                   'ctypes_type_library_call': 'ViSession',
+                                                   'ctypes_variable_name': 'vi_ctype',
+                                                   'direction': 'in',
+                                                   'documentation': {   'description': '\n'
+                                                                                       'A particular NI-SWITCH session established with\n'
+                                                                                       'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                       'and used for all subsequent NI-SWITCH calls.\n',
+                                                                        'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                   'enum': None,
+                                                   'is_buffer': False,
+                                                   'is_repeated_capability': False,
+                                                   'is_session_handle': True,
+                                                   'is_string': False,
+                                                   'library_method_call_snippet': 'vi_ctype',
+                                                   'name': 'vi',
+                                                   'numpy': False,
+                                                   'numpy_into_return': False,
+                                                   'python_name': 'vi',
+                                                   'python_name_or_default_for_init': 'vi',
+                                                   'python_name_with_default': 'vi',
+                                                   'python_name_with_doc_default': 'vi',
+                                                   'python_type': 'int',
+                                                   'size': {'mechanism': 'fixed', 'value': 1},
+                                                   'type': 'ViSession',
+                                                   'use_array': False,
+                                                   'use_in_python_api': True,
+                                                   'use_list': False}],
+                             'python_code_variables': [],
+                             'python_name': 'reset_with_defaults',
+                             'render_in_library': True,
+                             'render_in_session_base': False,
+                             'returns': 'ViStatus'},
+    'RouteScanAdvancedOutput': {   'blocking': False,
+                                   'codegen_method': 'public',
+                                   'documentation': {'description': '\nRoutes the scan advanced output trigger from a trigger bus line (TTLx)\nto the front or rear connector.\n'},
+                                   'has_repeated_capability': False,
+                                   'invalidates_attribute_cache': True,
+                                   'is_error_handling': False,
+                                   'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                   'name': 'RouteScanAdvancedOutput',
+                                   'parameters': [   {   'ctypes_type': 'ViSession',
+                                                         'ctypes_type_library_call': 'ViSession',
+                                                         'ctypes_variable_name': 'vi_ctype',
+                                                         'direction': 'in',
+                                                         'documentation': {   'description': '\n'
+                                                                                             'A particular NI-SWITCH session established with\n'
+                                                                                             'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                             'and used for all subsequent NI-SWITCH calls.\n',
+                                                                              'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                         'enum': None,
+                                                         'is_buffer': False,
+                                                         'is_repeated_capability': False,
+                                                         'is_session_handle': True,
+                                                         'is_string': False,
+                                                         'library_method_call_snippet': 'vi_ctype',
+                                                         'name': 'vi',
+                                                         'numpy': False,
+                                                         'numpy_into_return': False,
+                                                         'python_name': 'vi',
+                                                         'python_name_or_default_for_init': 'vi',
+                                                         'python_name_with_default': 'vi',
+                                                         'python_name_with_doc_default': 'vi',
+                                                         'python_type': 'int',
+                                                         'size': {'mechanism': 'fixed', 'value': 1},
+                                                         'type': 'ViSession',
+                                                         'use_array': False,
+                                                         'use_in_python_api': True,
+                                                         'use_list': False},
+                                                     {   'ctypes_type': 'ViInt32',
+                                                         'ctypes_type_library_call': 'ViInt32',
+                                                         'ctypes_variable_name': 'scan_advanced_output_connector_ctype',
+                                                         'direction': 'in',
+                                                         'documentation': {   'description': '\n'
+                                                                                             'The scan advanced trigger destination. Valid locations are the\n'
+                                                                                             'NISWITCH_VAL_FRONTCONNECTOR and NISWITCH_VAL_REARCONNECTOR. Default\n'
+                                                                                             'value: NISWITCH_VAL_FRONTCONNECTOR\n',
+                                                                              'note': [   '\n'
+                                                                                          'One or more of the referenced values are not in the Python API for this driver. Enums that only define '
+                                                                                          'values, or represent True/False, have been removed.\n']},
+                                                         'enum': 'ScanAdvancedOutput',
+                                                         'is_buffer': False,
+                                                         'is_repeated_capability': False,
+                                                         'is_session_handle': False,
+                                                         'is_string': False,
+                                                         'library_method_call_snippet': 'scan_advanced_output_connector_ctype',
+                                                         'name': 'scanAdvancedOutputConnector',
+                                                         'numpy': False,
+                                                         'numpy_into_return': False,
+                                                         'python_name': 'scan_advanced_output_connector',
+                                                         'python_name_or_default_for_init': 'scan_advanced_output_connector',
+                                                         'python_name_with_default': 'scan_advanced_output_connector',
+                                                         'python_name_with_doc_default': 'scan_advanced_output_connector',
+                                                         'python_type': 'enums.ScanAdvancedOutput',
+                                                         'size': {'mechanism': 'fixed', 'value': 1},
+                                                         'type': 'ViInt32',
+                                                         'use_array': False,
+                                                         'use_in_python_api': True,
+                                                         'use_list': False},
+                                                     {   'ctypes_type': 'ViInt32',
+                                                         'ctypes_type_library_call': 'ViInt32',
+                                                         'ctypes_variable_name': 'scan_advanced_output_bus_line_ctype',
+                                                         'direction': 'in',
+                                                         'documentation': {   'description': '\n'
+                                                                                             'The trigger line to route the scan advanced output trigger from the\n'
+                                                                                             'front or rear connector. Select NISWITCH_VAL_NONE to break an existing\n'
+                                                                                             'route. Default value: None Valid Values: NISWITCH_VAL_NONE\n'
+                                                                                             'NISWITCH_VAL_TTL0 NISWITCH_VAL_TTL1 NISWITCH_VAL_TTL2\n'
+                                                                                             'NISWITCH_VAL_TTL3 NISWITCH_VAL_TTL4 NISWITCH_VAL_TTL5\n'
+                                                                                             'NISWITCH_VAL_TTL6 NISWITCH_VAL_TTL7\n',
+                                                                              'note': [   '\n'
+                                                                                          'One or more of the referenced values are not in the Python API for this driver. Enums that only define '
+                                                                                          'values, or represent True/False, have been removed.\n']},
+                                                         'enum': 'ScanAdvancedOutput',
+                                                         'is_buffer': False,
+                                                         'is_repeated_capability': False,
+                                                         'is_session_handle': False,
+                                                         'is_string': False,
+                                                         'library_method_call_snippet': 'scan_advanced_output_bus_line_ctype',
+                                                         'name': 'scanAdvancedOutputBusLine',
+                                                         'numpy': False,
+                                                         'numpy_into_return': False,
+                                                         'python_name': 'scan_advanced_output_bus_line',
+                                                         'python_name_or_default_for_init': 'scan_advanced_output_bus_line',
+                                                         'python_name_with_default': 'scan_advanced_output_bus_line',
+                                                         'python_name_with_doc_default': 'scan_advanced_output_bus_line',
+                                                         'python_type': 'enums.ScanAdvancedOutput',
+                                                         'size': {'mechanism': 'fixed', 'value': 1},
+                                                         'type': 'ViInt32',
+                                                         'use_array': False,
+                                                         'use_in_python_api': True,
+                                                         'use_list': False},
+                                                     {   'ctypes_type': 'ViBoolean',
+                                                         'ctypes_type_library_call': 'ViBoolean',
+                                                         'ctypes_variable_name': 'invert_ctype',
+                                                         'default_value': False,
+                                                         'direction': 'in',
+                                                         'documentation': {   'description': '\n'
+                                                                                             'If VI_TRUE, inverts the input trigger signal from falling to rising or\n'
+                                                                                             'vice versa. Default value: VI_FALSE\n'},
+                                                         'enum': None,
+                                                         'is_buffer': False,
+                                                         'is_repeated_capability': False,
+                                                         'is_session_handle': False,
+                                                         'is_string': False,
+                                                         'library_method_call_snippet': 'invert_ctype',
+                                                         'name': 'Invert',
+                                                         'numpy': False,
+                                                         'numpy_into_return': False,
+                                                         'python_name': 'invert',
+                                                         'python_name_or_default_for_init': 'invert',
+                                                         'python_name_with_default': 'invert=False',
+                                                         'python_name_with_doc_default': 'invert=False',
+                                                         'python_type': 'bool',
+                                                         'size': {'mechanism': 'fixed', 'value': 1},
+                                                         'type': 'ViBoolean',
+                                                         'use_array': False,
+                                                         'use_in_python_api': True,
+                                                         'use_list': False}],
+                                   'python_code_variables': [],
+                                   'python_name': 'route_scan_advanced_output',
+                                   'render_in_library': True,
+                                   'render_in_session_base': False,
+                                   'returns': 'ViStatus'},
+    'RouteTriggerInput': {   'blocking': False,
+                             'codegen_method': 'public',
+                             'documentation': {   'description': '\n'
+                                                                 'Routes the input trigger from the front or rear connector to a trigger\n'
+                                                                 'bus line (TTLx). To disconnect the route, call this function again and\n'
+                                                                 'specify None for trigger bus line parameter.\n'},
+                             'has_repeated_capability': False,
+                             'invalidates_attribute_cache': True,
+                             'is_error_handling': False,
+                             'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                             'name': 'RouteTriggerInput',
+                             'parameters': [   {   'ctypes_type': 'ViSession',
+                                                   'ctypes_type_library_call': 'ViSession',
+                                                   'ctypes_variable_name': 'vi_ctype',
+                                                   'direction': 'in',
+                                                   'documentation': {   'description': '\n'
+                                                                                       'A particular NI-SWITCH session established with\n'
+                                                                                       'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                       'and used for all subsequent NI-SWITCH calls.\n',
+                                                                        'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                   'enum': None,
+                                                   'is_buffer': False,
+                                                   'is_repeated_capability': False,
+                                                   'is_session_handle': True,
+                                                   'is_string': False,
+                                                   'library_method_call_snippet': 'vi_ctype',
+                                                   'name': 'vi',
+                                                   'numpy': False,
+                                                   'numpy_into_return': False,
+                                                   'python_name': 'vi',
+                                                   'python_name_or_default_for_init': 'vi',
+                                                   'python_name_with_default': 'vi',
+                                                   'python_name_with_doc_default': 'vi',
+                                                   'python_type': 'int',
+                                                   'size': {'mechanism': 'fixed', 'value': 1},
+                                                   'type': 'ViSession',
+                                                   'use_array': False,
+                                                   'use_in_python_api': True,
+                                                   'use_list': False},
+                                               {   'ctypes_type': 'ViInt32',
+                                                   'ctypes_type_library_call': 'ViInt32',
+                                                   'ctypes_variable_name': 'trigger_input_connector_ctype',
+                                                   'direction': 'in',
+                                                   'documentation': {   'description': '\n'
+                                                                                       'The location of the input trigger source on the switch module. Valid\n'
+                                                                                       'locations are the NISWITCH_VAL_FRONTCONNECTOR and\n'
+                                                                                       'NISWITCH_VAL_REARCONNECTOR. Default value:\n'
+                                                                                       'NISWITCH_VAL_FRONTCONNECTOR\n',
+                                                                        'note': [   '\n'
+                                                                                    'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or '
+                                                                                    'represent True/False, have been removed.\n']},
+                                                   'enum': 'TriggerInput',
+                                                   'is_buffer': False,
+                                                   'is_repeated_capability': False,
+                                                   'is_session_handle': False,
+                                                   'is_string': False,
+                                                   'library_method_call_snippet': 'trigger_input_connector_ctype',
+                                                   'name': 'triggerInputConnector',
+                                                   'numpy': False,
+                                                   'numpy_into_return': False,
+                                                   'python_name': 'trigger_input_connector',
+                                                   'python_name_or_default_for_init': 'trigger_input_connector',
+                                                   'python_name_with_default': 'trigger_input_connector',
+                                                   'python_name_with_doc_default': 'trigger_input_connector',
+                                                   'python_type': 'enums.TriggerInput',
+                                                   'size': {'mechanism': 'fixed', 'value': 1},
+                                                   'type': 'ViInt32',
+                                                   'use_array': False,
+                                                   'use_in_python_api': True,
+                                                   'use_list': False},
+                                               {   'ctypes_type': 'ViInt32',
+                                                   'ctypes_type_library_call': 'ViInt32',
+                                                   'ctypes_variable_name': 'trigger_input_bus_line_ctype',
+                                                   'direction': 'in',
+                                                   'documentation': {   'description': '\n'
+                                                                                       'The trigger line to route the input trigger. Select NISWITCH_VAL_NONE\n'
+                                                                                       'to break an existing route. Default value: None Valid Values:\n'
+                                                                                       'NISWITCH_VAL_NONE NISWITCH_VAL_TTL0 NISWITCH_VAL_TTL1\n'
+                                                                                       'NISWITCH_VAL_TTL2 NISWITCH_VAL_TTL3 NISWITCH_VAL_TTL4\n'
+                                                                                       'NISWITCH_VAL_TTL5 NISWITCH_VAL_TTL6 NISWITCH_VAL_TTL7\n',
+                                                                        'note': [   '\n'
+                                                                                    'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or '
+                                                                                    'represent True/False, have been removed.\n']},
+                                                   'enum': 'TriggerInput',
+                                                   'is_buffer': False,
+                                                   'is_repeated_capability': False,
+                                                   'is_session_handle': False,
+                                                   'is_string': False,
+                                                   'library_method_call_snippet': 'trigger_input_bus_line_ctype',
+                                                   'name': 'triggerInputBusLine',
+                                                   'numpy': False,
+                                                   'numpy_into_return': False,
+                                                   'python_name': 'trigger_input_bus_line',
+                                                   'python_name_or_default_for_init': 'trigger_input_bus_line',
+                                                   'python_name_with_default': 'trigger_input_bus_line',
+                                                   'python_name_with_doc_default': 'trigger_input_bus_line',
+                                                   'python_type': 'enums.TriggerInput',
+                                                   'size': {'mechanism': 'fixed', 'value': 1},
+                                                   'type': 'ViInt32',
+                                                   'use_array': False,
+                                                   'use_in_python_api': True,
+                                                   'use_list': False},
+                                               {   'ctypes_type': 'ViBoolean',
+                                                   'ctypes_type_library_call': 'ViBoolean',
+                                                   'ctypes_variable_name': 'invert_ctype',
+                                                   'default_value': False,
+                                                   'direction': 'in',
+                                                   'documentation': {'description': '\nIf VI_TRUE, inverts the input trigger signal from falling to rising or\nvice versa. Default value: VI_FALSE\n'},
+                                                   'enum': None,
+                                                   'is_buffer': False,
+                                                   'is_repeated_capability': False,
+                                                   'is_session_handle': False,
+                                                   'is_string': False,
+                                                   'library_method_call_snippet': 'invert_ctype',
+                                                   'name': 'Invert',
+                                                   'numpy': False,
+                                                   'numpy_into_return': False,
+                                                   'python_name': 'invert',
+                                                   'python_name_or_default_for_init': 'invert',
+                                                   'python_name_with_default': 'invert=False',
+                                                   'python_name_with_doc_default': 'invert=False',
+                                                   'python_type': 'bool',
+                                                   'size': {'mechanism': 'fixed', 'value': 1},
+                                                   'type': 'ViBoolean',
+                                                   'use_array': False,
+                                                   'use_in_python_api': True,
+                                                   'use_list': False}],
+                             'python_code_variables': [],
+                             'python_name': 'route_trigger_input',
+                             'render_in_library': True,
+                             'render_in_session_base': False,
+                             'returns': 'ViStatus'},
+    'Scan': {   'codegen_method': 'no',
+                'documentation': {   'description': '\n'
+                                                    'This function is a high level operation for scanning. It takes the scan\n'
+                                                    'list provided, programs the switching hardware and initiates the scan.\n'
+                                                    'Once initiation is complete, the operation will return. The scan list\n'
+                                                    'itself is comprised of a list of channel connections separated by\n'
+                                                    'semicolons. For example, the following scan list would scan the first\n'
+                                                    'three channels of a multiplexer. Example: com0->ch0; com0->ch1;\n'
+                                                    'com0->ch2; For more information on scan list syntax, refer to the NI\n'
+                                                    'Switches Help. To see the status of the scan, you can call either\n'
+                                                    'niSwitch_IsScanning or niSwitch_WaitForScanComplete. Use the\n'
+                                                    'niSwitch_ConfigureScanTrigger function to configure the scan trigger.\n'
+                                                    'Use the niSwitch_AbortScan function to stop the scan if you are in\n'
+                                                    'continuous scan mode (Refer to niSwitch_SetContinuousScan); otherwise\n'
+                                                    'the scan halts automatically when the end of the scan list is reached.\n'
+                                                    'For reference, this operation is equivalent to calling\n'
+                                                    'niSwitch_ConfigureScanList and niSwitch_InitiateScan.\n',
+                                     'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                'parameters': [   {   'direction': 'in',
+                                      'documentation': {   'description': '\n'
+                                                                          'A particular NI-SWITCH session established with\n'
+                                                                          'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                          'and used for all subsequent NI-SWITCH calls.\n',
+                                                           'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                      'name': 'vi',
+                                      'type': 'ViSession'},
+                                  {   'direction': 'in',
+                                      'documentation': {   'description': '\n'
+                                                                          'Pass the scan list you want the instrument to use. The driver uses this\n'
+                                                                          'value to set the NISWITCH_ATTR_SCAN_LIST attribute. The scan list is\n'
+                                                                          'a string that specifies channel connections and trigger conditions for\n'
+                                                                          'scanning. After you call the niSwitch_InitiateScan function, the\n'
+                                                                          'instrument makes or breaks connections and waits for triggers according\n'
+                                                                          'to the instructions in the scan list. The scan list is comprised of\n'
+                                                                          'channel names that you separate with special characters. These special\n'
+                                                                          'characters determine the operation the scanner performs on the channels\n'
+                                                                          'when it executes this scan list. To create a path between two channels,\n'
+                                                                          "use '->' (a dash followed by a '>' sign) between the two channel names.\n"
+                                                                          'Example: "CH1->CH2" instructs the switch to make a path from channel CH1\n'
+                                                                          "to channel CH2. To break or clear a path, use a '~' (tilde) as a prefix\n"
+                                                                          'before the path. Example: "~CH1->CH2" instructs the switch to break the\n'
+                                                                          'path from channel CH1 to channel CH2. To wait for a trigger event, use a\n'
+                                                                          "';' (semicolon) as a separator between paths. Example:\n"
+                                                                          '"CH1->CH2;CH3->CH4" instructs the switch to make the path from channel\n'
+                                                                          'CH1 to channel CH2, wait for a trigger, and then make the path from CH3\n'
+                                                                          'to CH4. To tell the switch device to create multiple paths\n'
+                                                                          "simultaneously, use an '&' (ampersand) character as a separator between\n"
+                                                                          'the paths. Example: "CH0->CH1; CH1->CH2 & CH3->CH4" instructs the\n'
+                                                                          'scanner to make the path between channels CH0 and CH1, wait for a\n'
+                                                                          'trigger, and then simultaneously make the paths between channels CH1 and\n'
+                                                                          'CH2 and between channels CH3 and CH4. For SCXI use the following syntax\n'
+                                                                          ': - For a single channel: sc!md!ch -> com0; For example: for Chassis 1,\n'
+                                                                          'module in slot 3, and ch 30 the syntax is: sc1!md3!ch30 ->com0; For\n'
+                                                                          'multiple sequential channels: sc!md!ch -> com0; For example: for Chassis\n'
+                                                                          '1, module in slot 3, and ch 30 to 19 the syntax is: sc1!md3!ch30:19\n'
+                                                                          '->com0; will scan from channel 30 to 19 sequentially. For multiple\n'
+                                                                          'randomly ordered channels: sc!md!ch -> com0; sc!md!ch -> com0; For\n'
+                                                                          'example: for Chassis 1, module in slot 3 and slot 4, and ch 30 and 5 on\n'
+                                                                          'slot 3 and channel 19 on slot 4the syntax is: sc1!md3!ch30 ->com0;\n'
+                                                                          'sc1!md4!ch19 ->com0; sc1!md3!ch5 ->com0; This will scan ch30 of slot 3\n'
+                                                                          'then ch19 of slot 4 then ch5 of slot3. For more information on scan list\n'
+                                                                          'syntax, refer to the NI Switches Help. Default Value: None\n'},
+                                      'name': 'Scanlist',
+                                      'type': 'ViConstString'},
+                                  {   'direction': 'in',
+                                      'documentation': {   'description': '\n'
+                                                                          'Use the initiation paramater to specify whether the switch device or the\n'
+                                                                          'measurement device will be initiating the scan trigger handshake. This\n'
+                                                                          'parameter determines whether to wait for the scan to reach a trigger\n'
+                                                                          'point before completing. If the Measurement Device will initiate the\n'
+                                                                          'scan, set this parameter to\n'
+                                                                          'NISWITCH_VAL_MEASUREMENT_DEVICE_INITIATED. This function will then\n'
+                                                                          'wait until the switch is waiting for a trigger from the measurement\n'
+                                                                          'device before completing. If the Switch will initiate the scan, set this\n'
+                                                                          'parameter to NISWITCH_VAL_SWITCH_INITIATED. This function will then\n'
+                                                                          'complete immediately after initating the scan. You should have already\n'
+                                                                          'set up your DMM to wait for a trigger before calling this function with\n'
+                                                                          'initiation set to NISWITCH_VAL_SWITCH_INITIATED. Valid values:\n'
+                                                                          'NISWITCH_VAL_SWITCH_INITIATED - Switch Initiated\n'
+                                                                          'NISWITCH_VAL_MEASUREMENT_DEVICE_INITIATED - Measurement device\n'
+                                                                          'initiated Default value: NISWITCH_VAL_MEASUREMENT_DEVICE_INITIATED\n',
+                                                           'note': [   '\n'
+                                                                       'One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or represent '
+                                                                       'True/False, have been removed.\n']},
+                                      'name': 'Initiation',
+                                      'type': 'ViInt16'}],
+                'returns': 'ViStatus'},
+    'SendSoftwareTrigger': {   'blocking': False,
+                               'codegen_method': 'public',
+                               'documentation': {   'description': '\n'
+                                                                   'Sends a software trigger to the switch module specified in the NI-SWITCH\n'
+                                                                   'session. When the trigger input is set to NISWITCH_VAL_SOFTWARE_TRIG\n'
+                                                                   'through either the niSwitch_ConfigureScanTrigger or the\n'
+                                                                   'NISWITCH_ATTR_TRIGGER_INPUT attribute, the scan does not proceed from\n'
+                                                                   'a semi-colon (wait for trigger) until niSwitch_SendSoftwareTrigger is\n'
+                                                                   'called.\n'},
+                               'has_repeated_capability': False,
+                               'invalidates_attribute_cache': False,
+                               'is_error_handling': False,
+                               'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                               'name': 'SendSoftwareTrigger',
+                               'parameters': [   {   'ctypes_type': 'ViSession',
+                                                     'ctypes_type_library_call': 'ViSession',
+                                                     'ctypes_variable_name': 'vi_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'A particular NI-SWITCH session established with\n'
+                                                                                         'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                         'and used for all subsequent NI-SWITCH calls.\n',
+                                                                          'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': True,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'vi_ctype',
+                                                     'name': 'vi',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'vi',
+                                                     'python_name_or_default_for_init': 'vi',
+                                                     'python_name_with_default': 'vi',
+                                                     'python_name_with_doc_default': 'vi',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViSession',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False}],
+                               'python_code_variables': [],
+                               'python_name': 'send_software_trigger',
+                               'render_in_library': True,
+                               'render_in_session_base': False,
+                               'returns': 'ViStatus'},
+    'SetAttributeViBoolean': {   'blocking': False,
+                                 'codegen_method': 'private',
+                                 'documentation': {   'description': '\n'
+                                                                     'This function sets the value of a ViBoolean attribute. This is a\n'
+                                                                     'low-level function that you can use to set the values of\n'
+                                                                     'instrument-specific attributes and inherent IVI attributes. If the\n'
+                                                                     'attribute represents an instrument state, this function performs\n'
+                                                                     'instrument I/O in the following cases: - State caching is disabled for\n'
+                                                                     'the entire session or for the particular attribute. - State caching is\n'
+                                                                     'enabled and the currently cached value is invalid or is different than\n'
+                                                                     'the value you specify. This instrument driver contains high-level\n'
+                                                                     'functions that set most of the instrument attributes. It is best to use\n'
+                                                                     'the high-level driver functions as much as possible. They handle order\n'
+                                                                     'dependencies and multithread locking for you. In addition, they perform\n'
+                                                                     'status checking only after setting all of the attributes. In contrast,\n'
+                                                                     'when you set multiple attributes using the SetAttribute functions, the\n'
+                                                                     'functions check the instrument status after each call. Also, when state\n'
+                                                                     'caching is enabled, the high-level functions that configure multiple\n'
+                                                                     'attributes perform instrument I/O only for the attributes whose value\n'
+                                                                     'you change. Thus, you can safely call the high-level functions without\n'
+                                                                     'the penalty of redundant instrument I/O.\n'},
+                                 'has_repeated_capability': True,
+                                 'invalidates_attribute_cache': True,
+                                 'is_error_handling': False,
+                                 'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                 'name': 'SetAttributeViBoolean',
+                                 'parameters': [   {   'ctypes_type': 'ViSession',
+                                                       'ctypes_type_library_call': 'ViSession',
+                                                       'ctypes_variable_name': 'vi_ctype',
+                                                       'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'A particular NI-SWITCH session established with\n'
+                                                                                           'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                           'and used for all subsequent NI-SWITCH calls.\n',
+                                                                            'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': True,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'vi_ctype',
+                                                       'name': 'vi',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'vi',
+                                                       'python_name_or_default_for_init': 'vi',
+                                                       'python_name_with_default': 'vi',
+                                                       'python_name_with_doc_default': 'vi',
+                                                       'python_type': 'int',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViSession',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False},
+                                                   {   'ctypes_type': 'ViConstString',
+                                                       'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                       'ctypes_variable_name': 'channel_name_ctype',
+                                                       'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Some attributes are unique per channel. For these, pass the name of the\n'
+                                                                                           'channel. Other attributes are unique per switch device. Pass VI_NULL or\n'
+                                                                                           'an empty string for this parameter. Default Value: ""\n'},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': True,
+                                                       'is_session_handle': False,
+                                                       'is_string': True,
+                                                       'library_method_call_snippet': 'channel_name_ctype',
+                                                       'name': 'channelName',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'channel_name',
+                                                       'python_name_or_default_for_init': 'channel_name',
+                                                       'python_name_with_default': 'channel_name',
+                                                       'python_name_with_doc_default': 'channel_name',
+                                                       'python_type': 'str',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViConstString',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False},
+                                                   {   'ctypes_type': 'ViAttr',
+                                                       'ctypes_type_library_call': 'ViAttr',
+                                                       'ctypes_variable_name': 'attribute_id_ctype',
+                                                       'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Pass the ID of an attribute. From the function panel window, you can use\n'
+                                                                                           'this control as follows. - Click on the control or press , , or , to\n'
+                                                                                           'display a dialog box containing a hierarchical list of the available\n'
+                                                                                           'attributes. Attributes whose value cannot be set are dim. Help text is\n'
+                                                                                           'shown for each attribute. Select an attribute by double-clicking on it\n'
+                                                                                           'or by selecting it and then pressing . Read-only attributes appear dim\n'
+                                                                                           'in the list box. If you select a read-only attribute, an error message\n'
+                                                                                           'appears. A ring control at the top of the dialog box allows you to see\n'
+                                                                                           'all IVI attributes or only the attributes of the ViInt32 type. If you\n'
+                                                                                           'choose to see all IVI attributes, the data types appear to the right of\n'
+                                                                                           'the attribute names in the list box. The data types that are not\n'
+                                                                                           'consistent with this function are dim. If you select an attribute data\n'
+                                                                                           'type that is dim, LabWindows/CVI transfers you to the function panel for\n'
+                                                                                           'the corresponding function that is consistent with the data type. - If\n'
+                                                                                           'you want to enter a variable name, press to change this ring control to\n'
+                                                                                           'a manual input box. - If the attribute in this ring control has\n'
+                                                                                           'constants as valid values, you can view the constants by moving to the\n'
+                                                                                           'Attribute Value control and pressing .\n'},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': False,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'attribute_id_ctype',
+                                                       'name': 'attributeId',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'attribute_id',
+                                                       'python_name_or_default_for_init': 'attribute_id',
+                                                       'python_name_with_default': 'attribute_id',
+                                                       'python_name_with_doc_default': 'attribute_id',
+                                                       'python_type': 'int',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViAttr',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False},
+                                                   {   'ctypes_type': 'ViBoolean',
+                                                       'ctypes_type_library_call': 'ViBoolean',
+                                                       'ctypes_variable_name': 'attribute_value_ctype',
+                                                       'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Pass the value to which you want to set the attribute. From the function\n'
+                                                                                           'panel window, you can use this control as follows. - If the attribute\n'
+                                                                                           'currently showing in the Attribute ID ring control has constants as\n'
+                                                                                           'valid values, you can view a list of the constants by pressing on this\n'
+                                                                                           'control. Select a value by double-clicking on it or by selecting it and\n'
+                                                                                           'then pressing . Note: Some of the values might not be valid depending on\n'
+                                                                                           'the current settings of the instrument session. Default Value: none\n'},
+                                                       'enum': None,
+                                                       'is_buffer': False,
+                                                       'is_repeated_capability': False,
+                                                       'is_session_handle': False,
+                                                       'is_string': False,
+                                                       'library_method_call_snippet': 'attribute_value_ctype',
+                                                       'name': 'attributeValue',
+                                                       'numpy': False,
+                                                       'numpy_into_return': False,
+                                                       'python_name': 'attribute_value',
+                                                       'python_name_or_default_for_init': 'attribute_value',
+                                                       'python_name_with_default': 'attribute_value',
+                                                       'python_name_with_doc_default': 'attribute_value',
+                                                       'python_type': 'bool',
+                                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                                       'type': 'ViBoolean',
+                                                       'use_array': False,
+                                                       'use_in_python_api': True,
+                                                       'use_list': False}],
+                                 'python_code_variables': [],
+                                 'python_name': '_set_attribute_vi_boolean',
+                                 'render_in_library': True,
+                                 'render_in_session_base': True,
+                                 'returns': 'ViStatus'},
+    'SetAttributeViInt32': {   'blocking': False,
+                               'codegen_method': 'private',
+                               'documentation': {   'description': '\n'
+                                                                   'This function sets the value of a ViInt32 attribute. This is a low-level\n'
+                                                                   'function that you can use to set the values of instrument-specific\n'
+                                                                   'attributes and inherent IVI attributes. If the attribute represents an\n'
+                                                                   'instrument state, this function performs instrument I/O in the following\n'
+                                                                   'cases: - State caching is disabled for the entire session or for the\n'
+                                                                   'particular attribute. - State caching is enabled and the currently\n'
+                                                                   'cached value is invalid or is different than the value you specify. This\n'
+                                                                   'instrument driver contains high-level functions that set most of the\n'
+                                                                   'instrument attributes. It is best to use the high-level driver functions\n'
+                                                                   'as much as possible. They handle order dependencies and multithread\n'
+                                                                   'locking for you. In addition, they perform status checking only after\n'
+                                                                   'setting all of the attributes. In contrast, when you set multiple\n'
+                                                                   'attributes using the SetAttribute functions, the functions check the\n'
+                                                                   'instrument status after each call. Also, when state caching is enabled,\n'
+                                                                   'the high-level functions that configure multiple attributes perform\n'
+                                                                   'instrument I/O only for the attributes whose value you change. Thus, you\n'
+                                                                   'can safely call the high-level functions without the penalty of\n'
+                                                                   'redundant instrument I/O.\n'},
+                               'has_repeated_capability': True,
+                               'invalidates_attribute_cache': True,
+                               'is_error_handling': False,
+                               'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                               'name': 'SetAttributeViInt32',
+                               'parameters': [   {   'ctypes_type': 'ViSession',
+                                                     'ctypes_type_library_call': 'ViSession',
+                                                     'ctypes_variable_name': 'vi_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'A particular NI-SWITCH session established with\n'
+                                                                                         'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                         'and used for all subsequent NI-SWITCH calls.\n',
+                                                                          'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': True,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'vi_ctype',
+                                                     'name': 'vi',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'vi',
+                                                     'python_name_or_default_for_init': 'vi',
+                                                     'python_name_with_default': 'vi',
+                                                     'python_name_with_doc_default': 'vi',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViSession',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViConstString',
+                                                     'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                     'ctypes_variable_name': 'channel_name_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'Some attributes are unique per channel. For these, pass the name of the\n'
+                                                                                         'channel. Other attributes are unique per switch device. Pass VI_NULL or\n'
+                                                                                         'an empty string for this parameter. Default Value: ""\n'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': True,
+                                                     'is_session_handle': False,
+                                                     'is_string': True,
+                                                     'library_method_call_snippet': 'channel_name_ctype',
+                                                     'name': 'channelName',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'channel_name',
+                                                     'python_name_or_default_for_init': 'channel_name',
+                                                     'python_name_with_default': 'channel_name',
+                                                     'python_name_with_doc_default': 'channel_name',
+                                                     'python_type': 'str',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViConstString',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViAttr',
+                                                     'ctypes_type_library_call': 'ViAttr',
+                                                     'ctypes_variable_name': 'attribute_id_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'Pass the ID of an attribute. From the function panel window, you can use\n'
+                                                                                         'this control as follows. - Click on the control or press , , or , to\n'
+                                                                                         'display a dialog box containing a hierarchical list of the available\n'
+                                                                                         'attributes. Attributes whose value cannot be set are dim. Help text is\n'
+                                                                                         'shown for each attribute. Select an attribute by double-clicking on it\n'
+                                                                                         'or by selecting it and then pressing . Read-only attributes appear dim\n'
+                                                                                         'in the list box. If you select a read-only attribute, an error message\n'
+                                                                                         'appears. A ring control at the top of the dialog box allows you to see\n'
+                                                                                         'all IVI attributes or only the attributes of the ViInt32 type. If you\n'
+                                                                                         'choose to see all IVI attributes, the data types appear to the right of\n'
+                                                                                         'the attribute names in the list box. The data types that are not\n'
+                                                                                         'consistent with this function are dim. If you select an attribute data\n'
+                                                                                         'type that is dim, LabWindows/CVI transfers you to the function panel for\n'
+                                                                                         'the corresponding function that is consistent with the data type. - If\n'
+                                                                                         'you want to enter a variable name, press to change this ring control to\n'
+                                                                                         'a manual input box. - If the attribute in this ring control has\n'
+                                                                                         'constants as valid values, you can view the constants by moving to the\n'
+                                                                                         'Attribute Value control and pressing .\n'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'attribute_id_ctype',
+                                                     'name': 'attributeId',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'attribute_id',
+                                                     'python_name_or_default_for_init': 'attribute_id',
+                                                     'python_name_with_default': 'attribute_id',
+                                                     'python_name_with_doc_default': 'attribute_id',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViAttr',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViInt32',
+                                                     'ctypes_type_library_call': 'ViInt32',
+                                                     'ctypes_variable_name': 'attribute_value_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'Pass the value to which you want to set the attribute. From the function\n'
+                                                                                         'panel window, you can use this control as follows. - If the attribute\n'
+                                                                                         'currently showing in the Attribute ID ring control has constants as\n'
+                                                                                         'valid values, you can view a list of the constants by pressing on this\n'
+                                                                                         'control. Select a value by double-clicking on it or by selecting it and\n'
+                                                                                         'then pressing . Note: Some of the values might not be valid depending on\n'
+                                                                                         'the current settings of the instrument session. Default Value: none\n'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'attribute_value_ctype',
+                                                     'name': 'attributeValue',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'attribute_value',
+                                                     'python_name_or_default_for_init': 'attribute_value',
+                                                     'python_name_with_default': 'attribute_value',
+                                                     'python_name_with_doc_default': 'attribute_value',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViInt32',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False}],
+                               'python_code_variables': [],
+                               'python_name': '_set_attribute_vi_int32',
+                               'render_in_library': True,
+                               'render_in_session_base': True,
+                               'returns': 'ViStatus'},
+    'SetAttributeViReal64': {   'blocking': False,
+                                'codegen_method': 'private',
+                                'documentation': {   'description': '\n'
+                                                                    'This function sets the value of a ViReal64 attribute. This is a\n'
+                                                                    'low-level function that you can use to set the values of\n'
+                                                                    'instrument-specific attributes and inherent IVI attributes. If the\n'
+                                                                    'attribute represents an instrument state, this function performs\n'
+                                                                    'instrument I/O in the following cases: - State caching is disabled for\n'
+                                                                    'the entire session or for the particular attribute. - State caching is\n'
+                                                                    'enabled and the currently cached value is invalid or is different than\n'
+                                                                    'the value you specify. This instrument driver contains high-level\n'
+                                                                    'functions that set most of the instrument attributes. It is best to use\n'
+                                                                    'the high-level driver functions as much as possible. They handle order\n'
+                                                                    'dependencies and multithread locking for you. In addition, they perform\n'
+                                                                    'status checking only after setting all of the attributes. In contrast,\n'
+                                                                    'when you set multiple attributes using the SetAttribute functions, the\n'
+                                                                    'functions check the instrument status after each call. Also, when state\n'
+                                                                    'caching is enabled, the high-level functions that configure multiple\n'
+                                                                    'attributes perform instrument I/O only for the attributes whose value\n'
+                                                                    'you change. Thus, you can safely call the high-level functions without\n'
+                                                                    'the penalty of redundant instrument I/O.\n'},
+                                'has_repeated_capability': True,
+                                'invalidates_attribute_cache': True,
+                                'is_error_handling': False,
+                                'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                'name': 'SetAttributeViReal64',
+                                'parameters': [   {   'ctypes_type': 'ViSession',
+                                                      'ctypes_type_library_call': 'ViSession',
+                                                      'ctypes_variable_name': 'vi_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'A particular NI-SWITCH session established with\n'
+                                                                                          'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                          'and used for all subsequent NI-SWITCH calls.\n',
+                                                                           'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': True,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'vi_ctype',
+                                                      'name': 'vi',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'vi',
+                                                      'python_name_or_default_for_init': 'vi',
+                                                      'python_name_with_default': 'vi',
+                                                      'python_name_with_doc_default': 'vi',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViSession',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViConstString',
+                                                      'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                      'ctypes_variable_name': 'channel_name_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Some attributes are unique per channel. For these, pass the name of the\n'
+                                                                                          'channel. Other attributes are unique per switch device. Pass VI_NULL or\n'
+                                                                                          'an empty string for this parameter. Default Value: ""\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': True,
+                                                      'is_session_handle': False,
+                                                      'is_string': True,
+                                                      'library_method_call_snippet': 'channel_name_ctype',
+                                                      'name': 'channelName',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'channel_name',
+                                                      'python_name_or_default_for_init': 'channel_name',
+                                                      'python_name_with_default': 'channel_name',
+                                                      'python_name_with_doc_default': 'channel_name',
+                                                      'python_type': 'str',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViConstString',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViAttr',
+                                                      'ctypes_type_library_call': 'ViAttr',
+                                                      'ctypes_variable_name': 'attribute_id_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Pass the ID of an attribute. From the function panel window, you can use\n'
+                                                                                          'this control as follows. - Click on the control or press , , or , to\n'
+                                                                                          'display a dialog box containing a hierarchical list of the available\n'
+                                                                                          'attributes. Attributes whose value cannot be set are dim. Help text is\n'
+                                                                                          'shown for each attribute. Select an attribute by double-clicking on it\n'
+                                                                                          'or by selecting it and then pressing . Read-only attributes appear dim\n'
+                                                                                          'in the list box. If you select a read-only attribute, an error message\n'
+                                                                                          'appears. A ring control at the top of the dialog box allows you to see\n'
+                                                                                          'all IVI attributes or only the attributes of the ViInt32 type. If you\n'
+                                                                                          'choose to see all IVI attributes, the data types appear to the right of\n'
+                                                                                          'the attribute names in the list box. The data types that are not\n'
+                                                                                          'consistent with this function are dim. If you select an attribute data\n'
+                                                                                          'type that is dim, LabWindows/CVI transfers you to the function panel for\n'
+                                                                                          'the corresponding function that is consistent with the data type. - If\n'
+                                                                                          'you want to enter a variable name, press to change this ring control to\n'
+                                                                                          'a manual input box. - If the attribute in this ring control has\n'
+                                                                                          'constants as valid values, you can view the constants by moving to the\n'
+                                                                                          'Attribute Value control and pressing .\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'attribute_id_ctype',
+                                                      'name': 'attributeId',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'attribute_id',
+                                                      'python_name_or_default_for_init': 'attribute_id',
+                                                      'python_name_with_default': 'attribute_id',
+                                                      'python_name_with_doc_default': 'attribute_id',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViAttr',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViReal64',
+                                                      'ctypes_type_library_call': 'ViReal64',
+                                                      'ctypes_variable_name': 'attribute_value_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Pass the value to which you want to set the attribute. From the function\n'
+                                                                                          'panel window, you can use this control as follows. - If the attribute\n'
+                                                                                          'currently showing in the Attribute ID ring control has constants as\n'
+                                                                                          'valid values, you can view a list of the constants by pressing on this\n'
+                                                                                          'control. Select a value by double-clicking on it or by selecting it and\n'
+                                                                                          'then pressing . Note: Some of the values might not be valid depending on\n'
+                                                                                          'the current settings of the instrument session. Default Value: none\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'attribute_value_ctype',
+                                                      'name': 'attributeValue',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'attribute_value',
+                                                      'python_name_or_default_for_init': 'attribute_value',
+                                                      'python_name_with_default': 'attribute_value',
+                                                      'python_name_with_doc_default': 'attribute_value',
+                                                      'python_type': 'float',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViReal64',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False}],
+                                'python_code_variables': [],
+                                'python_name': '_set_attribute_vi_real64',
+                                'render_in_library': True,
+                                'render_in_session_base': True,
+                                'returns': 'ViStatus'},
+    'SetAttributeViSession': {   'codegen_method': 'no',
+                                 'documentation': {   'description': '\n'
+                                                                     'This function sets the value of a ViSession attribute. This is a\n'
+                                                                     'low-level function that you can use to set the values of\n'
+                                                                     'instrument-specific attributes and inherent IVI attributes. If the\n'
+                                                                     'attribute represents an instrument state, this function performs\n'
+                                                                     'instrument I/O in the following cases: - State caching is disabled for\n'
+                                                                     'the entire session or for the particular attribute. - State caching is\n'
+                                                                     'enabled and the currently cached value is invalid or is different than\n'
+                                                                     'the value you specify. This instrument driver contains high-level\n'
+                                                                     'functions that set most of the instrument attributes. It is best to use\n'
+                                                                     'the high-level driver functions as much as possible. They handle order\n'
+                                                                     'dependencies and multithread locking for you. In addition, they perform\n'
+                                                                     'status checking only after setting all of the attributes. In contrast,\n'
+                                                                     'when you set multiple attributes using the SetAttribute functions, the\n'
+                                                                     'functions check the instrument status after each call. Also, when state\n'
+                                                                     'caching is enabled, the high-level functions that configure multiple\n'
+                                                                     'attributes perform instrument I/O only for the attributes whose value\n'
+                                                                     'you change. Thus, you can safely call the high-level functions without\n'
+                                                                     'the penalty of redundant instrument I/O.\n'},
+                                 'invalidates_attribute_cache': True,
+                                 'parameters': [   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'A particular NI-SWITCH session established with\n'
+                                                                                           'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                           'and used for all subsequent NI-SWITCH calls.\n',
+                                                                            'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                       'name': 'vi',
+                                                       'type': 'ViSession'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Some attributes are unique per channel. For these, pass the name of the\n'
+                                                                                           'channel. Other attributes are unique per switch device. Pass VI_NULL or\n'
+                                                                                           'an empty string for this parameter. Default Value: ""\n'},
+                                                       'name': 'channelName',
+                                                       'type': 'ViConstString'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Pass the ID of an attribute. From the function panel window, you can use\n'
+                                                                                           'this control as follows. - Click on the control or press , , or , to\n'
+                                                                                           'display a dialog box containing a hierarchical list of the available\n'
+                                                                                           'attributes. Attributes whose value cannot be set are dim. Help text is\n'
+                                                                                           'shown for each attribute. Select an attribute by double-clicking on it\n'
+                                                                                           'or by selecting it and then pressing . Read-only attributes appear dim\n'
+                                                                                           'in the list box. If you select a read-only attribute, an error message\n'
+                                                                                           'appears. A ring control at the top of the dialog box allows you to see\n'
+                                                                                           'all IVI attributes or only the attributes of the ViInt32 type. If you\n'
+                                                                                           'choose to see all IVI attributes, the data types appear to the right of\n'
+                                                                                           'the attribute names in the list box. The data types that are not\n'
+                                                                                           'consistent with this function are dim. If you select an attribute data\n'
+                                                                                           'type that is dim, LabWindows/CVI transfers you to the function panel for\n'
+                                                                                           'the corresponding function that is consistent with the data type. - If\n'
+                                                                                           'you want to enter a variable name, press to change this ring control to\n'
+                                                                                           'a manual input box. - If the attribute in this ring control has\n'
+                                                                                           'constants as valid values, you can view the constants by moving to the\n'
+                                                                                           'Attribute Value control and pressing .\n'},
+                                                       'name': 'attributeId',
+                                                       'type': 'ViAttr'},
+                                                   {   'direction': 'in',
+                                                       'documentation': {   'description': '\n'
+                                                                                           'Pass the value to which you want to set the attribute. From the function\n'
+                                                                                           'panel window, you can use this control as follows. - If the attribute\n'
+                                                                                           'currently showing in the Attribute ID ring control has constants as\n'
+                                                                                           'valid values, you can view a list of the constants by pressing on this\n'
+                                                                                           'control. Select a value by double-clicking on it or by selecting it and\n'
+                                                                                           'then pressing . Note: Some of the values might not be valid depending on\n'
+                                                                                           'the current settings of the instrument session. Default Value: none\n'},
+                                                       'name': 'attributeValue',
+                                                       'type': 'ViSession'}],
+                                 'returns': 'ViStatus'},
+    'SetAttributeViString': {   'blocking': False,
+                                'codegen_method': 'private',
+                                'documentation': {   'description': '\n'
+                                                                    'This function sets the value of a ViString attribute. This is a\n'
+                                                                    'low-level function that you can use to set the values of\n'
+                                                                    'instrument-specific attributes and inherent IVI attributes. If the\n'
+                                                                    'attribute represents an instrument state, this function performs\n'
+                                                                    'instrument I/O in the following cases: - State caching is disabled for\n'
+                                                                    'the entire session or for the particular attribute. - State caching is\n'
+                                                                    'enabled and the currently cached value is invalid or is different than\n'
+                                                                    'the value you specify. This instrument driver contains high-level\n'
+                                                                    'functions that set most of the instrument attributes. It is best to use\n'
+                                                                    'the high-level driver functions as much as possible. They handle order\n'
+                                                                    'dependencies and multithread locking for you. In addition, they perform\n'
+                                                                    'status checking only after setting all of the attributes. In contrast,\n'
+                                                                    'when you set multiple attributes using the SetAttribute functions, the\n'
+                                                                    'functions check the instrument status after each call. Also, when state\n'
+                                                                    'caching is enabled, the high-level functions that configure multiple\n'
+                                                                    'attributes perform instrument I/O only for the attributes whose value\n'
+                                                                    'you change. Thus, you can safely call the high-level functions without\n'
+                                                                    'the penalty of redundant instrument I/O.\n'},
+                                'has_repeated_capability': True,
+                                'invalidates_attribute_cache': True,
+                                'is_error_handling': False,
+                                'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                                'name': 'SetAttributeViString',
+                                'parameters': [   {   'ctypes_type': 'ViSession',
+                                                      'ctypes_type_library_call': 'ViSession',
+                                                      'ctypes_variable_name': 'vi_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'A particular NI-SWITCH session established with\n'
+                                                                                          'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                          'and used for all subsequent NI-SWITCH calls.\n',
+                                                                           'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': True,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'vi_ctype',
+                                                      'name': 'vi',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'vi',
+                                                      'python_name_or_default_for_init': 'vi',
+                                                      'python_name_with_default': 'vi',
+                                                      'python_name_with_doc_default': 'vi',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViSession',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViConstString',
+                                                      'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                      'ctypes_variable_name': 'channel_name_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Some attributes are unique per channel. For these, pass the name of the\n'
+                                                                                          'channel. Other attributes are unique per switch device. Pass VI_NULL or\n'
+                                                                                          'an empty string for this parameter. Default Value: ""\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': True,
+                                                      'is_session_handle': False,
+                                                      'is_string': True,
+                                                      'library_method_call_snippet': 'channel_name_ctype',
+                                                      'name': 'channelName',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'channel_name',
+                                                      'python_name_or_default_for_init': 'channel_name',
+                                                      'python_name_with_default': 'channel_name',
+                                                      'python_name_with_doc_default': 'channel_name',
+                                                      'python_type': 'str',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViConstString',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViAttr',
+                                                      'ctypes_type_library_call': 'ViAttr',
+                                                      'ctypes_variable_name': 'attribute_id_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Pass the ID of an attribute. From the function panel window, you can use\n'
+                                                                                          'this control as follows. - Click on the control or press , , or , to\n'
+                                                                                          'display a dialog box containing a hierarchical list of the available\n'
+                                                                                          'attributes. Attributes whose value cannot be set are dim. Help text is\n'
+                                                                                          'shown for each attribute. Select an attribute by double-clicking on it\n'
+                                                                                          'or by selecting it and then pressing . Read-only attributes appear dim\n'
+                                                                                          'in the list box. If you select a read-only attribute, an error message\n'
+                                                                                          'appears. A ring control at the top of the dialog box allows you to see\n'
+                                                                                          'all IVI attributes or only the attributes of the ViInt32 type. If you\n'
+                                                                                          'choose to see all IVI attributes, the data types appear to the right of\n'
+                                                                                          'the attribute names in the list box. The data types that are not\n'
+                                                                                          'consistent with this function are dim. If you select an attribute data\n'
+                                                                                          'type that is dim, LabWindows/CVI transfers you to the function panel for\n'
+                                                                                          'the corresponding function that is consistent with the data type. - If\n'
+                                                                                          'you want to enter a variable name, press to change this ring control to\n'
+                                                                                          'a manual input box. - If the attribute in this ring control has\n'
+                                                                                          'constants as valid values, you can view the constants by moving to the\n'
+                                                                                          'Attribute Value control and pressing .\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': False,
+                                                      'library_method_call_snippet': 'attribute_id_ctype',
+                                                      'name': 'attributeId',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'attribute_id',
+                                                      'python_name_or_default_for_init': 'attribute_id',
+                                                      'python_name_with_default': 'attribute_id',
+                                                      'python_name_with_doc_default': 'attribute_id',
+                                                      'python_type': 'int',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViAttr',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False},
+                                                  {   'ctypes_type': 'ViChar[]',
+                                                      'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                      'ctypes_variable_name': 'attribute_value_ctype',
+                                                      'direction': 'in',
+                                                      'documentation': {   'description': '\n'
+                                                                                          'Pass the value to which you want to set the attribute. From the function\n'
+                                                                                          'panel window, you can use this control as follows. - If the attribute\n'
+                                                                                          'currently showing in the Attribute ID ring control has constants as\n'
+                                                                                          'valid values, you can view a list of the constants by pressing on this\n'
+                                                                                          'control. Select a value by double-clicking on it or by selecting it and\n'
+                                                                                          'then pressing . Note: Some of the values might not be valid depending on\n'
+                                                                                          'the current settings of the instrument session. Default Value: none\n'},
+                                                      'enum': None,
+                                                      'is_buffer': False,
+                                                      'is_repeated_capability': False,
+                                                      'is_session_handle': False,
+                                                      'is_string': True,
+                                                      'library_method_call_snippet': 'attribute_value_ctype',
+                                                      'name': 'attributeValue',
+                                                      'numpy': False,
+                                                      'numpy_into_return': False,
+                                                      'python_name': 'attribute_value',
+                                                      'python_name_or_default_for_init': 'attribute_value',
+                                                      'python_name_with_default': 'attribute_value',
+                                                      'python_name_with_doc_default': 'attribute_value',
+                                                      'python_type': 'str',
+                                                      'size': {'mechanism': 'fixed', 'value': 1},
+                                                      'type': 'ViChar[]',
+                                                      'use_array': False,
+                                                      'use_in_python_api': True,
+                                                      'use_list': False}],
+                                'python_code_variables': [],
+                                'python_name': '_set_attribute_vi_string',
+                                'render_in_library': True,
+                                'render_in_session_base': True,
+                                'returns': 'ViStatus'},
+    'SetContinuousScan': {   'blocking': False,
+                             'codegen_method': 'public',
+                             'documentation': {'description': '\nSets the to loop continuously through the scan list or to stop scanning\nafter one pass through the scan list.\n'},
+                             'has_repeated_capability': False,
+                             'invalidates_attribute_cache': True,
+                             'is_error_handling': False,
+                             'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                             'name': 'SetContinuousScan',
+                             'parameters': [   {   'ctypes_type': 'ViSession',
+                                                   'ctypes_type_library_call': 'ViSession',
+                                                   'ctypes_variable_name': 'vi_ctype',
+                                                   'direction': 'in',
+                                                   'documentation': {   'description': '\n'
+                                                                                       'A particular NI-SWITCH session established with\n'
+                                                                                       'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                       'and used for all subsequent NI-SWITCH calls.\n',
+                                                                        'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                   'enum': None,
+                                                   'is_buffer': False,
+                                                   'is_repeated_capability': False,
+                                                   'is_session_handle': True,
+                                                   'is_string': False,
+                                                   'library_method_call_snippet': 'vi_ctype',
+                                                   'name': 'vi',
+                                                   'numpy': False,
+                                                   'numpy_into_return': False,
+                                                   'python_name': 'vi',
+                                                   'python_name_or_default_for_init': 'vi',
+                                                   'python_name_with_default': 'vi',
+                                                   'python_name_with_doc_default': 'vi',
+                                                   'python_type': 'int',
+                                                   'size': {'mechanism': 'fixed', 'value': 1},
+                                                   'type': 'ViSession',
+                                                   'use_array': False,
+                                                   'use_in_python_api': True,
+                                                   'use_list': False},
+                                               {   'ctypes_type': 'ViBoolean',
+                                                   'ctypes_type_library_call': 'ViBoolean',
+                                                   'ctypes_variable_name': 'continuous_scan_ctype',
+                                                   'direction': 'in',
+                                                   'documentation': {   'description': '\n'
+                                                                                       'If VI_TRUE, loops continuously through the scan list during scanning.\n'
+                                                                                       'If VI_FALSE, the scan stops after one pass through the scan list.\n'
+                                                                                       'Default value: VI_FALSE\n'},
+                                                   'enum': None,
+                                                   'is_buffer': False,
+                                                   'is_repeated_capability': False,
+                                                   'is_session_handle': False,
+                                                   'is_string': False,
+                                                   'library_method_call_snippet': 'continuous_scan_ctype',
+                                                   'name': 'continuousScan',
+                                                   'numpy': False,
+                                                   'numpy_into_return': False,
+                                                   'python_name': 'continuous_scan',
+                                                   'python_name_or_default_for_init': 'continuous_scan',
+                                                   'python_name_with_default': 'continuous_scan',
+                                                   'python_name_with_doc_default': 'continuous_scan',
+                                                   'python_type': 'bool',
+                                                   'size': {'mechanism': 'fixed', 'value': 1},
+                                                   'type': 'ViBoolean',
+                                                   'use_array': False,
+                                                   'use_in_python_api': True,
+                                                   'use_list': False}],
+                             'python_code_variables': [],
+                             'python_name': 'set_continuous_scan',
+                             'render_in_library': True,
+                             'render_in_session_base': False,
+                             'returns': 'ViStatus'},
+    'SetPath': {   'blocking': False,
+                   'codegen_method': 'public',
+                   'documentation': {   'description': '\n'
+                                                       'Connects two channels by specifying an explicit path in the path list\n'
+                                                       'parameter. niSwitch_SetPath is particularly useful where path\n'
+                                                       'repeatability is important, such as in calibrated signal paths. If this\n'
+                                                       'is not necessary, use niSwitch_Connect.\n'},
+                   'has_repeated_capability': False,
+                   'invalidates_attribute_cache': True,
+                   'is_error_handling': False,
+                   'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                   'name': 'SetPath',
+                   'parameters': [   {   'ctypes_type': 'ViSession',
+                                         'ctypes_type_library_call': 'ViSession',
+                                         'ctypes_variable_name': 'vi_ctype',
+                                         'direction': 'in',
+                                         'documentation': {   'description': '\n'
+                                                                             'A particular NI-SWITCH session established with\n'
+                                                                             'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                             'and used for all subsequent NI-SWITCH calls.\n',
+                                                              'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                         'enum': None,
+                                         'is_buffer': False,
+                                         'is_repeated_capability': False,
+                                         'is_session_handle': True,
+                                         'is_string': False,
+                                         'library_method_call_snippet': 'vi_ctype',
+                                         'name': 'vi',
+                                         'numpy': False,
+                                         'numpy_into_return': False,
+                                         'python_name': 'vi',
+                                         'python_name_or_default_for_init': 'vi',
+                                         'python_name_with_default': 'vi',
+                                         'python_name_with_doc_default': 'vi',
+                                         'python_type': 'int',
+                                         'size': {'mechanism': 'fixed', 'value': 1},
+                                         'type': 'ViSession',
+                                         'use_array': False,
+                                         'use_in_python_api': True,
+                                         'use_list': False},
+                                     {   'ctypes_type': 'ViConstString',
+                                         'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                         'ctypes_variable_name': 'path_list_ctype',
+                                         'direction': 'in',
+                                         'documentation': {   'description': '\n'
+                                                                             'A string composed of comma-separated paths between channel 1 and channel\n'
+                                                                             '2. The first and last names in the path are the endpoints of the path.\n'
+                                                                             'Every other channel in the path are configuration channels. Example of a\n'
+                                                                             'valid path list string: ch0->com0, com0->ab0. In this example, com0 is a\n'
+                                                                             'configuration channel. Default value: None Obtain the path list for a\n'
+                                                                             'previously created path with niSwitch_GetPath.\n'},
+                                         'enum': None,
+                                         'is_buffer': False,
+                                         'is_repeated_capability': False,
+                                         'is_session_handle': False,
+                                         'is_string': True,
+                                         'library_method_call_snippet': 'path_list_ctype',
+                                         'name': 'pathList',
+                                         'numpy': False,
+                                         'numpy_into_return': False,
+                                         'python_name': 'path_list',
+                                         'python_name_or_default_for_init': 'path_list',
+                                         'python_name_with_default': 'path_list',
+                                         'python_name_with_doc_default': 'path_list',
+                                         'python_type': 'str',
+                                         'size': {'mechanism': 'fixed', 'value': 1},
+                                         'type': 'ViConstString',
+                                         'use_array': False,
+                                         'use_in_python_api': True,
+                                         'use_list': False}],
+                   'python_code_variables': [],
+                   'python_name': 'set_path',
+                   'render_in_library': True,
+                   'render_in_session_base': False,
+                   'returns': 'ViStatus'},
+    'UnlockSession': {   'codegen_method': 'no',
+                         'documentation': {   'description': '\n'
+                                                             'This function releases a lock that you acquired on an instrument session\n'
+                                                             'using niSwitch_LockSession. Refer to niSwitch_LockSession for\n'
+                                                             'additional information on session locks.\n',
+                                              'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                         'parameters': [   {   'direction': 'in',
+                                               'documentation': {   'description': '\n'
+                                                                                   'A particular NI-SWITCH session established with\n'
+                                                                                   'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                   'and used for all subsequent NI-SWITCH calls.\n',
+                                                                    'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                               'name': 'vi',
+                                               'type': 'ViSession'},
+                                           {   'direction': 'out',
+                                               'documentation': {   'description': '\n'
+                                                                                   'This parameter serves as a convenience. If you do not want to use this\n'
+                                                                                   'parameter, pass VI_NULL. Use this parameter in complex functions to\n'
+                                                                                   'keep track of whether you obtain a lock and therefore need to unlock the\n'
+                                                                                   'session. Pass the address of a local ViBoolean variable. In the\n'
+                                                                                   'declaration of the local variable, initialize it to VI_FALSE. Pass the\n'
+                                                                                   'address of the same local variable to any other calls you make to\n'
+                                                                                   'niSwitch_LockSession or niSwitch_UnlockSession in the same function.\n'
+                                                                                   'The parameter is an input/output parameter. niSwitch_LockSession and\n'
+                                                                                   'niSwitch_UnlockSession each inspect the current value and take the\n'
+                                                                                   'following actions: - If the value is VI_TRUE, niSwitch_LockSession\n'
+                                                                                   'does not lock the session again. If the value is VI_FALSE,\n'
+                                                                                   'niSwitch_LockSession obtains the lock and sets the value of the\n'
+                                                                                   'parameter to VI_TRUE. - If the value is VI_FALSE,\n'
+                                                                                   'niSwitch_UnlockSession does not attempt to unlock the session. If the\n'
+                                                                                   'value is VI_TRUE, niSwitch_UnlockSession releases the lock and sets\n'
+                                                                                   'the value of the parameter to VI_FALSE. Thus, you can, call\n'
+                                                                                   'niSwitch_UnlockSession at the end of your function without worrying\n'
+                                                                                   'about whether you actually have the lock. Example: ViStatus TestFunc\n'
+                                                                                   '(ViSession vi, ViInt32 flags) { ViStatus error = VI_SUCCESS; ViBoolean\n'
+                                                                                   'haveLock = VI_FALSE; if (flags & BIT_1) { viCheckErr(\n'
+                                                                                   'niSwitch_LockSession(vi, &haveLock;)); viCheckErr( TakeAction1(vi)); if\n'
+                                                                                   '(flags & BIT_2) { viCheckErr( niSwitch_UnlockSession(vi, &haveLock;));\n'
+                                                                                   'viCheckErr( TakeAction2(vi)); viCheckErr( niSwitch_LockSession(vi,\n'
+                                                                                   '&haveLock;); } if (flags & BIT_3) viCheckErr( TakeAction3(vi)); }\n'
+                                                                                   'Error: /\\* At this point, you cannot really be sure that you have the\n'
+                                                                                   'lock. Fortunately, the haveLock variable takes care of that for you. \\*/\n'
+                                                                                   'niSwitch_UnlockSession(vi, &haveLock;); return error; }\n',
+                                                                    'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                               'name': 'callerHasLock',
+                                               'type': 'ViBoolean'}],
+                         'returns': 'ViStatus'},
+    'WaitForDebounce': {   'blocking': True,
+                           'codegen_method': 'public',
+                           'documentation': {   'description': '\n'
+                                                               'Pauses until all created paths have settled. If the time you specify\n'
+                                                               'with the Maximum Time (ms) parameter elapsed before the switch paths\n'
+                                                               'have settled, this function returns the\n'
+                                                               'NISWITCH_ERROR_MAX_TIME_EXCEEDED error.\n',
+                                                'note': [   '\n'
+                                                            'This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the '
+                                                            'same session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through '
+                                                            "the Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.\n"]},
+                           'has_repeated_capability': False,
+                           'invalidates_attribute_cache': False,
+                           'is_error_handling': False,
+                           'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                           'name': 'WaitForDebounce',
+                           'parameters': [   {   'ctypes_type': 'ViSession',
+                                                 'ctypes_type_library_call': 'ViSession',
+                                                 'ctypes_variable_name': 'vi_ctype',
+                                                 'direction': 'in',
+                                                 'documentation': {   'description': '\n'
+                                                                                     'A particular NI-SWITCH session established with\n'
+                                                                                     'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                     'and used for all subsequent NI-SWITCH calls.\n',
+                                                                      'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                 'enum': None,
+                                                 'is_buffer': False,
+                                                 'is_repeated_capability': False,
+                                                 'is_session_handle': True,
+                                                 'is_string': False,
+                                                 'library_method_call_snippet': 'vi_ctype',
+                                                 'name': 'vi',
+                                                 'numpy': False,
+                                                 'numpy_into_return': False,
+                                                 'python_name': 'vi',
+                                                 'python_name_or_default_for_init': 'vi',
+                                                 'python_name_with_default': 'vi',
+                                                 'python_name_with_doc_default': 'vi',
+                                                 'python_type': 'int',
+                                                 'size': {'mechanism': 'fixed', 'value': 1},
+                                                 'type': 'ViSession',
+                                                 'use_array': False,
+                                                 'use_in_python_api': True,
+                                                 'use_list': False},
+                                             {   'ctypes_type': 'ViInt32',
+                                                 'ctypes_type_library_call': 'ViInt32',
+                                                 'ctypes_variable_name': 'maximum_time_ms_ctype',
+                                                 'default_value': 'datetime.timedelta(milliseconds=5000)',
+                                                 'direction': 'in',
+                                                 'documentation': {   'description': '\n'
+                                                                                     'Specifies the maximum length of time to wait for all relays in the\n'
+                                                                                     'switch module to activate or deactivate. If the specified time elapses\n'
+                                                                                     'before all relays active or deactivate, a timeout error is returned.\n'
+                                                                                     'Default Value:5000 ms\n'},
+                                                 'enum': None,
+                                                 'is_buffer': False,
+                                                 'is_repeated_capability': False,
+                                                 'is_session_handle': False,
+                                                 'is_string': False,
+                                                 'library_method_call_snippet': 'maximum_time_ms_ctype',
+                                                 'name': 'maximumTimeMs',
+                                                 'numpy': False,
+                                                 'numpy_into_return': False,
+                                                 'python_api_converter_name': 'convert_timedelta_to_milliseconds',
+                                                 'python_api_converter_type': 'datetime.timedelta',
+                                                 'python_name': 'maximum_time_ms',
+                                                 'python_name_or_default_for_init': '_converters.convert_timedelta_to_milliseconds(maximum_time_ms, self._encoding)',
+                                                 'python_name_with_default': 'maximum_time_ms=datetime.timedelta(milliseconds=5000)',
+                                                 'python_name_with_doc_default': "maximum_time_ms='datetime.timedelta(milliseconds=5000)'",
+                                                 'python_type': 'int',
+                                                 'size': {'mechanism': 'fixed', 'value': 1},
+                                                 'type': 'ViInt32',
+                                                 'use_array': False,
+                                                 'use_in_python_api': True,
+                                                 'use_list': False}],
+                           'python_code_variables': [],
+                           'python_name': 'wait_for_debounce',
+                           'render_in_library': True,
+                           'render_in_session_base': False,
+                           'returns': 'ViStatus'},
+    'WaitForScanComplete': {   'blocking': True,
+                               'codegen_method': 'public',
+                               'documentation': {   'description': '\n'
+                                                                   'Pauses until the switch module stops scanning or the maximum time has\n'
+                                                                   'elapsed and returns a timeout error. If the time you specify with the\n'
+                                                                   'Maximum Time (ms) parameter elapsed before the scanning operation has\n'
+                                                                   'finished, this function returns the NISWITCH_ERROR_MAX_TIME_EXCEEDED\n'
+                                                                   'error.\n',
+                                                    'note': [   '\n'
+                                                                'This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on '
+                                                                'the same session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method '
+                                                                "through the Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is "
+                                                                'returned.\n']},
+                               'has_repeated_capability': False,
+                               'invalidates_attribute_cache': False,
+                               'is_error_handling': False,
+                               'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                               'name': 'WaitForScanComplete',
+                               'parameters': [   {   'ctypes_type': 'ViSession',
+                                                     'ctypes_type_library_call': 'ViSession',
+                                                     'ctypes_variable_name': 'vi_ctype',
+                                                     'direction': 'in',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'A particular NI-SWITCH session established with\n'
+                                                                                         'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                         'and used for all subsequent NI-SWITCH calls.\n',
+                                                                          'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': True,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'vi_ctype',
+                                                     'name': 'vi',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_name': 'vi',
+                                                     'python_name_or_default_for_init': 'vi',
+                                                     'python_name_with_default': 'vi',
+                                                     'python_name_with_doc_default': 'vi',
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViSession',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False},
+                                                 {   'ctypes_type': 'ViInt32',
+                                                     'ctypes_type_library_call': 'ViInt32',
+                                                     'ctypes_variable_name': 'maximum_time_ms_ctype',
+                                                     'default_value': 'datetime.timedelta(milliseconds=5000)',
+                                                     'direction': 'in',
+                                                     'documentation': {   'description': '\n'
+                                                                                         'Specifies the maximum length of time to wait for the switch module to\n'
+                                                                                         'stop scanning. If the specified time elapses before the scan ends,\n'
+                                                                                         'NISWITCH_ERROR_MAX_TIME_EXCEEDED error is returned. Default\n'
+                                                                                         'Value:5000 ms\n'},
+                                                     'enum': None,
+                                                     'is_buffer': False,
+                                                     'is_repeated_capability': False,
+                                                     'is_session_handle': False,
+                                                     'is_string': False,
+                                                     'library_method_call_snippet': 'maximum_time_ms_ctype',
+                                                     'name': 'maximumTimeMs',
+                                                     'numpy': False,
+                                                     'numpy_into_return': False,
+                                                     'python_api_converter_name': 'convert_timedelta_to_milliseconds',
+                                                     'python_api_converter_type': 'datetime.timedelta',
+                                                     'python_name': 'maximum_time_ms',
+                                                     'python_name_or_default_for_init': '_converters.convert_timedelta_to_milliseconds(maximum_time_ms, self._encoding)',
+                                                     'python_name_with_default': 'maximum_time_ms=datetime.timedelta(milliseconds=5000)',
+                                                     'python_name_with_doc_default': "maximum_time_ms='datetime.timedelta(milliseconds=5000)'",
+                                                     'python_type': 'int',
+                                                     'size': {'mechanism': 'fixed', 'value': 1},
+                                                     'type': 'ViInt32',
+                                                     'use_array': False,
+                                                     'use_in_python_api': True,
+                                                     'use_list': False}],
+                               'python_code_variables': [],
+                               'python_name': 'wait_for_scan_complete',
+                               'render_in_library': True,
+                               'render_in_session_base': False,
+                               'returns': 'ViStatus'},
+    '_init_function': {   'blocking': False,
+                          'codegen_method': 'no',
+                          'documentation': {   'description': '\n'
+                                                              'Returns a session handle used to identify the switch in all subsequent\n'
+                                                              'instrument driver calls and sets the topology of the switch.\n'
+                                                              'niSwitch_InitWithTopology creates a new IVI instrument driver session\n'
+                                                              'for the switch specified in the resourceName parameter. The driver uses\n'
+                                                              'the topology specified in the topology parameter and overrides the\n'
+                                                              'topology specified in MAX. Note: When initializing an NI SwitchBlock\n'
+                                                              'device with topology, you must specify the toplogy created when you\n'
+                                                              'configured the device in MAX, using either\n'
+                                                              'NISWITCH_TOPOLOGY_CONFIGURED_TOPOLOGY or the toplogy string of the\n'
+                                                              'device. Refer to the Initializing with Toplogy for NI SwitchBlock\n'
+                                                              'Devices topic in the NI Switches Help for information about determining\n'
+                                                              'the topology string of an NI SwitchBlock device. By default, the switch\n'
+                                                              'is reset to a known state. Enable simulation by specifying the topology\n'
+                                                              'and setting the simulate parameter to VI_TRUE.\n'},
+                          'has_repeated_capability': False,
+                          'invalidates_attribute_cache': False,
+                          'is_error_handling': False,
+                          'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                          'name': 'InitWithTopology',
+                          'parameters': [   {   'ctypes_type': 'ViRsrc',
+                                                'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                'ctypes_variable_name': 'resource_name_ctype',
+                                                'direction': 'in',
+                                                'documentation': {   'description': '\n'
+                                                                                    'Resource name of the switch module to initialize. Default value: None\n'
+                                                                                    'Syntax: Optional fields are shown in square brackets ([]). Configured in\n'
+                                                                                    'MAX Under Valid Syntax Devices and Interfaces DeviceName Traditional\n'
+                                                                                    'NI-DAQ Devices SCXI[chassis ID]::slot number PXI System PXI[bus\n'
+                                                                                    'number]::device number TIP: IVI logical names are also valid for the\n'
+                                                                                    'resource name. Default values for optional fields: chassis ID = 1 bus\n'
+                                                                                    'number = 0 Example resource names: Resource Name Description SC1Mod3\n'
+                                                                                    'NI-DAQmx module in chassis "SC1" slot 3 MySwitch NI-DAQmx module renamed\n'
+                                                                                    'to "MySwitch" SCXI1::3 Traditional NI-DAQ module in chassis 1, slot 3\n'
+                                                                                    'SCXI::3 Traditional NI-DAQ module in chassis 1, slot 3 PXI0::16 PXI bus\n'
+                                                                                    '0, device number 16 PXI::16 PXI bus 0, device number 16\n'},
+                                                'enum': None,
+                                                'is_buffer': False,
+                                                'is_repeated_capability': False,
+                                                'is_session_handle': False,
+                                                'is_string': True,
+                                                'library_method_call_snippet': 'resource_name_ctype',
+                                                'name': 'resourceName',
+                                                'numpy': False,
+                                                'numpy_into_return': False,
+                                                'python_name': 'resource_name',
+                                                'python_name_or_default_for_init': 'resource_name',
+                                                'python_name_with_default': 'resource_name',
+                                                'python_name_with_doc_default': 'resource_name',
+                                                'python_type': 'str',
+                                                'size': {'mechanism': 'fixed', 'value': 1},
+                                                'type': 'ViRsrc',
+                                                'use_array': False,
+                                                'use_in_python_api': True,
+                                                'use_list': False},
+                                            {   'ctypes_type': 'ViConstString',
+                                                'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                                'ctypes_variable_name': 'topology_ctype',
+                                                'default_value': '"Configured Topology"',
+                                                'direction': 'in',
+                                                'documentation': {   'description': '\n'
+                                                                                    'Pass the topology name you want to use for the switch you specify with\n'
+                                                                                    'Resource Name parameter. You can also pass\n'
+                                                                                    'NISWITCH_TOPOLOGY_CONFIGURED_TOPOLOGY to use the last topology that\n'
+                                                                                    'was configured for the device in MAX. Default Value:\n'
+                                                                                    'NISWITCH_TOPOLOGY_CONFIGURED_TOPOLOGY Valid Values:\n'
+                                                                                    'NISWITCH_TOPOLOGY_1127_1_WIRE_64X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_1127_2_WIRE_32X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_1127_2_WIRE_4X8_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_1127_4_WIRE_16X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_1127_INDEPENDENT\n'
+                                                                                    'NISWITCH_TOPOLOGY_1128_1_WIRE_64X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_1128_2_WIRE_32X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_1128_2_WIRE_4X8_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_1128_4_WIRE_16X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_1128_INDEPENDENT\n'
+                                                                                    'NISWITCH_TOPOLOGY_1129_2_WIRE_16X16_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_1129_2_WIRE_8X32_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_1129_2_WIRE_4X64_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_1129_2_WIRE_DUAL_8X16_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_1129_2_WIRE_DUAL_4X32_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_1129_2_WIRE_QUAD_4X16_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_1130_1_WIRE_256X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_1130_1_WIRE_DUAL_128X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_1130_1_WIRE_4X64_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_1130_1_WIRE_8x32_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_1130_1_WIRE_OCTAL_32X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_1130_1_WIRE_QUAD_64X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_1130_1_WIRE_SIXTEEN_16X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_1130_2_WIRE_4X32_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_1130_2_WIRE_128X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_1130_2_WIRE_OCTAL_16X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_1130_2_WIRE_QUAD_32X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_1130_4_WIRE_64X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_1130_4_WIRE_QUAD_16X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_1130_INDEPENDENT NISWITCH_TOPOLOGY_1160_16_SPDT\n'
+                                                                                    'NISWITCH_TOPOLOGY_1161_8_SPDT\n'
+                                                                                    'NISWITCH_TOPOLOGY_1163R_OCTAL_4X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_1166_16_DPDT NISWITCH_TOPOLOGY_1166_32_SPDT\n'
+                                                                                    'NISWITCH_TOPOLOGY_1167_INDEPENDENT\n'
+                                                                                    'NISWITCH_TOPOLOGY_1169_100_SPST NISWITCH_TOPOLOGY_1169_50_DPST\n'
+                                                                                    'NISWITCH_TOPOLOGY_1175_1_WIRE_196X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_1175_2_WIRE_98X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_1175_2_WIRE_95X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_1190_QUAD_4X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_1191_QUAD_4X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_1192_8_SPDT NISWITCH_TOPOLOGY_1193_32X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_1193_16X1_TERMINATED_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_1193_DUAL_16X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_1193_DUAL_8X1_TERMINATED_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_1193_QUAD_8X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_1193_QUAD_4X1_TERMINATED_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_1193_INDEPENDENT\n'
+                                                                                    'NISWITCH_TOPOLOGY_1194_QUAD_4X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_1195_QUAD_4X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2501_1_WIRE_48X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2501_1_WIRE_48X1_AMPLIFIED_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2501_2_WIRE_24X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2501_2_WIRE_24X1_AMPLIFIED_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2501_2_WIRE_DUAL_12X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2501_2_WIRE_QUAD_6X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2501_2_WIRE_4X6_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2501_4_WIRE_12X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2503_1_WIRE_48X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2503_2_WIRE_24X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2503_2_WIRE_DUAL_12X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2503_2_WIRE_QUAD_6X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2503_2_WIRE_4X6_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2503_4_WIRE_12X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2510_INDEPENDENT\n'
+                                                                                    'NISWITCH_TOPOLOGY_2512_INDEPENDENT\n'
+                                                                                    'NISWITCH_TOPOLOGY_2514_INDEPENDENT\n'
+                                                                                    'NISWITCH_TOPOLOGY_2515_INDEPENDENT NISWITCH_TOPOLOGY_2520_80_SPST\n'
+                                                                                    'NISWITCH_TOPOLOGY_2521_40_DPST NISWITCH_TOPOLOGY_2522_53_SPDT\n'
+                                                                                    'NISWITCH_TOPOLOGY_2523_26_DPDT\n'
+                                                                                    'NISWITCH_TOPOLOGY_2524_1_WIRE_128X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2524_1_WIRE_DUAL_64X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2524_1_WIRE_QUAD_32X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2524_1_WIRE_OCTAL_16X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2524_1_WIRE_SIXTEEN_8X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2525_2_WIRE_64X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2525_2_WIRE_DUAL_32X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2525_2_WIRE_QUAD_16X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2525_2_WIRE_OCTAL_8X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2525_2_WIRE_SIXTEEN_4X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2526_1_WIRE_158X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2526_2_WIRE_79X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2527_1_WIRE_64X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2527_1_WIRE_DUAL_32X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2527_2_WIRE_32X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2527_2_WIRE_DUAL_16X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2527_4_WIRE_16X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2527_INDEPENDENT\n'
+                                                                                    'NISWITCH_TOPOLOGY_2529_2_WIRE_DUAL_4X16_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2529_2_WIRE_8X16_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2529_2_WIRE_4X32_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2530_1_WIRE_128X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2530_1_WIRE_DUAL_64X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2530_1_WIRE_4x32_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2530_1_WIRE_8x16_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2530_1_WIRE_OCTAL_16X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2530_1_WIRE_QUAD_32X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2530_2_WIRE_4x16_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2530_2_WIRE_64X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2530_2_WIRE_DUAL_32X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2530_2_WIRE_QUAD_16X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2530_4_WIRE_32X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2530_4_WIRE_DUAL_16X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2530_INDEPENDENT\n'
+                                                                                    'NISWITCH_TOPOLOGY_2531_1_WIRE_4X128_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2531_1_WIRE_8X64_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2531_1_WIRE_DUAL_4X64_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2531_1_WIRE_DUAL_8X32_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2531_2_WIRE_4X64_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2531_2_WIRE_8X32_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2532_1_WIRE_16X32_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2532_1_WIRE_4X128_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2532_1_WIRE_8X64_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2532_1_WIRE_DUAL_16X16_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2532_1_WIRE_DUAL_4X64_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2532_1_WIRE_DUAL_8X32_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2532_1_WIRE_SIXTEEN_2X16_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2532_2_WIRE_16X16_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2532_2_WIRE_4X64_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2532_2_WIRE_8X32_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2532_2_WIRE_DUAL_4X32_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2533_1_WIRE_4X64_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2534_1_WIRE_8X32_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2535_1_WIRE_4X136_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2536_1_WIRE_8X68_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2540_1_WIRE_8X9_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2541_1_WIRE_8X12_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2542_QUAD_2X1_TERMINATED_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2543_DUAL_4X1_TERMINATED_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2544_8X1_TERMINATED_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2545_4X1_TERMINATED_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2546_DUAL_4X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2547_8X1_MUX NISWITCH_TOPOLOGY_2548_4_SPDT\n'
+                                                                                    'NISWITCH_TOPOLOGY_2549_TERMINATED_2_SPDT\n'
+                                                                                    'NISWITCH_TOPOLOGY_2554_4X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2555_4X1_TERMINATED_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2556_DUAL_4X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2557_8X1_MUX NISWITCH_TOPOLOGY_2558_4_SPDT\n'
+                                                                                    'NISWITCH_TOPOLOGY_2559_TERMINATED_2_SPDT\n'
+                                                                                    'NISWITCH_TOPOLOGY_2564_16_SPST NISWITCH_TOPOLOGY_2564_8_DPST\n'
+                                                                                    'NISWITCH_TOPOLOGY_2565_16_SPST NISWITCH_TOPOLOGY_2566_16_SPDT\n'
+                                                                                    'NISWITCH_TOPOLOGY_2566_8_DPDT NISWITCH_TOPOLOGY_2567_INDEPENDENT\n'
+                                                                                    'NISWITCH_TOPOLOGY_2568_15_DPST NISWITCH_TOPOLOGY_2568_31_SPST\n'
+                                                                                    'NISWITCH_TOPOLOGY_2569_100_SPST NISWITCH_TOPOLOGY_2569_50_DPST\n'
+                                                                                    'NISWITCH_TOPOLOGY_2570_20_DPDT NISWITCH_TOPOLOGY_2570_40_SPDT\n'
+                                                                                    'NISWITCH_TOPOLOGY_2571_66_SPDT\n'
+                                                                                    'NISWITCH_TOPOLOGY_2575_1_WIRE_196X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2575_2_WIRE_98X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2575_2_WIRE_95X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2576_2_WIRE_64X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2576_2_WIRE_DUAL_32X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2576_2_WIRE_OCTAL_8X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2576_2_WIRE_QUAD_16X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2576_2_WIRE_SIXTEEN_4X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2576_INDEPENDENT\n'
+                                                                                    'NISWITCH_TOPOLOGY_2584_1_WIRE_12X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2584_1_WIRE_DUAL_6X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2584_2_WIRE_6X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2584_INDEPENDENT\n'
+                                                                                    'NISWITCH_TOPOLOGY_2585_1_WIRE_10X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2586_10_SPST NISWITCH_TOPOLOGY_2586_5_DPST\n'
+                                                                                    'NISWITCH_TOPOLOGY_2590_4X1_MUX NISWITCH_TOPOLOGY_2591_4X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2593_16X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2593_8X1_TERMINATED_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2593_DUAL_8X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2593_DUAL_4X1_TERMINATED_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2593_INDEPENDENT NISWITCH_TOPOLOGY_2594_4X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2595_4X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2596_DUAL_6X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2597_6X1_TERMINATED_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2598_DUAL_TRANSFER\n'
+                                                                                    'NISWITCH_TOPOLOGY_2599_2_SPDT NISWITCH_TOPOLOGY_2720_INDEPENDENT\n'
+                                                                                    'NISWITCH_TOPOLOGY_2722_INDEPENDENT\n'
+                                                                                    'NISWITCH_TOPOLOGY_2725_INDEPENDENT\n'
+                                                                                    'NISWITCH_TOPOLOGY_2727_INDEPENDENT\n'
+                                                                                    'NISWITCH_TOPOLOGY_2737_2_WIRE_4X64_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2738_2_WIRE_8X32_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2739_2_WIRE_16X16_MATRIX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2746_QUAD_4X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2747_DUAL_8X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2748_16X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2790_INDEPENDENT\n'
+                                                                                    'NISWITCH_TOPOLOGY_2796_DUAL_6X1_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2797_6X1_TERMINATED_MUX\n'
+                                                                                    'NISWITCH_TOPOLOGY_2798_DUAL_TRANSFER\n'
+                                                                                    'NISWITCH_TOPOLOGY_2799_2_SPDT\n'},
+                                                'enum': None,
+                                                'is_buffer': False,
+                                                'is_repeated_capability': False,
+                                                'is_session_handle': False,
+                                                'is_string': True,
+                                                'library_method_call_snippet': 'topology_ctype',
+                                                'name': 'Topology',
+                                                'numpy': False,
+                                                'numpy_into_return': False,
+                                                'python_name': 'topology',
+                                                'python_name_or_default_for_init': 'topology',
+                                                'python_name_with_default': 'topology="Configured Topology"',
+                                                'python_name_with_doc_default': 'topology=\'"Configured Topology"\'',
+                                                'python_type': 'str',
+                                                'size': {'mechanism': 'fixed', 'value': 1},
+                                                'type': 'ViConstString',
+                                                'use_array': False,
+                                                'use_in_python_api': True,
+                                                'use_list': False},
+                                            {   'ctypes_type': 'ViBoolean',
+                                                'ctypes_type_library_call': 'ViBoolean',
+                                                'ctypes_variable_name': 'simulate_ctype',
+                                                'default_value': False,
+                                                'direction': 'in',
+                                                'documentation': {   'description': '\n'
+                                                                                    'Enables simulation of the switch module specified in the resource name\n'
+                                                                                    "parameter. Valid Values: VI_TRUE - simulate VI_FALSE - Don't simulate\n"
+                                                                                    '(Default Value)\n'},
+                                                'enum': None,
+                                                'is_buffer': False,
+                                                'is_repeated_capability': False,
+                                                'is_session_handle': False,
+                                                'is_string': False,
+                                                'library_method_call_snippet': 'simulate_ctype',
+                                                'name': 'Simulate',
+                                                'numpy': False,
+                                                'numpy_into_return': False,
+                                                'python_name': 'simulate',
+                                                'python_name_or_default_for_init': 'simulate',
+                                                'python_name_with_default': 'simulate=False',
+                                                'python_name_with_doc_default': 'simulate=False',
+                                                'python_type': 'bool',
+                                                'size': {'mechanism': 'fixed', 'value': 1},
+                                                'type': 'ViBoolean',
+                                                'use_array': False,
+                                                'use_in_python_api': True,
+                                                'use_list': False},
+                                            {   'ctypes_type': 'ViBoolean',
+                                                'ctypes_type_library_call': 'ViBoolean',
+                                                'ctypes_variable_name': 'reset_device_ctype',
+                                                'default_value': False,
+                                                'direction': 'in',
+                                                'documentation': {   'description': '\n'
+                                                                                    'Specifies whether to reset the switch module during the initialization\n'
+                                                                                    'process. Valid Values: VI_TRUE - Reset Device (Default Value) VI_FALSE\n'
+                                                                                    '- Currently unsupported. The device will not reset.\n'},
+                                                'enum': None,
+                                                'is_buffer': False,
+                                                'is_repeated_capability': False,
+                                                'is_session_handle': False,
+                                                'is_string': False,
+                                                'library_method_call_snippet': 'reset_device_ctype',
+                                                'name': 'resetDevice',
+                                                'numpy': False,
+                                                'numpy_into_return': False,
+                                                'python_name': 'reset_device',
+                                                'python_name_or_default_for_init': 'reset_device',
+                                                'python_name_with_default': 'reset_device=False',
+                                                'python_name_with_doc_default': 'reset_device=False',
+                                                'python_type': 'bool',
+                                                'size': {'mechanism': 'fixed', 'value': 1},
+                                                'type': 'ViBoolean',
+                                                'use_array': False,
+                                                'use_in_python_api': True,
+                                                'use_list': False},
+                                            {   'ctypes_type': 'ViSession',
+                                                'ctypes_type_library_call': 'ctypes.POINTER(ViSession)',
+                                                'ctypes_variable_name': 'vi_ctype',
+                                                'default_value': '""',
+                                                'direction': 'out',
+                                                'documentation': {'description': '\nA session object representing the device.\n'},
+                                                'enum': None,
+                                                'is_buffer': False,
+                                                'is_repeated_capability': False,
+                                                'is_session_handle': False,
+                                                'is_string': False,
+                                                'library_method_call_snippet': 'None if vi_ctype is None else (ctypes.pointer(vi_ctype))',
+                                                'name': 'vi',
+                                                'numpy': False,
+                                                'numpy_into_return': False,
+                                                'python_name': 'session',
+                                                'python_name_or_default_for_init': 'vi',
+                                                'python_name_with_default': 'vi=""',
+                                                'python_name_with_doc_default': 'vi=\'""\'',
+                                                'python_type': 'niswitch.Session',
+                                                'size': {'mechanism': 'fixed', 'value': 1},
+                                                'type': 'ViSession',
+                                                'use_array': False,
+                                                'use_in_python_api': True,
+                                                'use_list': False}],
+                          'python_code_variables': [],
+                          'python_name': '_init_with_topology',
+                          'render_in_library': True,
+                          'render_in_session_base': False,
+                          'returns': 'ViStatus'},
+    'close': {   'blocking': False,
+                 'codegen_method': 'private',
+                 'documentation': {   'description': '\n'
+                                                     'Terminates the NI-SWITCH session and all of its attributes and\n'
+                                                     'deallocates any memory resources the driver uses. Notes: (1) You must\n'
+                                                     'unlock the session before calling niSwitch_close. (2) After calling\n'
+                                                     'niSwitch_close, you cannot use the instrument driver again until you\n'
+                                                     'call niSwitch_init or niSwitch_InitWithOptions.\n',
+                                      'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                 'has_repeated_capability': False,
+                 'invalidates_attribute_cache': False,
+                 'is_error_handling': False,
+                 'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                 'name': 'close',
+                 'parameters': [   {   'ctypes_type': 'ViSession',
+                                       'ctypes_type_library_call': 'ViSession',
+                                       'ctypes_variable_name': 'vi_ctype',
+                                       'direction': 'in',
+                                       'documentation': {   'description': '\n'
+                                                                           'A particular NI-SWITCH session established with\n'
+                                                                           'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                           'and used for all subsequent NI-SWITCH calls.\n',
+                                                            'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                       'enum': None,
+                                       'is_buffer': False,
+                                       'is_repeated_capability': False,
+                                       'is_session_handle': True,
+                                       'is_string': False,
+                                       'library_method_call_snippet': 'vi_ctype',
+                                       'name': 'vi',
+                                       'numpy': False,
+                                       'numpy_into_return': False,
+                                       'python_name': 'vi',
+                                       'python_name_or_default_for_init': 'vi',
+                                       'python_name_with_default': 'vi',
+                                       'python_name_with_doc_default': 'vi',
+                                       'python_type': 'int',
+                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                       'type': 'ViSession',
+                                       'use_array': False,
+                                       'use_in_python_api': True,
+                                       'use_list': False}],
+                 'python_code_variables': [],
+                 'python_name': '_close',
+                 'render_in_library': True,
+                 'render_in_session_base': False,
+                 'returns': 'ViStatus'},
+    'error_message': {   'blocking': False,
+                         'codegen_method': 'private',
+                         'documentation': {   'description': '\n'
+                                                             'Converts an error code returned by NI-SWITCH into a user-readable\n'
+                                                             'string. Generally this information is supplied in error out of any\n'
+                                                             'NI-SWITCH VI. Use niSwitch_error_message for a static lookup of an\n'
+                                                             'error code description.\n'},
+                         'has_repeated_capability': False,
+                         'invalidates_attribute_cache': False,
+                         'is_error_handling': True,
+                         'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                         'name': 'error_message',
+                         'parameters': [   {   'ctypes_type': 'ViSession',
+                                               'ctypes_type_library_call': 'ViSession',
+                                               'ctypes_variable_name': 'vi_ctype',
+                                               'direction': 'in',
+                                               'documentation': {   'description': '\n'
+                                                                                   'A particular NI-SWITCH session established with\n'
+                                                                                   'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                   'and used for all subsequent NI-SWITCH calls.\n',
+                                                                    'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                               'enum': None,
+                                               'is_buffer': False,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': True,
+                                               'is_string': False,
+                                               'library_method_call_snippet': 'vi_ctype',
+                                               'name': 'vi',
+                                               'numpy': False,
+                                               'numpy_into_return': False,
+                                               'python_name': 'vi',
+                                               'python_name_or_default_for_init': 'vi',
+                                               'python_name_with_default': 'vi',
+                                               'python_name_with_doc_default': 'vi',
+                                               'python_type': 'int',
+                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                               'type': 'ViSession',
+                                               'use_array': False,
+                                               'use_in_python_api': True,
+                                               'use_list': False},
+                                           {   'ctypes_type': 'ViStatus',
+                                               'ctypes_type_library_call': 'ViStatus',
+                                               'ctypes_variable_name': 'error_code_ctype',
+                                               'direction': 'in',
+                                               'documentation': {'description': '\nStatus code returned by any NI-SWITCH function. Default Value: 0\n(VI_SUCCESS)\n'},
+                                               'enum': None,
+                                               'is_buffer': False,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': False,
+                                               'is_string': False,
+                                               'library_method_call_snippet': 'error_code_ctype',
+                                               'name': 'errorCode',
+                                               'numpy': False,
+                                               'numpy_into_return': False,
+                                               'python_name': 'error_code',
+                                               'python_name_or_default_for_init': 'error_code',
+                                               'python_name_with_default': 'error_code',
+                                               'python_name_with_doc_default': 'error_code',
+                                               'python_type': 'int',
+                                               'size': {'mechanism': 'fixed', 'value': 1},
+                                               'type': 'ViStatus',
+                                               'use_array': False,
+                                               'use_in_python_api': True,
+                                               'use_list': False},
+                                           {   'ctypes_type': 'ViChar[]',
+                                               'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                               'ctypes_variable_name': 'error_message_ctype',
+                                               'direction': 'out',
+                                               'documentation': {'description': '\nThe error information formatted into a string. You must pass a ViChar\narray with at least 256 bytes.\n'},
+                                               'enum': None,
+                                               'is_buffer': False,
+                                               'is_repeated_capability': False,
+                                               'is_session_handle': False,
+                                               'is_string': True,
+                                               'library_method_call_snippet': 'error_message_ctype',
+                                               'name': 'errorMessage',
+                                               'numpy': False,
+                                               'numpy_into_return': False,
+                                               'python_name': 'error_message',
+                                               'python_name_or_default_for_init': 'error_message',
+                                               'python_name_with_default': 'error_message',
+                                               'python_name_with_doc_default': 'error_message',
+                                               'python_type': 'str',
+                                               'size': {'mechanism': 'fixed', 'value': 256},
+                                               'type': 'ViChar[]',
+                                               'use_array': False,
+                                               'use_in_python_api': True,
+                                               'use_list': False}],
+                         'python_code_variables': [],
+                         'python_name': '_error_message',
+                         'render_in_library': True,
+                         'render_in_session_base': True,
+                         'returns': 'ViStatus'},
+    'error_query': {   'codegen_method': 'no',
+                       'documentation': {   'description': '\n'
+                                                           "This function reads an error code and a message from the instrument's\n"
+                                                           'error queue. NI-SWITCH does not have an error queue, so this function\n'
+                                                           'never returns any errors.\n'},
+                       'parameters': [   {   'direction': 'in',
+                                             'documentation': {   'description': '\n'
+                                                                                 'A particular NI-SWITCH session established with\n'
+                                                                                 'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                 'and used for all subsequent NI-SWITCH calls.\n',
+                                                                  'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                             'name': 'vi',
+                                             'type': 'ViSession'},
+                                         {   'direction': 'out',
+                                             'documentation': {   'description': '\n'
+                                                                                 "Returns the error code read from the instrument's error queue. NI-SWITCH\n"
+                                                                                 'does not have an error queue, so this function never returns any errors.\n'},
+                                             'name': 'errorCode',
+                                             'type': 'ViInt32'},
+                                         {   'direction': 'out',
+                                             'documentation': {   'description': '\n'
+                                                                                 "Returns the error message string read from the instrument's error\n"
+                                                                                 'message queue. You must pass a ViChar array with at least 256 bytes.\n'
+                                                                                 'NI-SWITCH does not have an error queue, so this function never returns\n'
+                                                                                 'anything other than "No error".\n'},
+                                             'name': 'errorMessage',
+                                             'type': 'ViChar[]'}],
+                       'returns': 'ViStatus'},
+    'init': {   'codegen_method': 'no',
+                'documentation': {   'description': '\n'
+                                                    'Returns a session handle used to identify the switch module in all\n'
+                                                    'subsequent instrument driver calls. niSwitch_init creates a new IVI\n'
+                                                    'instrument driver session for the switch module specified in the\n'
+                                                    'resource name parameter. If multiple topologies are valid for that\n'
+                                                    'device, the driver uses the default topology specified in MAX. By\n'
+                                                    'default, the switch module is reset to a known state. An error is\n'
+                                                    'returned if a session to the specified resource exists in another\n'
+                                                    'process. The same session is returned if niSwitch_init is called twice\n'
+                                                    'in the same process for the same resource with the same topology.\n',
+                                     'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                'parameters': [   {   'direction': 'in',
+                                      'documentation': {   'description': '\n'
+                                                                          'Resource name of the switch module to initialize. Default value: None\n'
+                                                                          'Syntax: Optional fields are shown in square brackets ([]). Configured in\n'
+                                                                          'MAX Under Valid Syntax Devices and Interfaces DeviceName Traditional\n'
+                                                                          'NI-DAQ Devices SCXI[chassis ID]::slot number PXI System PXI[bus\n'
+                                                                          'number]::device number TIP: IVI logical names are also valid for the\n'
+                                                                          'resource name. Default values for optional fields: chassis ID = 1 bus\n'
+                                                                          'number = 0 Example resource names: Resource Name Description SC1Mod3\n'
+                                                                          'NI-DAQmx module in chassis "SC1" slot 3 MySwitch NI-DAQmx module renamed\n'
+                                                                          'to "MySwitch" SCXI1::3 Traditional NI-DAQ module in chassis 1, slot 3\n'
+                                                                          'SCXI::3 Traditional NI-DAQ module in chassis 1, slot 3 PXI0::16 PXI bus\n'
+                                                                          '0, device number 16 PXI::16 PXI bus 0, device number 16\n'},
+                                      'name': 'resourceName',
+                                      'type': 'ViRsrc'},
+                                  {   'direction': 'in',
+                                      'documentation': {   'description': '\n'
+                                                                          'This parameter is ignored. Because NI-SWITCH supports multiple switch\n'
+                                                                          'modules, it always queries the switch device to determine which device\n'
+                                                                          'is installed. For this reason, this VI may return\n'
+                                                                          'NISWITCH_ERROR_FAIL_ID_QUERY even if this parameter is set to\n'
+                                                                          'VI_FALSE. Valid Values: VI_TRUE - (Default Value) VI_FALSE -\n'
+                                                                          'Currently unsupported.\n'},
+                                      'name': 'idQuery',
+                                      'type': 'ViBoolean'},
+                                  {   'direction': 'in',
+                                      'documentation': {   'description': '\n'
+                                                                          'Specifies whether to reset the switch module during the initialization\n'
+                                                                          'process. Valid Values: VI_TRUE - Reset Device (Default Value) VI_FALSE\n'
+                                                                          '- Currently unsupported. The device will not reset.\n'},
+                                      'name': 'resetDevice',
+                                      'type': 'ViBoolean'},
+                                  {   'direction': 'out',
+                                      'documentation': {   'description': '\n'
+                                                                          'A particular NI-SWITCH session established with\n'
+                                                                          'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                          'and used for all subsequent NI-SWITCH calls.\n',
+                                                           'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                      'name': 'vi',
+                                      'type': 'ViSession'}],
+                'returns': 'ViStatus'},
+    'reset': {   'blocking': False,
+                 'codegen_method': 'public',
+                 'documentation': {   'description': '\n'
+                                                     'Disconnects all created paths and returns the switch module to the state\n'
+                                                     'at initialization. Configuration channel and source channel settings\n'
+                                                     'remain unchanged.\n'},
+                 'has_repeated_capability': False,
+                 'invalidates_attribute_cache': True,
+                 'is_error_handling': False,
+                 'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                 'name': 'reset',
+                 'parameters': [   {   'ctypes_type': 'ViSession',
+                                       'ctypes_type_library_call': 'ViSession',
+                                       'ctypes_variable_name': 'vi_ctype',
+                                       'direction': 'in',
+                                       'documentation': {   'description': '\n'
+                                                                           'A particular NI-SWITCH session established with\n'
+                                                                           'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                           'and used for all subsequent NI-SWITCH calls.\n',
+                                                            'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                       'enum': None,
+                                       'is_buffer': False,
+                                       'is_repeated_capability': False,
+                                       'is_session_handle': True,
+                                       'is_string': False,
+                                       'library_method_call_snippet': 'vi_ctype',
+                                       'name': 'vi',
+                                       'numpy': False,
+                                       'numpy_into_return': False,
+                                       'python_name': 'vi',
+                                       'python_name_or_default_for_init': 'vi',
+                                       'python_name_with_default': 'vi',
+                                       'python_name_with_doc_default': 'vi',
+                                       'python_type': 'int',
+                                       'size': {'mechanism': 'fixed', 'value': 1},
+                                       'type': 'ViSession',
+                                       'use_array': False,
+                                       'use_in_python_api': True,
+                                       'use_list': False}],
+                 'python_code_variables': [],
+                 'python_name': 'reset',
+                 'render_in_library': True,
+                 'render_in_session_base': False,
+                 'returns': 'ViStatus'},
+    'revision_query': {   'codegen_method': 'no',
+                          'documentation': {'description': 'Returns the revision of the NI-SWITCH driver.'},
+                          'parameters': [   {   'direction': 'in',
+                                                'documentation': {   'description': '\n'
+                                                                                    'A particular NI-SWITCH session established with\n'
+                                                                                    'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                                    'and used for all subsequent NI-SWITCH calls.\n',
+                                                                     'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                                'name': 'vi',
+                                                'type': 'ViSession'},
+                                            {   'direction': 'out',
+                                                'documentation': {   'description': '\n'
+                                                                                    'NI-SWITCH software revision numbers in the form of a string. You must\n'
+                                                                                    'pass a ViChar array with at least 256 bytes.\n'},
+                                                'name': 'instrumentDriverRevision',
+                                                'type': 'ViChar[]'},
+                                            {'direction': 'out', 'documentation': {'description': 'Currently unsupported.'}, 'name': 'firmwareRevision', 'type': 'ViChar[]'}],
+                          'returns': 'ViStatus'},
+    'self_test': {   'blocking': True,
+                     'codegen_method': 'public',
+                     'documentation': {   'description': 'Verifies that the driver can communicate with the switch module.',
+                                          'note': [   '\n'
+                                                      'This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same '
+                                                      'session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the '
+                                                      "Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.\n"]},
+                     'has_repeated_capability': False,
+                     'invalidates_attribute_cache': True,
+                     'is_error_handling': False,
+                     'method_templates': [{'documentation_filename': '/default_method', 'method_python_name_suffix': '', 'session_filename': '/default_method'}],
+                     'name': 'self_test',
+                     'parameters': [   {   'ctypes_type': 'ViSession',
+                                           'ctypes_type_library_call': 'ViSession',
+                                           'ctypes_variable_name': 'vi_ctype',
+                                           'direction': 'in',
+                                           'documentation': {   'description': '\n'
+                                                                               'A particular NI-SWITCH session established with\n'
+                                                                               'niSwitch_InitWithTopology, niSwitch_InitWithOptions, or niSwitch_init\n'
+                                                                               'and used for all subsequent NI-SWITCH calls.\n',
+                                                                'note': ['\nOne or more of the referenced functions are not in the Python API for this driver.\n']},
+                                           'enum': None,
+                                           'is_buffer': False,
+                                           'is_repeated_capability': False,
+                                           'is_session_handle': True,
+                                           'is_string': False,
+                                           'library_method_call_snippet': 'vi_ctype',
+                                           'name': 'vi',
+                                           'numpy': False,
+                                           'numpy_into_return': False,
+                                           'python_name': 'vi',
+                                           'python_name_or_default_for_init': 'vi',
+                                           'python_name_with_default': 'vi',
+                                           'python_name_with_doc_default': 'vi',
+                                           'python_type': 'int',
+                                           'size': {'mechanism': 'fixed', 'value': 1},
+                                           'type': 'ViSession',
+                                           'use_array': False,
+                                           'use_in_python_api': True,
+                                           'use_list': False},
+                                       {   'ctypes_type': 'ViInt16',
+                                           'ctypes_type_library_call': 'ctypes.POINTER(ViInt16)',
+                                           'ctypes_variable_name': 'self_test_result_ctype',
+                                           'direction': 'out',
+                                           'documentation': {'description': 'Value returned from the switch device self-test. Passed 0 Failed 1'},
+                                           'enum': None,
+                                           'is_buffer': False,
+                                           'is_repeated_capability': False,
+                                           'is_session_handle': False,
+                                           'is_string': False,
+                                           'library_method_call_snippet': 'None if self_test_result_ctype is None else (ctypes.pointer(self_test_result_ctype))',
+                                           'name': 'selfTestResult',
+                                           'numpy': False,
+                                           'numpy_into_return': False,
+                                           'python_name': 'self_test_result',
+                                           'python_name_or_default_for_init': 'self_test_result',
+                                           'python_name_with_default': 'self_test_result',
+                                           'python_name_with_doc_default': 'self_test_result',
+                                           'python_type': 'int',
+                                           'size': {'mechanism': 'fixed', 'value': 1},
+                                           'type': 'ViInt16',
+                                           'use_array': False,
+                                           'use_in_python_api': True,
+                                           'use_list': False},
+                                       {   'ctypes_type': 'ViChar[]',
+                                           'ctypes_type_library_call': 'ctypes.POINTER(ViChar)',
+                                           'ctypes_variable_name': 'self_test_message_ctype',
+                                           'direction': 'out',
+                                           'documentation': {'description': '\nSelf-test response string from the switch device. You must pass a ViChar\narray with at least 256 bytes.\n'},
+                                           'enum': None,
+                                           'is_buffer': False,
+                                           'is_repeated_capability': False,
+                                           'is_session_handle': False,
+                                           'is_string': True,
+                                           'library_method_call_snippet': 'self_test_message_ctype',
+                                           'name': 'selfTestMessage',
+                                           'numpy': False,
+                                           'numpy_into_return': False,
+                                           'python_name': 'self_test_message',
+                                           'python_name_or_default_for_init': 'self_test_message',
+                                           'python_name_with_default': 'self_test_message',
+                                           'python_name_with_doc_default': 'self_test_message',
+                                           'python_type': 'str',
+                                           'size': {'mechanism': 'fixed', 'value': 256},
+                                           'type': 'ViChar[]',
+                                           'use_array': False,
+                                           'use_in_python_api': True,
+                                           'use_list': False}],
+                     'python_code_variables': [],
+                     'python_name': 'self_test',
+                     'render_in_library': True,
+                     'render_in_session_base': False,
+                     'returns': 'ViStatus'}}
\ No newline at end of file
@@ -61,9 +61,11 @@ DEFAULT_PY_FILES_TO_GENERATE := \
     unit_tests/matchers.py \
     __init__.py \
     _converters.py \
+    aio.py \
 
 DEFAULT_PY_FILES_TO_COPY := \
     visatype.py \
+    executor.py \
 
 DEFAULT_RST_FILES_TO_GENERATE := \
     session.rst \
@@ -2,6 +2,7 @@ from build.helper.codegen_helper import get_ctype_variable_declaration_snippet
 from build.helper.codegen_helper import get_dictionary_snippet  # noqa: F401
 from build.helper.codegen_helper import get_enum_type_check_snippet  # noqa: F401
 from build.helper.codegen_helper import get_method_return_snippet  # noqa: F401
+from build.helper.codegen_helper import get_numpy_copy_back_snippet  # noqa: F401
 from build.helper.codegen_helper import get_params_snippet  # noqa: F401
 from build.helper.codegen_helper import IviDanceStep  # noqa: F401
 
@@ -23,6 +24,7 @@ from build.helper.documentation_helper import rep_cap_method_desc_rst  # noqa: F
 from build.helper.documentation_helper import square_up_tables  # noqa: F401
 
 from build.helper.documentation_snippets import rep_cap_attr_desc  # noqa: F401
+from build.helper.documentation_snippets import session_thread_safety_text  # noqa: F401
 
 from build.helper.helper import camelcase_to_snakecase  # noqa: F401
 from build.helper.helper import get_array_type_for_api_type  # noqa: F401
@@ -37,6 +39,7 @@ from build.helper.metadata_filters import filter_codegen_enums  # noqa: F401
 from build.helper.metadata_filters import filter_codegen_functions  # noqa: F401
 from build.helper.metadata_filters import filter_ivi_dance_parameter  # noqa: F401
 from build.helper.metadata_filters import filter_len_parameter  # noqa: F401
+from build.helper.metadata_filters import filter_library_functions  # noqa: F401
 from build.helper.metadata_filters import filter_parameters  # noqa: F401
 
 from build.helper.metadata_find import find_custom_type  # noqa: F401
@@ -105,7 +105,8 @@ def _get_output_param_return_snippet(output_parameter, parameters, config):
         if output_parameter['size']['mechanism'] == 'fixed':
             size = str(output_parameter['size']['value'])
         elif output_parameter['size']['mechanism'] == 'python-code':
-            size = output_parameter['size']['value']
+            # Don't evaluate the python code again, it was stored when the buffer was allocated (case B560)
+            size = output_parameter['python_name'] + '_size'
         else:
             size_parameter = find_size_parameter(output_parameter, parameters)
             size = size_parameter['ctypes_variable_name'] + '.value'
@@ -128,11 +129,22 @@ def get_method_return_snippet(parameters, config, use_numpy_array=False):
     for x in parameters:
         if x['direction'] == 'out' or x['size']['mechanism'] == 'ivi-dance':
             if x['numpy'] is False or use_numpy_array is False:
-                if x['use_in_python_api']:
+                if x['use_in_python_api'] or (use_numpy_array is True and x['numpy_into_return'] is True):
                     snippets.append(_get_output_param_return_snippet(x, parameters, config))
     return ('return ' + ', '.join(snippets)).strip()
 
 
+def get_numpy_copy_back_snippet(parameter):
+    '''Returns a python snippet that copies a ViBoolean output buffer into the caller's numpy.ndarray, or None if no copy is needed
+
+    See case B515 in _get_ctype_variable_definition_snippet_for_buffers().
+    '''
+    assert parameter['numpy'] is True, pp.pformat(parameter)
+    if parameter['type'] == 'ViBoolean' and parameter['direction'] == 'out':
+        return '{0}[:] = numpy.ctypeslib.as_array({1})'.format(parameter['python_name'], parameter['ctypes_variable_name'])
+    return None
+
+
 def get_enum_type_check_snippet(parameter, indent):
     '''Returns python snippet to check that the type of a parameter is what is expected'''
     assert parameter['enum'] is not None, pp.pformat(parameter)
@@ -192,7 +204,7 @@ def get_ctype_variable_declaration_snippet(parameter, parameters, ivi_dance_step
 def _get_ctype_variable_definition_snippet_for_string(parameter, parameters, ivi_dance_step, module_name):
     '''These are the different cases for initializing the ctype variables for strings
 
-    C010. Input repeated capability:                                           ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))
+    C010. Input repeated capability:                                           self._repeated_capability_ctype
     C020. Input string:                                                        ctypes.create_string_buffer(parameter_name.encode(self._encoding))
     C050. Output buffer with mechanism ivi-dance, QUERY_SIZE:                  None
     C060. Output buffer with mechanism ivi-dance, GET_DATA:                    (visatype.ViChar * buffer_size_ctype.value)()
@@ -203,7 +215,7 @@ def _get_ctype_variable_definition_snippet_for_string(parameter, parameters, ivi
 
     if parameter['direction'] == 'in':
         if parameter['is_repeated_capability'] is True:
-            definition = 'ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010'
+            definition = 'self._repeated_capability_ctype  # case C010'
         else:
             definition = 'ctypes.create_string_buffer({0}.encode(self._encoding))  # case C020'.format(parameter['python_name'])
     else:
@@ -290,24 +302,32 @@ def _get_ctype_variable_definition_snippet_for_buffers(parameter, parameters, iv
     '''These are the different cases for initializing the ctype variable for buffers:
 
         B510. Input/output numpy array:                                            get_ctypes_pointer_for_buffer(value=waveform)
+        B515. Input/output numpy array of ViBoolean:                               get_ctypes_pointer_for_buffer(library_type=visatype.ViBoolean, size=len(in_compliance))
         B540. Input buffer (custom type):                                          get_ctypes_pointer_for_buffer(value=[custom_struct(l) for l in list], library_type=custom_struct)
         B550. Input buffer of simple types:                                        get_ctypes_pointer_for_buffer(value=array.array('d', list), library_type=visatype.ViReal64)
         B560. Output buffer with mechanism python-code:                            get_ctypes_pointer_for_buffer(value=array.array('d'), library_type=ViInt32)
         B570. Output buffer with mechanism fixed-size:                             get_ctypes_pointer_for_buffer(library_type=ViInt32, size=256)
         B580. Output buffer with mechanism ivi-dance, QUERY_SIZE:                  None
-        B590. Output buffer with mechanism ivi-dance, GET_DATA:                    get_ctypes_pointer_for_buffer(value=array.array('d', [0] * buffer_size_ctype.value, library_type=ViInt32)
-        B600. Output buffer with mechanism passed-in:                              get_ctypes_pointer_for_buffer(value-array.array('d', [0] * buffer_size, library_type=ViInt32)
+        B590. Output buffer with mechanism ivi-dance, GET_DATA:                    get_ctypes_pointer_for_buffer(value=array.array('d', [0]) * buffer_size_ctype.value, library_type=ViInt32)
+        B600. Output buffer with mechanism passed-in:                              get_ctypes_pointer_for_buffer(value=array.array('d', [0]) * buffer_size, library_type=ViInt32)
 
     Return Value (list): each item in the list will be one line needed for the declaration of that parameter
 
     All versions that have array.array have an alternate format for lists
+    Input buffers (B550) given as a contiguous numpy.ndarray or an array.array of the library type are passed by pointer, without copying
     '''
 
     assert parameter['is_buffer'] is True
     definitions = []
     definition = None
 
-    if parameter['numpy'] is True and use_numpy_array is True:
+    if parameter['numpy'] is True and use_numpy_array is True and parameter['type'] == 'ViBoolean':
+        # numpy.bool_ and ViBoolean differ in size, so the driver writes into a ViBoolean buffer that is copied back after the call
+        if parameter['direction'] == 'in':
+            definition = 'get_ctypes_pointer_for_buffer(value={0}.tolist(), library_type=visatype.ViBoolean)  # case B515'.format(parameter['python_name'])
+        else:
+            definition = 'get_ctypes_pointer_for_buffer(library_type=visatype.ViBoolean, size=len({0}))  # case B515'.format(parameter['python_name'])
+    elif parameter['numpy'] is True and use_numpy_array is True:
         definition = 'get_ctypes_pointer_for_buffer(value={0})  # case B510'.format(parameter['python_name'])
     elif parameter['direction'] == 'in':
         if custom_type is not None:
@@ -329,7 +349,7 @@ def _get_ctype_variable_definition_snippet_for_buffers(parameter, parameters, iv
             line1 = '{0}_size = {1}  # case B560'.format(parameter['python_name'], parameter['size']['value'])
             definitions.append(line1)
             if parameter['use_array']:
-                line2 = '{0}_array = array.array("{1}", [0] * {0}_size)  # case B560'.format(parameter['python_name'], get_array_type_for_api_type(parameter['ctypes_type']))
+                line2 = '{0}_array = array.array("{1}", [0]) * {0}_size  # case B560'.format(parameter['python_name'], get_array_type_for_api_type(parameter['ctypes_type']))
                 definitions.append(line2)
                 definition = 'get_ctypes_pointer_for_buffer(value={2}_array, library_type={1}.{3})  # case B560'.format(parameter['ctypes_variable_name'], module_name, parameter['python_name'], parameter['ctypes_type'])
             elif parameter['use_list']:
@@ -341,7 +361,7 @@ def _get_ctype_variable_definition_snippet_for_buffers(parameter, parameters, iv
             line1 = '{0}_size = {1}  # case B570'.format(parameter['python_name'], parameter['size']['value'])
             definitions.append(line1)
             if parameter['use_array']:
-                line2 = '{0}_array = array.array("{1}", [0] * {0}_size)  # case B570'.format(parameter['python_name'], get_array_type_for_api_type(parameter['ctypes_type']))
+                line2 = '{0}_array = array.array("{1}", [0]) * {0}_size  # case B570'.format(parameter['python_name'], get_array_type_for_api_type(parameter['ctypes_type']))
                 definitions.append(line2)
                 definition = 'get_ctypes_pointer_for_buffer(value={2}_array, library_type={1}.{3})  # case B570'.format(parameter['ctypes_variable_name'], module_name, parameter['python_name'], parameter['ctypes_type'])
             elif parameter['use_list']:
@@ -356,7 +376,7 @@ def _get_ctype_variable_definition_snippet_for_buffers(parameter, parameters, iv
                 line1 = '{0}_size = {1}.value  # case B590'.format(parameter['python_name'], size_parameter['ctypes_variable_name'])
                 definitions.append(line1)
                 if parameter['use_array']:
-                    line2 = '{0}_array = array.array("{1}", [0] * {0}_size)  # case B590'.format(parameter['python_name'], get_array_type_for_api_type(parameter['ctypes_type']))
+                    line2 = '{0}_array = array.array("{1}", [0]) * {0}_size  # case B590'.format(parameter['python_name'], get_array_type_for_api_type(parameter['ctypes_type']))
                     definition = 'get_ctypes_pointer_for_buffer(value={2}_array, library_type={1}.{3})  # case B590'.format(parameter['ctypes_variable_name'], module_name, parameter['python_name'], parameter['ctypes_type'])
                     definitions.append(line2)
                 elif parameter['use_list']:
@@ -370,7 +390,7 @@ def _get_ctype_variable_definition_snippet_for_buffers(parameter, parameters, iv
             line1 = '{0}_size = {1}  # case B600'.format(parameter['python_name'], size_parameter['python_name'])
             definitions.append(line1)
             if parameter['use_array']:
-                line2 = '{0}_array = array.array("{1}", [0] * {0}_size)  # case B600'.format(parameter['python_name'], get_array_type_for_api_type(parameter['ctypes_type']))
+                line2 = '{0}_array = array.array("{1}", [0]) * {0}_size  # case B600'.format(parameter['python_name'], get_array_type_for_api_type(parameter['ctypes_type']))
                 definition = 'get_ctypes_pointer_for_buffer(value={2}_array, library_type={1}.{3})  # case B600'.format(parameter['ctypes_variable_name'], module_name, parameter['python_name'], parameter['ctypes_type'])
                 definitions.append(line2)
             elif parameter['use_list']:
@@ -862,6 +882,56 @@ parameters_for_testing = [
         'numpy': False,
         'use_in_python_api': True,
     },
+    {  # 19
+        'ctypes_type': 'ViBoolean',
+        'ctypes_type_library_call': 'ctypes.POINTER(ViBoolean)',
+        'ctypes_variable_name': 'in_compliance_ctype',
+        'direction': 'out',
+        'documentation': {'description': 'Compliance state of each measurement.'},
+        'enum': None,
+        'is_buffer': True,
+        'use_array': False,
+        'use_list': True,
+        'is_string': False,
+        'is_repeated_capability': False,
+        'is_session_handle': False,
+        'library_method_call_snippet': 'in_compliance_ctype',
+        'name': 'inCompliance',
+        'python_name': 'in_compliance',
+        'python_name_with_default': 'in_compliance',
+        'python_name_with_doc_default': 'in_compliance',
+        'python_type': 'bool',
+        'size': {'mechanism': 'passed-in', 'value': 'numberOfElements'},
+        'type': 'ViBoolean',
+        'numpy': True,
+        'numpy_type': 'bool_',
+        'use_in_python_api': True,
+    },
+    {  # 20
+        'ctypes_type': 'ViInt32',
+        'ctypes_type_library_call': 'ctypes.POINTER(ViInt32)',
+        'ctypes_variable_name': 'actual_count_ctype',
+        'direction': 'out',
+        'documentation': {'description': 'Number of measurements actually fetched.'},
+        'enum': None,
+        'is_buffer': False,
+        'use_array': False,
+        'use_list': False,
+        'is_string': False,
+        'is_repeated_capability': False,
+        'is_session_handle': False,
+        'library_method_call_snippet': 'ctypes.pointer(actual_count_ctype)',
+        'name': 'actualCount',
+        'python_name': 'actual_count',
+        'python_name_with_default': 'actual_count',
+        'python_name_with_doc_default': 'actual_count',
+        'python_type': 'int',
+        'size': {'mechanism': 'fixed', 'value': 1},
+        'type': 'ViInt32',
+        'numpy': False,
+        'numpy_into_return': True,
+        'use_in_python_api': False,
+    },
 ]
 
 
@@ -882,7 +952,7 @@ def test_get_method_return_snippet_string():
 
 def test_get_method_return_snippet_custom_type():
     param = [parameters_for_testing[3]]
-    assert get_method_return_snippet(param, config_for_testing) == 'return [custom_struct.CustomStruct(array_out_ctype[i]) for i in range(self.get_array_size_for_python_code())]'
+    assert get_method_return_snippet(param, config_for_testing) == 'return [custom_struct.CustomStruct(array_out_ctype[i]) for i in range(array_out_size)]'
 
 
 def test_get_method_return_snippet_enum():
@@ -895,6 +965,24 @@ def test_get_method_return_snippet_into():
     assert get_method_return_snippet(param, config_for_testing, use_numpy_array=True) == 'return'
 
 
+def test_get_method_return_snippet_into_hidden_output():
+    param = [parameters_for_testing[7], parameters_for_testing[20]]
+    assert get_method_return_snippet(param, config_for_testing, use_numpy_array=True) == 'return int(actual_count_ctype.value)'
+
+
+def test_get_method_return_snippet_hidden_output():
+    param = [parameters_for_testing[20]]
+    assert get_method_return_snippet(param, config_for_testing) == 'return'
+
+
+def test_get_numpy_copy_back_snippet():
+    assert get_numpy_copy_back_snippet(parameters_for_testing[19]) == 'in_compliance[:] = numpy.ctypeslib.as_array(in_compliance_ctype)'
+
+
+def test_get_numpy_copy_back_snippet_none():
+    assert get_numpy_copy_back_snippet(parameters_for_testing[7]) is None
+
+
 def test_get_enum_type_check_snippet():
     param = parameters_for_testing[6]
     assert get_enum_type_check_snippet(param, 0) == "if type(an_int_enum) is not enums.Turtle:\nraise TypeError('Parameter mode must be of type ' + str(enums.Turtle))"
@@ -975,9 +1063,14 @@ def test_get_ctype_variable_declaration_snippet_case_b510():
     assert snippet == ["output_ctype = get_ctypes_pointer_for_buffer(value=output)  # case B510"]
 
 
+def test_get_ctype_variable_declaration_snippet_case_b515():
+    snippet = get_ctype_variable_declaration_snippet(parameters_for_testing[19], parameters_for_testing, IviDanceStep.NOT_APPLICABLE, config_for_testing, use_numpy_array=True)
+    assert snippet == ["in_compliance_ctype = get_ctypes_pointer_for_buffer(library_type=visatype.ViBoolean, size=len(in_compliance))  # case B515"]
+
+
 def test_get_ctype_variable_declaration_snippet_case_b520():
     snippet = get_ctype_variable_declaration_snippet(parameters_for_testing[15], parameters_for_testing, IviDanceStep.NOT_APPLICABLE, config_for_testing, use_numpy_array=False)
-    assert snippet == ["channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010"]
+    assert snippet == ["channel_list_ctype = self._repeated_capability_ctype  # case C010"]
 
 
 def test_get_ctype_variable_declaration_snippet_case_b530():
@@ -1016,7 +1109,7 @@ def test_get_ctype_variable_declaration_snippet_case_b570():
     actual = get_ctype_variable_declaration_snippet(parameters_for_testing[18], parameters_for_testing, IviDanceStep.NOT_APPLICABLE, config_for_testing, use_numpy_array=False)
     expected = [
         'an_int_size = 256  # case B570',
-        'an_int_array = array.array("h", [0] * an_int_size)  # case B570',
+        'an_int_array = array.array("h", [0]) * an_int_size  # case B570',
         'an_int_ctype = get_ctypes_pointer_for_buffer(value=an_int_array, library_type=visatype.ViInt16)  # case B570',
     ]
     assert len(actual) == len(expected)
@@ -1028,7 +1121,7 @@ def test_get_ctype_variable_declaration_snippet_case_b600():
     actual = get_ctype_variable_declaration_snippet(parameters_for_testing[7], parameters_for_testing, IviDanceStep.NOT_APPLICABLE, config_for_testing, use_numpy_array=False)
     expected = [
         'output_size = number_of_elements  # case B600',
-        'output_array = array.array("q", [0] * output_size)  # case B600',
+        'output_array = array.array("q", [0]) * output_size  # case B600',
         'output_ctype = get_ctypes_pointer_for_buffer(value=output_array, library_type=visatype.ViInt64)  # case B600',
     ]
     assert len(actual) == len(expected)
@@ -27,6 +27,18 @@ rep_cap_method_desc_docstring = rep_cap_method_desc + '''
     session.channels['0,1'].{1}({2})
 '''
 
+blocking_method_note_text = '''
+This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.
+'''
+
+session_thread_safety_text = '''
+A session can be used from several threads. This applies to every method and property. No Python lock is held while the driver runs, and the driver runs one call on a session at a time. A method called, or a property set or read, while another call on the same session is in progress, directly or through the executor property, waits for that call to complete. Calls on different sessions run in parallel.
+
+Calls made through the executor property run on the worker thread of the session, one at a time and in the order they were submitted.
+
+Sequences of calls that depend on each other, such as setting the fetch properties and then fetching, are not atomic. Make them from one thread, or submit them to the executor as one callable. Generators, pipelines and buffer pools returned by the session are used from one thread at a time. Do not call close() while other threads use the session.
+'''
+
 func_note_text = '''
 One or more of the referenced functions are not in the Python API for this driver.
 '''
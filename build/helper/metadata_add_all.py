@@ -2,6 +2,7 @@
 
 from .documentation_helper import add_notes_re_links
 from .documentation_helper import square_up_tables
+from .documentation_snippets import blocking_method_note_text
 from .documentation_snippets import options_table_body
 from .documentation_snippets import options_table_header
 from .documentation_snippets import options_text
@@ -101,13 +102,17 @@ def _add_ctypes_type(parameter, config):
 def _add_numpy_info(parameter, parameters, config):
     '''Adds the following numpy-related information:
 
-             numpy: Default to False unless already set. True for buffers that allow being passed as a numpy.ndarray.
-        numpy_type: The name of the element type to use in the numpy.ndarray.
+                    numpy: Default to False unless already set. True for buffers that allow being passed as a numpy.ndarray.
+               numpy_type: The name of the element type to use in the numpy.ndarray.
+        numpy_into_return: Default to False unless already set. True for outputs hidden from the Python API that the numpy-based method still returns.
     '''
 
     if 'numpy' not in parameter:
         parameter['numpy'] = False
 
+    if 'numpy_into_return' not in parameter:
+        parameter['numpy_into_return'] = False
+
     if parameter['numpy']:
         parameter['numpy_type'] = get_numpy_type_for_api_type(parameter['type'], config)
 
@@ -258,6 +263,61 @@ def _add_render_in_session_base(f):
         f['render_in_session_base'] = f['has_repeated_capability'] or f['is_error_handling']
 
 
+def _add_render_in_library(f):
+    '''Adds a boolean 'render_in_library' to the function metadata if not previously populated.
+
+    This tells the code generator whether the function exists in the driver runtime and needs a wrapper in Library.
+    Functions implemented purely in Python (i.e. dispatchers) set this to False in functions_addon.py.
+    '''
+    if 'render_in_library' not in f:
+        f['render_in_library'] = True
+
+
+def _add_blocking(f):
+    '''Adds a boolean 'blocking' to the function metadata if not previously populated.
+
+    Blocking functions (fetches, reads, waits, self-calibration) are set in functions_addon.py.
+    '''
+    if 'blocking' not in f:
+        f['blocking'] = False
+
+
+def _add_invalidates_attribute_cache(f):
+    '''Adds a boolean 'invalidates_attribute_cache' to the function metadata if not previously populated.
+
+    Functions that can change property values in the driver (reset, commit, configure, set attribute, ...)
+    are set in functions_addon.py. Calling them clears the session attribute cache.
+    '''
+    if 'invalidates_attribute_cache' not in f:
+        f['invalidates_attribute_cache'] = False
+
+
+def _add_python_code_variables(f):
+    '''Adds a list 'python_code_variables' to the function metadata if not previously populated.
+
+    Each entry is a (name, python code) pair for a local variable assigned at the start of the generated method,
+    i.e. ('num_wfms', 'self._actual_num_wfms()'), so that the python code is evaluated once and buffers with
+    mechanism 'python-code' can use the variable for their size. A list is used because addon dicts are only
+    merged into keys that already exist.
+    '''
+    if 'python_code_variables' not in f:
+        f['python_code_variables'] = []
+
+
+def _add_blocking_note(f):
+    '''Adds a note describing how a blocking function behaves when called from multiple threads.
+
+    This must run after add_notes_re_links(), which expects notes from the metadata to be strings.
+    '''
+    if f['blocking'] and 'documentation' in f:
+        nd = f['documentation']
+        if 'note' not in nd:
+            nd['note'] = []
+        elif not isinstance(nd['note'], list):
+            nd['note'] = [nd['note']]
+        nd['note'].append(blocking_method_note_text)
+
+
 def _add_is_repeated_capability(parameter):
     '''Adds a boolean 'is_repeated_capability' to the parameter metadata by inferring it from its name, if not previously populated.'''
     if 'is_repeated_capability' not in parameter:
@@ -324,6 +384,10 @@ def add_all_function_metadata(functions, config):
         _add_is_error_handling(functions[f])
         _add_has_repeated_capability(functions[f])
         _add_render_in_session_base(functions[f])
+        _add_render_in_library(functions[f])
+        _add_blocking(functions[f])
+        _add_invalidates_attribute_cache(functions[f])
+        _add_python_code_variables(functions[f])
         _add_method_templates(functions[f])
         for p in functions[f]['parameters']:
             _add_enum(p)
@@ -364,6 +428,16 @@ def _add_default_attribute_class(a, attributes):
         attributes[a]['attribute_class'] = 'Attribute' + attributes[a]['type']
 
 
+def _add_cacheable(a, attributes):
+    '''Set 'cacheable' if not set.
+
+    By default, property values can be kept in the session attribute cache.
+    Properties that change without a call into the driver (status, backlog, temperature, ...) set it to False in attributes_addon.
+    '''
+    if 'cacheable' not in attributes[a]:
+        attributes[a]['cacheable'] = True
+
+
 def add_all_attribute_metadata(attributes, config):
     '''Merges and Adds all codegen-specific metada to the function metadata list'''
     attributes = merge_helper(attributes, 'attributes', config, use_re=False)
@@ -374,6 +448,7 @@ def add_all_attribute_metadata(attributes, config):
         _add_python_name(a, attributes)
         _add_python_type(attributes[a], config)
         _add_default_attribute_class(a, attributes)
+        _add_cacheable(a, attributes)
 
     return attributes
 
@@ -507,6 +582,9 @@ def add_all_metadata(functions, attributes, enums, config):
 
     add_notes_re_links(config)
 
+    for f in filter_codegen_functions(functions):
+        _add_blocking_note(functions[f])
+
     square_up_tables(config)
 
     pp_persist = pprint.PrettyPrinter(indent=4, width=200)
@@ -637,6 +715,10 @@ def test_add_all_metadata_simple():
             'has_repeated_capability': True,
             'is_error_handling': False,
             'render_in_session_base': True,
+            'render_in_library': True,
+            'blocking': False,
+            'invalidates_attribute_cache': False,
+            'python_code_variables': [],
             'method_templates': [{'session_filename': '/cool_template', 'documentation_filename': '/cool_template', 'method_python_name_suffix': '', }, ],
             'parameters': [
                 {
@@ -651,6 +733,7 @@ def test_add_all_metadata_simple():
                     'is_session_handle': True,
                     'enum': None,
                     'numpy': False,
+                    'numpy_into_return': False,
                     'python_type': 'int',
                     'use_array': False,
                     'is_buffer': False,
@@ -681,6 +764,7 @@ def test_add_all_metadata_simple():
                     'is_session_handle': False,
                     'enum': None,
                     'numpy': False,
+                    'numpy_into_return': False,
                     'python_type': 'str',
                     'use_array': False,
                     'is_buffer': False,
@@ -708,6 +792,7 @@ def test_add_all_metadata_simple():
                 'direction': 'in',
                 'enum': None,
                 'numpy': False,
+                'numpy_into_return': False,
                 'name': 'vi',
                 'type': 'ViSession',
                 'documentation': {
@@ -737,6 +822,7 @@ def test_add_all_metadata_simple():
                 'direction': 'out',
                 'enum': None,
                 'numpy': False,
+                'numpy_into_return': False,
                 'name': 'status',
                 'type': 'ViString',
                 'documentation': {
@@ -770,6 +856,10 @@ def test_add_all_metadata_simple():
             'python_name': '_make_a_private_method',
             'is_error_handling': False,
             'render_in_session_base': False,
+            'render_in_library': True,
+            'blocking': False,
+            'invalidates_attribute_cache': False,
+            'python_code_variables': [],
             'has_repeated_capability': False
         }
     }
@@ -783,6 +873,15 @@ def _do_the_test_add_attributes_metadata(attributes, expected):
     _compare_dicts(actual, expected)
 
 
+def test_add_blocking_note():
+    blocking_function = {'blocking': True, 'documentation': {'description': 'Waits.', 'note': 'Existing note.'}}
+    other_function = {'blocking': False, 'documentation': {'description': 'Returns immediately.'}}
+    _add_blocking_note(blocking_function)
+    _add_blocking_note(other_function)
+    assert blocking_function['documentation']['note'] == ['Existing note.', blocking_method_note_text]
+    assert 'note' not in other_function['documentation']
+
+
 def test_add_attributes_metadata_simple():
     attributes = {
         1000000: {
@@ -812,6 +911,7 @@ def test_add_attributes_metadata_simple():
             'type': 'ViBoolean',
             'python_type': 'bool',
             'attribute_class': 'AttributeViBoolean',
+            'cacheable': True,
         },
     }
 
@@ -11,6 +11,7 @@ from ${module_name}.enums import *          # noqa: F403,F401,H303
 % endif
 from ${module_name}.errors import Error     # noqa: F401
 from ${module_name}.errors import ${module_name_class}Warning   # noqa: F401
+from ${module_name}.errors import WarningPolicy   # noqa: F401
 from ${module_name}.session import Session  # noqa: F401
 <%
  # Blank lines are to make each import separate so that they do not need to be sorted
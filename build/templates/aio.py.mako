@@ -0,0 +1,127 @@
+<%
+# Have to put this in a variable and add it that way because mako keeps thinking it is for it, not for the output file
+encoding_tag = '# -*- coding: utf-8 -*-'
+%>\
+${encoding_tag}
+# This file was generated
+<%
+    import build.helper as helper
+
+    config = template_parameters['metadata'].config
+    functions = helper.filter_codegen_functions(config['functions'])
+    blocking_functions = {k: v for k, v in functions.items() if v['blocking']}
+
+    module_name = config['module_name']
+
+    init_function = config['functions']['_init_function']
+    init_method_params = helper.get_params_snippet(init_function, helper.ParameterUsageOptions.SESSION_METHOD_DECLARATION)
+    init_call_params = helper.get_params_snippet(init_function, helper.ParameterUsageOptions.SESSION_METHOD_CALL)
+%>\
+'''asyncio front-end for ${config['driver_name']} sessions.
+
+Blocking methods return awaitables. The underlying driver call runs on an executor, by default the
+worker thread of the session (see ${module_name}.Session.executor), so the event loop keeps running while
+the driver waits. Cancelling the awaitable before the call has started removes it from the queue, and
+asyncio.wait_for() can be used to put a timeout on it.
+
+All other methods and properties are forwarded to the synchronous ${module_name}.Session unchanged.
+
+Requires Python 3.4 or later.
+'''
+import asyncio
+
+from ${module_name} import session as _session
+<%def name="blocking_method(f, method_template)">\
+<%
+    method_name = f['python_name'] + method_template['method_python_name_suffix']
+%>\
+    def ${method_name}(self, *args, **kwargs):
+        '''${method_name}
+
+        asyncio variant of ${module_name}.Session.${method_name}. Takes the same parameters and returns an awaitable for its result.
+        '''
+        return self.run_in_executor(self._session.${method_name}, *args, **kwargs)
+
+</%def>\
+
+
+class _RepeatedCapabilities(object):
+    def __init__(self, repeated_capabilities, executor):
+        self._repeated_capabilities = repeated_capabilities
+        self._executor = executor
+
+    def __getitem__(self, repeated_capability):
+        '''Set/get properties or call methods with a repeated capability (i.e. channels)'''
+        return _SessionBase(self._repeated_capabilities[repeated_capability], self._executor)
+
+
+class _SessionBase(object):
+    '''Base class for all asyncio ${config['driver_name']} sessions.'''
+
+    def __init__(self, session, executor):
+        object.__setattr__(self, '_session', session)
+        object.__setattr__(self, '_executor', executor)
+
+    def __repr__(self):
+        return '{0}.aio.{1}({2})'.format('${module_name}', self.__class__.__name__, self._session._param_list)
+
+    def __getattr__(self, key):
+        return getattr(self._session, key)
+
+    def __setattr__(self, key, value):
+        setattr(self._session, key, value)
+
+    def run_in_executor(self, fn, *args, **kwargs):
+        '''run_in_executor
+
+        Schedules fn(*args, **kwargs) on the executor of this session and returns an awaitable for its result.
+        Use it to call methods that do not have an asyncio variant without blocking the event loop.
+        '''
+        return asyncio.wrap_future(self._executor.submit(fn, *args, **kwargs))
+
+% for func_name in sorted({k: v for k, v in blocking_functions.items() if v['render_in_session_base']}):
+% for method_template in blocking_functions[func_name]['method_templates']:
+${blocking_method(blocking_functions[func_name], method_template)}\
+% endfor
+% endfor
+
+class Session(_SessionBase):
+    '''asyncio variant of ${module_name}.Session'''
+
+    def __init__(${init_method_params}, executor=None):
+        '''asyncio variant of ${module_name}.Session
+
+        Opens the session synchronously; see ${module_name}.Session for the parameters.
+
+        Args:
+            executor (concurrent.futures.Executor): Executor that runs the blocking calls. Defaults to the worker
+                thread of the session. Pass a shared executor to bound the number of threads used by many sessions.
+        '''
+        session = _session.Session(${init_call_params})
+        super(Session, self).__init__(session, session.executor if executor is None else executor)
+
+        # Instantiate any repeated capability objects
+% for rep_cap in config['repeated_capabilities']:
+        object.__setattr__(self, '${rep_cap['python_name']}', _RepeatedCapabilities(session.${rep_cap['python_name']}, self._executor))
+% endfor
+
+    def __aenter__(self):
+        return asyncio.sleep(0, result=self)
+
+    def __aexit__(self, exc_type, exc_value, traceback):
+        return self.close()
+
+    def close(self):
+        '''close
+
+        Closes the session and returns an awaitable. Pending calls on the session executor complete first.
+        '''
+        # close() waits for the worker thread of the session, so it cannot run on it
+        return asyncio.get_event_loop().run_in_executor(None, self._session.close)
+
+% for func_name in sorted({k: v for k, v in blocking_functions.items() if not v['render_in_session_base']}):
+% for method_template in blocking_functions[func_name]['method_templates']:
+${blocking_method(blocking_functions[func_name], method_template)}\
+% endfor
+% endfor
+
@@ -10,7 +10,7 @@ c_function_prefix = config['c_function_prefix']
 driver_name = config['driver_name']
 
 functions = config['functions']
-functions = helper.filter_codegen_functions(functions)
+functions = helper.filter_library_functions(functions)
 %>\
 
 import ctypes
@@ -28,8 +28,23 @@ class Library(object):
 
     Wrapper around driver library.
     Class will setup the correct ctypes information for every function on first call.
+
+    Binding uses double-checked locking: _func_lock is only taken the first time a function
+    is called. Call bind_all_functions() to bind every function up front, after which no
+    call into the driver takes a Python-side lock.
     '''
 
+    # ctypes prototype (argtypes, restype) of every function in the driver library
+    _prototypes = {
+% for func_name in sorted(functions):
+<%
+    f = functions[func_name]
+    param_ctypes_library = helper.get_params_snippet(f, helper.ParameterUsageOptions.CTYPES_ARGTYPES)
+%>\
+        '${c_function_prefix}${func_name}': ([${param_ctypes_library}], ${f['returns']}),  # noqa: F405
+% endfor
+    }
+
     def __init__(self, ctypes_library):
         self._func_lock = threading.Lock()
         self._library = ctypes_library
@@ -37,21 +52,39 @@ class Library(object):
 % for func_name in sorted(functions):
         self.${c_function_prefix}${func_name}_cfunc = None
 % endfor
+
+    def _bind_function(self, c_func_name):
+        with self._func_lock:
+            cfunc = getattr(self, c_func_name + '_cfunc')
+            if cfunc is None:
+                cfunc = getattr(self._library, c_func_name)
+                cfunc.argtypes, cfunc.restype = self._prototypes[c_func_name]
+                # Only publish the cfunc once it is fully typed, other threads read it without the lock
+                setattr(self, c_func_name + '_cfunc', cfunc)
+        return cfunc
+
+    def bind_all_functions(self):
+        '''bind_all_functions
+
+        Resolves and sets up the ctypes information for every function in the driver library.
+        Functions not exported by the driver runtime are left unbound and raise on first call.
+        '''
+        for c_func_name in sorted(self._prototypes):
+            try:
+                self._bind_function(c_func_name)
+            except AttributeError:
+                pass
 % for func_name in sorted(functions):
 <%
     f = functions[func_name]
     c_func_name = c_function_prefix + func_name
-    params = f['parameters']
     param_names_method = helper.get_params_snippet(f, helper.ParameterUsageOptions.LIBRARY_METHOD_DECLARATION)
     param_names_library = helper.get_params_snippet(f, helper.ParameterUsageOptions.CTYPES_CALL)
-    param_ctypes_library = helper.get_params_snippet(f, helper.ParameterUsageOptions.CTYPES_ARGTYPES)
 %>\
 
     def ${c_func_name}(${param_names_method}):  # noqa: N802
-        with self._func_lock:
-            if self.${c_func_name}_cfunc is None:
-                self.${c_func_name}_cfunc = self._library.${c_func_name}
-                self.${c_func_name}_cfunc.argtypes = [${param_ctypes_library}]  # noqa: F405
-                self.${c_func_name}_cfunc.restype = ${f['returns']}  # noqa: F405
-        return self.${c_func_name}_cfunc(${param_names_library})
+        cfunc = self.${c_func_name}_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('${c_func_name}')
+        return cfunc(${param_names_library})
 % endfor
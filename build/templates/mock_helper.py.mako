@@ -11,7 +11,7 @@ c_function_prefix = config['c_function_prefix']
 driver_name = config['driver_name']
 
 functions = template_parameters['metadata'].functions
-functions = helper.filter_codegen_functions(functions)
+functions = helper.filter_library_functions(functions)
 %>\
 import sys  # noqa: F401   - Not all mock_helpers will need this
 
@@ -29,7 +29,7 @@ class MockFunctionCallError(Exception):
 class SideEffectsHelper(object):
     def __init__(self):
         self._defaults = {}
-% for func_name in sorted(helper.filter_codegen_functions(functions)):
+% for func_name in sorted(helper.filter_library_functions(functions)):
 <%
 f = functions[func_name]
 %>\
@@ -52,7 +52,7 @@ ivi_dance_param = helper.filter_ivi_dance_parameter(f)
     def __setitem__(self, func, val):
         self._defaults[func] = val
 
-% for func_name in sorted(helper.filter_codegen_functions(functions)):
+% for func_name in sorted(helper.filter_library_functions(functions)):
 <%
 f = functions[func_name]
 params = f['parameters']
@@ -121,7 +121,7 @@ if p['use_array']:
 % endfor
     # Helper function to setup Mock object with default side effects and return values
     def set_side_effects_and_return_values(self, mock_library):
-% for func_name in sorted(helper.filter_codegen_functions(functions)):
+% for func_name in sorted(helper.filter_library_functions(functions)):
 <%
 f = functions[func_name]
 %>\
@@ -0,0 +1,14 @@
+<%page args="f, config, method_template"/>\
+<%
+    '''Renders a Session method that returns the result of a method without parameters from the session attribute cache.'''
+
+    suffix = method_template['method_python_name_suffix']
+%>\
+    def ${f['python_name']}${suffix}(self):
+        '''${f['python_name']}${suffix}
+
+        Returns the result of ${f['python_name']}(). When the attribute cache is enabled, the result is kept
+        until a method or property that can change it clears the cache, see attribute_cache_enabled.
+        '''
+        return self._attribute_cache.get(self._repeated_capability, '${f['python_name']}', lambda _: self.${f['python_name']}())
+
@@ -23,6 +23,9 @@
 % for parameter in enum_input_parameters:
         ${helper.get_enum_type_check_snippet(parameter, indent=12)}
 % endfor
+% for variable_name, python_code in f['python_code_variables']:
+        ${variable_name} = ${python_code}
+% endfor
 % for p in helper.filter_parameters(f, helper.ParameterUsageOptions.LIBRARY_METHOD_CALL):
 <% ivi_dance_step = helper.IviDanceStep.QUERY_SIZE if (p == ivi_dance_parameter or p == ivi_dance_size_parameter) else helper.IviDanceStep.NOT_APPLICABLE %>\
 %   for declaration in helper.get_ctype_variable_declaration_snippet(p, parameters, ivi_dance_step, config):
@@ -41,6 +44,9 @@
 %   endfor
 % endif
         error_code = self._library.${c_function_prefix}${f['name']}(${helper.get_params_snippet(f, helper.ParameterUsageOptions.LIBRARY_METHOD_CALL)})
+% if f['invalidates_attribute_cache']:
+        self._attribute_cache.clear()
+% endif
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=${f['is_error_handling']})
         ${helper.get_method_return_snippet(parameters, config)}
 
@@ -0,0 +1,19 @@
+<%page args="f, config, method_template"/>\
+<%
+    '''Renders a Session method that calls a method without parameters once per object and returns the saved result afterwards.'''
+
+    suffix = method_template['method_python_name_suffix']
+%>\
+    def ${f['python_name']}${suffix}(self):
+        '''${f['python_name']}${suffix}
+
+        Returns the result of ${f['python_name']}(). Only use this for methods whose result depends on nothing but the
+        repeated capability of the object, which does not change. The method is called the first time and its result is
+        returned on every later call.
+        '''
+        try:
+            return self._memoized_results['${f['python_name']}']
+        except KeyError:
+            result = self._memoized_results['${f['python_name']}'] = self.${f['python_name']}()
+            return result
+
@@ -8,8 +8,13 @@
     c_function_prefix = config['c_function_prefix']
     enum_input_parameters = helper.filter_parameters(f, helper.ParameterUsageOptions.INPUT_ENUM_PARAMETERS)
     suffix = method_template['method_python_name_suffix']
+    # Callers that already computed the python_code_variables can pass them in as keyword arguments
+    python_code_variables_as_parameters = method_template.get('python_code_variables_as_parameters', False)
+    params_snippet = helper.get_params_snippet(f, helper.ParameterUsageOptions.SESSION_NUMPY_INTO_METHOD_DECLARATION)
+    if python_code_variables_as_parameters:
+        params_snippet += ''.join(', {0}=None'.format(variable_name) for variable_name, _ in f['python_code_variables'])
 %>\
-    def ${f['python_name']}${suffix}(${helper.get_params_snippet(f, helper.ParameterUsageOptions.SESSION_NUMPY_INTO_METHOD_DECLARATION)}):
+    def ${f['python_name']}${suffix}(${params_snippet}):
         '''${f['python_name']}
 
         ${helper.get_function_docstring(f, True, config, indent=8)}
@@ -19,6 +24,9 @@
 % for parameter in enum_input_parameters:
         ${helper.get_enum_type_check_snippet(parameter, indent=12)}
 % endfor
+<%
+size_params_set = []
+%>\
 % for parameter in helper.filter_parameters(f, helper.ParameterUsageOptions.NUMPY_PARAMETERS):
         if type(${parameter['python_name']}) is not numpy.ndarray:
             raise TypeError('${parameter['python_name']} must be {0}, is {1}'.format(numpy.ndarray, type(${parameter['python_name']})))
@@ -31,17 +39,49 @@ size_param = None
 if parameter['size']['mechanism'] == 'passed-in':
     size_param = helper.find_size_parameter(parameter, f['parameters'])
 %>\
-% if size_param:
+% if size_param and size_param['python_name'] in size_params_set:
+        if len(${parameter['python_name']}) != ${size_param['python_name']}:
+            raise ValueError('${parameter['python_name']} must have the same length as the other buffers, {0}, is {1}'.format(${size_param['python_name']}, len(${parameter['python_name']})))
+
+% elif size_param:
+<%
+size_params_set.append(size_param['python_name'])
+%>\
         ${size_param['python_name']} = len(${parameter['python_name']})
 
 % endif
 % endfor
+% for variable_name, python_code in f['python_code_variables']:
+%   if python_code_variables_as_parameters:
+        if ${variable_name} is None:
+            ${variable_name} = ${python_code}
+%   else:
+        ${variable_name} = ${python_code}
+%   endif
+% endfor
+% for parameter in helper.filter_parameters(f, helper.ParameterUsageOptions.NUMPY_PARAMETERS):
+%   if parameter['size']['mechanism'] == 'python-code':
+        if ${parameter['python_name']}.size < ${parameter['size']['value']}:
+            raise ValueError('${parameter['python_name']} must have at least {0} elements, has {1}'.format(${parameter['size']['value']}, ${parameter['python_name']}.size))
+%   endif
+% endfor
 % for parameter in helper.filter_parameters(f, helper.ParameterUsageOptions.LIBRARY_METHOD_CALL):
 %   for declaration in helper.get_ctype_variable_declaration_snippet(parameter, parameters, None, config, use_numpy_array=parameter['numpy']):
         ${declaration}
 %   endfor
 % endfor
         error_code = self._library.${c_function_prefix}${f['name']}(${helper.get_params_snippet(f, helper.ParameterUsageOptions.LIBRARY_METHOD_CALL)})
+% if f['invalidates_attribute_cache']:
+        self._attribute_cache.clear()
+% endif
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=${f['is_error_handling']})
+% for parameter in helper.filter_parameters(f, helper.ParameterUsageOptions.NUMPY_PARAMETERS):
+<%
+copy_back = helper.get_numpy_copy_back_snippet(parameter)
+%>\
+%   if copy_back:
+        ${copy_back}
+%   endif
+% endfor
         ${helper.get_method_return_snippet(parameters, config, use_numpy_array=True)}
 
@@ -16,6 +16,12 @@ ${helper.get_rst_header_snippet(module_name + '.Session', '=')}
 
    ${helper.get_indented_docstring_snippet(config['session_class_description'], indent=3)}
 
+% if any(f['blocking'] for f in functions.values()):
+   **Thread safety**
+
+   ${helper.get_indented_docstring_snippet(helper.session_thread_safety_text, indent=3)}
+
+% endif
 <%
 table_contents = []
 table_contents.append(('Property', 'Datatype'))
@@ -4,5 +4,6 @@
 from nidcpower.enums import *          # noqa: F403,F401,H303
 from nidcpower.errors import Error     # noqa: F401
 from nidcpower.errors import NidcpowerWarning   # noqa: F401
+from nidcpower.errors import WarningPolicy   # noqa: F401
 from nidcpower.session import Session  # noqa: F401
 
@@ -11,8 +11,67 @@ class Library(object):
 
     Wrapper around driver library.
     Class will setup the correct ctypes information for every function on first call.
+
+    Binding uses double-checked locking: _func_lock is only taken the first time a function
+    is called. Call bind_all_functions() to bind every function up front, after which no
+    call into the driver takes a Python-side lock.
     '''
 
+    # ctypes prototype (argtypes, restype) of every function in the driver library
+    _prototypes = {
+        'niDCPower_Abort': ([ViSession], ViStatus),  # noqa: F405
+        'niDCPower_Commit': ([ViSession], ViStatus),  # noqa: F405
+        'niDCPower_ConfigureApertureTime': ([ViSession, ctypes.POINTER(ViChar), ViReal64, ViInt32], ViStatus),  # noqa: F405
+        'niDCPower_ConfigureDigitalEdgeMeasureTrigger': ([ViSession, ctypes.POINTER(ViChar), ViInt32], ViStatus),  # noqa: F405
+        'niDCPower_ConfigureDigitalEdgePulseTrigger': ([ViSession, ctypes.POINTER(ViChar), ViInt32], ViStatus),  # noqa: F405
+        'niDCPower_ConfigureDigitalEdgeSequenceAdvanceTrigger': ([ViSession, ctypes.POINTER(ViChar), ViInt32], ViStatus),  # noqa: F405
+        'niDCPower_ConfigureDigitalEdgeSourceTrigger': ([ViSession, ctypes.POINTER(ViChar), ViInt32], ViStatus),  # noqa: F405
+        'niDCPower_ConfigureDigitalEdgeStartTrigger': ([ViSession, ctypes.POINTER(ViChar), ViInt32], ViStatus),  # noqa: F405
+        'niDCPower_CreateAdvancedSequence': ([ViSession, ctypes.POINTER(ViChar), ViInt32, ctypes.POINTER(ViInt32), ViBoolean], ViStatus),  # noqa: F405
+        'niDCPower_CreateAdvancedSequenceStep': ([ViSession, ViBoolean], ViStatus),  # noqa: F405
+        'niDCPower_DeleteAdvancedSequence': ([ViSession, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niDCPower_Disable': ([ViSession], ViStatus),  # noqa: F405
+        'niDCPower_ExportSignal': ([ViSession, ViInt32, ctypes.POINTER(ViChar), ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niDCPower_FetchMultiple': ([ViSession, ctypes.POINTER(ViChar), ViReal64, ViInt32, ctypes.POINTER(ViReal64), ctypes.POINTER(ViReal64), ctypes.POINTER(ViBoolean), ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niDCPower_GetAttributeViBoolean': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViBoolean)], ViStatus),  # noqa: F405
+        'niDCPower_GetAttributeViInt32': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niDCPower_GetAttributeViInt64': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViInt64)], ViStatus),  # noqa: F405
+        'niDCPower_GetAttributeViReal64': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niDCPower_GetAttributeViString': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ViInt32, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niDCPower_GetChannelName': ([ViSession, ViInt32, ViInt32, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niDCPower_GetError': ([ViSession, ctypes.POINTER(ViStatus), ViInt32, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niDCPower_GetExtCalLastDateAndTime': ([ViSession, ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niDCPower_GetExtCalLastTemp': ([ViSession, ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niDCPower_GetExtCalRecommendedInterval': ([ViSession, ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niDCPower_GetSelfCalLastDateAndTime': ([ViSession, ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niDCPower_GetSelfCalLastTemp': ([ViSession, ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niDCPower_InitializeWithChannels': ([ctypes.POINTER(ViChar), ctypes.POINTER(ViChar), ViBoolean, ctypes.POINTER(ViChar), ctypes.POINTER(ViSession)], ViStatus),  # noqa: F405
+        'niDCPower_Initiate': ([ViSession], ViStatus),  # noqa: F405
+        'niDCPower_Measure': ([ViSession, ctypes.POINTER(ViChar), ViInt32, ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niDCPower_MeasureMultiple': ([ViSession, ctypes.POINTER(ViChar), ctypes.POINTER(ViReal64), ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niDCPower_ParseChannelCount': ([ViSession, ctypes.POINTER(ViChar), ctypes.POINTER(ViUInt32)], ViStatus),  # noqa: F405
+        'niDCPower_QueryInCompliance': ([ViSession, ctypes.POINTER(ViChar), ctypes.POINTER(ViBoolean)], ViStatus),  # noqa: F405
+        'niDCPower_QueryMaxCurrentLimit': ([ViSession, ctypes.POINTER(ViChar), ViReal64, ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niDCPower_QueryMaxVoltageLevel': ([ViSession, ctypes.POINTER(ViChar), ViReal64, ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niDCPower_QueryMinCurrentLimit': ([ViSession, ctypes.POINTER(ViChar), ViReal64, ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niDCPower_QueryOutputState': ([ViSession, ctypes.POINTER(ViChar), ViInt32, ctypes.POINTER(ViBoolean)], ViStatus),  # noqa: F405
+        'niDCPower_ReadCurrentTemperature': ([ViSession, ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niDCPower_ResetDevice': ([ViSession], ViStatus),  # noqa: F405
+        'niDCPower_ResetWithDefaults': ([ViSession], ViStatus),  # noqa: F405
+        'niDCPower_SendSoftwareEdgeTrigger': ([ViSession, ViInt32], ViStatus),  # noqa: F405
+        'niDCPower_SetAttributeViBoolean': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ViBoolean], ViStatus),  # noqa: F405
+        'niDCPower_SetAttributeViInt32': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ViInt32], ViStatus),  # noqa: F405
+        'niDCPower_SetAttributeViInt64': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ViInt64], ViStatus),  # noqa: F405
+        'niDCPower_SetAttributeViReal64': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ViReal64], ViStatus),  # noqa: F405
+        'niDCPower_SetAttributeViString': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niDCPower_SetSequence': ([ViSession, ctypes.POINTER(ViChar), ctypes.POINTER(ViReal64), ctypes.POINTER(ViReal64), ViUInt32], ViStatus),  # noqa: F405
+        'niDCPower_WaitForEvent': ([ViSession, ViInt32, ViReal64], ViStatus),  # noqa: F405
+        'niDCPower_close': ([ViSession], ViStatus),  # noqa: F405
+        'niDCPower_error_message': ([ViSession, ViStatus, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niDCPower_reset': ([ViSession], ViStatus),  # noqa: F405
+        'niDCPower_self_test': ([ViSession, ctypes.POINTER(ViInt16), ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+    }
+
     def __init__(self, ctypes_library):
         self._func_lock = threading.Lock()
         self._library = ctypes_library
@@ -41,8 +100,6 @@ class Library(object):
         self.niDCPower_GetExtCalLastDateAndTime_cfunc = None
         self.niDCPower_GetExtCalLastTemp_cfunc = None
         self.niDCPower_GetExtCalRecommendedInterval_cfunc = None
-        self.niDCPower_GetLastExtCalLastDateAndTime_cfunc = None
-        self.niDCPower_GetLastSelfCalLastDateAndTime_cfunc = None
         self.niDCPower_GetSelfCalLastDateAndTime_cfunc = None
         self.niDCPower_GetSelfCalLastTemp_cfunc = None
         self.niDCPower_InitializeWithChannels_cfunc = None
@@ -71,426 +128,330 @@ class Library(object):
         self.niDCPower_reset_cfunc = None
         self.niDCPower_self_test_cfunc = None
 
-    def niDCPower_Abort(self, vi):  # noqa: N802
+    def _bind_function(self, c_func_name):
         with self._func_lock:
-            if self.niDCPower_Abort_cfunc is None:
-                self.niDCPower_Abort_cfunc = self._library.niDCPower_Abort
-                self.niDCPower_Abort_cfunc.argtypes = [ViSession]  # noqa: F405
-                self.niDCPower_Abort_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_Abort_cfunc(vi)
+            cfunc = getattr(self, c_func_name + '_cfunc')
+            if cfunc is None:
+                cfunc = getattr(self._library, c_func_name)
+                cfunc.argtypes, cfunc.restype = self._prototypes[c_func_name]
+                # Only publish the cfunc once it is fully typed, other threads read it without the lock
+                setattr(self, c_func_name + '_cfunc', cfunc)
+        return cfunc
+
+    def bind_all_functions(self):
+        '''bind_all_functions
+
+        Resolves and sets up the ctypes information for every function in the driver library.
+        Functions not exported by the driver runtime are left unbound and raise on first call.
+        '''
+        for c_func_name in sorted(self._prototypes):
+            try:
+                self._bind_function(c_func_name)
+            except AttributeError:
+                pass
+
+    def niDCPower_Abort(self, vi):  # noqa: N802
+        cfunc = self.niDCPower_Abort_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_Abort')
+        return cfunc(vi)
 
     def niDCPower_Commit(self, vi):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_Commit_cfunc is None:
-                self.niDCPower_Commit_cfunc = self._library.niDCPower_Commit
-                self.niDCPower_Commit_cfunc.argtypes = [ViSession]  # noqa: F405
-                self.niDCPower_Commit_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_Commit_cfunc(vi)
+        cfunc = self.niDCPower_Commit_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_Commit')
+        return cfunc(vi)
 
     def niDCPower_ConfigureApertureTime(self, vi, channel_name, aperture_time, units):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_ConfigureApertureTime_cfunc is None:
-                self.niDCPower_ConfigureApertureTime_cfunc = self._library.niDCPower_ConfigureApertureTime
-                self.niDCPower_ConfigureApertureTime_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViReal64, ViInt32]  # noqa: F405
-                self.niDCPower_ConfigureApertureTime_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_ConfigureApertureTime_cfunc(vi, channel_name, aperture_time, units)
+        cfunc = self.niDCPower_ConfigureApertureTime_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_ConfigureApertureTime')
+        return cfunc(vi, channel_name, aperture_time, units)
 
     def niDCPower_ConfigureDigitalEdgeMeasureTrigger(self, vi, input_terminal, edge):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_ConfigureDigitalEdgeMeasureTrigger_cfunc is None:
-                self.niDCPower_ConfigureDigitalEdgeMeasureTrigger_cfunc = self._library.niDCPower_ConfigureDigitalEdgeMeasureTrigger
-                self.niDCPower_ConfigureDigitalEdgeMeasureTrigger_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViInt32]  # noqa: F405
-                self.niDCPower_ConfigureDigitalEdgeMeasureTrigger_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_ConfigureDigitalEdgeMeasureTrigger_cfunc(vi, input_terminal, edge)
+        cfunc = self.niDCPower_ConfigureDigitalEdgeMeasureTrigger_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_ConfigureDigitalEdgeMeasureTrigger')
+        return cfunc(vi, input_terminal, edge)
 
     def niDCPower_ConfigureDigitalEdgePulseTrigger(self, vi, input_terminal, edge):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_ConfigureDigitalEdgePulseTrigger_cfunc is None:
-                self.niDCPower_ConfigureDigitalEdgePulseTrigger_cfunc = self._library.niDCPower_ConfigureDigitalEdgePulseTrigger
-                self.niDCPower_ConfigureDigitalEdgePulseTrigger_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViInt32]  # noqa: F405
-                self.niDCPower_ConfigureDigitalEdgePulseTrigger_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_ConfigureDigitalEdgePulseTrigger_cfunc(vi, input_terminal, edge)
+        cfunc = self.niDCPower_ConfigureDigitalEdgePulseTrigger_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_ConfigureDigitalEdgePulseTrigger')
+        return cfunc(vi, input_terminal, edge)
 
     def niDCPower_ConfigureDigitalEdgeSequenceAdvanceTrigger(self, vi, input_terminal, edge):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_ConfigureDigitalEdgeSequenceAdvanceTrigger_cfunc is None:
-                self.niDCPower_ConfigureDigitalEdgeSequenceAdvanceTrigger_cfunc = self._library.niDCPower_ConfigureDigitalEdgeSequenceAdvanceTrigger
-                self.niDCPower_ConfigureDigitalEdgeSequenceAdvanceTrigger_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViInt32]  # noqa: F405
-                self.niDCPower_ConfigureDigitalEdgeSequenceAdvanceTrigger_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_ConfigureDigitalEdgeSequenceAdvanceTrigger_cfunc(vi, input_terminal, edge)
+        cfunc = self.niDCPower_ConfigureDigitalEdgeSequenceAdvanceTrigger_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_ConfigureDigitalEdgeSequenceAdvanceTrigger')
+        return cfunc(vi, input_terminal, edge)
 
     def niDCPower_ConfigureDigitalEdgeSourceTrigger(self, vi, input_terminal, edge):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_ConfigureDigitalEdgeSourceTrigger_cfunc is None:
-                self.niDCPower_ConfigureDigitalEdgeSourceTrigger_cfunc = self._library.niDCPower_ConfigureDigitalEdgeSourceTrigger
-                self.niDCPower_ConfigureDigitalEdgeSourceTrigger_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViInt32]  # noqa: F405
-                self.niDCPower_ConfigureDigitalEdgeSourceTrigger_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_ConfigureDigitalEdgeSourceTrigger_cfunc(vi, input_terminal, edge)
+        cfunc = self.niDCPower_ConfigureDigitalEdgeSourceTrigger_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_ConfigureDigitalEdgeSourceTrigger')
+        return cfunc(vi, input_terminal, edge)
 
     def niDCPower_ConfigureDigitalEdgeStartTrigger(self, vi, input_terminal, edge):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_ConfigureDigitalEdgeStartTrigger_cfunc is None:
-                self.niDCPower_ConfigureDigitalEdgeStartTrigger_cfunc = self._library.niDCPower_ConfigureDigitalEdgeStartTrigger
-                self.niDCPower_ConfigureDigitalEdgeStartTrigger_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViInt32]  # noqa: F405
-                self.niDCPower_ConfigureDigitalEdgeStartTrigger_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_ConfigureDigitalEdgeStartTrigger_cfunc(vi, input_terminal, edge)
+        cfunc = self.niDCPower_ConfigureDigitalEdgeStartTrigger_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_ConfigureDigitalEdgeStartTrigger')
+        return cfunc(vi, input_terminal, edge)
 
     def niDCPower_CreateAdvancedSequence(self, vi, sequence_name, attribute_id_count, attribute_ids, set_as_active_sequence):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_CreateAdvancedSequence_cfunc is None:
-                self.niDCPower_CreateAdvancedSequence_cfunc = self._library.niDCPower_CreateAdvancedSequence
-                self.niDCPower_CreateAdvancedSequence_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViInt32, ctypes.POINTER(ViInt32), ViBoolean]  # noqa: F405
-                self.niDCPower_CreateAdvancedSequence_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_CreateAdvancedSequence_cfunc(vi, sequence_name, attribute_id_count, attribute_ids, set_as_active_sequence)
+        cfunc = self.niDCPower_CreateAdvancedSequence_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_CreateAdvancedSequence')
+        return cfunc(vi, sequence_name, attribute_id_count, attribute_ids, set_as_active_sequence)
 
     def niDCPower_CreateAdvancedSequenceStep(self, vi, set_as_active_step):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_CreateAdvancedSequenceStep_cfunc is None:
-                self.niDCPower_CreateAdvancedSequenceStep_cfunc = self._library.niDCPower_CreateAdvancedSequenceStep
-                self.niDCPower_CreateAdvancedSequenceStep_cfunc.argtypes = [ViSession, ViBoolean]  # noqa: F405
-                self.niDCPower_CreateAdvancedSequenceStep_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_CreateAdvancedSequenceStep_cfunc(vi, set_as_active_step)
+        cfunc = self.niDCPower_CreateAdvancedSequenceStep_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_CreateAdvancedSequenceStep')
+        return cfunc(vi, set_as_active_step)
 
     def niDCPower_DeleteAdvancedSequence(self, vi, sequence_name):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_DeleteAdvancedSequence_cfunc is None:
-                self.niDCPower_DeleteAdvancedSequence_cfunc = self._library.niDCPower_DeleteAdvancedSequence
-                self.niDCPower_DeleteAdvancedSequence_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar)]  # noqa: F405
-                self.niDCPower_DeleteAdvancedSequence_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_DeleteAdvancedSequence_cfunc(vi, sequence_name)
+        cfunc = self.niDCPower_DeleteAdvancedSequence_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_DeleteAdvancedSequence')
+        return cfunc(vi, sequence_name)
 
     def niDCPower_Disable(self, vi):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_Disable_cfunc is None:
-                self.niDCPower_Disable_cfunc = self._library.niDCPower_Disable
-                self.niDCPower_Disable_cfunc.argtypes = [ViSession]  # noqa: F405
-                self.niDCPower_Disable_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_Disable_cfunc(vi)
+        cfunc = self.niDCPower_Disable_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_Disable')
+        return cfunc(vi)
 
     def niDCPower_ExportSignal(self, vi, signal, signal_identifier, output_terminal):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_ExportSignal_cfunc is None:
-                self.niDCPower_ExportSignal_cfunc = self._library.niDCPower_ExportSignal
-                self.niDCPower_ExportSignal_cfunc.argtypes = [ViSession, ViInt32, ctypes.POINTER(ViChar), ctypes.POINTER(ViChar)]  # noqa: F405
-                self.niDCPower_ExportSignal_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_ExportSignal_cfunc(vi, signal, signal_identifier, output_terminal)
+        cfunc = self.niDCPower_ExportSignal_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_ExportSignal')
+        return cfunc(vi, signal, signal_identifier, output_terminal)
 
     def niDCPower_FetchMultiple(self, vi, channel_name, timeout, count, voltage_measurements, current_measurements, in_compliance, actual_count):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_FetchMultiple_cfunc is None:
-                self.niDCPower_FetchMultiple_cfunc = self._library.niDCPower_FetchMultiple
-                self.niDCPower_FetchMultiple_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViReal64, ViInt32, ctypes.POINTER(ViReal64), ctypes.POINTER(ViReal64), ctypes.POINTER(ViBoolean), ctypes.POINTER(ViInt32)]  # noqa: F405
-                self.niDCPower_FetchMultiple_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_FetchMultiple_cfunc(vi, channel_name, timeout, count, voltage_measurements, current_measurements, in_compliance, actual_count)
+        cfunc = self.niDCPower_FetchMultiple_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_FetchMultiple')
+        return cfunc(vi, channel_name, timeout, count, voltage_measurements, current_measurements, in_compliance, actual_count)
 
     def niDCPower_GetAttributeViBoolean(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_GetAttributeViBoolean_cfunc is None:
-                self.niDCPower_GetAttributeViBoolean_cfunc = self._library.niDCPower_GetAttributeViBoolean
-                self.niDCPower_GetAttributeViBoolean_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViBoolean)]  # noqa: F405
-                self.niDCPower_GetAttributeViBoolean_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_GetAttributeViBoolean_cfunc(vi, channel_name, attribute_id, attribute_value)
+        cfunc = self.niDCPower_GetAttributeViBoolean_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_GetAttributeViBoolean')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
 
     def niDCPower_GetAttributeViInt32(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_GetAttributeViInt32_cfunc is None:
-                self.niDCPower_GetAttributeViInt32_cfunc = self._library.niDCPower_GetAttributeViInt32
-                self.niDCPower_GetAttributeViInt32_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViInt32)]  # noqa: F405
-                self.niDCPower_GetAttributeViInt32_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_GetAttributeViInt32_cfunc(vi, channel_name, attribute_id, attribute_value)
+        cfunc = self.niDCPower_GetAttributeViInt32_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_GetAttributeViInt32')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
 
     def niDCPower_GetAttributeViInt64(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_GetAttributeViInt64_cfunc is None:
-                self.niDCPower_GetAttributeViInt64_cfunc = self._library.niDCPower_GetAttributeViInt64
-                self.niDCPower_GetAttributeViInt64_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViInt64)]  # noqa: F405
-                self.niDCPower_GetAttributeViInt64_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_GetAttributeViInt64_cfunc(vi, channel_name, attribute_id, attribute_value)
+        cfunc = self.niDCPower_GetAttributeViInt64_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_GetAttributeViInt64')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
 
     def niDCPower_GetAttributeViReal64(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_GetAttributeViReal64_cfunc is None:
-                self.niDCPower_GetAttributeViReal64_cfunc = self._library.niDCPower_GetAttributeViReal64
-                self.niDCPower_GetAttributeViReal64_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViReal64)]  # noqa: F405
-                self.niDCPower_GetAttributeViReal64_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_GetAttributeViReal64_cfunc(vi, channel_name, attribute_id, attribute_value)
+        cfunc = self.niDCPower_GetAttributeViReal64_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_GetAttributeViReal64')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
 
     def niDCPower_GetAttributeViString(self, vi, channel_name, attribute_id, buffer_size, attribute_value):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_GetAttributeViString_cfunc is None:
-                self.niDCPower_GetAttributeViString_cfunc = self._library.niDCPower_GetAttributeViString
-                self.niDCPower_GetAttributeViString_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ViInt32, ctypes.POINTER(ViChar)]  # noqa: F405
-                self.niDCPower_GetAttributeViString_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_GetAttributeViString_cfunc(vi, channel_name, attribute_id, buffer_size, attribute_value)
+        cfunc = self.niDCPower_GetAttributeViString_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_GetAttributeViString')
+        return cfunc(vi, channel_name, attribute_id, buffer_size, attribute_value)
 
     def niDCPower_GetChannelName(self, vi, index, buffer_size, channel_name):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_GetChannelName_cfunc is None:
-                self.niDCPower_GetChannelName_cfunc = self._library.niDCPower_GetChannelName
-                self.niDCPower_GetChannelName_cfunc.argtypes = [ViSession, ViInt32, ViInt32, ctypes.POINTER(ViChar)]  # noqa: F405
-                self.niDCPower_GetChannelName_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_GetChannelName_cfunc(vi, index, buffer_size, channel_name)
+        cfunc = self.niDCPower_GetChannelName_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_GetChannelName')
+        return cfunc(vi, index, buffer_size, channel_name)
 
     def niDCPower_GetError(self, vi, code, buffer_size, description):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_GetError_cfunc is None:
-                self.niDCPower_GetError_cfunc = self._library.niDCPower_GetError
-                self.niDCPower_GetError_cfunc.argtypes = [ViSession, ctypes.POINTER(ViStatus), ViInt32, ctypes.POINTER(ViChar)]  # noqa: F405
-                self.niDCPower_GetError_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_GetError_cfunc(vi, code, buffer_size, description)
+        cfunc = self.niDCPower_GetError_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_GetError')
+        return cfunc(vi, code, buffer_size, description)
 
     def niDCPower_GetExtCalLastDateAndTime(self, vi, year, month, day, hour, minute):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_GetExtCalLastDateAndTime_cfunc is None:
-                self.niDCPower_GetExtCalLastDateAndTime_cfunc = self._library.niDCPower_GetExtCalLastDateAndTime
-                self.niDCPower_GetExtCalLastDateAndTime_cfunc.argtypes = [ViSession, ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32)]  # noqa: F405
-                self.niDCPower_GetExtCalLastDateAndTime_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_GetExtCalLastDateAndTime_cfunc(vi, year, month, day, hour, minute)
+        cfunc = self.niDCPower_GetExtCalLastDateAndTime_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_GetExtCalLastDateAndTime')
+        return cfunc(vi, year, month, day, hour, minute)
 
     def niDCPower_GetExtCalLastTemp(self, vi, temperature):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_GetExtCalLastTemp_cfunc is None:
-                self.niDCPower_GetExtCalLastTemp_cfunc = self._library.niDCPower_GetExtCalLastTemp
-                self.niDCPower_GetExtCalLastTemp_cfunc.argtypes = [ViSession, ctypes.POINTER(ViReal64)]  # noqa: F405
-                self.niDCPower_GetExtCalLastTemp_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_GetExtCalLastTemp_cfunc(vi, temperature)
+        cfunc = self.niDCPower_GetExtCalLastTemp_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_GetExtCalLastTemp')
+        return cfunc(vi, temperature)
 
     def niDCPower_GetExtCalRecommendedInterval(self, vi, months):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_GetExtCalRecommendedInterval_cfunc is None:
-                self.niDCPower_GetExtCalRecommendedInterval_cfunc = self._library.niDCPower_GetExtCalRecommendedInterval
-                self.niDCPower_GetExtCalRecommendedInterval_cfunc.argtypes = [ViSession, ctypes.POINTER(ViInt32)]  # noqa: F405
-                self.niDCPower_GetExtCalRecommendedInterval_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_GetExtCalRecommendedInterval_cfunc(vi, months)
-
-    def niDCPower_GetLastExtCalLastDateAndTime(self, vi, month):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_GetLastExtCalLastDateAndTime_cfunc is None:
-                self.niDCPower_GetLastExtCalLastDateAndTime_cfunc = self._library.niDCPower_GetLastExtCalLastDateAndTime
-                self.niDCPower_GetLastExtCalLastDateAndTime_cfunc.argtypes = [ViSession, ctypes.POINTER(datetime.datetime)]  # noqa: F405
-                self.niDCPower_GetLastExtCalLastDateAndTime_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_GetLastExtCalLastDateAndTime_cfunc(vi, month)
-
-    def niDCPower_GetLastSelfCalLastDateAndTime(self, vi, month):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_GetLastSelfCalLastDateAndTime_cfunc is None:
-                self.niDCPower_GetLastSelfCalLastDateAndTime_cfunc = self._library.niDCPower_GetLastSelfCalLastDateAndTime
-                self.niDCPower_GetLastSelfCalLastDateAndTime_cfunc.argtypes = [ViSession, ctypes.POINTER(datetime.datetime)]  # noqa: F405
-                self.niDCPower_GetLastSelfCalLastDateAndTime_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_GetLastSelfCalLastDateAndTime_cfunc(vi, month)
+        cfunc = self.niDCPower_GetExtCalRecommendedInterval_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_GetExtCalRecommendedInterval')
+        return cfunc(vi, months)
 
     def niDCPower_GetSelfCalLastDateAndTime(self, vi, year, month, day, hour, minute):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_GetSelfCalLastDateAndTime_cfunc is None:
-                self.niDCPower_GetSelfCalLastDateAndTime_cfunc = self._library.niDCPower_GetSelfCalLastDateAndTime
-                self.niDCPower_GetSelfCalLastDateAndTime_cfunc.argtypes = [ViSession, ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32)]  # noqa: F405
-                self.niDCPower_GetSelfCalLastDateAndTime_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_GetSelfCalLastDateAndTime_cfunc(vi, year, month, day, hour, minute)
+        cfunc = self.niDCPower_GetSelfCalLastDateAndTime_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_GetSelfCalLastDateAndTime')
+        return cfunc(vi, year, month, day, hour, minute)
 
     def niDCPower_GetSelfCalLastTemp(self, vi, temperature):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_GetSelfCalLastTemp_cfunc is None:
-                self.niDCPower_GetSelfCalLastTemp_cfunc = self._library.niDCPower_GetSelfCalLastTemp
-                self.niDCPower_GetSelfCalLastTemp_cfunc.argtypes = [ViSession, ctypes.POINTER(ViReal64)]  # noqa: F405
-                self.niDCPower_GetSelfCalLastTemp_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_GetSelfCalLastTemp_cfunc(vi, temperature)
+        cfunc = self.niDCPower_GetSelfCalLastTemp_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_GetSelfCalLastTemp')
+        return cfunc(vi, temperature)
 
     def niDCPower_InitializeWithChannels(self, resource_name, channels, reset, option_string, vi):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_InitializeWithChannels_cfunc is None:
-                self.niDCPower_InitializeWithChannels_cfunc = self._library.niDCPower_InitializeWithChannels
-                self.niDCPower_InitializeWithChannels_cfunc.argtypes = [ctypes.POINTER(ViChar), ctypes.POINTER(ViChar), ViBoolean, ctypes.POINTER(ViChar), ctypes.POINTER(ViSession)]  # noqa: F405
-                self.niDCPower_InitializeWithChannels_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_InitializeWithChannels_cfunc(resource_name, channels, reset, option_string, vi)
+        cfunc = self.niDCPower_InitializeWithChannels_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_InitializeWithChannels')
+        return cfunc(resource_name, channels, reset, option_string, vi)
 
     def niDCPower_Initiate(self, vi):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_Initiate_cfunc is None:
-                self.niDCPower_Initiate_cfunc = self._library.niDCPower_Initiate
-                self.niDCPower_Initiate_cfunc.argtypes = [ViSession]  # noqa: F405
-                self.niDCPower_Initiate_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_Initiate_cfunc(vi)
+        cfunc = self.niDCPower_Initiate_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_Initiate')
+        return cfunc(vi)
 
     def niDCPower_Measure(self, vi, channel_name, measurement_type, measurement):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_Measure_cfunc is None:
-                self.niDCPower_Measure_cfunc = self._library.niDCPower_Measure
-                self.niDCPower_Measure_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViInt32, ctypes.POINTER(ViReal64)]  # noqa: F405
-                self.niDCPower_Measure_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_Measure_cfunc(vi, channel_name, measurement_type, measurement)
+        cfunc = self.niDCPower_Measure_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_Measure')
+        return cfunc(vi, channel_name, measurement_type, measurement)
 
     def niDCPower_MeasureMultiple(self, vi, channel_name, voltage_measurements, current_measurements):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_MeasureMultiple_cfunc is None:
-                self.niDCPower_MeasureMultiple_cfunc = self._library.niDCPower_MeasureMultiple
-                self.niDCPower_MeasureMultiple_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ctypes.POINTER(ViReal64), ctypes.POINTER(ViReal64)]  # noqa: F405
-                self.niDCPower_MeasureMultiple_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_MeasureMultiple_cfunc(vi, channel_name, voltage_measurements, current_measurements)
+        cfunc = self.niDCPower_MeasureMultiple_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_MeasureMultiple')
+        return cfunc(vi, channel_name, voltage_measurements, current_measurements)
 
     def niDCPower_ParseChannelCount(self, vi, channels_string, number_of_channels):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_ParseChannelCount_cfunc is None:
-                self.niDCPower_ParseChannelCount_cfunc = self._library.niDCPower_ParseChannelCount
-                self.niDCPower_ParseChannelCount_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ctypes.POINTER(ViUInt32)]  # noqa: F405
-                self.niDCPower_ParseChannelCount_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_ParseChannelCount_cfunc(vi, channels_string, number_of_channels)
+        cfunc = self.niDCPower_ParseChannelCount_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_ParseChannelCount')
+        return cfunc(vi, channels_string, number_of_channels)
 
     def niDCPower_QueryInCompliance(self, vi, channel_name, in_compliance):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_QueryInCompliance_cfunc is None:
-                self.niDCPower_QueryInCompliance_cfunc = self._library.niDCPower_QueryInCompliance
-                self.niDCPower_QueryInCompliance_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ctypes.POINTER(ViBoolean)]  # noqa: F405
-                self.niDCPower_QueryInCompliance_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_QueryInCompliance_cfunc(vi, channel_name, in_compliance)
+        cfunc = self.niDCPower_QueryInCompliance_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_QueryInCompliance')
+        return cfunc(vi, channel_name, in_compliance)
 
     def niDCPower_QueryMaxCurrentLimit(self, vi, channel_name, voltage_level, max_current_limit):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_QueryMaxCurrentLimit_cfunc is None:
-                self.niDCPower_QueryMaxCurrentLimit_cfunc = self._library.niDCPower_QueryMaxCurrentLimit
-                self.niDCPower_QueryMaxCurrentLimit_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViReal64, ctypes.POINTER(ViReal64)]  # noqa: F405
-                self.niDCPower_QueryMaxCurrentLimit_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_QueryMaxCurrentLimit_cfunc(vi, channel_name, voltage_level, max_current_limit)
+        cfunc = self.niDCPower_QueryMaxCurrentLimit_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_QueryMaxCurrentLimit')
+        return cfunc(vi, channel_name, voltage_level, max_current_limit)
 
     def niDCPower_QueryMaxVoltageLevel(self, vi, channel_name, current_limit, max_voltage_level):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_QueryMaxVoltageLevel_cfunc is None:
-                self.niDCPower_QueryMaxVoltageLevel_cfunc = self._library.niDCPower_QueryMaxVoltageLevel
-                self.niDCPower_QueryMaxVoltageLevel_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViReal64, ctypes.POINTER(ViReal64)]  # noqa: F405
-                self.niDCPower_QueryMaxVoltageLevel_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_QueryMaxVoltageLevel_cfunc(vi, channel_name, current_limit, max_voltage_level)
+        cfunc = self.niDCPower_QueryMaxVoltageLevel_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_QueryMaxVoltageLevel')
+        return cfunc(vi, channel_name, current_limit, max_voltage_level)
 
     def niDCPower_QueryMinCurrentLimit(self, vi, channel_name, voltage_level, min_current_limit):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_QueryMinCurrentLimit_cfunc is None:
-                self.niDCPower_QueryMinCurrentLimit_cfunc = self._library.niDCPower_QueryMinCurrentLimit
-                self.niDCPower_QueryMinCurrentLimit_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViReal64, ctypes.POINTER(ViReal64)]  # noqa: F405
-                self.niDCPower_QueryMinCurrentLimit_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_QueryMinCurrentLimit_cfunc(vi, channel_name, voltage_level, min_current_limit)
+        cfunc = self.niDCPower_QueryMinCurrentLimit_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_QueryMinCurrentLimit')
+        return cfunc(vi, channel_name, voltage_level, min_current_limit)
 
     def niDCPower_QueryOutputState(self, vi, channel_name, output_state, in_state):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_QueryOutputState_cfunc is None:
-                self.niDCPower_QueryOutputState_cfunc = self._library.niDCPower_QueryOutputState
-                self.niDCPower_QueryOutputState_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViInt32, ctypes.POINTER(ViBoolean)]  # noqa: F405
-                self.niDCPower_QueryOutputState_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_QueryOutputState_cfunc(vi, channel_name, output_state, in_state)
+        cfunc = self.niDCPower_QueryOutputState_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_QueryOutputState')
+        return cfunc(vi, channel_name, output_state, in_state)
 
     def niDCPower_ReadCurrentTemperature(self, vi, temperature):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_ReadCurrentTemperature_cfunc is None:
-                self.niDCPower_ReadCurrentTemperature_cfunc = self._library.niDCPower_ReadCurrentTemperature
-                self.niDCPower_ReadCurrentTemperature_cfunc.argtypes = [ViSession, ctypes.POINTER(ViReal64)]  # noqa: F405
-                self.niDCPower_ReadCurrentTemperature_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_ReadCurrentTemperature_cfunc(vi, temperature)
+        cfunc = self.niDCPower_ReadCurrentTemperature_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_ReadCurrentTemperature')
+        return cfunc(vi, temperature)
 
     def niDCPower_ResetDevice(self, vi):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_ResetDevice_cfunc is None:
-                self.niDCPower_ResetDevice_cfunc = self._library.niDCPower_ResetDevice
-                self.niDCPower_ResetDevice_cfunc.argtypes = [ViSession]  # noqa: F405
-                self.niDCPower_ResetDevice_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_ResetDevice_cfunc(vi)
+        cfunc = self.niDCPower_ResetDevice_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_ResetDevice')
+        return cfunc(vi)
 
     def niDCPower_ResetWithDefaults(self, vi):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_ResetWithDefaults_cfunc is None:
-                self.niDCPower_ResetWithDefaults_cfunc = self._library.niDCPower_ResetWithDefaults
-                self.niDCPower_ResetWithDefaults_cfunc.argtypes = [ViSession]  # noqa: F405
-                self.niDCPower_ResetWithDefaults_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_ResetWithDefaults_cfunc(vi)
+        cfunc = self.niDCPower_ResetWithDefaults_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_ResetWithDefaults')
+        return cfunc(vi)
 
     def niDCPower_SendSoftwareEdgeTrigger(self, vi, trigger):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_SendSoftwareEdgeTrigger_cfunc is None:
-                self.niDCPower_SendSoftwareEdgeTrigger_cfunc = self._library.niDCPower_SendSoftwareEdgeTrigger
-                self.niDCPower_SendSoftwareEdgeTrigger_cfunc.argtypes = [ViSession, ViInt32]  # noqa: F405
-                self.niDCPower_SendSoftwareEdgeTrigger_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_SendSoftwareEdgeTrigger_cfunc(vi, trigger)
+        cfunc = self.niDCPower_SendSoftwareEdgeTrigger_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_SendSoftwareEdgeTrigger')
+        return cfunc(vi, trigger)
 
     def niDCPower_SetAttributeViBoolean(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_SetAttributeViBoolean_cfunc is None:
-                self.niDCPower_SetAttributeViBoolean_cfunc = self._library.niDCPower_SetAttributeViBoolean
-                self.niDCPower_SetAttributeViBoolean_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ViBoolean]  # noqa: F405
-                self.niDCPower_SetAttributeViBoolean_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_SetAttributeViBoolean_cfunc(vi, channel_name, attribute_id, attribute_value)
+        cfunc = self.niDCPower_SetAttributeViBoolean_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_SetAttributeViBoolean')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
 
     def niDCPower_SetAttributeViInt32(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_SetAttributeViInt32_cfunc is None:
-                self.niDCPower_SetAttributeViInt32_cfunc = self._library.niDCPower_SetAttributeViInt32
-                self.niDCPower_SetAttributeViInt32_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ViInt32]  # noqa: F405
-                self.niDCPower_SetAttributeViInt32_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_SetAttributeViInt32_cfunc(vi, channel_name, attribute_id, attribute_value)
+        cfunc = self.niDCPower_SetAttributeViInt32_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_SetAttributeViInt32')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
 
     def niDCPower_SetAttributeViInt64(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_SetAttributeViInt64_cfunc is None:
-                self.niDCPower_SetAttributeViInt64_cfunc = self._library.niDCPower_SetAttributeViInt64
-                self.niDCPower_SetAttributeViInt64_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ViInt64]  # noqa: F405
-                self.niDCPower_SetAttributeViInt64_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_SetAttributeViInt64_cfunc(vi, channel_name, attribute_id, attribute_value)
+        cfunc = self.niDCPower_SetAttributeViInt64_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_SetAttributeViInt64')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
 
     def niDCPower_SetAttributeViReal64(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_SetAttributeViReal64_cfunc is None:
-                self.niDCPower_SetAttributeViReal64_cfunc = self._library.niDCPower_SetAttributeViReal64
-                self.niDCPower_SetAttributeViReal64_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ViReal64]  # noqa: F405
-                self.niDCPower_SetAttributeViReal64_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_SetAttributeViReal64_cfunc(vi, channel_name, attribute_id, attribute_value)
+        cfunc = self.niDCPower_SetAttributeViReal64_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_SetAttributeViReal64')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
 
     def niDCPower_SetAttributeViString(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_SetAttributeViString_cfunc is None:
-                self.niDCPower_SetAttributeViString_cfunc = self._library.niDCPower_SetAttributeViString
-                self.niDCPower_SetAttributeViString_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViChar)]  # noqa: F405
-                self.niDCPower_SetAttributeViString_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_SetAttributeViString_cfunc(vi, channel_name, attribute_id, attribute_value)
+        cfunc = self.niDCPower_SetAttributeViString_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_SetAttributeViString')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
 
     def niDCPower_SetSequence(self, vi, channel_name, values, source_delays, size):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_SetSequence_cfunc is None:
-                self.niDCPower_SetSequence_cfunc = self._library.niDCPower_SetSequence
-                self.niDCPower_SetSequence_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ctypes.POINTER(ViReal64), ctypes.POINTER(ViReal64), ViUInt32]  # noqa: F405
-                self.niDCPower_SetSequence_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_SetSequence_cfunc(vi, channel_name, values, source_delays, size)
+        cfunc = self.niDCPower_SetSequence_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_SetSequence')
+        return cfunc(vi, channel_name, values, source_delays, size)
 
     def niDCPower_WaitForEvent(self, vi, event_id, timeout):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_WaitForEvent_cfunc is None:
-                self.niDCPower_WaitForEvent_cfunc = self._library.niDCPower_WaitForEvent
-                self.niDCPower_WaitForEvent_cfunc.argtypes = [ViSession, ViInt32, ViReal64]  # noqa: F405
-                self.niDCPower_WaitForEvent_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_WaitForEvent_cfunc(vi, event_id, timeout)
+        cfunc = self.niDCPower_WaitForEvent_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_WaitForEvent')
+        return cfunc(vi, event_id, timeout)
 
     def niDCPower_close(self, vi):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_close_cfunc is None:
-                self.niDCPower_close_cfunc = self._library.niDCPower_close
-                self.niDCPower_close_cfunc.argtypes = [ViSession]  # noqa: F405
-                self.niDCPower_close_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_close_cfunc(vi)
+        cfunc = self.niDCPower_close_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_close')
+        return cfunc(vi)
 
     def niDCPower_error_message(self, vi, error_code, error_message):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_error_message_cfunc is None:
-                self.niDCPower_error_message_cfunc = self._library.niDCPower_error_message
-                self.niDCPower_error_message_cfunc.argtypes = [ViSession, ViStatus, ctypes.POINTER(ViChar)]  # noqa: F405
-                self.niDCPower_error_message_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_error_message_cfunc(vi, error_code, error_message)
+        cfunc = self.niDCPower_error_message_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_error_message')
+        return cfunc(vi, error_code, error_message)
 
     def niDCPower_reset(self, vi):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_reset_cfunc is None:
-                self.niDCPower_reset_cfunc = self._library.niDCPower_reset
-                self.niDCPower_reset_cfunc.argtypes = [ViSession]  # noqa: F405
-                self.niDCPower_reset_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_reset_cfunc(vi)
+        cfunc = self.niDCPower_reset_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_reset')
+        return cfunc(vi)
 
     def niDCPower_self_test(self, vi, self_test_result, self_test_message):  # noqa: N802
-        with self._func_lock:
-            if self.niDCPower_self_test_cfunc is None:
-                self.niDCPower_self_test_cfunc = self._library.niDCPower_self_test
-                self.niDCPower_self_test_cfunc.argtypes = [ViSession, ctypes.POINTER(ViInt16), ctypes.POINTER(ViChar)]  # noqa: F405
-                self.niDCPower_self_test_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDCPower_self_test_cfunc(vi, self_test_result, self_test_message)
+        cfunc = self.niDCPower_self_test_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDCPower_self_test')
+        return cfunc(vi, self_test_result, self_test_message)
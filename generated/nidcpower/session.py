@@ -1,13 +1,17 @@
 # -*- coding: utf-8 -*-
 # This file was generated
 import array  # noqa: F401
+import collections
 import ctypes
 import datetime
+import six
+import threading
 
 from nidcpower import _converters
 from nidcpower import attributes
 from nidcpower import enums
 from nidcpower import errors
+from nidcpower import executor
 from nidcpower import library_singleton
 from nidcpower import visatype
 
@@ -20,12 +24,23 @@ pp = pprint.PrettyPrinter(indent=4)
 def get_ctypes_pointer_for_buffer(value=None, library_type=None, size=None):
     if isinstance(value, array.array):
         assert library_type is not None, 'library_type is required for array.array'
-        addr, _ = value.buffer_info()
-        return ctypes.cast(addr, ctypes.POINTER(library_type))
+        if value.itemsize == ctypes.sizeof(library_type) and (value.typecode in 'fd') == (getattr(library_type, '_type_', None) in ('f', 'd')):
+            # Passed by pointer, without copying
+            addr, _ = value.buffer_info()
+            return ctypes.cast(addr, ctypes.POINTER(library_type))
+        # Input buffer of another element type, i.e. array.array('f') for ViReal64
+        return (library_type * len(value))(*value)
     elif str(type(value)).find("'numpy.ndarray'") != -1:
         import numpy
-        return numpy.ctypeslib.as_ctypes(value)
-    elif isinstance(value, list):
+        if library_type is None:
+            return numpy.ctypeslib.as_ctypes(value)
+        dtype = numpy.dtype(library_type)
+        if value.dtype == dtype and value.flags.c_contiguous:
+            # Passed by pointer, without copying
+            return ctypes.cast(value.ctypes.data, ctypes.POINTER(library_type))
+        # Input buffer of another dtype or not contiguous. The ctypes array keeps a reference to the converted copy.
+        return numpy.ctypeslib.as_ctypes(numpy.ascontiguousarray(value.astype(dtype, casting='same_kind', copy=False)))
+    elif isinstance(value, (list, tuple)):
         assert library_type is not None, 'library_type is required for list'
         return (library_type * len(value))(*value)
     else:
@@ -37,7 +52,8 @@ def get_ctypes_pointer_for_buffer(value=None, library_type=None, size=None):
 
 def get_ctypes_and_array(value, array_type):
     if value is not None:
-        if isinstance(value, array.array):
+        if isinstance(value, array.array) or str(type(value)).find("'numpy.ndarray'") != -1:
+            # get_ctypes_pointer_for_buffer() passes them by pointer when the element type matches
             value_array = value
         else:
             value_array = array.array(array_type, value)
@@ -59,24 +75,240 @@ class _Acquisition(object):
         self._session.abort()
 
 
+class _LruCache(object):
+    '''Dictionary with at most maxsize entries that discards the least recently used entry when full'''
+
+    def __init__(self, maxsize):
+        self._maxsize = maxsize
+        self._values = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, create):
+        '''Returns the value stored for key, calling create() and storing its result on a miss'''
+        with self._lock:
+            try:
+                value = self._values.pop(key)
+                self._values[key] = value
+                return value
+            except KeyError:
+                pass
+        # Don't hold the lock while creating the value, create() may call into the driver
+        value = create()
+        with self._lock:
+            self._values[key] = value
+            if len(self._values) > self._maxsize:
+                self._values.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+
+def _get_repeated_capability_cache_key(repeated_capability):
+    '''Returns a hashable key for repeated_capability, or None for values that are not cached (i.e. generators)'''
+    simple_types = six.string_types + six.integer_types
+    if isinstance(repeated_capability, simple_types):
+        # The type is part of the key so that i.e. True and 1 are different keys
+        return (type(repeated_capability), repeated_capability)
+    if isinstance(repeated_capability, slice):
+        return (slice, repeated_capability.start, repeated_capability.stop, repeated_capability.step)
+    if isinstance(repeated_capability, (list, tuple)) and all(isinstance(r, simple_types) for r in repeated_capability):
+        return (type(repeated_capability), ) + tuple((type(r), r) for r in repeated_capability)
+    return None
+
+
 class _RepeatedCapabilities(object):
+    # Maximum number of objects kept by each repeated capability, see __getitem__
+    _cache_size = 128
+
     def __init__(self, session, prefix):
         self._session = session
         self._prefix = prefix
+        self._cache = _LruCache(self._cache_size)
 
     def __getitem__(self, repeated_capability):
         '''Set/get properties or call methods with a repeated capability (i.e. channels)'''
+        key = _get_repeated_capability_cache_key(repeated_capability)
+        if key is None:
+            return self._create(repeated_capability)
+        # The objects are immutable, so the ones for recently used repeated capabilities are reused
+        # instead of parsing the repeated capability and encoding the resulting string again
+        return self._cache.get(key, lambda: self._create(repeated_capability))
+
+    def _create(self, repeated_capability):
         rep_caps = _converters.convert_repeated_capabilities(repeated_capability, self._prefix)
 
-        return _SessionBase(vi=self._session._vi, repeated_capability=rep_caps, library=self._session._library, encoding=self._session._encoding, freeze_it=True)
+        return self._session._with_repeated_capability(rep_caps)
+
+    def _clear_cache(self):
+        self._cache.clear()
 
 
-class _SessionBase(object):
+class _SessionBase(errors._WarningPolicyMixin):
     '''Base class for all NI-DCPower sessions.'''
 
     # This is needed during __init__. Without it, __setattr__ raises an exception
     _is_frozen = False
 
+    # Names that __setattr__ accepts without a dir() lookup once the session is frozen: the
+    # properties and the instance attributes set in __init__. Anything else falls back to dir().
+    _settable_names = frozenset([
+        '_vi',
+        '_attribute_cache',
+        '_channel_name_ctypes',
+        '_encoding',
+        '_error_descriptions',
+        '_is_frozen',
+        '_library',
+        '_memoized_results',
+        '_param_list',
+        '_pending_descriptions',
+        '_repeated_capability',
+        '_repeated_capability_ctype',
+        '_warning_filter',
+        'active_advanced_sequence',
+        'active_advanced_sequence_step',
+        'aperture_time',
+        'aperture_time_units',
+        'auto_zero',
+        'auxiliary_power_source_available',
+        'cache',
+        'channel_count',
+        'compliance_limit_symmetry',
+        'current_compensation_frequency',
+        'current_gain_bandwidth',
+        'current_level',
+        'current_level_autorange',
+        'current_level_range',
+        'current_limit',
+        'current_limit_autorange',
+        'current_limit_high',
+        'current_limit_low',
+        'current_limit_range',
+        'current_pole_zero_ratio',
+        'dc_noise_rejection',
+        'digital_edge_measure_trigger_edge',
+        'digital_edge_measure_trigger_input_terminal',
+        'digital_edge_pulse_trigger_edge',
+        'digital_edge_pulse_trigger_input_terminal',
+        'digital_edge_sequence_advance_trigger_edge',
+        'digital_edge_sequence_advance_trigger_input_terminal',
+        'digital_edge_source_trigger_edge',
+        'digital_edge_source_trigger_input_terminal',
+        'digital_edge_start_trigger_edge',
+        'digital_edge_start_trigger_input_terminal',
+        'driver_setup',
+        'exported_measure_trigger_output_terminal',
+        'exported_pulse_trigger_output_terminal',
+        'exported_sequence_advance_trigger_output_terminal',
+        'exported_source_trigger_output_terminal',
+        'exported_start_trigger_output_terminal',
+        'fetch_backlog',
+        'group_capabilities',
+        'instrument_firmware_revision',
+        'instrument_manufacturer',
+        'instrument_model',
+        'interchange_check',
+        'interlock_input_open',
+        'io_resource_descriptor',
+        'logical_name',
+        'measure_buffer_size',
+        'measure_complete_event_delay',
+        'measure_complete_event_output_terminal',
+        'measure_complete_event_pulse_polarity',
+        'measure_complete_event_pulse_width',
+        'measure_record_delta_time',
+        'measure_record_length',
+        'measure_record_length_is_finite',
+        'measure_trigger_type',
+        'measure_when',
+        'output_capacitance',
+        'output_connected',
+        'output_enabled',
+        'output_function',
+        'output_resistance',
+        'overranging_enabled',
+        'ovp_enabled',
+        'ovp_limit',
+        'power_line_frequency',
+        'power_source',
+        'power_source_in_use',
+        'pulse_bias_current_level',
+        'pulse_bias_current_limit',
+        'pulse_bias_current_limit_high',
+        'pulse_bias_current_limit_low',
+        'pulse_bias_delay',
+        'pulse_bias_voltage_level',
+        'pulse_bias_voltage_limit',
+        'pulse_bias_voltage_limit_high',
+        'pulse_bias_voltage_limit_low',
+        'pulse_complete_event_output_terminal',
+        'pulse_complete_event_pulse_polarity',
+        'pulse_complete_event_pulse_width',
+        'pulse_current_level',
+        'pulse_current_level_range',
+        'pulse_current_limit',
+        'pulse_current_limit_high',
+        'pulse_current_limit_low',
+        'pulse_current_limit_range',
+        'pulse_off_time',
+        'pulse_on_time',
+        'pulse_trigger_type',
+        'pulse_voltage_level',
+        'pulse_voltage_level_range',
+        'pulse_voltage_limit',
+        'pulse_voltage_limit_high',
+        'pulse_voltage_limit_low',
+        'pulse_voltage_limit_range',
+        'query_instrument_status',
+        'range_check',
+        'ready_for_pulse_trigger_event_output_terminal',
+        'ready_for_pulse_trigger_event_pulse_polarity',
+        'ready_for_pulse_trigger_event_pulse_width',
+        'record_coercions',
+        'reset_average_before_measurement',
+        'samples_to_average',
+        'self_calibration_persistence',
+        'sense',
+        'sequence_advance_trigger_type',
+        'sequence_engine_done_event_output_terminal',
+        'sequence_engine_done_event_pulse_polarity',
+        'sequence_engine_done_event_pulse_width',
+        'sequence_iteration_complete_event_output_terminal',
+        'sequence_iteration_complete_event_pulse_polarity',
+        'sequence_iteration_complete_event_pulse_width',
+        'sequence_loop_count',
+        'sequence_loop_count_is_finite',
+        'simulate',
+        'source_complete_event_output_terminal',
+        'source_complete_event_pulse_polarity',
+        'source_complete_event_pulse_width',
+        'source_delay',
+        'source_mode',
+        'source_trigger_type',
+        'specific_driver_class_spec_major_version',
+        'specific_driver_class_spec_minor_version',
+        'specific_driver_description',
+        'specific_driver_prefix',
+        'specific_driver_revision',
+        'specific_driver_vendor',
+        'start_trigger_type',
+        'supported_instrument_models',
+        'transient_response',
+        'voltage_compensation_frequency',
+        'voltage_gain_bandwidth',
+        'voltage_level',
+        'voltage_level_autorange',
+        'voltage_level_range',
+        'voltage_limit',
+        'voltage_limit_autorange',
+        'voltage_limit_high',
+        'voltage_limit_low',
+        'voltage_limit_range',
+        'voltage_pole_zero_ratio',
+    ])
+
     active_advanced_sequence = attributes.AttributeViString(1150074)
     '''Type: str
 
@@ -637,7 +869,7 @@ class _SessionBase(object):
 
     Note: This property is not supported by all devices. Refer to Supported Properties by Device topic
     '''
-    fetch_backlog = attributes.AttributeViInt32(1150056)
+    fetch_backlog = attributes.AttributeViInt32(1150056, cacheable=False)
     '''Type: int
 
     Returns the number of measurements acquired that have not been fetched yet.
@@ -2247,11 +2479,21 @@ class _SessionBase(object):
         var = session.channels['0,1'].voltage_pole_zero_ratio
     '''
 
-    def __init__(self, repeated_capability, vi, library, encoding, freeze_it=False):
+    def __init__(self, repeated_capability, vi, library, encoding, attribute_cache, error_descriptions, warning_filter, pending_descriptions, freeze_it=False):
         self._repeated_capability = repeated_capability
         self._vi = vi
         self._library = library
         self._encoding = encoding
+        self._attribute_cache = attribute_cache
+        self._error_descriptions = error_descriptions
+        self._warning_filter = warning_filter
+        self._pending_descriptions = pending_descriptions
+        # Encoded once and passed to every driver call that takes the repeated capability. The driver does not modify it.
+        self._repeated_capability_ctype = None if encoding is None else ctypes.create_string_buffer(repeated_capability.encode(encoding))
+        # Created on first use, see _get_channel_name_ctypes
+        self._channel_name_ctypes = None
+        # Results of methods that only depend on the repeated capability, see the memoized_method template
+        self._memoized_results = {}
 
         # Store the parameter list for later printing in __repr__
         self._param_list = "repeated_capability=" + pp.pformat(repeated_capability)
@@ -2261,8 +2503,16 @@ class _SessionBase(object):
     def __repr__(self):
         return '{0}.{1}({2})'.format('nidcpower', self.__class__.__name__, self._param_list)
 
+    def _with_repeated_capability(self, repeated_capability):
+        '''Returns a _SessionBase for repeated_capability that shares the handle, library and per-session state of this session'''
+        return _SessionBase(vi=self._vi, repeated_capability=repeated_capability, library=self._library, encoding=self._encoding, attribute_cache=self._attribute_cache, error_descriptions=self._error_descriptions, warning_filter=self._warning_filter, pending_descriptions=self._pending_descriptions, freeze_it=True)
+
+    def _session_wide(self):
+        '''Returns a _SessionBase without a repeated capability, for properties and methods that are not channel based'''
+        return self._with_repeated_capability('')
+
     def __setattr__(self, key, value):
-        if self._is_frozen and key not in dir(self):
+        if self._is_frozen and key not in self._settable_names and key not in dir(self):
             raise AttributeError("'{0}' object has no attribute '{1}'".format(type(self).__name__, key))
         object.__setattr__(self, key, value)
 
@@ -2270,10 +2520,21 @@ class _SessionBase(object):
         '''_get_error_description
 
         Returns the error description.
+
+        Descriptions of warnings are kept per session, so a warning returned over and over by the driver
+        (i.e. a coercion warning on every fetch) only costs calls into the driver the first time.
         '''
+        if errors._is_warning(error_code):
+            return self._error_descriptions.get(error_code, lambda: self._read_error_description(error_code))
+        return self._read_error_description(error_code)
+
+    def _read_error_description(self, error_code):
+        # The description is retrieved after the call that failed, so the last error of the session may
+        # be a different one. Only use it when the codes match.
         try:
-            _, error_string = self._get_error()
-            return error_string
+            last_error_code, error_string = self._get_error()
+            if last_error_code == error_code:
+                return error_string
         except errors.Error:
             pass
 
@@ -2288,6 +2549,225 @@ class _SessionBase(object):
         except errors.Error:
             return "Failed to retrieve error description."
 
+    def _find_attributes(self, names):
+        '''Returns (name, descriptor) pairs for the given property names
+
+        Raises a single AttributeError that lists every name that is not a property.
+        '''
+        found = []
+        unknown = []
+        for name in names:
+            attribute = _SessionBase.__dict__.get(name)
+            if isinstance(attribute, (attributes.Attribute, attributes.AttributeEnum)):
+                found.append((name, attribute))
+            else:
+                unknown.append(name)
+        if unknown:
+            raise AttributeError("'{0}' object has no attribute {1}".format(type(self).__name__, ', '.join(repr(n) for n in unknown)))
+        return found
+
+    def _get_channel_name_ctypes(self):
+        '''Returns (channel name, encoded channel name) pairs for the comma-separated items of the repeated capability'''
+        if self._channel_name_ctypes is None:
+            channel_names = [c.strip() for c in self._repeated_capability.split(',')]
+            self._channel_name_ctypes = [(c, ctypes.create_string_buffer(c.encode(self._encoding))) for c in channel_names]
+        return self._channel_name_ctypes
+
+    def _get_set_attribute_call(self, attribute, value):
+        '''Converts value for attribute and returns the SetAttribute function to call and the value ctype'''
+        value = attribute._to_driver(value)
+        if attribute._vi_type == 'ViString':
+            return self._library.niDCPower_SetAttributeViString, ctypes.create_string_buffer(value.encode(self._encoding))
+        set_attribute_name, value_type = {
+            'ViBoolean': ('niDCPower_SetAttributeViBoolean', visatype.ViBoolean),
+            'ViInt32': ('niDCPower_SetAttributeViInt32', visatype.ViInt32),
+            'ViInt64': ('niDCPower_SetAttributeViInt64', visatype.ViInt64),
+            'ViReal64': ('niDCPower_SetAttributeViReal64', visatype.ViReal64),
+        }[attribute._vi_type]
+        return getattr(self._library, set_attribute_name), value_type(value)
+
+    def _get_attribute_getter(self, vi_type, channel_name_ctype):
+        '''Returns getter(attribute_id) that reads an attribute of API type vi_type for channel_name_ctype from the driver'''
+        vi_ctype = visatype.ViSession(self._vi)
+        if vi_type == 'ViString':
+            def getter(attribute_id):
+                attribute_id_ctype = visatype.ViAttr(attribute_id)
+                error_code = self._library.niDCPower_GetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, visatype.ViInt32(), None)
+                errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=False)
+                buffer_size_ctype = visatype.ViInt32(error_code)
+                attribute_value_ctype = (visatype.ViChar * buffer_size_ctype.value)()
+                error_code = self._library.niDCPower_GetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, buffer_size_ctype, attribute_value_ctype)
+                errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+                return attribute_value_ctype.value.decode(self._encoding)
+            return getter
+
+        get_attribute_name, value_type, python_type = {
+            'ViBoolean': ('niDCPower_GetAttributeViBoolean', visatype.ViBoolean, bool),
+            'ViInt32': ('niDCPower_GetAttributeViInt32', visatype.ViInt32, int),
+            'ViInt64': ('niDCPower_GetAttributeViInt64', visatype.ViInt64, int),
+            'ViReal64': ('niDCPower_GetAttributeViReal64', visatype.ViReal64, float),
+        }[vi_type]
+        get_attribute = getattr(self._library, get_attribute_name)
+        # One value buffer for all the calls made with this getter
+        value_ctype = value_type()
+
+        def getter(attribute_id):
+            error_code = get_attribute(vi_ctype, channel_name_ctype, visatype.ViAttr(attribute_id), ctypes.pointer(value_ctype))
+            errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+            return python_type(value_ctype.value)
+        return getter
+
+    def _set_attributes(self, channel_name_ctype, calls):
+        '''Makes the (SetAttribute function, attribute ID, value ctype) calls, stopping at the first error'''
+        vi_ctype = visatype.ViSession(self._vi)
+        try:
+            for set_attribute, attribute_id, value_ctype in calls:
+                error_code = set_attribute(vi_ctype, channel_name_ctype, visatype.ViAttr(attribute_id), value_ctype)
+                errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        finally:
+            self._attribute_cache.clear()
+
+    def configure(self, ordered_properties=(), **properties):
+        '''configure
+
+        Sets several properties with one call, i.e.
+
+            session.configure(voltage_level=1.0, current_limit=0.01)
+
+        Like properties, it can be called on a repeated capability to set the properties for those channels only.
+
+        Every name and value is checked and converted before anything is sent to the driver, so an
+        unknown name or a value of the wrong type leaves the device untouched. The properties are then
+        set without the per-property overhead of setting them one at a time. If the driver returns an
+        error, the properties after the failing one are not set.
+
+        The valid values of some properties depend on others, so the order can matter. Properties in
+        ordered_properties are set in the order given, before the keyword arguments, i.e.
+
+            session.configure([('voltage_level', 1.0), ('current_limit', 0.01)])
+
+        The order of keyword arguments is only kept by Python 3.6 and later.
+
+        Args:
+            ordered_properties (list of (str, value) tuples or collections.OrderedDict): Property names and the values to set them to, in the order to set them.
+
+            properties: Property names and the values to set them to.
+        '''
+        if hasattr(ordered_properties, 'items'):
+            ordered_properties = ordered_properties.items()
+        name_values = list(ordered_properties) + list(properties.items())
+        calls = []
+        invalid = []
+        found = self._find_attributes([name for name, _ in name_values])
+        for (name, attribute), (_, value) in zip(found, name_values):
+            try:
+                set_attribute, value_ctype = self._get_set_attribute_call(attribute, value)
+            except (AttributeError, TypeError, ValueError) as e:
+                invalid.append('{0}: {1}'.format(name, e))
+                continue
+            calls.append((set_attribute, attribute._attribute_id, value_ctype))
+        if invalid:
+            raise TypeError('Invalid property values: ' + '; '.join(invalid))
+        self._set_attributes(self._repeated_capability_ctype, calls)
+
+    def read_attributes(self, names):
+        '''read_attributes
+
+        Reads several properties with one call and returns a dict that maps each name to its value, i.e.
+
+            values = session.read_attributes(['voltage_level', 'current_limit'])
+
+        Every name is checked before anything is read from the driver. Values are returned from the
+        attribute cache when it is enabled, see attribute_cache_enabled.
+
+        Args:
+            names (list of str): Names of the properties to read.
+
+        Returns:
+            values (dict): Property values, keyed by name, in the order of names.
+        '''
+        values = collections.OrderedDict()
+        for name, attribute in self._find_attributes(names):
+            getter = self._get_attribute_getter(attribute._vi_type, self._repeated_capability_ctype)
+            if attribute._cacheable:
+                value = self._attribute_cache.get(self._repeated_capability, attribute._attribute_id, getter)
+            else:
+                value = getter(attribute._attribute_id)
+            values[name] = attribute._from_driver(value)
+        return values
+
+    def get(self, name):
+        '''get
+
+        Reads a property for each channel of the repeated capability and returns a numpy.ndarray with one value per channel, i.e.
+
+            values = session.channels[0:64].get('voltage_level')
+
+        The channels are the comma-separated items of the repeated capability, in order. A range such as '0-63'
+        is a single item. Boolean, integer and floating-point properties are returned in an array of the matching
+        dtype, other properties (i.e. enums, strings and timedeltas) in an array of objects.
+
+        Values are returned from the attribute cache when it is enabled, see attribute_cache_enabled.
+
+        Requires numpy.
+
+        Args:
+            name (str): Name of the property to read.
+
+        Returns:
+            values (numpy.ndarray): Property value for each channel.
+        '''
+        import numpy
+        [(_, attribute)] = self._find_attributes([name])
+        channel_name_ctypes = self._get_channel_name_ctypes()
+        values = numpy.empty(len(channel_name_ctypes), dtype=attribute._numpy_type or object)
+        for i, (channel_name, channel_name_ctype) in enumerate(channel_name_ctypes):
+            getter = self._get_attribute_getter(attribute._vi_type, channel_name_ctype)
+            if attribute._cacheable:
+                value = self._attribute_cache.get(channel_name, attribute._attribute_id, getter)
+            else:
+                value = getter(attribute._attribute_id)
+            values[i] = attribute._from_driver(value)
+        return values
+
+    def set(self, name, values):
+        '''set
+
+        Sets a property to a different value for each channel of the repeated capability, i.e.
+
+            session.channels[0:64].set('voltage_level', values)
+
+        The channels are the comma-separated items of the repeated capability, in order. A range such as '0-63'
+        is a single item. values can be a numpy.ndarray, an array.array or any other sequence with one value per channel.
+
+        Every value is checked and converted before anything is sent to the driver. If the driver returns an
+        error, the channels after the failing one are not set.
+
+        Args:
+            name (str): Name of the property to set.
+
+            values: Property value for each channel.
+        '''
+        [(_, attribute)] = self._find_attributes([name])
+        channel_name_ctypes = self._get_channel_name_ctypes()
+        # numpy.ndarray and array.array convert their items to Python values, which ctypes accepts
+        values = values.tolist() if hasattr(values, 'tolist') else list(values)
+        if len(values) != len(channel_name_ctypes):
+            raise ValueError('{0} values given for {1} channels'.format(len(values), len(channel_name_ctypes)))
+
+        calls = []
+        invalid = []
+        for (channel_name, channel_name_ctype), value in zip(channel_name_ctypes, values):
+            try:
+                calls.append((channel_name_ctype, self._get_set_attribute_call(attribute, value)))
+            except (AttributeError, TypeError, ValueError) as e:
+                invalid.append('{0}: {1}'.format(channel_name, e))
+        if invalid:
+            raise TypeError('Invalid values for {0}: {1}'.format(name, '; '.join(invalid)))
+
+        for channel_name_ctype, (set_attribute, value_ctype) in calls:
+            self._set_attributes(channel_name_ctype, [(set_attribute, attribute._attribute_id, value_ctype)])
+
     ''' These are code-generated '''
 
     def configure_aperture_time(self, aperture_time, units=enums.ApertureTimeUnits.SECONDS):
@@ -2340,10 +2820,11 @@ class _SessionBase(object):
         if type(units) is not enums.ApertureTimeUnits:
             raise TypeError('Parameter mode must be of type ' + str(enums.ApertureTimeUnits))
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         aperture_time_ctype = visatype.ViReal64(aperture_time)  # case S150
         units_ctype = visatype.ViInt32(units.value)  # case S130
         error_code = self._library.niDCPower_ConfigureApertureTime(vi_ctype, channel_name_ctype, aperture_time_ctype, units_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -2369,6 +2850,9 @@ class _SessionBase(object):
         Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__
         for more information about supported devices.
 
+        Note:
+        This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.
+
         Tip:
         This method requires repeated capabilities (usually channels). If called directly on the
         nidcpower.Session object, then the method will use all repeated capabilities in the session.
@@ -2406,14 +2890,14 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         timeout_ctype = _converters.convert_timedelta_to_seconds(timeout, visatype.ViReal64)  # case S140
         count_ctype = visatype.ViInt32(count)  # case S190
         voltage_measurements_size = count  # case B600
-        voltage_measurements_array = array.array("d", [0] * voltage_measurements_size)  # case B600
+        voltage_measurements_array = array.array("d", [0]) * voltage_measurements_size  # case B600
         voltage_measurements_ctype = get_ctypes_pointer_for_buffer(value=voltage_measurements_array, library_type=visatype.ViReal64)  # case B600
         current_measurements_size = count  # case B600
-        current_measurements_array = array.array("d", [0] * current_measurements_size)  # case B600
+        current_measurements_array = array.array("d", [0]) * current_measurements_size  # case B600
         current_measurements_ctype = get_ctypes_pointer_for_buffer(value=current_measurements_array, library_type=visatype.ViReal64)  # case B600
         in_compliance_size = count  # case B600
         in_compliance_ctype = get_ctypes_pointer_for_buffer(library_type=visatype.ViBoolean, size=in_compliance_size)  # case B600
@@ -2422,6 +2906,171 @@ class _SessionBase(object):
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return voltage_measurements_array, current_measurements_array, [bool(in_compliance_ctype[i]) for i in range(count_ctype.value)]
 
+    def fetch_multiple_into(self, voltage_measurements, current_measurements, in_compliance, timeout=datetime.timedelta(seconds=1.0)):
+        '''fetch_multiple
+
+        Returns an array of voltage measurements, an array of current
+        measurements, and an array of compliance measurements that were
+        previously taken and are stored in the NI-DCPower buffer. This method
+        should not be used when the measure_when property is
+        set to MeasureWhen.ON_DEMAND. You must first call
+        _initiate before calling this method.
+
+        Refer to the `Acquiring
+        Measurements <REPLACE_DRIVER_SPECIFIC_URL_1(acquiringmeasurements)>`__
+        and `Compliance <REPLACE_DRIVER_SPECIFIC_URL_1(compliance)>`__ topics in
+        the *NI DC Power Supplies and SMUs Help* for more information about
+        configuring this method.
+
+        Note:
+        This method is not supported on all devices. Refer to `Supported
+        Methods by
+        Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__
+        for more information about supported devices.
+
+        Note:
+        This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        nidcpower.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        nidcpower.Session instance, and calling this method on the result.:
+
+            session.channels['0,1'].fetch_multiple(count, timeout='datetime.timedelta(seconds=1.0)')
+
+        Args:
+            voltage_measurements (numpy.array(dtype=numpy.float64)): Returns an array of voltage measurements. Ensure that sufficient space
+                has been allocated for the returned array.
+
+            current_measurements (numpy.array(dtype=numpy.float64)): Returns an array of current measurements. Ensure that sufficient space
+                has been allocated for the returned array.
+
+            in_compliance (numpy.array(dtype=numpy.bool_)): Returns an array of Boolean values indicating whether the output was in
+                compliance at the time the measurement was taken. Ensure that sufficient
+                space has been allocated for the returned array.
+
+            timeout (datetime.timedelta): Specifies the maximum time allowed for this method to complete, in
+                seconds. If the method does not complete within this time interval,
+                NI-DCPower returns an error.
+
+                Note:
+                When setting the timeout interval, ensure you take into account any
+                triggers so that the timeout interval is long enough for your
+                application.
+
+
+        Returns:
+            voltage_measurements (numpy.array(dtype=numpy.float64)): Returns an array of voltage measurements. Ensure that sufficient space
+                has been allocated for the returned array.
+
+            current_measurements (numpy.array(dtype=numpy.float64)): Returns an array of current measurements. Ensure that sufficient space
+                has been allocated for the returned array.
+
+            in_compliance (numpy.array(dtype=numpy.bool_)): Returns an array of Boolean values indicating whether the output was in
+                compliance at the time the measurement was taken. Ensure that sufficient
+                space has been allocated for the returned array.
+
+            actual_count (int): Indicates the number of measured values actually retrieved from the
+                device.
+
+        '''
+        import numpy
+
+        if type(voltage_measurements) is not numpy.ndarray:
+            raise TypeError('voltage_measurements must be {0}, is {1}'.format(numpy.ndarray, type(voltage_measurements)))
+        if numpy.isfortran(voltage_measurements) is True:
+            raise TypeError('voltage_measurements must be in C-order')
+        if voltage_measurements.dtype is not numpy.dtype('float64'):
+            raise TypeError('voltage_measurements must be numpy.ndarray of dtype=float64, is ' + str(voltage_measurements.dtype))
+        count = len(voltage_measurements)
+
+        if type(current_measurements) is not numpy.ndarray:
+            raise TypeError('current_measurements must be {0}, is {1}'.format(numpy.ndarray, type(current_measurements)))
+        if numpy.isfortran(current_measurements) is True:
+            raise TypeError('current_measurements must be in C-order')
+        if current_measurements.dtype is not numpy.dtype('float64'):
+            raise TypeError('current_measurements must be numpy.ndarray of dtype=float64, is ' + str(current_measurements.dtype))
+        if len(current_measurements) != count:
+            raise ValueError('current_measurements must have the same length as the other buffers, {0}, is {1}'.format(count, len(current_measurements)))
+
+        if type(in_compliance) is not numpy.ndarray:
+            raise TypeError('in_compliance must be {0}, is {1}'.format(numpy.ndarray, type(in_compliance)))
+        if numpy.isfortran(in_compliance) is True:
+            raise TypeError('in_compliance must be in C-order')
+        if in_compliance.dtype is not numpy.dtype('bool_'):
+            raise TypeError('in_compliance must be numpy.ndarray of dtype=bool_, is ' + str(in_compliance.dtype))
+        if len(in_compliance) != count:
+            raise ValueError('in_compliance must have the same length as the other buffers, {0}, is {1}'.format(count, len(in_compliance)))
+
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
+        timeout_ctype = _converters.convert_timedelta_to_seconds(timeout, visatype.ViReal64)  # case S140
+        count_ctype = visatype.ViInt32(count)  # case S190
+        voltage_measurements_ctype = get_ctypes_pointer_for_buffer(value=voltage_measurements)  # case B510
+        current_measurements_ctype = get_ctypes_pointer_for_buffer(value=current_measurements)  # case B510
+        in_compliance_ctype = get_ctypes_pointer_for_buffer(library_type=visatype.ViBoolean, size=len(in_compliance))  # case B515
+        actual_count_ctype = visatype.ViInt32()  # case S200
+        error_code = self._library.niDCPower_FetchMultiple(vi_ctype, channel_name_ctype, timeout_ctype, count_ctype, voltage_measurements_ctype, current_measurements_ctype, in_compliance_ctype, None if actual_count_ctype is None else (ctypes.pointer(actual_count_ctype)))
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        in_compliance[:] = numpy.ctypeslib.as_array(in_compliance_ctype)
+        return int(actual_count_ctype.value)
+
+    def fetch_pipeline(self, count, num_buffers=4, drop_when_full=False, timeout=datetime.timedelta(seconds=1.0)):
+        '''fetch_pipeline
+
+        Fetches measurements of an initiated session on a background thread into a bounded set of
+                        preallocated buffers, until abort() is called or a fetch fails. The calling thread processes
+                        earlier measurements while the next ones are fetched. Errors raised by the fetch are raised
+                        again when iterating.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        nidcpower.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        nidcpower.Session instance, and calling this method on the result.:
+
+            session.channels['0,1'].fetch_pipeline(count, num_buffers=4, drop_when_full=False, timeout='datetime.timedelta(seconds=1.0)')
+
+        Args:
+            count (int): The maximum number of measurements in each item. Fewer are returned when the fetch completes with fewer measurements available.
+
+            num_buffers (int): The number of preallocated buffers, which bounds the number of items fetched ahead of the consumer.
+
+            drop_when_full (bool): What the background thread does when all buffers hold items that have not been consumed. If False, it waits for the consumer. If True, it reuses the buffer of the oldest waiting item so that the driver keeps being drained, and counts the item in **dropped_count**.
+
+            timeout (datetime.timedelta): The maximum time allowed for each fetch to complete. A fetch that times out ends the pipeline with the error.
+
+
+        Returns:
+            pipeline (nidcpower.pipeline.AcquisitionPipeline): Iterable of (voltage_measurements, current_measurements, in_compliance) tuples of numpy arrays of float64, float64 and bool.
+                                        The arrays stay valid until the next item is requested. It also has **fetched_count**, **dropped_count**, **consumed_count**
+                                        and **backlog** (items waiting) properties, and **abort()**, which stops the background thread and is called when leaving a with block.
+
+                                        Example:
+
+                                        .. code-block:: python
+
+                                            with session.initiate():
+                                                with session.channels['0'].fetch_pipeline(count=1000) as pipeline:
+                                                    for voltage_measurements, current_measurements, in_compliance in pipeline:
+                                                        process(voltage_measurements, current_measurements)
+
+        '''
+        import numpy
+        from nidcpower import pipeline
+
+        if count < 1:
+            raise ValueError('count must be at least 1, was {0}'.format(count))
+        buffers = [(numpy.zeros(count, dtype=numpy.float64), numpy.zeros(count, dtype=numpy.float64), numpy.zeros(count, dtype=numpy.bool_)) for _ in range(num_buffers)]
+
+        def fetch(buffer):
+            # Runs on the producer thread
+            voltage_measurements, current_measurements, in_compliance = buffer
+            actual_count = self.fetch_multiple_into(voltage_measurements, current_measurements, in_compliance, timeout)
+            return voltage_measurements[:actual_count], current_measurements[:actual_count], in_compliance[:actual_count]
+        return pipeline.AcquisitionPipeline(fetch, buffers, drop_when_full)
+
     def _get_attribute_vi_boolean(self, attribute_id):
         '''_get_attribute_vi_boolean
 
@@ -2469,7 +3118,7 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
         attribute_value_ctype = visatype.ViBoolean()  # case S200
         error_code = self._library.niDCPower_GetAttributeViBoolean(vi_ctype, channel_name_ctype, attribute_id_ctype, None if attribute_value_ctype is None else (ctypes.pointer(attribute_value_ctype)))
@@ -2523,7 +3172,7 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
         attribute_value_ctype = visatype.ViInt32()  # case S200
         error_code = self._library.niDCPower_GetAttributeViInt32(vi_ctype, channel_name_ctype, attribute_id_ctype, None if attribute_value_ctype is None else (ctypes.pointer(attribute_value_ctype)))
@@ -2577,7 +3226,7 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
         attribute_value_ctype = visatype.ViInt64()  # case S200
         error_code = self._library.niDCPower_GetAttributeViInt64(vi_ctype, channel_name_ctype, attribute_id_ctype, None if attribute_value_ctype is None else (ctypes.pointer(attribute_value_ctype)))
@@ -2631,7 +3280,7 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
         attribute_value_ctype = visatype.ViReal64()  # case S200
         error_code = self._library.niDCPower_GetAttributeViReal64(vi_ctype, channel_name_ctype, attribute_id_ctype, None if attribute_value_ctype is None else (ctypes.pointer(attribute_value_ctype)))
@@ -2676,7 +3325,7 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
         buffer_size_ctype = visatype.ViInt32()  # case S170
         attribute_value_ctype = None  # case C050
@@ -2757,6 +3406,109 @@ class _SessionBase(object):
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=True)
         return int(code_ctype.value), description_ctype.value.decode(self._encoding)
 
+    def load_advanced_sequence(self, sequence_name, values, set_as_active_sequence=True):
+        '''load_advanced_sequence
+
+        Creates an advanced sequence with one step per row of **values**, like calling create_advanced_sequence, then
+                        create_advanced_sequence_step and setting the properties for each step. All names and columns are checked and
+                        converted, with vectorized numpy operations where possible, before anything is sent to the driver. The steps are
+                        then created in a single loop that passes the encoded channel string and converted values straight to the driver.
+                        If the driver returns an error, the steps after the failing one are not created.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        nidcpower.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        nidcpower.Session instance, and calling this method on the result.:
+
+            session.channels['0,1'].load_advanced_sequence(sequence_name, values, set_as_active_sequence=True)
+
+        Args:
+            sequence_name (str): Specifies the name of the sequence to create.
+
+            values (dict): Maps each property of the sequence, given by name or by property ID, to a column with its value for every step.
+                                        Columns can be numpy arrays, array.array or any other sequence, and must all have the same length, which is the
+                                        number of steps. Columns of enum, datetime.timedelta and string properties hold enum values, datetime.timedelta
+                                        objects and strings.
+
+                                        Example:
+
+                                        .. code-block:: python
+
+                                            session.load_advanced_sequence('sweep', {
+                                                'output_function': [nidcpower.OutputFunction.DC_VOLTAGE] * 2000,
+                                                'voltage_level': numpy.linspace(0.0, 2.0, 2000),
+                                            })
+
+            set_as_active_sequence (bool): Specifies that this sequence is active.
+
+        '''
+        import numpy
+
+        attributes_by_id = None
+        columns = []
+        invalid = []
+        for key, column in values.items():
+            if isinstance(key, six.string_types):
+                [(name, attribute)] = self._find_attributes([key])
+            else:
+                if attributes_by_id is None:
+                    attributes_by_id = dict((a._attribute_id, (n, a)) for n, a in _SessionBase.__dict__.items() if isinstance(a, (attributes.Attribute, attributes.AttributeEnum)))
+                if key not in attributes_by_id:
+                    raise ValueError('{0} is not the attribute ID of a property'.format(key))
+                name, attribute = attributes_by_id[key]
+            column = numpy.asarray(column)
+            if column.ndim != 1:
+                raise ValueError('The column for {0} must be one-dimensional'.format(name))
+            try:
+                if attribute._numpy_type is None or column.dtype == object:
+                    # enum, datetime.timedelta and string properties are converted one value at a time
+                    driver_values = [attribute._to_driver(v) for v in column.tolist()]
+                else:
+                    dtype = numpy.dtype(attribute._numpy_type)
+                    if not numpy.can_cast(column.dtype, dtype, casting='same_kind'):
+                        raise TypeError('must be numpy.{0} compatible, is {1}'.format(dtype, column.dtype))
+                    converted = column.astype(dtype)
+                    if dtype.kind in 'iu' and numpy.any(converted != column):
+                        raise ValueError('values out of range for {0}'.format(dtype))
+                    driver_values = converted.tolist()
+                # Every value is converted to its ctype before the first step is created
+                if attribute._vi_type == 'ViString':
+                    value_ctypes = [ctypes.create_string_buffer(v.encode(self._encoding)) for v in driver_values]
+                else:
+                    value_type = getattr(visatype, attribute._vi_type)
+                    value_ctypes = [value_type(v) for v in driver_values]
+            except (AttributeError, TypeError, ValueError) as e:
+                invalid.append('{0}: {1}'.format(name, e))
+                continue
+            columns.append((name, attribute, value_ctypes))
+        if invalid:
+            raise TypeError('Invalid property values: ' + '; '.join(invalid))
+        num_steps = len(columns[0][2]) if columns else 0
+        if num_steps == 0 or any(len(value_ctypes) != num_steps for _, _, value_ctypes in columns):
+            raise ValueError('The columns must all have the same length, which must be at least 1: ' + ', '.join('{0}={1}'.format(name, len(value_ctypes)) for name, _, value_ctypes in columns))
+
+        vi_ctype = visatype.ViSession(self._vi)
+        channel_name_ctype = self._repeated_capability_ctype
+        sequence_name_ctype = ctypes.create_string_buffer(sequence_name.encode(self._encoding))
+        attribute_ids_ctype = get_ctypes_pointer_for_buffer(value=[attribute._attribute_id for _, attribute, _ in columns], library_type=visatype.ViInt32)
+        set_calls = [(getattr(self._library, 'niDCPower_SetAttribute' + attribute._vi_type), visatype.ViAttr(attribute._attribute_id), value_ctypes) for _, attribute, value_ctypes in columns]
+        create_step = self._library.niDCPower_CreateAdvancedSequenceStep
+        set_as_active_step_ctype = visatype.ViBoolean(True)
+        try:
+            error_code = self._library.niDCPower_CreateAdvancedSequence(vi_ctype, sequence_name_ctype, visatype.ViInt32(len(columns)), attribute_ids_ctype, visatype.ViBoolean(set_as_active_sequence))
+            errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+            for step in range(num_steps):
+                error_code = create_step(vi_ctype, set_as_active_step_ctype)
+                if error_code != 0:
+                    errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+                for set_attribute, attribute_id_ctype, value_ctypes in set_calls:
+                    error_code = set_attribute(vi_ctype, channel_name_ctype, attribute_id_ctype, value_ctypes[step])
+                    if error_code != 0:
+                        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        finally:
+            self._attribute_cache.clear()
+
     def measure(self, measurement_type):
         '''measure
 
@@ -2766,6 +3518,9 @@ class _SessionBase(object):
         measure multiple output channels, use the measure_multiple
         method.
 
+        Note:
+        This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.
+
         Tip:
         This method requires repeated capabilities (usually channels). If called directly on the
         nidcpower.Session object, then the method will use all repeated capabilities in the session.
@@ -2793,7 +3548,7 @@ class _SessionBase(object):
         if type(measurement_type) is not enums.MeasurementTypes:
             raise TypeError('Parameter mode must be of type ' + str(enums.MeasurementTypes))
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         measurement_type_ctype = visatype.ViInt32(measurement_type.value)  # case S130
         measurement_ctype = visatype.ViReal64()  # case S200
         error_code = self._library.niDCPower_Measure(vi_ctype, channel_name_ctype, measurement_type_ctype, None if measurement_ctype is None else (ctypes.pointer(measurement_ctype)))
@@ -2809,6 +3564,9 @@ class _SessionBase(object):
         order of the measurements returned in the array corresponds to the order
         on the specified output channel(s).
 
+        Note:
+        This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.
+
         Tip:
         This method requires repeated capabilities (usually channels). If called directly on the
         nidcpower.Session object, then the method will use all repeated capabilities in the session.
@@ -2829,15 +3587,87 @@ class _SessionBase(object):
                 returned array.
 
         '''
+        channel_count = self._parse_channel_count_memoized()
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
-        voltage_measurements_size = self._parse_channel_count()  # case B560
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
+        voltage_measurements_size = channel_count  # case B560
         voltage_measurements_ctype = get_ctypes_pointer_for_buffer(library_type=visatype.ViReal64, size=voltage_measurements_size)  # case B560
-        current_measurements_size = self._parse_channel_count()  # case B560
+        current_measurements_size = channel_count  # case B560
         current_measurements_ctype = get_ctypes_pointer_for_buffer(library_type=visatype.ViReal64, size=current_measurements_size)  # case B560
         error_code = self._library.niDCPower_MeasureMultiple(vi_ctype, channel_name_ctype, voltage_measurements_ctype, current_measurements_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
-        return [float(voltage_measurements_ctype[i]) for i in range(self._parse_channel_count())], [float(current_measurements_ctype[i]) for i in range(self._parse_channel_count())]
+        return [float(voltage_measurements_ctype[i]) for i in range(voltage_measurements_size)], [float(current_measurements_ctype[i]) for i in range(current_measurements_size)]
+
+    def measure_multiple_into(self, voltage_measurements, current_measurements):
+        '''measure_multiple
+
+        Returns arrays of the measured voltage and current values on the
+        specified output channel(s). Each call to this method blocks other
+        method calls until the measurements are returned from the device. The
+        order of the measurements returned in the array corresponds to the order
+        on the specified output channel(s).
+
+        Note:
+        This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        nidcpower.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        nidcpower.Session instance, and calling this method on the result.:
+
+            session.channels['0,1'].measure_multiple()
+
+        Args:
+            voltage_measurements (numpy.array(dtype=numpy.float64)): Returns an array of voltage measurements. The measurements in the array
+                are returned in the same order as the channels specified in
+                **channelName**. Ensure that sufficient space has been allocated for the
+                returned array.
+
+            current_measurements (numpy.array(dtype=numpy.float64)): Returns an array of current measurements. The measurements in the array
+                are returned in the same order as the channels specified in
+                **channelName**. Ensure that sufficient space has been allocated for the
+                returned array.
+
+
+        Returns:
+            voltage_measurements (numpy.array(dtype=numpy.float64)): Returns an array of voltage measurements. The measurements in the array
+                are returned in the same order as the channels specified in
+                **channelName**. Ensure that sufficient space has been allocated for the
+                returned array.
+
+            current_measurements (numpy.array(dtype=numpy.float64)): Returns an array of current measurements. The measurements in the array
+                are returned in the same order as the channels specified in
+                **channelName**. Ensure that sufficient space has been allocated for the
+                returned array.
+
+        '''
+        import numpy
+
+        if type(voltage_measurements) is not numpy.ndarray:
+            raise TypeError('voltage_measurements must be {0}, is {1}'.format(numpy.ndarray, type(voltage_measurements)))
+        if numpy.isfortran(voltage_measurements) is True:
+            raise TypeError('voltage_measurements must be in C-order')
+        if voltage_measurements.dtype is not numpy.dtype('float64'):
+            raise TypeError('voltage_measurements must be numpy.ndarray of dtype=float64, is ' + str(voltage_measurements.dtype))
+        if type(current_measurements) is not numpy.ndarray:
+            raise TypeError('current_measurements must be {0}, is {1}'.format(numpy.ndarray, type(current_measurements)))
+        if numpy.isfortran(current_measurements) is True:
+            raise TypeError('current_measurements must be in C-order')
+        if current_measurements.dtype is not numpy.dtype('float64'):
+            raise TypeError('current_measurements must be numpy.ndarray of dtype=float64, is ' + str(current_measurements.dtype))
+        channel_count = self._parse_channel_count_memoized()
+        if voltage_measurements.size < channel_count:
+            raise ValueError('voltage_measurements must have at least {0} elements, has {1}'.format(channel_count, voltage_measurements.size))
+        if current_measurements.size < channel_count:
+            raise ValueError('current_measurements must have at least {0} elements, has {1}'.format(channel_count, current_measurements.size))
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
+        voltage_measurements_ctype = get_ctypes_pointer_for_buffer(value=voltage_measurements)  # case B510
+        current_measurements_ctype = get_ctypes_pointer_for_buffer(value=current_measurements)  # case B510
+        error_code = self._library.niDCPower_MeasureMultiple(vi_ctype, channel_name_ctype, voltage_measurements_ctype, current_measurements_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
 
     def _parse_channel_count(self):
         '''_parse_channel_count
@@ -2857,12 +3687,25 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channels_string_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channels_string_ctype = self._repeated_capability_ctype  # case C010
         number_of_channels_ctype = visatype.ViUInt32()  # case S200
         error_code = self._library.niDCPower_ParseChannelCount(vi_ctype, channels_string_ctype, None if number_of_channels_ctype is None else (ctypes.pointer(number_of_channels_ctype)))
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(number_of_channels_ctype.value)
 
+    def _parse_channel_count_memoized(self):
+        '''_parse_channel_count_memoized
+
+        Returns the result of _parse_channel_count(). Only use this for methods whose result depends on nothing but the
+        repeated capability of the object, which does not change. The method is called the first time and its result is
+        returned on every later call.
+        '''
+        try:
+            return self._memoized_results['_parse_channel_count']
+        except KeyError:
+            result = self._memoized_results['_parse_channel_count'] = self._parse_channel_count()
+            return result
+
     def query_in_compliance(self):
         '''query_in_compliance
 
@@ -2903,7 +3746,7 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         in_compliance_ctype = visatype.ViBoolean()  # case S200
         error_code = self._library.niDCPower_QueryInCompliance(vi_ctype, channel_name_ctype, None if in_compliance_ctype is None else (ctypes.pointer(in_compliance_ctype)))
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
@@ -2934,7 +3777,7 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         voltage_level_ctype = visatype.ViReal64(voltage_level)  # case S150
         max_current_limit_ctype = visatype.ViReal64()  # case S200
         error_code = self._library.niDCPower_QueryMaxCurrentLimit(vi_ctype, channel_name_ctype, voltage_level_ctype, None if max_current_limit_ctype is None else (ctypes.pointer(max_current_limit_ctype)))
@@ -2966,7 +3809,7 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         current_limit_ctype = visatype.ViReal64(current_limit)  # case S150
         max_voltage_level_ctype = visatype.ViReal64()  # case S200
         error_code = self._library.niDCPower_QueryMaxVoltageLevel(vi_ctype, channel_name_ctype, current_limit_ctype, None if max_voltage_level_ctype is None else (ctypes.pointer(max_voltage_level_ctype)))
@@ -2998,7 +3841,7 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         voltage_level_ctype = visatype.ViReal64(voltage_level)  # case S150
         min_current_limit_ctype = visatype.ViReal64()  # case S200
         error_code = self._library.niDCPower_QueryMinCurrentLimit(vi_ctype, channel_name_ctype, voltage_level_ctype, None if min_current_limit_ctype is None else (ctypes.pointer(min_current_limit_ctype)))
@@ -3042,7 +3885,7 @@ class _SessionBase(object):
         if type(output_state) is not enums.OutputStates:
             raise TypeError('Parameter mode must be of type ' + str(enums.OutputStates))
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         output_state_ctype = visatype.ViInt32(output_state.value)  # case S130
         in_state_ctype = visatype.ViBoolean()  # case S200
         error_code = self._library.niDCPower_QueryOutputState(vi_ctype, channel_name_ctype, output_state_ctype, None if in_state_ctype is None else (ctypes.pointer(in_state_ctype)))
@@ -3099,10 +3942,11 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
         attribute_value_ctype = visatype.ViBoolean(attribute_value)  # case S150
         error_code = self._library.niDCPower_SetAttributeViBoolean(vi_ctype, channel_name_ctype, attribute_id_ctype, attribute_value_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -3156,10 +4000,11 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
         attribute_value_ctype = visatype.ViInt32(attribute_value)  # case S150
         error_code = self._library.niDCPower_SetAttributeViInt32(vi_ctype, channel_name_ctype, attribute_id_ctype, attribute_value_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -3213,10 +4058,11 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
         attribute_value_ctype = visatype.ViInt64(attribute_value)  # case S150
         error_code = self._library.niDCPower_SetAttributeViInt64(vi_ctype, channel_name_ctype, attribute_id_ctype, attribute_value_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -3270,10 +4116,11 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
         attribute_value_ctype = visatype.ViReal64(attribute_value)  # case S150
         error_code = self._library.niDCPower_SetAttributeViReal64(vi_ctype, channel_name_ctype, attribute_id_ctype, attribute_value_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -3327,10 +4174,11 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
         attribute_value_ctype = ctypes.create_string_buffer(attribute_value.encode(self._encoding))  # case C020
         error_code = self._library.niDCPower_SetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, attribute_value_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -3382,14 +4230,82 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         values_ctype = get_ctypes_pointer_for_buffer(value=values, library_type=visatype.ViReal64)  # case B550
         source_delays_ctype = get_ctypes_pointer_for_buffer(value=source_delays, library_type=visatype.ViReal64)  # case B550
         size_ctype = visatype.ViUInt32(0 if values is None else len(values))  # case S160
         error_code = self._library.niDCPower_SetSequence(vi_ctype, channel_name_ctype, values_ctype, source_delays_ctype, size_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
+    def stream_measurements(self, chunk=1000, count=None, num_buffers=4, timeout=datetime.timedelta(seconds=1.0)):
+        '''stream_measurements
+
+        Fetches the measurements of an initiated session in chunks of what has been acquired. Before each fetch, the
+                        generator reads fetch_backlog and fetches what is available, up to **chunk** measurements, into reusable
+                        buffers. When nothing has been acquired yet, it waits up to **timeout** for a single measurement, so a slow
+                        acquisition does not time out waiting for a full chunk. Reading what is ready as it is acquired keeps long
+                        acquisitions from overflowing measure_buffer_size.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        nidcpower.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        nidcpower.Session instance, and calling this method on the result.:
+
+            session.channels['0,1'].stream_measurements(chunk=1000, count=None, num_buffers=4, timeout='datetime.timedelta(seconds=1.0)')
+
+        Args:
+            chunk (int): The maximum number of measurements in each item. Fewer are returned when fewer have been acquired or are left to fetch.
+
+            count (int): The total number of measurements to fetch. When None, the measurements of one measure record are fetched if
+                                        measure_record_length_is_finite is True, and measurements are fetched until the generator is closed otherwise.
+                                        For sequences, pass the number of measure records times measure_record_length.
+
+            num_buffers (int): The number of preallocated buffers the measurements are fetched into. The arrays of an item stay valid until **num_buffers** more items have been fetched.
+
+            timeout (datetime.timedelta): The maximum time to wait for a measurement when none have been acquired yet.
+
+
+        Returns:
+            measurements (generator): Generator of (voltage_measurements, current_measurements, in_compliance, timestamps) tuples of numpy arrays of
+                                        float64, float64, bool and float64. **timestamps** is the time of each measurement in seconds, relative to the first
+                                        measurement fetched, computed from measure_record_delta_time.
+
+                                        Example:
+
+                                        .. code-block:: python
+
+                                            with session.initiate():
+                                                for voltage_measurements, current_measurements, in_compliance, timestamps in session.channels['0'].stream_measurements(chunk=1000):
+                                                    process(timestamps, voltage_measurements)
+
+        '''
+        import numpy
+
+        if chunk < 1:
+            raise ValueError('chunk must be at least 1, was {0}'.format(chunk))
+        if count is None and self.measure_record_length_is_finite:
+            count = self.measure_record_length
+        delta_time = self.measure_record_delta_time.total_seconds()
+        buffers = [(numpy.zeros(chunk, dtype=numpy.float64), numpy.zeros(chunk, dtype=numpy.float64), numpy.zeros(chunk, dtype=numpy.bool_), numpy.zeros(chunk, dtype=numpy.float64)) for _ in range(num_buffers)]
+        indices = numpy.arange(chunk, dtype=numpy.float64)
+
+        fetched = 0
+        item = 0
+        while count is None or fetched < count:
+            num_measurements = chunk if count is None else min(chunk, count - fetched)
+            # When nothing has been acquired yet, wait for a single measurement instead of a full chunk
+            num_measurements = min(num_measurements, max(int(self.fetch_backlog), 1))
+            voltage_measurements, current_measurements, in_compliance, timestamps = buffers[item % num_buffers]
+            actual_count = self.fetch_multiple_into(voltage_measurements[:num_measurements], current_measurements[:num_measurements], in_compliance[:num_measurements], timeout)
+            numpy.add(indices[:actual_count], fetched, out=timestamps[:actual_count])
+            numpy.multiply(timestamps[:actual_count], delta_time, out=timestamps[:actual_count])
+            fetched += actual_count
+            item += 1
+            yield voltage_measurements[:actual_count], current_measurements[:actual_count], in_compliance[:actual_count], timestamps[:actual_count]
+
     def _error_message(self, error_code):
         '''_error_message
 
@@ -3416,7 +4332,25 @@ class _SessionBase(object):
 
 
 class Session(_SessionBase):
-    '''An NI-DCPower session to a National Instruments Programmable Power Supply or Source Measure Unit.'''
+    '''An NI-DCPower session to a National Instruments Programmable Power Supply or Source Measure Unit.
+
+    Thread safety:
+
+    A session can be used from several threads. This applies to every method and property. No Python lock is held while the driver runs, and the driver runs one call on a session at a time. A method called, or a property set or read, while another call on the same session is in progress, directly or through the executor property, waits for that call to complete. Calls on different sessions run in parallel.
+
+    Calls made through the executor property run on the worker thread of the session, one at a time and in the order they were submitted.
+
+    Sequences of calls that depend on each other, such as setting the fetch properties and then fetching, are not atomic. Make them from one thread, or submit them to the executor as one callable. Generators, pipelines and buffer pools returned by the session are used from one thread at a time. Do not call close() while other threads use the session.
+    '''
+
+    _settable_names = _SessionBase._settable_names | frozenset([
+        '_executor',
+        '_executor_lock',
+        'attribute_cache_enabled',
+        'warning_interval',
+        'warning_policy',
+        'channels',
+    ])
 
     def __init__(self, resource_name, channels="", reset=False, options={}):
         '''An NI-DCPower session to a National Instruments Programmable Power Supply or Source Measure Unit.
@@ -3503,10 +4437,15 @@ class Session(_SessionBase):
             session (nidcpower.Session): A session object representing the device.
 
         '''
-        super(Session, self).__init__(repeated_capability='', vi=None, library=None, encoding=None, freeze_it=False)
+        super(Session, self).__init__(repeated_capability='', vi=None, library=None, encoding=None, attribute_cache=attributes.AttributeCache(), error_descriptions=_LruCache(64), warning_filter=errors._WarningFilter(), pending_descriptions=errors._PendingDescriptions(), freeze_it=False)
         options = _converters.convert_init_with_options_dictionary(options, self._encoding)
         self._library = library_singleton.get()
         self._encoding = 'windows-1251'
+        self._repeated_capability_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))
+
+        # The executor is created on first use, see the executor property
+        self._executor = None
+        self._executor_lock = threading.Lock()
 
         # Call specified init function
         self._vi = 0  # This must be set before calling _initialize_with_channels().
@@ -3534,10 +4473,49 @@ class Session(_SessionBase):
     def initiate(self):
         return _Acquisition(self)
 
+    @property
+    def attribute_cache_enabled(self):
+        '''attribute_cache_enabled
+
+        When True, property values are kept in a Python-side cache after they are first read from the
+        driver, so reading them again does not call into the driver. Methods that can change property
+        values, including setting a property, clear the cache. Properties that change on their own,
+        such as status or temperature, are never cached. Defaults to False.
+
+        Do not enable the cache if another session or process changes the configuration of the device.
+        '''
+        return self._attribute_cache.enabled
+
+    @attribute_cache_enabled.setter
+    def attribute_cache_enabled(self, value):
+        self._attribute_cache.clear()
+        self._attribute_cache.enabled = value
+
+    @property
+    def executor(self):
+        '''executor
+
+        Returns the executor.SessionExecutor that runs calls on this session on a
+        dedicated worker thread. The worker thread is started on first use and
+        stopped by close(), after any pending calls have completed.
+        '''
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = executor.SessionExecutor(self)
+            return self._executor
+
     def close(self):
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+        self.channels._clear_cache()
+        # The driver can't describe errors of the session once it is closed
+        self._pending_descriptions.resolve()
         try:
             self._close()
         except errors.Error as e:
+            self._pending_descriptions.resolve()
             self._vi = 0
             raise
         self._vi = 0
@@ -3596,6 +4574,7 @@ class Session(_SessionBase):
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
         error_code = self._library.niDCPower_Commit(vi_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -3643,6 +4622,7 @@ class Session(_SessionBase):
         input_terminal_ctype = ctypes.create_string_buffer(input_terminal.encode(self._encoding))  # case C020
         edge_ctype = visatype.ViInt32(edge.value)  # case S130
         error_code = self._library.niDCPower_ConfigureDigitalEdgeMeasureTrigger(vi_ctype, input_terminal_ctype, edge_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -3687,6 +4667,7 @@ class Session(_SessionBase):
         input_terminal_ctype = ctypes.create_string_buffer(input_terminal.encode(self._encoding))  # case C020
         edge_ctype = visatype.ViInt32(edge.value)  # case S130
         error_code = self._library.niDCPower_ConfigureDigitalEdgePulseTrigger(vi_ctype, input_terminal_ctype, edge_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -3735,6 +4716,7 @@ class Session(_SessionBase):
         input_terminal_ctype = ctypes.create_string_buffer(input_terminal.encode(self._encoding))  # case C020
         edge_ctype = visatype.ViInt32(edge.value)  # case S130
         error_code = self._library.niDCPower_ConfigureDigitalEdgeSequenceAdvanceTrigger(vi_ctype, input_terminal_ctype, edge_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -3782,6 +4764,7 @@ class Session(_SessionBase):
         input_terminal_ctype = ctypes.create_string_buffer(input_terminal.encode(self._encoding))  # case C020
         edge_ctype = visatype.ViInt32(edge.value)  # case S130
         error_code = self._library.niDCPower_ConfigureDigitalEdgeSourceTrigger(vi_ctype, input_terminal_ctype, edge_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -3829,6 +4812,7 @@ class Session(_SessionBase):
         input_terminal_ctype = ctypes.create_string_buffer(input_terminal.encode(self._encoding))  # case C020
         edge_ctype = visatype.ViInt32(edge.value)  # case S130
         error_code = self._library.niDCPower_ConfigureDigitalEdgeStartTrigger(vi_ctype, input_terminal_ctype, edge_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -3971,6 +4955,7 @@ class Session(_SessionBase):
         attribute_ids_ctype = get_ctypes_pointer_for_buffer(value=attribute_ids, library_type=visatype.ViInt32)  # case B550
         set_as_active_sequence_ctype = visatype.ViBoolean(set_as_active_sequence)  # case S150
         error_code = self._library.niDCPower_CreateAdvancedSequence(vi_ctype, sequence_name_ctype, attribute_id_count_ctype, attribute_ids_ctype, set_as_active_sequence_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -4013,6 +4998,7 @@ class Session(_SessionBase):
         vi_ctype = visatype.ViSession(self._vi)  # case S110
         set_as_active_step_ctype = visatype.ViBoolean(set_as_active_step)  # case S150
         error_code = self._library.niDCPower_CreateAdvancedSequenceStep(vi_ctype, set_as_active_step_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -4050,6 +5036,7 @@ class Session(_SessionBase):
         vi_ctype = visatype.ViSession(self._vi)  # case S110
         sequence_name_ctype = ctypes.create_string_buffer(sequence_name.encode(self._encoding))  # case C020
         error_code = self._library.niDCPower_DeleteAdvancedSequence(vi_ctype, sequence_name_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -4065,6 +5052,7 @@ class Session(_SessionBase):
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
         error_code = self._library.niDCPower_Disable(vi_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -4145,6 +5133,7 @@ class Session(_SessionBase):
         signal_identifier_ctype = ctypes.create_string_buffer(signal_identifier.encode(self._encoding))  # case C020
         output_terminal_ctype = ctypes.create_string_buffer(output_terminal.encode(self._encoding))  # case C020
         error_code = self._library.niDCPower_ExportSignal(vi_ctype, signal_ctype, signal_identifier_ctype, output_terminal_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -4407,6 +5396,7 @@ class Session(_SessionBase):
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
         error_code = self._library.niDCPower_Initiate(vi_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -4445,6 +5435,7 @@ class Session(_SessionBase):
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
         error_code = self._library.niDCPower_ResetDevice(vi_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -4461,6 +5452,7 @@ class Session(_SessionBase):
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
         error_code = self._library.niDCPower_ResetWithDefaults(vi_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -4521,6 +5513,9 @@ class Session(_SessionBase):
         Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__
         for more information about supported devices.
 
+        Note:
+        This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.
+
         Args:
             event_id (enums.Event): Specifies which event to wait for.
                 **Defined Values:**
@@ -4593,6 +5588,7 @@ class Session(_SessionBase):
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
         error_code = self._library.niDCPower_reset(vi_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -4607,6 +5603,9 @@ class Session(_SessionBase):
         _initialize_with_channels. You cannot self test a subset of
         PXIe-4162/4163 channels.
 
+        Note:
+        This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.
+
         Returns:
             self_test_result (int): Returns the value result from the device self-test.
 
@@ -4626,6 +5625,7 @@ class Session(_SessionBase):
         self_test_result_ctype = visatype.ViInt16()  # case S200
         self_test_message_ctype = (visatype.ViChar * 256)()  # case C070
         error_code = self._library.niDCPower_self_test(vi_ctype, None if self_test_result_ctype is None else (ctypes.pointer(self_test_result_ctype)), self_test_message_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(self_test_result_ctype.value), self_test_message_ctype.value.decode(self._encoding)
 
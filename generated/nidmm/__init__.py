@@ -4,5 +4,6 @@
 from nidmm.enums import *          # noqa: F403,F401,H303
 from nidmm.errors import Error     # noqa: F401
 from nidmm.errors import NidmmWarning   # noqa: F401
+from nidmm.errors import WarningPolicy   # noqa: F401
 from nidmm.session import Session  # noqa: F401
 
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+# This file was generated
+'''asyncio front-end for NI-DMM sessions.
+
+Blocking methods return awaitables. The underlying driver call runs on an executor, by default the
+worker thread of the session (see nidmm.Session.executor), so the event loop keeps running while
+the driver waits. Cancelling the awaitable before the call has started removes it from the queue, and
+asyncio.wait_for() can be used to put a timeout on it.
+
+All other methods and properties are forwarded to the synchronous nidmm.Session unchanged.
+
+Requires Python 3.4 or later.
+'''
+import asyncio
+
+from nidmm import session as _session
+
+
+class _RepeatedCapabilities(object):
+    def __init__(self, repeated_capabilities, executor):
+        self._repeated_capabilities = repeated_capabilities
+        self._executor = executor
+
+    def __getitem__(self, repeated_capability):
+        '''Set/get properties or call methods with a repeated capability (i.e. channels)'''
+        return _SessionBase(self._repeated_capabilities[repeated_capability], self._executor)
+
+
+class _SessionBase(object):
+    '''Base class for all asyncio NI-DMM sessions.'''
+
+    def __init__(self, session, executor):
+        object.__setattr__(self, '_session', session)
+        object.__setattr__(self, '_executor', executor)
+
+    def __repr__(self):
+        return '{0}.aio.{1}({2})'.format('nidmm', self.__class__.__name__, self._session._param_list)
+
+    def __getattr__(self, key):
+        return getattr(self._session, key)
+
+    def __setattr__(self, key, value):
+        setattr(self._session, key, value)
+
+    def run_in_executor(self, fn, *args, **kwargs):
+        '''run_in_executor
+
+        Schedules fn(*args, **kwargs) on the executor of this session and returns an awaitable for its result.
+        Use it to call methods that do not have an asyncio variant without blocking the event loop.
+        '''
+        return asyncio.wrap_future(self._executor.submit(fn, *args, **kwargs))
+
+
+class Session(_SessionBase):
+    '''asyncio variant of nidmm.Session'''
+
+    def __init__(self, resource_name, id_query=False, reset_device=False, options={}, executor=None):
+        '''asyncio variant of nidmm.Session
+
+        Opens the session synchronously; see nidmm.Session for the parameters.
+
+        Args:
+            executor (concurrent.futures.Executor): Executor that runs the blocking calls. Defaults to the worker
+                thread of the session. Pass a shared executor to bound the number of threads used by many sessions.
+        '''
+        session = _session.Session(resource_name, id_query, reset_device, options)
+        super(Session, self).__init__(session, session.executor if executor is None else executor)
+
+        # Instantiate any repeated capability objects
+
+    def __aenter__(self):
+        return asyncio.sleep(0, result=self)
+
+    def __aexit__(self, exc_type, exc_value, traceback):
+        return self.close()
+
+    def close(self):
+        '''close
+
+        Closes the session and returns an awaitable. Pending calls on the session executor complete first.
+        '''
+        # close() waits for the worker thread of the session, so it cannot run on it
+        return asyncio.get_event_loop().run_in_executor(None, self._session.close)
+
+    def fetch(self, *args, **kwargs):
+        '''fetch
+
+        asyncio variant of nidmm.Session.fetch. Takes the same parameters and returns an awaitable for its result.
+        '''
+        return self.run_in_executor(self._session.fetch, *args, **kwargs)
+
+    def fetch_multi_point(self, *args, **kwargs):
+        '''fetch_multi_point
+
+        asyncio variant of nidmm.Session.fetch_multi_point. Takes the same parameters and returns an awaitable for its result.
+        '''
+        return self.run_in_executor(self._session.fetch_multi_point, *args, **kwargs)
+
+    def fetch_waveform(self, *args, **kwargs):
+        '''fetch_waveform
+
+        asyncio variant of nidmm.Session.fetch_waveform. Takes the same parameters and returns an awaitable for its result.
+        '''
+        return self.run_in_executor(self._session.fetch_waveform, *args, **kwargs)
+
+    def fetch_waveform_into(self, *args, **kwargs):
+        '''fetch_waveform_into
+
+        asyncio variant of nidmm.Session.fetch_waveform_into. Takes the same parameters and returns an awaitable for its result.
+        '''
+        return self.run_in_executor(self._session.fetch_waveform_into, *args, **kwargs)
+
+    def read(self, *args, **kwargs):
+        '''read
+
+        asyncio variant of nidmm.Session.read. Takes the same parameters and returns an awaitable for its result.
+        '''
+        return self.run_in_executor(self._session.read, *args, **kwargs)
+
+    def read_multi_point(self, *args, **kwargs):
+        '''read_multi_point
+
+        asyncio variant of nidmm.Session.read_multi_point. Takes the same parameters and returns an awaitable for its result.
+        '''
+        return self.run_in_executor(self._session.read_multi_point, *args, **kwargs)
+
+    def read_waveform(self, *args, **kwargs):
+        '''read_waveform
+
+        asyncio variant of nidmm.Session.read_waveform. Takes the same parameters and returns an awaitable for its result.
+        '''
+        return self.run_in_executor(self._session.read_waveform, *args, **kwargs)
+
+    def self_cal(self, *args, **kwargs):
+        '''self_cal
+
+        asyncio variant of nidmm.Session.self_cal. Takes the same parameters and returns an awaitable for its result.
+        '''
+        return self.run_in_executor(self._session.self_cal, *args, **kwargs)
+
+    def self_test(self, *args, **kwargs):
+        '''self_test
+
+        asyncio variant of nidmm.Session.self_test. Takes the same parameters and returns an awaitable for its result.
+        '''
+        return self.run_in_executor(self._session.self_test, *args, **kwargs)
+
+
@@ -11,8 +11,66 @@ class Library(object):
 
     Wrapper around driver library.
     Class will setup the correct ctypes information for every function on first call.
+
+    Binding uses double-checked locking: _func_lock is only taken the first time a function
+    is called. Call bind_all_functions() to bind every function up front, after which no
+    call into the driver takes a Python-side lock.
     '''
 
+    # ctypes prototype (argtypes, restype) of every function in the driver library
+    _prototypes = {
+        'niDMM_Abort': ([ViSession], ViStatus),  # noqa: F405
+        'niDMM_ConfigureACBandwidth': ([ViSession, ViReal64, ViReal64], ViStatus),  # noqa: F405
+        'niDMM_ConfigureMeasurementAbsolute': ([ViSession, ViInt32, ViReal64, ViReal64], ViStatus),  # noqa: F405
+        'niDMM_ConfigureMeasurementDigits': ([ViSession, ViInt32, ViReal64, ViReal64], ViStatus),  # noqa: F405
+        'niDMM_ConfigureMultiPoint': ([ViSession, ViInt32, ViInt32, ViInt32, ViReal64], ViStatus),  # noqa: F405
+        'niDMM_ConfigureOpenCableCompValues': ([ViSession, ViReal64, ViReal64], ViStatus),  # noqa: F405
+        'niDMM_ConfigurePowerLineFrequency': ([ViSession, ViReal64], ViStatus),  # noqa: F405
+        'niDMM_ConfigureRTDCustom': ([ViSession, ViReal64, ViReal64, ViReal64], ViStatus),  # noqa: F405
+        'niDMM_ConfigureRTDType': ([ViSession, ViInt32, ViReal64], ViStatus),  # noqa: F405
+        'niDMM_ConfigureShortCableCompValues': ([ViSession, ViReal64, ViReal64], ViStatus),  # noqa: F405
+        'niDMM_ConfigureThermistorCustom': ([ViSession, ViReal64, ViReal64, ViReal64], ViStatus),  # noqa: F405
+        'niDMM_ConfigureThermocouple': ([ViSession, ViInt32, ViInt32], ViStatus),  # noqa: F405
+        'niDMM_ConfigureTrigger': ([ViSession, ViInt32, ViReal64], ViStatus),  # noqa: F405
+        'niDMM_ConfigureWaveformAcquisition': ([ViSession, ViInt32, ViReal64, ViReal64, ViInt32], ViStatus),  # noqa: F405
+        'niDMM_Disable': ([ViSession], ViStatus),  # noqa: F405
+        'niDMM_Fetch': ([ViSession, ViInt32, ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niDMM_FetchMultiPoint': ([ViSession, ViInt32, ViInt32, ctypes.POINTER(ViReal64), ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niDMM_FetchWaveform': ([ViSession, ViInt32, ViInt32, ctypes.POINTER(ViReal64), ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niDMM_GetApertureTimeInfo': ([ViSession, ctypes.POINTER(ViReal64), ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niDMM_GetAttributeViBoolean': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViBoolean)], ViStatus),  # noqa: F405
+        'niDMM_GetAttributeViInt32': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niDMM_GetAttributeViReal64': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niDMM_GetAttributeViString': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ViInt32, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niDMM_GetAutoRangeValue': ([ViSession, ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niDMM_GetCalDateAndTime': ([ViSession, ViInt32, ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niDMM_GetDevTemp': ([ViSession, ctypes.POINTER(ViChar), ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niDMM_GetError': ([ViSession, ctypes.POINTER(ViStatus), ViInt32, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niDMM_GetExtCalRecommendedInterval': ([ViSession, ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niDMM_GetLastCalTemp': ([ViSession, ViInt32, ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niDMM_GetMeasurementPeriod': ([ViSession, ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niDMM_GetSelfCalSupported': ([ViSession, ctypes.POINTER(ViBoolean)], ViStatus),  # noqa: F405
+        'niDMM_InitWithOptions': ([ctypes.POINTER(ViChar), ViBoolean, ViBoolean, ctypes.POINTER(ViChar), ctypes.POINTER(ViSession)], ViStatus),  # noqa: F405
+        'niDMM_Initiate': ([ViSession], ViStatus),  # noqa: F405
+        'niDMM_PerformOpenCableComp': ([ViSession, ctypes.POINTER(ViReal64), ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niDMM_PerformShortCableComp': ([ViSession, ctypes.POINTER(ViReal64), ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niDMM_Read': ([ViSession, ViInt32, ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niDMM_ReadMultiPoint': ([ViSession, ViInt32, ViInt32, ctypes.POINTER(ViReal64), ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niDMM_ReadStatus': ([ViSession, ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt16)], ViStatus),  # noqa: F405
+        'niDMM_ReadWaveform': ([ViSession, ViInt32, ViInt32, ctypes.POINTER(ViReal64), ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niDMM_ResetWithDefaults': ([ViSession], ViStatus),  # noqa: F405
+        'niDMM_SelfCal': ([ViSession], ViStatus),  # noqa: F405
+        'niDMM_SendSoftwareTrigger': ([ViSession], ViStatus),  # noqa: F405
+        'niDMM_SetAttributeViBoolean': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ViBoolean], ViStatus),  # noqa: F405
+        'niDMM_SetAttributeViInt32': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ViInt32], ViStatus),  # noqa: F405
+        'niDMM_SetAttributeViReal64': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ViReal64], ViStatus),  # noqa: F405
+        'niDMM_SetAttributeViString': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niDMM_close': ([ViSession], ViStatus),  # noqa: F405
+        'niDMM_error_message': ([ViSession, ViStatus, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niDMM_reset': ([ViSession], ViStatus),  # noqa: F405
+        'niDMM_self_test': ([ViSession, ctypes.POINTER(ViInt16), ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+    }
+
     def __init__(self, ctypes_library):
         self._func_lock = threading.Lock()
         self._library = ctypes_library
@@ -45,7 +103,6 @@ class Library(object):
         self.niDMM_GetDevTemp_cfunc = None
         self.niDMM_GetError_cfunc = None
         self.niDMM_GetExtCalRecommendedInterval_cfunc = None
-        self.niDMM_GetLastCalDateAndTime_cfunc = None
         self.niDMM_GetLastCalTemp_cfunc = None
         self.niDMM_GetMeasurementPeriod_cfunc = None
         self.niDMM_GetSelfCalSupported_cfunc = None
@@ -69,410 +126,324 @@ class Library(object):
         self.niDMM_reset_cfunc = None
         self.niDMM_self_test_cfunc = None
 
-    def niDMM_Abort(self, vi):  # noqa: N802
+    def _bind_function(self, c_func_name):
         with self._func_lock:
-            if self.niDMM_Abort_cfunc is None:
-                self.niDMM_Abort_cfunc = self._library.niDMM_Abort
-                self.niDMM_Abort_cfunc.argtypes = [ViSession]  # noqa: F405
-                self.niDMM_Abort_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_Abort_cfunc(vi)
+            cfunc = getattr(self, c_func_name + '_cfunc')
+            if cfunc is None:
+                cfunc = getattr(self._library, c_func_name)
+                cfunc.argtypes, cfunc.restype = self._prototypes[c_func_name]
+                # Only publish the cfunc once it is fully typed, other threads read it without the lock
+                setattr(self, c_func_name + '_cfunc', cfunc)
+        return cfunc
+
+    def bind_all_functions(self):
+        '''bind_all_functions
+
+        Resolves and sets up the ctypes information for every function in the driver library.
+        Functions not exported by the driver runtime are left unbound and raise on first call.
+        '''
+        for c_func_name in sorted(self._prototypes):
+            try:
+                self._bind_function(c_func_name)
+            except AttributeError:
+                pass
+
+    def niDMM_Abort(self, vi):  # noqa: N802
+        cfunc = self.niDMM_Abort_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_Abort')
+        return cfunc(vi)
 
     def niDMM_ConfigureACBandwidth(self, vi, ac_minimum_frequency_hz, ac_maximum_frequency_hz):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_ConfigureACBandwidth_cfunc is None:
-                self.niDMM_ConfigureACBandwidth_cfunc = self._library.niDMM_ConfigureACBandwidth
-                self.niDMM_ConfigureACBandwidth_cfunc.argtypes = [ViSession, ViReal64, ViReal64]  # noqa: F405
-                self.niDMM_ConfigureACBandwidth_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_ConfigureACBandwidth_cfunc(vi, ac_minimum_frequency_hz, ac_maximum_frequency_hz)
+        cfunc = self.niDMM_ConfigureACBandwidth_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_ConfigureACBandwidth')
+        return cfunc(vi, ac_minimum_frequency_hz, ac_maximum_frequency_hz)
 
     def niDMM_ConfigureMeasurementAbsolute(self, vi, measurement_function, range, resolution_absolute):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_ConfigureMeasurementAbsolute_cfunc is None:
-                self.niDMM_ConfigureMeasurementAbsolute_cfunc = self._library.niDMM_ConfigureMeasurementAbsolute
-                self.niDMM_ConfigureMeasurementAbsolute_cfunc.argtypes = [ViSession, ViInt32, ViReal64, ViReal64]  # noqa: F405
-                self.niDMM_ConfigureMeasurementAbsolute_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_ConfigureMeasurementAbsolute_cfunc(vi, measurement_function, range, resolution_absolute)
+        cfunc = self.niDMM_ConfigureMeasurementAbsolute_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_ConfigureMeasurementAbsolute')
+        return cfunc(vi, measurement_function, range, resolution_absolute)
 
     def niDMM_ConfigureMeasurementDigits(self, vi, measurement_function, range, resolution_digits):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_ConfigureMeasurementDigits_cfunc is None:
-                self.niDMM_ConfigureMeasurementDigits_cfunc = self._library.niDMM_ConfigureMeasurementDigits
-                self.niDMM_ConfigureMeasurementDigits_cfunc.argtypes = [ViSession, ViInt32, ViReal64, ViReal64]  # noqa: F405
-                self.niDMM_ConfigureMeasurementDigits_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_ConfigureMeasurementDigits_cfunc(vi, measurement_function, range, resolution_digits)
+        cfunc = self.niDMM_ConfigureMeasurementDigits_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_ConfigureMeasurementDigits')
+        return cfunc(vi, measurement_function, range, resolution_digits)
 
     def niDMM_ConfigureMultiPoint(self, vi, trigger_count, sample_count, sample_trigger, sample_interval):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_ConfigureMultiPoint_cfunc is None:
-                self.niDMM_ConfigureMultiPoint_cfunc = self._library.niDMM_ConfigureMultiPoint
-                self.niDMM_ConfigureMultiPoint_cfunc.argtypes = [ViSession, ViInt32, ViInt32, ViInt32, ViReal64]  # noqa: F405
-                self.niDMM_ConfigureMultiPoint_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_ConfigureMultiPoint_cfunc(vi, trigger_count, sample_count, sample_trigger, sample_interval)
+        cfunc = self.niDMM_ConfigureMultiPoint_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_ConfigureMultiPoint')
+        return cfunc(vi, trigger_count, sample_count, sample_trigger, sample_interval)
 
     def niDMM_ConfigureOpenCableCompValues(self, vi, conductance, susceptance):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_ConfigureOpenCableCompValues_cfunc is None:
-                self.niDMM_ConfigureOpenCableCompValues_cfunc = self._library.niDMM_ConfigureOpenCableCompValues
-                self.niDMM_ConfigureOpenCableCompValues_cfunc.argtypes = [ViSession, ViReal64, ViReal64]  # noqa: F405
-                self.niDMM_ConfigureOpenCableCompValues_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_ConfigureOpenCableCompValues_cfunc(vi, conductance, susceptance)
+        cfunc = self.niDMM_ConfigureOpenCableCompValues_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_ConfigureOpenCableCompValues')
+        return cfunc(vi, conductance, susceptance)
 
     def niDMM_ConfigurePowerLineFrequency(self, vi, power_line_frequency_hz):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_ConfigurePowerLineFrequency_cfunc is None:
-                self.niDMM_ConfigurePowerLineFrequency_cfunc = self._library.niDMM_ConfigurePowerLineFrequency
-                self.niDMM_ConfigurePowerLineFrequency_cfunc.argtypes = [ViSession, ViReal64]  # noqa: F405
-                self.niDMM_ConfigurePowerLineFrequency_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_ConfigurePowerLineFrequency_cfunc(vi, power_line_frequency_hz)
+        cfunc = self.niDMM_ConfigurePowerLineFrequency_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_ConfigurePowerLineFrequency')
+        return cfunc(vi, power_line_frequency_hz)
 
     def niDMM_ConfigureRTDCustom(self, vi, rtd_a, rtd_b, rtd_c):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_ConfigureRTDCustom_cfunc is None:
-                self.niDMM_ConfigureRTDCustom_cfunc = self._library.niDMM_ConfigureRTDCustom
-                self.niDMM_ConfigureRTDCustom_cfunc.argtypes = [ViSession, ViReal64, ViReal64, ViReal64]  # noqa: F405
-                self.niDMM_ConfigureRTDCustom_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_ConfigureRTDCustom_cfunc(vi, rtd_a, rtd_b, rtd_c)
+        cfunc = self.niDMM_ConfigureRTDCustom_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_ConfigureRTDCustom')
+        return cfunc(vi, rtd_a, rtd_b, rtd_c)
 
     def niDMM_ConfigureRTDType(self, vi, rtd_type, rtd_resistance):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_ConfigureRTDType_cfunc is None:
-                self.niDMM_ConfigureRTDType_cfunc = self._library.niDMM_ConfigureRTDType
-                self.niDMM_ConfigureRTDType_cfunc.argtypes = [ViSession, ViInt32, ViReal64]  # noqa: F405
-                self.niDMM_ConfigureRTDType_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_ConfigureRTDType_cfunc(vi, rtd_type, rtd_resistance)
+        cfunc = self.niDMM_ConfigureRTDType_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_ConfigureRTDType')
+        return cfunc(vi, rtd_type, rtd_resistance)
 
     def niDMM_ConfigureShortCableCompValues(self, vi, resistance, reactance):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_ConfigureShortCableCompValues_cfunc is None:
-                self.niDMM_ConfigureShortCableCompValues_cfunc = self._library.niDMM_ConfigureShortCableCompValues
-                self.niDMM_ConfigureShortCableCompValues_cfunc.argtypes = [ViSession, ViReal64, ViReal64]  # noqa: F405
-                self.niDMM_ConfigureShortCableCompValues_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_ConfigureShortCableCompValues_cfunc(vi, resistance, reactance)
+        cfunc = self.niDMM_ConfigureShortCableCompValues_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_ConfigureShortCableCompValues')
+        return cfunc(vi, resistance, reactance)
 
     def niDMM_ConfigureThermistorCustom(self, vi, thermistor_a, thermistor_b, thermistor_c):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_ConfigureThermistorCustom_cfunc is None:
-                self.niDMM_ConfigureThermistorCustom_cfunc = self._library.niDMM_ConfigureThermistorCustom
-                self.niDMM_ConfigureThermistorCustom_cfunc.argtypes = [ViSession, ViReal64, ViReal64, ViReal64]  # noqa: F405
-                self.niDMM_ConfigureThermistorCustom_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_ConfigureThermistorCustom_cfunc(vi, thermistor_a, thermistor_b, thermistor_c)
+        cfunc = self.niDMM_ConfigureThermistorCustom_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_ConfigureThermistorCustom')
+        return cfunc(vi, thermistor_a, thermistor_b, thermistor_c)
 
     def niDMM_ConfigureThermocouple(self, vi, thermocouple_type, reference_junction_type):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_ConfigureThermocouple_cfunc is None:
-                self.niDMM_ConfigureThermocouple_cfunc = self._library.niDMM_ConfigureThermocouple
-                self.niDMM_ConfigureThermocouple_cfunc.argtypes = [ViSession, ViInt32, ViInt32]  # noqa: F405
-                self.niDMM_ConfigureThermocouple_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_ConfigureThermocouple_cfunc(vi, thermocouple_type, reference_junction_type)
+        cfunc = self.niDMM_ConfigureThermocouple_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_ConfigureThermocouple')
+        return cfunc(vi, thermocouple_type, reference_junction_type)
 
     def niDMM_ConfigureTrigger(self, vi, trigger_source, trigger_delay):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_ConfigureTrigger_cfunc is None:
-                self.niDMM_ConfigureTrigger_cfunc = self._library.niDMM_ConfigureTrigger
-                self.niDMM_ConfigureTrigger_cfunc.argtypes = [ViSession, ViInt32, ViReal64]  # noqa: F405
-                self.niDMM_ConfigureTrigger_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_ConfigureTrigger_cfunc(vi, trigger_source, trigger_delay)
+        cfunc = self.niDMM_ConfigureTrigger_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_ConfigureTrigger')
+        return cfunc(vi, trigger_source, trigger_delay)
 
     def niDMM_ConfigureWaveformAcquisition(self, vi, measurement_function, range, rate, waveform_points):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_ConfigureWaveformAcquisition_cfunc is None:
-                self.niDMM_ConfigureWaveformAcquisition_cfunc = self._library.niDMM_ConfigureWaveformAcquisition
-                self.niDMM_ConfigureWaveformAcquisition_cfunc.argtypes = [ViSession, ViInt32, ViReal64, ViReal64, ViInt32]  # noqa: F405
-                self.niDMM_ConfigureWaveformAcquisition_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_ConfigureWaveformAcquisition_cfunc(vi, measurement_function, range, rate, waveform_points)
+        cfunc = self.niDMM_ConfigureWaveformAcquisition_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_ConfigureWaveformAcquisition')
+        return cfunc(vi, measurement_function, range, rate, waveform_points)
 
     def niDMM_Disable(self, vi):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_Disable_cfunc is None:
-                self.niDMM_Disable_cfunc = self._library.niDMM_Disable
-                self.niDMM_Disable_cfunc.argtypes = [ViSession]  # noqa: F405
-                self.niDMM_Disable_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_Disable_cfunc(vi)
+        cfunc = self.niDMM_Disable_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_Disable')
+        return cfunc(vi)
 
     def niDMM_Fetch(self, vi, maximum_time, reading):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_Fetch_cfunc is None:
-                self.niDMM_Fetch_cfunc = self._library.niDMM_Fetch
-                self.niDMM_Fetch_cfunc.argtypes = [ViSession, ViInt32, ctypes.POINTER(ViReal64)]  # noqa: F405
-                self.niDMM_Fetch_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_Fetch_cfunc(vi, maximum_time, reading)
+        cfunc = self.niDMM_Fetch_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_Fetch')
+        return cfunc(vi, maximum_time, reading)
 
     def niDMM_FetchMultiPoint(self, vi, maximum_time, array_size, reading_array, actual_number_of_points):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_FetchMultiPoint_cfunc is None:
-                self.niDMM_FetchMultiPoint_cfunc = self._library.niDMM_FetchMultiPoint
-                self.niDMM_FetchMultiPoint_cfunc.argtypes = [ViSession, ViInt32, ViInt32, ctypes.POINTER(ViReal64), ctypes.POINTER(ViInt32)]  # noqa: F405
-                self.niDMM_FetchMultiPoint_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_FetchMultiPoint_cfunc(vi, maximum_time, array_size, reading_array, actual_number_of_points)
+        cfunc = self.niDMM_FetchMultiPoint_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_FetchMultiPoint')
+        return cfunc(vi, maximum_time, array_size, reading_array, actual_number_of_points)
 
     def niDMM_FetchWaveform(self, vi, maximum_time, array_size, waveform_array, actual_number_of_points):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_FetchWaveform_cfunc is None:
-                self.niDMM_FetchWaveform_cfunc = self._library.niDMM_FetchWaveform
-                self.niDMM_FetchWaveform_cfunc.argtypes = [ViSession, ViInt32, ViInt32, ctypes.POINTER(ViReal64), ctypes.POINTER(ViInt32)]  # noqa: F405
-                self.niDMM_FetchWaveform_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_FetchWaveform_cfunc(vi, maximum_time, array_size, waveform_array, actual_number_of_points)
+        cfunc = self.niDMM_FetchWaveform_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_FetchWaveform')
+        return cfunc(vi, maximum_time, array_size, waveform_array, actual_number_of_points)
 
     def niDMM_GetApertureTimeInfo(self, vi, aperture_time, aperture_time_units):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_GetApertureTimeInfo_cfunc is None:
-                self.niDMM_GetApertureTimeInfo_cfunc = self._library.niDMM_GetApertureTimeInfo
-                self.niDMM_GetApertureTimeInfo_cfunc.argtypes = [ViSession, ctypes.POINTER(ViReal64), ctypes.POINTER(ViInt32)]  # noqa: F405
-                self.niDMM_GetApertureTimeInfo_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_GetApertureTimeInfo_cfunc(vi, aperture_time, aperture_time_units)
+        cfunc = self.niDMM_GetApertureTimeInfo_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_GetApertureTimeInfo')
+        return cfunc(vi, aperture_time, aperture_time_units)
 
     def niDMM_GetAttributeViBoolean(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_GetAttributeViBoolean_cfunc is None:
-                self.niDMM_GetAttributeViBoolean_cfunc = self._library.niDMM_GetAttributeViBoolean
-                self.niDMM_GetAttributeViBoolean_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViBoolean)]  # noqa: F405
-                self.niDMM_GetAttributeViBoolean_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_GetAttributeViBoolean_cfunc(vi, channel_name, attribute_id, attribute_value)
+        cfunc = self.niDMM_GetAttributeViBoolean_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_GetAttributeViBoolean')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
 
     def niDMM_GetAttributeViInt32(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_GetAttributeViInt32_cfunc is None:
-                self.niDMM_GetAttributeViInt32_cfunc = self._library.niDMM_GetAttributeViInt32
-                self.niDMM_GetAttributeViInt32_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViInt32)]  # noqa: F405
-                self.niDMM_GetAttributeViInt32_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_GetAttributeViInt32_cfunc(vi, channel_name, attribute_id, attribute_value)
+        cfunc = self.niDMM_GetAttributeViInt32_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_GetAttributeViInt32')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
 
     def niDMM_GetAttributeViReal64(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_GetAttributeViReal64_cfunc is None:
-                self.niDMM_GetAttributeViReal64_cfunc = self._library.niDMM_GetAttributeViReal64
-                self.niDMM_GetAttributeViReal64_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViReal64)]  # noqa: F405
-                self.niDMM_GetAttributeViReal64_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_GetAttributeViReal64_cfunc(vi, channel_name, attribute_id, attribute_value)
+        cfunc = self.niDMM_GetAttributeViReal64_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_GetAttributeViReal64')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
 
     def niDMM_GetAttributeViString(self, vi, channel_name, attribute_id, buffer_size, attribute_value):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_GetAttributeViString_cfunc is None:
-                self.niDMM_GetAttributeViString_cfunc = self._library.niDMM_GetAttributeViString
-                self.niDMM_GetAttributeViString_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ViInt32, ctypes.POINTER(ViChar)]  # noqa: F405
-                self.niDMM_GetAttributeViString_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_GetAttributeViString_cfunc(vi, channel_name, attribute_id, buffer_size, attribute_value)
+        cfunc = self.niDMM_GetAttributeViString_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_GetAttributeViString')
+        return cfunc(vi, channel_name, attribute_id, buffer_size, attribute_value)
 
     def niDMM_GetAutoRangeValue(self, vi, actual_range):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_GetAutoRangeValue_cfunc is None:
-                self.niDMM_GetAutoRangeValue_cfunc = self._library.niDMM_GetAutoRangeValue
-                self.niDMM_GetAutoRangeValue_cfunc.argtypes = [ViSession, ctypes.POINTER(ViReal64)]  # noqa: F405
-                self.niDMM_GetAutoRangeValue_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_GetAutoRangeValue_cfunc(vi, actual_range)
+        cfunc = self.niDMM_GetAutoRangeValue_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_GetAutoRangeValue')
+        return cfunc(vi, actual_range)
 
     def niDMM_GetCalDateAndTime(self, vi, cal_type, month, day, year, hour, minute):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_GetCalDateAndTime_cfunc is None:
-                self.niDMM_GetCalDateAndTime_cfunc = self._library.niDMM_GetCalDateAndTime
-                self.niDMM_GetCalDateAndTime_cfunc.argtypes = [ViSession, ViInt32, ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32)]  # noqa: F405
-                self.niDMM_GetCalDateAndTime_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_GetCalDateAndTime_cfunc(vi, cal_type, month, day, year, hour, minute)
+        cfunc = self.niDMM_GetCalDateAndTime_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_GetCalDateAndTime')
+        return cfunc(vi, cal_type, month, day, year, hour, minute)
 
     def niDMM_GetDevTemp(self, vi, options, temperature):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_GetDevTemp_cfunc is None:
-                self.niDMM_GetDevTemp_cfunc = self._library.niDMM_GetDevTemp
-                self.niDMM_GetDevTemp_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ctypes.POINTER(ViReal64)]  # noqa: F405
-                self.niDMM_GetDevTemp_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_GetDevTemp_cfunc(vi, options, temperature)
+        cfunc = self.niDMM_GetDevTemp_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_GetDevTemp')
+        return cfunc(vi, options, temperature)
 
     def niDMM_GetError(self, vi, error_code, buffer_size, description):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_GetError_cfunc is None:
-                self.niDMM_GetError_cfunc = self._library.niDMM_GetError
-                self.niDMM_GetError_cfunc.argtypes = [ViSession, ctypes.POINTER(ViStatus), ViInt32, ctypes.POINTER(ViChar)]  # noqa: F405
-                self.niDMM_GetError_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_GetError_cfunc(vi, error_code, buffer_size, description)
+        cfunc = self.niDMM_GetError_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_GetError')
+        return cfunc(vi, error_code, buffer_size, description)
 
     def niDMM_GetExtCalRecommendedInterval(self, vi, months):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_GetExtCalRecommendedInterval_cfunc is None:
-                self.niDMM_GetExtCalRecommendedInterval_cfunc = self._library.niDMM_GetExtCalRecommendedInterval
-                self.niDMM_GetExtCalRecommendedInterval_cfunc.argtypes = [ViSession, ctypes.POINTER(ViInt32)]  # noqa: F405
-                self.niDMM_GetExtCalRecommendedInterval_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_GetExtCalRecommendedInterval_cfunc(vi, months)
-
-    def niDMM_GetLastCalDateAndTime(self, vi, cal_type, month):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_GetLastCalDateAndTime_cfunc is None:
-                self.niDMM_GetLastCalDateAndTime_cfunc = self._library.niDMM_GetLastCalDateAndTime
-                self.niDMM_GetLastCalDateAndTime_cfunc.argtypes = [ViSession, ViInt32, ctypes.POINTER(datetime.datetime)]  # noqa: F405
-                self.niDMM_GetLastCalDateAndTime_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_GetLastCalDateAndTime_cfunc(vi, cal_type, month)
+        cfunc = self.niDMM_GetExtCalRecommendedInterval_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_GetExtCalRecommendedInterval')
+        return cfunc(vi, months)
 
     def niDMM_GetLastCalTemp(self, vi, cal_type, temperature):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_GetLastCalTemp_cfunc is None:
-                self.niDMM_GetLastCalTemp_cfunc = self._library.niDMM_GetLastCalTemp
-                self.niDMM_GetLastCalTemp_cfunc.argtypes = [ViSession, ViInt32, ctypes.POINTER(ViReal64)]  # noqa: F405
-                self.niDMM_GetLastCalTemp_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_GetLastCalTemp_cfunc(vi, cal_type, temperature)
+        cfunc = self.niDMM_GetLastCalTemp_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_GetLastCalTemp')
+        return cfunc(vi, cal_type, temperature)
 
     def niDMM_GetMeasurementPeriod(self, vi, period):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_GetMeasurementPeriod_cfunc is None:
-                self.niDMM_GetMeasurementPeriod_cfunc = self._library.niDMM_GetMeasurementPeriod
-                self.niDMM_GetMeasurementPeriod_cfunc.argtypes = [ViSession, ctypes.POINTER(ViReal64)]  # noqa: F405
-                self.niDMM_GetMeasurementPeriod_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_GetMeasurementPeriod_cfunc(vi, period)
+        cfunc = self.niDMM_GetMeasurementPeriod_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_GetMeasurementPeriod')
+        return cfunc(vi, period)
 
     def niDMM_GetSelfCalSupported(self, vi, self_cal_supported):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_GetSelfCalSupported_cfunc is None:
-                self.niDMM_GetSelfCalSupported_cfunc = self._library.niDMM_GetSelfCalSupported
-                self.niDMM_GetSelfCalSupported_cfunc.argtypes = [ViSession, ctypes.POINTER(ViBoolean)]  # noqa: F405
-                self.niDMM_GetSelfCalSupported_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_GetSelfCalSupported_cfunc(vi, self_cal_supported)
+        cfunc = self.niDMM_GetSelfCalSupported_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_GetSelfCalSupported')
+        return cfunc(vi, self_cal_supported)
 
     def niDMM_InitWithOptions(self, resource_name, id_query, reset_device, option_string, vi):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_InitWithOptions_cfunc is None:
-                self.niDMM_InitWithOptions_cfunc = self._library.niDMM_InitWithOptions
-                self.niDMM_InitWithOptions_cfunc.argtypes = [ctypes.POINTER(ViChar), ViBoolean, ViBoolean, ctypes.POINTER(ViChar), ctypes.POINTER(ViSession)]  # noqa: F405
-                self.niDMM_InitWithOptions_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_InitWithOptions_cfunc(resource_name, id_query, reset_device, option_string, vi)
+        cfunc = self.niDMM_InitWithOptions_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_InitWithOptions')
+        return cfunc(resource_name, id_query, reset_device, option_string, vi)
 
     def niDMM_Initiate(self, vi):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_Initiate_cfunc is None:
-                self.niDMM_Initiate_cfunc = self._library.niDMM_Initiate
-                self.niDMM_Initiate_cfunc.argtypes = [ViSession]  # noqa: F405
-                self.niDMM_Initiate_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_Initiate_cfunc(vi)
+        cfunc = self.niDMM_Initiate_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_Initiate')
+        return cfunc(vi)
 
     def niDMM_PerformOpenCableComp(self, vi, conductance, susceptance):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_PerformOpenCableComp_cfunc is None:
-                self.niDMM_PerformOpenCableComp_cfunc = self._library.niDMM_PerformOpenCableComp
-                self.niDMM_PerformOpenCableComp_cfunc.argtypes = [ViSession, ctypes.POINTER(ViReal64), ctypes.POINTER(ViReal64)]  # noqa: F405
-                self.niDMM_PerformOpenCableComp_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_PerformOpenCableComp_cfunc(vi, conductance, susceptance)
+        cfunc = self.niDMM_PerformOpenCableComp_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_PerformOpenCableComp')
+        return cfunc(vi, conductance, susceptance)
 
     def niDMM_PerformShortCableComp(self, vi, resistance, reactance):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_PerformShortCableComp_cfunc is None:
-                self.niDMM_PerformShortCableComp_cfunc = self._library.niDMM_PerformShortCableComp
-                self.niDMM_PerformShortCableComp_cfunc.argtypes = [ViSession, ctypes.POINTER(ViReal64), ctypes.POINTER(ViReal64)]  # noqa: F405
-                self.niDMM_PerformShortCableComp_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_PerformShortCableComp_cfunc(vi, resistance, reactance)
+        cfunc = self.niDMM_PerformShortCableComp_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_PerformShortCableComp')
+        return cfunc(vi, resistance, reactance)
 
     def niDMM_Read(self, vi, maximum_time, reading):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_Read_cfunc is None:
-                self.niDMM_Read_cfunc = self._library.niDMM_Read
-                self.niDMM_Read_cfunc.argtypes = [ViSession, ViInt32, ctypes.POINTER(ViReal64)]  # noqa: F405
-                self.niDMM_Read_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_Read_cfunc(vi, maximum_time, reading)
+        cfunc = self.niDMM_Read_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_Read')
+        return cfunc(vi, maximum_time, reading)
 
     def niDMM_ReadMultiPoint(self, vi, maximum_time, array_size, reading_array, actual_number_of_points):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_ReadMultiPoint_cfunc is None:
-                self.niDMM_ReadMultiPoint_cfunc = self._library.niDMM_ReadMultiPoint
-                self.niDMM_ReadMultiPoint_cfunc.argtypes = [ViSession, ViInt32, ViInt32, ctypes.POINTER(ViReal64), ctypes.POINTER(ViInt32)]  # noqa: F405
-                self.niDMM_ReadMultiPoint_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_ReadMultiPoint_cfunc(vi, maximum_time, array_size, reading_array, actual_number_of_points)
+        cfunc = self.niDMM_ReadMultiPoint_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_ReadMultiPoint')
+        return cfunc(vi, maximum_time, array_size, reading_array, actual_number_of_points)
 
     def niDMM_ReadStatus(self, vi, acquisition_backlog, acquisition_status):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_ReadStatus_cfunc is None:
-                self.niDMM_ReadStatus_cfunc = self._library.niDMM_ReadStatus
-                self.niDMM_ReadStatus_cfunc.argtypes = [ViSession, ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt16)]  # noqa: F405
-                self.niDMM_ReadStatus_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_ReadStatus_cfunc(vi, acquisition_backlog, acquisition_status)
+        cfunc = self.niDMM_ReadStatus_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_ReadStatus')
+        return cfunc(vi, acquisition_backlog, acquisition_status)
 
     def niDMM_ReadWaveform(self, vi, maximum_time, array_size, waveform_array, actual_number_of_points):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_ReadWaveform_cfunc is None:
-                self.niDMM_ReadWaveform_cfunc = self._library.niDMM_ReadWaveform
-                self.niDMM_ReadWaveform_cfunc.argtypes = [ViSession, ViInt32, ViInt32, ctypes.POINTER(ViReal64), ctypes.POINTER(ViInt32)]  # noqa: F405
-                self.niDMM_ReadWaveform_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_ReadWaveform_cfunc(vi, maximum_time, array_size, waveform_array, actual_number_of_points)
+        cfunc = self.niDMM_ReadWaveform_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_ReadWaveform')
+        return cfunc(vi, maximum_time, array_size, waveform_array, actual_number_of_points)
 
     def niDMM_ResetWithDefaults(self, vi):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_ResetWithDefaults_cfunc is None:
-                self.niDMM_ResetWithDefaults_cfunc = self._library.niDMM_ResetWithDefaults
-                self.niDMM_ResetWithDefaults_cfunc.argtypes = [ViSession]  # noqa: F405
-                self.niDMM_ResetWithDefaults_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_ResetWithDefaults_cfunc(vi)
+        cfunc = self.niDMM_ResetWithDefaults_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_ResetWithDefaults')
+        return cfunc(vi)
 
     def niDMM_SelfCal(self, vi):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_SelfCal_cfunc is None:
-                self.niDMM_SelfCal_cfunc = self._library.niDMM_SelfCal
-                self.niDMM_SelfCal_cfunc.argtypes = [ViSession]  # noqa: F405
-                self.niDMM_SelfCal_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_SelfCal_cfunc(vi)
+        cfunc = self.niDMM_SelfCal_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_SelfCal')
+        return cfunc(vi)
 
     def niDMM_SendSoftwareTrigger(self, vi):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_SendSoftwareTrigger_cfunc is None:
-                self.niDMM_SendSoftwareTrigger_cfunc = self._library.niDMM_SendSoftwareTrigger
-                self.niDMM_SendSoftwareTrigger_cfunc.argtypes = [ViSession]  # noqa: F405
-                self.niDMM_SendSoftwareTrigger_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_SendSoftwareTrigger_cfunc(vi)
+        cfunc = self.niDMM_SendSoftwareTrigger_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_SendSoftwareTrigger')
+        return cfunc(vi)
 
     def niDMM_SetAttributeViBoolean(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_SetAttributeViBoolean_cfunc is None:
-                self.niDMM_SetAttributeViBoolean_cfunc = self._library.niDMM_SetAttributeViBoolean
-                self.niDMM_SetAttributeViBoolean_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ViBoolean]  # noqa: F405
-                self.niDMM_SetAttributeViBoolean_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_SetAttributeViBoolean_cfunc(vi, channel_name, attribute_id, attribute_value)
+        cfunc = self.niDMM_SetAttributeViBoolean_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_SetAttributeViBoolean')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
 
     def niDMM_SetAttributeViInt32(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_SetAttributeViInt32_cfunc is None:
-                self.niDMM_SetAttributeViInt32_cfunc = self._library.niDMM_SetAttributeViInt32
-                self.niDMM_SetAttributeViInt32_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ViInt32]  # noqa: F405
-                self.niDMM_SetAttributeViInt32_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_SetAttributeViInt32_cfunc(vi, channel_name, attribute_id, attribute_value)
+        cfunc = self.niDMM_SetAttributeViInt32_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_SetAttributeViInt32')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
 
     def niDMM_SetAttributeViReal64(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_SetAttributeViReal64_cfunc is None:
-                self.niDMM_SetAttributeViReal64_cfunc = self._library.niDMM_SetAttributeViReal64
-                self.niDMM_SetAttributeViReal64_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ViReal64]  # noqa: F405
-                self.niDMM_SetAttributeViReal64_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_SetAttributeViReal64_cfunc(vi, channel_name, attribute_id, attribute_value)
+        cfunc = self.niDMM_SetAttributeViReal64_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_SetAttributeViReal64')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
 
     def niDMM_SetAttributeViString(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_SetAttributeViString_cfunc is None:
-                self.niDMM_SetAttributeViString_cfunc = self._library.niDMM_SetAttributeViString
-                self.niDMM_SetAttributeViString_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViChar)]  # noqa: F405
-                self.niDMM_SetAttributeViString_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_SetAttributeViString_cfunc(vi, channel_name, attribute_id, attribute_value)
+        cfunc = self.niDMM_SetAttributeViString_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_SetAttributeViString')
+        return cfunc(vi, channel_name, attribute_id, attribute_value)
 
     def niDMM_close(self, vi):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_close_cfunc is None:
-                self.niDMM_close_cfunc = self._library.niDMM_close
-                self.niDMM_close_cfunc.argtypes = [ViSession]  # noqa: F405
-                self.niDMM_close_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_close_cfunc(vi)
+        cfunc = self.niDMM_close_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_close')
+        return cfunc(vi)
 
     def niDMM_error_message(self, vi, error_code, error_message):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_error_message_cfunc is None:
-                self.niDMM_error_message_cfunc = self._library.niDMM_error_message
-                self.niDMM_error_message_cfunc.argtypes = [ViSession, ViStatus, ctypes.POINTER(ViChar)]  # noqa: F405
-                self.niDMM_error_message_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_error_message_cfunc(vi, error_code, error_message)
+        cfunc = self.niDMM_error_message_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_error_message')
+        return cfunc(vi, error_code, error_message)
 
     def niDMM_reset(self, vi):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_reset_cfunc is None:
-                self.niDMM_reset_cfunc = self._library.niDMM_reset
-                self.niDMM_reset_cfunc.argtypes = [ViSession]  # noqa: F405
-                self.niDMM_reset_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_reset_cfunc(vi)
+        cfunc = self.niDMM_reset_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_reset')
+        return cfunc(vi)
 
     def niDMM_self_test(self, vi, self_test_result, self_test_message):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_self_test_cfunc is None:
-                self.niDMM_self_test_cfunc = self._library.niDMM_self_test
-                self.niDMM_self_test_cfunc.argtypes = [ViSession, ctypes.POINTER(ViInt16), ctypes.POINTER(ViChar)]  # noqa: F405
-                self.niDMM_self_test_cfunc.restype = ViStatus  # noqa: F405
-        return self.niDMM_self_test_cfunc(vi, self_test_result, self_test_message)
+        cfunc = self.niDMM_self_test_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niDMM_self_test')
+        return cfunc(vi, self_test_result, self_test_message)
@@ -4,6 +4,7 @@
 from nifake.enums import *          # noqa: F403,F401,H303
 from nifake.errors import Error     # noqa: F401
 from nifake.errors import NifakeWarning   # noqa: F401
+from nifake.errors import WarningPolicy   # noqa: F401
 from nifake.session import Session  # noqa: F401
 
 from nifake.custom_struct import CustomStruct  # noqa: F401
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+# This file was generated
+'''asyncio front-end for NI-FAKE sessions.
+
+Blocking methods return awaitables. The underlying driver call runs on an executor, by default the
+worker thread of the session (see nifake.Session.executor), so the event loop keeps running while
+the driver waits. Cancelling the awaitable before the call has started removes it from the queue, and
+asyncio.wait_for() can be used to put a timeout on it.
+
+All other methods and properties are forwarded to the synchronous nifake.Session unchanged.
+
+Requires Python 3.4 or later.
+'''
+import asyncio
+
+from nifake import session as _session
+
+
+class _RepeatedCapabilities(object):
+    def __init__(self, repeated_capabilities, executor):
+        self._repeated_capabilities = repeated_capabilities
+        self._executor = executor
+
+    def __getitem__(self, repeated_capability):
+        '''Set/get properties or call methods with a repeated capability (i.e. channels)'''
+        return _SessionBase(self._repeated_capabilities[repeated_capability], self._executor)
+
+
+class _SessionBase(object):
+    '''Base class for all asyncio NI-FAKE sessions.'''
+
+    def __init__(self, session, executor):
+        object.__setattr__(self, '_session', session)
+        object.__setattr__(self, '_executor', executor)
+
+    def __repr__(self):
+        return '{0}.aio.{1}({2})'.format('nifake', self.__class__.__name__, self._session._param_list)
+
+    def __getattr__(self, key):
+        return getattr(self._session, key)
+
+    def __setattr__(self, key, value):
+        setattr(self._session, key, value)
+
+    def run_in_executor(self, fn, *args, **kwargs):
+        '''run_in_executor
+
+        Schedules fn(*args, **kwargs) on the executor of this session and returns an awaitable for its result.
+        Use it to call methods that do not have an asyncio variant without blocking the event loop.
+        '''
+        return asyncio.wrap_future(self._executor.submit(fn, *args, **kwargs))
+
+    def read_from_channel(self, *args, **kwargs):
+        '''read_from_channel
+
+        asyncio variant of nifake.Session.read_from_channel. Takes the same parameters and returns an awaitable for its result.
+        '''
+        return self.run_in_executor(self._session.read_from_channel, *args, **kwargs)
+
+
+class Session(_SessionBase):
+    '''asyncio variant of nifake.Session'''
+
+    def __init__(self, resource_name, options={}, id_query=False, reset_device=False, executor=None):
+        '''asyncio variant of nifake.Session
+
+        Opens the session synchronously; see nifake.Session for the parameters.
+
+        Args:
+            executor (concurrent.futures.Executor): Executor that runs the blocking calls. Defaults to the worker
+                thread of the session. Pass a shared executor to bound the number of threads used by many sessions.
+        '''
+        session = _session.Session(resource_name, options, id_query, reset_device)
+        super(Session, self).__init__(session, session.executor if executor is None else executor)
+
+        # Instantiate any repeated capability objects
+        object.__setattr__(self, 'channels', _RepeatedCapabilities(session.channels, self._executor))
+
+    def __aenter__(self):
+        return asyncio.sleep(0, result=self)
+
+    def __aexit__(self, exc_type, exc_value, traceback):
+        return self.close()
+
+    def close(self):
+        '''close
+
+        Closes the session and returns an awaitable. Pending calls on the session executor complete first.
+        '''
+        # close() waits for the worker thread of the session, so it cannot run on it
+        return asyncio.get_event_loop().run_in_executor(None, self._session.close)
+
+    def fetch_waveform(self, *args, **kwargs):
+        '''fetch_waveform
+
+        asyncio variant of nifake.Session.fetch_waveform. Takes the same parameters and returns an awaitable for its result.
+        '''
+        return self.run_in_executor(self._session.fetch_waveform, *args, **kwargs)
+
+    def fetch_waveform_into(self, *args, **kwargs):
+        '''fetch_waveform_into
+
+        asyncio variant of nifake.Session.fetch_waveform_into. Takes the same parameters and returns an awaitable for its result.
+        '''
+        return self.run_in_executor(self._session.fetch_waveform_into, *args, **kwargs)
+
+    def read(self, *args, **kwargs):
+        '''read
+
+        asyncio variant of nifake.Session.read. Takes the same parameters and returns an awaitable for its result.
+        '''
+        return self.run_in_executor(self._session.read, *args, **kwargs)
+
+
@@ -5,108 +5,196 @@ from nifgen import _converters
 import datetime
 
 
+class AttributeCache(object):
+    '''Python-side cache of property values for one session, keyed by (repeated capability, attribute ID).
+
+    It is shared by a session and the objects returned by its repeated capabilities and is disabled by
+    default. Methods that can change property values in the driver (i.e. reset, commit or setting a
+    property) clear it. They are marked with 'invalidates_attribute_cache' in the function metadata.
+    '''
+
+    def __init__(self):
+        self.enabled = False
+        self._values = {}
+        self._generation = 0
+
+    def get(self, repeated_capability, attribute_id, getter):
+        '''Returns the cached value, calling getter(attribute_id) on a miss or when the cache is disabled'''
+        if not self.enabled:
+            return getter(attribute_id)
+        key = (repeated_capability, attribute_id)
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        generation = self._generation
+        value = getter(attribute_id)
+        # Don't store a value read while another thread cleared the cache, it may be stale
+        if generation == self._generation:
+            self._values[key] = value
+        return value
+
+    def clear(self):
+        self._generation += 1
+        self._values.clear()
+
+
 class Attribute(object):
     '''Base class for all typed attributes.'''
 
-    def __init__(self, attribute_id):
+    # API type of the attribute in the driver, selects the SetAttribute/GetAttribute function
+    _vi_type = None
+    # numpy dtype of an array of values, None when the values are Python objects
+    _numpy_type = None
+
+    def __init__(self, attribute_id, cacheable=True):
         self._attribute_id = attribute_id
+        self._cacheable = cacheable
+
+    def _get(self, session, getter):
+        if self._cacheable:
+            return session._attribute_cache.get(session._repeated_capability, self._attribute_id, getter)
+        return getter(self._attribute_id)
+
+    def _to_driver(self, value):
+        '''Converts a Python value to the value passed to the driver'''
+        return value
+
+    def _from_driver(self, value):
+        '''Converts a value returned by the driver to the Python value'''
+        return value
 
 
 class AttributeViInt32(Attribute):
 
+    _vi_type = 'ViInt32'
+    _numpy_type = 'int32'
+
     def __get__(self, session, session_type):
-        return session._get_attribute_vi_int32(self._attribute_id)
+        return self._from_driver(self._get(session, session._get_attribute_vi_int32))
 
     def __set__(self, session, value):
-        session._set_attribute_vi_int32(self._attribute_id, value)
+        session._set_attribute_vi_int32(self._attribute_id, self._to_driver(value))
 
 
-class AttributeViInt32TimeDeltaSeconds(Attribute):
+class AttributeViInt32TimeDeltaSeconds(AttributeViInt32):
 
-    def __get__(self, session, session_type):
-        return datetime.timedelta(seconds=session._get_attribute_vi_int32(self._attribute_id))
+    _numpy_type = None
 
-    def __set__(self, session, value):
-        session._set_attribute_vi_int32(self._attribute_id, _converters.convert_timedelta_to_seconds(value, int))
+    def _to_driver(self, value):
+        return _converters.convert_timedelta_to_seconds(value, int)
 
+    def _from_driver(self, value):
+        return datetime.timedelta(seconds=value)
 
-class AttributeViInt32TimeDeltaMilliseconds(Attribute):
 
-    def __get__(self, session, session_type):
-        return datetime.timedelta(milliseconds=session._get_attribute_vi_int32(self._attribute_id))
+class AttributeViInt32TimeDeltaMilliseconds(AttributeViInt32):
 
-    def __set__(self, session, value):
-        session._set_attribute_vi_int32(self._attribute_id, _converters.convert_timedelta_to_milliseconds(value, int))
+    _numpy_type = None
+
+    def _to_driver(self, value):
+        return _converters.convert_timedelta_to_milliseconds(value, int)
+
+    def _from_driver(self, value):
+        return datetime.timedelta(milliseconds=value)
 
 
 class AttributeViInt64(Attribute):
 
+    _vi_type = 'ViInt64'
+    _numpy_type = 'int64'
+
     def __get__(self, session, session_type):
-        return session._get_attribute_vi_int64(self._attribute_id)
+        return self._from_driver(self._get(session, session._get_attribute_vi_int64))
 
     def __set__(self, session, value):
-        session._set_attribute_vi_int64(self._attribute_id, value)
+        session._set_attribute_vi_int64(self._attribute_id, self._to_driver(value))
 
 
 class AttributeViReal64(Attribute):
 
+    _vi_type = 'ViReal64'
+    _numpy_type = 'float64'
+
     def __get__(self, session, session_type):
-        return session._get_attribute_vi_real64(self._attribute_id)
+        return self._from_driver(self._get(session, session._get_attribute_vi_real64))
 
     def __set__(self, session, value):
-        session._set_attribute_vi_real64(self._attribute_id, value)
+        session._set_attribute_vi_real64(self._attribute_id, self._to_driver(value))
 
 
-class AttributeViReal64TimeDeltaSeconds(Attribute):
+class AttributeViReal64TimeDeltaSeconds(AttributeViReal64):
 
-    def __get__(self, session, session_type):
-        return datetime.timedelta(seconds=session._get_attribute_vi_real64(self._attribute_id))
+    _numpy_type = None
 
-    def __set__(self, session, value):
-        session._set_attribute_vi_real64(self._attribute_id, _converters.convert_timedelta_to_seconds(value, float))
+    def _to_driver(self, value):
+        return _converters.convert_timedelta_to_seconds(value, float)
 
+    def _from_driver(self, value):
+        return datetime.timedelta(seconds=value)
 
-class AttributeViReal64TimeDeltaMilliseconds(Attribute):
 
-    def __get__(self, session, session_type):
-        return datetime.timedelta(milliseconds=session._get_attribute_vi_real64(self._attribute_id))
+class AttributeViReal64TimeDeltaMilliseconds(AttributeViReal64):
 
-    def __set__(self, session, value):
-        session._set_attribute_vi_real64(self._attribute_id, _converters.convert_timedelta_to_milliseconds(value, float))
+    _numpy_type = None
+
+    def _to_driver(self, value):
+        return _converters.convert_timedelta_to_milliseconds(value, float)
+
+    def _from_driver(self, value):
+        return datetime.timedelta(milliseconds=value)
 
 
 class AttributeViString(Attribute):
 
+    _vi_type = 'ViString'
+
     def __get__(self, session, session_type):
-        return session._get_attribute_vi_string(self._attribute_id)
+        return self._from_driver(self._get(session, session._get_attribute_vi_string))
 
     def __set__(self, session, value):
-        session._set_attribute_vi_string(self._attribute_id, value)
+        session._set_attribute_vi_string(self._attribute_id, self._to_driver(value))
 
 
 class AttributeViBoolean(Attribute):
 
+    _vi_type = 'ViBoolean'
+    _numpy_type = 'bool'
+
     def __get__(self, session, session_type):
-        return session._get_attribute_vi_boolean(self._attribute_id)
+        return self._from_driver(self._get(session, session._get_attribute_vi_boolean))
 
     def __set__(self, session, value):
-        session._set_attribute_vi_boolean(self._attribute_id, value)
+        session._set_attribute_vi_boolean(self._attribute_id, self._to_driver(value))
 
 
 class AttributeEnum(object):
 
-    def __init__(self, underlying_attribute_meta_class, enum_meta_class, attribute_id):
-        self._underlying_attribute = underlying_attribute_meta_class(attribute_id)
+    def __init__(self, underlying_attribute_meta_class, enum_meta_class, attribute_id, cacheable=True):
+        self._underlying_attribute = underlying_attribute_meta_class(attribute_id, cacheable)
         self._attribute_type = enum_meta_class
         self._attribute_id = attribute_id
+        self._cacheable = cacheable
+        self._vi_type = self._underlying_attribute._vi_type
+        self._numpy_type = None
 
     def __get__(self, session, session_type):
         return self._attribute_type(self._underlying_attribute.__get__(session, session_type))
 
     def __set__(self, session, value):
+        self._check_type(value)
+        return self._underlying_attribute.__set__(session, value.value)
+
+    def _check_type(self, value):
         if type(value) is not self._attribute_type:
             raise TypeError('must be ' + str(self._attribute_type.__name__) + ' not ' + str(type(value).__name__))
-        return self._underlying_attribute.__set__(session, value.value)
+
+    def _to_driver(self, value):
+        self._check_type(value)
+        return self._underlying_attribute._to_driver(value.value)
+
+    def _from_driver(self, value):
+        return self._attribute_type(self._underlying_attribute._from_driver(value))
 
 
 
@@ -37,6 +37,10 @@ def get():
     global _instance
     global _instance_lock
 
+    # Fast path once the library is loaded, so sessions created from many threads don't serialize here
+    if _instance is not None:
+        return _instance
+
     with _instance_lock:
         if _instance is None:
             try:
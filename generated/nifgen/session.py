@@ -1,13 +1,17 @@
 # -*- coding: utf-8 -*-
 # This file was generated
 import array  # noqa: F401
+import collections
 import ctypes
 import datetime
+import six
+import threading
 
 from nifgen import _converters
 from nifgen import attributes
 from nifgen import enums
 from nifgen import errors
+from nifgen import executor
 from nifgen import library_singleton
 from nifgen import visatype
 
@@ -20,12 +24,23 @@ pp = pprint.PrettyPrinter(indent=4)
 def get_ctypes_pointer_for_buffer(value=None, library_type=None, size=None):
     if isinstance(value, array.array):
         assert library_type is not None, 'library_type is required for array.array'
-        addr, _ = value.buffer_info()
-        return ctypes.cast(addr, ctypes.POINTER(library_type))
+        if value.itemsize == ctypes.sizeof(library_type) and (value.typecode in 'fd') == (getattr(library_type, '_type_', None) in ('f', 'd')):
+            # Passed by pointer, without copying
+            addr, _ = value.buffer_info()
+            return ctypes.cast(addr, ctypes.POINTER(library_type))
+        # Input buffer of another element type, i.e. array.array('f') for ViReal64
+        return (library_type * len(value))(*value)
     elif str(type(value)).find("'numpy.ndarray'") != -1:
         import numpy
-        return numpy.ctypeslib.as_ctypes(value)
-    elif isinstance(value, list):
+        if library_type is None:
+            return numpy.ctypeslib.as_ctypes(value)
+        dtype = numpy.dtype(library_type)
+        if value.dtype == dtype and value.flags.c_contiguous:
+            # Passed by pointer, without copying
+            return ctypes.cast(value.ctypes.data, ctypes.POINTER(library_type))
+        # Input buffer of another dtype or not contiguous. The ctypes array keeps a reference to the converted copy.
+        return numpy.ctypeslib.as_ctypes(numpy.ascontiguousarray(value.astype(dtype, casting='same_kind', copy=False)))
+    elif isinstance(value, (list, tuple)):
         assert library_type is not None, 'library_type is required for list'
         return (library_type * len(value))(*value)
     else:
@@ -37,7 +52,8 @@ def get_ctypes_pointer_for_buffer(value=None, library_type=None, size=None):
 
 def get_ctypes_and_array(value, array_type):
     if value is not None:
-        if isinstance(value, array.array):
+        if isinstance(value, array.array) or str(type(value)).find("'numpy.ndarray'") != -1:
+            # get_ctypes_pointer_for_buffer() passes them by pointer when the element type matches
             value_array = value
         else:
             value_array = array.array(array_type, value)
@@ -59,30 +75,304 @@ class _Generation(object):
         self._session.abort()
 
 
+class _LruCache(object):
+    '''Dictionary with at most maxsize entries that discards the least recently used entry when full'''
+
+    def __init__(self, maxsize):
+        self._maxsize = maxsize
+        self._values = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, create):
+        '''Returns the value stored for key, calling create() and storing its result on a miss'''
+        with self._lock:
+            try:
+                value = self._values.pop(key)
+                self._values[key] = value
+                return value
+            except KeyError:
+                pass
+        # Don't hold the lock while creating the value, create() may call into the driver
+        value = create()
+        with self._lock:
+            self._values[key] = value
+            if len(self._values) > self._maxsize:
+                self._values.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+
+def _get_repeated_capability_cache_key(repeated_capability):
+    '''Returns a hashable key for repeated_capability, or None for values that are not cached (i.e. generators)'''
+    simple_types = six.string_types + six.integer_types
+    if isinstance(repeated_capability, simple_types):
+        # The type is part of the key so that i.e. True and 1 are different keys
+        return (type(repeated_capability), repeated_capability)
+    if isinstance(repeated_capability, slice):
+        return (slice, repeated_capability.start, repeated_capability.stop, repeated_capability.step)
+    if isinstance(repeated_capability, (list, tuple)) and all(isinstance(r, simple_types) for r in repeated_capability):
+        return (type(repeated_capability), ) + tuple((type(r), r) for r in repeated_capability)
+    return None
+
+
 class _RepeatedCapabilities(object):
+    # Maximum number of objects kept by each repeated capability, see __getitem__
+    _cache_size = 128
+
     def __init__(self, session, prefix):
         self._session = session
         self._prefix = prefix
+        self._cache = _LruCache(self._cache_size)
 
     def __getitem__(self, repeated_capability):
         '''Set/get properties or call methods with a repeated capability (i.e. channels)'''
+        key = _get_repeated_capability_cache_key(repeated_capability)
+        if key is None:
+            return self._create(repeated_capability)
+        # The objects are immutable, so the ones for recently used repeated capabilities are reused
+        # instead of parsing the repeated capability and encoding the resulting string again
+        return self._cache.get(key, lambda: self._create(repeated_capability))
+
+    def _create(self, repeated_capability):
         rep_caps = _converters.convert_repeated_capabilities(repeated_capability, self._prefix)
 
-        return _SessionBase(vi=self._session._vi, repeated_capability=rep_caps, library=self._session._library, encoding=self._session._encoding, freeze_it=True)
+        return self._session._with_repeated_capability(rep_caps)
+
+    def _clear_cache(self):
+        self._cache.clear()
 
 
-class _SessionBase(object):
+class _SessionBase(errors._WarningPolicyMixin):
     '''Base class for all NI-FGEN sessions.'''
 
     # This is needed during __init__. Without it, __setattr__ raises an exception
     _is_frozen = False
 
-    all_marker_events_latched_status = attributes.AttributeViInt32(1150349)
+    # Names that __setattr__ accepts without a dir() lookup once the session is frozen: the
+    # properties and the instance attributes set in __init__. Anything else falls back to dir().
+    _settable_names = frozenset([
+        '_vi',
+        '_attribute_cache',
+        '_channel_name_ctypes',
+        '_encoding',
+        '_error_descriptions',
+        '_is_frozen',
+        '_library',
+        '_memoized_results',
+        '_param_list',
+        '_pending_descriptions',
+        '_repeated_capability',
+        '_repeated_capability_ctype',
+        '_warning_filter',
+        'all_marker_events_latched_status',
+        'all_marker_events_live_status',
+        'analog_data_mask',
+        'analog_filter_enabled',
+        'analog_path',
+        'analog_static_value',
+        'arb_gain',
+        'arb_marker_position',
+        'arb_offset',
+        'arb_repeat_count',
+        'arb_sample_rate',
+        'arb_sequence_handle',
+        'arb_waveform_handle',
+        'aux_power_enabled',
+        'bus_type',
+        'cache',
+        'cal_adc_input',
+        'channel_delay',
+        'clock_mode',
+        'common_mode_offset',
+        'data_marker_events_count',
+        'data_marker_event_data_bit_number',
+        'data_marker_event_level_polarity',
+        'data_marker_event_output_terminal',
+        'data_transfer_block_size',
+        'data_transfer_maximum_bandwidth',
+        'data_transfer_maximum_in_flight_reads',
+        'data_transfer_preferred_packet_size',
+        'digital_data_mask',
+        'digital_edge_script_trigger_edge',
+        'digital_edge_script_trigger_source',
+        'digital_edge_start_trigger_edge',
+        'digital_edge_start_trigger_source',
+        'digital_filter_enabled',
+        'digital_filter_interpolation_factor',
+        'digital_gain',
+        'digital_level_script_trigger_active_level',
+        'digital_level_script_trigger_source',
+        'digital_pattern_enabled',
+        'digital_static_value',
+        'direct_dma_enabled',
+        'direct_dma_window_address',
+        'direct_dma_window_size',
+        'done_event_delay',
+        'done_event_delay_units',
+        'done_event_latched_status',
+        'done_event_level_active_level',
+        'done_event_output_behavior',
+        'done_event_output_terminal',
+        'done_event_pulse_polarity',
+        'done_event_pulse_width',
+        'done_event_pulse_width_units',
+        'driver_setup',
+        'exported_onboard_reference_clock_output_terminal',
+        'exported_reference_clock_output_terminal',
+        'exported_sample_clock_divisor',
+        'exported_sample_clock_output_terminal',
+        'exported_sample_clock_timebase_divisor',
+        'exported_sample_clock_timebase_output_terminal',
+        'exported_script_trigger_output_terminal',
+        'exported_start_trigger_output_terminal',
+        'external_clock_delay_binary_value',
+        'external_sample_clock_multiplier',
+        'file_transfer_block_size',
+        'filter_correction_frequency',
+        'flatness_correction_enabled',
+        'fpga_bitfile_path',
+        'freq_list_duration_quantum',
+        'freq_list_handle',
+        'func_amplitude',
+        'func_buffer_size',
+        'func_dc_offset',
+        'func_duty_cycle_high',
+        'func_frequency',
+        'func_max_buffer_size',
+        'func_start_phase',
+        'func_waveform',
+        'gain_dac_value',
+        'group_capabilities',
+        'idle_behavior',
+        'idle_value',
+        'id_query_response',
+        'instrument_firmware_revision',
+        'instrument_manufacturer',
+        'instrument_model',
+        'interchange_check',
+        'io_resource_descriptor',
+        'load_impedance',
+        'logical_name',
+        'major_version',
+        'marker_events_count',
+        'marker_event_delay',
+        'marker_event_delay_units',
+        'marker_event_latched_status',
+        'marker_event_live_status',
+        'marker_event_output_behavior',
+        'marker_event_output_terminal',
+        'marker_event_pulse_polarity',
+        'marker_event_pulse_width',
+        'marker_event_pulse_width_units',
+        'marker_event_toggle_initial_state',
+        'max_freq_list_duration',
+        'max_freq_list_length',
+        'max_loop_count',
+        'max_num_freq_lists',
+        'max_num_sequences',
+        'max_num_waveforms',
+        'max_sequence_length',
+        'max_waveform_size',
+        'memory_size',
+        'minor_version',
+        'min_freq_list_duration',
+        'min_freq_list_length',
+        'min_sequence_length',
+        'min_waveform_size',
+        'module_revision',
+        'num_channels',
+        'offset_dac_value',
+        'oscillator_freq_dac_value',
+        'oscillator_phase_dac_value',
+        'osp_carrier_enabled',
+        'osp_carrier_frequency',
+        'osp_carrier_phase_i',
+        'osp_carrier_phase_q',
+        'osp_cic_filter_enabled',
+        'osp_cic_filter_gain',
+        'osp_cic_filter_interpolation',
+        'osp_compensate_for_filter_group_delay',
+        'osp_data_processing_mode',
+        'osp_enabled',
+        'osp_fir_filter_enabled',
+        'osp_fir_filter_flat_passband',
+        'osp_fir_filter_gaussian_bt',
+        'osp_fir_filter_interpolation',
+        'osp_fir_filter_raised_cosine_alpha',
+        'osp_fir_filter_root_raised_cosine_alpha',
+        'osp_fir_filter_type',
+        'osp_frequency_shift',
+        'osp_mode',
+        'osp_overflow_error_reporting',
+        'osp_overflow_status',
+        'osp_pre_filter_gain_i',
+        'osp_pre_filter_gain_q',
+        'osp_pre_filter_offset_i',
+        'osp_pre_filter_offset_q',
+        'output_enabled',
+        'output_impedance',
+        'output_mode',
+        'p2p_endpoint_fullness_start_trigger_level',
+        'pci_dma_optimizations_enabled',
+        'post_amplifier_attenuation',
+        'pre_amplifier_attenuation',
+        'range_check',
+        'ready_for_start_event_level_active_level',
+        'ready_for_start_event_live_status',
+        'ready_for_start_event_output_terminal',
+        'record_coercions',
+        'reference_clock_source',
+        'ref_clock_frequency',
+        'sample_clock_absolute_delay',
+        'sample_clock_source',
+        'sample_clock_timebase_rate',
+        'sample_clock_timebase_source',
+        'script_to_generate',
+        'script_triggers_count',
+        'script_trigger_type',
+        'serial_number',
+        'simulate',
+        'specific_driver_class_spec_major_version',
+        'specific_driver_class_spec_minor_version',
+        'specific_driver_description',
+        'specific_driver_revision',
+        'specific_driver_vendor',
+        'started_event_delay',
+        'started_event_delay_units',
+        'started_event_latched_status',
+        'started_event_level_active_level',
+        'started_event_output_behavior',
+        'started_event_output_terminal',
+        'started_event_pulse_polarity',
+        'started_event_pulse_width',
+        'started_event_pulse_width_units',
+        'start_trigger_type',
+        'streaming_space_available_in_waveform',
+        'streaming_waveform_handle',
+        'streaming_waveform_name',
+        'streaming_write_timeout',
+        'supported_instrument_models',
+        'synchronization',
+        'sync_duty_cycle_high',
+        'sync_out_output_terminal',
+        'terminal_configuration',
+        'trigger_mode',
+        'trigger_source',
+        'video_waveform_type',
+        'wait_behavior',
+        'wait_value',
+        'waveform_quantum',
+    ])
+
+    all_marker_events_latched_status = attributes.AttributeViInt32(1150349, cacheable=False)
     '''Type: int
 
     Returns a bit field of the latched status of all Marker Events.  Write 0 to this property to clear the latched status of all Marker Events.
     '''
-    all_marker_events_live_status = attributes.AttributeViInt32(1150344)
+    all_marker_events_live_status = attributes.AttributeViInt32(1150344, cacheable=False)
     '''Type: int
 
     Returns a bit field of the live status of all Marker Events.
@@ -336,7 +626,7 @@ class _SessionBase(object):
 
     Specifies the units applied to the value of the done_event_delay property. Valid units are seconds and sample clock periods.
     '''
-    done_event_latched_status = attributes.AttributeViBoolean(1150351)
+    done_event_latched_status = attributes.AttributeViBoolean(1150351, cacheable=False)
     '''Type: bool
 
     Returns the latched status of the specified Done Event.
@@ -632,13 +922,13 @@ class _SessionBase(object):
 
     Specifies the units applied to the value of the marker_event_delay property.  Valid units are seconds and sample clock periods.
     '''
-    marker_event_latched_status = attributes.AttributeViBoolean(1150350)
+    marker_event_latched_status = attributes.AttributeViBoolean(1150350, cacheable=False)
     '''Type: bool
 
     Specifies the latched status of the specified Marker Event.
     Write True to this property to clear the latched status of the Marker Event.
     '''
-    marker_event_live_status = attributes.AttributeViBoolean(1150345)
+    marker_event_live_status = attributes.AttributeViBoolean(1150345, cacheable=False)
     '''Type: bool
 
     Returns the live status of the specified Marker Event.
@@ -872,7 +1162,7 @@ class _SessionBase(object):
     Configures error reporting when the OSP block detects an overflow in any of its stages.  Overflows lead to clipping of the waveform.
     You can use the osp_overflow_status property to query for overflow  conditions whether or not the osp_overflow_error_reporting property is  enabled. The device will continue to generate after an overflow whether or not the  osp_overflow_error_reporting property is enabled.
     '''
-    osp_overflow_status = attributes.AttributeViInt32(1150269)
+    osp_overflow_status = attributes.AttributeViInt32(1150269, cacheable=False)
     '''Type: int
 
     Returns a bit field of the overflow status in any stage of the OSP block.  This property is functional regardless of the value for the  osp_overflow_error_reporting property.
@@ -952,7 +1242,7 @@ class _SessionBase(object):
 
     Specifies the output polarity of the Ready for Start Event.
     '''
-    ready_for_start_event_live_status = attributes.AttributeViBoolean(1150348)
+    ready_for_start_event_live_status = attributes.AttributeViBoolean(1150348, cacheable=False)
     '''Type: bool
 
     Returns the live status of the specified Ready For Start Event.
@@ -1087,7 +1377,7 @@ class _SessionBase(object):
     Specifies the units applied to the value of the started_event_delay
     property.  Valid units are seconds and sample clock periods.
     '''
-    started_event_latched_status = attributes.AttributeViBoolean(1150352)
+    started_event_latched_status = attributes.AttributeViBoolean(1150352, cacheable=False)
     '''Type: bool
 
     Specifies the latched status of the Started Event.
@@ -1127,7 +1417,7 @@ class _SessionBase(object):
 
     Specifies whether you want the Start trigger to be a Digital Edge, or Software trigger. You can also choose None as the value for this property.
     '''
-    streaming_space_available_in_waveform = attributes.AttributeViInt32(1150325)
+    streaming_space_available_in_waveform = attributes.AttributeViInt32(1150325, cacheable=False)
     '''Type: int
 
     Indicates the space available (in samples) in the streaming waveform for writing new data. During generation, this available space may be in multiple locations with, for example, part of the available space at the end of the streaming waveform and the rest at the beginning. In this situation, writing a block of waveform data the size of the  total space available in the streaming waveform causes NI-FGEN to return an error, as  NI-FGEN will not wrap the data from the end of the waveform to the beginning and cannot write data past the end of the waveform buffer.
@@ -1214,11 +1504,21 @@ class _SessionBase(object):
     For example, when this property returns a value of 8, all waveform sizes must be a multiple of 8. Typically, this value is constant for the signal generator.
     '''
 
-    def __init__(self, repeated_capability, vi, library, encoding, freeze_it=False):
+    def __init__(self, repeated_capability, vi, library, encoding, attribute_cache, error_descriptions, warning_filter, pending_descriptions, freeze_it=False):
         self._repeated_capability = repeated_capability
         self._vi = vi
         self._library = library
         self._encoding = encoding
+        self._attribute_cache = attribute_cache
+        self._error_descriptions = error_descriptions
+        self._warning_filter = warning_filter
+        self._pending_descriptions = pending_descriptions
+        # Encoded once and passed to every driver call that takes the repeated capability. The driver does not modify it.
+        self._repeated_capability_ctype = None if encoding is None else ctypes.create_string_buffer(repeated_capability.encode(encoding))
+        # Created on first use, see _get_channel_name_ctypes
+        self._channel_name_ctypes = None
+        # Results of methods that only depend on the repeated capability, see the memoized_method template
+        self._memoized_results = {}
 
         # Store the parameter list for later printing in __repr__
         self._param_list = "repeated_capability=" + pp.pformat(repeated_capability)
@@ -1228,8 +1528,16 @@ class _SessionBase(object):
     def __repr__(self):
         return '{0}.{1}({2})'.format('nifgen', self.__class__.__name__, self._param_list)
 
+    def _with_repeated_capability(self, repeated_capability):
+        '''Returns a _SessionBase for repeated_capability that shares the handle, library and per-session state of this session'''
+        return _SessionBase(vi=self._vi, repeated_capability=repeated_capability, library=self._library, encoding=self._encoding, attribute_cache=self._attribute_cache, error_descriptions=self._error_descriptions, warning_filter=self._warning_filter, pending_descriptions=self._pending_descriptions, freeze_it=True)
+
+    def _session_wide(self):
+        '''Returns a _SessionBase without a repeated capability, for properties and methods that are not channel based'''
+        return self._with_repeated_capability('')
+
     def __setattr__(self, key, value):
-        if self._is_frozen and key not in dir(self):
+        if self._is_frozen and key not in self._settable_names and key not in dir(self):
             raise AttributeError("'{0}' object has no attribute '{1}'".format(type(self).__name__, key))
         object.__setattr__(self, key, value)
 
@@ -1237,10 +1545,21 @@ class _SessionBase(object):
         '''_get_error_description
 
         Returns the error description.
+
+        Descriptions of warnings are kept per session, so a warning returned over and over by the driver
+        (i.e. a coercion warning on every fetch) only costs calls into the driver the first time.
         '''
+        if errors._is_warning(error_code):
+            return self._error_descriptions.get(error_code, lambda: self._read_error_description(error_code))
+        return self._read_error_description(error_code)
+
+    def _read_error_description(self, error_code):
+        # The description is retrieved after the call that failed, so the last error of the session may
+        # be a different one. Only use it when the codes match.
         try:
-            _, error_string = self._get_error()
-            return error_string
+            last_error_code, error_string = self._get_error()
+            if last_error_code == error_code:
+                return error_string
         except errors.Error:
             pass
 
@@ -1255,6 +1574,223 @@ class _SessionBase(object):
         except errors.Error:
             return "Failed to retrieve error description."
 
+    def _find_attributes(self, names):
+        '''Returns (name, descriptor) pairs for the given property names
+
+        Raises a single AttributeError that lists every name that is not a property.
+        '''
+        found = []
+        unknown = []
+        for name in names:
+            attribute = _SessionBase.__dict__.get(name)
+            if isinstance(attribute, (attributes.Attribute, attributes.AttributeEnum)):
+                found.append((name, attribute))
+            else:
+                unknown.append(name)
+        if unknown:
+            raise AttributeError("'{0}' object has no attribute {1}".format(type(self).__name__, ', '.join(repr(n) for n in unknown)))
+        return found
+
+    def _get_channel_name_ctypes(self):
+        '''Returns (channel name, encoded channel name) pairs for the comma-separated items of the repeated capability'''
+        if self._channel_name_ctypes is None:
+            channel_names = [c.strip() for c in self._repeated_capability.split(',')]
+            self._channel_name_ctypes = [(c, ctypes.create_string_buffer(c.encode(self._encoding))) for c in channel_names]
+        return self._channel_name_ctypes
+
+    def _get_set_attribute_call(self, attribute, value):
+        '''Converts value for attribute and returns the SetAttribute function to call and the value ctype'''
+        value = attribute._to_driver(value)
+        if attribute._vi_type == 'ViString':
+            return self._library.niFgen_SetAttributeViString, ctypes.create_string_buffer(value.encode(self._encoding))
+        set_attribute_name, value_type = {
+            'ViBoolean': ('niFgen_SetAttributeViBoolean', visatype.ViBoolean),
+            'ViInt32': ('niFgen_SetAttributeViInt32', visatype.ViInt32),
+            'ViReal64': ('niFgen_SetAttributeViReal64', visatype.ViReal64),
+        }[attribute._vi_type]
+        return getattr(self._library, set_attribute_name), value_type(value)
+
+    def _get_attribute_getter(self, vi_type, channel_name_ctype):
+        '''Returns getter(attribute_id) that reads an attribute of API type vi_type for channel_name_ctype from the driver'''
+        vi_ctype = visatype.ViSession(self._vi)
+        if vi_type == 'ViString':
+            def getter(attribute_id):
+                attribute_id_ctype = visatype.ViAttr(attribute_id)
+                error_code = self._library.niFgen_GetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, visatype.ViInt32(), None)
+                errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=False)
+                buffer_size_ctype = visatype.ViInt32(error_code)
+                attribute_value_ctype = (visatype.ViChar * buffer_size_ctype.value)()
+                error_code = self._library.niFgen_GetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, buffer_size_ctype, attribute_value_ctype)
+                errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+                return attribute_value_ctype.value.decode(self._encoding)
+            return getter
+
+        get_attribute_name, value_type, python_type = {
+            'ViBoolean': ('niFgen_GetAttributeViBoolean', visatype.ViBoolean, bool),
+            'ViInt32': ('niFgen_GetAttributeViInt32', visatype.ViInt32, int),
+            'ViReal64': ('niFgen_GetAttributeViReal64', visatype.ViReal64, float),
+        }[vi_type]
+        get_attribute = getattr(self._library, get_attribute_name)
+        # One value buffer for all the calls made with this getter
+        value_ctype = value_type()
+
+        def getter(attribute_id):
+            error_code = get_attribute(vi_ctype, channel_name_ctype, visatype.ViAttr(attribute_id), ctypes.pointer(value_ctype))
+            errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+            return python_type(value_ctype.value)
+        return getter
+
+    def _set_attributes(self, channel_name_ctype, calls):
+        '''Makes the (SetAttribute function, attribute ID, value ctype) calls, stopping at the first error'''
+        vi_ctype = visatype.ViSession(self._vi)
+        try:
+            for set_attribute, attribute_id, value_ctype in calls:
+                error_code = set_attribute(vi_ctype, channel_name_ctype, visatype.ViAttr(attribute_id), value_ctype)
+                errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        finally:
+            self._attribute_cache.clear()
+
+    def configure(self, ordered_properties=(), **properties):
+        '''configure
+
+        Sets several properties with one call, i.e.
+
+            session.configure(func_amplitude=1.0, func_frequency=1000.0)
+
+        Like properties, it can be called on a repeated capability to set the properties for those channels only.
+
+        Every name and value is checked and converted before anything is sent to the driver, so an
+        unknown name or a value of the wrong type leaves the device untouched. The properties are then
+        set without the per-property overhead of setting them one at a time. If the driver returns an
+        error, the properties after the failing one are not set.
+
+        The valid values of some properties depend on others, so the order can matter. Properties in
+        ordered_properties are set in the order given, before the keyword arguments, i.e.
+
+            session.configure([('func_amplitude', 1.0), ('func_frequency', 1000.0)])
+
+        The order of keyword arguments is only kept by Python 3.6 and later.
+
+        Args:
+            ordered_properties (list of (str, value) tuples or collections.OrderedDict): Property names and the values to set them to, in the order to set them.
+
+            properties: Property names and the values to set them to.
+        '''
+        if hasattr(ordered_properties, 'items'):
+            ordered_properties = ordered_properties.items()
+        name_values = list(ordered_properties) + list(properties.items())
+        calls = []
+        invalid = []
+        found = self._find_attributes([name for name, _ in name_values])
+        for (name, attribute), (_, value) in zip(found, name_values):
+            try:
+                set_attribute, value_ctype = self._get_set_attribute_call(attribute, value)
+            except (AttributeError, TypeError, ValueError) as e:
+                invalid.append('{0}: {1}'.format(name, e))
+                continue
+            calls.append((set_attribute, attribute._attribute_id, value_ctype))
+        if invalid:
+            raise TypeError('Invalid property values: ' + '; '.join(invalid))
+        self._set_attributes(self._repeated_capability_ctype, calls)
+
+    def read_attributes(self, names):
+        '''read_attributes
+
+        Reads several properties with one call and returns a dict that maps each name to its value, i.e.
+
+            values = session.read_attributes(['func_amplitude', 'func_frequency'])
+
+        Every name is checked before anything is read from the driver. Values are returned from the
+        attribute cache when it is enabled, see attribute_cache_enabled.
+
+        Args:
+            names (list of str): Names of the properties to read.
+
+        Returns:
+            values (dict): Property values, keyed by name, in the order of names.
+        '''
+        values = collections.OrderedDict()
+        for name, attribute in self._find_attributes(names):
+            getter = self._get_attribute_getter(attribute._vi_type, self._repeated_capability_ctype)
+            if attribute._cacheable:
+                value = self._attribute_cache.get(self._repeated_capability, attribute._attribute_id, getter)
+            else:
+                value = getter(attribute._attribute_id)
+            values[name] = attribute._from_driver(value)
+        return values
+
+    def get(self, name):
+        '''get
+
+        Reads a property for each channel of the repeated capability and returns a numpy.ndarray with one value per channel, i.e.
+
+            values = session.channels[0:64].get('func_amplitude')
+
+        The channels are the comma-separated items of the repeated capability, in order. A range such as '0-63'
+        is a single item. Boolean, integer and floating-point properties are returned in an array of the matching
+        dtype, other properties (i.e. enums, strings and timedeltas) in an array of objects.
+
+        Values are returned from the attribute cache when it is enabled, see attribute_cache_enabled.
+
+        Requires numpy.
+
+        Args:
+            name (str): Name of the property to read.
+
+        Returns:
+            values (numpy.ndarray): Property value for each channel.
+        '''
+        import numpy
+        [(_, attribute)] = self._find_attributes([name])
+        channel_name_ctypes = self._get_channel_name_ctypes()
+        values = numpy.empty(len(channel_name_ctypes), dtype=attribute._numpy_type or object)
+        for i, (channel_name, channel_name_ctype) in enumerate(channel_name_ctypes):
+            getter = self._get_attribute_getter(attribute._vi_type, channel_name_ctype)
+            if attribute._cacheable:
+                value = self._attribute_cache.get(channel_name, attribute._attribute_id, getter)
+            else:
+                value = getter(attribute._attribute_id)
+            values[i] = attribute._from_driver(value)
+        return values
+
+    def set(self, name, values):
+        '''set
+
+        Sets a property to a different value for each channel of the repeated capability, i.e.
+
+            session.channels[0:64].set('func_amplitude', values)
+
+        The channels are the comma-separated items of the repeated capability, in order. A range such as '0-63'
+        is a single item. values can be a numpy.ndarray, an array.array or any other sequence with one value per channel.
+
+        Every value is checked and converted before anything is sent to the driver. If the driver returns an
+        error, the channels after the failing one are not set.
+
+        Args:
+            name (str): Name of the property to set.
+
+            values: Property value for each channel.
+        '''
+        [(_, attribute)] = self._find_attributes([name])
+        channel_name_ctypes = self._get_channel_name_ctypes()
+        # numpy.ndarray and array.array convert their items to Python values, which ctypes accepts
+        values = values.tolist() if hasattr(values, 'tolist') else list(values)
+        if len(values) != len(channel_name_ctypes):
+            raise ValueError('{0} values given for {1} channels'.format(len(values), len(channel_name_ctypes)))
+
+        calls = []
+        invalid = []
+        for (channel_name, channel_name_ctype), value in zip(channel_name_ctypes, values):
+            try:
+                calls.append((channel_name_ctype, self._get_set_attribute_call(attribute, value)))
+            except (AttributeError, TypeError, ValueError) as e:
+                invalid.append('{0}: {1}'.format(channel_name, e))
+        if invalid:
+            raise TypeError('Invalid values for {0}: {1}'.format(name, '; '.join(invalid)))
+
+        for channel_name_ctype, (set_attribute, value_ctype) in calls:
+            self._set_attributes(channel_name_ctype, [(set_attribute, attribute._attribute_id, value_ctype)])
+
     ''' These are code-generated '''
 
     def allocate_named_waveform(self, waveform_name, waveform_size):
@@ -1282,10 +1818,11 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         waveform_name_ctype = ctypes.create_string_buffer(waveform_name.encode(self._encoding))  # case C020
         waveform_size_ctype = visatype.ViInt32(waveform_size)  # case S150
         error_code = self._library.niFgen_AllocateNamedWaveform(vi_ctype, channel_name_ctype, waveform_name_ctype, waveform_size_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -1318,10 +1855,11 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         waveform_size_ctype = visatype.ViInt32(waveform_size)  # case S150
         waveform_handle_ctype = visatype.ViInt32()  # case S200
         error_code = self._library.niFgen_AllocateWaveform(vi_ctype, channel_name_ctype, waveform_size_ctype, None if waveform_handle_ctype is None else (ctypes.pointer(waveform_handle_ctype)))
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(waveform_handle_ctype.value)
 
@@ -1340,8 +1878,9 @@ class _SessionBase(object):
             session.channels['0,1'].clear_user_standard_waveform()
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         error_code = self._library.niFgen_ClearUserStandardWaveform(vi_ctype, channel_name_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -1402,11 +1941,12 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         sequence_handle_ctype = visatype.ViInt32(sequence_handle)  # case S150
         gain_ctype = visatype.ViReal64(gain)  # case S150
         offset_ctype = visatype.ViReal64(offset)  # case S150
         error_code = self._library.niFgen_ConfigureArbSequence(vi_ctype, channel_name_ctype, sequence_handle_ctype, gain_ctype, offset_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -1477,11 +2017,12 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         waveform_handle_ctype = visatype.ViInt32(waveform_handle)  # case S150
         gain_ctype = visatype.ViReal64(gain)  # case S150
         offset_ctype = visatype.ViReal64(offset)  # case S150
         error_code = self._library.niFgen_ConfigureArbWaveform(vi_ctype, channel_name_ctype, waveform_handle_ctype, gain_ctype, offset_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -1518,10 +2059,11 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         number_of_coefficients_ctype = visatype.ViInt32(0 if coefficients_array is None else len(coefficients_array))  # case S160
         coefficients_array_ctype = get_ctypes_pointer_for_buffer(value=coefficients_array, library_type=visatype.ViReal64)  # case B550
         error_code = self._library.niFgen_ConfigureCustomFIRFilterCoefficients(vi_ctype, channel_name_ctype, number_of_coefficients_ctype, coefficients_array_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -1600,12 +2142,13 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         frequency_list_handle_ctype = visatype.ViInt32(frequency_list_handle)  # case S150
         amplitude_ctype = visatype.ViReal64(amplitude)  # case S150
         dc_offset_ctype = visatype.ViReal64(dc_offset)  # case S150
         start_phase_ctype = visatype.ViReal64(start_phase)  # case S150
         error_code = self._library.niFgen_ConfigureFreqList(vi_ctype, channel_name_ctype, frequency_list_handle_ctype, amplitude_ctype, dc_offset_ctype, start_phase_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -1726,13 +2269,14 @@ class _SessionBase(object):
         if type(waveform) is not enums.Waveform:
             raise TypeError('Parameter mode must be of type ' + str(enums.Waveform))
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         waveform_ctype = visatype.ViInt32(waveform.value)  # case S130
         amplitude_ctype = visatype.ViReal64(amplitude)  # case S150
         dc_offset_ctype = visatype.ViReal64(dc_offset)  # case S150
         frequency_ctype = visatype.ViReal64(frequency)  # case S150
         start_phase_ctype = visatype.ViReal64(start_phase)  # case S150
         error_code = self._library.niFgen_ConfigureStandardWaveform(vi_ctype, channel_name_ctype, waveform_ctype, amplitude_ctype, dc_offset_ctype, frequency_ctype, start_phase_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -1817,12 +2361,13 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         waveform_size_ctype = visatype.ViInt32(0 if waveform_data_array is None else len(waveform_data_array))  # case S160
         waveform_data_array_array = get_ctypes_and_array(value=waveform_data_array, array_type="d")  # case B550
         waveform_data_array_ctype = get_ctypes_pointer_for_buffer(value=waveform_data_array_array, library_type=visatype.ViReal64)  # case B550
         waveform_handle_ctype = visatype.ViInt32()  # case S200
         error_code = self._library.niFgen_CreateWaveformF64(vi_ctype, channel_name_ctype, waveform_size_ctype, waveform_data_array_ctype, None if waveform_handle_ctype is None else (ctypes.pointer(waveform_handle_ctype)))
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(waveform_handle_ctype.value)
 
@@ -1873,11 +2418,12 @@ class _SessionBase(object):
         if waveform_data_array.dtype is not numpy.dtype('float64'):
             raise TypeError('waveform_data_array must be numpy.ndarray of dtype=float64, is ' + str(waveform_data_array.dtype))
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         waveform_size_ctype = visatype.ViInt32(0 if waveform_data_array is None else len(waveform_data_array))  # case S160
         waveform_data_array_ctype = get_ctypes_pointer_for_buffer(value=waveform_data_array)  # case B510
         waveform_handle_ctype = visatype.ViInt32()  # case S200
         error_code = self._library.niFgen_CreateWaveformF64(vi_ctype, channel_name_ctype, waveform_size_ctype, waveform_data_array_ctype, None if waveform_handle_ctype is None else (ctypes.pointer(waveform_handle_ctype)))
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(waveform_handle_ctype.value)
 
@@ -1936,11 +2482,12 @@ class _SessionBase(object):
         if type(byte_order) is not enums.ByteOrder:
             raise TypeError('Parameter mode must be of type ' + str(enums.ByteOrder))
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         file_name_ctype = ctypes.create_string_buffer(file_name.encode(self._encoding))  # case C020
         byte_order_ctype = visatype.ViInt32(byte_order.value)  # case S130
         waveform_handle_ctype = visatype.ViInt32()  # case S200
         error_code = self._library.niFgen_CreateWaveformFromFileF64(vi_ctype, channel_name_ctype, file_name_ctype, byte_order_ctype, None if waveform_handle_ctype is None else (ctypes.pointer(waveform_handle_ctype)))
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(waveform_handle_ctype.value)
 
@@ -1999,11 +2546,12 @@ class _SessionBase(object):
         if type(byte_order) is not enums.ByteOrder:
             raise TypeError('Parameter mode must be of type ' + str(enums.ByteOrder))
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         file_name_ctype = ctypes.create_string_buffer(file_name.encode(self._encoding))  # case C020
         byte_order_ctype = visatype.ViInt32(byte_order.value)  # case S130
         waveform_handle_ctype = visatype.ViInt32()  # case S200
         error_code = self._library.niFgen_CreateWaveformFromFileI16(vi_ctype, channel_name_ctype, file_name_ctype, byte_order_ctype, None if waveform_handle_ctype is None else (ctypes.pointer(waveform_handle_ctype)))
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(waveform_handle_ctype.value)
 
@@ -2052,11 +2600,12 @@ class _SessionBase(object):
         if waveform_data_array.dtype is not numpy.dtype('int16'):
             raise TypeError('waveform_data_array must be numpy.ndarray of dtype=int16, is ' + str(waveform_data_array.dtype))
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         waveform_size_ctype = visatype.ViInt32(0 if waveform_data_array is None else len(waveform_data_array))  # case S160
         waveform_data_array_ctype = get_ctypes_pointer_for_buffer(value=waveform_data_array)  # case B510
         waveform_handle_ctype = visatype.ViInt32()  # case S200
         error_code = self._library.niFgen_CreateWaveformI16(vi_ctype, channel_name_ctype, waveform_size_ctype, waveform_data_array_ctype, None if waveform_handle_ctype is None else (ctypes.pointer(waveform_handle_ctype)))
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(waveform_handle_ctype.value)
 
@@ -2099,10 +2648,11 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         waveform_size_ctype = visatype.ViInt32(0 if waveform_data_array is None else len(waveform_data_array))  # case S160
         waveform_data_array_ctype = get_ctypes_pointer_for_buffer(value=waveform_data_array, library_type=visatype.ViReal64)  # case B550
         error_code = self._library.niFgen_DefineUserStandardWaveform(vi_ctype, channel_name_ctype, waveform_size_ctype, waveform_data_array_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -2129,9 +2679,10 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         waveform_name_ctype = ctypes.create_string_buffer(waveform_name.encode(self._encoding))  # case C020
         error_code = self._library.niFgen_DeleteNamedWaveform(vi_ctype, channel_name_ctype, waveform_name_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -2154,9 +2705,10 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         script_name_ctype = ctypes.create_string_buffer(script_name.encode(self._encoding))  # case C020
         error_code = self._library.niFgen_DeleteScript(vi_ctype, channel_name_ctype, script_name_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -2192,7 +2744,7 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
         attribute_value_ctype = visatype.ViBoolean()  # case S200
         error_code = self._library.niFgen_GetAttributeViBoolean(vi_ctype, channel_name_ctype, attribute_id_ctype, None if attribute_value_ctype is None else (ctypes.pointer(attribute_value_ctype)))
@@ -2229,7 +2781,7 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
         attribute_value_ctype = visatype.ViInt32()  # case S200
         error_code = self._library.niFgen_GetAttributeViInt32(vi_ctype, channel_name_ctype, attribute_id_ctype, None if attribute_value_ctype is None else (ctypes.pointer(attribute_value_ctype)))
@@ -2268,7 +2820,7 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
         attribute_value_ctype = visatype.ViReal64()  # case S200
         error_code = self._library.niFgen_GetAttributeViReal64(vi_ctype, channel_name_ctype, attribute_id_ctype, None if attribute_value_ctype is None else (ctypes.pointer(attribute_value_ctype)))
@@ -2320,7 +2872,7 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
         array_size_ctype = visatype.ViInt32()  # case S170
         attribute_value_ctype = None  # case C050
@@ -2411,7 +2963,7 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         array_size_ctype = visatype.ViInt32()  # case S170
         coefficients_array_ctype = None  # case B580
         number_of_coefficients_read_ctype = visatype.ViInt32()  # case S200
@@ -2557,7 +3109,7 @@ class _SessionBase(object):
 
         '''
         resource_name_ctype = ctypes.create_string_buffer(resource_name.encode(self._encoding))  # case C020
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         reset_device_ctype = visatype.ViBoolean(reset_device)  # case S150
         option_string_ctype = ctypes.create_string_buffer(option_string.encode(self._encoding))  # case C020
         vi_ctype = visatype.ViSession()  # case S200
@@ -2613,10 +3165,11 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
         attribute_value_ctype = visatype.ViBoolean(attribute_value)  # case S150
         error_code = self._library.niFgen_SetAttributeViBoolean(vi_ctype, channel_name_ctype, attribute_id_ctype, attribute_value_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -2668,10 +3221,11 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
         attribute_value_ctype = visatype.ViInt32(attribute_value)  # case S150
         error_code = self._library.niFgen_SetAttributeViInt32(vi_ctype, channel_name_ctype, attribute_id_ctype, attribute_value_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -2723,10 +3277,11 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
         attribute_value_ctype = visatype.ViReal64(attribute_value)  # case S150
         error_code = self._library.niFgen_SetAttributeViReal64(vi_ctype, channel_name_ctype, attribute_id_ctype, attribute_value_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -2778,10 +3333,11 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
         attribute_value_ctype = ctypes.create_string_buffer(attribute_value.encode(self._encoding))  # case C020
         error_code = self._library.niFgen_SetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, attribute_value_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -2833,7 +3389,7 @@ class _SessionBase(object):
         if type(relative_to) is not enums.RelativeTo:
             raise TypeError('Parameter mode must be of type ' + str(enums.RelativeTo))
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         waveform_name_ctype = ctypes.create_string_buffer(waveform_name.encode(self._encoding))  # case C020
         relative_to_ctype = visatype.ViInt32(relative_to.value)  # case S130
         offset_ctype = visatype.ViInt32(offset)  # case S150
@@ -2890,7 +3446,7 @@ class _SessionBase(object):
         if type(relative_to) is not enums.RelativeTo:
             raise TypeError('Parameter mode must be of type ' + str(enums.RelativeTo))
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         waveform_handle_ctype = visatype.ViInt32(waveform_handle)  # case S150
         relative_to_ctype = visatype.ViInt32(relative_to.value)  # case S130
         offset_ctype = visatype.ViInt32(offset)  # case S150
@@ -2940,7 +3496,7 @@ class _SessionBase(object):
         if data.dtype is not numpy.dtype('int16'):
             raise TypeError('data must be numpy.ndarray of dtype=int16, is ' + str(data.dtype))
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         waveform_handle_ctype = visatype.ViInt32(waveform_handle)  # case S150
         size_ctype = visatype.ViInt32(0 if data is None else len(data))  # case S160
         data_ctype = get_ctypes_pointer_for_buffer(value=data)  # case B510
@@ -2987,7 +3543,7 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         waveform_name_ctype = ctypes.create_string_buffer(waveform_name.encode(self._encoding))  # case C020
         size_ctype = visatype.ViInt32(0 if data is None else len(data))  # case S160
         data_array = get_ctypes_and_array(value=data, array_type="d")  # case B550
@@ -3043,7 +3599,7 @@ class _SessionBase(object):
         if data.dtype is not numpy.dtype('float64'):
             raise TypeError('data must be numpy.ndarray of dtype=float64, is ' + str(data.dtype))
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         waveform_name_ctype = ctypes.create_string_buffer(waveform_name.encode(self._encoding))  # case C020
         size_ctype = visatype.ViInt32(0 if data is None else len(data))  # case S160
         data_ctype = get_ctypes_pointer_for_buffer(value=data)  # case B510
@@ -3089,7 +3645,7 @@ class _SessionBase(object):
         if data.dtype is not numpy.dtype('int16'):
             raise TypeError('data must be numpy.ndarray of dtype=int16, is ' + str(data.dtype))
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         waveform_name_ctype = ctypes.create_string_buffer(waveform_name.encode(self._encoding))  # case C020
         size_ctype = visatype.ViInt32(0 if data is None else len(data))  # case S160
         data_ctype = get_ctypes_pointer_for_buffer(value=data)  # case B510
@@ -3119,7 +3675,7 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         script_ctype = ctypes.create_string_buffer(script.encode(self._encoding))  # case C020
         error_code = self._library.niFgen_WriteScript(vi_ctype, channel_name_ctype, script_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
@@ -3165,7 +3721,7 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         waveform_handle_ctype = visatype.ViInt32(waveform_handle)  # case S150
         size_ctype = visatype.ViInt32(0 if data is None else len(data))  # case S160
         data_array = get_ctypes_and_array(value=data, array_type="d")  # case B550
@@ -3222,7 +3778,7 @@ class _SessionBase(object):
         if data.dtype is not numpy.dtype('float64'):
             raise TypeError('data must be numpy.ndarray of dtype=float64, is ' + str(data.dtype))
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_name_ctype = self._repeated_capability_ctype  # case C010
         waveform_handle_ctype = visatype.ViInt32(waveform_handle)  # case S150
         size_ctype = visatype.ViInt32(0 if data is None else len(data))  # case S160
         data_ctype = get_ctypes_pointer_for_buffer(value=data)  # case B510
@@ -3303,7 +3859,27 @@ class _SessionBase(object):
 
 
 class Session(_SessionBase):
-    '''An NI-FGEN session to a National Instruments Signal Generator.'''
+    '''An NI-FGEN session to a National Instruments Signal Generator.
+
+    Thread safety:
+
+    A session can be used from several threads. This applies to every method and property. No Python lock is held while the driver runs, and the driver runs one call on a session at a time. A method called, or a property set or read, while another call on the same session is in progress, directly or through the executor property, waits for that call to complete. Calls on different sessions run in parallel.
+
+    Calls made through the executor property run on the worker thread of the session, one at a time and in the order they were submitted.
+
+    Sequences of calls that depend on each other, such as setting the fetch properties and then fetching, are not atomic. Make them from one thread, or submit them to the executor as one callable. Generators, pipelines and buffer pools returned by the session are used from one thread at a time. Do not call close() while other threads use the session.
+    '''
+
+    _settable_names = _SessionBase._settable_names | frozenset([
+        '_executor',
+        '_executor_lock',
+        'attribute_cache_enabled',
+        'warning_interval',
+        'warning_policy',
+        'channels',
+        'script_triggers',
+        'markers',
+    ])
 
     def __init__(self, resource_name, reset_device=False, options={}):
         '''An NI-FGEN session to a National Instruments Signal Generator.
@@ -3416,10 +3992,15 @@ class Session(_SessionBase):
             session (nifgen.Session): A session object representing the device.
 
         '''
-        super(Session, self).__init__(repeated_capability='', vi=None, library=None, encoding=None, freeze_it=False)
+        super(Session, self).__init__(repeated_capability='', vi=None, library=None, encoding=None, attribute_cache=attributes.AttributeCache(), error_descriptions=_LruCache(64), warning_filter=errors._WarningFilter(), pending_descriptions=errors._PendingDescriptions(), freeze_it=False)
         options = _converters.convert_init_with_options_dictionary(options, self._encoding)
         self._library = library_singleton.get()
         self._encoding = 'windows-1251'
+        self._repeated_capability_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))
+
+        # The executor is created on first use, see the executor property
+        self._executor = None
+        self._executor_lock = threading.Lock()
 
         # Call specified init function
         self._vi = 0  # This must be set before calling _initialize_with_channels().
@@ -3448,10 +4029,51 @@ class Session(_SessionBase):
     def initiate(self):
         return _Generation(self)
 
+    @property
+    def attribute_cache_enabled(self):
+        '''attribute_cache_enabled
+
+        When True, property values are kept in a Python-side cache after they are first read from the
+        driver, so reading them again does not call into the driver. Methods that can change property
+        values, including setting a property, clear the cache. Properties that change on their own,
+        such as status or temperature, are never cached. Defaults to False.
+
+        Do not enable the cache if another session or process changes the configuration of the device.
+        '''
+        return self._attribute_cache.enabled
+
+    @attribute_cache_enabled.setter
+    def attribute_cache_enabled(self, value):
+        self._attribute_cache.clear()
+        self._attribute_cache.enabled = value
+
+    @property
+    def executor(self):
+        '''executor
+
+        Returns the executor.SessionExecutor that runs calls on this session on a
+        dedicated worker thread. The worker thread is started on first use and
+        stopped by close(), after any pending calls have completed.
+        '''
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = executor.SessionExecutor(self)
+            return self._executor
+
     def close(self):
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+        self.channels._clear_cache()
+        self.script_triggers._clear_cache()
+        self.markers._clear_cache()
+        # The driver can't describe errors of the session once it is closed
+        self._pending_descriptions.resolve()
         try:
             self._close()
         except errors.Error as e:
+            self._pending_descriptions.resolve()
             self._vi = 0
             raise
         self._vi = 0
@@ -3483,6 +4105,7 @@ class Session(_SessionBase):
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
         error_code = self._library.niFgen_ClearArbMemory(vi_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -3515,6 +4138,7 @@ class Session(_SessionBase):
         vi_ctype = visatype.ViSession(self._vi)  # case S110
         sequence_handle_ctype = visatype.ViInt32(sequence_handle)  # case S150
         error_code = self._library.niFgen_ClearArbSequence(vi_ctype, sequence_handle_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -3558,6 +4182,7 @@ class Session(_SessionBase):
         vi_ctype = visatype.ViSession(self._vi)  # case S110
         waveform_handle_ctype = visatype.ViInt32(waveform_handle)  # case S150
         error_code = self._library.niFgen_ClearArbWaveform(vi_ctype, waveform_handle_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -3592,6 +4217,7 @@ class Session(_SessionBase):
         vi_ctype = visatype.ViSession(self._vi)  # case S110
         frequency_list_handle_ctype = visatype.ViInt32(frequency_list_handle)  # case S150
         error_code = self._library.niFgen_ClearFreqList(vi_ctype, frequency_list_handle_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -3621,6 +4247,7 @@ class Session(_SessionBase):
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
         error_code = self._library.niFgen_Commit(vi_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -3711,6 +4338,7 @@ class Session(_SessionBase):
         source_ctype = ctypes.create_string_buffer(source.encode(self._encoding))  # case C020
         edge_ctype = visatype.ViInt32(edge.value)  # case S130
         error_code = self._library.niFgen_ConfigureDigitalEdgeScriptTrigger(vi_ctype, trigger_id_ctype, source_ctype, edge_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -3784,6 +4412,7 @@ class Session(_SessionBase):
         source_ctype = ctypes.create_string_buffer(source.encode(self._encoding))  # case C020
         edge_ctype = visatype.ViInt32(edge.value)  # case S130
         error_code = self._library.niFgen_ConfigureDigitalEdgeStartTrigger(vi_ctype, source_ctype, edge_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -3872,6 +4501,7 @@ class Session(_SessionBase):
         source_ctype = ctypes.create_string_buffer(source.encode(self._encoding))  # case C020
         trigger_when_ctype = visatype.ViInt32(trigger_when.value)  # case S130
         error_code = self._library.niFgen_ConfigureDigitalLevelScriptTrigger(vi_ctype, trigger_id_ctype, source_ctype, trigger_when_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -3985,8 +4615,9 @@ class Session(_SessionBase):
         coerced_markers_array_ctype = get_ctypes_pointer_for_buffer(library_type=visatype.ViInt32, size=coerced_markers_array_size)  # case B560
         sequence_handle_ctype = visatype.ViInt32()  # case S200
         error_code = self._library.niFgen_CreateAdvancedArbSequence(vi_ctype, sequence_length_ctype, waveform_handles_array_ctype, loop_counts_array_ctype, sample_counts_array_ctype, marker_location_array_ctype, coerced_markers_array_ctype, None if sequence_handle_ctype is None else (ctypes.pointer(sequence_handle_ctype)))
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
-        return [int(coerced_markers_array_ctype[i]) for i in range((0 if marker_location_array is None else len(marker_location_array)))], int(sequence_handle_ctype.value)
+        return [int(coerced_markers_array_ctype[i]) for i in range(coerced_markers_array_size)], int(sequence_handle_ctype.value)
 
     def create_arb_sequence(self, waveform_handles_array, loop_counts_array):
         '''create_arb_sequence
@@ -4050,6 +4681,7 @@ class Session(_SessionBase):
         loop_counts_array_ctype = get_ctypes_pointer_for_buffer(value=loop_counts_array, library_type=visatype.ViInt32)  # case B550
         sequence_handle_ctype = visatype.ViInt32()  # case S200
         error_code = self._library.niFgen_CreateArbSequence(vi_ctype, sequence_length_ctype, waveform_handles_array_ctype, loop_counts_array_ctype, None if sequence_handle_ctype is None else (ctypes.pointer(sequence_handle_ctype)))
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(sequence_handle_ctype.value)
 
@@ -4136,6 +4768,7 @@ class Session(_SessionBase):
         duration_array_ctype = get_ctypes_pointer_for_buffer(value=duration_array, library_type=visatype.ViReal64)  # case B550
         frequency_list_handle_ctype = visatype.ViInt32()  # case S200
         error_code = self._library.niFgen_CreateFreqList(vi_ctype, waveform_ctype, frequency_list_length_ctype, frequency_array_ctype, duration_array_ctype, None if frequency_list_handle_ctype is None else (ctypes.pointer(frequency_list_handle_ctype)))
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(frequency_list_handle_ctype.value)
 
@@ -4148,6 +4781,7 @@ class Session(_SessionBase):
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
         error_code = self._library.niFgen_Disable(vi_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -4285,6 +4919,7 @@ class Session(_SessionBase):
         signal_identifier_ctype = ctypes.create_string_buffer(signal_identifier.encode(self._encoding))  # case C020
         output_terminal_ctype = ctypes.create_string_buffer(output_terminal.encode(self._encoding))  # case C020
         error_code = self._library.niFgen_ExportSignal(vi_ctype, signal_ctype, signal_identifier_ctype, output_terminal_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -4495,6 +5130,7 @@ class Session(_SessionBase):
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
         error_code = self._library.niFgen_InitiateGeneration(vi_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -4682,6 +5318,7 @@ class Session(_SessionBase):
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
         error_code = self._library.niFgen_ResetDevice(vi_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -4695,6 +5332,7 @@ class Session(_SessionBase):
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
         error_code = self._library.niFgen_ResetWithDefaults(vi_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -4704,9 +5342,13 @@ class Session(_SessionBase):
         Performs a full internal self-calibration on the device. If the
         calibration is successful, new calibration data and constants are stored
         in the onboard EEPROM.
+
+        Note:
+        This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
         error_code = self._library.niFgen_SelfCal(vi_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -4751,6 +5393,9 @@ class Session(_SessionBase):
         Waits until the device is done generating or until the maximum time has
         expired.
 
+        Note:
+        This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.
+
         Args:
             max_time (datetime.timedelta): Specifies the timeout value in milliseconds.
 
@@ -4806,6 +5451,7 @@ class Session(_SessionBase):
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
         error_code = self._library.niFgen_reset(vi_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -4820,6 +5466,9 @@ class Session(_SessionBase):
         method, your device may not be in its previously configured state
         after the method runs.
 
+        Note:
+        This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.
+
         Returns:
             self_test_result (int): Contains the value returned from the instrument self-test. A value of 0
                 indicates success.
@@ -4841,6 +5490,7 @@ class Session(_SessionBase):
         self_test_result_ctype = visatype.ViInt16()  # case S200
         self_test_message_ctype = (visatype.ViChar * 256)()  # case C070
         error_code = self._library.niFgen_self_test(vi_ctype, None if self_test_result_ctype is None else (ctypes.pointer(self_test_result_ctype)), self_test_message_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(self_test_result_ctype.value), self_test_message_ctype.value.decode(self._encoding)
 
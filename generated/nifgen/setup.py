@@ -42,6 +42,7 @@ setup(
     packages=['nifgen'],
     install_requires=[
         'enum34;python_version<"3.4"',
+        'futures;python_version<"3.2"',
         'six',
     ],
     setup_requires=['pytest-runner', ],
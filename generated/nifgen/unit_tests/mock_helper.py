@@ -60,9 +60,6 @@ class SideEffectsHelper(object):
         self._defaults['CreateFreqList'] = {}
         self._defaults['CreateFreqList']['return'] = 0
         self._defaults['CreateFreqList']['frequencyListHandle'] = None
-        self._defaults['CreateWaveformDispatcher'] = {}
-        self._defaults['CreateWaveformDispatcher']['return'] = 0
-        self._defaults['CreateWaveformDispatcher']['waveformHandle'] = None
         self._defaults['CreateWaveformF64'] = {}
         self._defaults['CreateWaveformF64']['return'] = 0
         self._defaults['CreateWaveformF64']['waveformHandle'] = None
@@ -121,12 +118,6 @@ class SideEffectsHelper(object):
         self._defaults['GetHardwareState'] = {}
         self._defaults['GetHardwareState']['return'] = 0
         self._defaults['GetHardwareState']['state'] = None
-        self._defaults['GetLastExtCalLastDateAndTime'] = {}
-        self._defaults['GetLastExtCalLastDateAndTime']['return'] = 0
-        self._defaults['GetLastExtCalLastDateAndTime']['Month'] = None
-        self._defaults['GetLastSelfCalLastDateAndTime'] = {}
-        self._defaults['GetLastSelfCalLastDateAndTime']['return'] = 0
-        self._defaults['GetLastSelfCalLastDateAndTime']['Month'] = None
         self._defaults['GetSelfCalLastDateAndTime'] = {}
         self._defaults['GetSelfCalLastDateAndTime']['return'] = 0
         self._defaults['GetSelfCalLastDateAndTime']['Year'] = None
@@ -203,8 +194,6 @@ class SideEffectsHelper(object):
         self._defaults['WriteScript']['return'] = 0
         self._defaults['WriteWaveform'] = {}
         self._defaults['WriteWaveform']['return'] = 0
-        self._defaults['WriteWaveformDispatcher'] = {}
-        self._defaults['WriteWaveformDispatcher']['return'] = 0
         self._defaults['close'] = {}
         self._defaults['close']['return'] = 0
         self._defaults['error_message'] = {}
@@ -350,15 +339,6 @@ class SideEffectsHelper(object):
         frequency_list_handle.contents.value = self._defaults['CreateFreqList']['frequencyListHandle']
         return self._defaults['CreateFreqList']['return']
 
-    def niFgen_CreateWaveformDispatcher(self, vi, channel_name, waveform_data_array, waveform_handle):  # noqa: N802
-        if self._defaults['CreateWaveformDispatcher']['return'] != 0:
-            return self._defaults['CreateWaveformDispatcher']['return']
-        # waveform_handle
-        if self._defaults['CreateWaveformDispatcher']['waveformHandle'] is None:
-            raise MockFunctionCallError("niFgen_CreateWaveformDispatcher", param='waveformHandle')
-        waveform_handle.contents.value = self._defaults['CreateWaveformDispatcher']['waveformHandle']
-        return self._defaults['CreateWaveformDispatcher']['return']
-
     def niFgen_CreateWaveformF64(self, vi, channel_name, waveform_size, waveform_data_array, waveform_handle):  # noqa: N802
         if self._defaults['CreateWaveformF64']['return'] != 0:
             return self._defaults['CreateWaveformF64']['return']
@@ -542,24 +522,6 @@ class SideEffectsHelper(object):
         state.contents.value = self._defaults['GetHardwareState']['state']
         return self._defaults['GetHardwareState']['return']
 
-    def niFgen_GetLastExtCalLastDateAndTime(self, vi, month):  # noqa: N802
-        if self._defaults['GetLastExtCalLastDateAndTime']['return'] != 0:
-            return self._defaults['GetLastExtCalLastDateAndTime']['return']
-        # month
-        if self._defaults['GetLastExtCalLastDateAndTime']['Month'] is None:
-            raise MockFunctionCallError("niFgen_GetLastExtCalLastDateAndTime", param='Month')
-        month.contents.value = self._defaults['GetLastExtCalLastDateAndTime']['Month']
-        return self._defaults['GetLastExtCalLastDateAndTime']['return']
-
-    def niFgen_GetLastSelfCalLastDateAndTime(self, vi, month):  # noqa: N802
-        if self._defaults['GetLastSelfCalLastDateAndTime']['return'] != 0:
-            return self._defaults['GetLastSelfCalLastDateAndTime']['return']
-        # month
-        if self._defaults['GetLastSelfCalLastDateAndTime']['Month'] is None:
-            raise MockFunctionCallError("niFgen_GetLastSelfCalLastDateAndTime", param='Month')
-        month.contents.value = self._defaults['GetLastSelfCalLastDateAndTime']['Month']
-        return self._defaults['GetLastSelfCalLastDateAndTime']['return']
-
     def niFgen_GetSelfCalLastDateAndTime(self, vi, year, month, day, hour, minute):  # noqa: N802
         if self._defaults['GetSelfCalLastDateAndTime']['return'] != 0:
             return self._defaults['GetSelfCalLastDateAndTime']['return']
@@ -786,11 +748,6 @@ class SideEffectsHelper(object):
             return self._defaults['WriteWaveform']['return']
         return self._defaults['WriteWaveform']['return']
 
-    def niFgen_WriteWaveformDispatcher(self, vi, channel_name, waveform_name_or_handle, size, data):  # noqa: N802
-        if self._defaults['WriteWaveformDispatcher']['return'] != 0:
-            return self._defaults['WriteWaveformDispatcher']['return']
-        return self._defaults['WriteWaveformDispatcher']['return']
-
     def niFgen_close(self, vi):  # noqa: N802
         if self._defaults['close']['return'] != 0:
             return self._defaults['close']['return']
@@ -875,8 +832,6 @@ class SideEffectsHelper(object):
         mock_library.niFgen_CreateArbSequence.return_value = 0
         mock_library.niFgen_CreateFreqList.side_effect = MockFunctionCallError("niFgen_CreateFreqList")
         mock_library.niFgen_CreateFreqList.return_value = 0
-        mock_library.niFgen_CreateWaveformDispatcher.side_effect = MockFunctionCallError("niFgen_CreateWaveformDispatcher")
-        mock_library.niFgen_CreateWaveformDispatcher.return_value = 0
         mock_library.niFgen_CreateWaveformF64.side_effect = MockFunctionCallError("niFgen_CreateWaveformF64")
         mock_library.niFgen_CreateWaveformF64.return_value = 0
         mock_library.niFgen_CreateWaveformFromFileF64.side_effect = MockFunctionCallError("niFgen_CreateWaveformFromFileF64")
@@ -915,10 +870,6 @@ class SideEffectsHelper(object):
         mock_library.niFgen_GetFIRFilterCoefficients.return_value = 0
         mock_library.niFgen_GetHardwareState.side_effect = MockFunctionCallError("niFgen_GetHardwareState")
         mock_library.niFgen_GetHardwareState.return_value = 0
-        mock_library.niFgen_GetLastExtCalLastDateAndTime.side_effect = MockFunctionCallError("niFgen_GetLastExtCalLastDateAndTime")
-        mock_library.niFgen_GetLastExtCalLastDateAndTime.return_value = 0
-        mock_library.niFgen_GetLastSelfCalLastDateAndTime.side_effect = MockFunctionCallError("niFgen_GetLastSelfCalLastDateAndTime")
-        mock_library.niFgen_GetLastSelfCalLastDateAndTime.return_value = 0
         mock_library.niFgen_GetSelfCalLastDateAndTime.side_effect = MockFunctionCallError("niFgen_GetSelfCalLastDateAndTime")
         mock_library.niFgen_GetSelfCalLastDateAndTime.return_value = 0
         mock_library.niFgen_GetSelfCalLastTemp.side_effect = MockFunctionCallError("niFgen_GetSelfCalLastTemp")
@@ -971,8 +922,6 @@ class SideEffectsHelper(object):
         mock_library.niFgen_WriteScript.return_value = 0
         mock_library.niFgen_WriteWaveform.side_effect = MockFunctionCallError("niFgen_WriteWaveform")
         mock_library.niFgen_WriteWaveform.return_value = 0
-        mock_library.niFgen_WriteWaveformDispatcher.side_effect = MockFunctionCallError("niFgen_WriteWaveformDispatcher")
-        mock_library.niFgen_WriteWaveformDispatcher.return_value = 0
         mock_library.niFgen_close.side_effect = MockFunctionCallError("niFgen_close")
         mock_library.niFgen_close.return_value = 0
         mock_library.niFgen_error_message.side_effect = MockFunctionCallError("niFgen_error_message")
@@ -3,5 +3,6 @@
 
 from nimodinst.errors import Error     # noqa: F401
 from nimodinst.errors import NimodinstWarning   # noqa: F401
+from nimodinst.errors import WarningPolicy   # noqa: F401
 from nimodinst.session import Session  # noqa: F401
 
@@ -11,8 +11,21 @@ class Library(object):
 
     Wrapper around driver library.
     Class will setup the correct ctypes information for every function on first call.
+
+    Binding uses double-checked locking: _func_lock is only taken the first time a function
+    is called. Call bind_all_functions() to bind every function up front, after which no
+    call into the driver takes a Python-side lock.
     '''
 
+    # ctypes prototype (argtypes, restype) of every function in the driver library
+    _prototypes = {
+        'niModInst_CloseInstalledDevicesSession': ([ViSession], ViStatus),  # noqa: F405
+        'niModInst_GetExtendedErrorInfo': ([ViInt32, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niModInst_GetInstalledDeviceAttributeViInt32': ([ViSession, ViInt32, ViInt32, ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niModInst_GetInstalledDeviceAttributeViString': ([ViSession, ViInt32, ViInt32, ViInt32, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niModInst_OpenInstalledDevicesSession': ([ctypes.POINTER(ViChar), ctypes.POINTER(ViSession), ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+    }
+
     def __init__(self, ctypes_library):
         self._func_lock = threading.Lock()
         self._library = ctypes_library
@@ -23,42 +36,54 @@ class Library(object):
         self.niModInst_GetInstalledDeviceAttributeViString_cfunc = None
         self.niModInst_OpenInstalledDevicesSession_cfunc = None
 
-    def niModInst_CloseInstalledDevicesSession(self, handle):  # noqa: N802
+    def _bind_function(self, c_func_name):
         with self._func_lock:
-            if self.niModInst_CloseInstalledDevicesSession_cfunc is None:
-                self.niModInst_CloseInstalledDevicesSession_cfunc = self._library.niModInst_CloseInstalledDevicesSession
-                self.niModInst_CloseInstalledDevicesSession_cfunc.argtypes = [ViSession]  # noqa: F405
-                self.niModInst_CloseInstalledDevicesSession_cfunc.restype = ViStatus  # noqa: F405
-        return self.niModInst_CloseInstalledDevicesSession_cfunc(handle)
+            cfunc = getattr(self, c_func_name + '_cfunc')
+            if cfunc is None:
+                cfunc = getattr(self._library, c_func_name)
+                cfunc.argtypes, cfunc.restype = self._prototypes[c_func_name]
+                # Only publish the cfunc once it is fully typed, other threads read it without the lock
+                setattr(self, c_func_name + '_cfunc', cfunc)
+        return cfunc
+
+    def bind_all_functions(self):
+        '''bind_all_functions
+
+        Resolves and sets up the ctypes information for every function in the driver library.
+        Functions not exported by the driver runtime are left unbound and raise on first call.
+        '''
+        for c_func_name in sorted(self._prototypes):
+            try:
+                self._bind_function(c_func_name)
+            except AttributeError:
+                pass
+
+    def niModInst_CloseInstalledDevicesSession(self, handle):  # noqa: N802
+        cfunc = self.niModInst_CloseInstalledDevicesSession_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niModInst_CloseInstalledDevicesSession')
+        return cfunc(handle)
 
     def niModInst_GetExtendedErrorInfo(self, error_info_buffer_size, error_info):  # noqa: N802
-        with self._func_lock:
-            if self.niModInst_GetExtendedErrorInfo_cfunc is None:
-                self.niModInst_GetExtendedErrorInfo_cfunc = self._library.niModInst_GetExtendedErrorInfo
-                self.niModInst_GetExtendedErrorInfo_cfunc.argtypes = [ViInt32, ctypes.POINTER(ViChar)]  # noqa: F405
-                self.niModInst_GetExtendedErrorInfo_cfunc.restype = ViStatus  # noqa: F405
-        return self.niModInst_GetExtendedErrorInfo_cfunc(error_info_buffer_size, error_info)
+        cfunc = self.niModInst_GetExtendedErrorInfo_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niModInst_GetExtendedErrorInfo')
+        return cfunc(error_info_buffer_size, error_info)
 
     def niModInst_GetInstalledDeviceAttributeViInt32(self, handle, index, attribute_id, attribute_value):  # noqa: N802
-        with self._func_lock:
-            if self.niModInst_GetInstalledDeviceAttributeViInt32_cfunc is None:
-                self.niModInst_GetInstalledDeviceAttributeViInt32_cfunc = self._library.niModInst_GetInstalledDeviceAttributeViInt32
-                self.niModInst_GetInstalledDeviceAttributeViInt32_cfunc.argtypes = [ViSession, ViInt32, ViInt32, ctypes.POINTER(ViInt32)]  # noqa: F405
-                self.niModInst_GetInstalledDeviceAttributeViInt32_cfunc.restype = ViStatus  # noqa: F405
-        return self.niModInst_GetInstalledDeviceAttributeViInt32_cfunc(handle, index, attribute_id, attribute_value)
+        cfunc = self.niModInst_GetInstalledDeviceAttributeViInt32_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niModInst_GetInstalledDeviceAttributeViInt32')
+        return cfunc(handle, index, attribute_id, attribute_value)
 
     def niModInst_GetInstalledDeviceAttributeViString(self, handle, index, attribute_id, attribute_value_buffer_size, attribute_value):  # noqa: N802
-        with self._func_lock:
-            if self.niModInst_GetInstalledDeviceAttributeViString_cfunc is None:
-                self.niModInst_GetInstalledDeviceAttributeViString_cfunc = self._library.niModInst_GetInstalledDeviceAttributeViString
-                self.niModInst_GetInstalledDeviceAttributeViString_cfunc.argtypes = [ViSession, ViInt32, ViInt32, ViInt32, ctypes.POINTER(ViChar)]  # noqa: F405
-                self.niModInst_GetInstalledDeviceAttributeViString_cfunc.restype = ViStatus  # noqa: F405
-        return self.niModInst_GetInstalledDeviceAttributeViString_cfunc(handle, index, attribute_id, attribute_value_buffer_size, attribute_value)
+        cfunc = self.niModInst_GetInstalledDeviceAttributeViString_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niModInst_GetInstalledDeviceAttributeViString')
+        return cfunc(handle, index, attribute_id, attribute_value_buffer_size, attribute_value)
 
     def niModInst_OpenInstalledDevicesSession(self, driver, handle, device_count):  # noqa: N802
-        with self._func_lock:
-            if self.niModInst_OpenInstalledDevicesSession_cfunc is None:
-                self.niModInst_OpenInstalledDevicesSession_cfunc = self._library.niModInst_OpenInstalledDevicesSession
-                self.niModInst_OpenInstalledDevicesSession_cfunc.argtypes = [ctypes.POINTER(ViChar), ctypes.POINTER(ViSession), ctypes.POINTER(ViInt32)]  # noqa: F405
-                self.niModInst_OpenInstalledDevicesSession_cfunc.restype = ViStatus  # noqa: F405
-        return self.niModInst_OpenInstalledDevicesSession_cfunc(driver, handle, device_count)
+        cfunc = self.niModInst_OpenInstalledDevicesSession_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niModInst_OpenInstalledDevicesSession')
+        return cfunc(driver, handle, device_count)
@@ -138,7 +138,7 @@ class _DeviceIterable(object):
         return ret_str
 
 
-class Session(object):
+class Session(errors._WarningPolicyMixin):
     '''A NI-ModInst session to get device information'''
 
     # This is needed during __init__. Without it, __setattr__ raises an exception
@@ -150,6 +150,8 @@ class Session(object):
         self._current_item = 0
         self._encoding = 'windows-1251'
         self._library = library_singleton.get()
+        self._warning_filter = errors._WarningFilter()
+        self._pending_descriptions = errors._PendingDescriptions()
         self._handle, self._item_count = self._open_installed_devices_session(driver)
         self._param_list = "driver=" + pp.pformat(driver)
 
@@ -208,6 +210,7 @@ class Session(object):
     def close(self):
         # TODO(marcoskirsch): Should we raise an exception on double close? Look at what File does.
         if(self._handle != 0):
+            self._pending_descriptions.resolve()
             self._close_installed_devices_session()
             self._handle = 0
 
@@ -24,6 +24,36 @@ class AcquisitionType(Enum):
     '''
 
 
+class ArrayMeasurement(Enum):
+    NO_MEASUREMENT = 4000
+    LAST_ACQ_HISTOGRAM = 4001
+    FFT_PHASE_SPECTRUM = 4002
+    FFT_AMP_SPECTRUM_VOLTS_RMS = 4003
+    MULTI_ACQ_VOLTAGE_HISTOGRAM = 4004
+    MULTI_ACQ_TIME_HISTOGRAM = 4005
+    ARRAY_INTEGRAL = 4006
+    DERIVATIVE = 4007
+    INVERSE = 4008
+    HANNING_WINDOW = 4009
+    FLAT_TOP_WINDOW = 4010
+    POLYNOMIAL_INTERPOLATION = 4011
+    MULTIPLY_CHANNELS = 4012
+    ADD_CHANNELS = 4013
+    SUBTRACT_CHANNELS = 4014
+    DIVIDE_CHANNELS = 4015
+    MULTI_ACQ_AVERAGE = 4016
+    BUTTERWORTH_FILTER = 4017
+    CHEBYSHEV_FILTER = 4018
+    FFT_AMP_SPECTRUM_DB = 4019
+    HAMMING_WINDOW = 4020
+    WINDOWED_FIR_FILTER = 4021
+    BESSEL_FILTER = 4022
+    TRIANGLE_WINDOW = 4023
+    BLACKMAN_WINDOW = 4024
+    ARRAY_OFFSET = 4025
+    ARRAY_GAIN = 4026
+
+
 class ClearableMeasurement(Enum):
     ALL_MEASUREMENTS = 10000
     MULTI_ACQ_VOLTAGE_HISTOGRAM = 4004
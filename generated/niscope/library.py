@@ -13,14 +13,74 @@ class Library(object):
 
     Wrapper around driver library.
     Class will setup the correct ctypes information for every function on first call.
+
+    Binding uses double-checked locking: _func_lock is only taken the first time a function
+    is called. Call bind_all_functions() to bind every function up front, after which no
+    call into the driver takes a Python-side lock.
     '''
 
+    # ctypes prototype (argtypes, restype) of every function in the driver library
+    _prototypes = {
+        'niScope_Abort': ([ViSession], ViStatus),  # noqa: F405
+        'niScope_AcquisitionStatus': ([ViSession, ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niScope_ActualMeasWfmSize': ([ViSession, ViInt32, ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niScope_ActualNumWfms': ([ViSession, ctypes.POINTER(ViChar), ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niScope_AutoSetup': ([ViSession], ViStatus),  # noqa: F405
+        'niScope_CalSelfCalibrate': ([ViSession, ctypes.POINTER(ViChar), ViInt32], ViStatus),  # noqa: F405
+        'niScope_ClearWaveformMeasurementStats': ([ViSession, ctypes.POINTER(ViChar), ViInt32], ViStatus),  # noqa: F405
+        'niScope_Commit': ([ViSession], ViStatus),  # noqa: F405
+        'niScope_ConfigureChanCharacteristics': ([ViSession, ctypes.POINTER(ViChar), ViReal64, ViReal64], ViStatus),  # noqa: F405
+        'niScope_ConfigureEqualizationFilterCoefficients': ([ViSession, ctypes.POINTER(ViChar), ViInt32, ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niScope_ConfigureHorizontalTiming': ([ViSession, ViReal64, ViInt32, ViReal64, ViInt32, ViBoolean], ViStatus),  # noqa: F405
+        'niScope_ConfigureRefLevels': ([ViSession, ViReal64, ViReal64, ViReal64], ViStatus),  # noqa: F405
+        'niScope_ConfigureTriggerDigital': ([ViSession, ctypes.POINTER(ViChar), ViInt32, ViReal64, ViReal64], ViStatus),  # noqa: F405
+        'niScope_ConfigureTriggerEdge': ([ViSession, ctypes.POINTER(ViChar), ViReal64, ViInt32, ViInt32, ViReal64, ViReal64], ViStatus),  # noqa: F405
+        'niScope_ConfigureTriggerHysteresis': ([ViSession, ctypes.POINTER(ViChar), ViReal64, ViReal64, ViInt32, ViInt32, ViReal64, ViReal64], ViStatus),  # noqa: F405
+        'niScope_ConfigureTriggerImmediate': ([ViSession], ViStatus),  # noqa: F405
+        'niScope_ConfigureTriggerSoftware': ([ViSession, ViReal64, ViReal64], ViStatus),  # noqa: F405
+        'niScope_ConfigureTriggerVideo': ([ViSession, ctypes.POINTER(ViChar), ViBoolean, ViInt32, ViInt32, ViInt32, ViInt32, ViInt32, ViReal64, ViReal64], ViStatus),  # noqa: F405
+        'niScope_ConfigureTriggerWindow': ([ViSession, ctypes.POINTER(ViChar), ViReal64, ViReal64, ViInt32, ViInt32, ViReal64, ViReal64], ViStatus),  # noqa: F405
+        'niScope_ConfigureVertical': ([ViSession, ctypes.POINTER(ViChar), ViReal64, ViReal64, ViInt32, ViReal64, ViBoolean], ViStatus),  # noqa: F405
+        'niScope_Disable': ([ViSession], ViStatus),  # noqa: F405
+        'niScope_ExportSignal': ([ViSession, ViInt32, ctypes.POINTER(ViChar), ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niScope_Fetch': ([ViSession, ctypes.POINTER(ViChar), ViReal64, ViInt32, ctypes.POINTER(ViReal64), ctypes.POINTER(waveform_info.struct_niScope_wfmInfo)], ViStatus),  # noqa: F405
+        'niScope_FetchArrayMeasurement': ([ViSession, ctypes.POINTER(ViChar), ViReal64, ViInt32, ViInt32, ctypes.POINTER(ViReal64), ctypes.POINTER(waveform_info.struct_niScope_wfmInfo)], ViStatus),  # noqa: F405
+        'niScope_FetchBinary16': ([ViSession, ctypes.POINTER(ViChar), ViReal64, ViInt32, ctypes.POINTER(ViInt16), ctypes.POINTER(waveform_info.struct_niScope_wfmInfo)], ViStatus),  # noqa: F405
+        'niScope_FetchBinary32': ([ViSession, ctypes.POINTER(ViChar), ViReal64, ViInt32, ctypes.POINTER(ViInt32), ctypes.POINTER(waveform_info.struct_niScope_wfmInfo)], ViStatus),  # noqa: F405
+        'niScope_FetchBinary8': ([ViSession, ctypes.POINTER(ViChar), ViReal64, ViInt32, ctypes.POINTER(ViInt8), ctypes.POINTER(waveform_info.struct_niScope_wfmInfo)], ViStatus),  # noqa: F405
+        'niScope_FetchMeasurement': ([ViSession, ctypes.POINTER(ViChar), ViReal64, ViInt32, ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niScope_FetchMeasurementStats': ([ViSession, ctypes.POINTER(ViChar), ViReal64, ViInt32, ctypes.POINTER(ViReal64), ctypes.POINTER(ViReal64), ctypes.POINTER(ViReal64), ctypes.POINTER(ViReal64), ctypes.POINTER(ViReal64), ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niScope_GetAttributeViBoolean': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViBoolean)], ViStatus),  # noqa: F405
+        'niScope_GetAttributeViInt32': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViInt32)], ViStatus),  # noqa: F405
+        'niScope_GetAttributeViReal64': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niScope_GetAttributeViString': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ViInt32, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niScope_GetEqualizationFilterCoefficients': ([ViSession, ctypes.POINTER(ViChar), ViInt32, ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niScope_GetError': ([ViSession, ctypes.POINTER(ViStatus), ViInt32, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niScope_InitWithOptions': ([ctypes.POINTER(ViChar), ViBoolean, ViBoolean, ctypes.POINTER(ViChar), ctypes.POINTER(ViSession)], ViStatus),  # noqa: F405
+        'niScope_InitiateAcquisition': ([ViSession], ViStatus),  # noqa: F405
+        'niScope_ProbeCompensationSignalStart': ([ViSession], ViStatus),  # noqa: F405
+        'niScope_ProbeCompensationSignalStop': ([ViSession], ViStatus),  # noqa: F405
+        'niScope_Read': ([ViSession, ctypes.POINTER(ViChar), ViReal64, ViInt32, ctypes.POINTER(ViReal64), ctypes.POINTER(waveform_info.struct_niScope_wfmInfo)], ViStatus),  # noqa: F405
+        'niScope_ReadMeasurement': ([ViSession, ctypes.POINTER(ViChar), ViReal64, ViInt32, ctypes.POINTER(ViReal64)], ViStatus),  # noqa: F405
+        'niScope_ResetDevice': ([ViSession], ViStatus),  # noqa: F405
+        'niScope_ResetWithDefaults': ([ViSession], ViStatus),  # noqa: F405
+        'niScope_SendSoftwareTriggerEdge': ([ViSession, ViInt32], ViStatus),  # noqa: F405
+        'niScope_SetAttributeViBoolean': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ViBoolean], ViStatus),  # noqa: F405
+        'niScope_SetAttributeViInt32': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ViInt32], ViStatus),  # noqa: F405
+        'niScope_SetAttributeViReal64': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ViReal64], ViStatus),  # noqa: F405
+        'niScope_SetAttributeViString': ([ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+        'niScope_close': ([ViSession], ViStatus),  # noqa: F405
+        'niScope_reset': ([ViSession], ViStatus),  # noqa: F405
+        'niScope_self_test': ([ViSession, ctypes.POINTER(ViInt16), ctypes.POINTER(ViChar)], ViStatus),  # noqa: F405
+    }
+
     def __init__(self, ctypes_library):
         self._func_lock = threading.Lock()
         self._library = ctypes_library
         # We cache the cfunc object from the ctypes.CDLL object
         self.niScope_Abort_cfunc = None
         self.niScope_AcquisitionStatus_cfunc = None
+        self.niScope_ActualMeasWfmSize_cfunc = None
         self.niScope_ActualNumWfms_cfunc = None
         self.niScope_AutoSetup_cfunc = None
         self.niScope_CalSelfCalibrate_cfunc = None
@@ -41,11 +101,10 @@ class Library(object):
         self.niScope_Disable_cfunc = None
         self.niScope_ExportSignal_cfunc = None
         self.niScope_Fetch_cfunc = None
+        self.niScope_FetchArrayMeasurement_cfunc = None
         self.niScope_FetchBinary16_cfunc = None
         self.niScope_FetchBinary32_cfunc = None
         self.niScope_FetchBinary8_cfunc = None
-        self.niScope_FetchDispatcher_cfunc = None
-        self.niScope_FetchDouble_cfunc = None
         self.niScope_FetchMeasurement_cfunc = None
         self.niScope_FetchMeasurementStats_cfunc = None
         self.niScope_GetAttributeViBoolean_cfunc = None
@@ -71,410 +130,330 @@ class Library(object):
         self.niScope_reset_cfunc = None
         self.niScope_self_test_cfunc = None
 
-    def niScope_Abort(self, vi):  # noqa: N802
+    def _bind_function(self, c_func_name):
         with self._func_lock:
-            if self.niScope_Abort_cfunc is None:
-                self.niScope_Abort_cfunc = self._library.niScope_Abort
-                self.niScope_Abort_cfunc.argtypes = [ViSession]  # noqa: F405
-                self.niScope_Abort_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_Abort_cfunc(vi)
+            cfunc = getattr(self, c_func_name + '_cfunc')
+            if cfunc is None:
+                cfunc = getattr(self._library, c_func_name)
+                cfunc.argtypes, cfunc.restype = self._prototypes[c_func_name]
+                # Only publish the cfunc once it is fully typed, other threads read it without the lock
+                setattr(self, c_func_name + '_cfunc', cfunc)
+        return cfunc
+
+    def bind_all_functions(self):
+        '''bind_all_functions
+
+        Resolves and sets up the ctypes information for every function in the driver library.
+        Functions not exported by the driver runtime are left unbound and raise on first call.
+        '''
+        for c_func_name in sorted(self._prototypes):
+            try:
+                self._bind_function(c_func_name)
+            except AttributeError:
+                pass
+
+    def niScope_Abort(self, vi):  # noqa: N802
+        cfunc = self.niScope_Abort_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_Abort')
+        return cfunc(vi)
 
     def niScope_AcquisitionStatus(self, vi, acquisition_status):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_AcquisitionStatus_cfunc is None:
-                self.niScope_AcquisitionStatus_cfunc = self._library.niScope_AcquisitionStatus
-                self.niScope_AcquisitionStatus_cfunc.argtypes = [ViSession, ctypes.POINTER(ViInt32)]  # noqa: F405
-                self.niScope_AcquisitionStatus_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_AcquisitionStatus_cfunc(vi, acquisition_status)
+        cfunc = self.niScope_AcquisitionStatus_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_AcquisitionStatus')
+        return cfunc(vi, acquisition_status)
+
+    def niScope_ActualMeasWfmSize(self, vi, array_meas_function, meas_waveform_size):  # noqa: N802
+        cfunc = self.niScope_ActualMeasWfmSize_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_ActualMeasWfmSize')
+        return cfunc(vi, array_meas_function, meas_waveform_size)
 
     def niScope_ActualNumWfms(self, vi, channel_list, num_wfms):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_ActualNumWfms_cfunc is None:
-                self.niScope_ActualNumWfms_cfunc = self._library.niScope_ActualNumWfms
-                self.niScope_ActualNumWfms_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ctypes.POINTER(ViInt32)]  # noqa: F405
-                self.niScope_ActualNumWfms_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_ActualNumWfms_cfunc(vi, channel_list, num_wfms)
+        cfunc = self.niScope_ActualNumWfms_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_ActualNumWfms')
+        return cfunc(vi, channel_list, num_wfms)
 
     def niScope_AutoSetup(self, vi):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_AutoSetup_cfunc is None:
-                self.niScope_AutoSetup_cfunc = self._library.niScope_AutoSetup
-                self.niScope_AutoSetup_cfunc.argtypes = [ViSession]  # noqa: F405
-                self.niScope_AutoSetup_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_AutoSetup_cfunc(vi)
+        cfunc = self.niScope_AutoSetup_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_AutoSetup')
+        return cfunc(vi)
 
     def niScope_CalSelfCalibrate(self, vi, channel_list, option):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_CalSelfCalibrate_cfunc is None:
-                self.niScope_CalSelfCalibrate_cfunc = self._library.niScope_CalSelfCalibrate
-                self.niScope_CalSelfCalibrate_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViInt32]  # noqa: F405
-                self.niScope_CalSelfCalibrate_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_CalSelfCalibrate_cfunc(vi, channel_list, option)
+        cfunc = self.niScope_CalSelfCalibrate_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_CalSelfCalibrate')
+        return cfunc(vi, channel_list, option)
 
     def niScope_ClearWaveformMeasurementStats(self, vi, channel_list, clearable_measurement_function):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_ClearWaveformMeasurementStats_cfunc is None:
-                self.niScope_ClearWaveformMeasurementStats_cfunc = self._library.niScope_ClearWaveformMeasurementStats
-                self.niScope_ClearWaveformMeasurementStats_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViInt32]  # noqa: F405
-                self.niScope_ClearWaveformMeasurementStats_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_ClearWaveformMeasurementStats_cfunc(vi, channel_list, clearable_measurement_function)
+        cfunc = self.niScope_ClearWaveformMeasurementStats_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_ClearWaveformMeasurementStats')
+        return cfunc(vi, channel_list, clearable_measurement_function)
 
     def niScope_Commit(self, vi):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_Commit_cfunc is None:
-                self.niScope_Commit_cfunc = self._library.niScope_Commit
-                self.niScope_Commit_cfunc.argtypes = [ViSession]  # noqa: F405
-                self.niScope_Commit_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_Commit_cfunc(vi)
+        cfunc = self.niScope_Commit_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_Commit')
+        return cfunc(vi)
 
     def niScope_ConfigureChanCharacteristics(self, vi, channel_list, input_impedance, max_input_frequency):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_ConfigureChanCharacteristics_cfunc is None:
-                self.niScope_ConfigureChanCharacteristics_cfunc = self._library.niScope_ConfigureChanCharacteristics
-                self.niScope_ConfigureChanCharacteristics_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViReal64, ViReal64]  # noqa: F405
-                self.niScope_ConfigureChanCharacteristics_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_ConfigureChanCharacteristics_cfunc(vi, channel_list, input_impedance, max_input_frequency)
+        cfunc = self.niScope_ConfigureChanCharacteristics_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_ConfigureChanCharacteristics')
+        return cfunc(vi, channel_list, input_impedance, max_input_frequency)
 
     def niScope_ConfigureEqualizationFilterCoefficients(self, vi, channel_list, number_of_coefficients, coefficients):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_ConfigureEqualizationFilterCoefficients_cfunc is None:
-                self.niScope_ConfigureEqualizationFilterCoefficients_cfunc = self._library.niScope_ConfigureEqualizationFilterCoefficients
-                self.niScope_ConfigureEqualizationFilterCoefficients_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViInt32, ctypes.POINTER(ViReal64)]  # noqa: F405
-                self.niScope_ConfigureEqualizationFilterCoefficients_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_ConfigureEqualizationFilterCoefficients_cfunc(vi, channel_list, number_of_coefficients, coefficients)
+        cfunc = self.niScope_ConfigureEqualizationFilterCoefficients_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_ConfigureEqualizationFilterCoefficients')
+        return cfunc(vi, channel_list, number_of_coefficients, coefficients)
 
     def niScope_ConfigureHorizontalTiming(self, vi, min_sample_rate, min_num_pts, ref_position, num_records, enforce_realtime):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_ConfigureHorizontalTiming_cfunc is None:
-                self.niScope_ConfigureHorizontalTiming_cfunc = self._library.niScope_ConfigureHorizontalTiming
-                self.niScope_ConfigureHorizontalTiming_cfunc.argtypes = [ViSession, ViReal64, ViInt32, ViReal64, ViInt32, ViBoolean]  # noqa: F405
-                self.niScope_ConfigureHorizontalTiming_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_ConfigureHorizontalTiming_cfunc(vi, min_sample_rate, min_num_pts, ref_position, num_records, enforce_realtime)
+        cfunc = self.niScope_ConfigureHorizontalTiming_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_ConfigureHorizontalTiming')
+        return cfunc(vi, min_sample_rate, min_num_pts, ref_position, num_records, enforce_realtime)
 
     def niScope_ConfigureRefLevels(self, vi, low, mid, high):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_ConfigureRefLevels_cfunc is None:
-                self.niScope_ConfigureRefLevels_cfunc = self._library.niScope_ConfigureRefLevels
-                self.niScope_ConfigureRefLevels_cfunc.argtypes = [ViSession, ViReal64, ViReal64, ViReal64]  # noqa: F405
-                self.niScope_ConfigureRefLevels_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_ConfigureRefLevels_cfunc(vi, low, mid, high)
+        cfunc = self.niScope_ConfigureRefLevels_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_ConfigureRefLevels')
+        return cfunc(vi, low, mid, high)
 
     def niScope_ConfigureTriggerDigital(self, vi, trigger_source, slope, holdoff, delay):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_ConfigureTriggerDigital_cfunc is None:
-                self.niScope_ConfigureTriggerDigital_cfunc = self._library.niScope_ConfigureTriggerDigital
-                self.niScope_ConfigureTriggerDigital_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViInt32, ViReal64, ViReal64]  # noqa: F405
-                self.niScope_ConfigureTriggerDigital_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_ConfigureTriggerDigital_cfunc(vi, trigger_source, slope, holdoff, delay)
+        cfunc = self.niScope_ConfigureTriggerDigital_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_ConfigureTriggerDigital')
+        return cfunc(vi, trigger_source, slope, holdoff, delay)
 
     def niScope_ConfigureTriggerEdge(self, vi, trigger_source, level, slope, trigger_coupling, holdoff, delay):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_ConfigureTriggerEdge_cfunc is None:
-                self.niScope_ConfigureTriggerEdge_cfunc = self._library.niScope_ConfigureTriggerEdge
-                self.niScope_ConfigureTriggerEdge_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViReal64, ViInt32, ViInt32, ViReal64, ViReal64]  # noqa: F405
-                self.niScope_ConfigureTriggerEdge_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_ConfigureTriggerEdge_cfunc(vi, trigger_source, level, slope, trigger_coupling, holdoff, delay)
+        cfunc = self.niScope_ConfigureTriggerEdge_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_ConfigureTriggerEdge')
+        return cfunc(vi, trigger_source, level, slope, trigger_coupling, holdoff, delay)
 
     def niScope_ConfigureTriggerHysteresis(self, vi, trigger_source, level, hysteresis, slope, trigger_coupling, holdoff, delay):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_ConfigureTriggerHysteresis_cfunc is None:
-                self.niScope_ConfigureTriggerHysteresis_cfunc = self._library.niScope_ConfigureTriggerHysteresis
-                self.niScope_ConfigureTriggerHysteresis_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViReal64, ViReal64, ViInt32, ViInt32, ViReal64, ViReal64]  # noqa: F405
-                self.niScope_ConfigureTriggerHysteresis_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_ConfigureTriggerHysteresis_cfunc(vi, trigger_source, level, hysteresis, slope, trigger_coupling, holdoff, delay)
+        cfunc = self.niScope_ConfigureTriggerHysteresis_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_ConfigureTriggerHysteresis')
+        return cfunc(vi, trigger_source, level, hysteresis, slope, trigger_coupling, holdoff, delay)
 
     def niScope_ConfigureTriggerImmediate(self, vi):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_ConfigureTriggerImmediate_cfunc is None:
-                self.niScope_ConfigureTriggerImmediate_cfunc = self._library.niScope_ConfigureTriggerImmediate
-                self.niScope_ConfigureTriggerImmediate_cfunc.argtypes = [ViSession]  # noqa: F405
-                self.niScope_ConfigureTriggerImmediate_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_ConfigureTriggerImmediate_cfunc(vi)
+        cfunc = self.niScope_ConfigureTriggerImmediate_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_ConfigureTriggerImmediate')
+        return cfunc(vi)
 
     def niScope_ConfigureTriggerSoftware(self, vi, holdoff, delay):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_ConfigureTriggerSoftware_cfunc is None:
-                self.niScope_ConfigureTriggerSoftware_cfunc = self._library.niScope_ConfigureTriggerSoftware
-                self.niScope_ConfigureTriggerSoftware_cfunc.argtypes = [ViSession, ViReal64, ViReal64]  # noqa: F405
-                self.niScope_ConfigureTriggerSoftware_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_ConfigureTriggerSoftware_cfunc(vi, holdoff, delay)
+        cfunc = self.niScope_ConfigureTriggerSoftware_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_ConfigureTriggerSoftware')
+        return cfunc(vi, holdoff, delay)
 
     def niScope_ConfigureTriggerVideo(self, vi, trigger_source, enable_dc_restore, signal_format, event, line_number, polarity, trigger_coupling, holdoff, delay):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_ConfigureTriggerVideo_cfunc is None:
-                self.niScope_ConfigureTriggerVideo_cfunc = self._library.niScope_ConfigureTriggerVideo
-                self.niScope_ConfigureTriggerVideo_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViBoolean, ViInt32, ViInt32, ViInt32, ViInt32, ViInt32, ViReal64, ViReal64]  # noqa: F405
-                self.niScope_ConfigureTriggerVideo_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_ConfigureTriggerVideo_cfunc(vi, trigger_source, enable_dc_restore, signal_format, event, line_number, polarity, trigger_coupling, holdoff, delay)
+        cfunc = self.niScope_ConfigureTriggerVideo_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_ConfigureTriggerVideo')
+        return cfunc(vi, trigger_source, enable_dc_restore, signal_format, event, line_number, polarity, trigger_coupling, holdoff, delay)
 
     def niScope_ConfigureTriggerWindow(self, vi, trigger_source, low_level, high_level, window_mode, trigger_coupling, holdoff, delay):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_ConfigureTriggerWindow_cfunc is None:
-                self.niScope_ConfigureTriggerWindow_cfunc = self._library.niScope_ConfigureTriggerWindow
-                self.niScope_ConfigureTriggerWindow_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViReal64, ViReal64, ViInt32, ViInt32, ViReal64, ViReal64]  # noqa: F405
-                self.niScope_ConfigureTriggerWindow_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_ConfigureTriggerWindow_cfunc(vi, trigger_source, low_level, high_level, window_mode, trigger_coupling, holdoff, delay)
+        cfunc = self.niScope_ConfigureTriggerWindow_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_ConfigureTriggerWindow')
+        return cfunc(vi, trigger_source, low_level, high_level, window_mode, trigger_coupling, holdoff, delay)
 
     def niScope_ConfigureVertical(self, vi, channel_list, range, offset, coupling, probe_attenuation, enabled):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_ConfigureVertical_cfunc is None:
-                self.niScope_ConfigureVertical_cfunc = self._library.niScope_ConfigureVertical
-                self.niScope_ConfigureVertical_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViReal64, ViReal64, ViInt32, ViReal64, ViBoolean]  # noqa: F405
-                self.niScope_ConfigureVertical_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_ConfigureVertical_cfunc(vi, channel_list, range, offset, coupling, probe_attenuation, enabled)
+        cfunc = self.niScope_ConfigureVertical_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_ConfigureVertical')
+        return cfunc(vi, channel_list, range, offset, coupling, probe_attenuation, enabled)
 
     def niScope_Disable(self, vi):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_Disable_cfunc is None:
-                self.niScope_Disable_cfunc = self._library.niScope_Disable
-                self.niScope_Disable_cfunc.argtypes = [ViSession]  # noqa: F405
-                self.niScope_Disable_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_Disable_cfunc(vi)
+        cfunc = self.niScope_Disable_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_Disable')
+        return cfunc(vi)
 
     def niScope_ExportSignal(self, vi, signal, signal_identifier, output_terminal):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_ExportSignal_cfunc is None:
-                self.niScope_ExportSignal_cfunc = self._library.niScope_ExportSignal
-                self.niScope_ExportSignal_cfunc.argtypes = [ViSession, ViInt32, ctypes.POINTER(ViChar), ctypes.POINTER(ViChar)]  # noqa: F405
-                self.niScope_ExportSignal_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_ExportSignal_cfunc(vi, signal, signal_identifier, output_terminal)
+        cfunc = self.niScope_ExportSignal_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_ExportSignal')
+        return cfunc(vi, signal, signal_identifier, output_terminal)
 
     def niScope_Fetch(self, vi, channel_list, timeout, num_samples, wfm, wfm_info):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_Fetch_cfunc is None:
-                self.niScope_Fetch_cfunc = self._library.niScope_Fetch
-                self.niScope_Fetch_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViReal64, ViInt32, ctypes.POINTER(ViReal64), ctypes.POINTER(waveform_info.struct_niScope_wfmInfo)]  # noqa: F405
-                self.niScope_Fetch_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_Fetch_cfunc(vi, channel_list, timeout, num_samples, wfm, wfm_info)
+        cfunc = self.niScope_Fetch_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_Fetch')
+        return cfunc(vi, channel_list, timeout, num_samples, wfm, wfm_info)
+
+    def niScope_FetchArrayMeasurement(self, vi, channel_list, timeout, array_meas_function, meas_wfm_size, meas_wfm, wfm_info):  # noqa: N802
+        cfunc = self.niScope_FetchArrayMeasurement_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_FetchArrayMeasurement')
+        return cfunc(vi, channel_list, timeout, array_meas_function, meas_wfm_size, meas_wfm, wfm_info)
 
     def niScope_FetchBinary16(self, vi, channel_list, timeout, num_samples, wfm, wfm_info):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_FetchBinary16_cfunc is None:
-                self.niScope_FetchBinary16_cfunc = self._library.niScope_FetchBinary16
-                self.niScope_FetchBinary16_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViReal64, ViInt32, ctypes.POINTER(ViInt16), ctypes.POINTER(waveform_info.struct_niScope_wfmInfo)]  # noqa: F405
-                self.niScope_FetchBinary16_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_FetchBinary16_cfunc(vi, channel_list, timeout, num_samples, wfm, wfm_info)
+        cfunc = self.niScope_FetchBinary16_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_FetchBinary16')
+        return cfunc(vi, channel_list, timeout, num_samples, wfm, wfm_info)
 
     def niScope_FetchBinary32(self, vi, channel_list, timeout, num_samples, wfm, wfm_info):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_FetchBinary32_cfunc is None:
-                self.niScope_FetchBinary32_cfunc = self._library.niScope_FetchBinary32
-                self.niScope_FetchBinary32_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViReal64, ViInt32, ctypes.POINTER(ViInt32), ctypes.POINTER(waveform_info.struct_niScope_wfmInfo)]  # noqa: F405
-                self.niScope_FetchBinary32_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_FetchBinary32_cfunc(vi, channel_list, timeout, num_samples, wfm, wfm_info)
+        cfunc = self.niScope_FetchBinary32_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_FetchBinary32')
+        return cfunc(vi, channel_list, timeout, num_samples, wfm, wfm_info)
 
     def niScope_FetchBinary8(self, vi, channel_list, timeout, num_samples, wfm, wfm_info):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_FetchBinary8_cfunc is None:
-                self.niScope_FetchBinary8_cfunc = self._library.niScope_FetchBinary8
-                self.niScope_FetchBinary8_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViReal64, ViInt32, ctypes.POINTER(ViInt8), ctypes.POINTER(waveform_info.struct_niScope_wfmInfo)]  # noqa: F405
-                self.niScope_FetchBinary8_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_FetchBinary8_cfunc(vi, channel_list, timeout, num_samples, wfm, wfm_info)
-
-    def niScope_FetchDispatcher(self, vi, channel_list, timeout, num_samples, wfm, wfm_info):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_FetchDispatcher_cfunc is None:
-                self.niScope_FetchDispatcher_cfunc = self._library.niScope_FetchDispatcher
-                self.niScope_FetchDispatcher_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViReal64, ViInt32, ctypes.POINTER(ViReal64), ctypes.POINTER(waveform_info.struct_niScope_wfmInfo)]  # noqa: F405
-                self.niScope_FetchDispatcher_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_FetchDispatcher_cfunc(vi, channel_list, timeout, num_samples, wfm, wfm_info)
-
-    def niScope_FetchDouble(self, vi, channel_list, timeout, num_samples, wfm, wfm_info):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_FetchDouble_cfunc is None:
-                self.niScope_FetchDouble_cfunc = self._library.niScope_FetchDouble
-                self.niScope_FetchDouble_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViReal64, ViInt32, ctypes.POINTER(ViReal64), ctypes.POINTER(waveform_info.struct_niScope_wfmInfo)]  # noqa: F405
-                self.niScope_FetchDouble_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_FetchDouble_cfunc(vi, channel_list, timeout, num_samples, wfm, wfm_info)
+        cfunc = self.niScope_FetchBinary8_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_FetchBinary8')
+        return cfunc(vi, channel_list, timeout, num_samples, wfm, wfm_info)
 
     def niScope_FetchMeasurement(self, vi, channel_list, timeout, scalar_meas_function, result):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_FetchMeasurement_cfunc is None:
-                self.niScope_FetchMeasurement_cfunc = self._library.niScope_FetchMeasurement
-                self.niScope_FetchMeasurement_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViReal64, ViInt32, ctypes.POINTER(ViReal64)]  # noqa: F405
-                self.niScope_FetchMeasurement_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_FetchMeasurement_cfunc(vi, channel_list, timeout, scalar_meas_function, result)
+        cfunc = self.niScope_FetchMeasurement_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_FetchMeasurement')
+        return cfunc(vi, channel_list, timeout, scalar_meas_function, result)
 
     def niScope_FetchMeasurementStats(self, vi, channel_list, timeout, scalar_meas_function, result, mean, stdev, min, max, num_in_stats):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_FetchMeasurementStats_cfunc is None:
-                self.niScope_FetchMeasurementStats_cfunc = self._library.niScope_FetchMeasurementStats
-                self.niScope_FetchMeasurementStats_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViReal64, ViInt32, ctypes.POINTER(ViReal64), ctypes.POINTER(ViReal64), ctypes.POINTER(ViReal64), ctypes.POINTER(ViReal64), ctypes.POINTER(ViReal64), ctypes.POINTER(ViInt32)]  # noqa: F405
-                self.niScope_FetchMeasurementStats_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_FetchMeasurementStats_cfunc(vi, channel_list, timeout, scalar_meas_function, result, mean, stdev, min, max, num_in_stats)
+        cfunc = self.niScope_FetchMeasurementStats_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_FetchMeasurementStats')
+        return cfunc(vi, channel_list, timeout, scalar_meas_function, result, mean, stdev, min, max, num_in_stats)
 
     def niScope_GetAttributeViBoolean(self, vi, channel_list, attribute_id, value):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_GetAttributeViBoolean_cfunc is None:
-                self.niScope_GetAttributeViBoolean_cfunc = self._library.niScope_GetAttributeViBoolean
-                self.niScope_GetAttributeViBoolean_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViBoolean)]  # noqa: F405
-                self.niScope_GetAttributeViBoolean_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_GetAttributeViBoolean_cfunc(vi, channel_list, attribute_id, value)
+        cfunc = self.niScope_GetAttributeViBoolean_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_GetAttributeViBoolean')
+        return cfunc(vi, channel_list, attribute_id, value)
 
     def niScope_GetAttributeViInt32(self, vi, channel_list, attribute_id, value):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_GetAttributeViInt32_cfunc is None:
-                self.niScope_GetAttributeViInt32_cfunc = self._library.niScope_GetAttributeViInt32
-                self.niScope_GetAttributeViInt32_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViInt32)]  # noqa: F405
-                self.niScope_GetAttributeViInt32_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_GetAttributeViInt32_cfunc(vi, channel_list, attribute_id, value)
+        cfunc = self.niScope_GetAttributeViInt32_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_GetAttributeViInt32')
+        return cfunc(vi, channel_list, attribute_id, value)
 
     def niScope_GetAttributeViReal64(self, vi, channel_list, attribute_id, value):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_GetAttributeViReal64_cfunc is None:
-                self.niScope_GetAttributeViReal64_cfunc = self._library.niScope_GetAttributeViReal64
-                self.niScope_GetAttributeViReal64_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViReal64)]  # noqa: F405
-                self.niScope_GetAttributeViReal64_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_GetAttributeViReal64_cfunc(vi, channel_list, attribute_id, value)
+        cfunc = self.niScope_GetAttributeViReal64_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_GetAttributeViReal64')
+        return cfunc(vi, channel_list, attribute_id, value)
 
     def niScope_GetAttributeViString(self, vi, channel_list, attribute_id, buf_size, value):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_GetAttributeViString_cfunc is None:
-                self.niScope_GetAttributeViString_cfunc = self._library.niScope_GetAttributeViString
-                self.niScope_GetAttributeViString_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ViInt32, ctypes.POINTER(ViChar)]  # noqa: F405
-                self.niScope_GetAttributeViString_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_GetAttributeViString_cfunc(vi, channel_list, attribute_id, buf_size, value)
+        cfunc = self.niScope_GetAttributeViString_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_GetAttributeViString')
+        return cfunc(vi, channel_list, attribute_id, buf_size, value)
 
     def niScope_GetEqualizationFilterCoefficients(self, vi, channel, number_of_coefficients, coefficients):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_GetEqualizationFilterCoefficients_cfunc is None:
-                self.niScope_GetEqualizationFilterCoefficients_cfunc = self._library.niScope_GetEqualizationFilterCoefficients
-                self.niScope_GetEqualizationFilterCoefficients_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViInt32, ctypes.POINTER(ViReal64)]  # noqa: F405
-                self.niScope_GetEqualizationFilterCoefficients_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_GetEqualizationFilterCoefficients_cfunc(vi, channel, number_of_coefficients, coefficients)
+        cfunc = self.niScope_GetEqualizationFilterCoefficients_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_GetEqualizationFilterCoefficients')
+        return cfunc(vi, channel, number_of_coefficients, coefficients)
 
     def niScope_GetError(self, vi, error_code, buffer_size, description):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_GetError_cfunc is None:
-                self.niScope_GetError_cfunc = self._library.niScope_GetError
-                self.niScope_GetError_cfunc.argtypes = [ViSession, ctypes.POINTER(ViStatus), ViInt32, ctypes.POINTER(ViChar)]  # noqa: F405
-                self.niScope_GetError_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_GetError_cfunc(vi, error_code, buffer_size, description)
+        cfunc = self.niScope_GetError_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_GetError')
+        return cfunc(vi, error_code, buffer_size, description)
 
     def niScope_InitWithOptions(self, resource_name, id_query, reset_device, option_string, vi):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_InitWithOptions_cfunc is None:
-                self.niScope_InitWithOptions_cfunc = self._library.niScope_InitWithOptions
-                self.niScope_InitWithOptions_cfunc.argtypes = [ctypes.POINTER(ViChar), ViBoolean, ViBoolean, ctypes.POINTER(ViChar), ctypes.POINTER(ViSession)]  # noqa: F405
-                self.niScope_InitWithOptions_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_InitWithOptions_cfunc(resource_name, id_query, reset_device, option_string, vi)
+        cfunc = self.niScope_InitWithOptions_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_InitWithOptions')
+        return cfunc(resource_name, id_query, reset_device, option_string, vi)
 
     def niScope_InitiateAcquisition(self, vi):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_InitiateAcquisition_cfunc is None:
-                self.niScope_InitiateAcquisition_cfunc = self._library.niScope_InitiateAcquisition
-                self.niScope_InitiateAcquisition_cfunc.argtypes = [ViSession]  # noqa: F405
-                self.niScope_InitiateAcquisition_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_InitiateAcquisition_cfunc(vi)
+        cfunc = self.niScope_InitiateAcquisition_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_InitiateAcquisition')
+        return cfunc(vi)
 
     def niScope_ProbeCompensationSignalStart(self, vi):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_ProbeCompensationSignalStart_cfunc is None:
-                self.niScope_ProbeCompensationSignalStart_cfunc = self._library.niScope_ProbeCompensationSignalStart
-                self.niScope_ProbeCompensationSignalStart_cfunc.argtypes = [ViSession]  # noqa: F405
-                self.niScope_ProbeCompensationSignalStart_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_ProbeCompensationSignalStart_cfunc(vi)
+        cfunc = self.niScope_ProbeCompensationSignalStart_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_ProbeCompensationSignalStart')
+        return cfunc(vi)
 
     def niScope_ProbeCompensationSignalStop(self, vi):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_ProbeCompensationSignalStop_cfunc is None:
-                self.niScope_ProbeCompensationSignalStop_cfunc = self._library.niScope_ProbeCompensationSignalStop
-                self.niScope_ProbeCompensationSignalStop_cfunc.argtypes = [ViSession]  # noqa: F405
-                self.niScope_ProbeCompensationSignalStop_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_ProbeCompensationSignalStop_cfunc(vi)
+        cfunc = self.niScope_ProbeCompensationSignalStop_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_ProbeCompensationSignalStop')
+        return cfunc(vi)
 
     def niScope_Read(self, vi, channel_list, timeout, num_samples, wfm, wfm_info):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_Read_cfunc is None:
-                self.niScope_Read_cfunc = self._library.niScope_Read
-                self.niScope_Read_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViReal64, ViInt32, ctypes.POINTER(ViReal64), ctypes.POINTER(waveform_info.struct_niScope_wfmInfo)]  # noqa: F405
-                self.niScope_Read_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_Read_cfunc(vi, channel_list, timeout, num_samples, wfm, wfm_info)
+        cfunc = self.niScope_Read_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_Read')
+        return cfunc(vi, channel_list, timeout, num_samples, wfm, wfm_info)
 
     def niScope_ReadMeasurement(self, vi, channel_list, timeout, scalar_meas_function, result):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_ReadMeasurement_cfunc is None:
-                self.niScope_ReadMeasurement_cfunc = self._library.niScope_ReadMeasurement
-                self.niScope_ReadMeasurement_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViReal64, ViInt32, ctypes.POINTER(ViReal64)]  # noqa: F405
-                self.niScope_ReadMeasurement_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_ReadMeasurement_cfunc(vi, channel_list, timeout, scalar_meas_function, result)
+        cfunc = self.niScope_ReadMeasurement_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_ReadMeasurement')
+        return cfunc(vi, channel_list, timeout, scalar_meas_function, result)
 
     def niScope_ResetDevice(self, vi):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_ResetDevice_cfunc is None:
-                self.niScope_ResetDevice_cfunc = self._library.niScope_ResetDevice
-                self.niScope_ResetDevice_cfunc.argtypes = [ViSession]  # noqa: F405
-                self.niScope_ResetDevice_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_ResetDevice_cfunc(vi)
+        cfunc = self.niScope_ResetDevice_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_ResetDevice')
+        return cfunc(vi)
 
     def niScope_ResetWithDefaults(self, vi):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_ResetWithDefaults_cfunc is None:
-                self.niScope_ResetWithDefaults_cfunc = self._library.niScope_ResetWithDefaults
-                self.niScope_ResetWithDefaults_cfunc.argtypes = [ViSession]  # noqa: F405
-                self.niScope_ResetWithDefaults_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_ResetWithDefaults_cfunc(vi)
+        cfunc = self.niScope_ResetWithDefaults_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_ResetWithDefaults')
+        return cfunc(vi)
 
     def niScope_SendSoftwareTriggerEdge(self, vi, which_trigger):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_SendSoftwareTriggerEdge_cfunc is None:
-                self.niScope_SendSoftwareTriggerEdge_cfunc = self._library.niScope_SendSoftwareTriggerEdge
-                self.niScope_SendSoftwareTriggerEdge_cfunc.argtypes = [ViSession, ViInt32]  # noqa: F405
-                self.niScope_SendSoftwareTriggerEdge_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_SendSoftwareTriggerEdge_cfunc(vi, which_trigger)
+        cfunc = self.niScope_SendSoftwareTriggerEdge_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_SendSoftwareTriggerEdge')
+        return cfunc(vi, which_trigger)
 
     def niScope_SetAttributeViBoolean(self, vi, channel_list, attribute_id, value):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_SetAttributeViBoolean_cfunc is None:
-                self.niScope_SetAttributeViBoolean_cfunc = self._library.niScope_SetAttributeViBoolean
-                self.niScope_SetAttributeViBoolean_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ViBoolean]  # noqa: F405
-                self.niScope_SetAttributeViBoolean_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_SetAttributeViBoolean_cfunc(vi, channel_list, attribute_id, value)
+        cfunc = self.niScope_SetAttributeViBoolean_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_SetAttributeViBoolean')
+        return cfunc(vi, channel_list, attribute_id, value)
 
     def niScope_SetAttributeViInt32(self, vi, channel_list, attribute_id, value):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_SetAttributeViInt32_cfunc is None:
-                self.niScope_SetAttributeViInt32_cfunc = self._library.niScope_SetAttributeViInt32
-                self.niScope_SetAttributeViInt32_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ViInt32]  # noqa: F405
-                self.niScope_SetAttributeViInt32_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_SetAttributeViInt32_cfunc(vi, channel_list, attribute_id, value)
+        cfunc = self.niScope_SetAttributeViInt32_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_SetAttributeViInt32')
+        return cfunc(vi, channel_list, attribute_id, value)
 
     def niScope_SetAttributeViReal64(self, vi, channel_list, attribute_id, value):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_SetAttributeViReal64_cfunc is None:
-                self.niScope_SetAttributeViReal64_cfunc = self._library.niScope_SetAttributeViReal64
-                self.niScope_SetAttributeViReal64_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ViReal64]  # noqa: F405
-                self.niScope_SetAttributeViReal64_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_SetAttributeViReal64_cfunc(vi, channel_list, attribute_id, value)
+        cfunc = self.niScope_SetAttributeViReal64_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_SetAttributeViReal64')
+        return cfunc(vi, channel_list, attribute_id, value)
 
     def niScope_SetAttributeViString(self, vi, channel_list, attribute_id, value):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_SetAttributeViString_cfunc is None:
-                self.niScope_SetAttributeViString_cfunc = self._library.niScope_SetAttributeViString
-                self.niScope_SetAttributeViString_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViChar)]  # noqa: F405
-                self.niScope_SetAttributeViString_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_SetAttributeViString_cfunc(vi, channel_list, attribute_id, value)
+        cfunc = self.niScope_SetAttributeViString_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_SetAttributeViString')
+        return cfunc(vi, channel_list, attribute_id, value)
 
     def niScope_close(self, vi):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_close_cfunc is None:
-                self.niScope_close_cfunc = self._library.niScope_close
-                self.niScope_close_cfunc.argtypes = [ViSession]  # noqa: F405
-                self.niScope_close_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_close_cfunc(vi)
+        cfunc = self.niScope_close_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_close')
+        return cfunc(vi)
 
     def niScope_reset(self, vi):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_reset_cfunc is None:
-                self.niScope_reset_cfunc = self._library.niScope_reset
-                self.niScope_reset_cfunc.argtypes = [ViSession]  # noqa: F405
-                self.niScope_reset_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_reset_cfunc(vi)
+        cfunc = self.niScope_reset_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_reset')
+        return cfunc(vi)
 
     def niScope_self_test(self, vi, self_test_result, self_test_message):  # noqa: N802
-        with self._func_lock:
-            if self.niScope_self_test_cfunc is None:
-                self.niScope_self_test_cfunc = self._library.niScope_self_test
-                self.niScope_self_test_cfunc.argtypes = [ViSession, ctypes.POINTER(ViInt16), ctypes.POINTER(ViChar)]  # noqa: F405
-                self.niScope_self_test_cfunc.restype = ViStatus  # noqa: F405
-        return self.niScope_self_test_cfunc(vi, self_test_result, self_test_message)
+        cfunc = self.niScope_self_test_cfunc
+        if cfunc is None:
+            cfunc = self._bind_function('niScope_self_test')
+        return cfunc(vi, self_test_result, self_test_message)
@@ -1,13 +1,17 @@
 # -*- coding: utf-8 -*-
 # This file was generated
 import array  # noqa: F401
+import collections
 import ctypes
 import datetime
+import six
+import threading
 
 from niscope import _converters
 from niscope import attributes
 from niscope import enums
 from niscope import errors
+from niscope import executor
 from niscope import library_singleton
 from niscope import visatype
 
@@ -22,12 +26,23 @@ pp = pprint.PrettyPrinter(indent=4)
 def get_ctypes_pointer_for_buffer(value=None, library_type=None, size=None):
     if isinstance(value, array.array):
         assert library_type is not None, 'library_type is required for array.array'
-        addr, _ = value.buffer_info()
-        return ctypes.cast(addr, ctypes.POINTER(library_type))
+        if value.itemsize == ctypes.sizeof(library_type) and (value.typecode in 'fd') == (getattr(library_type, '_type_', None) in ('f', 'd')):
+            # Passed by pointer, without copying
+            addr, _ = value.buffer_info()
+            return ctypes.cast(addr, ctypes.POINTER(library_type))
+        # Input buffer of another element type, i.e. array.array('f') for ViReal64
+        return (library_type * len(value))(*value)
     elif str(type(value)).find("'numpy.ndarray'") != -1:
         import numpy
-        return numpy.ctypeslib.as_ctypes(value)
-    elif isinstance(value, list):
+        if library_type is None:
+            return numpy.ctypeslib.as_ctypes(value)
+        dtype = numpy.dtype(library_type)
+        if value.dtype == dtype and value.flags.c_contiguous:
+            # Passed by pointer, without copying
+            return ctypes.cast(value.ctypes.data, ctypes.POINTER(library_type))
+        # Input buffer of another dtype or not contiguous. The ctypes array keeps a reference to the converted copy.
+        return numpy.ctypeslib.as_ctypes(numpy.ascontiguousarray(value.astype(dtype, casting='same_kind', copy=False)))
+    elif isinstance(value, (list, tuple)):
         assert library_type is not None, 'library_type is required for list'
         return (library_type * len(value))(*value)
     else:
@@ -39,7 +54,8 @@ def get_ctypes_pointer_for_buffer(value=None, library_type=None, size=None):
 
 def get_ctypes_and_array(value, array_type):
     if value is not None:
-        if isinstance(value, array.array):
+        if isinstance(value, array.array) or str(type(value)).find("'numpy.ndarray'") != -1:
+            # get_ctypes_pointer_for_buffer() passes them by pointer when the element type matches
             value_array = value
         else:
             value_array = array.array(array_type, value)
@@ -61,24 +77,274 @@ class _Acquisition(object):
         self._session.abort()
 
 
+class _LruCache(object):
+    '''Dictionary with at most maxsize entries that discards the least recently used entry when full'''
+
+    def __init__(self, maxsize):
+        self._maxsize = maxsize
+        self._values = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, create):
+        '''Returns the value stored for key, calling create() and storing its result on a miss'''
+        with self._lock:
+            try:
+                value = self._values.pop(key)
+                self._values[key] = value
+                return value
+            except KeyError:
+                pass
+        # Don't hold the lock while creating the value, create() may call into the driver
+        value = create()
+        with self._lock:
+            self._values[key] = value
+            if len(self._values) > self._maxsize:
+                self._values.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+
+def _get_repeated_capability_cache_key(repeated_capability):
+    '''Returns a hashable key for repeated_capability, or None for values that are not cached (i.e. generators)'''
+    simple_types = six.string_types + six.integer_types
+    if isinstance(repeated_capability, simple_types):
+        # The type is part of the key so that i.e. True and 1 are different keys
+        return (type(repeated_capability), repeated_capability)
+    if isinstance(repeated_capability, slice):
+        return (slice, repeated_capability.start, repeated_capability.stop, repeated_capability.step)
+    if isinstance(repeated_capability, (list, tuple)) and all(isinstance(r, simple_types) for r in repeated_capability):
+        return (type(repeated_capability), ) + tuple((type(r), r) for r in repeated_capability)
+    return None
+
+
 class _RepeatedCapabilities(object):
+    # Maximum number of objects kept by each repeated capability, see __getitem__
+    _cache_size = 128
+
     def __init__(self, session, prefix):
         self._session = session
         self._prefix = prefix
+        self._cache = _LruCache(self._cache_size)
 
     def __getitem__(self, repeated_capability):
         '''Set/get properties or call methods with a repeated capability (i.e. channels)'''
+        key = _get_repeated_capability_cache_key(repeated_capability)
+        if key is None:
+            return self._create(repeated_capability)
+        # The objects are immutable, so the ones for recently used repeated capabilities are reused
+        # instead of parsing the repeated capability and encoding the resulting string again
+        return self._cache.get(key, lambda: self._create(repeated_capability))
+
+    def _create(self, repeated_capability):
         rep_caps = _converters.convert_repeated_capabilities(repeated_capability, self._prefix)
 
-        return _SessionBase(vi=self._session._vi, repeated_capability=rep_caps, library=self._session._library, encoding=self._session._encoding, freeze_it=True)
+        return self._session._with_repeated_capability(rep_caps)
 
+    def _clear_cache(self):
+        self._cache.clear()
 
-class _SessionBase(object):
+
+class _SessionBase(errors._WarningPolicyMixin):
     '''Base class for all NI-SCOPE sessions.'''
 
     # This is needed during __init__. Without it, __setattr__ raises an exception
     _is_frozen = False
 
+    # Names that __setattr__ accepts without a dir() lookup once the session is frozen: the
+    # properties and the instance attributes set in __init__. Anything else falls back to dir().
+    _settable_names = frozenset([
+        '_vi',
+        '_attribute_cache',
+        '_channel_name_ctypes',
+        '_encoding',
+        '_error_descriptions',
+        '_is_frozen',
+        '_library',
+        '_memoized_results',
+        '_param_list',
+        '_pending_descriptions',
+        '_repeated_capability',
+        '_repeated_capability_ctype',
+        '_warning_filter',
+        '_5102_adjust_pretrigger_samples',
+        '_5v_out_output_terminal',
+        'absolute_sample_clock_offset',
+        'accessory_gain',
+        'accessory_offset',
+        'acquisition_start_time',
+        'acquisition_type',
+        'acq_arm_source',
+        'adv_trig_src',
+        'allow_more_records_than_memory',
+        'arm_ref_trig_src',
+        'backlog',
+        'bandpass_filter_enabled',
+        'binary_sample_width',
+        'cache',
+        'channel_count',
+        'channel_enabled',
+        'channel_terminal_configuration',
+        'clock_sync_pulse_source',
+        'data_transfer_block_size',
+        'data_transfer_maximum_bandwidth',
+        'data_transfer_preferred_packet_size',
+        'ddc_center_frequency',
+        'ddc_data_processing_mode',
+        'ddc_enabled',
+        'ddc_frequency_translation_enabled',
+        'ddc_frequency_translation_phase_i',
+        'ddc_frequency_translation_phase_q',
+        'ddc_q_source',
+        'device_number',
+        'device_temperature',
+        'digital_gain',
+        'digital_offset',
+        'dither_enabled',
+        'driver_setup',
+        'enable_dc_restore',
+        'enable_time_interleaved_sampling',
+        'end_of_acquisition_event_output_terminal',
+        'end_of_record_event_output_terminal',
+        'end_of_record_to_advance_trigger_holdoff',
+        'equalization_filter_enabled',
+        'equalization_num_coefficients',
+        'exported_advance_trigger_output_terminal',
+        'exported_ref_trigger_output_terminal',
+        'exported_start_trigger_output_terminal',
+        'fetch_interleaved_data',
+        'fetch_interleaved_iq_data',
+        'fetch_meas_num_samples',
+        'fetch_num_records',
+        'fetch_offset',
+        'fetch_record_number',
+        'fetch_relative_to',
+        'flex_fir_antialias_filter_type',
+        'fpga_bitfile_path',
+        'fractional_resample_enabled',
+        'group_capabilities',
+        'high_pass_filter_frequency',
+        'horz_enforce_realtime',
+        'horz_min_num_pts',
+        'horz_num_records',
+        'horz_record_length',
+        'horz_record_ref_position',
+        'horz_sample_rate',
+        'horz_time_per_record',
+        'input_clock_source',
+        'input_impedance',
+        'instrument_firmware_revision',
+        'instrument_manufacturer',
+        'instrument_model',
+        'interchange_check',
+        'interleaving_offset_correction_enabled',
+        'io_resource_descriptor',
+        'logical_name',
+        'master_enable',
+        'max_input_frequency',
+        'max_real_time_sampling_rate',
+        'max_ris_rate',
+        'meas_array_gain',
+        'meas_array_offset',
+        'meas_chan_high_ref_level',
+        'meas_chan_low_ref_level',
+        'meas_chan_mid_ref_level',
+        'meas_filter_center_freq',
+        'meas_filter_cutoff_freq',
+        'meas_filter_order',
+        'meas_filter_ripple',
+        'meas_filter_taps',
+        'meas_filter_transient_waveform_percent',
+        'meas_filter_type',
+        'meas_filter_width',
+        'meas_fir_filter_window',
+        'meas_hysteresis_percent',
+        'meas_interpolation_sampling_factor',
+        'meas_last_acq_histogram_size',
+        'meas_other_channel',
+        'meas_percentage_method',
+        'meas_polynomial_interpolation_order',
+        'meas_ref_level_units',
+        'meas_time_histogram_high_time',
+        'meas_time_histogram_high_volts',
+        'meas_time_histogram_low_time',
+        'meas_time_histogram_low_volts',
+        'meas_time_histogram_size',
+        'meas_voltage_histogram_high_volts',
+        'meas_voltage_histogram_low_volts',
+        'meas_voltage_histogram_size',
+        'min_sample_rate',
+        'mux_mode_register',
+        'onboard_memory_size',
+        'oscillator_phase_dac_value',
+        'output_clock_source',
+        'overflow_error_reporting',
+        'pll_lock_status',
+        'points_done',
+        'poll_interval',
+        'probe_attenuation',
+        'range_check',
+        'ready_for_advance_event_output_terminal',
+        'ready_for_ref_event_output_terminal',
+        'ready_for_start_event_output_terminal',
+        'records_done',
+        'record_arm_source',
+        'record_coercions',
+        'ref_clk_rate',
+        'ref_trigger_detector_location',
+        'ref_trigger_minimum_quiet_time',
+        'ref_trig_tdc_enable',
+        'resolution',
+        'ris_in_auto_setup_enable',
+        'ris_method',
+        'ris_num_averages',
+        'sample_clock_timebase_multiplier',
+        'sample_mode',
+        'samp_clk_timebase_div',
+        'samp_clk_timebase_rate',
+        'samp_clk_timebase_src',
+        'serial_number',
+        'simulate',
+        'slave_trigger_delay',
+        'specific_driver_class_spec_major_version',
+        'specific_driver_class_spec_minor_version',
+        'specific_driver_description',
+        'specific_driver_revision',
+        'specific_driver_vendor',
+        'start_to_ref_trigger_holdoff',
+        'stream_relative_to',
+        'supported_instrument_models',
+        'trigger_auto_triggered',
+        'trigger_coupling',
+        'trigger_delay_time',
+        'trigger_from_pfi_delay',
+        'trigger_from_rtsi_delay',
+        'trigger_from_star_delay',
+        'trigger_holdoff',
+        'trigger_hysteresis',
+        'trigger_impedance',
+        'trigger_level',
+        'trigger_modifier',
+        'trigger_slope',
+        'trigger_source',
+        'trigger_to_pfi_delay',
+        'trigger_to_rtsi_delay',
+        'trigger_to_star_delay',
+        'trigger_type',
+        'trigger_window_high_level',
+        'trigger_window_low_level',
+        'trigger_window_mode',
+        'tv_trigger_event',
+        'tv_trigger_line_number',
+        'tv_trigger_polarity',
+        'tv_trigger_signal_format',
+        'vertical_coupling',
+        'vertical_offset',
+        'vertical_range',
+    ])
+
     _5102_adjust_pretrigger_samples = attributes.AttributeViBoolean(1150085)
     '''Type: bool
 
@@ -193,7 +459,7 @@ class _SessionBase(object):
 
     Specifies the source the digitizer monitors for an arm reference trigger.   When the arm reference trigger is received, the digitizer begins looking for a  reference (stop) trigger from the user-configured trigger source.
     '''
-    backlog = attributes.AttributeViReal64(1150084)
+    backlog = attributes.AttributeViReal64(1150084, cacheable=False)
     '''Type: float
 
     Returns the number of samples (points_done) that have been acquired but not fetched  for the record specified by fetch_record_number.
@@ -388,7 +654,7 @@ class _SessionBase(object):
 
     Indicates the device number associated with the current session.
     '''
-    device_temperature = attributes.AttributeViReal64(1150086)
+    device_temperature = attributes.AttributeViReal64(1150086, cacheable=False)
     '''Type: float
 
     Returns the temperature of the device in degrees Celsius from the onboard sensor.
@@ -774,12 +1040,9 @@ class _SessionBase(object):
     meas_array_gain = attributes.AttributeViReal64(1150043)
     '''Type: float
 
-    Every element of an array is multiplied by this scalar value during the Array Gain measurement.  Refer to NISCOPE_VAL_ARRAY_GAIN for more information.
+    Every element of an array is multiplied by this scalar value during the Array Gain measurement.  Refer to ArrayMeasurement.ARRAY_GAIN for more information.
     Default: 1.0
 
-    Note:
-    One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or represent True/False, have been removed.
-
     Tip:
     This property can use repeated capabilities (usually channels). If set or get directly on the
     meas_array_gain.Session object, then the set/get will use all repeated capabilities in the session.
@@ -792,12 +1055,9 @@ class _SessionBase(object):
     meas_array_offset = attributes.AttributeViReal64(1150044)
     '''Type: float
 
-    Every element of an array is added to this scalar value during the Array Offset measurement. Refer to NISCOPE_VAL_ARRAY_OFFSET for more information.
+    Every element of an array is added to this scalar value during the Array Offset measurement. Refer to ArrayMeasurement.ARRAY_OFFSET for more information.
     Default: 0.0
 
-    Note:
-    One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or represent True/False, have been removed.
-
     Tip:
     This property can use repeated capabilities (usually channels). If set or get directly on the
     meas_array_offset.Session object, then the set/get will use all repeated capabilities in the session.
@@ -948,11 +1208,11 @@ class _SessionBase(object):
 
     Specifies the FIR window type. The possible choices are:
     NISCOPE_VAL_NONE
-    NISCOPE_VAL_HANNING_WINDOW
-    NISCOPE_VAL_HAMMING_WINDOW
-    NISCOPE_VAL_TRIANGLE_WINDOW
-    NISCOPE_VAL_FLAT_TOP_WINDOW
-    NISCOPE_VAL_BLACKMAN_WINDOW
+    ArrayMeasurement.HANNING_WINDOW
+    ArrayMeasurement.HAMMING_WINDOW
+    ArrayMeasurement.TRIANGLE_WINDOW
+    ArrayMeasurement.FLAT_TOP_WINDOW
+    ArrayMeasurement.BLACKMAN_WINDOW
     The symmetric windows are applied to the FIR filter coefficients to limit passband ripple in FIR filters.
     Default: NISCOPE_VAL_NONE
 
@@ -986,15 +1246,12 @@ class _SessionBase(object):
     meas_interpolation_sampling_factor = attributes.AttributeViReal64(1150030)
     '''Type: float
 
-    The new number of points for polynomial interpolation is the sampling factor times the input number of points. For example, if you acquire 1,000 points with the digitizer and set this property to 2.5, calling FetchWaveformMeasurementArray with the NISCOPE_VAL_POLYNOMIAL_INTERPOLATION measurement resamples the waveform to 2,500 points.
+    The new number of points for polynomial interpolation is the sampling factor times the input number of points. For example, if you acquire 1,000 points with the digitizer and set this property to 2.5, calling FetchWaveformMeasurementArray with the ArrayMeasurement.POLYNOMIAL_INTERPOLATION measurement resamples the waveform to 2,500 points.
     Default: 2.0
 
     Note:
     One or more of the referenced methods are not in the Python API for this driver.
 
-    Note:
-    One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or represent True/False, have been removed.
-
     Tip:
     This property can use repeated capabilities (usually channels). If set or get directly on the
     meas_interpolation_sampling_factor.Session object, then the set/get will use all repeated capabilities in the session.
@@ -1022,12 +1279,9 @@ class _SessionBase(object):
     meas_other_channel = attributes.AttributeViString(1150018)
     '''Type: str
 
-    Specifies the second channel for two-channel measurements, such as NISCOPE_VAL_ADD_CHANNELS. If processing steps are registered with this channel, the processing is done before the waveform is used in a two-channel measurement.
+    Specifies the second channel for two-channel measurements, such as ArrayMeasurement.ADD_CHANNELS. If processing steps are registered with this channel, the processing is done before the waveform is used in a two-channel measurement.
     Default: '0'
 
-    Note:
-    One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or represent True/False, have been removed.
-
     Tip:
     This property can use repeated capabilities (usually channels). If set or get directly on the
     meas_other_channel.Session object, then the set/get will use all repeated capabilities in the session.
@@ -1197,12 +1451,12 @@ class _SessionBase(object):
     Disabled (2)
     Default Value: Warning
     '''
-    pll_lock_status = attributes.AttributeViBoolean(1151303)
+    pll_lock_status = attributes.AttributeViBoolean(1151303, cacheable=False)
     '''Type: bool
 
     If TRUE, the PLL has remained locked to the external reference clock since it was last checked. If FALSE,  the PLL has become unlocked from the external reference clock since it was last checked.
     '''
-    points_done = attributes.AttributeViReal64(1150082)
+    points_done = attributes.AttributeViReal64(1150082, cacheable=False)
     '''Type: float
 
     Actual number of samples acquired in the record specified by fetch_record_number from the fetch_relative_to and fetch_offset properties.
@@ -1252,7 +1506,7 @@ class _SessionBase(object):
     Specifies the destination for the Ready for Start Event.   When this event is asserted, the digitizer is ready to receive a start trigger.
     Consult your device documentation for a specific list of valid destinations.
     '''
-    records_done = attributes.AttributeViInt32(1150083)
+    records_done = attributes.AttributeViInt32(1150083, cacheable=False)
     '''Type: int
 
     Specifies the number of records that have been completely acquired.
@@ -1422,7 +1676,7 @@ class _SessionBase(object):
 
     A string that contains a comma-separated list of the instrument model numbers supported by this driver.
     '''
-    trigger_auto_triggered = attributes.AttributeViBoolean(1150278)
+    trigger_auto_triggered = attributes.AttributeViBoolean(1150278, cacheable=False)
     '''Type: bool
 
     Specifies if the last acquisition was auto triggered.   You can use the Auto Triggered property to find out if the last acquisition was triggered.
@@ -1626,11 +1880,21 @@ class _SessionBase(object):
         var = session.channels['0,1'].vertical_range
     '''
 
-    def __init__(self, repeated_capability, vi, library, encoding, freeze_it=False):
+    def __init__(self, repeated_capability, vi, library, encoding, attribute_cache, error_descriptions, warning_filter, pending_descriptions, freeze_it=False):
         self._repeated_capability = repeated_capability
         self._vi = vi
         self._library = library
         self._encoding = encoding
+        self._attribute_cache = attribute_cache
+        self._error_descriptions = error_descriptions
+        self._warning_filter = warning_filter
+        self._pending_descriptions = pending_descriptions
+        # Encoded once and passed to every driver call that takes the repeated capability. The driver does not modify it.
+        self._repeated_capability_ctype = None if encoding is None else ctypes.create_string_buffer(repeated_capability.encode(encoding))
+        # Created on first use, see _get_channel_name_ctypes
+        self._channel_name_ctypes = None
+        # Results of methods that only depend on the repeated capability, see the memoized_method template
+        self._memoized_results = {}
 
         # Store the parameter list for later printing in __repr__
         self._param_list = "repeated_capability=" + pp.pformat(repeated_capability)
@@ -1640,8 +1904,16 @@ class _SessionBase(object):
     def __repr__(self):
         return '{0}.{1}({2})'.format('niscope', self.__class__.__name__, self._param_list)
 
+    def _with_repeated_capability(self, repeated_capability):
+        '''Returns a _SessionBase for repeated_capability that shares the handle, library and per-session state of this session'''
+        return _SessionBase(vi=self._vi, repeated_capability=repeated_capability, library=self._library, encoding=self._encoding, attribute_cache=self._attribute_cache, error_descriptions=self._error_descriptions, warning_filter=self._warning_filter, pending_descriptions=self._pending_descriptions, freeze_it=True)
+
+    def _session_wide(self):
+        '''Returns a _SessionBase without a repeated capability, for properties and methods that are not channel based'''
+        return self._with_repeated_capability('')
+
     def __setattr__(self, key, value):
-        if self._is_frozen and key not in dir(self):
+        if self._is_frozen and key not in self._settable_names and key not in dir(self):
             raise AttributeError("'{0}' object has no attribute '{1}'".format(type(self).__name__, key))
         object.__setattr__(self, key, value)
 
@@ -1649,10 +1921,21 @@ class _SessionBase(object):
         '''_get_error_description
 
         Returns the error description.
+
+        Descriptions of warnings are kept per session, so a warning returned over and over by the driver
+        (i.e. a coercion warning on every fetch) only costs calls into the driver the first time.
         '''
+        if errors._is_warning(error_code):
+            return self._error_descriptions.get(error_code, lambda: self._read_error_description(error_code))
+        return self._read_error_description(error_code)
+
+    def _read_error_description(self, error_code):
+        # The description is retrieved after the call that failed, so the last error of the session may
+        # be a different one. Only use it when the codes match.
         try:
-            _, error_string = self._get_error()
-            return error_string
+            last_error_code, error_string = self._get_error()
+            if last_error_code == error_code:
+                return error_string
         except errors.Error:
             pass
 
@@ -1667,6 +1950,223 @@ class _SessionBase(object):
         except errors.Error:
             return "Failed to retrieve error description."
 
+    def _find_attributes(self, names):
+        '''Returns (name, descriptor) pairs for the given property names
+
+        Raises a single AttributeError that lists every name that is not a property.
+        '''
+        found = []
+        unknown = []
+        for name in names:
+            attribute = _SessionBase.__dict__.get(name)
+            if isinstance(attribute, (attributes.Attribute, attributes.AttributeEnum)):
+                found.append((name, attribute))
+            else:
+                unknown.append(name)
+        if unknown:
+            raise AttributeError("'{0}' object has no attribute {1}".format(type(self).__name__, ', '.join(repr(n) for n in unknown)))
+        return found
+
+    def _get_channel_name_ctypes(self):
+        '''Returns (channel name, encoded channel name) pairs for the comma-separated items of the repeated capability'''
+        if self._channel_name_ctypes is None:
+            channel_names = [c.strip() for c in self._repeated_capability.split(',')]
+            self._channel_name_ctypes = [(c, ctypes.create_string_buffer(c.encode(self._encoding))) for c in channel_names]
+        return self._channel_name_ctypes
+
+    def _get_set_attribute_call(self, attribute, value):
+        '''Converts value for attribute and returns the SetAttribute function to call and the value ctype'''
+        value = attribute._to_driver(value)
+        if attribute._vi_type == 'ViString':
+            return self._library.niScope_SetAttributeViString, ctypes.create_string_buffer(value.encode(self._encoding))
+        set_attribute_name, value_type = {
+            'ViBoolean': ('niScope_SetAttributeViBoolean', visatype.ViBoolean),
+            'ViInt32': ('niScope_SetAttributeViInt32', visatype.ViInt32),
+            'ViReal64': ('niScope_SetAttributeViReal64', visatype.ViReal64),
+        }[attribute._vi_type]
+        return getattr(self._library, set_attribute_name), value_type(value)
+
+    def _get_attribute_getter(self, vi_type, channel_name_ctype):
+        '''Returns getter(attribute_id) that reads an attribute of API type vi_type for channel_name_ctype from the driver'''
+        vi_ctype = visatype.ViSession(self._vi)
+        if vi_type == 'ViString':
+            def getter(attribute_id):
+                attribute_id_ctype = visatype.ViAttr(attribute_id)
+                error_code = self._library.niScope_GetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, visatype.ViInt32(), None)
+                errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=False)
+                buffer_size_ctype = visatype.ViInt32(error_code)
+                attribute_value_ctype = (visatype.ViChar * buffer_size_ctype.value)()
+                error_code = self._library.niScope_GetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, buffer_size_ctype, attribute_value_ctype)
+                errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+                return attribute_value_ctype.value.decode(self._encoding)
+            return getter
+
+        get_attribute_name, value_type, python_type = {
+            'ViBoolean': ('niScope_GetAttributeViBoolean', visatype.ViBoolean, bool),
+            'ViInt32': ('niScope_GetAttributeViInt32', visatype.ViInt32, int),
+            'ViReal64': ('niScope_GetAttributeViReal64', visatype.ViReal64, float),
+        }[vi_type]
+        get_attribute = getattr(self._library, get_attribute_name)
+        # One value buffer for all the calls made with this getter
+        value_ctype = value_type()
+
+        def getter(attribute_id):
+            error_code = get_attribute(vi_ctype, channel_name_ctype, visatype.ViAttr(attribute_id), ctypes.pointer(value_ctype))
+            errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+            return python_type(value_ctype.value)
+        return getter
+
+    def _set_attributes(self, channel_name_ctype, calls):
+        '''Makes the (SetAttribute function, attribute ID, value ctype) calls, stopping at the first error'''
+        vi_ctype = visatype.ViSession(self._vi)
+        try:
+            for set_attribute, attribute_id, value_ctype in calls:
+                error_code = set_attribute(vi_ctype, channel_name_ctype, visatype.ViAttr(attribute_id), value_ctype)
+                errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        finally:
+            self._attribute_cache.clear()
+
+    def configure(self, ordered_properties=(), **properties):
+        '''configure
+
+        Sets several properties with one call, i.e.
+
+            session.configure(vertical_range=2.0, vertical_offset=0.0)
+
+        Like properties, it can be called on a repeated capability to set the properties for those channels only.
+
+        Every name and value is checked and converted before anything is sent to the driver, so an
+        unknown name or a value of the wrong type leaves the device untouched. The properties are then
+        set without the per-property overhead of setting them one at a time. If the driver returns an
+        error, the properties after the failing one are not set.
+
+        The valid values of some properties depend on others, so the order can matter. Properties in
+        ordered_properties are set in the order given, before the keyword arguments, i.e.
+
+            session.configure([('vertical_range', 2.0), ('vertical_offset', 0.0)])
+
+        The order of keyword arguments is only kept by Python 3.6 and later.
+
+        Args:
+            ordered_properties (list of (str, value) tuples or collections.OrderedDict): Property names and the values to set them to, in the order to set them.
+
+            properties: Property names and the values to set them to.
+        '''
+        if hasattr(ordered_properties, 'items'):
+            ordered_properties = ordered_properties.items()
+        name_values = list(ordered_properties) + list(properties.items())
+        calls = []
+        invalid = []
+        found = self._find_attributes([name for name, _ in name_values])
+        for (name, attribute), (_, value) in zip(found, name_values):
+            try:
+                set_attribute, value_ctype = self._get_set_attribute_call(attribute, value)
+            except (AttributeError, TypeError, ValueError) as e:
+                invalid.append('{0}: {1}'.format(name, e))
+                continue
+            calls.append((set_attribute, attribute._attribute_id, value_ctype))
+        if invalid:
+            raise TypeError('Invalid property values: ' + '; '.join(invalid))
+        self._set_attributes(self._repeated_capability_ctype, calls)
+
+    def read_attributes(self, names):
+        '''read_attributes
+
+        Reads several properties with one call and returns a dict that maps each name to its value, i.e.
+
+            values = session.read_attributes(['vertical_range', 'vertical_offset'])
+
+        Every name is checked before anything is read from the driver. Values are returned from the
+        attribute cache when it is enabled, see attribute_cache_enabled.
+
+        Args:
+            names (list of str): Names of the properties to read.
+
+        Returns:
+            values (dict): Property values, keyed by name, in the order of names.
+        '''
+        values = collections.OrderedDict()
+        for name, attribute in self._find_attributes(names):
+            getter = self._get_attribute_getter(attribute._vi_type, self._repeated_capability_ctype)
+            if attribute._cacheable:
+                value = self._attribute_cache.get(self._repeated_capability, attribute._attribute_id, getter)
+            else:
+                value = getter(attribute._attribute_id)
+            values[name] = attribute._from_driver(value)
+        return values
+
+    def get(self, name):
+        '''get
+
+        Reads a property for each channel of the repeated capability and returns a numpy.ndarray with one value per channel, i.e.
+
+            values = session.channels[0:64].get('vertical_range')
+
+        The channels are the comma-separated items of the repeated capability, in order. A range such as '0-63'
+        is a single item. Boolean, integer and floating-point properties are returned in an array of the matching
+        dtype, other properties (i.e. enums, strings and timedeltas) in an array of objects.
+
+        Values are returned from the attribute cache when it is enabled, see attribute_cache_enabled.
+
+        Requires numpy.
+
+        Args:
+            name (str): Name of the property to read.
+
+        Returns:
+            values (numpy.ndarray): Property value for each channel.
+        '''
+        import numpy
+        [(_, attribute)] = self._find_attributes([name])
+        channel_name_ctypes = self._get_channel_name_ctypes()
+        values = numpy.empty(len(channel_name_ctypes), dtype=attribute._numpy_type or object)
+        for i, (channel_name, channel_name_ctype) in enumerate(channel_name_ctypes):
+            getter = self._get_attribute_getter(attribute._vi_type, channel_name_ctype)
+            if attribute._cacheable:
+                value = self._attribute_cache.get(channel_name, attribute._attribute_id, getter)
+            else:
+                value = getter(attribute._attribute_id)
+            values[i] = attribute._from_driver(value)
+        return values
+
+    def set(self, name, values):
+        '''set
+
+        Sets a property to a different value for each channel of the repeated capability, i.e.
+
+            session.channels[0:64].set('vertical_range', values)
+
+        The channels are the comma-separated items of the repeated capability, in order. A range such as '0-63'
+        is a single item. values can be a numpy.ndarray, an array.array or any other sequence with one value per channel.
+
+        Every value is checked and converted before anything is sent to the driver. If the driver returns an
+        error, the channels after the failing one are not set.
+
+        Args:
+            name (str): Name of the property to set.
+
+            values: Property value for each channel.
+        '''
+        [(_, attribute)] = self._find_attributes([name])
+        channel_name_ctypes = self._get_channel_name_ctypes()
+        # numpy.ndarray and array.array convert their items to Python values, which ctypes accepts
+        values = values.tolist() if hasattr(values, 'tolist') else list(values)
+        if len(values) != len(channel_name_ctypes):
+            raise ValueError('{0} values given for {1} channels'.format(len(values), len(channel_name_ctypes)))
+
+        calls = []
+        invalid = []
+        for (channel_name, channel_name_ctype), value in zip(channel_name_ctypes, values):
+            try:
+                calls.append((channel_name_ctype, self._get_set_attribute_call(attribute, value)))
+            except (AttributeError, TypeError, ValueError) as e:
+                invalid.append('{0}: {1}'.format(channel_name, e))
+        if invalid:
+            raise TypeError('Invalid values for {0}: {1}'.format(name, '; '.join(invalid)))
+
+        for channel_name_ctype, (set_attribute, value_ctype) in calls:
+            self._set_attributes(channel_name_ctype, [(set_attribute, attribute._attribute_id, value_ctype)])
+
     ''' These are code-generated '''
 
     def _actual_num_wfms(self):
@@ -1690,12 +2190,20 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_list_ctype = self._repeated_capability_ctype  # case C010
         num_wfms_ctype = visatype.ViInt32()  # case S200
         error_code = self._library.niScope_ActualNumWfms(vi_ctype, channel_list_ctype, None if num_wfms_ctype is None else (ctypes.pointer(num_wfms_ctype)))
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(num_wfms_ctype.value)
 
+    def _actual_num_wfms_cached(self):
+        '''_actual_num_wfms_cached
+
+        Returns the result of _actual_num_wfms(). When the attribute cache is enabled, the result is kept
+        until a method or property that can change it clears the cache, see attribute_cache_enabled.
+        '''
+        return self._attribute_cache.get(self._repeated_capability, '_actual_num_wfms', lambda _: self._actual_num_wfms())
+
     def cal_self_calibrate(self, option=enums.Option.SELF_CALIBRATE_ALL_CHANNELS):
         '''cal_self_calibrate
 
@@ -1719,6 +2227,9 @@ class _SessionBase(object):
         Note:
         One or more of the referenced values are not in the Python API for this driver. Enums that only define values, or represent True/False, have been removed.
 
+        Note:
+        This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.
+
         Tip:
         This method requires repeated capabilities (usually channels). If called directly on the
         niscope.Session object, then the method will use all repeated capabilities in the session.
@@ -1739,9 +2250,10 @@ class _SessionBase(object):
         if type(option) is not enums.Option:
             raise TypeError('Parameter mode must be of type ' + str(enums.Option))
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_list_ctype = self._repeated_capability_ctype  # case C010
         option_ctype = visatype.ViInt32(option.value)  # case S130
         error_code = self._library.niScope_CalSelfCalibrate(vi_ctype, channel_list_ctype, option_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -1781,7 +2293,7 @@ class _SessionBase(object):
         if type(clearable_measurement_function) is not enums.ClearableMeasurement:
             raise TypeError('Parameter mode must be of type ' + str(enums.ClearableMeasurement))
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_list_ctype = self._repeated_capability_ctype  # case C010
         clearable_measurement_function_ctype = visatype.ViInt32(clearable_measurement_function.value)  # case S130
         error_code = self._library.niScope_ClearWaveformMeasurementStats(vi_ctype, channel_list_ctype, clearable_measurement_function_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
@@ -1812,10 +2324,11 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_list_ctype = self._repeated_capability_ctype  # case C010
         input_impedance_ctype = visatype.ViReal64(input_impedance)  # case S150
         max_input_frequency_ctype = visatype.ViReal64(max_input_frequency)  # case S150
         error_code = self._library.niScope_ConfigureChanCharacteristics(vi_ctype, channel_list_ctype, input_impedance_ctype, max_input_frequency_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -1847,13 +2360,30 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_list_ctype = self._repeated_capability_ctype  # case C010
         number_of_coefficients_ctype = visatype.ViInt32(0 if coefficients is None else len(coefficients))  # case S160
         coefficients_ctype = get_ctypes_pointer_for_buffer(value=coefficients, library_type=visatype.ViReal64)  # case B550
         error_code = self._library.niScope_ConfigureEqualizationFilterCoefficients(vi_ctype, channel_list_ctype, number_of_coefficients_ctype, coefficients_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
+    def _configure_fetch_records(self, record_number, num_records):
+        '''_configure_fetch_records
+
+        Sets the fetch properties so that the next fetch returns num_records whole records starting at
+        record_number, and returns the number of waveforms that fetch returns.
+
+        The fetch properties are not restored; callers save them first with _save_fetch_properties().
+        '''
+        # The fetch properties are not channel based, so they are accessed without the repeated capability
+        session = self._session_wide()
+        session.fetch_relative_to = enums.FetchRelativeTo.PRETRIGGER
+        session.fetch_offset = 0
+        session.fetch_record_number = record_number
+        session.fetch_num_records = num_records
+        return self._actual_num_wfms()
+
     def configure_vertical(self, range, coupling, offset=0.0, probe_attenuation=1.0, enabled=True):
         '''configure_vertical
 
@@ -1889,13 +2419,14 @@ class _SessionBase(object):
         if type(coupling) is not enums.VerticalCoupling:
             raise TypeError('Parameter mode must be of type ' + str(enums.VerticalCoupling))
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_list_ctype = self._repeated_capability_ctype  # case C010
         range_ctype = visatype.ViReal64(range)  # case S150
         offset_ctype = visatype.ViReal64(offset)  # case S150
         coupling_ctype = visatype.ViInt32(coupling.value)  # case S130
         probe_attenuation_ctype = visatype.ViReal64(probe_attenuation)  # case S150
         enabled_ctype = visatype.ViBoolean(enabled)  # case S150
         error_code = self._library.niScope_ConfigureVertical(vi_ctype, channel_list_ctype, range_ctype, offset_ctype, coupling_ctype, probe_attenuation_ctype, enabled_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -1987,20 +2518,21 @@ class _SessionBase(object):
                 Call _actual_num_wfms to determine the size of this array.
 
         '''
+        num_wfms = self._actual_num_wfms_cached()
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_list_ctype = self._repeated_capability_ctype  # case C010
         timeout_ctype = _converters.convert_timedelta_to_seconds(timeout, visatype.ViReal64)  # case S140
         num_samples_ctype = visatype.ViInt32(num_samples)  # case S150
-        wfm_size = (num_samples * self._actual_num_wfms())  # case B560
-        wfm_array = array.array("d", [0] * wfm_size)  # case B560
+        wfm_size = (num_samples * num_wfms)  # case B560
+        wfm_array = array.array("d", [0]) * wfm_size  # case B560
         wfm_ctype = get_ctypes_pointer_for_buffer(value=wfm_array, library_type=visatype.ViReal64)  # case B560
-        wfm_info_size = self._actual_num_wfms()  # case B560
+        wfm_info_size = num_wfms  # case B560
         wfm_info_ctype = get_ctypes_pointer_for_buffer(library_type=waveform_info.struct_niScope_wfmInfo, size=wfm_info_size)  # case B560
         error_code = self._library.niScope_Fetch(vi_ctype, channel_list_ctype, timeout_ctype, num_samples_ctype, wfm_ctype, wfm_info_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
-        return wfm_array, [waveform_info.WaveformInfo(wfm_info_ctype[i]) for i in range(self._actual_num_wfms())]
+        return wfm_array, [waveform_info.WaveformInfo(wfm_info_ctype[i]) for i in range(wfm_info_size)]
 
-    def _fetch_into(self, num_samples, wfm, timeout=datetime.timedelta(seconds=5.0)):
+    def _fetch_into(self, num_samples, wfm, timeout=datetime.timedelta(seconds=5.0), num_wfms=None):
         '''_fetch
 
         Returns the waveform from a previously initiated acquisition that the
@@ -2117,18 +2649,210 @@ class _SessionBase(object):
             raise TypeError('wfm must be in C-order')
         if wfm.dtype is not numpy.dtype('float64'):
             raise TypeError('wfm must be numpy.ndarray of dtype=float64, is ' + str(wfm.dtype))
+        if num_wfms is None:
+            num_wfms = self._actual_num_wfms_cached()
+        if wfm.size < (num_samples * num_wfms):
+            raise ValueError('wfm must have at least {0} elements, has {1}'.format((num_samples * num_wfms), wfm.size))
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_list_ctype = self._repeated_capability_ctype  # case C010
         timeout_ctype = _converters.convert_timedelta_to_seconds(timeout, visatype.ViReal64)  # case S140
         num_samples_ctype = visatype.ViInt32(num_samples)  # case S150
         wfm_ctype = get_ctypes_pointer_for_buffer(value=wfm)  # case B510
-        wfm_info_size = self._actual_num_wfms()  # case B560
+        wfm_info_size = num_wfms  # case B560
         wfm_info_ctype = get_ctypes_pointer_for_buffer(library_type=waveform_info.struct_niScope_wfmInfo, size=wfm_info_size)  # case B560
         error_code = self._library.niScope_Fetch(vi_ctype, channel_list_ctype, timeout_ctype, num_samples_ctype, wfm_ctype, wfm_info_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
-        return [waveform_info.WaveformInfo(wfm_info_ctype[i]) for i in range(self._actual_num_wfms())]
+        return [waveform_info.WaveformInfo(wfm_info_ctype[i]) for i in range(wfm_info_size)]
+
+    def _fetch_array_measurement_into(self, array_meas_function, meas_wfm_size, meas_wfm, timeout=datetime.timedelta(seconds=5.0), num_wfms=None):
+        '''_fetch_array_measurement
+
+        Obtains a waveform from the digitizer and returns the specified
+        measurement array. This method may return multiple waveforms depending
+        on the number of channels, the acquisition type, and the number of
+        records you specify.
+
+        Note:
+        Some functionality, such as time stamping, is not supported in all
+        digitizers. Refer to `Features Supported by
+        Device <REPLACE_DRIVER_SPECIFIC_URL_1(features_supported_main)>`__ for
+        more information.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        niscope.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        niscope.Session instance, and calling this method on the result.:
+
+            session.channels['0,1']._fetch_array_measurement(array_meas_function, meas_wfm_size, timeout='datetime.timedelta(seconds=5.0)')
+
+        Args:
+            array_meas_function (enums.ArrayMeasurement): The `array
+                measurement <REPLACE_DRIVER_SPECIFIC_URL_2(array_measurements_refs)>`__
+                to perform.
+
+            meas_wfm_size (int): The maximum number of samples returned in the measurement waveform array
+                for each waveform measurement. Use actual_meas_wfm_size to
+                determine the number of available samples.
+
+                Note:
+                Use the property fetch_meas_num_samples to set the
+                number of samples to fetch when performing a measurement. For more
+                information about when to use this property, refer to the `NI
+                KnowledgeBase <javascript:WWW(WWW_KB_MEAS)>`__.
+
+            meas_wfm (numpy.array(dtype=numpy.float64)): Returns an array whose length is the number of waveforms times
+                **measWfmSize**; call _actual_num_wfms to determine the number of
+                waveforms; call actual_meas_wfm_size to determine the size of each
+                waveform.
+
+                NI-SCOPE returns this data sequentially, so all record 0 waveforms are
+                first. For example, with channel list of 0, 1, you would have the
+                following index values:
+
+                index 0 = record 0, channel 0
+
+                index *x* = record 0, channel 1
+
+                index 2\ *x* = record 1, channel 0
+
+                index 3\ *x* = record 1, channel 1
+
+                Where *x* = the record length
+
+            timeout (datetime.timedelta): The time to wait in seconds for data to be acquired; using 0 for this
+                parameter tells NI-SCOPE to fetch whatever is currently available. Using
+                -1 for this parameter implies infinite timeout.
+
 
-    def _fetch_binary16_into(self, num_samples, wfm, timeout=datetime.timedelta(seconds=5.0)):
+        Returns:
+            meas_wfm (numpy.array(dtype=numpy.float64)): Returns an array whose length is the number of waveforms times
+                **measWfmSize**; call _actual_num_wfms to determine the number of
+                waveforms; call actual_meas_wfm_size to determine the size of each
+                waveform.
+
+                NI-SCOPE returns this data sequentially, so all record 0 waveforms are
+                first. For example, with channel list of 0, 1, you would have the
+                following index values:
+
+                index 0 = record 0, channel 0
+
+                index *x* = record 0, channel 1
+
+                index 2\ *x* = record 1, channel 0
+
+                index 3\ *x* = record 1, channel 1
+
+                Where *x* = the record length
+
+            wfm_info (numpy.array(dtype=numpy.WaveformInfo)): Returns an array of structures with the following timing and scaling
+                information about each waveform:
+
+                -  **relativeInitialX**—the time (in seconds) from the trigger to the
+                   first sample in the fetched waveform
+                -  **absoluteInitialX**—timestamp (in seconds) of the first fetched
+                   sample. This timestamp is comparable between records and
+                   acquisitions; devices that do not support this parameter use 0 for
+                   this output.
+                -  **xIncrement**—the time between points in the acquired waveform in
+                   seconds
+                -  **actualSamples**—the actual number of samples fetched and placed in
+                   the waveform array
+                -  **gain**—the gain factor of the given channel; useful for scaling
+                   binary data with the following formula:
+
+                voltage = binary data × gain factor + offset
+
+                -  **offset**—the offset factor of the given channel; useful for scaling
+                   binary data with the following formula:
+
+                voltage = binary data × gain factor + offset
+
+                Call _actual_num_wfms to determine the size of this array.
+
+        '''
+        import numpy
+
+        if type(array_meas_function) is not enums.ArrayMeasurement:
+            raise TypeError('Parameter mode must be of type ' + str(enums.ArrayMeasurement))
+        if type(meas_wfm) is not numpy.ndarray:
+            raise TypeError('meas_wfm must be {0}, is {1}'.format(numpy.ndarray, type(meas_wfm)))
+        if numpy.isfortran(meas_wfm) is True:
+            raise TypeError('meas_wfm must be in C-order')
+        if meas_wfm.dtype is not numpy.dtype('float64'):
+            raise TypeError('meas_wfm must be numpy.ndarray of dtype=float64, is ' + str(meas_wfm.dtype))
+        if num_wfms is None:
+            num_wfms = self._actual_num_wfms_cached()
+        if meas_wfm.size < (meas_wfm_size * num_wfms):
+            raise ValueError('meas_wfm must have at least {0} elements, has {1}'.format((meas_wfm_size * num_wfms), meas_wfm.size))
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        channel_list_ctype = self._repeated_capability_ctype  # case C010
+        timeout_ctype = _converters.convert_timedelta_to_seconds(timeout, visatype.ViReal64)  # case S140
+        array_meas_function_ctype = visatype.ViInt32(array_meas_function.value)  # case S130
+        meas_wfm_size_ctype = visatype.ViInt32(meas_wfm_size)  # case S150
+        meas_wfm_ctype = get_ctypes_pointer_for_buffer(value=meas_wfm)  # case B510
+        wfm_info_size = num_wfms  # case B560
+        wfm_info_ctype = get_ctypes_pointer_for_buffer(library_type=waveform_info.struct_niScope_wfmInfo, size=wfm_info_size)  # case B560
+        error_code = self._library.niScope_FetchArrayMeasurement(vi_ctype, channel_list_ctype, timeout_ctype, array_meas_function_ctype, meas_wfm_size_ctype, meas_wfm_ctype, wfm_info_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return [waveform_info.WaveformInfo(wfm_info_ctype[i]) for i in range(wfm_info_size)]
+
+    def fetch_array_measurement_into(self, array_meas_function, meas_wfm, timeout=datetime.timedelta(seconds=5.0)):
+        '''fetch_array_measurement
+
+        Obtains a waveform from the digitizer and fetches the specified measurement array into a preallocated
+                        numpy array. The measurement is computed by NI-SCOPE rather than in Python. This method may return
+                        multiple waveforms depending on the number of channels, the acquisition type, and the number of records
+                        you specify.
+
+        Note:
+        This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        niscope.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        niscope.Session instance, and calling this method on the result.:
+
+            session.channels['0,1'].fetch_array_measurement(array_meas_function, meas_wfm_size, meas_wfm, timeout='datetime.timedelta(seconds=5.0)')
+
+        Args:
+            array_meas_function (enums.ArrayMeasurement): The array measurement to perform, such as an FFT amplitude spectrum, a histogram or the average of several acquisitions.
+
+            meas_wfm_size (int): The number of samples of each measurement waveform, computed from the size of **meas_wfm**.
+
+            meas_wfm (list of float): C-contiguous numpy array of `numpy.float64` that receives the measurement waveforms, all samples of waveform 0 first.
+                                        Its size must be a multiple of the number of waveforms, normally **actual_meas_wfm_size()** times the number of waveforms; a 2-D array of shape
+                                        (number of waveforms, **actual_meas_wfm_size()**) can be used.
+
+                                        Example:
+
+                                        .. code-block:: python
+
+                                            meas_wfm_size = session.actual_meas_wfm_size(niscope.ArrayMeasurement.FFT_AMP_SPECTRUM_DB)
+                                            meas_wfm = numpy.zeros((2, meas_wfm_size))
+                                            wfm_info = session.channels['0,1'].fetch_array_measurement_into(niscope.ArrayMeasurement.FFT_AMP_SPECTRUM_DB, meas_wfm)
+
+            timeout (datetime.timedelta): The time to wait for data to be acquired; using 0 for this parameter tells NI-SCOPE to fetch whatever is currently available.
+
+
+        Returns:
+            wfm_info (list of WaveformInfo): Returns an array of WaveformInfo with the timing and scaling information of each measurement waveform. For spectra, **relative_initial_x** and **x_increment** are the start frequency and frequency step in Hz.
+
+        '''
+        import numpy
+
+        if type(meas_wfm) is not numpy.ndarray:
+            raise TypeError('meas_wfm must be {0}, is {1}'.format(numpy.ndarray, type(meas_wfm)))
+        if not meas_wfm.flags['C_CONTIGUOUS']:
+            raise TypeError('meas_wfm must be C-contiguous')
+        num_wfms = self._actual_num_wfms_cached()
+        if meas_wfm.size % num_wfms != 0:
+            raise ValueError('meas_wfm size must be a multiple of the number of waveforms, {0}, is {1}'.format(num_wfms, meas_wfm.size))
+        meas_wfm_size = meas_wfm.size // num_wfms
+        return self._fetch_array_measurement_into(array_meas_function=array_meas_function, meas_wfm_size=meas_wfm_size, meas_wfm=meas_wfm.reshape(-1), timeout=timeout, num_wfms=num_wfms)
+
+    def _fetch_binary16_into(self, num_samples, wfm, timeout=datetime.timedelta(seconds=5.0), num_wfms=None):
         '''_fetch_binary16
 
         Retrieves data from a previously initiated acquisition and returns
@@ -2243,18 +2967,22 @@ class _SessionBase(object):
             raise TypeError('wfm must be in C-order')
         if wfm.dtype is not numpy.dtype('int16'):
             raise TypeError('wfm must be numpy.ndarray of dtype=int16, is ' + str(wfm.dtype))
+        if num_wfms is None:
+            num_wfms = self._actual_num_wfms_cached()
+        if wfm.size < (num_samples * num_wfms):
+            raise ValueError('wfm must have at least {0} elements, has {1}'.format((num_samples * num_wfms), wfm.size))
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_list_ctype = self._repeated_capability_ctype  # case C010
         timeout_ctype = _converters.convert_timedelta_to_seconds(timeout, visatype.ViReal64)  # case S140
         num_samples_ctype = visatype.ViInt32(num_samples)  # case S150
         wfm_ctype = get_ctypes_pointer_for_buffer(value=wfm)  # case B510
-        wfm_info_size = self._actual_num_wfms()  # case B560
+        wfm_info_size = num_wfms  # case B560
         wfm_info_ctype = get_ctypes_pointer_for_buffer(library_type=waveform_info.struct_niScope_wfmInfo, size=wfm_info_size)  # case B560
         error_code = self._library.niScope_FetchBinary16(vi_ctype, channel_list_ctype, timeout_ctype, num_samples_ctype, wfm_ctype, wfm_info_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
-        return [waveform_info.WaveformInfo(wfm_info_ctype[i]) for i in range(self._actual_num_wfms())]
+        return [waveform_info.WaveformInfo(wfm_info_ctype[i]) for i in range(wfm_info_size)]
 
-    def _fetch_binary32_into(self, num_samples, wfm, timeout=datetime.timedelta(seconds=5.0)):
+    def _fetch_binary32_into(self, num_samples, wfm, timeout=datetime.timedelta(seconds=5.0), num_wfms=None):
         '''_fetch_binary32
 
         Retrieves data from a previously initiated acquisition and returns
@@ -2369,18 +3097,22 @@ class _SessionBase(object):
             raise TypeError('wfm must be in C-order')
         if wfm.dtype is not numpy.dtype('int32'):
             raise TypeError('wfm must be numpy.ndarray of dtype=int32, is ' + str(wfm.dtype))
+        if num_wfms is None:
+            num_wfms = self._actual_num_wfms_cached()
+        if wfm.size < (num_samples * num_wfms):
+            raise ValueError('wfm must have at least {0} elements, has {1}'.format((num_samples * num_wfms), wfm.size))
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_list_ctype = self._repeated_capability_ctype  # case C010
         timeout_ctype = _converters.convert_timedelta_to_seconds(timeout, visatype.ViReal64)  # case S140
         num_samples_ctype = visatype.ViInt32(num_samples)  # case S150
         wfm_ctype = get_ctypes_pointer_for_buffer(value=wfm)  # case B510
-        wfm_info_size = self._actual_num_wfms()  # case B560
+        wfm_info_size = num_wfms  # case B560
         wfm_info_ctype = get_ctypes_pointer_for_buffer(library_type=waveform_info.struct_niScope_wfmInfo, size=wfm_info_size)  # case B560
         error_code = self._library.niScope_FetchBinary32(vi_ctype, channel_list_ctype, timeout_ctype, num_samples_ctype, wfm_ctype, wfm_info_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
-        return [waveform_info.WaveformInfo(wfm_info_ctype[i]) for i in range(self._actual_num_wfms())]
+        return [waveform_info.WaveformInfo(wfm_info_ctype[i]) for i in range(wfm_info_size)]
 
-    def _fetch_binary8_into(self, num_samples, wfm, timeout=datetime.timedelta(seconds=5.0)):
+    def _fetch_binary8_into(self, num_samples, wfm, timeout=datetime.timedelta(seconds=5.0), num_wfms=None):
         '''_fetch_binary8
 
         Retrieves data from a previously initiated acquisition and returns
@@ -2495,16 +3227,120 @@ class _SessionBase(object):
             raise TypeError('wfm must be in C-order')
         if wfm.dtype is not numpy.dtype('int8'):
             raise TypeError('wfm must be numpy.ndarray of dtype=int8, is ' + str(wfm.dtype))
+        if num_wfms is None:
+            num_wfms = self._actual_num_wfms_cached()
+        if wfm.size < (num_samples * num_wfms):
+            raise ValueError('wfm must have at least {0} elements, has {1}'.format((num_samples * num_wfms), wfm.size))
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_list_ctype = self._repeated_capability_ctype  # case C010
         timeout_ctype = _converters.convert_timedelta_to_seconds(timeout, visatype.ViReal64)  # case S140
         num_samples_ctype = visatype.ViInt32(num_samples)  # case S150
         wfm_ctype = get_ctypes_pointer_for_buffer(value=wfm)  # case B510
-        wfm_info_size = self._actual_num_wfms()  # case B560
+        wfm_info_size = num_wfms  # case B560
         wfm_info_ctype = get_ctypes_pointer_for_buffer(library_type=waveform_info.struct_niScope_wfmInfo, size=wfm_info_size)  # case B560
         error_code = self._library.niScope_FetchBinary8(vi_ctype, channel_list_ctype, timeout_ctype, num_samples_ctype, wfm_ctype, wfm_info_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
-        return [waveform_info.WaveformInfo(wfm_info_ctype[i]) for i in range(self._actual_num_wfms())]
+        return [waveform_info.WaveformInfo(wfm_info_ctype[i]) for i in range(wfm_info_size)]
+
+    def fetch_buffer_pool(self, num_samples, dtype=None, num_buffers=2):
+        '''fetch_buffer_pool
+
+        Returns a pool of buffers that are allocated once for repeated fetches of **num_samples**
+                        samples per waveform. The sample buffers and the waveform information structures are reused
+                        by every fetch, so a continuous acquisition does not allocate memory for each fetch.
+
+                        The number of waveforms is queried when the pool is created. Create a new pool after changing
+                        the channels or the number of records.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        niscope.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        niscope.Session instance, and calling this method on the result.:
+
+            session.channels['0,1'].fetch_buffer_pool(num_samples, dtype=None, num_buffers=2)
+
+        Args:
+            num_samples (int): The number of samples to fetch for each waveform on every call to **fetch()** of the pool.
+
+            dtype (numpy.dtype): Type of the samples. None means `numpy.float64` (scaled voltages).
+
+                                        Types supported are
+
+                                        - `numpy.float64`
+                                        - `numpy.int8`
+                                        - `numpy.int16`
+                                        - `numpy.int32`
+
+            num_buffers (int): The number of buffers in the ring. Data returned by **fetch()** stays valid until **num_buffers** more fetches have been made.
+
+
+        Returns:
+            buffer_pool (niscope.fetch_buffer_pool.FetchBufferPool): Object whose **fetch(timeout=datetime.timedelta(seconds=5.0))** method fetches into the next buffer of the ring and
+                                        returns the waveform array and a numpy structured array with the waveform information for that buffer, i.e. `wfm_info['gain']`.
+                                        Both are overwritten in place by later fetches.
+
+                                        Example:
+
+                                        .. code-block:: python
+
+                                            pool = session.channels['0,1'].fetch_buffer_pool(num_samples, dtype=numpy.int16)
+                                            with session.initiate():
+                                                for i in range(num_fetches):
+                                                    wfm, wfm_info = pool.fetch()
+
+        '''
+        from niscope import fetch_buffer_pool
+
+        return fetch_buffer_pool.FetchBufferPool(self, num_samples, dtype, num_buffers)
+
+    def _fetch_chunks(self, samples_per_chunk, continuous=False):
+        '''_fetch_chunks
+
+        Sets the fetch properties to fetch one record at a time relative to the read pointer, and returns
+        a generator of (record_number, offset, num_samples, backlog) tuples for all the records of the
+        acquisition, or, when continuous is True, for one record after the other until the caller stops.
+        Before yielding, it reads backlog and limits num_samples to what has been acquired; the caller
+        fetches num_samples samples before asking for the next chunk. When nothing has been acquired yet,
+        num_samples is a full chunk and the fetch waits for it.
+
+        The samples acquired but not fetched, the backlog of the record plus the records done after it,
+        are compared to the samples of each waveform that fit in the onboard memory. When they no longer
+        fit, samples have been overwritten and the generator raises StreamOverflowError.
+
+        The fetch properties are not restored; callers save them first with _save_fetch_properties().
+        '''
+        from niscope import fetch_buffer_pool
+
+        # The fetch and horizontal properties are not channel based, so they are accessed without the repeated capability
+        session = self._session_wide()
+        session.fetch_relative_to = enums.FetchRelativeTo.READ_POINTER
+        session.fetch_offset = 0
+        session.fetch_num_records = 1
+        record_length = session.horz_record_length
+        num_records = session.horz_num_records
+        # The onboard memory is shared by the acquired channels, which are assumed to be the fetched ones
+        memory_size = session.onboard_memory_size // (session.binary_sample_width // 8 * self._actual_num_wfms())
+
+        def chunks():
+            record_number = 0
+            while continuous or record_number < num_records:
+                session.fetch_record_number = record_number
+                offset = 0
+                while offset < record_length:
+                    num_samples = min(samples_per_chunk, record_length - offset)
+                    backlog = int(session.backlog)
+                    samples_pending = backlog
+                    if continuous or record_number + 1 < num_records:
+                        samples_pending += max(session.records_done - record_number - 1, 0) * record_length
+                    if samples_pending > memory_size:
+                        raise fetch_buffer_pool.StreamOverflowError(record_number, offset, samples_pending, memory_size)
+                    if backlog > 0:
+                        num_samples = min(num_samples, backlog)
+                    yield record_number, offset, num_samples, max(backlog - num_samples, 0)
+                    offset += num_samples
+                record_number += 1
+        return chunks()
 
     def fetch_into(self, wfm, timeout=datetime.timedelta(seconds=5.0)):
         '''fetch
@@ -2518,6 +3354,9 @@ class _SessionBase(object):
 
         Note: Some functionality, such as time stamping, is not supported in all digitizers.
 
+        Note:
+        This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.
+
         Tip:
         This method requires repeated capabilities (usually channels). If called directly on the
         niscope.Session object, then the method will use all repeated capabilities in the session.
@@ -2571,16 +3410,17 @@ class _SessionBase(object):
         '''
         import numpy
 
-        num_samples = int(len(wfm) / self._actual_num_wfms())
+        num_wfms = self._actual_num_wfms_cached()
+        num_samples = int(len(wfm) / num_wfms)
 
         if wfm.dtype == numpy.float64:
-            return self._fetch_into(num_samples=num_samples, wfm=wfm, timeout=timeout)
+            return self._fetch_into(num_samples=num_samples, wfm=wfm, timeout=timeout, num_wfms=num_wfms)
         elif wfm.dtype == numpy.int8:
-            return self._fetch_binary8_into(num_samples=num_samples, wfm=wfm, timeout=timeout)
+            return self._fetch_binary8_into(num_samples=num_samples, wfm=wfm, timeout=timeout, num_wfms=num_wfms)
         elif wfm.dtype == numpy.int16:
-            return self._fetch_binary16_into(num_samples=num_samples, wfm=wfm, timeout=timeout)
+            return self._fetch_binary16_into(num_samples=num_samples, wfm=wfm, timeout=timeout, num_wfms=num_wfms)
         elif wfm.dtype == numpy.int32:
-            return self._fetch_binary32_into(num_samples=num_samples, wfm=wfm, timeout=timeout)
+            return self._fetch_binary32_into(num_samples=num_samples, wfm=wfm, timeout=timeout, num_wfms=num_wfms)
         else:
             raise TypeError("Unsupported dtype. Is {0}, expected {1}, {2}, {3}, or {5}".format(wfm.dtype, numpy.float64, numpy.int8, numpy.int16, numpy.int32))
 
@@ -2596,6 +3436,9 @@ class _SessionBase(object):
 
         Note: Some functionality, such as time stamping, is not supported in all digitizers.
 
+        Note:
+        This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.
+
         Tip:
         This method requires repeated capabilities (usually channels). If called directly on the
         niscope.Session object, then the method will use all repeated capabilities in the session.
@@ -2635,6 +3478,28 @@ class _SessionBase(object):
         '''
         return self._fetch(num_samples, timeout)
 
+    def _fetch_into_buffers(self, num_samples, wfm, wfm_info, timeout):
+        '''_fetch_into_buffers
+
+        Fetches into the buffers of a FetchBufferPool, which checks them once when it allocates them.
+
+        wfm is a C-contiguous numpy.ndarray of dtype float64, int8, int16 or int32 holding num_samples
+        samples per waveform, and wfm_info a ctypes array of waveform_info.struct_niScope_wfmInfo with one
+        element per waveform. The driver writes both in place.
+        '''
+        fetch_function_name = {
+            'float64': 'niScope_Fetch',
+            'int8': 'niScope_FetchBinary8',
+            'int16': 'niScope_FetchBinary16',
+            'int32': 'niScope_FetchBinary32',
+        }[wfm.dtype.name]
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        timeout_ctype = _converters.convert_timedelta_to_seconds(timeout, visatype.ViReal64)  # case S140
+        num_samples_ctype = visatype.ViInt32(num_samples)  # case S150
+        wfm_ctype = get_ctypes_pointer_for_buffer(value=wfm)  # case B510
+        error_code = getattr(self._library, fetch_function_name)(vi_ctype, self._repeated_capability_ctype, timeout_ctype, num_samples_ctype, wfm_ctype, wfm_info)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+
     def fetch_measurement(self, scalar_meas_function, timeout=datetime.timedelta(seconds=5.0)):
         '''fetch_measurement
 
@@ -2650,6 +3515,9 @@ class _SessionBase(object):
         meas_chan_high_ref_level to set each channel
         differently.
 
+        Note:
+        This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.
+
         Tip:
         This method requires repeated capabilities (usually channels). If called directly on the
         niscope.Session object, then the method will use all repeated capabilities in the session.
@@ -2675,15 +3543,16 @@ class _SessionBase(object):
         '''
         if type(scalar_meas_function) is not enums.ScalarMeasurement:
             raise TypeError('Parameter mode must be of type ' + str(enums.ScalarMeasurement))
+        num_wfms = self._actual_num_wfms_cached()
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_list_ctype = self._repeated_capability_ctype  # case C010
         timeout_ctype = _converters.convert_timedelta_to_seconds(timeout, visatype.ViReal64)  # case S140
         scalar_meas_function_ctype = visatype.ViInt32(scalar_meas_function.value)  # case S130
-        result_size = self._actual_num_wfms()  # case B560
+        result_size = num_wfms  # case B560
         result_ctype = get_ctypes_pointer_for_buffer(library_type=visatype.ViReal64, size=result_size)  # case B560
         error_code = self._library.niScope_FetchMeasurement(vi_ctype, channel_list_ctype, timeout_ctype, scalar_meas_function_ctype, result_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
-        return [float(result_ctype[i]) for i in range(self._actual_num_wfms())]
+        return [float(result_ctype[i]) for i in range(result_size)]
 
     def fetch_measurement_stats(self, scalar_meas_function, timeout=datetime.timedelta(seconds=5.0)):
         '''fetch_measurement_stats
@@ -2713,6 +3582,9 @@ class _SessionBase(object):
         meas_chan_high_ref_level to set each channel
         differently.
 
+        Note:
+        This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.
+
         Tip:
         This method requires repeated capabilities (usually channels). If called directly on the
         niscope.Session object, then the method will use all repeated capabilities in the session.
@@ -2752,25 +3624,366 @@ class _SessionBase(object):
         '''
         if type(scalar_meas_function) is not enums.ScalarMeasurement:
             raise TypeError('Parameter mode must be of type ' + str(enums.ScalarMeasurement))
+        num_wfms = self._actual_num_wfms_cached()
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_list_ctype = self._repeated_capability_ctype  # case C010
         timeout_ctype = _converters.convert_timedelta_to_seconds(timeout, visatype.ViReal64)  # case S140
         scalar_meas_function_ctype = visatype.ViInt32(scalar_meas_function.value)  # case S130
-        result_size = self._actual_num_wfms()  # case B560
+        result_size = num_wfms  # case B560
         result_ctype = get_ctypes_pointer_for_buffer(library_type=visatype.ViReal64, size=result_size)  # case B560
-        mean_size = self._actual_num_wfms()  # case B560
+        mean_size = num_wfms  # case B560
         mean_ctype = get_ctypes_pointer_for_buffer(library_type=visatype.ViReal64, size=mean_size)  # case B560
-        stdev_size = self._actual_num_wfms()  # case B560
+        stdev_size = num_wfms  # case B560
         stdev_ctype = get_ctypes_pointer_for_buffer(library_type=visatype.ViReal64, size=stdev_size)  # case B560
-        min_size = self._actual_num_wfms()  # case B560
+        min_size = num_wfms  # case B560
         min_ctype = get_ctypes_pointer_for_buffer(library_type=visatype.ViReal64, size=min_size)  # case B560
-        max_size = self._actual_num_wfms()  # case B560
+        max_size = num_wfms  # case B560
         max_ctype = get_ctypes_pointer_for_buffer(library_type=visatype.ViReal64, size=max_size)  # case B560
-        num_in_stats_size = self._actual_num_wfms()  # case B560
+        num_in_stats_size = num_wfms  # case B560
         num_in_stats_ctype = get_ctypes_pointer_for_buffer(library_type=visatype.ViInt32, size=num_in_stats_size)  # case B560
         error_code = self._library.niScope_FetchMeasurementStats(vi_ctype, channel_list_ctype, timeout_ctype, scalar_meas_function_ctype, result_ctype, mean_ctype, stdev_ctype, min_ctype, max_ctype, num_in_stats_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
-        return [float(result_ctype[i]) for i in range(self._actual_num_wfms())], [float(mean_ctype[i]) for i in range(self._actual_num_wfms())], [float(stdev_ctype[i]) for i in range(self._actual_num_wfms())], [float(min_ctype[i]) for i in range(self._actual_num_wfms())], [float(max_ctype[i]) for i in range(self._actual_num_wfms())], [int(num_in_stats_ctype[i]) for i in range(self._actual_num_wfms())]
+        return [float(result_ctype[i]) for i in range(result_size)], [float(mean_ctype[i]) for i in range(mean_size)], [float(stdev_ctype[i]) for i in range(stdev_size)], [float(min_ctype[i]) for i in range(min_size)], [float(max_ctype[i]) for i in range(max_size)], [int(num_in_stats_ctype[i]) for i in range(num_in_stats_size)]
+
+    def fetch_measurements(self, scalar_meas_functions, timeout=datetime.timedelta(seconds=5.0)):
+        '''fetch_measurements
+
+        Fetches several scalar measurements and their statistics, such as rise time, frequency and voltage
+                        peak to peak. Returns one 2-D numpy array per statistic, indexed by [measurement, waveform]. The number
+                        of waveforms is queried once and all measurements are fetched into the same preallocated arrays.
+
+                        Example:
+
+                        .. code-block:: python
+
+                            measurements = [niscope.ScalarMeasurement.RISE_TIME, niscope.ScalarMeasurement.FREQUENCY]
+                            result, mean, stdev, min, max, num_in_stats = session.channels['0,1'].fetch_measurements(measurements)
+                            rise_times = result[0]
+
+        Note:
+        This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        niscope.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        niscope.Session instance, and calling this method on the result.:
+
+            session.channels['0,1'].fetch_measurements(scalar_meas_functions, timeout='datetime.timedelta(seconds=5.0)')
+
+        Args:
+            scalar_meas_functions (list of list of ScalarMeasurement): The scalar measurements to be performed on each fetched waveform.
+
+            timeout (datetime.timedelta): The time to wait for data to be acquired, for each measurement; using 0 for this parameter tells NI-SCOPE to fetch whatever is currently available.
+
+
+        Returns:
+            result (numpy.array(dtype=numpy.float64)): The value of each measurement for each waveform, with one row per measurement in **scalar_meas_functions** and one column per waveform.
+
+            mean (numpy.array(dtype=numpy.float64)): The mean of each measurement over the fetched waveforms since the statistics were last cleared, with one row per measurement in **scalar_meas_functions** and one column per waveform.
+
+            stdev (numpy.array(dtype=numpy.float64)): The standard deviation of each measurement, with one row per measurement in **scalar_meas_functions** and one column per waveform.
+
+            min (numpy.array(dtype=numpy.float64)): The smallest value of each measurement, with one row per measurement in **scalar_meas_functions** and one column per waveform.
+
+            max (numpy.array(dtype=numpy.float64)): The largest value of each measurement, with one row per measurement in **scalar_meas_functions** and one column per waveform.
+
+            num_in_stats (numpy.array(dtype=numpy.int32)): The number of times each measurement has been taken, with one row per measurement in **scalar_meas_functions** and one column per waveform.
+
+        '''
+        import numpy
+
+        for scalar_meas_function in scalar_meas_functions:
+            if type(scalar_meas_function) is not enums.ScalarMeasurement:
+                raise TypeError('Parameter mode must be of type ' + str(enums.ScalarMeasurement))
+        shape = (len(scalar_meas_functions), self._actual_num_wfms_cached())
+        # result, mean, stdev, min, max and num_in_stats; each measurement is fetched into one row of them
+        stats = tuple(numpy.zeros(shape, dtype=numpy.float64) for _ in range(5)) + (numpy.zeros(shape, dtype=numpy.dtype(visatype.ViInt32)), )
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        timeout_ctype = _converters.convert_timedelta_to_seconds(timeout, visatype.ViReal64)  # case S140
+        for i, scalar_meas_function in enumerate(scalar_meas_functions):
+            scalar_meas_function_ctype = visatype.ViInt32(scalar_meas_function.value)  # case S130
+            stats_ctypes = [get_ctypes_pointer_for_buffer(value=stat[i]) for stat in stats]  # case B510
+            error_code = self._library.niScope_FetchMeasurementStats(vi_ctype, self._repeated_capability_ctype, timeout_ctype, scalar_meas_function_ctype, *stats_ctypes)
+            errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return stats
+
+    def fetch_pipeline(self, samples_per_chunk, dtype=None, num_buffers=4, drop_when_full=False, timeout=datetime.timedelta(seconds=5.0), continuous=False):
+        '''fetch_pipeline
+
+        Fetches the records of an initiated acquisition in chunks on a background thread, like stream(),
+                        into a bounded set of preallocated buffers. The calling thread processes earlier chunks while the
+                        next ones are fetched. Errors raised by the fetch are raised again when iterating.
+
+                        Like stream(), it sets **fetch_relative_to**, **fetch_offset**, **fetch_record_number** and
+                        **fetch_num_records** when called, and sets them back to their previous values once the background
+                        thread stops, after the last chunk, an error or abort(). It also fetches indefinitely with
+                        **continuous** set to True, and raises `niscope.fetch_buffer_pool.StreamOverflowError` when
+                        iterating once the samples not fetched no longer fit in the onboard memory.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        niscope.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        niscope.Session instance, and calling this method on the result.:
+
+            session.channels['0,1'].fetch_pipeline(samples_per_chunk, dtype=None, num_buffers=4, drop_when_full=False, timeout='datetime.timedelta(seconds=5.0)', continuous=False)
+
+        Args:
+            samples_per_chunk (int): The maximum number of samples of each waveform in a chunk. Fewer samples are returned when only fewer have been acquired or are left in the record.
+
+            dtype (numpy.dtype): Type of the samples: `numpy.float64` (the default when None), `numpy.int8`, `numpy.int16` or `numpy.int32`.
+
+            num_buffers (int): The number of preallocated buffers, which bounds the number of chunks fetched ahead of the consumer.
+
+            drop_when_full (bool): What the background thread does when all buffers hold chunks that have not been consumed. If False, it waits for the consumer. If True, it reuses the buffer of the oldest waiting chunk so that the driver keeps being drained, and counts the chunk in **dropped_count**.
+
+            timeout (datetime.timedelta): The time to wait for the samples of a chunk when none have been acquired yet.
+
+            continuous (bool): If False, fetching ends after the last of **horz_num_records** records. If True, it goes on with the next record after every record until you stop iterating, for indefinite acquisitions that acquire more records than fit in the onboard memory.
+
+
+        Returns:
+            pipeline (niscope.pipeline.AcquisitionPipeline): Iterable of the same `StreamChunk` named tuples as stream(). The data of a chunk stays valid until the next chunk is requested.
+                                        It also has **fetched_count**, **dropped_count**, **consumed_count** and **backlog** (chunks waiting) properties, and **abort()**,
+                                        which stops the background thread and is called when leaving a with block.
+
+                                        Example:
+
+                                        .. code-block:: python
+
+                                            with session.initiate():
+                                                with session.channels['0'].fetch_pipeline(samples_per_chunk=100000, dtype=numpy.int16) as pipeline:
+                                                    for chunk in pipeline:
+                                                        process(chunk.wfm)
+
+        '''
+        from niscope import fetch_buffer_pool
+        from niscope import pipeline
+
+        restore_fetch_properties = self._save_fetch_properties()
+        try:
+            chunks = self._fetch_chunks(samples_per_chunk, continuous)
+            pool = fetch_buffer_pool.FetchBufferPool(self, samples_per_chunk, dtype, num_buffers)
+        except Exception:
+            restore_fetch_properties()
+            raise
+
+        def fetch(buffer):
+            # Runs on the producer thread; StopIteration after the last chunk ends the pipeline
+            record_number, offset, num_samples, backlog = next(chunks)
+            wfm, wfm_info = pool.fetch_into(buffer, timeout, num_samples)
+            return fetch_buffer_pool.StreamChunk(wfm, wfm_info, record_number, offset, backlog)
+        return pipeline.AcquisitionPipeline(fetch, pool.buffers, drop_when_full, on_stop=restore_fetch_properties)
+
+    def fetch_record_batches(self, records_per_fetch=100, num_samples=None, dtype=None, num_buffers=2, timeout=datetime.timedelta(seconds=5.0)):
+        '''fetch_record_batches
+
+        Fetches the records of an initiated acquisition in batches of at most **records_per_fetch** records, using
+                        **fetch_record_number** and **fetch_num_records**, into a bounded set of preallocated buffers. Each batch
+                        holds the records that are done (**records_done**) when it is fetched, so batches are yielded while the
+                        acquisition is still running and memory use does not grow with **horz_num_records**.
+
+                        The generator also sets **fetch_relative_to** and **fetch_offset**, and sets the four fetch properties back to
+                        their previous values when it finishes or is closed.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        niscope.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        niscope.Session instance, and calling this method on the result.:
+
+            session.channels['0,1'].fetch_record_batches(records_per_fetch=100, num_samples=None, dtype=None, num_buffers=2, timeout='datetime.timedelta(seconds=5.0)')
+
+        Args:
+            records_per_fetch (int): The maximum number of records in a batch. Fewer records are returned when only fewer are done or left in the acquisition.
+
+            num_samples (int): The number of samples to fetch for each waveform. None means **horz_record_length**.
+
+            dtype (numpy.dtype): Type of the samples: `numpy.float64` (the default when None), `numpy.int8`, `numpy.int16` or `numpy.int32`.
+
+            num_buffers (int): The number of preallocated buffers the batches are fetched into. The data of a batch stays valid until **num_buffers** more batches have been fetched.
+
+            timeout (datetime.timedelta): The time to wait for the records of a batch when none are done yet.
+
+
+        Returns:
+            batches (generator): Generator of `RecordBatch` named tuples with the fields
+
+                                        - **wfm** numpy array of shape (records in the batch, waveforms per record, num_samples)
+                                        - **wfm_info** numpy structured array of shape (records in the batch, waveforms per record) with fields named like the properties of WaveformInfo
+                                        - **record_number** the first record of the batch
+                                        - **records_pending** the number of records that were done but not in the batch
+
+                                        Example:
+
+                                        .. code-block:: python
+
+                                            with session.initiate():
+                                                for batch in session.channels['0,1'].fetch_record_batches(records_per_fetch=1000, dtype=numpy.int16):
+                                                    process(batch.wfm)
+
+        '''
+        from niscope import fetch_buffer_pool
+
+        if records_per_fetch < 1:
+            raise ValueError('records_per_fetch must be at least 1, is {0}'.format(records_per_fetch))
+        # The horizontal and acquisition status properties are not channel based, so they are accessed without the repeated capability
+        session = self._session_wide()
+        if num_samples is None:
+            num_samples = session.horz_record_length
+        num_records = session.horz_num_records
+        restore_fetch_properties = self._save_fetch_properties()
+        try:
+            num_wfms_per_record = self._configure_fetch_records(0, 1)
+            # The pool is sized for the number of waveforms of a full batch
+            self._configure_fetch_records(0, min(records_per_fetch, num_records))
+            pool = fetch_buffer_pool.FetchBufferPool(self, num_samples, dtype, num_buffers)
+            record_number = 0
+            while record_number < num_records:
+                batch_size = min(records_per_fetch, num_records - record_number)
+                # Fetch what is done without waiting for a full batch; when nothing is done the fetch waits for a full batch
+                records_done = session.records_done - record_number
+                if records_done > 0:
+                    batch_size = min(batch_size, records_done)
+                num_wfms = self._configure_fetch_records(record_number, batch_size)
+                wfm, wfm_info = pool.fetch(timeout)
+                wfm = wfm[:num_wfms * num_samples].reshape(batch_size, num_wfms_per_record, num_samples)
+                wfm_info = wfm_info[:num_wfms].reshape(batch_size, num_wfms_per_record)
+                yield fetch_buffer_pool.RecordBatch(wfm, wfm_info, record_number, max(records_done - batch_size, 0))
+                record_number += batch_size
+        finally:
+            restore_fetch_properties()
+
+    def fetch_scaled_into(self, wfm, timeout=datetime.timedelta(seconds=5.0)):
+        '''fetch_scaled
+
+        Fetches 16-bit binary data from a previously initiated acquisition and scales it to voltages
+                        in **wfm**, using the gain and offset of each waveform:
+
+                        .. math::
+
+                            voltage = binary data * gain factor + offset
+
+                        Compared to fetch_into() with a `numpy.float64` array, a quarter of the data is transferred
+                        from the driver and the scaling is done with numpy for all waveforms at once.
+
+        Note:
+        This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        niscope.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        niscope.Session instance, and calling this method on the result.:
+
+            session.channels['0,1'].fetch_scaled(wfm, timeout='datetime.timedelta(seconds=5.0)')
+
+        Args:
+            wfm (list of numpy.array): numpy array of dtype `numpy.float64` or `numpy.float32` that receives the scaled voltages as a 1D array. Size should be **num_samples** times number of waveforms.
+
+                                        Example:
+
+                                        .. code-block:: python
+
+                                            wfm = numpy.ndarray(num_samples * num_wfms, dtype=numpy.float32)
+                                            wfm_info = session.channels['0,1'].fetch_scaled_into(wfm)
+
+            timeout (datetime.timedelta): The time to wait in seconds for data to be acquired; using 0 for this parameter tells NI-SCOPE to fetch whatever is currently available. Using -1 for this parameter implies infinite timeout.
+
+
+        Returns:
+            wfm_info (list of numpy.array): Structured array with the timing and scaling information for each waveform. See niscope.waveform_info.as_numpy_array().
+
+        '''
+        import numpy
+
+        if type(wfm) is not numpy.ndarray:
+            raise TypeError('wfm must be {0}, is {1}'.format(numpy.ndarray, type(wfm)))
+        if not wfm.flags.c_contiguous:
+            raise TypeError('wfm must be C-contiguous')
+        if wfm.dtype not in (numpy.float64, numpy.float32):
+            raise TypeError('wfm must be numpy.ndarray of dtype=float64 or float32, is ' + str(wfm.dtype))
+        num_wfms = self._actual_num_wfms_cached()
+        num_samples = len(wfm) // num_wfms
+        binary_wfm = numpy.empty(num_samples * num_wfms, dtype=numpy.int16)
+        wfm_info_ctype = (waveform_info.struct_niScope_wfmInfo * num_wfms)()
+        self._fetch_into_buffers(num_samples, binary_wfm, wfm_info_ctype, timeout)
+        wfm_info = waveform_info.as_numpy_array(wfm_info_ctype)
+        waveform_info.scale(binary_wfm, wfm_info, out=wfm[:num_samples * num_wfms])
+        return wfm_info
+
+    def stream(self, samples_per_chunk, dtype=None, num_buffers=4, timeout=datetime.timedelta(seconds=5.0), continuous=False):
+        '''stream
+
+        Fetches the records of an initiated acquisition in chunks, for acquisitions that are too long to
+                        fetch at once. For each record, the generator reads **backlog** and fetches what has been
+                        acquired, up to **samples_per_chunk** samples, relative to the read pointer. When nothing has
+                        been acquired yet it waits up to **timeout** for a full chunk.
+
+                        The generator sets **fetch_relative_to**, **fetch_offset**, **fetch_record_number** and
+                        **fetch_num_records**, and ends after the last of **horz_num_records** records of
+                        **horz_record_length** samples. With **continuous** set to True it keeps fetching the next
+                        record instead, for acquisitions configured with **allow_more_records_than_memory** that run
+                        until they are aborted. Stop iterating to stop fetching. The four fetch properties are set back
+                        to their previous values when the generator finishes or is closed.
+
+                        Before each chunk, the samples acquired but not fetched, the **backlog** of the record plus the
+                        records done after it, are compared to the samples of each waveform that fit in
+                        **onboard_memory_size**. When the stream has fallen that far behind, samples it has not fetched
+                        were overwritten, and the generator raises `niscope.fetch_buffer_pool.StreamOverflowError`.
+
+        Note: The onboard memory is divided among the channels acquired. The overflow check assumes that they are the channels being streamed. If other channels are enabled too, samples can be overwritten before the check detects it, and the fetch raises the error of the driver instead.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        niscope.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        niscope.Session instance, and calling this method on the result.:
+
+            session.channels['0,1'].stream(samples_per_chunk, dtype=None, num_buffers=4, timeout='datetime.timedelta(seconds=5.0)', continuous=False)
+
+        Args:
+            samples_per_chunk (int): The maximum number of samples of each waveform in a chunk. Fewer samples are returned when only fewer have been acquired or are left in the record.
+
+            dtype (numpy.dtype): Type of the samples: `numpy.float64` (the default when None), `numpy.int8`, `numpy.int16` or `numpy.int32`.
+
+            num_buffers (int): The number of preallocated buffers the chunks are fetched into. The data of a chunk stays valid until **num_buffers** more chunks have been fetched.
+
+            timeout (datetime.timedelta): The time to wait for the samples of a chunk when none have been acquired yet.
+
+            continuous (bool): If False, fetching ends after the last of **horz_num_records** records. If True, it goes on with the next record after every record until you stop iterating, for indefinite acquisitions that acquire more records than fit in the onboard memory.
+
+
+        Returns:
+            chunks (generator): Generator of `StreamChunk` named tuples with the following fields:
+
+                                        -  **wfm** the samples of each waveform in the chunk, all samples of waveform 0 first
+                                        -  **wfm_info** numpy structured array with the timing and scaling information for each waveform
+                                        -  **record_number** the record the samples belong to
+                                        -  **offset** the position of the first sample of the chunk in the record
+                                        -  **backlog** the number of samples of the record acquired but not fetched yet, after this chunk
+
+                                        Example:
+
+                                        .. code-block:: python
+
+                                            with session.initiate():
+                                                for chunk in session.channels['0'].stream(samples_per_chunk=100000, dtype=numpy.int16):
+                                                    process(chunk.wfm)
+
+        '''
+        from niscope import fetch_buffer_pool
+
+        restore_fetch_properties = self._save_fetch_properties()
+        try:
+            chunks = self._fetch_chunks(samples_per_chunk, continuous)
+            pool = fetch_buffer_pool.FetchBufferPool(self, samples_per_chunk, dtype, num_buffers)
+            for record_number, offset, num_samples, backlog in chunks:
+                wfm, wfm_info = pool.fetch(timeout, num_samples)
+                yield fetch_buffer_pool.StreamChunk(wfm, wfm_info, record_number, offset, backlog)
+        finally:
+            restore_fetch_properties()
 
     def _get_attribute_vi_boolean(self, attribute_id):
         '''_get_attribute_vi_boolean
@@ -2802,7 +4015,7 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_list_ctype = self._repeated_capability_ctype  # case C010
         attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
         value_ctype = visatype.ViBoolean()  # case S200
         error_code = self._library.niScope_GetAttributeViBoolean(vi_ctype, channel_list_ctype, attribute_id_ctype, None if value_ctype is None else (ctypes.pointer(value_ctype)))
@@ -2838,7 +4051,7 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_list_ctype = self._repeated_capability_ctype  # case C010
         attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
         value_ctype = visatype.ViInt32()  # case S200
         error_code = self._library.niScope_GetAttributeViInt32(vi_ctype, channel_list_ctype, attribute_id_ctype, None if value_ctype is None else (ctypes.pointer(value_ctype)))
@@ -2875,7 +4088,7 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_list_ctype = self._repeated_capability_ctype  # case C010
         attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
         value_ctype = visatype.ViReal64()  # case S200
         error_code = self._library.niScope_GetAttributeViReal64(vi_ctype, channel_list_ctype, attribute_id_ctype, None if value_ctype is None else (ctypes.pointer(value_ctype)))
@@ -2918,7 +4131,7 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_list_ctype = self._repeated_capability_ctype  # case C010
         attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
         buf_size_ctype = visatype.ViInt32()  # case S170
         value_ctype = None  # case C050
@@ -2960,7 +4173,7 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_ctype = self._repeated_capability_ctype  # case C010
         number_of_coefficients_ctype = visatype.ViInt32(number_of_coefficients)  # case S190
         coefficients_size = number_of_coefficients  # case B600
         coefficients_ctype = get_ctypes_pointer_for_buffer(library_type=visatype.ViReal64, size=coefficients_size)  # case B600
@@ -3027,6 +4240,9 @@ class _SessionBase(object):
         Device <REPLACE_DRIVER_SPECIFIC_URL_1(features_supported_main)>`__ for
         more information.
 
+        Note:
+        This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.
+
         Tip:
         This method requires repeated capabilities (usually channels). If called directly on the
         niscope.Session object, then the method will use all repeated capabilities in the session.
@@ -3095,18 +4311,19 @@ class _SessionBase(object):
                 Call _actual_num_wfms to determine the size of this array.
 
         '''
+        num_wfms = self._actual_num_wfms_cached()
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_list_ctype = self._repeated_capability_ctype  # case C010
         timeout_ctype = _converters.convert_timedelta_to_seconds(timeout, visatype.ViReal64)  # case S140
         num_samples_ctype = visatype.ViInt32(num_samples)  # case S150
-        wfm_size = (num_samples * self._actual_num_wfms())  # case B560
-        wfm_array = array.array("d", [0] * wfm_size)  # case B560
+        wfm_size = (num_samples * num_wfms)  # case B560
+        wfm_array = array.array("d", [0]) * wfm_size  # case B560
         wfm_ctype = get_ctypes_pointer_for_buffer(value=wfm_array, library_type=visatype.ViReal64)  # case B560
-        wfm_info_size = self._actual_num_wfms()  # case B560
+        wfm_info_size = num_wfms  # case B560
         wfm_info_ctype = get_ctypes_pointer_for_buffer(library_type=waveform_info.struct_niScope_wfmInfo, size=wfm_info_size)  # case B560
         error_code = self._library.niScope_Read(vi_ctype, channel_list_ctype, timeout_ctype, num_samples_ctype, wfm_ctype, wfm_info_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
-        return wfm_array, [waveform_info.WaveformInfo(wfm_info_ctype[i]) for i in range(self._actual_num_wfms())]
+        return wfm_array, [waveform_info.WaveformInfo(wfm_info_ctype[i]) for i in range(wfm_info_size)]
 
     def read_measurement(self, scalar_meas_function, timeout=datetime.timedelta(seconds=5.0)):
         '''read_measurement
@@ -3126,6 +4343,9 @@ class _SessionBase(object):
         meas_chan_high_ref_level to set each channel
         differently.
 
+        Note:
+        This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.
+
         Tip:
         This method requires repeated capabilities (usually channels). If called directly on the
         niscope.Session object, then the method will use all repeated capabilities in the session.
@@ -3151,17 +4371,34 @@ class _SessionBase(object):
         '''
         if type(scalar_meas_function) is not enums.ScalarMeasurement:
             raise TypeError('Parameter mode must be of type ' + str(enums.ScalarMeasurement))
+        num_wfms = self._actual_num_wfms_cached()
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_list_ctype = self._repeated_capability_ctype  # case C010
         timeout_ctype = _converters.convert_timedelta_to_seconds(timeout, visatype.ViReal64)  # case S140
         scalar_meas_function_ctype = visatype.ViInt32(scalar_meas_function.value)  # case S130
-        result_size = self._actual_num_wfms()  # case B560
-        result_array = array.array("d", [0] * result_size)  # case B560
+        result_size = num_wfms  # case B560
+        result_array = array.array("d", [0]) * result_size  # case B560
         result_ctype = get_ctypes_pointer_for_buffer(value=result_array, library_type=visatype.ViReal64)  # case B560
         error_code = self._library.niScope_ReadMeasurement(vi_ctype, channel_list_ctype, timeout_ctype, scalar_meas_function_ctype, result_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return result_array
 
+    def _save_fetch_properties(self):
+        '''_save_fetch_properties
+
+        Returns a function that sets fetch_relative_to, fetch_offset, fetch_record_number and
+        fetch_num_records back to their current values. Methods that change them to fetch in chunks
+        or batches call it when they are done, so fetch() afterwards behaves as configured.
+        '''
+        # The fetch properties are not channel based, so they are accessed without the repeated capability
+        session = self._session_wide()
+        values = [(name, getattr(session, name)) for name in ('fetch_relative_to', 'fetch_offset', 'fetch_record_number', 'fetch_num_records')]
+
+        def restore():
+            for name, value in values:
+                setattr(session, name, value)
+        return restore
+
     def _set_attribute_vi_boolean(self, attribute_id, value):
         '''_set_attribute_vi_boolean
 
@@ -3204,10 +4441,11 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_list_ctype = self._repeated_capability_ctype  # case C010
         attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
         value_ctype = visatype.ViBoolean(value)  # case S150
         error_code = self._library.niScope_SetAttributeViBoolean(vi_ctype, channel_list_ctype, attribute_id_ctype, value_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -3253,10 +4491,11 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_list_ctype = self._repeated_capability_ctype  # case C010
         attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
         value_ctype = visatype.ViInt32(value)  # case S150
         error_code = self._library.niScope_SetAttributeViInt32(vi_ctype, channel_list_ctype, attribute_id_ctype, value_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -3302,10 +4541,11 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_list_ctype = self._repeated_capability_ctype  # case C010
         attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
         value_ctype = visatype.ViReal64(value)  # case S150
         error_code = self._library.niScope_SetAttributeViReal64(vi_ctype, channel_list_ctype, attribute_id_ctype, value_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -3353,16 +4593,102 @@ class _SessionBase(object):
 
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case C010
+        channel_list_ctype = self._repeated_capability_ctype  # case C010
         attribute_id_ctype = visatype.ViAttr(attribute_id)  # case S150
         value_ctype = ctypes.create_string_buffer(value.encode(self._encoding))  # case C020
         error_code = self._library.niScope_SetAttributeViString(vi_ctype, channel_list_ctype, attribute_id_ctype, value_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
+    def waveform_recorder(self, path, num_samples=None, num_records=None, dtype=None, records_per_fetch=1, index_path=None):
+        '''waveform_recorder
+
+        Creates a recorder that fetches the records of an acquisition into memory-mapped .npy files: one for the samples
+                        and a sidecar index with the waveform information of each waveform, such as timestamps, gain, offset and
+                        actual samples. The driver fetches directly into the mapped files, so captures larger than memory can be recorded.
+
+                        The recorder sets **fetch_relative_to**, **fetch_offset**, **fetch_record_number** and **fetch_num_records**
+                        for each fetch, and sets them back to their values from before it was created when it is closed.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        niscope.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        niscope.Session instance, and calling this method on the result.:
+
+            session.channels['0,1'].waveform_recorder(path, num_samples=None, num_records=None, dtype=None, records_per_fetch=1, index_path=None)
+
+        Args:
+            path (str): Path of the .npy file created for the samples. An existing file is overwritten.
+
+            num_samples (int): The number of samples to record for each waveform. None means **horz_record_length**.
+
+            num_records (int): The number of records to record. None means **horz_num_records**.
+
+            dtype (numpy.dtype): Type of the samples. None means `numpy.int16` (binary16), which can be scaled to voltages with the gain and offset in the index.
+
+                                        Types supported are
+
+                                        - `numpy.float64`
+                                        - `numpy.int8`
+                                        - `numpy.int16`
+                                        - `numpy.int32`
+
+            records_per_fetch (int): The number of records fetched by each call to the driver.
+
+            index_path (str): Path of the .npy file created for the waveform information. None means **path** with its extension replaced by `_wfm_info.npy`.
+
+
+        Returns:
+            recorder (niscope.waveform_recorder.WaveformRecorder): Object whose **record(timeout=datetime.timedelta(seconds=5.0))** method fetches all records into the files, and
+                                        **record_next(timeout)** fetches the next **records_per_fetch** records. The samples file has shape
+                                        (num_records, num_wfms_per_record, num_samples). The index file holds a structured array of shape
+                                        (num_records, num_wfms_per_record) with fields named like the properties of WaveformInfo, i.e. `index['gain']`.
+                                        Leaving a with block flushes and closes both files.
+
+                                        Example:
+
+                                        .. code-block:: python
+
+                                            with session.initiate():
+                                                with session.channels['0,1'].waveform_recorder('capture.npy', records_per_fetch=100) as recorder:
+                                                    recorder.record()
+                                            wfm = numpy.load('capture.npy', mmap_mode='r')
+                                            index = numpy.load('capture_wfm_info.npy', mmap_mode='r')
+
+        '''
+        from niscope import waveform_recorder
+
+        # The horizontal properties are not channel based, so they are accessed without the repeated capability
+        session = self._session_wide()
+        if num_samples is None:
+            num_samples = session.horz_record_length
+        if num_records is None:
+            num_records = session.horz_num_records
+        return waveform_recorder.WaveformRecorder(self, path, num_samples, num_records, dtype, records_per_fetch, index_path)
+
 
 class Session(_SessionBase):
-    '''An NI-SCOPE session to a National Instruments Digitizer.'''
+    '''An NI-SCOPE session to a National Instruments Digitizer.
+
+    Thread safety:
+
+    A session can be used from several threads. This applies to every method and property. No Python lock is held while the driver runs, and the driver runs one call on a session at a time. A method called, or a property set or read, while another call on the same session is in progress, directly or through the executor property, waits for that call to complete. Calls on different sessions run in parallel.
+
+    Calls made through the executor property run on the worker thread of the session, one at a time and in the order they were submitted.
+
+    Sequences of calls that depend on each other, such as setting the fetch properties and then fetching, are not atomic. Make them from one thread, or submit them to the executor as one callable. Generators, pipelines and buffer pools returned by the session are used from one thread at a time. Do not call close() while other threads use the session.
+    '''
+
+    _settable_names = _SessionBase._settable_names | frozenset([
+        '_executor',
+        '_executor_lock',
+        'attribute_cache_enabled',
+        'warning_interval',
+        'warning_policy',
+        'channels',
+    ])
 
     def __init__(self, resource_name, id_query=False, reset_device=False, options={}):
         '''An NI-SCOPE session to a National Instruments Digitizer.
@@ -3494,10 +4820,15 @@ class Session(_SessionBase):
             session (niscope.Session): A session object representing the device.
 
         '''
-        super(Session, self).__init__(repeated_capability='', vi=None, library=None, encoding=None, freeze_it=False)
+        super(Session, self).__init__(repeated_capability='', vi=None, library=None, encoding=None, attribute_cache=attributes.AttributeCache(), error_descriptions=_LruCache(64), warning_filter=errors._WarningFilter(), pending_descriptions=errors._PendingDescriptions(), freeze_it=False)
         options = _converters.convert_init_with_options_dictionary(options, self._encoding)
         self._library = library_singleton.get()
         self._encoding = 'windows-1251'
+        self._repeated_capability_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))
+
+        # The executor is created on first use, see the executor property
+        self._executor = None
+        self._executor_lock = threading.Lock()
 
         # Call specified init function
         self._vi = 0  # This must be set before calling _init_with_options().
@@ -3525,10 +4856,49 @@ class Session(_SessionBase):
     def initiate(self):
         return _Acquisition(self)
 
+    @property
+    def attribute_cache_enabled(self):
+        '''attribute_cache_enabled
+
+        When True, property values are kept in a Python-side cache after they are first read from the
+        driver, so reading them again does not call into the driver. Methods that can change property
+        values, including setting a property, clear the cache. Properties that change on their own,
+        such as status or temperature, are never cached. Defaults to False.
+
+        Do not enable the cache if another session or process changes the configuration of the device.
+        '''
+        return self._attribute_cache.enabled
+
+    @attribute_cache_enabled.setter
+    def attribute_cache_enabled(self, value):
+        self._attribute_cache.clear()
+        self._attribute_cache.enabled = value
+
+    @property
+    def executor(self):
+        '''executor
+
+        Returns the executor.SessionExecutor that runs calls on this session on a
+        dedicated worker thread. The worker thread is started on first use and
+        stopped by close(), after any pending calls have completed.
+        '''
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = executor.SessionExecutor(self)
+            return self._executor
+
     def close(self):
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+        self.channels._clear_cache()
+        # The driver can't describe errors of the session once it is closed
+        self._pending_descriptions.resolve()
         try:
             self._close()
         except errors.Error as e:
+            self._pending_descriptions.resolve()
             self._vi = 0
             raise
         self._vi = 0
@@ -3570,6 +4940,31 @@ class Session(_SessionBase):
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return enums.AcquisitionStatus(acquisition_status_ctype.value)
 
+    def actual_meas_wfm_size(self, array_meas_function):
+        '''actual_meas_wfm_size
+
+        Returns the total available size of an array measurement acquisition.
+
+        Args:
+            array_meas_function (enums.ArrayMeasurement): The `array
+                measurement <REPLACE_DRIVER_SPECIFIC_URL_2(array_measurements_refs)>`__
+                to perform.
+
+
+        Returns:
+            meas_waveform_size (int): Returns the size (in number of samples) of the resulting analysis
+                waveform.
+
+        '''
+        if type(array_meas_function) is not enums.ArrayMeasurement:
+            raise TypeError('Parameter mode must be of type ' + str(enums.ArrayMeasurement))
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        array_meas_function_ctype = visatype.ViInt32(array_meas_function.value)  # case S130
+        meas_waveform_size_ctype = visatype.ViInt32()  # case S200
+        error_code = self._library.niScope_ActualMeasWfmSize(vi_ctype, array_meas_function_ctype, None if meas_waveform_size_ctype is None else (ctypes.pointer(meas_waveform_size_ctype)))
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return int(meas_waveform_size_ctype.value)
+
     def auto_setup(self):
         '''auto_setup
 
@@ -3639,9 +5034,13 @@ class Session(_SessionBase):
         +--------------------+-----------------------------------------------+
         | Trigger output     | None                                          |
         +--------------------+-----------------------------------------------+
+
+        Note:
+        This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
         error_code = self._library.niScope_AutoSetup(vi_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -3655,6 +5054,7 @@ class Session(_SessionBase):
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
         error_code = self._library.niScope_Commit(vi_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -3704,6 +5104,7 @@ class Session(_SessionBase):
         num_records_ctype = visatype.ViInt32(num_records)  # case S150
         enforce_realtime_ctype = visatype.ViBoolean(enforce_realtime)  # case S150
         error_code = self._library.niScope_ConfigureHorizontalTiming(vi_ctype, min_sample_rate_ctype, min_num_pts_ctype, ref_position_ctype, num_records_ctype, enforce_realtime_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -3761,6 +5162,7 @@ class Session(_SessionBase):
         mid_ctype = visatype.ViReal64(mid)  # case S150
         high_ctype = visatype.ViReal64(high)  # case S150
         error_code = self._library.niScope_ConfigureRefLevels(vi_ctype, low_ctype, mid_ctype, high_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -3822,6 +5224,7 @@ class Session(_SessionBase):
         holdoff_ctype = _converters.convert_timedelta_to_seconds(holdoff, visatype.ViReal64)  # case S140
         delay_ctype = _converters.convert_timedelta_to_seconds(delay, visatype.ViReal64)  # case S140
         error_code = self._library.niScope_ConfigureTriggerDigital(vi_ctype, trigger_source_ctype, slope_ctype, holdoff_ctype, delay_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -3883,6 +5286,7 @@ class Session(_SessionBase):
         holdoff_ctype = _converters.convert_timedelta_to_seconds(holdoff, visatype.ViReal64)  # case S140
         delay_ctype = _converters.convert_timedelta_to_seconds(delay, visatype.ViReal64)  # case S140
         error_code = self._library.niScope_ConfigureTriggerEdge(vi_ctype, trigger_source_ctype, level_ctype, slope_ctype, trigger_coupling_ctype, holdoff_ctype, delay_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -3955,6 +5359,7 @@ class Session(_SessionBase):
         holdoff_ctype = _converters.convert_timedelta_to_seconds(holdoff, visatype.ViReal64)  # case S140
         delay_ctype = _converters.convert_timedelta_to_seconds(delay, visatype.ViReal64)  # case S140
         error_code = self._library.niScope_ConfigureTriggerHysteresis(vi_ctype, trigger_source_ctype, level_ctype, hysteresis_ctype, slope_ctype, trigger_coupling_ctype, holdoff_ctype, delay_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -3970,6 +5375,7 @@ class Session(_SessionBase):
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
         error_code = self._library.niScope_ConfigureTriggerImmediate(vi_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -4012,6 +5418,7 @@ class Session(_SessionBase):
         holdoff_ctype = _converters.convert_timedelta_to_seconds(holdoff, visatype.ViReal64)  # case S140
         delay_ctype = _converters.convert_timedelta_to_seconds(delay, visatype.ViReal64)  # case S140
         error_code = self._library.niScope_ConfigureTriggerSoftware(vi_ctype, holdoff_ctype, delay_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -4097,6 +5504,7 @@ class Session(_SessionBase):
         holdoff_ctype = _converters.convert_timedelta_to_seconds(holdoff, visatype.ViReal64)  # case S140
         delay_ctype = _converters.convert_timedelta_to_seconds(delay, visatype.ViReal64)  # case S140
         error_code = self._library.niScope_ConfigureTriggerVideo(vi_ctype, trigger_source_ctype, enable_dc_restore_ctype, signal_format_ctype, event_ctype, line_number_ctype, polarity_ctype, trigger_coupling_ctype, holdoff_ctype, delay_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -4165,6 +5573,7 @@ class Session(_SessionBase):
         holdoff_ctype = _converters.convert_timedelta_to_seconds(holdoff, visatype.ViReal64)  # case S140
         delay_ctype = _converters.convert_timedelta_to_seconds(delay, visatype.ViReal64)  # case S140
         error_code = self._library.niScope_ConfigureTriggerWindow(vi_ctype, trigger_source_ctype, low_level_ctype, high_level_ctype, window_mode_ctype, trigger_coupling_ctype, holdoff_ctype, delay_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -4176,6 +5585,7 @@ class Session(_SessionBase):
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
         error_code = self._library.niScope_Disable(vi_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -4281,6 +5691,7 @@ class Session(_SessionBase):
         signal_identifier_ctype = ctypes.create_string_buffer(signal_identifier.encode(self._encoding))  # case C020
         output_terminal_ctype = ctypes.create_string_buffer(output_terminal.encode(self._encoding))  # case C020
         error_code = self._library.niScope_ExportSignal(vi_ctype, signal_ctype, signal_identifier_ctype, output_terminal_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -4430,6 +5841,7 @@ class Session(_SessionBase):
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
         error_code = self._library.niScope_InitiateAcquisition(vi_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -4465,6 +5877,7 @@ class Session(_SessionBase):
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
         error_code = self._library.niScope_ResetDevice(vi_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -4477,6 +5890,7 @@ class Session(_SessionBase):
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
         error_code = self._library.niScope_ResetWithDefaults(vi_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -4534,6 +5948,7 @@ class Session(_SessionBase):
         '''
         vi_ctype = visatype.ViSession(self._vi)  # case S110
         error_code = self._library.niScope_reset(vi_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
@@ -4542,6 +5957,9 @@ class Session(_SessionBase):
 
         Runs the instrument self-test routine and returns the test result(s).
 
+        Note:
+        This method blocks until the driver call completes. Calls on other sessions from other threads proceed in parallel, while calls on the same session wait for it, see the thread safety section of the Session class. To keep the calling thread free, call this method through the Session.executor property instead. The call then runs on the session's worker thread and a concurrent.futures.Future is returned.
+
         Returns:
             self_test_result (int): This control contains the value returned from the instrument self-test.
 
@@ -4561,6 +5979,7 @@ class Session(_SessionBase):
         self_test_result_ctype = visatype.ViInt16()  # case S200
         self_test_message_ctype = (visatype.ViChar * 256)()  # case C070
         error_code = self._library.niScope_self_test(vi_ctype, None if self_test_result_ctype is None else (ctypes.pointer(self_test_result_ctype)), self_test_message_ctype)
+        self._attribute_cache.clear()
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(self_test_result_ctype.value), self_test_message_ctype.value.decode(self._encoding)
 
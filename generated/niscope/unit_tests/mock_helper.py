@@ -20,6 +20,9 @@ class SideEffectsHelper(object):
         self._defaults['AcquisitionStatus'] = {}
         self._defaults['AcquisitionStatus']['return'] = 0
         self._defaults['AcquisitionStatus']['acquisitionStatus'] = None
+        self._defaults['ActualMeasWfmSize'] = {}
+        self._defaults['ActualMeasWfmSize']['return'] = 0
+        self._defaults['ActualMeasWfmSize']['measWaveformSize'] = None
         self._defaults['ActualNumWfms'] = {}
         self._defaults['ActualNumWfms']['return'] = 0
         self._defaults['ActualNumWfms']['numWfms'] = None
@@ -63,6 +66,10 @@ class SideEffectsHelper(object):
         self._defaults['Fetch']['return'] = 0
         self._defaults['Fetch']['Wfm'] = None
         self._defaults['Fetch']['wfmInfo'] = None
+        self._defaults['FetchArrayMeasurement'] = {}
+        self._defaults['FetchArrayMeasurement']['return'] = 0
+        self._defaults['FetchArrayMeasurement']['measWfm'] = None
+        self._defaults['FetchArrayMeasurement']['wfmInfo'] = None
         self._defaults['FetchBinary16'] = {}
         self._defaults['FetchBinary16']['return'] = 0
         self._defaults['FetchBinary16']['Wfm'] = None
@@ -75,13 +82,6 @@ class SideEffectsHelper(object):
         self._defaults['FetchBinary8']['return'] = 0
         self._defaults['FetchBinary8']['Wfm'] = None
         self._defaults['FetchBinary8']['wfmInfo'] = None
-        self._defaults['FetchDispatcher'] = {}
-        self._defaults['FetchDispatcher']['return'] = 0
-        self._defaults['FetchDispatcher']['wfmInfo'] = None
-        self._defaults['FetchDouble'] = {}
-        self._defaults['FetchDouble']['return'] = 0
-        self._defaults['FetchDouble']['Wfm'] = None
-        self._defaults['FetchDouble']['wfmInfo'] = None
         self._defaults['FetchMeasurement'] = {}
         self._defaults['FetchMeasurement']['return'] = 0
         self._defaults['FetchMeasurement']['Result'] = None
@@ -171,6 +171,15 @@ class SideEffectsHelper(object):
         acquisition_status.contents.value = self._defaults['AcquisitionStatus']['acquisitionStatus']
         return self._defaults['AcquisitionStatus']['return']
 
+    def niScope_ActualMeasWfmSize(self, vi, array_meas_function, meas_waveform_size):  # noqa: N802
+        if self._defaults['ActualMeasWfmSize']['return'] != 0:
+            return self._defaults['ActualMeasWfmSize']['return']
+        # meas_waveform_size
+        if self._defaults['ActualMeasWfmSize']['measWaveformSize'] is None:
+            raise MockFunctionCallError("niScope_ActualMeasWfmSize", param='measWaveformSize')
+        meas_waveform_size.contents.value = self._defaults['ActualMeasWfmSize']['measWaveformSize']
+        return self._defaults['ActualMeasWfmSize']['return']
+
     def niScope_ActualNumWfms(self, vi, channel_list, num_wfms):  # noqa: N802
         if self._defaults['ActualNumWfms']['return'] != 0:
             return self._defaults['ActualNumWfms']['return']
@@ -297,6 +306,33 @@ class SideEffectsHelper(object):
             wfm_info_ref[i] = test_value[i]
         return self._defaults['Fetch']['return']
 
+    def niScope_FetchArrayMeasurement(self, vi, channel_list, timeout, array_meas_function, meas_wfm_size, meas_wfm, wfm_info):  # noqa: N802
+        if self._defaults['FetchArrayMeasurement']['return'] != 0:
+            return self._defaults['FetchArrayMeasurement']['return']
+        # meas_wfm
+        if self._defaults['FetchArrayMeasurement']['measWfm'] is None:
+            raise MockFunctionCallError("niScope_FetchArrayMeasurement", param='measWfm')
+        test_value = self._defaults['FetchArrayMeasurement']['measWfm']
+        try:
+            meas_wfm_ref = meas_wfm.contents
+        except AttributeError:
+            meas_wfm_ref = meas_wfm
+        assert len(meas_wfm_ref) >= len(test_value)
+        for i in range(len(test_value)):
+            meas_wfm_ref[i] = test_value[i]
+        # wfm_info
+        if self._defaults['FetchArrayMeasurement']['wfmInfo'] is None:
+            raise MockFunctionCallError("niScope_FetchArrayMeasurement", param='wfmInfo')
+        test_value = self._defaults['FetchArrayMeasurement']['wfmInfo']
+        try:
+            wfm_info_ref = wfm_info.contents
+        except AttributeError:
+            wfm_info_ref = wfm_info
+        assert len(wfm_info_ref) >= len(test_value)
+        for i in range(len(test_value)):
+            wfm_info_ref[i] = test_value[i]
+        return self._defaults['FetchArrayMeasurement']['return']
+
     def niScope_FetchBinary16(self, vi, channel_list, timeout, num_samples, wfm, wfm_info):  # noqa: N802
         if self._defaults['FetchBinary16']['return'] != 0:
             return self._defaults['FetchBinary16']['return']
@@ -378,49 +414,6 @@ class SideEffectsHelper(object):
             wfm_info_ref[i] = test_value[i]
         return self._defaults['FetchBinary8']['return']
 
-    def niScope_FetchDispatcher(self, vi, channel_list, timeout, num_samples, wfm, wfm_info):  # noqa: N802
-        if self._defaults['FetchDispatcher']['return'] != 0:
-            return self._defaults['FetchDispatcher']['return']
-        # wfm_info
-        if self._defaults['FetchDispatcher']['wfmInfo'] is None:
-            raise MockFunctionCallError("niScope_FetchDispatcher", param='wfmInfo')
-        test_value = self._defaults['FetchDispatcher']['wfmInfo']
-        try:
-            wfm_info_ref = wfm_info.contents
-        except AttributeError:
-            wfm_info_ref = wfm_info
-        assert len(wfm_info_ref) >= len(test_value)
-        for i in range(len(test_value)):
-            wfm_info_ref[i] = test_value[i]
-        return self._defaults['FetchDispatcher']['return']
-
-    def niScope_FetchDouble(self, vi, channel_list, timeout, num_samples, wfm, wfm_info):  # noqa: N802
-        if self._defaults['FetchDouble']['return'] != 0:
-            return self._defaults['FetchDouble']['return']
-        # wfm
-        if self._defaults['FetchDouble']['Wfm'] is None:
-            raise MockFunctionCallError("niScope_FetchDouble", param='Wfm')
-        test_value = self._defaults['FetchDouble']['Wfm']
-        try:
-            wfm_ref = wfm.contents
-        except AttributeError:
-            wfm_ref = wfm
-        assert len(wfm_ref) >= len(test_value)
-        for i in range(len(test_value)):
-            wfm_ref[i] = test_value[i]
-        # wfm_info
-        if self._defaults['FetchDouble']['wfmInfo'] is None:
-            raise MockFunctionCallError("niScope_FetchDouble", param='wfmInfo')
-        test_value = self._defaults['FetchDouble']['wfmInfo']
-        try:
-            wfm_info_ref = wfm_info.contents
-        except AttributeError:
-            wfm_info_ref = wfm_info
-        assert len(wfm_info_ref) >= len(test_value)
-        for i in range(len(test_value)):
-            wfm_info_ref[i] = test_value[i]
-        return self._defaults['FetchDouble']['return']
-
     def niScope_FetchMeasurement(self, vi, channel_list, timeout, scalar_meas_function, result):  # noqa: N802
         if self._defaults['FetchMeasurement']['return'] != 0:
             return self._defaults['FetchMeasurement']['return']
@@ -711,6 +704,8 @@ class SideEffectsHelper(object):
         mock_library.niScope_Abort.return_value = 0
         mock_library.niScope_AcquisitionStatus.side_effect = MockFunctionCallError("niScope_AcquisitionStatus")
         mock_library.niScope_AcquisitionStatus.return_value = 0
+        mock_library.niScope_ActualMeasWfmSize.side_effect = MockFunctionCallError("niScope_ActualMeasWfmSize")
+        mock_library.niScope_ActualMeasWfmSize.return_value = 0
         mock_library.niScope_ActualNumWfms.side_effect = MockFunctionCallError("niScope_ActualNumWfms")
         mock_library.niScope_ActualNumWfms.return_value = 0
         mock_library.niScope_AutoSetup.side_effect = MockFunctionCallError("niScope_AutoSetup")
@@ -751,16 +746,14 @@ class SideEffectsHelper(object):
         mock_library.niScope_ExportSignal.return_value = 0
         mock_library.niScope_Fetch.side_effect = MockFunctionCallError("niScope_Fetch")
         mock_library.niScope_Fetch.return_value = 0
+        mock_library.niScope_FetchArrayMeasurement.side_effect = MockFunctionCallError("niScope_FetchArrayMeasurement")
+        mock_library.niScope_FetchArrayMeasurement.return_value = 0
         mock_library.niScope_FetchBinary16.side_effect = MockFunctionCallError("niScope_FetchBinary16")
         mock_library.niScope_FetchBinary16.return_value = 0
         mock_library.niScope_FetchBinary32.side_effect = MockFunctionCallError("niScope_FetchBinary32")
         mock_library.niScope_FetchBinary32.return_value = 0
         mock_library.niScope_FetchBinary8.side_effect = MockFunctionCallError("niScope_FetchBinary8")
         mock_library.niScope_FetchBinary8.return_value = 0
-        mock_library.niScope_FetchDispatcher.side_effect = MockFunctionCallError("niScope_FetchDispatcher")
-        mock_library.niScope_FetchDispatcher.return_value = 0
-        mock_library.niScope_FetchDouble.side_effect = MockFunctionCallError("niScope_FetchDouble")
-        mock_library.niScope_FetchDouble.return_value = 0
         mock_library.niScope_FetchMeasurement.side_effect = MockFunctionCallError("niScope_FetchMeasurement")
         mock_library.niScope_FetchMeasurement.return_value = 0
         mock_library.niScope_FetchMeasurementStats.side_effect = MockFunctionCallError("niScope_FetchMeasurementStats")
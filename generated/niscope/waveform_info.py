@@ -43,6 +43,55 @@ class struct_niScope_wfmInfo(ctypes.Structure):  # noqa N801
             self.reserved2 = reserved2
 
 
+# Built on first use so that numpy is only required by code that uses it
+_numpy_dtype = None
+
+
+def get_numpy_dtype():
+    '''Returns the numpy.dtype with the same fields, offsets and size as struct_niScope_wfmInfo (_pack_ = 8).'''
+    global _numpy_dtype
+    if _numpy_dtype is None:
+        import numpy
+        _numpy_dtype = numpy.dtype({
+            'names': [name for name, _ in struct_niScope_wfmInfo._fields_],
+            'formats': [numpy.dtype(field_type) for _, field_type in struct_niScope_wfmInfo._fields_],
+            'offsets': [getattr(struct_niScope_wfmInfo, name).offset for name, _ in struct_niScope_wfmInfo._fields_],
+            'itemsize': ctypes.sizeof(struct_niScope_wfmInfo),
+        })
+    return _numpy_dtype
+
+
+def as_numpy_array(wfm_info):
+    '''Returns waveform information as a numpy structured array, i.e. info['absolute_initial_x'] is an array of timestamps.
+
+    A ctypes array of struct_niScope_wfmInfo is viewed without copying, so later writes by the driver show
+    through. Any other sequence, such as the list of WaveformInfo returned by fetch(), is copied.
+    '''
+    import numpy
+    dtype = get_numpy_dtype()
+    if isinstance(wfm_info, ctypes.Array):
+        return numpy.frombuffer(wfm_info, dtype=dtype)
+    info_array = numpy.zeros(len(wfm_info), dtype=dtype)
+    for name in dtype.names:
+        info_array[name] = [getattr(info, name) for info in wfm_info]
+    return info_array
+
+
+def scale(wfm, wfm_info, out):
+    '''Scales binary waveforms to voltages in out, as wfm * gain + offset with the gain and offset of each waveform.
+
+    wfm holds the samples of all waveforms one after the other, wfm_info is a structured array from
+    as_numpy_array() with one element per waveform and out is a float32 or float64 array the size of wfm.
+    '''
+    import numpy
+    num_wfms = len(wfm_info)
+    wfm_2d = wfm.reshape(num_wfms, -1)
+    out_2d = out.reshape(num_wfms, -1)
+    numpy.multiply(wfm_2d, wfm_info['gain'][:, numpy.newaxis], out=out_2d, casting='unsafe')
+    numpy.add(out_2d, wfm_info['offset'][:, numpy.newaxis], out=out_2d, casting='unsafe')
+    return out
+
+
 class WaveformInfo(object):
     def __init__(self, data=None, absolute_initial_x=0.0, relative_initial_x=0.0,
                  x_increment=0.0, actual_samples=0, offset=0.0, gain=0.0,
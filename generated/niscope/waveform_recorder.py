@@ -0,0 +1,136 @@
+import datetime
+import os
+
+from niscope import waveform_info
+
+
+class WaveformRecorder(object):
+    '''Fetches the records of an acquisition into memory-mapped .npy files.
+
+    Created by niscope.Session.waveform_recorder(). The samples are written to a file of shape
+    (num_records, num_wfms_per_record, num_samples) and the waveform information to a sidecar index
+    file of shape (num_records, num_wfms_per_record) with the dtype of waveform_info.get_numpy_dtype().
+    The driver writes into the mapped files directly, so records never pass through Python objects and
+    only the pages being written are held in memory. Both files can be opened again with
+    numpy.load(path, mmap_mode='r').
+    '''
+
+    _supported_dtypes = ('float64', 'int8', 'int16', 'int32')
+
+    def __init__(self, session, path, num_samples, num_records, dtype=None, records_per_fetch=1, index_path=None):
+        import numpy
+        from numpy.lib import format
+
+        dtype = numpy.dtype(numpy.int16 if dtype is None else dtype)
+        if dtype.name not in self._supported_dtypes:
+            raise TypeError('Unsupported dtype. Is {0}, expected one of {1}'.format(dtype, ', '.join(self._supported_dtypes)))
+        if records_per_fetch < 1:
+            raise ValueError('records_per_fetch must be at least 1, is {0}'.format(records_per_fetch))
+
+        self._session = session
+        self._records_per_fetch = records_per_fetch
+        self._path = path
+        self._index_path = os.path.splitext(path)[0] + '_wfm_info.npy' if index_path is None else index_path
+        # The fetch properties are set for every fetch and set back by close()
+        self._restore_fetch_properties = session._save_fetch_properties()
+        try:
+            num_wfms_per_record = session._configure_fetch_records(0, 1)
+            self._wfm = format.open_memmap(self._path, mode='w+', dtype=dtype, shape=(num_records, num_wfms_per_record, num_samples))
+            self._wfm_info = format.open_memmap(self._index_path, mode='w+', dtype=waveform_info.get_numpy_dtype(), shape=(num_records, num_wfms_per_record))
+        except Exception:
+            self._restore_fetch_properties()
+            raise
+        self._records_written = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def path(self):
+        '''Path of the .npy file holding the samples.'''
+        return self._path
+
+    @property
+    def index_path(self):
+        '''Path of the .npy file holding the waveform information.'''
+        return self._index_path
+
+    @property
+    def num_samples(self):
+        '''Number of samples fetched for each waveform.'''
+        return self._wfm.shape[2]
+
+    @property
+    def num_records(self):
+        '''Number of records the files hold.'''
+        return self._wfm.shape[0]
+
+    @property
+    def num_wfms_per_record(self):
+        '''Number of waveforms (channels) in each record.'''
+        return self._wfm.shape[1]
+
+    @property
+    def dtype(self):
+        '''numpy.dtype of the samples.'''
+        return self._wfm.dtype
+
+    @property
+    def records_written(self):
+        '''Number of records fetched into the files so far.'''
+        return self._records_written
+
+    def record_next(self, timeout=datetime.timedelta(seconds=5.0)):
+        '''record_next
+
+        Fetches the next records_per_fetch records, or fewer for the last fetch, into the files.
+
+        Args:
+            timeout (datetime.timedelta): The time to wait for the records to be acquired.
+
+        Returns:
+            num_records (int): The number of records fetched, 0 once all records have been written.
+        '''
+        import numpy
+
+        record_number = self._records_written
+        num_records = min(self._records_per_fetch, self.num_records - record_number)
+        if num_records == 0:
+            return 0
+        num_wfms = self._session._configure_fetch_records(record_number, num_records)
+        if num_wfms != num_records * self.num_wfms_per_record:
+            raise ValueError('The number of waveforms changed while recording. Is {0}, expected {1}'.format(num_wfms, num_records * self.num_wfms_per_record))
+        # Record-major like the driver, so a range of records is contiguous in both files
+        wfm = self._wfm[record_number:record_number + num_records].reshape(-1).view(numpy.ndarray)
+        wfm_info = (waveform_info.struct_niScope_wfmInfo * num_wfms).from_buffer(self._wfm_info[record_number:record_number + num_records])
+        self._session._fetch_into_buffers(self.num_samples, wfm, wfm_info, timeout)
+        self._records_written += num_records
+        return num_records
+
+    def record(self, timeout=datetime.timedelta(seconds=5.0)):
+        '''record
+
+        Fetches all remaining records into the files and flushes them.
+
+        Args:
+            timeout (datetime.timedelta): The time to wait for each fetch of records_per_fetch records.
+        '''
+        while self.record_next(timeout) > 0:
+            pass
+        self.flush()
+
+    def flush(self):
+        '''Writes modified pages of both files to disk.'''
+        self._wfm.flush()
+        self._wfm_info.flush()
+
+    def close(self):
+        '''Flushes and unmaps both files and sets the fetch properties of the session back. The recorder cannot be used afterwards.'''
+        if self._wfm is not None:
+            self.flush()
+            self._wfm = None
+            self._wfm_info = None
+            self._restore_fetch_properties()
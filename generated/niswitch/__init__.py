@@ -4,5 +4,6 @@
 from niswitch.enums import *          # noqa: F403,F401,H303
 from niswitch.errors import Error     # noqa: F401
 from niswitch.errors import NiswitchWarning   # noqa: F401
+from niswitch.errors import WarningPolicy   # noqa: F401
 from niswitch.session import Session  # noqa: F401
 
@@ -44,3 +44,9 @@ attributes_remove_enum = {
     1150015: { 'enum': None, 'python_type': 'bool', },  # VOLTAGE_LEVEL_AUTORANGE, Don't use the enum because a bool will do
     1150018: { 'enum': None, 'python_type': 'bool', },  # CURRENT_LIMIT_AUTORANGE, Don't use the enum because a bool will do
 }
+
+# Properties that change without a call into the driver must never be served from the session attribute cache
+attributes_cacheable = {
+    1150056: { 'cacheable': False, },  # FETCH_BACKLOG
+}
+
@@ -27,5 +27,6 @@ config = {
     'repeated_capabilities': [
         {'python_name': 'channels', 'prefix': '', },
     ],
+    'example_property_values': [('voltage_level', '1.0'), ('current_limit', '0.01'), ],
 }
 
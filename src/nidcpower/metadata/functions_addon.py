@@ -74,8 +74,8 @@ functions_buffer_info = {
     'FetchMultiple':                { 'parameters': { 4: { 'size': {'mechanism':'passed-in', 'value':'Count'}, },
                                                       5: { 'size': {'mechanism':'passed-in', 'value':'Count'}, },
                                                       6: { 'size': {'mechanism':'passed-in', 'value':'Count'}, }, }, },
-    'MeasureMultiple':              { 'parameters': { 2: { 'size': {'mechanism':'python-code', 'value':'self._parse_channel_count()'}, },
-                                                      3: { 'size': {'mechanism':'python-code', 'value':'self._parse_channel_count()'}, }, }, }
+    'MeasureMultiple':              { 'parameters': { 2: { 'size': {'mechanism':'python-code', 'value':'channel_count'}, },
+                                                      3: { 'size': {'mechanism':'python-code', 'value':'channel_count'}, }, }, }
 }
 
 # These are functions we mark as "error_handling":True. The generator uses this information to
@@ -150,6 +150,7 @@ functions_additional_functions = {
     # Public function that wraps driver function but returns datetime object instead of individual items
     'GetLastExtCalLastDateAndTime': {
         'codegen_method': 'public',
+        'render_in_library': False,  # Implemented in Python only
         'returns': 'ViStatus',
         'python_name': 'get_ext_cal_last_date_and_time',
         'real_datetime_call': 'GetExtCalLastDateAndTime',
@@ -180,6 +181,7 @@ functions_additional_functions = {
     },
     'GetLastSelfCalLastDateAndTime': {
         'codegen_method': 'public',
+        'render_in_library': False,  # Implemented in Python only
         'returns': 'ViStatus',
         'python_name': 'get_self_cal_last_date_and_time',
         'real_datetime_call': 'GetSelfCalLastDateAndTime',
@@ -210,6 +212,254 @@ functions_additional_functions = {
             'note': 'This function is not supported on all devices.',
         },
     },
+    'FetchPipeline': {
+        'codegen_method': 'public',
+        'render_in_library': False,  # Implemented in Python only
+        'returns': 'ViStatus',
+        'parameters': [
+            {
+                'direction': 'in',
+                'name': 'vi',
+                'type': 'ViSession',
+                'documentation': {
+                    'description': 'Identifies a particular instrument session. **vi** is obtained from the niDCPower_InitializeWithChannels function.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'channelName',
+                'type': 'ViChar[]',
+                'documentation': {
+                    'description': 'Specifies the output channel(s) to fetch measurements from.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'count',
+                'type': 'ViInt32',
+                'documentation': {
+                    'description': 'The maximum number of measurements in each item. Fewer are returned when the fetch completes with fewer measurements available.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'numBuffers',
+                'type': 'ViInt32',
+                'default_value': 4,
+                'documentation': {
+                    'description': 'The number of preallocated buffers, which bounds the number of items fetched ahead of the consumer.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'dropWhenFull',
+                'type': 'ViBoolean',
+                'default_value': False,
+                'documentation': {
+                    'description': 'What the background thread does when all buffers hold items that have not been consumed. If False, it waits for the consumer. If True, it reuses the buffer of the oldest waiting item so that the driver keeps being drained, and counts the item in **dropped_count**.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'Timeout',
+                'type': 'ViReal64',
+                'python_type': 'datetime.timedelta',
+                'default_value': 'datetime.timedelta(seconds=1.0)',
+                'documentation': {
+                    'description': 'The maximum time allowed for each fetch to complete. A fetch that times out ends the pipeline with the error.',
+                },
+            },
+            {
+                'direction': 'out',
+                'name': 'pipeline',
+                'type': 'ViSession',  # Type doesn't really matter for this function
+                'python_type': 'nidcpower.pipeline.AcquisitionPipeline',
+                'documentation': {
+                    'description': '''
+                        Iterable of (voltage_measurements, current_measurements, in_compliance) tuples of numpy arrays of float64, float64 and bool.
+                        The arrays stay valid until the next item is requested. It also has **fetched_count**, **dropped_count**, **consumed_count**
+                        and **backlog** (items waiting) properties, and **abort()**, which stops the background thread and is called when leaving a with block.
+
+                        Example:
+
+                        .. code-block:: python
+
+                            with session.initiate():
+                                with session.channels['0'].fetch_pipeline(count=1000) as pipeline:
+                                    for voltage_measurements, current_measurements, in_compliance in pipeline:
+                                        process(voltage_measurements, current_measurements)''',
+                },
+            },
+        ],
+        'documentation': {
+            'description': '''
+                Fetches measurements of an initiated session on a background thread into a bounded set of
+                preallocated buffers, until abort() is called or a fetch fails. The calling thread processes
+                earlier measurements while the next ones are fetched. Errors raised by the fetch are raised
+                again when iterating.''',
+        },
+    },
+    'StreamMeasurements': {
+        'codegen_method': 'public',
+        'render_in_library': False,  # Implemented in Python only
+        'returns': 'ViStatus',
+        'parameters': [
+            {
+                'direction': 'in',
+                'name': 'vi',
+                'type': 'ViSession',
+                'documentation': {
+                    'description': 'Identifies a particular instrument session. **vi** is obtained from the niDCPower_InitializeWithChannels function.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'channelName',
+                'type': 'ViChar[]',
+                'documentation': {
+                    'description': 'Specifies the output channel to fetch measurements from.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'chunk',
+                'type': 'ViInt32',
+                'default_value': 1000,
+                'documentation': {
+                    'description': 'The maximum number of measurements in each item. Fewer are returned when fewer have been acquired or are left to fetch.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'count',
+                'type': 'ViInt32',
+                'default_value': None,
+                'documentation': {
+                    'description': '''
+                        The total number of measurements to fetch. When None, the measurements of one measure record are fetched if
+                        measure_record_length_is_finite is True, and measurements are fetched until the generator is closed otherwise.
+                        For sequences, pass the number of measure records times measure_record_length.''',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'numBuffers',
+                'type': 'ViInt32',
+                'default_value': 4,
+                'documentation': {
+                    'description': 'The number of preallocated buffers the measurements are fetched into. The arrays of an item stay valid until **num_buffers** more items have been fetched.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'Timeout',
+                'type': 'ViReal64',
+                'python_type': 'datetime.timedelta',
+                'default_value': 'datetime.timedelta(seconds=1.0)',
+                'documentation': {
+                    'description': 'The maximum time to wait for a measurement when none have been acquired yet.',
+                },
+            },
+            {
+                'direction': 'out',
+                'name': 'measurements',
+                'type': 'ViSession',  # Type doesn't really matter for this function
+                'python_type': 'generator',
+                'documentation': {
+                    'description': '''
+                        Generator of (voltage_measurements, current_measurements, in_compliance, timestamps) tuples of numpy arrays of
+                        float64, float64, bool and float64. **timestamps** is the time of each measurement in seconds, relative to the first
+                        measurement fetched, computed from measure_record_delta_time.
+
+                        Example:
+
+                        .. code-block:: python
+
+                            with session.initiate():
+                                for voltage_measurements, current_measurements, in_compliance, timestamps in session.channels['0'].stream_measurements(chunk=1000):
+                                    process(timestamps, voltage_measurements)''',
+                },
+            },
+        ],
+        'documentation': {
+            'description': '''
+                Fetches the measurements of an initiated session in chunks of what has been acquired. Before each fetch, the
+                generator reads fetch_backlog and fetches what is available, up to **chunk** measurements, into reusable
+                buffers. When nothing has been acquired yet, it waits up to **timeout** for a single measurement, so a slow
+                acquisition does not time out waiting for a full chunk. Reading what is ready as it is acquired keeps long
+                acquisitions from overflowing measure_buffer_size.''',
+        },
+    },
+    'LoadAdvancedSequence': {
+        'codegen_method': 'public',
+        'render_in_library': False,  # Implemented in Python only
+        'returns': 'ViStatus',
+        'parameters': [
+            {
+                'direction': 'in',
+                'name': 'vi',
+                'type': 'ViSession',
+                'documentation': {
+                    'description': 'Identifies a particular instrument session. **vi** is obtained from the niDCPower_InitializeWithChannels function.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'channelName',
+                'type': 'ViChar[]',
+                'documentation': {
+                    'description': 'Specifies the output channel(s) the property values of the steps are set for.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'sequenceName',
+                'type': 'ViConstString',
+                'documentation': {
+                    'description': 'Specifies the name of the sequence to create.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'values',
+                'type': 'ViInt32',  # Type doesn't really matter for this function
+                'python_type': 'dict',
+                'documentation': {
+                    'description': '''
+                        Maps each property of the sequence, given by name or by attribute ID, to a column with its value for every step.
+                        Columns can be numpy arrays, array.array or any other sequence, and must all have the same length, which is the
+                        number of steps. Columns of enum, datetime.timedelta and string properties hold enum values, datetime.timedelta
+                        objects and strings.
+
+                        Example:
+
+                        .. code-block:: python
+
+                            session.load_advanced_sequence('sweep', {
+                                'output_function': [nidcpower.OutputFunction.DC_VOLTAGE] * 2000,
+                                'voltage_level': numpy.linspace(0.0, 2.0, 2000),
+                            })''',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'setAsActiveSequence',
+                'type': 'ViBoolean',
+                'default_value': True,
+                'documentation': {
+                    'description': 'Specifies that this sequence is active.',
+                },
+            },
+        ],
+        'documentation': {
+            'description': '''
+                Creates an advanced sequence with one step per row of **values**, like calling create_advanced_sequence, then
+                create_advanced_sequence_step and setting the properties for each step. All names and columns are checked and
+                converted, with vectorized numpy operations where possible, before anything is sent to the driver. The steps are
+                then created in a single loop that passes the encoded channel string and converted values straight to the driver.
+                If the driver returns an error, the steps after the failing one are not created.''',
+        },
+    },
 }
 
 # Converted parameters
@@ -222,4 +472,70 @@ functions_converters = {
                                                                'python_type': 'dict', }, }, },
 }
 
+# Functions that block until the driver completes an operation (fetch, read, wait, self-calibration).
+# Their documentation describes how they behave when called from multiple threads.
+functions_blocking = {
+    'FetchMultiple':   { 'blocking': True, },
+    'Measure':         { 'blocking': True, },
+    'MeasureMultiple': { 'blocking': True, },
+    'WaitForEvent':    { 'blocking': True, },
+    'self_test':       { 'blocking': True, },
+}
+
+# Functions that can change property values in the driver. Calling them clears the session attribute cache.
+functions_invalidates_attribute_cache = {
+    'reset':                      { 'invalidates_attribute_cache': True, },
+    'ResetDevice':                { 'invalidates_attribute_cache': True, },
+    'ResetWithDefaults':          { 'invalidates_attribute_cache': True, },
+    'Commit':                     { 'invalidates_attribute_cache': True, },
+    'Initiate':                   { 'invalidates_attribute_cache': True, },
+    'Disable':                    { 'invalidates_attribute_cache': True, },
+    'self_test':                  { 'invalidates_attribute_cache': True, },
+    'Configure.+':                { 'invalidates_attribute_cache': True, },  # All Configure functions set properties
+    'SetAttributeVi.+':           { 'invalidates_attribute_cache': True, },
+    'CreateAdvancedSequence':     { 'invalidates_attribute_cache': True, },
+    'CreateAdvancedSequenceStep': { 'invalidates_attribute_cache': True, },
+    'DeleteAdvancedSequence':     { 'invalidates_attribute_cache': True, },
+    'SetSequence':                { 'invalidates_attribute_cache': True, },
+    'ExportSignal':               { 'invalidates_attribute_cache': True, },
+}
+
+functions_method_templates = {
+    'FetchPipeline':                                 { 'method_templates': [
+        { 'session_filename': 'fetch_pipeline', 'documentation_filename': 'default_method', 'method_python_name_suffix': '', },
+    ], },
+    'LoadAdvancedSequence':                          { 'method_templates': [
+        { 'session_filename': 'load_advanced_sequence', 'documentation_filename': 'default_method', 'method_python_name_suffix': '', },
+    ], },
+    'StreamMeasurements':                            { 'method_templates': [
+        { 'session_filename': 'stream_measurements', 'documentation_filename': 'default_method', 'method_python_name_suffix': '', },
+    ], },
+    'ParseChannelCount':                             { 'method_templates': [
+        { 'session_filename': 'default_method', 'documentation_filename': 'default_method', 'method_python_name_suffix': '', },
+        { 'session_filename': 'memoized_method', 'method_python_name_suffix': '_memoized', },
+    ], },
+    'MeasureMultiple':                               { 'method_templates': [
+        { 'session_filename': 'default_method', 'documentation_filename': 'default_method', 'method_python_name_suffix': '', },
+        { 'session_filename': 'numpy_read_method', 'documentation_filename': 'numpy_method', 'method_python_name_suffix': '_into', },
+    ], },
+    'FetchMultiple':                                 { 'method_templates': [
+        { 'session_filename': 'default_method', 'documentation_filename': 'default_method', 'method_python_name_suffix': '', },
+        { 'session_filename': 'numpy_read_method', 'documentation_filename': 'numpy_method', 'method_python_name_suffix': '_into', },
+    ], },
+}
+
+# Parameters that can be passed as numpy.ndarray in the numpy-based methods
+functions_numpy = {
+    'FetchMultiple':                                 { 'parameters': { 4: { 'numpy': True, },
+                                                                       5: { 'numpy': True, },
+                                                                       6: { 'numpy': True, },
+                                                                       7: { 'numpy_into_return': True, }, }, },
+    'MeasureMultiple':                               { 'parameters': { 2: { 'numpy': True, },
+                                                                       3: { 'numpy': True, }, }, },
+}
 
+# The channel string of a repeated capability object does not change, so its number of channels is only queried
+# the first time and used to size the buffers of every later call.
+functions_python_code_variables = {
+    'MeasureMultiple':                               { 'python_code_variables': [('channel_count', 'self._parse_channel_count_memoized()'), ], },
+}
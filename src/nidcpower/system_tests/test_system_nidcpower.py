@@ -1,5 +1,7 @@
+import array
 import datetime
 import nidcpower
+import numpy
 import pytest
 
 
@@ -154,6 +156,54 @@ def test_fetch_multiple(single_channel_session):
         assert current_measurements[1] == 0.00001
 
 
+def test_fetch_multiple_into(single_channel_session):
+    single_channel_session.source_mode = nidcpower.SourceMode.SINGLE_POINT
+    single_channel_session.configure_aperture_time(0, nidcpower.ApertureTimeUnits.SECONDS)
+    single_channel_session.voltage_level = 1
+    count = 10
+    voltage_measurements = numpy.zeros(count, dtype=numpy.float64)
+    current_measurements = numpy.zeros(count, dtype=numpy.float64)
+    in_compliance = numpy.zeros(count, dtype=numpy.bool_)
+    single_channel_session.measure_when = nidcpower.MeasureWhen.AUTOMATICALLY_AFTER_SOURCE_COMPLETE
+    with single_channel_session.initiate():
+        actual_count = single_channel_session.fetch_multiple_into(voltage_measurements, current_measurements, in_compliance)
+        assert actual_count == count
+        assert voltage_measurements[1] == 1.0
+        assert current_measurements[1] == 0.00001
+
+
+def test_fetch_pipeline(single_channel_session):
+    single_channel_session.source_mode = nidcpower.SourceMode.SINGLE_POINT
+    single_channel_session.configure_aperture_time(0, nidcpower.ApertureTimeUnits.SECONDS)
+    single_channel_session.voltage_level = 1
+    count = 10
+    single_channel_session.measure_when = nidcpower.MeasureWhen.AUTOMATICALLY_AFTER_SOURCE_COMPLETE
+    with single_channel_session.initiate():
+        with single_channel_session.fetch_pipeline(count) as pipeline:
+            voltage_measurements, current_measurements, in_compliance = next(pipeline)
+        assert len(voltage_measurements) == len(current_measurements) == len(in_compliance) == count
+        assert voltage_measurements[1] == 1.0
+        assert current_measurements[1] == 0.00001
+        assert pipeline.consumed_count == 1
+
+
+def test_stream_measurements(single_channel_session):
+    single_channel_session.source_mode = nidcpower.SourceMode.SINGLE_POINT
+    single_channel_session.configure_aperture_time(0, nidcpower.ApertureTimeUnits.SECONDS)
+    single_channel_session.voltage_level = 1
+    single_channel_session.measure_when = nidcpower.MeasureWhen.AUTOMATICALLY_AFTER_SOURCE_COMPLETE
+    single_channel_session.measure_record_length = 25
+    with single_channel_session.initiate():
+        fetched = 0
+        for voltage_measurements, current_measurements, in_compliance, timestamps in single_channel_session.stream_measurements(chunk=10):
+            assert 0 < len(voltage_measurements) <= 10
+            assert len(voltage_measurements) == len(current_measurements) == len(in_compliance) == len(timestamps)
+            assert voltage_measurements[0] == 1.0
+            fetched += len(voltage_measurements)
+        assert fetched == 25
+        assert timestamps[-1] == pytest.approx(24 * single_channel_session.measure_record_delta_time.total_seconds())
+
+
 def test_measure_multiple(session):
     with session.initiate():
         # session is open to all 12 channels on the device
@@ -164,6 +214,15 @@ def test_measure_multiple(session):
         assert len(voltage_measurements) == len(current_measurements) == 4
 
 
+def test_measure_multiple_into(session):
+    voltage_measurements = numpy.zeros(4, dtype=numpy.float64)
+    current_measurements = numpy.zeros(4, dtype=numpy.float64)
+    with session.initiate():
+        session.channels[range(4)].measure_multiple_into(voltage_measurements, current_measurements)
+        with pytest.raises(ValueError):
+            session.measure_multiple_into(voltage_measurements, current_measurements)
+
+
 def test_query_max_current_limit(single_channel_session):
     max_current_limit = single_channel_session.query_max_current_limit(6)
     expected_max_current_limit = 0.06  # for a simulated 4162 max current limit should be 0.06 for 6V Voltage level
@@ -208,6 +267,10 @@ def test_set_sequence_with_source_delays(single_channel_session):
     single_channel_session.set_sequence([0.1, 0.2, 0.3], [0.001, 0.002, 0.003])
 
 
+def test_set_sequence_numpy_and_array(single_channel_session):
+    single_channel_session.set_sequence(values=numpy.array([0.1, 0.2, 0.3]), source_delays=array.array('d', [0.001, 0.002, 0.003]))
+
+
 # TODO(marcoskirsch): Should raise because arrays are different size. See issue #515
 def test_set_sequence_with_too_many_source_delays(single_channel_session):
     single_channel_session.set_sequence([0.1, 0.2, 0.3], [0.001, 0.002, 0.003, 0.004])
@@ -284,6 +347,26 @@ def test_create_and_delete_advanced_sequence_step(single_channel_session):
     single_channel_session.delete_advanced_sequence(sequence_name='my_sequence')
 
 
+def test_load_advanced_sequence(single_channel_session):
+    steps = 100
+    single_channel_session.source_mode = nidcpower.SourceMode.SEQUENCE
+    single_channel_session.load_advanced_sequence('my_sequence', {
+        'output_function': [nidcpower.OutputFunction.DC_VOLTAGE] * steps,
+        'voltage_level': numpy.linspace(0.0, 1.0, steps),
+    })
+    assert single_channel_session.active_advanced_sequence == 'my_sequence'
+    assert single_channel_session.active_advanced_sequence_step == steps - 1
+    assert single_channel_session.voltage_level == 1.0
+    single_channel_session.delete_advanced_sequence(sequence_name='my_sequence')
+
+
+def test_load_advanced_sequence_invalid_values(single_channel_session):
+    with pytest.raises(TypeError):
+        single_channel_session.load_advanced_sequence('my_sequence', {'voltage_level': numpy.linspace(0.0, 1.0, 10), 'output_function': [1] * 10})
+    with pytest.raises(ValueError):
+        single_channel_session.load_advanced_sequence('my_sequence', {'voltage_level': [0.0, 1.0], 'current_level': [0.0]})
+
+
 def test_send_software_edge_trigger_error(session):
     try:
         session.send_software_edge_trigger()
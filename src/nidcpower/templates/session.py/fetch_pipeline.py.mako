@@ -0,0 +1,26 @@
+<%page args="f, config, method_template"/>\
+<%
+    '''Creates an AcquisitionPipeline that fetches measurements on a background thread.'''
+    import build.helper as helper
+
+    suffix = method_template['method_python_name_suffix']
+%>\
+    def ${f['python_name']}${suffix}(${helper.get_params_snippet(f, helper.ParameterUsageOptions.SESSION_METHOD_DECLARATION)}):
+        '''${f['python_name']}
+
+        ${helper.get_function_docstring(f, False, config, indent=8)}
+        '''
+        import numpy
+        from nidcpower import pipeline
+
+        if count < 1:
+            raise ValueError('count must be at least 1, was {0}'.format(count))
+        buffers = [(numpy.zeros(count, dtype=numpy.float64), numpy.zeros(count, dtype=numpy.float64), numpy.zeros(count, dtype=numpy.bool_)) for _ in range(num_buffers)]
+
+        def fetch(buffer):
+            # Runs on the producer thread
+            voltage_measurements, current_measurements, in_compliance = buffer
+            actual_count = self.fetch_multiple_into(voltage_measurements, current_measurements, in_compliance, timeout)
+            return voltage_measurements[:actual_count], current_measurements[:actual_count], in_compliance[:actual_count]
+        return pipeline.AcquisitionPipeline(fetch, buffers, drop_when_full)
+
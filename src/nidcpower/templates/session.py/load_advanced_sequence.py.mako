@@ -0,0 +1,79 @@
+<%page args="f, config, method_template"/>\
+<%
+    '''Creates an advanced sequence and all its steps from columns of property values.'''
+    import build.helper as helper
+
+    c_function_prefix = config['c_function_prefix']
+    suffix = method_template['method_python_name_suffix']
+%>\
+    def ${f['python_name']}${suffix}(${helper.get_params_snippet(f, helper.ParameterUsageOptions.SESSION_METHOD_DECLARATION)}):
+        '''${f['python_name']}
+
+        ${helper.get_function_docstring(f, False, config, indent=8)}
+        '''
+        import numpy
+
+        attributes_by_id = None
+        columns = []
+        invalid = []
+        for key, column in values.items():
+            if isinstance(key, six.string_types):
+                [(name, attribute)] = self._find_attributes([key])
+            else:
+                if attributes_by_id is None:
+                    attributes_by_id = dict((a._attribute_id, (n, a)) for n, a in _SessionBase.__dict__.items() if isinstance(a, (attributes.Attribute, attributes.AttributeEnum)))
+                if key not in attributes_by_id:
+                    raise ValueError('{0} is not the attribute ID of a property'.format(key))
+                name, attribute = attributes_by_id[key]
+            column = numpy.asarray(column)
+            if column.ndim != 1:
+                raise ValueError('The column for {0} must be one-dimensional'.format(name))
+            try:
+                if attribute._numpy_type is None or column.dtype == object:
+                    # enum, datetime.timedelta and string properties are converted one value at a time
+                    driver_values = [attribute._to_driver(v) for v in column.tolist()]
+                else:
+                    dtype = numpy.dtype(attribute._numpy_type)
+                    if not numpy.can_cast(column.dtype, dtype, casting='same_kind'):
+                        raise TypeError('must be numpy.{0} compatible, is {1}'.format(dtype, column.dtype))
+                    converted = column.astype(dtype)
+                    if dtype.kind in 'iu' and numpy.any(converted != column):
+                        raise ValueError('values out of range for {0}'.format(dtype))
+                    driver_values = converted.tolist()
+                # Every value is converted to its ctype before the first step is created
+                if attribute._vi_type == 'ViString':
+                    value_ctypes = [ctypes.create_string_buffer(v.encode(self._encoding)) for v in driver_values]
+                else:
+                    value_type = getattr(visatype, attribute._vi_type)
+                    value_ctypes = [value_type(v) for v in driver_values]
+            except (AttributeError, TypeError, ValueError) as e:
+                invalid.append('{0}: {1}'.format(name, e))
+                continue
+            columns.append((name, attribute, value_ctypes))
+        if invalid:
+            raise TypeError('Invalid property values: ' + '; '.join(invalid))
+        num_steps = len(columns[0][2]) if columns else 0
+        if num_steps == 0 or any(len(value_ctypes) != num_steps for _, _, value_ctypes in columns):
+            raise ValueError('The columns must all have the same length, which must be at least 1: ' + ', '.join('{0}={1}'.format(name, len(value_ctypes)) for name, _, value_ctypes in columns))
+
+        vi_ctype = visatype.ViSession(self._vi)
+        channel_name_ctype = self._repeated_capability_ctype
+        sequence_name_ctype = ctypes.create_string_buffer(sequence_name.encode(self._encoding))
+        attribute_ids_ctype = get_ctypes_pointer_for_buffer(value=[attribute._attribute_id for _, attribute, _ in columns], library_type=visatype.ViInt32)
+        set_calls = [(getattr(self._library, '${c_function_prefix}SetAttribute' + attribute._vi_type), visatype.ViAttr(attribute._attribute_id), value_ctypes) for _, attribute, value_ctypes in columns]
+        create_step = self._library.${c_function_prefix}CreateAdvancedSequenceStep
+        set_as_active_step_ctype = visatype.ViBoolean(True)
+        try:
+            error_code = self._library.${c_function_prefix}CreateAdvancedSequence(vi_ctype, sequence_name_ctype, visatype.ViInt32(len(columns)), attribute_ids_ctype, visatype.ViBoolean(set_as_active_sequence))
+            errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+            for step in range(num_steps):
+                error_code = create_step(vi_ctype, set_as_active_step_ctype)
+                if error_code != 0:
+                    errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+                for set_attribute, attribute_id_ctype, value_ctypes in set_calls:
+                    error_code = set_attribute(vi_ctype, channel_name_ctype, attribute_id_ctype, value_ctypes[step])
+                    if error_code != 0:
+                        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        finally:
+            self._attribute_cache.clear()
+
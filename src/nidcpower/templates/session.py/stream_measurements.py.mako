@@ -0,0 +1,36 @@
+<%page args="f, config, method_template"/>\
+<%
+    '''Generator that fetches the measurements of an initiated session in chunks of what has been acquired.'''
+    import build.helper as helper
+
+    suffix = method_template['method_python_name_suffix']
+%>\
+    def ${f['python_name']}${suffix}(${helper.get_params_snippet(f, helper.ParameterUsageOptions.SESSION_METHOD_DECLARATION)}):
+        '''${f['python_name']}
+
+        ${helper.get_function_docstring(f, False, config, indent=8)}
+        '''
+        import numpy
+
+        if chunk < 1:
+            raise ValueError('chunk must be at least 1, was {0}'.format(chunk))
+        if count is None and self.measure_record_length_is_finite:
+            count = self.measure_record_length
+        delta_time = self.measure_record_delta_time.total_seconds()
+        buffers = [(numpy.zeros(chunk, dtype=numpy.float64), numpy.zeros(chunk, dtype=numpy.float64), numpy.zeros(chunk, dtype=numpy.bool_), numpy.zeros(chunk, dtype=numpy.float64)) for _ in range(num_buffers)]
+        indices = numpy.arange(chunk, dtype=numpy.float64)
+
+        fetched = 0
+        item = 0
+        while count is None or fetched < count:
+            num_measurements = chunk if count is None else min(chunk, count - fetched)
+            # When nothing has been acquired yet, wait for a single measurement instead of a full chunk
+            num_measurements = min(num_measurements, max(int(self.fetch_backlog), 1))
+            voltage_measurements, current_measurements, in_compliance, timestamps = buffers[item % num_buffers]
+            actual_count = self.fetch_multiple_into(voltage_measurements[:num_measurements], current_measurements[:num_measurements], in_compliance[:num_measurements], timeout)
+            numpy.add(indices[:actual_count], fetched, out=timestamps[:actual_count])
+            numpy.multiply(timestamps[:actual_count], delta_time, out=timestamps[:actual_count])
+            fetched += actual_count
+            item += 1
+            yield voltage_measurements[:actual_count], current_measurements[:actual_count], in_compliance[:actual_count], timestamps[:actual_count]
+
@@ -46,3 +46,9 @@ attributes_remove_enum = {
     1150023: { 'enum': None, 'python_type': 'bool', },  # OFFSET_COMP_OHMS, Don't use the enum because a bool will do
 }
 
+# Properties that change without a call into the driver must never be served from the session attribute cache
+attributes_cacheable = {
+    1150044: { 'cacheable': False, },  # FREQ_VOLTAGE_AUTORANGE
+    1250331: { 'cacheable': False, },  # AUTO_RANGE_VALUE
+}
+
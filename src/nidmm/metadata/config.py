@@ -28,6 +28,7 @@ config = {
     'custom_types': [],
     'last_tested_version': '17.1.0',
     'repeated_capabilities': [],
+    'example_property_values': [('range', '10.0'), ('resolution_digits', '5.5'), ],
 }
 
 
@@ -159,6 +159,7 @@ functions_additional_functions = {
     # Public function that wraps driver function but returns datetime object instead of individual items
     'GetLastCalDateAndTime': {
         'codegen_method': 'public',
+        'render_in_library': False,  # Implemented in Python only
         'returns': 'ViStatus',
         'python_name': 'get_cal_date_and_time',
         'real_datetime_call': 'GetCalDateAndTime',
@@ -210,4 +211,28 @@ functions_array = {
     'FetchWaveform':                       { 'parameters': { 3: { 'use_array': True, }, }, },
 }
 
+# Functions that block until the driver completes an operation (fetch, read, wait, self-calibration).
+# Their documentation describes how they behave when called from multiple threads.
+functions_blocking = {
+    'Fetch':           { 'blocking': True, },
+    'FetchMultiPoint': { 'blocking': True, },
+    'FetchWaveform':   { 'blocking': True, },
+    'Read':            { 'blocking': True, },
+    'ReadMultiPoint':  { 'blocking': True, },
+    'ReadWaveform':    { 'blocking': True, },
+    'SelfCal':         { 'blocking': True, },
+    'self_test':       { 'blocking': True, },
+}
+
+# Functions that can change property values in the driver. Calling them clears the session attribute cache.
+functions_invalidates_attribute_cache = {
+    'reset':             { 'invalidates_attribute_cache': True, },
+    'ResetWithDefaults': { 'invalidates_attribute_cache': True, },
+    'Initiate':          { 'invalidates_attribute_cache': True, },
+    'Disable':           { 'invalidates_attribute_cache': True, },
+    'self_test':         { 'invalidates_attribute_cache': True, },
+    'SelfCal':           { 'invalidates_attribute_cache': True, },
+    'Configure.+':       { 'invalidates_attribute_cache': True, },  # All Configure functions set properties
+    'SetAttributeVi.+':  { 'invalidates_attribute_cache': True, },
+}
 
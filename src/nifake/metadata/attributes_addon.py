@@ -14,3 +14,8 @@ attributes_converters = {
 }
 
 
+# Exercises properties that are never served from the session attribute cache
+attributes_cacheable = {
+    1000006: { 'cacheable': False, },  # READ_WRITE_INT64
+}
+
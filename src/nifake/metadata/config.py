@@ -29,5 +29,6 @@ config = {
     'repeated_capabilities': [
         {'python_name': 'channels', 'prefix': '', },
     ],
+    'example_property_values': [('read_write_bool', 'True'), ('read_write_double', '1.5'), ],
 }
 
@@ -120,6 +120,7 @@ functions_array = {
 functions_additional_functions = {
     'GetLastCalDateAndTime': {
         'codegen_method': 'public',
+        'render_in_library': False,  # Implemented in Python only
         'returns': 'ViStatus',
         'python_name': 'get_cal_date_and_time',
         'real_datetime_call': 'GetCalDateAndTime',
@@ -158,4 +159,16 @@ functions_additional_functions = {
     },
 }
 
+# Functions that block until the driver completes an operation (fetch, read, wait, self-calibration).
+# Their documentation describes how they behave when called from multiple threads.
+functions_blocking = {
+    'FetchWaveform':   { 'blocking': True, },
+    'Read':            { 'blocking': True, },
+    'ReadFromChannel': { 'blocking': True, },
+}
+
+# Functions that can change property values in the driver. Calling them clears the session attribute cache.
+functions_invalidates_attribute_cache = {
+    'SetAttributeVi.+': { 'invalidates_attribute_cache': True, },
+}
 
@@ -0,0 +1,128 @@
+import concurrent.futures
+import datetime
+import matchers
+import mock_helper
+import pytest
+import threading
+
+from mock import patch
+
+asyncio = pytest.importorskip('asyncio')
+aio = pytest.importorskip('nifake.aio')
+
+
+SESSION_NUM_FOR_TEST = 42
+
+
+class TestAioSession(object):
+
+    def setup_method(self, method):
+        self.patched_library_patcher = patch('nifake.library.Library', autospec=True)
+        self.patched_library = self.patched_library_patcher.start()
+        self.patched_library_singleton_get = patch('nifake.session.library_singleton.get', return_value=self.patched_library)
+        self.patched_library_singleton_get.start()
+
+        self.side_effects_helper = mock_helper.SideEffectsHelper()
+        self.side_effects_helper.set_side_effects_and_return_values(self.patched_library)
+        self.patched_library.niFake_InitWithOptions.side_effect = self.side_effects_helper.niFake_InitWithOptions
+        self.patched_library.niFake_close.side_effect = self.side_effects_helper.niFake_close
+
+        self.side_effects_helper['InitWithOptions']['vi'] = SESSION_NUM_FOR_TEST
+
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def teardown_method(self, method):
+        asyncio.set_event_loop(None)
+        self.loop.close()
+        self.patched_library_singleton_get.stop()
+        self.patched_library_patcher.stop()
+
+    def test_open_and_close(self):
+        session = aio.Session('dev1')
+        self.patched_library.niFake_InitWithOptions.assert_called_once_with(matchers.ViStringMatcher('dev1'), matchers.ViBooleanMatcher(False), matchers.ViBooleanMatcher(False), matchers.ViStringMatcher(''), matchers.ViSessionPointerMatcher())
+        self.loop.run_until_complete(session.close())
+        self.patched_library.niFake_close.assert_called_once_with(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST))
+
+    def test_async_context_manager(self):
+        session = aio.Session('dev1')
+        assert self.loop.run_until_complete(session.__aenter__()) is session
+        self.loop.run_until_complete(session.__aexit__(None, None, None))
+        self.patched_library.niFake_close.assert_called_once_with(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST))
+
+    def test_blocking_method_runs_on_session_worker_thread(self):
+        test_reading = 5
+        calling_threads = []
+
+        def side_effect(vi, maximum_time, reading):
+            calling_threads.append(threading.current_thread())
+            return self.side_effects_helper.niFake_Read(vi, maximum_time, reading)
+        self.patched_library.niFake_Read.side_effect = side_effect
+        self.side_effects_helper['Read']['reading'] = test_reading
+        session = aio.Session('dev1')
+        assert self.loop.run_until_complete(session.read(datetime.timedelta(milliseconds=100))) == test_reading
+        self.loop.run_until_complete(session.close())
+        assert len(calling_threads) == 1
+        assert calling_threads[0] is not threading.current_thread()
+        self.patched_library.niFake_Read.assert_called_once_with(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViReal64Matcher(0.1), matchers.ViReal64PointerMatcher())
+
+    def test_repeated_capability_method(self):
+        test_reading = 5
+        self.patched_library.niFake_ReadFromChannel.side_effect = self.side_effects_helper.niFake_ReadFromChannel
+        self.side_effects_helper['ReadFromChannel']['reading'] = test_reading
+        session = aio.Session('dev1')
+        assert self.loop.run_until_complete(session.channels['3'].read_from_channel(datetime.timedelta(milliseconds=10))) == test_reading
+        self.loop.run_until_complete(session.close())
+        self.patched_library.niFake_ReadFromChannel.assert_called_once_with(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViStringMatcher('3'), matchers.ViInt32Matcher(10000), matchers.ViReal64PointerMatcher())
+
+    def test_cancel_pending_call(self):
+        driver_call_started = threading.Event()
+        release_driver_call = threading.Event()
+
+        def side_effect(vi):
+            driver_call_started.set()
+            release_driver_call.wait()
+            return 0
+        self.patched_library.niFake_PoorlyNamedSimpleFunction.side_effect = side_effect
+        self.patched_library.niFake_Read.side_effect = self.side_effects_helper.niFake_Read
+        session = aio.Session('dev1')
+        running = session.run_in_executor(session.simple_function)
+        driver_call_started.wait()
+        pending = session.read(datetime.timedelta(milliseconds=100))
+        pending.cancel()
+        # Let the event loop propagate the cancellation to the executor before the worker thread is free
+        self.loop.run_until_complete(asyncio.sleep(0))
+        release_driver_call.set()
+        self.loop.run_until_complete(running)
+        self.loop.run_until_complete(session.close())
+        assert pending.cancelled()
+        assert self.patched_library.niFake_Read.call_count == 0
+
+    def test_custom_executor(self):
+        self.patched_library.niFake_PoorlyNamedSimpleFunction.side_effect = self.side_effects_helper.niFake_PoorlyNamedSimpleFunction
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        session = aio.Session('dev1', executor=executor)
+        self.loop.run_until_complete(session.run_in_executor(session.simple_function))
+        self.loop.run_until_complete(session.close())
+        executor.shutdown()
+        self.patched_library.niFake_PoorlyNamedSimpleFunction.assert_called_once_with(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST))
+
+    def test_properties_forwarded_to_session(self):
+        self.patched_library.niFake_GetAttributeViBoolean.side_effect = self.side_effects_helper.niFake_GetAttributeViBoolean
+        self.patched_library.niFake_SetAttributeViBoolean.side_effect = self.side_effects_helper.niFake_SetAttributeViBoolean
+        self.side_effects_helper['GetAttributeViBoolean']['attributeValue'] = 1
+        session = aio.Session('dev1')
+        assert session.read_write_bool
+        session.read_write_bool = False
+        self.loop.run_until_complete(session.close())
+        self.patched_library.niFake_GetAttributeViBoolean.assert_called_once_with(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViStringMatcher(''), matchers.ViInt32Matcher(1000000), matchers.ViBooleanPointerMatcher())
+        self.patched_library.niFake_SetAttributeViBoolean.assert_called_once_with(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViStringMatcher(''), matchers.ViInt32Matcher(1000000), matchers.ViBooleanMatcher(False))
+
+    def test_set_nonexistent_property_error(self):
+        session = aio.Session('dev1')
+        try:
+            session.non_existent_property = 5
+            assert False
+        except AttributeError:
+            pass
+        self.loop.run_until_complete(session.close())
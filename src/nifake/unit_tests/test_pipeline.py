@@ -0,0 +1,154 @@
+import pytest
+import threading
+import time
+
+from nifake import pipeline
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline, 'Timed out waiting for the producer thread'
+        time.sleep(0.001)
+
+
+class _Fetcher(object):
+    '''fetch(buffer) for the pipeline: writes the number of the item into the buffer and returns (number, buffer)
+
+    It ends the pipeline after num_items items, or raises error when it gets to item error_at.
+    '''
+
+    def __init__(self, num_items, error_at=None, error=None):
+        self.num_items = num_items
+        self.error_at = error_at
+        self.error = error
+        self.call_count = 0
+
+    def __call__(self, buffer):
+        number = self.call_count
+        self.call_count += 1
+        if number == self.error_at:
+            raise self.error
+        if number >= self.num_items:
+            return None
+        buffer[0] = number
+        return number, buffer
+
+
+class TestAcquisitionPipeline(object):
+
+    def test_items_are_returned_in_order(self):
+        fetcher = _Fetcher(5)
+        stopped = threading.Event()
+        with pipeline.AcquisitionPipeline(fetcher, [[None], [None]], on_stop=stopped.set) as p:
+            numbers = [number for number, buffer in p]
+            assert numbers == [0, 1, 2, 3, 4]
+            assert p.fetched_count == 5
+            assert p.consumed_count == 5
+            assert p.dropped_count == 0
+        assert stopped.is_set()
+
+    def test_stop_iteration_ends_pipeline(self):
+        items = iter([1, 2])
+
+        def fetch(buffer):
+            return next(items)
+        with pipeline.AcquisitionPipeline(fetch, [[None]]) as p:
+            assert list(p) == [1, 2]
+            # The end marker is left for later calls
+            with pytest.raises(StopIteration):
+                next(p)
+
+    def test_producer_waits_when_all_buffers_are_in_use(self):
+        fetcher = _Fetcher(10)
+        buffer_a = [None]
+        buffer_b = [None]
+        with pipeline.AcquisitionPipeline(fetcher, [buffer_a, buffer_b]) as p:
+            _wait_for(lambda: p.fetched_count == 2)
+            time.sleep(0.05)
+            # Both buffers hold items that have not been consumed
+            assert fetcher.call_count == 2
+            assert p.backlog == 2
+            number, buffer = next(p)
+            assert (number, buffer) == (0, buffer_a)
+            time.sleep(0.05)
+            # The buffer of the current item is only given back when the next one is requested
+            assert fetcher.call_count == 2
+            number, buffer = next(p)
+            assert (number, buffer) == (1, buffer_b)
+            _wait_for(lambda: p.fetched_count == 3)
+            # Item 0 is done, so its buffer was fetched into again
+            assert buffer_a[0] == 2
+            assert buffer_b[0] == 1
+            assert p.dropped_count == 0
+
+    def test_drop_when_full_reuses_buffer_of_oldest_item(self):
+        fetcher = _Fetcher(5)
+        stopped = threading.Event()
+        with pipeline.AcquisitionPipeline(fetcher, [[None], [None]], drop_when_full=True, on_stop=stopped.set) as p:
+            # Nothing is consumed until the producer fetched all items
+            assert stopped.wait(5.0)
+            assert p.fetched_count == 5
+            assert p.dropped_count == 3
+            assert p.backlog == 2
+            items = list(p)
+            assert [number for number, buffer in items] == [3, 4]
+            # The dropped items were overwritten, the remaining ones were not
+            assert [buffer[0] for number, buffer in items] == [3, 4]
+
+    def test_drop_when_full_keeps_oldest_item_when_pipeline_ends(self):
+        stopped = threading.Event()
+        buffers = [[None], [None]]
+        with pipeline.AcquisitionPipeline(_Fetcher(2), buffers, drop_when_full=True, on_stop=stopped.set) as p:
+            assert stopped.wait(5.0)
+            # The buffer of item 0 was taken for the fetch that ended the pipeline, and given back
+            assert p.dropped_count == 0
+            assert [number for number, buffer in p] == [0, 1]
+
+    def test_fetch_error_is_raised_by_iterator(self):
+        fetcher = _Fetcher(10, error_at=2, error=ValueError('fetch failed'))
+        stopped = threading.Event()
+        with pipeline.AcquisitionPipeline(fetcher, [[None], [None], [None]], on_stop=stopped.set) as p:
+            assert next(p)[0] == 0
+            assert next(p)[0] == 1
+            with pytest.raises(ValueError) as e:
+                next(p)
+            assert str(e.value) == 'fetch failed'
+            # The error is only raised once
+            with pytest.raises(StopIteration):
+                next(p)
+            assert fetcher.call_count == 3
+        assert stopped.is_set()
+
+    def test_on_stop_error_is_raised_by_iterator(self):
+        def on_stop():
+            raise RuntimeError('restore failed')
+        with pipeline.AcquisitionPipeline(_Fetcher(1), [[None]], on_stop=on_stop) as p:
+            assert next(p)[0] == 0
+            with pytest.raises(RuntimeError):
+                next(p)
+
+    def test_abort_while_producer_waits_for_buffer(self):
+        fetcher = _Fetcher(10)
+        stopped = threading.Event()
+        p = pipeline.AcquisitionPipeline(fetcher, [[None]], on_stop=stopped.set)
+        _wait_for(lambda: p.fetched_count == 1)
+        aborter = threading.Thread(target=p.abort)
+        aborter.start()
+        aborter.join(5.0)
+        assert not aborter.is_alive()
+        assert stopped.is_set()
+        assert fetcher.call_count == 1
+        # Items fetched before abort() can still be consumed
+        assert [number for number, buffer in p] == [0]
+
+    def test_abort_after_producer_stopped(self):
+        fetcher = _Fetcher(1)
+        with pipeline.AcquisitionPipeline(fetcher, [[None]]) as p:
+            assert list(number for number, buffer in p) == [0]
+        p.abort()
+        assert fetcher.call_count == 2
+
+    def test_no_buffers(self):
+        with pytest.raises(ValueError):
+            pipeline.AcquisitionPipeline(_Fetcher(1), [])
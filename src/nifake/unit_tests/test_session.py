@@ -1,12 +1,16 @@
 import array
+import collections
 import ctypes
 import datetime
 import matchers
 import math
+import mock
 import mock_helper
 import nifake
 import numpy
+import pickle
 import six
+import threading
 import warnings
 
 from mock import patch
@@ -53,7 +57,7 @@ class TestSession(object):
     # Session management
 
     def test_init_with_options_and_close(self):
-        errors_patcher = patch('nifake.session.errors', spec_set=['handle_error', '_is_error'])
+        errors_patcher = patch('nifake.session.errors', spec_set=['handle_error', '_is_error', '_WarningFilter', '_PendingDescriptions'])
         patched_errors = errors_patcher.start()
         patched_errors._is_error.return_value = 0
 
@@ -425,6 +429,45 @@ class TestSession(object):
                 matchers.ViInt16BufferMatcher(input_array_of_integers)
             )
 
+    def test_multiple_array_types_input_buffers_passed_by_pointer(self):
+        input_array_of_floats = numpy.array([-1.0, -2.0], dtype=numpy.float64)
+        input_array_of_integers = array.array('h', [1, 2])
+        self.patched_library.niFake_MultipleArrayTypes.side_effect = self.side_effects_helper.niFake_MultipleArrayTypes
+        self.side_effects_helper['MultipleArrayTypes']['outputArray'] = [0.2, 0.4]
+        self.side_effects_helper['MultipleArrayTypes']['outputArrayOfFixedLength'] = [-6, -7, -8]
+        with nifake.Session('dev1') as session:
+            session.multiple_array_types(2, input_array_of_floats, input_array_of_integers)
+            args, _ = self.patched_library.niFake_MultipleArrayTypes.call_args
+            assert ctypes.addressof(args[5].contents) == input_array_of_floats.ctypes.data
+            assert ctypes.addressof(args[6].contents) == input_array_of_integers.buffer_info()[0]
+
+    def test_multiple_array_types_input_buffers_converted(self):
+        # Element types other than the library type and non-contiguous arrays are copied
+        input_array_of_floats = numpy.array([-1.0, 0.0, -2.0], dtype=numpy.float32)[::2]
+        input_array_of_integers = numpy.array([1, 2], dtype=numpy.int64)
+        self.patched_library.niFake_MultipleArrayTypes.side_effect = self.side_effects_helper.niFake_MultipleArrayTypes
+        self.side_effects_helper['MultipleArrayTypes']['outputArray'] = [0.2, 0.4]
+        self.side_effects_helper['MultipleArrayTypes']['outputArrayOfFixedLength'] = [-6, -7, -8]
+        with nifake.Session('dev1') as session:
+            session.multiple_array_types(2, input_array_of_floats, input_array_of_integers)
+            self.patched_library.niFake_MultipleArrayTypes.assert_called_once_with(
+                matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST),
+                matchers.ViInt32Matcher(2),
+                matchers.ViReal64BufferMatcher(2),
+                matchers.ViReal64BufferMatcher(3),
+                matchers.ViInt32Matcher(2),
+                matchers.ViReal64BufferMatcher([-1.0, -2.0]),
+                matchers.ViInt16BufferMatcher([1, 2])
+            )
+
+    def test_multiple_array_types_input_buffer_invalid_dtype(self):
+        with nifake.Session('dev1') as session:
+            try:
+                session.multiple_array_types(2, numpy.array([-1.0, -2.0]), numpy.array([1.5, 2.5]))
+                assert False
+            except TypeError:
+                pass
+
     # TODO(marcoskirsch): One of the input arrays is optional. C function receives size for both arrays, and Python code is using the wrong one for the size. See #515
     '''
     def test_multiple_array_types_none_input(self):
@@ -680,6 +723,123 @@ class TestSession(object):
             except AttributeError:
                 pass
 
+    def test_repeated_capability_objects_are_reused(self):
+        with nifake.Session('dev1') as session:
+            assert session.channels['3'] is session.channels['3']
+            assert session.channels[3] is not session.channels['3']
+            assert session.channels[0:2] is session.channels[0:2]
+            assert session.channels[[0, 1]] is session.channels[[0, 1]]
+            assert session.channels[0:2]._repeated_capability == session.channels[[0, 1]]._repeated_capability == '0,1'
+            assert session.channels[True] is not session.channels[1]
+
+    def test_repeated_capability_not_cached_for_generators(self):
+        with nifake.Session('dev1') as session:
+            channels = session.channels[(i for i in range(2))]
+            assert channels._repeated_capability == '0,1'
+            assert channels is not session.channels[(i for i in range(2))]
+
+    def test_repeated_capability_cache_discards_least_recently_used(self):
+        with nifake.Session('dev1') as session:
+            first = session.channels['0']
+            second = session.channels['1']
+            for i in range(2, session.channels._cache_size):
+                session.channels[str(i)]
+            assert session.channels['0'] is first
+            session.channels['new']
+            assert session.channels['0'] is first
+            assert session.channels['1'] is not second
+
+    def test_repeated_capability_cache_cleared_by_close(self):
+        session = nifake.Session('dev1')
+        channel = session.channels['3']
+        session.close()
+        assert session.channels['3'] is not channel
+
+    def test_session_wide_object_shares_session_state(self):
+        with nifake.Session('dev1') as session:
+            channel = session.channels['3']
+            for session_wide in (session._session_wide(), channel._session_wide()):
+                assert session_wide._repeated_capability == ''
+                assert session_wide._attribute_cache is session._attribute_cache
+                assert session_wide._error_descriptions is session._error_descriptions
+                assert session_wide._warning_filter is session._warning_filter
+                assert session_wide._pending_descriptions is session._pending_descriptions
+
+    def test_repeated_capability_string_encoded_once(self):
+        self.patched_library.niFake_ReadFromChannel.side_effect = self.side_effects_helper.niFake_ReadFromChannel
+        self.side_effects_helper['ReadFromChannel']['reading'] = 5
+        with nifake.Session('dev1') as session:
+            channel = session.channels['3']
+            channel.read_from_channel(datetime.timedelta(milliseconds=10))
+            channel.read_from_channel(datetime.timedelta(milliseconds=10))
+        buffers = [c[0][1] for c in self.patched_library.niFake_ReadFromChannel.call_args_list]
+        assert buffers[0] is buffers[1] is channel._repeated_capability_ctype
+        assert buffers[0].value == b'3'
+
+    # Executor
+
+    def test_executor_runs_method_on_worker_thread(self):
+        test_reading = 5
+        calling_threads = []
+
+        def side_effect(vi, maximum_time, reading):
+            calling_threads.append(threading.current_thread())
+            return self.side_effects_helper.niFake_Read(vi, maximum_time, reading)
+        self.patched_library.niFake_Read.side_effect = side_effect
+        self.side_effects_helper['Read']['reading'] = test_reading
+        with nifake.Session('dev1') as session:
+            future = session.executor.read(datetime.timedelta(milliseconds=100))
+            assert future.result() == test_reading
+        assert len(calling_threads) == 1
+        assert calling_threads[0] is not threading.current_thread()
+        self.patched_library.niFake_Read.assert_called_once_with(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViReal64Matcher(0.1), matchers.ViReal64PointerMatcher())
+
+    def test_executor_submit_repeated_capability_method(self):
+        test_reading = 5
+        self.patched_library.niFake_ReadFromChannel.side_effect = self.side_effects_helper.niFake_ReadFromChannel
+        self.side_effects_helper['ReadFromChannel']['reading'] = test_reading
+        with nifake.Session('dev1') as session:
+            future = session.executor.submit(session.channels['3'].read_from_channel, datetime.timedelta(milliseconds=10))
+            assert future.result() == test_reading
+        self.patched_library.niFake_ReadFromChannel.assert_called_once_with(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViStringMatcher('3'), matchers.ViInt32Matcher(10000), matchers.ViReal64PointerMatcher())
+
+    def test_executor_errors_raised_by_future(self):
+        test_error_code = -42
+        test_error_desc = 'The answer to the ultimate question'
+        self.patched_library.niFake_PoorlyNamedSimpleFunction.side_effect = self.side_effects_helper.niFake_PoorlyNamedSimpleFunction
+        self.side_effects_helper['PoorlyNamedSimpleFunction']['return'] = test_error_code
+        self.patched_library.niFake_GetError.side_effect = self.side_effects_helper.niFake_GetError
+        self.side_effects_helper['GetError']['errorCode'] = test_error_code
+        self.side_effects_helper['GetError']['description'] = test_error_desc
+        with nifake.Session('dev1') as session:
+            future = session.executor.simple_function()
+            try:
+                future.result()
+                assert False
+            except nifake.Error as e:
+                assert e.code == test_error_code
+                assert e.description == test_error_desc
+
+    def test_executor_created_once_and_shut_down_by_close(self):
+        session = nifake.Session('dev1')
+        executor = session.executor
+        assert session.executor is executor
+        session.close()
+        try:
+            executor.submit(session.simple_function)
+            assert False
+        except RuntimeError:
+            pass
+        self.patched_library.niFake_close.assert_called_once_with(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST))
+
+    def test_executor_attribute_is_not_a_method_error(self):
+        with nifake.Session('dev1') as session:
+            try:
+                session.executor.read_write_bool
+                assert False
+            except AttributeError:
+                pass
+
     # Attributes
 
     def test_get_attribute_int32(self):
@@ -923,6 +1083,24 @@ class TestSession(object):
             except AttributeError as e:
                 assert str(e) == "'_SessionBase' object has no attribute 'non_existent_property'"
 
+    def test_settable_names_include_all_properties(self):
+        with nifake.Session('dev1') as session:
+            for name, value in vars(nifake.session._SessionBase).items():
+                if isinstance(value, (nifake.attributes.Attribute, nifake.attributes.AttributeEnum)):
+                    assert name in session._settable_names
+            for name in session.__dict__:
+                assert name in session._settable_names
+            for name in session.channels['0'].__dict__:
+                assert name in session.channels['0']._settable_names
+
+    def test_set_property_does_not_call_dir(self):
+        self.patched_library.niFake_SetAttributeViBoolean.side_effect = self.side_effects_helper.niFake_SetAttributeViBoolean
+        with nifake.Session('dev1') as session:
+            with patch('nifake.session.dir', create=True, side_effect=AssertionError('dir() called')):
+                session.read_write_bool = True
+                session.channels['0'].read_write_bool = True
+        assert self.patched_library.niFake_SetAttributeViBoolean.call_count == 2
+
     def test_set_enum_attribute_int32_error(self):
         with nifake.Session('dev1') as session:
             try:
@@ -937,6 +1115,287 @@ class TestSession(object):
             except TypeError as e:
                 assert str(e) == 'must be Color not FloatEnum'
 
+    # Attribute cache
+
+    def test_attribute_cache_disabled_by_default(self):
+        self.patched_library.niFake_GetAttributeViInt32.side_effect = self.side_effects_helper.niFake_GetAttributeViInt32
+        self.side_effects_helper['GetAttributeViInt32']['attributeValue'] = 3
+        with nifake.Session('dev1') as session:
+            assert not session.attribute_cache_enabled
+            assert session.read_write_integer == 3
+            assert session.read_write_integer == 3
+        assert self.patched_library.niFake_GetAttributeViInt32.call_count == 2
+
+    def test_attribute_cache_reads_driver_once(self):
+        self.patched_library.niFake_GetAttributeViInt32.side_effect = self.side_effects_helper.niFake_GetAttributeViInt32
+        self.side_effects_helper['GetAttributeViInt32']['attributeValue'] = 3
+        with nifake.Session('dev1') as session:
+            session.attribute_cache_enabled = True
+            assert session.read_write_integer == 3
+            assert session.read_write_integer == 3
+        self.patched_library.niFake_GetAttributeViInt32.assert_called_once_with(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViStringMatcher(''), matchers.ViInt32Matcher(1000004), matchers.ViInt32PointerMatcher())
+
+    def test_attribute_cache_converted_and_enum_properties(self):
+        self.patched_library.niFake_GetAttributeViInt32.side_effect = self.side_effects_helper.niFake_GetAttributeViInt32
+        self.side_effects_helper['GetAttributeViInt32']['attributeValue'] = nifake.Color.BLUE.value
+        with nifake.Session('dev1') as session:
+            session.attribute_cache_enabled = True
+            assert session.read_write_color == nifake.Color.BLUE
+            assert session.read_write_color == nifake.Color.BLUE
+            assert session.read_write_integer_with_converter == datetime.timedelta(milliseconds=nifake.Color.BLUE.value)
+            assert session.read_write_integer_with_converter == datetime.timedelta(milliseconds=nifake.Color.BLUE.value)
+        assert self.patched_library.niFake_GetAttributeViInt32.call_count == 2
+
+    def test_attribute_cache_keyed_by_repeated_capability(self):
+        self.patched_library.niFake_GetAttributeViInt32.side_effect = self.side_effects_helper.niFake_GetAttributeViInt32
+        self.side_effects_helper['GetAttributeViInt32']['attributeValue'] = 3
+        with nifake.Session('dev1') as session:
+            session.attribute_cache_enabled = True
+            for _ in range(3):
+                assert session.channels['0'].read_write_integer == 3
+                assert session.channels['1'].read_write_integer == 3
+        calls = [
+            mock.call(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViStringMatcher('0'), matchers.ViInt32Matcher(1000004), matchers.ViInt32PointerMatcher()),
+            mock.call(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViStringMatcher('1'), matchers.ViInt32Matcher(1000004), matchers.ViInt32PointerMatcher()),
+        ]
+        self.patched_library.niFake_GetAttributeViInt32.assert_has_calls(calls)
+        assert self.patched_library.niFake_GetAttributeViInt32.call_count == 2
+
+    def test_attribute_cache_cleared_by_set(self):
+        self.patched_library.niFake_GetAttributeViInt32.side_effect = self.side_effects_helper.niFake_GetAttributeViInt32
+        self.patched_library.niFake_SetAttributeViInt32.side_effect = self.side_effects_helper.niFake_SetAttributeViInt32
+        self.side_effects_helper['GetAttributeViInt32']['attributeValue'] = 3
+        with nifake.Session('dev1') as session:
+            session.attribute_cache_enabled = True
+            assert session.read_write_integer == 3
+            session.channels['0'].read_write_integer = 4
+            self.side_effects_helper['GetAttributeViInt32']['attributeValue'] = 4
+            assert session.read_write_integer == 4
+            assert session.read_write_integer == 4
+        assert self.patched_library.niFake_GetAttributeViInt32.call_count == 2
+
+    def test_attribute_cache_cleared_when_set_fails(self):
+        test_error_code = -1
+        self.patched_library.niFake_GetAttributeViInt32.side_effect = self.side_effects_helper.niFake_GetAttributeViInt32
+        self.patched_library.niFake_SetAttributeViInt32.side_effect = self.side_effects_helper.niFake_SetAttributeViInt32
+        self.patched_library.niFake_GetError.side_effect = self.side_effects_helper.niFake_GetError
+        self.side_effects_helper['GetAttributeViInt32']['attributeValue'] = 3
+        self.side_effects_helper['SetAttributeViInt32']['return'] = test_error_code
+        self.side_effects_helper['GetError']['errorCode'] = test_error_code
+        self.side_effects_helper['GetError']['description'] = 'Test'
+        with nifake.Session('dev1') as session:
+            session.attribute_cache_enabled = True
+            assert session.read_write_integer == 3
+            try:
+                session.read_write_integer = 4
+                assert False
+            except nifake.Error:
+                pass
+            assert session.read_write_integer == 3
+        assert self.patched_library.niFake_GetAttributeViInt32.call_count == 2
+
+    def test_attribute_cache_skips_uncacheable_property(self):
+        self.patched_library.niFake_GetAttributeViInt64.side_effect = self.side_effects_helper.niFake_GetAttributeViInt64
+        self.side_effects_helper['GetAttributeViInt64']['attributeValue'] = 6000000000
+        with nifake.Session('dev1') as session:
+            session.attribute_cache_enabled = True
+            assert session.read_write_int64 == 6000000000
+            assert session.read_write_int64 == 6000000000
+        assert self.patched_library.niFake_GetAttributeViInt64.call_count == 2
+
+    def test_attribute_cache_cleared_when_disabled(self):
+        self.patched_library.niFake_GetAttributeViInt32.side_effect = self.side_effects_helper.niFake_GetAttributeViInt32
+        self.side_effects_helper['GetAttributeViInt32']['attributeValue'] = 3
+        with nifake.Session('dev1') as session:
+            session.attribute_cache_enabled = True
+            assert session.read_write_integer == 3
+            session.attribute_cache_enabled = False
+            session.attribute_cache_enabled = True
+            assert session.read_write_integer == 3
+        assert self.patched_library.niFake_GetAttributeViInt32.call_count == 2
+
+    # Batched configure/read_attributes
+
+    def test_configure(self):
+        self.patched_library.niFake_SetAttributeViBoolean.side_effect = self.side_effects_helper.niFake_SetAttributeViBoolean
+        self.patched_library.niFake_SetAttributeViInt32.side_effect = self.side_effects_helper.niFake_SetAttributeViInt32
+        self.patched_library.niFake_SetAttributeViReal64.side_effect = self.side_effects_helper.niFake_SetAttributeViReal64
+        self.patched_library.niFake_SetAttributeViString.side_effect = self.side_effects_helper.niFake_SetAttributeViString
+        with nifake.Session('dev1') as session:
+            session.channels[[0, 1]].configure(read_write_bool=True, read_write_color=nifake.Color.BLUE, read_write_double_with_converter=datetime.timedelta(milliseconds=1), read_write_integer_with_converter=datetime.timedelta(seconds=2), read_write_string='Hello')
+        self.patched_library.niFake_SetAttributeViBoolean.assert_called_once_with(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViStringMatcher('0,1'), matchers.ViInt32Matcher(1000000), matchers.ViBooleanMatcher(True))
+        self.patched_library.niFake_SetAttributeViInt32.assert_has_calls([
+            mock.call(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViStringMatcher('0,1'), matchers.ViInt32Matcher(1000003), matchers.ViInt32Matcher(nifake.Color.BLUE.value)),
+            mock.call(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViStringMatcher('0,1'), matchers.ViInt32Matcher(1000008), matchers.ViInt32Matcher(2000)),
+        ])
+        self.patched_library.niFake_SetAttributeViReal64.assert_called_once_with(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViStringMatcher('0,1'), matchers.ViInt32Matcher(1000007), matchers.ViReal64Matcher(0.001))
+        self.patched_library.niFake_SetAttributeViString.assert_called_once_with(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViStringMatcher('0,1'), matchers.ViInt32Matcher(1000002), matchers.ViStringMatcher('Hello'))
+
+    def test_configure_ordered_properties_set_in_order(self):
+        calls = []
+
+        def set_attribute(vi, channel_name, attribute_id, attribute_value):
+            calls.append(attribute_id.value)
+            return 0
+        self.patched_library.niFake_SetAttributeViBoolean.side_effect = set_attribute
+        self.patched_library.niFake_SetAttributeViInt32.side_effect = set_attribute
+        self.patched_library.niFake_SetAttributeViReal64.side_effect = set_attribute
+        with nifake.Session('dev1') as session:
+            session.configure([('read_write_double', 1.0), ('read_write_bool', True)], read_write_integer=2)
+            session.configure(collections.OrderedDict([('read_write_integer', 3), ('read_write_double', 4.0)]))
+        assert calls == [1000001, 1000000, 1000004, 1000004, 1000001]
+
+    def test_configure_unknown_properties_sets_nothing(self):
+        with nifake.Session('dev1') as session:
+            try:
+                session.configure(read_write_integer=1, not_a_property=2, simple_function=3)
+                assert False
+            except AttributeError as e:
+                assert 'not_a_property' in str(e)
+                assert 'simple_function' in str(e)
+        assert self.patched_library.niFake_SetAttributeViInt32.call_count == 0
+
+    def test_configure_invalid_values_sets_nothing(self):
+        with nifake.Session('dev1') as session:
+            try:
+                session.configure(read_write_integer=1, read_write_color=nifake.FloatEnum.SIX_POINT_FIVE, read_write_double='1.0')
+                assert False
+            except TypeError as e:
+                assert 'read_write_color: must be Color not FloatEnum' in str(e)
+                assert 'read_write_double' in str(e)
+        assert self.patched_library.niFake_SetAttributeViInt32.call_count == 0
+        assert self.patched_library.niFake_SetAttributeViReal64.call_count == 0
+
+    def test_configure_stops_at_error_and_clears_cache(self):
+        test_error_code = -1
+        self.patched_library.niFake_GetAttributeViInt32.side_effect = self.side_effects_helper.niFake_GetAttributeViInt32
+        self.patched_library.niFake_SetAttributeViBoolean.side_effect = self.side_effects_helper.niFake_SetAttributeViBoolean
+        self.patched_library.niFake_SetAttributeViInt32.side_effect = self.side_effects_helper.niFake_SetAttributeViInt32
+        self.patched_library.niFake_GetError.side_effect = self.side_effects_helper.niFake_GetError
+        self.side_effects_helper['GetAttributeViInt32']['attributeValue'] = 3
+        self.side_effects_helper['SetAttributeViInt32']['return'] = test_error_code
+        self.side_effects_helper['GetError']['errorCode'] = test_error_code
+        self.side_effects_helper['GetError']['description'] = 'Test'
+        with nifake.Session('dev1') as session:
+            session.attribute_cache_enabled = True
+            assert session.read_write_integer == 3
+            try:
+                session.configure(read_write_integer=4, read_write_bool=True)
+                assert False
+            except nifake.Error as e:
+                assert e.code == test_error_code
+            assert session.read_write_integer == 3
+        assert self.patched_library.niFake_SetAttributeViBoolean.call_count == 0
+        assert self.patched_library.niFake_GetAttributeViInt32.call_count == 2
+
+    def test_read_attributes(self):
+        self.patched_library.niFake_GetAttributeViBoolean.side_effect = self.side_effects_helper.niFake_GetAttributeViBoolean
+        self.patched_library.niFake_GetAttributeViInt32.side_effect = self.side_effects_helper.niFake_GetAttributeViInt32
+        self.patched_library.niFake_GetAttributeViReal64.side_effect = self.side_effects_helper.niFake_GetAttributeViReal64
+        self.patched_library.niFake_GetAttributeViString.side_effect = self.side_effects_helper.niFake_GetAttributeViString
+        self.side_effects_helper['GetAttributeViBoolean']['attributeValue'] = 1
+        self.side_effects_helper['GetAttributeViInt32']['attributeValue'] = nifake.Color.BLUE.value
+        self.side_effects_helper['GetAttributeViReal64']['attributeValue'] = 0.5
+        self.side_effects_helper['GetAttributeViString']['attributeValue'] = 'Hello'
+        with nifake.Session('dev1') as session:
+            values = session.channels['3'].read_attributes(['read_write_string', 'read_write_bool', 'read_write_color', 'read_write_double_with_converter'])
+        assert list(values.keys()) == ['read_write_string', 'read_write_bool', 'read_write_color', 'read_write_double_with_converter']
+        assert values['read_write_string'] == 'Hello'
+        assert values['read_write_bool'] is True
+        assert values['read_write_color'] == nifake.Color.BLUE
+        assert values['read_write_double_with_converter'] == datetime.timedelta(seconds=0.5)
+        self.patched_library.niFake_GetAttributeViInt32.assert_called_once_with(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViStringMatcher('3'), matchers.ViInt32Matcher(1000003), matchers.ViInt32PointerMatcher())
+
+    def test_read_attributes_shares_attribute_cache(self):
+        self.patched_library.niFake_GetAttributeViBoolean.side_effect = self.side_effects_helper.niFake_GetAttributeViBoolean
+        self.side_effects_helper['GetAttributeViBoolean']['attributeValue'] = 1
+        with nifake.Session('dev1') as session:
+            session.attribute_cache_enabled = True
+            assert session.read_attributes(['read_write_bool'])['read_write_bool'] is True
+            assert session.read_write_bool is True
+        assert self.patched_library.niFake_GetAttributeViBoolean.call_count == 1
+
+    def test_read_attributes_unknown_property_reads_nothing(self):
+        with nifake.Session('dev1') as session:
+            try:
+                session.read_attributes(['read_write_integer', 'not_a_property'])
+                assert False
+            except AttributeError as e:
+                assert 'not_a_property' in str(e)
+        assert self.patched_library.niFake_GetAttributeViInt32.call_count == 0
+
+    def test_get_per_channel(self):
+        test_values = {b'0': 1.5, b'1': 2.5, b'2': 3.5}
+
+        def side_effect(vi, channel_name, attribute_id, attribute_value):
+            attribute_value.contents.value = test_values[channel_name.value]
+            return 0
+        self.patched_library.niFake_GetAttributeViReal64.side_effect = side_effect
+        with nifake.Session('dev1') as session:
+            values = session.channels[0:3].get('read_write_double')
+        assert isinstance(values, numpy.ndarray)
+        assert values.dtype == numpy.float64
+        assert values.tolist() == [1.5, 2.5, 3.5]
+        calls = [mock.call(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViStringMatcher(c), matchers.ViInt32Matcher(1000001), matchers.ViReal64PointerMatcher()) for c in ['0', '1', '2']]
+        self.patched_library.niFake_GetAttributeViReal64.assert_has_calls(calls)
+        assert self.patched_library.niFake_GetAttributeViReal64.call_count == 3
+
+    def test_get_per_channel_enum_returns_objects(self):
+        self.patched_library.niFake_GetAttributeViInt32.side_effect = self.side_effects_helper.niFake_GetAttributeViInt32
+        self.side_effects_helper['GetAttributeViInt32']['attributeValue'] = nifake.Color.BLUE.value
+        with nifake.Session('dev1') as session:
+            values = session.channels['0, 1'].get('read_write_color')
+        assert values.tolist() == [nifake.Color.BLUE, nifake.Color.BLUE]
+        self.patched_library.niFake_GetAttributeViInt32.assert_has_calls([
+            mock.call(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViStringMatcher('0'), matchers.ViInt32Matcher(1000003), matchers.ViInt32PointerMatcher()),
+            mock.call(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViStringMatcher('1'), matchers.ViInt32Matcher(1000003), matchers.ViInt32PointerMatcher()),
+        ])
+
+    def test_get_per_channel_uses_attribute_cache(self):
+        self.patched_library.niFake_GetAttributeViInt32.side_effect = self.side_effects_helper.niFake_GetAttributeViInt32
+        self.side_effects_helper['GetAttributeViInt32']['attributeValue'] = 3
+        with nifake.Session('dev1') as session:
+            session.attribute_cache_enabled = True
+            assert session.channels[0:2].get('read_write_integer').tolist() == [3, 3]
+            assert session.channels[1].read_write_integer == 3
+            assert session.channels[0:2].get('read_write_integer').tolist() == [3, 3]
+        assert self.patched_library.niFake_GetAttributeViInt32.call_count == 2
+
+    def test_set_per_channel(self):
+        self.patched_library.niFake_SetAttributeViReal64.side_effect = self.side_effects_helper.niFake_SetAttributeViReal64
+        with nifake.Session('dev1') as session:
+            session.channels[0:3].set('read_write_double', numpy.array([1.5, 2.5, 3.5]))
+        calls = [mock.call(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViStringMatcher(str(i)), matchers.ViInt32Matcher(1000001), matchers.ViReal64Matcher(v)) for i, v in enumerate([1.5, 2.5, 3.5])]
+        self.patched_library.niFake_SetAttributeViReal64.assert_has_calls(calls)
+        assert self.patched_library.niFake_SetAttributeViReal64.call_count == 3
+
+    def test_set_per_channel_converts_values(self):
+        self.patched_library.niFake_SetAttributeViInt32.side_effect = self.side_effects_helper.niFake_SetAttributeViInt32
+        with nifake.Session('dev1') as session:
+            session.channels[[0, 1]].set('read_write_integer_with_converter', [datetime.timedelta(seconds=1), datetime.timedelta(seconds=2)])
+        self.patched_library.niFake_SetAttributeViInt32.assert_has_calls([
+            mock.call(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViStringMatcher('0'), matchers.ViInt32Matcher(1000008), matchers.ViInt32Matcher(1000)),
+            mock.call(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViStringMatcher('1'), matchers.ViInt32Matcher(1000008), matchers.ViInt32Matcher(2000)),
+        ])
+
+    def test_set_per_channel_wrong_number_of_values(self):
+        with nifake.Session('dev1') as session:
+            try:
+                session.channels[0:3].set('read_write_double', [1.0, 2.0])
+                assert False
+            except ValueError as e:
+                assert str(e) == '2 values given for 3 channels'
+        assert self.patched_library.niFake_SetAttributeViReal64.call_count == 0
+
+    def test_set_per_channel_invalid_value_sets_nothing(self):
+        with nifake.Session('dev1') as session:
+            try:
+                session.channels[0:2].set('read_write_color', [nifake.Color.RED, 2])
+                assert False
+            except TypeError as e:
+                assert str(e) == 'Invalid values for read_write_color: 1: must be Color not int'
+        assert self.patched_library.niFake_SetAttributeViInt32.call_count == 0
+
     # Error descriptions
 
     def test_get_error_and_error_message_returns_error(self):
@@ -976,6 +1435,207 @@ class TestSession(object):
                 assert e.description == test_error_desc
         self.patched_library.niFake_error_message.assert_called_once_with(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViInt32Matcher(test_error_code), matchers.ViCharBufferMatcher(256))
 
+    def test_error_description_retrieved_on_first_use(self):
+        test_error_code = -42
+        test_error_desc = 'The answer to the ultimate question'
+        self.patched_library.niFake_PoorlyNamedSimpleFunction.side_effect = self.side_effects_helper.niFake_PoorlyNamedSimpleFunction
+        self.side_effects_helper['PoorlyNamedSimpleFunction']['return'] = test_error_code
+        self.patched_library.niFake_GetError.side_effect = self.side_effects_helper.niFake_GetError
+        self.side_effects_helper['GetError']['errorCode'] = test_error_code
+        self.side_effects_helper['GetError']['description'] = test_error_desc
+        with nifake.Session('dev1') as session:
+            try:
+                session.simple_function()
+                assert False
+            except nifake.Error as e:
+                assert e.code == test_error_code
+                assert self.patched_library.niFake_GetError.call_count == 0
+                assert str(e) == '-42: ' + test_error_desc
+                assert e.description == test_error_desc
+        # One call to query the size of the description and one to get it
+        assert self.patched_library.niFake_GetError.call_count == 2
+
+    def test_error_and_warning_args_hold_message(self):
+        test_error_desc = 'The answer to the ultimate question'
+        self.patched_library.niFake_PoorlyNamedSimpleFunction.side_effect = self.side_effects_helper.niFake_PoorlyNamedSimpleFunction
+        self.patched_library.niFake_GetError.side_effect = self.side_effects_helper.niFake_GetError
+        self.side_effects_helper['GetError']['description'] = test_error_desc
+        with nifake.Session('dev1') as session:
+            self.side_effects_helper['PoorlyNamedSimpleFunction']['return'] = -42
+            self.side_effects_helper['GetError']['errorCode'] = -42
+            try:
+                session.simple_function()
+                assert False
+            except nifake.Error as e:
+                assert e.args == ('-42: ' + test_error_desc, )
+                assert repr(e) == 'Error({0!r})'.format('-42: ' + test_error_desc)
+            self.side_effects_helper['PoorlyNamedSimpleFunction']['return'] = 42
+            self.side_effects_helper['GetError']['errorCode'] = 42
+            with warnings.catch_warnings(record=True) as w:
+                warnings.simplefilter('always')
+                session.simple_function()
+            assert w[0].message.args == ('Warning 42 occurred.\n\n' + test_error_desc, )
+        error = nifake.Error(-1, 'Test')
+        error.args = ('Changed', )
+        assert error.args == ('Changed', )
+
+    def test_error_description_from_error_message_when_last_error_differs(self):
+        test_error_code = -42
+        test_error_desc = 'The answer to the ultimate question'
+        self.patched_library.niFake_PoorlyNamedSimpleFunction.side_effect = self.side_effects_helper.niFake_PoorlyNamedSimpleFunction
+        self.side_effects_helper['PoorlyNamedSimpleFunction']['return'] = test_error_code
+        self.patched_library.niFake_GetError.side_effect = self.side_effects_helper.niFake_GetError
+        self.side_effects_helper['GetError']['errorCode'] = -1
+        self.side_effects_helper['GetError']['description'] = "Shouldn't get this"
+        self.patched_library.niFake_error_message.side_effect = self.side_effects_helper.niFake_error_message
+        self.side_effects_helper['error_message']['errorMessage'] = test_error_desc
+        with nifake.Session('dev1') as session:
+            try:
+                session.simple_function()
+                assert False
+            except nifake.Error as e:
+                assert e.description == test_error_desc
+
+    def test_error_pickles_with_description(self):
+        test_error_code = -42
+        test_error_desc = 'The answer to the ultimate question'
+        self.patched_library.niFake_PoorlyNamedSimpleFunction.side_effect = self.side_effects_helper.niFake_PoorlyNamedSimpleFunction
+        self.side_effects_helper['PoorlyNamedSimpleFunction']['return'] = test_error_code
+        self.patched_library.niFake_GetError.side_effect = self.side_effects_helper.niFake_GetError
+        self.side_effects_helper['GetError']['errorCode'] = test_error_code
+        self.side_effects_helper['GetError']['description'] = test_error_desc
+        with nifake.Session('dev1') as session:
+            try:
+                session.simple_function()
+                assert False
+            except nifake.Error as e:
+                error = pickle.loads(pickle.dumps(e))
+        assert type(error) is nifake.Error
+        assert error.code == test_error_code
+        assert error.description == test_error_desc
+
+    def test_error_description_retrieved_before_session_is_closed(self):
+        test_error_code = -42
+        test_error_desc = 'The answer to the ultimate question'
+        self.patched_library.niFake_PoorlyNamedSimpleFunction.side_effect = self.side_effects_helper.niFake_PoorlyNamedSimpleFunction
+        self.side_effects_helper['PoorlyNamedSimpleFunction']['return'] = test_error_code
+        self.patched_library.niFake_GetError.side_effect = self.side_effects_helper.niFake_GetError
+        self.side_effects_helper['GetError']['errorCode'] = test_error_code
+        self.side_effects_helper['GetError']['description'] = test_error_desc
+        try:
+            with nifake.Session('dev1') as session:
+                session.simple_function()
+            assert False
+        except nifake.Error as e:
+            error = e
+        calls = [name for name, args, kwargs in self.patched_library.method_calls]
+        assert calls.index('niFake_GetError') < calls.index('niFake_close')
+        assert error.description == test_error_desc
+
+    def test_close_does_not_retrieve_description_of_dropped_errors(self):
+        self.patched_library.niFake_PoorlyNamedSimpleFunction.side_effect = self.side_effects_helper.niFake_PoorlyNamedSimpleFunction
+        self.side_effects_helper['PoorlyNamedSimpleFunction']['return'] = -42
+        with nifake.Session('dev1') as session:
+            for _ in range(3):
+                try:
+                    session.simple_function()
+                    assert False
+                except nifake.Error:
+                    pass
+        assert self.patched_library.niFake_GetError.call_count == 0
+        assert self.patched_library.niFake_error_message.call_count == 0
+
+    def test_warning_description_retrieved_once_per_session(self):
+        test_error_code = 42
+        test_error_desc = 'The answer to the ultimate question, only positive'
+        self.patched_library.niFake_PoorlyNamedSimpleFunction.side_effect = self.side_effects_helper.niFake_PoorlyNamedSimpleFunction
+        self.side_effects_helper['PoorlyNamedSimpleFunction']['return'] = test_error_code
+        self.patched_library.niFake_GetError.side_effect = self.side_effects_helper.niFake_GetError
+        self.side_effects_helper['GetError']['errorCode'] = test_error_code
+        self.side_effects_helper['GetError']['description'] = test_error_desc
+        with nifake.Session('dev1') as session:
+            with warnings.catch_warnings(record=True) as w:
+                warnings.simplefilter('always')
+                for _ in range(3):
+                    session.simple_function()
+                assert len(w) == 3
+                for warning in w:
+                    assert warning.message.code == test_error_code
+                    assert test_error_desc in str(warning.message)
+        assert self.patched_library.niFake_GetError.call_count == 2
+
+    # Warning policies
+
+    def _set_up_warning(self):
+        self.patched_library.niFake_PoorlyNamedSimpleFunction.side_effect = self.side_effects_helper.niFake_PoorlyNamedSimpleFunction
+        self.patched_library.niFake_ReadFromChannel.side_effect = self.side_effects_helper.niFake_ReadFromChannel
+        self.side_effects_helper['PoorlyNamedSimpleFunction']['return'] = 42
+        self.side_effects_helper['ReadFromChannel']['return'] = 42
+        self.patched_library.niFake_GetError.side_effect = self.side_effects_helper.niFake_GetError
+        self.side_effects_helper['GetError']['errorCode'] = 42
+        self.side_effects_helper['GetError']['description'] = 'Coerced'
+
+    def test_warning_policy_always(self):
+        self._set_up_warning()
+        with nifake.Session('dev1') as session:
+            assert session.warning_policy == nifake.WarningPolicy.ALWAYS
+            with warnings.catch_warnings(record=True) as w:
+                warnings.simplefilter('always')
+                for _ in range(3):
+                    session.simple_function()
+                assert len(w) == 3
+            assert session.warning_stats() == {42: nifake.errors.WarningStats(count=3, issued=3, description='Coerced')}
+
+    def test_warning_policy_once_per_code(self):
+        self._set_up_warning()
+        with nifake.Session('dev1') as session:
+            session.warning_policy = nifake.WarningPolicy.ONCE_PER_CODE
+            with warnings.catch_warnings(record=True) as w:
+                warnings.simplefilter('always')
+                for _ in range(3):
+                    session.simple_function()
+                    session.channels['0'].read_from_channel(datetime.timedelta(milliseconds=10))
+                assert len(w) == 1
+            assert session.warning_stats()[42].count == 6
+            assert session.warning_stats()[42].issued == 1
+
+    def test_warning_policy_rate_limited(self):
+        self._set_up_warning()
+        with patch('nifake.errors._clock') as clock:
+            with nifake.Session('dev1') as session:
+                session.warning_policy = nifake.WarningPolicy.RATE_LIMITED
+                session.warning_interval = datetime.timedelta(seconds=10)
+                assert session.warning_interval == datetime.timedelta(seconds=10)
+                with warnings.catch_warnings(record=True) as w:
+                    warnings.simplefilter('always')
+                    for now in [100.0, 105.0, 109.9, 110.0, 111.0]:
+                        clock.return_value = now
+                        session.simple_function()
+                    assert len(w) == 2
+                assert session.warning_stats()[42][:2] == (5, 2)
+
+    def test_warning_policy_count(self):
+        self._set_up_warning()
+        with nifake.Session('dev1') as session:
+            session.warning_policy = nifake.WarningPolicy.COUNT
+            with warnings.catch_warnings(record=True) as w:
+                warnings.simplefilter('always')
+                for _ in range(3):
+                    session.simple_function()
+                assert len(w) == 0
+            # The description is only retrieved for warning_stats()
+            assert self.patched_library.niFake_GetError.call_count == 0
+            assert session.warning_stats(reset=True)[42] == (3, 0, 'Coerced')
+            assert session.warning_stats() == {}
+
+    def test_warning_policy_invalid_type(self):
+        with nifake.Session('dev1') as session:
+            try:
+                session.warning_policy = 'always'
+                assert False
+            except TypeError as e:
+                assert str(e) == 'must be WarningPolicy not str'
+
     # Custom types
 
     def test_set_custom_type(self):
@@ -1076,4 +1736,46 @@ class TestSession(object):
         assert matchers.CustomTypeBufferMatcher(nifake.custom_struct, cs_ctype).__repr__() == "CustomTypeBufferMatcher(<class 'nifake.custom_struct.custom_struct'>, [custom_struct(data=None, struct_int=42, struct_double=4.2), custom_struct(data=None, struct_int=43, struct_double=4.3), custom_struct(data=None, struct_int=42, struct_double=4.3)])"
 
 
+class _FakeCtypesLibrary(object):
+    '''Stands in for ctypes.CDLL. Hands out a new mock for every exported function, like ctypes does on first lookup.'''
+
+    def __init__(self, missing_functions=()):
+        self._missing_functions = missing_functions
+        self.lookups = []
 
+    def __getattr__(self, name):
+        if name.startswith('_') or name in self._missing_functions:
+            raise AttributeError(name)
+        self.lookups.append(name)
+        cfunc = mock.Mock(return_value=0)
+        object.__setattr__(self, name, cfunc)
+        return cfunc
+
+
+class TestLibrary(object):
+
+    def test_function_bound_on_first_call(self):
+        import nifake.library
+        import nifake.visatype
+        ctypes_library = _FakeCtypesLibrary()
+        library = nifake.library.Library(ctypes_library)
+        assert library.niFake_PoorlyNamedSimpleFunction_cfunc is None
+        library.niFake_PoorlyNamedSimpleFunction(SESSION_NUM_FOR_TEST)
+        library.niFake_PoorlyNamedSimpleFunction(SESSION_NUM_FOR_TEST)
+        assert ctypes_library.lookups == ['niFake_PoorlyNamedSimpleFunction']
+        cfunc = library.niFake_PoorlyNamedSimpleFunction_cfunc
+        assert cfunc.argtypes == [nifake.visatype.ViSession]
+        assert cfunc.restype == nifake.visatype.ViStatus
+        assert cfunc.call_count == 2
+
+    def test_bind_all_functions_takes_no_lock_afterwards(self):
+        import nifake.library
+        ctypes_library = _FakeCtypesLibrary(missing_functions=['niFake_Abort'])
+        library = nifake.library.Library(ctypes_library)
+        library.bind_all_functions()
+        assert library.niFake_Abort_cfunc is None
+        assert library.niFake_PoorlyNamedSimpleFunction_cfunc is not None
+        assert len(ctypes_library.lookups) == len(nifake.library.Library._prototypes) - 1
+        library._func_lock = None  # Any attempt to take the lock now fails
+        library.niFake_PoorlyNamedSimpleFunction(SESSION_NUM_FOR_TEST)
+        library.niFake_PoorlyNamedSimpleFunction_cfunc.assert_called_once_with(SESSION_NUM_FOR_TEST)
@@ -49,4 +49,16 @@ attributes_converters = {
                'python_type': 'datetime.timedelta', },  # STREAMING_WRITE_TIMEOUT
 }
 
+# Properties that change without a call into the driver must never be served from the session attribute cache
+attributes_cacheable = {
+    1150269: { 'cacheable': False, },  # OSP_OVERFLOW_STATUS
+    1150325: { 'cacheable': False, },  # STREAMING_SPACE_AVAILABLE_IN_WAVEFORM
+    1150344: { 'cacheable': False, },  # ALL_MARKER_EVENTS_LIVE_STATUS
+    1150345: { 'cacheable': False, },  # MARKER_EVENT_LIVE_STATUS
+    1150348: { 'cacheable': False, },  # READY_FOR_START_EVENT_LIVE_STATUS
+    1150349: { 'cacheable': False, },  # ALL_MARKER_EVENTS_LATCHED_STATUS
+    1150350: { 'cacheable': False, },  # MARKER_EVENT_LATCHED_STATUS
+    1150351: { 'cacheable': False, },  # DONE_EVENT_LATCHED_STATUS
+    1150352: { 'cacheable': False, },  # STARTED_EVENT_LATCHED_STATUS
+}
 
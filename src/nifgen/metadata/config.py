@@ -29,5 +29,6 @@ config = {
         {'python_name': 'script_triggers', 'prefix': 'ScriptTrigger', },
         {'python_name': 'markers', 'prefix': 'Marker', },
     ],
+    'example_property_values': [('func_amplitude', '1.0'), ('func_frequency', '1000.0'), ],
 }
 
@@ -144,6 +144,7 @@ functions_converters = {
 functions_additional_functions = {
     'CreateWaveformDispatcher': {
         'codegen_method': 'public',
+        'render_in_library': False,  # Implemented in Python only
         'returns': 'ViStatus',
         'parameters': [
             {
@@ -181,6 +182,7 @@ functions_additional_functions = {
 
     'WriteWaveformDispatcher': {
         'codegen_method': 'public',
+        'render_in_library': False,  # Implemented in Python only
         'returns': 'ViStatus',
         'parameters': [
             {
@@ -227,6 +229,7 @@ nifgen_SetWaveformNextWritePosition function.''',
     # Public function that wraps driver function but returns datetime object instead of individual items
     'GetLastExtCalLastDateAndTime': {
         'codegen_method': 'public',
+        'render_in_library': False,  # Implemented in Python only
         'returns': 'ViStatus',
         'python_name': 'get_ext_cal_last_date_and_time',
         'real_datetime_call': 'GetExtCalLastDateAndTime',
@@ -257,6 +260,7 @@ nifgen_SetWaveformNextWritePosition function.''',
     },
     'GetLastSelfCalLastDateAndTime': {
         'codegen_method': 'public',
+        'render_in_library': False,  # Implemented in Python only
         'returns': 'ViStatus',
         'python_name': 'get_self_cal_last_date_and_time',
         'real_datetime_call': 'GetSelfCalLastDateAndTime',
@@ -345,4 +349,31 @@ functions_array = {
     'WriteNamedWaveformI16':        { 'parameters': { 4: { 'use_array': True, }, }, },
 }
 
+# Functions that block until the driver completes an operation (fetch, read, wait, self-calibration).
+# Their documentation describes how they behave when called from multiple threads.
+functions_blocking = {
+    'SelfCal':       { 'blocking': True, },
+    'WaitUntilDone': { 'blocking': True, },
+    'self_test':     { 'blocking': True, },
+}
+
+# Functions that can change property values in the driver. Calling them clears the session attribute cache.
+functions_invalidates_attribute_cache = {
+    'reset':              { 'invalidates_attribute_cache': True, },
+    'ResetDevice':        { 'invalidates_attribute_cache': True, },
+    'ResetWithDefaults':  { 'invalidates_attribute_cache': True, },
+    'Commit':             { 'invalidates_attribute_cache': True, },
+    'InitiateGeneration': { 'invalidates_attribute_cache': True, },
+    'Disable':            { 'invalidates_attribute_cache': True, },
+    'self_test':          { 'invalidates_attribute_cache': True, },
+    'SelfCal':            { 'invalidates_attribute_cache': True, },
+    'Configure.+':        { 'invalidates_attribute_cache': True, },  # All Configure functions set properties
+    'SetAttributeVi.+':   { 'invalidates_attribute_cache': True, },
+    'Allocate.+':         { 'invalidates_attribute_cache': True, },  # Waveform and sequence handles are properties
+    'Create.+':           { 'invalidates_attribute_cache': True, },
+    'Clear.+':            { 'invalidates_attribute_cache': True, },
+    'Define.+':           { 'invalidates_attribute_cache': True, },
+    'Delete.+':           { 'invalidates_attribute_cache': True, },
+    'ExportSignal':       { 'invalidates_attribute_cache': True, },
+}
 
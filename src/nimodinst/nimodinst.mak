@@ -1,10 +1,11 @@
 include $(BUILD_HELPER_DIR)/defines.mak
 include $(BUILD_HELPER_DIR)/tools.mak
 
-# We want everything but enums.py
-MODULE_FILES_TO_GENERATE := $(filter-out enums.py attributes.py,$(DEFAULT_PY_FILES_TO_GENERATE))
+# We want everything but enums.py, attributes.py and aio.py
+MODULE_FILES_TO_GENERATE := $(filter-out enums.py attributes.py aio.py,$(DEFAULT_PY_FILES_TO_GENERATE))
 
-MODULE_FILES_TO_COPY := $(DEFAULT_PY_FILES_TO_COPY)
+# ModInst sessions do not talk to instruments, so they do not need an executor
+MODULE_FILES_TO_COPY := $(filter-out executor.py,$(DEFAULT_PY_FILES_TO_COPY))
 
 RST_FILES_TO_GENERATE := $(filter-out enums.rst,$(DEFAULT_RST_FILES_TO_GENERATE))
 
@@ -116,7 +116,7 @@ class _DeviceIterable(object):
         return ret_str
 
 
-class Session(object):
+class Session(errors._WarningPolicyMixin):
     '''${config['session_class_description']}'''
 
     # This is needed during __init__. Without it, __setattr__ raises an exception
@@ -128,6 +128,8 @@ class Session(object):
         self._current_item = 0
         self._encoding = 'windows-1251'
         self._library = library_singleton.get()
+        self._warning_filter = errors._WarningFilter()
+        self._pending_descriptions = errors._PendingDescriptions()
         self._${config['session_handle_parameter_name']}, self._item_count = self._open_installed_devices_session(driver)
         self._param_list = "driver=" + pp.pformat(driver)
 
@@ -186,6 +188,7 @@ class Session(object):
     def close(self):
         # TODO(marcoskirsch): Should we raise an exception on double close? Look at what File does.
         if(self._${config['session_handle_parameter_name']} != 0):
+            self._pending_descriptions.resolve()
             self._close_installed_devices_session()
             self._${config['session_handle_parameter_name']} = 0
 
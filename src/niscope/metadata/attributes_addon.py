@@ -152,4 +152,13 @@ attributes_codegen_method = {
     1150380: { "codegen_method": "no" },  # SAMPLES_TRANSFERRED_PER_RECORD - P2P Attribute
 }
 
+# Properties that change without a call into the driver must never be served from the session attribute cache
+attributes_cacheable = {
+    1150082: { 'cacheable': False, },  # POINTS_DONE
+    1150083: { 'cacheable': False, },  # RECORDS_DONE
+    1150084: { 'cacheable': False, },  # BACKLOG
+    1150086: { 'cacheable': False, },  # DEVICE_TEMPERATURE
+    1150278: { 'cacheable': False, },  # TRIGGER_AUTO_TRIGGERED
+    1151303: { 'cacheable': False, },  # PLL_LOCK_STATUS
+}
 
@@ -29,5 +29,6 @@ config = {
     'repeated_capabilities': [
         {'python_name': 'channels', 'prefix': '', },
     ],
+    'example_property_values': [('vertical_range', '2.0'), ('vertical_offset', '0.0'), ],
 }
 
@@ -542,6 +542,118 @@ replacement_enums = {
             },
         ],
     },
+    'ArrayMeasurement': {
+        'values': [
+            {
+                'name': 'NISCOPE_VAL_NO_MEASUREMENT',
+                'value': 4000,
+            },
+            {
+                'name': 'NISCOPE_VAL_LAST_ACQ_HISTOGRAM',
+                'value': 4001,
+            },
+            {
+                'name': 'NISCOPE_VAL_FFT_PHASE_SPECTRUM',
+                'value': 4002,
+            },
+            {
+                'name': 'NISCOPE_VAL_FFT_AMP_SPECTRUM_VOLTS_RMS',
+                'value': 4003,
+            },
+            {
+                'name': 'NISCOPE_VAL_MULTI_ACQ_VOLTAGE_HISTOGRAM',
+                'value': 4004,
+            },
+            {
+                'name': 'NISCOPE_VAL_MULTI_ACQ_TIME_HISTOGRAM',
+                'value': 4005,
+            },
+            {
+                'name': 'NISCOPE_VAL_ARRAY_INTEGRAL',
+                'value': 4006,
+            },
+            {
+                'name': 'NISCOPE_VAL_DERIVATIVE',
+                'value': 4007,
+            },
+            {
+                'name': 'NISCOPE_VAL_INVERSE',
+                'value': 4008,
+            },
+            {
+                'name': 'NISCOPE_VAL_HANNING_WINDOW',
+                'value': 4009,
+            },
+            {
+                'name': 'NISCOPE_VAL_FLAT_TOP_WINDOW',
+                'value': 4010,
+            },
+            {
+                'name': 'NISCOPE_VAL_POLYNOMIAL_INTERPOLATION',
+                'value': 4011,
+            },
+            {
+                'name': 'NISCOPE_VAL_MULTIPLY_CHANNELS',
+                'value': 4012,
+            },
+            {
+                'name': 'NISCOPE_VAL_ADD_CHANNELS',
+                'value': 4013,
+            },
+            {
+                'name': 'NISCOPE_VAL_SUBTRACT_CHANNELS',
+                'value': 4014,
+            },
+            {
+                'name': 'NISCOPE_VAL_DIVIDE_CHANNELS',
+                'value': 4015,
+            },
+            {
+                'name': 'NISCOPE_VAL_MULTI_ACQ_AVERAGE',
+                'value': 4016,
+            },
+            {
+                'name': 'NISCOPE_VAL_BUTTERWORTH_FILTER',
+                'value': 4017,
+            },
+            {
+                'name': 'NISCOPE_VAL_CHEBYSHEV_FILTER',
+                'value': 4018,
+            },
+            {
+                'name': 'NISCOPE_VAL_FFT_AMP_SPECTRUM_DB',
+                'value': 4019,
+            },
+            {
+                'name': 'NISCOPE_VAL_HAMMING_WINDOW',
+                'value': 4020,
+            },
+            {
+                'name': 'NISCOPE_VAL_WINDOWED_FIR_FILTER',
+                'value': 4021,
+            },
+            {
+                'name': 'NISCOPE_VAL_BESSEL_FILTER',
+                'value': 4022,
+            },
+            {
+                'name': 'NISCOPE_VAL_TRIANGLE_WINDOW',
+                'value': 4023,
+            },
+            {
+                'name': 'NISCOPE_VAL_BLACKMAN_WINDOW',
+                'value': 4024,
+            },
+            {
+                'name': 'NISCOPE_VAL_ARRAY_OFFSET',
+                'value': 4025,
+            },
+            {
+                'name': 'NISCOPE_VAL_ARRAY_GAIN',
+                'value': 4026,
+            },
+        ],
+    },
     'ScalarMeasurement': {
         'values': [
             {
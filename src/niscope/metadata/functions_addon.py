@@ -64,8 +64,7 @@ functions_codegen_method = {
     '.etAttributeViInt64':              { 'codegen_method': 'no',       },  # NI-SCOPE has no ViInt64 attributes.
     'ClearWaveformProcessing':          { 'codegen_method': 'no',       },  # Per #667, removing waveform measurement methods
     'AddWaveformProcessing':            { 'codegen_method': 'no',       },  # Per #667, removing waveform measurement methods
-    'FetchArrayMeasurement':            { 'codegen_method': 'no',       },  # Per #667, removing waveform measurement methods
-    'ActualMeasWfmSize':                { 'codegen_method': 'no',       },  # Per #667, removing waveform measurement methods
+    'FetchArrayMeasurement':            { 'codegen_method': 'private',  },
 }
 
 # Attach the given parameter to the given enum from enums.py
@@ -89,6 +88,9 @@ functions_enums = {
     'FetchMeasurement':                                { 'parameters': { 3: { 'enum': 'ScalarMeasurement',               }, }, },
     'FetchMeasurementStats':                           { 'parameters': { 3: { 'enum': 'ScalarMeasurement',               }, }, },
     'ReadMeasurement':                                 { 'parameters': { 3: { 'enum': 'ScalarMeasurement',               }, }, },
+    'FetchArrayMeasurement':                           { 'parameters': { 3: { 'enum': 'ArrayMeasurement',                }, }, },
+    'FetchArrayMeasurementDispatcher':                 { 'parameters': { 3: { 'enum': 'ArrayMeasurement',                }, }, },
+    'ActualMeasWfmSize':                               { 'parameters': { 1: { 'enum': 'ArrayMeasurement',                }, }, },
     'AcquisitionStatus':                               { 'parameters': { 1: { 'enum': 'AcquisitionStatus',               }, }, },
 }
 
@@ -105,24 +107,26 @@ functions_buffer_info = {
     # 'GetFrequencyResponse':                     { 'parameters': { 3: { 'size': {'mechanism':'ivi-dance', 'value':'bufferSize'}, },
     #                                                               4: { 'size': {'mechanism':'ivi-dance', 'value':'bufferSize'}, },
     #                                                               5: { 'size': {'mechanism':'ivi-dance', 'value':'bufferSize'}, }, }, },
-    'FetchMeasurement':                         { 'parameters': { 4: { 'size': {'mechanism':'python-code', 'value':'self._actual_num_wfms()'}, }, }, },
-    'FetchMeasurementStats':                    { 'parameters': { 4: { 'size': {'mechanism':'python-code', 'value':'self._actual_num_wfms()'}, },
-                                                                  5: { 'size': {'mechanism':'python-code', 'value':'self._actual_num_wfms()'}, },
-                                                                  6: { 'size': {'mechanism':'python-code', 'value':'self._actual_num_wfms()'}, },
-                                                                  7: { 'size': {'mechanism':'python-code', 'value':'self._actual_num_wfms()'}, },
-                                                                  8: { 'size': {'mechanism':'python-code', 'value':'self._actual_num_wfms()'}, },
-                                                                  9: { 'size': {'mechanism':'python-code', 'value':'self._actual_num_wfms()'}, }, }, },
-    'ReadMeasurement':                          { 'parameters': { 4: { 'size': {'mechanism':'python-code', 'value':'self._actual_num_wfms()'}, }, }, },
-    'Read':                                     { 'parameters': { 4: { 'size': {'mechanism':'python-code', 'value':'(num_samples * self._actual_num_wfms())'}, },
-                                                                  5: { 'size': {'mechanism':'python-code', 'value':'self._actual_num_wfms()'}, }, }, },
-    'Fetch':                                    { 'parameters': { 4: { 'size': {'mechanism':'python-code', 'value':'(num_samples * self._actual_num_wfms())'}, },
-                                                                  5: { 'size': {'mechanism':'python-code', 'value':'self._actual_num_wfms()'}, }, }, },
-    'FetchBinary8':                             { 'parameters': { 4: { 'size': {'mechanism':'python-code', 'value':'(num_samples * self._actual_num_wfms())'}, },
-                                                                  5: { 'size': {'mechanism':'python-code', 'value':'self._actual_num_wfms()'}, }, }, },
-    'FetchBinary16':                            { 'parameters': { 4: { 'size': {'mechanism':'python-code', 'value':'(num_samples * self._actual_num_wfms())'}, },
-                                                                  5: { 'size': {'mechanism':'python-code', 'value':'self._actual_num_wfms()'}, }, }, },
-    'FetchBinary32':                            { 'parameters': { 4: { 'size': {'mechanism':'python-code', 'value':'(num_samples * self._actual_num_wfms())'}, },
-                                                                  5: { 'size': {'mechanism':'python-code', 'value':'self._actual_num_wfms()'}, }, }, },
+    'FetchMeasurement':                         { 'parameters': { 4: { 'size': {'mechanism':'python-code', 'value':'num_wfms'}, }, }, },
+    'FetchMeasurementStats':                    { 'parameters': { 4: { 'size': {'mechanism':'python-code', 'value':'num_wfms'}, },
+                                                                  5: { 'size': {'mechanism':'python-code', 'value':'num_wfms'}, },
+                                                                  6: { 'size': {'mechanism':'python-code', 'value':'num_wfms'}, },
+                                                                  7: { 'size': {'mechanism':'python-code', 'value':'num_wfms'}, },
+                                                                  8: { 'size': {'mechanism':'python-code', 'value':'num_wfms'}, },
+                                                                  9: { 'size': {'mechanism':'python-code', 'value':'num_wfms'}, }, }, },
+    'ReadMeasurement':                          { 'parameters': { 4: { 'size': {'mechanism':'python-code', 'value':'num_wfms'}, }, }, },
+    'Read':                                     { 'parameters': { 4: { 'size': {'mechanism':'python-code', 'value':'(num_samples * num_wfms)'}, },
+                                                                  5: { 'size': {'mechanism':'python-code', 'value':'num_wfms'}, }, }, },
+    'FetchArrayMeasurement':                    { 'parameters': { 5: { 'size': {'mechanism':'python-code', 'value':'(meas_wfm_size * num_wfms)'}, },
+                                                                  6: { 'size': {'mechanism':'python-code', 'value':'num_wfms'}, }, }, },
+    'Fetch':                                    { 'parameters': { 4: { 'size': {'mechanism':'python-code', 'value':'(num_samples * num_wfms)'}, },
+                                                                  5: { 'size': {'mechanism':'python-code', 'value':'num_wfms'}, }, }, },
+    'FetchBinary8':                             { 'parameters': { 4: { 'size': {'mechanism':'python-code', 'value':'(num_samples * num_wfms)'}, },
+                                                                  5: { 'size': {'mechanism':'python-code', 'value':'num_wfms'}, }, }, },
+    'FetchBinary16':                            { 'parameters': { 4: { 'size': {'mechanism':'python-code', 'value':'(num_samples * num_wfms)'}, },
+                                                                  5: { 'size': {'mechanism':'python-code', 'value':'num_wfms'}, }, }, },
+    'FetchBinary32':                            { 'parameters': { 4: { 'size': {'mechanism':'python-code', 'value':'(num_samples * num_wfms)'}, },
+                                                                  5: { 'size': {'mechanism':'python-code', 'value':'num_wfms'}, }, }, },
 }
 
 # The extracted metadata is incorrect. Patch it here.
@@ -157,6 +161,7 @@ functions_default_value = {
                                                                        2: { 'default_value': 'datetime.timedelta(seconds=0.0)', }, }, },
     'Read':                                          { 'parameters': { 2: { 'default_value': 'datetime.timedelta(seconds=5.0)', }, }, },
     'Fetch':                                         { 'parameters': { 2: { 'default_value': 'datetime.timedelta(seconds=5.0)', }, }, },
+    'FetchArrayMeasurement':                         { 'parameters': { 2: { 'default_value': 'datetime.timedelta(seconds=5.0)', }, }, },
     'FetchBinary8':                                  { 'parameters': { 2: { 'default_value': 'datetime.timedelta(seconds=5.0)', }, }, },
     'FetchBinary16':                                 { 'parameters': { 2: { 'default_value': 'datetime.timedelta(seconds=5.0)', }, }, },
     'FetchBinary32':                                 { 'parameters': { 2: { 'default_value': 'datetime.timedelta(seconds=5.0)', }, }, },
@@ -241,6 +246,7 @@ functions_converters = {
 functions_additional_functions = {
     'FetchDouble': {
         'codegen_method': 'public',
+        'render_in_library': False,  # Implemented in Python only
         'returns': 'ViStatus',
         'parameters': [
             {
@@ -323,8 +329,710 @@ functions_additional_functions = {
             'note': 'Some functionality, such as time stamping, is not supported in all digitizers.',
         },
     },
+    'FetchMeasurements': {
+        'codegen_method': 'public',
+        'render_in_library': False,  # Implemented in Python only
+        'returns': 'ViStatus',
+        'parameters': [
+            {
+                'direction': 'in',
+                'name': 'vi',
+                'type': 'ViSession',
+                'documentation': {
+                    'description': 'The instrument handle you obtain from niScope_init that identifies a particular instrument session.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'channelList',
+                'type': 'ViChar[]',
+                'documentation': {
+                    'description': 'The channel to configure.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'Timeout',
+                'type': 'ViReal64',
+                'python_type': 'datetime.timedelta',
+                'default_value': 'datetime.timedelta(seconds=5.0)',
+                'documentation': {
+                    'description': 'The time to wait for data to be acquired, for each measurement; using 0 for this parameter tells NI-SCOPE to fetch whatever is currently available.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'scalarMeasFunctions',
+                'type': 'ViInt32[]',
+                'python_type': 'list of ScalarMeasurement',
+                'documentation': {
+                    'description': 'The scalar measurements to be performed on each fetched waveform.',
+                },
+            },
+            {
+                'direction': 'out',
+                'name': 'result',
+                'type': 'ViReal64',  # Type doesn't really matter for this function
+                'python_type': 'numpy.array(dtype=numpy.float64)',
+                'documentation': {
+                    'description': 'The value of each measurement for each waveform, with one row per measurement in **scalar_meas_functions** and one column per waveform.',
+                },
+            },
+            {
+                'direction': 'out',
+                'name': 'mean',
+                'type': 'ViReal64',  # Type doesn't really matter for this function
+                'python_type': 'numpy.array(dtype=numpy.float64)',
+                'documentation': {
+                    'description': 'The mean of each measurement over the fetched waveforms since the statistics were last cleared, with one row per measurement in **scalar_meas_functions** and one column per waveform.',
+                },
+            },
+            {
+                'direction': 'out',
+                'name': 'stdev',
+                'type': 'ViReal64',  # Type doesn't really matter for this function
+                'python_type': 'numpy.array(dtype=numpy.float64)',
+                'documentation': {
+                    'description': 'The standard deviation of each measurement, with one row per measurement in **scalar_meas_functions** and one column per waveform.',
+                },
+            },
+            {
+                'direction': 'out',
+                'name': 'min',
+                'type': 'ViReal64',  # Type doesn't really matter for this function
+                'python_type': 'numpy.array(dtype=numpy.float64)',
+                'documentation': {
+                    'description': 'The smallest value of each measurement, with one row per measurement in **scalar_meas_functions** and one column per waveform.',
+                },
+            },
+            {
+                'direction': 'out',
+                'name': 'max',
+                'type': 'ViReal64',  # Type doesn't really matter for this function
+                'python_type': 'numpy.array(dtype=numpy.float64)',
+                'documentation': {
+                    'description': 'The largest value of each measurement, with one row per measurement in **scalar_meas_functions** and one column per waveform.',
+                },
+            },
+            {
+                'direction': 'out',
+                'name': 'numInStats',
+                'type': 'ViReal64',  # Type doesn't really matter for this function
+                'python_type': 'numpy.array(dtype=numpy.int32)',
+                'documentation': {
+                    'description': 'The number of times each measurement has been taken, with one row per measurement in **scalar_meas_functions** and one column per waveform.',
+                },
+            },
+        ],
+        'documentation': {
+            'description': '''
+                Fetches several scalar measurements and their statistics, such as rise time, frequency and voltage
+                peak to peak. Returns one 2-D numpy array per statistic, indexed by [measurement, waveform]. The number
+                of waveforms is queried once and all measurements are fetched into the same preallocated arrays.
+
+                Example:
+
+                .. code-block:: python
+
+                    measurements = [niscope.ScalarMeasurement.RISE_TIME, niscope.ScalarMeasurement.FREQUENCY]
+                    result, mean, stdev, min, max, num_in_stats = session.channels['0,1'].fetch_measurements(measurements)
+                    rise_times = result[0]''',
+        },
+    },
+    'FetchArrayMeasurementDispatcher': {
+        'codegen_method': 'public',
+        'render_in_library': False,  # Implemented in Python only
+        'returns': 'ViStatus',
+        'parameters': [
+            {
+                'direction': 'in',
+                'name': 'vi',
+                'type': 'ViSession',
+                'documentation': {
+                    'description': 'The instrument handle you obtain from niScope_init that identifies a particular instrument session.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'channelList',
+                'type': 'ViChar[]',
+                'documentation': {
+                    'description': 'The channel to configure.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'Timeout',
+                'type': 'ViReal64',
+                'python_type': 'datetime.timedelta',
+                'default_value': 'datetime.timedelta(seconds=5.0)',
+                'documentation': {
+                    'description': 'The time to wait for data to be acquired; using 0 for this parameter tells NI-SCOPE to fetch whatever is currently available.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'arrayMeasFunction',
+                'type': 'ViInt32',
+                'documentation': {
+                    'description': 'The array measurement to perform, such as an FFT amplitude spectrum, a histogram or the average of several acquisitions.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'measWfmSize',
+                'type': 'ViInt32',
+                'documentation': {
+                    'description': 'The number of samples of each measurement waveform, computed from the size of **meas_wfm**.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'measWfm',
+                'type': 'ViReal64[]',
+                'documentation': {
+                    'description': '''
+                        C-contiguous numpy array of `numpy.float64` that receives the measurement waveforms, all samples of waveform 0 first.
+                        Its size must be a multiple of the number of waveforms, normally **actual_meas_wfm_size()** times the number of waveforms; a 2-D array of shape
+                        (number of waveforms, **actual_meas_wfm_size()**) can be used.
+
+                        Example:
+
+                        .. code-block:: python
+
+                            meas_wfm_size = session.actual_meas_wfm_size(niscope.ArrayMeasurement.FFT_AMP_SPECTRUM_DB)
+                            meas_wfm = numpy.zeros((2, meas_wfm_size))
+                            wfm_info = session.channels['0,1'].fetch_array_measurement_into(niscope.ArrayMeasurement.FFT_AMP_SPECTRUM_DB, meas_wfm)''',
+                },
+            },
+            {
+                'direction': 'out',
+                'name': 'wfmInfo',
+                'type': 'struct niScope_wfmInfo[]',
+                'documentation': {
+                    'description': 'Returns an array of WaveformInfo with the timing and scaling information of each measurement waveform. For spectra, **relative_initial_x** and **x_increment** are the start frequency and frequency step in Hz.',
+                },
+            },
+        ],
+        'documentation': {
+            'description': '''
+                Obtains a waveform from the digitizer and fetches the specified measurement array into a preallocated
+                numpy array. The measurement is computed by NI-SCOPE rather than in Python. This function may return
+                multiple waveforms depending on the number of channels, the acquisition type, and the number of records
+                you specify.''',
+        },
+    },
     'FetchDispatcher': {
         'codegen_method': 'public',
+        'render_in_library': False,  # Implemented in Python only
+        'returns': 'ViStatus',
+        'parameters': [
+            {
+                'direction': 'in',
+                'name': 'vi',
+                'type': 'ViSession',
+                'documentation': {
+                    'description': 'The instrument handle you obtain from niScope_init that identifies a particular instrument session.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'channelList',
+                'type': 'ViChar[]',
+                'documentation': {
+                    'description': 'The channel to configure.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'Timeout',
+                'type': 'ViReal64',
+                'default_value': 'datetime.timedelta(seconds=5.0)',
+                'documentation': {
+                    'description': 'The time to wait in seconds for data to be acquired; using 0 for this parameter tells NI-SCOPE to fetch whatever is currently available. Using -1 for this parameter implies infinite timeout.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'numSamples',
+                'type': 'ViInt32',
+                'documentation': {
+                    'description': 'The maximum number of samples to fetch for each waveform. If the acquisition finishes with fewer points than requested, some devices return partial data if the acquisition finished, was aborted, or a timeout of 0 was used. If it fails to complete within the timeout period, the function throws an exception.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'Wfm',
+                'type': 'ViReal64[]', # Type doesn't really matter for this function
+                'documentation': {
+                    'description': '''
+                        numpy array of the appropriate type and size the should be acquired as a 1D array. Size should be **num_samples** times number of waveforms. Call niScope_ActualNumWfms to determine the number of waveforms.
+
+                        Types supported are
+
+                        - `numpy.float64`
+                        - `numpy.int8`
+                        - `numpy.in16`
+                        - `numpy.int32`
+
+                        Example:
+
+                        .. code-block:: python
+
+                            wfm = numpy.ndarray(num_samples * session.actual_num_wfms(), dtype=numpy.float64)
+                            wfm_info = session['0,1'].fetch_into(num_samples, wfms, timeout=5.0)''',
+                },
+            },
+            {
+                'direction': 'out',
+                'name': 'wfmInfo',
+                'type': 'struct niScope_wfmInfo[]',
+                'documentation': {
+                    'description': '''
+                    Returns an array of classed with the following timing and scaling information about each waveform:
+
+                    -  **relative_initial_x** the time (in seconds) from the trigger to the first sample in the fetched waveform
+                    -  **absolute_initial_x** timestamp (in seconds) of the first fetched sample. This timestamp is comparable between records and acquisitions; devices that do not support this parameter use 0 for this output.
+                    -  **x_increment** the time between points in the acquired waveform in seconds -  **actual_samples** the actual number of samples fetched and placed in the waveform array
+                    -  **gain** the gain factor of the given channel; useful for scaling binary data with the following formula:
+
+                        .. math::
+
+                            voltage = binary data * gain factor + offset
+
+                    -  **offset** the offset factor of the given channel; useful for scaling binary data with the following formula:
+
+                        .. math::
+
+                            voltage = binary data * gain factor + offset
+
+                    Call niScope_ActualNumWfms to determine the size of this array.''',
+                },
+            },
+        ],
+        'documentation': {
+            'description': '''
+                Returns the waveform from a previously initiated acquisition that the
+                digitizer acquires for the specified channel. This function returns
+                scaled voltage waveforms.
+
+                This function may return multiple waveforms depending on the number of
+                channels, the acquisition type, and the number of records you specify.''',
+            'note': 'Some functionality, such as time stamping, is not supported in all digitizers.',
+        },
+    },
+    'FetchBufferPool': {
+        'codegen_method': 'public',
+        'render_in_library': False,  # Implemented in Python only
+        'returns': 'ViStatus',
+        'parameters': [
+            {
+                'direction': 'in',
+                'name': 'vi',
+                'type': 'ViSession',
+                'documentation': {
+                    'description': 'The instrument handle you obtain from niScope_init that identifies a particular instrument session.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'channelList',
+                'type': 'ViChar[]',
+                'documentation': {
+                    'description': 'The channel to configure.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'numSamples',
+                'type': 'ViInt32',
+                'documentation': {
+                    'description': 'The number of samples to fetch for each waveform on every call to **fetch()** of the pool.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'dtype',
+                'type': 'ViInt32',  # Type doesn't really matter for this function
+                'python_type': 'numpy.dtype',
+                'default_value': None,
+                'documentation': {
+                    'description': '''
+                        Type of the samples. None means `numpy.float64` (scaled voltages).
+
+                        Types supported are
+
+                        - `numpy.float64`
+                        - `numpy.int8`
+                        - `numpy.int16`
+                        - `numpy.int32`''',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'numBuffers',
+                'type': 'ViInt32',
+                'default_value': 2,
+                'documentation': {
+                    'description': 'The number of buffers in the ring. Data returned by **fetch()** stays valid until **num_buffers** more fetches have been made.',
+                },
+            },
+            {
+                'direction': 'out',
+                'name': 'bufferPool',
+                'type': 'ViSession',  # Type doesn't really matter for this function
+                'python_type': 'niscope.fetch_buffer_pool.FetchBufferPool',
+                'documentation': {
+                    'description': '''
+                        Object whose **fetch(timeout=datetime.timedelta(seconds=5.0))** method fetches into the next buffer of the ring and
+                        returns the waveform array and a numpy structured array with the waveform information for that buffer, i.e. `wfm_info['gain']`.
+                        Both are overwritten in place by later fetches.
+
+                        Example:
+
+                        .. code-block:: python
+
+                            pool = session.channels['0,1'].fetch_buffer_pool(num_samples, dtype=numpy.int16)
+                            with session.initiate():
+                                for i in range(num_fetches):
+                                    wfm, wfm_info = pool.fetch()''',
+                },
+            },
+        ],
+        'documentation': {
+            'description': '''
+                Returns a pool of buffers that are allocated once for repeated fetches of **num_samples**
+                samples per waveform. The sample buffers and the waveform information structures are reused
+                by every fetch, so a continuous acquisition does not allocate memory for each fetch.
+
+                The number of waveforms is queried when the pool is created. Create a new pool after changing
+                the channels or the number of records.''',
+        },
+    },
+    'FetchScaled': {
+        'codegen_method': 'public',
+        'render_in_library': False,  # Implemented in Python only
+        'returns': 'ViStatus',
+        'parameters': [
+            {
+                'direction': 'in',
+                'name': 'vi',
+                'type': 'ViSession',
+                'documentation': {
+                    'description': 'The instrument handle you obtain from niScope_init that identifies a particular instrument session.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'channelList',
+                'type': 'ViChar[]',
+                'documentation': {
+                    'description': 'The channel to configure.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'Wfm',
+                'type': 'ViReal64[]',  # Type doesn't really matter for this function
+                'python_type': 'numpy.array',
+                'documentation': {
+                    'description': '''
+                        numpy array of dtype `numpy.float64` or `numpy.float32` that receives the scaled voltages as a 1D array. Size should be **num_samples** times number of waveforms.
+
+                        Example:
+
+                        .. code-block:: python
+
+                            wfm = numpy.ndarray(num_samples * num_wfms, dtype=numpy.float32)
+                            wfm_info = session.channels['0,1'].fetch_scaled_into(wfm)''',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'Timeout',
+                'type': 'ViReal64',
+                'python_type': 'datetime.timedelta',
+                'default_value': 'datetime.timedelta(seconds=5.0)',
+                'documentation': {
+                    'description': 'The time to wait in seconds for data to be acquired; using 0 for this parameter tells NI-SCOPE to fetch whatever is currently available. Using -1 for this parameter implies infinite timeout.',
+                },
+            },
+            {
+                'direction': 'out',
+                'name': 'wfmInfo',
+                'type': 'struct niScope_wfmInfo[]',
+                'python_type': 'numpy.array',
+                'documentation': {
+                    'description': 'Structured array with the timing and scaling information for each waveform. See niscope.waveform_info.as_numpy_array().',
+                },
+            },
+        ],
+        'documentation': {
+            'description': '''
+                Fetches 16-bit binary data from a previously initiated acquisition and scales it to voltages
+                in **wfm**, using the gain and offset of each waveform:
+
+                .. math::
+
+                    voltage = binary data * gain factor + offset
+
+                Compared to fetch_into() with a `numpy.float64` array, a quarter of the data is transferred
+                from the driver and the scaling is done with numpy for all waveforms at once.''',
+        },
+    },
+    'FetchStream': {
+        'codegen_method': 'public',
+        'render_in_library': False,  # Implemented in Python only
+        'returns': 'ViStatus',
+        'parameters': [
+            {
+                'direction': 'in',
+                'name': 'vi',
+                'type': 'ViSession',
+                'documentation': {
+                    'description': 'The instrument handle you obtain from niScope_init that identifies a particular instrument session.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'channelList',
+                'type': 'ViChar[]',
+                'documentation': {
+                    'description': 'The channel to configure.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'samplesPerChunk',
+                'type': 'ViInt32',
+                'documentation': {
+                    'description': 'The maximum number of samples of each waveform in a chunk. Fewer samples are returned when only fewer have been acquired or are left in the record.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'dtype',
+                'type': 'ViInt32',  # Type doesn't really matter for this function
+                'python_type': 'numpy.dtype',
+                'default_value': None,
+                'documentation': {
+                    'description': 'Type of the samples: `numpy.float64` (the default when None), `numpy.int8`, `numpy.int16` or `numpy.int32`.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'numBuffers',
+                'type': 'ViInt32',
+                'default_value': 4,
+                'documentation': {
+                    'description': 'The number of preallocated buffers the chunks are fetched into. The data of a chunk stays valid until **num_buffers** more chunks have been fetched.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'Timeout',
+                'type': 'ViReal64',
+                'python_type': 'datetime.timedelta',
+                'default_value': 'datetime.timedelta(seconds=5.0)',
+                'documentation': {
+                    'description': 'The time to wait for the samples of a chunk when none have been acquired yet.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'continuous',
+                'type': 'ViBoolean',
+                'default_value': False,
+                'documentation': {
+                    'description': 'If False, fetching ends after the last of **horz_num_records** records. If True, it goes on with the next record after every record until you stop iterating, for indefinite acquisitions that acquire more records than fit in the onboard memory.',
+                },
+            },
+            {
+                'direction': 'out',
+                'name': 'chunks',
+                'type': 'ViSession',  # Type doesn't really matter for this function
+                'python_type': 'generator',
+                'documentation': {
+                    'description': '''
+                        Generator of `StreamChunk` named tuples with the following fields:
+
+                        -  **wfm** the samples of each waveform in the chunk, all samples of waveform 0 first
+                        -  **wfm_info** numpy structured array with the timing and scaling information for each waveform
+                        -  **record_number** the record the samples belong to
+                        -  **offset** the position of the first sample of the chunk in the record
+                        -  **backlog** the number of samples of the record acquired but not fetched yet, after this chunk
+
+                        Example:
+
+                        .. code-block:: python
+
+                            with session.initiate():
+                                for chunk in session.channels['0'].stream(samples_per_chunk=100000, dtype=numpy.int16):
+                                    process(chunk.wfm)''',
+                },
+            },
+        ],
+        'documentation': {
+            'description': '''
+                Fetches the records of an initiated acquisition in chunks, for acquisitions that are too long to
+                fetch at once. For each record, the generator reads **backlog** and fetches what has been
+                acquired, up to **samples_per_chunk** samples, relative to the read pointer. When nothing has
+                been acquired yet it waits up to **timeout** for a full chunk.
+
+                The generator sets **fetch_relative_to**, **fetch_offset**, **fetch_record_number** and
+                **fetch_num_records**, and ends after the last of **horz_num_records** records of
+                **horz_record_length** samples. With **continuous** set to True it keeps fetching the next
+                record instead, for acquisitions configured with **allow_more_records_than_memory** that run
+                until they are aborted. Stop iterating to stop fetching. The four fetch properties are set back
+                to their previous values when the generator finishes or is closed.
+
+                Before each chunk, the samples acquired but not fetched, the **backlog** of the record plus the
+                records done after it, are compared to the samples of each waveform that fit in
+                **onboard_memory_size**. When the stream has fallen that far behind, samples it has not fetched
+                were overwritten, and the generator raises `niscope.fetch_buffer_pool.StreamOverflowError`.''',
+            'note': 'The onboard memory is divided among the channels acquired. The overflow check assumes that they are the channels being streamed. If other channels are enabled too, samples can be overwritten before the check detects it, and the fetch raises the error of the driver instead.',
+        },
+    },
+    'FetchPipeline': {
+        'codegen_method': 'public',
+        'render_in_library': False,  # Implemented in Python only
+        'returns': 'ViStatus',
+        'parameters': [
+            {
+                'direction': 'in',
+                'name': 'vi',
+                'type': 'ViSession',
+                'documentation': {
+                    'description': 'The instrument handle you obtain from niScope_init that identifies a particular instrument session.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'channelList',
+                'type': 'ViChar[]',
+                'documentation': {
+                    'description': 'The channel to configure.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'samplesPerChunk',
+                'type': 'ViInt32',
+                'documentation': {
+                    'description': 'The maximum number of samples of each waveform in a chunk. Fewer samples are returned when only fewer have been acquired or are left in the record.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'dtype',
+                'type': 'ViInt32',  # Type doesn't really matter for this function
+                'python_type': 'numpy.dtype',
+                'default_value': None,
+                'documentation': {
+                    'description': 'Type of the samples: `numpy.float64` (the default when None), `numpy.int8`, `numpy.int16` or `numpy.int32`.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'numBuffers',
+                'type': 'ViInt32',
+                'default_value': 4,
+                'documentation': {
+                    'description': 'The number of preallocated buffers, which bounds the number of chunks fetched ahead of the consumer.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'dropWhenFull',
+                'type': 'ViBoolean',
+                'default_value': False,
+                'documentation': {
+                    'description': 'What the background thread does when all buffers hold chunks that have not been consumed. If False, it waits for the consumer. If True, it reuses the buffer of the oldest waiting chunk so that the driver keeps being drained, and counts the chunk in **dropped_count**.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'Timeout',
+                'type': 'ViReal64',
+                'python_type': 'datetime.timedelta',
+                'default_value': 'datetime.timedelta(seconds=5.0)',
+                'documentation': {
+                    'description': 'The time to wait for the samples of a chunk when none have been acquired yet.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'continuous',
+                'type': 'ViBoolean',
+                'default_value': False,
+                'documentation': {
+                    'description': 'If False, fetching ends after the last of **horz_num_records** records. If True, it goes on with the next record after every record until you stop iterating, for indefinite acquisitions that acquire more records than fit in the onboard memory.',
+                },
+            },
+            {
+                'direction': 'out',
+                'name': 'pipeline',
+                'type': 'ViSession',  # Type doesn't really matter for this function
+                'python_type': 'niscope.pipeline.AcquisitionPipeline',
+                'documentation': {
+                    'description': '''
+                        Iterable of the same `StreamChunk` named tuples as stream(). The data of a chunk stays valid until the next chunk is requested.
+                        It also has **fetched_count**, **dropped_count**, **consumed_count** and **backlog** (chunks waiting) properties, and **abort()**,
+                        which stops the background thread and is called when leaving a with block.
+
+                        Example:
+
+                        .. code-block:: python
+
+                            with session.initiate():
+                                with session.channels['0'].fetch_pipeline(samples_per_chunk=100000, dtype=numpy.int16) as pipeline:
+                                    for chunk in pipeline:
+                                        process(chunk.wfm)''',
+                },
+            },
+        ],
+        'documentation': {
+            'description': '''
+                Fetches the records of an initiated acquisition in chunks on a background thread, like stream(),
+                into a bounded set of preallocated buffers. The calling thread processes earlier chunks while the
+                next ones are fetched. Errors raised by the fetch are raised again when iterating.
+
+                Like stream(), it sets **fetch_relative_to**, **fetch_offset**, **fetch_record_number** and
+                **fetch_num_records** when called, and sets them back to their previous values once the background
+                thread stops, after the last chunk, an error or abort(). It also fetches indefinitely with
+                **continuous** set to True, and raises `niscope.fetch_buffer_pool.StreamOverflowError` when
+                iterating once the samples not fetched no longer fit in the onboard memory.''',
+        },
+    },
+    'FetchChunks': {
+        'codegen_method': 'private',
+        'render_in_library': False,  # Implemented in Python only
+        'returns': 'ViStatus',
+        'parameters': [
+            {
+                'direction': 'in',
+                'name': 'vi',
+                'type': 'ViSession',
+                'documentation': {
+                    'description': 'The instrument handle you obtain from niScope_init that identifies a particular instrument session.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'channelList',
+                'type': 'ViChar[]',
+                'documentation': {
+                    'description': 'The channel to configure.',
+                },
+            },
+        ],
+        'documentation': {
+            'description': 'Walks the records of an acquisition in chunks. Used by stream() and fetch_pipeline().',
+        },
+    },
+    'FetchRecordBatches': {
+        'codegen_method': 'public',
+        'render_in_library': False,  # Implemented in Python only
         'returns': 'ViStatus',
         'parameters': [
             {
@@ -343,82 +1051,282 @@ functions_additional_functions = {
                     'description': 'The channel to configure.',
                 },
             },
+            {
+                'direction': 'in',
+                'name': 'recordsPerFetch',
+                'type': 'ViInt32',
+                'default_value': 100,
+                'documentation': {
+                    'description': 'The maximum number of records in a batch. Fewer records are returned when only fewer are done or left in the acquisition.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'numSamples',
+                'type': 'ViInt32',
+                'default_value': None,
+                'documentation': {
+                    'description': 'The number of samples to fetch for each waveform. None means **horz_record_length**.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'dtype',
+                'type': 'ViInt32',  # Type doesn't really matter for this function
+                'python_type': 'numpy.dtype',
+                'default_value': None,
+                'documentation': {
+                    'description': 'Type of the samples: `numpy.float64` (the default when None), `numpy.int8`, `numpy.int16` or `numpy.int32`.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'numBuffers',
+                'type': 'ViInt32',
+                'default_value': 2,
+                'documentation': {
+                    'description': 'The number of preallocated buffers the batches are fetched into. The data of a batch stays valid until **num_buffers** more batches have been fetched.',
+                },
+            },
             {
                 'direction': 'in',
                 'name': 'Timeout',
                 'type': 'ViReal64',
+                'python_type': 'datetime.timedelta',
                 'default_value': 'datetime.timedelta(seconds=5.0)',
                 'documentation': {
-                    'description': 'The time to wait in seconds for data to be acquired; using 0 for this parameter tells NI-SCOPE to fetch whatever is currently available. Using -1 for this parameter implies infinite timeout.',
+                    'description': 'The time to wait for the records of a batch when none are done yet.',
+                },
+            },
+            {
+                'direction': 'out',
+                'name': 'batches',
+                'type': 'ViSession',  # Type doesn't really matter for this function
+                'python_type': 'generator',
+                'documentation': {
+                    'description': '''
+                        Generator of `RecordBatch` named tuples with the fields
+
+                        - **wfm** numpy array of shape (records in the batch, waveforms per record, num_samples)
+                        - **wfm_info** numpy structured array of shape (records in the batch, waveforms per record) with fields named like the attributes of WaveformInfo
+                        - **record_number** the first record of the batch
+                        - **records_pending** the number of records that were done but not in the batch
+
+                        Example:
+
+                        .. code-block:: python
+
+                            with session.initiate():
+                                for batch in session.channels['0,1'].fetch_record_batches(records_per_fetch=1000, dtype=numpy.int16):
+                                    process(batch.wfm)''',
+                },
+            },
+        ],
+        'documentation': {
+            'description': '''
+                Fetches the records of an initiated acquisition in batches of at most **records_per_fetch** records, using
+                **fetch_record_number** and **fetch_num_records**, into a bounded set of preallocated buffers. Each batch
+                holds the records that are done (**records_done**) when it is fetched, so batches are yielded while the
+                acquisition is still running and memory use does not grow with **horz_num_records**.
+
+                The generator also sets **fetch_relative_to** and **fetch_offset**, and sets the four fetch properties back to
+                their previous values when it finishes or is closed.''',
+        },
+    },
+    'WaveformRecorder': {
+        'codegen_method': 'public',
+        'render_in_library': False,  # Implemented in Python only
+        'returns': 'ViStatus',
+        'parameters': [
+            {
+                'direction': 'in',
+                'name': 'vi',
+                'type': 'ViSession',
+                'documentation': {
+                    'description': 'The instrument handle you obtain from niScope_init that identifies a particular instrument session.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'channelList',
+                'type': 'ViChar[]',
+                'documentation': {
+                    'description': 'The channel to configure.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'path',
+                'type': 'ViConstString',
+                'documentation': {
+                    'description': 'Path of the .npy file created for the samples. An existing file is overwritten.',
                 },
             },
             {
                 'direction': 'in',
                 'name': 'numSamples',
                 'type': 'ViInt32',
+                'default_value': None,
                 'documentation': {
-                    'description': 'The maximum number of samples to fetch for each waveform. If the acquisition finishes with fewer points than requested, some devices return partial data if the acquisition finished, was aborted, or a timeout of 0 was used. If it fails to complete within the timeout period, the function throws an exception.',
+                    'description': 'The number of samples to record for each waveform. None means **horz_record_length**.',
                 },
             },
             {
                 'direction': 'in',
-                'name': 'Wfm',
-                'type': 'ViReal64[]', # Type doesn't really matter for this function
+                'name': 'numRecords',
+                'type': 'ViInt32',
+                'default_value': None,
+                'documentation': {
+                    'description': 'The number of records to record. None means **horz_num_records**.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'dtype',
+                'type': 'ViInt32',  # Type doesn't really matter for this function
+                'python_type': 'numpy.dtype',
+                'default_value': None,
                 'documentation': {
                     'description': '''
-                        numpy array of the appropriate type and size the should be acquired as a 1D array. Size should be **num_samples** times number of waveforms. Call niScope_ActualNumWfms to determine the number of waveforms.
+                        Type of the samples. None means `numpy.int16` (binary16), which can be scaled to voltages with the gain and offset in the index.
 
                         Types supported are
 
                         - `numpy.float64`
                         - `numpy.int8`
-                        - `numpy.in16`
-                        - `numpy.int32`
-
-                        Example:
-
-                        .. code-block:: python
-
-                            wfm = numpy.ndarray(num_samples * session.actual_num_wfms(), dtype=numpy.float64)
-                            wfm_info = session['0,1'].fetch_into(num_samples, wfms, timeout=5.0)''',
+                        - `numpy.int16`
+                        - `numpy.int32`''',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'recordsPerFetch',
+                'type': 'ViInt32',
+                'default_value': 1,
+                'documentation': {
+                    'description': 'The number of records fetched by each call to the driver.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'indexPath',
+                'type': 'ViConstString',
+                'default_value': None,
+                'documentation': {
+                    'description': 'Path of the .npy file created for the waveform information. None means **path** with its extension replaced by `_wfm_info.npy`.',
                 },
             },
             {
                 'direction': 'out',
-                'name': 'wfmInfo',
-                'type': 'struct niScope_wfmInfo[]',
+                'name': 'recorder',
+                'type': 'ViSession',  # Type doesn't really matter for this function
+                'python_type': 'niscope.waveform_recorder.WaveformRecorder',
                 'documentation': {
                     'description': '''
-                    Returns an array of classed with the following timing and scaling information about each waveform:
-
-                    -  **relative_initial_x** the time (in seconds) from the trigger to the first sample in the fetched waveform
-                    -  **absolute_initial_x** timestamp (in seconds) of the first fetched sample. This timestamp is comparable between records and acquisitions; devices that do not support this parameter use 0 for this output.
-                    -  **x_increment** the time between points in the acquired waveform in seconds -  **actual_samples** the actual number of samples fetched and placed in the waveform array
-                    -  **gain** the gain factor of the given channel; useful for scaling binary data with the following formula:
-
-                        .. math::
-
-                            voltage = binary data * gain factor + offset
-
-                    -  **offset** the offset factor of the given channel; useful for scaling binary data with the following formula:
+                        Object whose **record(timeout=datetime.timedelta(seconds=5.0))** method fetches all records into the files, and
+                        **record_next(timeout)** fetches the next **records_per_fetch** records. The samples file has shape
+                        (num_records, num_wfms_per_record, num_samples). The index file holds a structured array of shape
+                        (num_records, num_wfms_per_record) with fields named like the attributes of WaveformInfo, i.e. `index['gain']`.
+                        Leaving a with block flushes and closes both files.
 
-                        .. math::
+                        Example:
 
-                            voltage = binary data * gain factor + offset
+                        .. code-block:: python
 
-                    Call niScope_ActualNumWfms to determine the size of this array.''',
+                            with session.initiate():
+                                with session.channels['0,1'].waveform_recorder('capture.npy', records_per_fetch=100) as recorder:
+                                    recorder.record()
+                            wfm = numpy.load('capture.npy', mmap_mode='r')
+                            index = numpy.load('capture_wfm_info.npy', mmap_mode='r')''',
                 },
             },
         ],
         'documentation': {
             'description': '''
-                Returns the waveform from a previously initiated acquisition that the
-                digitizer acquires for the specified channel. This function returns
-                scaled voltage waveforms.
+                Creates a recorder that fetches the records of an acquisition into memory-mapped .npy files: one for the samples
+                and a sidecar index with the waveform information of each waveform, such as timestamps, gain, offset and
+                actual samples. The driver fetches directly into the mapped files, so captures larger than memory can be recorded.
 
-                This function may return multiple waveforms depending on the number of
-                channels, the acquisition type, and the number of records you specify.''',
-            'note': 'Some functionality, such as time stamping, is not supported in all digitizers.',
+                The recorder sets **fetch_relative_to**, **fetch_offset**, **fetch_record_number** and **fetch_num_records**
+                for each fetch, and sets them back to their values from before it was created when it is closed.''',
+        },
+    },
+    'ConfigureFetchRecords': {
+        'codegen_method': 'private',
+        'render_in_library': False,  # Implemented in Python only
+        'returns': 'ViStatus',
+        'parameters': [
+            {
+                'direction': 'in',
+                'name': 'vi',
+                'type': 'ViSession',
+                'documentation': {
+                    'description': 'The instrument handle you obtain from niScope_init that identifies a particular instrument session.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'channelList',
+                'type': 'ViChar[]',
+                'documentation': {
+                    'description': 'The channel to configure.',
+                },
+            },
+        ],
+        'documentation': {
+            'description': 'Sets the fetch properties to fetch a range of whole records. Used by fetch_record_batches() and WaveformRecorder.',
+        },
+    },
+    'SaveFetchProperties': {
+        'codegen_method': 'private',
+        'render_in_library': False,  # Implemented in Python only
+        'returns': 'ViStatus',
+        'parameters': [
+            {
+                'direction': 'in',
+                'name': 'vi',
+                'type': 'ViSession',
+                'documentation': {
+                    'description': 'The instrument handle you obtain from niScope_init that identifies a particular instrument session.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'channelList',
+                'type': 'ViChar[]',
+                'documentation': {
+                    'description': 'The channel to configure.',
+                },
+            },
+        ],
+        'documentation': {
+            'description': 'Returns a function that sets the fetch properties back to their current values. Used by the methods that change them.',
+        },
+    },
+    'FetchIntoBuffers': {
+        'codegen_method': 'private',
+        'render_in_library': False,  # Implemented in Python only
+        'returns': 'ViStatus',
+        'parameters': [
+            {
+                'direction': 'in',
+                'name': 'vi',
+                'type': 'ViSession',
+                'documentation': {
+                    'description': 'The instrument handle you obtain from niScope_init that identifies a particular instrument session.',
+                },
+            },
+            {
+                'direction': 'in',
+                'name': 'channelList',
+                'type': 'ViChar[]',
+                'documentation': {
+                    'description': 'The channel to configure.',
+                },
+            },
+        ],
+        'documentation': {
+            'description': 'Fetches into preallocated buffers. Used by FetchBufferPool.',
         },
     },
 }
@@ -426,22 +1334,33 @@ functions_additional_functions = {
 # Override the 'python' name for some functions.
 functions_python_name = {
     'FetchDispatcher':            { 'python_name': 'fetch',                           },
+    'FetchArrayMeasurementDispatcher': { 'python_name': 'fetch_array_measurement',    },
     'FetchDouble':                { 'python_name': 'fetch',                           },
+    'FetchStream':                { 'python_name': 'stream',                          },
 }
 
 functions_method_templates = {
     'FetchBinary8':                                  { 'method_templates': [
-        { 'session_filename': 'numpy_read_method', 'method_python_name_suffix': '_into', },
+        { 'session_filename': 'numpy_read_method', 'method_python_name_suffix': '_into', 'python_code_variables_as_parameters': True, },
     ], },
     'FetchBinary16':                                 { 'method_templates': [
-        { 'session_filename': 'numpy_read_method', 'method_python_name_suffix': '_into', },
+        { 'session_filename': 'numpy_read_method', 'method_python_name_suffix': '_into', 'python_code_variables_as_parameters': True, },
     ], },
     'FetchBinary32':                                 { 'method_templates': [
-        { 'session_filename': 'numpy_read_method', 'method_python_name_suffix': '_into', },
+        { 'session_filename': 'numpy_read_method', 'method_python_name_suffix': '_into', 'python_code_variables_as_parameters': True, },
     ], },
     'Fetch':                { 'method_templates': [
         { 'session_filename': 'default_method', 'method_python_name_suffix': '', },
-        { 'session_filename': 'numpy_read_method', 'method_python_name_suffix': '_into', },
+        { 'session_filename': 'numpy_read_method', 'method_python_name_suffix': '_into', 'python_code_variables_as_parameters': True, },
+    ], },
+    'FetchArrayMeasurement':                         { 'method_templates': [
+        { 'session_filename': 'numpy_read_method', 'method_python_name_suffix': '_into', 'python_code_variables_as_parameters': True, },
+    ], },
+    'FetchMeasurements':                             { 'method_templates': [
+        { 'session_filename': 'fetch_measurements', 'documentation_filename': 'default_method', 'method_python_name_suffix': '', },
+    ], },
+    'FetchArrayMeasurementDispatcher':               { 'method_templates': [
+        { 'session_filename': 'fetch_array_measurement', 'documentation_filename': 'default_method', 'method_python_name_suffix': '_into', },
     ], },
     'FetchDispatcher':                               { 'method_templates': [
         { 'session_filename': 'fetch_waveform', 'documentation_filename': 'default_method', 'method_python_name_suffix': '_into', },
@@ -449,6 +1368,56 @@ functions_method_templates = {
     'FetchDouble':                                   { 'method_templates': [
         { 'session_filename': 'fetch_double', 'documentation_filename': 'default_method', 'method_python_name_suffix': '', },
     ], },
+    'FetchBufferPool':                               { 'method_templates': [
+        { 'session_filename': 'fetch_buffer_pool', 'documentation_filename': 'default_method', 'method_python_name_suffix': '', },
+    ], },
+    'FetchScaled':                                   { 'method_templates': [
+        { 'session_filename': 'fetch_scaled', 'documentation_filename': 'default_method', 'method_python_name_suffix': '_into', },
+    ], },
+    'FetchStream':                                   { 'method_templates': [
+        { 'session_filename': 'stream', 'documentation_filename': 'default_method', 'method_python_name_suffix': '', },
+    ], },
+    'FetchPipeline':                                 { 'method_templates': [
+        { 'session_filename': 'fetch_pipeline', 'documentation_filename': 'default_method', 'method_python_name_suffix': '', },
+    ], },
+    'FetchChunks':                                   { 'method_templates': [
+        { 'session_filename': 'fetch_chunks', 'method_python_name_suffix': '', },
+    ], },
+    'FetchRecordBatches':                            { 'method_templates': [
+        { 'session_filename': 'fetch_record_batches', 'documentation_filename': 'default_method', 'method_python_name_suffix': '', },
+    ], },
+    'WaveformRecorder':                              { 'method_templates': [
+        { 'session_filename': 'waveform_recorder', 'documentation_filename': 'default_method', 'method_python_name_suffix': '', },
+    ], },
+    'ConfigureFetchRecords':                         { 'method_templates': [
+        { 'session_filename': 'configure_fetch_records', 'method_python_name_suffix': '', },
+    ], },
+    'SaveFetchProperties':                           { 'method_templates': [
+        { 'session_filename': 'save_fetch_properties', 'method_python_name_suffix': '', },
+    ], },
+    'FetchIntoBuffers':                              { 'method_templates': [
+        { 'session_filename': 'fetch_into_buffers', 'method_python_name_suffix': '', },
+    ], },
+    'ActualNumWfms':                                 { 'method_templates': [
+        { 'session_filename': 'default_method', 'documentation_filename': 'default_method', 'method_python_name_suffix': '', },
+        { 'session_filename': 'cached_method', 'method_python_name_suffix': '_cached', },
+    ], },
+}
+
+# The number of waveforms is queried once per call and used to size all the buffers. _actual_num_wfms_cached()
+# returns it from the attribute cache when that is enabled; the cache is cleared whenever the configuration changes.
+# The private _into methods take num_wfms as an optional keyword argument so that fetch_into() and
+# fetch_array_measurement_into(), which need the count themselves, don't query it a second time.
+functions_python_code_variables = {
+    'Fetch':                                         { 'python_code_variables': [('num_wfms', 'self._actual_num_wfms_cached()'), ], },
+    'FetchArrayMeasurement':                         { 'python_code_variables': [('num_wfms', 'self._actual_num_wfms_cached()'), ], },
+    'FetchBinary8':                                  { 'python_code_variables': [('num_wfms', 'self._actual_num_wfms_cached()'), ], },
+    'FetchBinary16':                                 { 'python_code_variables': [('num_wfms', 'self._actual_num_wfms_cached()'), ], },
+    'FetchBinary32':                                 { 'python_code_variables': [('num_wfms', 'self._actual_num_wfms_cached()'), ], },
+    'FetchMeasurement':                              { 'python_code_variables': [('num_wfms', 'self._actual_num_wfms_cached()'), ], },
+    'FetchMeasurementStats':                         { 'python_code_variables': [('num_wfms', 'self._actual_num_wfms_cached()'), ], },
+    'Read':                                          { 'python_code_variables': [('num_wfms', 'self._actual_num_wfms_cached()'), ], },
+    'ReadMeasurement':                               { 'python_code_variables': [('num_wfms', 'self._actual_num_wfms_cached()'), ], },
 }
 
 # We don't want the size parameter to be used in the public api for fetch
@@ -456,6 +1425,7 @@ functions_method_templates = {
 #  to calculate the size in the dispatcher function
 functions_into_size_params = {
     'FetchDispatcher':                               { 'parameters': { 3: { 'use_in_python_api': False, }, }, },
+    'FetchArrayMeasurementDispatcher':               { 'parameters': { 4: { 'use_in_python_api': False, }, }, },
 }
 
 functions_numpy = {
@@ -464,6 +1434,8 @@ functions_numpy = {
     'FetchBinary32':                                 { 'parameters': { 4: { 'numpy': True, }, }, },
     'Fetch':                                         { 'parameters': { 4: { 'numpy': True, }, }, },
     'FetchDispatcher':                               { 'parameters': { 4: { 'numpy': True, }, }, },
+    'FetchArrayMeasurement':                         { 'parameters': { 5: { 'numpy': True, }, }, },
+    'FetchArrayMeasurementDispatcher':               { 'parameters': { 5: { 'numpy': True, }, }, },
 }
 
 # Parameter that need to be array.array
@@ -477,4 +1449,36 @@ functions_array = {
     'ReadMeasurement':                               { 'parameters': { 4: { 'use_array': True, }, }, },
 }
 
+# Functions that block until the driver completes an operation (fetch, read, wait, self-calibration).
+# Their documentation describes how they behave when called from multiple threads.
+functions_blocking = {
+    'AutoSetup':             { 'blocking': True, },
+    'CalSelfCalibrate':      { 'blocking': True, },
+    'FetchArrayMeasurementDispatcher': { 'blocking': True, },
+    'FetchDispatcher':       { 'blocking': True, },
+    'FetchDouble':           { 'blocking': True, },
+    'FetchScaled':           { 'blocking': True, },
+    'FetchMeasurement':      { 'blocking': True, },
+    'FetchMeasurementStats': { 'blocking': True, },
+    'FetchMeasurements':     { 'blocking': True, },
+    'Read':                  { 'blocking': True, },
+    'ReadMeasurement':       { 'blocking': True, },
+    'self_test':             { 'blocking': True, },
+}
+
+# Functions that can change property values in the driver. Calling them clears the session attribute cache.
+functions_invalidates_attribute_cache = {
+    'reset':               { 'invalidates_attribute_cache': True, },
+    'ResetDevice':         { 'invalidates_attribute_cache': True, },
+    'ResetWithDefaults':   { 'invalidates_attribute_cache': True, },
+    'Commit':              { 'invalidates_attribute_cache': True, },
+    'InitiateAcquisition': { 'invalidates_attribute_cache': True, },
+    'Disable':             { 'invalidates_attribute_cache': True, },
+    'self_test':           { 'invalidates_attribute_cache': True, },
+    'AutoSetup':           { 'invalidates_attribute_cache': True, },
+    'CalSelfCalibrate':    { 'invalidates_attribute_cache': True, },
+    'Configure.+':         { 'invalidates_attribute_cache': True, },  # All Configure functions set properties
+    'SetAttributeVi.+':    { 'invalidates_attribute_cache': True, },
+    'ExportSignal':        { 'invalidates_attribute_cache': True, },
+}
 
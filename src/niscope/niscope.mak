@@ -4,7 +4,8 @@ include $(BUILD_HELPER_DIR)/defines.mak
 
 MODULE_FILES_TO_GENERATE := $(DEFAULT_PY_FILES_TO_GENERATE)
 
-MODULE_FILES_TO_COPY := $(DEFAULT_PY_FILES_TO_COPY)
+MODULE_FILES_TO_COPY := $(DEFAULT_PY_FILES_TO_COPY) \
+    pipeline.py \
 
 RST_FILES_TO_GENERATE := $(DEFAULT_RST_FILES_TO_GENERATE)
 
@@ -12,6 +13,8 @@ RST_FILES_TO_GENERATE := $(DEFAULT_RST_FILES_TO_GENERATE)
 # Add custom types to copy
 CUSTOM_TYPES_TO_COPY += \
     waveform_info.py \
+    fetch_buffer_pool.py \
+    waveform_recorder.py \
 
 include $(BUILD_HELPER_DIR)/rules.mak
 
@@ -117,6 +117,147 @@ def test_fetch_double_into(session):
     assert len(wfm_infos) == test_num_channels
 
 
+def test_fetch_scaled_into(session):
+    test_voltage = 1.0
+    test_record_length = 2000
+    test_channels = range(2)
+    test_num_channels = 2
+    wfm = numpy.ndarray(test_num_channels * test_record_length, dtype=numpy.float32)
+    wfm.fill(float('nan'))
+    binary_wfm = numpy.ndarray(test_num_channels * test_record_length, dtype=numpy.int16)
+    session.configure_vertical(test_voltage, niscope.VerticalCoupling.AC)
+    session.configure_horizontal_timing(50000000, test_record_length, 50.0, 1, True)
+    with session.initiate():
+        wfm_infos = session.channels[test_channels].fetch_scaled_into(wfm=wfm)
+        binary_wfm_infos = session.channels[test_channels].fetch_into(wfm=binary_wfm)
+    assert not numpy.isnan(wfm).any()
+    assert len(wfm_infos) == test_num_channels
+    assert list(wfm_infos['gain']) == [wfm_info.gain for wfm_info in binary_wfm_infos]
+
+
+def test_fetch_buffer_pool(session):
+    test_voltage = 1.0
+    test_record_length = 2000
+    test_channels = range(2)
+    test_num_channels = 2
+    session.configure_vertical(test_voltage, niscope.VerticalCoupling.AC)
+    session.configure_horizontal_timing(50000000, test_record_length, 50.0, 1, True)
+    pool = session.channels[test_channels].fetch_buffer_pool(test_record_length, dtype=numpy.int16, num_buffers=2)
+    with session.initiate():
+        wfm, wfm_infos = pool.fetch()
+    assert wfm.dtype == numpy.int16
+    assert len(wfm) == test_num_channels * test_record_length
+    assert len(wfm_infos) == test_num_channels
+    assert list(wfm_infos['actual_samples']) == [test_record_length] * test_num_channels
+    with session.initiate():
+        pool.fetch()
+        wfm_again, wfm_infos_again = pool.fetch()
+    # The ring has two buffers, so the third fetch reuses the first one
+    assert wfm_again is wfm
+    assert wfm_infos_again is wfm_infos
+
+
+def test_stream(session):
+    test_record_length = 2000
+    test_num_records = 3
+    test_samples_per_chunk = 500
+    session.configure_horizontal_timing(50000000, test_record_length, 50.0, test_num_records, True)
+    samples_per_record = [0] * test_num_records
+    with session.initiate():
+        for chunk in session.channels[0].stream(samples_per_chunk=test_samples_per_chunk, dtype=numpy.int16):
+            assert chunk.wfm.dtype == numpy.int16
+            assert 0 < len(chunk.wfm) <= test_samples_per_chunk
+            assert chunk.offset == samples_per_record[chunk.record_number]
+            samples_per_record[chunk.record_number] += len(chunk.wfm)
+    assert samples_per_record == [test_record_length] * test_num_records
+
+
+def test_fetch_pipeline(session):
+    test_record_length = 2000
+    test_num_records = 3
+    test_samples_per_chunk = 500
+    session.configure_horizontal_timing(50000000, test_record_length, 50.0, test_num_records, True)
+    samples_per_record = [0] * test_num_records
+    with session.initiate():
+        with session.channels[0].fetch_pipeline(samples_per_chunk=test_samples_per_chunk, dtype=numpy.int16, num_buffers=2) as pipeline:
+            for chunk in pipeline:
+                assert chunk.wfm.dtype == numpy.int16
+                assert chunk.offset == samples_per_record[chunk.record_number]
+                samples_per_record[chunk.record_number] += len(chunk.wfm)
+    assert samples_per_record == [test_record_length] * test_num_records
+    assert pipeline.dropped_count == 0
+    assert pipeline.consumed_count == pipeline.fetched_count
+
+
+def test_fetch_record_batches(session):
+    test_record_length = 1000
+    test_num_records = 50
+    test_records_per_fetch = 8
+    test_channels = range(2)
+    session.configure_horizontal_timing(50000000, test_record_length, 50.0, test_num_records, True)
+    next_record_number = 0
+    with session.initiate():
+        for batch in session.channels[test_channels].fetch_record_batches(records_per_fetch=test_records_per_fetch, dtype=numpy.int16):
+            assert batch.record_number == next_record_number
+            assert 0 < batch.wfm.shape[0] <= test_records_per_fetch
+            assert batch.wfm.shape[1:] == (len(test_channels), test_record_length)
+            assert batch.wfm_info.shape == batch.wfm.shape[:2]
+            next_record_number += batch.wfm.shape[0]
+    assert next_record_number == test_num_records
+
+
+def test_waveform_recorder(session, tmpdir):
+    test_record_length = 1000
+    test_num_records = 5
+    test_channels = range(2)
+    session.configure_horizontal_timing(50000000, test_record_length, 50.0, test_num_records, True)
+    path = str(tmpdir.join('capture.npy'))
+    with session.initiate():
+        with session.channels[test_channels].waveform_recorder(path, records_per_fetch=2) as recorder:
+            recorder.record()
+            assert recorder.records_written == test_num_records
+            index_path = recorder.index_path
+    wfm = numpy.load(path, mmap_mode='r')
+    index = numpy.load(index_path, mmap_mode='r')
+    assert wfm.shape == (test_num_records, len(test_channels), test_record_length)
+    assert wfm.dtype == numpy.int16
+    assert index.shape == (test_num_records, len(test_channels))
+    assert list(index['actual_samples'].flatten()) == [test_record_length] * test_num_records * len(test_channels)
+
+
+def test_fetch_measurements(session):
+    test_channels = range(2)
+    test_measurements = [niscope.ScalarMeasurement.FREQUENCY, niscope.ScalarMeasurement.VOLTAGE_PEAK_TO_PEAK, niscope.ScalarMeasurement.RISE_TIME]
+    session.configure_horizontal_timing(50000000, 1000, 50.0, 1, True)
+    with session.initiate():
+        result, mean, stdev, min_val, max_val, num_in_stats = session.channels[test_channels].fetch_measurements(test_measurements)
+    for stat in (result, mean, stdev, min_val, max_val, num_in_stats):
+        assert stat.shape == (len(test_measurements), len(test_channels))
+    assert (num_in_stats >= 1).all()
+
+
+def test_fetch_array_measurement_into(session):
+    test_channels = range(2)
+    session.configure_horizontal_timing(50000000, 1000, 50.0, 1, True)
+    meas_wfm_size = session.actual_meas_wfm_size(niscope.ArrayMeasurement.FFT_AMP_SPECTRUM_DB)
+    meas_wfm = numpy.zeros((len(test_channels), meas_wfm_size))
+    with session.initiate():
+        wfm_infos = session.channels[test_channels].fetch_array_measurement_into(niscope.ArrayMeasurement.FFT_AMP_SPECTRUM_DB, meas_wfm)
+    assert len(wfm_infos) == len(test_channels)
+
+
+def test_waveform_info_as_numpy_array(session):
+    test_record_length = 2000
+    test_channels = range(2)
+    session.configure_horizontal_timing(50000000, test_record_length, 50.0, 1, True)
+    with session.initiate():
+        _, wfm_infos = session.channels[test_channels].fetch(test_record_length)
+    wfm_info_array = niscope.waveform_info.as_numpy_array(wfm_infos)
+    assert wfm_info_array.dtype == niscope.waveform_info.get_numpy_dtype()
+    assert list(wfm_info_array['gain']) == [wfm_info.gain for wfm_info in wfm_infos]
+    assert list(wfm_info_array['absolute_initial_x']) == [wfm_info.absolute_initial_x for wfm_info in wfm_infos]
+
+
 def test_self_test(session):
     result, message = session.self_test()
     assert result == 0
@@ -0,0 +1,21 @@
+<%page args="f, config, method_template"/>\
+<%
+    '''Sets the fetch properties to fetch a range of whole records.'''
+    suffix = method_template['method_python_name_suffix']
+%>\
+    def ${f['python_name']}${suffix}(self, record_number, num_records):
+        '''${f['python_name']}
+
+        Sets the fetch properties so that the next fetch returns num_records whole records starting at
+        record_number, and returns the number of waveforms that fetch returns.
+
+        The fetch properties are not restored; callers save them first with _save_fetch_properties().
+        '''
+        # The fetch properties are not channel based, so they are accessed without the repeated capability
+        session = self._session_wide()
+        session.fetch_relative_to = enums.FetchRelativeTo.PRETRIGGER
+        session.fetch_offset = 0
+        session.fetch_record_number = record_number
+        session.fetch_num_records = num_records
+        return self._actual_num_wfms()
+
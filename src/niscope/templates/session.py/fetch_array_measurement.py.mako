@@ -0,0 +1,24 @@
+<%page args="f, config, method_template"/>\
+<%
+    '''Fetches an array measurement into a preallocated numpy array, computing the measurement waveform size from it.'''
+    import build.helper as helper
+
+    suffix = method_template['method_python_name_suffix']
+%>\
+    def ${f['python_name']}${suffix}(${helper.get_params_snippet(f, helper.ParameterUsageOptions.SESSION_NUMPY_INTO_METHOD_DECLARATION)}):
+        '''${f['python_name']}
+
+        ${helper.get_function_docstring(f, False, config, indent=8)}
+        '''
+        import numpy
+
+        if type(meas_wfm) is not numpy.ndarray:
+            raise TypeError('meas_wfm must be {0}, is {1}'.format(numpy.ndarray, type(meas_wfm)))
+        if not meas_wfm.flags['C_CONTIGUOUS']:
+            raise TypeError('meas_wfm must be C-contiguous')
+        num_wfms = self._actual_num_wfms_cached()
+        if meas_wfm.size % num_wfms != 0:
+            raise ValueError('meas_wfm size must be a multiple of the number of waveforms, {0}, is {1}'.format(num_wfms, meas_wfm.size))
+        meas_wfm_size = meas_wfm.size // num_wfms
+        return self._fetch_array_measurement_into(array_meas_function=array_meas_function, meas_wfm_size=meas_wfm_size, meas_wfm=meas_wfm.reshape(-1), timeout=timeout, num_wfms=num_wfms)
+
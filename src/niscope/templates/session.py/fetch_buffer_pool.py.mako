@@ -0,0 +1,16 @@
+<%page args="f, config, method_template"/>\
+<%
+    '''Creates a FetchBufferPool for this session or repeated capability.'''
+    import build.helper as helper
+
+    suffix = method_template['method_python_name_suffix']
+%>\
+    def ${f['python_name']}${suffix}(${helper.get_params_snippet(f, helper.ParameterUsageOptions.SESSION_METHOD_DECLARATION)}):
+        '''${f['python_name']}
+
+        ${helper.get_function_docstring(f, False, config, indent=8)}
+        '''
+        from niscope import fetch_buffer_pool
+
+        return fetch_buffer_pool.FetchBufferPool(self, num_samples, dtype, num_buffers)
+
@@ -0,0 +1,53 @@
+<%page args="f, config, method_template"/>\
+<%
+    '''Sets up the fetch properties for fetching an acquisition in chunks and returns the generator of chunk positions.'''
+    suffix = method_template['method_python_name_suffix']
+%>\
+    def ${f['python_name']}${suffix}(self, samples_per_chunk, continuous=False):
+        '''${f['python_name']}
+
+        Sets the fetch properties to fetch one record at a time relative to the read pointer, and returns
+        a generator of (record_number, offset, num_samples, backlog) tuples for all the records of the
+        acquisition, or, when continuous is True, for one record after the other until the caller stops.
+        Before yielding, it reads backlog and limits num_samples to what has been acquired; the caller
+        fetches num_samples samples before asking for the next chunk. When nothing has been acquired yet,
+        num_samples is a full chunk and the fetch waits for it.
+
+        The samples acquired but not fetched, the backlog of the record plus the records done after it,
+        are compared to the samples of each waveform that fit in the onboard memory. When they no longer
+        fit, samples have been overwritten and the generator raises StreamOverflowError.
+
+        The fetch properties are not restored; callers save them first with _save_fetch_properties().
+        '''
+        from niscope import fetch_buffer_pool
+
+        # The fetch and horizontal properties are not channel based, so they are accessed without the repeated capability
+        session = self._session_wide()
+        session.fetch_relative_to = enums.FetchRelativeTo.READ_POINTER
+        session.fetch_offset = 0
+        session.fetch_num_records = 1
+        record_length = session.horz_record_length
+        num_records = session.horz_num_records
+        # The onboard memory is shared by the acquired channels, which are assumed to be the fetched ones
+        memory_size = session.onboard_memory_size // (session.binary_sample_width // 8 * self._actual_num_wfms())
+
+        def chunks():
+            record_number = 0
+            while continuous or record_number < num_records:
+                session.fetch_record_number = record_number
+                offset = 0
+                while offset < record_length:
+                    num_samples = min(samples_per_chunk, record_length - offset)
+                    backlog = int(session.backlog)
+                    samples_pending = backlog
+                    if continuous or record_number + 1 < num_records:
+                        samples_pending += max(session.records_done - record_number - 1, 0) * record_length
+                    if samples_pending > memory_size:
+                        raise fetch_buffer_pool.StreamOverflowError(record_number, offset, samples_pending, memory_size)
+                    if backlog > 0:
+                        num_samples = min(num_samples, backlog)
+                    yield record_number, offset, num_samples, max(backlog - num_samples, 0)
+                    offset += num_samples
+                record_number += 1
+        return chunks()
+
@@ -0,0 +1,27 @@
+<%page args="f, config, method_template"/>\
+<%
+    '''Fetches into preallocated buffers, dispatching on the dtype of the waveform buffer.'''
+    suffix = method_template['method_python_name_suffix']
+%>\
+    def ${f['python_name']}${suffix}(self, num_samples, wfm, wfm_info, timeout):
+        '''${f['python_name']}
+
+        Fetches into the buffers of a FetchBufferPool, which checks them once when it allocates them.
+
+        wfm is a C-contiguous numpy.ndarray of dtype float64, int8, int16 or int32 holding num_samples
+        samples per waveform, and wfm_info a ctypes array of waveform_info.struct_niScope_wfmInfo with one
+        element per waveform. The driver writes both in place.
+        '''
+        fetch_function_name = {
+            'float64': '${config['c_function_prefix']}Fetch',
+            'int8': '${config['c_function_prefix']}FetchBinary8',
+            'int16': '${config['c_function_prefix']}FetchBinary16',
+            'int32': '${config['c_function_prefix']}FetchBinary32',
+        }[wfm.dtype.name]
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        timeout_ctype = _converters.convert_timedelta_to_seconds(timeout, visatype.ViReal64)  # case S140
+        num_samples_ctype = visatype.ViInt32(num_samples)  # case S150
+        wfm_ctype = get_ctypes_pointer_for_buffer(value=wfm)  # case B510
+        error_code = getattr(self._library, fetch_function_name)(vi_ctype, self._repeated_capability_ctype, timeout_ctype, num_samples_ctype, wfm_ctype, wfm_info)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+
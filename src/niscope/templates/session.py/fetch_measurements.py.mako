@@ -0,0 +1,29 @@
+<%page args="f, config, method_template"/>\
+<%
+    '''Fetches the statistics of several scalar measurements into one 2-D numpy array per statistic.'''
+    import build.helper as helper
+
+    suffix = method_template['method_python_name_suffix']
+%>\
+    def ${f['python_name']}${suffix}(${helper.get_params_snippet(f, helper.ParameterUsageOptions.SESSION_METHOD_DECLARATION)}):
+        '''${f['python_name']}
+
+        ${helper.get_function_docstring(f, False, config, indent=8)}
+        '''
+        import numpy
+
+        for scalar_meas_function in scalar_meas_functions:
+            if type(scalar_meas_function) is not enums.ScalarMeasurement:
+                raise TypeError('Parameter mode must be of type ' + str(enums.ScalarMeasurement))
+        shape = (len(scalar_meas_functions), self._actual_num_wfms_cached())
+        # result, mean, stdev, min, max and num_in_stats; each measurement is fetched into one row of them
+        stats = tuple(numpy.zeros(shape, dtype=numpy.float64) for _ in range(5)) + (numpy.zeros(shape, dtype=numpy.dtype(visatype.ViInt32)), )
+        vi_ctype = visatype.ViSession(self._vi)  # case S110
+        timeout_ctype = _converters.convert_timedelta_to_seconds(timeout, visatype.ViReal64)  # case S140
+        for i, scalar_meas_function in enumerate(scalar_meas_functions):
+            scalar_meas_function_ctype = visatype.ViInt32(scalar_meas_function.value)  # case S130
+            stats_ctypes = [get_ctypes_pointer_for_buffer(value=stat[i]) for stat in stats]  # case B510
+            error_code = self._library.${config['c_function_prefix']}FetchMeasurementStats(vi_ctype, self._repeated_capability_ctype, timeout_ctype, scalar_meas_function_ctype, *stats_ctypes)
+            errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return stats
+
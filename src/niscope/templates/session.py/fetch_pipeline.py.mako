@@ -0,0 +1,30 @@
+<%page args="f, config, method_template"/>\
+<%
+    '''Creates an AcquisitionPipeline that streams the acquisition on a background thread.'''
+    import build.helper as helper
+
+    suffix = method_template['method_python_name_suffix']
+%>\
+    def ${f['python_name']}${suffix}(${helper.get_params_snippet(f, helper.ParameterUsageOptions.SESSION_METHOD_DECLARATION)}):
+        '''${f['python_name']}
+
+        ${helper.get_function_docstring(f, False, config, indent=8)}
+        '''
+        from niscope import fetch_buffer_pool
+        from niscope import pipeline
+
+        restore_fetch_properties = self._save_fetch_properties()
+        try:
+            chunks = self._fetch_chunks(samples_per_chunk, continuous)
+            pool = fetch_buffer_pool.FetchBufferPool(self, samples_per_chunk, dtype, num_buffers)
+        except Exception:
+            restore_fetch_properties()
+            raise
+
+        def fetch(buffer):
+            # Runs on the producer thread; StopIteration after the last chunk ends the pipeline
+            record_number, offset, num_samples, backlog = next(chunks)
+            wfm, wfm_info = pool.fetch_into(buffer, timeout, num_samples)
+            return fetch_buffer_pool.StreamChunk(wfm, wfm_info, record_number, offset, backlog)
+        return pipeline.AcquisitionPipeline(fetch, pool.buffers, drop_when_full, on_stop=restore_fetch_properties)
+
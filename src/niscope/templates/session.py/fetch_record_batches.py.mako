@@ -0,0 +1,43 @@
+<%page args="f, config, method_template"/>\
+<%
+    '''Generator that fetches the records of an initiated acquisition in batches of records that are done.'''
+    import build.helper as helper
+
+    suffix = method_template['method_python_name_suffix']
+%>\
+    def ${f['python_name']}${suffix}(${helper.get_params_snippet(f, helper.ParameterUsageOptions.SESSION_METHOD_DECLARATION)}):
+        '''${f['python_name']}
+
+        ${helper.get_function_docstring(f, False, config, indent=8)}
+        '''
+        from niscope import fetch_buffer_pool
+
+        if records_per_fetch < 1:
+            raise ValueError('records_per_fetch must be at least 1, is {0}'.format(records_per_fetch))
+        # The horizontal and acquisition status properties are not channel based, so they are accessed without the repeated capability
+        session = self._session_wide()
+        if num_samples is None:
+            num_samples = session.horz_record_length
+        num_records = session.horz_num_records
+        restore_fetch_properties = self._save_fetch_properties()
+        try:
+            num_wfms_per_record = self._configure_fetch_records(0, 1)
+            # The pool is sized for the number of waveforms of a full batch
+            self._configure_fetch_records(0, min(records_per_fetch, num_records))
+            pool = fetch_buffer_pool.FetchBufferPool(self, num_samples, dtype, num_buffers)
+            record_number = 0
+            while record_number < num_records:
+                batch_size = min(records_per_fetch, num_records - record_number)
+                # Fetch what is done without waiting for a full batch; when nothing is done the fetch waits for a full batch
+                records_done = session.records_done - record_number
+                if records_done > 0:
+                    batch_size = min(batch_size, records_done)
+                num_wfms = self._configure_fetch_records(record_number, batch_size)
+                wfm, wfm_info = pool.fetch(timeout)
+                wfm = wfm[:num_wfms * num_samples].reshape(batch_size, num_wfms_per_record, num_samples)
+                wfm_info = wfm_info[:num_wfms].reshape(batch_size, num_wfms_per_record)
+                yield fetch_buffer_pool.RecordBatch(wfm, wfm_info, record_number, max(records_done - batch_size, 0))
+                record_number += batch_size
+        finally:
+            restore_fetch_properties()
+
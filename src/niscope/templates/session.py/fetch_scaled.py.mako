@@ -0,0 +1,29 @@
+<%page args="f, config, method_template"/>\
+<%
+    '''Fetches binary16 data and scales it to voltages with numpy.'''
+    import build.helper as helper
+
+    suffix = method_template['method_python_name_suffix']
+%>\
+    def ${f['python_name']}${suffix}(${helper.get_params_snippet(f, helper.ParameterUsageOptions.SESSION_METHOD_DECLARATION)}):
+        '''${f['python_name']}
+
+        ${helper.get_function_docstring(f, False, config, indent=8)}
+        '''
+        import numpy
+
+        if type(wfm) is not numpy.ndarray:
+            raise TypeError('wfm must be {0}, is {1}'.format(numpy.ndarray, type(wfm)))
+        if not wfm.flags.c_contiguous:
+            raise TypeError('wfm must be C-contiguous')
+        if wfm.dtype not in (numpy.float64, numpy.float32):
+            raise TypeError('wfm must be numpy.ndarray of dtype=float64 or float32, is ' + str(wfm.dtype))
+        num_wfms = self._actual_num_wfms_cached()
+        num_samples = len(wfm) // num_wfms
+        binary_wfm = numpy.empty(num_samples * num_wfms, dtype=numpy.int16)
+        wfm_info_ctype = (waveform_info.struct_niScope_wfmInfo * num_wfms)()
+        self._fetch_into_buffers(num_samples, binary_wfm, wfm_info_ctype, timeout)
+        wfm_info = waveform_info.as_numpy_array(wfm_info_ctype)
+        waveform_info.scale(binary_wfm, wfm_info, out=wfm[:num_samples * num_wfms])
+        return wfm_info
+
@@ -12,16 +12,17 @@
         '''
         import numpy
 
-        num_samples = int(len(wfm) / self._actual_num_wfms())
+        num_wfms = self._actual_num_wfms_cached()
+        num_samples = int(len(wfm) / num_wfms)
 
         if wfm.dtype == numpy.float64:
-            return self._fetch_into(num_samples=num_samples, wfm=wfm, timeout=timeout)
+            return self._fetch_into(num_samples=num_samples, wfm=wfm, timeout=timeout, num_wfms=num_wfms)
         elif wfm.dtype == numpy.int8:
-            return self._fetch_binary8_into(num_samples=num_samples, wfm=wfm, timeout=timeout)
+            return self._fetch_binary8_into(num_samples=num_samples, wfm=wfm, timeout=timeout, num_wfms=num_wfms)
         elif wfm.dtype == numpy.int16:
-            return self._fetch_binary16_into(num_samples=num_samples, wfm=wfm, timeout=timeout)
+            return self._fetch_binary16_into(num_samples=num_samples, wfm=wfm, timeout=timeout, num_wfms=num_wfms)
         elif wfm.dtype == numpy.int32:
-            return self._fetch_binary32_into(num_samples=num_samples, wfm=wfm, timeout=timeout)
+            return self._fetch_binary32_into(num_samples=num_samples, wfm=wfm, timeout=timeout, num_wfms=num_wfms)
         else:
             raise TypeError("Unsupported dtype. Is {0}, expected {1}, {2}, {3}, or {5}".format(wfm.dtype, numpy.float64, numpy.int8, numpy.int16, numpy.int32))
 
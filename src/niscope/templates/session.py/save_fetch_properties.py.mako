@@ -0,0 +1,21 @@
+<%page args="f, config, method_template"/>\
+<%
+    '''Saves the fetch properties and returns a function that restores them.'''
+    suffix = method_template['method_python_name_suffix']
+%>\
+    def ${f['python_name']}${suffix}(self):
+        '''${f['python_name']}
+
+        Returns a function that sets fetch_relative_to, fetch_offset, fetch_record_number and
+        fetch_num_records back to their current values. Methods that change them to fetch in chunks
+        or batches call it when they are done, so fetch() afterwards behaves as configured.
+        '''
+        # The fetch properties are not channel based, so they are accessed without the repeated capability
+        session = self._session_wide()
+        values = [(name, getattr(session, name)) for name in ('fetch_relative_to', 'fetch_offset', 'fetch_record_number', 'fetch_num_records')]
+
+        def restore():
+            for name, value in values:
+                setattr(session, name, value)
+        return restore
+
@@ -0,0 +1,24 @@
+<%page args="f, config, method_template"/>\
+<%
+    '''Generator that fetches the records of an initiated acquisition in chunks of what has been acquired.'''
+    import build.helper as helper
+
+    suffix = method_template['method_python_name_suffix']
+%>\
+    def ${f['python_name']}${suffix}(${helper.get_params_snippet(f, helper.ParameterUsageOptions.SESSION_METHOD_DECLARATION)}):
+        '''${f['python_name']}
+
+        ${helper.get_function_docstring(f, False, config, indent=8)}
+        '''
+        from niscope import fetch_buffer_pool
+
+        restore_fetch_properties = self._save_fetch_properties()
+        try:
+            chunks = self._fetch_chunks(samples_per_chunk, continuous)
+            pool = fetch_buffer_pool.FetchBufferPool(self, samples_per_chunk, dtype, num_buffers)
+            for record_number, offset, num_samples, backlog in chunks:
+                wfm, wfm_info = pool.fetch(timeout, num_samples)
+                yield fetch_buffer_pool.StreamChunk(wfm, wfm_info, record_number, offset, backlog)
+        finally:
+            restore_fetch_properties()
+
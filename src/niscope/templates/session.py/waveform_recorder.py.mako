@@ -0,0 +1,22 @@
+<%page args="f, config, method_template"/>\
+<%
+    '''Creates a WaveformRecorder for this session or repeated capability.'''
+    import build.helper as helper
+
+    suffix = method_template['method_python_name_suffix']
+%>\
+    def ${f['python_name']}${suffix}(${helper.get_params_snippet(f, helper.ParameterUsageOptions.SESSION_METHOD_DECLARATION)}):
+        '''${f['python_name']}
+
+        ${helper.get_function_docstring(f, False, config, indent=8)}
+        '''
+        from niscope import waveform_recorder
+
+        # The horizontal properties are not channel based, so they are accessed without the repeated capability
+        session = self._session_wide()
+        if num_samples is None:
+            num_samples = session.horz_record_length
+        if num_records is None:
+            num_records = session.horz_num_records
+        return waveform_recorder.WaveformRecorder(self, path, num_samples, num_records, dtype, records_per_fetch, index_path)
+
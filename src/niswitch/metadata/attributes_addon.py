@@ -24,4 +24,11 @@ attributes_converters = {
                'python_api_converter_type': 'datetime.timedelta', },  # SCAN_DELAY
 }
 
+# Properties that change without a call into the driver must never be served from the session attribute cache
+attributes_cacheable = {
+    1150004: { 'cacheable': False, },  # IS_WAITING_FOR_TRIG
+    1150019: { 'cacheable': False, },  # TEMPERATURE
+    1250002: { 'cacheable': False, },  # IS_DEBOUNCED
+    1250024: { 'cacheable': False, },  # IS_SCANNING
+}
 
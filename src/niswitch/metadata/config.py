@@ -27,5 +27,6 @@ config = {
     'repeated_capabilities': [
         {'python_name': 'channels', 'prefix': '', },
     ],
+    'example_property_values': [('scan_list', "'c0->r0;'"), ('continuous_scan', 'True'), ],
 }
 
@@ -90,3 +90,34 @@ functions_converters = {
     'WaitForScanComplete':               { 'parameters': { 1: { 'python_api_converter_name': 'convert_timedelta_to_milliseconds',
                                                                 'python_api_converter_type': 'datetime.timedelta', }, }, },
 }
+
+# Functions that block until the driver completes an operation (fetch, read, wait, self-calibration).
+# Their documentation describes how they behave when called from multiple threads.
+functions_blocking = {
+    'WaitForDebounce':     { 'blocking': True, },
+    'WaitForScanComplete': { 'blocking': True, },
+    'self_test':           { 'blocking': True, },
+}
+
+# Functions that can change property values in the driver. Calling them clears the session attribute cache.
+functions_invalidates_attribute_cache = {
+    'reset':                   { 'invalidates_attribute_cache': True, },
+    'ResetWithDefaults':       { 'invalidates_attribute_cache': True, },
+    'Commit':                  { 'invalidates_attribute_cache': True, },
+    'InitiateScan':            { 'invalidates_attribute_cache': True, },
+    'Disable':                 { 'invalidates_attribute_cache': True, },
+    'self_test':               { 'invalidates_attribute_cache': True, },
+    'Configure.+':             { 'invalidates_attribute_cache': True, },  # All Configure functions set properties
+    'SetAttributeVi.+':        { 'invalidates_attribute_cache': True, },
+    'Connect':                 { 'invalidates_attribute_cache': True, },
+    'ConnectMultiple':         { 'invalidates_attribute_cache': True, },
+    'Disconnect':              { 'invalidates_attribute_cache': True, },
+    'DisconnectAll':           { 'invalidates_attribute_cache': True, },
+    'DisconnectMultiple':      { 'invalidates_attribute_cache': True, },
+    'SetPath':                 { 'invalidates_attribute_cache': True, },
+    'RelayControl':            { 'invalidates_attribute_cache': True, },
+    'RouteScanAdvancedOutput': { 'invalidates_attribute_cache': True, },
+    'RouteTriggerInput':       { 'invalidates_attribute_cache': True, },
+    'SetContinuousScan':       { 'invalidates_attribute_cache': True, },
+}
+
@@ -0,0 +1,45 @@
+# !python
+
+import argparse
+import os
+import sys
+import timeit
+
+
+def main():
+    usage = """
+Measure the overhead _SessionBase.__setattr__ adds to every property write on a frozen session.
+
+No driver runtime is needed. The session handle is never used because the benchmark sets an
+instance attribute, so only the frozen-attribute check and object.__setattr__ are timed. The
+check used before this change (key not in dir(self)) is timed on the same object for comparison.
+Run 'make' first so that bin/<driver>/<driver> exists.
+"""
+    parser = argparse.ArgumentParser(description=usage)
+    parser.add_argument("--driver", action="store", dest="driver", default='niscope', help="Driver whose generated session to use")
+    parser.add_argument("--number", action="store", dest="number", type=int, default=100000, help="Number of assignments per run")
+    parser.add_argument("--repeat", action="store", dest="repeat", type=int, default=5, help="Number of runs, the fastest one is reported")
+    args = parser.parse_args()
+
+    sys.path.insert(0, os.path.join('bin', args.driver))
+    session_module = __import__(args.driver + '.session', fromlist=['session'])
+
+    session = session_module._SessionBase('', 0, None, 'windows-1251', session_module.attributes.AttributeCache(), session_module._LruCache(64), session_module.errors._WarningFilter(), session_module.errors._PendingDescriptions(), freeze_it=True)
+    key = '_encoding'
+
+    def dir_check():
+        if key not in dir(session):
+            raise AttributeError(key)
+        object.__setattr__(session, key, 'windows-1251')
+
+    def frozenset_check():
+        session._encoding = 'windows-1251'
+
+    print("{0}: {1} settable names, {2} names in dir()".format(args.driver, len(session._settable_names), len(dir(session))))
+    for name, func in [('dir() lookup (before)', dir_check), ('frozenset lookup (after)', frozenset_check)]:
+        best = min(timeit.repeat(func, number=args.number, repeat=args.repeat))
+        print("{0:<26} {1:8.3f} us per assignment".format(name, best / args.number * 1e6))
+
+
+if __name__ == '__main__':
+    main()